@@ -0,0 +1,173 @@
+import os
+import sys
+import struct
+import math
+import uuid
+import typing
+
+#replays the event log written by server.py (serverFiles/events.bin)
+#usage: python analyzeEventLog.py [path to events.bin]
+
+
+
+#constants, must match server.py
+EVENTLOGMAGIC = b"DCEV"
+EVENTLOGVERSION = 1
+EVENTHEADER = struct.Struct(">BdI16s16sI")  #type, time, size, connection id, subtask uuid, length of extra data
+EVENT_START = 0
+EVENT_CONNECT = 1
+EVENT_REGISTERCLIENT = 2
+EVENT_REGISTERNODE = 3
+EVENT_DISCONNECT = 4
+EVENT_SUBMIT = 5
+EVENT_DISPATCH = 6
+EVENT_COMPLETE = 7
+EVENT_DELIVER = 8
+EVENT_REQUEUE = 9
+
+DEFAULTEVENTLOGFILE = os.path.join("serverFiles", "events.bin")
+QUANTILES = [0.5, 0.9, 0.99, 0.999]
+
+
+
+class Event(typing.NamedTuple):
+    type: int
+    time: float
+    size: int
+    connectionID: uuid.UUID
+    subtaskUUID: uuid.UUID
+    extra: str
+
+def readEvents(path:str) -> typing.List[Event]:
+    f = open(path, "rb")
+    data = f.read()
+    f.close()
+    assert data[:len(EVENTLOGMAGIC)] == EVENTLOGMAGIC, "not an event log"
+    version = int.from_bytes(data[len(EVENTLOGMAGIC):len(EVENTLOGMAGIC)+2], "big")
+    assert version == EVENTLOGVERSION, "unsupported event log version ("+str(version)+")"
+    events = []
+    i = len(EVENTLOGMAGIC) + 2
+    while i + EVENTHEADER.size <= len(data):
+        eventType, t, size, connectionID, subtaskUUID, extraLength = EVENTHEADER.unpack_from(data, i)
+        i += EVENTHEADER.size
+        if(i + extraLength > len(data)):
+            break  #partially written record at the end
+        extra = data[i:i+extraLength].decode()
+        i += extraLength
+        events.append(Event(eventType, t, size, uuid.UUID(bytes=connectionID), uuid.UUID(bytes=subtaskUUID), extra))
+    return events
+
+def quantile(sortedValues:typing.List[float], q:float) -> float:
+    if(len(sortedValues) == 0):
+        return math.nan
+    return sortedValues[min(max(math.ceil(q * len(sortedValues)) - 1, 0), len(sortedValues) - 1)]
+
+def unionLength(intervals:"list[typing.Tuple[float, float]]") -> float:
+    total = 0.0
+    end = -math.inf
+    for s, e in sorted(intervals):
+        if(e <= end):
+            continue
+        total += e - max(s, end)
+        end = e
+    return total
+
+def formatSeconds(seconds:float) -> str:
+    if(math.isnan(seconds)):
+        return "-"
+    if(seconds < 1):
+        return "{0:.1f}ms".format(seconds * 1000)
+    return "{0:.2f}s".format(seconds)
+
+def printDistribution(name:str, values:"list[float]"):
+    values = sorted(values)
+    cols = ["p"+str(q*100).rstrip("0").rstrip(".")+"="+formatSeconds(quantile(values, q)) for q in QUANTILES]
+    print("  {0:<18} n={1:<8} {2}  max={3}".format(name, len(values), "  ".join(cols), formatSeconds(values[-1] if len(values) > 0 else math.nan)))
+
+def analyze(events:typing.List[Event]):
+    if(len(events) == 0):
+        print("no events")
+        return
+    lastTime = events[-1].time
+
+    connectionAddr : "dict[uuid.UUID, str]" = dict()
+    connectionStart : "dict[uuid.UUID, float]" = dict()
+    connectionEnd : "dict[uuid.UUID, float]" = dict()
+    nodeConnections : "list[uuid.UUID]" = []
+    submitTime : "dict[uuid.UUID, float]" = dict()
+    firstDispatchTime : "dict[uuid.UUID, float]" = dict()
+    deliverTime : "dict[uuid.UUID, float]" = dict()
+    #(node connection, subtask) -> dispatch time, for subtasks currently on a node
+    running : "dict[typing.Tuple[uuid.UUID, uuid.UUID], float]" = dict()
+    busyIntervals : "dict[uuid.UUID, list[typing.Tuple[float, float]]]" = dict()
+    serviceTimes : "list[float]" = []
+    numCompleted = 0
+    numRequeued = 0
+    bytesIn = 0
+    bytesOut = 0
+
+    for e in events:
+        if(e.type == EVENT_CONNECT):
+            connectionAddr[e.connectionID] = e.extra
+            connectionStart[e.connectionID] = e.time
+        elif(e.type == EVENT_REGISTERNODE):
+            nodeConnections.append(e.connectionID)
+            busyIntervals[e.connectionID] = []
+        elif(e.type == EVENT_DISCONNECT):
+            connectionEnd[e.connectionID] = e.time
+        elif(e.type == EVENT_SUBMIT):
+            submitTime[e.subtaskUUID] = e.time
+            bytesIn += e.size
+        elif(e.type == EVENT_DISPATCH):
+            firstDispatchTime.setdefault(e.subtaskUUID, e.time)
+            running[(e.connectionID, e.subtaskUUID)] = e.time
+        elif(e.type == EVENT_COMPLETE or e.type == EVENT_REQUEUE):
+            start = running.pop((e.connectionID, e.subtaskUUID), None)
+            if(start is not None):
+                busyIntervals.setdefault(e.connectionID, []).append((start, e.time))
+                if(e.type == EVENT_COMPLETE):
+                    serviceTimes.append(e.time - start)
+            if(e.type == EVENT_COMPLETE):
+                numCompleted += 1
+                bytesOut += e.size
+            else:
+                numRequeued += 1
+        elif(e.type == EVENT_DELIVER):
+            deliverTime[e.subtaskUUID] = e.time
+    #subtasks still running when the log ends count as busy until then
+    for (connectionID, _), start in running.items():
+        busyIntervals.setdefault(connectionID, []).append((start, connectionEnd.get(connectionID, lastTime)))
+
+    queueingDelays = [firstDispatchTime[k] - submitTime[k] for k in firstDispatchTime if k in submitTime]
+    latencies = [deliverTime[k] - submitTime[k] for k in deliverTime if k in submitTime]
+    duration = lastTime - events[0].time
+
+    print("events: {0}    span: {1}".format(len(events), formatSeconds(duration)))
+    print("subtasks: {0} submitted, {1} completed, {2} delivered, {3} requeued".format(len(submitTime), numCompleted, len(deliverTime), numRequeued))
+    if(len(submitTime) > 0 and len(deliverTime) > 0):
+        makespan = max(deliverTime.values()) - min(submitTime.values())
+        print("makespan: {0}    throughput: {1:.2f} subtasks/s".format(formatSeconds(makespan), len(deliverTime) / makespan if makespan > 0 else math.nan))
+    print("bytes: {0} in, {1} out".format(bytesIn, bytesOut))
+    print()
+    print("latency:")
+    printDistribution("queueing delay", queueingDelays)
+    printDistribution("service time", serviceTimes)
+    printDistribution("end to end", latencies)
+    print()
+    print("nodes:")
+    if(len(nodeConnections) == 0):
+        print("  none")
+    else:
+        print("  {0:<25}  {1:>10}  {2:>10}  {3:>12}  {4:>12}".format("address", "connected", "busy", "utilization", "avg in use"))
+        for connectionID in nodeConnections:
+            connected = connectionEnd.get(connectionID, lastTime) - connectionStart.get(connectionID, events[0].time)
+            intervals = busyIntervals[connectionID]
+            busy = unionLength(intervals)
+            utilization = busy / connected if connected > 0 else math.nan
+            concurrency = sum(e - s for s, e in intervals) / connected if connected > 0 else math.nan
+            print("  {0:<25}  {1:>10}  {2:>10}  {3:>11.1f}%  {4:>12.2f}".format(connectionAddr.get(connectionID, "?"), formatSeconds(connected), formatSeconds(busy), utilization * 100, concurrency))
+
+
+
+if(__name__ == "__main__"):
+    analyze(readEvents(sys.argv[1] if len(sys.argv) > 1 else DEFAULTEVENTLOGFILE))
@@ -5,6 +5,11 @@ import time
 import uuid
 import tqdm
 import ast
+import struct
+import collections
+import json
+import zipfile
+import io
 
 
 
@@ -39,6 +44,9 @@ RESPONSE_NOTENOUGHSPACE = 14
 RESPONSE_NONEWRESULTS = 15
 RESPONSE_SENDAUUID = 16
 RESPONSE_NOAUUID = 17
+RESPONSE_SENDTASKOPTIONS = 18
+RESPONSE_SENDSHAREDINPUT = 19
+RESPONSE_FAILED = 20
 
 CLIENTFOLDER = "clientFiles"
 
@@ -85,25 +93,43 @@ def send(connection:socket.socket, packetType:int, data:typing.Union[bytes, int]
         return False
 
 
+#estimated from pings, server time = local time + serverClockOffset
+serverClockOffset = 0.0
+clockSamples : "collections.deque[typing.Tuple[float, float]]" = collections.deque(maxlen=8)  #(round trip time, offset)
 
-def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *, AUUID:uuid.UUID=None, checkpointFrequency=-1):
-    inputData = iter(tqdm.tqdm(inputData, smoothing=0.1))
+def updateClockOffset(sendTime:float, receiveTime:float, serverTime:float):
+    global serverClockOffset
+    clockSamples.append((receiveTime - sendTime, serverTime - (sendTime + receiveTime) / 2))
+    serverClockOffset = min(clockSamples)[1]  #the fastest round trip gives the tightest estimate
 
-    if(not os.path.isdir(CLIENTFOLDER)):
-        os.mkdir(CLIENTFOLDER)
+def serverTime() -> float:
+    return time.time() + serverClockOffset
 
-    results : "dict[str, str]" = dict()
 
-    #load checkpoint
-    clientTempCheckpointPath = os.path.join(CLIENTFOLDER, "clientTempCheckpoint.txt")
-    if(os.path.isfile(clientTempCheckpointPath)):
-        tqdm.tqdm.write("loading results from clientTempCheckpoint.txt")
-        clientTempCheckpoint = open(clientTempCheckpointPath, "r")
-        prevCalculatedResults = clientTempCheckpoint.read()
-        clientTempCheckpoint.close()
-        results = ast.literal_eval(prevCalculatedResults)
-    lastCheckpointAt = len(results)
 
+#ioMode: "files" for processors that read in.txt and write out.txt, "stdio" for processors that read stdin and write stdout
+#zips the processor with the files it needs, paths are kept relative to the processor's folder
+#timestamps are fixed so the same files always give the same bundle, which lets the server and nodes reuse their copy
+def makeBundle(processorFile:str, bundleFiles:"list[str]") -> bytes:
+    baseFolder = os.path.dirname(os.path.abspath(processorFile))
+    buffer = io.BytesIO()
+    bundle = zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED)
+    for path in sorted(set([processorFile] + list(bundleFiles))):
+        name = os.path.relpath(os.path.abspath(path), baseFolder).replace(os.sep, "/")
+        assert not name.startswith("../"), str(path)+" is not in the processor's folder"
+        info = zipfile.ZipInfo(name, (1980, 1, 1, 0, 0, 0))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        f = open(path, "rb")
+        bundle.writestr(info, f.read())
+        f.close()
+    bundle.close()
+    return buffer.getvalue()
+
+#connects as a client and sends the task, returns the connection ready for subtasks
+#bundleFiles are shipped with the processor once per node and can be found next to it (os.path.dirname(__file__))
+#sharedInput is sent once for the whole task, processors find it at the path in the DCSHAREDINPUT environment variable
+#build is a recipe for compiling the bundle on each node, {"command": ..., "run": ...}, see buildTask in node.py
+def startTask(addr: str, processorFile: str, *, AUUID:uuid.UUID=None, ioMode="files", bundleFiles:"list[str]"=None, sharedInput:typing.Union[str, bytes]=None, build:dict=None, profileRate:float=0, limits:dict=None) -> socket.socket:
     connection = socket.create_connection((addr, PORT))
     connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
     tqdm.tqdm.write("connected to "+str(connection.getpeername())+" as "+str(connection.getsockname()))
@@ -119,17 +145,59 @@ def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *,
     tqdm.tqdm.write("identified as client")
 
     #send preliminary data
-    tqdm.tqdm.write("sending processor file")
-    f = open(processorFile, "r")
-    send(connection, TYPE_DATA, f.read().encode())
-    f.close()
+    taskOptions = {"io": ioMode, "reportFailed": True}
+    if(profileRate > 0):
+        taskOptions["profileRate"] = profileRate
+    if(limits is not None):
+        taskOptions["limits"] = limits
+    if(bundleFiles or build is not None):
+        tqdm.tqdm.write("sending processor bundle")
+        send(connection, TYPE_DATA, makeBundle(processorFile, bundleFiles or []))
+        taskOptions["entry"] = os.path.basename(processorFile)
+        if(build is not None):
+            taskOptions["build"] = build
+    else:
+        tqdm.tqdm.write("sending processor file")
+        f = open(processorFile, "r")
+        send(connection, TYPE_DATA, f.read().encode())
+        f.close()
     tqdm.tqdm.write("file sent")
     if(AUUID is not None):
         tqdm.tqdm.write("sending AUUID "+str(AUUID))
         send(connection, TYPE_RESPONSE, RESPONSE_SENDAUUID)
         send(connection, TYPE_DATA, AUUID.bytes)
         tqdm.tqdm.write("sent AUUID")
+    if(sharedInput is not None):
+        tqdm.tqdm.write("sending shared input")
+        send(connection, TYPE_RESPONSE, RESPONSE_SENDSHAREDINPUT)
+        send(connection, TYPE_DATA, sharedInput.encode() if type(sharedInput) == str else sharedInput)
+        tqdm.tqdm.write("sent shared input")
+    send(connection, TYPE_RESPONSE, RESPONSE_SENDTASKOPTIONS)
+    send(connection, TYPE_DATA, json.dumps(taskOptions).encode())
     send(connection, TYPE_RESPONSE, RESPONSE_DONE)
+    return connection
+
+#blocking, returns {input: output} once every input is done, see startTask for the options
+def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *, checkpointFrequency=-1, **taskOptions):
+    inputData = iter(tqdm.tqdm(inputData, smoothing=0.1))
+
+    if(not os.path.isdir(CLIENTFOLDER)):
+        os.mkdir(CLIENTFOLDER)
+
+    results : "dict[str, str]" = dict()
+    failed : "dict[str, str]" = dict()  #inputs the server gave up on -> why, they are tried again on the next run
+
+    #load checkpoint
+    clientTempCheckpointPath = os.path.join(CLIENTFOLDER, "clientTempCheckpoint.txt")
+    if(os.path.isfile(clientTempCheckpointPath)):
+        tqdm.tqdm.write("loading results from clientTempCheckpoint.txt")
+        clientTempCheckpoint = open(clientTempCheckpointPath, "r")
+        prevCalculatedResults = clientTempCheckpoint.read()
+        clientTempCheckpoint.close()
+        results = ast.literal_eval(prevCalculatedResults)
+    lastCheckpointAt = len(results)
+
+    connection = startTask(addr, processorFile, **taskOptions)
 
     #send requests
     pendingSubtasks : "dict[uuid.UUID, str]" = dict()
@@ -139,9 +207,13 @@ def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *,
         #ping
         tqdm.tqdm.write("ping...", end="")
         # sys.stdout.flush()
+        sendTime = time.time()
         send(connection, TYPE_COMMAND, COMMAND_PING)
         pType, data = receive(connection)
         if(pType != TYPE_COMMAND or int.from_bytes(data, "big") != COMMAND_PONG): tqdm.tqdm.write("server did not pong ("+str(pType)+": "+str(data)+")")
+        pType, data = receive(connection)
+        if(pType == TYPE_DATA):
+            updateClockOffset(sendTime, time.time(), struct.unpack(">d", data)[0])
         tqdm.tqdm.write("pong")
 
         while True:
@@ -158,12 +230,14 @@ def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *,
             if(nextSubtaskInput != None):
                 tqdm.tqdm.write("submitting subtask...", end="")
                 # sys.stdout.flush()
+                submitTime = serverTime()
                 send(connection, TYPE_COMMAND, COMMAND_SUBMITSUBTASK)
                 pType, data = receive(connection)
                 if(pType != TYPE_RESPONSE): tqdm.tqdm.write("server sent invalid response to submit subtask")
                 response = int.from_bytes(data, "big")
                 if(response == RESPONSE_OK):
                     send(connection, TYPE_DATA, nextSubtaskInput.encode())
+                    send(connection, TYPE_DATA, struct.pack(">d", submitTime))
                     pType, data = receive(connection)
                     if(pType != TYPE_DATA):
                         tqdm.tqdm.write("server did not send uuid")
@@ -188,7 +262,7 @@ def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *,
             pType, data = receive(connection)
             if(pType != TYPE_RESPONSE): tqdm.tqdm.write("server sent invalid response to is subtask done")
             response = int.from_bytes(data, "big")
-            if(response == RESPONSE_OK):
+            if(response == RESPONSE_OK or response == RESPONSE_FAILED):
                 pType, data = receive(connection)
                 if(pType != TYPE_DATA):
                     tqdm.tqdm.write("server did not send uuid")
@@ -197,6 +271,10 @@ def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *,
                     pType, data = receive(connection)
                     if(pType != TYPE_DATA):
                         tqdm.tqdm.write("server did not send output")
+                    elif(response == RESPONSE_FAILED):
+                        subtaskInput = pendingSubtasks.pop(subtaskUUID)
+                        failed[subtaskInput] = data.decode()
+                        tqdm.tqdm.write("subtask "+str(subtaskUUID)+" failed: "+subtaskInput+" -> "+failed[subtaskInput])
                     else:
                         subtaskInput = pendingSubtasks.pop(subtaskUUID)
                         subtaskOutput = data.decode()
@@ -224,31 +302,40 @@ def runClient(addr: str, processorFile: str, inputData: typing.Iterable[str], *,
         if(nextSubtaskInput == None and len(pendingSubtasks) == 0):
             send(connection, TYPE_COMMAND, COMMAND_EXIT)
             tqdm.tqdm.write("all subtasks finished")
+            if(len(failed) > 0):
+                tqdm.tqdm.write(str(len(failed))+" subtasks failed, see failedSubtasks.txt")
+                f = open(os.path.join(CLIENTFOLDER, "failedSubtasks.txt"), "w")
+                f.write(str(failed))
+                f.close()
             return results
 
         time.sleep(1)
 
 
 
-targetAddress = input("server ip address: ")
+#client2.py imports this file as a library
+if(__name__ == "__main__"):
+    targetAddress = input("server ip address: ")
+
+    if(False):
+        #temp processor
+        processor = "processor/process.py"
+        inputData = ["1\n2","a\na","q\nw","4\n4","5\n5","6\n6","7\n7","8\n8","9\n9","10\n2"]
+        # inputData = ["1\n2","a\na"]
+        AUUID = None
+        bundleFiles = None
+    else:
+        #nerdle
+        processor = "processor/nerdleSolver1DC.py"
+        f = open("processor/equations3.txt")
+        inputData = f.read()
+        f.close()
+        inputData = inputData.strip().split("\n")
+        AUUID = uuid.UUID('aa9df30a-eb04-42eb-9c2c-8059edcaa7ea')
+        bundleFiles = ["processor/equations3.txt"]
 
-if(False):
-    #temp processor
-    processor = "processor/process.py"
-    inputData = ["1\n2","a\na","q\nw","4\n4","5\n5","6\n6","7\n7","8\n8","9\n9","10\n2"]
-    # inputData = ["1\n2","a\na"]
-    AUUID = None
-else:
-    #nerdle
-    processor = "processor/nerdleSolver1DC.py"
-    f = open("processor/equations3.txt")
-    inputData = f.read()
+    outputData = runClient(targetAddress, processor, inputData, AUUID=AUUID, checkpointFrequency=10, bundleFiles=bundleFiles)
+    print(outputData)
+    f = open(os.path.join(CLIENTFOLDER, "clientOutput.txt"), "w")
+    f.write(str(outputData))
     f.close()
-    inputData = inputData.strip().split("\n")
-    AUUID = uuid.UUID('aa9df30a-eb04-42eb-9c2c-8059edcaa7ea')
-
-outputData = runClient(targetAddress, processor, inputData, AUUID=AUUID, checkpointFrequency=10)
-print(outputData)
-f = open(os.path.join(CLIENTFOLDER, "clientOutput.txt"), "w")
-f.write(str(outputData))
-f.close()
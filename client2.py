@@ -1,4 +1,190 @@
-#TODO
+import threading
+import queue
+import asyncio
+import struct
+import time
+import typing
+import uuid
+import tqdm
 
-#like client, but instead is a class, has a submitTask function (submits to local queue, separate thread submits to server)
-#calls handleResult callback (inputData, outputData) instead of storing in a dict
+from client import startTask, send, receive, updateClockOffset, serverTime, MAXTIMEOUT, TYPE_COMMAND, TYPE_RESPONSE, TYPE_DATA, COMMAND_PING, COMMAND_PONG, COMMAND_EXIT, COMMAND_SUBMITSUBTASK, COMMAND_ISSUBTASKDONE, RESPONSE_OK, RESPONSE_FAILED, RESPONSE_NOTENOUGHSPACE, RESPONSE_NONEWRESULTS
+
+
+
+#like client.py, but as an object that can be embedded in other programs
+#submitTask can be called from any thread, it only adds the input to a local queue and a background thread streams it to the server
+#results are passed to handleResult(inputData, outputData) if it is given, otherwise they can be read with results() or async for
+#callbacks run on the background thread, slow ones hold up the submitting and polling
+#   dc = Client(addr, "processor/process.py", handleResult=print)
+#   dc.submitTask("1\n2")
+#   dc.finish(); dc.wait()
+
+POLLINTERVAL = 0.05  #wait before asking an idle server for results again, doubles while nothing happens
+MAXPOLLINTERVAL = 1
+PINGINTERVAL = MAXTIMEOUT / 2  #the server drops connections that are silent for MAXTIMEOUT
+
+
+
+class Client:
+    #the keyword options are the same as for client.runClient (AUUID, ioMode, bundleFiles, sharedInput, build, profileRate, limits)
+    #handleFailed(inputData, reason) is called for inputs the server gave up on, see MAXATTEMPTS in server.py
+    def __init__(self, addr:str, processorFile:str, handleResult:typing.Callable[[str, str], None] = None, handleFailed:typing.Callable[[str, str], None] = None, **taskOptions):
+        self.handleResult = handleResult
+        self.handleFailed = handleFailed
+        self.inputQueue : "queue.Queue[str]" = queue.Queue()
+        self.resultQueue : "queue.Queue[typing.Tuple[str, str]]" = queue.Queue()  #only used without handleResult, None marks the end
+        self.failed : "dict[str, str]" = dict()  #input -> why, for inputs that failed without handleFailed
+        self.pendingSubtasks : "dict[uuid.UUID, str]" = dict()
+        self.finishing = False
+        self.error : Exception = None
+        self.connection = startTask(addr, processorFile, **taskOptions)
+        self.thread = threading.Thread(None, self.run, "Client-Thread", daemon=True)
+        self.thread.start()
+
+    def submitTask(self, inputData:str):
+        assert not self.finishing, "submitTask called after finish"
+        self.inputQueue.put(inputData)
+
+    #no more inputs, the background thread exits once every submitted input has a result
+    def finish(self):
+        self.finishing = True
+        self.inputQueue.put(None)  #wakes the background thread
+
+    #blocks until the background thread is done, re-raises what stopped it if it failed
+    def wait(self, timeout:float = None) -> bool:
+        self.thread.join(timeout)
+        if(self.error is not None):
+            raise self.error
+        return not self.thread.is_alive()
+
+    #(input, output) pairs as they arrive, ends after finish once all of them were delivered
+    def results(self) -> "typing.Iterator[typing.Tuple[str, str]]":
+        assert self.handleResult is None, "results are passed to handleResult"
+        while True:
+            result = self.resultQueue.get()
+            if(result is None):
+                self.resultQueue.put(None)  #so other readers stop too
+                return
+            yield result
+
+    async def __aiter__(self):
+        assert self.handleResult is None, "results are passed to handleResult"
+        loop = asyncio.get_running_loop()
+        while True:
+            result = await loop.run_in_executor(None, self.resultQueue.get)
+            if(result is None):
+                self.resultQueue.put(None)
+                return
+            yield result
+
+    def run(self):
+        try:
+            nextInput : str = None
+            inputsDone = False
+            lastPing = 0.0
+            pollInterval = POLLINTERVAL
+            while True:
+                if(time.monotonic() - lastPing > PINGINTERVAL):
+                    self.ping()
+                    lastPing = time.monotonic()
+
+                #submit everything that is queued, until the server runs out of space
+                progress = False
+                queueFull = False
+                while not inputsDone:
+                    if(nextInput is None):
+                        try:
+                            nextInput = self.inputQueue.get(block=False)
+                        except queue.Empty:
+                            break
+                        if(nextInput is None):
+                            inputsDone = True  #finish was called
+                            continue
+                    if(not self.submitSubtask(nextInput)):
+                        queueFull = True
+                        break
+                    nextInput = None
+                    progress = True
+
+                while self.pendingSubtasks and self.checkSubtaskDone():
+                    progress = True
+
+                if(inputsDone and nextInput is None and len(self.pendingSubtasks) == 0):
+                    send(self.connection, TYPE_COMMAND, COMMAND_EXIT)
+                    break
+                if(progress):
+                    pollInterval = POLLINTERVAL
+                    continue
+
+                #nothing to do until there's a new input or the next poll for results
+                if(not queueFull and not inputsDone):
+                    try:
+                        nextInput = self.inputQueue.get(timeout=pollInterval if self.pendingSubtasks else PINGINTERVAL)
+                    except queue.Empty:
+                        pass
+                    else:
+                        if(nextInput is None):
+                            inputsDone = True
+                        continue
+                else:
+                    time.sleep(pollInterval)
+                pollInterval = min(pollInterval * 2, MAXPOLLINTERVAL)
+        except Exception as e:
+            tqdm.tqdm.write("client stopped: "+repr(e))
+            self.error = e
+        finally:
+            self.connection.close()
+            self.resultQueue.put(None)
+
+    def ping(self):
+        sendTime = time.time()
+        send(self.connection, TYPE_COMMAND, COMMAND_PING)
+        pType, data = receive(self.connection)
+        assert pType == TYPE_COMMAND and int.from_bytes(data, "big") == COMMAND_PONG, "server did not pong"
+        pType, data = receive(self.connection)
+        if(pType == TYPE_DATA):
+            updateClockOffset(sendTime, time.time(), struct.unpack(">d", data)[0])
+
+    #returns False if the server's queue is full
+    def submitSubtask(self, inputData:str) -> bool:
+        submitTime = serverTime()
+        send(self.connection, TYPE_COMMAND, COMMAND_SUBMITSUBTASK)
+        pType, data = receive(self.connection)
+        assert pType == TYPE_RESPONSE, "server sent invalid response to submit subtask"
+        response = int.from_bytes(data, "big")
+        if(response == RESPONSE_NOTENOUGHSPACE):
+            return False
+        assert response == RESPONSE_OK, "server sent unknown response to submit subtask"
+        send(self.connection, TYPE_DATA, inputData.encode())
+        send(self.connection, TYPE_DATA, struct.pack(">d", submitTime))
+        pType, data = receive(self.connection)
+        assert pType == TYPE_DATA, "server did not send uuid"
+        self.pendingSubtasks[uuid.UUID(bytes=data)] = inputData
+        return True
+
+    #returns False if there were no new results
+    def checkSubtaskDone(self) -> bool:
+        send(self.connection, TYPE_COMMAND, COMMAND_ISSUBTASKDONE)
+        pType, data = receive(self.connection)
+        assert pType == TYPE_RESPONSE, "server sent invalid response to is subtask done"
+        response = int.from_bytes(data, "big")
+        if(response == RESPONSE_NONEWRESULTS):
+            return False
+        assert response == RESPONSE_OK or response == RESPONSE_FAILED, "server sent unknown response to is subtask done"
+        pType, data = receive(self.connection)
+        assert pType == TYPE_DATA, "server did not send uuid"
+        subtaskUUID = uuid.UUID(bytes=data)
+        pType, data = receive(self.connection)
+        assert pType == TYPE_DATA, "server did not send output"
+        inputData = self.pendingSubtasks.pop(subtaskUUID)
+        if(response == RESPONSE_FAILED):
+            if(self.handleFailed is not None):
+                self.handleFailed(inputData, data.decode())
+            else:
+                tqdm.tqdm.write("subtask failed: "+inputData+" -> "+data.decode())
+                self.failed[inputData] = data.decode()
+        elif(self.handleResult is not None):
+            self.handleResult(inputData, data.decode())
+        else:
+            self.resultQueue.put((inputData, data.decode()))
+        return True
@@ -7,6 +7,24 @@ import threading
 import subprocess
 import platform
 import uuid
+import struct
+import json
+import collections
+import re
+import queue
+import hashlib
+import shutil
+import zipfile
+import io
+import stat
+import math
+import random
+import base64
+import signal
+try:
+    import resource
+except ImportError:
+    resource = None  #windows, cpu and memory limits aren't enforced there
 
 
 
@@ -29,6 +47,9 @@ COMMAND_GETSUBTASK = 11
 COMMAND_SUBMITSUBTASK = 12
 COMMAND_ISSUBTASKDONE = 13
 COMMAND_SUBMITSUBTASKOUTPUT = 14
+COMMAND_SUBMITSUBTASKOUTPUTS = 15
+COMMAND_GETSUBTASKS = 16
+COMMAND_GETTASKEXCLUDING = 17
 #responses
 RESPONSE_NODE = 83
 RESPONSE_CLIENT = 98
@@ -41,8 +62,34 @@ RESPONSE_NOTENOUGHSPACE = 14
 RESPONSE_NONEWRESULTS = 15
 RESPONSE_SENDAUUID = 16
 RESPONSE_NOAUUID = 17
+RESPONSE_SENDTASKOPTIONS = 18
+RESPONSE_SENDSHAREDINPUT = 19
+
+TYPE_ERROR = 5  #only used between node.py and nodeWorker.py
+TYPE_BATCH = 6  #only used between node.py and nodeWorker.py
+TYPE_PROFILE = 7  #only used between node.py and nodeWorker.py
 
 NODEFOLDER = "nodeFiles"
+ARTIFACTCACHEFOLDER = os.path.join(NODEFOLDER, "cache")
+ARTIFACTCACHEMAXBYTES = 1024**3  #least recently used artifacts are deleted past this
+BUILDTIMEOUT = 600
+SDKFOLDER = os.path.dirname(os.path.abspath(__file__))  #processorSDK.py, added to the processors' PYTHONPATH
+WORKERSCRIPT = os.path.join(SDKFOLDER, "nodeWorker.py")
+WORKERMAXITEMS = 1000  #warm workers are restarted after this many subtasks to contain leaks
+WORKERPROBETIMEOUT = 5  #alt processors that haven't sent the ready packet by then are run once per subtask instead
+POOLSIZE = os.cpu_count() or 1  #number of subtasks processed at once
+PREFETCHDEPTH = POOLSIZE  #subtasks fetched ahead so a finished executor can start the next one without waiting on the server
+UPLOADBATCHSIZE = 32  #max results sent in one packet
+RECONNECTDELAY = 1  #doubles after every failed attempt
+MAXRECONNECTDELAY = 30
+IDLEPOLLINTERVAL = 0.05  #wait before asking an idle server for work again, doubles while it stays idle
+MAXIDLEPOLLINTERVAL = 2
+HEARTBEATINTERVAL = 0.5  #seconds between pings, the server reclaims subtasks of nodes that stay silent for much longer
+KEEPALIVEIDLE = 5  #tcp keepalive, in seconds
+KEEPALIVEINTERVAL = 1
+KEEPALIVECOUNT = 3
+MEMORYLIMITFRACTION = 0.9  #processors that fail with a peak rss this close to the memory limit count as hitting it
+CLOCKTICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100  #unit of the cpu times in /proc
 
 
 
@@ -69,11 +116,13 @@ def receive(connection:socket.socket) -> typing.Tuple[int, bytes]:
         data = _receiveBytes(connection, length)
         return (packetType, data)
     except SocketIsClosedException:
-        print(str(connection.getpeername())+": socket closed")
-        return (TYPE_INVALID, 2)
-    except ConnectionResetError as e:
+        print("server socket closed")
+        markConnectionClosed(connection)
+        return (TYPE_INVALID, bytes())
+    except OSError as e:
         print(e)
-        return (TYPE_INVALID, 3)
+        markConnectionClosed(connection)
+        return (TYPE_INVALID, bytes())
 
 #returns False if failed
 def send(connection:socket.socket, packetType:int, data:typing.Union[bytes, int]) -> bool:
@@ -86,220 +135,1100 @@ def send(connection:socket.socket, packetType:int, data:typing.Union[bytes, int]
         connection.sendall(packeTypeAsBytes)
         connection.sendall(data)
         return True
-    except socket.timeout:
+    except OSError as e:
+        print(e)
+        markConnectionClosed(connection)
+        return False
+
+#same packet format as the socket, used for the pipes to warm workers
+def _readPipeBytes(stream:typing.BinaryIO, numBytes):
+    data = stream.read(numBytes)
+    if(data is None or len(data) < numBytes):
+        raise EOFError()
+    return data
+
+def receiveFromPipe(stream:typing.BinaryIO) -> typing.Tuple[int, bytes]:
+    try:
+        length = int.from_bytes(_readPipeBytes(stream, 4), "big")
+        packetType = int.from_bytes(_readPipeBytes(stream, 4), "big")
+        data = _readPipeBytes(stream, length)
+        return (packetType, data)
+    except (EOFError, OSError):
+        return (TYPE_INVALID, bytes())
+
+def sendToPipe(stream:typing.BinaryIO, packetType:int, data:typing.Union[bytes, int]) -> bool:
+    if(type(data) == int):
+        data = data.to_bytes(4, "big")
+    try:
+        stream.write(len(data).to_bytes(4, "big") + packetType.to_bytes(4, "big") + data)
+        stream.flush()
+        return True
+    except OSError:
         return False
 
+#processors that define process(inputData) or process_batch(inputs) can be kept loaded in a nodeWorker.py process
+def isWorkerProcessor(processorFilePath:str) -> bool:
+    return definesFunction(processorFilePath, "process") or definesFunction(processorFilePath, "process_batch")
+
+def definesFunction(processorFilePath:str, name:str) -> bool:
+    f = open(processorFilePath, "rb")
+    source = f.read()
+    f.close()
+    return re.search(rb"^def "+name.encode()+rb"\(", source, re.MULTILINE) is not None
+
+def packItems(items:"list[bytes]") -> bytes:
+    return b"".join(len(item).to_bytes(4, "big") + item for item in items)
+
+def unpackItems(data:bytes) -> "list[bytes]":
+    items = []
+    i = 0
+    while i < len(data):
+        length = int.from_bytes(data[i:i+4], "big")
+        items.append(data[i+4:i+4+length])
+        i += 4 + length
+    return items
+
+#resource usage of processor runs goes in the output info as cpuUser, cpuSystem, maxRSS (bytes) and wall (seconds)
+#fields that can't be measured on this platform are left out
+def rusageToUsage(rusage) -> "dict[str, float]":
+    #ru_maxrss is in KiB, except on macos where it is in bytes
+    return {"cpuUser": rusage.ru_utime, "cpuSystem": rusage.ru_stime, "maxRSS": rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)}
+
+#reaps a processor that ran once, wait4 returns the usage that Popen.wait would throw away
+def waitAndMeasure(popen:subprocess.Popen, deadline:"Deadline" = None) -> typing.Tuple[int, "dict[str, float]"]:
+    if(not hasattr(os, "wait4")):
+        returnCode = popen.wait()
+        if(deadline is not None):
+            deadline.cancel()
+        return (returnCode, dict())
+    if(deadline is not None and hasattr(os, "waitid")):
+        os.waitid(os.P_PID, popen.pid, os.WEXITED | os.WNOWAIT)  #exited but not reaped yet, so the deadline can't kill a reused pid
+        deadline.cancel()
+    try:
+        _, status, rusage = os.wait4(popen.pid, 0)
+    except ChildProcessError:
+        #reaped elsewhere already
+        if(deadline is not None):
+            deadline.cancel()
+        return (popen.wait(), dict())
+    #without waitid (macos before python 3.13) the deadline is cancelled right after reaping, leaving only a tiny window for pid reuse
+    if(deadline is not None):
+        deadline.cancel()
+    popen.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    return (popen.returncode, rusageToUsage(rusage))
+
+#cpu time and peak rss so far of a process that is still running, from /proc
+def processUsage(pid:int) -> "dict[str, float]":
+    try:
+        f = open("/proc/"+str(pid)+"/stat", "r")
+        fields = f.read().rsplit(")", 1)[1].split()  #the name before ")" can contain spaces
+        f.close()
+        f = open("/proc/"+str(pid)+"/status", "r")
+        status = f.read()
+        f.close()
+    except (OSError, IndexError):
+        return dict()
+    usage = {"cpuUser": int(fields[11]) / CLOCKTICKS, "cpuSystem": int(fields[12]) / CLOCKTICKS}
+    match = re.search(r"^VmHWM:\s+(\d+) kB", status, re.MULTILINE)
+    if(match is not None):
+        usage["maxRSS"] = int(match.group(1)) * 1024
+    return usage
+
+#usage between two processUsage calls, maxRSS stays the peak of the whole process
+def usageSince(before:"dict[str, float]", after:"dict[str, float]") -> "dict[str, float]":
+    if(len(before) == 0 or len(after) == 0):
+        return dict()
+    usage = {"cpuUser": after["cpuUser"] - before["cpuUser"], "cpuSystem": after["cpuSystem"] - before["cpuSystem"]}
+    if("maxRSS" in after):
+        usage["maxRSS"] = after["maxRSS"]
+    return usage
+
+#limits from the task options: {"wall": seconds, "cpu": seconds, "memory": bytes}, all optional
+#processors are started in their own session so everything they start is killed with them
+def killProcessGroup(popen:subprocess.Popen):
+    try:
+        if(hasattr(os, "killpg")):
+            os.killpg(popen.pid, signal.SIGKILL)
+        else:
+            popen.kill()
+    except OSError:
+        pass  #already exited
+
+#kills the processor once the wall clock limit is up
+class Deadline:
+    def __init__(self, popen:subprocess.Popen, seconds:float):
+        self.popen = popen
+        self.expired = False
+        self.done = False
+        self.mutex = threading.Lock()
+        self.timer : threading.Timer = None
+        if(seconds is not None):
+            self.timer = threading.Timer(seconds, self.expire)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def expire(self):
+        with self.mutex:
+            if(self.done):
+                return
+            self.expired = True
+            killProcessGroup(self.popen)
+
+    #has to be called before the processor is reaped
+    def cancel(self):
+        with self.mutex:
+            self.done = True
+        if(self.timer is not None):
+            self.timer.cancel()
+
+#cpu and memory limits are set with prlimit right after the processor starts, this needs linux
+#the cpu limit is on the total cpu time of the process, so it is raised by what was already used for warm workers
+def applyLimits(pid:int, limits:dict, cpuUsed:float = 0):
+    if(resource is None or not hasattr(resource, "prlimit")):
+        return
+    try:
+        if("cpu" in limits):
+            _, hard = resource.prlimit(pid, resource.RLIMIT_CPU)
+            soft = math.ceil(cpuUsed + limits["cpu"])
+            #at least a second below the hard limit, so the processor always gets SIGXCPU before the SIGKILL
+            resource.prlimit(pid, resource.RLIMIT_CPU, (soft if hard == resource.RLIM_INFINITY else max(min(soft, hard - 1), 0), hard))
+        if("memory" in limits):
+            _, hard = resource.prlimit(pid, resource.RLIMIT_AS)
+            resource.prlimit(pid, resource.RLIMIT_AS, (int(limits["memory"]) if hard == resource.RLIM_INFINITY else min(int(limits["memory"]), hard), hard))
+    except (OSError, ValueError):
+        pass  #already exited
+
+#python processors that run out of address space end with a MemoryError traceback
+def isMemoryError(errorData:bytes) -> bool:
+    lines = errorData.strip().splitlines()
+    return len(lines) > 0 and lines[-1].startswith(b"MemoryError")
+
+#"ok", "error" or "timeout" and a message saying which limit was hit, "timeout" covers all of the task's limits
+#errorData is what the processor wrote to stderr
+def processOutcome(returnCode:int, deadline:Deadline, limits:dict, usage:"dict[str, float]", errorData:bytes = bytes()) -> typing.Tuple[str, str]:
+    if(deadline.expired):
+        return ("timeout", "timed out after "+str(limits["wall"])+"s\n")
+    #the kernel sends SIGXCPU past the soft limit, applyLimits keeps it below the hard one
+    if("cpu" in limits and hasattr(signal, "SIGXCPU") and returnCode == -signal.SIGXCPU):
+        return ("timeout", "exceeded the cpu limit of "+str(limits["cpu"])+"s\n")
+    #allocations past RLIMIT_AS fail, which python turns into a MemoryError and other processors usually into a crash
+    if("memory" in limits and returnCode != 0 and (isMemoryError(errorData) or usage.get("maxRSS", 0) >= limits["memory"] * MEMORYLIMITFRACTION)):
+        return ("timeout", "exceeded the memory limit of "+str(limits["memory"])+" bytes\n")
+    if(returnCode != 0):
+        return ("error", "")
+    return ("ok", "")
+
+#a long lived processor process that handles one subtask at a time over its stdin/stdout
+#it is restarted after an error or after WORKERMAXITEMS subtasks
+class PersistentWorker:
+    def __init__(self, args:"list[str]", cwd:str, env:"dict[str, str]" = None, readyTimeout:float = None, limits:dict = None):
+        self.args = args
+        self.cwd = cwd
+        self.env = env
+        self.readyTimeout = readyTimeout  #None waits for as long as setup takes
+        self.limits = limits or dict()  #per subtask, setup isn't limited except for memory
+        self.popen : subprocess.Popen = None
+        self.numItems = 0
+
+    def start(self) -> typing.Tuple[int, bytes]:
+        print("starting worker")
+        self.popen = subprocess.Popen(self.args, cwd=self.cwd, env=self.env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, start_new_session=True)
+        if("memory" in self.limits):
+            applyLimits(self.popen.pid, {"memory": self.limits["memory"]})
+        self.numItems = 0
+        if(self.readyTimeout is None):
+            return receiveFromPipe(self.popen.stdout)  #sent once setup is done
+        #pipes can't be polled on every platform, so the ready packet is read on a separate thread
+        ready = []
+        reader = threading.Thread(None, lambda: ready.append(receiveFromPipe(self.popen.stdout)), "Worker-Probe", daemon=True)
+        reader.start()
+        reader.join(self.readyTimeout)
+        if(len(ready) == 0):
+            killProcessGroup(self.popen)  #also ends the reader
+            return (TYPE_INVALID, bytes())
+        return ready[0]
+
+    #returns (output, outcome, usage, marshaled pstats or None), outcome is "ok", "error" or "timeout"
+    def run(self, inputData:bytes, profile:bool = False) -> typing.Tuple[bytes, str, "dict[str, float]", bytes]:
+        return self.exchange(TYPE_DATA, inputData, 1, profile)
+
+    #same as run for the whole batch, the limits are per subtask and after an error every output is the error
+    def runBatch(self, inputs:"list[bytes]", profile:bool = False) -> typing.Tuple["list[bytes]", str, "dict[str, float]", bytes]:
+        data, outcome, usage, profileData = self.exchange(TYPE_BATCH, packItems(inputs), len(inputs), profile)
+        if(outcome != "ok"):
+            return ([data]*len(inputs), outcome, usage, profileData)
+        return (unpackItems(data), outcome, usage, profileData)
+
+    #the reply has the same type as the request, or is TYPE_ERROR
+    #usage doesn't include starting the worker and its setup
+    def exchange(self, packetType:int, data:bytes, numItems:int, profile:bool = False) -> typing.Tuple[bytes, str, "dict[str, float]", bytes]:
+        if(self.popen is None):
+            pType, replyData = self.start()
+            if(pType != TYPE_RESPONSE):
+                self.close()
+                return (replyData if pType == TYPE_ERROR else "worker failed to start".encode(), "error", dict(), None)
+        before = processUsage(self.popen.pid)
+        if("cpu" in self.limits):
+            applyLimits(self.popen.pid, {"cpu": self.limits["cpu"] * numItems}, before.get("cpuUser", 0) + before.get("cpuSystem", 0))
+        deadline = Deadline(self.popen, self.limits["wall"] * numItems if "wall" in self.limits else None)
+        if(profile):
+            sent = sendToPipe(self.popen.stdin, TYPE_PROFILE, packItems([packetType.to_bytes(4, "big"), data]))
+        else:
+            sent = sendToPipe(self.popen.stdin, packetType, data)
+        if(sent):
+            pType, replyData = receiveFromPipe(self.popen.stdout)
+        else:
+            pType, replyData = (TYPE_INVALID, bytes())
+        usage = usageSince(before, processUsage(self.popen.pid))
+        deadline.cancel()  #the worker isn't reaped before close
+        profileData = None
+        if(profile and pType == TYPE_PROFILE):
+            replyData, profileData = unpackItems(replyData)
+            pType = packetType
+        self.numItems += numItems
+        if(pType == packetType):
+            if(self.numItems >= WORKERMAXITEMS):
+                self.close()
+            return (replyData, "ok", usage, profileData)
+        #the processor may be in a bad state after an error
+        returnCode = self.close()
+        if(pType == TYPE_ERROR):
+            if("memory" in self.limits and isMemoryError(replyData)):
+                return (replyData + ("exceeded the memory limit of "+str(self.limits["memory"])+" bytes\n").encode(), "timeout", usage, None)
+            return (replyData, "error", usage, None)
+        #memory is a limit on the whole worker, not per subtask
+        outcome, message = processOutcome(returnCode, deadline, {name: limit if name == "memory" else limit * numItems for name, limit in self.limits.items()}, usage)
+        if(outcome == "timeout"):
+            return (message.encode(), outcome, usage, None)
+        return ("worker exited unexpectedly".encode(), "error", usage, None)
+
+    #returns the exit code
+    def close(self) -> int:
+        if(self.popen is None):
+            return None
+        try:
+            self.popen.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.popen.wait(MAXTIMEOUT)
+        except subprocess.TimeoutExpired:
+            killProcessGroup(self.popen)
+            self.popen.wait()
+        returnCode = self.popen.returncode
+        self.popen = None
+        return returnCode
+
+def folderSize(folder:str) -> int:
+    size = 0
+    for dirPath, _, fileNames in os.walk(folder):
+        for fileName in fileNames:
+            size += os.path.getsize(os.path.join(dirPath, fileName))
+    return size
+
+#unpacked bundle files are read-only
+def removeFolder(folder:str):
+    def onError(func, path, _):
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    shutil.rmtree(folder, onerror=onError)
+
+#artifacts are stored by the sha256 of their contents, in a folder per artifact
+#a single file processor is saved as cache/<hash>/processor.py and a bundle is unpacked into cache/<hash>/
+#so identical processors from different tasks are only downloaded once, also across node restarts
+#artifacts still used by queued or running subtasks are never evicted
+class ArtifactCache:
+    def __init__(self, folder:str, maxBytes:int):
+        self.folder = os.path.abspath(folder)
+        self.maxBytes = maxBytes
+        self.mutex = threading.Lock()
+        self.sizes : "collections.OrderedDict[str, int]" = collections.OrderedDict()  #least recently used first
+        self.users : "collections.Counter[str]" = collections.Counter()
+        if(not os.path.isdir(self.folder)):
+            os.makedirs(self.folder)
+        entries = []
+        for name in os.listdir(self.folder):
+            path = os.path.join(self.folder, name)
+            if(".tmp" in name):
+                removeFolder(path)  #left over from an interrupted download
+                continue
+            entries.append((os.path.getmtime(path), name, folderSize(path)))
+        for _, name, size in sorted(entries):
+            self.sizes[name] = size
+
+    #returns the artifact's folder, or None if it isn't cached
+    def get(self, artifactHash:str) -> str:
+        with self.mutex:
+            if(artifactHash not in self.sizes):
+                return None
+            self.sizes.move_to_end(artifactHash)
+        os.utime(os.path.join(self.folder, artifactHash))  #so the order survives restarts
+        return os.path.join(self.folder, artifactHash)
+
+    #returns the artifact's folder
+    #fileName is what a single file artifact is saved as, or None if the artifact is a zip bundle
+    def add(self, artifactHash:str, data:bytes, fileName:str) -> str:
+        assert hashlib.sha256(data).hexdigest() == artifactHash, "processor does not match its hash"
+        tempFolder = self.tempFolder(artifactHash)
+        if(fileName is None):
+            bundle = zipfile.ZipFile(io.BytesIO(data))
+            bundle.extractall(tempFolder)  #drops absolute paths and ..
+            bundle.close()
+        else:
+            f = open(os.path.join(tempFolder, fileName), "wb")
+            f.write(data)
+            f.close()
+        return self.commit(artifactHash, tempFolder)
+
+    #artifacts are prepared in a temporary folder and then committed
+    #so a crash never leaves a partial artifact under its hash
+    def tempFolder(self, artifactHash:str) -> str:
+        tempFolder = os.path.join(self.folder, artifactHash+".tmp"+str(os.getpid()))
+        if(os.path.isdir(tempFolder)):
+            removeFolder(tempFolder)
+        os.makedirs(tempFolder)
+        return tempFolder
+
+    #returns the artifact's folder
+    def commit(self, artifactHash:str, tempFolder:str) -> str:
+        #shared by every executor, so data files can be memory mapped read-only instead of loaded by each one
+        for dirPath, _, fileNames in os.walk(tempFolder):
+            for name in fileNames:
+                path = os.path.join(dirPath, name)
+                os.chmod(path, os.stat(path).st_mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+        size = folderSize(tempFolder)
+        try:
+            os.rename(tempFolder, os.path.join(self.folder, artifactHash))
+        except OSError:
+            removeFolder(tempFolder)  #already there
+        with self.mutex:
+            self.sizes[artifactHash] = size
+            self.sizes.move_to_end(artifactHash)
+            self.evict(artifactHash)
+        return os.path.join(self.folder, artifactHash)
+
+    def evict(self, keepHash:str):
+        total = sum(self.sizes.values())
+        for artifactHash in list(self.sizes):
+            if(total <= self.maxBytes):
+                break
+            if(artifactHash == keepHash or self.users[artifactHash] > 0):
+                continue
+            print("evicting artifact "+artifactHash)
+            total -= self.sizes.pop(artifactHash)
+            removeFolder(os.path.join(self.folder, artifactHash))
+
+    #hold while a subtask that needs the artifact is queued or running
+    def hold(self, artifactHash:str):
+        with self.mutex:
+            self.users[artifactHash] += 1
+
+    def release(self, artifactHash:str):
+        with self.mutex:
+            self.users[artifactHash] -= 1
+            if(self.users[artifactHash] <= 0):
+                del self.users[artifactHash]
+
+#alt processor path -> whether it speaks the worker protocol, found out the first time it is used
+#alt processors are started with DCWORKERPROTOCOL=1 and one that supports it replies the same way as nodeWorker.py (see plan.txt)
+altProcessorIsWorker : "dict[str, bool]" = dict()
+altProbeMutex = threading.Lock()  #each alt processor is probed once, the other executors wait for the answer
+
+#returns None if the alt processor doesn't speak the worker protocol
+#the probe runs in an empty folder, a legacy processor started by it would otherwise read the in.txt another subtask left behind
+def startAltWorker(task:"Task", folder:str) -> PersistentWorker:
+    with altProbeMutex:
+        if(task.altProcessorFilePath not in altProcessorIsWorker):
+            folder = folder + "-probe"  #the executor keeps the probe as its worker, so the folder is per executor
+            if(os.path.isdir(folder)):
+                removeFolder(folder)
+            os.mkdir(folder)
+            worker = startAltWorkerIn(task, folder)
+            print("alt processor "+("speaks the worker protocol" if worker is not None else "is run once per subtask"))
+            return worker
+    if(not altProcessorIsWorker[task.altProcessorFilePath]):
+        return None
+    return startAltWorkerIn(task, folder)
+
+def startAltWorkerIn(task:"Task", folder:str) -> PersistentWorker:
+    worker = PersistentWorker([task.altProcessorFilePath], folder, dict(task.env, DCWORKERPROTOCOL="1"), WORKERPROBETIMEOUT, task.limits)
+    pType, data = worker.start()
+    isWorker = pType == TYPE_RESPONSE and data == RESPONSE_OK.to_bytes(4, "big")
+    altProcessorIsWorker[task.altProcessorFilePath] = isWorker
+    if(not isWorker):
+        worker.close()
+        return None
+    return worker
+
+#everything an executor needs to run subtasks of a task
+class Task:
+    def __init__(self, taskUUID:uuid.UUID, processorHash:str, processorFilePath:str, altProcessorFilePath:str, options:dict, sharedInputHash:str = None, sharedInputPath:str = None, buildHash:str = None):
+        self.taskUUID = taskUUID
+        self.processorHash = processorHash
+        self.processorFilePath = processorFilePath
+        self.altProcessorFilePath = altProcessorFilePath  #None if there is no alt processor
+        self.options = options
+        self.sharedInputHash = sharedInputHash
+        self.sharedInputPath = sharedInputPath
+        #cache entries the task's subtasks need
+        self.artifactHashes = [h for h in [processorHash, sharedInputHash, buildHash] if h is not None]
+        #environment of the processor's process, the shared input is passed as a path so it is read (or memory mapped) once per process
+        self.env = dict(os.environ)
+        self.env["PYTHONPATH"] = os.pathsep.join([SDKFOLDER] + ([os.environ["PYTHONPATH"]] if "PYTHONPATH" in os.environ else []))
+        if(sharedInputPath is not None):
+            self.env["DCSHAREDINPUT"] = sharedInputPath
+        #"files": in.txt/out.txt/error.txt in the executor folder, "stdio": input on stdin and output from stdout/stderr
+        self.ioMode = options.get("io", "files")
+        #keep the processor loaded between subtasks if it supports it
+        self.usesWorker = altProcessorFilePath is None and isWorkerProcessor(processorFilePath)
+        self.usesBatches = self.usesWorker and definesFunction(processorFilePath, "process_batch")
+        #fraction of subtasks run under cProfile, only python processors can be profiled
+        self.profileRate = options.get("profileRate", 0) if altProcessorFilePath is None else 0
+        #{"wall": seconds, "cpu": seconds, "memory": bytes} per subtask, all optional
+        self.limits = options.get("limits", dict())
+        if(("cpu" in self.limits or "memory" in self.limits) and (resource is None or not hasattr(resource, "prlimit"))):
+            print("WARNING: cpu and memory limits need linux, only the wall clock limit is enforced")
+
+def pythonCommand() -> str:
+    if(platform.system() == "Windows"):
+        return "python"
+    elif(platform.system() == "Linux" or platform.system() == "Darwin"):
+        return "python3"
+    raise AssertionError("unkonwn platform, unsure whether to use python or python3")
+
+#runs the processor in its own process for a single subtask with the input and output piped, no files are involved
+#the python processor's command line, run under cProfile if profilePath is set
+def processorArgs(task:Task, profilePath:str = None) -> "list[str]":
+    if(profilePath is not None):
+        return [pythonCommand(), "-m", "processorSDK", "--profile", profilePath, task.processorFilePath]
+    return [pythonCommand(), task.processorFilePath]
+
+#starts the processor for one subtask with the task's limits
+def startProcessor(task:Task, folder:str, profilePath:str, **kwargs) -> typing.Tuple[subprocess.Popen, Deadline]:
+    if(task.altProcessorFilePath is not None):
+        args = [task.altProcessorFilePath]
+    else:
+        args = processorArgs(task, profilePath)
+    popen = subprocess.Popen(args, cwd=folder, env=task.env, start_new_session=True, **kwargs)
+    applyLimits(popen.pid, task.limits)
+    return (popen, Deadline(popen, task.limits.get("wall")))
+
+def runProcessorOnceWithPipes(task:Task, inputData:bytes, folder:str, profilePath:str = None) -> typing.Tuple[bytes, str, "dict[str, float]"]:
+    #like subprocess.run, but reaped by waitAndMeasure
+    popen, deadline = startProcessor(task, folder, profilePath, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    errorData = []
+    errorReader = threading.Thread(None, lambda: errorData.append(popen.stderr.read()), "Processor-Stderr", daemon=True)
+    errorReader.start()
+    inputWriter = threading.Thread(None, writeAndClose, "Processor-Stdin", (popen.stdin, inputData), daemon=True)
+    inputWriter.start()
+    outputData = popen.stdout.read()
+    inputWriter.join()
+    errorReader.join()
+    popen.stdout.close()
+    popen.stderr.close()
+    returnCode, usage = waitAndMeasure(popen, deadline)
+    outcome, message = processOutcome(returnCode, deadline, task.limits, usage, errorData[0])
+    #also send errors
+    if(outcome != "ok"):
+        outputData += errorData[0] + message.encode()
+    return (outputData, outcome, usage)
+
+def writeAndClose(pipe, data:bytes):
+    try:
+        pipe.write(data)
+    except OSError:
+        pass  #the processor exited without reading all of its input
+    try:
+        pipe.close()
+    except OSError:
+        pass
+
+#runs the processor in its own process for a single subtask
+#returns (output, outcome, usage, marshaled pstats or None), outcome is "ok", "error" or "timeout"
+def runProcessorOnce(task:Task, inputData:bytes, folder:str, profile:bool = False) -> typing.Tuple[bytes, str, "dict[str, float]", bytes]:
+    profilePath = None
+    if(profile):
+        profilePath = os.path.join(folder, "profile.prof")
+        if(os.path.exists(profilePath)):
+            os.remove(profilePath)
+    if(task.ioMode == "stdio"):
+        outputData, outcome, usage = runProcessorOnceWithPipes(task, inputData, folder, profilePath)
+    else:
+        outputData, outcome, usage = runProcessorOnceWithFiles(task, inputData, folder, profilePath)
+    profileData = None
+    if(profilePath is not None and os.path.exists(profilePath)):
+        f = open(profilePath, "rb")
+        profileData = f.read()
+        f.close()
+    return (outputData, outcome, usage, profileData)
+
+#using in.txt/out.txt/error.txt in folder
+def runProcessorOnceWithFiles(task:Task, inputData:bytes, folder:str, profilePath:str = None) -> typing.Tuple[bytes, str, "dict[str, float]"]:
+    inputFilePath = os.path.join(folder, "in.txt")
+    f = open(inputFilePath, "w")
+    f.write(inputData.decode())
+    f.close()
+    errorFilePath = os.path.join(folder, "error.txt")
+    errorFile = open(errorFilePath, "w")
+    outputFilePath = os.path.join(folder, "out.txt")
+    if(os.path.exists(outputFilePath)):
+        os.remove(outputFilePath)  #left over from the previous subtask
+
+    popen, deadline = startProcessor(task, folder, profilePath, stderr=errorFile)
+    returnCode, usage = waitAndMeasure(popen, deadline)
+    errorFile.close()
+    f = open(errorFilePath, "rb")
+    errorData = f.read()
+    f.close()
+    outcome, message = processOutcome(returnCode, deadline, task.limits, usage, errorData)
+    if(outcome == "timeout"):
+        return (message.encode(), outcome, usage)
+
+    try:
+        f = open(outputFilePath, "r")
+        outputData = f.read()
+        f.close()
+        outputData = outputData.encode()
+    except FileNotFoundError:
+        outputData = "out.txt file not found".encode()
+    #also send errors
+    if(outcome != "ok"):
+        outputData += errorData + message.encode()
+    return (outputData, outcome, usage)
+
+prefetchQueue : "queue.Queue[typing.Tuple[Task, list[typing.Tuple[bytes, bytes]]]]" = queue.Queue()  #(task, [(subtask uuid, input)]), None stops an executor
+finishedQueue : "queue.Queue[typing.Tuple[bytes, bytes, dict]]" = queue.Queue()  #(subtask uuid, output, output info)
+
+#a batch's usage is shared equally between its subtasks, except maxRSS
+#a batch's profile only goes with its first subtask
+def makeOutputInfo(nodeStartTime:float, processEndTime:float, outcome:str, usage:"dict[str, float]", numSubtasks:int, inputData:bytes, outputData:bytes, profileData:bytes = None) -> dict:
+    outputInfo = {"nodeStart": nodeStartTime, "processEnd": processEndTime, "outcome": outcome, "bytesIn": len(inputData), "bytesOut": len(outputData)}
+    for field, value in usage.items():
+        outputInfo[field] = value if field == "maxRSS" else value / numSubtasks
+    if(profileData is not None):
+        outputInfo["profile"] = base64.b64encode(profileData).decode()
+    return outputInfo
+
+#each executor has its own folder so in.txt/out.txt/error.txt of concurrent subtasks don't collide
+def runExecutor(executorID:int):
+    executorFolder = os.path.abspath(os.path.join(NODEFOLDER, "executor-"+str(executorID)))
+    if(not os.path.isdir(executorFolder)):
+        os.mkdir(executorFolder)
+    worker : PersistentWorker = None
+    workerTaskUUID : uuid.UUID = None
+    while True:
+        item = prefetchQueue.get()
+        if(item is None):
+            break
+        task, subtasks = item
+        if(worker is not None and workerTaskUUID != task.taskUUID):
+            worker.close()
+            worker = None
+        if(worker is None and task.usesWorker):
+            worker = PersistentWorker([sys.executable, WORKERSCRIPT, task.processorFilePath], executorFolder, task.env, limits=task.limits)
+            workerTaskUUID = task.taskUUID
+        elif(worker is None and task.altProcessorFilePath is not None and altProcessorIsWorker.get(task.altProcessorFilePath, True)):
+            worker = startAltWorker(task, executorFolder)
+            workerTaskUUID = task.taskUUID
+
+        if(task.usesBatches and len(subtasks) > 1):
+            print("processing "+str(len(subtasks))+" subtasks on executor "+str(executorID))
+            nodeStartTime = serverTime()
+            wallStartTime = time.perf_counter()
+            outputs, outcome, usage, profileData = worker.runBatch([inputData for _, inputData in subtasks], random.random() < task.profileRate)
+            usage["wall"] = time.perf_counter() - wallStartTime
+            processEndTime = serverTime()
+            print("done"+(" ("+outcome+")" if outcome != "ok" else ""))
+            for (subtaskUUIDBytes, inputData), outputData in zip(subtasks, outputs):
+                finishedQueue.put((subtaskUUIDBytes, outputData, makeOutputInfo(nodeStartTime, processEndTime, outcome, usage, len(subtasks), inputData, outputData, profileData)))
+                profileData = None
+        else:
+            for subtaskUUIDBytes, inputData in subtasks:
+                print("processing subtask "+str(uuid.UUID(bytes=subtaskUUIDBytes))+" on executor "+str(executorID))
+                nodeStartTime = serverTime()
+                wallStartTime = time.perf_counter()
+                profile = random.random() < task.profileRate
+                if(worker is not None):
+                    outputData, outcome, usage, profileData = worker.run(inputData, profile)
+                else:
+                    outputData, outcome, usage, profileData = runProcessorOnce(task, inputData, executorFolder, profile)
+                usage["wall"] = time.perf_counter() - wallStartTime
+                processEndTime = serverTime()
+                print("done"+(" ("+outcome+")" if outcome != "ok" else ""))
+                finishedQueue.put((subtaskUUIDBytes, outputData, makeOutputInfo(nodeStartTime, processEndTime, outcome, usage, 1, inputData, outputData, profileData)))
+        for _ in subtasks:
+            for artifactHash in task.artifactHashes:
+                artifactCache.release(artifactHash)
+    if(worker is not None):
+        worker.close()
+
 socketMutex = threading.Lock()
-connectionClosed = False
+connection : socket.socket = None
+connectionClosed = True  #set when the connection is lost, the main loop then reconnects
+nodeShuttingDown = False
+
+#the main loop blocks on these instead of polling, anything else it waits for is a timer
+EVENT_SLOTFREED = 0  #results were acknowledged, so more subtasks can be fetched
+EVENT_DISCONNECTED = 1
+mainLoopEvents : "queue.Queue[int]" = queue.Queue()
 
-def regularPing(connection:socket.socket):
+def markConnectionClosed(closedConnection:socket.socket):
     global connectionClosed
-    while not connectionClosed:
-        socketMutex.acquire()
-        print("ping...", end="", flush=True)
-        send(connection, TYPE_COMMAND, COMMAND_PING)
-        pType, data = receive(connection)
-        if(pType == TYPE_INVALID):
-            print("server connection closed")
-            connectionClosed = True
-            socketMutex.release()
-            return
-        if(pType != TYPE_COMMAND or int.from_bytes(data, "big") != COMMAND_PONG): print("server did not pong ("+str(pType)+": "+str(int.from_bytes(data, "big"))+")")
-        print("pong")
-        socketMutex.release()
-        time.sleep(MAXTIMEOUT / 2)
+    if(closedConnection is connection):
+        connectionClosed = True
+        mainLoopEvents.put(EVENT_DISCONNECTED)
 
+#returns the event, or None if the timeout passed first
+def waitForEvent(timeout:float = None) -> int:
+    try:
+        return mainLoopEvents.get(timeout=timeout)
+    except queue.Empty:
+        return None
 
+def setKeepAlive(connection:socket.socket):
+    connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    #the timings can only be set on some platforms
+    for option, value in (("TCP_KEEPIDLE", KEEPALIVEIDLE), ("TCP_KEEPALIVE", KEEPALIVEIDLE), ("TCP_KEEPINTVL", KEEPALIVEINTERVAL), ("TCP_KEEPCNT", KEEPALIVECOUNT)):
+        if(hasattr(socket, option)):
+            try:
+                connection.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+            except OSError:
+                pass
 
+#returns False if the server couldn't be reached
+def connectToServer() -> bool:
+    global connection, connectionClosed
+    try:
+        newConnection = socket.create_connection((targetAddress, PORT), MAXTIMEOUT)
+    except OSError as e:
+        print("could not connect to server: "+str(e))
+        return False
+    newConnection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    setKeepAlive(newConnection)
+    newConnection.settimeout(MAXTIMEOUT * 2)
+    print("connected to "+str(newConnection.getpeername())+" as "+str(newConnection.getsockname()))
+    #handshake
+    send(newConnection, TYPE_HANDSHAKE, HANDSHAKEBYTES)
+    print("sent handshake")
+    pType, data = receive(newConnection)
+    if(pType != TYPE_RESPONSE or int.from_bytes(data, "big") != RESPONSE_OK):
+        print("server did not send OK")
+        newConnection.close()
+        return False
+    print("server ok")
+    #identify as node
+    if(not send(newConnection, TYPE_RESPONSE, RESPONSE_NODE)):
+        newConnection.close()
+        return False
+    print("identified as node")
+    socketMutex.acquire()
+    connection = newConnection
+    connectionClosed = False
+    socketMutex.release()
+    return True
 
-targetAddress = input("server ip address: ")
-connection = socket.create_connection((targetAddress, PORT))
-connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-print("connected to "+str(connection.getpeername())+" as "+str(connection.getsockname()))
-#handshake
-send(connection, TYPE_HANDSHAKE, HANDSHAKEBYTES)
-print("sent handshake")
-pType, data = receive(connection)
-assert pType == TYPE_RESPONSE, "server sent invalid response"
-assert int.from_bytes(data, "big") == RESPONSE_OK, "server did not send OK"
-print("server ok")
-#identify as node
-send(connection, TYPE_RESPONSE, RESPONSE_NODE)
-print("identified as node")
-
-pingThread = threading.Thread(None, regularPing, None, [connection])
-pingThread.start()
+#subtasks the server had given this node were requeued when the connection dropped
+#results of those are still uploaded after reconnecting, the server ignores ones that were already finished elsewhere
+def reconnect():
+    socketMutex.acquire()
+    connection.close()
+    socketMutex.release()
+    delay = RECONNECTDELAY
+    while not connectToServer():
+        print("reconnecting in "+str(delay)+"s")
+        time.sleep(delay)
+        delay = min(delay * 2, MAXRECONNECTDELAY)
 
-#start processing
-taskUUID = None
-taskUUIDBytes = None
-algoUUID = None
-hasAltProcessorFile = False
-try:
-    while not connectionClosed:
-        time.sleep(1)
+#estimated from pings, server time = local time + serverClockOffset
+serverClockOffset = 0.0
+clockSamples : "collections.deque[typing.Tuple[float, float]]" = collections.deque(maxlen=8)  #(round trip time, offset)
+
+def updateClockOffset(sendTime:float, receiveTime:float, serverTime:float):
+    global serverClockOffset
+    clockSamples.append((receiveTime - sendTime, serverTime - (sendTime + receiveTime) / 2))
+    serverClockOffset = min(clockSamples)[1]  #the fastest round trip gives the tightest estimate
+
+def serverTime() -> float:
+    return time.time() + serverClockOffset
+
+failedBuilds : "set[str]" = set()  #not retried until the node restarts
+declinedTasks : "set[uuid.UUID]" = set()  #tasks this node can't run, the server is asked to skip them
+
+#processors with a build recipe are compiled once per source, platform and interpreter
+#and the result is kept in the artifact cache like a download, so it is reused by every later task with the same source
+#the recipe is the task option "build": {"command": run in a copy of the bundle, "run": path of the executable it makes (optional)}
+#without "run" the bundle's entry point is run from the build folder, next to whatever the build made (e.g. an extension module it imports)
+#returns None if the build failed
+def buildTask(task:Task) -> Task:
+    recipe = task.options["build"]
+    buildKey = [task.processorHash, platform.system(), platform.machine(), platform.python_implementation(), platform.python_version(), recipe["command"]]
+    buildHash = hashlib.sha256("\n".join(buildKey).encode()).hexdigest()
+    if(buildHash in failedBuilds):
+        return None
+    sourceFolder = os.path.join(artifactCache.folder, task.processorHash)
+    buildFolder = artifactCache.get(buildHash)
+    if(buildFolder is None):
+        print("building processor for task "+str(task.taskUUID))
+        tempFolder = artifactCache.tempFolder(buildHash)
+        #plain copies, the cached bundle is read-only
+        shutil.copytree(sourceFolder, tempFolder, dirs_exist_ok=True, copy_function=shutil.copyfile)
+        try:
+            #DCPYTHON is the node's interpreter, for recipes that build extension modules
+            result = subprocess.run(recipe["command"], shell=True, cwd=tempFolder, env=dict(task.env, DCPYTHON=sys.executable), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=BUILDTIMEOUT)
+            buildLog, succeeded = result.stdout, result.returncode == 0
+        except subprocess.TimeoutExpired as e:
+            buildLog, succeeded = (e.output or bytes()) + "\nbuild timed out".encode(), False
+        if(not succeeded):
+            print(buildLog.decode(errors="replace"))
+            print("build failed, skipping task "+str(task.taskUUID))
+            failedBuilds.add(buildHash)
+            removeFolder(tempFolder)
+            return None
+        f = open(os.path.join(tempFolder, "build.log"), "wb")
+        f.write(buildLog)
+        f.close()
+        artifactCache.hold(task.processorHash)  #so making room for the build can't evict its source
         try:
-            socketMutex.acquire()
-            print("getting task")
+            buildFolder = artifactCache.commit(buildHash, tempFolder)
+        finally:
+            artifactCache.release(task.processorHash)
+        print("build done")
+    else:
+        print("has build")
+
+    processorFilePath = os.path.join(buildFolder, os.path.relpath(task.processorFilePath, sourceFolder))
+    altProcessorFilePath = None
+    if("run" in recipe):
+        altProcessorFilePath = os.path.normpath(os.path.join(buildFolder, recipe["run"]))
+        if(not altProcessorFilePath.startswith(buildFolder + os.sep) or not os.path.isfile(altProcessorFilePath)):
+            print("build did not make "+recipe["run"]+", skipping task "+str(task.taskUUID))
+            failedBuilds.add(buildHash)
+            return None
+    return Task(task.taskUUID, task.processorHash, processorFilePath, altProcessorFilePath, task.options, task.sharedInputHash, task.sharedInputPath, buildHash)
+
+#returns None if there are no tasks
+#downloads are only received while the connection is held and stored after it is released,
+#so unpacking a large bundle doesn't hold up the pings the server's failure detector waits for
+def requestTask() -> Task:
+    offer = receiveTask()
+    if(offer is None):
+        return None
+    taskUUID, processorHash, processorData, altProcessorFilePath, options, sharedInputHash, sharedInputData = offer
+    entryPoint = options.get("entry")  #set if the processor is a bundle
+    #receiveTask holds both, so storing one can't evict the other
+    artifactHashes = [h for h in [processorHash, sharedInputHash] if h is not None]
+    try:
+        if(processorData is not None):
+            artifactFolder = artifactCache.add(processorHash, processorData, None if entryPoint is not None else "processor.py")
+        else:
+            artifactFolder = artifactCache.get(processorHash)
+        processorFilePath = None
+        if(artifactFolder is not None):
+            processorFilePath = os.path.normpath(os.path.join(artifactFolder, entryPoint or "processor.py"))
+            assert processorFilePath.startswith(artifactFolder + os.sep), "bundle entry point is outside of the bundle"
+
+        sharedInputPath = None
+        if(sharedInputHash is not None):
+            if(sharedInputData is not None):
+                sharedInputFolder = artifactCache.add(sharedInputHash, sharedInputData, "shared")
+            else:
+                sharedInputFolder = artifactCache.get(sharedInputHash)
+            sharedInputPath = os.path.join(sharedInputFolder, "shared")
+    except AssertionError as e:
+        print(e)
+        return None
+    finally:
+        for artifactHash in artifactHashes:
+            artifactCache.release(artifactHash)
+
+    task = Task(taskUUID, processorHash, processorFilePath, altProcessorFilePath, options, sharedInputHash, sharedInputPath)
+    print("ready to process subtasks for task "+str(taskUUID)+(" (warm worker)" if task.usesWorker else ""))
+    print()
+    return task
+
+#the get task exchange, returns (task uuid, processor hash, processor data, alt processor path, options, shared input hash, shared input data)
+#the data is None for artifacts that are already in the cache
+def receiveTask() -> tuple:
+    heldHashes = []
+    offer = None
+    try:
+        socketMutex.acquire()
+        print("getting task")
+        if(len(declinedTasks) > 0):
+            send(connection, TYPE_COMMAND, COMMAND_GETTASKEXCLUDING)
+            send(connection, TYPE_DATA, b"".join(taskUUID.bytes for taskUUID in declinedTasks))
+        else:
             send(connection, TYPE_COMMAND, COMMAND_GETTASK)
+        pType, data = receive(connection)
+        assert pType == TYPE_RESPONSE, "server sent invalid response to get task"
+        response = int.from_bytes(data, "big")
+        if(response == RESPONSE_NONEWTASKS):
+            print("no new tasks")
+            return None
+        elif(response == RESPONSE_OK):
+            #task uuid
             pType, data = receive(connection)
-            assert pType == TYPE_RESPONSE, "server sent invalid response to get task"
+            assert pType == TYPE_DATA, "server did not send task uuid"
+            taskUUID = uuid.UUID(bytes=data)
+            pType, data = receive(connection)
+            assert pType == TYPE_RESPONSE, "server did not send response"
             response = int.from_bytes(data, "big")
-            if(response == RESPONSE_NONEWTASKS):
-                print("no new tasks")
-                time.sleep(MAXTIMEOUT/2)
-                continue
-            elif(response == RESPONSE_OK):
-                #task uuid
+            if(response == RESPONSE_SENDAUUID):
                 pType, data = receive(connection)
-                assert pType == TYPE_DATA, "server did not send task uuid"
-                taskUUIDBytes = data
-                taskUUID = uuid.UUID(bytes=data)
+                assert pType == TYPE_DATA, "server did not send auuid"
+                algoUUID = uuid.UUID(bytes=data)
+                print("auuid: "+str(algoUUID))
+            elif(response == RESPONSE_NOAUUID):
+                algoUUID = None
+                print("no auuid")
+            else:
+                raise AssertionError("server did not send response about auuid")
+            pType, data = receive(connection)
+            assert pType == TYPE_DATA, "server did not send task options"
+            options = json.loads(data.decode())
+            pType, data = receive(connection)
+            assert pType == TYPE_DATA, "server did not send processor hash"
+            processorHash = data.decode()
+            pType, data = receive(connection)
+            assert pType == TYPE_DATA, "server did not send shared input hash"
+            sharedInputHash = data.decode() or None
+            #held until requestTask has stored what is downloaded, so cached ones aren't evicted in between
+            for artifactHash in [processorHash, sharedInputHash]:
+                if(artifactHash is not None):
+                    artifactCache.hold(artifactHash)
+                    heldHashes.append(artifactHash)
+
+            entryPoint = options.get("entry")  #set if the processor is a bundle
+            artifactFolder = artifactCache.get(processorHash)
+            altProcessorFilePath = os.path.abspath(os.path.join(NODEFOLDER, str(algoUUID)))
+            if(artifactFolder is not None):
+                print("has python processor file")
+            else:
+                print("does not have python processor file")
+            if(os.path.isfile(altProcessorFilePath)):
+                print("has alt processor file")
+            else:
+                print("does not have alt processor file")
+                altProcessorFilePath = None
+
+            processorData = None
+            if(artifactFolder is None and altProcessorFilePath is None):
+                #request file, it is written once the connection is released
+                send(connection, TYPE_RESPONSE, RESPONSE_DOESNOTHAVEFILE)
                 pType, data = receive(connection)
-                assert pType == TYPE_RESPONSE, "server did not send response"
-                response = int.from_bytes(data, "big")
-                if(response == RESPONSE_SENDAUUID):
-                    pType, data = receive(connection)
-                    assert pType == TYPE_DATA, "server did not send auuid"
-                    algoUUID = uuid.UUID(bytes=data)
-                    print("auuid: "+str(algoUUID))
-                elif(response == RESPONSE_NOAUUID):
-                    algoUUID = None
-                    print("no auuid")
-                else:
-                    raise AssertionError("server did not send response about auuid")
-
-                #generate folders and file
-                if(not os.path.isdir(NODEFOLDER)):
-                    os.mkdir(NODEFOLDER)
-                processorFile = str(taskUUID)+".py"
-                processorFilePath = os.path.join(NODEFOLDER, processorFile)
-                altProcessorFile = str(algoUUID)
-                altProcessorFilePath = os.path.join(NODEFOLDER, altProcessorFile)
-                if(os.path.isfile(processorFilePath)):
-                    print("has python processor file")
-                else:
-                    print("does not have python processor file")
-                if(os.path.isfile(altProcessorFilePath)):
-                    print("has alt processor file")
-                    hasAltProcessorFile = True
-                else:
-                    print("does not have alt processor file")
-                    hasAltProcessorFile = False
+                assert pType == TYPE_DATA, "server did not send file"
+                processorData = data
+                print("received "+("bundle" if entryPoint is not None else "file"))
+            else:
+                send(connection, TYPE_RESPONSE, RESPONSE_OK)
 
-                if(not os.path.isfile(processorFilePath) and not os.path.isfile(altProcessorFile)):
-                    #request file and write
+            sharedInputData = None
+            if(sharedInputHash is not None):
+                if(artifactCache.get(sharedInputHash) is None):
                     send(connection, TYPE_RESPONSE, RESPONSE_DOESNOTHAVEFILE)
                     pType, data = receive(connection)
-                    assert pType == TYPE_DATA, "server did not send file"
-                    f = open(processorFilePath, "w")
-                    f.write(data.decode())
-                    f.close()
-                    print("received file")
+                    assert pType == TYPE_DATA, "server did not send shared input"
+                    sharedInputData = data
+                    print("received shared input")
                 else:
                     send(connection, TYPE_RESPONSE, RESPONSE_OK)
-                print("ready to process subtasks for task "+str(taskUUID))
-                print()
-            else:
-                raise AssertionError("server sent unknown response to get task")
-        except AssertionError as e:
-            print(e)
-        finally:
-            socketMutex.release()
-        if(taskUUID == None):
-            print("no task uuid")
-            continue
-        
-        while(True):
-            time.sleep(1)
-            inputData = None
-            #get subtask data
+                    print("has shared input")
+            offer = (taskUUID, processorHash, processorData, altProcessorFilePath, options, sharedInputHash, sharedInputData)
+            return offer
+        else:
+            raise AssertionError("server sent unknown response to get task")
+    except AssertionError as e:
+        print(e)
+        return None
+    finally:
+        socketMutex.release()
+        if(offer is None):
+            for artifactHash in heldHashes:
+                artifactCache.release(artifactHash)
+
+#returns up to maxCount [(subtask uuid, input)], the server decides how many, empty if the task has no subtasks left
+def requestSubtasks(task:Task, maxCount:int) -> "list[typing.Tuple[bytes, bytes]]":
+    try:
+        socketMutex.acquire()
+        print("getting up to "+str(maxCount)+" subtasks")
+        send(connection, TYPE_COMMAND, COMMAND_GETSUBTASKS)
+        send(connection, TYPE_DATA, task.taskUUID.bytes)
+        send(connection, TYPE_DATA, maxCount)
+        pType, data = receive(connection)
+        assert pType == TYPE_RESPONSE, "server sent invalid response to get subtasks"
+        response = int.from_bytes(data, "big")
+        if(response == RESPONSE_NONEWSUBTASKS):
+            print("no new subtasks")
+            return []
+        elif(response == RESPONSE_OK):
+            pType, data = receive(connection)
+            assert pType == TYPE_DATA, "server did not send subtasks"
+            #batch layout: repeated 16 byte subtask uuid, 4 byte input length, input
+            subtasks = []
+            i = 0
+            while i < len(data):
+                length = int.from_bytes(data[i+16:i+20], "big")
+                subtasks.append((data[i:i+16], data[i+20:i+20+length]))
+                i += 20 + length
+            print("acquired input data for "+str(len(subtasks))+" subtasks")
+            return subtasks
+        else:
+            raise AssertionError("server sent unknown response to get subtasks")
+    except AssertionError as e:
+        print(e)
+        return []
+    finally:
+        socketMutex.release()
+
+#returns True once the server has acknowledged all of the results
+def uploadResults(results:"list[typing.Tuple[bytes, bytes, dict]]") -> bool:
+    #batch layout: repeated 16 byte subtask uuid, 4 byte output length, output, 4 byte info length, info json
+    batch = bytearray()
+    for subtaskUUIDBytes, outputData, outputInfo in results:
+        outputInfo["upload"] = serverTime()
+        infoData = json.dumps(outputInfo).encode()
+        batch += subtaskUUIDBytes + len(outputData).to_bytes(4, "big") + outputData + len(infoData).to_bytes(4, "big") + infoData
+    try:
+        socketMutex.acquire()
+        if(connectionClosed):
+            return False
+        print("submitting results of "+str(len(results))+" subtasks")
+        send(connection, TYPE_COMMAND, COMMAND_SUBMITSUBTASKOUTPUTS)
+        send(connection, TYPE_DATA, bytes(batch))
+        pType, data = receive(connection)
+        if(pType != TYPE_RESPONSE or int.from_bytes(data, "big") != RESPONSE_OK):
+            print("server did not acknowledge results")
+            markConnectionClosed(connection)  #out of sync, start over on a new connection
+            return False
+        print("done")
+        return True
+    finally:
+        socketMutex.release()
+
+#uploads in the background so neither the executors nor the fetching wait on it
+#results that finished while the previous upload was in flight are sent together
+#results are kept until the server acknowledges them, so they survive the connection dropping
+def runUploader():
+    pending : "list[typing.Tuple[bytes, bytes, dict]]" = []
+    while not nodeShuttingDown:
+        if(len(pending) == 0):
             try:
-                socketMutex.acquire()
-                print("getting subtask")
-                send(connection, TYPE_COMMAND, COMMAND_GETSUBTASK)
-                send(connection, TYPE_DATA, taskUUIDBytes)
-                pType, data = receive(connection)
-                assert pType == TYPE_RESPONSE, "server sent invalid response to get subtask"
-                response = int.from_bytes(data, "big")
-                if(response == RESPONSE_NONEWSUBTASKS):
-                    print("no new subtasks")
-                    break
-                elif(response == RESPONSE_OK):
-                    pType, data = receive(connection)
-                    assert pType == TYPE_DATA, "server did not send uuid"
-                    subtaskUUIDBytes = data
-                    subtaskUUID = uuid.UUID(bytes=subtaskUUIDBytes)
-                    pType, data = receive(connection)
-                    assert pType == TYPE_DATA, "server did not send input data"
-                    inputData = data
-                    print("acquired input data for subtask "+str(subtaskUUID))
-                else:
-                    raise AssertionError("server sent unknown response to get subtask")
-            except AssertionError as e:
-                print(e)
-            finally:
-                socketMutex.release()
-
-            #process data
-            if(inputData == None):
+                pending.append(finishedQueue.get(timeout=1))
+            except queue.Empty:
                 continue
-            inputDataAsStr = inputData.decode()
-            inputFilePath = os.path.join(NODEFOLDER, "in.txt")
-            f = open(inputFilePath, "w")
-            f.write(inputDataAsStr)
-            f.close()
-            errorFilePath = os.path.join(NODEFOLDER, "error.txt")
-            errorFile = open(errorFilePath, "w")
-
-            print("processing data")
-            errorOccurred = False
-            if(hasAltProcessorFile):
-                if(subprocess.call("cd \""+NODEFOLDER+"\" && \"./"+altProcessorFile+"\"", shell=True, stderr=errorFile) != 0):
-                    errorOccurred = True
-            else:
-                if(platform.system() == "Windows"):
-                    if(subprocess.call("cd \""+NODEFOLDER+"\" && python \""+processorFile+"\"", shell=True, stderr=errorFile) != 0):
-                        errorOccurred = True
-                elif(platform.system() == "Linux" or platform.system() == "Darwin"):
-                    if(subprocess.call("cd \""+NODEFOLDER+"\" && python3 \""+processorFile+"\"", shell=True, stderr=errorFile) != 0):
-                        errorOccurred = True
-                else:
-                    raise AssertionError("unkonwn platform, unsure whether to use python or python3")
-            print("done")
-
-            #send output
+        while len(pending) < UPLOADBATCHSIZE:
             try:
-                socketMutex.acquire()
-                print("submitting results of subtask "+str(subtaskUUID))
-                send(connection, TYPE_COMMAND, COMMAND_SUBMITSUBTASKOUTPUT)
-                send(connection, TYPE_DATA, subtaskUUIDBytes)
-                outputFilePath = os.path.join(NODEFOLDER, "out.txt")
-                try:
-                    f = open(outputFilePath, "r")
-                    outputData = f.read()
-                    f.close()
-                    outputData = outputData.encode()
-                except FileNotFoundError:
-                    outputData = "out.txt file not found".encode()
-                #also send errors
-                if(errorOccurred):
-                    f = open(errorFilePath, "r")
-                    errorData = f.read()
-                    f.close()
-                    outputData += errorData.encode()
-                send(connection, TYPE_DATA, outputData)
-            except AssertionError as e:
-                print(e)
-            finally:
-                print("done")
-                socketMutex.release()
-
-        if(socketMutex.locked()):
+                pending.append(finishedQueue.get(block=False))
+            except queue.Empty:
+                break
+        if(uploadResults(pending)):
+            for _ in pending:
+                heldSlots.release()
+            pending = []
+            mainLoopEvents.put(EVENT_SLOTFREED)
+        else:
+            time.sleep(RECONNECTDELAY)
+
+def regularPing():
+    while not nodeShuttingDown:
+        if(connectionClosed):
+            time.sleep(RECONNECTDELAY)
+            continue
+        socketMutex.acquire()
+        sendTime = time.time()
+        send(connection, TYPE_COMMAND, COMMAND_PING)
+        pType, data = receive(connection)
+        if(pType == TYPE_INVALID):
+            print("server connection closed")
             socketMutex.release()
+            continue
+        if(pType != TYPE_COMMAND or int.from_bytes(data, "big") != COMMAND_PONG): print("server did not pong ("+str(pType)+": "+str(int.from_bytes(data, "big"))+")")
+        pType, data = receive(connection)
+        if(pType == TYPE_DATA):
+            updateClockOffset(sendTime, time.time(), struct.unpack(">d", data)[0])
+        socketMutex.release()
+        time.sleep(HEARTBEATINTERVAL)  #also a heartbeat, no log line since it's frequent
+
+
+
+
+targetAddress = input("server ip address: ")
+assert connectToServer(), "could not connect to server"
+
+#one slot per subtask fetched from the server whose result hasn't been acknowledged yet
+heldSlots = threading.Semaphore(POOLSIZE + PREFETCHDEPTH)
+
+pingThread = threading.Thread(None, regularPing, "Ping", daemon=True)
+pingThread.start()
+uploaderThread = threading.Thread(None, runUploader, "Uploader", daemon=True)
+uploaderThread.start()
+if(not os.path.isdir(NODEFOLDER)):
+    os.mkdir(NODEFOLDER)
+artifactCache = ArtifactCache(ARTIFACTCACHEFOLDER, ARTIFACTCACHEMAXBYTES)
+executorThreads = [threading.Thread(None, runExecutor, "Executor-"+str(i), [i], daemon=True) for i in range(POOLSIZE)]
+for t in executorThreads:
+    t.start()
+
+#start processing
+#the server is only asked for work again once there is room for it, or after a short timer while it has none
+idlePollInterval = IDLEPOLLINTERVAL
+nextPoll = 0.0
+try:
+    while True:
+        if(connectionClosed):
+            print("lost connection to server, reconnecting")
+            reconnect()
+            nextPoll = 0.0
+        wait = nextPoll - time.monotonic()
+        if(wait > 0):
+            waitForEvent(wait)  #a lost connection cuts the wait short
+            continue
+        task = requestTask()
+        if(task is not None and "build" in task.options and task.altProcessorFilePath is None):
+            builtTask = buildTask(task)  #outside of requestTask so the connection isn't blocked while compiling
+            if(builtTask is None):
+                #skipped on this node from now on, other tasks can be asked for right away
+                declinedTasks.add(task.taskUUID)
+                continue
+            task = builtTask
+        if(task == None):
+            nextPoll = time.monotonic() + idlePollInterval
+            idlePollInterval = min(idlePollInterval * 2, MAXIDLEPOLLINTERVAL)
+            continue
+
+        gotSubtasks = False
+        while not connectionClosed:
+            #fetch ahead while the executors are busy, a slot frees up once a result is acknowledged
+            if(not heldSlots.acquire(blocking=False)):
+                waitForEvent()
+                continue
+            numSlots = 1
+            while heldSlots.acquire(blocking=False):
+                numSlots += 1
+            subtasks = requestSubtasks(task, numSlots)
+            for _ in range(numSlots - len(subtasks)):
+                heldSlots.release()
+            if(len(subtasks) == 0):
+                break
+            gotSubtasks = True
+            for _ in subtasks:
+                for artifactHash in task.artifactHashes:
+                    artifactCache.hold(artifactHash)
+            #batch processors get the batch split evenly between the executors, others get one subtask at a time
+            chunkSize = math.ceil(len(subtasks) / POOLSIZE) if task.usesBatches else 1
+            for i in range(0, len(subtasks), chunkSize):
+                prefetchQueue.put((task, subtasks[i:i+chunkSize]))
+        if(gotSubtasks):
+            idlePollInterval = IDLEPOLLINTERVAL
+        else:
+            #the task ran out between the two requests
+            nextPoll = time.monotonic() + idlePollInterval
+            idlePollInterval = min(idlePollInterval * 2, MAXIDLEPOLLINTERVAL)
 except KeyboardInterrupt:
-    connectionClosed = True
+    nodeShuttingDown = True
     socketMutex.acquire()
     send(connection, TYPE_COMMAND, COMMAND_EXIT)
 
+for _ in executorThreads:
+    prefetchQueue.put(None)
 connection.close()
@@ -1,3 +0,0 @@
-#TODO
-
-#like node, but can get multiple subtasks so that it is nearly constantly processing
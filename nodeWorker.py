@@ -0,0 +1,119 @@
+import os
+import sys
+import typing
+import importlib.util
+import traceback
+import cProfile
+import marshal
+import processorSDK
+
+#keeps a processor loaded so its setup only runs once instead of once per subtask
+#the processor has to define process(inputData) -> output or process_batch(inputs) -> outputs, see processorSDK.py
+#started by node.py, which sends inputs and receives outputs over stdin/stdout
+#packets use the same format as the server connection (4 byte size, 4 byte type, data)
+#usage: python nodeWorker.py <processor file>
+
+
+
+#constants
+#packet types
+TYPE_INVALID = 0
+TYPE_RESPONSE = 3
+TYPE_DATA = 4
+TYPE_ERROR = 5  #data is the traceback
+TYPE_BATCH = 6  #several inputs or outputs, each with a 4 byte length in front
+TYPE_PROFILE = 7  #a TYPE_DATA or TYPE_BATCH packet to run under cProfile, see runWorker
+#responses
+RESPONSE_OK = 0
+
+
+
+def _readBytes(stream:typing.BinaryIO, numBytes):
+    data = stream.read(numBytes)
+    if(data is None or len(data) < numBytes):
+        raise EOFError()
+    return data
+
+#returns TYPE_INVALID once the node closes the pipe
+def receive(stream:typing.BinaryIO) -> typing.Tuple[int, bytes]:
+    try:
+        length = int.from_bytes(_readBytes(stream, 4), "big")
+        packetType = int.from_bytes(_readBytes(stream, 4), "big")
+        data = _readBytes(stream, length)
+        return (packetType, data)
+    except EOFError:
+        return (TYPE_INVALID, bytes())
+
+def send(stream:typing.BinaryIO, packetType:int, data:typing.Union[bytes, int]):
+    if(type(data) == int):
+        data = data.to_bytes(4, "big")
+    stream.write(len(data).to_bytes(4, "big") + packetType.to_bytes(4, "big") + data)
+    stream.flush()
+
+def loadProcessor(processorFile:str):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(processorFile)))
+    spec = importlib.util.spec_from_file_location("processor", processorFile)
+    processor = importlib.util.module_from_spec(spec)
+    sys.modules["processor"] = processor
+    spec.loader.exec_module(processor)
+    return processor
+
+def packItems(items:"list[bytes]") -> bytes:
+    return b"".join(len(item).to_bytes(4, "big") + item for item in items)
+
+def unpackItems(data:bytes) -> "list[bytes]":
+    items = []
+    i = 0
+    while i < len(data):
+        length = int.from_bytes(data[i:i+4], "big")
+        items.append(data[i+4:i+4+length])
+        i += 4 + length
+    return items
+
+def runWorker(processorFile:str):
+    #anything the processor prints would corrupt the packets, so stdout is moved onto stderr
+    pipeOut = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    pipeIn = sys.stdin.buffer
+
+    try:
+        processor = loadProcessor(processorFile)
+        processorSDK.callSetup(processor)
+    except BaseException:
+        send(pipeOut, TYPE_ERROR, traceback.format_exc().encode())
+        return
+    send(pipeOut, TYPE_RESPONSE, RESPONSE_OK)
+
+    while True:
+        pType, data = receive(pipeIn)
+        #the request is packed as [4 byte type, data], the reply as [reply data, marshaled pstats]
+        profiler = None
+        if(pType == TYPE_PROFILE):
+            packetType, data = unpackItems(data)
+            pType = int.from_bytes(packetType, "big")
+            profiler = cProfile.Profile()
+        if(pType == TYPE_DATA):
+            inputs = [data.decode()]
+        elif(pType == TYPE_BATCH):
+            inputs = [item.decode() for item in unpackItems(data)]
+        else:
+            return
+        try:
+            if(profiler is not None):
+                outputs = profiler.runcall(processorSDK.processBatch, processor, inputs)
+            else:
+                outputs = processorSDK.processBatch(processor, inputs)
+        except BaseException:
+            send(pipeOut, TYPE_ERROR, traceback.format_exc().encode())
+            continue
+        replyData = outputs[0] if pType == TYPE_DATA else packItems(outputs)
+        if(profiler is not None):
+            profiler.create_stats()
+            send(pipeOut, TYPE_PROFILE, packItems([replyData, marshal.dumps(profiler.stats)]))
+        else:
+            send(pipeOut, pType, replyData)
+
+
+
+if(__name__ == "__main__"):
+    runWorker(sys.argv[1])
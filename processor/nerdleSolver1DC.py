@@ -5,6 +5,7 @@
 import os
 import sys
 import random
+import mmap
 import tqdm
 
 #code is adapted from my wordle solver, so any references to a word means an equation
@@ -54,70660 +55,16 @@ NUM_TO_CHAR = {
 
 
 
-equationsAsStr = ["0+0-1=-1",
-"0+0-2=-2",
-"0+0-3=-3",
-"0+0-4=-4",
-"0+0-5=-5",
-"0+0-6=-6",
-"0+0-7=-7",
-"0+0-8=-8",
-"0+0-9=-9",
-"0+0*10=0",
-"0+0*11=0",
-"0+0*12=0",
-"0+0*13=0",
-"0+0*14=0",
-"0+0*15=0",
-"0+0*16=0",
-"0+0*17=0",
-"0+0*18=0",
-"0+0*19=0",
-"0+0*20=0",
-"0+0*21=0",
-"0+0*22=0",
-"0+0*23=0",
-"0+0*24=0",
-"0+0*25=0",
-"0+0*26=0",
-"0+0*27=0",
-"0+0*28=0",
-"0+0*29=0",
-"0+0*30=0",
-"0+0*31=0",
-"0+0*32=0",
-"0+0*33=0",
-"0+0*34=0",
-"0+0*35=0",
-"0+0*36=0",
-"0+0*37=0",
-"0+0*38=0",
-"0+0*39=0",
-"0+0*40=0",
-"0+0*41=0",
-"0+0*42=0",
-"0+0*43=0",
-"0+0*44=0",
-"0+0*45=0",
-"0+0*46=0",
-"0+0*47=0",
-"0+0*48=0",
-"0+0*49=0",
-"0+0*50=0",
-"0+0*51=0",
-"0+0*52=0",
-"0+0*53=0",
-"0+0*54=0",
-"0+0*55=0",
-"0+0*56=0",
-"0+0*57=0",
-"0+0*58=0",
-"0+0*59=0",
-"0+0*60=0",
-"0+0*61=0",
-"0+0*62=0",
-"0+0*63=0",
-"0+0*64=0",
-"0+0*65=0",
-"0+0*66=0",
-"0+0*67=0",
-"0+0*68=0",
-"0+0*69=0",
-"0+0*70=0",
-"0+0*71=0",
-"0+0*72=0",
-"0+0*73=0",
-"0+0*74=0",
-"0+0*75=0",
-"0+0*76=0",
-"0+0*77=0",
-"0+0*78=0",
-"0+0*79=0",
-"0+0*80=0",
-"0+0*81=0",
-"0+0*82=0",
-"0+0*83=0",
-"0+0*84=0",
-"0+0*85=0",
-"0+0*86=0",
-"0+0*87=0",
-"0+0*88=0",
-"0+0*89=0",
-"0+0*90=0",
-"0+0*91=0",
-"0+0*92=0",
-"0+0*93=0",
-"0+0*94=0",
-"0+0*95=0",
-"0+0*96=0",
-"0+0*97=0",
-"0+0*98=0",
-"0+0*99=0",
-"0+0/10=0",
-"0+0/11=0",
-"0+0/12=0",
-"0+0/13=0",
-"0+0/14=0",
-"0+0/15=0",
-"0+0/16=0",
-"0+0/17=0",
-"0+0/18=0",
-"0+0/19=0",
-"0+0/20=0",
-"0+0/21=0",
-"0+0/22=0",
-"0+0/23=0",
-"0+0/24=0",
-"0+0/25=0",
-"0+0/26=0",
-"0+0/27=0",
-"0+0/28=0",
-"0+0/29=0",
-"0+0/30=0",
-"0+0/31=0",
-"0+0/32=0",
-"0+0/33=0",
-"0+0/34=0",
-"0+0/35=0",
-"0+0/36=0",
-"0+0/37=0",
-"0+0/38=0",
-"0+0/39=0",
-"0+0/40=0",
-"0+0/41=0",
-"0+0/42=0",
-"0+0/43=0",
-"0+0/44=0",
-"0+0/45=0",
-"0+0/46=0",
-"0+0/47=0",
-"0+0/48=0",
-"0+0/49=0",
-"0+0/50=0",
-"0+0/51=0",
-"0+0/52=0",
-"0+0/53=0",
-"0+0/54=0",
-"0+0/55=0",
-"0+0/56=0",
-"0+0/57=0",
-"0+0/58=0",
-"0+0/59=0",
-"0+0/60=0",
-"0+0/61=0",
-"0+0/62=0",
-"0+0/63=0",
-"0+0/64=0",
-"0+0/65=0",
-"0+0/66=0",
-"0+0/67=0",
-"0+0/68=0",
-"0+0/69=0",
-"0+0/70=0",
-"0+0/71=0",
-"0+0/72=0",
-"0+0/73=0",
-"0+0/74=0",
-"0+0/75=0",
-"0+0/76=0",
-"0+0/77=0",
-"0+0/78=0",
-"0+0/79=0",
-"0+0/80=0",
-"0+0/81=0",
-"0+0/82=0",
-"0+0/83=0",
-"0+0/84=0",
-"0+0/85=0",
-"0+0/86=0",
-"0+0/87=0",
-"0+0/88=0",
-"0+0/89=0",
-"0+0/90=0",
-"0+0/91=0",
-"0+0/92=0",
-"0+0/93=0",
-"0+0/94=0",
-"0+0/95=0",
-"0+0/96=0",
-"0+0/97=0",
-"0+0/98=0",
-"0+0/99=0",
-"0+10-1=9",
-"0+10-2=8",
-"0+10-3=7",
-"0+10-4=6",
-"0+10-5=5",
-"0+10-6=4",
-"0+10-7=3",
-"0+10-8=2",
-"0+10-9=1",
-"0+10*0=0",
-"0+10/2=5",
-"0+10/5=2",
-"0+11-2=9",
-"0+11-3=8",
-"0+11-4=7",
-"0+11-5=6",
-"0+11-6=5",
-"0+11-7=4",
-"0+11-8=3",
-"0+11-9=2",
-"0+11*0=0",
-"0+12-3=9",
-"0+12-4=8",
-"0+12-5=7",
-"0+12-6=6",
-"0+12-7=5",
-"0+12-8=4",
-"0+12-9=3",
-"0+12*0=0",
-"0+12/2=6",
-"0+12/3=4",
-"0+12/4=3",
-"0+12/6=2",
-"0+13-4=9",
-"0+13-5=8",
-"0+13-6=7",
-"0+13-7=6",
-"0+13-8=5",
-"0+13-9=4",
-"0+13*0=0",
-"0+14-5=9",
-"0+14-6=8",
-"0+14-7=7",
-"0+14-8=6",
-"0+14-9=5",
-"0+14*0=0",
-"0+14/2=7",
-"0+14/7=2",
-"0+15-6=9",
-"0+15-7=8",
-"0+15-8=7",
-"0+15-9=6",
-"0+15*0=0",
-"0+15/3=5",
-"0+15/5=3",
-"0+16-7=9",
-"0+16-8=8",
-"0+16-9=7",
-"0+16*0=0",
-"0+16/2=8",
-"0+16/4=4",
-"0+16/8=2",
-"0+17-8=9",
-"0+17-9=8",
-"0+17*0=0",
-"0+18-9=9",
-"0+18*0=0",
-"0+18/2=9",
-"0+18/3=6",
-"0+18/6=3",
-"0+18/9=2",
-"0+19*0=0",
-"0+1+9=10",
-"0+1-2=-1",
-"0+1-3=-2",
-"0+1-4=-3",
-"0+1-5=-4",
-"0+1-6=-5",
-"0+1-7=-6",
-"0+1-8=-7",
-"0+1-9=-8",
-"0+20*0=0",
-"0+20/4=5",
-"0+20/5=4",
-"0+21*0=0",
-"0+21/3=7",
-"0+21/7=3",
-"0+22*0=0",
-"0+23*0=0",
-"0+24*0=0",
-"0+24/3=8",
-"0+24/4=6",
-"0+24/6=4",
-"0+24/8=3",
-"0+25*0=0",
-"0+25/5=5",
-"0+26*0=0",
-"0+27*0=0",
-"0+27/3=9",
-"0+27/9=3",
-"0+28*0=0",
-"0+28/4=7",
-"0+28/7=4",
-"0+29*0=0",
-"0+2+8=10",
-"0+2+9=11",
-"0+2-3=-1",
-"0+2-4=-2",
-"0+2-5=-3",
-"0+2-6=-4",
-"0+2-7=-5",
-"0+2-8=-6",
-"0+2-9=-7",
-"0+2*5=10",
-"0+2*6=12",
-"0+2*7=14",
-"0+2*8=16",
-"0+2*9=18",
-"0+30*0=0",
-"0+30/5=6",
-"0+30/6=5",
-"0+31*0=0",
-"0+32*0=0",
-"0+32/4=8",
-"0+32/8=4",
-"0+33*0=0",
-"0+34*0=0",
-"0+35*0=0",
-"0+35/5=7",
-"0+35/7=5",
-"0+36*0=0",
-"0+36/4=9",
-"0+36/6=6",
-"0+36/9=4",
-"0+37*0=0",
-"0+38*0=0",
-"0+39*0=0",
-"0+3+7=10",
-"0+3+8=11",
-"0+3+9=12",
-"0+3-4=-1",
-"0+3-5=-2",
-"0+3-6=-3",
-"0+3-7=-4",
-"0+3-8=-5",
-"0+3-9=-6",
-"0+3*4=12",
-"0+3*5=15",
-"0+3*6=18",
-"0+3*7=21",
-"0+3*8=24",
-"0+3*9=27",
-"0+40*0=0",
-"0+40/5=8",
-"0+40/8=5",
-"0+41*0=0",
-"0+42*0=0",
-"0+42/6=7",
-"0+42/7=6",
-"0+43*0=0",
-"0+44*0=0",
-"0+45*0=0",
-"0+45/5=9",
-"0+45/9=5",
-"0+46*0=0",
-"0+47*0=0",
-"0+48*0=0",
-"0+48/6=8",
-"0+48/8=6",
-"0+49*0=0",
-"0+49/7=7",
-"0+4+6=10",
-"0+4+7=11",
-"0+4+8=12",
-"0+4+9=13",
-"0+4-5=-1",
-"0+4-6=-2",
-"0+4-7=-3",
-"0+4-8=-4",
-"0+4-9=-5",
-"0+4*3=12",
-"0+4*4=16",
-"0+4*5=20",
-"0+4*6=24",
-"0+4*7=28",
-"0+4*8=32",
-"0+4*9=36",
-"0+50*0=0",
-"0+51*0=0",
-"0+52*0=0",
-"0+53*0=0",
-"0+54*0=0",
-"0+54/6=9",
-"0+54/9=6",
-"0+55*0=0",
-"0+56*0=0",
-"0+56/7=8",
-"0+56/8=7",
-"0+57*0=0",
-"0+58*0=0",
-"0+59*0=0",
-"0+5+5=10",
-"0+5+6=11",
-"0+5+7=12",
-"0+5+8=13",
-"0+5+9=14",
-"0+5-6=-1",
-"0+5-7=-2",
-"0+5-8=-3",
-"0+5-9=-4",
-"0+5*2=10",
-"0+5*3=15",
-"0+5*4=20",
-"0+5*5=25",
-"0+5*6=30",
-"0+5*7=35",
-"0+5*8=40",
-"0+5*9=45",
-"0+60*0=0",
-"0+61*0=0",
-"0+62*0=0",
-"0+63*0=0",
-"0+63/7=9",
-"0+63/9=7",
-"0+64*0=0",
-"0+64/8=8",
-"0+65*0=0",
-"0+66*0=0",
-"0+67*0=0",
-"0+68*0=0",
-"0+69*0=0",
-"0+6+4=10",
-"0+6+5=11",
-"0+6+6=12",
-"0+6+7=13",
-"0+6+8=14",
-"0+6+9=15",
-"0+6-7=-1",
-"0+6-8=-2",
-"0+6-9=-3",
-"0+6*2=12",
-"0+6*3=18",
-"0+6*4=24",
-"0+6*5=30",
-"0+6*6=36",
-"0+6*7=42",
-"0+6*8=48",
-"0+6*9=54",
-"0+70*0=0",
-"0+71*0=0",
-"0+72*0=0",
-"0+72/8=9",
-"0+72/9=8",
-"0+73*0=0",
-"0+74*0=0",
-"0+75*0=0",
-"0+76*0=0",
-"0+77*0=0",
-"0+78*0=0",
-"0+79*0=0",
-"0+7+3=10",
-"0+7+4=11",
-"0+7+5=12",
-"0+7+6=13",
-"0+7+7=14",
-"0+7+8=15",
-"0+7+9=16",
-"0+7-8=-1",
-"0+7-9=-2",
-"0+7*2=14",
-"0+7*3=21",
-"0+7*4=28",
-"0+7*5=35",
-"0+7*6=42",
-"0+7*7=49",
-"0+7*8=56",
-"0+7*9=63",
-"0+80*0=0",
-"0+81*0=0",
-"0+81/9=9",
-"0+82*0=0",
-"0+83*0=0",
-"0+84*0=0",
-"0+85*0=0",
-"0+86*0=0",
-"0+87*0=0",
-"0+88*0=0",
-"0+89*0=0",
-"0+8+2=10",
-"0+8+3=11",
-"0+8+4=12",
-"0+8+5=13",
-"0+8+6=14",
-"0+8+7=15",
-"0+8+8=16",
-"0+8+9=17",
-"0+8-9=-1",
-"0+8*2=16",
-"0+8*3=24",
-"0+8*4=32",
-"0+8*5=40",
-"0+8*6=48",
-"0+8*7=56",
-"0+8*8=64",
-"0+8*9=72",
-"0+90*0=0",
-"0+91*0=0",
-"0+92*0=0",
-"0+93*0=0",
-"0+94*0=0",
-"0+95*0=0",
-"0+96*0=0",
-"0+97*0=0",
-"0+98*0=0",
-"0+99*0=0",
-"0+9+1=10",
-"0+9+2=11",
-"0+9+3=12",
-"0+9+4=13",
-"0+9+5=14",
-"0+9+6=15",
-"0+9+7=16",
-"0+9+8=17",
-"0+9+9=18",
-"0+9*2=18",
-"0+9*3=27",
-"0+9*4=36",
-"0+9*5=45",
-"0+9*6=54",
-"0+9*7=63",
-"0+9*8=72",
-"0+9*9=81",
-"0-0-1=-1",
-"0-0-2=-2",
-"0-0-3=-3",
-"0-0-4=-4",
-"0-0-5=-5",
-"0-0-6=-6",
-"0-0-7=-7",
-"0-0-8=-8",
-"0-0-9=-9",
-"0-0*10=0",
-"0-0*11=0",
-"0-0*12=0",
-"0-0*13=0",
-"0-0*14=0",
-"0-0*15=0",
-"0-0*16=0",
-"0-0*17=0",
-"0-0*18=0",
-"0-0*19=0",
-"0-0*20=0",
-"0-0*21=0",
-"0-0*22=0",
-"0-0*23=0",
-"0-0*24=0",
-"0-0*25=0",
-"0-0*26=0",
-"0-0*27=0",
-"0-0*28=0",
-"0-0*29=0",
-"0-0*30=0",
-"0-0*31=0",
-"0-0*32=0",
-"0-0*33=0",
-"0-0*34=0",
-"0-0*35=0",
-"0-0*36=0",
-"0-0*37=0",
-"0-0*38=0",
-"0-0*39=0",
-"0-0*40=0",
-"0-0*41=0",
-"0-0*42=0",
-"0-0*43=0",
-"0-0*44=0",
-"0-0*45=0",
-"0-0*46=0",
-"0-0*47=0",
-"0-0*48=0",
-"0-0*49=0",
-"0-0*50=0",
-"0-0*51=0",
-"0-0*52=0",
-"0-0*53=0",
-"0-0*54=0",
-"0-0*55=0",
-"0-0*56=0",
-"0-0*57=0",
-"0-0*58=0",
-"0-0*59=0",
-"0-0*60=0",
-"0-0*61=0",
-"0-0*62=0",
-"0-0*63=0",
-"0-0*64=0",
-"0-0*65=0",
-"0-0*66=0",
-"0-0*67=0",
-"0-0*68=0",
-"0-0*69=0",
-"0-0*70=0",
-"0-0*71=0",
-"0-0*72=0",
-"0-0*73=0",
-"0-0*74=0",
-"0-0*75=0",
-"0-0*76=0",
-"0-0*77=0",
-"0-0*78=0",
-"0-0*79=0",
-"0-0*80=0",
-"0-0*81=0",
-"0-0*82=0",
-"0-0*83=0",
-"0-0*84=0",
-"0-0*85=0",
-"0-0*86=0",
-"0-0*87=0",
-"0-0*88=0",
-"0-0*89=0",
-"0-0*90=0",
-"0-0*91=0",
-"0-0*92=0",
-"0-0*93=0",
-"0-0*94=0",
-"0-0*95=0",
-"0-0*96=0",
-"0-0*97=0",
-"0-0*98=0",
-"0-0*99=0",
-"0-0/10=0",
-"0-0/11=0",
-"0-0/12=0",
-"0-0/13=0",
-"0-0/14=0",
-"0-0/15=0",
-"0-0/16=0",
-"0-0/17=0",
-"0-0/18=0",
-"0-0/19=0",
-"0-0/20=0",
-"0-0/21=0",
-"0-0/22=0",
-"0-0/23=0",
-"0-0/24=0",
-"0-0/25=0",
-"0-0/26=0",
-"0-0/27=0",
-"0-0/28=0",
-"0-0/29=0",
-"0-0/30=0",
-"0-0/31=0",
-"0-0/32=0",
-"0-0/33=0",
-"0-0/34=0",
-"0-0/35=0",
-"0-0/36=0",
-"0-0/37=0",
-"0-0/38=0",
-"0-0/39=0",
-"0-0/40=0",
-"0-0/41=0",
-"0-0/42=0",
-"0-0/43=0",
-"0-0/44=0",
-"0-0/45=0",
-"0-0/46=0",
-"0-0/47=0",
-"0-0/48=0",
-"0-0/49=0",
-"0-0/50=0",
-"0-0/51=0",
-"0-0/52=0",
-"0-0/53=0",
-"0-0/54=0",
-"0-0/55=0",
-"0-0/56=0",
-"0-0/57=0",
-"0-0/58=0",
-"0-0/59=0",
-"0-0/60=0",
-"0-0/61=0",
-"0-0/62=0",
-"0-0/63=0",
-"0-0/64=0",
-"0-0/65=0",
-"0-0/66=0",
-"0-0/67=0",
-"0-0/68=0",
-"0-0/69=0",
-"0-0/70=0",
-"0-0/71=0",
-"0-0/72=0",
-"0-0/73=0",
-"0-0/74=0",
-"0-0/75=0",
-"0-0/76=0",
-"0-0/77=0",
-"0-0/78=0",
-"0-0/79=0",
-"0-0/80=0",
-"0-0/81=0",
-"0-0/82=0",
-"0-0/83=0",
-"0-0/84=0",
-"0-0/85=0",
-"0-0/86=0",
-"0-0/87=0",
-"0-0/88=0",
-"0-0/89=0",
-"0-0/90=0",
-"0-0/91=0",
-"0-0/92=0",
-"0-0/93=0",
-"0-0/94=0",
-"0-0/95=0",
-"0-0/96=0",
-"0-0/97=0",
-"0-0/98=0",
-"0-0/99=0",
-"0-10*0=0",
-"0-10=-10",
-"0-11*0=0",
-"0-11=-11",
-"0-12*0=0",
-"0-12=-12",
-"0-13*0=0",
-"0-13=-13",
-"0-14*0=0",
-"0-14=-14",
-"0-15*0=0",
-"0-15=-15",
-"0-16*0=0",
-"0-16=-16",
-"0-17*0=0",
-"0-17=-17",
-"0-18*0=0",
-"0-18=-18",
-"0-19*0=0",
-"0-19=-19",
-"0-1+0=-1",
-"0-1+10=9",
-"0-1-0=-1",
-"0-1-1=-2",
-"0-1-2=-3",
-"0-1-3=-4",
-"0-1-4=-5",
-"0-1-5=-6",
-"0-1-6=-7",
-"0-1-7=-8",
-"0-1-8=-9",
-"0-1*1=-1",
-"0-1*2=-2",
-"0-1*3=-3",
-"0-1*4=-4",
-"0-1*5=-5",
-"0-1*6=-6",
-"0-1*7=-7",
-"0-1*8=-8",
-"0-1*9=-9",
-"0-1/1=-1",
-"0-20*0=0",
-"0-20=-20",
-"0-21*0=0",
-"0-21=-21",
-"0-22*0=0",
-"0-22=-22",
-"0-23*0=0",
-"0-23=-23",
-"0-24*0=0",
-"0-24=-24",
-"0-25*0=0",
-"0-25=-25",
-"0-26*0=0",
-"0-26=-26",
-"0-27*0=0",
-"0-27=-27",
-"0-28*0=0",
-"0-28=-28",
-"0-29*0=0",
-"0-29=-29",
-"0-2+0=-2",
-"0-2+10=8",
-"0-2+11=9",
-"0-2+1=-1",
-"0-2-0=-2",
-"0-2-1=-3",
-"0-2-2=-4",
-"0-2-3=-5",
-"0-2-4=-6",
-"0-2-5=-7",
-"0-2-6=-8",
-"0-2-7=-9",
-"0-2*1=-2",
-"0-2*2=-4",
-"0-2*3=-6",
-"0-2*4=-8",
-"0-2/1=-2",
-"0-2/2=-1",
-"0-30*0=0",
-"0-30=-30",
-"0-31*0=0",
-"0-31=-31",
-"0-32*0=0",
-"0-32=-32",
-"0-33*0=0",
-"0-33=-33",
-"0-34*0=0",
-"0-34=-34",
-"0-35*0=0",
-"0-35=-35",
-"0-36*0=0",
-"0-36=-36",
-"0-37*0=0",
-"0-37=-37",
-"0-38*0=0",
-"0-38=-38",
-"0-39*0=0",
-"0-39=-39",
-"0-3+0=-3",
-"0-3+10=7",
-"0-3+11=8",
-"0-3+12=9",
-"0-3+1=-2",
-"0-3+2=-1",
-"0-3-0=-3",
-"0-3-1=-4",
-"0-3-2=-5",
-"0-3-3=-6",
-"0-3-4=-7",
-"0-3-5=-8",
-"0-3-6=-9",
-"0-3*1=-3",
-"0-3*2=-6",
-"0-3*3=-9",
-"0-3/1=-3",
-"0-3/3=-1",
-"0-40*0=0",
-"0-40=-40",
-"0-41*0=0",
-"0-41=-41",
-"0-42*0=0",
-"0-42=-42",
-"0-43*0=0",
-"0-43=-43",
-"0-44*0=0",
-"0-44=-44",
-"0-45*0=0",
-"0-45=-45",
-"0-46*0=0",
-"0-46=-46",
-"0-47*0=0",
-"0-47=-47",
-"0-48*0=0",
-"0-48=-48",
-"0-49*0=0",
-"0-49=-49",
-"0-4+0=-4",
-"0-4+10=6",
-"0-4+11=7",
-"0-4+12=8",
-"0-4+13=9",
-"0-4+1=-3",
-"0-4+2=-2",
-"0-4+3=-1",
-"0-4-0=-4",
-"0-4-1=-5",
-"0-4-2=-6",
-"0-4-3=-7",
-"0-4-4=-8",
-"0-4-5=-9",
-"0-4*1=-4",
-"0-4*2=-8",
-"0-4/1=-4",
-"0-4/2=-2",
-"0-4/4=-1",
-"0-50*0=0",
-"0-50=-50",
-"0-51*0=0",
-"0-51=-51",
-"0-52*0=0",
-"0-52=-52",
-"0-53*0=0",
-"0-53=-53",
-"0-54*0=0",
-"0-54=-54",
-"0-55*0=0",
-"0-55=-55",
-"0-56*0=0",
-"0-56=-56",
-"0-57*0=0",
-"0-57=-57",
-"0-58*0=0",
-"0-58=-58",
-"0-59*0=0",
-"0-59=-59",
-"0-5+0=-5",
-"0-5+10=5",
-"0-5+11=6",
-"0-5+12=7",
-"0-5+13=8",
-"0-5+14=9",
-"0-5+1=-4",
-"0-5+2=-3",
-"0-5+3=-2",
-"0-5+4=-1",
-"0-5-0=-5",
-"0-5-1=-6",
-"0-5-2=-7",
-"0-5-3=-8",
-"0-5-4=-9",
-"0-5*1=-5",
-"0-5/1=-5",
-"0-5/5=-1",
-"0-60*0=0",
-"0-60=-60",
-"0-61*0=0",
-"0-61=-61",
-"0-62*0=0",
-"0-62=-62",
-"0-63*0=0",
-"0-63=-63",
-"0-64*0=0",
-"0-64=-64",
-"0-65*0=0",
-"0-65=-65",
-"0-66*0=0",
-"0-66=-66",
-"0-67*0=0",
-"0-67=-67",
-"0-68*0=0",
-"0-68=-68",
-"0-69*0=0",
-"0-69=-69",
-"0-6+0=-6",
-"0-6+10=4",
-"0-6+11=5",
-"0-6+12=6",
-"0-6+13=7",
-"0-6+14=8",
-"0-6+15=9",
-"0-6+1=-5",
-"0-6+2=-4",
-"0-6+3=-3",
-"0-6+4=-2",
-"0-6+5=-1",
-"0-6-0=-6",
-"0-6-1=-7",
-"0-6-2=-8",
-"0-6-3=-9",
-"0-6*1=-6",
-"0-6/1=-6",
-"0-6/2=-3",
-"0-6/3=-2",
-"0-6/6=-1",
-"0-70*0=0",
-"0-70=-70",
-"0-71*0=0",
-"0-71=-71",
-"0-72*0=0",
-"0-72=-72",
-"0-73*0=0",
-"0-73=-73",
-"0-74*0=0",
-"0-74=-74",
-"0-75*0=0",
-"0-75=-75",
-"0-76*0=0",
-"0-76=-76",
-"0-77*0=0",
-"0-77=-77",
-"0-78*0=0",
-"0-78=-78",
-"0-79*0=0",
-"0-79=-79",
-"0-7+0=-7",
-"0-7+10=3",
-"0-7+11=4",
-"0-7+12=5",
-"0-7+13=6",
-"0-7+14=7",
-"0-7+15=8",
-"0-7+16=9",
-"0-7+1=-6",
-"0-7+2=-5",
-"0-7+3=-4",
-"0-7+4=-3",
-"0-7+5=-2",
-"0-7+6=-1",
-"0-7-0=-7",
-"0-7-1=-8",
-"0-7-2=-9",
-"0-7*1=-7",
-"0-7/1=-7",
-"0-7/7=-1",
-"0-80*0=0",
-"0-80=-80",
-"0-81*0=0",
-"0-81=-81",
-"0-82*0=0",
-"0-82=-82",
-"0-83*0=0",
-"0-83=-83",
-"0-84*0=0",
-"0-84=-84",
-"0-85*0=0",
-"0-85=-85",
-"0-86*0=0",
-"0-86=-86",
-"0-87*0=0",
-"0-87=-87",
-"0-88*0=0",
-"0-88=-88",
-"0-89*0=0",
-"0-89=-89",
-"0-8+0=-8",
-"0-8+10=2",
-"0-8+11=3",
-"0-8+12=4",
-"0-8+13=5",
-"0-8+14=6",
-"0-8+15=7",
-"0-8+16=8",
-"0-8+17=9",
-"0-8+1=-7",
-"0-8+2=-6",
-"0-8+3=-5",
-"0-8+4=-4",
-"0-8+5=-3",
-"0-8+6=-2",
-"0-8+7=-1",
-"0-8-0=-8",
-"0-8-1=-9",
-"0-8*1=-8",
-"0-8/1=-8",
-"0-8/2=-4",
-"0-8/4=-2",
-"0-8/8=-1",
-"0-90*0=0",
-"0-90=-90",
-"0-91*0=0",
-"0-91=-91",
-"0-92*0=0",
-"0-92=-92",
-"0-93*0=0",
-"0-93=-93",
-"0-94*0=0",
-"0-94=-94",
-"0-95*0=0",
-"0-95=-95",
-"0-96*0=0",
-"0-96=-96",
-"0-97*0=0",
-"0-97=-97",
-"0-98*0=0",
-"0-98=-98",
-"0-99*0=0",
-"0-99=-99",
-"0-9+0=-9",
-"0-9+10=1",
-"0-9+11=2",
-"0-9+12=3",
-"0-9+13=4",
-"0-9+14=5",
-"0-9+15=6",
-"0-9+16=7",
-"0-9+17=8",
-"0-9+18=9",
-"0-9+1=-8",
-"0-9+2=-7",
-"0-9+3=-6",
-"0-9+4=-5",
-"0-9+5=-4",
-"0-9+6=-3",
-"0-9+7=-2",
-"0-9+8=-1",
-"0-9-0=-9",
-"0-9*1=-9",
-"0-9/1=-9",
-"0-9/3=-3",
-"0-9/9=-1",
-"0*0-1=-1",
-"0*0-2=-2",
-"0*0-3=-3",
-"0*0-4=-4",
-"0*0-5=-5",
-"0*0-6=-6",
-"0*0-7=-7",
-"0*0-8=-8",
-"0*0-9=-9",
-"0*0*10=0",
-"0*0*11=0",
-"0*0*12=0",
-"0*0*13=0",
-"0*0*14=0",
-"0*0*15=0",
-"0*0*16=0",
-"0*0*17=0",
-"0*0*18=0",
-"0*0*19=0",
-"0*0*20=0",
-"0*0*21=0",
-"0*0*22=0",
-"0*0*23=0",
-"0*0*24=0",
-"0*0*25=0",
-"0*0*26=0",
-"0*0*27=0",
-"0*0*28=0",
-"0*0*29=0",
-"0*0*30=0",
-"0*0*31=0",
-"0*0*32=0",
-"0*0*33=0",
-"0*0*34=0",
-"0*0*35=0",
-"0*0*36=0",
-"0*0*37=0",
-"0*0*38=0",
-"0*0*39=0",
-"0*0*40=0",
-"0*0*41=0",
-"0*0*42=0",
-"0*0*43=0",
-"0*0*44=0",
-"0*0*45=0",
-"0*0*46=0",
-"0*0*47=0",
-"0*0*48=0",
-"0*0*49=0",
-"0*0*50=0",
-"0*0*51=0",
-"0*0*52=0",
-"0*0*53=0",
-"0*0*54=0",
-"0*0*55=0",
-"0*0*56=0",
-"0*0*57=0",
-"0*0*58=0",
-"0*0*59=0",
-"0*0*60=0",
-"0*0*61=0",
-"0*0*62=0",
-"0*0*63=0",
-"0*0*64=0",
-"0*0*65=0",
-"0*0*66=0",
-"0*0*67=0",
-"0*0*68=0",
-"0*0*69=0",
-"0*0*70=0",
-"0*0*71=0",
-"0*0*72=0",
-"0*0*73=0",
-"0*0*74=0",
-"0*0*75=0",
-"0*0*76=0",
-"0*0*77=0",
-"0*0*78=0",
-"0*0*79=0",
-"0*0*80=0",
-"0*0*81=0",
-"0*0*82=0",
-"0*0*83=0",
-"0*0*84=0",
-"0*0*85=0",
-"0*0*86=0",
-"0*0*87=0",
-"0*0*88=0",
-"0*0*89=0",
-"0*0*90=0",
-"0*0*91=0",
-"0*0*92=0",
-"0*0*93=0",
-"0*0*94=0",
-"0*0*95=0",
-"0*0*96=0",
-"0*0*97=0",
-"0*0*98=0",
-"0*0*99=0",
-"0*0/10=0",
-"0*0/11=0",
-"0*0/12=0",
-"0*0/13=0",
-"0*0/14=0",
-"0*0/15=0",
-"0*0/16=0",
-"0*0/17=0",
-"0*0/18=0",
-"0*0/19=0",
-"0*0/20=0",
-"0*0/21=0",
-"0*0/22=0",
-"0*0/23=0",
-"0*0/24=0",
-"0*0/25=0",
-"0*0/26=0",
-"0*0/27=0",
-"0*0/28=0",
-"0*0/29=0",
-"0*0/30=0",
-"0*0/31=0",
-"0*0/32=0",
-"0*0/33=0",
-"0*0/34=0",
-"0*0/35=0",
-"0*0/36=0",
-"0*0/37=0",
-"0*0/38=0",
-"0*0/39=0",
-"0*0/40=0",
-"0*0/41=0",
-"0*0/42=0",
-"0*0/43=0",
-"0*0/44=0",
-"0*0/45=0",
-"0*0/46=0",
-"0*0/47=0",
-"0*0/48=0",
-"0*0/49=0",
-"0*0/50=0",
-"0*0/51=0",
-"0*0/52=0",
-"0*0/53=0",
-"0*0/54=0",
-"0*0/55=0",
-"0*0/56=0",
-"0*0/57=0",
-"0*0/58=0",
-"0*0/59=0",
-"0*0/60=0",
-"0*0/61=0",
-"0*0/62=0",
-"0*0/63=0",
-"0*0/64=0",
-"0*0/65=0",
-"0*0/66=0",
-"0*0/67=0",
-"0*0/68=0",
-"0*0/69=0",
-"0*0/70=0",
-"0*0/71=0",
-"0*0/72=0",
-"0*0/73=0",
-"0*0/74=0",
-"0*0/75=0",
-"0*0/76=0",
-"0*0/77=0",
-"0*0/78=0",
-"0*0/79=0",
-"0*0/80=0",
-"0*0/81=0",
-"0*0/82=0",
-"0*0/83=0",
-"0*0/84=0",
-"0*0/85=0",
-"0*0/86=0",
-"0*0/87=0",
-"0*0/88=0",
-"0*0/89=0",
-"0*0/90=0",
-"0*0/91=0",
-"0*0/92=0",
-"0*0/93=0",
-"0*0/94=0",
-"0*0/95=0",
-"0*0/96=0",
-"0*0/97=0",
-"0*0/98=0",
-"0*0/99=0",
-"0*1000=0",
-"0*1001=0",
-"0*1002=0",
-"0*1003=0",
-"0*1004=0",
-"0*1005=0",
-"0*1006=0",
-"0*1007=0",
-"0*1008=0",
-"0*1009=0",
-"0*1010=0",
-"0*1011=0",
-"0*1012=0",
-"0*1013=0",
-"0*1014=0",
-"0*1015=0",
-"0*1016=0",
-"0*1017=0",
-"0*1018=0",
-"0*1019=0",
-"0*1020=0",
-"0*1021=0",
-"0*1022=0",
-"0*1023=0",
-"0*1024=0",
-"0*1025=0",
-"0*1026=0",
-"0*1027=0",
-"0*1028=0",
-"0*1029=0",
-"0*1030=0",
-"0*1031=0",
-"0*1032=0",
-"0*1033=0",
-"0*1034=0",
-"0*1035=0",
-"0*1036=0",
-"0*1037=0",
-"0*1038=0",
-"0*1039=0",
-"0*1040=0",
-"0*1041=0",
-"0*1042=0",
-"0*1043=0",
-"0*1044=0",
-"0*1045=0",
-"0*1046=0",
-"0*1047=0",
-"0*1048=0",
-"0*1049=0",
-"0*1050=0",
-"0*1051=0",
-"0*1052=0",
-"0*1053=0",
-"0*1054=0",
-"0*1055=0",
-"0*1056=0",
-"0*1057=0",
-"0*1058=0",
-"0*1059=0",
-"0*1060=0",
-"0*1061=0",
-"0*1062=0",
-"0*1063=0",
-"0*1064=0",
-"0*1065=0",
-"0*1066=0",
-"0*1067=0",
-"0*1068=0",
-"0*1069=0",
-"0*1070=0",
-"0*1071=0",
-"0*1072=0",
-"0*1073=0",
-"0*1074=0",
-"0*1075=0",
-"0*1076=0",
-"0*1077=0",
-"0*1078=0",
-"0*1079=0",
-"0*1080=0",
-"0*1081=0",
-"0*1082=0",
-"0*1083=0",
-"0*1084=0",
-"0*1085=0",
-"0*1086=0",
-"0*1087=0",
-"0*1088=0",
-"0*1089=0",
-"0*1090=0",
-"0*1091=0",
-"0*1092=0",
-"0*1093=0",
-"0*1094=0",
-"0*1095=0",
-"0*1096=0",
-"0*1097=0",
-"0*1098=0",
-"0*1099=0",
-"0*10+0=0",
-"0*10+1=1",
-"0*10+2=2",
-"0*10+3=3",
-"0*10+4=4",
-"0*10+5=5",
-"0*10+6=6",
-"0*10+7=7",
-"0*10+8=8",
-"0*10+9=9",
-"0*10-0=0",
-"0*10*0=0",
-"0*10*1=0",
-"0*10*2=0",
-"0*10*3=0",
-"0*10*4=0",
-"0*10*5=0",
-"0*10*6=0",
-"0*10*7=0",
-"0*10*8=0",
-"0*10*9=0",
-"0*10/1=0",
-"0*10/2=0",
-"0*10/3=0",
-"0*10/4=0",
-"0*10/5=0",
-"0*10/6=0",
-"0*10/7=0",
-"0*10/8=0",
-"0*10/9=0",
-"0*1100=0",
-"0*1101=0",
-"0*1102=0",
-"0*1103=0",
-"0*1104=0",
-"0*1105=0",
-"0*1106=0",
-"0*1107=0",
-"0*1108=0",
-"0*1109=0",
-"0*1110=0",
-"0*1111=0",
-"0*1112=0",
-"0*1113=0",
-"0*1114=0",
-"0*1115=0",
-"0*1116=0",
-"0*1117=0",
-"0*1118=0",
-"0*1119=0",
-"0*1120=0",
-"0*1121=0",
-"0*1122=0",
-"0*1123=0",
-"0*1124=0",
-"0*1125=0",
-"0*1126=0",
-"0*1127=0",
-"0*1128=0",
-"0*1129=0",
-"0*1130=0",
-"0*1131=0",
-"0*1132=0",
-"0*1133=0",
-"0*1134=0",
-"0*1135=0",
-"0*1136=0",
-"0*1137=0",
-"0*1138=0",
-"0*1139=0",
-"0*1140=0",
-"0*1141=0",
-"0*1142=0",
-"0*1143=0",
-"0*1144=0",
-"0*1145=0",
-"0*1146=0",
-"0*1147=0",
-"0*1148=0",
-"0*1149=0",
-"0*1150=0",
-"0*1151=0",
-"0*1152=0",
-"0*1153=0",
-"0*1154=0",
-"0*1155=0",
-"0*1156=0",
-"0*1157=0",
-"0*1158=0",
-"0*1159=0",
-"0*1160=0",
-"0*1161=0",
-"0*1162=0",
-"0*1163=0",
-"0*1164=0",
-"0*1165=0",
-"0*1166=0",
-"0*1167=0",
-"0*1168=0",
-"0*1169=0",
-"0*1170=0",
-"0*1171=0",
-"0*1172=0",
-"0*1173=0",
-"0*1174=0",
-"0*1175=0",
-"0*1176=0",
-"0*1177=0",
-"0*1178=0",
-"0*1179=0",
-"0*1180=0",
-"0*1181=0",
-"0*1182=0",
-"0*1183=0",
-"0*1184=0",
-"0*1185=0",
-"0*1186=0",
-"0*1187=0",
-"0*1188=0",
-"0*1189=0",
-"0*1190=0",
-"0*1191=0",
-"0*1192=0",
-"0*1193=0",
-"0*1194=0",
-"0*1195=0",
-"0*1196=0",
-"0*1197=0",
-"0*1198=0",
-"0*1199=0",
-"0*11+0=0",
-"0*11+1=1",
-"0*11+2=2",
-"0*11+3=3",
-"0*11+4=4",
-"0*11+5=5",
-"0*11+6=6",
-"0*11+7=7",
-"0*11+8=8",
-"0*11+9=9",
-"0*11-0=0",
-"0*11*0=0",
-"0*11*1=0",
-"0*11*2=0",
-"0*11*3=0",
-"0*11*4=0",
-"0*11*5=0",
-"0*11*6=0",
-"0*11*7=0",
-"0*11*8=0",
-"0*11*9=0",
-"0*11/1=0",
-"0*11/2=0",
-"0*11/3=0",
-"0*11/4=0",
-"0*11/5=0",
-"0*11/6=0",
-"0*11/7=0",
-"0*11/8=0",
-"0*11/9=0",
-"0*1200=0",
-"0*1201=0",
-"0*1202=0",
-"0*1203=0",
-"0*1204=0",
-"0*1205=0",
-"0*1206=0",
-"0*1207=0",
-"0*1208=0",
-"0*1209=0",
-"0*1210=0",
-"0*1211=0",
-"0*1212=0",
-"0*1213=0",
-"0*1214=0",
-"0*1215=0",
-"0*1216=0",
-"0*1217=0",
-"0*1218=0",
-"0*1219=0",
-"0*1220=0",
-"0*1221=0",
-"0*1222=0",
-"0*1223=0",
-"0*1224=0",
-"0*1225=0",
-"0*1226=0",
-"0*1227=0",
-"0*1228=0",
-"0*1229=0",
-"0*1230=0",
-"0*1231=0",
-"0*1232=0",
-"0*1233=0",
-"0*1234=0",
-"0*1235=0",
-"0*1236=0",
-"0*1237=0",
-"0*1238=0",
-"0*1239=0",
-"0*1240=0",
-"0*1241=0",
-"0*1242=0",
-"0*1243=0",
-"0*1244=0",
-"0*1245=0",
-"0*1246=0",
-"0*1247=0",
-"0*1248=0",
-"0*1249=0",
-"0*1250=0",
-"0*1251=0",
-"0*1252=0",
-"0*1253=0",
-"0*1254=0",
-"0*1255=0",
-"0*1256=0",
-"0*1257=0",
-"0*1258=0",
-"0*1259=0",
-"0*1260=0",
-"0*1261=0",
-"0*1262=0",
-"0*1263=0",
-"0*1264=0",
-"0*1265=0",
-"0*1266=0",
-"0*1267=0",
-"0*1268=0",
-"0*1269=0",
-"0*1270=0",
-"0*1271=0",
-"0*1272=0",
-"0*1273=0",
-"0*1274=0",
-"0*1275=0",
-"0*1276=0",
-"0*1277=0",
-"0*1278=0",
-"0*1279=0",
-"0*1280=0",
-"0*1281=0",
-"0*1282=0",
-"0*1283=0",
-"0*1284=0",
-"0*1285=0",
-"0*1286=0",
-"0*1287=0",
-"0*1288=0",
-"0*1289=0",
-"0*1290=0",
-"0*1291=0",
-"0*1292=0",
-"0*1293=0",
-"0*1294=0",
-"0*1295=0",
-"0*1296=0",
-"0*1297=0",
-"0*1298=0",
-"0*1299=0",
-"0*12+0=0",
-"0*12+1=1",
-"0*12+2=2",
-"0*12+3=3",
-"0*12+4=4",
-"0*12+5=5",
-"0*12+6=6",
-"0*12+7=7",
-"0*12+8=8",
-"0*12+9=9",
-"0*12-0=0",
-"0*12*0=0",
-"0*12*1=0",
-"0*12*2=0",
-"0*12*3=0",
-"0*12*4=0",
-"0*12*5=0",
-"0*12*6=0",
-"0*12*7=0",
-"0*12*8=0",
-"0*12*9=0",
-"0*12/1=0",
-"0*12/2=0",
-"0*12/3=0",
-"0*12/4=0",
-"0*12/5=0",
-"0*12/6=0",
-"0*12/7=0",
-"0*12/8=0",
-"0*12/9=0",
-"0*1300=0",
-"0*1301=0",
-"0*1302=0",
-"0*1303=0",
-"0*1304=0",
-"0*1305=0",
-"0*1306=0",
-"0*1307=0",
-"0*1308=0",
-"0*1309=0",
-"0*1310=0",
-"0*1311=0",
-"0*1312=0",
-"0*1313=0",
-"0*1314=0",
-"0*1315=0",
-"0*1316=0",
-"0*1317=0",
-"0*1318=0",
-"0*1319=0",
-"0*1320=0",
-"0*1321=0",
-"0*1322=0",
-"0*1323=0",
-"0*1324=0",
-"0*1325=0",
-"0*1326=0",
-"0*1327=0",
-"0*1328=0",
-"0*1329=0",
-"0*1330=0",
-"0*1331=0",
-"0*1332=0",
-"0*1333=0",
-"0*1334=0",
-"0*1335=0",
-"0*1336=0",
-"0*1337=0",
-"0*1338=0",
-"0*1339=0",
-"0*1340=0",
-"0*1341=0",
-"0*1342=0",
-"0*1343=0",
-"0*1344=0",
-"0*1345=0",
-"0*1346=0",
-"0*1347=0",
-"0*1348=0",
-"0*1349=0",
-"0*1350=0",
-"0*1351=0",
-"0*1352=0",
-"0*1353=0",
-"0*1354=0",
-"0*1355=0",
-"0*1356=0",
-"0*1357=0",
-"0*1358=0",
-"0*1359=0",
-"0*1360=0",
-"0*1361=0",
-"0*1362=0",
-"0*1363=0",
-"0*1364=0",
-"0*1365=0",
-"0*1366=0",
-"0*1367=0",
-"0*1368=0",
-"0*1369=0",
-"0*1370=0",
-"0*1371=0",
-"0*1372=0",
-"0*1373=0",
-"0*1374=0",
-"0*1375=0",
-"0*1376=0",
-"0*1377=0",
-"0*1378=0",
-"0*1379=0",
-"0*1380=0",
-"0*1381=0",
-"0*1382=0",
-"0*1383=0",
-"0*1384=0",
-"0*1385=0",
-"0*1386=0",
-"0*1387=0",
-"0*1388=0",
-"0*1389=0",
-"0*1390=0",
-"0*1391=0",
-"0*1392=0",
-"0*1393=0",
-"0*1394=0",
-"0*1395=0",
-"0*1396=0",
-"0*1397=0",
-"0*1398=0",
-"0*1399=0",
-"0*13+0=0",
-"0*13+1=1",
-"0*13+2=2",
-"0*13+3=3",
-"0*13+4=4",
-"0*13+5=5",
-"0*13+6=6",
-"0*13+7=7",
-"0*13+8=8",
-"0*13+9=9",
-"0*13-0=0",
-"0*13*0=0",
-"0*13*1=0",
-"0*13*2=0",
-"0*13*3=0",
-"0*13*4=0",
-"0*13*5=0",
-"0*13*6=0",
-"0*13*7=0",
-"0*13*8=0",
-"0*13*9=0",
-"0*13/1=0",
-"0*13/2=0",
-"0*13/3=0",
-"0*13/4=0",
-"0*13/5=0",
-"0*13/6=0",
-"0*13/7=0",
-"0*13/8=0",
-"0*13/9=0",
-"0*1400=0",
-"0*1401=0",
-"0*1402=0",
-"0*1403=0",
-"0*1404=0",
-"0*1405=0",
-"0*1406=0",
-"0*1407=0",
-"0*1408=0",
-"0*1409=0",
-"0*1410=0",
-"0*1411=0",
-"0*1412=0",
-"0*1413=0",
-"0*1414=0",
-"0*1415=0",
-"0*1416=0",
-"0*1417=0",
-"0*1418=0",
-"0*1419=0",
-"0*1420=0",
-"0*1421=0",
-"0*1422=0",
-"0*1423=0",
-"0*1424=0",
-"0*1425=0",
-"0*1426=0",
-"0*1427=0",
-"0*1428=0",
-"0*1429=0",
-"0*1430=0",
-"0*1431=0",
-"0*1432=0",
-"0*1433=0",
-"0*1434=0",
-"0*1435=0",
-"0*1436=0",
-"0*1437=0",
-"0*1438=0",
-"0*1439=0",
-"0*1440=0",
-"0*1441=0",
-"0*1442=0",
-"0*1443=0",
-"0*1444=0",
-"0*1445=0",
-"0*1446=0",
-"0*1447=0",
-"0*1448=0",
-"0*1449=0",
-"0*1450=0",
-"0*1451=0",
-"0*1452=0",
-"0*1453=0",
-"0*1454=0",
-"0*1455=0",
-"0*1456=0",
-"0*1457=0",
-"0*1458=0",
-"0*1459=0",
-"0*1460=0",
-"0*1461=0",
-"0*1462=0",
-"0*1463=0",
-"0*1464=0",
-"0*1465=0",
-"0*1466=0",
-"0*1467=0",
-"0*1468=0",
-"0*1469=0",
-"0*1470=0",
-"0*1471=0",
-"0*1472=0",
-"0*1473=0",
-"0*1474=0",
-"0*1475=0",
-"0*1476=0",
-"0*1477=0",
-"0*1478=0",
-"0*1479=0",
-"0*1480=0",
-"0*1481=0",
-"0*1482=0",
-"0*1483=0",
-"0*1484=0",
-"0*1485=0",
-"0*1486=0",
-"0*1487=0",
-"0*1488=0",
-"0*1489=0",
-"0*1490=0",
-"0*1491=0",
-"0*1492=0",
-"0*1493=0",
-"0*1494=0",
-"0*1495=0",
-"0*1496=0",
-"0*1497=0",
-"0*1498=0",
-"0*1499=0",
-"0*14+0=0",
-"0*14+1=1",
-"0*14+2=2",
-"0*14+3=3",
-"0*14+4=4",
-"0*14+5=5",
-"0*14+6=6",
-"0*14+7=7",
-"0*14+8=8",
-"0*14+9=9",
-"0*14-0=0",
-"0*14*0=0",
-"0*14*1=0",
-"0*14*2=0",
-"0*14*3=0",
-"0*14*4=0",
-"0*14*5=0",
-"0*14*6=0",
-"0*14*7=0",
-"0*14*8=0",
-"0*14*9=0",
-"0*14/1=0",
-"0*14/2=0",
-"0*14/3=0",
-"0*14/4=0",
-"0*14/5=0",
-"0*14/6=0",
-"0*14/7=0",
-"0*14/8=0",
-"0*14/9=0",
-"0*1500=0",
-"0*1501=0",
-"0*1502=0",
-"0*1503=0",
-"0*1504=0",
-"0*1505=0",
-"0*1506=0",
-"0*1507=0",
-"0*1508=0",
-"0*1509=0",
-"0*1510=0",
-"0*1511=0",
-"0*1512=0",
-"0*1513=0",
-"0*1514=0",
-"0*1515=0",
-"0*1516=0",
-"0*1517=0",
-"0*1518=0",
-"0*1519=0",
-"0*1520=0",
-"0*1521=0",
-"0*1522=0",
-"0*1523=0",
-"0*1524=0",
-"0*1525=0",
-"0*1526=0",
-"0*1527=0",
-"0*1528=0",
-"0*1529=0",
-"0*1530=0",
-"0*1531=0",
-"0*1532=0",
-"0*1533=0",
-"0*1534=0",
-"0*1535=0",
-"0*1536=0",
-"0*1537=0",
-"0*1538=0",
-"0*1539=0",
-"0*1540=0",
-"0*1541=0",
-"0*1542=0",
-"0*1543=0",
-"0*1544=0",
-"0*1545=0",
-"0*1546=0",
-"0*1547=0",
-"0*1548=0",
-"0*1549=0",
-"0*1550=0",
-"0*1551=0",
-"0*1552=0",
-"0*1553=0",
-"0*1554=0",
-"0*1555=0",
-"0*1556=0",
-"0*1557=0",
-"0*1558=0",
-"0*1559=0",
-"0*1560=0",
-"0*1561=0",
-"0*1562=0",
-"0*1563=0",
-"0*1564=0",
-"0*1565=0",
-"0*1566=0",
-"0*1567=0",
-"0*1568=0",
-"0*1569=0",
-"0*1570=0",
-"0*1571=0",
-"0*1572=0",
-"0*1573=0",
-"0*1574=0",
-"0*1575=0",
-"0*1576=0",
-"0*1577=0",
-"0*1578=0",
-"0*1579=0",
-"0*1580=0",
-"0*1581=0",
-"0*1582=0",
-"0*1583=0",
-"0*1584=0",
-"0*1585=0",
-"0*1586=0",
-"0*1587=0",
-"0*1588=0",
-"0*1589=0",
-"0*1590=0",
-"0*1591=0",
-"0*1592=0",
-"0*1593=0",
-"0*1594=0",
-"0*1595=0",
-"0*1596=0",
-"0*1597=0",
-"0*1598=0",
-"0*1599=0",
-"0*15+0=0",
-"0*15+1=1",
-"0*15+2=2",
-"0*15+3=3",
-"0*15+4=4",
-"0*15+5=5",
-"0*15+6=6",
-"0*15+7=7",
-"0*15+8=8",
-"0*15+9=9",
-"0*15-0=0",
-"0*15*0=0",
-"0*15*1=0",
-"0*15*2=0",
-"0*15*3=0",
-"0*15*4=0",
-"0*15*5=0",
-"0*15*6=0",
-"0*15*7=0",
-"0*15*8=0",
-"0*15*9=0",
-"0*15/1=0",
-"0*15/2=0",
-"0*15/3=0",
-"0*15/4=0",
-"0*15/5=0",
-"0*15/6=0",
-"0*15/7=0",
-"0*15/8=0",
-"0*15/9=0",
-"0*1600=0",
-"0*1601=0",
-"0*1602=0",
-"0*1603=0",
-"0*1604=0",
-"0*1605=0",
-"0*1606=0",
-"0*1607=0",
-"0*1608=0",
-"0*1609=0",
-"0*1610=0",
-"0*1611=0",
-"0*1612=0",
-"0*1613=0",
-"0*1614=0",
-"0*1615=0",
-"0*1616=0",
-"0*1617=0",
-"0*1618=0",
-"0*1619=0",
-"0*1620=0",
-"0*1621=0",
-"0*1622=0",
-"0*1623=0",
-"0*1624=0",
-"0*1625=0",
-"0*1626=0",
-"0*1627=0",
-"0*1628=0",
-"0*1629=0",
-"0*1630=0",
-"0*1631=0",
-"0*1632=0",
-"0*1633=0",
-"0*1634=0",
-"0*1635=0",
-"0*1636=0",
-"0*1637=0",
-"0*1638=0",
-"0*1639=0",
-"0*1640=0",
-"0*1641=0",
-"0*1642=0",
-"0*1643=0",
-"0*1644=0",
-"0*1645=0",
-"0*1646=0",
-"0*1647=0",
-"0*1648=0",
-"0*1649=0",
-"0*1650=0",
-"0*1651=0",
-"0*1652=0",
-"0*1653=0",
-"0*1654=0",
-"0*1655=0",
-"0*1656=0",
-"0*1657=0",
-"0*1658=0",
-"0*1659=0",
-"0*1660=0",
-"0*1661=0",
-"0*1662=0",
-"0*1663=0",
-"0*1664=0",
-"0*1665=0",
-"0*1666=0",
-"0*1667=0",
-"0*1668=0",
-"0*1669=0",
-"0*1670=0",
-"0*1671=0",
-"0*1672=0",
-"0*1673=0",
-"0*1674=0",
-"0*1675=0",
-"0*1676=0",
-"0*1677=0",
-"0*1678=0",
-"0*1679=0",
-"0*1680=0",
-"0*1681=0",
-"0*1682=0",
-"0*1683=0",
-"0*1684=0",
-"0*1685=0",
-"0*1686=0",
-"0*1687=0",
-"0*1688=0",
-"0*1689=0",
-"0*1690=0",
-"0*1691=0",
-"0*1692=0",
-"0*1693=0",
-"0*1694=0",
-"0*1695=0",
-"0*1696=0",
-"0*1697=0",
-"0*1698=0",
-"0*1699=0",
-"0*16+0=0",
-"0*16+1=1",
-"0*16+2=2",
-"0*16+3=3",
-"0*16+4=4",
-"0*16+5=5",
-"0*16+6=6",
-"0*16+7=7",
-"0*16+8=8",
-"0*16+9=9",
-"0*16-0=0",
-"0*16*0=0",
-"0*16*1=0",
-"0*16*2=0",
-"0*16*3=0",
-"0*16*4=0",
-"0*16*5=0",
-"0*16*6=0",
-"0*16*7=0",
-"0*16*8=0",
-"0*16*9=0",
-"0*16/1=0",
-"0*16/2=0",
-"0*16/3=0",
-"0*16/4=0",
-"0*16/5=0",
-"0*16/6=0",
-"0*16/7=0",
-"0*16/8=0",
-"0*16/9=0",
-"0*1700=0",
-"0*1701=0",
-"0*1702=0",
-"0*1703=0",
-"0*1704=0",
-"0*1705=0",
-"0*1706=0",
-"0*1707=0",
-"0*1708=0",
-"0*1709=0",
-"0*1710=0",
-"0*1711=0",
-"0*1712=0",
-"0*1713=0",
-"0*1714=0",
-"0*1715=0",
-"0*1716=0",
-"0*1717=0",
-"0*1718=0",
-"0*1719=0",
-"0*1720=0",
-"0*1721=0",
-"0*1722=0",
-"0*1723=0",
-"0*1724=0",
-"0*1725=0",
-"0*1726=0",
-"0*1727=0",
-"0*1728=0",
-"0*1729=0",
-"0*1730=0",
-"0*1731=0",
-"0*1732=0",
-"0*1733=0",
-"0*1734=0",
-"0*1735=0",
-"0*1736=0",
-"0*1737=0",
-"0*1738=0",
-"0*1739=0",
-"0*1740=0",
-"0*1741=0",
-"0*1742=0",
-"0*1743=0",
-"0*1744=0",
-"0*1745=0",
-"0*1746=0",
-"0*1747=0",
-"0*1748=0",
-"0*1749=0",
-"0*1750=0",
-"0*1751=0",
-"0*1752=0",
-"0*1753=0",
-"0*1754=0",
-"0*1755=0",
-"0*1756=0",
-"0*1757=0",
-"0*1758=0",
-"0*1759=0",
-"0*1760=0",
-"0*1761=0",
-"0*1762=0",
-"0*1763=0",
-"0*1764=0",
-"0*1765=0",
-"0*1766=0",
-"0*1767=0",
-"0*1768=0",
-"0*1769=0",
-"0*1770=0",
-"0*1771=0",
-"0*1772=0",
-"0*1773=0",
-"0*1774=0",
-"0*1775=0",
-"0*1776=0",
-"0*1777=0",
-"0*1778=0",
-"0*1779=0",
-"0*1780=0",
-"0*1781=0",
-"0*1782=0",
-"0*1783=0",
-"0*1784=0",
-"0*1785=0",
-"0*1786=0",
-"0*1787=0",
-"0*1788=0",
-"0*1789=0",
-"0*1790=0",
-"0*1791=0",
-"0*1792=0",
-"0*1793=0",
-"0*1794=0",
-"0*1795=0",
-"0*1796=0",
-"0*1797=0",
-"0*1798=0",
-"0*1799=0",
-"0*17+0=0",
-"0*17+1=1",
-"0*17+2=2",
-"0*17+3=3",
-"0*17+4=4",
-"0*17+5=5",
-"0*17+6=6",
-"0*17+7=7",
-"0*17+8=8",
-"0*17+9=9",
-"0*17-0=0",
-"0*17*0=0",
-"0*17*1=0",
-"0*17*2=0",
-"0*17*3=0",
-"0*17*4=0",
-"0*17*5=0",
-"0*17*6=0",
-"0*17*7=0",
-"0*17*8=0",
-"0*17*9=0",
-"0*17/1=0",
-"0*17/2=0",
-"0*17/3=0",
-"0*17/4=0",
-"0*17/5=0",
-"0*17/6=0",
-"0*17/7=0",
-"0*17/8=0",
-"0*17/9=0",
-"0*1800=0",
-"0*1801=0",
-"0*1802=0",
-"0*1803=0",
-"0*1804=0",
-"0*1805=0",
-"0*1806=0",
-"0*1807=0",
-"0*1808=0",
-"0*1809=0",
-"0*1810=0",
-"0*1811=0",
-"0*1812=0",
-"0*1813=0",
-"0*1814=0",
-"0*1815=0",
-"0*1816=0",
-"0*1817=0",
-"0*1818=0",
-"0*1819=0",
-"0*1820=0",
-"0*1821=0",
-"0*1822=0",
-"0*1823=0",
-"0*1824=0",
-"0*1825=0",
-"0*1826=0",
-"0*1827=0",
-"0*1828=0",
-"0*1829=0",
-"0*1830=0",
-"0*1831=0",
-"0*1832=0",
-"0*1833=0",
-"0*1834=0",
-"0*1835=0",
-"0*1836=0",
-"0*1837=0",
-"0*1838=0",
-"0*1839=0",
-"0*1840=0",
-"0*1841=0",
-"0*1842=0",
-"0*1843=0",
-"0*1844=0",
-"0*1845=0",
-"0*1846=0",
-"0*1847=0",
-"0*1848=0",
-"0*1849=0",
-"0*1850=0",
-"0*1851=0",
-"0*1852=0",
-"0*1853=0",
-"0*1854=0",
-"0*1855=0",
-"0*1856=0",
-"0*1857=0",
-"0*1858=0",
-"0*1859=0",
-"0*1860=0",
-"0*1861=0",
-"0*1862=0",
-"0*1863=0",
-"0*1864=0",
-"0*1865=0",
-"0*1866=0",
-"0*1867=0",
-"0*1868=0",
-"0*1869=0",
-"0*1870=0",
-"0*1871=0",
-"0*1872=0",
-"0*1873=0",
-"0*1874=0",
-"0*1875=0",
-"0*1876=0",
-"0*1877=0",
-"0*1878=0",
-"0*1879=0",
-"0*1880=0",
-"0*1881=0",
-"0*1882=0",
-"0*1883=0",
-"0*1884=0",
-"0*1885=0",
-"0*1886=0",
-"0*1887=0",
-"0*1888=0",
-"0*1889=0",
-"0*1890=0",
-"0*1891=0",
-"0*1892=0",
-"0*1893=0",
-"0*1894=0",
-"0*1895=0",
-"0*1896=0",
-"0*1897=0",
-"0*1898=0",
-"0*1899=0",
-"0*18+0=0",
-"0*18+1=1",
-"0*18+2=2",
-"0*18+3=3",
-"0*18+4=4",
-"0*18+5=5",
-"0*18+6=6",
-"0*18+7=7",
-"0*18+8=8",
-"0*18+9=9",
-"0*18-0=0",
-"0*18*0=0",
-"0*18*1=0",
-"0*18*2=0",
-"0*18*3=0",
-"0*18*4=0",
-"0*18*5=0",
-"0*18*6=0",
-"0*18*7=0",
-"0*18*8=0",
-"0*18*9=0",
-"0*18/1=0",
-"0*18/2=0",
-"0*18/3=0",
-"0*18/4=0",
-"0*18/5=0",
-"0*18/6=0",
-"0*18/7=0",
-"0*18/8=0",
-"0*18/9=0",
-"0*1900=0",
-"0*1901=0",
-"0*1902=0",
-"0*1903=0",
-"0*1904=0",
-"0*1905=0",
-"0*1906=0",
-"0*1907=0",
-"0*1908=0",
-"0*1909=0",
-"0*1910=0",
-"0*1911=0",
-"0*1912=0",
-"0*1913=0",
-"0*1914=0",
-"0*1915=0",
-"0*1916=0",
-"0*1917=0",
-"0*1918=0",
-"0*1919=0",
-"0*1920=0",
-"0*1921=0",
-"0*1922=0",
-"0*1923=0",
-"0*1924=0",
-"0*1925=0",
-"0*1926=0",
-"0*1927=0",
-"0*1928=0",
-"0*1929=0",
-"0*1930=0",
-"0*1931=0",
-"0*1932=0",
-"0*1933=0",
-"0*1934=0",
-"0*1935=0",
-"0*1936=0",
-"0*1937=0",
-"0*1938=0",
-"0*1939=0",
-"0*1940=0",
-"0*1941=0",
-"0*1942=0",
-"0*1943=0",
-"0*1944=0",
-"0*1945=0",
-"0*1946=0",
-"0*1947=0",
-"0*1948=0",
-"0*1949=0",
-"0*1950=0",
-"0*1951=0",
-"0*1952=0",
-"0*1953=0",
-"0*1954=0",
-"0*1955=0",
-"0*1956=0",
-"0*1957=0",
-"0*1958=0",
-"0*1959=0",
-"0*1960=0",
-"0*1961=0",
-"0*1962=0",
-"0*1963=0",
-"0*1964=0",
-"0*1965=0",
-"0*1966=0",
-"0*1967=0",
-"0*1968=0",
-"0*1969=0",
-"0*1970=0",
-"0*1971=0",
-"0*1972=0",
-"0*1973=0",
-"0*1974=0",
-"0*1975=0",
-"0*1976=0",
-"0*1977=0",
-"0*1978=0",
-"0*1979=0",
-"0*1980=0",
-"0*1981=0",
-"0*1982=0",
-"0*1983=0",
-"0*1984=0",
-"0*1985=0",
-"0*1986=0",
-"0*1987=0",
-"0*1988=0",
-"0*1989=0",
-"0*1990=0",
-"0*1991=0",
-"0*1992=0",
-"0*1993=0",
-"0*1994=0",
-"0*1995=0",
-"0*1996=0",
-"0*1997=0",
-"0*1998=0",
-"0*1999=0",
-"0*19+0=0",
-"0*19+1=1",
-"0*19+2=2",
-"0*19+3=3",
-"0*19+4=4",
-"0*19+5=5",
-"0*19+6=6",
-"0*19+7=7",
-"0*19+8=8",
-"0*19+9=9",
-"0*19-0=0",
-"0*19*0=0",
-"0*19*1=0",
-"0*19*2=0",
-"0*19*3=0",
-"0*19*4=0",
-"0*19*5=0",
-"0*19*6=0",
-"0*19*7=0",
-"0*19*8=0",
-"0*19*9=0",
-"0*19/1=0",
-"0*19/2=0",
-"0*19/3=0",
-"0*19/4=0",
-"0*19/5=0",
-"0*19/6=0",
-"0*19/7=0",
-"0*19/8=0",
-"0*19/9=0",
-"0*1-1=-1",
-"0*1-2=-2",
-"0*1-3=-3",
-"0*1-4=-4",
-"0*1-5=-5",
-"0*1-6=-6",
-"0*1-7=-7",
-"0*1-8=-8",
-"0*1-9=-9",
-"0*1*10=0",
-"0*1*11=0",
-"0*1*12=0",
-"0*1*13=0",
-"0*1*14=0",
-"0*1*15=0",
-"0*1*16=0",
-"0*1*17=0",
-"0*1*18=0",
-"0*1*19=0",
-"0*1*20=0",
-"0*1*21=0",
-"0*1*22=0",
-"0*1*23=0",
-"0*1*24=0",
-"0*1*25=0",
-"0*1*26=0",
-"0*1*27=0",
-"0*1*28=0",
-"0*1*29=0",
-"0*1*30=0",
-"0*1*31=0",
-"0*1*32=0",
-"0*1*33=0",
-"0*1*34=0",
-"0*1*35=0",
-"0*1*36=0",
-"0*1*37=0",
-"0*1*38=0",
-"0*1*39=0",
-"0*1*40=0",
-"0*1*41=0",
-"0*1*42=0",
-"0*1*43=0",
-"0*1*44=0",
-"0*1*45=0",
-"0*1*46=0",
-"0*1*47=0",
-"0*1*48=0",
-"0*1*49=0",
-"0*1*50=0",
-"0*1*51=0",
-"0*1*52=0",
-"0*1*53=0",
-"0*1*54=0",
-"0*1*55=0",
-"0*1*56=0",
-"0*1*57=0",
-"0*1*58=0",
-"0*1*59=0",
-"0*1*60=0",
-"0*1*61=0",
-"0*1*62=0",
-"0*1*63=0",
-"0*1*64=0",
-"0*1*65=0",
-"0*1*66=0",
-"0*1*67=0",
-"0*1*68=0",
-"0*1*69=0",
-"0*1*70=0",
-"0*1*71=0",
-"0*1*72=0",
-"0*1*73=0",
-"0*1*74=0",
-"0*1*75=0",
-"0*1*76=0",
-"0*1*77=0",
-"0*1*78=0",
-"0*1*79=0",
-"0*1*80=0",
-"0*1*81=0",
-"0*1*82=0",
-"0*1*83=0",
-"0*1*84=0",
-"0*1*85=0",
-"0*1*86=0",
-"0*1*87=0",
-"0*1*88=0",
-"0*1*89=0",
-"0*1*90=0",
-"0*1*91=0",
-"0*1*92=0",
-"0*1*93=0",
-"0*1*94=0",
-"0*1*95=0",
-"0*1*96=0",
-"0*1*97=0",
-"0*1*98=0",
-"0*1*99=0",
-"0*1/10=0",
-"0*1/11=0",
-"0*1/12=0",
-"0*1/13=0",
-"0*1/14=0",
-"0*1/15=0",
-"0*1/16=0",
-"0*1/17=0",
-"0*1/18=0",
-"0*1/19=0",
-"0*1/20=0",
-"0*1/21=0",
-"0*1/22=0",
-"0*1/23=0",
-"0*1/24=0",
-"0*1/25=0",
-"0*1/26=0",
-"0*1/27=0",
-"0*1/28=0",
-"0*1/29=0",
-"0*1/30=0",
-"0*1/31=0",
-"0*1/32=0",
-"0*1/33=0",
-"0*1/34=0",
-"0*1/35=0",
-"0*1/36=0",
-"0*1/37=0",
-"0*1/38=0",
-"0*1/39=0",
-"0*1/40=0",
-"0*1/41=0",
-"0*1/42=0",
-"0*1/43=0",
-"0*1/44=0",
-"0*1/45=0",
-"0*1/46=0",
-"0*1/47=0",
-"0*1/48=0",
-"0*1/49=0",
-"0*1/50=0",
-"0*1/51=0",
-"0*1/52=0",
-"0*1/53=0",
-"0*1/54=0",
-"0*1/55=0",
-"0*1/56=0",
-"0*1/57=0",
-"0*1/58=0",
-"0*1/59=0",
-"0*1/60=0",
-"0*1/61=0",
-"0*1/62=0",
-"0*1/63=0",
-"0*1/64=0",
-"0*1/65=0",
-"0*1/66=0",
-"0*1/67=0",
-"0*1/68=0",
-"0*1/69=0",
-"0*1/70=0",
-"0*1/71=0",
-"0*1/72=0",
-"0*1/73=0",
-"0*1/74=0",
-"0*1/75=0",
-"0*1/76=0",
-"0*1/77=0",
-"0*1/78=0",
-"0*1/79=0",
-"0*1/80=0",
-"0*1/81=0",
-"0*1/82=0",
-"0*1/83=0",
-"0*1/84=0",
-"0*1/85=0",
-"0*1/86=0",
-"0*1/87=0",
-"0*1/88=0",
-"0*1/89=0",
-"0*1/90=0",
-"0*1/91=0",
-"0*1/92=0",
-"0*1/93=0",
-"0*1/94=0",
-"0*1/95=0",
-"0*1/96=0",
-"0*1/97=0",
-"0*1/98=0",
-"0*1/99=0",
-"0*2000=0",
-"0*2001=0",
-"0*2002=0",
-"0*2003=0",
-"0*2004=0",
-"0*2005=0",
-"0*2006=0",
-"0*2007=0",
-"0*2008=0",
-"0*2009=0",
-"0*2010=0",
-"0*2011=0",
-"0*2012=0",
-"0*2013=0",
-"0*2014=0",
-"0*2015=0",
-"0*2016=0",
-"0*2017=0",
-"0*2018=0",
-"0*2019=0",
-"0*2020=0",
-"0*2021=0",
-"0*2022=0",
-"0*2023=0",
-"0*2024=0",
-"0*2025=0",
-"0*2026=0",
-"0*2027=0",
-"0*2028=0",
-"0*2029=0",
-"0*2030=0",
-"0*2031=0",
-"0*2032=0",
-"0*2033=0",
-"0*2034=0",
-"0*2035=0",
-"0*2036=0",
-"0*2037=0",
-"0*2038=0",
-"0*2039=0",
-"0*2040=0",
-"0*2041=0",
-"0*2042=0",
-"0*2043=0",
-"0*2044=0",
-"0*2045=0",
-"0*2046=0",
-"0*2047=0",
-"0*2048=0",
-"0*2049=0",
-"0*2050=0",
-"0*2051=0",
-"0*2052=0",
-"0*2053=0",
-"0*2054=0",
-"0*2055=0",
-"0*2056=0",
-"0*2057=0",
-"0*2058=0",
-"0*2059=0",
-"0*2060=0",
-"0*2061=0",
-"0*2062=0",
-"0*2063=0",
-"0*2064=0",
-"0*2065=0",
-"0*2066=0",
-"0*2067=0",
-"0*2068=0",
-"0*2069=0",
-"0*2070=0",
-"0*2071=0",
-"0*2072=0",
-"0*2073=0",
-"0*2074=0",
-"0*2075=0",
-"0*2076=0",
-"0*2077=0",
-"0*2078=0",
-"0*2079=0",
-"0*2080=0",
-"0*2081=0",
-"0*2082=0",
-"0*2083=0",
-"0*2084=0",
-"0*2085=0",
-"0*2086=0",
-"0*2087=0",
-"0*2088=0",
-"0*2089=0",
-"0*2090=0",
-"0*2091=0",
-"0*2092=0",
-"0*2093=0",
-"0*2094=0",
-"0*2095=0",
-"0*2096=0",
-"0*2097=0",
-"0*2098=0",
-"0*2099=0",
-"0*20+0=0",
-"0*20+1=1",
-"0*20+2=2",
-"0*20+3=3",
-"0*20+4=4",
-"0*20+5=5",
-"0*20+6=6",
-"0*20+7=7",
-"0*20+8=8",
-"0*20+9=9",
-"0*20-0=0",
-"0*20*0=0",
-"0*20*1=0",
-"0*20*2=0",
-"0*20*3=0",
-"0*20*4=0",
-"0*20*5=0",
-"0*20*6=0",
-"0*20*7=0",
-"0*20*8=0",
-"0*20*9=0",
-"0*20/1=0",
-"0*20/2=0",
-"0*20/3=0",
-"0*20/4=0",
-"0*20/5=0",
-"0*20/6=0",
-"0*20/7=0",
-"0*20/8=0",
-"0*20/9=0",
-"0*2100=0",
-"0*2101=0",
-"0*2102=0",
-"0*2103=0",
-"0*2104=0",
-"0*2105=0",
-"0*2106=0",
-"0*2107=0",
-"0*2108=0",
-"0*2109=0",
-"0*2110=0",
-"0*2111=0",
-"0*2112=0",
-"0*2113=0",
-"0*2114=0",
-"0*2115=0",
-"0*2116=0",
-"0*2117=0",
-"0*2118=0",
-"0*2119=0",
-"0*2120=0",
-"0*2121=0",
-"0*2122=0",
-"0*2123=0",
-"0*2124=0",
-"0*2125=0",
-"0*2126=0",
-"0*2127=0",
-"0*2128=0",
-"0*2129=0",
-"0*2130=0",
-"0*2131=0",
-"0*2132=0",
-"0*2133=0",
-"0*2134=0",
-"0*2135=0",
-"0*2136=0",
-"0*2137=0",
-"0*2138=0",
-"0*2139=0",
-"0*2140=0",
-"0*2141=0",
-"0*2142=0",
-"0*2143=0",
-"0*2144=0",
-"0*2145=0",
-"0*2146=0",
-"0*2147=0",
-"0*2148=0",
-"0*2149=0",
-"0*2150=0",
-"0*2151=0",
-"0*2152=0",
-"0*2153=0",
-"0*2154=0",
-"0*2155=0",
-"0*2156=0",
-"0*2157=0",
-"0*2158=0",
-"0*2159=0",
-"0*2160=0",
-"0*2161=0",
-"0*2162=0",
-"0*2163=0",
-"0*2164=0",
-"0*2165=0",
-"0*2166=0",
-"0*2167=0",
-"0*2168=0",
-"0*2169=0",
-"0*2170=0",
-"0*2171=0",
-"0*2172=0",
-"0*2173=0",
-"0*2174=0",
-"0*2175=0",
-"0*2176=0",
-"0*2177=0",
-"0*2178=0",
-"0*2179=0",
-"0*2180=0",
-"0*2181=0",
-"0*2182=0",
-"0*2183=0",
-"0*2184=0",
-"0*2185=0",
-"0*2186=0",
-"0*2187=0",
-"0*2188=0",
-"0*2189=0",
-"0*2190=0",
-"0*2191=0",
-"0*2192=0",
-"0*2193=0",
-"0*2194=0",
-"0*2195=0",
-"0*2196=0",
-"0*2197=0",
-"0*2198=0",
-"0*2199=0",
-"0*21+0=0",
-"0*21+1=1",
-"0*21+2=2",
-"0*21+3=3",
-"0*21+4=4",
-"0*21+5=5",
-"0*21+6=6",
-"0*21+7=7",
-"0*21+8=8",
-"0*21+9=9",
-"0*21-0=0",
-"0*21*0=0",
-"0*21*1=0",
-"0*21*2=0",
-"0*21*3=0",
-"0*21*4=0",
-"0*21*5=0",
-"0*21*6=0",
-"0*21*7=0",
-"0*21*8=0",
-"0*21*9=0",
-"0*21/1=0",
-"0*21/2=0",
-"0*21/3=0",
-"0*21/4=0",
-"0*21/5=0",
-"0*21/6=0",
-"0*21/7=0",
-"0*21/8=0",
-"0*21/9=0",
-"0*2200=0",
-"0*2201=0",
-"0*2202=0",
-"0*2203=0",
-"0*2204=0",
-"0*2205=0",
-"0*2206=0",
-"0*2207=0",
-"0*2208=0",
-"0*2209=0",
-"0*2210=0",
-"0*2211=0",
-"0*2212=0",
-"0*2213=0",
-"0*2214=0",
-"0*2215=0",
-"0*2216=0",
-"0*2217=0",
-"0*2218=0",
-"0*2219=0",
-"0*2220=0",
-"0*2221=0",
-"0*2222=0",
-"0*2223=0",
-"0*2224=0",
-"0*2225=0",
-"0*2226=0",
-"0*2227=0",
-"0*2228=0",
-"0*2229=0",
-"0*2230=0",
-"0*2231=0",
-"0*2232=0",
-"0*2233=0",
-"0*2234=0",
-"0*2235=0",
-"0*2236=0",
-"0*2237=0",
-"0*2238=0",
-"0*2239=0",
-"0*2240=0",
-"0*2241=0",
-"0*2242=0",
-"0*2243=0",
-"0*2244=0",
-"0*2245=0",
-"0*2246=0",
-"0*2247=0",
-"0*2248=0",
-"0*2249=0",
-"0*2250=0",
-"0*2251=0",
-"0*2252=0",
-"0*2253=0",
-"0*2254=0",
-"0*2255=0",
-"0*2256=0",
-"0*2257=0",
-"0*2258=0",
-"0*2259=0",
-"0*2260=0",
-"0*2261=0",
-"0*2262=0",
-"0*2263=0",
-"0*2264=0",
-"0*2265=0",
-"0*2266=0",
-"0*2267=0",
-"0*2268=0",
-"0*2269=0",
-"0*2270=0",
-"0*2271=0",
-"0*2272=0",
-"0*2273=0",
-"0*2274=0",
-"0*2275=0",
-"0*2276=0",
-"0*2277=0",
-"0*2278=0",
-"0*2279=0",
-"0*2280=0",
-"0*2281=0",
-"0*2282=0",
-"0*2283=0",
-"0*2284=0",
-"0*2285=0",
-"0*2286=0",
-"0*2287=0",
-"0*2288=0",
-"0*2289=0",
-"0*2290=0",
-"0*2291=0",
-"0*2292=0",
-"0*2293=0",
-"0*2294=0",
-"0*2295=0",
-"0*2296=0",
-"0*2297=0",
-"0*2298=0",
-"0*2299=0",
-"0*22+0=0",
-"0*22+1=1",
-"0*22+2=2",
-"0*22+3=3",
-"0*22+4=4",
-"0*22+5=5",
-"0*22+6=6",
-"0*22+7=7",
-"0*22+8=8",
-"0*22+9=9",
-"0*22-0=0",
-"0*22*0=0",
-"0*22*1=0",
-"0*22*2=0",
-"0*22*3=0",
-"0*22*4=0",
-"0*22*5=0",
-"0*22*6=0",
-"0*22*7=0",
-"0*22*8=0",
-"0*22*9=0",
-"0*22/1=0",
-"0*22/2=0",
-"0*22/3=0",
-"0*22/4=0",
-"0*22/5=0",
-"0*22/6=0",
-"0*22/7=0",
-"0*22/8=0",
-"0*22/9=0",
-"0*2300=0",
-"0*2301=0",
-"0*2302=0",
-"0*2303=0",
-"0*2304=0",
-"0*2305=0",
-"0*2306=0",
-"0*2307=0",
-"0*2308=0",
-"0*2309=0",
-"0*2310=0",
-"0*2311=0",
-"0*2312=0",
-"0*2313=0",
-"0*2314=0",
-"0*2315=0",
-"0*2316=0",
-"0*2317=0",
-"0*2318=0",
-"0*2319=0",
-"0*2320=0",
-"0*2321=0",
-"0*2322=0",
-"0*2323=0",
-"0*2324=0",
-"0*2325=0",
-"0*2326=0",
-"0*2327=0",
-"0*2328=0",
-"0*2329=0",
-"0*2330=0",
-"0*2331=0",
-"0*2332=0",
-"0*2333=0",
-"0*2334=0",
-"0*2335=0",
-"0*2336=0",
-"0*2337=0",
-"0*2338=0",
-"0*2339=0",
-"0*2340=0",
-"0*2341=0",
-"0*2342=0",
-"0*2343=0",
-"0*2344=0",
-"0*2345=0",
-"0*2346=0",
-"0*2347=0",
-"0*2348=0",
-"0*2349=0",
-"0*2350=0",
-"0*2351=0",
-"0*2352=0",
-"0*2353=0",
-"0*2354=0",
-"0*2355=0",
-"0*2356=0",
-"0*2357=0",
-"0*2358=0",
-"0*2359=0",
-"0*2360=0",
-"0*2361=0",
-"0*2362=0",
-"0*2363=0",
-"0*2364=0",
-"0*2365=0",
-"0*2366=0",
-"0*2367=0",
-"0*2368=0",
-"0*2369=0",
-"0*2370=0",
-"0*2371=0",
-"0*2372=0",
-"0*2373=0",
-"0*2374=0",
-"0*2375=0",
-"0*2376=0",
-"0*2377=0",
-"0*2378=0",
-"0*2379=0",
-"0*2380=0",
-"0*2381=0",
-"0*2382=0",
-"0*2383=0",
-"0*2384=0",
-"0*2385=0",
-"0*2386=0",
-"0*2387=0",
-"0*2388=0",
-"0*2389=0",
-"0*2390=0",
-"0*2391=0",
-"0*2392=0",
-"0*2393=0",
-"0*2394=0",
-"0*2395=0",
-"0*2396=0",
-"0*2397=0",
-"0*2398=0",
-"0*2399=0",
-"0*23+0=0",
-"0*23+1=1",
-"0*23+2=2",
-"0*23+3=3",
-"0*23+4=4",
-"0*23+5=5",
-"0*23+6=6",
-"0*23+7=7",
-"0*23+8=8",
-"0*23+9=9",
-"0*23-0=0",
-"0*23*0=0",
-"0*23*1=0",
-"0*23*2=0",
-"0*23*3=0",
-"0*23*4=0",
-"0*23*5=0",
-"0*23*6=0",
-"0*23*7=0",
-"0*23*8=0",
-"0*23*9=0",
-"0*23/1=0",
-"0*23/2=0",
-"0*23/3=0",
-"0*23/4=0",
-"0*23/5=0",
-"0*23/6=0",
-"0*23/7=0",
-"0*23/8=0",
-"0*23/9=0",
-"0*2400=0",
-"0*2401=0",
-"0*2402=0",
-"0*2403=0",
-"0*2404=0",
-"0*2405=0",
-"0*2406=0",
-"0*2407=0",
-"0*2408=0",
-"0*2409=0",
-"0*2410=0",
-"0*2411=0",
-"0*2412=0",
-"0*2413=0",
-"0*2414=0",
-"0*2415=0",
-"0*2416=0",
-"0*2417=0",
-"0*2418=0",
-"0*2419=0",
-"0*2420=0",
-"0*2421=0",
-"0*2422=0",
-"0*2423=0",
-"0*2424=0",
-"0*2425=0",
-"0*2426=0",
-"0*2427=0",
-"0*2428=0",
-"0*2429=0",
-"0*2430=0",
-"0*2431=0",
-"0*2432=0",
-"0*2433=0",
-"0*2434=0",
-"0*2435=0",
-"0*2436=0",
-"0*2437=0",
-"0*2438=0",
-"0*2439=0",
-"0*2440=0",
-"0*2441=0",
-"0*2442=0",
-"0*2443=0",
-"0*2444=0",
-"0*2445=0",
-"0*2446=0",
-"0*2447=0",
-"0*2448=0",
-"0*2449=0",
-"0*2450=0",
-"0*2451=0",
-"0*2452=0",
-"0*2453=0",
-"0*2454=0",
-"0*2455=0",
-"0*2456=0",
-"0*2457=0",
-"0*2458=0",
-"0*2459=0",
-"0*2460=0",
-"0*2461=0",
-"0*2462=0",
-"0*2463=0",
-"0*2464=0",
-"0*2465=0",
-"0*2466=0",
-"0*2467=0",
-"0*2468=0",
-"0*2469=0",
-"0*2470=0",
-"0*2471=0",
-"0*2472=0",
-"0*2473=0",
-"0*2474=0",
-"0*2475=0",
-"0*2476=0",
-"0*2477=0",
-"0*2478=0",
-"0*2479=0",
-"0*2480=0",
-"0*2481=0",
-"0*2482=0",
-"0*2483=0",
-"0*2484=0",
-"0*2485=0",
-"0*2486=0",
-"0*2487=0",
-"0*2488=0",
-"0*2489=0",
-"0*2490=0",
-"0*2491=0",
-"0*2492=0",
-"0*2493=0",
-"0*2494=0",
-"0*2495=0",
-"0*2496=0",
-"0*2497=0",
-"0*2498=0",
-"0*2499=0",
-"0*24+0=0",
-"0*24+1=1",
-"0*24+2=2",
-"0*24+3=3",
-"0*24+4=4",
-"0*24+5=5",
-"0*24+6=6",
-"0*24+7=7",
-"0*24+8=8",
-"0*24+9=9",
-"0*24-0=0",
-"0*24*0=0",
-"0*24*1=0",
-"0*24*2=0",
-"0*24*3=0",
-"0*24*4=0",
-"0*24*5=0",
-"0*24*6=0",
-"0*24*7=0",
-"0*24*8=0",
-"0*24*9=0",
-"0*24/1=0",
-"0*24/2=0",
-"0*24/3=0",
-"0*24/4=0",
-"0*24/5=0",
-"0*24/6=0",
-"0*24/7=0",
-"0*24/8=0",
-"0*24/9=0",
-"0*2500=0",
-"0*2501=0",
-"0*2502=0",
-"0*2503=0",
-"0*2504=0",
-"0*2505=0",
-"0*2506=0",
-"0*2507=0",
-"0*2508=0",
-"0*2509=0",
-"0*2510=0",
-"0*2511=0",
-"0*2512=0",
-"0*2513=0",
-"0*2514=0",
-"0*2515=0",
-"0*2516=0",
-"0*2517=0",
-"0*2518=0",
-"0*2519=0",
-"0*2520=0",
-"0*2521=0",
-"0*2522=0",
-"0*2523=0",
-"0*2524=0",
-"0*2525=0",
-"0*2526=0",
-"0*2527=0",
-"0*2528=0",
-"0*2529=0",
-"0*2530=0",
-"0*2531=0",
-"0*2532=0",
-"0*2533=0",
-"0*2534=0",
-"0*2535=0",
-"0*2536=0",
-"0*2537=0",
-"0*2538=0",
-"0*2539=0",
-"0*2540=0",
-"0*2541=0",
-"0*2542=0",
-"0*2543=0",
-"0*2544=0",
-"0*2545=0",
-"0*2546=0",
-"0*2547=0",
-"0*2548=0",
-"0*2549=0",
-"0*2550=0",
-"0*2551=0",
-"0*2552=0",
-"0*2553=0",
-"0*2554=0",
-"0*2555=0",
-"0*2556=0",
-"0*2557=0",
-"0*2558=0",
-"0*2559=0",
-"0*2560=0",
-"0*2561=0",
-"0*2562=0",
-"0*2563=0",
-"0*2564=0",
-"0*2565=0",
-"0*2566=0",
-"0*2567=0",
-"0*2568=0",
-"0*2569=0",
-"0*2570=0",
-"0*2571=0",
-"0*2572=0",
-"0*2573=0",
-"0*2574=0",
-"0*2575=0",
-"0*2576=0",
-"0*2577=0",
-"0*2578=0",
-"0*2579=0",
-"0*2580=0",
-"0*2581=0",
-"0*2582=0",
-"0*2583=0",
-"0*2584=0",
-"0*2585=0",
-"0*2586=0",
-"0*2587=0",
-"0*2588=0",
-"0*2589=0",
-"0*2590=0",
-"0*2591=0",
-"0*2592=0",
-"0*2593=0",
-"0*2594=0",
-"0*2595=0",
-"0*2596=0",
-"0*2597=0",
-"0*2598=0",
-"0*2599=0",
-"0*25+0=0",
-"0*25+1=1",
-"0*25+2=2",
-"0*25+3=3",
-"0*25+4=4",
-"0*25+5=5",
-"0*25+6=6",
-"0*25+7=7",
-"0*25+8=8",
-"0*25+9=9",
-"0*25-0=0",
-"0*25*0=0",
-"0*25*1=0",
-"0*25*2=0",
-"0*25*3=0",
-"0*25*4=0",
-"0*25*5=0",
-"0*25*6=0",
-"0*25*7=0",
-"0*25*8=0",
-"0*25*9=0",
-"0*25/1=0",
-"0*25/2=0",
-"0*25/3=0",
-"0*25/4=0",
-"0*25/5=0",
-"0*25/6=0",
-"0*25/7=0",
-"0*25/8=0",
-"0*25/9=0",
-"0*2600=0",
-"0*2601=0",
-"0*2602=0",
-"0*2603=0",
-"0*2604=0",
-"0*2605=0",
-"0*2606=0",
-"0*2607=0",
-"0*2608=0",
-"0*2609=0",
-"0*2610=0",
-"0*2611=0",
-"0*2612=0",
-"0*2613=0",
-"0*2614=0",
-"0*2615=0",
-"0*2616=0",
-"0*2617=0",
-"0*2618=0",
-"0*2619=0",
-"0*2620=0",
-"0*2621=0",
-"0*2622=0",
-"0*2623=0",
-"0*2624=0",
-"0*2625=0",
-"0*2626=0",
-"0*2627=0",
-"0*2628=0",
-"0*2629=0",
-"0*2630=0",
-"0*2631=0",
-"0*2632=0",
-"0*2633=0",
-"0*2634=0",
-"0*2635=0",
-"0*2636=0",
-"0*2637=0",
-"0*2638=0",
-"0*2639=0",
-"0*2640=0",
-"0*2641=0",
-"0*2642=0",
-"0*2643=0",
-"0*2644=0",
-"0*2645=0",
-"0*2646=0",
-"0*2647=0",
-"0*2648=0",
-"0*2649=0",
-"0*2650=0",
-"0*2651=0",
-"0*2652=0",
-"0*2653=0",
-"0*2654=0",
-"0*2655=0",
-"0*2656=0",
-"0*2657=0",
-"0*2658=0",
-"0*2659=0",
-"0*2660=0",
-"0*2661=0",
-"0*2662=0",
-"0*2663=0",
-"0*2664=0",
-"0*2665=0",
-"0*2666=0",
-"0*2667=0",
-"0*2668=0",
-"0*2669=0",
-"0*2670=0",
-"0*2671=0",
-"0*2672=0",
-"0*2673=0",
-"0*2674=0",
-"0*2675=0",
-"0*2676=0",
-"0*2677=0",
-"0*2678=0",
-"0*2679=0",
-"0*2680=0",
-"0*2681=0",
-"0*2682=0",
-"0*2683=0",
-"0*2684=0",
-"0*2685=0",
-"0*2686=0",
-"0*2687=0",
-"0*2688=0",
-"0*2689=0",
-"0*2690=0",
-"0*2691=0",
-"0*2692=0",
-"0*2693=0",
-"0*2694=0",
-"0*2695=0",
-"0*2696=0",
-"0*2697=0",
-"0*2698=0",
-"0*2699=0",
-"0*26+0=0",
-"0*26+1=1",
-"0*26+2=2",
-"0*26+3=3",
-"0*26+4=4",
-"0*26+5=5",
-"0*26+6=6",
-"0*26+7=7",
-"0*26+8=8",
-"0*26+9=9",
-"0*26-0=0",
-"0*26*0=0",
-"0*26*1=0",
-"0*26*2=0",
-"0*26*3=0",
-"0*26*4=0",
-"0*26*5=0",
-"0*26*6=0",
-"0*26*7=0",
-"0*26*8=0",
-"0*26*9=0",
-"0*26/1=0",
-"0*26/2=0",
-"0*26/3=0",
-"0*26/4=0",
-"0*26/5=0",
-"0*26/6=0",
-"0*26/7=0",
-"0*26/8=0",
-"0*26/9=0",
-"0*2700=0",
-"0*2701=0",
-"0*2702=0",
-"0*2703=0",
-"0*2704=0",
-"0*2705=0",
-"0*2706=0",
-"0*2707=0",
-"0*2708=0",
-"0*2709=0",
-"0*2710=0",
-"0*2711=0",
-"0*2712=0",
-"0*2713=0",
-"0*2714=0",
-"0*2715=0",
-"0*2716=0",
-"0*2717=0",
-"0*2718=0",
-"0*2719=0",
-"0*2720=0",
-"0*2721=0",
-"0*2722=0",
-"0*2723=0",
-"0*2724=0",
-"0*2725=0",
-"0*2726=0",
-"0*2727=0",
-"0*2728=0",
-"0*2729=0",
-"0*2730=0",
-"0*2731=0",
-"0*2732=0",
-"0*2733=0",
-"0*2734=0",
-"0*2735=0",
-"0*2736=0",
-"0*2737=0",
-"0*2738=0",
-"0*2739=0",
-"0*2740=0",
-"0*2741=0",
-"0*2742=0",
-"0*2743=0",
-"0*2744=0",
-"0*2745=0",
-"0*2746=0",
-"0*2747=0",
-"0*2748=0",
-"0*2749=0",
-"0*2750=0",
-"0*2751=0",
-"0*2752=0",
-"0*2753=0",
-"0*2754=0",
-"0*2755=0",
-"0*2756=0",
-"0*2757=0",
-"0*2758=0",
-"0*2759=0",
-"0*2760=0",
-"0*2761=0",
-"0*2762=0",
-"0*2763=0",
-"0*2764=0",
-"0*2765=0",
-"0*2766=0",
-"0*2767=0",
-"0*2768=0",
-"0*2769=0",
-"0*2770=0",
-"0*2771=0",
-"0*2772=0",
-"0*2773=0",
-"0*2774=0",
-"0*2775=0",
-"0*2776=0",
-"0*2777=0",
-"0*2778=0",
-"0*2779=0",
-"0*2780=0",
-"0*2781=0",
-"0*2782=0",
-"0*2783=0",
-"0*2784=0",
-"0*2785=0",
-"0*2786=0",
-"0*2787=0",
-"0*2788=0",
-"0*2789=0",
-"0*2790=0",
-"0*2791=0",
-"0*2792=0",
-"0*2793=0",
-"0*2794=0",
-"0*2795=0",
-"0*2796=0",
-"0*2797=0",
-"0*2798=0",
-"0*2799=0",
-"0*27+0=0",
-"0*27+1=1",
-"0*27+2=2",
-"0*27+3=3",
-"0*27+4=4",
-"0*27+5=5",
-"0*27+6=6",
-"0*27+7=7",
-"0*27+8=8",
-"0*27+9=9",
-"0*27-0=0",
-"0*27*0=0",
-"0*27*1=0",
-"0*27*2=0",
-"0*27*3=0",
-"0*27*4=0",
-"0*27*5=0",
-"0*27*6=0",
-"0*27*7=0",
-"0*27*8=0",
-"0*27*9=0",
-"0*27/1=0",
-"0*27/2=0",
-"0*27/3=0",
-"0*27/4=0",
-"0*27/5=0",
-"0*27/6=0",
-"0*27/7=0",
-"0*27/8=0",
-"0*27/9=0",
-"0*2800=0",
-"0*2801=0",
-"0*2802=0",
-"0*2803=0",
-"0*2804=0",
-"0*2805=0",
-"0*2806=0",
-"0*2807=0",
-"0*2808=0",
-"0*2809=0",
-"0*2810=0",
-"0*2811=0",
-"0*2812=0",
-"0*2813=0",
-"0*2814=0",
-"0*2815=0",
-"0*2816=0",
-"0*2817=0",
-"0*2818=0",
-"0*2819=0",
-"0*2820=0",
-"0*2821=0",
-"0*2822=0",
-"0*2823=0",
-"0*2824=0",
-"0*2825=0",
-"0*2826=0",
-"0*2827=0",
-"0*2828=0",
-"0*2829=0",
-"0*2830=0",
-"0*2831=0",
-"0*2832=0",
-"0*2833=0",
-"0*2834=0",
-"0*2835=0",
-"0*2836=0",
-"0*2837=0",
-"0*2838=0",
-"0*2839=0",
-"0*2840=0",
-"0*2841=0",
-"0*2842=0",
-"0*2843=0",
-"0*2844=0",
-"0*2845=0",
-"0*2846=0",
-"0*2847=0",
-"0*2848=0",
-"0*2849=0",
-"0*2850=0",
-"0*2851=0",
-"0*2852=0",
-"0*2853=0",
-"0*2854=0",
-"0*2855=0",
-"0*2856=0",
-"0*2857=0",
-"0*2858=0",
-"0*2859=0",
-"0*2860=0",
-"0*2861=0",
-"0*2862=0",
-"0*2863=0",
-"0*2864=0",
-"0*2865=0",
-"0*2866=0",
-"0*2867=0",
-"0*2868=0",
-"0*2869=0",
-"0*2870=0",
-"0*2871=0",
-"0*2872=0",
-"0*2873=0",
-"0*2874=0",
-"0*2875=0",
-"0*2876=0",
-"0*2877=0",
-"0*2878=0",
-"0*2879=0",
-"0*2880=0",
-"0*2881=0",
-"0*2882=0",
-"0*2883=0",
-"0*2884=0",
-"0*2885=0",
-"0*2886=0",
-"0*2887=0",
-"0*2888=0",
-"0*2889=0",
-"0*2890=0",
-"0*2891=0",
-"0*2892=0",
-"0*2893=0",
-"0*2894=0",
-"0*2895=0",
-"0*2896=0",
-"0*2897=0",
-"0*2898=0",
-"0*2899=0",
-"0*28+0=0",
-"0*28+1=1",
-"0*28+2=2",
-"0*28+3=3",
-"0*28+4=4",
-"0*28+5=5",
-"0*28+6=6",
-"0*28+7=7",
-"0*28+8=8",
-"0*28+9=9",
-"0*28-0=0",
-"0*28*0=0",
-"0*28*1=0",
-"0*28*2=0",
-"0*28*3=0",
-"0*28*4=0",
-"0*28*5=0",
-"0*28*6=0",
-"0*28*7=0",
-"0*28*8=0",
-"0*28*9=0",
-"0*28/1=0",
-"0*28/2=0",
-"0*28/3=0",
-"0*28/4=0",
-"0*28/5=0",
-"0*28/6=0",
-"0*28/7=0",
-"0*28/8=0",
-"0*28/9=0",
-"0*2900=0",
-"0*2901=0",
-"0*2902=0",
-"0*2903=0",
-"0*2904=0",
-"0*2905=0",
-"0*2906=0",
-"0*2907=0",
-"0*2908=0",
-"0*2909=0",
-"0*2910=0",
-"0*2911=0",
-"0*2912=0",
-"0*2913=0",
-"0*2914=0",
-"0*2915=0",
-"0*2916=0",
-"0*2917=0",
-"0*2918=0",
-"0*2919=0",
-"0*2920=0",
-"0*2921=0",
-"0*2922=0",
-"0*2923=0",
-"0*2924=0",
-"0*2925=0",
-"0*2926=0",
-"0*2927=0",
-"0*2928=0",
-"0*2929=0",
-"0*2930=0",
-"0*2931=0",
-"0*2932=0",
-"0*2933=0",
-"0*2934=0",
-"0*2935=0",
-"0*2936=0",
-"0*2937=0",
-"0*2938=0",
-"0*2939=0",
-"0*2940=0",
-"0*2941=0",
-"0*2942=0",
-"0*2943=0",
-"0*2944=0",
-"0*2945=0",
-"0*2946=0",
-"0*2947=0",
-"0*2948=0",
-"0*2949=0",
-"0*2950=0",
-"0*2951=0",
-"0*2952=0",
-"0*2953=0",
-"0*2954=0",
-"0*2955=0",
-"0*2956=0",
-"0*2957=0",
-"0*2958=0",
-"0*2959=0",
-"0*2960=0",
-"0*2961=0",
-"0*2962=0",
-"0*2963=0",
-"0*2964=0",
-"0*2965=0",
-"0*2966=0",
-"0*2967=0",
-"0*2968=0",
-"0*2969=0",
-"0*2970=0",
-"0*2971=0",
-"0*2972=0",
-"0*2973=0",
-"0*2974=0",
-"0*2975=0",
-"0*2976=0",
-"0*2977=0",
-"0*2978=0",
-"0*2979=0",
-"0*2980=0",
-"0*2981=0",
-"0*2982=0",
-"0*2983=0",
-"0*2984=0",
-"0*2985=0",
-"0*2986=0",
-"0*2987=0",
-"0*2988=0",
-"0*2989=0",
-"0*2990=0",
-"0*2991=0",
-"0*2992=0",
-"0*2993=0",
-"0*2994=0",
-"0*2995=0",
-"0*2996=0",
-"0*2997=0",
-"0*2998=0",
-"0*2999=0",
-"0*29+0=0",
-"0*29+1=1",
-"0*29+2=2",
-"0*29+3=3",
-"0*29+4=4",
-"0*29+5=5",
-"0*29+6=6",
-"0*29+7=7",
-"0*29+8=8",
-"0*29+9=9",
-"0*29-0=0",
-"0*29*0=0",
-"0*29*1=0",
-"0*29*2=0",
-"0*29*3=0",
-"0*29*4=0",
-"0*29*5=0",
-"0*29*6=0",
-"0*29*7=0",
-"0*29*8=0",
-"0*29*9=0",
-"0*29/1=0",
-"0*29/2=0",
-"0*29/3=0",
-"0*29/4=0",
-"0*29/5=0",
-"0*29/6=0",
-"0*29/7=0",
-"0*29/8=0",
-"0*29/9=0",
-"0*2-1=-1",
-"0*2-2=-2",
-"0*2-3=-3",
-"0*2-4=-4",
-"0*2-5=-5",
-"0*2-6=-6",
-"0*2-7=-7",
-"0*2-8=-8",
-"0*2-9=-9",
-"0*2*10=0",
-"0*2*11=0",
-"0*2*12=0",
-"0*2*13=0",
-"0*2*14=0",
-"0*2*15=0",
-"0*2*16=0",
-"0*2*17=0",
-"0*2*18=0",
-"0*2*19=0",
-"0*2*20=0",
-"0*2*21=0",
-"0*2*22=0",
-"0*2*23=0",
-"0*2*24=0",
-"0*2*25=0",
-"0*2*26=0",
-"0*2*27=0",
-"0*2*28=0",
-"0*2*29=0",
-"0*2*30=0",
-"0*2*31=0",
-"0*2*32=0",
-"0*2*33=0",
-"0*2*34=0",
-"0*2*35=0",
-"0*2*36=0",
-"0*2*37=0",
-"0*2*38=0",
-"0*2*39=0",
-"0*2*40=0",
-"0*2*41=0",
-"0*2*42=0",
-"0*2*43=0",
-"0*2*44=0",
-"0*2*45=0",
-"0*2*46=0",
-"0*2*47=0",
-"0*2*48=0",
-"0*2*49=0",
-"0*2*50=0",
-"0*2*51=0",
-"0*2*52=0",
-"0*2*53=0",
-"0*2*54=0",
-"0*2*55=0",
-"0*2*56=0",
-"0*2*57=0",
-"0*2*58=0",
-"0*2*59=0",
-"0*2*60=0",
-"0*2*61=0",
-"0*2*62=0",
-"0*2*63=0",
-"0*2*64=0",
-"0*2*65=0",
-"0*2*66=0",
-"0*2*67=0",
-"0*2*68=0",
-"0*2*69=0",
-"0*2*70=0",
-"0*2*71=0",
-"0*2*72=0",
-"0*2*73=0",
-"0*2*74=0",
-"0*2*75=0",
-"0*2*76=0",
-"0*2*77=0",
-"0*2*78=0",
-"0*2*79=0",
-"0*2*80=0",
-"0*2*81=0",
-"0*2*82=0",
-"0*2*83=0",
-"0*2*84=0",
-"0*2*85=0",
-"0*2*86=0",
-"0*2*87=0",
-"0*2*88=0",
-"0*2*89=0",
-"0*2*90=0",
-"0*2*91=0",
-"0*2*92=0",
-"0*2*93=0",
-"0*2*94=0",
-"0*2*95=0",
-"0*2*96=0",
-"0*2*97=0",
-"0*2*98=0",
-"0*2*99=0",
-"0*2/10=0",
-"0*2/11=0",
-"0*2/12=0",
-"0*2/13=0",
-"0*2/14=0",
-"0*2/15=0",
-"0*2/16=0",
-"0*2/17=0",
-"0*2/18=0",
-"0*2/19=0",
-"0*2/20=0",
-"0*2/21=0",
-"0*2/22=0",
-"0*2/23=0",
-"0*2/24=0",
-"0*2/25=0",
-"0*2/26=0",
-"0*2/27=0",
-"0*2/28=0",
-"0*2/29=0",
-"0*2/30=0",
-"0*2/31=0",
-"0*2/32=0",
-"0*2/33=0",
-"0*2/34=0",
-"0*2/35=0",
-"0*2/36=0",
-"0*2/37=0",
-"0*2/38=0",
-"0*2/39=0",
-"0*2/40=0",
-"0*2/41=0",
-"0*2/42=0",
-"0*2/43=0",
-"0*2/44=0",
-"0*2/45=0",
-"0*2/46=0",
-"0*2/47=0",
-"0*2/48=0",
-"0*2/49=0",
-"0*2/50=0",
-"0*2/51=0",
-"0*2/52=0",
-"0*2/53=0",
-"0*2/54=0",
-"0*2/55=0",
-"0*2/56=0",
-"0*2/57=0",
-"0*2/58=0",
-"0*2/59=0",
-"0*2/60=0",
-"0*2/61=0",
-"0*2/62=0",
-"0*2/63=0",
-"0*2/64=0",
-"0*2/65=0",
-"0*2/66=0",
-"0*2/67=0",
-"0*2/68=0",
-"0*2/69=0",
-"0*2/70=0",
-"0*2/71=0",
-"0*2/72=0",
-"0*2/73=0",
-"0*2/74=0",
-"0*2/75=0",
-"0*2/76=0",
-"0*2/77=0",
-"0*2/78=0",
-"0*2/79=0",
-"0*2/80=0",
-"0*2/81=0",
-"0*2/82=0",
-"0*2/83=0",
-"0*2/84=0",
-"0*2/85=0",
-"0*2/86=0",
-"0*2/87=0",
-"0*2/88=0",
-"0*2/89=0",
-"0*2/90=0",
-"0*2/91=0",
-"0*2/92=0",
-"0*2/93=0",
-"0*2/94=0",
-"0*2/95=0",
-"0*2/96=0",
-"0*2/97=0",
-"0*2/98=0",
-"0*2/99=0",
-"0*3000=0",
-"0*3001=0",
-"0*3002=0",
-"0*3003=0",
-"0*3004=0",
-"0*3005=0",
-"0*3006=0",
-"0*3007=0",
-"0*3008=0",
-"0*3009=0",
-"0*3010=0",
-"0*3011=0",
-"0*3012=0",
-"0*3013=0",
-"0*3014=0",
-"0*3015=0",
-"0*3016=0",
-"0*3017=0",
-"0*3018=0",
-"0*3019=0",
-"0*3020=0",
-"0*3021=0",
-"0*3022=0",
-"0*3023=0",
-"0*3024=0",
-"0*3025=0",
-"0*3026=0",
-"0*3027=0",
-"0*3028=0",
-"0*3029=0",
-"0*3030=0",
-"0*3031=0",
-"0*3032=0",
-"0*3033=0",
-"0*3034=0",
-"0*3035=0",
-"0*3036=0",
-"0*3037=0",
-"0*3038=0",
-"0*3039=0",
-"0*3040=0",
-"0*3041=0",
-"0*3042=0",
-"0*3043=0",
-"0*3044=0",
-"0*3045=0",
-"0*3046=0",
-"0*3047=0",
-"0*3048=0",
-"0*3049=0",
-"0*3050=0",
-"0*3051=0",
-"0*3052=0",
-"0*3053=0",
-"0*3054=0",
-"0*3055=0",
-"0*3056=0",
-"0*3057=0",
-"0*3058=0",
-"0*3059=0",
-"0*3060=0",
-"0*3061=0",
-"0*3062=0",
-"0*3063=0",
-"0*3064=0",
-"0*3065=0",
-"0*3066=0",
-"0*3067=0",
-"0*3068=0",
-"0*3069=0",
-"0*3070=0",
-"0*3071=0",
-"0*3072=0",
-"0*3073=0",
-"0*3074=0",
-"0*3075=0",
-"0*3076=0",
-"0*3077=0",
-"0*3078=0",
-"0*3079=0",
-"0*3080=0",
-"0*3081=0",
-"0*3082=0",
-"0*3083=0",
-"0*3084=0",
-"0*3085=0",
-"0*3086=0",
-"0*3087=0",
-"0*3088=0",
-"0*3089=0",
-"0*3090=0",
-"0*3091=0",
-"0*3092=0",
-"0*3093=0",
-"0*3094=0",
-"0*3095=0",
-"0*3096=0",
-"0*3097=0",
-"0*3098=0",
-"0*3099=0",
-"0*30+0=0",
-"0*30+1=1",
-"0*30+2=2",
-"0*30+3=3",
-"0*30+4=4",
-"0*30+5=5",
-"0*30+6=6",
-"0*30+7=7",
-"0*30+8=8",
-"0*30+9=9",
-"0*30-0=0",
-"0*30*0=0",
-"0*30*1=0",
-"0*30*2=0",
-"0*30*3=0",
-"0*30*4=0",
-"0*30*5=0",
-"0*30*6=0",
-"0*30*7=0",
-"0*30*8=0",
-"0*30*9=0",
-"0*30/1=0",
-"0*30/2=0",
-"0*30/3=0",
-"0*30/4=0",
-"0*30/5=0",
-"0*30/6=0",
-"0*30/7=0",
-"0*30/8=0",
-"0*30/9=0",
-"0*3100=0",
-"0*3101=0",
-"0*3102=0",
-"0*3103=0",
-"0*3104=0",
-"0*3105=0",
-"0*3106=0",
-"0*3107=0",
-"0*3108=0",
-"0*3109=0",
-"0*3110=0",
-"0*3111=0",
-"0*3112=0",
-"0*3113=0",
-"0*3114=0",
-"0*3115=0",
-"0*3116=0",
-"0*3117=0",
-"0*3118=0",
-"0*3119=0",
-"0*3120=0",
-"0*3121=0",
-"0*3122=0",
-"0*3123=0",
-"0*3124=0",
-"0*3125=0",
-"0*3126=0",
-"0*3127=0",
-"0*3128=0",
-"0*3129=0",
-"0*3130=0",
-"0*3131=0",
-"0*3132=0",
-"0*3133=0",
-"0*3134=0",
-"0*3135=0",
-"0*3136=0",
-"0*3137=0",
-"0*3138=0",
-"0*3139=0",
-"0*3140=0",
-"0*3141=0",
-"0*3142=0",
-"0*3143=0",
-"0*3144=0",
-"0*3145=0",
-"0*3146=0",
-"0*3147=0",
-"0*3148=0",
-"0*3149=0",
-"0*3150=0",
-"0*3151=0",
-"0*3152=0",
-"0*3153=0",
-"0*3154=0",
-"0*3155=0",
-"0*3156=0",
-"0*3157=0",
-"0*3158=0",
-"0*3159=0",
-"0*3160=0",
-"0*3161=0",
-"0*3162=0",
-"0*3163=0",
-"0*3164=0",
-"0*3165=0",
-"0*3166=0",
-"0*3167=0",
-"0*3168=0",
-"0*3169=0",
-"0*3170=0",
-"0*3171=0",
-"0*3172=0",
-"0*3173=0",
-"0*3174=0",
-"0*3175=0",
-"0*3176=0",
-"0*3177=0",
-"0*3178=0",
-"0*3179=0",
-"0*3180=0",
-"0*3181=0",
-"0*3182=0",
-"0*3183=0",
-"0*3184=0",
-"0*3185=0",
-"0*3186=0",
-"0*3187=0",
-"0*3188=0",
-"0*3189=0",
-"0*3190=0",
-"0*3191=0",
-"0*3192=0",
-"0*3193=0",
-"0*3194=0",
-"0*3195=0",
-"0*3196=0",
-"0*3197=0",
-"0*3198=0",
-"0*3199=0",
-"0*31+0=0",
-"0*31+1=1",
-"0*31+2=2",
-"0*31+3=3",
-"0*31+4=4",
-"0*31+5=5",
-"0*31+6=6",
-"0*31+7=7",
-"0*31+8=8",
-"0*31+9=9",
-"0*31-0=0",
-"0*31*0=0",
-"0*31*1=0",
-"0*31*2=0",
-"0*31*3=0",
-"0*31*4=0",
-"0*31*5=0",
-"0*31*6=0",
-"0*31*7=0",
-"0*31*8=0",
-"0*31*9=0",
-"0*31/1=0",
-"0*31/2=0",
-"0*31/3=0",
-"0*31/4=0",
-"0*31/5=0",
-"0*31/6=0",
-"0*31/7=0",
-"0*31/8=0",
-"0*31/9=0",
-"0*3200=0",
-"0*3201=0",
-"0*3202=0",
-"0*3203=0",
-"0*3204=0",
-"0*3205=0",
-"0*3206=0",
-"0*3207=0",
-"0*3208=0",
-"0*3209=0",
-"0*3210=0",
-"0*3211=0",
-"0*3212=0",
-"0*3213=0",
-"0*3214=0",
-"0*3215=0",
-"0*3216=0",
-"0*3217=0",
-"0*3218=0",
-"0*3219=0",
-"0*3220=0",
-"0*3221=0",
-"0*3222=0",
-"0*3223=0",
-"0*3224=0",
-"0*3225=0",
-"0*3226=0",
-"0*3227=0",
-"0*3228=0",
-"0*3229=0",
-"0*3230=0",
-"0*3231=0",
-"0*3232=0",
-"0*3233=0",
-"0*3234=0",
-"0*3235=0",
-"0*3236=0",
-"0*3237=0",
-"0*3238=0",
-"0*3239=0",
-"0*3240=0",
-"0*3241=0",
-"0*3242=0",
-"0*3243=0",
-"0*3244=0",
-"0*3245=0",
-"0*3246=0",
-"0*3247=0",
-"0*3248=0",
-"0*3249=0",
-"0*3250=0",
-"0*3251=0",
-"0*3252=0",
-"0*3253=0",
-"0*3254=0",
-"0*3255=0",
-"0*3256=0",
-"0*3257=0",
-"0*3258=0",
-"0*3259=0",
-"0*3260=0",
-"0*3261=0",
-"0*3262=0",
-"0*3263=0",
-"0*3264=0",
-"0*3265=0",
-"0*3266=0",
-"0*3267=0",
-"0*3268=0",
-"0*3269=0",
-"0*3270=0",
-"0*3271=0",
-"0*3272=0",
-"0*3273=0",
-"0*3274=0",
-"0*3275=0",
-"0*3276=0",
-"0*3277=0",
-"0*3278=0",
-"0*3279=0",
-"0*3280=0",
-"0*3281=0",
-"0*3282=0",
-"0*3283=0",
-"0*3284=0",
-"0*3285=0",
-"0*3286=0",
-"0*3287=0",
-"0*3288=0",
-"0*3289=0",
-"0*3290=0",
-"0*3291=0",
-"0*3292=0",
-"0*3293=0",
-"0*3294=0",
-"0*3295=0",
-"0*3296=0",
-"0*3297=0",
-"0*3298=0",
-"0*3299=0",
-"0*32+0=0",
-"0*32+1=1",
-"0*32+2=2",
-"0*32+3=3",
-"0*32+4=4",
-"0*32+5=5",
-"0*32+6=6",
-"0*32+7=7",
-"0*32+8=8",
-"0*32+9=9",
-"0*32-0=0",
-"0*32*0=0",
-"0*32*1=0",
-"0*32*2=0",
-"0*32*3=0",
-"0*32*4=0",
-"0*32*5=0",
-"0*32*6=0",
-"0*32*7=0",
-"0*32*8=0",
-"0*32*9=0",
-"0*32/1=0",
-"0*32/2=0",
-"0*32/3=0",
-"0*32/4=0",
-"0*32/5=0",
-"0*32/6=0",
-"0*32/7=0",
-"0*32/8=0",
-"0*32/9=0",
-"0*3300=0",
-"0*3301=0",
-"0*3302=0",
-"0*3303=0",
-"0*3304=0",
-"0*3305=0",
-"0*3306=0",
-"0*3307=0",
-"0*3308=0",
-"0*3309=0",
-"0*3310=0",
-"0*3311=0",
-"0*3312=0",
-"0*3313=0",
-"0*3314=0",
-"0*3315=0",
-"0*3316=0",
-"0*3317=0",
-"0*3318=0",
-"0*3319=0",
-"0*3320=0",
-"0*3321=0",
-"0*3322=0",
-"0*3323=0",
-"0*3324=0",
-"0*3325=0",
-"0*3326=0",
-"0*3327=0",
-"0*3328=0",
-"0*3329=0",
-"0*3330=0",
-"0*3331=0",
-"0*3332=0",
-"0*3333=0",
-"0*3334=0",
-"0*3335=0",
-"0*3336=0",
-"0*3337=0",
-"0*3338=0",
-"0*3339=0",
-"0*3340=0",
-"0*3341=0",
-"0*3342=0",
-"0*3343=0",
-"0*3344=0",
-"0*3345=0",
-"0*3346=0",
-"0*3347=0",
-"0*3348=0",
-"0*3349=0",
-"0*3350=0",
-"0*3351=0",
-"0*3352=0",
-"0*3353=0",
-"0*3354=0",
-"0*3355=0",
-"0*3356=0",
-"0*3357=0",
-"0*3358=0",
-"0*3359=0",
-"0*3360=0",
-"0*3361=0",
-"0*3362=0",
-"0*3363=0",
-"0*3364=0",
-"0*3365=0",
-"0*3366=0",
-"0*3367=0",
-"0*3368=0",
-"0*3369=0",
-"0*3370=0",
-"0*3371=0",
-"0*3372=0",
-"0*3373=0",
-"0*3374=0",
-"0*3375=0",
-"0*3376=0",
-"0*3377=0",
-"0*3378=0",
-"0*3379=0",
-"0*3380=0",
-"0*3381=0",
-"0*3382=0",
-"0*3383=0",
-"0*3384=0",
-"0*3385=0",
-"0*3386=0",
-"0*3387=0",
-"0*3388=0",
-"0*3389=0",
-"0*3390=0",
-"0*3391=0",
-"0*3392=0",
-"0*3393=0",
-"0*3394=0",
-"0*3395=0",
-"0*3396=0",
-"0*3397=0",
-"0*3398=0",
-"0*3399=0",
-"0*33+0=0",
-"0*33+1=1",
-"0*33+2=2",
-"0*33+3=3",
-"0*33+4=4",
-"0*33+5=5",
-"0*33+6=6",
-"0*33+7=7",
-"0*33+8=8",
-"0*33+9=9",
-"0*33-0=0",
-"0*33*0=0",
-"0*33*1=0",
-"0*33*2=0",
-"0*33*3=0",
-"0*33*4=0",
-"0*33*5=0",
-"0*33*6=0",
-"0*33*7=0",
-"0*33*8=0",
-"0*33*9=0",
-"0*33/1=0",
-"0*33/2=0",
-"0*33/3=0",
-"0*33/4=0",
-"0*33/5=0",
-"0*33/6=0",
-"0*33/7=0",
-"0*33/8=0",
-"0*33/9=0",
-"0*3400=0",
-"0*3401=0",
-"0*3402=0",
-"0*3403=0",
-"0*3404=0",
-"0*3405=0",
-"0*3406=0",
-"0*3407=0",
-"0*3408=0",
-"0*3409=0",
-"0*3410=0",
-"0*3411=0",
-"0*3412=0",
-"0*3413=0",
-"0*3414=0",
-"0*3415=0",
-"0*3416=0",
-"0*3417=0",
-"0*3418=0",
-"0*3419=0",
-"0*3420=0",
-"0*3421=0",
-"0*3422=0",
-"0*3423=0",
-"0*3424=0",
-"0*3425=0",
-"0*3426=0",
-"0*3427=0",
-"0*3428=0",
-"0*3429=0",
-"0*3430=0",
-"0*3431=0",
-"0*3432=0",
-"0*3433=0",
-"0*3434=0",
-"0*3435=0",
-"0*3436=0",
-"0*3437=0",
-"0*3438=0",
-"0*3439=0",
-"0*3440=0",
-"0*3441=0",
-"0*3442=0",
-"0*3443=0",
-"0*3444=0",
-"0*3445=0",
-"0*3446=0",
-"0*3447=0",
-"0*3448=0",
-"0*3449=0",
-"0*3450=0",
-"0*3451=0",
-"0*3452=0",
-"0*3453=0",
-"0*3454=0",
-"0*3455=0",
-"0*3456=0",
-"0*3457=0",
-"0*3458=0",
-"0*3459=0",
-"0*3460=0",
-"0*3461=0",
-"0*3462=0",
-"0*3463=0",
-"0*3464=0",
-"0*3465=0",
-"0*3466=0",
-"0*3467=0",
-"0*3468=0",
-"0*3469=0",
-"0*3470=0",
-"0*3471=0",
-"0*3472=0",
-"0*3473=0",
-"0*3474=0",
-"0*3475=0",
-"0*3476=0",
-"0*3477=0",
-"0*3478=0",
-"0*3479=0",
-"0*3480=0",
-"0*3481=0",
-"0*3482=0",
-"0*3483=0",
-"0*3484=0",
-"0*3485=0",
-"0*3486=0",
-"0*3487=0",
-"0*3488=0",
-"0*3489=0",
-"0*3490=0",
-"0*3491=0",
-"0*3492=0",
-"0*3493=0",
-"0*3494=0",
-"0*3495=0",
-"0*3496=0",
-"0*3497=0",
-"0*3498=0",
-"0*3499=0",
-"0*34+0=0",
-"0*34+1=1",
-"0*34+2=2",
-"0*34+3=3",
-"0*34+4=4",
-"0*34+5=5",
-"0*34+6=6",
-"0*34+7=7",
-"0*34+8=8",
-"0*34+9=9",
-"0*34-0=0",
-"0*34*0=0",
-"0*34*1=0",
-"0*34*2=0",
-"0*34*3=0",
-"0*34*4=0",
-"0*34*5=0",
-"0*34*6=0",
-"0*34*7=0",
-"0*34*8=0",
-"0*34*9=0",
-"0*34/1=0",
-"0*34/2=0",
-"0*34/3=0",
-"0*34/4=0",
-"0*34/5=0",
-"0*34/6=0",
-"0*34/7=0",
-"0*34/8=0",
-"0*34/9=0",
-"0*3500=0",
-"0*3501=0",
-"0*3502=0",
-"0*3503=0",
-"0*3504=0",
-"0*3505=0",
-"0*3506=0",
-"0*3507=0",
-"0*3508=0",
-"0*3509=0",
-"0*3510=0",
-"0*3511=0",
-"0*3512=0",
-"0*3513=0",
-"0*3514=0",
-"0*3515=0",
-"0*3516=0",
-"0*3517=0",
-"0*3518=0",
-"0*3519=0",
-"0*3520=0",
-"0*3521=0",
-"0*3522=0",
-"0*3523=0",
-"0*3524=0",
-"0*3525=0",
-"0*3526=0",
-"0*3527=0",
-"0*3528=0",
-"0*3529=0",
-"0*3530=0",
-"0*3531=0",
-"0*3532=0",
-"0*3533=0",
-"0*3534=0",
-"0*3535=0",
-"0*3536=0",
-"0*3537=0",
-"0*3538=0",
-"0*3539=0",
-"0*3540=0",
-"0*3541=0",
-"0*3542=0",
-"0*3543=0",
-"0*3544=0",
-"0*3545=0",
-"0*3546=0",
-"0*3547=0",
-"0*3548=0",
-"0*3549=0",
-"0*3550=0",
-"0*3551=0",
-"0*3552=0",
-"0*3553=0",
-"0*3554=0",
-"0*3555=0",
-"0*3556=0",
-"0*3557=0",
-"0*3558=0",
-"0*3559=0",
-"0*3560=0",
-"0*3561=0",
-"0*3562=0",
-"0*3563=0",
-"0*3564=0",
-"0*3565=0",
-"0*3566=0",
-"0*3567=0",
-"0*3568=0",
-"0*3569=0",
-"0*3570=0",
-"0*3571=0",
-"0*3572=0",
-"0*3573=0",
-"0*3574=0",
-"0*3575=0",
-"0*3576=0",
-"0*3577=0",
-"0*3578=0",
-"0*3579=0",
-"0*3580=0",
-"0*3581=0",
-"0*3582=0",
-"0*3583=0",
-"0*3584=0",
-"0*3585=0",
-"0*3586=0",
-"0*3587=0",
-"0*3588=0",
-"0*3589=0",
-"0*3590=0",
-"0*3591=0",
-"0*3592=0",
-"0*3593=0",
-"0*3594=0",
-"0*3595=0",
-"0*3596=0",
-"0*3597=0",
-"0*3598=0",
-"0*3599=0",
-"0*35+0=0",
-"0*35+1=1",
-"0*35+2=2",
-"0*35+3=3",
-"0*35+4=4",
-"0*35+5=5",
-"0*35+6=6",
-"0*35+7=7",
-"0*35+8=8",
-"0*35+9=9",
-"0*35-0=0",
-"0*35*0=0",
-"0*35*1=0",
-"0*35*2=0",
-"0*35*3=0",
-"0*35*4=0",
-"0*35*5=0",
-"0*35*6=0",
-"0*35*7=0",
-"0*35*8=0",
-"0*35*9=0",
-"0*35/1=0",
-"0*35/2=0",
-"0*35/3=0",
-"0*35/4=0",
-"0*35/5=0",
-"0*35/6=0",
-"0*35/7=0",
-"0*35/8=0",
-"0*35/9=0",
-"0*3600=0",
-"0*3601=0",
-"0*3602=0",
-"0*3603=0",
-"0*3604=0",
-"0*3605=0",
-"0*3606=0",
-"0*3607=0",
-"0*3608=0",
-"0*3609=0",
-"0*3610=0",
-"0*3611=0",
-"0*3612=0",
-"0*3613=0",
-"0*3614=0",
-"0*3615=0",
-"0*3616=0",
-"0*3617=0",
-"0*3618=0",
-"0*3619=0",
-"0*3620=0",
-"0*3621=0",
-"0*3622=0",
-"0*3623=0",
-"0*3624=0",
-"0*3625=0",
-"0*3626=0",
-"0*3627=0",
-"0*3628=0",
-"0*3629=0",
-"0*3630=0",
-"0*3631=0",
-"0*3632=0",
-"0*3633=0",
-"0*3634=0",
-"0*3635=0",
-"0*3636=0",
-"0*3637=0",
-"0*3638=0",
-"0*3639=0",
-"0*3640=0",
-"0*3641=0",
-"0*3642=0",
-"0*3643=0",
-"0*3644=0",
-"0*3645=0",
-"0*3646=0",
-"0*3647=0",
-"0*3648=0",
-"0*3649=0",
-"0*3650=0",
-"0*3651=0",
-"0*3652=0",
-"0*3653=0",
-"0*3654=0",
-"0*3655=0",
-"0*3656=0",
-"0*3657=0",
-"0*3658=0",
-"0*3659=0",
-"0*3660=0",
-"0*3661=0",
-"0*3662=0",
-"0*3663=0",
-"0*3664=0",
-"0*3665=0",
-"0*3666=0",
-"0*3667=0",
-"0*3668=0",
-"0*3669=0",
-"0*3670=0",
-"0*3671=0",
-"0*3672=0",
-"0*3673=0",
-"0*3674=0",
-"0*3675=0",
-"0*3676=0",
-"0*3677=0",
-"0*3678=0",
-"0*3679=0",
-"0*3680=0",
-"0*3681=0",
-"0*3682=0",
-"0*3683=0",
-"0*3684=0",
-"0*3685=0",
-"0*3686=0",
-"0*3687=0",
-"0*3688=0",
-"0*3689=0",
-"0*3690=0",
-"0*3691=0",
-"0*3692=0",
-"0*3693=0",
-"0*3694=0",
-"0*3695=0",
-"0*3696=0",
-"0*3697=0",
-"0*3698=0",
-"0*3699=0",
-"0*36+0=0",
-"0*36+1=1",
-"0*36+2=2",
-"0*36+3=3",
-"0*36+4=4",
-"0*36+5=5",
-"0*36+6=6",
-"0*36+7=7",
-"0*36+8=8",
-"0*36+9=9",
-"0*36-0=0",
-"0*36*0=0",
-"0*36*1=0",
-"0*36*2=0",
-"0*36*3=0",
-"0*36*4=0",
-"0*36*5=0",
-"0*36*6=0",
-"0*36*7=0",
-"0*36*8=0",
-"0*36*9=0",
-"0*36/1=0",
-"0*36/2=0",
-"0*36/3=0",
-"0*36/4=0",
-"0*36/5=0",
-"0*36/6=0",
-"0*36/7=0",
-"0*36/8=0",
-"0*36/9=0",
-"0*3700=0",
-"0*3701=0",
-"0*3702=0",
-"0*3703=0",
-"0*3704=0",
-"0*3705=0",
-"0*3706=0",
-"0*3707=0",
-"0*3708=0",
-"0*3709=0",
-"0*3710=0",
-"0*3711=0",
-"0*3712=0",
-"0*3713=0",
-"0*3714=0",
-"0*3715=0",
-"0*3716=0",
-"0*3717=0",
-"0*3718=0",
-"0*3719=0",
-"0*3720=0",
-"0*3721=0",
-"0*3722=0",
-"0*3723=0",
-"0*3724=0",
-"0*3725=0",
-"0*3726=0",
-"0*3727=0",
-"0*3728=0",
-"0*3729=0",
-"0*3730=0",
-"0*3731=0",
-"0*3732=0",
-"0*3733=0",
-"0*3734=0",
-"0*3735=0",
-"0*3736=0",
-"0*3737=0",
-"0*3738=0",
-"0*3739=0",
-"0*3740=0",
-"0*3741=0",
-"0*3742=0",
-"0*3743=0",
-"0*3744=0",
-"0*3745=0",
-"0*3746=0",
-"0*3747=0",
-"0*3748=0",
-"0*3749=0",
-"0*3750=0",
-"0*3751=0",
-"0*3752=0",
-"0*3753=0",
-"0*3754=0",
-"0*3755=0",
-"0*3756=0",
-"0*3757=0",
-"0*3758=0",
-"0*3759=0",
-"0*3760=0",
-"0*3761=0",
-"0*3762=0",
-"0*3763=0",
-"0*3764=0",
-"0*3765=0",
-"0*3766=0",
-"0*3767=0",
-"0*3768=0",
-"0*3769=0",
-"0*3770=0",
-"0*3771=0",
-"0*3772=0",
-"0*3773=0",
-"0*3774=0",
-"0*3775=0",
-"0*3776=0",
-"0*3777=0",
-"0*3778=0",
-"0*3779=0",
-"0*3780=0",
-"0*3781=0",
-"0*3782=0",
-"0*3783=0",
-"0*3784=0",
-"0*3785=0",
-"0*3786=0",
-"0*3787=0",
-"0*3788=0",
-"0*3789=0",
-"0*3790=0",
-"0*3791=0",
-"0*3792=0",
-"0*3793=0",
-"0*3794=0",
-"0*3795=0",
-"0*3796=0",
-"0*3797=0",
-"0*3798=0",
-"0*3799=0",
-"0*37+0=0",
-"0*37+1=1",
-"0*37+2=2",
-"0*37+3=3",
-"0*37+4=4",
-"0*37+5=5",
-"0*37+6=6",
-"0*37+7=7",
-"0*37+8=8",
-"0*37+9=9",
-"0*37-0=0",
-"0*37*0=0",
-"0*37*1=0",
-"0*37*2=0",
-"0*37*3=0",
-"0*37*4=0",
-"0*37*5=0",
-"0*37*6=0",
-"0*37*7=0",
-"0*37*8=0",
-"0*37*9=0",
-"0*37/1=0",
-"0*37/2=0",
-"0*37/3=0",
-"0*37/4=0",
-"0*37/5=0",
-"0*37/6=0",
-"0*37/7=0",
-"0*37/8=0",
-"0*37/9=0",
-"0*3800=0",
-"0*3801=0",
-"0*3802=0",
-"0*3803=0",
-"0*3804=0",
-"0*3805=0",
-"0*3806=0",
-"0*3807=0",
-"0*3808=0",
-"0*3809=0",
-"0*3810=0",
-"0*3811=0",
-"0*3812=0",
-"0*3813=0",
-"0*3814=0",
-"0*3815=0",
-"0*3816=0",
-"0*3817=0",
-"0*3818=0",
-"0*3819=0",
-"0*3820=0",
-"0*3821=0",
-"0*3822=0",
-"0*3823=0",
-"0*3824=0",
-"0*3825=0",
-"0*3826=0",
-"0*3827=0",
-"0*3828=0",
-"0*3829=0",
-"0*3830=0",
-"0*3831=0",
-"0*3832=0",
-"0*3833=0",
-"0*3834=0",
-"0*3835=0",
-"0*3836=0",
-"0*3837=0",
-"0*3838=0",
-"0*3839=0",
-"0*3840=0",
-"0*3841=0",
-"0*3842=0",
-"0*3843=0",
-"0*3844=0",
-"0*3845=0",
-"0*3846=0",
-"0*3847=0",
-"0*3848=0",
-"0*3849=0",
-"0*3850=0",
-"0*3851=0",
-"0*3852=0",
-"0*3853=0",
-"0*3854=0",
-"0*3855=0",
-"0*3856=0",
-"0*3857=0",
-"0*3858=0",
-"0*3859=0",
-"0*3860=0",
-"0*3861=0",
-"0*3862=0",
-"0*3863=0",
-"0*3864=0",
-"0*3865=0",
-"0*3866=0",
-"0*3867=0",
-"0*3868=0",
-"0*3869=0",
-"0*3870=0",
-"0*3871=0",
-"0*3872=0",
-"0*3873=0",
-"0*3874=0",
-"0*3875=0",
-"0*3876=0",
-"0*3877=0",
-"0*3878=0",
-"0*3879=0",
-"0*3880=0",
-"0*3881=0",
-"0*3882=0",
-"0*3883=0",
-"0*3884=0",
-"0*3885=0",
-"0*3886=0",
-"0*3887=0",
-"0*3888=0",
-"0*3889=0",
-"0*3890=0",
-"0*3891=0",
-"0*3892=0",
-"0*3893=0",
-"0*3894=0",
-"0*3895=0",
-"0*3896=0",
-"0*3897=0",
-"0*3898=0",
-"0*3899=0",
-"0*38+0=0",
-"0*38+1=1",
-"0*38+2=2",
-"0*38+3=3",
-"0*38+4=4",
-"0*38+5=5",
-"0*38+6=6",
-"0*38+7=7",
-"0*38+8=8",
-"0*38+9=9",
-"0*38-0=0",
-"0*38*0=0",
-"0*38*1=0",
-"0*38*2=0",
-"0*38*3=0",
-"0*38*4=0",
-"0*38*5=0",
-"0*38*6=0",
-"0*38*7=0",
-"0*38*8=0",
-"0*38*9=0",
-"0*38/1=0",
-"0*38/2=0",
-"0*38/3=0",
-"0*38/4=0",
-"0*38/5=0",
-"0*38/6=0",
-"0*38/7=0",
-"0*38/8=0",
-"0*38/9=0",
-"0*3900=0",
-"0*3901=0",
-"0*3902=0",
-"0*3903=0",
-"0*3904=0",
-"0*3905=0",
-"0*3906=0",
-"0*3907=0",
-"0*3908=0",
-"0*3909=0",
-"0*3910=0",
-"0*3911=0",
-"0*3912=0",
-"0*3913=0",
-"0*3914=0",
-"0*3915=0",
-"0*3916=0",
-"0*3917=0",
-"0*3918=0",
-"0*3919=0",
-"0*3920=0",
-"0*3921=0",
-"0*3922=0",
-"0*3923=0",
-"0*3924=0",
-"0*3925=0",
-"0*3926=0",
-"0*3927=0",
-"0*3928=0",
-"0*3929=0",
-"0*3930=0",
-"0*3931=0",
-"0*3932=0",
-"0*3933=0",
-"0*3934=0",
-"0*3935=0",
-"0*3936=0",
-"0*3937=0",
-"0*3938=0",
-"0*3939=0",
-"0*3940=0",
-"0*3941=0",
-"0*3942=0",
-"0*3943=0",
-"0*3944=0",
-"0*3945=0",
-"0*3946=0",
-"0*3947=0",
-"0*3948=0",
-"0*3949=0",
-"0*3950=0",
-"0*3951=0",
-"0*3952=0",
-"0*3953=0",
-"0*3954=0",
-"0*3955=0",
-"0*3956=0",
-"0*3957=0",
-"0*3958=0",
-"0*3959=0",
-"0*3960=0",
-"0*3961=0",
-"0*3962=0",
-"0*3963=0",
-"0*3964=0",
-"0*3965=0",
-"0*3966=0",
-"0*3967=0",
-"0*3968=0",
-"0*3969=0",
-"0*3970=0",
-"0*3971=0",
-"0*3972=0",
-"0*3973=0",
-"0*3974=0",
-"0*3975=0",
-"0*3976=0",
-"0*3977=0",
-"0*3978=0",
-"0*3979=0",
-"0*3980=0",
-"0*3981=0",
-"0*3982=0",
-"0*3983=0",
-"0*3984=0",
-"0*3985=0",
-"0*3986=0",
-"0*3987=0",
-"0*3988=0",
-"0*3989=0",
-"0*3990=0",
-"0*3991=0",
-"0*3992=0",
-"0*3993=0",
-"0*3994=0",
-"0*3995=0",
-"0*3996=0",
-"0*3997=0",
-"0*3998=0",
-"0*3999=0",
-"0*39+0=0",
-"0*39+1=1",
-"0*39+2=2",
-"0*39+3=3",
-"0*39+4=4",
-"0*39+5=5",
-"0*39+6=6",
-"0*39+7=7",
-"0*39+8=8",
-"0*39+9=9",
-"0*39-0=0",
-"0*39*0=0",
-"0*39*1=0",
-"0*39*2=0",
-"0*39*3=0",
-"0*39*4=0",
-"0*39*5=0",
-"0*39*6=0",
-"0*39*7=0",
-"0*39*8=0",
-"0*39*9=0",
-"0*39/1=0",
-"0*39/2=0",
-"0*39/3=0",
-"0*39/4=0",
-"0*39/5=0",
-"0*39/6=0",
-"0*39/7=0",
-"0*39/8=0",
-"0*39/9=0",
-"0*3-1=-1",
-"0*3-2=-2",
-"0*3-3=-3",
-"0*3-4=-4",
-"0*3-5=-5",
-"0*3-6=-6",
-"0*3-7=-7",
-"0*3-8=-8",
-"0*3-9=-9",
-"0*3*10=0",
-"0*3*11=0",
-"0*3*12=0",
-"0*3*13=0",
-"0*3*14=0",
-"0*3*15=0",
-"0*3*16=0",
-"0*3*17=0",
-"0*3*18=0",
-"0*3*19=0",
-"0*3*20=0",
-"0*3*21=0",
-"0*3*22=0",
-"0*3*23=0",
-"0*3*24=0",
-"0*3*25=0",
-"0*3*26=0",
-"0*3*27=0",
-"0*3*28=0",
-"0*3*29=0",
-"0*3*30=0",
-"0*3*31=0",
-"0*3*32=0",
-"0*3*33=0",
-"0*3*34=0",
-"0*3*35=0",
-"0*3*36=0",
-"0*3*37=0",
-"0*3*38=0",
-"0*3*39=0",
-"0*3*40=0",
-"0*3*41=0",
-"0*3*42=0",
-"0*3*43=0",
-"0*3*44=0",
-"0*3*45=0",
-"0*3*46=0",
-"0*3*47=0",
-"0*3*48=0",
-"0*3*49=0",
-"0*3*50=0",
-"0*3*51=0",
-"0*3*52=0",
-"0*3*53=0",
-"0*3*54=0",
-"0*3*55=0",
-"0*3*56=0",
-"0*3*57=0",
-"0*3*58=0",
-"0*3*59=0",
-"0*3*60=0",
-"0*3*61=0",
-"0*3*62=0",
-"0*3*63=0",
-"0*3*64=0",
-"0*3*65=0",
-"0*3*66=0",
-"0*3*67=0",
-"0*3*68=0",
-"0*3*69=0",
-"0*3*70=0",
-"0*3*71=0",
-"0*3*72=0",
-"0*3*73=0",
-"0*3*74=0",
-"0*3*75=0",
-"0*3*76=0",
-"0*3*77=0",
-"0*3*78=0",
-"0*3*79=0",
-"0*3*80=0",
-"0*3*81=0",
-"0*3*82=0",
-"0*3*83=0",
-"0*3*84=0",
-"0*3*85=0",
-"0*3*86=0",
-"0*3*87=0",
-"0*3*88=0",
-"0*3*89=0",
-"0*3*90=0",
-"0*3*91=0",
-"0*3*92=0",
-"0*3*93=0",
-"0*3*94=0",
-"0*3*95=0",
-"0*3*96=0",
-"0*3*97=0",
-"0*3*98=0",
-"0*3*99=0",
-"0*3/10=0",
-"0*3/11=0",
-"0*3/12=0",
-"0*3/13=0",
-"0*3/14=0",
-"0*3/15=0",
-"0*3/16=0",
-"0*3/17=0",
-"0*3/18=0",
-"0*3/19=0",
-"0*3/20=0",
-"0*3/21=0",
-"0*3/22=0",
-"0*3/23=0",
-"0*3/24=0",
-"0*3/25=0",
-"0*3/26=0",
-"0*3/27=0",
-"0*3/28=0",
-"0*3/29=0",
-"0*3/30=0",
-"0*3/31=0",
-"0*3/32=0",
-"0*3/33=0",
-"0*3/34=0",
-"0*3/35=0",
-"0*3/36=0",
-"0*3/37=0",
-"0*3/38=0",
-"0*3/39=0",
-"0*3/40=0",
-"0*3/41=0",
-"0*3/42=0",
-"0*3/43=0",
-"0*3/44=0",
-"0*3/45=0",
-"0*3/46=0",
-"0*3/47=0",
-"0*3/48=0",
-"0*3/49=0",
-"0*3/50=0",
-"0*3/51=0",
-"0*3/52=0",
-"0*3/53=0",
-"0*3/54=0",
-"0*3/55=0",
-"0*3/56=0",
-"0*3/57=0",
-"0*3/58=0",
-"0*3/59=0",
-"0*3/60=0",
-"0*3/61=0",
-"0*3/62=0",
-"0*3/63=0",
-"0*3/64=0",
-"0*3/65=0",
-"0*3/66=0",
-"0*3/67=0",
-"0*3/68=0",
-"0*3/69=0",
-"0*3/70=0",
-"0*3/71=0",
-"0*3/72=0",
-"0*3/73=0",
-"0*3/74=0",
-"0*3/75=0",
-"0*3/76=0",
-"0*3/77=0",
-"0*3/78=0",
-"0*3/79=0",
-"0*3/80=0",
-"0*3/81=0",
-"0*3/82=0",
-"0*3/83=0",
-"0*3/84=0",
-"0*3/85=0",
-"0*3/86=0",
-"0*3/87=0",
-"0*3/88=0",
-"0*3/89=0",
-"0*3/90=0",
-"0*3/91=0",
-"0*3/92=0",
-"0*3/93=0",
-"0*3/94=0",
-"0*3/95=0",
-"0*3/96=0",
-"0*3/97=0",
-"0*3/98=0",
-"0*3/99=0",
-"0*4000=0",
-"0*4001=0",
-"0*4002=0",
-"0*4003=0",
-"0*4004=0",
-"0*4005=0",
-"0*4006=0",
-"0*4007=0",
-"0*4008=0",
-"0*4009=0",
-"0*4010=0",
-"0*4011=0",
-"0*4012=0",
-"0*4013=0",
-"0*4014=0",
-"0*4015=0",
-"0*4016=0",
-"0*4017=0",
-"0*4018=0",
-"0*4019=0",
-"0*4020=0",
-"0*4021=0",
-"0*4022=0",
-"0*4023=0",
-"0*4024=0",
-"0*4025=0",
-"0*4026=0",
-"0*4027=0",
-"0*4028=0",
-"0*4029=0",
-"0*4030=0",
-"0*4031=0",
-"0*4032=0",
-"0*4033=0",
-"0*4034=0",
-"0*4035=0",
-"0*4036=0",
-"0*4037=0",
-"0*4038=0",
-"0*4039=0",
-"0*4040=0",
-"0*4041=0",
-"0*4042=0",
-"0*4043=0",
-"0*4044=0",
-"0*4045=0",
-"0*4046=0",
-"0*4047=0",
-"0*4048=0",
-"0*4049=0",
-"0*4050=0",
-"0*4051=0",
-"0*4052=0",
-"0*4053=0",
-"0*4054=0",
-"0*4055=0",
-"0*4056=0",
-"0*4057=0",
-"0*4058=0",
-"0*4059=0",
-"0*4060=0",
-"0*4061=0",
-"0*4062=0",
-"0*4063=0",
-"0*4064=0",
-"0*4065=0",
-"0*4066=0",
-"0*4067=0",
-"0*4068=0",
-"0*4069=0",
-"0*4070=0",
-"0*4071=0",
-"0*4072=0",
-"0*4073=0",
-"0*4074=0",
-"0*4075=0",
-"0*4076=0",
-"0*4077=0",
-"0*4078=0",
-"0*4079=0",
-"0*4080=0",
-"0*4081=0",
-"0*4082=0",
-"0*4083=0",
-"0*4084=0",
-"0*4085=0",
-"0*4086=0",
-"0*4087=0",
-"0*4088=0",
-"0*4089=0",
-"0*4090=0",
-"0*4091=0",
-"0*4092=0",
-"0*4093=0",
-"0*4094=0",
-"0*4095=0",
-"0*4096=0",
-"0*4097=0",
-"0*4098=0",
-"0*4099=0",
-"0*40+0=0",
-"0*40+1=1",
-"0*40+2=2",
-"0*40+3=3",
-"0*40+4=4",
-"0*40+5=5",
-"0*40+6=6",
-"0*40+7=7",
-"0*40+8=8",
-"0*40+9=9",
-"0*40-0=0",
-"0*40*0=0",
-"0*40*1=0",
-"0*40*2=0",
-"0*40*3=0",
-"0*40*4=0",
-"0*40*5=0",
-"0*40*6=0",
-"0*40*7=0",
-"0*40*8=0",
-"0*40*9=0",
-"0*40/1=0",
-"0*40/2=0",
-"0*40/3=0",
-"0*40/4=0",
-"0*40/5=0",
-"0*40/6=0",
-"0*40/7=0",
-"0*40/8=0",
-"0*40/9=0",
-"0*4100=0",
-"0*4101=0",
-"0*4102=0",
-"0*4103=0",
-"0*4104=0",
-"0*4105=0",
-"0*4106=0",
-"0*4107=0",
-"0*4108=0",
-"0*4109=0",
-"0*4110=0",
-"0*4111=0",
-"0*4112=0",
-"0*4113=0",
-"0*4114=0",
-"0*4115=0",
-"0*4116=0",
-"0*4117=0",
-"0*4118=0",
-"0*4119=0",
-"0*4120=0",
-"0*4121=0",
-"0*4122=0",
-"0*4123=0",
-"0*4124=0",
-"0*4125=0",
-"0*4126=0",
-"0*4127=0",
-"0*4128=0",
-"0*4129=0",
-"0*4130=0",
-"0*4131=0",
-"0*4132=0",
-"0*4133=0",
-"0*4134=0",
-"0*4135=0",
-"0*4136=0",
-"0*4137=0",
-"0*4138=0",
-"0*4139=0",
-"0*4140=0",
-"0*4141=0",
-"0*4142=0",
-"0*4143=0",
-"0*4144=0",
-"0*4145=0",
-"0*4146=0",
-"0*4147=0",
-"0*4148=0",
-"0*4149=0",
-"0*4150=0",
-"0*4151=0",
-"0*4152=0",
-"0*4153=0",
-"0*4154=0",
-"0*4155=0",
-"0*4156=0",
-"0*4157=0",
-"0*4158=0",
-"0*4159=0",
-"0*4160=0",
-"0*4161=0",
-"0*4162=0",
-"0*4163=0",
-"0*4164=0",
-"0*4165=0",
-"0*4166=0",
-"0*4167=0",
-"0*4168=0",
-"0*4169=0",
-"0*4170=0",
-"0*4171=0",
-"0*4172=0",
-"0*4173=0",
-"0*4174=0",
-"0*4175=0",
-"0*4176=0",
-"0*4177=0",
-"0*4178=0",
-"0*4179=0",
-"0*4180=0",
-"0*4181=0",
-"0*4182=0",
-"0*4183=0",
-"0*4184=0",
-"0*4185=0",
-"0*4186=0",
-"0*4187=0",
-"0*4188=0",
-"0*4189=0",
-"0*4190=0",
-"0*4191=0",
-"0*4192=0",
-"0*4193=0",
-"0*4194=0",
-"0*4195=0",
-"0*4196=0",
-"0*4197=0",
-"0*4198=0",
-"0*4199=0",
-"0*41+0=0",
-"0*41+1=1",
-"0*41+2=2",
-"0*41+3=3",
-"0*41+4=4",
-"0*41+5=5",
-"0*41+6=6",
-"0*41+7=7",
-"0*41+8=8",
-"0*41+9=9",
-"0*41-0=0",
-"0*41*0=0",
-"0*41*1=0",
-"0*41*2=0",
-"0*41*3=0",
-"0*41*4=0",
-"0*41*5=0",
-"0*41*6=0",
-"0*41*7=0",
-"0*41*8=0",
-"0*41*9=0",
-"0*41/1=0",
-"0*41/2=0",
-"0*41/3=0",
-"0*41/4=0",
-"0*41/5=0",
-"0*41/6=0",
-"0*41/7=0",
-"0*41/8=0",
-"0*41/9=0",
-"0*4200=0",
-"0*4201=0",
-"0*4202=0",
-"0*4203=0",
-"0*4204=0",
-"0*4205=0",
-"0*4206=0",
-"0*4207=0",
-"0*4208=0",
-"0*4209=0",
-"0*4210=0",
-"0*4211=0",
-"0*4212=0",
-"0*4213=0",
-"0*4214=0",
-"0*4215=0",
-"0*4216=0",
-"0*4217=0",
-"0*4218=0",
-"0*4219=0",
-"0*4220=0",
-"0*4221=0",
-"0*4222=0",
-"0*4223=0",
-"0*4224=0",
-"0*4225=0",
-"0*4226=0",
-"0*4227=0",
-"0*4228=0",
-"0*4229=0",
-"0*4230=0",
-"0*4231=0",
-"0*4232=0",
-"0*4233=0",
-"0*4234=0",
-"0*4235=0",
-"0*4236=0",
-"0*4237=0",
-"0*4238=0",
-"0*4239=0",
-"0*4240=0",
-"0*4241=0",
-"0*4242=0",
-"0*4243=0",
-"0*4244=0",
-"0*4245=0",
-"0*4246=0",
-"0*4247=0",
-"0*4248=0",
-"0*4249=0",
-"0*4250=0",
-"0*4251=0",
-"0*4252=0",
-"0*4253=0",
-"0*4254=0",
-"0*4255=0",
-"0*4256=0",
-"0*4257=0",
-"0*4258=0",
-"0*4259=0",
-"0*4260=0",
-"0*4261=0",
-"0*4262=0",
-"0*4263=0",
-"0*4264=0",
-"0*4265=0",
-"0*4266=0",
-"0*4267=0",
-"0*4268=0",
-"0*4269=0",
-"0*4270=0",
-"0*4271=0",
-"0*4272=0",
-"0*4273=0",
-"0*4274=0",
-"0*4275=0",
-"0*4276=0",
-"0*4277=0",
-"0*4278=0",
-"0*4279=0",
-"0*4280=0",
-"0*4281=0",
-"0*4282=0",
-"0*4283=0",
-"0*4284=0",
-"0*4285=0",
-"0*4286=0",
-"0*4287=0",
-"0*4288=0",
-"0*4289=0",
-"0*4290=0",
-"0*4291=0",
-"0*4292=0",
-"0*4293=0",
-"0*4294=0",
-"0*4295=0",
-"0*4296=0",
-"0*4297=0",
-"0*4298=0",
-"0*4299=0",
-"0*42+0=0",
-"0*42+1=1",
-"0*42+2=2",
-"0*42+3=3",
-"0*42+4=4",
-"0*42+5=5",
-"0*42+6=6",
-"0*42+7=7",
-"0*42+8=8",
-"0*42+9=9",
-"0*42-0=0",
-"0*42*0=0",
-"0*42*1=0",
-"0*42*2=0",
-"0*42*3=0",
-"0*42*4=0",
-"0*42*5=0",
-"0*42*6=0",
-"0*42*7=0",
-"0*42*8=0",
-"0*42*9=0",
-"0*42/1=0",
-"0*42/2=0",
-"0*42/3=0",
-"0*42/4=0",
-"0*42/5=0",
-"0*42/6=0",
-"0*42/7=0",
-"0*42/8=0",
-"0*42/9=0",
-"0*4300=0",
-"0*4301=0",
-"0*4302=0",
-"0*4303=0",
-"0*4304=0",
-"0*4305=0",
-"0*4306=0",
-"0*4307=0",
-"0*4308=0",
-"0*4309=0",
-"0*4310=0",
-"0*4311=0",
-"0*4312=0",
-"0*4313=0",
-"0*4314=0",
-"0*4315=0",
-"0*4316=0",
-"0*4317=0",
-"0*4318=0",
-"0*4319=0",
-"0*4320=0",
-"0*4321=0",
-"0*4322=0",
-"0*4323=0",
-"0*4324=0",
-"0*4325=0",
-"0*4326=0",
-"0*4327=0",
-"0*4328=0",
-"0*4329=0",
-"0*4330=0",
-"0*4331=0",
-"0*4332=0",
-"0*4333=0",
-"0*4334=0",
-"0*4335=0",
-"0*4336=0",
-"0*4337=0",
-"0*4338=0",
-"0*4339=0",
-"0*4340=0",
-"0*4341=0",
-"0*4342=0",
-"0*4343=0",
-"0*4344=0",
-"0*4345=0",
-"0*4346=0",
-"0*4347=0",
-"0*4348=0",
-"0*4349=0",
-"0*4350=0",
-"0*4351=0",
-"0*4352=0",
-"0*4353=0",
-"0*4354=0",
-"0*4355=0",
-"0*4356=0",
-"0*4357=0",
-"0*4358=0",
-"0*4359=0",
-"0*4360=0",
-"0*4361=0",
-"0*4362=0",
-"0*4363=0",
-"0*4364=0",
-"0*4365=0",
-"0*4366=0",
-"0*4367=0",
-"0*4368=0",
-"0*4369=0",
-"0*4370=0",
-"0*4371=0",
-"0*4372=0",
-"0*4373=0",
-"0*4374=0",
-"0*4375=0",
-"0*4376=0",
-"0*4377=0",
-"0*4378=0",
-"0*4379=0",
-"0*4380=0",
-"0*4381=0",
-"0*4382=0",
-"0*4383=0",
-"0*4384=0",
-"0*4385=0",
-"0*4386=0",
-"0*4387=0",
-"0*4388=0",
-"0*4389=0",
-"0*4390=0",
-"0*4391=0",
-"0*4392=0",
-"0*4393=0",
-"0*4394=0",
-"0*4395=0",
-"0*4396=0",
-"0*4397=0",
-"0*4398=0",
-"0*4399=0",
-"0*43+0=0",
-"0*43+1=1",
-"0*43+2=2",
-"0*43+3=3",
-"0*43+4=4",
-"0*43+5=5",
-"0*43+6=6",
-"0*43+7=7",
-"0*43+8=8",
-"0*43+9=9",
-"0*43-0=0",
-"0*43*0=0",
-"0*43*1=0",
-"0*43*2=0",
-"0*43*3=0",
-"0*43*4=0",
-"0*43*5=0",
-"0*43*6=0",
-"0*43*7=0",
-"0*43*8=0",
-"0*43*9=0",
-"0*43/1=0",
-"0*43/2=0",
-"0*43/3=0",
-"0*43/4=0",
-"0*43/5=0",
-"0*43/6=0",
-"0*43/7=0",
-"0*43/8=0",
-"0*43/9=0",
-"0*4400=0",
-"0*4401=0",
-"0*4402=0",
-"0*4403=0",
-"0*4404=0",
-"0*4405=0",
-"0*4406=0",
-"0*4407=0",
-"0*4408=0",
-"0*4409=0",
-"0*4410=0",
-"0*4411=0",
-"0*4412=0",
-"0*4413=0",
-"0*4414=0",
-"0*4415=0",
-"0*4416=0",
-"0*4417=0",
-"0*4418=0",
-"0*4419=0",
-"0*4420=0",
-"0*4421=0",
-"0*4422=0",
-"0*4423=0",
-"0*4424=0",
-"0*4425=0",
-"0*4426=0",
-"0*4427=0",
-"0*4428=0",
-"0*4429=0",
-"0*4430=0",
-"0*4431=0",
-"0*4432=0",
-"0*4433=0",
-"0*4434=0",
-"0*4435=0",
-"0*4436=0",
-"0*4437=0",
-"0*4438=0",
-"0*4439=0",
-"0*4440=0",
-"0*4441=0",
-"0*4442=0",
-"0*4443=0",
-"0*4444=0",
-"0*4445=0",
-"0*4446=0",
-"0*4447=0",
-"0*4448=0",
-"0*4449=0",
-"0*4450=0",
-"0*4451=0",
-"0*4452=0",
-"0*4453=0",
-"0*4454=0",
-"0*4455=0",
-"0*4456=0",
-"0*4457=0",
-"0*4458=0",
-"0*4459=0",
-"0*4460=0",
-"0*4461=0",
-"0*4462=0",
-"0*4463=0",
-"0*4464=0",
-"0*4465=0",
-"0*4466=0",
-"0*4467=0",
-"0*4468=0",
-"0*4469=0",
-"0*4470=0",
-"0*4471=0",
-"0*4472=0",
-"0*4473=0",
-"0*4474=0",
-"0*4475=0",
-"0*4476=0",
-"0*4477=0",
-"0*4478=0",
-"0*4479=0",
-"0*4480=0",
-"0*4481=0",
-"0*4482=0",
-"0*4483=0",
-"0*4484=0",
-"0*4485=0",
-"0*4486=0",
-"0*4487=0",
-"0*4488=0",
-"0*4489=0",
-"0*4490=0",
-"0*4491=0",
-"0*4492=0",
-"0*4493=0",
-"0*4494=0",
-"0*4495=0",
-"0*4496=0",
-"0*4497=0",
-"0*4498=0",
-"0*4499=0",
-"0*44+0=0",
-"0*44+1=1",
-"0*44+2=2",
-"0*44+3=3",
-"0*44+4=4",
-"0*44+5=5",
-"0*44+6=6",
-"0*44+7=7",
-"0*44+8=8",
-"0*44+9=9",
-"0*44-0=0",
-"0*44*0=0",
-"0*44*1=0",
-"0*44*2=0",
-"0*44*3=0",
-"0*44*4=0",
-"0*44*5=0",
-"0*44*6=0",
-"0*44*7=0",
-"0*44*8=0",
-"0*44*9=0",
-"0*44/1=0",
-"0*44/2=0",
-"0*44/3=0",
-"0*44/4=0",
-"0*44/5=0",
-"0*44/6=0",
-"0*44/7=0",
-"0*44/8=0",
-"0*44/9=0",
-"0*4500=0",
-"0*4501=0",
-"0*4502=0",
-"0*4503=0",
-"0*4504=0",
-"0*4505=0",
-"0*4506=0",
-"0*4507=0",
-"0*4508=0",
-"0*4509=0",
-"0*4510=0",
-"0*4511=0",
-"0*4512=0",
-"0*4513=0",
-"0*4514=0",
-"0*4515=0",
-"0*4516=0",
-"0*4517=0",
-"0*4518=0",
-"0*4519=0",
-"0*4520=0",
-"0*4521=0",
-"0*4522=0",
-"0*4523=0",
-"0*4524=0",
-"0*4525=0",
-"0*4526=0",
-"0*4527=0",
-"0*4528=0",
-"0*4529=0",
-"0*4530=0",
-"0*4531=0",
-"0*4532=0",
-"0*4533=0",
-"0*4534=0",
-"0*4535=0",
-"0*4536=0",
-"0*4537=0",
-"0*4538=0",
-"0*4539=0",
-"0*4540=0",
-"0*4541=0",
-"0*4542=0",
-"0*4543=0",
-"0*4544=0",
-"0*4545=0",
-"0*4546=0",
-"0*4547=0",
-"0*4548=0",
-"0*4549=0",
-"0*4550=0",
-"0*4551=0",
-"0*4552=0",
-"0*4553=0",
-"0*4554=0",
-"0*4555=0",
-"0*4556=0",
-"0*4557=0",
-"0*4558=0",
-"0*4559=0",
-"0*4560=0",
-"0*4561=0",
-"0*4562=0",
-"0*4563=0",
-"0*4564=0",
-"0*4565=0",
-"0*4566=0",
-"0*4567=0",
-"0*4568=0",
-"0*4569=0",
-"0*4570=0",
-"0*4571=0",
-"0*4572=0",
-"0*4573=0",
-"0*4574=0",
-"0*4575=0",
-"0*4576=0",
-"0*4577=0",
-"0*4578=0",
-"0*4579=0",
-"0*4580=0",
-"0*4581=0",
-"0*4582=0",
-"0*4583=0",
-"0*4584=0",
-"0*4585=0",
-"0*4586=0",
-"0*4587=0",
-"0*4588=0",
-"0*4589=0",
-"0*4590=0",
-"0*4591=0",
-"0*4592=0",
-"0*4593=0",
-"0*4594=0",
-"0*4595=0",
-"0*4596=0",
-"0*4597=0",
-"0*4598=0",
-"0*4599=0",
-"0*45+0=0",
-"0*45+1=1",
-"0*45+2=2",
-"0*45+3=3",
-"0*45+4=4",
-"0*45+5=5",
-"0*45+6=6",
-"0*45+7=7",
-"0*45+8=8",
-"0*45+9=9",
-"0*45-0=0",
-"0*45*0=0",
-"0*45*1=0",
-"0*45*2=0",
-"0*45*3=0",
-"0*45*4=0",
-"0*45*5=0",
-"0*45*6=0",
-"0*45*7=0",
-"0*45*8=0",
-"0*45*9=0",
-"0*45/1=0",
-"0*45/2=0",
-"0*45/3=0",
-"0*45/4=0",
-"0*45/5=0",
-"0*45/6=0",
-"0*45/7=0",
-"0*45/8=0",
-"0*45/9=0",
-"0*4600=0",
-"0*4601=0",
-"0*4602=0",
-"0*4603=0",
-"0*4604=0",
-"0*4605=0",
-"0*4606=0",
-"0*4607=0",
-"0*4608=0",
-"0*4609=0",
-"0*4610=0",
-"0*4611=0",
-"0*4612=0",
-"0*4613=0",
-"0*4614=0",
-"0*4615=0",
-"0*4616=0",
-"0*4617=0",
-"0*4618=0",
-"0*4619=0",
-"0*4620=0",
-"0*4621=0",
-"0*4622=0",
-"0*4623=0",
-"0*4624=0",
-"0*4625=0",
-"0*4626=0",
-"0*4627=0",
-"0*4628=0",
-"0*4629=0",
-"0*4630=0",
-"0*4631=0",
-"0*4632=0",
-"0*4633=0",
-"0*4634=0",
-"0*4635=0",
-"0*4636=0",
-"0*4637=0",
-"0*4638=0",
-"0*4639=0",
-"0*4640=0",
-"0*4641=0",
-"0*4642=0",
-"0*4643=0",
-"0*4644=0",
-"0*4645=0",
-"0*4646=0",
-"0*4647=0",
-"0*4648=0",
-"0*4649=0",
-"0*4650=0",
-"0*4651=0",
-"0*4652=0",
-"0*4653=0",
-"0*4654=0",
-"0*4655=0",
-"0*4656=0",
-"0*4657=0",
-"0*4658=0",
-"0*4659=0",
-"0*4660=0",
-"0*4661=0",
-"0*4662=0",
-"0*4663=0",
-"0*4664=0",
-"0*4665=0",
-"0*4666=0",
-"0*4667=0",
-"0*4668=0",
-"0*4669=0",
-"0*4670=0",
-"0*4671=0",
-"0*4672=0",
-"0*4673=0",
-"0*4674=0",
-"0*4675=0",
-"0*4676=0",
-"0*4677=0",
-"0*4678=0",
-"0*4679=0",
-"0*4680=0",
-"0*4681=0",
-"0*4682=0",
-"0*4683=0",
-"0*4684=0",
-"0*4685=0",
-"0*4686=0",
-"0*4687=0",
-"0*4688=0",
-"0*4689=0",
-"0*4690=0",
-"0*4691=0",
-"0*4692=0",
-"0*4693=0",
-"0*4694=0",
-"0*4695=0",
-"0*4696=0",
-"0*4697=0",
-"0*4698=0",
-"0*4699=0",
-"0*46+0=0",
-"0*46+1=1",
-"0*46+2=2",
-"0*46+3=3",
-"0*46+4=4",
-"0*46+5=5",
-"0*46+6=6",
-"0*46+7=7",
-"0*46+8=8",
-"0*46+9=9",
-"0*46-0=0",
-"0*46*0=0",
-"0*46*1=0",
-"0*46*2=0",
-"0*46*3=0",
-"0*46*4=0",
-"0*46*5=0",
-"0*46*6=0",
-"0*46*7=0",
-"0*46*8=0",
-"0*46*9=0",
-"0*46/1=0",
-"0*46/2=0",
-"0*46/3=0",
-"0*46/4=0",
-"0*46/5=0",
-"0*46/6=0",
-"0*46/7=0",
-"0*46/8=0",
-"0*46/9=0",
-"0*4700=0",
-"0*4701=0",
-"0*4702=0",
-"0*4703=0",
-"0*4704=0",
-"0*4705=0",
-"0*4706=0",
-"0*4707=0",
-"0*4708=0",
-"0*4709=0",
-"0*4710=0",
-"0*4711=0",
-"0*4712=0",
-"0*4713=0",
-"0*4714=0",
-"0*4715=0",
-"0*4716=0",
-"0*4717=0",
-"0*4718=0",
-"0*4719=0",
-"0*4720=0",
-"0*4721=0",
-"0*4722=0",
-"0*4723=0",
-"0*4724=0",
-"0*4725=0",
-"0*4726=0",
-"0*4727=0",
-"0*4728=0",
-"0*4729=0",
-"0*4730=0",
-"0*4731=0",
-"0*4732=0",
-"0*4733=0",
-"0*4734=0",
-"0*4735=0",
-"0*4736=0",
-"0*4737=0",
-"0*4738=0",
-"0*4739=0",
-"0*4740=0",
-"0*4741=0",
-"0*4742=0",
-"0*4743=0",
-"0*4744=0",
-"0*4745=0",
-"0*4746=0",
-"0*4747=0",
-"0*4748=0",
-"0*4749=0",
-"0*4750=0",
-"0*4751=0",
-"0*4752=0",
-"0*4753=0",
-"0*4754=0",
-"0*4755=0",
-"0*4756=0",
-"0*4757=0",
-"0*4758=0",
-"0*4759=0",
-"0*4760=0",
-"0*4761=0",
-"0*4762=0",
-"0*4763=0",
-"0*4764=0",
-"0*4765=0",
-"0*4766=0",
-"0*4767=0",
-"0*4768=0",
-"0*4769=0",
-"0*4770=0",
-"0*4771=0",
-"0*4772=0",
-"0*4773=0",
-"0*4774=0",
-"0*4775=0",
-"0*4776=0",
-"0*4777=0",
-"0*4778=0",
-"0*4779=0",
-"0*4780=0",
-"0*4781=0",
-"0*4782=0",
-"0*4783=0",
-"0*4784=0",
-"0*4785=0",
-"0*4786=0",
-"0*4787=0",
-"0*4788=0",
-"0*4789=0",
-"0*4790=0",
-"0*4791=0",
-"0*4792=0",
-"0*4793=0",
-"0*4794=0",
-"0*4795=0",
-"0*4796=0",
-"0*4797=0",
-"0*4798=0",
-"0*4799=0",
-"0*47+0=0",
-"0*47+1=1",
-"0*47+2=2",
-"0*47+3=3",
-"0*47+4=4",
-"0*47+5=5",
-"0*47+6=6",
-"0*47+7=7",
-"0*47+8=8",
-"0*47+9=9",
-"0*47-0=0",
-"0*47*0=0",
-"0*47*1=0",
-"0*47*2=0",
-"0*47*3=0",
-"0*47*4=0",
-"0*47*5=0",
-"0*47*6=0",
-"0*47*7=0",
-"0*47*8=0",
-"0*47*9=0",
-"0*47/1=0",
-"0*47/2=0",
-"0*47/3=0",
-"0*47/4=0",
-"0*47/5=0",
-"0*47/6=0",
-"0*47/7=0",
-"0*47/8=0",
-"0*47/9=0",
-"0*4800=0",
-"0*4801=0",
-"0*4802=0",
-"0*4803=0",
-"0*4804=0",
-"0*4805=0",
-"0*4806=0",
-"0*4807=0",
-"0*4808=0",
-"0*4809=0",
-"0*4810=0",
-"0*4811=0",
-"0*4812=0",
-"0*4813=0",
-"0*4814=0",
-"0*4815=0",
-"0*4816=0",
-"0*4817=0",
-"0*4818=0",
-"0*4819=0",
-"0*4820=0",
-"0*4821=0",
-"0*4822=0",
-"0*4823=0",
-"0*4824=0",
-"0*4825=0",
-"0*4826=0",
-"0*4827=0",
-"0*4828=0",
-"0*4829=0",
-"0*4830=0",
-"0*4831=0",
-"0*4832=0",
-"0*4833=0",
-"0*4834=0",
-"0*4835=0",
-"0*4836=0",
-"0*4837=0",
-"0*4838=0",
-"0*4839=0",
-"0*4840=0",
-"0*4841=0",
-"0*4842=0",
-"0*4843=0",
-"0*4844=0",
-"0*4845=0",
-"0*4846=0",
-"0*4847=0",
-"0*4848=0",
-"0*4849=0",
-"0*4850=0",
-"0*4851=0",
-"0*4852=0",
-"0*4853=0",
-"0*4854=0",
-"0*4855=0",
-"0*4856=0",
-"0*4857=0",
-"0*4858=0",
-"0*4859=0",
-"0*4860=0",
-"0*4861=0",
-"0*4862=0",
-"0*4863=0",
-"0*4864=0",
-"0*4865=0",
-"0*4866=0",
-"0*4867=0",
-"0*4868=0",
-"0*4869=0",
-"0*4870=0",
-"0*4871=0",
-"0*4872=0",
-"0*4873=0",
-"0*4874=0",
-"0*4875=0",
-"0*4876=0",
-"0*4877=0",
-"0*4878=0",
-"0*4879=0",
-"0*4880=0",
-"0*4881=0",
-"0*4882=0",
-"0*4883=0",
-"0*4884=0",
-"0*4885=0",
-"0*4886=0",
-"0*4887=0",
-"0*4888=0",
-"0*4889=0",
-"0*4890=0",
-"0*4891=0",
-"0*4892=0",
-"0*4893=0",
-"0*4894=0",
-"0*4895=0",
-"0*4896=0",
-"0*4897=0",
-"0*4898=0",
-"0*4899=0",
-"0*48+0=0",
-"0*48+1=1",
-"0*48+2=2",
-"0*48+3=3",
-"0*48+4=4",
-"0*48+5=5",
-"0*48+6=6",
-"0*48+7=7",
-"0*48+8=8",
-"0*48+9=9",
-"0*48-0=0",
-"0*48*0=0",
-"0*48*1=0",
-"0*48*2=0",
-"0*48*3=0",
-"0*48*4=0",
-"0*48*5=0",
-"0*48*6=0",
-"0*48*7=0",
-"0*48*8=0",
-"0*48*9=0",
-"0*48/1=0",
-"0*48/2=0",
-"0*48/3=0",
-"0*48/4=0",
-"0*48/5=0",
-"0*48/6=0",
-"0*48/7=0",
-"0*48/8=0",
-"0*48/9=0",
-"0*4900=0",
-"0*4901=0",
-"0*4902=0",
-"0*4903=0",
-"0*4904=0",
-"0*4905=0",
-"0*4906=0",
-"0*4907=0",
-"0*4908=0",
-"0*4909=0",
-"0*4910=0",
-"0*4911=0",
-"0*4912=0",
-"0*4913=0",
-"0*4914=0",
-"0*4915=0",
-"0*4916=0",
-"0*4917=0",
-"0*4918=0",
-"0*4919=0",
-"0*4920=0",
-"0*4921=0",
-"0*4922=0",
-"0*4923=0",
-"0*4924=0",
-"0*4925=0",
-"0*4926=0",
-"0*4927=0",
-"0*4928=0",
-"0*4929=0",
-"0*4930=0",
-"0*4931=0",
-"0*4932=0",
-"0*4933=0",
-"0*4934=0",
-"0*4935=0",
-"0*4936=0",
-"0*4937=0",
-"0*4938=0",
-"0*4939=0",
-"0*4940=0",
-"0*4941=0",
-"0*4942=0",
-"0*4943=0",
-"0*4944=0",
-"0*4945=0",
-"0*4946=0",
-"0*4947=0",
-"0*4948=0",
-"0*4949=0",
-"0*4950=0",
-"0*4951=0",
-"0*4952=0",
-"0*4953=0",
-"0*4954=0",
-"0*4955=0",
-"0*4956=0",
-"0*4957=0",
-"0*4958=0",
-"0*4959=0",
-"0*4960=0",
-"0*4961=0",
-"0*4962=0",
-"0*4963=0",
-"0*4964=0",
-"0*4965=0",
-"0*4966=0",
-"0*4967=0",
-"0*4968=0",
-"0*4969=0",
-"0*4970=0",
-"0*4971=0",
-"0*4972=0",
-"0*4973=0",
-"0*4974=0",
-"0*4975=0",
-"0*4976=0",
-"0*4977=0",
-"0*4978=0",
-"0*4979=0",
-"0*4980=0",
-"0*4981=0",
-"0*4982=0",
-"0*4983=0",
-"0*4984=0",
-"0*4985=0",
-"0*4986=0",
-"0*4987=0",
-"0*4988=0",
-"0*4989=0",
-"0*4990=0",
-"0*4991=0",
-"0*4992=0",
-"0*4993=0",
-"0*4994=0",
-"0*4995=0",
-"0*4996=0",
-"0*4997=0",
-"0*4998=0",
-"0*4999=0",
-"0*49+0=0",
-"0*49+1=1",
-"0*49+2=2",
-"0*49+3=3",
-"0*49+4=4",
-"0*49+5=5",
-"0*49+6=6",
-"0*49+7=7",
-"0*49+8=8",
-"0*49+9=9",
-"0*49-0=0",
-"0*49*0=0",
-"0*49*1=0",
-"0*49*2=0",
-"0*49*3=0",
-"0*49*4=0",
-"0*49*5=0",
-"0*49*6=0",
-"0*49*7=0",
-"0*49*8=0",
-"0*49*9=0",
-"0*49/1=0",
-"0*49/2=0",
-"0*49/3=0",
-"0*49/4=0",
-"0*49/5=0",
-"0*49/6=0",
-"0*49/7=0",
-"0*49/8=0",
-"0*49/9=0",
-"0*4-1=-1",
-"0*4-2=-2",
-"0*4-3=-3",
-"0*4-4=-4",
-"0*4-5=-5",
-"0*4-6=-6",
-"0*4-7=-7",
-"0*4-8=-8",
-"0*4-9=-9",
-"0*4*10=0",
-"0*4*11=0",
-"0*4*12=0",
-"0*4*13=0",
-"0*4*14=0",
-"0*4*15=0",
-"0*4*16=0",
-"0*4*17=0",
-"0*4*18=0",
-"0*4*19=0",
-"0*4*20=0",
-"0*4*21=0",
-"0*4*22=0",
-"0*4*23=0",
-"0*4*24=0",
-"0*4*25=0",
-"0*4*26=0",
-"0*4*27=0",
-"0*4*28=0",
-"0*4*29=0",
-"0*4*30=0",
-"0*4*31=0",
-"0*4*32=0",
-"0*4*33=0",
-"0*4*34=0",
-"0*4*35=0",
-"0*4*36=0",
-"0*4*37=0",
-"0*4*38=0",
-"0*4*39=0",
-"0*4*40=0",
-"0*4*41=0",
-"0*4*42=0",
-"0*4*43=0",
-"0*4*44=0",
-"0*4*45=0",
-"0*4*46=0",
-"0*4*47=0",
-"0*4*48=0",
-"0*4*49=0",
-"0*4*50=0",
-"0*4*51=0",
-"0*4*52=0",
-"0*4*53=0",
-"0*4*54=0",
-"0*4*55=0",
-"0*4*56=0",
-"0*4*57=0",
-"0*4*58=0",
-"0*4*59=0",
-"0*4*60=0",
-"0*4*61=0",
-"0*4*62=0",
-"0*4*63=0",
-"0*4*64=0",
-"0*4*65=0",
-"0*4*66=0",
-"0*4*67=0",
-"0*4*68=0",
-"0*4*69=0",
-"0*4*70=0",
-"0*4*71=0",
-"0*4*72=0",
-"0*4*73=0",
-"0*4*74=0",
-"0*4*75=0",
-"0*4*76=0",
-"0*4*77=0",
-"0*4*78=0",
-"0*4*79=0",
-"0*4*80=0",
-"0*4*81=0",
-"0*4*82=0",
-"0*4*83=0",
-"0*4*84=0",
-"0*4*85=0",
-"0*4*86=0",
-"0*4*87=0",
-"0*4*88=0",
-"0*4*89=0",
-"0*4*90=0",
-"0*4*91=0",
-"0*4*92=0",
-"0*4*93=0",
-"0*4*94=0",
-"0*4*95=0",
-"0*4*96=0",
-"0*4*97=0",
-"0*4*98=0",
-"0*4*99=0",
-"0*4/10=0",
-"0*4/11=0",
-"0*4/12=0",
-"0*4/13=0",
-"0*4/14=0",
-"0*4/15=0",
-"0*4/16=0",
-"0*4/17=0",
-"0*4/18=0",
-"0*4/19=0",
-"0*4/20=0",
-"0*4/21=0",
-"0*4/22=0",
-"0*4/23=0",
-"0*4/24=0",
-"0*4/25=0",
-"0*4/26=0",
-"0*4/27=0",
-"0*4/28=0",
-"0*4/29=0",
-"0*4/30=0",
-"0*4/31=0",
-"0*4/32=0",
-"0*4/33=0",
-"0*4/34=0",
-"0*4/35=0",
-"0*4/36=0",
-"0*4/37=0",
-"0*4/38=0",
-"0*4/39=0",
-"0*4/40=0",
-"0*4/41=0",
-"0*4/42=0",
-"0*4/43=0",
-"0*4/44=0",
-"0*4/45=0",
-"0*4/46=0",
-"0*4/47=0",
-"0*4/48=0",
-"0*4/49=0",
-"0*4/50=0",
-"0*4/51=0",
-"0*4/52=0",
-"0*4/53=0",
-"0*4/54=0",
-"0*4/55=0",
-"0*4/56=0",
-"0*4/57=0",
-"0*4/58=0",
-"0*4/59=0",
-"0*4/60=0",
-"0*4/61=0",
-"0*4/62=0",
-"0*4/63=0",
-"0*4/64=0",
-"0*4/65=0",
-"0*4/66=0",
-"0*4/67=0",
-"0*4/68=0",
-"0*4/69=0",
-"0*4/70=0",
-"0*4/71=0",
-"0*4/72=0",
-"0*4/73=0",
-"0*4/74=0",
-"0*4/75=0",
-"0*4/76=0",
-"0*4/77=0",
-"0*4/78=0",
-"0*4/79=0",
-"0*4/80=0",
-"0*4/81=0",
-"0*4/82=0",
-"0*4/83=0",
-"0*4/84=0",
-"0*4/85=0",
-"0*4/86=0",
-"0*4/87=0",
-"0*4/88=0",
-"0*4/89=0",
-"0*4/90=0",
-"0*4/91=0",
-"0*4/92=0",
-"0*4/93=0",
-"0*4/94=0",
-"0*4/95=0",
-"0*4/96=0",
-"0*4/97=0",
-"0*4/98=0",
-"0*4/99=0",
-"0*5000=0",
-"0*5001=0",
-"0*5002=0",
-"0*5003=0",
-"0*5004=0",
-"0*5005=0",
-"0*5006=0",
-"0*5007=0",
-"0*5008=0",
-"0*5009=0",
-"0*5010=0",
-"0*5011=0",
-"0*5012=0",
-"0*5013=0",
-"0*5014=0",
-"0*5015=0",
-"0*5016=0",
-"0*5017=0",
-"0*5018=0",
-"0*5019=0",
-"0*5020=0",
-"0*5021=0",
-"0*5022=0",
-"0*5023=0",
-"0*5024=0",
-"0*5025=0",
-"0*5026=0",
-"0*5027=0",
-"0*5028=0",
-"0*5029=0",
-"0*5030=0",
-"0*5031=0",
-"0*5032=0",
-"0*5033=0",
-"0*5034=0",
-"0*5035=0",
-"0*5036=0",
-"0*5037=0",
-"0*5038=0",
-"0*5039=0",
-"0*5040=0",
-"0*5041=0",
-"0*5042=0",
-"0*5043=0",
-"0*5044=0",
-"0*5045=0",
-"0*5046=0",
-"0*5047=0",
-"0*5048=0",
-"0*5049=0",
-"0*5050=0",
-"0*5051=0",
-"0*5052=0",
-"0*5053=0",
-"0*5054=0",
-"0*5055=0",
-"0*5056=0",
-"0*5057=0",
-"0*5058=0",
-"0*5059=0",
-"0*5060=0",
-"0*5061=0",
-"0*5062=0",
-"0*5063=0",
-"0*5064=0",
-"0*5065=0",
-"0*5066=0",
-"0*5067=0",
-"0*5068=0",
-"0*5069=0",
-"0*5070=0",
-"0*5071=0",
-"0*5072=0",
-"0*5073=0",
-"0*5074=0",
-"0*5075=0",
-"0*5076=0",
-"0*5077=0",
-"0*5078=0",
-"0*5079=0",
-"0*5080=0",
-"0*5081=0",
-"0*5082=0",
-"0*5083=0",
-"0*5084=0",
-"0*5085=0",
-"0*5086=0",
-"0*5087=0",
-"0*5088=0",
-"0*5089=0",
-"0*5090=0",
-"0*5091=0",
-"0*5092=0",
-"0*5093=0",
-"0*5094=0",
-"0*5095=0",
-"0*5096=0",
-"0*5097=0",
-"0*5098=0",
-"0*5099=0",
-"0*50+0=0",
-"0*50+1=1",
-"0*50+2=2",
-"0*50+3=3",
-"0*50+4=4",
-"0*50+5=5",
-"0*50+6=6",
-"0*50+7=7",
-"0*50+8=8",
-"0*50+9=9",
-"0*50-0=0",
-"0*50*0=0",
-"0*50*1=0",
-"0*50*2=0",
-"0*50*3=0",
-"0*50*4=0",
-"0*50*5=0",
-"0*50*6=0",
-"0*50*7=0",
-"0*50*8=0",
-"0*50*9=0",
-"0*50/1=0",
-"0*50/2=0",
-"0*50/3=0",
-"0*50/4=0",
-"0*50/5=0",
-"0*50/6=0",
-"0*50/7=0",
-"0*50/8=0",
-"0*50/9=0",
-"0*5100=0",
-"0*5101=0",
-"0*5102=0",
-"0*5103=0",
-"0*5104=0",
-"0*5105=0",
-"0*5106=0",
-"0*5107=0",
-"0*5108=0",
-"0*5109=0",
-"0*5110=0",
-"0*5111=0",
-"0*5112=0",
-"0*5113=0",
-"0*5114=0",
-"0*5115=0",
-"0*5116=0",
-"0*5117=0",
-"0*5118=0",
-"0*5119=0",
-"0*5120=0",
-"0*5121=0",
-"0*5122=0",
-"0*5123=0",
-"0*5124=0",
-"0*5125=0",
-"0*5126=0",
-"0*5127=0",
-"0*5128=0",
-"0*5129=0",
-"0*5130=0",
-"0*5131=0",
-"0*5132=0",
-"0*5133=0",
-"0*5134=0",
-"0*5135=0",
-"0*5136=0",
-"0*5137=0",
-"0*5138=0",
-"0*5139=0",
-"0*5140=0",
-"0*5141=0",
-"0*5142=0",
-"0*5143=0",
-"0*5144=0",
-"0*5145=0",
-"0*5146=0",
-"0*5147=0",
-"0*5148=0",
-"0*5149=0",
-"0*5150=0",
-"0*5151=0",
-"0*5152=0",
-"0*5153=0",
-"0*5154=0",
-"0*5155=0",
-"0*5156=0",
-"0*5157=0",
-"0*5158=0",
-"0*5159=0",
-"0*5160=0",
-"0*5161=0",
-"0*5162=0",
-"0*5163=0",
-"0*5164=0",
-"0*5165=0",
-"0*5166=0",
-"0*5167=0",
-"0*5168=0",
-"0*5169=0",
-"0*5170=0",
-"0*5171=0",
-"0*5172=0",
-"0*5173=0",
-"0*5174=0",
-"0*5175=0",
-"0*5176=0",
-"0*5177=0",
-"0*5178=0",
-"0*5179=0",
-"0*5180=0",
-"0*5181=0",
-"0*5182=0",
-"0*5183=0",
-"0*5184=0",
-"0*5185=0",
-"0*5186=0",
-"0*5187=0",
-"0*5188=0",
-"0*5189=0",
-"0*5190=0",
-"0*5191=0",
-"0*5192=0",
-"0*5193=0",
-"0*5194=0",
-"0*5195=0",
-"0*5196=0",
-"0*5197=0",
-"0*5198=0",
-"0*5199=0",
-"0*51+0=0",
-"0*51+1=1",
-"0*51+2=2",
-"0*51+3=3",
-"0*51+4=4",
-"0*51+5=5",
-"0*51+6=6",
-"0*51+7=7",
-"0*51+8=8",
-"0*51+9=9",
-"0*51-0=0",
-"0*51*0=0",
-"0*51*1=0",
-"0*51*2=0",
-"0*51*3=0",
-"0*51*4=0",
-"0*51*5=0",
-"0*51*6=0",
-"0*51*7=0",
-"0*51*8=0",
-"0*51*9=0",
-"0*51/1=0",
-"0*51/2=0",
-"0*51/3=0",
-"0*51/4=0",
-"0*51/5=0",
-"0*51/6=0",
-"0*51/7=0",
-"0*51/8=0",
-"0*51/9=0",
-"0*5200=0",
-"0*5201=0",
-"0*5202=0",
-"0*5203=0",
-"0*5204=0",
-"0*5205=0",
-"0*5206=0",
-"0*5207=0",
-"0*5208=0",
-"0*5209=0",
-"0*5210=0",
-"0*5211=0",
-"0*5212=0",
-"0*5213=0",
-"0*5214=0",
-"0*5215=0",
-"0*5216=0",
-"0*5217=0",
-"0*5218=0",
-"0*5219=0",
-"0*5220=0",
-"0*5221=0",
-"0*5222=0",
-"0*5223=0",
-"0*5224=0",
-"0*5225=0",
-"0*5226=0",
-"0*5227=0",
-"0*5228=0",
-"0*5229=0",
-"0*5230=0",
-"0*5231=0",
-"0*5232=0",
-"0*5233=0",
-"0*5234=0",
-"0*5235=0",
-"0*5236=0",
-"0*5237=0",
-"0*5238=0",
-"0*5239=0",
-"0*5240=0",
-"0*5241=0",
-"0*5242=0",
-"0*5243=0",
-"0*5244=0",
-"0*5245=0",
-"0*5246=0",
-"0*5247=0",
-"0*5248=0",
-"0*5249=0",
-"0*5250=0",
-"0*5251=0",
-"0*5252=0",
-"0*5253=0",
-"0*5254=0",
-"0*5255=0",
-"0*5256=0",
-"0*5257=0",
-"0*5258=0",
-"0*5259=0",
-"0*5260=0",
-"0*5261=0",
-"0*5262=0",
-"0*5263=0",
-"0*5264=0",
-"0*5265=0",
-"0*5266=0",
-"0*5267=0",
-"0*5268=0",
-"0*5269=0",
-"0*5270=0",
-"0*5271=0",
-"0*5272=0",
-"0*5273=0",
-"0*5274=0",
-"0*5275=0",
-"0*5276=0",
-"0*5277=0",
-"0*5278=0",
-"0*5279=0",
-"0*5280=0",
-"0*5281=0",
-"0*5282=0",
-"0*5283=0",
-"0*5284=0",
-"0*5285=0",
-"0*5286=0",
-"0*5287=0",
-"0*5288=0",
-"0*5289=0",
-"0*5290=0",
-"0*5291=0",
-"0*5292=0",
-"0*5293=0",
-"0*5294=0",
-"0*5295=0",
-"0*5296=0",
-"0*5297=0",
-"0*5298=0",
-"0*5299=0",
-"0*52+0=0",
-"0*52+1=1",
-"0*52+2=2",
-"0*52+3=3",
-"0*52+4=4",
-"0*52+5=5",
-"0*52+6=6",
-"0*52+7=7",
-"0*52+8=8",
-"0*52+9=9",
-"0*52-0=0",
-"0*52*0=0",
-"0*52*1=0",
-"0*52*2=0",
-"0*52*3=0",
-"0*52*4=0",
-"0*52*5=0",
-"0*52*6=0",
-"0*52*7=0",
-"0*52*8=0",
-"0*52*9=0",
-"0*52/1=0",
-"0*52/2=0",
-"0*52/3=0",
-"0*52/4=0",
-"0*52/5=0",
-"0*52/6=0",
-"0*52/7=0",
-"0*52/8=0",
-"0*52/9=0",
-"0*5300=0",
-"0*5301=0",
-"0*5302=0",
-"0*5303=0",
-"0*5304=0",
-"0*5305=0",
-"0*5306=0",
-"0*5307=0",
-"0*5308=0",
-"0*5309=0",
-"0*5310=0",
-"0*5311=0",
-"0*5312=0",
-"0*5313=0",
-"0*5314=0",
-"0*5315=0",
-"0*5316=0",
-"0*5317=0",
-"0*5318=0",
-"0*5319=0",
-"0*5320=0",
-"0*5321=0",
-"0*5322=0",
-"0*5323=0",
-"0*5324=0",
-"0*5325=0",
-"0*5326=0",
-"0*5327=0",
-"0*5328=0",
-"0*5329=0",
-"0*5330=0",
-"0*5331=0",
-"0*5332=0",
-"0*5333=0",
-"0*5334=0",
-"0*5335=0",
-"0*5336=0",
-"0*5337=0",
-"0*5338=0",
-"0*5339=0",
-"0*5340=0",
-"0*5341=0",
-"0*5342=0",
-"0*5343=0",
-"0*5344=0",
-"0*5345=0",
-"0*5346=0",
-"0*5347=0",
-"0*5348=0",
-"0*5349=0",
-"0*5350=0",
-"0*5351=0",
-"0*5352=0",
-"0*5353=0",
-"0*5354=0",
-"0*5355=0",
-"0*5356=0",
-"0*5357=0",
-"0*5358=0",
-"0*5359=0",
-"0*5360=0",
-"0*5361=0",
-"0*5362=0",
-"0*5363=0",
-"0*5364=0",
-"0*5365=0",
-"0*5366=0",
-"0*5367=0",
-"0*5368=0",
-"0*5369=0",
-"0*5370=0",
-"0*5371=0",
-"0*5372=0",
-"0*5373=0",
-"0*5374=0",
-"0*5375=0",
-"0*5376=0",
-"0*5377=0",
-"0*5378=0",
-"0*5379=0",
-"0*5380=0",
-"0*5381=0",
-"0*5382=0",
-"0*5383=0",
-"0*5384=0",
-"0*5385=0",
-"0*5386=0",
-"0*5387=0",
-"0*5388=0",
-"0*5389=0",
-"0*5390=0",
-"0*5391=0",
-"0*5392=0",
-"0*5393=0",
-"0*5394=0",
-"0*5395=0",
-"0*5396=0",
-"0*5397=0",
-"0*5398=0",
-"0*5399=0",
-"0*53+0=0",
-"0*53+1=1",
-"0*53+2=2",
-"0*53+3=3",
-"0*53+4=4",
-"0*53+5=5",
-"0*53+6=6",
-"0*53+7=7",
-"0*53+8=8",
-"0*53+9=9",
-"0*53-0=0",
-"0*53*0=0",
-"0*53*1=0",
-"0*53*2=0",
-"0*53*3=0",
-"0*53*4=0",
-"0*53*5=0",
-"0*53*6=0",
-"0*53*7=0",
-"0*53*8=0",
-"0*53*9=0",
-"0*53/1=0",
-"0*53/2=0",
-"0*53/3=0",
-"0*53/4=0",
-"0*53/5=0",
-"0*53/6=0",
-"0*53/7=0",
-"0*53/8=0",
-"0*53/9=0",
-"0*5400=0",
-"0*5401=0",
-"0*5402=0",
-"0*5403=0",
-"0*5404=0",
-"0*5405=0",
-"0*5406=0",
-"0*5407=0",
-"0*5408=0",
-"0*5409=0",
-"0*5410=0",
-"0*5411=0",
-"0*5412=0",
-"0*5413=0",
-"0*5414=0",
-"0*5415=0",
-"0*5416=0",
-"0*5417=0",
-"0*5418=0",
-"0*5419=0",
-"0*5420=0",
-"0*5421=0",
-"0*5422=0",
-"0*5423=0",
-"0*5424=0",
-"0*5425=0",
-"0*5426=0",
-"0*5427=0",
-"0*5428=0",
-"0*5429=0",
-"0*5430=0",
-"0*5431=0",
-"0*5432=0",
-"0*5433=0",
-"0*5434=0",
-"0*5435=0",
-"0*5436=0",
-"0*5437=0",
-"0*5438=0",
-"0*5439=0",
-"0*5440=0",
-"0*5441=0",
-"0*5442=0",
-"0*5443=0",
-"0*5444=0",
-"0*5445=0",
-"0*5446=0",
-"0*5447=0",
-"0*5448=0",
-"0*5449=0",
-"0*5450=0",
-"0*5451=0",
-"0*5452=0",
-"0*5453=0",
-"0*5454=0",
-"0*5455=0",
-"0*5456=0",
-"0*5457=0",
-"0*5458=0",
-"0*5459=0",
-"0*5460=0",
-"0*5461=0",
-"0*5462=0",
-"0*5463=0",
-"0*5464=0",
-"0*5465=0",
-"0*5466=0",
-"0*5467=0",
-"0*5468=0",
-"0*5469=0",
-"0*5470=0",
-"0*5471=0",
-"0*5472=0",
-"0*5473=0",
-"0*5474=0",
-"0*5475=0",
-"0*5476=0",
-"0*5477=0",
-"0*5478=0",
-"0*5479=0",
-"0*5480=0",
-"0*5481=0",
-"0*5482=0",
-"0*5483=0",
-"0*5484=0",
-"0*5485=0",
-"0*5486=0",
-"0*5487=0",
-"0*5488=0",
-"0*5489=0",
-"0*5490=0",
-"0*5491=0",
-"0*5492=0",
-"0*5493=0",
-"0*5494=0",
-"0*5495=0",
-"0*5496=0",
-"0*5497=0",
-"0*5498=0",
-"0*5499=0",
-"0*54+0=0",
-"0*54+1=1",
-"0*54+2=2",
-"0*54+3=3",
-"0*54+4=4",
-"0*54+5=5",
-"0*54+6=6",
-"0*54+7=7",
-"0*54+8=8",
-"0*54+9=9",
-"0*54-0=0",
-"0*54*0=0",
-"0*54*1=0",
-"0*54*2=0",
-"0*54*3=0",
-"0*54*4=0",
-"0*54*5=0",
-"0*54*6=0",
-"0*54*7=0",
-"0*54*8=0",
-"0*54*9=0",
-"0*54/1=0",
-"0*54/2=0",
-"0*54/3=0",
-"0*54/4=0",
-"0*54/5=0",
-"0*54/6=0",
-"0*54/7=0",
-"0*54/8=0",
-"0*54/9=0",
-"0*5500=0",
-"0*5501=0",
-"0*5502=0",
-"0*5503=0",
-"0*5504=0",
-"0*5505=0",
-"0*5506=0",
-"0*5507=0",
-"0*5508=0",
-"0*5509=0",
-"0*5510=0",
-"0*5511=0",
-"0*5512=0",
-"0*5513=0",
-"0*5514=0",
-"0*5515=0",
-"0*5516=0",
-"0*5517=0",
-"0*5518=0",
-"0*5519=0",
-"0*5520=0",
-"0*5521=0",
-"0*5522=0",
-"0*5523=0",
-"0*5524=0",
-"0*5525=0",
-"0*5526=0",
-"0*5527=0",
-"0*5528=0",
-"0*5529=0",
-"0*5530=0",
-"0*5531=0",
-"0*5532=0",
-"0*5533=0",
-"0*5534=0",
-"0*5535=0",
-"0*5536=0",
-"0*5537=0",
-"0*5538=0",
-"0*5539=0",
-"0*5540=0",
-"0*5541=0",
-"0*5542=0",
-"0*5543=0",
-"0*5544=0",
-"0*5545=0",
-"0*5546=0",
-"0*5547=0",
-"0*5548=0",
-"0*5549=0",
-"0*5550=0",
-"0*5551=0",
-"0*5552=0",
-"0*5553=0",
-"0*5554=0",
-"0*5555=0",
-"0*5556=0",
-"0*5557=0",
-"0*5558=0",
-"0*5559=0",
-"0*5560=0",
-"0*5561=0",
-"0*5562=0",
-"0*5563=0",
-"0*5564=0",
-"0*5565=0",
-"0*5566=0",
-"0*5567=0",
-"0*5568=0",
-"0*5569=0",
-"0*5570=0",
-"0*5571=0",
-"0*5572=0",
-"0*5573=0",
-"0*5574=0",
-"0*5575=0",
-"0*5576=0",
-"0*5577=0",
-"0*5578=0",
-"0*5579=0",
-"0*5580=0",
-"0*5581=0",
-"0*5582=0",
-"0*5583=0",
-"0*5584=0",
-"0*5585=0",
-"0*5586=0",
-"0*5587=0",
-"0*5588=0",
-"0*5589=0",
-"0*5590=0",
-"0*5591=0",
-"0*5592=0",
-"0*5593=0",
-"0*5594=0",
-"0*5595=0",
-"0*5596=0",
-"0*5597=0",
-"0*5598=0",
-"0*5599=0",
-"0*55+0=0",
-"0*55+1=1",
-"0*55+2=2",
-"0*55+3=3",
-"0*55+4=4",
-"0*55+5=5",
-"0*55+6=6",
-"0*55+7=7",
-"0*55+8=8",
-"0*55+9=9",
-"0*55-0=0",
-"0*55*0=0",
-"0*55*1=0",
-"0*55*2=0",
-"0*55*3=0",
-"0*55*4=0",
-"0*55*5=0",
-"0*55*6=0",
-"0*55*7=0",
-"0*55*8=0",
-"0*55*9=0",
-"0*55/1=0",
-"0*55/2=0",
-"0*55/3=0",
-"0*55/4=0",
-"0*55/5=0",
-"0*55/6=0",
-"0*55/7=0",
-"0*55/8=0",
-"0*55/9=0",
-"0*5600=0",
-"0*5601=0",
-"0*5602=0",
-"0*5603=0",
-"0*5604=0",
-"0*5605=0",
-"0*5606=0",
-"0*5607=0",
-"0*5608=0",
-"0*5609=0",
-"0*5610=0",
-"0*5611=0",
-"0*5612=0",
-"0*5613=0",
-"0*5614=0",
-"0*5615=0",
-"0*5616=0",
-"0*5617=0",
-"0*5618=0",
-"0*5619=0",
-"0*5620=0",
-"0*5621=0",
-"0*5622=0",
-"0*5623=0",
-"0*5624=0",
-"0*5625=0",
-"0*5626=0",
-"0*5627=0",
-"0*5628=0",
-"0*5629=0",
-"0*5630=0",
-"0*5631=0",
-"0*5632=0",
-"0*5633=0",
-"0*5634=0",
-"0*5635=0",
-"0*5636=0",
-"0*5637=0",
-"0*5638=0",
-"0*5639=0",
-"0*5640=0",
-"0*5641=0",
-"0*5642=0",
-"0*5643=0",
-"0*5644=0",
-"0*5645=0",
-"0*5646=0",
-"0*5647=0",
-"0*5648=0",
-"0*5649=0",
-"0*5650=0",
-"0*5651=0",
-"0*5652=0",
-"0*5653=0",
-"0*5654=0",
-"0*5655=0",
-"0*5656=0",
-"0*5657=0",
-"0*5658=0",
-"0*5659=0",
-"0*5660=0",
-"0*5661=0",
-"0*5662=0",
-"0*5663=0",
-"0*5664=0",
-"0*5665=0",
-"0*5666=0",
-"0*5667=0",
-"0*5668=0",
-"0*5669=0",
-"0*5670=0",
-"0*5671=0",
-"0*5672=0",
-"0*5673=0",
-"0*5674=0",
-"0*5675=0",
-"0*5676=0",
-"0*5677=0",
-"0*5678=0",
-"0*5679=0",
-"0*5680=0",
-"0*5681=0",
-"0*5682=0",
-"0*5683=0",
-"0*5684=0",
-"0*5685=0",
-"0*5686=0",
-"0*5687=0",
-"0*5688=0",
-"0*5689=0",
-"0*5690=0",
-"0*5691=0",
-"0*5692=0",
-"0*5693=0",
-"0*5694=0",
-"0*5695=0",
-"0*5696=0",
-"0*5697=0",
-"0*5698=0",
-"0*5699=0",
-"0*56+0=0",
-"0*56+1=1",
-"0*56+2=2",
-"0*56+3=3",
-"0*56+4=4",
-"0*56+5=5",
-"0*56+6=6",
-"0*56+7=7",
-"0*56+8=8",
-"0*56+9=9",
-"0*56-0=0",
-"0*56*0=0",
-"0*56*1=0",
-"0*56*2=0",
-"0*56*3=0",
-"0*56*4=0",
-"0*56*5=0",
-"0*56*6=0",
-"0*56*7=0",
-"0*56*8=0",
-"0*56*9=0",
-"0*56/1=0",
-"0*56/2=0",
-"0*56/3=0",
-"0*56/4=0",
-"0*56/5=0",
-"0*56/6=0",
-"0*56/7=0",
-"0*56/8=0",
-"0*56/9=0",
-"0*5700=0",
-"0*5701=0",
-"0*5702=0",
-"0*5703=0",
-"0*5704=0",
-"0*5705=0",
-"0*5706=0",
-"0*5707=0",
-"0*5708=0",
-"0*5709=0",
-"0*5710=0",
-"0*5711=0",
-"0*5712=0",
-"0*5713=0",
-"0*5714=0",
-"0*5715=0",
-"0*5716=0",
-"0*5717=0",
-"0*5718=0",
-"0*5719=0",
-"0*5720=0",
-"0*5721=0",
-"0*5722=0",
-"0*5723=0",
-"0*5724=0",
-"0*5725=0",
-"0*5726=0",
-"0*5727=0",
-"0*5728=0",
-"0*5729=0",
-"0*5730=0",
-"0*5731=0",
-"0*5732=0",
-"0*5733=0",
-"0*5734=0",
-"0*5735=0",
-"0*5736=0",
-"0*5737=0",
-"0*5738=0",
-"0*5739=0",
-"0*5740=0",
-"0*5741=0",
-"0*5742=0",
-"0*5743=0",
-"0*5744=0",
-"0*5745=0",
-"0*5746=0",
-"0*5747=0",
-"0*5748=0",
-"0*5749=0",
-"0*5750=0",
-"0*5751=0",
-"0*5752=0",
-"0*5753=0",
-"0*5754=0",
-"0*5755=0",
-"0*5756=0",
-"0*5757=0",
-"0*5758=0",
-"0*5759=0",
-"0*5760=0",
-"0*5761=0",
-"0*5762=0",
-"0*5763=0",
-"0*5764=0",
-"0*5765=0",
-"0*5766=0",
-"0*5767=0",
-"0*5768=0",
-"0*5769=0",
-"0*5770=0",
-"0*5771=0",
-"0*5772=0",
-"0*5773=0",
-"0*5774=0",
-"0*5775=0",
-"0*5776=0",
-"0*5777=0",
-"0*5778=0",
-"0*5779=0",
-"0*5780=0",
-"0*5781=0",
-"0*5782=0",
-"0*5783=0",
-"0*5784=0",
-"0*5785=0",
-"0*5786=0",
-"0*5787=0",
-"0*5788=0",
-"0*5789=0",
-"0*5790=0",
-"0*5791=0",
-"0*5792=0",
-"0*5793=0",
-"0*5794=0",
-"0*5795=0",
-"0*5796=0",
-"0*5797=0",
-"0*5798=0",
-"0*5799=0",
-"0*57+0=0",
-"0*57+1=1",
-"0*57+2=2",
-"0*57+3=3",
-"0*57+4=4",
-"0*57+5=5",
-"0*57+6=6",
-"0*57+7=7",
-"0*57+8=8",
-"0*57+9=9",
-"0*57-0=0",
-"0*57*0=0",
-"0*57*1=0",
-"0*57*2=0",
-"0*57*3=0",
-"0*57*4=0",
-"0*57*5=0",
-"0*57*6=0",
-"0*57*7=0",
-"0*57*8=0",
-"0*57*9=0",
-"0*57/1=0",
-"0*57/2=0",
-"0*57/3=0",
-"0*57/4=0",
-"0*57/5=0",
-"0*57/6=0",
-"0*57/7=0",
-"0*57/8=0",
-"0*57/9=0",
-"0*5800=0",
-"0*5801=0",
-"0*5802=0",
-"0*5803=0",
-"0*5804=0",
-"0*5805=0",
-"0*5806=0",
-"0*5807=0",
-"0*5808=0",
-"0*5809=0",
-"0*5810=0",
-"0*5811=0",
-"0*5812=0",
-"0*5813=0",
-"0*5814=0",
-"0*5815=0",
-"0*5816=0",
-"0*5817=0",
-"0*5818=0",
-"0*5819=0",
-"0*5820=0",
-"0*5821=0",
-"0*5822=0",
-"0*5823=0",
-"0*5824=0",
-"0*5825=0",
-"0*5826=0",
-"0*5827=0",
-"0*5828=0",
-"0*5829=0",
-"0*5830=0",
-"0*5831=0",
-"0*5832=0",
-"0*5833=0",
-"0*5834=0",
-"0*5835=0",
-"0*5836=0",
-"0*5837=0",
-"0*5838=0",
-"0*5839=0",
-"0*5840=0",
-"0*5841=0",
-"0*5842=0",
-"0*5843=0",
-"0*5844=0",
-"0*5845=0",
-"0*5846=0",
-"0*5847=0",
-"0*5848=0",
-"0*5849=0",
-"0*5850=0",
-"0*5851=0",
-"0*5852=0",
-"0*5853=0",
-"0*5854=0",
-"0*5855=0",
-"0*5856=0",
-"0*5857=0",
-"0*5858=0",
-"0*5859=0",
-"0*5860=0",
-"0*5861=0",
-"0*5862=0",
-"0*5863=0",
-"0*5864=0",
-"0*5865=0",
-"0*5866=0",
-"0*5867=0",
-"0*5868=0",
-"0*5869=0",
-"0*5870=0",
-"0*5871=0",
-"0*5872=0",
-"0*5873=0",
-"0*5874=0",
-"0*5875=0",
-"0*5876=0",
-"0*5877=0",
-"0*5878=0",
-"0*5879=0",
-"0*5880=0",
-"0*5881=0",
-"0*5882=0",
-"0*5883=0",
-"0*5884=0",
-"0*5885=0",
-"0*5886=0",
-"0*5887=0",
-"0*5888=0",
-"0*5889=0",
-"0*5890=0",
-"0*5891=0",
-"0*5892=0",
-"0*5893=0",
-"0*5894=0",
-"0*5895=0",
-"0*5896=0",
-"0*5897=0",
-"0*5898=0",
-"0*5899=0",
-"0*58+0=0",
-"0*58+1=1",
-"0*58+2=2",
-"0*58+3=3",
-"0*58+4=4",
-"0*58+5=5",
-"0*58+6=6",
-"0*58+7=7",
-"0*58+8=8",
-"0*58+9=9",
-"0*58-0=0",
-"0*58*0=0",
-"0*58*1=0",
-"0*58*2=0",
-"0*58*3=0",
-"0*58*4=0",
-"0*58*5=0",
-"0*58*6=0",
-"0*58*7=0",
-"0*58*8=0",
-"0*58*9=0",
-"0*58/1=0",
-"0*58/2=0",
-"0*58/3=0",
-"0*58/4=0",
-"0*58/5=0",
-"0*58/6=0",
-"0*58/7=0",
-"0*58/8=0",
-"0*58/9=0",
-"0*5900=0",
-"0*5901=0",
-"0*5902=0",
-"0*5903=0",
-"0*5904=0",
-"0*5905=0",
-"0*5906=0",
-"0*5907=0",
-"0*5908=0",
-"0*5909=0",
-"0*5910=0",
-"0*5911=0",
-"0*5912=0",
-"0*5913=0",
-"0*5914=0",
-"0*5915=0",
-"0*5916=0",
-"0*5917=0",
-"0*5918=0",
-"0*5919=0",
-"0*5920=0",
-"0*5921=0",
-"0*5922=0",
-"0*5923=0",
-"0*5924=0",
-"0*5925=0",
-"0*5926=0",
-"0*5927=0",
-"0*5928=0",
-"0*5929=0",
-"0*5930=0",
-"0*5931=0",
-"0*5932=0",
-"0*5933=0",
-"0*5934=0",
-"0*5935=0",
-"0*5936=0",
-"0*5937=0",
-"0*5938=0",
-"0*5939=0",
-"0*5940=0",
-"0*5941=0",
-"0*5942=0",
-"0*5943=0",
-"0*5944=0",
-"0*5945=0",
-"0*5946=0",
-"0*5947=0",
-"0*5948=0",
-"0*5949=0",
-"0*5950=0",
-"0*5951=0",
-"0*5952=0",
-"0*5953=0",
-"0*5954=0",
-"0*5955=0",
-"0*5956=0",
-"0*5957=0",
-"0*5958=0",
-"0*5959=0",
-"0*5960=0",
-"0*5961=0",
-"0*5962=0",
-"0*5963=0",
-"0*5964=0",
-"0*5965=0",
-"0*5966=0",
-"0*5967=0",
-"0*5968=0",
-"0*5969=0",
-"0*5970=0",
-"0*5971=0",
-"0*5972=0",
-"0*5973=0",
-"0*5974=0",
-"0*5975=0",
-"0*5976=0",
-"0*5977=0",
-"0*5978=0",
-"0*5979=0",
-"0*5980=0",
-"0*5981=0",
-"0*5982=0",
-"0*5983=0",
-"0*5984=0",
-"0*5985=0",
-"0*5986=0",
-"0*5987=0",
-"0*5988=0",
-"0*5989=0",
-"0*5990=0",
-"0*5991=0",
-"0*5992=0",
-"0*5993=0",
-"0*5994=0",
-"0*5995=0",
-"0*5996=0",
-"0*5997=0",
-"0*5998=0",
-"0*5999=0",
-"0*59+0=0",
-"0*59+1=1",
-"0*59+2=2",
-"0*59+3=3",
-"0*59+4=4",
-"0*59+5=5",
-"0*59+6=6",
-"0*59+7=7",
-"0*59+8=8",
-"0*59+9=9",
-"0*59-0=0",
-"0*59*0=0",
-"0*59*1=0",
-"0*59*2=0",
-"0*59*3=0",
-"0*59*4=0",
-"0*59*5=0",
-"0*59*6=0",
-"0*59*7=0",
-"0*59*8=0",
-"0*59*9=0",
-"0*59/1=0",
-"0*59/2=0",
-"0*59/3=0",
-"0*59/4=0",
-"0*59/5=0",
-"0*59/6=0",
-"0*59/7=0",
-"0*59/8=0",
-"0*59/9=0",
-"0*5-1=-1",
-"0*5-2=-2",
-"0*5-3=-3",
-"0*5-4=-4",
-"0*5-5=-5",
-"0*5-6=-6",
-"0*5-7=-7",
-"0*5-8=-8",
-"0*5-9=-9",
-"0*5*10=0",
-"0*5*11=0",
-"0*5*12=0",
-"0*5*13=0",
-"0*5*14=0",
-"0*5*15=0",
-"0*5*16=0",
-"0*5*17=0",
-"0*5*18=0",
-"0*5*19=0",
-"0*5*20=0",
-"0*5*21=0",
-"0*5*22=0",
-"0*5*23=0",
-"0*5*24=0",
-"0*5*25=0",
-"0*5*26=0",
-"0*5*27=0",
-"0*5*28=0",
-"0*5*29=0",
-"0*5*30=0",
-"0*5*31=0",
-"0*5*32=0",
-"0*5*33=0",
-"0*5*34=0",
-"0*5*35=0",
-"0*5*36=0",
-"0*5*37=0",
-"0*5*38=0",
-"0*5*39=0",
-"0*5*40=0",
-"0*5*41=0",
-"0*5*42=0",
-"0*5*43=0",
-"0*5*44=0",
-"0*5*45=0",
-"0*5*46=0",
-"0*5*47=0",
-"0*5*48=0",
-"0*5*49=0",
-"0*5*50=0",
-"0*5*51=0",
-"0*5*52=0",
-"0*5*53=0",
-"0*5*54=0",
-"0*5*55=0",
-"0*5*56=0",
-"0*5*57=0",
-"0*5*58=0",
-"0*5*59=0",
-"0*5*60=0",
-"0*5*61=0",
-"0*5*62=0",
-"0*5*63=0",
-"0*5*64=0",
-"0*5*65=0",
-"0*5*66=0",
-"0*5*67=0",
-"0*5*68=0",
-"0*5*69=0",
-"0*5*70=0",
-"0*5*71=0",
-"0*5*72=0",
-"0*5*73=0",
-"0*5*74=0",
-"0*5*75=0",
-"0*5*76=0",
-"0*5*77=0",
-"0*5*78=0",
-"0*5*79=0",
-"0*5*80=0",
-"0*5*81=0",
-"0*5*82=0",
-"0*5*83=0",
-"0*5*84=0",
-"0*5*85=0",
-"0*5*86=0",
-"0*5*87=0",
-"0*5*88=0",
-"0*5*89=0",
-"0*5*90=0",
-"0*5*91=0",
-"0*5*92=0",
-"0*5*93=0",
-"0*5*94=0",
-"0*5*95=0",
-"0*5*96=0",
-"0*5*97=0",
-"0*5*98=0",
-"0*5*99=0",
-"0*5/10=0",
-"0*5/11=0",
-"0*5/12=0",
-"0*5/13=0",
-"0*5/14=0",
-"0*5/15=0",
-"0*5/16=0",
-"0*5/17=0",
-"0*5/18=0",
-"0*5/19=0",
-"0*5/20=0",
-"0*5/21=0",
-"0*5/22=0",
-"0*5/23=0",
-"0*5/24=0",
-"0*5/25=0",
-"0*5/26=0",
-"0*5/27=0",
-"0*5/28=0",
-"0*5/29=0",
-"0*5/30=0",
-"0*5/31=0",
-"0*5/32=0",
-"0*5/33=0",
-"0*5/34=0",
-"0*5/35=0",
-"0*5/36=0",
-"0*5/37=0",
-"0*5/38=0",
-"0*5/39=0",
-"0*5/40=0",
-"0*5/41=0",
-"0*5/42=0",
-"0*5/43=0",
-"0*5/44=0",
-"0*5/45=0",
-"0*5/46=0",
-"0*5/47=0",
-"0*5/48=0",
-"0*5/49=0",
-"0*5/50=0",
-"0*5/51=0",
-"0*5/52=0",
-"0*5/53=0",
-"0*5/54=0",
-"0*5/55=0",
-"0*5/56=0",
-"0*5/57=0",
-"0*5/58=0",
-"0*5/59=0",
-"0*5/60=0",
-"0*5/61=0",
-"0*5/62=0",
-"0*5/63=0",
-"0*5/64=0",
-"0*5/65=0",
-"0*5/66=0",
-"0*5/67=0",
-"0*5/68=0",
-"0*5/69=0",
-"0*5/70=0",
-"0*5/71=0",
-"0*5/72=0",
-"0*5/73=0",
-"0*5/74=0",
-"0*5/75=0",
-"0*5/76=0",
-"0*5/77=0",
-"0*5/78=0",
-"0*5/79=0",
-"0*5/80=0",
-"0*5/81=0",
-"0*5/82=0",
-"0*5/83=0",
-"0*5/84=0",
-"0*5/85=0",
-"0*5/86=0",
-"0*5/87=0",
-"0*5/88=0",
-"0*5/89=0",
-"0*5/90=0",
-"0*5/91=0",
-"0*5/92=0",
-"0*5/93=0",
-"0*5/94=0",
-"0*5/95=0",
-"0*5/96=0",
-"0*5/97=0",
-"0*5/98=0",
-"0*5/99=0",
-"0*6000=0",
-"0*6001=0",
-"0*6002=0",
-"0*6003=0",
-"0*6004=0",
-"0*6005=0",
-"0*6006=0",
-"0*6007=0",
-"0*6008=0",
-"0*6009=0",
-"0*6010=0",
-"0*6011=0",
-"0*6012=0",
-"0*6013=0",
-"0*6014=0",
-"0*6015=0",
-"0*6016=0",
-"0*6017=0",
-"0*6018=0",
-"0*6019=0",
-"0*6020=0",
-"0*6021=0",
-"0*6022=0",
-"0*6023=0",
-"0*6024=0",
-"0*6025=0",
-"0*6026=0",
-"0*6027=0",
-"0*6028=0",
-"0*6029=0",
-"0*6030=0",
-"0*6031=0",
-"0*6032=0",
-"0*6033=0",
-"0*6034=0",
-"0*6035=0",
-"0*6036=0",
-"0*6037=0",
-"0*6038=0",
-"0*6039=0",
-"0*6040=0",
-"0*6041=0",
-"0*6042=0",
-"0*6043=0",
-"0*6044=0",
-"0*6045=0",
-"0*6046=0",
-"0*6047=0",
-"0*6048=0",
-"0*6049=0",
-"0*6050=0",
-"0*6051=0",
-"0*6052=0",
-"0*6053=0",
-"0*6054=0",
-"0*6055=0",
-"0*6056=0",
-"0*6057=0",
-"0*6058=0",
-"0*6059=0",
-"0*6060=0",
-"0*6061=0",
-"0*6062=0",
-"0*6063=0",
-"0*6064=0",
-"0*6065=0",
-"0*6066=0",
-"0*6067=0",
-"0*6068=0",
-"0*6069=0",
-"0*6070=0",
-"0*6071=0",
-"0*6072=0",
-"0*6073=0",
-"0*6074=0",
-"0*6075=0",
-"0*6076=0",
-"0*6077=0",
-"0*6078=0",
-"0*6079=0",
-"0*6080=0",
-"0*6081=0",
-"0*6082=0",
-"0*6083=0",
-"0*6084=0",
-"0*6085=0",
-"0*6086=0",
-"0*6087=0",
-"0*6088=0",
-"0*6089=0",
-"0*6090=0",
-"0*6091=0",
-"0*6092=0",
-"0*6093=0",
-"0*6094=0",
-"0*6095=0",
-"0*6096=0",
-"0*6097=0",
-"0*6098=0",
-"0*6099=0",
-"0*60+0=0",
-"0*60+1=1",
-"0*60+2=2",
-"0*60+3=3",
-"0*60+4=4",
-"0*60+5=5",
-"0*60+6=6",
-"0*60+7=7",
-"0*60+8=8",
-"0*60+9=9",
-"0*60-0=0",
-"0*60*0=0",
-"0*60*1=0",
-"0*60*2=0",
-"0*60*3=0",
-"0*60*4=0",
-"0*60*5=0",
-"0*60*6=0",
-"0*60*7=0",
-"0*60*8=0",
-"0*60*9=0",
-"0*60/1=0",
-"0*60/2=0",
-"0*60/3=0",
-"0*60/4=0",
-"0*60/5=0",
-"0*60/6=0",
-"0*60/7=0",
-"0*60/8=0",
-"0*60/9=0",
-"0*6100=0",
-"0*6101=0",
-"0*6102=0",
-"0*6103=0",
-"0*6104=0",
-"0*6105=0",
-"0*6106=0",
-"0*6107=0",
-"0*6108=0",
-"0*6109=0",
-"0*6110=0",
-"0*6111=0",
-"0*6112=0",
-"0*6113=0",
-"0*6114=0",
-"0*6115=0",
-"0*6116=0",
-"0*6117=0",
-"0*6118=0",
-"0*6119=0",
-"0*6120=0",
-"0*6121=0",
-"0*6122=0",
-"0*6123=0",
-"0*6124=0",
-"0*6125=0",
-"0*6126=0",
-"0*6127=0",
-"0*6128=0",
-"0*6129=0",
-"0*6130=0",
-"0*6131=0",
-"0*6132=0",
-"0*6133=0",
-"0*6134=0",
-"0*6135=0",
-"0*6136=0",
-"0*6137=0",
-"0*6138=0",
-"0*6139=0",
-"0*6140=0",
-"0*6141=0",
-"0*6142=0",
-"0*6143=0",
-"0*6144=0",
-"0*6145=0",
-"0*6146=0",
-"0*6147=0",
-"0*6148=0",
-"0*6149=0",
-"0*6150=0",
-"0*6151=0",
-"0*6152=0",
-"0*6153=0",
-"0*6154=0",
-"0*6155=0",
-"0*6156=0",
-"0*6157=0",
-"0*6158=0",
-"0*6159=0",
-"0*6160=0",
-"0*6161=0",
-"0*6162=0",
-"0*6163=0",
-"0*6164=0",
-"0*6165=0",
-"0*6166=0",
-"0*6167=0",
-"0*6168=0",
-"0*6169=0",
-"0*6170=0",
-"0*6171=0",
-"0*6172=0",
-"0*6173=0",
-"0*6174=0",
-"0*6175=0",
-"0*6176=0",
-"0*6177=0",
-"0*6178=0",
-"0*6179=0",
-"0*6180=0",
-"0*6181=0",
-"0*6182=0",
-"0*6183=0",
-"0*6184=0",
-"0*6185=0",
-"0*6186=0",
-"0*6187=0",
-"0*6188=0",
-"0*6189=0",
-"0*6190=0",
-"0*6191=0",
-"0*6192=0",
-"0*6193=0",
-"0*6194=0",
-"0*6195=0",
-"0*6196=0",
-"0*6197=0",
-"0*6198=0",
-"0*6199=0",
-"0*61+0=0",
-"0*61+1=1",
-"0*61+2=2",
-"0*61+3=3",
-"0*61+4=4",
-"0*61+5=5",
-"0*61+6=6",
-"0*61+7=7",
-"0*61+8=8",
-"0*61+9=9",
-"0*61-0=0",
-"0*61*0=0",
-"0*61*1=0",
-"0*61*2=0",
-"0*61*3=0",
-"0*61*4=0",
-"0*61*5=0",
-"0*61*6=0",
-"0*61*7=0",
-"0*61*8=0",
-"0*61*9=0",
-"0*61/1=0",
-"0*61/2=0",
-"0*61/3=0",
-"0*61/4=0",
-"0*61/5=0",
-"0*61/6=0",
-"0*61/7=0",
-"0*61/8=0",
-"0*61/9=0",
-"0*6200=0",
-"0*6201=0",
-"0*6202=0",
-"0*6203=0",
-"0*6204=0",
-"0*6205=0",
-"0*6206=0",
-"0*6207=0",
-"0*6208=0",
-"0*6209=0",
-"0*6210=0",
-"0*6211=0",
-"0*6212=0",
-"0*6213=0",
-"0*6214=0",
-"0*6215=0",
-"0*6216=0",
-"0*6217=0",
-"0*6218=0",
-"0*6219=0",
-"0*6220=0",
-"0*6221=0",
-"0*6222=0",
-"0*6223=0",
-"0*6224=0",
-"0*6225=0",
-"0*6226=0",
-"0*6227=0",
-"0*6228=0",
-"0*6229=0",
-"0*6230=0",
-"0*6231=0",
-"0*6232=0",
-"0*6233=0",
-"0*6234=0",
-"0*6235=0",
-"0*6236=0",
-"0*6237=0",
-"0*6238=0",
-"0*6239=0",
-"0*6240=0",
-"0*6241=0",
-"0*6242=0",
-"0*6243=0",
-"0*6244=0",
-"0*6245=0",
-"0*6246=0",
-"0*6247=0",
-"0*6248=0",
-"0*6249=0",
-"0*6250=0",
-"0*6251=0",
-"0*6252=0",
-"0*6253=0",
-"0*6254=0",
-"0*6255=0",
-"0*6256=0",
-"0*6257=0",
-"0*6258=0",
-"0*6259=0",
-"0*6260=0",
-"0*6261=0",
-"0*6262=0",
-"0*6263=0",
-"0*6264=0",
-"0*6265=0",
-"0*6266=0",
-"0*6267=0",
-"0*6268=0",
-"0*6269=0",
-"0*6270=0",
-"0*6271=0",
-"0*6272=0",
-"0*6273=0",
-"0*6274=0",
-"0*6275=0",
-"0*6276=0",
-"0*6277=0",
-"0*6278=0",
-"0*6279=0",
-"0*6280=0",
-"0*6281=0",
-"0*6282=0",
-"0*6283=0",
-"0*6284=0",
-"0*6285=0",
-"0*6286=0",
-"0*6287=0",
-"0*6288=0",
-"0*6289=0",
-"0*6290=0",
-"0*6291=0",
-"0*6292=0",
-"0*6293=0",
-"0*6294=0",
-"0*6295=0",
-"0*6296=0",
-"0*6297=0",
-"0*6298=0",
-"0*6299=0",
-"0*62+0=0",
-"0*62+1=1",
-"0*62+2=2",
-"0*62+3=3",
-"0*62+4=4",
-"0*62+5=5",
-"0*62+6=6",
-"0*62+7=7",
-"0*62+8=8",
-"0*62+9=9",
-"0*62-0=0",
-"0*62*0=0",
-"0*62*1=0",
-"0*62*2=0",
-"0*62*3=0",
-"0*62*4=0",
-"0*62*5=0",
-"0*62*6=0",
-"0*62*7=0",
-"0*62*8=0",
-"0*62*9=0",
-"0*62/1=0",
-"0*62/2=0",
-"0*62/3=0",
-"0*62/4=0",
-"0*62/5=0",
-"0*62/6=0",
-"0*62/7=0",
-"0*62/8=0",
-"0*62/9=0",
-"0*6300=0",
-"0*6301=0",
-"0*6302=0",
-"0*6303=0",
-"0*6304=0",
-"0*6305=0",
-"0*6306=0",
-"0*6307=0",
-"0*6308=0",
-"0*6309=0",
-"0*6310=0",
-"0*6311=0",
-"0*6312=0",
-"0*6313=0",
-"0*6314=0",
-"0*6315=0",
-"0*6316=0",
-"0*6317=0",
-"0*6318=0",
-"0*6319=0",
-"0*6320=0",
-"0*6321=0",
-"0*6322=0",
-"0*6323=0",
-"0*6324=0",
-"0*6325=0",
-"0*6326=0",
-"0*6327=0",
-"0*6328=0",
-"0*6329=0",
-"0*6330=0",
-"0*6331=0",
-"0*6332=0",
-"0*6333=0",
-"0*6334=0",
-"0*6335=0",
-"0*6336=0",
-"0*6337=0",
-"0*6338=0",
-"0*6339=0",
-"0*6340=0",
-"0*6341=0",
-"0*6342=0",
-"0*6343=0",
-"0*6344=0",
-"0*6345=0",
-"0*6346=0",
-"0*6347=0",
-"0*6348=0",
-"0*6349=0",
-"0*6350=0",
-"0*6351=0",
-"0*6352=0",
-"0*6353=0",
-"0*6354=0",
-"0*6355=0",
-"0*6356=0",
-"0*6357=0",
-"0*6358=0",
-"0*6359=0",
-"0*6360=0",
-"0*6361=0",
-"0*6362=0",
-"0*6363=0",
-"0*6364=0",
-"0*6365=0",
-"0*6366=0",
-"0*6367=0",
-"0*6368=0",
-"0*6369=0",
-"0*6370=0",
-"0*6371=0",
-"0*6372=0",
-"0*6373=0",
-"0*6374=0",
-"0*6375=0",
-"0*6376=0",
-"0*6377=0",
-"0*6378=0",
-"0*6379=0",
-"0*6380=0",
-"0*6381=0",
-"0*6382=0",
-"0*6383=0",
-"0*6384=0",
-"0*6385=0",
-"0*6386=0",
-"0*6387=0",
-"0*6388=0",
-"0*6389=0",
-"0*6390=0",
-"0*6391=0",
-"0*6392=0",
-"0*6393=0",
-"0*6394=0",
-"0*6395=0",
-"0*6396=0",
-"0*6397=0",
-"0*6398=0",
-"0*6399=0",
-"0*63+0=0",
-"0*63+1=1",
-"0*63+2=2",
-"0*63+3=3",
-"0*63+4=4",
-"0*63+5=5",
-"0*63+6=6",
-"0*63+7=7",
-"0*63+8=8",
-"0*63+9=9",
-"0*63-0=0",
-"0*63*0=0",
-"0*63*1=0",
-"0*63*2=0",
-"0*63*3=0",
-"0*63*4=0",
-"0*63*5=0",
-"0*63*6=0",
-"0*63*7=0",
-"0*63*8=0",
-"0*63*9=0",
-"0*63/1=0",
-"0*63/2=0",
-"0*63/3=0",
-"0*63/4=0",
-"0*63/5=0",
-"0*63/6=0",
-"0*63/7=0",
-"0*63/8=0",
-"0*63/9=0",
-"0*6400=0",
-"0*6401=0",
-"0*6402=0",
-"0*6403=0",
-"0*6404=0",
-"0*6405=0",
-"0*6406=0",
-"0*6407=0",
-"0*6408=0",
-"0*6409=0",
-"0*6410=0",
-"0*6411=0",
-"0*6412=0",
-"0*6413=0",
-"0*6414=0",
-"0*6415=0",
-"0*6416=0",
-"0*6417=0",
-"0*6418=0",
-"0*6419=0",
-"0*6420=0",
-"0*6421=0",
-"0*6422=0",
-"0*6423=0",
-"0*6424=0",
-"0*6425=0",
-"0*6426=0",
-"0*6427=0",
-"0*6428=0",
-"0*6429=0",
-"0*6430=0",
-"0*6431=0",
-"0*6432=0",
-"0*6433=0",
-"0*6434=0",
-"0*6435=0",
-"0*6436=0",
-"0*6437=0",
-"0*6438=0",
-"0*6439=0",
-"0*6440=0",
-"0*6441=0",
-"0*6442=0",
-"0*6443=0",
-"0*6444=0",
-"0*6445=0",
-"0*6446=0",
-"0*6447=0",
-"0*6448=0",
-"0*6449=0",
-"0*6450=0",
-"0*6451=0",
-"0*6452=0",
-"0*6453=0",
-"0*6454=0",
-"0*6455=0",
-"0*6456=0",
-"0*6457=0",
-"0*6458=0",
-"0*6459=0",
-"0*6460=0",
-"0*6461=0",
-"0*6462=0",
-"0*6463=0",
-"0*6464=0",
-"0*6465=0",
-"0*6466=0",
-"0*6467=0",
-"0*6468=0",
-"0*6469=0",
-"0*6470=0",
-"0*6471=0",
-"0*6472=0",
-"0*6473=0",
-"0*6474=0",
-"0*6475=0",
-"0*6476=0",
-"0*6477=0",
-"0*6478=0",
-"0*6479=0",
-"0*6480=0",
-"0*6481=0",
-"0*6482=0",
-"0*6483=0",
-"0*6484=0",
-"0*6485=0",
-"0*6486=0",
-"0*6487=0",
-"0*6488=0",
-"0*6489=0",
-"0*6490=0",
-"0*6491=0",
-"0*6492=0",
-"0*6493=0",
-"0*6494=0",
-"0*6495=0",
-"0*6496=0",
-"0*6497=0",
-"0*6498=0",
-"0*6499=0",
-"0*64+0=0",
-"0*64+1=1",
-"0*64+2=2",
-"0*64+3=3",
-"0*64+4=4",
-"0*64+5=5",
-"0*64+6=6",
-"0*64+7=7",
-"0*64+8=8",
-"0*64+9=9",
-"0*64-0=0",
-"0*64*0=0",
-"0*64*1=0",
-"0*64*2=0",
-"0*64*3=0",
-"0*64*4=0",
-"0*64*5=0",
-"0*64*6=0",
-"0*64*7=0",
-"0*64*8=0",
-"0*64*9=0",
-"0*64/1=0",
-"0*64/2=0",
-"0*64/3=0",
-"0*64/4=0",
-"0*64/5=0",
-"0*64/6=0",
-"0*64/7=0",
-"0*64/8=0",
-"0*64/9=0",
-"0*6500=0",
-"0*6501=0",
-"0*6502=0",
-"0*6503=0",
-"0*6504=0",
-"0*6505=0",
-"0*6506=0",
-"0*6507=0",
-"0*6508=0",
-"0*6509=0",
-"0*6510=0",
-"0*6511=0",
-"0*6512=0",
-"0*6513=0",
-"0*6514=0",
-"0*6515=0",
-"0*6516=0",
-"0*6517=0",
-"0*6518=0",
-"0*6519=0",
-"0*6520=0",
-"0*6521=0",
-"0*6522=0",
-"0*6523=0",
-"0*6524=0",
-"0*6525=0",
-"0*6526=0",
-"0*6527=0",
-"0*6528=0",
-"0*6529=0",
-"0*6530=0",
-"0*6531=0",
-"0*6532=0",
-"0*6533=0",
-"0*6534=0",
-"0*6535=0",
-"0*6536=0",
-"0*6537=0",
-"0*6538=0",
-"0*6539=0",
-"0*6540=0",
-"0*6541=0",
-"0*6542=0",
-"0*6543=0",
-"0*6544=0",
-"0*6545=0",
-"0*6546=0",
-"0*6547=0",
-"0*6548=0",
-"0*6549=0",
-"0*6550=0",
-"0*6551=0",
-"0*6552=0",
-"0*6553=0",
-"0*6554=0",
-"0*6555=0",
-"0*6556=0",
-"0*6557=0",
-"0*6558=0",
-"0*6559=0",
-"0*6560=0",
-"0*6561=0",
-"0*6562=0",
-"0*6563=0",
-"0*6564=0",
-"0*6565=0",
-"0*6566=0",
-"0*6567=0",
-"0*6568=0",
-"0*6569=0",
-"0*6570=0",
-"0*6571=0",
-"0*6572=0",
-"0*6573=0",
-"0*6574=0",
-"0*6575=0",
-"0*6576=0",
-"0*6577=0",
-"0*6578=0",
-"0*6579=0",
-"0*6580=0",
-"0*6581=0",
-"0*6582=0",
-"0*6583=0",
-"0*6584=0",
-"0*6585=0",
-"0*6586=0",
-"0*6587=0",
-"0*6588=0",
-"0*6589=0",
-"0*6590=0",
-"0*6591=0",
-"0*6592=0",
-"0*6593=0",
-"0*6594=0",
-"0*6595=0",
-"0*6596=0",
-"0*6597=0",
-"0*6598=0",
-"0*6599=0",
-"0*65+0=0",
-"0*65+1=1",
-"0*65+2=2",
-"0*65+3=3",
-"0*65+4=4",
-"0*65+5=5",
-"0*65+6=6",
-"0*65+7=7",
-"0*65+8=8",
-"0*65+9=9",
-"0*65-0=0",
-"0*65*0=0",
-"0*65*1=0",
-"0*65*2=0",
-"0*65*3=0",
-"0*65*4=0",
-"0*65*5=0",
-"0*65*6=0",
-"0*65*7=0",
-"0*65*8=0",
-"0*65*9=0",
-"0*65/1=0",
-"0*65/2=0",
-"0*65/3=0",
-"0*65/4=0",
-"0*65/5=0",
-"0*65/6=0",
-"0*65/7=0",
-"0*65/8=0",
-"0*65/9=0",
-"0*6600=0",
-"0*6601=0",
-"0*6602=0",
-"0*6603=0",
-"0*6604=0",
-"0*6605=0",
-"0*6606=0",
-"0*6607=0",
-"0*6608=0",
-"0*6609=0",
-"0*6610=0",
-"0*6611=0",
-"0*6612=0",
-"0*6613=0",
-"0*6614=0",
-"0*6615=0",
-"0*6616=0",
-"0*6617=0",
-"0*6618=0",
-"0*6619=0",
-"0*6620=0",
-"0*6621=0",
-"0*6622=0",
-"0*6623=0",
-"0*6624=0",
-"0*6625=0",
-"0*6626=0",
-"0*6627=0",
-"0*6628=0",
-"0*6629=0",
-"0*6630=0",
-"0*6631=0",
-"0*6632=0",
-"0*6633=0",
-"0*6634=0",
-"0*6635=0",
-"0*6636=0",
-"0*6637=0",
-"0*6638=0",
-"0*6639=0",
-"0*6640=0",
-"0*6641=0",
-"0*6642=0",
-"0*6643=0",
-"0*6644=0",
-"0*6645=0",
-"0*6646=0",
-"0*6647=0",
-"0*6648=0",
-"0*6649=0",
-"0*6650=0",
-"0*6651=0",
-"0*6652=0",
-"0*6653=0",
-"0*6654=0",
-"0*6655=0",
-"0*6656=0",
-"0*6657=0",
-"0*6658=0",
-"0*6659=0",
-"0*6660=0",
-"0*6661=0",
-"0*6662=0",
-"0*6663=0",
-"0*6664=0",
-"0*6665=0",
-"0*6666=0",
-"0*6667=0",
-"0*6668=0",
-"0*6669=0",
-"0*6670=0",
-"0*6671=0",
-"0*6672=0",
-"0*6673=0",
-"0*6674=0",
-"0*6675=0",
-"0*6676=0",
-"0*6677=0",
-"0*6678=0",
-"0*6679=0",
-"0*6680=0",
-"0*6681=0",
-"0*6682=0",
-"0*6683=0",
-"0*6684=0",
-"0*6685=0",
-"0*6686=0",
-"0*6687=0",
-"0*6688=0",
-"0*6689=0",
-"0*6690=0",
-"0*6691=0",
-"0*6692=0",
-"0*6693=0",
-"0*6694=0",
-"0*6695=0",
-"0*6696=0",
-"0*6697=0",
-"0*6698=0",
-"0*6699=0",
-"0*66+0=0",
-"0*66+1=1",
-"0*66+2=2",
-"0*66+3=3",
-"0*66+4=4",
-"0*66+5=5",
-"0*66+6=6",
-"0*66+7=7",
-"0*66+8=8",
-"0*66+9=9",
-"0*66-0=0",
-"0*66*0=0",
-"0*66*1=0",
-"0*66*2=0",
-"0*66*3=0",
-"0*66*4=0",
-"0*66*5=0",
-"0*66*6=0",
-"0*66*7=0",
-"0*66*8=0",
-"0*66*9=0",
-"0*66/1=0",
-"0*66/2=0",
-"0*66/3=0",
-"0*66/4=0",
-"0*66/5=0",
-"0*66/6=0",
-"0*66/7=0",
-"0*66/8=0",
-"0*66/9=0",
-"0*6700=0",
-"0*6701=0",
-"0*6702=0",
-"0*6703=0",
-"0*6704=0",
-"0*6705=0",
-"0*6706=0",
-"0*6707=0",
-"0*6708=0",
-"0*6709=0",
-"0*6710=0",
-"0*6711=0",
-"0*6712=0",
-"0*6713=0",
-"0*6714=0",
-"0*6715=0",
-"0*6716=0",
-"0*6717=0",
-"0*6718=0",
-"0*6719=0",
-"0*6720=0",
-"0*6721=0",
-"0*6722=0",
-"0*6723=0",
-"0*6724=0",
-"0*6725=0",
-"0*6726=0",
-"0*6727=0",
-"0*6728=0",
-"0*6729=0",
-"0*6730=0",
-"0*6731=0",
-"0*6732=0",
-"0*6733=0",
-"0*6734=0",
-"0*6735=0",
-"0*6736=0",
-"0*6737=0",
-"0*6738=0",
-"0*6739=0",
-"0*6740=0",
-"0*6741=0",
-"0*6742=0",
-"0*6743=0",
-"0*6744=0",
-"0*6745=0",
-"0*6746=0",
-"0*6747=0",
-"0*6748=0",
-"0*6749=0",
-"0*6750=0",
-"0*6751=0",
-"0*6752=0",
-"0*6753=0",
-"0*6754=0",
-"0*6755=0",
-"0*6756=0",
-"0*6757=0",
-"0*6758=0",
-"0*6759=0",
-"0*6760=0",
-"0*6761=0",
-"0*6762=0",
-"0*6763=0",
-"0*6764=0",
-"0*6765=0",
-"0*6766=0",
-"0*6767=0",
-"0*6768=0",
-"0*6769=0",
-"0*6770=0",
-"0*6771=0",
-"0*6772=0",
-"0*6773=0",
-"0*6774=0",
-"0*6775=0",
-"0*6776=0",
-"0*6777=0",
-"0*6778=0",
-"0*6779=0",
-"0*6780=0",
-"0*6781=0",
-"0*6782=0",
-"0*6783=0",
-"0*6784=0",
-"0*6785=0",
-"0*6786=0",
-"0*6787=0",
-"0*6788=0",
-"0*6789=0",
-"0*6790=0",
-"0*6791=0",
-"0*6792=0",
-"0*6793=0",
-"0*6794=0",
-"0*6795=0",
-"0*6796=0",
-"0*6797=0",
-"0*6798=0",
-"0*6799=0",
-"0*67+0=0",
-"0*67+1=1",
-"0*67+2=2",
-"0*67+3=3",
-"0*67+4=4",
-"0*67+5=5",
-"0*67+6=6",
-"0*67+7=7",
-"0*67+8=8",
-"0*67+9=9",
-"0*67-0=0",
-"0*67*0=0",
-"0*67*1=0",
-"0*67*2=0",
-"0*67*3=0",
-"0*67*4=0",
-"0*67*5=0",
-"0*67*6=0",
-"0*67*7=0",
-"0*67*8=0",
-"0*67*9=0",
-"0*67/1=0",
-"0*67/2=0",
-"0*67/3=0",
-"0*67/4=0",
-"0*67/5=0",
-"0*67/6=0",
-"0*67/7=0",
-"0*67/8=0",
-"0*67/9=0",
-"0*6800=0",
-"0*6801=0",
-"0*6802=0",
-"0*6803=0",
-"0*6804=0",
-"0*6805=0",
-"0*6806=0",
-"0*6807=0",
-"0*6808=0",
-"0*6809=0",
-"0*6810=0",
-"0*6811=0",
-"0*6812=0",
-"0*6813=0",
-"0*6814=0",
-"0*6815=0",
-"0*6816=0",
-"0*6817=0",
-"0*6818=0",
-"0*6819=0",
-"0*6820=0",
-"0*6821=0",
-"0*6822=0",
-"0*6823=0",
-"0*6824=0",
-"0*6825=0",
-"0*6826=0",
-"0*6827=0",
-"0*6828=0",
-"0*6829=0",
-"0*6830=0",
-"0*6831=0",
-"0*6832=0",
-"0*6833=0",
-"0*6834=0",
-"0*6835=0",
-"0*6836=0",
-"0*6837=0",
-"0*6838=0",
-"0*6839=0",
-"0*6840=0",
-"0*6841=0",
-"0*6842=0",
-"0*6843=0",
-"0*6844=0",
-"0*6845=0",
-"0*6846=0",
-"0*6847=0",
-"0*6848=0",
-"0*6849=0",
-"0*6850=0",
-"0*6851=0",
-"0*6852=0",
-"0*6853=0",
-"0*6854=0",
-"0*6855=0",
-"0*6856=0",
-"0*6857=0",
-"0*6858=0",
-"0*6859=0",
-"0*6860=0",
-"0*6861=0",
-"0*6862=0",
-"0*6863=0",
-"0*6864=0",
-"0*6865=0",
-"0*6866=0",
-"0*6867=0",
-"0*6868=0",
-"0*6869=0",
-"0*6870=0",
-"0*6871=0",
-"0*6872=0",
-"0*6873=0",
-"0*6874=0",
-"0*6875=0",
-"0*6876=0",
-"0*6877=0",
-"0*6878=0",
-"0*6879=0",
-"0*6880=0",
-"0*6881=0",
-"0*6882=0",
-"0*6883=0",
-"0*6884=0",
-"0*6885=0",
-"0*6886=0",
-"0*6887=0",
-"0*6888=0",
-"0*6889=0",
-"0*6890=0",
-"0*6891=0",
-"0*6892=0",
-"0*6893=0",
-"0*6894=0",
-"0*6895=0",
-"0*6896=0",
-"0*6897=0",
-"0*6898=0",
-"0*6899=0",
-"0*68+0=0",
-"0*68+1=1",
-"0*68+2=2",
-"0*68+3=3",
-"0*68+4=4",
-"0*68+5=5",
-"0*68+6=6",
-"0*68+7=7",
-"0*68+8=8",
-"0*68+9=9",
-"0*68-0=0",
-"0*68*0=0",
-"0*68*1=0",
-"0*68*2=0",
-"0*68*3=0",
-"0*68*4=0",
-"0*68*5=0",
-"0*68*6=0",
-"0*68*7=0",
-"0*68*8=0",
-"0*68*9=0",
-"0*68/1=0",
-"0*68/2=0",
-"0*68/3=0",
-"0*68/4=0",
-"0*68/5=0",
-"0*68/6=0",
-"0*68/7=0",
-"0*68/8=0",
-"0*68/9=0",
-"0*6900=0",
-"0*6901=0",
-"0*6902=0",
-"0*6903=0",
-"0*6904=0",
-"0*6905=0",
-"0*6906=0",
-"0*6907=0",
-"0*6908=0",
-"0*6909=0",
-"0*6910=0",
-"0*6911=0",
-"0*6912=0",
-"0*6913=0",
-"0*6914=0",
-"0*6915=0",
-"0*6916=0",
-"0*6917=0",
-"0*6918=0",
-"0*6919=0",
-"0*6920=0",
-"0*6921=0",
-"0*6922=0",
-"0*6923=0",
-"0*6924=0",
-"0*6925=0",
-"0*6926=0",
-"0*6927=0",
-"0*6928=0",
-"0*6929=0",
-"0*6930=0",
-"0*6931=0",
-"0*6932=0",
-"0*6933=0",
-"0*6934=0",
-"0*6935=0",
-"0*6936=0",
-"0*6937=0",
-"0*6938=0",
-"0*6939=0",
-"0*6940=0",
-"0*6941=0",
-"0*6942=0",
-"0*6943=0",
-"0*6944=0",
-"0*6945=0",
-"0*6946=0",
-"0*6947=0",
-"0*6948=0",
-"0*6949=0",
-"0*6950=0",
-"0*6951=0",
-"0*6952=0",
-"0*6953=0",
-"0*6954=0",
-"0*6955=0",
-"0*6956=0",
-"0*6957=0",
-"0*6958=0",
-"0*6959=0",
-"0*6960=0",
-"0*6961=0",
-"0*6962=0",
-"0*6963=0",
-"0*6964=0",
-"0*6965=0",
-"0*6966=0",
-"0*6967=0",
-"0*6968=0",
-"0*6969=0",
-"0*6970=0",
-"0*6971=0",
-"0*6972=0",
-"0*6973=0",
-"0*6974=0",
-"0*6975=0",
-"0*6976=0",
-"0*6977=0",
-"0*6978=0",
-"0*6979=0",
-"0*6980=0",
-"0*6981=0",
-"0*6982=0",
-"0*6983=0",
-"0*6984=0",
-"0*6985=0",
-"0*6986=0",
-"0*6987=0",
-"0*6988=0",
-"0*6989=0",
-"0*6990=0",
-"0*6991=0",
-"0*6992=0",
-"0*6993=0",
-"0*6994=0",
-"0*6995=0",
-"0*6996=0",
-"0*6997=0",
-"0*6998=0",
-"0*6999=0",
-"0*69+0=0",
-"0*69+1=1",
-"0*69+2=2",
-"0*69+3=3",
-"0*69+4=4",
-"0*69+5=5",
-"0*69+6=6",
-"0*69+7=7",
-"0*69+8=8",
-"0*69+9=9",
-"0*69-0=0",
-"0*69*0=0",
-"0*69*1=0",
-"0*69*2=0",
-"0*69*3=0",
-"0*69*4=0",
-"0*69*5=0",
-"0*69*6=0",
-"0*69*7=0",
-"0*69*8=0",
-"0*69*9=0",
-"0*69/1=0",
-"0*69/2=0",
-"0*69/3=0",
-"0*69/4=0",
-"0*69/5=0",
-"0*69/6=0",
-"0*69/7=0",
-"0*69/8=0",
-"0*69/9=0",
-"0*6-1=-1",
-"0*6-2=-2",
-"0*6-3=-3",
-"0*6-4=-4",
-"0*6-5=-5",
-"0*6-6=-6",
-"0*6-7=-7",
-"0*6-8=-8",
-"0*6-9=-9",
-"0*6*10=0",
-"0*6*11=0",
-"0*6*12=0",
-"0*6*13=0",
-"0*6*14=0",
-"0*6*15=0",
-"0*6*16=0",
-"0*6*17=0",
-"0*6*18=0",
-"0*6*19=0",
-"0*6*20=0",
-"0*6*21=0",
-"0*6*22=0",
-"0*6*23=0",
-"0*6*24=0",
-"0*6*25=0",
-"0*6*26=0",
-"0*6*27=0",
-"0*6*28=0",
-"0*6*29=0",
-"0*6*30=0",
-"0*6*31=0",
-"0*6*32=0",
-"0*6*33=0",
-"0*6*34=0",
-"0*6*35=0",
-"0*6*36=0",
-"0*6*37=0",
-"0*6*38=0",
-"0*6*39=0",
-"0*6*40=0",
-"0*6*41=0",
-"0*6*42=0",
-"0*6*43=0",
-"0*6*44=0",
-"0*6*45=0",
-"0*6*46=0",
-"0*6*47=0",
-"0*6*48=0",
-"0*6*49=0",
-"0*6*50=0",
-"0*6*51=0",
-"0*6*52=0",
-"0*6*53=0",
-"0*6*54=0",
-"0*6*55=0",
-"0*6*56=0",
-"0*6*57=0",
-"0*6*58=0",
-"0*6*59=0",
-"0*6*60=0",
-"0*6*61=0",
-"0*6*62=0",
-"0*6*63=0",
-"0*6*64=0",
-"0*6*65=0",
-"0*6*66=0",
-"0*6*67=0",
-"0*6*68=0",
-"0*6*69=0",
-"0*6*70=0",
-"0*6*71=0",
-"0*6*72=0",
-"0*6*73=0",
-"0*6*74=0",
-"0*6*75=0",
-"0*6*76=0",
-"0*6*77=0",
-"0*6*78=0",
-"0*6*79=0",
-"0*6*80=0",
-"0*6*81=0",
-"0*6*82=0",
-"0*6*83=0",
-"0*6*84=0",
-"0*6*85=0",
-"0*6*86=0",
-"0*6*87=0",
-"0*6*88=0",
-"0*6*89=0",
-"0*6*90=0",
-"0*6*91=0",
-"0*6*92=0",
-"0*6*93=0",
-"0*6*94=0",
-"0*6*95=0",
-"0*6*96=0",
-"0*6*97=0",
-"0*6*98=0",
-"0*6*99=0",
-"0*6/10=0",
-"0*6/11=0",
-"0*6/12=0",
-"0*6/13=0",
-"0*6/14=0",
-"0*6/15=0",
-"0*6/16=0",
-"0*6/17=0",
-"0*6/18=0",
-"0*6/19=0",
-"0*6/20=0",
-"0*6/21=0",
-"0*6/22=0",
-"0*6/23=0",
-"0*6/24=0",
-"0*6/25=0",
-"0*6/26=0",
-"0*6/27=0",
-"0*6/28=0",
-"0*6/29=0",
-"0*6/30=0",
-"0*6/31=0",
-"0*6/32=0",
-"0*6/33=0",
-"0*6/34=0",
-"0*6/35=0",
-"0*6/36=0",
-"0*6/37=0",
-"0*6/38=0",
-"0*6/39=0",
-"0*6/40=0",
-"0*6/41=0",
-"0*6/42=0",
-"0*6/43=0",
-"0*6/44=0",
-"0*6/45=0",
-"0*6/46=0",
-"0*6/47=0",
-"0*6/48=0",
-"0*6/49=0",
-"0*6/50=0",
-"0*6/51=0",
-"0*6/52=0",
-"0*6/53=0",
-"0*6/54=0",
-"0*6/55=0",
-"0*6/56=0",
-"0*6/57=0",
-"0*6/58=0",
-"0*6/59=0",
-"0*6/60=0",
-"0*6/61=0",
-"0*6/62=0",
-"0*6/63=0",
-"0*6/64=0",
-"0*6/65=0",
-"0*6/66=0",
-"0*6/67=0",
-"0*6/68=0",
-"0*6/69=0",
-"0*6/70=0",
-"0*6/71=0",
-"0*6/72=0",
-"0*6/73=0",
-"0*6/74=0",
-"0*6/75=0",
-"0*6/76=0",
-"0*6/77=0",
-"0*6/78=0",
-"0*6/79=0",
-"0*6/80=0",
-"0*6/81=0",
-"0*6/82=0",
-"0*6/83=0",
-"0*6/84=0",
-"0*6/85=0",
-"0*6/86=0",
-"0*6/87=0",
-"0*6/88=0",
-"0*6/89=0",
-"0*6/90=0",
-"0*6/91=0",
-"0*6/92=0",
-"0*6/93=0",
-"0*6/94=0",
-"0*6/95=0",
-"0*6/96=0",
-"0*6/97=0",
-"0*6/98=0",
-"0*6/99=0",
-"0*7000=0",
-"0*7001=0",
-"0*7002=0",
-"0*7003=0",
-"0*7004=0",
-"0*7005=0",
-"0*7006=0",
-"0*7007=0",
-"0*7008=0",
-"0*7009=0",
-"0*7010=0",
-"0*7011=0",
-"0*7012=0",
-"0*7013=0",
-"0*7014=0",
-"0*7015=0",
-"0*7016=0",
-"0*7017=0",
-"0*7018=0",
-"0*7019=0",
-"0*7020=0",
-"0*7021=0",
-"0*7022=0",
-"0*7023=0",
-"0*7024=0",
-"0*7025=0",
-"0*7026=0",
-"0*7027=0",
-"0*7028=0",
-"0*7029=0",
-"0*7030=0",
-"0*7031=0",
-"0*7032=0",
-"0*7033=0",
-"0*7034=0",
-"0*7035=0",
-"0*7036=0",
-"0*7037=0",
-"0*7038=0",
-"0*7039=0",
-"0*7040=0",
-"0*7041=0",
-"0*7042=0",
-"0*7043=0",
-"0*7044=0",
-"0*7045=0",
-"0*7046=0",
-"0*7047=0",
-"0*7048=0",
-"0*7049=0",
-"0*7050=0",
-"0*7051=0",
-"0*7052=0",
-"0*7053=0",
-"0*7054=0",
-"0*7055=0",
-"0*7056=0",
-"0*7057=0",
-"0*7058=0",
-"0*7059=0",
-"0*7060=0",
-"0*7061=0",
-"0*7062=0",
-"0*7063=0",
-"0*7064=0",
-"0*7065=0",
-"0*7066=0",
-"0*7067=0",
-"0*7068=0",
-"0*7069=0",
-"0*7070=0",
-"0*7071=0",
-"0*7072=0",
-"0*7073=0",
-"0*7074=0",
-"0*7075=0",
-"0*7076=0",
-"0*7077=0",
-"0*7078=0",
-"0*7079=0",
-"0*7080=0",
-"0*7081=0",
-"0*7082=0",
-"0*7083=0",
-"0*7084=0",
-"0*7085=0",
-"0*7086=0",
-"0*7087=0",
-"0*7088=0",
-"0*7089=0",
-"0*7090=0",
-"0*7091=0",
-"0*7092=0",
-"0*7093=0",
-"0*7094=0",
-"0*7095=0",
-"0*7096=0",
-"0*7097=0",
-"0*7098=0",
-"0*7099=0",
-"0*70+0=0",
-"0*70+1=1",
-"0*70+2=2",
-"0*70+3=3",
-"0*70+4=4",
-"0*70+5=5",
-"0*70+6=6",
-"0*70+7=7",
-"0*70+8=8",
-"0*70+9=9",
-"0*70-0=0",
-"0*70*0=0",
-"0*70*1=0",
-"0*70*2=0",
-"0*70*3=0",
-"0*70*4=0",
-"0*70*5=0",
-"0*70*6=0",
-"0*70*7=0",
-"0*70*8=0",
-"0*70*9=0",
-"0*70/1=0",
-"0*70/2=0",
-"0*70/3=0",
-"0*70/4=0",
-"0*70/5=0",
-"0*70/6=0",
-"0*70/7=0",
-"0*70/8=0",
-"0*70/9=0",
-"0*7100=0",
-"0*7101=0",
-"0*7102=0",
-"0*7103=0",
-"0*7104=0",
-"0*7105=0",
-"0*7106=0",
-"0*7107=0",
-"0*7108=0",
-"0*7109=0",
-"0*7110=0",
-"0*7111=0",
-"0*7112=0",
-"0*7113=0",
-"0*7114=0",
-"0*7115=0",
-"0*7116=0",
-"0*7117=0",
-"0*7118=0",
-"0*7119=0",
-"0*7120=0",
-"0*7121=0",
-"0*7122=0",
-"0*7123=0",
-"0*7124=0",
-"0*7125=0",
-"0*7126=0",
-"0*7127=0",
-"0*7128=0",
-"0*7129=0",
-"0*7130=0",
-"0*7131=0",
-"0*7132=0",
-"0*7133=0",
-"0*7134=0",
-"0*7135=0",
-"0*7136=0",
-"0*7137=0",
-"0*7138=0",
-"0*7139=0",
-"0*7140=0",
-"0*7141=0",
-"0*7142=0",
-"0*7143=0",
-"0*7144=0",
-"0*7145=0",
-"0*7146=0",
-"0*7147=0",
-"0*7148=0",
-"0*7149=0",
-"0*7150=0",
-"0*7151=0",
-"0*7152=0",
-"0*7153=0",
-"0*7154=0",
-"0*7155=0",
-"0*7156=0",
-"0*7157=0",
-"0*7158=0",
-"0*7159=0",
-"0*7160=0",
-"0*7161=0",
-"0*7162=0",
-"0*7163=0",
-"0*7164=0",
-"0*7165=0",
-"0*7166=0",
-"0*7167=0",
-"0*7168=0",
-"0*7169=0",
-"0*7170=0",
-"0*7171=0",
-"0*7172=0",
-"0*7173=0",
-"0*7174=0",
-"0*7175=0",
-"0*7176=0",
-"0*7177=0",
-"0*7178=0",
-"0*7179=0",
-"0*7180=0",
-"0*7181=0",
-"0*7182=0",
-"0*7183=0",
-"0*7184=0",
-"0*7185=0",
-"0*7186=0",
-"0*7187=0",
-"0*7188=0",
-"0*7189=0",
-"0*7190=0",
-"0*7191=0",
-"0*7192=0",
-"0*7193=0",
-"0*7194=0",
-"0*7195=0",
-"0*7196=0",
-"0*7197=0",
-"0*7198=0",
-"0*7199=0",
-"0*71+0=0",
-"0*71+1=1",
-"0*71+2=2",
-"0*71+3=3",
-"0*71+4=4",
-"0*71+5=5",
-"0*71+6=6",
-"0*71+7=7",
-"0*71+8=8",
-"0*71+9=9",
-"0*71-0=0",
-"0*71*0=0",
-"0*71*1=0",
-"0*71*2=0",
-"0*71*3=0",
-"0*71*4=0",
-"0*71*5=0",
-"0*71*6=0",
-"0*71*7=0",
-"0*71*8=0",
-"0*71*9=0",
-"0*71/1=0",
-"0*71/2=0",
-"0*71/3=0",
-"0*71/4=0",
-"0*71/5=0",
-"0*71/6=0",
-"0*71/7=0",
-"0*71/8=0",
-"0*71/9=0",
-"0*7200=0",
-"0*7201=0",
-"0*7202=0",
-"0*7203=0",
-"0*7204=0",
-"0*7205=0",
-"0*7206=0",
-"0*7207=0",
-"0*7208=0",
-"0*7209=0",
-"0*7210=0",
-"0*7211=0",
-"0*7212=0",
-"0*7213=0",
-"0*7214=0",
-"0*7215=0",
-"0*7216=0",
-"0*7217=0",
-"0*7218=0",
-"0*7219=0",
-"0*7220=0",
-"0*7221=0",
-"0*7222=0",
-"0*7223=0",
-"0*7224=0",
-"0*7225=0",
-"0*7226=0",
-"0*7227=0",
-"0*7228=0",
-"0*7229=0",
-"0*7230=0",
-"0*7231=0",
-"0*7232=0",
-"0*7233=0",
-"0*7234=0",
-"0*7235=0",
-"0*7236=0",
-"0*7237=0",
-"0*7238=0",
-"0*7239=0",
-"0*7240=0",
-"0*7241=0",
-"0*7242=0",
-"0*7243=0",
-"0*7244=0",
-"0*7245=0",
-"0*7246=0",
-"0*7247=0",
-"0*7248=0",
-"0*7249=0",
-"0*7250=0",
-"0*7251=0",
-"0*7252=0",
-"0*7253=0",
-"0*7254=0",
-"0*7255=0",
-"0*7256=0",
-"0*7257=0",
-"0*7258=0",
-"0*7259=0",
-"0*7260=0",
-"0*7261=0",
-"0*7262=0",
-"0*7263=0",
-"0*7264=0",
-"0*7265=0",
-"0*7266=0",
-"0*7267=0",
-"0*7268=0",
-"0*7269=0",
-"0*7270=0",
-"0*7271=0",
-"0*7272=0",
-"0*7273=0",
-"0*7274=0",
-"0*7275=0",
-"0*7276=0",
-"0*7277=0",
-"0*7278=0",
-"0*7279=0",
-"0*7280=0",
-"0*7281=0",
-"0*7282=0",
-"0*7283=0",
-"0*7284=0",
-"0*7285=0",
-"0*7286=0",
-"0*7287=0",
-"0*7288=0",
-"0*7289=0",
-"0*7290=0",
-"0*7291=0",
-"0*7292=0",
-"0*7293=0",
-"0*7294=0",
-"0*7295=0",
-"0*7296=0",
-"0*7297=0",
-"0*7298=0",
-"0*7299=0",
-"0*72+0=0",
-"0*72+1=1",
-"0*72+2=2",
-"0*72+3=3",
-"0*72+4=4",
-"0*72+5=5",
-"0*72+6=6",
-"0*72+7=7",
-"0*72+8=8",
-"0*72+9=9",
-"0*72-0=0",
-"0*72*0=0",
-"0*72*1=0",
-"0*72*2=0",
-"0*72*3=0",
-"0*72*4=0",
-"0*72*5=0",
-"0*72*6=0",
-"0*72*7=0",
-"0*72*8=0",
-"0*72*9=0",
-"0*72/1=0",
-"0*72/2=0",
-"0*72/3=0",
-"0*72/4=0",
-"0*72/5=0",
-"0*72/6=0",
-"0*72/7=0",
-"0*72/8=0",
-"0*72/9=0",
-"0*7300=0",
-"0*7301=0",
-"0*7302=0",
-"0*7303=0",
-"0*7304=0",
-"0*7305=0",
-"0*7306=0",
-"0*7307=0",
-"0*7308=0",
-"0*7309=0",
-"0*7310=0",
-"0*7311=0",
-"0*7312=0",
-"0*7313=0",
-"0*7314=0",
-"0*7315=0",
-"0*7316=0",
-"0*7317=0",
-"0*7318=0",
-"0*7319=0",
-"0*7320=0",
-"0*7321=0",
-"0*7322=0",
-"0*7323=0",
-"0*7324=0",
-"0*7325=0",
-"0*7326=0",
-"0*7327=0",
-"0*7328=0",
-"0*7329=0",
-"0*7330=0",
-"0*7331=0",
-"0*7332=0",
-"0*7333=0",
-"0*7334=0",
-"0*7335=0",
-"0*7336=0",
-"0*7337=0",
-"0*7338=0",
-"0*7339=0",
-"0*7340=0",
-"0*7341=0",
-"0*7342=0",
-"0*7343=0",
-"0*7344=0",
-"0*7345=0",
-"0*7346=0",
-"0*7347=0",
-"0*7348=0",
-"0*7349=0",
-"0*7350=0",
-"0*7351=0",
-"0*7352=0",
-"0*7353=0",
-"0*7354=0",
-"0*7355=0",
-"0*7356=0",
-"0*7357=0",
-"0*7358=0",
-"0*7359=0",
-"0*7360=0",
-"0*7361=0",
-"0*7362=0",
-"0*7363=0",
-"0*7364=0",
-"0*7365=0",
-"0*7366=0",
-"0*7367=0",
-"0*7368=0",
-"0*7369=0",
-"0*7370=0",
-"0*7371=0",
-"0*7372=0",
-"0*7373=0",
-"0*7374=0",
-"0*7375=0",
-"0*7376=0",
-"0*7377=0",
-"0*7378=0",
-"0*7379=0",
-"0*7380=0",
-"0*7381=0",
-"0*7382=0",
-"0*7383=0",
-"0*7384=0",
-"0*7385=0",
-"0*7386=0",
-"0*7387=0",
-"0*7388=0",
-"0*7389=0",
-"0*7390=0",
-"0*7391=0",
-"0*7392=0",
-"0*7393=0",
-"0*7394=0",
-"0*7395=0",
-"0*7396=0",
-"0*7397=0",
-"0*7398=0",
-"0*7399=0",
-"0*73+0=0",
-"0*73+1=1",
-"0*73+2=2",
-"0*73+3=3",
-"0*73+4=4",
-"0*73+5=5",
-"0*73+6=6",
-"0*73+7=7",
-"0*73+8=8",
-"0*73+9=9",
-"0*73-0=0",
-"0*73*0=0",
-"0*73*1=0",
-"0*73*2=0",
-"0*73*3=0",
-"0*73*4=0",
-"0*73*5=0",
-"0*73*6=0",
-"0*73*7=0",
-"0*73*8=0",
-"0*73*9=0",
-"0*73/1=0",
-"0*73/2=0",
-"0*73/3=0",
-"0*73/4=0",
-"0*73/5=0",
-"0*73/6=0",
-"0*73/7=0",
-"0*73/8=0",
-"0*73/9=0",
-"0*7400=0",
-"0*7401=0",
-"0*7402=0",
-"0*7403=0",
-"0*7404=0",
-"0*7405=0",
-"0*7406=0",
-"0*7407=0",
-"0*7408=0",
-"0*7409=0",
-"0*7410=0",
-"0*7411=0",
-"0*7412=0",
-"0*7413=0",
-"0*7414=0",
-"0*7415=0",
-"0*7416=0",
-"0*7417=0",
-"0*7418=0",
-"0*7419=0",
-"0*7420=0",
-"0*7421=0",
-"0*7422=0",
-"0*7423=0",
-"0*7424=0",
-"0*7425=0",
-"0*7426=0",
-"0*7427=0",
-"0*7428=0",
-"0*7429=0",
-"0*7430=0",
-"0*7431=0",
-"0*7432=0",
-"0*7433=0",
-"0*7434=0",
-"0*7435=0",
-"0*7436=0",
-"0*7437=0",
-"0*7438=0",
-"0*7439=0",
-"0*7440=0",
-"0*7441=0",
-"0*7442=0",
-"0*7443=0",
-"0*7444=0",
-"0*7445=0",
-"0*7446=0",
-"0*7447=0",
-"0*7448=0",
-"0*7449=0",
-"0*7450=0",
-"0*7451=0",
-"0*7452=0",
-"0*7453=0",
-"0*7454=0",
-"0*7455=0",
-"0*7456=0",
-"0*7457=0",
-"0*7458=0",
-"0*7459=0",
-"0*7460=0",
-"0*7461=0",
-"0*7462=0",
-"0*7463=0",
-"0*7464=0",
-"0*7465=0",
-"0*7466=0",
-"0*7467=0",
-"0*7468=0",
-"0*7469=0",
-"0*7470=0",
-"0*7471=0",
-"0*7472=0",
-"0*7473=0",
-"0*7474=0",
-"0*7475=0",
-"0*7476=0",
-"0*7477=0",
-"0*7478=0",
-"0*7479=0",
-"0*7480=0",
-"0*7481=0",
-"0*7482=0",
-"0*7483=0",
-"0*7484=0",
-"0*7485=0",
-"0*7486=0",
-"0*7487=0",
-"0*7488=0",
-"0*7489=0",
-"0*7490=0",
-"0*7491=0",
-"0*7492=0",
-"0*7493=0",
-"0*7494=0",
-"0*7495=0",
-"0*7496=0",
-"0*7497=0",
-"0*7498=0",
-"0*7499=0",
-"0*74+0=0",
-"0*74+1=1",
-"0*74+2=2",
-"0*74+3=3",
-"0*74+4=4",
-"0*74+5=5",
-"0*74+6=6",
-"0*74+7=7",
-"0*74+8=8",
-"0*74+9=9",
-"0*74-0=0",
-"0*74*0=0",
-"0*74*1=0",
-"0*74*2=0",
-"0*74*3=0",
-"0*74*4=0",
-"0*74*5=0",
-"0*74*6=0",
-"0*74*7=0",
-"0*74*8=0",
-"0*74*9=0",
-"0*74/1=0",
-"0*74/2=0",
-"0*74/3=0",
-"0*74/4=0",
-"0*74/5=0",
-"0*74/6=0",
-"0*74/7=0",
-"0*74/8=0",
-"0*74/9=0",
-"0*7500=0",
-"0*7501=0",
-"0*7502=0",
-"0*7503=0",
-"0*7504=0",
-"0*7505=0",
-"0*7506=0",
-"0*7507=0",
-"0*7508=0",
-"0*7509=0",
-"0*7510=0",
-"0*7511=0",
-"0*7512=0",
-"0*7513=0",
-"0*7514=0",
-"0*7515=0",
-"0*7516=0",
-"0*7517=0",
-"0*7518=0",
-"0*7519=0",
-"0*7520=0",
-"0*7521=0",
-"0*7522=0",
-"0*7523=0",
-"0*7524=0",
-"0*7525=0",
-"0*7526=0",
-"0*7527=0",
-"0*7528=0",
-"0*7529=0",
-"0*7530=0",
-"0*7531=0",
-"0*7532=0",
-"0*7533=0",
-"0*7534=0",
-"0*7535=0",
-"0*7536=0",
-"0*7537=0",
-"0*7538=0",
-"0*7539=0",
-"0*7540=0",
-"0*7541=0",
-"0*7542=0",
-"0*7543=0",
-"0*7544=0",
-"0*7545=0",
-"0*7546=0",
-"0*7547=0",
-"0*7548=0",
-"0*7549=0",
-"0*7550=0",
-"0*7551=0",
-"0*7552=0",
-"0*7553=0",
-"0*7554=0",
-"0*7555=0",
-"0*7556=0",
-"0*7557=0",
-"0*7558=0",
-"0*7559=0",
-"0*7560=0",
-"0*7561=0",
-"0*7562=0",
-"0*7563=0",
-"0*7564=0",
-"0*7565=0",
-"0*7566=0",
-"0*7567=0",
-"0*7568=0",
-"0*7569=0",
-"0*7570=0",
-"0*7571=0",
-"0*7572=0",
-"0*7573=0",
-"0*7574=0",
-"0*7575=0",
-"0*7576=0",
-"0*7577=0",
-"0*7578=0",
-"0*7579=0",
-"0*7580=0",
-"0*7581=0",
-"0*7582=0",
-"0*7583=0",
-"0*7584=0",
-"0*7585=0",
-"0*7586=0",
-"0*7587=0",
-"0*7588=0",
-"0*7589=0",
-"0*7590=0",
-"0*7591=0",
-"0*7592=0",
-"0*7593=0",
-"0*7594=0",
-"0*7595=0",
-"0*7596=0",
-"0*7597=0",
-"0*7598=0",
-"0*7599=0",
-"0*75+0=0",
-"0*75+1=1",
-"0*75+2=2",
-"0*75+3=3",
-"0*75+4=4",
-"0*75+5=5",
-"0*75+6=6",
-"0*75+7=7",
-"0*75+8=8",
-"0*75+9=9",
-"0*75-0=0",
-"0*75*0=0",
-"0*75*1=0",
-"0*75*2=0",
-"0*75*3=0",
-"0*75*4=0",
-"0*75*5=0",
-"0*75*6=0",
-"0*75*7=0",
-"0*75*8=0",
-"0*75*9=0",
-"0*75/1=0",
-"0*75/2=0",
-"0*75/3=0",
-"0*75/4=0",
-"0*75/5=0",
-"0*75/6=0",
-"0*75/7=0",
-"0*75/8=0",
-"0*75/9=0",
-"0*7600=0",
-"0*7601=0",
-"0*7602=0",
-"0*7603=0",
-"0*7604=0",
-"0*7605=0",
-"0*7606=0",
-"0*7607=0",
-"0*7608=0",
-"0*7609=0",
-"0*7610=0",
-"0*7611=0",
-"0*7612=0",
-"0*7613=0",
-"0*7614=0",
-"0*7615=0",
-"0*7616=0",
-"0*7617=0",
-"0*7618=0",
-"0*7619=0",
-"0*7620=0",
-"0*7621=0",
-"0*7622=0",
-"0*7623=0",
-"0*7624=0",
-"0*7625=0",
-"0*7626=0",
-"0*7627=0",
-"0*7628=0",
-"0*7629=0",
-"0*7630=0",
-"0*7631=0",
-"0*7632=0",
-"0*7633=0",
-"0*7634=0",
-"0*7635=0",
-"0*7636=0",
-"0*7637=0",
-"0*7638=0",
-"0*7639=0",
-"0*7640=0",
-"0*7641=0",
-"0*7642=0",
-"0*7643=0",
-"0*7644=0",
-"0*7645=0",
-"0*7646=0",
-"0*7647=0",
-"0*7648=0",
-"0*7649=0",
-"0*7650=0",
-"0*7651=0",
-"0*7652=0",
-"0*7653=0",
-"0*7654=0",
-"0*7655=0",
-"0*7656=0",
-"0*7657=0",
-"0*7658=0",
-"0*7659=0",
-"0*7660=0",
-"0*7661=0",
-"0*7662=0",
-"0*7663=0",
-"0*7664=0",
-"0*7665=0",
-"0*7666=0",
-"0*7667=0",
-"0*7668=0",
-"0*7669=0",
-"0*7670=0",
-"0*7671=0",
-"0*7672=0",
-"0*7673=0",
-"0*7674=0",
-"0*7675=0",
-"0*7676=0",
-"0*7677=0",
-"0*7678=0",
-"0*7679=0",
-"0*7680=0",
-"0*7681=0",
-"0*7682=0",
-"0*7683=0",
-"0*7684=0",
-"0*7685=0",
-"0*7686=0",
-"0*7687=0",
-"0*7688=0",
-"0*7689=0",
-"0*7690=0",
-"0*7691=0",
-"0*7692=0",
-"0*7693=0",
-"0*7694=0",
-"0*7695=0",
-"0*7696=0",
-"0*7697=0",
-"0*7698=0",
-"0*7699=0",
-"0*76+0=0",
-"0*76+1=1",
-"0*76+2=2",
-"0*76+3=3",
-"0*76+4=4",
-"0*76+5=5",
-"0*76+6=6",
-"0*76+7=7",
-"0*76+8=8",
-"0*76+9=9",
-"0*76-0=0",
-"0*76*0=0",
-"0*76*1=0",
-"0*76*2=0",
-"0*76*3=0",
-"0*76*4=0",
-"0*76*5=0",
-"0*76*6=0",
-"0*76*7=0",
-"0*76*8=0",
-"0*76*9=0",
-"0*76/1=0",
-"0*76/2=0",
-"0*76/3=0",
-"0*76/4=0",
-"0*76/5=0",
-"0*76/6=0",
-"0*76/7=0",
-"0*76/8=0",
-"0*76/9=0",
-"0*7700=0",
-"0*7701=0",
-"0*7702=0",
-"0*7703=0",
-"0*7704=0",
-"0*7705=0",
-"0*7706=0",
-"0*7707=0",
-"0*7708=0",
-"0*7709=0",
-"0*7710=0",
-"0*7711=0",
-"0*7712=0",
-"0*7713=0",
-"0*7714=0",
-"0*7715=0",
-"0*7716=0",
-"0*7717=0",
-"0*7718=0",
-"0*7719=0",
-"0*7720=0",
-"0*7721=0",
-"0*7722=0",
-"0*7723=0",
-"0*7724=0",
-"0*7725=0",
-"0*7726=0",
-"0*7727=0",
-"0*7728=0",
-"0*7729=0",
-"0*7730=0",
-"0*7731=0",
-"0*7732=0",
-"0*7733=0",
-"0*7734=0",
-"0*7735=0",
-"0*7736=0",
-"0*7737=0",
-"0*7738=0",
-"0*7739=0",
-"0*7740=0",
-"0*7741=0",
-"0*7742=0",
-"0*7743=0",
-"0*7744=0",
-"0*7745=0",
-"0*7746=0",
-"0*7747=0",
-"0*7748=0",
-"0*7749=0",
-"0*7750=0",
-"0*7751=0",
-"0*7752=0",
-"0*7753=0",
-"0*7754=0",
-"0*7755=0",
-"0*7756=0",
-"0*7757=0",
-"0*7758=0",
-"0*7759=0",
-"0*7760=0",
-"0*7761=0",
-"0*7762=0",
-"0*7763=0",
-"0*7764=0",
-"0*7765=0",
-"0*7766=0",
-"0*7767=0",
-"0*7768=0",
-"0*7769=0",
-"0*7770=0",
-"0*7771=0",
-"0*7772=0",
-"0*7773=0",
-"0*7774=0",
-"0*7775=0",
-"0*7776=0",
-"0*7777=0",
-"0*7778=0",
-"0*7779=0",
-"0*7780=0",
-"0*7781=0",
-"0*7782=0",
-"0*7783=0",
-"0*7784=0",
-"0*7785=0",
-"0*7786=0",
-"0*7787=0",
-"0*7788=0",
-"0*7789=0",
-"0*7790=0",
-"0*7791=0",
-"0*7792=0",
-"0*7793=0",
-"0*7794=0",
-"0*7795=0",
-"0*7796=0",
-"0*7797=0",
-"0*7798=0",
-"0*7799=0",
-"0*77+0=0",
-"0*77+1=1",
-"0*77+2=2",
-"0*77+3=3",
-"0*77+4=4",
-"0*77+5=5",
-"0*77+6=6",
-"0*77+7=7",
-"0*77+8=8",
-"0*77+9=9",
-"0*77-0=0",
-"0*77*0=0",
-"0*77*1=0",
-"0*77*2=0",
-"0*77*3=0",
-"0*77*4=0",
-"0*77*5=0",
-"0*77*6=0",
-"0*77*7=0",
-"0*77*8=0",
-"0*77*9=0",
-"0*77/1=0",
-"0*77/2=0",
-"0*77/3=0",
-"0*77/4=0",
-"0*77/5=0",
-"0*77/6=0",
-"0*77/7=0",
-"0*77/8=0",
-"0*77/9=0",
-"0*7800=0",
-"0*7801=0",
-"0*7802=0",
-"0*7803=0",
-"0*7804=0",
-"0*7805=0",
-"0*7806=0",
-"0*7807=0",
-"0*7808=0",
-"0*7809=0",
-"0*7810=0",
-"0*7811=0",
-"0*7812=0",
-"0*7813=0",
-"0*7814=0",
-"0*7815=0",
-"0*7816=0",
-"0*7817=0",
-"0*7818=0",
-"0*7819=0",
-"0*7820=0",
-"0*7821=0",
-"0*7822=0",
-"0*7823=0",
-"0*7824=0",
-"0*7825=0",
-"0*7826=0",
-"0*7827=0",
-"0*7828=0",
-"0*7829=0",
-"0*7830=0",
-"0*7831=0",
-"0*7832=0",
-"0*7833=0",
-"0*7834=0",
-"0*7835=0",
-"0*7836=0",
-"0*7837=0",
-"0*7838=0",
-"0*7839=0",
-"0*7840=0",
-"0*7841=0",
-"0*7842=0",
-"0*7843=0",
-"0*7844=0",
-"0*7845=0",
-"0*7846=0",
-"0*7847=0",
-"0*7848=0",
-"0*7849=0",
-"0*7850=0",
-"0*7851=0",
-"0*7852=0",
-"0*7853=0",
-"0*7854=0",
-"0*7855=0",
-"0*7856=0",
-"0*7857=0",
-"0*7858=0",
-"0*7859=0",
-"0*7860=0",
-"0*7861=0",
-"0*7862=0",
-"0*7863=0",
-"0*7864=0",
-"0*7865=0",
-"0*7866=0",
-"0*7867=0",
-"0*7868=0",
-"0*7869=0",
-"0*7870=0",
-"0*7871=0",
-"0*7872=0",
-"0*7873=0",
-"0*7874=0",
-"0*7875=0",
-"0*7876=0",
-"0*7877=0",
-"0*7878=0",
-"0*7879=0",
-"0*7880=0",
-"0*7881=0",
-"0*7882=0",
-"0*7883=0",
-"0*7884=0",
-"0*7885=0",
-"0*7886=0",
-"0*7887=0",
-"0*7888=0",
-"0*7889=0",
-"0*7890=0",
-"0*7891=0",
-"0*7892=0",
-"0*7893=0",
-"0*7894=0",
-"0*7895=0",
-"0*7896=0",
-"0*7897=0",
-"0*7898=0",
-"0*7899=0",
-"0*78+0=0",
-"0*78+1=1",
-"0*78+2=2",
-"0*78+3=3",
-"0*78+4=4",
-"0*78+5=5",
-"0*78+6=6",
-"0*78+7=7",
-"0*78+8=8",
-"0*78+9=9",
-"0*78-0=0",
-"0*78*0=0",
-"0*78*1=0",
-"0*78*2=0",
-"0*78*3=0",
-"0*78*4=0",
-"0*78*5=0",
-"0*78*6=0",
-"0*78*7=0",
-"0*78*8=0",
-"0*78*9=0",
-"0*78/1=0",
-"0*78/2=0",
-"0*78/3=0",
-"0*78/4=0",
-"0*78/5=0",
-"0*78/6=0",
-"0*78/7=0",
-"0*78/8=0",
-"0*78/9=0",
-"0*7900=0",
-"0*7901=0",
-"0*7902=0",
-"0*7903=0",
-"0*7904=0",
-"0*7905=0",
-"0*7906=0",
-"0*7907=0",
-"0*7908=0",
-"0*7909=0",
-"0*7910=0",
-"0*7911=0",
-"0*7912=0",
-"0*7913=0",
-"0*7914=0",
-"0*7915=0",
-"0*7916=0",
-"0*7917=0",
-"0*7918=0",
-"0*7919=0",
-"0*7920=0",
-"0*7921=0",
-"0*7922=0",
-"0*7923=0",
-"0*7924=0",
-"0*7925=0",
-"0*7926=0",
-"0*7927=0",
-"0*7928=0",
-"0*7929=0",
-"0*7930=0",
-"0*7931=0",
-"0*7932=0",
-"0*7933=0",
-"0*7934=0",
-"0*7935=0",
-"0*7936=0",
-"0*7937=0",
-"0*7938=0",
-"0*7939=0",
-"0*7940=0",
-"0*7941=0",
-"0*7942=0",
-"0*7943=0",
-"0*7944=0",
-"0*7945=0",
-"0*7946=0",
-"0*7947=0",
-"0*7948=0",
-"0*7949=0",
-"0*7950=0",
-"0*7951=0",
-"0*7952=0",
-"0*7953=0",
-"0*7954=0",
-"0*7955=0",
-"0*7956=0",
-"0*7957=0",
-"0*7958=0",
-"0*7959=0",
-"0*7960=0",
-"0*7961=0",
-"0*7962=0",
-"0*7963=0",
-"0*7964=0",
-"0*7965=0",
-"0*7966=0",
-"0*7967=0",
-"0*7968=0",
-"0*7969=0",
-"0*7970=0",
-"0*7971=0",
-"0*7972=0",
-"0*7973=0",
-"0*7974=0",
-"0*7975=0",
-"0*7976=0",
-"0*7977=0",
-"0*7978=0",
-"0*7979=0",
-"0*7980=0",
-"0*7981=0",
-"0*7982=0",
-"0*7983=0",
-"0*7984=0",
-"0*7985=0",
-"0*7986=0",
-"0*7987=0",
-"0*7988=0",
-"0*7989=0",
-"0*7990=0",
-"0*7991=0",
-"0*7992=0",
-"0*7993=0",
-"0*7994=0",
-"0*7995=0",
-"0*7996=0",
-"0*7997=0",
-"0*7998=0",
-"0*7999=0",
-"0*79+0=0",
-"0*79+1=1",
-"0*79+2=2",
-"0*79+3=3",
-"0*79+4=4",
-"0*79+5=5",
-"0*79+6=6",
-"0*79+7=7",
-"0*79+8=8",
-"0*79+9=9",
-"0*79-0=0",
-"0*79*0=0",
-"0*79*1=0",
-"0*79*2=0",
-"0*79*3=0",
-"0*79*4=0",
-"0*79*5=0",
-"0*79*6=0",
-"0*79*7=0",
-"0*79*8=0",
-"0*79*9=0",
-"0*79/1=0",
-"0*79/2=0",
-"0*79/3=0",
-"0*79/4=0",
-"0*79/5=0",
-"0*79/6=0",
-"0*79/7=0",
-"0*79/8=0",
-"0*79/9=0",
-"0*7-1=-1",
-"0*7-2=-2",
-"0*7-3=-3",
-"0*7-4=-4",
-"0*7-5=-5",
-"0*7-6=-6",
-"0*7-7=-7",
-"0*7-8=-8",
-"0*7-9=-9",
-"0*7*10=0",
-"0*7*11=0",
-"0*7*12=0",
-"0*7*13=0",
-"0*7*14=0",
-"0*7*15=0",
-"0*7*16=0",
-"0*7*17=0",
-"0*7*18=0",
-"0*7*19=0",
-"0*7*20=0",
-"0*7*21=0",
-"0*7*22=0",
-"0*7*23=0",
-"0*7*24=0",
-"0*7*25=0",
-"0*7*26=0",
-"0*7*27=0",
-"0*7*28=0",
-"0*7*29=0",
-"0*7*30=0",
-"0*7*31=0",
-"0*7*32=0",
-"0*7*33=0",
-"0*7*34=0",
-"0*7*35=0",
-"0*7*36=0",
-"0*7*37=0",
-"0*7*38=0",
-"0*7*39=0",
-"0*7*40=0",
-"0*7*41=0",
-"0*7*42=0",
-"0*7*43=0",
-"0*7*44=0",
-"0*7*45=0",
-"0*7*46=0",
-"0*7*47=0",
-"0*7*48=0",
-"0*7*49=0",
-"0*7*50=0",
-"0*7*51=0",
-"0*7*52=0",
-"0*7*53=0",
-"0*7*54=0",
-"0*7*55=0",
-"0*7*56=0",
-"0*7*57=0",
-"0*7*58=0",
-"0*7*59=0",
-"0*7*60=0",
-"0*7*61=0",
-"0*7*62=0",
-"0*7*63=0",
-"0*7*64=0",
-"0*7*65=0",
-"0*7*66=0",
-"0*7*67=0",
-"0*7*68=0",
-"0*7*69=0",
-"0*7*70=0",
-"0*7*71=0",
-"0*7*72=0",
-"0*7*73=0",
-"0*7*74=0",
-"0*7*75=0",
-"0*7*76=0",
-"0*7*77=0",
-"0*7*78=0",
-"0*7*79=0",
-"0*7*80=0",
-"0*7*81=0",
-"0*7*82=0",
-"0*7*83=0",
-"0*7*84=0",
-"0*7*85=0",
-"0*7*86=0",
-"0*7*87=0",
-"0*7*88=0",
-"0*7*89=0",
-"0*7*90=0",
-"0*7*91=0",
-"0*7*92=0",
-"0*7*93=0",
-"0*7*94=0",
-"0*7*95=0",
-"0*7*96=0",
-"0*7*97=0",
-"0*7*98=0",
-"0*7*99=0",
-"0*7/10=0",
-"0*7/11=0",
-"0*7/12=0",
-"0*7/13=0",
-"0*7/14=0",
-"0*7/15=0",
-"0*7/16=0",
-"0*7/17=0",
-"0*7/18=0",
-"0*7/19=0",
-"0*7/20=0",
-"0*7/21=0",
-"0*7/22=0",
-"0*7/23=0",
-"0*7/24=0",
-"0*7/25=0",
-"0*7/26=0",
-"0*7/27=0",
-"0*7/28=0",
-"0*7/29=0",
-"0*7/30=0",
-"0*7/31=0",
-"0*7/32=0",
-"0*7/33=0",
-"0*7/34=0",
-"0*7/35=0",
-"0*7/36=0",
-"0*7/37=0",
-"0*7/38=0",
-"0*7/39=0",
-"0*7/40=0",
-"0*7/41=0",
-"0*7/42=0",
-"0*7/43=0",
-"0*7/44=0",
-"0*7/45=0",
-"0*7/46=0",
-"0*7/47=0",
-"0*7/48=0",
-"0*7/49=0",
-"0*7/50=0",
-"0*7/51=0",
-"0*7/52=0",
-"0*7/53=0",
-"0*7/54=0",
-"0*7/55=0",
-"0*7/56=0",
-"0*7/57=0",
-"0*7/58=0",
-"0*7/59=0",
-"0*7/60=0",
-"0*7/61=0",
-"0*7/62=0",
-"0*7/63=0",
-"0*7/64=0",
-"0*7/65=0",
-"0*7/66=0",
-"0*7/67=0",
-"0*7/68=0",
-"0*7/69=0",
-"0*7/70=0",
-"0*7/71=0",
-"0*7/72=0",
-"0*7/73=0",
-"0*7/74=0",
-"0*7/75=0",
-"0*7/76=0",
-"0*7/77=0",
-"0*7/78=0",
-"0*7/79=0",
-"0*7/80=0",
-"0*7/81=0",
-"0*7/82=0",
-"0*7/83=0",
-"0*7/84=0",
-"0*7/85=0",
-"0*7/86=0",
-"0*7/87=0",
-"0*7/88=0",
-"0*7/89=0",
-"0*7/90=0",
-"0*7/91=0",
-"0*7/92=0",
-"0*7/93=0",
-"0*7/94=0",
-"0*7/95=0",
-"0*7/96=0",
-"0*7/97=0",
-"0*7/98=0",
-"0*7/99=0",
-"0*8000=0",
-"0*8001=0",
-"0*8002=0",
-"0*8003=0",
-"0*8004=0",
-"0*8005=0",
-"0*8006=0",
-"0*8007=0",
-"0*8008=0",
-"0*8009=0",
-"0*8010=0",
-"0*8011=0",
-"0*8012=0",
-"0*8013=0",
-"0*8014=0",
-"0*8015=0",
-"0*8016=0",
-"0*8017=0",
-"0*8018=0",
-"0*8019=0",
-"0*8020=0",
-"0*8021=0",
-"0*8022=0",
-"0*8023=0",
-"0*8024=0",
-"0*8025=0",
-"0*8026=0",
-"0*8027=0",
-"0*8028=0",
-"0*8029=0",
-"0*8030=0",
-"0*8031=0",
-"0*8032=0",
-"0*8033=0",
-"0*8034=0",
-"0*8035=0",
-"0*8036=0",
-"0*8037=0",
-"0*8038=0",
-"0*8039=0",
-"0*8040=0",
-"0*8041=0",
-"0*8042=0",
-"0*8043=0",
-"0*8044=0",
-"0*8045=0",
-"0*8046=0",
-"0*8047=0",
-"0*8048=0",
-"0*8049=0",
-"0*8050=0",
-"0*8051=0",
-"0*8052=0",
-"0*8053=0",
-"0*8054=0",
-"0*8055=0",
-"0*8056=0",
-"0*8057=0",
-"0*8058=0",
-"0*8059=0",
-"0*8060=0",
-"0*8061=0",
-"0*8062=0",
-"0*8063=0",
-"0*8064=0",
-"0*8065=0",
-"0*8066=0",
-"0*8067=0",
-"0*8068=0",
-"0*8069=0",
-"0*8070=0",
-"0*8071=0",
-"0*8072=0",
-"0*8073=0",
-"0*8074=0",
-"0*8075=0",
-"0*8076=0",
-"0*8077=0",
-"0*8078=0",
-"0*8079=0",
-"0*8080=0",
-"0*8081=0",
-"0*8082=0",
-"0*8083=0",
-"0*8084=0",
-"0*8085=0",
-"0*8086=0",
-"0*8087=0",
-"0*8088=0",
-"0*8089=0",
-"0*8090=0",
-"0*8091=0",
-"0*8092=0",
-"0*8093=0",
-"0*8094=0",
-"0*8095=0",
-"0*8096=0",
-"0*8097=0",
-"0*8098=0",
-"0*8099=0",
-"0*80+0=0",
-"0*80+1=1",
-"0*80+2=2",
-"0*80+3=3",
-"0*80+4=4",
-"0*80+5=5",
-"0*80+6=6",
-"0*80+7=7",
-"0*80+8=8",
-"0*80+9=9",
-"0*80-0=0",
-"0*80*0=0",
-"0*80*1=0",
-"0*80*2=0",
-"0*80*3=0",
-"0*80*4=0",
-"0*80*5=0",
-"0*80*6=0",
-"0*80*7=0",
-"0*80*8=0",
-"0*80*9=0",
-"0*80/1=0",
-"0*80/2=0",
-"0*80/3=0",
-"0*80/4=0",
-"0*80/5=0",
-"0*80/6=0",
-"0*80/7=0",
-"0*80/8=0",
-"0*80/9=0",
-"0*8100=0",
-"0*8101=0",
-"0*8102=0",
-"0*8103=0",
-"0*8104=0",
-"0*8105=0",
-"0*8106=0",
-"0*8107=0",
-"0*8108=0",
-"0*8109=0",
-"0*8110=0",
-"0*8111=0",
-"0*8112=0",
-"0*8113=0",
-"0*8114=0",
-"0*8115=0",
-"0*8116=0",
-"0*8117=0",
-"0*8118=0",
-"0*8119=0",
-"0*8120=0",
-"0*8121=0",
-"0*8122=0",
-"0*8123=0",
-"0*8124=0",
-"0*8125=0",
-"0*8126=0",
-"0*8127=0",
-"0*8128=0",
-"0*8129=0",
-"0*8130=0",
-"0*8131=0",
-"0*8132=0",
-"0*8133=0",
-"0*8134=0",
-"0*8135=0",
-"0*8136=0",
-"0*8137=0",
-"0*8138=0",
-"0*8139=0",
-"0*8140=0",
-"0*8141=0",
-"0*8142=0",
-"0*8143=0",
-"0*8144=0",
-"0*8145=0",
-"0*8146=0",
-"0*8147=0",
-"0*8148=0",
-"0*8149=0",
-"0*8150=0",
-"0*8151=0",
-"0*8152=0",
-"0*8153=0",
-"0*8154=0",
-"0*8155=0",
-"0*8156=0",
-"0*8157=0",
-"0*8158=0",
-"0*8159=0",
-"0*8160=0",
-"0*8161=0",
-"0*8162=0",
-"0*8163=0",
-"0*8164=0",
-"0*8165=0",
-"0*8166=0",
-"0*8167=0",
-"0*8168=0",
-"0*8169=0",
-"0*8170=0",
-"0*8171=0",
-"0*8172=0",
-"0*8173=0",
-"0*8174=0",
-"0*8175=0",
-"0*8176=0",
-"0*8177=0",
-"0*8178=0",
-"0*8179=0",
-"0*8180=0",
-"0*8181=0",
-"0*8182=0",
-"0*8183=0",
-"0*8184=0",
-"0*8185=0",
-"0*8186=0",
-"0*8187=0",
-"0*8188=0",
-"0*8189=0",
-"0*8190=0",
-"0*8191=0",
-"0*8192=0",
-"0*8193=0",
-"0*8194=0",
-"0*8195=0",
-"0*8196=0",
-"0*8197=0",
-"0*8198=0",
-"0*8199=0",
-"0*81+0=0",
-"0*81+1=1",
-"0*81+2=2",
-"0*81+3=3",
-"0*81+4=4",
-"0*81+5=5",
-"0*81+6=6",
-"0*81+7=7",
-"0*81+8=8",
-"0*81+9=9",
-"0*81-0=0",
-"0*81*0=0",
-"0*81*1=0",
-"0*81*2=0",
-"0*81*3=0",
-"0*81*4=0",
-"0*81*5=0",
-"0*81*6=0",
-"0*81*7=0",
-"0*81*8=0",
-"0*81*9=0",
-"0*81/1=0",
-"0*81/2=0",
-"0*81/3=0",
-"0*81/4=0",
-"0*81/5=0",
-"0*81/6=0",
-"0*81/7=0",
-"0*81/8=0",
-"0*81/9=0",
-"0*8200=0",
-"0*8201=0",
-"0*8202=0",
-"0*8203=0",
-"0*8204=0",
-"0*8205=0",
-"0*8206=0",
-"0*8207=0",
-"0*8208=0",
-"0*8209=0",
-"0*8210=0",
-"0*8211=0",
-"0*8212=0",
-"0*8213=0",
-"0*8214=0",
-"0*8215=0",
-"0*8216=0",
-"0*8217=0",
-"0*8218=0",
-"0*8219=0",
-"0*8220=0",
-"0*8221=0",
-"0*8222=0",
-"0*8223=0",
-"0*8224=0",
-"0*8225=0",
-"0*8226=0",
-"0*8227=0",
-"0*8228=0",
-"0*8229=0",
-"0*8230=0",
-"0*8231=0",
-"0*8232=0",
-"0*8233=0",
-"0*8234=0",
-"0*8235=0",
-"0*8236=0",
-"0*8237=0",
-"0*8238=0",
-"0*8239=0",
-"0*8240=0",
-"0*8241=0",
-"0*8242=0",
-"0*8243=0",
-"0*8244=0",
-"0*8245=0",
-"0*8246=0",
-"0*8247=0",
-"0*8248=0",
-"0*8249=0",
-"0*8250=0",
-"0*8251=0",
-"0*8252=0",
-"0*8253=0",
-"0*8254=0",
-"0*8255=0",
-"0*8256=0",
-"0*8257=0",
-"0*8258=0",
-"0*8259=0",
-"0*8260=0",
-"0*8261=0",
-"0*8262=0",
-"0*8263=0",
-"0*8264=0",
-"0*8265=0",
-"0*8266=0",
-"0*8267=0",
-"0*8268=0",
-"0*8269=0",
-"0*8270=0",
-"0*8271=0",
-"0*8272=0",
-"0*8273=0",
-"0*8274=0",
-"0*8275=0",
-"0*8276=0",
-"0*8277=0",
-"0*8278=0",
-"0*8279=0",
-"0*8280=0",
-"0*8281=0",
-"0*8282=0",
-"0*8283=0",
-"0*8284=0",
-"0*8285=0",
-"0*8286=0",
-"0*8287=0",
-"0*8288=0",
-"0*8289=0",
-"0*8290=0",
-"0*8291=0",
-"0*8292=0",
-"0*8293=0",
-"0*8294=0",
-"0*8295=0",
-"0*8296=0",
-"0*8297=0",
-"0*8298=0",
-"0*8299=0",
-"0*82+0=0",
-"0*82+1=1",
-"0*82+2=2",
-"0*82+3=3",
-"0*82+4=4",
-"0*82+5=5",
-"0*82+6=6",
-"0*82+7=7",
-"0*82+8=8",
-"0*82+9=9",
-"0*82-0=0",
-"0*82*0=0",
-"0*82*1=0",
-"0*82*2=0",
-"0*82*3=0",
-"0*82*4=0",
-"0*82*5=0",
-"0*82*6=0",
-"0*82*7=0",
-"0*82*8=0",
-"0*82*9=0",
-"0*82/1=0",
-"0*82/2=0",
-"0*82/3=0",
-"0*82/4=0",
-"0*82/5=0",
-"0*82/6=0",
-"0*82/7=0",
-"0*82/8=0",
-"0*82/9=0",
-"0*8300=0",
-"0*8301=0",
-"0*8302=0",
-"0*8303=0",
-"0*8304=0",
-"0*8305=0",
-"0*8306=0",
-"0*8307=0",
-"0*8308=0",
-"0*8309=0",
-"0*8310=0",
-"0*8311=0",
-"0*8312=0",
-"0*8313=0",
-"0*8314=0",
-"0*8315=0",
-"0*8316=0",
-"0*8317=0",
-"0*8318=0",
-"0*8319=0",
-"0*8320=0",
-"0*8321=0",
-"0*8322=0",
-"0*8323=0",
-"0*8324=0",
-"0*8325=0",
-"0*8326=0",
-"0*8327=0",
-"0*8328=0",
-"0*8329=0",
-"0*8330=0",
-"0*8331=0",
-"0*8332=0",
-"0*8333=0",
-"0*8334=0",
-"0*8335=0",
-"0*8336=0",
-"0*8337=0",
-"0*8338=0",
-"0*8339=0",
-"0*8340=0",
-"0*8341=0",
-"0*8342=0",
-"0*8343=0",
-"0*8344=0",
-"0*8345=0",
-"0*8346=0",
-"0*8347=0",
-"0*8348=0",
-"0*8349=0",
-"0*8350=0",
-"0*8351=0",
-"0*8352=0",
-"0*8353=0",
-"0*8354=0",
-"0*8355=0",
-"0*8356=0",
-"0*8357=0",
-"0*8358=0",
-"0*8359=0",
-"0*8360=0",
-"0*8361=0",
-"0*8362=0",
-"0*8363=0",
-"0*8364=0",
-"0*8365=0",
-"0*8366=0",
-"0*8367=0",
-"0*8368=0",
-"0*8369=0",
-"0*8370=0",
-"0*8371=0",
-"0*8372=0",
-"0*8373=0",
-"0*8374=0",
-"0*8375=0",
-"0*8376=0",
-"0*8377=0",
-"0*8378=0",
-"0*8379=0",
-"0*8380=0",
-"0*8381=0",
-"0*8382=0",
-"0*8383=0",
-"0*8384=0",
-"0*8385=0",
-"0*8386=0",
-"0*8387=0",
-"0*8388=0",
-"0*8389=0",
-"0*8390=0",
-"0*8391=0",
-"0*8392=0",
-"0*8393=0",
-"0*8394=0",
-"0*8395=0",
-"0*8396=0",
-"0*8397=0",
-"0*8398=0",
-"0*8399=0",
-"0*83+0=0",
-"0*83+1=1",
-"0*83+2=2",
-"0*83+3=3",
-"0*83+4=4",
-"0*83+5=5",
-"0*83+6=6",
-"0*83+7=7",
-"0*83+8=8",
-"0*83+9=9",
-"0*83-0=0",
-"0*83*0=0",
-"0*83*1=0",
-"0*83*2=0",
-"0*83*3=0",
-"0*83*4=0",
-"0*83*5=0",
-"0*83*6=0",
-"0*83*7=0",
-"0*83*8=0",
-"0*83*9=0",
-"0*83/1=0",
-"0*83/2=0",
-"0*83/3=0",
-"0*83/4=0",
-"0*83/5=0",
-"0*83/6=0",
-"0*83/7=0",
-"0*83/8=0",
-"0*83/9=0",
-"0*8400=0",
-"0*8401=0",
-"0*8402=0",
-"0*8403=0",
-"0*8404=0",
-"0*8405=0",
-"0*8406=0",
-"0*8407=0",
-"0*8408=0",
-"0*8409=0",
-"0*8410=0",
-"0*8411=0",
-"0*8412=0",
-"0*8413=0",
-"0*8414=0",
-"0*8415=0",
-"0*8416=0",
-"0*8417=0",
-"0*8418=0",
-"0*8419=0",
-"0*8420=0",
-"0*8421=0",
-"0*8422=0",
-"0*8423=0",
-"0*8424=0",
-"0*8425=0",
-"0*8426=0",
-"0*8427=0",
-"0*8428=0",
-"0*8429=0",
-"0*8430=0",
-"0*8431=0",
-"0*8432=0",
-"0*8433=0",
-"0*8434=0",
-"0*8435=0",
-"0*8436=0",
-"0*8437=0",
-"0*8438=0",
-"0*8439=0",
-"0*8440=0",
-"0*8441=0",
-"0*8442=0",
-"0*8443=0",
-"0*8444=0",
-"0*8445=0",
-"0*8446=0",
-"0*8447=0",
-"0*8448=0",
-"0*8449=0",
-"0*8450=0",
-"0*8451=0",
-"0*8452=0",
-"0*8453=0",
-"0*8454=0",
-"0*8455=0",
-"0*8456=0",
-"0*8457=0",
-"0*8458=0",
-"0*8459=0",
-"0*8460=0",
-"0*8461=0",
-"0*8462=0",
-"0*8463=0",
-"0*8464=0",
-"0*8465=0",
-"0*8466=0",
-"0*8467=0",
-"0*8468=0",
-"0*8469=0",
-"0*8470=0",
-"0*8471=0",
-"0*8472=0",
-"0*8473=0",
-"0*8474=0",
-"0*8475=0",
-"0*8476=0",
-"0*8477=0",
-"0*8478=0",
-"0*8479=0",
-"0*8480=0",
-"0*8481=0",
-"0*8482=0",
-"0*8483=0",
-"0*8484=0",
-"0*8485=0",
-"0*8486=0",
-"0*8487=0",
-"0*8488=0",
-"0*8489=0",
-"0*8490=0",
-"0*8491=0",
-"0*8492=0",
-"0*8493=0",
-"0*8494=0",
-"0*8495=0",
-"0*8496=0",
-"0*8497=0",
-"0*8498=0",
-"0*8499=0",
-"0*84+0=0",
-"0*84+1=1",
-"0*84+2=2",
-"0*84+3=3",
-"0*84+4=4",
-"0*84+5=5",
-"0*84+6=6",
-"0*84+7=7",
-"0*84+8=8",
-"0*84+9=9",
-"0*84-0=0",
-"0*84*0=0",
-"0*84*1=0",
-"0*84*2=0",
-"0*84*3=0",
-"0*84*4=0",
-"0*84*5=0",
-"0*84*6=0",
-"0*84*7=0",
-"0*84*8=0",
-"0*84*9=0",
-"0*84/1=0",
-"0*84/2=0",
-"0*84/3=0",
-"0*84/4=0",
-"0*84/5=0",
-"0*84/6=0",
-"0*84/7=0",
-"0*84/8=0",
-"0*84/9=0",
-"0*8500=0",
-"0*8501=0",
-"0*8502=0",
-"0*8503=0",
-"0*8504=0",
-"0*8505=0",
-"0*8506=0",
-"0*8507=0",
-"0*8508=0",
-"0*8509=0",
-"0*8510=0",
-"0*8511=0",
-"0*8512=0",
-"0*8513=0",
-"0*8514=0",
-"0*8515=0",
-"0*8516=0",
-"0*8517=0",
-"0*8518=0",
-"0*8519=0",
-"0*8520=0",
-"0*8521=0",
-"0*8522=0",
-"0*8523=0",
-"0*8524=0",
-"0*8525=0",
-"0*8526=0",
-"0*8527=0",
-"0*8528=0",
-"0*8529=0",
-"0*8530=0",
-"0*8531=0",
-"0*8532=0",
-"0*8533=0",
-"0*8534=0",
-"0*8535=0",
-"0*8536=0",
-"0*8537=0",
-"0*8538=0",
-"0*8539=0",
-"0*8540=0",
-"0*8541=0",
-"0*8542=0",
-"0*8543=0",
-"0*8544=0",
-"0*8545=0",
-"0*8546=0",
-"0*8547=0",
-"0*8548=0",
-"0*8549=0",
-"0*8550=0",
-"0*8551=0",
-"0*8552=0",
-"0*8553=0",
-"0*8554=0",
-"0*8555=0",
-"0*8556=0",
-"0*8557=0",
-"0*8558=0",
-"0*8559=0",
-"0*8560=0",
-"0*8561=0",
-"0*8562=0",
-"0*8563=0",
-"0*8564=0",
-"0*8565=0",
-"0*8566=0",
-"0*8567=0",
-"0*8568=0",
-"0*8569=0",
-"0*8570=0",
-"0*8571=0",
-"0*8572=0",
-"0*8573=0",
-"0*8574=0",
-"0*8575=0",
-"0*8576=0",
-"0*8577=0",
-"0*8578=0",
-"0*8579=0",
-"0*8580=0",
-"0*8581=0",
-"0*8582=0",
-"0*8583=0",
-"0*8584=0",
-"0*8585=0",
-"0*8586=0",
-"0*8587=0",
-"0*8588=0",
-"0*8589=0",
-"0*8590=0",
-"0*8591=0",
-"0*8592=0",
-"0*8593=0",
-"0*8594=0",
-"0*8595=0",
-"0*8596=0",
-"0*8597=0",
-"0*8598=0",
-"0*8599=0",
-"0*85+0=0",
-"0*85+1=1",
-"0*85+2=2",
-"0*85+3=3",
-"0*85+4=4",
-"0*85+5=5",
-"0*85+6=6",
-"0*85+7=7",
-"0*85+8=8",
-"0*85+9=9",
-"0*85-0=0",
-"0*85*0=0",
-"0*85*1=0",
-"0*85*2=0",
-"0*85*3=0",
-"0*85*4=0",
-"0*85*5=0",
-"0*85*6=0",
-"0*85*7=0",
-"0*85*8=0",
-"0*85*9=0",
-"0*85/1=0",
-"0*85/2=0",
-"0*85/3=0",
-"0*85/4=0",
-"0*85/5=0",
-"0*85/6=0",
-"0*85/7=0",
-"0*85/8=0",
-"0*85/9=0",
-"0*8600=0",
-"0*8601=0",
-"0*8602=0",
-"0*8603=0",
-"0*8604=0",
-"0*8605=0",
-"0*8606=0",
-"0*8607=0",
-"0*8608=0",
-"0*8609=0",
-"0*8610=0",
-"0*8611=0",
-"0*8612=0",
-"0*8613=0",
-"0*8614=0",
-"0*8615=0",
-"0*8616=0",
-"0*8617=0",
-"0*8618=0",
-"0*8619=0",
-"0*8620=0",
-"0*8621=0",
-"0*8622=0",
-"0*8623=0",
-"0*8624=0",
-"0*8625=0",
-"0*8626=0",
-"0*8627=0",
-"0*8628=0",
-"0*8629=0",
-"0*8630=0",
-"0*8631=0",
-"0*8632=0",
-"0*8633=0",
-"0*8634=0",
-"0*8635=0",
-"0*8636=0",
-"0*8637=0",
-"0*8638=0",
-"0*8639=0",
-"0*8640=0",
-"0*8641=0",
-"0*8642=0",
-"0*8643=0",
-"0*8644=0",
-"0*8645=0",
-"0*8646=0",
-"0*8647=0",
-"0*8648=0",
-"0*8649=0",
-"0*8650=0",
-"0*8651=0",
-"0*8652=0",
-"0*8653=0",
-"0*8654=0",
-"0*8655=0",
-"0*8656=0",
-"0*8657=0",
-"0*8658=0",
-"0*8659=0",
-"0*8660=0",
-"0*8661=0",
-"0*8662=0",
-"0*8663=0",
-"0*8664=0",
-"0*8665=0",
-"0*8666=0",
-"0*8667=0",
-"0*8668=0",
-"0*8669=0",
-"0*8670=0",
-"0*8671=0",
-"0*8672=0",
-"0*8673=0",
-"0*8674=0",
-"0*8675=0",
-"0*8676=0",
-"0*8677=0",
-"0*8678=0",
-"0*8679=0",
-"0*8680=0",
-"0*8681=0",
-"0*8682=0",
-"0*8683=0",
-"0*8684=0",
-"0*8685=0",
-"0*8686=0",
-"0*8687=0",
-"0*8688=0",
-"0*8689=0",
-"0*8690=0",
-"0*8691=0",
-"0*8692=0",
-"0*8693=0",
-"0*8694=0",
-"0*8695=0",
-"0*8696=0",
-"0*8697=0",
-"0*8698=0",
-"0*8699=0",
-"0*86+0=0",
-"0*86+1=1",
-"0*86+2=2",
-"0*86+3=3",
-"0*86+4=4",
-"0*86+5=5",
-"0*86+6=6",
-"0*86+7=7",
-"0*86+8=8",
-"0*86+9=9",
-"0*86-0=0",
-"0*86*0=0",
-"0*86*1=0",
-"0*86*2=0",
-"0*86*3=0",
-"0*86*4=0",
-"0*86*5=0",
-"0*86*6=0",
-"0*86*7=0",
-"0*86*8=0",
-"0*86*9=0",
-"0*86/1=0",
-"0*86/2=0",
-"0*86/3=0",
-"0*86/4=0",
-"0*86/5=0",
-"0*86/6=0",
-"0*86/7=0",
-"0*86/8=0",
-"0*86/9=0",
-"0*8700=0",
-"0*8701=0",
-"0*8702=0",
-"0*8703=0",
-"0*8704=0",
-"0*8705=0",
-"0*8706=0",
-"0*8707=0",
-"0*8708=0",
-"0*8709=0",
-"0*8710=0",
-"0*8711=0",
-"0*8712=0",
-"0*8713=0",
-"0*8714=0",
-"0*8715=0",
-"0*8716=0",
-"0*8717=0",
-"0*8718=0",
-"0*8719=0",
-"0*8720=0",
-"0*8721=0",
-"0*8722=0",
-"0*8723=0",
-"0*8724=0",
-"0*8725=0",
-"0*8726=0",
-"0*8727=0",
-"0*8728=0",
-"0*8729=0",
-"0*8730=0",
-"0*8731=0",
-"0*8732=0",
-"0*8733=0",
-"0*8734=0",
-"0*8735=0",
-"0*8736=0",
-"0*8737=0",
-"0*8738=0",
-"0*8739=0",
-"0*8740=0",
-"0*8741=0",
-"0*8742=0",
-"0*8743=0",
-"0*8744=0",
-"0*8745=0",
-"0*8746=0",
-"0*8747=0",
-"0*8748=0",
-"0*8749=0",
-"0*8750=0",
-"0*8751=0",
-"0*8752=0",
-"0*8753=0",
-"0*8754=0",
-"0*8755=0",
-"0*8756=0",
-"0*8757=0",
-"0*8758=0",
-"0*8759=0",
-"0*8760=0",
-"0*8761=0",
-"0*8762=0",
-"0*8763=0",
-"0*8764=0",
-"0*8765=0",
-"0*8766=0",
-"0*8767=0",
-"0*8768=0",
-"0*8769=0",
-"0*8770=0",
-"0*8771=0",
-"0*8772=0",
-"0*8773=0",
-"0*8774=0",
-"0*8775=0",
-"0*8776=0",
-"0*8777=0",
-"0*8778=0",
-"0*8779=0",
-"0*8780=0",
-"0*8781=0",
-"0*8782=0",
-"0*8783=0",
-"0*8784=0",
-"0*8785=0",
-"0*8786=0",
-"0*8787=0",
-"0*8788=0",
-"0*8789=0",
-"0*8790=0",
-"0*8791=0",
-"0*8792=0",
-"0*8793=0",
-"0*8794=0",
-"0*8795=0",
-"0*8796=0",
-"0*8797=0",
-"0*8798=0",
-"0*8799=0",
-"0*87+0=0",
-"0*87+1=1",
-"0*87+2=2",
-"0*87+3=3",
-"0*87+4=4",
-"0*87+5=5",
-"0*87+6=6",
-"0*87+7=7",
-"0*87+8=8",
-"0*87+9=9",
-"0*87-0=0",
-"0*87*0=0",
-"0*87*1=0",
-"0*87*2=0",
-"0*87*3=0",
-"0*87*4=0",
-"0*87*5=0",
-"0*87*6=0",
-"0*87*7=0",
-"0*87*8=0",
-"0*87*9=0",
-"0*87/1=0",
-"0*87/2=0",
-"0*87/3=0",
-"0*87/4=0",
-"0*87/5=0",
-"0*87/6=0",
-"0*87/7=0",
-"0*87/8=0",
-"0*87/9=0",
-"0*8800=0",
-"0*8801=0",
-"0*8802=0",
-"0*8803=0",
-"0*8804=0",
-"0*8805=0",
-"0*8806=0",
-"0*8807=0",
-"0*8808=0",
-"0*8809=0",
-"0*8810=0",
-"0*8811=0",
-"0*8812=0",
-"0*8813=0",
-"0*8814=0",
-"0*8815=0",
-"0*8816=0",
-"0*8817=0",
-"0*8818=0",
-"0*8819=0",
-"0*8820=0",
-"0*8821=0",
-"0*8822=0",
-"0*8823=0",
-"0*8824=0",
-"0*8825=0",
-"0*8826=0",
-"0*8827=0",
-"0*8828=0",
-"0*8829=0",
-"0*8830=0",
-"0*8831=0",
-"0*8832=0",
-"0*8833=0",
-"0*8834=0",
-"0*8835=0",
-"0*8836=0",
-"0*8837=0",
-"0*8838=0",
-"0*8839=0",
-"0*8840=0",
-"0*8841=0",
-"0*8842=0",
-"0*8843=0",
-"0*8844=0",
-"0*8845=0",
-"0*8846=0",
-"0*8847=0",
-"0*8848=0",
-"0*8849=0",
-"0*8850=0",
-"0*8851=0",
-"0*8852=0",
-"0*8853=0",
-"0*8854=0",
-"0*8855=0",
-"0*8856=0",
-"0*8857=0",
-"0*8858=0",
-"0*8859=0",
-"0*8860=0",
-"0*8861=0",
-"0*8862=0",
-"0*8863=0",
-"0*8864=0",
-"0*8865=0",
-"0*8866=0",
-"0*8867=0",
-"0*8868=0",
-"0*8869=0",
-"0*8870=0",
-"0*8871=0",
-"0*8872=0",
-"0*8873=0",
-"0*8874=0",
-"0*8875=0",
-"0*8876=0",
-"0*8877=0",
-"0*8878=0",
-"0*8879=0",
-"0*8880=0",
-"0*8881=0",
-"0*8882=0",
-"0*8883=0",
-"0*8884=0",
-"0*8885=0",
-"0*8886=0",
-"0*8887=0",
-"0*8888=0",
-"0*8889=0",
-"0*8890=0",
-"0*8891=0",
-"0*8892=0",
-"0*8893=0",
-"0*8894=0",
-"0*8895=0",
-"0*8896=0",
-"0*8897=0",
-"0*8898=0",
-"0*8899=0",
-"0*88+0=0",
-"0*88+1=1",
-"0*88+2=2",
-"0*88+3=3",
-"0*88+4=4",
-"0*88+5=5",
-"0*88+6=6",
-"0*88+7=7",
-"0*88+8=8",
-"0*88+9=9",
-"0*88-0=0",
-"0*88*0=0",
-"0*88*1=0",
-"0*88*2=0",
-"0*88*3=0",
-"0*88*4=0",
-"0*88*5=0",
-"0*88*6=0",
-"0*88*7=0",
-"0*88*8=0",
-"0*88*9=0",
-"0*88/1=0",
-"0*88/2=0",
-"0*88/3=0",
-"0*88/4=0",
-"0*88/5=0",
-"0*88/6=0",
-"0*88/7=0",
-"0*88/8=0",
-"0*88/9=0",
-"0*8900=0",
-"0*8901=0",
-"0*8902=0",
-"0*8903=0",
-"0*8904=0",
-"0*8905=0",
-"0*8906=0",
-"0*8907=0",
-"0*8908=0",
-"0*8909=0",
-"0*8910=0",
-"0*8911=0",
-"0*8912=0",
-"0*8913=0",
-"0*8914=0",
-"0*8915=0",
-"0*8916=0",
-"0*8917=0",
-"0*8918=0",
-"0*8919=0",
-"0*8920=0",
-"0*8921=0",
-"0*8922=0",
-"0*8923=0",
-"0*8924=0",
-"0*8925=0",
-"0*8926=0",
-"0*8927=0",
-"0*8928=0",
-"0*8929=0",
-"0*8930=0",
-"0*8931=0",
-"0*8932=0",
-"0*8933=0",
-"0*8934=0",
-"0*8935=0",
-"0*8936=0",
-"0*8937=0",
-"0*8938=0",
-"0*8939=0",
-"0*8940=0",
-"0*8941=0",
-"0*8942=0",
-"0*8943=0",
-"0*8944=0",
-"0*8945=0",
-"0*8946=0",
-"0*8947=0",
-"0*8948=0",
-"0*8949=0",
-"0*8950=0",
-"0*8951=0",
-"0*8952=0",
-"0*8953=0",
-"0*8954=0",
-"0*8955=0",
-"0*8956=0",
-"0*8957=0",
-"0*8958=0",
-"0*8959=0",
-"0*8960=0",
-"0*8961=0",
-"0*8962=0",
-"0*8963=0",
-"0*8964=0",
-"0*8965=0",
-"0*8966=0",
-"0*8967=0",
-"0*8968=0",
-"0*8969=0",
-"0*8970=0",
-"0*8971=0",
-"0*8972=0",
-"0*8973=0",
-"0*8974=0",
-"0*8975=0",
-"0*8976=0",
-"0*8977=0",
-"0*8978=0",
-"0*8979=0",
-"0*8980=0",
-"0*8981=0",
-"0*8982=0",
-"0*8983=0",
-"0*8984=0",
-"0*8985=0",
-"0*8986=0",
-"0*8987=0",
-"0*8988=0",
-"0*8989=0",
-"0*8990=0",
-"0*8991=0",
-"0*8992=0",
-"0*8993=0",
-"0*8994=0",
-"0*8995=0",
-"0*8996=0",
-"0*8997=0",
-"0*8998=0",
-"0*8999=0",
-"0*89+0=0",
-"0*89+1=1",
-"0*89+2=2",
-"0*89+3=3",
-"0*89+4=4",
-"0*89+5=5",
-"0*89+6=6",
-"0*89+7=7",
-"0*89+8=8",
-"0*89+9=9",
-"0*89-0=0",
-"0*89*0=0",
-"0*89*1=0",
-"0*89*2=0",
-"0*89*3=0",
-"0*89*4=0",
-"0*89*5=0",
-"0*89*6=0",
-"0*89*7=0",
-"0*89*8=0",
-"0*89*9=0",
-"0*89/1=0",
-"0*89/2=0",
-"0*89/3=0",
-"0*89/4=0",
-"0*89/5=0",
-"0*89/6=0",
-"0*89/7=0",
-"0*89/8=0",
-"0*89/9=0",
-"0*8-1=-1",
-"0*8-2=-2",
-"0*8-3=-3",
-"0*8-4=-4",
-"0*8-5=-5",
-"0*8-6=-6",
-"0*8-7=-7",
-"0*8-8=-8",
-"0*8-9=-9",
-"0*8*10=0",
-"0*8*11=0",
-"0*8*12=0",
-"0*8*13=0",
-"0*8*14=0",
-"0*8*15=0",
-"0*8*16=0",
-"0*8*17=0",
-"0*8*18=0",
-"0*8*19=0",
-"0*8*20=0",
-"0*8*21=0",
-"0*8*22=0",
-"0*8*23=0",
-"0*8*24=0",
-"0*8*25=0",
-"0*8*26=0",
-"0*8*27=0",
-"0*8*28=0",
-"0*8*29=0",
-"0*8*30=0",
-"0*8*31=0",
-"0*8*32=0",
-"0*8*33=0",
-"0*8*34=0",
-"0*8*35=0",
-"0*8*36=0",
-"0*8*37=0",
-"0*8*38=0",
-"0*8*39=0",
-"0*8*40=0",
-"0*8*41=0",
-"0*8*42=0",
-"0*8*43=0",
-"0*8*44=0",
-"0*8*45=0",
-"0*8*46=0",
-"0*8*47=0",
-"0*8*48=0",
-"0*8*49=0",
-"0*8*50=0",
-"0*8*51=0",
-"0*8*52=0",
-"0*8*53=0",
-"0*8*54=0",
-"0*8*55=0",
-"0*8*56=0",
-"0*8*57=0",
-"0*8*58=0",
-"0*8*59=0",
-"0*8*60=0",
-"0*8*61=0",
-"0*8*62=0",
-"0*8*63=0",
-"0*8*64=0",
-"0*8*65=0",
-"0*8*66=0",
-"0*8*67=0",
-"0*8*68=0",
-"0*8*69=0",
-"0*8*70=0",
-"0*8*71=0",
-"0*8*72=0",
-"0*8*73=0",
-"0*8*74=0",
-"0*8*75=0",
-"0*8*76=0",
-"0*8*77=0",
-"0*8*78=0",
-"0*8*79=0",
-"0*8*80=0",
-"0*8*81=0",
-"0*8*82=0",
-"0*8*83=0",
-"0*8*84=0",
-"0*8*85=0",
-"0*8*86=0",
-"0*8*87=0",
-"0*8*88=0",
-"0*8*89=0",
-"0*8*90=0",
-"0*8*91=0",
-"0*8*92=0",
-"0*8*93=0",
-"0*8*94=0",
-"0*8*95=0",
-"0*8*96=0",
-"0*8*97=0",
-"0*8*98=0",
-"0*8*99=0",
-"0*8/10=0",
-"0*8/11=0",
-"0*8/12=0",
-"0*8/13=0",
-"0*8/14=0",
-"0*8/15=0",
-"0*8/16=0",
-"0*8/17=0",
-"0*8/18=0",
-"0*8/19=0",
-"0*8/20=0",
-"0*8/21=0",
-"0*8/22=0",
-"0*8/23=0",
-"0*8/24=0",
-"0*8/25=0",
-"0*8/26=0",
-"0*8/27=0",
-"0*8/28=0",
-"0*8/29=0",
-"0*8/30=0",
-"0*8/31=0",
-"0*8/32=0",
-"0*8/33=0",
-"0*8/34=0",
-"0*8/35=0",
-"0*8/36=0",
-"0*8/37=0",
-"0*8/38=0",
-"0*8/39=0",
-"0*8/40=0",
-"0*8/41=0",
-"0*8/42=0",
-"0*8/43=0",
-"0*8/44=0",
-"0*8/45=0",
-"0*8/46=0",
-"0*8/47=0",
-"0*8/48=0",
-"0*8/49=0",
-"0*8/50=0",
-"0*8/51=0",
-"0*8/52=0",
-"0*8/53=0",
-"0*8/54=0",
-"0*8/55=0",
-"0*8/56=0",
-"0*8/57=0",
-"0*8/58=0",
-"0*8/59=0",
-"0*8/60=0",
-"0*8/61=0",
-"0*8/62=0",
-"0*8/63=0",
-"0*8/64=0",
-"0*8/65=0",
-"0*8/66=0",
-"0*8/67=0",
-"0*8/68=0",
-"0*8/69=0",
-"0*8/70=0",
-"0*8/71=0",
-"0*8/72=0",
-"0*8/73=0",
-"0*8/74=0",
-"0*8/75=0",
-"0*8/76=0",
-"0*8/77=0",
-"0*8/78=0",
-"0*8/79=0",
-"0*8/80=0",
-"0*8/81=0",
-"0*8/82=0",
-"0*8/83=0",
-"0*8/84=0",
-"0*8/85=0",
-"0*8/86=0",
-"0*8/87=0",
-"0*8/88=0",
-"0*8/89=0",
-"0*8/90=0",
-"0*8/91=0",
-"0*8/92=0",
-"0*8/93=0",
-"0*8/94=0",
-"0*8/95=0",
-"0*8/96=0",
-"0*8/97=0",
-"0*8/98=0",
-"0*8/99=0",
-"0*9000=0",
-"0*9001=0",
-"0*9002=0",
-"0*9003=0",
-"0*9004=0",
-"0*9005=0",
-"0*9006=0",
-"0*9007=0",
-"0*9008=0",
-"0*9009=0",
-"0*9010=0",
-"0*9011=0",
-"0*9012=0",
-"0*9013=0",
-"0*9014=0",
-"0*9015=0",
-"0*9016=0",
-"0*9017=0",
-"0*9018=0",
-"0*9019=0",
-"0*9020=0",
-"0*9021=0",
-"0*9022=0",
-"0*9023=0",
-"0*9024=0",
-"0*9025=0",
-"0*9026=0",
-"0*9027=0",
-"0*9028=0",
-"0*9029=0",
-"0*9030=0",
-"0*9031=0",
-"0*9032=0",
-"0*9033=0",
-"0*9034=0",
-"0*9035=0",
-"0*9036=0",
-"0*9037=0",
-"0*9038=0",
-"0*9039=0",
-"0*9040=0",
-"0*9041=0",
-"0*9042=0",
-"0*9043=0",
-"0*9044=0",
-"0*9045=0",
-"0*9046=0",
-"0*9047=0",
-"0*9048=0",
-"0*9049=0",
-"0*9050=0",
-"0*9051=0",
-"0*9052=0",
-"0*9053=0",
-"0*9054=0",
-"0*9055=0",
-"0*9056=0",
-"0*9057=0",
-"0*9058=0",
-"0*9059=0",
-"0*9060=0",
-"0*9061=0",
-"0*9062=0",
-"0*9063=0",
-"0*9064=0",
-"0*9065=0",
-"0*9066=0",
-"0*9067=0",
-"0*9068=0",
-"0*9069=0",
-"0*9070=0",
-"0*9071=0",
-"0*9072=0",
-"0*9073=0",
-"0*9074=0",
-"0*9075=0",
-"0*9076=0",
-"0*9077=0",
-"0*9078=0",
-"0*9079=0",
-"0*9080=0",
-"0*9081=0",
-"0*9082=0",
-"0*9083=0",
-"0*9084=0",
-"0*9085=0",
-"0*9086=0",
-"0*9087=0",
-"0*9088=0",
-"0*9089=0",
-"0*9090=0",
-"0*9091=0",
-"0*9092=0",
-"0*9093=0",
-"0*9094=0",
-"0*9095=0",
-"0*9096=0",
-"0*9097=0",
-"0*9098=0",
-"0*9099=0",
-"0*90+0=0",
-"0*90+1=1",
-"0*90+2=2",
-"0*90+3=3",
-"0*90+4=4",
-"0*90+5=5",
-"0*90+6=6",
-"0*90+7=7",
-"0*90+8=8",
-"0*90+9=9",
-"0*90-0=0",
-"0*90*0=0",
-"0*90*1=0",
-"0*90*2=0",
-"0*90*3=0",
-"0*90*4=0",
-"0*90*5=0",
-"0*90*6=0",
-"0*90*7=0",
-"0*90*8=0",
-"0*90*9=0",
-"0*90/1=0",
-"0*90/2=0",
-"0*90/3=0",
-"0*90/4=0",
-"0*90/5=0",
-"0*90/6=0",
-"0*90/7=0",
-"0*90/8=0",
-"0*90/9=0",
-"0*9100=0",
-"0*9101=0",
-"0*9102=0",
-"0*9103=0",
-"0*9104=0",
-"0*9105=0",
-"0*9106=0",
-"0*9107=0",
-"0*9108=0",
-"0*9109=0",
-"0*9110=0",
-"0*9111=0",
-"0*9112=0",
-"0*9113=0",
-"0*9114=0",
-"0*9115=0",
-"0*9116=0",
-"0*9117=0",
-"0*9118=0",
-"0*9119=0",
-"0*9120=0",
-"0*9121=0",
-"0*9122=0",
-"0*9123=0",
-"0*9124=0",
-"0*9125=0",
-"0*9126=0",
-"0*9127=0",
-"0*9128=0",
-"0*9129=0",
-"0*9130=0",
-"0*9131=0",
-"0*9132=0",
-"0*9133=0",
-"0*9134=0",
-"0*9135=0",
-"0*9136=0",
-"0*9137=0",
-"0*9138=0",
-"0*9139=0",
-"0*9140=0",
-"0*9141=0",
-"0*9142=0",
-"0*9143=0",
-"0*9144=0",
-"0*9145=0",
-"0*9146=0",
-"0*9147=0",
-"0*9148=0",
-"0*9149=0",
-"0*9150=0",
-"0*9151=0",
-"0*9152=0",
-"0*9153=0",
-"0*9154=0",
-"0*9155=0",
-"0*9156=0",
-"0*9157=0",
-"0*9158=0",
-"0*9159=0",
-"0*9160=0",
-"0*9161=0",
-"0*9162=0",
-"0*9163=0",
-"0*9164=0",
-"0*9165=0",
-"0*9166=0",
-"0*9167=0",
-"0*9168=0",
-"0*9169=0",
-"0*9170=0",
-"0*9171=0",
-"0*9172=0",
-"0*9173=0",
-"0*9174=0",
-"0*9175=0",
-"0*9176=0",
-"0*9177=0",
-"0*9178=0",
-"0*9179=0",
-"0*9180=0",
-"0*9181=0",
-"0*9182=0",
-"0*9183=0",
-"0*9184=0",
-"0*9185=0",
-"0*9186=0",
-"0*9187=0",
-"0*9188=0",
-"0*9189=0",
-"0*9190=0",
-"0*9191=0",
-"0*9192=0",
-"0*9193=0",
-"0*9194=0",
-"0*9195=0",
-"0*9196=0",
-"0*9197=0",
-"0*9198=0",
-"0*9199=0",
-"0*91+0=0",
-"0*91+1=1",
-"0*91+2=2",
-"0*91+3=3",
-"0*91+4=4",
-"0*91+5=5",
-"0*91+6=6",
-"0*91+7=7",
-"0*91+8=8",
-"0*91+9=9",
-"0*91-0=0",
-"0*91*0=0",
-"0*91*1=0",
-"0*91*2=0",
-"0*91*3=0",
-"0*91*4=0",
-"0*91*5=0",
-"0*91*6=0",
-"0*91*7=0",
-"0*91*8=0",
-"0*91*9=0",
-"0*91/1=0",
-"0*91/2=0",
-"0*91/3=0",
-"0*91/4=0",
-"0*91/5=0",
-"0*91/6=0",
-"0*91/7=0",
-"0*91/8=0",
-"0*91/9=0",
-"0*9200=0",
-"0*9201=0",
-"0*9202=0",
-"0*9203=0",
-"0*9204=0",
-"0*9205=0",
-"0*9206=0",
-"0*9207=0",
-"0*9208=0",
-"0*9209=0",
-"0*9210=0",
-"0*9211=0",
-"0*9212=0",
-"0*9213=0",
-"0*9214=0",
-"0*9215=0",
-"0*9216=0",
-"0*9217=0",
-"0*9218=0",
-"0*9219=0",
-"0*9220=0",
-"0*9221=0",
-"0*9222=0",
-"0*9223=0",
-"0*9224=0",
-"0*9225=0",
-"0*9226=0",
-"0*9227=0",
-"0*9228=0",
-"0*9229=0",
-"0*9230=0",
-"0*9231=0",
-"0*9232=0",
-"0*9233=0",
-"0*9234=0",
-"0*9235=0",
-"0*9236=0",
-"0*9237=0",
-"0*9238=0",
-"0*9239=0",
-"0*9240=0",
-"0*9241=0",
-"0*9242=0",
-"0*9243=0",
-"0*9244=0",
-"0*9245=0",
-"0*9246=0",
-"0*9247=0",
-"0*9248=0",
-"0*9249=0",
-"0*9250=0",
-"0*9251=0",
-"0*9252=0",
-"0*9253=0",
-"0*9254=0",
-"0*9255=0",
-"0*9256=0",
-"0*9257=0",
-"0*9258=0",
-"0*9259=0",
-"0*9260=0",
-"0*9261=0",
-"0*9262=0",
-"0*9263=0",
-"0*9264=0",
-"0*9265=0",
-"0*9266=0",
-"0*9267=0",
-"0*9268=0",
-"0*9269=0",
-"0*9270=0",
-"0*9271=0",
-"0*9272=0",
-"0*9273=0",
-"0*9274=0",
-"0*9275=0",
-"0*9276=0",
-"0*9277=0",
-"0*9278=0",
-"0*9279=0",
-"0*9280=0",
-"0*9281=0",
-"0*9282=0",
-"0*9283=0",
-"0*9284=0",
-"0*9285=0",
-"0*9286=0",
-"0*9287=0",
-"0*9288=0",
-"0*9289=0",
-"0*9290=0",
-"0*9291=0",
-"0*9292=0",
-"0*9293=0",
-"0*9294=0",
-"0*9295=0",
-"0*9296=0",
-"0*9297=0",
-"0*9298=0",
-"0*9299=0",
-"0*92+0=0",
-"0*92+1=1",
-"0*92+2=2",
-"0*92+3=3",
-"0*92+4=4",
-"0*92+5=5",
-"0*92+6=6",
-"0*92+7=7",
-"0*92+8=8",
-"0*92+9=9",
-"0*92-0=0",
-"0*92*0=0",
-"0*92*1=0",
-"0*92*2=0",
-"0*92*3=0",
-"0*92*4=0",
-"0*92*5=0",
-"0*92*6=0",
-"0*92*7=0",
-"0*92*8=0",
-"0*92*9=0",
-"0*92/1=0",
-"0*92/2=0",
-"0*92/3=0",
-"0*92/4=0",
-"0*92/5=0",
-"0*92/6=0",
-"0*92/7=0",
-"0*92/8=0",
-"0*92/9=0",
-"0*9300=0",
-"0*9301=0",
-"0*9302=0",
-"0*9303=0",
-"0*9304=0",
-"0*9305=0",
-"0*9306=0",
-"0*9307=0",
-"0*9308=0",
-"0*9309=0",
-"0*9310=0",
-"0*9311=0",
-"0*9312=0",
-"0*9313=0",
-"0*9314=0",
-"0*9315=0",
-"0*9316=0",
-"0*9317=0",
-"0*9318=0",
-"0*9319=0",
-"0*9320=0",
-"0*9321=0",
-"0*9322=0",
-"0*9323=0",
-"0*9324=0",
-"0*9325=0",
-"0*9326=0",
-"0*9327=0",
-"0*9328=0",
-"0*9329=0",
-"0*9330=0",
-"0*9331=0",
-"0*9332=0",
-"0*9333=0",
-"0*9334=0",
-"0*9335=0",
-"0*9336=0",
-"0*9337=0",
-"0*9338=0",
-"0*9339=0",
-"0*9340=0",
-"0*9341=0",
-"0*9342=0",
-"0*9343=0",
-"0*9344=0",
-"0*9345=0",
-"0*9346=0",
-"0*9347=0",
-"0*9348=0",
-"0*9349=0",
-"0*9350=0",
-"0*9351=0",
-"0*9352=0",
-"0*9353=0",
-"0*9354=0",
-"0*9355=0",
-"0*9356=0",
-"0*9357=0",
-"0*9358=0",
-"0*9359=0",
-"0*9360=0",
-"0*9361=0",
-"0*9362=0",
-"0*9363=0",
-"0*9364=0",
-"0*9365=0",
-"0*9366=0",
-"0*9367=0",
-"0*9368=0",
-"0*9369=0",
-"0*9370=0",
-"0*9371=0",
-"0*9372=0",
-"0*9373=0",
-"0*9374=0",
-"0*9375=0",
-"0*9376=0",
-"0*9377=0",
-"0*9378=0",
-"0*9379=0",
-"0*9380=0",
-"0*9381=0",
-"0*9382=0",
-"0*9383=0",
-"0*9384=0",
-"0*9385=0",
-"0*9386=0",
-"0*9387=0",
-"0*9388=0",
-"0*9389=0",
-"0*9390=0",
-"0*9391=0",
-"0*9392=0",
-"0*9393=0",
-"0*9394=0",
-"0*9395=0",
-"0*9396=0",
-"0*9397=0",
-"0*9398=0",
-"0*9399=0",
-"0*93+0=0",
-"0*93+1=1",
-"0*93+2=2",
-"0*93+3=3",
-"0*93+4=4",
-"0*93+5=5",
-"0*93+6=6",
-"0*93+7=7",
-"0*93+8=8",
-"0*93+9=9",
-"0*93-0=0",
-"0*93*0=0",
-"0*93*1=0",
-"0*93*2=0",
-"0*93*3=0",
-"0*93*4=0",
-"0*93*5=0",
-"0*93*6=0",
-"0*93*7=0",
-"0*93*8=0",
-"0*93*9=0",
-"0*93/1=0",
-"0*93/2=0",
-"0*93/3=0",
-"0*93/4=0",
-"0*93/5=0",
-"0*93/6=0",
-"0*93/7=0",
-"0*93/8=0",
-"0*93/9=0",
-"0*9400=0",
-"0*9401=0",
-"0*9402=0",
-"0*9403=0",
-"0*9404=0",
-"0*9405=0",
-"0*9406=0",
-"0*9407=0",
-"0*9408=0",
-"0*9409=0",
-"0*9410=0",
-"0*9411=0",
-"0*9412=0",
-"0*9413=0",
-"0*9414=0",
-"0*9415=0",
-"0*9416=0",
-"0*9417=0",
-"0*9418=0",
-"0*9419=0",
-"0*9420=0",
-"0*9421=0",
-"0*9422=0",
-"0*9423=0",
-"0*9424=0",
-"0*9425=0",
-"0*9426=0",
-"0*9427=0",
-"0*9428=0",
-"0*9429=0",
-"0*9430=0",
-"0*9431=0",
-"0*9432=0",
-"0*9433=0",
-"0*9434=0",
-"0*9435=0",
-"0*9436=0",
-"0*9437=0",
-"0*9438=0",
-"0*9439=0",
-"0*9440=0",
-"0*9441=0",
-"0*9442=0",
-"0*9443=0",
-"0*9444=0",
-"0*9445=0",
-"0*9446=0",
-"0*9447=0",
-"0*9448=0",
-"0*9449=0",
-"0*9450=0",
-"0*9451=0",
-"0*9452=0",
-"0*9453=0",
-"0*9454=0",
-"0*9455=0",
-"0*9456=0",
-"0*9457=0",
-"0*9458=0",
-"0*9459=0",
-"0*9460=0",
-"0*9461=0",
-"0*9462=0",
-"0*9463=0",
-"0*9464=0",
-"0*9465=0",
-"0*9466=0",
-"0*9467=0",
-"0*9468=0",
-"0*9469=0",
-"0*9470=0",
-"0*9471=0",
-"0*9472=0",
-"0*9473=0",
-"0*9474=0",
-"0*9475=0",
-"0*9476=0",
-"0*9477=0",
-"0*9478=0",
-"0*9479=0",
-"0*9480=0",
-"0*9481=0",
-"0*9482=0",
-"0*9483=0",
-"0*9484=0",
-"0*9485=0",
-"0*9486=0",
-"0*9487=0",
-"0*9488=0",
-"0*9489=0",
-"0*9490=0",
-"0*9491=0",
-"0*9492=0",
-"0*9493=0",
-"0*9494=0",
-"0*9495=0",
-"0*9496=0",
-"0*9497=0",
-"0*9498=0",
-"0*9499=0",
-"0*94+0=0",
-"0*94+1=1",
-"0*94+2=2",
-"0*94+3=3",
-"0*94+4=4",
-"0*94+5=5",
-"0*94+6=6",
-"0*94+7=7",
-"0*94+8=8",
-"0*94+9=9",
-"0*94-0=0",
-"0*94*0=0",
-"0*94*1=0",
-"0*94*2=0",
-"0*94*3=0",
-"0*94*4=0",
-"0*94*5=0",
-"0*94*6=0",
-"0*94*7=0",
-"0*94*8=0",
-"0*94*9=0",
-"0*94/1=0",
-"0*94/2=0",
-"0*94/3=0",
-"0*94/4=0",
-"0*94/5=0",
-"0*94/6=0",
-"0*94/7=0",
-"0*94/8=0",
-"0*94/9=0",
-"0*9500=0",
-"0*9501=0",
-"0*9502=0",
-"0*9503=0",
-"0*9504=0",
-"0*9505=0",
-"0*9506=0",
-"0*9507=0",
-"0*9508=0",
-"0*9509=0",
-"0*9510=0",
-"0*9511=0",
-"0*9512=0",
-"0*9513=0",
-"0*9514=0",
-"0*9515=0",
-"0*9516=0",
-"0*9517=0",
-"0*9518=0",
-"0*9519=0",
-"0*9520=0",
-"0*9521=0",
-"0*9522=0",
-"0*9523=0",
-"0*9524=0",
-"0*9525=0",
-"0*9526=0",
-"0*9527=0",
-"0*9528=0",
-"0*9529=0",
-"0*9530=0",
-"0*9531=0",
-"0*9532=0",
-"0*9533=0",
-"0*9534=0",
-"0*9535=0",
-"0*9536=0",
-"0*9537=0",
-"0*9538=0",
-"0*9539=0",
-"0*9540=0",
-"0*9541=0",
-"0*9542=0",
-"0*9543=0",
-"0*9544=0",
-"0*9545=0",
-"0*9546=0",
-"0*9547=0",
-"0*9548=0",
-"0*9549=0",
-"0*9550=0",
-"0*9551=0",
-"0*9552=0",
-"0*9553=0",
-"0*9554=0",
-"0*9555=0",
-"0*9556=0",
-"0*9557=0",
-"0*9558=0",
-"0*9559=0",
-"0*9560=0",
-"0*9561=0",
-"0*9562=0",
-"0*9563=0",
-"0*9564=0",
-"0*9565=0",
-"0*9566=0",
-"0*9567=0",
-"0*9568=0",
-"0*9569=0",
-"0*9570=0",
-"0*9571=0",
-"0*9572=0",
-"0*9573=0",
-"0*9574=0",
-"0*9575=0",
-"0*9576=0",
-"0*9577=0",
-"0*9578=0",
-"0*9579=0",
-"0*9580=0",
-"0*9581=0",
-"0*9582=0",
-"0*9583=0",
-"0*9584=0",
-"0*9585=0",
-"0*9586=0",
-"0*9587=0",
-"0*9588=0",
-"0*9589=0",
-"0*9590=0",
-"0*9591=0",
-"0*9592=0",
-"0*9593=0",
-"0*9594=0",
-"0*9595=0",
-"0*9596=0",
-"0*9597=0",
-"0*9598=0",
-"0*9599=0",
-"0*95+0=0",
-"0*95+1=1",
-"0*95+2=2",
-"0*95+3=3",
-"0*95+4=4",
-"0*95+5=5",
-"0*95+6=6",
-"0*95+7=7",
-"0*95+8=8",
-"0*95+9=9",
-"0*95-0=0",
-"0*95*0=0",
-"0*95*1=0",
-"0*95*2=0",
-"0*95*3=0",
-"0*95*4=0",
-"0*95*5=0",
-"0*95*6=0",
-"0*95*7=0",
-"0*95*8=0",
-"0*95*9=0",
-"0*95/1=0",
-"0*95/2=0",
-"0*95/3=0",
-"0*95/4=0",
-"0*95/5=0",
-"0*95/6=0",
-"0*95/7=0",
-"0*95/8=0",
-"0*95/9=0",
-"0*9600=0",
-"0*9601=0",
-"0*9602=0",
-"0*9603=0",
-"0*9604=0",
-"0*9605=0",
-"0*9606=0",
-"0*9607=0",
-"0*9608=0",
-"0*9609=0",
-"0*9610=0",
-"0*9611=0",
-"0*9612=0",
-"0*9613=0",
-"0*9614=0",
-"0*9615=0",
-"0*9616=0",
-"0*9617=0",
-"0*9618=0",
-"0*9619=0",
-"0*9620=0",
-"0*9621=0",
-"0*9622=0",
-"0*9623=0",
-"0*9624=0",
-"0*9625=0",
-"0*9626=0",
-"0*9627=0",
-"0*9628=0",
-"0*9629=0",
-"0*9630=0",
-"0*9631=0",
-"0*9632=0",
-"0*9633=0",
-"0*9634=0",
-"0*9635=0",
-"0*9636=0",
-"0*9637=0",
-"0*9638=0",
-"0*9639=0",
-"0*9640=0",
-"0*9641=0",
-"0*9642=0",
-"0*9643=0",
-"0*9644=0",
-"0*9645=0",
-"0*9646=0",
-"0*9647=0",
-"0*9648=0",
-"0*9649=0",
-"0*9650=0",
-"0*9651=0",
-"0*9652=0",
-"0*9653=0",
-"0*9654=0",
-"0*9655=0",
-"0*9656=0",
-"0*9657=0",
-"0*9658=0",
-"0*9659=0",
-"0*9660=0",
-"0*9661=0",
-"0*9662=0",
-"0*9663=0",
-"0*9664=0",
-"0*9665=0",
-"0*9666=0",
-"0*9667=0",
-"0*9668=0",
-"0*9669=0",
-"0*9670=0",
-"0*9671=0",
-"0*9672=0",
-"0*9673=0",
-"0*9674=0",
-"0*9675=0",
-"0*9676=0",
-"0*9677=0",
-"0*9678=0",
-"0*9679=0",
-"0*9680=0",
-"0*9681=0",
-"0*9682=0",
-"0*9683=0",
-"0*9684=0",
-"0*9685=0",
-"0*9686=0",
-"0*9687=0",
-"0*9688=0",
-"0*9689=0",
-"0*9690=0",
-"0*9691=0",
-"0*9692=0",
-"0*9693=0",
-"0*9694=0",
-"0*9695=0",
-"0*9696=0",
-"0*9697=0",
-"0*9698=0",
-"0*9699=0",
-"0*96+0=0",
-"0*96+1=1",
-"0*96+2=2",
-"0*96+3=3",
-"0*96+4=4",
-"0*96+5=5",
-"0*96+6=6",
-"0*96+7=7",
-"0*96+8=8",
-"0*96+9=9",
-"0*96-0=0",
-"0*96*0=0",
-"0*96*1=0",
-"0*96*2=0",
-"0*96*3=0",
-"0*96*4=0",
-"0*96*5=0",
-"0*96*6=0",
-"0*96*7=0",
-"0*96*8=0",
-"0*96*9=0",
-"0*96/1=0",
-"0*96/2=0",
-"0*96/3=0",
-"0*96/4=0",
-"0*96/5=0",
-"0*96/6=0",
-"0*96/7=0",
-"0*96/8=0",
-"0*96/9=0",
-"0*9700=0",
-"0*9701=0",
-"0*9702=0",
-"0*9703=0",
-"0*9704=0",
-"0*9705=0",
-"0*9706=0",
-"0*9707=0",
-"0*9708=0",
-"0*9709=0",
-"0*9710=0",
-"0*9711=0",
-"0*9712=0",
-"0*9713=0",
-"0*9714=0",
-"0*9715=0",
-"0*9716=0",
-"0*9717=0",
-"0*9718=0",
-"0*9719=0",
-"0*9720=0",
-"0*9721=0",
-"0*9722=0",
-"0*9723=0",
-"0*9724=0",
-"0*9725=0",
-"0*9726=0",
-"0*9727=0",
-"0*9728=0",
-"0*9729=0",
-"0*9730=0",
-"0*9731=0",
-"0*9732=0",
-"0*9733=0",
-"0*9734=0",
-"0*9735=0",
-"0*9736=0",
-"0*9737=0",
-"0*9738=0",
-"0*9739=0",
-"0*9740=0",
-"0*9741=0",
-"0*9742=0",
-"0*9743=0",
-"0*9744=0",
-"0*9745=0",
-"0*9746=0",
-"0*9747=0",
-"0*9748=0",
-"0*9749=0",
-"0*9750=0",
-"0*9751=0",
-"0*9752=0",
-"0*9753=0",
-"0*9754=0",
-"0*9755=0",
-"0*9756=0",
-"0*9757=0",
-"0*9758=0",
-"0*9759=0",
-"0*9760=0",
-"0*9761=0",
-"0*9762=0",
-"0*9763=0",
-"0*9764=0",
-"0*9765=0",
-"0*9766=0",
-"0*9767=0",
-"0*9768=0",
-"0*9769=0",
-"0*9770=0",
-"0*9771=0",
-"0*9772=0",
-"0*9773=0",
-"0*9774=0",
-"0*9775=0",
-"0*9776=0",
-"0*9777=0",
-"0*9778=0",
-"0*9779=0",
-"0*9780=0",
-"0*9781=0",
-"0*9782=0",
-"0*9783=0",
-"0*9784=0",
-"0*9785=0",
-"0*9786=0",
-"0*9787=0",
-"0*9788=0",
-"0*9789=0",
-"0*9790=0",
-"0*9791=0",
-"0*9792=0",
-"0*9793=0",
-"0*9794=0",
-"0*9795=0",
-"0*9796=0",
-"0*9797=0",
-"0*9798=0",
-"0*9799=0",
-"0*97+0=0",
-"0*97+1=1",
-"0*97+2=2",
-"0*97+3=3",
-"0*97+4=4",
-"0*97+5=5",
-"0*97+6=6",
-"0*97+7=7",
-"0*97+8=8",
-"0*97+9=9",
-"0*97-0=0",
-"0*97*0=0",
-"0*97*1=0",
-"0*97*2=0",
-"0*97*3=0",
-"0*97*4=0",
-"0*97*5=0",
-"0*97*6=0",
-"0*97*7=0",
-"0*97*8=0",
-"0*97*9=0",
-"0*97/1=0",
-"0*97/2=0",
-"0*97/3=0",
-"0*97/4=0",
-"0*97/5=0",
-"0*97/6=0",
-"0*97/7=0",
-"0*97/8=0",
-"0*97/9=0",
-"0*9800=0",
-"0*9801=0",
-"0*9802=0",
-"0*9803=0",
-"0*9804=0",
-"0*9805=0",
-"0*9806=0",
-"0*9807=0",
-"0*9808=0",
-"0*9809=0",
-"0*9810=0",
-"0*9811=0",
-"0*9812=0",
-"0*9813=0",
-"0*9814=0",
-"0*9815=0",
-"0*9816=0",
-"0*9817=0",
-"0*9818=0",
-"0*9819=0",
-"0*9820=0",
-"0*9821=0",
-"0*9822=0",
-"0*9823=0",
-"0*9824=0",
-"0*9825=0",
-"0*9826=0",
-"0*9827=0",
-"0*9828=0",
-"0*9829=0",
-"0*9830=0",
-"0*9831=0",
-"0*9832=0",
-"0*9833=0",
-"0*9834=0",
-"0*9835=0",
-"0*9836=0",
-"0*9837=0",
-"0*9838=0",
-"0*9839=0",
-"0*9840=0",
-"0*9841=0",
-"0*9842=0",
-"0*9843=0",
-"0*9844=0",
-"0*9845=0",
-"0*9846=0",
-"0*9847=0",
-"0*9848=0",
-"0*9849=0",
-"0*9850=0",
-"0*9851=0",
-"0*9852=0",
-"0*9853=0",
-"0*9854=0",
-"0*9855=0",
-"0*9856=0",
-"0*9857=0",
-"0*9858=0",
-"0*9859=0",
-"0*9860=0",
-"0*9861=0",
-"0*9862=0",
-"0*9863=0",
-"0*9864=0",
-"0*9865=0",
-"0*9866=0",
-"0*9867=0",
-"0*9868=0",
-"0*9869=0",
-"0*9870=0",
-"0*9871=0",
-"0*9872=0",
-"0*9873=0",
-"0*9874=0",
-"0*9875=0",
-"0*9876=0",
-"0*9877=0",
-"0*9878=0",
-"0*9879=0",
-"0*9880=0",
-"0*9881=0",
-"0*9882=0",
-"0*9883=0",
-"0*9884=0",
-"0*9885=0",
-"0*9886=0",
-"0*9887=0",
-"0*9888=0",
-"0*9889=0",
-"0*9890=0",
-"0*9891=0",
-"0*9892=0",
-"0*9893=0",
-"0*9894=0",
-"0*9895=0",
-"0*9896=0",
-"0*9897=0",
-"0*9898=0",
-"0*9899=0",
-"0*98+0=0",
-"0*98+1=1",
-"0*98+2=2",
-"0*98+3=3",
-"0*98+4=4",
-"0*98+5=5",
-"0*98+6=6",
-"0*98+7=7",
-"0*98+8=8",
-"0*98+9=9",
-"0*98-0=0",
-"0*98*0=0",
-"0*98*1=0",
-"0*98*2=0",
-"0*98*3=0",
-"0*98*4=0",
-"0*98*5=0",
-"0*98*6=0",
-"0*98*7=0",
-"0*98*8=0",
-"0*98*9=0",
-"0*98/1=0",
-"0*98/2=0",
-"0*98/3=0",
-"0*98/4=0",
-"0*98/5=0",
-"0*98/6=0",
-"0*98/7=0",
-"0*98/8=0",
-"0*98/9=0",
-"0*9900=0",
-"0*9901=0",
-"0*9902=0",
-"0*9903=0",
-"0*9904=0",
-"0*9905=0",
-"0*9906=0",
-"0*9907=0",
-"0*9908=0",
-"0*9909=0",
-"0*9910=0",
-"0*9911=0",
-"0*9912=0",
-"0*9913=0",
-"0*9914=0",
-"0*9915=0",
-"0*9916=0",
-"0*9917=0",
-"0*9918=0",
-"0*9919=0",
-"0*9920=0",
-"0*9921=0",
-"0*9922=0",
-"0*9923=0",
-"0*9924=0",
-"0*9925=0",
-"0*9926=0",
-"0*9927=0",
-"0*9928=0",
-"0*9929=0",
-"0*9930=0",
-"0*9931=0",
-"0*9932=0",
-"0*9933=0",
-"0*9934=0",
-"0*9935=0",
-"0*9936=0",
-"0*9937=0",
-"0*9938=0",
-"0*9939=0",
-"0*9940=0",
-"0*9941=0",
-"0*9942=0",
-"0*9943=0",
-"0*9944=0",
-"0*9945=0",
-"0*9946=0",
-"0*9947=0",
-"0*9948=0",
-"0*9949=0",
-"0*9950=0",
-"0*9951=0",
-"0*9952=0",
-"0*9953=0",
-"0*9954=0",
-"0*9955=0",
-"0*9956=0",
-"0*9957=0",
-"0*9958=0",
-"0*9959=0",
-"0*9960=0",
-"0*9961=0",
-"0*9962=0",
-"0*9963=0",
-"0*9964=0",
-"0*9965=0",
-"0*9966=0",
-"0*9967=0",
-"0*9968=0",
-"0*9969=0",
-"0*9970=0",
-"0*9971=0",
-"0*9972=0",
-"0*9973=0",
-"0*9974=0",
-"0*9975=0",
-"0*9976=0",
-"0*9977=0",
-"0*9978=0",
-"0*9979=0",
-"0*9980=0",
-"0*9981=0",
-"0*9982=0",
-"0*9983=0",
-"0*9984=0",
-"0*9985=0",
-"0*9986=0",
-"0*9987=0",
-"0*9988=0",
-"0*9989=0",
-"0*9990=0",
-"0*9991=0",
-"0*9992=0",
-"0*9993=0",
-"0*9994=0",
-"0*9995=0",
-"0*9996=0",
-"0*9997=0",
-"0*9998=0",
-"0*9999=0",
-"0*99+0=0",
-"0*99+1=1",
-"0*99+2=2",
-"0*99+3=3",
-"0*99+4=4",
-"0*99+5=5",
-"0*99+6=6",
-"0*99+7=7",
-"0*99+8=8",
-"0*99+9=9",
-"0*99-0=0",
-"0*99*0=0",
-"0*99*1=0",
-"0*99*2=0",
-"0*99*3=0",
-"0*99*4=0",
-"0*99*5=0",
-"0*99*6=0",
-"0*99*7=0",
-"0*99*8=0",
-"0*99*9=0",
-"0*99/1=0",
-"0*99/2=0",
-"0*99/3=0",
-"0*99/4=0",
-"0*99/5=0",
-"0*99/6=0",
-"0*99/7=0",
-"0*99/8=0",
-"0*99/9=0",
-"0*9-1=-1",
-"0*9-2=-2",
-"0*9-3=-3",
-"0*9-4=-4",
-"0*9-5=-5",
-"0*9-6=-6",
-"0*9-7=-7",
-"0*9-8=-8",
-"0*9-9=-9",
-"0*9*10=0",
-"0*9*11=0",
-"0*9*12=0",
-"0*9*13=0",
-"0*9*14=0",
-"0*9*15=0",
-"0*9*16=0",
-"0*9*17=0",
-"0*9*18=0",
-"0*9*19=0",
-"0*9*20=0",
-"0*9*21=0",
-"0*9*22=0",
-"0*9*23=0",
-"0*9*24=0",
-"0*9*25=0",
-"0*9*26=0",
-"0*9*27=0",
-"0*9*28=0",
-"0*9*29=0",
-"0*9*30=0",
-"0*9*31=0",
-"0*9*32=0",
-"0*9*33=0",
-"0*9*34=0",
-"0*9*35=0",
-"0*9*36=0",
-"0*9*37=0",
-"0*9*38=0",
-"0*9*39=0",
-"0*9*40=0",
-"0*9*41=0",
-"0*9*42=0",
-"0*9*43=0",
-"0*9*44=0",
-"0*9*45=0",
-"0*9*46=0",
-"0*9*47=0",
-"0*9*48=0",
-"0*9*49=0",
-"0*9*50=0",
-"0*9*51=0",
-"0*9*52=0",
-"0*9*53=0",
-"0*9*54=0",
-"0*9*55=0",
-"0*9*56=0",
-"0*9*57=0",
-"0*9*58=0",
-"0*9*59=0",
-"0*9*60=0",
-"0*9*61=0",
-"0*9*62=0",
-"0*9*63=0",
-"0*9*64=0",
-"0*9*65=0",
-"0*9*66=0",
-"0*9*67=0",
-"0*9*68=0",
-"0*9*69=0",
-"0*9*70=0",
-"0*9*71=0",
-"0*9*72=0",
-"0*9*73=0",
-"0*9*74=0",
-"0*9*75=0",
-"0*9*76=0",
-"0*9*77=0",
-"0*9*78=0",
-"0*9*79=0",
-"0*9*80=0",
-"0*9*81=0",
-"0*9*82=0",
-"0*9*83=0",
-"0*9*84=0",
-"0*9*85=0",
-"0*9*86=0",
-"0*9*87=0",
-"0*9*88=0",
-"0*9*89=0",
-"0*9*90=0",
-"0*9*91=0",
-"0*9*92=0",
-"0*9*93=0",
-"0*9*94=0",
-"0*9*95=0",
-"0*9*96=0",
-"0*9*97=0",
-"0*9*98=0",
-"0*9*99=0",
-"0*9/10=0",
-"0*9/11=0",
-"0*9/12=0",
-"0*9/13=0",
-"0*9/14=0",
-"0*9/15=0",
-"0*9/16=0",
-"0*9/17=0",
-"0*9/18=0",
-"0*9/19=0",
-"0*9/20=0",
-"0*9/21=0",
-"0*9/22=0",
-"0*9/23=0",
-"0*9/24=0",
-"0*9/25=0",
-"0*9/26=0",
-"0*9/27=0",
-"0*9/28=0",
-"0*9/29=0",
-"0*9/30=0",
-"0*9/31=0",
-"0*9/32=0",
-"0*9/33=0",
-"0*9/34=0",
-"0*9/35=0",
-"0*9/36=0",
-"0*9/37=0",
-"0*9/38=0",
-"0*9/39=0",
-"0*9/40=0",
-"0*9/41=0",
-"0*9/42=0",
-"0*9/43=0",
-"0*9/44=0",
-"0*9/45=0",
-"0*9/46=0",
-"0*9/47=0",
-"0*9/48=0",
-"0*9/49=0",
-"0*9/50=0",
-"0*9/51=0",
-"0*9/52=0",
-"0*9/53=0",
-"0*9/54=0",
-"0*9/55=0",
-"0*9/56=0",
-"0*9/57=0",
-"0*9/58=0",
-"0*9/59=0",
-"0*9/60=0",
-"0*9/61=0",
-"0*9/62=0",
-"0*9/63=0",
-"0*9/64=0",
-"0*9/65=0",
-"0*9/66=0",
-"0*9/67=0",
-"0*9/68=0",
-"0*9/69=0",
-"0*9/70=0",
-"0*9/71=0",
-"0*9/72=0",
-"0*9/73=0",
-"0*9/74=0",
-"0*9/75=0",
-"0*9/76=0",
-"0*9/77=0",
-"0*9/78=0",
-"0*9/79=0",
-"0*9/80=0",
-"0*9/81=0",
-"0*9/82=0",
-"0*9/83=0",
-"0*9/84=0",
-"0*9/85=0",
-"0*9/86=0",
-"0*9/87=0",
-"0*9/88=0",
-"0*9/89=0",
-"0*9/90=0",
-"0*9/91=0",
-"0*9/92=0",
-"0*9/93=0",
-"0*9/94=0",
-"0*9/95=0",
-"0*9/96=0",
-"0*9/97=0",
-"0*9/98=0",
-"0*9/99=0",
-"0/1000=0",
-"0/1001=0",
-"0/1002=0",
-"0/1003=0",
-"0/1004=0",
-"0/1005=0",
-"0/1006=0",
-"0/1007=0",
-"0/1008=0",
-"0/1009=0",
-"0/1010=0",
-"0/1011=0",
-"0/1012=0",
-"0/1013=0",
-"0/1014=0",
-"0/1015=0",
-"0/1016=0",
-"0/1017=0",
-"0/1018=0",
-"0/1019=0",
-"0/1020=0",
-"0/1021=0",
-"0/1022=0",
-"0/1023=0",
-"0/1024=0",
-"0/1025=0",
-"0/1026=0",
-"0/1027=0",
-"0/1028=0",
-"0/1029=0",
-"0/1030=0",
-"0/1031=0",
-"0/1032=0",
-"0/1033=0",
-"0/1034=0",
-"0/1035=0",
-"0/1036=0",
-"0/1037=0",
-"0/1038=0",
-"0/1039=0",
-"0/1040=0",
-"0/1041=0",
-"0/1042=0",
-"0/1043=0",
-"0/1044=0",
-"0/1045=0",
-"0/1046=0",
-"0/1047=0",
-"0/1048=0",
-"0/1049=0",
-"0/1050=0",
-"0/1051=0",
-"0/1052=0",
-"0/1053=0",
-"0/1054=0",
-"0/1055=0",
-"0/1056=0",
-"0/1057=0",
-"0/1058=0",
-"0/1059=0",
-"0/1060=0",
-"0/1061=0",
-"0/1062=0",
-"0/1063=0",
-"0/1064=0",
-"0/1065=0",
-"0/1066=0",
-"0/1067=0",
-"0/1068=0",
-"0/1069=0",
-"0/1070=0",
-"0/1071=0",
-"0/1072=0",
-"0/1073=0",
-"0/1074=0",
-"0/1075=0",
-"0/1076=0",
-"0/1077=0",
-"0/1078=0",
-"0/1079=0",
-"0/1080=0",
-"0/1081=0",
-"0/1082=0",
-"0/1083=0",
-"0/1084=0",
-"0/1085=0",
-"0/1086=0",
-"0/1087=0",
-"0/1088=0",
-"0/1089=0",
-"0/1090=0",
-"0/1091=0",
-"0/1092=0",
-"0/1093=0",
-"0/1094=0",
-"0/1095=0",
-"0/1096=0",
-"0/1097=0",
-"0/1098=0",
-"0/1099=0",
-"0/10+0=0",
-"0/10+1=1",
-"0/10+2=2",
-"0/10+3=3",
-"0/10+4=4",
-"0/10+5=5",
-"0/10+6=6",
-"0/10+7=7",
-"0/10+8=8",
-"0/10+9=9",
-"0/10-0=0",
-"0/10*0=0",
-"0/10*1=0",
-"0/10*2=0",
-"0/10*3=0",
-"0/10*4=0",
-"0/10*5=0",
-"0/10*6=0",
-"0/10*7=0",
-"0/10*8=0",
-"0/10*9=0",
-"0/10/1=0",
-"0/10/2=0",
-"0/10/3=0",
-"0/10/4=0",
-"0/10/5=0",
-"0/10/6=0",
-"0/10/7=0",
-"0/10/8=0",
-"0/10/9=0",
-"0/1100=0",
-"0/1101=0",
-"0/1102=0",
-"0/1103=0",
-"0/1104=0",
-"0/1105=0",
-"0/1106=0",
-"0/1107=0",
-"0/1108=0",
-"0/1109=0",
-"0/1110=0",
-"0/1111=0",
-"0/1112=0",
-"0/1113=0",
-"0/1114=0",
-"0/1115=0",
-"0/1116=0",
-"0/1117=0",
-"0/1118=0",
-"0/1119=0",
-"0/1120=0",
-"0/1121=0",
-"0/1122=0",
-"0/1123=0",
-"0/1124=0",
-"0/1125=0",
-"0/1126=0",
-"0/1127=0",
-"0/1128=0",
-"0/1129=0",
-"0/1130=0",
-"0/1131=0",
-"0/1132=0",
-"0/1133=0",
-"0/1134=0",
-"0/1135=0",
-"0/1136=0",
-"0/1137=0",
-"0/1138=0",
-"0/1139=0",
-"0/1140=0",
-"0/1141=0",
-"0/1142=0",
-"0/1143=0",
-"0/1144=0",
-"0/1145=0",
-"0/1146=0",
-"0/1147=0",
-"0/1148=0",
-"0/1149=0",
-"0/1150=0",
-"0/1151=0",
-"0/1152=0",
-"0/1153=0",
-"0/1154=0",
-"0/1155=0",
-"0/1156=0",
-"0/1157=0",
-"0/1158=0",
-"0/1159=0",
-"0/1160=0",
-"0/1161=0",
-"0/1162=0",
-"0/1163=0",
-"0/1164=0",
-"0/1165=0",
-"0/1166=0",
-"0/1167=0",
-"0/1168=0",
-"0/1169=0",
-"0/1170=0",
-"0/1171=0",
-"0/1172=0",
-"0/1173=0",
-"0/1174=0",
-"0/1175=0",
-"0/1176=0",
-"0/1177=0",
-"0/1178=0",
-"0/1179=0",
-"0/1180=0",
-"0/1181=0",
-"0/1182=0",
-"0/1183=0",
-"0/1184=0",
-"0/1185=0",
-"0/1186=0",
-"0/1187=0",
-"0/1188=0",
-"0/1189=0",
-"0/1190=0",
-"0/1191=0",
-"0/1192=0",
-"0/1193=0",
-"0/1194=0",
-"0/1195=0",
-"0/1196=0",
-"0/1197=0",
-"0/1198=0",
-"0/1199=0",
-"0/11+0=0",
-"0/11+1=1",
-"0/11+2=2",
-"0/11+3=3",
-"0/11+4=4",
-"0/11+5=5",
-"0/11+6=6",
-"0/11+7=7",
-"0/11+8=8",
-"0/11+9=9",
-"0/11-0=0",
-"0/11*0=0",
-"0/11*1=0",
-"0/11*2=0",
-"0/11*3=0",
-"0/11*4=0",
-"0/11*5=0",
-"0/11*6=0",
-"0/11*7=0",
-"0/11*8=0",
-"0/11*9=0",
-"0/11/1=0",
-"0/11/2=0",
-"0/11/3=0",
-"0/11/4=0",
-"0/11/5=0",
-"0/11/6=0",
-"0/11/7=0",
-"0/11/8=0",
-"0/11/9=0",
-"0/1200=0",
-"0/1201=0",
-"0/1202=0",
-"0/1203=0",
-"0/1204=0",
-"0/1205=0",
-"0/1206=0",
-"0/1207=0",
-"0/1208=0",
-"0/1209=0",
-"0/1210=0",
-"0/1211=0",
-"0/1212=0",
-"0/1213=0",
-"0/1214=0",
-"0/1215=0",
-"0/1216=0",
-"0/1217=0",
-"0/1218=0",
-"0/1219=0",
-"0/1220=0",
-"0/1221=0",
-"0/1222=0",
-"0/1223=0",
-"0/1224=0",
-"0/1225=0",
-"0/1226=0",
-"0/1227=0",
-"0/1228=0",
-"0/1229=0",
-"0/1230=0",
-"0/1231=0",
-"0/1232=0",
-"0/1233=0",
-"0/1234=0",
-"0/1235=0",
-"0/1236=0",
-"0/1237=0",
-"0/1238=0",
-"0/1239=0",
-"0/1240=0",
-"0/1241=0",
-"0/1242=0",
-"0/1243=0",
-"0/1244=0",
-"0/1245=0",
-"0/1246=0",
-"0/1247=0",
-"0/1248=0",
-"0/1249=0",
-"0/1250=0",
-"0/1251=0",
-"0/1252=0",
-"0/1253=0",
-"0/1254=0",
-"0/1255=0",
-"0/1256=0",
-"0/1257=0",
-"0/1258=0",
-"0/1259=0",
-"0/1260=0",
-"0/1261=0",
-"0/1262=0",
-"0/1263=0",
-"0/1264=0",
-"0/1265=0",
-"0/1266=0",
-"0/1267=0",
-"0/1268=0",
-"0/1269=0",
-"0/1270=0",
-"0/1271=0",
-"0/1272=0",
-"0/1273=0",
-"0/1274=0",
-"0/1275=0",
-"0/1276=0",
-"0/1277=0",
-"0/1278=0",
-"0/1279=0",
-"0/1280=0",
-"0/1281=0",
-"0/1282=0",
-"0/1283=0",
-"0/1284=0",
-"0/1285=0",
-"0/1286=0",
-"0/1287=0",
-"0/1288=0",
-"0/1289=0",
-"0/1290=0",
-"0/1291=0",
-"0/1292=0",
-"0/1293=0",
-"0/1294=0",
-"0/1295=0",
-"0/1296=0",
-"0/1297=0",
-"0/1298=0",
-"0/1299=0",
-"0/12+0=0",
-"0/12+1=1",
-"0/12+2=2",
-"0/12+3=3",
-"0/12+4=4",
-"0/12+5=5",
-"0/12+6=6",
-"0/12+7=7",
-"0/12+8=8",
-"0/12+9=9",
-"0/12-0=0",
-"0/12*0=0",
-"0/12*1=0",
-"0/12*2=0",
-"0/12*3=0",
-"0/12*4=0",
-"0/12*5=0",
-"0/12*6=0",
-"0/12*7=0",
-"0/12*8=0",
-"0/12*9=0",
-"0/12/1=0",
-"0/12/2=0",
-"0/12/3=0",
-"0/12/4=0",
-"0/12/5=0",
-"0/12/6=0",
-"0/12/7=0",
-"0/12/8=0",
-"0/12/9=0",
-"0/1300=0",
-"0/1301=0",
-"0/1302=0",
-"0/1303=0",
-"0/1304=0",
-"0/1305=0",
-"0/1306=0",
-"0/1307=0",
-"0/1308=0",
-"0/1309=0",
-"0/1310=0",
-"0/1311=0",
-"0/1312=0",
-"0/1313=0",
-"0/1314=0",
-"0/1315=0",
-"0/1316=0",
-"0/1317=0",
-"0/1318=0",
-"0/1319=0",
-"0/1320=0",
-"0/1321=0",
-"0/1322=0",
-"0/1323=0",
-"0/1324=0",
-"0/1325=0",
-"0/1326=0",
-"0/1327=0",
-"0/1328=0",
-"0/1329=0",
-"0/1330=0",
-"0/1331=0",
-"0/1332=0",
-"0/1333=0",
-"0/1334=0",
-"0/1335=0",
-"0/1336=0",
-"0/1337=0",
-"0/1338=0",
-"0/1339=0",
-"0/1340=0",
-"0/1341=0",
-"0/1342=0",
-"0/1343=0",
-"0/1344=0",
-"0/1345=0",
-"0/1346=0",
-"0/1347=0",
-"0/1348=0",
-"0/1349=0",
-"0/1350=0",
-"0/1351=0",
-"0/1352=0",
-"0/1353=0",
-"0/1354=0",
-"0/1355=0",
-"0/1356=0",
-"0/1357=0",
-"0/1358=0",
-"0/1359=0",
-"0/1360=0",
-"0/1361=0",
-"0/1362=0",
-"0/1363=0",
-"0/1364=0",
-"0/1365=0",
-"0/1366=0",
-"0/1367=0",
-"0/1368=0",
-"0/1369=0",
-"0/1370=0",
-"0/1371=0",
-"0/1372=0",
-"0/1373=0",
-"0/1374=0",
-"0/1375=0",
-"0/1376=0",
-"0/1377=0",
-"0/1378=0",
-"0/1379=0",
-"0/1380=0",
-"0/1381=0",
-"0/1382=0",
-"0/1383=0",
-"0/1384=0",
-"0/1385=0",
-"0/1386=0",
-"0/1387=0",
-"0/1388=0",
-"0/1389=0",
-"0/1390=0",
-"0/1391=0",
-"0/1392=0",
-"0/1393=0",
-"0/1394=0",
-"0/1395=0",
-"0/1396=0",
-"0/1397=0",
-"0/1398=0",
-"0/1399=0",
-"0/13+0=0",
-"0/13+1=1",
-"0/13+2=2",
-"0/13+3=3",
-"0/13+4=4",
-"0/13+5=5",
-"0/13+6=6",
-"0/13+7=7",
-"0/13+8=8",
-"0/13+9=9",
-"0/13-0=0",
-"0/13*0=0",
-"0/13*1=0",
-"0/13*2=0",
-"0/13*3=0",
-"0/13*4=0",
-"0/13*5=0",
-"0/13*6=0",
-"0/13*7=0",
-"0/13*8=0",
-"0/13*9=0",
-"0/13/1=0",
-"0/13/2=0",
-"0/13/3=0",
-"0/13/4=0",
-"0/13/5=0",
-"0/13/6=0",
-"0/13/7=0",
-"0/13/8=0",
-"0/13/9=0",
-"0/1400=0",
-"0/1401=0",
-"0/1402=0",
-"0/1403=0",
-"0/1404=0",
-"0/1405=0",
-"0/1406=0",
-"0/1407=0",
-"0/1408=0",
-"0/1409=0",
-"0/1410=0",
-"0/1411=0",
-"0/1412=0",
-"0/1413=0",
-"0/1414=0",
-"0/1415=0",
-"0/1416=0",
-"0/1417=0",
-"0/1418=0",
-"0/1419=0",
-"0/1420=0",
-"0/1421=0",
-"0/1422=0",
-"0/1423=0",
-"0/1424=0",
-"0/1425=0",
-"0/1426=0",
-"0/1427=0",
-"0/1428=0",
-"0/1429=0",
-"0/1430=0",
-"0/1431=0",
-"0/1432=0",
-"0/1433=0",
-"0/1434=0",
-"0/1435=0",
-"0/1436=0",
-"0/1437=0",
-"0/1438=0",
-"0/1439=0",
-"0/1440=0",
-"0/1441=0",
-"0/1442=0",
-"0/1443=0",
-"0/1444=0",
-"0/1445=0",
-"0/1446=0",
-"0/1447=0",
-"0/1448=0",
-"0/1449=0",
-"0/1450=0",
-"0/1451=0",
-"0/1452=0",
-"0/1453=0",
-"0/1454=0",
-"0/1455=0",
-"0/1456=0",
-"0/1457=0",
-"0/1458=0",
-"0/1459=0",
-"0/1460=0",
-"0/1461=0",
-"0/1462=0",
-"0/1463=0",
-"0/1464=0",
-"0/1465=0",
-"0/1466=0",
-"0/1467=0",
-"0/1468=0",
-"0/1469=0",
-"0/1470=0",
-"0/1471=0",
-"0/1472=0",
-"0/1473=0",
-"0/1474=0",
-"0/1475=0",
-"0/1476=0",
-"0/1477=0",
-"0/1478=0",
-"0/1479=0",
-"0/1480=0",
-"0/1481=0",
-"0/1482=0",
-"0/1483=0",
-"0/1484=0",
-"0/1485=0",
-"0/1486=0",
-"0/1487=0",
-"0/1488=0",
-"0/1489=0",
-"0/1490=0",
-"0/1491=0",
-"0/1492=0",
-"0/1493=0",
-"0/1494=0",
-"0/1495=0",
-"0/1496=0",
-"0/1497=0",
-"0/1498=0",
-"0/1499=0",
-"0/14+0=0",
-"0/14+1=1",
-"0/14+2=2",
-"0/14+3=3",
-"0/14+4=4",
-"0/14+5=5",
-"0/14+6=6",
-"0/14+7=7",
-"0/14+8=8",
-"0/14+9=9",
-"0/14-0=0",
-"0/14*0=0",
-"0/14*1=0",
-"0/14*2=0",
-"0/14*3=0",
-"0/14*4=0",
-"0/14*5=0",
-"0/14*6=0",
-"0/14*7=0",
-"0/14*8=0",
-"0/14*9=0",
-"0/14/1=0",
-"0/14/2=0",
-"0/14/3=0",
-"0/14/4=0",
-"0/14/5=0",
-"0/14/6=0",
-"0/14/7=0",
-"0/14/8=0",
-"0/14/9=0",
-"0/1500=0",
-"0/1501=0",
-"0/1502=0",
-"0/1503=0",
-"0/1504=0",
-"0/1505=0",
-"0/1506=0",
-"0/1507=0",
-"0/1508=0",
-"0/1509=0",
-"0/1510=0",
-"0/1511=0",
-"0/1512=0",
-"0/1513=0",
-"0/1514=0",
-"0/1515=0",
-"0/1516=0",
-"0/1517=0",
-"0/1518=0",
-"0/1519=0",
-"0/1520=0",
-"0/1521=0",
-"0/1522=0",
-"0/1523=0",
-"0/1524=0",
-"0/1525=0",
-"0/1526=0",
-"0/1527=0",
-"0/1528=0",
-"0/1529=0",
-"0/1530=0",
-"0/1531=0",
-"0/1532=0",
-"0/1533=0",
-"0/1534=0",
-"0/1535=0",
-"0/1536=0",
-"0/1537=0",
-"0/1538=0",
-"0/1539=0",
-"0/1540=0",
-"0/1541=0",
-"0/1542=0",
-"0/1543=0",
-"0/1544=0",
-"0/1545=0",
-"0/1546=0",
-"0/1547=0",
-"0/1548=0",
-"0/1549=0",
-"0/1550=0",
-"0/1551=0",
-"0/1552=0",
-"0/1553=0",
-"0/1554=0",
-"0/1555=0",
-"0/1556=0",
-"0/1557=0",
-"0/1558=0",
-"0/1559=0",
-"0/1560=0",
-"0/1561=0",
-"0/1562=0",
-"0/1563=0",
-"0/1564=0",
-"0/1565=0",
-"0/1566=0",
-"0/1567=0",
-"0/1568=0",
-"0/1569=0",
-"0/1570=0",
-"0/1571=0",
-"0/1572=0",
-"0/1573=0",
-"0/1574=0",
-"0/1575=0",
-"0/1576=0",
-"0/1577=0",
-"0/1578=0",
-"0/1579=0",
-"0/1580=0",
-"0/1581=0",
-"0/1582=0",
-"0/1583=0",
-"0/1584=0",
-"0/1585=0",
-"0/1586=0",
-"0/1587=0",
-"0/1588=0",
-"0/1589=0",
-"0/1590=0",
-"0/1591=0",
-"0/1592=0",
-"0/1593=0",
-"0/1594=0",
-"0/1595=0",
-"0/1596=0",
-"0/1597=0",
-"0/1598=0",
-"0/1599=0",
-"0/15+0=0",
-"0/15+1=1",
-"0/15+2=2",
-"0/15+3=3",
-"0/15+4=4",
-"0/15+5=5",
-"0/15+6=6",
-"0/15+7=7",
-"0/15+8=8",
-"0/15+9=9",
-"0/15-0=0",
-"0/15*0=0",
-"0/15*1=0",
-"0/15*2=0",
-"0/15*3=0",
-"0/15*4=0",
-"0/15*5=0",
-"0/15*6=0",
-"0/15*7=0",
-"0/15*8=0",
-"0/15*9=0",
-"0/15/1=0",
-"0/15/2=0",
-"0/15/3=0",
-"0/15/4=0",
-"0/15/5=0",
-"0/15/6=0",
-"0/15/7=0",
-"0/15/8=0",
-"0/15/9=0",
-"0/1600=0",
-"0/1601=0",
-"0/1602=0",
-"0/1603=0",
-"0/1604=0",
-"0/1605=0",
-"0/1606=0",
-"0/1607=0",
-"0/1608=0",
-"0/1609=0",
-"0/1610=0",
-"0/1611=0",
-"0/1612=0",
-"0/1613=0",
-"0/1614=0",
-"0/1615=0",
-"0/1616=0",
-"0/1617=0",
-"0/1618=0",
-"0/1619=0",
-"0/1620=0",
-"0/1621=0",
-"0/1622=0",
-"0/1623=0",
-"0/1624=0",
-"0/1625=0",
-"0/1626=0",
-"0/1627=0",
-"0/1628=0",
-"0/1629=0",
-"0/1630=0",
-"0/1631=0",
-"0/1632=0",
-"0/1633=0",
-"0/1634=0",
-"0/1635=0",
-"0/1636=0",
-"0/1637=0",
-"0/1638=0",
-"0/1639=0",
-"0/1640=0",
-"0/1641=0",
-"0/1642=0",
-"0/1643=0",
-"0/1644=0",
-"0/1645=0",
-"0/1646=0",
-"0/1647=0",
-"0/1648=0",
-"0/1649=0",
-"0/1650=0",
-"0/1651=0",
-"0/1652=0",
-"0/1653=0",
-"0/1654=0",
-"0/1655=0",
-"0/1656=0",
-"0/1657=0",
-"0/1658=0",
-"0/1659=0",
-"0/1660=0",
-"0/1661=0",
-"0/1662=0",
-"0/1663=0",
-"0/1664=0",
-"0/1665=0",
-"0/1666=0",
-"0/1667=0",
-"0/1668=0",
-"0/1669=0",
-"0/1670=0",
-"0/1671=0",
-"0/1672=0",
-"0/1673=0",
-"0/1674=0",
-"0/1675=0",
-"0/1676=0",
-"0/1677=0",
-"0/1678=0",
-"0/1679=0",
-"0/1680=0",
-"0/1681=0",
-"0/1682=0",
-"0/1683=0",
-"0/1684=0",
-"0/1685=0",
-"0/1686=0",
-"0/1687=0",
-"0/1688=0",
-"0/1689=0",
-"0/1690=0",
-"0/1691=0",
-"0/1692=0",
-"0/1693=0",
-"0/1694=0",
-"0/1695=0",
-"0/1696=0",
-"0/1697=0",
-"0/1698=0",
-"0/1699=0",
-"0/16+0=0",
-"0/16+1=1",
-"0/16+2=2",
-"0/16+3=3",
-"0/16+4=4",
-"0/16+5=5",
-"0/16+6=6",
-"0/16+7=7",
-"0/16+8=8",
-"0/16+9=9",
-"0/16-0=0",
-"0/16*0=0",
-"0/16*1=0",
-"0/16*2=0",
-"0/16*3=0",
-"0/16*4=0",
-"0/16*5=0",
-"0/16*6=0",
-"0/16*7=0",
-"0/16*8=0",
-"0/16*9=0",
-"0/16/1=0",
-"0/16/2=0",
-"0/16/3=0",
-"0/16/4=0",
-"0/16/5=0",
-"0/16/6=0",
-"0/16/7=0",
-"0/16/8=0",
-"0/16/9=0",
-"0/1700=0",
-"0/1701=0",
-"0/1702=0",
-"0/1703=0",
-"0/1704=0",
-"0/1705=0",
-"0/1706=0",
-"0/1707=0",
-"0/1708=0",
-"0/1709=0",
-"0/1710=0",
-"0/1711=0",
-"0/1712=0",
-"0/1713=0",
-"0/1714=0",
-"0/1715=0",
-"0/1716=0",
-"0/1717=0",
-"0/1718=0",
-"0/1719=0",
-"0/1720=0",
-"0/1721=0",
-"0/1722=0",
-"0/1723=0",
-"0/1724=0",
-"0/1725=0",
-"0/1726=0",
-"0/1727=0",
-"0/1728=0",
-"0/1729=0",
-"0/1730=0",
-"0/1731=0",
-"0/1732=0",
-"0/1733=0",
-"0/1734=0",
-"0/1735=0",
-"0/1736=0",
-"0/1737=0",
-"0/1738=0",
-"0/1739=0",
-"0/1740=0",
-"0/1741=0",
-"0/1742=0",
-"0/1743=0",
-"0/1744=0",
-"0/1745=0",
-"0/1746=0",
-"0/1747=0",
-"0/1748=0",
-"0/1749=0",
-"0/1750=0",
-"0/1751=0",
-"0/1752=0",
-"0/1753=0",
-"0/1754=0",
-"0/1755=0",
-"0/1756=0",
-"0/1757=0",
-"0/1758=0",
-"0/1759=0",
-"0/1760=0",
-"0/1761=0",
-"0/1762=0",
-"0/1763=0",
-"0/1764=0",
-"0/1765=0",
-"0/1766=0",
-"0/1767=0",
-"0/1768=0",
-"0/1769=0",
-"0/1770=0",
-"0/1771=0",
-"0/1772=0",
-"0/1773=0",
-"0/1774=0",
-"0/1775=0",
-"0/1776=0",
-"0/1777=0",
-"0/1778=0",
-"0/1779=0",
-"0/1780=0",
-"0/1781=0",
-"0/1782=0",
-"0/1783=0",
-"0/1784=0",
-"0/1785=0",
-"0/1786=0",
-"0/1787=0",
-"0/1788=0",
-"0/1789=0",
-"0/1790=0",
-"0/1791=0",
-"0/1792=0",
-"0/1793=0",
-"0/1794=0",
-"0/1795=0",
-"0/1796=0",
-"0/1797=0",
-"0/1798=0",
-"0/1799=0",
-"0/17+0=0",
-"0/17+1=1",
-"0/17+2=2",
-"0/17+3=3",
-"0/17+4=4",
-"0/17+5=5",
-"0/17+6=6",
-"0/17+7=7",
-"0/17+8=8",
-"0/17+9=9",
-"0/17-0=0",
-"0/17*0=0",
-"0/17*1=0",
-"0/17*2=0",
-"0/17*3=0",
-"0/17*4=0",
-"0/17*5=0",
-"0/17*6=0",
-"0/17*7=0",
-"0/17*8=0",
-"0/17*9=0",
-"0/17/1=0",
-"0/17/2=0",
-"0/17/3=0",
-"0/17/4=0",
-"0/17/5=0",
-"0/17/6=0",
-"0/17/7=0",
-"0/17/8=0",
-"0/17/9=0",
-"0/1800=0",
-"0/1801=0",
-"0/1802=0",
-"0/1803=0",
-"0/1804=0",
-"0/1805=0",
-"0/1806=0",
-"0/1807=0",
-"0/1808=0",
-"0/1809=0",
-"0/1810=0",
-"0/1811=0",
-"0/1812=0",
-"0/1813=0",
-"0/1814=0",
-"0/1815=0",
-"0/1816=0",
-"0/1817=0",
-"0/1818=0",
-"0/1819=0",
-"0/1820=0",
-"0/1821=0",
-"0/1822=0",
-"0/1823=0",
-"0/1824=0",
-"0/1825=0",
-"0/1826=0",
-"0/1827=0",
-"0/1828=0",
-"0/1829=0",
-"0/1830=0",
-"0/1831=0",
-"0/1832=0",
-"0/1833=0",
-"0/1834=0",
-"0/1835=0",
-"0/1836=0",
-"0/1837=0",
-"0/1838=0",
-"0/1839=0",
-"0/1840=0",
-"0/1841=0",
-"0/1842=0",
-"0/1843=0",
-"0/1844=0",
-"0/1845=0",
-"0/1846=0",
-"0/1847=0",
-"0/1848=0",
-"0/1849=0",
-"0/1850=0",
-"0/1851=0",
-"0/1852=0",
-"0/1853=0",
-"0/1854=0",
-"0/1855=0",
-"0/1856=0",
-"0/1857=0",
-"0/1858=0",
-"0/1859=0",
-"0/1860=0",
-"0/1861=0",
-"0/1862=0",
-"0/1863=0",
-"0/1864=0",
-"0/1865=0",
-"0/1866=0",
-"0/1867=0",
-"0/1868=0",
-"0/1869=0",
-"0/1870=0",
-"0/1871=0",
-"0/1872=0",
-"0/1873=0",
-"0/1874=0",
-"0/1875=0",
-"0/1876=0",
-"0/1877=0",
-"0/1878=0",
-"0/1879=0",
-"0/1880=0",
-"0/1881=0",
-"0/1882=0",
-"0/1883=0",
-"0/1884=0",
-"0/1885=0",
-"0/1886=0",
-"0/1887=0",
-"0/1888=0",
-"0/1889=0",
-"0/1890=0",
-"0/1891=0",
-"0/1892=0",
-"0/1893=0",
-"0/1894=0",
-"0/1895=0",
-"0/1896=0",
-"0/1897=0",
-"0/1898=0",
-"0/1899=0",
-"0/18+0=0",
-"0/18+1=1",
-"0/18+2=2",
-"0/18+3=3",
-"0/18+4=4",
-"0/18+5=5",
-"0/18+6=6",
-"0/18+7=7",
-"0/18+8=8",
-"0/18+9=9",
-"0/18-0=0",
-"0/18*0=0",
-"0/18*1=0",
-"0/18*2=0",
-"0/18*3=0",
-"0/18*4=0",
-"0/18*5=0",
-"0/18*6=0",
-"0/18*7=0",
-"0/18*8=0",
-"0/18*9=0",
-"0/18/1=0",
-"0/18/2=0",
-"0/18/3=0",
-"0/18/4=0",
-"0/18/5=0",
-"0/18/6=0",
-"0/18/7=0",
-"0/18/8=0",
-"0/18/9=0",
-"0/1900=0",
-"0/1901=0",
-"0/1902=0",
-"0/1903=0",
-"0/1904=0",
-"0/1905=0",
-"0/1906=0",
-"0/1907=0",
-"0/1908=0",
-"0/1909=0",
-"0/1910=0",
-"0/1911=0",
-"0/1912=0",
-"0/1913=0",
-"0/1914=0",
-"0/1915=0",
-"0/1916=0",
-"0/1917=0",
-"0/1918=0",
-"0/1919=0",
-"0/1920=0",
-"0/1921=0",
-"0/1922=0",
-"0/1923=0",
-"0/1924=0",
-"0/1925=0",
-"0/1926=0",
-"0/1927=0",
-"0/1928=0",
-"0/1929=0",
-"0/1930=0",
-"0/1931=0",
-"0/1932=0",
-"0/1933=0",
-"0/1934=0",
-"0/1935=0",
-"0/1936=0",
-"0/1937=0",
-"0/1938=0",
-"0/1939=0",
-"0/1940=0",
-"0/1941=0",
-"0/1942=0",
-"0/1943=0",
-"0/1944=0",
-"0/1945=0",
-"0/1946=0",
-"0/1947=0",
-"0/1948=0",
-"0/1949=0",
-"0/1950=0",
-"0/1951=0",
-"0/1952=0",
-"0/1953=0",
-"0/1954=0",
-"0/1955=0",
-"0/1956=0",
-"0/1957=0",
-"0/1958=0",
-"0/1959=0",
-"0/1960=0",
-"0/1961=0",
-"0/1962=0",
-"0/1963=0",
-"0/1964=0",
-"0/1965=0",
-"0/1966=0",
-"0/1967=0",
-"0/1968=0",
-"0/1969=0",
-"0/1970=0",
-"0/1971=0",
-"0/1972=0",
-"0/1973=0",
-"0/1974=0",
-"0/1975=0",
-"0/1976=0",
-"0/1977=0",
-"0/1978=0",
-"0/1979=0",
-"0/1980=0",
-"0/1981=0",
-"0/1982=0",
-"0/1983=0",
-"0/1984=0",
-"0/1985=0",
-"0/1986=0",
-"0/1987=0",
-"0/1988=0",
-"0/1989=0",
-"0/1990=0",
-"0/1991=0",
-"0/1992=0",
-"0/1993=0",
-"0/1994=0",
-"0/1995=0",
-"0/1996=0",
-"0/1997=0",
-"0/1998=0",
-"0/1999=0",
-"0/19+0=0",
-"0/19+1=1",
-"0/19+2=2",
-"0/19+3=3",
-"0/19+4=4",
-"0/19+5=5",
-"0/19+6=6",
-"0/19+7=7",
-"0/19+8=8",
-"0/19+9=9",
-"0/19-0=0",
-"0/19*0=0",
-"0/19*1=0",
-"0/19*2=0",
-"0/19*3=0",
-"0/19*4=0",
-"0/19*5=0",
-"0/19*6=0",
-"0/19*7=0",
-"0/19*8=0",
-"0/19*9=0",
-"0/19/1=0",
-"0/19/2=0",
-"0/19/3=0",
-"0/19/4=0",
-"0/19/5=0",
-"0/19/6=0",
-"0/19/7=0",
-"0/19/8=0",
-"0/19/9=0",
-"0/1-1=-1",
-"0/1-2=-2",
-"0/1-3=-3",
-"0/1-4=-4",
-"0/1-5=-5",
-"0/1-6=-6",
-"0/1-7=-7",
-"0/1-8=-8",
-"0/1-9=-9",
-"0/1*10=0",
-"0/1*11=0",
-"0/1*12=0",
-"0/1*13=0",
-"0/1*14=0",
-"0/1*15=0",
-"0/1*16=0",
-"0/1*17=0",
-"0/1*18=0",
-"0/1*19=0",
-"0/1*20=0",
-"0/1*21=0",
-"0/1*22=0",
-"0/1*23=0",
-"0/1*24=0",
-"0/1*25=0",
-"0/1*26=0",
-"0/1*27=0",
-"0/1*28=0",
-"0/1*29=0",
-"0/1*30=0",
-"0/1*31=0",
-"0/1*32=0",
-"0/1*33=0",
-"0/1*34=0",
-"0/1*35=0",
-"0/1*36=0",
-"0/1*37=0",
-"0/1*38=0",
-"0/1*39=0",
-"0/1*40=0",
-"0/1*41=0",
-"0/1*42=0",
-"0/1*43=0",
-"0/1*44=0",
-"0/1*45=0",
-"0/1*46=0",
-"0/1*47=0",
-"0/1*48=0",
-"0/1*49=0",
-"0/1*50=0",
-"0/1*51=0",
-"0/1*52=0",
-"0/1*53=0",
-"0/1*54=0",
-"0/1*55=0",
-"0/1*56=0",
-"0/1*57=0",
-"0/1*58=0",
-"0/1*59=0",
-"0/1*60=0",
-"0/1*61=0",
-"0/1*62=0",
-"0/1*63=0",
-"0/1*64=0",
-"0/1*65=0",
-"0/1*66=0",
-"0/1*67=0",
-"0/1*68=0",
-"0/1*69=0",
-"0/1*70=0",
-"0/1*71=0",
-"0/1*72=0",
-"0/1*73=0",
-"0/1*74=0",
-"0/1*75=0",
-"0/1*76=0",
-"0/1*77=0",
-"0/1*78=0",
-"0/1*79=0",
-"0/1*80=0",
-"0/1*81=0",
-"0/1*82=0",
-"0/1*83=0",
-"0/1*84=0",
-"0/1*85=0",
-"0/1*86=0",
-"0/1*87=0",
-"0/1*88=0",
-"0/1*89=0",
-"0/1*90=0",
-"0/1*91=0",
-"0/1*92=0",
-"0/1*93=0",
-"0/1*94=0",
-"0/1*95=0",
-"0/1*96=0",
-"0/1*97=0",
-"0/1*98=0",
-"0/1*99=0",
-"0/1/10=0",
-"0/1/11=0",
-"0/1/12=0",
-"0/1/13=0",
-"0/1/14=0",
-"0/1/15=0",
-"0/1/16=0",
-"0/1/17=0",
-"0/1/18=0",
-"0/1/19=0",
-"0/1/20=0",
-"0/1/21=0",
-"0/1/22=0",
-"0/1/23=0",
-"0/1/24=0",
-"0/1/25=0",
-"0/1/26=0",
-"0/1/27=0",
-"0/1/28=0",
-"0/1/29=0",
-"0/1/30=0",
-"0/1/31=0",
-"0/1/32=0",
-"0/1/33=0",
-"0/1/34=0",
-"0/1/35=0",
-"0/1/36=0",
-"0/1/37=0",
-"0/1/38=0",
-"0/1/39=0",
-"0/1/40=0",
-"0/1/41=0",
-"0/1/42=0",
-"0/1/43=0",
-"0/1/44=0",
-"0/1/45=0",
-"0/1/46=0",
-"0/1/47=0",
-"0/1/48=0",
-"0/1/49=0",
-"0/1/50=0",
-"0/1/51=0",
-"0/1/52=0",
-"0/1/53=0",
-"0/1/54=0",
-"0/1/55=0",
-"0/1/56=0",
-"0/1/57=0",
-"0/1/58=0",
-"0/1/59=0",
-"0/1/60=0",
-"0/1/61=0",
-"0/1/62=0",
-"0/1/63=0",
-"0/1/64=0",
-"0/1/65=0",
-"0/1/66=0",
-"0/1/67=0",
-"0/1/68=0",
-"0/1/69=0",
-"0/1/70=0",
-"0/1/71=0",
-"0/1/72=0",
-"0/1/73=0",
-"0/1/74=0",
-"0/1/75=0",
-"0/1/76=0",
-"0/1/77=0",
-"0/1/78=0",
-"0/1/79=0",
-"0/1/80=0",
-"0/1/81=0",
-"0/1/82=0",
-"0/1/83=0",
-"0/1/84=0",
-"0/1/85=0",
-"0/1/86=0",
-"0/1/87=0",
-"0/1/88=0",
-"0/1/89=0",
-"0/1/90=0",
-"0/1/91=0",
-"0/1/92=0",
-"0/1/93=0",
-"0/1/94=0",
-"0/1/95=0",
-"0/1/96=0",
-"0/1/97=0",
-"0/1/98=0",
-"0/1/99=0",
-"0/2000=0",
-"0/2001=0",
-"0/2002=0",
-"0/2003=0",
-"0/2004=0",
-"0/2005=0",
-"0/2006=0",
-"0/2007=0",
-"0/2008=0",
-"0/2009=0",
-"0/2010=0",
-"0/2011=0",
-"0/2012=0",
-"0/2013=0",
-"0/2014=0",
-"0/2015=0",
-"0/2016=0",
-"0/2017=0",
-"0/2018=0",
-"0/2019=0",
-"0/2020=0",
-"0/2021=0",
-"0/2022=0",
-"0/2023=0",
-"0/2024=0",
-"0/2025=0",
-"0/2026=0",
-"0/2027=0",
-"0/2028=0",
-"0/2029=0",
-"0/2030=0",
-"0/2031=0",
-"0/2032=0",
-"0/2033=0",
-"0/2034=0",
-"0/2035=0",
-"0/2036=0",
-"0/2037=0",
-"0/2038=0",
-"0/2039=0",
-"0/2040=0",
-"0/2041=0",
-"0/2042=0",
-"0/2043=0",
-"0/2044=0",
-"0/2045=0",
-"0/2046=0",
-"0/2047=0",
-"0/2048=0",
-"0/2049=0",
-"0/2050=0",
-"0/2051=0",
-"0/2052=0",
-"0/2053=0",
-"0/2054=0",
-"0/2055=0",
-"0/2056=0",
-"0/2057=0",
-"0/2058=0",
-"0/2059=0",
-"0/2060=0",
-"0/2061=0",
-"0/2062=0",
-"0/2063=0",
-"0/2064=0",
-"0/2065=0",
-"0/2066=0",
-"0/2067=0",
-"0/2068=0",
-"0/2069=0",
-"0/2070=0",
-"0/2071=0",
-"0/2072=0",
-"0/2073=0",
-"0/2074=0",
-"0/2075=0",
-"0/2076=0",
-"0/2077=0",
-"0/2078=0",
-"0/2079=0",
-"0/2080=0",
-"0/2081=0",
-"0/2082=0",
-"0/2083=0",
-"0/2084=0",
-"0/2085=0",
-"0/2086=0",
-"0/2087=0",
-"0/2088=0",
-"0/2089=0",
-"0/2090=0",
-"0/2091=0",
-"0/2092=0",
-"0/2093=0",
-"0/2094=0",
-"0/2095=0",
-"0/2096=0",
-"0/2097=0",
-"0/2098=0",
-"0/2099=0",
-"0/20+0=0",
-"0/20+1=1",
-"0/20+2=2",
-"0/20+3=3",
-"0/20+4=4",
-"0/20+5=5",
-"0/20+6=6",
-"0/20+7=7",
-"0/20+8=8",
-"0/20+9=9",
-"0/20-0=0",
-"0/20*0=0",
-"0/20*1=0",
-"0/20*2=0",
-"0/20*3=0",
-"0/20*4=0",
-"0/20*5=0",
-"0/20*6=0",
-"0/20*7=0",
-"0/20*8=0",
-"0/20*9=0",
-"0/20/1=0",
-"0/20/2=0",
-"0/20/3=0",
-"0/20/4=0",
-"0/20/5=0",
-"0/20/6=0",
-"0/20/7=0",
-"0/20/8=0",
-"0/20/9=0",
-"0/2100=0",
-"0/2101=0",
-"0/2102=0",
-"0/2103=0",
-"0/2104=0",
-"0/2105=0",
-"0/2106=0",
-"0/2107=0",
-"0/2108=0",
-"0/2109=0",
-"0/2110=0",
-"0/2111=0",
-"0/2112=0",
-"0/2113=0",
-"0/2114=0",
-"0/2115=0",
-"0/2116=0",
-"0/2117=0",
-"0/2118=0",
-"0/2119=0",
-"0/2120=0",
-"0/2121=0",
-"0/2122=0",
-"0/2123=0",
-"0/2124=0",
-"0/2125=0",
-"0/2126=0",
-"0/2127=0",
-"0/2128=0",
-"0/2129=0",
-"0/2130=0",
-"0/2131=0",
-"0/2132=0",
-"0/2133=0",
-"0/2134=0",
-"0/2135=0",
-"0/2136=0",
-"0/2137=0",
-"0/2138=0",
-"0/2139=0",
-"0/2140=0",
-"0/2141=0",
-"0/2142=0",
-"0/2143=0",
-"0/2144=0",
-"0/2145=0",
-"0/2146=0",
-"0/2147=0",
-"0/2148=0",
-"0/2149=0",
-"0/2150=0",
-"0/2151=0",
-"0/2152=0",
-"0/2153=0",
-"0/2154=0",
-"0/2155=0",
-"0/2156=0",
-"0/2157=0",
-"0/2158=0",
-"0/2159=0",
-"0/2160=0",
-"0/2161=0",
-"0/2162=0",
-"0/2163=0",
-"0/2164=0",
-"0/2165=0",
-"0/2166=0",
-"0/2167=0",
-"0/2168=0",
-"0/2169=0",
-"0/2170=0",
-"0/2171=0",
-"0/2172=0",
-"0/2173=0",
-"0/2174=0",
-"0/2175=0",
-"0/2176=0",
-"0/2177=0",
-"0/2178=0",
-"0/2179=0",
-"0/2180=0",
-"0/2181=0",
-"0/2182=0",
-"0/2183=0",
-"0/2184=0",
-"0/2185=0",
-"0/2186=0",
-"0/2187=0",
-"0/2188=0",
-"0/2189=0",
-"0/2190=0",
-"0/2191=0",
-"0/2192=0",
-"0/2193=0",
-"0/2194=0",
-"0/2195=0",
-"0/2196=0",
-"0/2197=0",
-"0/2198=0",
-"0/2199=0",
-"0/21+0=0",
-"0/21+1=1",
-"0/21+2=2",
-"0/21+3=3",
-"0/21+4=4",
-"0/21+5=5",
-"0/21+6=6",
-"0/21+7=7",
-"0/21+8=8",
-"0/21+9=9",
-"0/21-0=0",
-"0/21*0=0",
-"0/21*1=0",
-"0/21*2=0",
-"0/21*3=0",
-"0/21*4=0",
-"0/21*5=0",
-"0/21*6=0",
-"0/21*7=0",
-"0/21*8=0",
-"0/21*9=0",
-"0/21/1=0",
-"0/21/2=0",
-"0/21/3=0",
-"0/21/4=0",
-"0/21/5=0",
-"0/21/6=0",
-"0/21/7=0",
-"0/21/8=0",
-"0/21/9=0",
-"0/2200=0",
-"0/2201=0",
-"0/2202=0",
-"0/2203=0",
-"0/2204=0",
-"0/2205=0",
-"0/2206=0",
-"0/2207=0",
-"0/2208=0",
-"0/2209=0",
-"0/2210=0",
-"0/2211=0",
-"0/2212=0",
-"0/2213=0",
-"0/2214=0",
-"0/2215=0",
-"0/2216=0",
-"0/2217=0",
-"0/2218=0",
-"0/2219=0",
-"0/2220=0",
-"0/2221=0",
-"0/2222=0",
-"0/2223=0",
-"0/2224=0",
-"0/2225=0",
-"0/2226=0",
-"0/2227=0",
-"0/2228=0",
-"0/2229=0",
-"0/2230=0",
-"0/2231=0",
-"0/2232=0",
-"0/2233=0",
-"0/2234=0",
-"0/2235=0",
-"0/2236=0",
-"0/2237=0",
-"0/2238=0",
-"0/2239=0",
-"0/2240=0",
-"0/2241=0",
-"0/2242=0",
-"0/2243=0",
-"0/2244=0",
-"0/2245=0",
-"0/2246=0",
-"0/2247=0",
-"0/2248=0",
-"0/2249=0",
-"0/2250=0",
-"0/2251=0",
-"0/2252=0",
-"0/2253=0",
-"0/2254=0",
-"0/2255=0",
-"0/2256=0",
-"0/2257=0",
-"0/2258=0",
-"0/2259=0",
-"0/2260=0",
-"0/2261=0",
-"0/2262=0",
-"0/2263=0",
-"0/2264=0",
-"0/2265=0",
-"0/2266=0",
-"0/2267=0",
-"0/2268=0",
-"0/2269=0",
-"0/2270=0",
-"0/2271=0",
-"0/2272=0",
-"0/2273=0",
-"0/2274=0",
-"0/2275=0",
-"0/2276=0",
-"0/2277=0",
-"0/2278=0",
-"0/2279=0",
-"0/2280=0",
-"0/2281=0",
-"0/2282=0",
-"0/2283=0",
-"0/2284=0",
-"0/2285=0",
-"0/2286=0",
-"0/2287=0",
-"0/2288=0",
-"0/2289=0",
-"0/2290=0",
-"0/2291=0",
-"0/2292=0",
-"0/2293=0",
-"0/2294=0",
-"0/2295=0",
-"0/2296=0",
-"0/2297=0",
-"0/2298=0",
-"0/2299=0",
-"0/22+0=0",
-"0/22+1=1",
-"0/22+2=2",
-"0/22+3=3",
-"0/22+4=4",
-"0/22+5=5",
-"0/22+6=6",
-"0/22+7=7",
-"0/22+8=8",
-"0/22+9=9",
-"0/22-0=0",
-"0/22*0=0",
-"0/22*1=0",
-"0/22*2=0",
-"0/22*3=0",
-"0/22*4=0",
-"0/22*5=0",
-"0/22*6=0",
-"0/22*7=0",
-"0/22*8=0",
-"0/22*9=0",
-"0/22/1=0",
-"0/22/2=0",
-"0/22/3=0",
-"0/22/4=0",
-"0/22/5=0",
-"0/22/6=0",
-"0/22/7=0",
-"0/22/8=0",
-"0/22/9=0",
-"0/2300=0",
-"0/2301=0",
-"0/2302=0",
-"0/2303=0",
-"0/2304=0",
-"0/2305=0",
-"0/2306=0",
-"0/2307=0",
-"0/2308=0",
-"0/2309=0",
-"0/2310=0",
-"0/2311=0",
-"0/2312=0",
-"0/2313=0",
-"0/2314=0",
-"0/2315=0",
-"0/2316=0",
-"0/2317=0",
-"0/2318=0",
-"0/2319=0",
-"0/2320=0",
-"0/2321=0",
-"0/2322=0",
-"0/2323=0",
-"0/2324=0",
-"0/2325=0",
-"0/2326=0",
-"0/2327=0",
-"0/2328=0",
-"0/2329=0",
-"0/2330=0",
-"0/2331=0",
-"0/2332=0",
-"0/2333=0",
-"0/2334=0",
-"0/2335=0",
-"0/2336=0",
-"0/2337=0",
-"0/2338=0",
-"0/2339=0",
-"0/2340=0",
-"0/2341=0",
-"0/2342=0",
-"0/2343=0",
-"0/2344=0",
-"0/2345=0",
-"0/2346=0",
-"0/2347=0",
-"0/2348=0",
-"0/2349=0",
-"0/2350=0",
-"0/2351=0",
-"0/2352=0",
-"0/2353=0",
-"0/2354=0",
-"0/2355=0",
-"0/2356=0",
-"0/2357=0",
-"0/2358=0",
-"0/2359=0",
-"0/2360=0",
-"0/2361=0",
-"0/2362=0",
-"0/2363=0",
-"0/2364=0",
-"0/2365=0",
-"0/2366=0",
-"0/2367=0",
-"0/2368=0",
-"0/2369=0",
-"0/2370=0",
-"0/2371=0",
-"0/2372=0",
-"0/2373=0",
-"0/2374=0",
-"0/2375=0",
-"0/2376=0",
-"0/2377=0",
-"0/2378=0",
-"0/2379=0",
-"0/2380=0",
-"0/2381=0",
-"0/2382=0",
-"0/2383=0",
-"0/2384=0",
-"0/2385=0",
-"0/2386=0",
-"0/2387=0",
-"0/2388=0",
-"0/2389=0",
-"0/2390=0",
-"0/2391=0",
-"0/2392=0",
-"0/2393=0",
-"0/2394=0",
-"0/2395=0",
-"0/2396=0",
-"0/2397=0",
-"0/2398=0",
-"0/2399=0",
-"0/23+0=0",
-"0/23+1=1",
-"0/23+2=2",
-"0/23+3=3",
-"0/23+4=4",
-"0/23+5=5",
-"0/23+6=6",
-"0/23+7=7",
-"0/23+8=8",
-"0/23+9=9",
-"0/23-0=0",
-"0/23*0=0",
-"0/23*1=0",
-"0/23*2=0",
-"0/23*3=0",
-"0/23*4=0",
-"0/23*5=0",
-"0/23*6=0",
-"0/23*7=0",
-"0/23*8=0",
-"0/23*9=0",
-"0/23/1=0",
-"0/23/2=0",
-"0/23/3=0",
-"0/23/4=0",
-"0/23/5=0",
-"0/23/6=0",
-"0/23/7=0",
-"0/23/8=0",
-"0/23/9=0",
-"0/2400=0",
-"0/2401=0",
-"0/2402=0",
-"0/2403=0",
-"0/2404=0",
-"0/2405=0",
-"0/2406=0",
-"0/2407=0",
-"0/2408=0",
-"0/2409=0",
-"0/2410=0",
-"0/2411=0",
-"0/2412=0",
-"0/2413=0",
-"0/2414=0",
-"0/2415=0",
-"0/2416=0",
-"0/2417=0",
-"0/2418=0",
-"0/2419=0",
-"0/2420=0",
-"0/2421=0",
-"0/2422=0",
-"0/2423=0",
-"0/2424=0",
-"0/2425=0",
-"0/2426=0",
-"0/2427=0",
-"0/2428=0",
-"0/2429=0",
-"0/2430=0",
-"0/2431=0",
-"0/2432=0",
-"0/2433=0",
-"0/2434=0",
-"0/2435=0",
-"0/2436=0",
-"0/2437=0",
-"0/2438=0",
-"0/2439=0",
-"0/2440=0",
-"0/2441=0",
-"0/2442=0",
-"0/2443=0",
-"0/2444=0",
-"0/2445=0",
-"0/2446=0",
-"0/2447=0",
-"0/2448=0",
-"0/2449=0",
-"0/2450=0",
-"0/2451=0",
-"0/2452=0",
-"0/2453=0",
-"0/2454=0",
-"0/2455=0",
-"0/2456=0",
-"0/2457=0",
-"0/2458=0",
-"0/2459=0",
-"0/2460=0",
-"0/2461=0",
-"0/2462=0",
-"0/2463=0",
-"0/2464=0",
-"0/2465=0",
-"0/2466=0",
-"0/2467=0",
-"0/2468=0",
-"0/2469=0",
-"0/2470=0",
-"0/2471=0",
-"0/2472=0",
-"0/2473=0",
-"0/2474=0",
-"0/2475=0",
-"0/2476=0",
-"0/2477=0",
-"0/2478=0",
-"0/2479=0",
-"0/2480=0",
-"0/2481=0",
-"0/2482=0",
-"0/2483=0",
-"0/2484=0",
-"0/2485=0",
-"0/2486=0",
-"0/2487=0",
-"0/2488=0",
-"0/2489=0",
-"0/2490=0",
-"0/2491=0",
-"0/2492=0",
-"0/2493=0",
-"0/2494=0",
-"0/2495=0",
-"0/2496=0",
-"0/2497=0",
-"0/2498=0",
-"0/2499=0",
-"0/24+0=0",
-"0/24+1=1",
-"0/24+2=2",
-"0/24+3=3",
-"0/24+4=4",
-"0/24+5=5",
-"0/24+6=6",
-"0/24+7=7",
-"0/24+8=8",
-"0/24+9=9",
-"0/24-0=0",
-"0/24*0=0",
-"0/24*1=0",
-"0/24*2=0",
-"0/24*3=0",
-"0/24*4=0",
-"0/24*5=0",
-"0/24*6=0",
-"0/24*7=0",
-"0/24*8=0",
-"0/24*9=0",
-"0/24/1=0",
-"0/24/2=0",
-"0/24/3=0",
-"0/24/4=0",
-"0/24/5=0",
-"0/24/6=0",
-"0/24/7=0",
-"0/24/8=0",
-"0/24/9=0",
-"0/2500=0",
-"0/2501=0",
-"0/2502=0",
-"0/2503=0",
-"0/2504=0",
-"0/2505=0",
-"0/2506=0",
-"0/2507=0",
-"0/2508=0",
-"0/2509=0",
-"0/2510=0",
-"0/2511=0",
-"0/2512=0",
-"0/2513=0",
-"0/2514=0",
-"0/2515=0",
-"0/2516=0",
-"0/2517=0",
-"0/2518=0",
-"0/2519=0",
-"0/2520=0",
-"0/2521=0",
-"0/2522=0",
-"0/2523=0",
-"0/2524=0",
-"0/2525=0",
-"0/2526=0",
-"0/2527=0",
-"0/2528=0",
-"0/2529=0",
-"0/2530=0",
-"0/2531=0",
-"0/2532=0",
-"0/2533=0",
-"0/2534=0",
-"0/2535=0",
-"0/2536=0",
-"0/2537=0",
-"0/2538=0",
-"0/2539=0",
-"0/2540=0",
-"0/2541=0",
-"0/2542=0",
-"0/2543=0",
-"0/2544=0",
-"0/2545=0",
-"0/2546=0",
-"0/2547=0",
-"0/2548=0",
-"0/2549=0",
-"0/2550=0",
-"0/2551=0",
-"0/2552=0",
-"0/2553=0",
-"0/2554=0",
-"0/2555=0",
-"0/2556=0",
-"0/2557=0",
-"0/2558=0",
-"0/2559=0",
-"0/2560=0",
-"0/2561=0",
-"0/2562=0",
-"0/2563=0",
-"0/2564=0",
-"0/2565=0",
-"0/2566=0",
-"0/2567=0",
-"0/2568=0",
-"0/2569=0",
-"0/2570=0",
-"0/2571=0",
-"0/2572=0",
-"0/2573=0",
-"0/2574=0",
-"0/2575=0",
-"0/2576=0",
-"0/2577=0",
-"0/2578=0",
-"0/2579=0",
-"0/2580=0",
-"0/2581=0",
-"0/2582=0",
-"0/2583=0",
-"0/2584=0",
-"0/2585=0",
-"0/2586=0",
-"0/2587=0",
-"0/2588=0",
-"0/2589=0",
-"0/2590=0",
-"0/2591=0",
-"0/2592=0",
-"0/2593=0",
-"0/2594=0",
-"0/2595=0",
-"0/2596=0",
-"0/2597=0",
-"0/2598=0",
-"0/2599=0",
-"0/25+0=0",
-"0/25+1=1",
-"0/25+2=2",
-"0/25+3=3",
-"0/25+4=4",
-"0/25+5=5",
-"0/25+6=6",
-"0/25+7=7",
-"0/25+8=8",
-"0/25+9=9",
-"0/25-0=0",
-"0/25*0=0",
-"0/25*1=0",
-"0/25*2=0",
-"0/25*3=0",
-"0/25*4=0",
-"0/25*5=0",
-"0/25*6=0",
-"0/25*7=0",
-"0/25*8=0",
-"0/25*9=0",
-"0/25/1=0",
-"0/25/2=0",
-"0/25/3=0",
-"0/25/4=0",
-"0/25/5=0",
-"0/25/6=0",
-"0/25/7=0",
-"0/25/8=0",
-"0/25/9=0",
-"0/2600=0",
-"0/2601=0",
-"0/2602=0",
-"0/2603=0",
-"0/2604=0",
-"0/2605=0",
-"0/2606=0",
-"0/2607=0",
-"0/2608=0",
-"0/2609=0",
-"0/2610=0",
-"0/2611=0",
-"0/2612=0",
-"0/2613=0",
-"0/2614=0",
-"0/2615=0",
-"0/2616=0",
-"0/2617=0",
-"0/2618=0",
-"0/2619=0",
-"0/2620=0",
-"0/2621=0",
-"0/2622=0",
-"0/2623=0",
-"0/2624=0",
-"0/2625=0",
-"0/2626=0",
-"0/2627=0",
-"0/2628=0",
-"0/2629=0",
-"0/2630=0",
-"0/2631=0",
-"0/2632=0",
-"0/2633=0",
-"0/2634=0",
-"0/2635=0",
-"0/2636=0",
-"0/2637=0",
-"0/2638=0",
-"0/2639=0",
-"0/2640=0",
-"0/2641=0",
-"0/2642=0",
-"0/2643=0",
-"0/2644=0",
-"0/2645=0",
-"0/2646=0",
-"0/2647=0",
-"0/2648=0",
-"0/2649=0",
-"0/2650=0",
-"0/2651=0",
-"0/2652=0",
-"0/2653=0",
-"0/2654=0",
-"0/2655=0",
-"0/2656=0",
-"0/2657=0",
-"0/2658=0",
-"0/2659=0",
-"0/2660=0",
-"0/2661=0",
-"0/2662=0",
-"0/2663=0",
-"0/2664=0",
-"0/2665=0",
-"0/2666=0",
-"0/2667=0",
-"0/2668=0",
-"0/2669=0",
-"0/2670=0",
-"0/2671=0",
-"0/2672=0",
-"0/2673=0",
-"0/2674=0",
-"0/2675=0",
-"0/2676=0",
-"0/2677=0",
-"0/2678=0",
-"0/2679=0",
-"0/2680=0",
-"0/2681=0",
-"0/2682=0",
-"0/2683=0",
-"0/2684=0",
-"0/2685=0",
-"0/2686=0",
-"0/2687=0",
-"0/2688=0",
-"0/2689=0",
-"0/2690=0",
-"0/2691=0",
-"0/2692=0",
-"0/2693=0",
-"0/2694=0",
-"0/2695=0",
-"0/2696=0",
-"0/2697=0",
-"0/2698=0",
-"0/2699=0",
-"0/26+0=0",
-"0/26+1=1",
-"0/26+2=2",
-"0/26+3=3",
-"0/26+4=4",
-"0/26+5=5",
-"0/26+6=6",
-"0/26+7=7",
-"0/26+8=8",
-"0/26+9=9",
-"0/26-0=0",
-"0/26*0=0",
-"0/26*1=0",
-"0/26*2=0",
-"0/26*3=0",
-"0/26*4=0",
-"0/26*5=0",
-"0/26*6=0",
-"0/26*7=0",
-"0/26*8=0",
-"0/26*9=0",
-"0/26/1=0",
-"0/26/2=0",
-"0/26/3=0",
-"0/26/4=0",
-"0/26/5=0",
-"0/26/6=0",
-"0/26/7=0",
-"0/26/8=0",
-"0/26/9=0",
-"0/2700=0",
-"0/2701=0",
-"0/2702=0",
-"0/2703=0",
-"0/2704=0",
-"0/2705=0",
-"0/2706=0",
-"0/2707=0",
-"0/2708=0",
-"0/2709=0",
-"0/2710=0",
-"0/2711=0",
-"0/2712=0",
-"0/2713=0",
-"0/2714=0",
-"0/2715=0",
-"0/2716=0",
-"0/2717=0",
-"0/2718=0",
-"0/2719=0",
-"0/2720=0",
-"0/2721=0",
-"0/2722=0",
-"0/2723=0",
-"0/2724=0",
-"0/2725=0",
-"0/2726=0",
-"0/2727=0",
-"0/2728=0",
-"0/2729=0",
-"0/2730=0",
-"0/2731=0",
-"0/2732=0",
-"0/2733=0",
-"0/2734=0",
-"0/2735=0",
-"0/2736=0",
-"0/2737=0",
-"0/2738=0",
-"0/2739=0",
-"0/2740=0",
-"0/2741=0",
-"0/2742=0",
-"0/2743=0",
-"0/2744=0",
-"0/2745=0",
-"0/2746=0",
-"0/2747=0",
-"0/2748=0",
-"0/2749=0",
-"0/2750=0",
-"0/2751=0",
-"0/2752=0",
-"0/2753=0",
-"0/2754=0",
-"0/2755=0",
-"0/2756=0",
-"0/2757=0",
-"0/2758=0",
-"0/2759=0",
-"0/2760=0",
-"0/2761=0",
-"0/2762=0",
-"0/2763=0",
-"0/2764=0",
-"0/2765=0",
-"0/2766=0",
-"0/2767=0",
-"0/2768=0",
-"0/2769=0",
-"0/2770=0",
-"0/2771=0",
-"0/2772=0",
-"0/2773=0",
-"0/2774=0",
-"0/2775=0",
-"0/2776=0",
-"0/2777=0",
-"0/2778=0",
-"0/2779=0",
-"0/2780=0",
-"0/2781=0",
-"0/2782=0",
-"0/2783=0",
-"0/2784=0",
-"0/2785=0",
-"0/2786=0",
-"0/2787=0",
-"0/2788=0",
-"0/2789=0",
-"0/2790=0",
-"0/2791=0",
-"0/2792=0",
-"0/2793=0",
-"0/2794=0",
-"0/2795=0",
-"0/2796=0",
-"0/2797=0",
-"0/2798=0",
-"0/2799=0",
-"0/27+0=0",
-"0/27+1=1",
-"0/27+2=2",
-"0/27+3=3",
-"0/27+4=4",
-"0/27+5=5",
-"0/27+6=6",
-"0/27+7=7",
-"0/27+8=8",
-"0/27+9=9",
-"0/27-0=0",
-"0/27*0=0",
-"0/27*1=0",
-"0/27*2=0",
-"0/27*3=0",
-"0/27*4=0",
-"0/27*5=0",
-"0/27*6=0",
-"0/27*7=0",
-"0/27*8=0",
-"0/27*9=0",
-"0/27/1=0",
-"0/27/2=0",
-"0/27/3=0",
-"0/27/4=0",
-"0/27/5=0",
-"0/27/6=0",
-"0/27/7=0",
-"0/27/8=0",
-"0/27/9=0",
-"0/2800=0",
-"0/2801=0",
-"0/2802=0",
-"0/2803=0",
-"0/2804=0",
-"0/2805=0",
-"0/2806=0",
-"0/2807=0",
-"0/2808=0",
-"0/2809=0",
-"0/2810=0",
-"0/2811=0",
-"0/2812=0",
-"0/2813=0",
-"0/2814=0",
-"0/2815=0",
-"0/2816=0",
-"0/2817=0",
-"0/2818=0",
-"0/2819=0",
-"0/2820=0",
-"0/2821=0",
-"0/2822=0",
-"0/2823=0",
-"0/2824=0",
-"0/2825=0",
-"0/2826=0",
-"0/2827=0",
-"0/2828=0",
-"0/2829=0",
-"0/2830=0",
-"0/2831=0",
-"0/2832=0",
-"0/2833=0",
-"0/2834=0",
-"0/2835=0",
-"0/2836=0",
-"0/2837=0",
-"0/2838=0",
-"0/2839=0",
-"0/2840=0",
-"0/2841=0",
-"0/2842=0",
-"0/2843=0",
-"0/2844=0",
-"0/2845=0",
-"0/2846=0",
-"0/2847=0",
-"0/2848=0",
-"0/2849=0",
-"0/2850=0",
-"0/2851=0",
-"0/2852=0",
-"0/2853=0",
-"0/2854=0",
-"0/2855=0",
-"0/2856=0",
-"0/2857=0",
-"0/2858=0",
-"0/2859=0",
-"0/2860=0",
-"0/2861=0",
-"0/2862=0",
-"0/2863=0",
-"0/2864=0",
-"0/2865=0",
-"0/2866=0",
-"0/2867=0",
-"0/2868=0",
-"0/2869=0",
-"0/2870=0",
-"0/2871=0",
-"0/2872=0",
-"0/2873=0",
-"0/2874=0",
-"0/2875=0",
-"0/2876=0",
-"0/2877=0",
-"0/2878=0",
-"0/2879=0",
-"0/2880=0",
-"0/2881=0",
-"0/2882=0",
-"0/2883=0",
-"0/2884=0",
-"0/2885=0",
-"0/2886=0",
-"0/2887=0",
-"0/2888=0",
-"0/2889=0",
-"0/2890=0",
-"0/2891=0",
-"0/2892=0",
-"0/2893=0",
-"0/2894=0",
-"0/2895=0",
-"0/2896=0",
-"0/2897=0",
-"0/2898=0",
-"0/2899=0",
-"0/28+0=0",
-"0/28+1=1",
-"0/28+2=2",
-"0/28+3=3",
-"0/28+4=4",
-"0/28+5=5",
-"0/28+6=6",
-"0/28+7=7",
-"0/28+8=8",
-"0/28+9=9",
-"0/28-0=0",
-"0/28*0=0",
-"0/28*1=0",
-"0/28*2=0",
-"0/28*3=0",
-"0/28*4=0",
-"0/28*5=0",
-"0/28*6=0",
-"0/28*7=0",
-"0/28*8=0",
-"0/28*9=0",
-"0/28/1=0",
-"0/28/2=0",
-"0/28/3=0",
-"0/28/4=0",
-"0/28/5=0",
-"0/28/6=0",
-"0/28/7=0",
-"0/28/8=0",
-"0/28/9=0",
-"0/2900=0",
-"0/2901=0",
-"0/2902=0",
-"0/2903=0",
-"0/2904=0",
-"0/2905=0",
-"0/2906=0",
-"0/2907=0",
-"0/2908=0",
-"0/2909=0",
-"0/2910=0",
-"0/2911=0",
-"0/2912=0",
-"0/2913=0",
-"0/2914=0",
-"0/2915=0",
-"0/2916=0",
-"0/2917=0",
-"0/2918=0",
-"0/2919=0",
-"0/2920=0",
-"0/2921=0",
-"0/2922=0",
-"0/2923=0",
-"0/2924=0",
-"0/2925=0",
-"0/2926=0",
-"0/2927=0",
-"0/2928=0",
-"0/2929=0",
-"0/2930=0",
-"0/2931=0",
-"0/2932=0",
-"0/2933=0",
-"0/2934=0",
-"0/2935=0",
-"0/2936=0",
-"0/2937=0",
-"0/2938=0",
-"0/2939=0",
-"0/2940=0",
-"0/2941=0",
-"0/2942=0",
-"0/2943=0",
-"0/2944=0",
-"0/2945=0",
-"0/2946=0",
-"0/2947=0",
-"0/2948=0",
-"0/2949=0",
-"0/2950=0",
-"0/2951=0",
-"0/2952=0",
-"0/2953=0",
-"0/2954=0",
-"0/2955=0",
-"0/2956=0",
-"0/2957=0",
-"0/2958=0",
-"0/2959=0",
-"0/2960=0",
-"0/2961=0",
-"0/2962=0",
-"0/2963=0",
-"0/2964=0",
-"0/2965=0",
-"0/2966=0",
-"0/2967=0",
-"0/2968=0",
-"0/2969=0",
-"0/2970=0",
-"0/2971=0",
-"0/2972=0",
-"0/2973=0",
-"0/2974=0",
-"0/2975=0",
-"0/2976=0",
-"0/2977=0",
-"0/2978=0",
-"0/2979=0",
-"0/2980=0",
-"0/2981=0",
-"0/2982=0",
-"0/2983=0",
-"0/2984=0",
-"0/2985=0",
-"0/2986=0",
-"0/2987=0",
-"0/2988=0",
-"0/2989=0",
-"0/2990=0",
-"0/2991=0",
-"0/2992=0",
-"0/2993=0",
-"0/2994=0",
-"0/2995=0",
-"0/2996=0",
-"0/2997=0",
-"0/2998=0",
-"0/2999=0",
-"0/29+0=0",
-"0/29+1=1",
-"0/29+2=2",
-"0/29+3=3",
-"0/29+4=4",
-"0/29+5=5",
-"0/29+6=6",
-"0/29+7=7",
-"0/29+8=8",
-"0/29+9=9",
-"0/29-0=0",
-"0/29*0=0",
-"0/29*1=0",
-"0/29*2=0",
-"0/29*3=0",
-"0/29*4=0",
-"0/29*5=0",
-"0/29*6=0",
-"0/29*7=0",
-"0/29*8=0",
-"0/29*9=0",
-"0/29/1=0",
-"0/29/2=0",
-"0/29/3=0",
-"0/29/4=0",
-"0/29/5=0",
-"0/29/6=0",
-"0/29/7=0",
-"0/29/8=0",
-"0/29/9=0",
-"0/2-1=-1",
-"0/2-2=-2",
-"0/2-3=-3",
-"0/2-4=-4",
-"0/2-5=-5",
-"0/2-6=-6",
-"0/2-7=-7",
-"0/2-8=-8",
-"0/2-9=-9",
-"0/2*10=0",
-"0/2*11=0",
-"0/2*12=0",
-"0/2*13=0",
-"0/2*14=0",
-"0/2*15=0",
-"0/2*16=0",
-"0/2*17=0",
-"0/2*18=0",
-"0/2*19=0",
-"0/2*20=0",
-"0/2*21=0",
-"0/2*22=0",
-"0/2*23=0",
-"0/2*24=0",
-"0/2*25=0",
-"0/2*26=0",
-"0/2*27=0",
-"0/2*28=0",
-"0/2*29=0",
-"0/2*30=0",
-"0/2*31=0",
-"0/2*32=0",
-"0/2*33=0",
-"0/2*34=0",
-"0/2*35=0",
-"0/2*36=0",
-"0/2*37=0",
-"0/2*38=0",
-"0/2*39=0",
-"0/2*40=0",
-"0/2*41=0",
-"0/2*42=0",
-"0/2*43=0",
-"0/2*44=0",
-"0/2*45=0",
-"0/2*46=0",
-"0/2*47=0",
-"0/2*48=0",
-"0/2*49=0",
-"0/2*50=0",
-"0/2*51=0",
-"0/2*52=0",
-"0/2*53=0",
-"0/2*54=0",
-"0/2*55=0",
-"0/2*56=0",
-"0/2*57=0",
-"0/2*58=0",
-"0/2*59=0",
-"0/2*60=0",
-"0/2*61=0",
-"0/2*62=0",
-"0/2*63=0",
-"0/2*64=0",
-"0/2*65=0",
-"0/2*66=0",
-"0/2*67=0",
-"0/2*68=0",
-"0/2*69=0",
-"0/2*70=0",
-"0/2*71=0",
-"0/2*72=0",
-"0/2*73=0",
-"0/2*74=0",
-"0/2*75=0",
-"0/2*76=0",
-"0/2*77=0",
-"0/2*78=0",
-"0/2*79=0",
-"0/2*80=0",
-"0/2*81=0",
-"0/2*82=0",
-"0/2*83=0",
-"0/2*84=0",
-"0/2*85=0",
-"0/2*86=0",
-"0/2*87=0",
-"0/2*88=0",
-"0/2*89=0",
-"0/2*90=0",
-"0/2*91=0",
-"0/2*92=0",
-"0/2*93=0",
-"0/2*94=0",
-"0/2*95=0",
-"0/2*96=0",
-"0/2*97=0",
-"0/2*98=0",
-"0/2*99=0",
-"0/2/10=0",
-"0/2/11=0",
-"0/2/12=0",
-"0/2/13=0",
-"0/2/14=0",
-"0/2/15=0",
-"0/2/16=0",
-"0/2/17=0",
-"0/2/18=0",
-"0/2/19=0",
-"0/2/20=0",
-"0/2/21=0",
-"0/2/22=0",
-"0/2/23=0",
-"0/2/24=0",
-"0/2/25=0",
-"0/2/26=0",
-"0/2/27=0",
-"0/2/28=0",
-"0/2/29=0",
-"0/2/30=0",
-"0/2/31=0",
-"0/2/32=0",
-"0/2/33=0",
-"0/2/34=0",
-"0/2/35=0",
-"0/2/36=0",
-"0/2/37=0",
-"0/2/38=0",
-"0/2/39=0",
-"0/2/40=0",
-"0/2/41=0",
-"0/2/42=0",
-"0/2/43=0",
-"0/2/44=0",
-"0/2/45=0",
-"0/2/46=0",
-"0/2/47=0",
-"0/2/48=0",
-"0/2/49=0",
-"0/2/50=0",
-"0/2/51=0",
-"0/2/52=0",
-"0/2/53=0",
-"0/2/54=0",
-"0/2/55=0",
-"0/2/56=0",
-"0/2/57=0",
-"0/2/58=0",
-"0/2/59=0",
-"0/2/60=0",
-"0/2/61=0",
-"0/2/62=0",
-"0/2/63=0",
-"0/2/64=0",
-"0/2/65=0",
-"0/2/66=0",
-"0/2/67=0",
-"0/2/68=0",
-"0/2/69=0",
-"0/2/70=0",
-"0/2/71=0",
-"0/2/72=0",
-"0/2/73=0",
-"0/2/74=0",
-"0/2/75=0",
-"0/2/76=0",
-"0/2/77=0",
-"0/2/78=0",
-"0/2/79=0",
-"0/2/80=0",
-"0/2/81=0",
-"0/2/82=0",
-"0/2/83=0",
-"0/2/84=0",
-"0/2/85=0",
-"0/2/86=0",
-"0/2/87=0",
-"0/2/88=0",
-"0/2/89=0",
-"0/2/90=0",
-"0/2/91=0",
-"0/2/92=0",
-"0/2/93=0",
-"0/2/94=0",
-"0/2/95=0",
-"0/2/96=0",
-"0/2/97=0",
-"0/2/98=0",
-"0/2/99=0",
-"0/3000=0",
-"0/3001=0",
-"0/3002=0",
-"0/3003=0",
-"0/3004=0",
-"0/3005=0",
-"0/3006=0",
-"0/3007=0",
-"0/3008=0",
-"0/3009=0",
-"0/3010=0",
-"0/3011=0",
-"0/3012=0",
-"0/3013=0",
-"0/3014=0",
-"0/3015=0",
-"0/3016=0",
-"0/3017=0",
-"0/3018=0",
-"0/3019=0",
-"0/3020=0",
-"0/3021=0",
-"0/3022=0",
-"0/3023=0",
-"0/3024=0",
-"0/3025=0",
-"0/3026=0",
-"0/3027=0",
-"0/3028=0",
-"0/3029=0",
-"0/3030=0",
-"0/3031=0",
-"0/3032=0",
-"0/3033=0",
-"0/3034=0",
-"0/3035=0",
-"0/3036=0",
-"0/3037=0",
-"0/3038=0",
-"0/3039=0",
-"0/3040=0",
-"0/3041=0",
-"0/3042=0",
-"0/3043=0",
-"0/3044=0",
-"0/3045=0",
-"0/3046=0",
-"0/3047=0",
-"0/3048=0",
-"0/3049=0",
-"0/3050=0",
-"0/3051=0",
-"0/3052=0",
-"0/3053=0",
-"0/3054=0",
-"0/3055=0",
-"0/3056=0",
-"0/3057=0",
-"0/3058=0",
-"0/3059=0",
-"0/3060=0",
-"0/3061=0",
-"0/3062=0",
-"0/3063=0",
-"0/3064=0",
-"0/3065=0",
-"0/3066=0",
-"0/3067=0",
-"0/3068=0",
-"0/3069=0",
-"0/3070=0",
-"0/3071=0",
-"0/3072=0",
-"0/3073=0",
-"0/3074=0",
-"0/3075=0",
-"0/3076=0",
-"0/3077=0",
-"0/3078=0",
-"0/3079=0",
-"0/3080=0",
-"0/3081=0",
-"0/3082=0",
-"0/3083=0",
-"0/3084=0",
-"0/3085=0",
-"0/3086=0",
-"0/3087=0",
-"0/3088=0",
-"0/3089=0",
-"0/3090=0",
-"0/3091=0",
-"0/3092=0",
-"0/3093=0",
-"0/3094=0",
-"0/3095=0",
-"0/3096=0",
-"0/3097=0",
-"0/3098=0",
-"0/3099=0",
-"0/30+0=0",
-"0/30+1=1",
-"0/30+2=2",
-"0/30+3=3",
-"0/30+4=4",
-"0/30+5=5",
-"0/30+6=6",
-"0/30+7=7",
-"0/30+8=8",
-"0/30+9=9",
-"0/30-0=0",
-"0/30*0=0",
-"0/30*1=0",
-"0/30*2=0",
-"0/30*3=0",
-"0/30*4=0",
-"0/30*5=0",
-"0/30*6=0",
-"0/30*7=0",
-"0/30*8=0",
-"0/30*9=0",
-"0/30/1=0",
-"0/30/2=0",
-"0/30/3=0",
-"0/30/4=0",
-"0/30/5=0",
-"0/30/6=0",
-"0/30/7=0",
-"0/30/8=0",
-"0/30/9=0",
-"0/3100=0",
-"0/3101=0",
-"0/3102=0",
-"0/3103=0",
-"0/3104=0",
-"0/3105=0",
-"0/3106=0",
-"0/3107=0",
-"0/3108=0",
-"0/3109=0",
-"0/3110=0",
-"0/3111=0",
-"0/3112=0",
-"0/3113=0",
-"0/3114=0",
-"0/3115=0",
-"0/3116=0",
-"0/3117=0",
-"0/3118=0",
-"0/3119=0",
-"0/3120=0",
-"0/3121=0",
-"0/3122=0",
-"0/3123=0",
-"0/3124=0",
-"0/3125=0",
-"0/3126=0",
-"0/3127=0",
-"0/3128=0",
-"0/3129=0",
-"0/3130=0",
-"0/3131=0",
-"0/3132=0",
-"0/3133=0",
-"0/3134=0",
-"0/3135=0",
-"0/3136=0",
-"0/3137=0",
-"0/3138=0",
-"0/3139=0",
-"0/3140=0",
-"0/3141=0",
-"0/3142=0",
-"0/3143=0",
-"0/3144=0",
-"0/3145=0",
-"0/3146=0",
-"0/3147=0",
-"0/3148=0",
-"0/3149=0",
-"0/3150=0",
-"0/3151=0",
-"0/3152=0",
-"0/3153=0",
-"0/3154=0",
-"0/3155=0",
-"0/3156=0",
-"0/3157=0",
-"0/3158=0",
-"0/3159=0",
-"0/3160=0",
-"0/3161=0",
-"0/3162=0",
-"0/3163=0",
-"0/3164=0",
-"0/3165=0",
-"0/3166=0",
-"0/3167=0",
-"0/3168=0",
-"0/3169=0",
-"0/3170=0",
-"0/3171=0",
-"0/3172=0",
-"0/3173=0",
-"0/3174=0",
-"0/3175=0",
-"0/3176=0",
-"0/3177=0",
-"0/3178=0",
-"0/3179=0",
-"0/3180=0",
-"0/3181=0",
-"0/3182=0",
-"0/3183=0",
-"0/3184=0",
-"0/3185=0",
-"0/3186=0",
-"0/3187=0",
-"0/3188=0",
-"0/3189=0",
-"0/3190=0",
-"0/3191=0",
-"0/3192=0",
-"0/3193=0",
-"0/3194=0",
-"0/3195=0",
-"0/3196=0",
-"0/3197=0",
-"0/3198=0",
-"0/3199=0",
-"0/31+0=0",
-"0/31+1=1",
-"0/31+2=2",
-"0/31+3=3",
-"0/31+4=4",
-"0/31+5=5",
-"0/31+6=6",
-"0/31+7=7",
-"0/31+8=8",
-"0/31+9=9",
-"0/31-0=0",
-"0/31*0=0",
-"0/31*1=0",
-"0/31*2=0",
-"0/31*3=0",
-"0/31*4=0",
-"0/31*5=0",
-"0/31*6=0",
-"0/31*7=0",
-"0/31*8=0",
-"0/31*9=0",
-"0/31/1=0",
-"0/31/2=0",
-"0/31/3=0",
-"0/31/4=0",
-"0/31/5=0",
-"0/31/6=0",
-"0/31/7=0",
-"0/31/8=0",
-"0/31/9=0",
-"0/3200=0",
-"0/3201=0",
-"0/3202=0",
-"0/3203=0",
-"0/3204=0",
-"0/3205=0",
-"0/3206=0",
-"0/3207=0",
-"0/3208=0",
-"0/3209=0",
-"0/3210=0",
-"0/3211=0",
-"0/3212=0",
-"0/3213=0",
-"0/3214=0",
-"0/3215=0",
-"0/3216=0",
-"0/3217=0",
-"0/3218=0",
-"0/3219=0",
-"0/3220=0",
-"0/3221=0",
-"0/3222=0",
-"0/3223=0",
-"0/3224=0",
-"0/3225=0",
-"0/3226=0",
-"0/3227=0",
-"0/3228=0",
-"0/3229=0",
-"0/3230=0",
-"0/3231=0",
-"0/3232=0",
-"0/3233=0",
-"0/3234=0",
-"0/3235=0",
-"0/3236=0",
-"0/3237=0",
-"0/3238=0",
-"0/3239=0",
-"0/3240=0",
-"0/3241=0",
-"0/3242=0",
-"0/3243=0",
-"0/3244=0",
-"0/3245=0",
-"0/3246=0",
-"0/3247=0",
-"0/3248=0",
-"0/3249=0",
-"0/3250=0",
-"0/3251=0",
-"0/3252=0",
-"0/3253=0",
-"0/3254=0",
-"0/3255=0",
-"0/3256=0",
-"0/3257=0",
-"0/3258=0",
-"0/3259=0",
-"0/3260=0",
-"0/3261=0",
-"0/3262=0",
-"0/3263=0",
-"0/3264=0",
-"0/3265=0",
-"0/3266=0",
-"0/3267=0",
-"0/3268=0",
-"0/3269=0",
-"0/3270=0",
-"0/3271=0",
-"0/3272=0",
-"0/3273=0",
-"0/3274=0",
-"0/3275=0",
-"0/3276=0",
-"0/3277=0",
-"0/3278=0",
-"0/3279=0",
-"0/3280=0",
-"0/3281=0",
-"0/3282=0",
-"0/3283=0",
-"0/3284=0",
-"0/3285=0",
-"0/3286=0",
-"0/3287=0",
-"0/3288=0",
-"0/3289=0",
-"0/3290=0",
-"0/3291=0",
-"0/3292=0",
-"0/3293=0",
-"0/3294=0",
-"0/3295=0",
-"0/3296=0",
-"0/3297=0",
-"0/3298=0",
-"0/3299=0",
-"0/32+0=0",
-"0/32+1=1",
-"0/32+2=2",
-"0/32+3=3",
-"0/32+4=4",
-"0/32+5=5",
-"0/32+6=6",
-"0/32+7=7",
-"0/32+8=8",
-"0/32+9=9",
-"0/32-0=0",
-"0/32*0=0",
-"0/32*1=0",
-"0/32*2=0",
-"0/32*3=0",
-"0/32*4=0",
-"0/32*5=0",
-"0/32*6=0",
-"0/32*7=0",
-"0/32*8=0",
-"0/32*9=0",
-"0/32/1=0",
-"0/32/2=0",
-"0/32/3=0",
-"0/32/4=0",
-"0/32/5=0",
-"0/32/6=0",
-"0/32/7=0",
-"0/32/8=0",
-"0/32/9=0",
-"0/3300=0",
-"0/3301=0",
-"0/3302=0",
-"0/3303=0",
-"0/3304=0",
-"0/3305=0",
-"0/3306=0",
-"0/3307=0",
-"0/3308=0",
-"0/3309=0",
-"0/3310=0",
-"0/3311=0",
-"0/3312=0",
-"0/3313=0",
-"0/3314=0",
-"0/3315=0",
-"0/3316=0",
-"0/3317=0",
-"0/3318=0",
-"0/3319=0",
-"0/3320=0",
-"0/3321=0",
-"0/3322=0",
-"0/3323=0",
-"0/3324=0",
-"0/3325=0",
-"0/3326=0",
-"0/3327=0",
-"0/3328=0",
-"0/3329=0",
-"0/3330=0",
-"0/3331=0",
-"0/3332=0",
-"0/3333=0",
-"0/3334=0",
-"0/3335=0",
-"0/3336=0",
-"0/3337=0",
-"0/3338=0",
-"0/3339=0",
-"0/3340=0",
-"0/3341=0",
-"0/3342=0",
-"0/3343=0",
-"0/3344=0",
-"0/3345=0",
-"0/3346=0",
-"0/3347=0",
-"0/3348=0",
-"0/3349=0",
-"0/3350=0",
-"0/3351=0",
-"0/3352=0",
-"0/3353=0",
-"0/3354=0",
-"0/3355=0",
-"0/3356=0",
-"0/3357=0",
-"0/3358=0",
-"0/3359=0",
-"0/3360=0",
-"0/3361=0",
-"0/3362=0",
-"0/3363=0",
-"0/3364=0",
-"0/3365=0",
-"0/3366=0",
-"0/3367=0",
-"0/3368=0",
-"0/3369=0",
-"0/3370=0",
-"0/3371=0",
-"0/3372=0",
-"0/3373=0",
-"0/3374=0",
-"0/3375=0",
-"0/3376=0",
-"0/3377=0",
-"0/3378=0",
-"0/3379=0",
-"0/3380=0",
-"0/3381=0",
-"0/3382=0",
-"0/3383=0",
-"0/3384=0",
-"0/3385=0",
-"0/3386=0",
-"0/3387=0",
-"0/3388=0",
-"0/3389=0",
-"0/3390=0",
-"0/3391=0",
-"0/3392=0",
-"0/3393=0",
-"0/3394=0",
-"0/3395=0",
-"0/3396=0",
-"0/3397=0",
-"0/3398=0",
-"0/3399=0",
-"0/33+0=0",
-"0/33+1=1",
-"0/33+2=2",
-"0/33+3=3",
-"0/33+4=4",
-"0/33+5=5",
-"0/33+6=6",
-"0/33+7=7",
-"0/33+8=8",
-"0/33+9=9",
-"0/33-0=0",
-"0/33*0=0",
-"0/33*1=0",
-"0/33*2=0",
-"0/33*3=0",
-"0/33*4=0",
-"0/33*5=0",
-"0/33*6=0",
-"0/33*7=0",
-"0/33*8=0",
-"0/33*9=0",
-"0/33/1=0",
-"0/33/2=0",
-"0/33/3=0",
-"0/33/4=0",
-"0/33/5=0",
-"0/33/6=0",
-"0/33/7=0",
-"0/33/8=0",
-"0/33/9=0",
-"0/3400=0",
-"0/3401=0",
-"0/3402=0",
-"0/3403=0",
-"0/3404=0",
-"0/3405=0",
-"0/3406=0",
-"0/3407=0",
-"0/3408=0",
-"0/3409=0",
-"0/3410=0",
-"0/3411=0",
-"0/3412=0",
-"0/3413=0",
-"0/3414=0",
-"0/3415=0",
-"0/3416=0",
-"0/3417=0",
-"0/3418=0",
-"0/3419=0",
-"0/3420=0",
-"0/3421=0",
-"0/3422=0",
-"0/3423=0",
-"0/3424=0",
-"0/3425=0",
-"0/3426=0",
-"0/3427=0",
-"0/3428=0",
-"0/3429=0",
-"0/3430=0",
-"0/3431=0",
-"0/3432=0",
-"0/3433=0",
-"0/3434=0",
-"0/3435=0",
-"0/3436=0",
-"0/3437=0",
-"0/3438=0",
-"0/3439=0",
-"0/3440=0",
-"0/3441=0",
-"0/3442=0",
-"0/3443=0",
-"0/3444=0",
-"0/3445=0",
-"0/3446=0",
-"0/3447=0",
-"0/3448=0",
-"0/3449=0",
-"0/3450=0",
-"0/3451=0",
-"0/3452=0",
-"0/3453=0",
-"0/3454=0",
-"0/3455=0",
-"0/3456=0",
-"0/3457=0",
-"0/3458=0",
-"0/3459=0",
-"0/3460=0",
-"0/3461=0",
-"0/3462=0",
-"0/3463=0",
-"0/3464=0",
-"0/3465=0",
-"0/3466=0",
-"0/3467=0",
-"0/3468=0",
-"0/3469=0",
-"0/3470=0",
-"0/3471=0",
-"0/3472=0",
-"0/3473=0",
-"0/3474=0",
-"0/3475=0",
-"0/3476=0",
-"0/3477=0",
-"0/3478=0",
-"0/3479=0",
-"0/3480=0",
-"0/3481=0",
-"0/3482=0",
-"0/3483=0",
-"0/3484=0",
-"0/3485=0",
-"0/3486=0",
-"0/3487=0",
-"0/3488=0",
-"0/3489=0",
-"0/3490=0",
-"0/3491=0",
-"0/3492=0",
-"0/3493=0",
-"0/3494=0",
-"0/3495=0",
-"0/3496=0",
-"0/3497=0",
-"0/3498=0",
-"0/3499=0",
-"0/34+0=0",
-"0/34+1=1",
-"0/34+2=2",
-"0/34+3=3",
-"0/34+4=4",
-"0/34+5=5",
-"0/34+6=6",
-"0/34+7=7",
-"0/34+8=8",
-"0/34+9=9",
-"0/34-0=0",
-"0/34*0=0",
-"0/34*1=0",
-"0/34*2=0",
-"0/34*3=0",
-"0/34*4=0",
-"0/34*5=0",
-"0/34*6=0",
-"0/34*7=0",
-"0/34*8=0",
-"0/34*9=0",
-"0/34/1=0",
-"0/34/2=0",
-"0/34/3=0",
-"0/34/4=0",
-"0/34/5=0",
-"0/34/6=0",
-"0/34/7=0",
-"0/34/8=0",
-"0/34/9=0",
-"0/3500=0",
-"0/3501=0",
-"0/3502=0",
-"0/3503=0",
-"0/3504=0",
-"0/3505=0",
-"0/3506=0",
-"0/3507=0",
-"0/3508=0",
-"0/3509=0",
-"0/3510=0",
-"0/3511=0",
-"0/3512=0",
-"0/3513=0",
-"0/3514=0",
-"0/3515=0",
-"0/3516=0",
-"0/3517=0",
-"0/3518=0",
-"0/3519=0",
-"0/3520=0",
-"0/3521=0",
-"0/3522=0",
-"0/3523=0",
-"0/3524=0",
-"0/3525=0",
-"0/3526=0",
-"0/3527=0",
-"0/3528=0",
-"0/3529=0",
-"0/3530=0",
-"0/3531=0",
-"0/3532=0",
-"0/3533=0",
-"0/3534=0",
-"0/3535=0",
-"0/3536=0",
-"0/3537=0",
-"0/3538=0",
-"0/3539=0",
-"0/3540=0",
-"0/3541=0",
-"0/3542=0",
-"0/3543=0",
-"0/3544=0",
-"0/3545=0",
-"0/3546=0",
-"0/3547=0",
-"0/3548=0",
-"0/3549=0",
-"0/3550=0",
-"0/3551=0",
-"0/3552=0",
-"0/3553=0",
-"0/3554=0",
-"0/3555=0",
-"0/3556=0",
-"0/3557=0",
-"0/3558=0",
-"0/3559=0",
-"0/3560=0",
-"0/3561=0",
-"0/3562=0",
-"0/3563=0",
-"0/3564=0",
-"0/3565=0",
-"0/3566=0",
-"0/3567=0",
-"0/3568=0",
-"0/3569=0",
-"0/3570=0",
-"0/3571=0",
-"0/3572=0",
-"0/3573=0",
-"0/3574=0",
-"0/3575=0",
-"0/3576=0",
-"0/3577=0",
-"0/3578=0",
-"0/3579=0",
-"0/3580=0",
-"0/3581=0",
-"0/3582=0",
-"0/3583=0",
-"0/3584=0",
-"0/3585=0",
-"0/3586=0",
-"0/3587=0",
-"0/3588=0",
-"0/3589=0",
-"0/3590=0",
-"0/3591=0",
-"0/3592=0",
-"0/3593=0",
-"0/3594=0",
-"0/3595=0",
-"0/3596=0",
-"0/3597=0",
-"0/3598=0",
-"0/3599=0",
-"0/35+0=0",
-"0/35+1=1",
-"0/35+2=2",
-"0/35+3=3",
-"0/35+4=4",
-"0/35+5=5",
-"0/35+6=6",
-"0/35+7=7",
-"0/35+8=8",
-"0/35+9=9",
-"0/35-0=0",
-"0/35*0=0",
-"0/35*1=0",
-"0/35*2=0",
-"0/35*3=0",
-"0/35*4=0",
-"0/35*5=0",
-"0/35*6=0",
-"0/35*7=0",
-"0/35*8=0",
-"0/35*9=0",
-"0/35/1=0",
-"0/35/2=0",
-"0/35/3=0",
-"0/35/4=0",
-"0/35/5=0",
-"0/35/6=0",
-"0/35/7=0",
-"0/35/8=0",
-"0/35/9=0",
-"0/3600=0",
-"0/3601=0",
-"0/3602=0",
-"0/3603=0",
-"0/3604=0",
-"0/3605=0",
-"0/3606=0",
-"0/3607=0",
-"0/3608=0",
-"0/3609=0",
-"0/3610=0",
-"0/3611=0",
-"0/3612=0",
-"0/3613=0",
-"0/3614=0",
-"0/3615=0",
-"0/3616=0",
-"0/3617=0",
-"0/3618=0",
-"0/3619=0",
-"0/3620=0",
-"0/3621=0",
-"0/3622=0",
-"0/3623=0",
-"0/3624=0",
-"0/3625=0",
-"0/3626=0",
-"0/3627=0",
-"0/3628=0",
-"0/3629=0",
-"0/3630=0",
-"0/3631=0",
-"0/3632=0",
-"0/3633=0",
-"0/3634=0",
-"0/3635=0",
-"0/3636=0",
-"0/3637=0",
-"0/3638=0",
-"0/3639=0",
-"0/3640=0",
-"0/3641=0",
-"0/3642=0",
-"0/3643=0",
-"0/3644=0",
-"0/3645=0",
-"0/3646=0",
-"0/3647=0",
-"0/3648=0",
-"0/3649=0",
-"0/3650=0",
-"0/3651=0",
-"0/3652=0",
-"0/3653=0",
-"0/3654=0",
-"0/3655=0",
-"0/3656=0",
-"0/3657=0",
-"0/3658=0",
-"0/3659=0",
-"0/3660=0",
-"0/3661=0",
-"0/3662=0",
-"0/3663=0",
-"0/3664=0",
-"0/3665=0",
-"0/3666=0",
-"0/3667=0",
-"0/3668=0",
-"0/3669=0",
-"0/3670=0",
-"0/3671=0",
-"0/3672=0",
-"0/3673=0",
-"0/3674=0",
-"0/3675=0",
-"0/3676=0",
-"0/3677=0",
-"0/3678=0",
-"0/3679=0",
-"0/3680=0",
-"0/3681=0",
-"0/3682=0",
-"0/3683=0",
-"0/3684=0",
-"0/3685=0",
-"0/3686=0",
-"0/3687=0",
-"0/3688=0",
-"0/3689=0",
-"0/3690=0",
-"0/3691=0",
-"0/3692=0",
-"0/3693=0",
-"0/3694=0",
-"0/3695=0",
-"0/3696=0",
-"0/3697=0",
-"0/3698=0",
-"0/3699=0",
-"0/36+0=0",
-"0/36+1=1",
-"0/36+2=2",
-"0/36+3=3",
-"0/36+4=4",
-"0/36+5=5",
-"0/36+6=6",
-"0/36+7=7",
-"0/36+8=8",
-"0/36+9=9",
-"0/36-0=0",
-"0/36*0=0",
-"0/36*1=0",
-"0/36*2=0",
-"0/36*3=0",
-"0/36*4=0",
-"0/36*5=0",
-"0/36*6=0",
-"0/36*7=0",
-"0/36*8=0",
-"0/36*9=0",
-"0/36/1=0",
-"0/36/2=0",
-"0/36/3=0",
-"0/36/4=0",
-"0/36/5=0",
-"0/36/6=0",
-"0/36/7=0",
-"0/36/8=0",
-"0/36/9=0",
-"0/3700=0",
-"0/3701=0",
-"0/3702=0",
-"0/3703=0",
-"0/3704=0",
-"0/3705=0",
-"0/3706=0",
-"0/3707=0",
-"0/3708=0",
-"0/3709=0",
-"0/3710=0",
-"0/3711=0",
-"0/3712=0",
-"0/3713=0",
-"0/3714=0",
-"0/3715=0",
-"0/3716=0",
-"0/3717=0",
-"0/3718=0",
-"0/3719=0",
-"0/3720=0",
-"0/3721=0",
-"0/3722=0",
-"0/3723=0",
-"0/3724=0",
-"0/3725=0",
-"0/3726=0",
-"0/3727=0",
-"0/3728=0",
-"0/3729=0",
-"0/3730=0",
-"0/3731=0",
-"0/3732=0",
-"0/3733=0",
-"0/3734=0",
-"0/3735=0",
-"0/3736=0",
-"0/3737=0",
-"0/3738=0",
-"0/3739=0",
-"0/3740=0",
-"0/3741=0",
-"0/3742=0",
-"0/3743=0",
-"0/3744=0",
-"0/3745=0",
-"0/3746=0",
-"0/3747=0",
-"0/3748=0",
-"0/3749=0",
-"0/3750=0",
-"0/3751=0",
-"0/3752=0",
-"0/3753=0",
-"0/3754=0",
-"0/3755=0",
-"0/3756=0",
-"0/3757=0",
-"0/3758=0",
-"0/3759=0",
-"0/3760=0",
-"0/3761=0",
-"0/3762=0",
-"0/3763=0",
-"0/3764=0",
-"0/3765=0",
-"0/3766=0",
-"0/3767=0",
-"0/3768=0",
-"0/3769=0",
-"0/3770=0",
-"0/3771=0",
-"0/3772=0",
-"0/3773=0",
-"0/3774=0",
-"0/3775=0",
-"0/3776=0",
-"0/3777=0",
-"0/3778=0",
-"0/3779=0",
-"0/3780=0",
-"0/3781=0",
-"0/3782=0",
-"0/3783=0",
-"0/3784=0",
-"0/3785=0",
-"0/3786=0",
-"0/3787=0",
-"0/3788=0",
-"0/3789=0",
-"0/3790=0",
-"0/3791=0",
-"0/3792=0",
-"0/3793=0",
-"0/3794=0",
-"0/3795=0",
-"0/3796=0",
-"0/3797=0",
-"0/3798=0",
-"0/3799=0",
-"0/37+0=0",
-"0/37+1=1",
-"0/37+2=2",
-"0/37+3=3",
-"0/37+4=4",
-"0/37+5=5",
-"0/37+6=6",
-"0/37+7=7",
-"0/37+8=8",
-"0/37+9=9",
-"0/37-0=0",
-"0/37*0=0",
-"0/37*1=0",
-"0/37*2=0",
-"0/37*3=0",
-"0/37*4=0",
-"0/37*5=0",
-"0/37*6=0",
-"0/37*7=0",
-"0/37*8=0",
-"0/37*9=0",
-"0/37/1=0",
-"0/37/2=0",
-"0/37/3=0",
-"0/37/4=0",
-"0/37/5=0",
-"0/37/6=0",
-"0/37/7=0",
-"0/37/8=0",
-"0/37/9=0",
-"0/3800=0",
-"0/3801=0",
-"0/3802=0",
-"0/3803=0",
-"0/3804=0",
-"0/3805=0",
-"0/3806=0",
-"0/3807=0",
-"0/3808=0",
-"0/3809=0",
-"0/3810=0",
-"0/3811=0",
-"0/3812=0",
-"0/3813=0",
-"0/3814=0",
-"0/3815=0",
-"0/3816=0",
-"0/3817=0",
-"0/3818=0",
-"0/3819=0",
-"0/3820=0",
-"0/3821=0",
-"0/3822=0",
-"0/3823=0",
-"0/3824=0",
-"0/3825=0",
-"0/3826=0",
-"0/3827=0",
-"0/3828=0",
-"0/3829=0",
-"0/3830=0",
-"0/3831=0",
-"0/3832=0",
-"0/3833=0",
-"0/3834=0",
-"0/3835=0",
-"0/3836=0",
-"0/3837=0",
-"0/3838=0",
-"0/3839=0",
-"0/3840=0",
-"0/3841=0",
-"0/3842=0",
-"0/3843=0",
-"0/3844=0",
-"0/3845=0",
-"0/3846=0",
-"0/3847=0",
-"0/3848=0",
-"0/3849=0",
-"0/3850=0",
-"0/3851=0",
-"0/3852=0",
-"0/3853=0",
-"0/3854=0",
-"0/3855=0",
-"0/3856=0",
-"0/3857=0",
-"0/3858=0",
-"0/3859=0",
-"0/3860=0",
-"0/3861=0",
-"0/3862=0",
-"0/3863=0",
-"0/3864=0",
-"0/3865=0",
-"0/3866=0",
-"0/3867=0",
-"0/3868=0",
-"0/3869=0",
-"0/3870=0",
-"0/3871=0",
-"0/3872=0",
-"0/3873=0",
-"0/3874=0",
-"0/3875=0",
-"0/3876=0",
-"0/3877=0",
-"0/3878=0",
-"0/3879=0",
-"0/3880=0",
-"0/3881=0",
-"0/3882=0",
-"0/3883=0",
-"0/3884=0",
-"0/3885=0",
-"0/3886=0",
-"0/3887=0",
-"0/3888=0",
-"0/3889=0",
-"0/3890=0",
-"0/3891=0",
-"0/3892=0",
-"0/3893=0",
-"0/3894=0",
-"0/3895=0",
-"0/3896=0",
-"0/3897=0",
-"0/3898=0",
-"0/3899=0",
-"0/38+0=0",
-"0/38+1=1",
-"0/38+2=2",
-"0/38+3=3",
-"0/38+4=4",
-"0/38+5=5",
-"0/38+6=6",
-"0/38+7=7",
-"0/38+8=8",
-"0/38+9=9",
-"0/38-0=0",
-"0/38*0=0",
-"0/38*1=0",
-"0/38*2=0",
-"0/38*3=0",
-"0/38*4=0",
-"0/38*5=0",
-"0/38*6=0",
-"0/38*7=0",
-"0/38*8=0",
-"0/38*9=0",
-"0/38/1=0",
-"0/38/2=0",
-"0/38/3=0",
-"0/38/4=0",
-"0/38/5=0",
-"0/38/6=0",
-"0/38/7=0",
-"0/38/8=0",
-"0/38/9=0",
-"0/3900=0",
-"0/3901=0",
-"0/3902=0",
-"0/3903=0",
-"0/3904=0",
-"0/3905=0",
-"0/3906=0",
-"0/3907=0",
-"0/3908=0",
-"0/3909=0",
-"0/3910=0",
-"0/3911=0",
-"0/3912=0",
-"0/3913=0",
-"0/3914=0",
-"0/3915=0",
-"0/3916=0",
-"0/3917=0",
-"0/3918=0",
-"0/3919=0",
-"0/3920=0",
-"0/3921=0",
-"0/3922=0",
-"0/3923=0",
-"0/3924=0",
-"0/3925=0",
-"0/3926=0",
-"0/3927=0",
-"0/3928=0",
-"0/3929=0",
-"0/3930=0",
-"0/3931=0",
-"0/3932=0",
-"0/3933=0",
-"0/3934=0",
-"0/3935=0",
-"0/3936=0",
-"0/3937=0",
-"0/3938=0",
-"0/3939=0",
-"0/3940=0",
-"0/3941=0",
-"0/3942=0",
-"0/3943=0",
-"0/3944=0",
-"0/3945=0",
-"0/3946=0",
-"0/3947=0",
-"0/3948=0",
-"0/3949=0",
-"0/3950=0",
-"0/3951=0",
-"0/3952=0",
-"0/3953=0",
-"0/3954=0",
-"0/3955=0",
-"0/3956=0",
-"0/3957=0",
-"0/3958=0",
-"0/3959=0",
-"0/3960=0",
-"0/3961=0",
-"0/3962=0",
-"0/3963=0",
-"0/3964=0",
-"0/3965=0",
-"0/3966=0",
-"0/3967=0",
-"0/3968=0",
-"0/3969=0",
-"0/3970=0",
-"0/3971=0",
-"0/3972=0",
-"0/3973=0",
-"0/3974=0",
-"0/3975=0",
-"0/3976=0",
-"0/3977=0",
-"0/3978=0",
-"0/3979=0",
-"0/3980=0",
-"0/3981=0",
-"0/3982=0",
-"0/3983=0",
-"0/3984=0",
-"0/3985=0",
-"0/3986=0",
-"0/3987=0",
-"0/3988=0",
-"0/3989=0",
-"0/3990=0",
-"0/3991=0",
-"0/3992=0",
-"0/3993=0",
-"0/3994=0",
-"0/3995=0",
-"0/3996=0",
-"0/3997=0",
-"0/3998=0",
-"0/3999=0",
-"0/39+0=0",
-"0/39+1=1",
-"0/39+2=2",
-"0/39+3=3",
-"0/39+4=4",
-"0/39+5=5",
-"0/39+6=6",
-"0/39+7=7",
-"0/39+8=8",
-"0/39+9=9",
-"0/39-0=0",
-"0/39*0=0",
-"0/39*1=0",
-"0/39*2=0",
-"0/39*3=0",
-"0/39*4=0",
-"0/39*5=0",
-"0/39*6=0",
-"0/39*7=0",
-"0/39*8=0",
-"0/39*9=0",
-"0/39/1=0",
-"0/39/2=0",
-"0/39/3=0",
-"0/39/4=0",
-"0/39/5=0",
-"0/39/6=0",
-"0/39/7=0",
-"0/39/8=0",
-"0/39/9=0",
-"0/3-1=-1",
-"0/3-2=-2",
-"0/3-3=-3",
-"0/3-4=-4",
-"0/3-5=-5",
-"0/3-6=-6",
-"0/3-7=-7",
-"0/3-8=-8",
-"0/3-9=-9",
-"0/3*10=0",
-"0/3*11=0",
-"0/3*12=0",
-"0/3*13=0",
-"0/3*14=0",
-"0/3*15=0",
-"0/3*16=0",
-"0/3*17=0",
-"0/3*18=0",
-"0/3*19=0",
-"0/3*20=0",
-"0/3*21=0",
-"0/3*22=0",
-"0/3*23=0",
-"0/3*24=0",
-"0/3*25=0",
-"0/3*26=0",
-"0/3*27=0",
-"0/3*28=0",
-"0/3*29=0",
-"0/3*30=0",
-"0/3*31=0",
-"0/3*32=0",
-"0/3*33=0",
-"0/3*34=0",
-"0/3*35=0",
-"0/3*36=0",
-"0/3*37=0",
-"0/3*38=0",
-"0/3*39=0",
-"0/3*40=0",
-"0/3*41=0",
-"0/3*42=0",
-"0/3*43=0",
-"0/3*44=0",
-"0/3*45=0",
-"0/3*46=0",
-"0/3*47=0",
-"0/3*48=0",
-"0/3*49=0",
-"0/3*50=0",
-"0/3*51=0",
-"0/3*52=0",
-"0/3*53=0",
-"0/3*54=0",
-"0/3*55=0",
-"0/3*56=0",
-"0/3*57=0",
-"0/3*58=0",
-"0/3*59=0",
-"0/3*60=0",
-"0/3*61=0",
-"0/3*62=0",
-"0/3*63=0",
-"0/3*64=0",
-"0/3*65=0",
-"0/3*66=0",
-"0/3*67=0",
-"0/3*68=0",
-"0/3*69=0",
-"0/3*70=0",
-"0/3*71=0",
-"0/3*72=0",
-"0/3*73=0",
-"0/3*74=0",
-"0/3*75=0",
-"0/3*76=0",
-"0/3*77=0",
-"0/3*78=0",
-"0/3*79=0",
-"0/3*80=0",
-"0/3*81=0",
-"0/3*82=0",
-"0/3*83=0",
-"0/3*84=0",
-"0/3*85=0",
-"0/3*86=0",
-"0/3*87=0",
-"0/3*88=0",
-"0/3*89=0",
-"0/3*90=0",
-"0/3*91=0",
-"0/3*92=0",
-"0/3*93=0",
-"0/3*94=0",
-"0/3*95=0",
-"0/3*96=0",
-"0/3*97=0",
-"0/3*98=0",
-"0/3*99=0",
-"0/3/10=0",
-"0/3/11=0",
-"0/3/12=0",
-"0/3/13=0",
-"0/3/14=0",
-"0/3/15=0",
-"0/3/16=0",
-"0/3/17=0",
-"0/3/18=0",
-"0/3/19=0",
-"0/3/20=0",
-"0/3/21=0",
-"0/3/22=0",
-"0/3/23=0",
-"0/3/24=0",
-"0/3/25=0",
-"0/3/26=0",
-"0/3/27=0",
-"0/3/28=0",
-"0/3/29=0",
-"0/3/30=0",
-"0/3/31=0",
-"0/3/32=0",
-"0/3/33=0",
-"0/3/34=0",
-"0/3/35=0",
-"0/3/36=0",
-"0/3/37=0",
-"0/3/38=0",
-"0/3/39=0",
-"0/3/40=0",
-"0/3/41=0",
-"0/3/42=0",
-"0/3/43=0",
-"0/3/44=0",
-"0/3/45=0",
-"0/3/46=0",
-"0/3/47=0",
-"0/3/48=0",
-"0/3/49=0",
-"0/3/50=0",
-"0/3/51=0",
-"0/3/52=0",
-"0/3/53=0",
-"0/3/54=0",
-"0/3/55=0",
-"0/3/56=0",
-"0/3/57=0",
-"0/3/58=0",
-"0/3/59=0",
-"0/3/60=0",
-"0/3/61=0",
-"0/3/62=0",
-"0/3/63=0",
-"0/3/64=0",
-"0/3/65=0",
-"0/3/66=0",
-"0/3/67=0",
-"0/3/68=0",
-"0/3/69=0",
-"0/3/70=0",
-"0/3/71=0",
-"0/3/72=0",
-"0/3/73=0",
-"0/3/74=0",
-"0/3/75=0",
-"0/3/76=0",
-"0/3/77=0",
-"0/3/78=0",
-"0/3/79=0",
-"0/3/80=0",
-"0/3/81=0",
-"0/3/82=0",
-"0/3/83=0",
-"0/3/84=0",
-"0/3/85=0",
-"0/3/86=0",
-"0/3/87=0",
-"0/3/88=0",
-"0/3/89=0",
-"0/3/90=0",
-"0/3/91=0",
-"0/3/92=0",
-"0/3/93=0",
-"0/3/94=0",
-"0/3/95=0",
-"0/3/96=0",
-"0/3/97=0",
-"0/3/98=0",
-"0/3/99=0",
-"0/4000=0",
-"0/4001=0",
-"0/4002=0",
-"0/4003=0",
-"0/4004=0",
-"0/4005=0",
-"0/4006=0",
-"0/4007=0",
-"0/4008=0",
-"0/4009=0",
-"0/4010=0",
-"0/4011=0",
-"0/4012=0",
-"0/4013=0",
-"0/4014=0",
-"0/4015=0",
-"0/4016=0",
-"0/4017=0",
-"0/4018=0",
-"0/4019=0",
-"0/4020=0",
-"0/4021=0",
-"0/4022=0",
-"0/4023=0",
-"0/4024=0",
-"0/4025=0",
-"0/4026=0",
-"0/4027=0",
-"0/4028=0",
-"0/4029=0",
-"0/4030=0",
-"0/4031=0",
-"0/4032=0",
-"0/4033=0",
-"0/4034=0",
-"0/4035=0",
-"0/4036=0",
-"0/4037=0",
-"0/4038=0",
-"0/4039=0",
-"0/4040=0",
-"0/4041=0",
-"0/4042=0",
-"0/4043=0",
-"0/4044=0",
-"0/4045=0",
-"0/4046=0",
-"0/4047=0",
-"0/4048=0",
-"0/4049=0",
-"0/4050=0",
-"0/4051=0",
-"0/4052=0",
-"0/4053=0",
-"0/4054=0",
-"0/4055=0",
-"0/4056=0",
-"0/4057=0",
-"0/4058=0",
-"0/4059=0",
-"0/4060=0",
-"0/4061=0",
-"0/4062=0",
-"0/4063=0",
-"0/4064=0",
-"0/4065=0",
-"0/4066=0",
-"0/4067=0",
-"0/4068=0",
-"0/4069=0",
-"0/4070=0",
-"0/4071=0",
-"0/4072=0",
-"0/4073=0",
-"0/4074=0",
-"0/4075=0",
-"0/4076=0",
-"0/4077=0",
-"0/4078=0",
-"0/4079=0",
-"0/4080=0",
-"0/4081=0",
-"0/4082=0",
-"0/4083=0",
-"0/4084=0",
-"0/4085=0",
-"0/4086=0",
-"0/4087=0",
-"0/4088=0",
-"0/4089=0",
-"0/4090=0",
-"0/4091=0",
-"0/4092=0",
-"0/4093=0",
-"0/4094=0",
-"0/4095=0",
-"0/4096=0",
-"0/4097=0",
-"0/4098=0",
-"0/4099=0",
-"0/40+0=0",
-"0/40+1=1",
-"0/40+2=2",
-"0/40+3=3",
-"0/40+4=4",
-"0/40+5=5",
-"0/40+6=6",
-"0/40+7=7",
-"0/40+8=8",
-"0/40+9=9",
-"0/40-0=0",
-"0/40*0=0",
-"0/40*1=0",
-"0/40*2=0",
-"0/40*3=0",
-"0/40*4=0",
-"0/40*5=0",
-"0/40*6=0",
-"0/40*7=0",
-"0/40*8=0",
-"0/40*9=0",
-"0/40/1=0",
-"0/40/2=0",
-"0/40/3=0",
-"0/40/4=0",
-"0/40/5=0",
-"0/40/6=0",
-"0/40/7=0",
-"0/40/8=0",
-"0/40/9=0",
-"0/4100=0",
-"0/4101=0",
-"0/4102=0",
-"0/4103=0",
-"0/4104=0",
-"0/4105=0",
-"0/4106=0",
-"0/4107=0",
-"0/4108=0",
-"0/4109=0",
-"0/4110=0",
-"0/4111=0",
-"0/4112=0",
-"0/4113=0",
-"0/4114=0",
-"0/4115=0",
-"0/4116=0",
-"0/4117=0",
-"0/4118=0",
-"0/4119=0",
-"0/4120=0",
-"0/4121=0",
-"0/4122=0",
-"0/4123=0",
-"0/4124=0",
-"0/4125=0",
-"0/4126=0",
-"0/4127=0",
-"0/4128=0",
-"0/4129=0",
-"0/4130=0",
-"0/4131=0",
-"0/4132=0",
-"0/4133=0",
-"0/4134=0",
-"0/4135=0",
-"0/4136=0",
-"0/4137=0",
-"0/4138=0",
-"0/4139=0",
-"0/4140=0",
-"0/4141=0",
-"0/4142=0",
-"0/4143=0",
-"0/4144=0",
-"0/4145=0",
-"0/4146=0",
-"0/4147=0",
-"0/4148=0",
-"0/4149=0",
-"0/4150=0",
-"0/4151=0",
-"0/4152=0",
-"0/4153=0",
-"0/4154=0",
-"0/4155=0",
-"0/4156=0",
-"0/4157=0",
-"0/4158=0",
-"0/4159=0",
-"0/4160=0",
-"0/4161=0",
-"0/4162=0",
-"0/4163=0",
-"0/4164=0",
-"0/4165=0",
-"0/4166=0",
-"0/4167=0",
-"0/4168=0",
-"0/4169=0",
-"0/4170=0",
-"0/4171=0",
-"0/4172=0",
-"0/4173=0",
-"0/4174=0",
-"0/4175=0",
-"0/4176=0",
-"0/4177=0",
-"0/4178=0",
-"0/4179=0",
-"0/4180=0",
-"0/4181=0",
-"0/4182=0",
-"0/4183=0",
-"0/4184=0",
-"0/4185=0",
-"0/4186=0",
-"0/4187=0",
-"0/4188=0",
-"0/4189=0",
-"0/4190=0",
-"0/4191=0",
-"0/4192=0",
-"0/4193=0",
-"0/4194=0",
-"0/4195=0",
-"0/4196=0",
-"0/4197=0",
-"0/4198=0",
-"0/4199=0",
-"0/41+0=0",
-"0/41+1=1",
-"0/41+2=2",
-"0/41+3=3",
-"0/41+4=4",
-"0/41+5=5",
-"0/41+6=6",
-"0/41+7=7",
-"0/41+8=8",
-"0/41+9=9",
-"0/41-0=0",
-"0/41*0=0",
-"0/41*1=0",
-"0/41*2=0",
-"0/41*3=0",
-"0/41*4=0",
-"0/41*5=0",
-"0/41*6=0",
-"0/41*7=0",
-"0/41*8=0",
-"0/41*9=0",
-"0/41/1=0",
-"0/41/2=0",
-"0/41/3=0",
-"0/41/4=0",
-"0/41/5=0",
-"0/41/6=0",
-"0/41/7=0",
-"0/41/8=0",
-"0/41/9=0",
-"0/4200=0",
-"0/4201=0",
-"0/4202=0",
-"0/4203=0",
-"0/4204=0",
-"0/4205=0",
-"0/4206=0",
-"0/4207=0",
-"0/4208=0",
-"0/4209=0",
-"0/4210=0",
-"0/4211=0",
-"0/4212=0",
-"0/4213=0",
-"0/4214=0",
-"0/4215=0",
-"0/4216=0",
-"0/4217=0",
-"0/4218=0",
-"0/4219=0",
-"0/4220=0",
-"0/4221=0",
-"0/4222=0",
-"0/4223=0",
-"0/4224=0",
-"0/4225=0",
-"0/4226=0",
-"0/4227=0",
-"0/4228=0",
-"0/4229=0",
-"0/4230=0",
-"0/4231=0",
-"0/4232=0",
-"0/4233=0",
-"0/4234=0",
-"0/4235=0",
-"0/4236=0",
-"0/4237=0",
-"0/4238=0",
-"0/4239=0",
-"0/4240=0",
-"0/4241=0",
-"0/4242=0",
-"0/4243=0",
-"0/4244=0",
-"0/4245=0",
-"0/4246=0",
-"0/4247=0",
-"0/4248=0",
-"0/4249=0",
-"0/4250=0",
-"0/4251=0",
-"0/4252=0",
-"0/4253=0",
-"0/4254=0",
-"0/4255=0",
-"0/4256=0",
-"0/4257=0",
-"0/4258=0",
-"0/4259=0",
-"0/4260=0",
-"0/4261=0",
-"0/4262=0",
-"0/4263=0",
-"0/4264=0",
-"0/4265=0",
-"0/4266=0",
-"0/4267=0",
-"0/4268=0",
-"0/4269=0",
-"0/4270=0",
-"0/4271=0",
-"0/4272=0",
-"0/4273=0",
-"0/4274=0",
-"0/4275=0",
-"0/4276=0",
-"0/4277=0",
-"0/4278=0",
-"0/4279=0",
-"0/4280=0",
-"0/4281=0",
-"0/4282=0",
-"0/4283=0",
-"0/4284=0",
-"0/4285=0",
-"0/4286=0",
-"0/4287=0",
-"0/4288=0",
-"0/4289=0",
-"0/4290=0",
-"0/4291=0",
-"0/4292=0",
-"0/4293=0",
-"0/4294=0",
-"0/4295=0",
-"0/4296=0",
-"0/4297=0",
-"0/4298=0",
-"0/4299=0",
-"0/42+0=0",
-"0/42+1=1",
-"0/42+2=2",
-"0/42+3=3",
-"0/42+4=4",
-"0/42+5=5",
-"0/42+6=6",
-"0/42+7=7",
-"0/42+8=8",
-"0/42+9=9",
-"0/42-0=0",
-"0/42*0=0",
-"0/42*1=0",
-"0/42*2=0",
-"0/42*3=0",
-"0/42*4=0",
-"0/42*5=0",
-"0/42*6=0",
-"0/42*7=0",
-"0/42*8=0",
-"0/42*9=0",
-"0/42/1=0",
-"0/42/2=0",
-"0/42/3=0",
-"0/42/4=0",
-"0/42/5=0",
-"0/42/6=0",
-"0/42/7=0",
-"0/42/8=0",
-"0/42/9=0",
-"0/4300=0",
-"0/4301=0",
-"0/4302=0",
-"0/4303=0",
-"0/4304=0",
-"0/4305=0",
-"0/4306=0",
-"0/4307=0",
-"0/4308=0",
-"0/4309=0",
-"0/4310=0",
-"0/4311=0",
-"0/4312=0",
-"0/4313=0",
-"0/4314=0",
-"0/4315=0",
-"0/4316=0",
-"0/4317=0",
-"0/4318=0",
-"0/4319=0",
-"0/4320=0",
-"0/4321=0",
-"0/4322=0",
-"0/4323=0",
-"0/4324=0",
-"0/4325=0",
-"0/4326=0",
-"0/4327=0",
-"0/4328=0",
-"0/4329=0",
-"0/4330=0",
-"0/4331=0",
-"0/4332=0",
-"0/4333=0",
-"0/4334=0",
-"0/4335=0",
-"0/4336=0",
-"0/4337=0",
-"0/4338=0",
-"0/4339=0",
-"0/4340=0",
-"0/4341=0",
-"0/4342=0",
-"0/4343=0",
-"0/4344=0",
-"0/4345=0",
-"0/4346=0",
-"0/4347=0",
-"0/4348=0",
-"0/4349=0",
-"0/4350=0",
-"0/4351=0",
-"0/4352=0",
-"0/4353=0",
-"0/4354=0",
-"0/4355=0",
-"0/4356=0",
-"0/4357=0",
-"0/4358=0",
-"0/4359=0",
-"0/4360=0",
-"0/4361=0",
-"0/4362=0",
-"0/4363=0",
-"0/4364=0",
-"0/4365=0",
-"0/4366=0",
-"0/4367=0",
-"0/4368=0",
-"0/4369=0",
-"0/4370=0",
-"0/4371=0",
-"0/4372=0",
-"0/4373=0",
-"0/4374=0",
-"0/4375=0",
-"0/4376=0",
-"0/4377=0",
-"0/4378=0",
-"0/4379=0",
-"0/4380=0",
-"0/4381=0",
-"0/4382=0",
-"0/4383=0",
-"0/4384=0",
-"0/4385=0",
-"0/4386=0",
-"0/4387=0",
-"0/4388=0",
-"0/4389=0",
-"0/4390=0",
-"0/4391=0",
-"0/4392=0",
-"0/4393=0",
-"0/4394=0",
-"0/4395=0",
-"0/4396=0",
-"0/4397=0",
-"0/4398=0",
-"0/4399=0",
-"0/43+0=0",
-"0/43+1=1",
-"0/43+2=2",
-"0/43+3=3",
-"0/43+4=4",
-"0/43+5=5",
-"0/43+6=6",
-"0/43+7=7",
-"0/43+8=8",
-"0/43+9=9",
-"0/43-0=0",
-"0/43*0=0",
-"0/43*1=0",
-"0/43*2=0",
-"0/43*3=0",
-"0/43*4=0",
-"0/43*5=0",
-"0/43*6=0",
-"0/43*7=0",
-"0/43*8=0",
-"0/43*9=0",
-"0/43/1=0",
-"0/43/2=0",
-"0/43/3=0",
-"0/43/4=0",
-"0/43/5=0",
-"0/43/6=0",
-"0/43/7=0",
-"0/43/8=0",
-"0/43/9=0",
-"0/4400=0",
-"0/4401=0",
-"0/4402=0",
-"0/4403=0",
-"0/4404=0",
-"0/4405=0",
-"0/4406=0",
-"0/4407=0",
-"0/4408=0",
-"0/4409=0",
-"0/4410=0",
-"0/4411=0",
-"0/4412=0",
-"0/4413=0",
-"0/4414=0",
-"0/4415=0",
-"0/4416=0",
-"0/4417=0",
-"0/4418=0",
-"0/4419=0",
-"0/4420=0",
-"0/4421=0",
-"0/4422=0",
-"0/4423=0",
-"0/4424=0",
-"0/4425=0",
-"0/4426=0",
-"0/4427=0",
-"0/4428=0",
-"0/4429=0",
-"0/4430=0",
-"0/4431=0",
-"0/4432=0",
-"0/4433=0",
-"0/4434=0",
-"0/4435=0",
-"0/4436=0",
-"0/4437=0",
-"0/4438=0",
-"0/4439=0",
-"0/4440=0",
-"0/4441=0",
-"0/4442=0",
-"0/4443=0",
-"0/4444=0",
-"0/4445=0",
-"0/4446=0",
-"0/4447=0",
-"0/4448=0",
-"0/4449=0",
-"0/4450=0",
-"0/4451=0",
-"0/4452=0",
-"0/4453=0",
-"0/4454=0",
-"0/4455=0",
-"0/4456=0",
-"0/4457=0",
-"0/4458=0",
-"0/4459=0",
-"0/4460=0",
-"0/4461=0",
-"0/4462=0",
-"0/4463=0",
-"0/4464=0",
-"0/4465=0",
-"0/4466=0",
-"0/4467=0",
-"0/4468=0",
-"0/4469=0",
-"0/4470=0",
-"0/4471=0",
-"0/4472=0",
-"0/4473=0",
-"0/4474=0",
-"0/4475=0",
-"0/4476=0",
-"0/4477=0",
-"0/4478=0",
-"0/4479=0",
-"0/4480=0",
-"0/4481=0",
-"0/4482=0",
-"0/4483=0",
-"0/4484=0",
-"0/4485=0",
-"0/4486=0",
-"0/4487=0",
-"0/4488=0",
-"0/4489=0",
-"0/4490=0",
-"0/4491=0",
-"0/4492=0",
-"0/4493=0",
-"0/4494=0",
-"0/4495=0",
-"0/4496=0",
-"0/4497=0",
-"0/4498=0",
-"0/4499=0",
-"0/44+0=0",
-"0/44+1=1",
-"0/44+2=2",
-"0/44+3=3",
-"0/44+4=4",
-"0/44+5=5",
-"0/44+6=6",
-"0/44+7=7",
-"0/44+8=8",
-"0/44+9=9",
-"0/44-0=0",
-"0/44*0=0",
-"0/44*1=0",
-"0/44*2=0",
-"0/44*3=0",
-"0/44*4=0",
-"0/44*5=0",
-"0/44*6=0",
-"0/44*7=0",
-"0/44*8=0",
-"0/44*9=0",
-"0/44/1=0",
-"0/44/2=0",
-"0/44/3=0",
-"0/44/4=0",
-"0/44/5=0",
-"0/44/6=0",
-"0/44/7=0",
-"0/44/8=0",
-"0/44/9=0",
-"0/4500=0",
-"0/4501=0",
-"0/4502=0",
-"0/4503=0",
-"0/4504=0",
-"0/4505=0",
-"0/4506=0",
-"0/4507=0",
-"0/4508=0",
-"0/4509=0",
-"0/4510=0",
-"0/4511=0",
-"0/4512=0",
-"0/4513=0",
-"0/4514=0",
-"0/4515=0",
-"0/4516=0",
-"0/4517=0",
-"0/4518=0",
-"0/4519=0",
-"0/4520=0",
-"0/4521=0",
-"0/4522=0",
-"0/4523=0",
-"0/4524=0",
-"0/4525=0",
-"0/4526=0",
-"0/4527=0",
-"0/4528=0",
-"0/4529=0",
-"0/4530=0",
-"0/4531=0",
-"0/4532=0",
-"0/4533=0",
-"0/4534=0",
-"0/4535=0",
-"0/4536=0",
-"0/4537=0",
-"0/4538=0",
-"0/4539=0",
-"0/4540=0",
-"0/4541=0",
-"0/4542=0",
-"0/4543=0",
-"0/4544=0",
-"0/4545=0",
-"0/4546=0",
-"0/4547=0",
-"0/4548=0",
-"0/4549=0",
-"0/4550=0",
-"0/4551=0",
-"0/4552=0",
-"0/4553=0",
-"0/4554=0",
-"0/4555=0",
-"0/4556=0",
-"0/4557=0",
-"0/4558=0",
-"0/4559=0",
-"0/4560=0",
-"0/4561=0",
-"0/4562=0",
-"0/4563=0",
-"0/4564=0",
-"0/4565=0",
-"0/4566=0",
-"0/4567=0",
-"0/4568=0",
-"0/4569=0",
-"0/4570=0",
-"0/4571=0",
-"0/4572=0",
-"0/4573=0",
-"0/4574=0",
-"0/4575=0",
-"0/4576=0",
-"0/4577=0",
-"0/4578=0",
-"0/4579=0",
-"0/4580=0",
-"0/4581=0",
-"0/4582=0",
-"0/4583=0",
-"0/4584=0",
-"0/4585=0",
-"0/4586=0",
-"0/4587=0",
-"0/4588=0",
-"0/4589=0",
-"0/4590=0",
-"0/4591=0",
-"0/4592=0",
-"0/4593=0",
-"0/4594=0",
-"0/4595=0",
-"0/4596=0",
-"0/4597=0",
-"0/4598=0",
-"0/4599=0",
-"0/45+0=0",
-"0/45+1=1",
-"0/45+2=2",
-"0/45+3=3",
-"0/45+4=4",
-"0/45+5=5",
-"0/45+6=6",
-"0/45+7=7",
-"0/45+8=8",
-"0/45+9=9",
-"0/45-0=0",
-"0/45*0=0",
-"0/45*1=0",
-"0/45*2=0",
-"0/45*3=0",
-"0/45*4=0",
-"0/45*5=0",
-"0/45*6=0",
-"0/45*7=0",
-"0/45*8=0",
-"0/45*9=0",
-"0/45/1=0",
-"0/45/2=0",
-"0/45/3=0",
-"0/45/4=0",
-"0/45/5=0",
-"0/45/6=0",
-"0/45/7=0",
-"0/45/8=0",
-"0/45/9=0",
-"0/4600=0",
-"0/4601=0",
-"0/4602=0",
-"0/4603=0",
-"0/4604=0",
-"0/4605=0",
-"0/4606=0",
-"0/4607=0",
-"0/4608=0",
-"0/4609=0",
-"0/4610=0",
-"0/4611=0",
-"0/4612=0",
-"0/4613=0",
-"0/4614=0",
-"0/4615=0",
-"0/4616=0",
-"0/4617=0",
-"0/4618=0",
-"0/4619=0",
-"0/4620=0",
-"0/4621=0",
-"0/4622=0",
-"0/4623=0",
-"0/4624=0",
-"0/4625=0",
-"0/4626=0",
-"0/4627=0",
-"0/4628=0",
-"0/4629=0",
-"0/4630=0",
-"0/4631=0",
-"0/4632=0",
-"0/4633=0",
-"0/4634=0",
-"0/4635=0",
-"0/4636=0",
-"0/4637=0",
-"0/4638=0",
-"0/4639=0",
-"0/4640=0",
-"0/4641=0",
-"0/4642=0",
-"0/4643=0",
-"0/4644=0",
-"0/4645=0",
-"0/4646=0",
-"0/4647=0",
-"0/4648=0",
-"0/4649=0",
-"0/4650=0",
-"0/4651=0",
-"0/4652=0",
-"0/4653=0",
-"0/4654=0",
-"0/4655=0",
-"0/4656=0",
-"0/4657=0",
-"0/4658=0",
-"0/4659=0",
-"0/4660=0",
-"0/4661=0",
-"0/4662=0",
-"0/4663=0",
-"0/4664=0",
-"0/4665=0",
-"0/4666=0",
-"0/4667=0",
-"0/4668=0",
-"0/4669=0",
-"0/4670=0",
-"0/4671=0",
-"0/4672=0",
-"0/4673=0",
-"0/4674=0",
-"0/4675=0",
-"0/4676=0",
-"0/4677=0",
-"0/4678=0",
-"0/4679=0",
-"0/4680=0",
-"0/4681=0",
-"0/4682=0",
-"0/4683=0",
-"0/4684=0",
-"0/4685=0",
-"0/4686=0",
-"0/4687=0",
-"0/4688=0",
-"0/4689=0",
-"0/4690=0",
-"0/4691=0",
-"0/4692=0",
-"0/4693=0",
-"0/4694=0",
-"0/4695=0",
-"0/4696=0",
-"0/4697=0",
-"0/4698=0",
-"0/4699=0",
-"0/46+0=0",
-"0/46+1=1",
-"0/46+2=2",
-"0/46+3=3",
-"0/46+4=4",
-"0/46+5=5",
-"0/46+6=6",
-"0/46+7=7",
-"0/46+8=8",
-"0/46+9=9",
-"0/46-0=0",
-"0/46*0=0",
-"0/46*1=0",
-"0/46*2=0",
-"0/46*3=0",
-"0/46*4=0",
-"0/46*5=0",
-"0/46*6=0",
-"0/46*7=0",
-"0/46*8=0",
-"0/46*9=0",
-"0/46/1=0",
-"0/46/2=0",
-"0/46/3=0",
-"0/46/4=0",
-"0/46/5=0",
-"0/46/6=0",
-"0/46/7=0",
-"0/46/8=0",
-"0/46/9=0",
-"0/4700=0",
-"0/4701=0",
-"0/4702=0",
-"0/4703=0",
-"0/4704=0",
-"0/4705=0",
-"0/4706=0",
-"0/4707=0",
-"0/4708=0",
-"0/4709=0",
-"0/4710=0",
-"0/4711=0",
-"0/4712=0",
-"0/4713=0",
-"0/4714=0",
-"0/4715=0",
-"0/4716=0",
-"0/4717=0",
-"0/4718=0",
-"0/4719=0",
-"0/4720=0",
-"0/4721=0",
-"0/4722=0",
-"0/4723=0",
-"0/4724=0",
-"0/4725=0",
-"0/4726=0",
-"0/4727=0",
-"0/4728=0",
-"0/4729=0",
-"0/4730=0",
-"0/4731=0",
-"0/4732=0",
-"0/4733=0",
-"0/4734=0",
-"0/4735=0",
-"0/4736=0",
-"0/4737=0",
-"0/4738=0",
-"0/4739=0",
-"0/4740=0",
-"0/4741=0",
-"0/4742=0",
-"0/4743=0",
-"0/4744=0",
-"0/4745=0",
-"0/4746=0",
-"0/4747=0",
-"0/4748=0",
-"0/4749=0",
-"0/4750=0",
-"0/4751=0",
-"0/4752=0",
-"0/4753=0",
-"0/4754=0",
-"0/4755=0",
-"0/4756=0",
-"0/4757=0",
-"0/4758=0",
-"0/4759=0",
-"0/4760=0",
-"0/4761=0",
-"0/4762=0",
-"0/4763=0",
-"0/4764=0",
-"0/4765=0",
-"0/4766=0",
-"0/4767=0",
-"0/4768=0",
-"0/4769=0",
-"0/4770=0",
-"0/4771=0",
-"0/4772=0",
-"0/4773=0",
-"0/4774=0",
-"0/4775=0",
-"0/4776=0",
-"0/4777=0",
-"0/4778=0",
-"0/4779=0",
-"0/4780=0",
-"0/4781=0",
-"0/4782=0",
-"0/4783=0",
-"0/4784=0",
-"0/4785=0",
-"0/4786=0",
-"0/4787=0",
-"0/4788=0",
-"0/4789=0",
-"0/4790=0",
-"0/4791=0",
-"0/4792=0",
-"0/4793=0",
-"0/4794=0",
-"0/4795=0",
-"0/4796=0",
-"0/4797=0",
-"0/4798=0",
-"0/4799=0",
-"0/47+0=0",
-"0/47+1=1",
-"0/47+2=2",
-"0/47+3=3",
-"0/47+4=4",
-"0/47+5=5",
-"0/47+6=6",
-"0/47+7=7",
-"0/47+8=8",
-"0/47+9=9",
-"0/47-0=0",
-"0/47*0=0",
-"0/47*1=0",
-"0/47*2=0",
-"0/47*3=0",
-"0/47*4=0",
-"0/47*5=0",
-"0/47*6=0",
-"0/47*7=0",
-"0/47*8=0",
-"0/47*9=0",
-"0/47/1=0",
-"0/47/2=0",
-"0/47/3=0",
-"0/47/4=0",
-"0/47/5=0",
-"0/47/6=0",
-"0/47/7=0",
-"0/47/8=0",
-"0/47/9=0",
-"0/4800=0",
-"0/4801=0",
-"0/4802=0",
-"0/4803=0",
-"0/4804=0",
-"0/4805=0",
-"0/4806=0",
-"0/4807=0",
-"0/4808=0",
-"0/4809=0",
-"0/4810=0",
-"0/4811=0",
-"0/4812=0",
-"0/4813=0",
-"0/4814=0",
-"0/4815=0",
-"0/4816=0",
-"0/4817=0",
-"0/4818=0",
-"0/4819=0",
-"0/4820=0",
-"0/4821=0",
-"0/4822=0",
-"0/4823=0",
-"0/4824=0",
-"0/4825=0",
-"0/4826=0",
-"0/4827=0",
-"0/4828=0",
-"0/4829=0",
-"0/4830=0",
-"0/4831=0",
-"0/4832=0",
-"0/4833=0",
-"0/4834=0",
-"0/4835=0",
-"0/4836=0",
-"0/4837=0",
-"0/4838=0",
-"0/4839=0",
-"0/4840=0",
-"0/4841=0",
-"0/4842=0",
-"0/4843=0",
-"0/4844=0",
-"0/4845=0",
-"0/4846=0",
-"0/4847=0",
-"0/4848=0",
-"0/4849=0",
-"0/4850=0",
-"0/4851=0",
-"0/4852=0",
-"0/4853=0",
-"0/4854=0",
-"0/4855=0",
-"0/4856=0",
-"0/4857=0",
-"0/4858=0",
-"0/4859=0",
-"0/4860=0",
-"0/4861=0",
-"0/4862=0",
-"0/4863=0",
-"0/4864=0",
-"0/4865=0",
-"0/4866=0",
-"0/4867=0",
-"0/4868=0",
-"0/4869=0",
-"0/4870=0",
-"0/4871=0",
-"0/4872=0",
-"0/4873=0",
-"0/4874=0",
-"0/4875=0",
-"0/4876=0",
-"0/4877=0",
-"0/4878=0",
-"0/4879=0",
-"0/4880=0",
-"0/4881=0",
-"0/4882=0",
-"0/4883=0",
-"0/4884=0",
-"0/4885=0",
-"0/4886=0",
-"0/4887=0",
-"0/4888=0",
-"0/4889=0",
-"0/4890=0",
-"0/4891=0",
-"0/4892=0",
-"0/4893=0",
-"0/4894=0",
-"0/4895=0",
-"0/4896=0",
-"0/4897=0",
-"0/4898=0",
-"0/4899=0",
-"0/48+0=0",
-"0/48+1=1",
-"0/48+2=2",
-"0/48+3=3",
-"0/48+4=4",
-"0/48+5=5",
-"0/48+6=6",
-"0/48+7=7",
-"0/48+8=8",
-"0/48+9=9",
-"0/48-0=0",
-"0/48*0=0",
-"0/48*1=0",
-"0/48*2=0",
-"0/48*3=0",
-"0/48*4=0",
-"0/48*5=0",
-"0/48*6=0",
-"0/48*7=0",
-"0/48*8=0",
-"0/48*9=0",
-"0/48/1=0",
-"0/48/2=0",
-"0/48/3=0",
-"0/48/4=0",
-"0/48/5=0",
-"0/48/6=0",
-"0/48/7=0",
-"0/48/8=0",
-"0/48/9=0",
-"0/4900=0",
-"0/4901=0",
-"0/4902=0",
-"0/4903=0",
-"0/4904=0",
-"0/4905=0",
-"0/4906=0",
-"0/4907=0",
-"0/4908=0",
-"0/4909=0",
-"0/4910=0",
-"0/4911=0",
-"0/4912=0",
-"0/4913=0",
-"0/4914=0",
-"0/4915=0",
-"0/4916=0",
-"0/4917=0",
-"0/4918=0",
-"0/4919=0",
-"0/4920=0",
-"0/4921=0",
-"0/4922=0",
-"0/4923=0",
-"0/4924=0",
-"0/4925=0",
-"0/4926=0",
-"0/4927=0",
-"0/4928=0",
-"0/4929=0",
-"0/4930=0",
-"0/4931=0",
-"0/4932=0",
-"0/4933=0",
-"0/4934=0",
-"0/4935=0",
-"0/4936=0",
-"0/4937=0",
-"0/4938=0",
-"0/4939=0",
-"0/4940=0",
-"0/4941=0",
-"0/4942=0",
-"0/4943=0",
-"0/4944=0",
-"0/4945=0",
-"0/4946=0",
-"0/4947=0",
-"0/4948=0",
-"0/4949=0",
-"0/4950=0",
-"0/4951=0",
-"0/4952=0",
-"0/4953=0",
-"0/4954=0",
-"0/4955=0",
-"0/4956=0",
-"0/4957=0",
-"0/4958=0",
-"0/4959=0",
-"0/4960=0",
-"0/4961=0",
-"0/4962=0",
-"0/4963=0",
-"0/4964=0",
-"0/4965=0",
-"0/4966=0",
-"0/4967=0",
-"0/4968=0",
-"0/4969=0",
-"0/4970=0",
-"0/4971=0",
-"0/4972=0",
-"0/4973=0",
-"0/4974=0",
-"0/4975=0",
-"0/4976=0",
-"0/4977=0",
-"0/4978=0",
-"0/4979=0",
-"0/4980=0",
-"0/4981=0",
-"0/4982=0",
-"0/4983=0",
-"0/4984=0",
-"0/4985=0",
-"0/4986=0",
-"0/4987=0",
-"0/4988=0",
-"0/4989=0",
-"0/4990=0",
-"0/4991=0",
-"0/4992=0",
-"0/4993=0",
-"0/4994=0",
-"0/4995=0",
-"0/4996=0",
-"0/4997=0",
-"0/4998=0",
-"0/4999=0",
-"0/49+0=0",
-"0/49+1=1",
-"0/49+2=2",
-"0/49+3=3",
-"0/49+4=4",
-"0/49+5=5",
-"0/49+6=6",
-"0/49+7=7",
-"0/49+8=8",
-"0/49+9=9",
-"0/49-0=0",
-"0/49*0=0",
-"0/49*1=0",
-"0/49*2=0",
-"0/49*3=0",
-"0/49*4=0",
-"0/49*5=0",
-"0/49*6=0",
-"0/49*7=0",
-"0/49*8=0",
-"0/49*9=0",
-"0/49/1=0",
-"0/49/2=0",
-"0/49/3=0",
-"0/49/4=0",
-"0/49/5=0",
-"0/49/6=0",
-"0/49/7=0",
-"0/49/8=0",
-"0/49/9=0",
-"0/4-1=-1",
-"0/4-2=-2",
-"0/4-3=-3",
-"0/4-4=-4",
-"0/4-5=-5",
-"0/4-6=-6",
-"0/4-7=-7",
-"0/4-8=-8",
-"0/4-9=-9",
-"0/4*10=0",
-"0/4*11=0",
-"0/4*12=0",
-"0/4*13=0",
-"0/4*14=0",
-"0/4*15=0",
-"0/4*16=0",
-"0/4*17=0",
-"0/4*18=0",
-"0/4*19=0",
-"0/4*20=0",
-"0/4*21=0",
-"0/4*22=0",
-"0/4*23=0",
-"0/4*24=0",
-"0/4*25=0",
-"0/4*26=0",
-"0/4*27=0",
-"0/4*28=0",
-"0/4*29=0",
-"0/4*30=0",
-"0/4*31=0",
-"0/4*32=0",
-"0/4*33=0",
-"0/4*34=0",
-"0/4*35=0",
-"0/4*36=0",
-"0/4*37=0",
-"0/4*38=0",
-"0/4*39=0",
-"0/4*40=0",
-"0/4*41=0",
-"0/4*42=0",
-"0/4*43=0",
-"0/4*44=0",
-"0/4*45=0",
-"0/4*46=0",
-"0/4*47=0",
-"0/4*48=0",
-"0/4*49=0",
-"0/4*50=0",
-"0/4*51=0",
-"0/4*52=0",
-"0/4*53=0",
-"0/4*54=0",
-"0/4*55=0",
-"0/4*56=0",
-"0/4*57=0",
-"0/4*58=0",
-"0/4*59=0",
-"0/4*60=0",
-"0/4*61=0",
-"0/4*62=0",
-"0/4*63=0",
-"0/4*64=0",
-"0/4*65=0",
-"0/4*66=0",
-"0/4*67=0",
-"0/4*68=0",
-"0/4*69=0",
-"0/4*70=0",
-"0/4*71=0",
-"0/4*72=0",
-"0/4*73=0",
-"0/4*74=0",
-"0/4*75=0",
-"0/4*76=0",
-"0/4*77=0",
-"0/4*78=0",
-"0/4*79=0",
-"0/4*80=0",
-"0/4*81=0",
-"0/4*82=0",
-"0/4*83=0",
-"0/4*84=0",
-"0/4*85=0",
-"0/4*86=0",
-"0/4*87=0",
-"0/4*88=0",
-"0/4*89=0",
-"0/4*90=0",
-"0/4*91=0",
-"0/4*92=0",
-"0/4*93=0",
-"0/4*94=0",
-"0/4*95=0",
-"0/4*96=0",
-"0/4*97=0",
-"0/4*98=0",
-"0/4*99=0",
-"0/4/10=0",
-"0/4/11=0",
-"0/4/12=0",
-"0/4/13=0",
-"0/4/14=0",
-"0/4/15=0",
-"0/4/16=0",
-"0/4/17=0",
-"0/4/18=0",
-"0/4/19=0",
-"0/4/20=0",
-"0/4/21=0",
-"0/4/22=0",
-"0/4/23=0",
-"0/4/24=0",
-"0/4/25=0",
-"0/4/26=0",
-"0/4/27=0",
-"0/4/28=0",
-"0/4/29=0",
-"0/4/30=0",
-"0/4/31=0",
-"0/4/32=0",
-"0/4/33=0",
-"0/4/34=0",
-"0/4/35=0",
-"0/4/36=0",
-"0/4/37=0",
-"0/4/38=0",
-"0/4/39=0",
-"0/4/40=0",
-"0/4/41=0",
-"0/4/42=0",
-"0/4/43=0",
-"0/4/44=0",
-"0/4/45=0",
-"0/4/46=0",
-"0/4/47=0",
-"0/4/48=0",
-"0/4/49=0",
-"0/4/50=0",
-"0/4/51=0",
-"0/4/52=0",
-"0/4/53=0",
-"0/4/54=0",
-"0/4/55=0",
-"0/4/56=0",
-"0/4/57=0",
-"0/4/58=0",
-"0/4/59=0",
-"0/4/60=0",
-"0/4/61=0",
-"0/4/62=0",
-"0/4/63=0",
-"0/4/64=0",
-"0/4/65=0",
-"0/4/66=0",
-"0/4/67=0",
-"0/4/68=0",
-"0/4/69=0",
-"0/4/70=0",
-"0/4/71=0",
-"0/4/72=0",
-"0/4/73=0",
-"0/4/74=0",
-"0/4/75=0",
-"0/4/76=0",
-"0/4/77=0",
-"0/4/78=0",
-"0/4/79=0",
-"0/4/80=0",
-"0/4/81=0",
-"0/4/82=0",
-"0/4/83=0",
-"0/4/84=0",
-"0/4/85=0",
-"0/4/86=0",
-"0/4/87=0",
-"0/4/88=0",
-"0/4/89=0",
-"0/4/90=0",
-"0/4/91=0",
-"0/4/92=0",
-"0/4/93=0",
-"0/4/94=0",
-"0/4/95=0",
-"0/4/96=0",
-"0/4/97=0",
-"0/4/98=0",
-"0/4/99=0",
-"0/5000=0",
-"0/5001=0",
-"0/5002=0",
-"0/5003=0",
-"0/5004=0",
-"0/5005=0",
-"0/5006=0",
-"0/5007=0",
-"0/5008=0",
-"0/5009=0",
-"0/5010=0",
-"0/5011=0",
-"0/5012=0",
-"0/5013=0",
-"0/5014=0",
-"0/5015=0",
-"0/5016=0",
-"0/5017=0",
-"0/5018=0",
-"0/5019=0",
-"0/5020=0",
-"0/5021=0",
-"0/5022=0",
-"0/5023=0",
-"0/5024=0",
-"0/5025=0",
-"0/5026=0",
-"0/5027=0",
-"0/5028=0",
-"0/5029=0",
-"0/5030=0",
-"0/5031=0",
-"0/5032=0",
-"0/5033=0",
-"0/5034=0",
-"0/5035=0",
-"0/5036=0",
-"0/5037=0",
-"0/5038=0",
-"0/5039=0",
-"0/5040=0",
-"0/5041=0",
-"0/5042=0",
-"0/5043=0",
-"0/5044=0",
-"0/5045=0",
-"0/5046=0",
-"0/5047=0",
-"0/5048=0",
-"0/5049=0",
-"0/5050=0",
-"0/5051=0",
-"0/5052=0",
-"0/5053=0",
-"0/5054=0",
-"0/5055=0",
-"0/5056=0",
-"0/5057=0",
-"0/5058=0",
-"0/5059=0",
-"0/5060=0",
-"0/5061=0",
-"0/5062=0",
-"0/5063=0",
-"0/5064=0",
-"0/5065=0",
-"0/5066=0",
-"0/5067=0",
-"0/5068=0",
-"0/5069=0",
-"0/5070=0",
-"0/5071=0",
-"0/5072=0",
-"0/5073=0",
-"0/5074=0",
-"0/5075=0",
-"0/5076=0",
-"0/5077=0",
-"0/5078=0",
-"0/5079=0",
-"0/5080=0",
-"0/5081=0",
-"0/5082=0",
-"0/5083=0",
-"0/5084=0",
-"0/5085=0",
-"0/5086=0",
-"0/5087=0",
-"0/5088=0",
-"0/5089=0",
-"0/5090=0",
-"0/5091=0",
-"0/5092=0",
-"0/5093=0",
-"0/5094=0",
-"0/5095=0",
-"0/5096=0",
-"0/5097=0",
-"0/5098=0",
-"0/5099=0",
-"0/50+0=0",
-"0/50+1=1",
-"0/50+2=2",
-"0/50+3=3",
-"0/50+4=4",
-"0/50+5=5",
-"0/50+6=6",
-"0/50+7=7",
-"0/50+8=8",
-"0/50+9=9",
-"0/50-0=0",
-"0/50*0=0",
-"0/50*1=0",
-"0/50*2=0",
-"0/50*3=0",
-"0/50*4=0",
-"0/50*5=0",
-"0/50*6=0",
-"0/50*7=0",
-"0/50*8=0",
-"0/50*9=0",
-"0/50/1=0",
-"0/50/2=0",
-"0/50/3=0",
-"0/50/4=0",
-"0/50/5=0",
-"0/50/6=0",
-"0/50/7=0",
-"0/50/8=0",
-"0/50/9=0",
-"0/5100=0",
-"0/5101=0",
-"0/5102=0",
-"0/5103=0",
-"0/5104=0",
-"0/5105=0",
-"0/5106=0",
-"0/5107=0",
-"0/5108=0",
-"0/5109=0",
-"0/5110=0",
-"0/5111=0",
-"0/5112=0",
-"0/5113=0",
-"0/5114=0",
-"0/5115=0",
-"0/5116=0",
-"0/5117=0",
-"0/5118=0",
-"0/5119=0",
-"0/5120=0",
-"0/5121=0",
-"0/5122=0",
-"0/5123=0",
-"0/5124=0",
-"0/5125=0",
-"0/5126=0",
-"0/5127=0",
-"0/5128=0",
-"0/5129=0",
-"0/5130=0",
-"0/5131=0",
-"0/5132=0",
-"0/5133=0",
-"0/5134=0",
-"0/5135=0",
-"0/5136=0",
-"0/5137=0",
-"0/5138=0",
-"0/5139=0",
-"0/5140=0",
-"0/5141=0",
-"0/5142=0",
-"0/5143=0",
-"0/5144=0",
-"0/5145=0",
-"0/5146=0",
-"0/5147=0",
-"0/5148=0",
-"0/5149=0",
-"0/5150=0",
-"0/5151=0",
-"0/5152=0",
-"0/5153=0",
-"0/5154=0",
-"0/5155=0",
-"0/5156=0",
-"0/5157=0",
-"0/5158=0",
-"0/5159=0",
-"0/5160=0",
-"0/5161=0",
-"0/5162=0",
-"0/5163=0",
-"0/5164=0",
-"0/5165=0",
-"0/5166=0",
-"0/5167=0",
-"0/5168=0",
-"0/5169=0",
-"0/5170=0",
-"0/5171=0",
-"0/5172=0",
-"0/5173=0",
-"0/5174=0",
-"0/5175=0",
-"0/5176=0",
-"0/5177=0",
-"0/5178=0",
-"0/5179=0",
-"0/5180=0",
-"0/5181=0",
-"0/5182=0",
-"0/5183=0",
-"0/5184=0",
-"0/5185=0",
-"0/5186=0",
-"0/5187=0",
-"0/5188=0",
-"0/5189=0",
-"0/5190=0",
-"0/5191=0",
-"0/5192=0",
-"0/5193=0",
-"0/5194=0",
-"0/5195=0",
-"0/5196=0",
-"0/5197=0",
-"0/5198=0",
-"0/5199=0",
-"0/51+0=0",
-"0/51+1=1",
-"0/51+2=2",
-"0/51+3=3",
-"0/51+4=4",
-"0/51+5=5",
-"0/51+6=6",
-"0/51+7=7",
-"0/51+8=8",
-"0/51+9=9",
-"0/51-0=0",
-"0/51*0=0",
-"0/51*1=0",
-"0/51*2=0",
-"0/51*3=0",
-"0/51*4=0",
-"0/51*5=0",
-"0/51*6=0",
-"0/51*7=0",
-"0/51*8=0",
-"0/51*9=0",
-"0/51/1=0",
-"0/51/2=0",
-"0/51/3=0",
-"0/51/4=0",
-"0/51/5=0",
-"0/51/6=0",
-"0/51/7=0",
-"0/51/8=0",
-"0/51/9=0",
-"0/5200=0",
-"0/5201=0",
-"0/5202=0",
-"0/5203=0",
-"0/5204=0",
-"0/5205=0",
-"0/5206=0",
-"0/5207=0",
-"0/5208=0",
-"0/5209=0",
-"0/5210=0",
-"0/5211=0",
-"0/5212=0",
-"0/5213=0",
-"0/5214=0",
-"0/5215=0",
-"0/5216=0",
-"0/5217=0",
-"0/5218=0",
-"0/5219=0",
-"0/5220=0",
-"0/5221=0",
-"0/5222=0",
-"0/5223=0",
-"0/5224=0",
-"0/5225=0",
-"0/5226=0",
-"0/5227=0",
-"0/5228=0",
-"0/5229=0",
-"0/5230=0",
-"0/5231=0",
-"0/5232=0",
-"0/5233=0",
-"0/5234=0",
-"0/5235=0",
-"0/5236=0",
-"0/5237=0",
-"0/5238=0",
-"0/5239=0",
-"0/5240=0",
-"0/5241=0",
-"0/5242=0",
-"0/5243=0",
-"0/5244=0",
-"0/5245=0",
-"0/5246=0",
-"0/5247=0",
-"0/5248=0",
-"0/5249=0",
-"0/5250=0",
-"0/5251=0",
-"0/5252=0",
-"0/5253=0",
-"0/5254=0",
-"0/5255=0",
-"0/5256=0",
-"0/5257=0",
-"0/5258=0",
-"0/5259=0",
-"0/5260=0",
-"0/5261=0",
-"0/5262=0",
-"0/5263=0",
-"0/5264=0",
-"0/5265=0",
-"0/5266=0",
-"0/5267=0",
-"0/5268=0",
-"0/5269=0",
-"0/5270=0",
-"0/5271=0",
-"0/5272=0",
-"0/5273=0",
-"0/5274=0",
-"0/5275=0",
-"0/5276=0",
-"0/5277=0",
-"0/5278=0",
-"0/5279=0",
-"0/5280=0",
-"0/5281=0",
-"0/5282=0",
-"0/5283=0",
-"0/5284=0",
-"0/5285=0",
-"0/5286=0",
-"0/5287=0",
-"0/5288=0",
-"0/5289=0",
-"0/5290=0",
-"0/5291=0",
-"0/5292=0",
-"0/5293=0",
-"0/5294=0",
-"0/5295=0",
-"0/5296=0",
-"0/5297=0",
-"0/5298=0",
-"0/5299=0",
-"0/52+0=0",
-"0/52+1=1",
-"0/52+2=2",
-"0/52+3=3",
-"0/52+4=4",
-"0/52+5=5",
-"0/52+6=6",
-"0/52+7=7",
-"0/52+8=8",
-"0/52+9=9",
-"0/52-0=0",
-"0/52*0=0",
-"0/52*1=0",
-"0/52*2=0",
-"0/52*3=0",
-"0/52*4=0",
-"0/52*5=0",
-"0/52*6=0",
-"0/52*7=0",
-"0/52*8=0",
-"0/52*9=0",
-"0/52/1=0",
-"0/52/2=0",
-"0/52/3=0",
-"0/52/4=0",
-"0/52/5=0",
-"0/52/6=0",
-"0/52/7=0",
-"0/52/8=0",
-"0/52/9=0",
-"0/5300=0",
-"0/5301=0",
-"0/5302=0",
-"0/5303=0",
-"0/5304=0",
-"0/5305=0",
-"0/5306=0",
-"0/5307=0",
-"0/5308=0",
-"0/5309=0",
-"0/5310=0",
-"0/5311=0",
-"0/5312=0",
-"0/5313=0",
-"0/5314=0",
-"0/5315=0",
-"0/5316=0",
-"0/5317=0",
-"0/5318=0",
-"0/5319=0",
-"0/5320=0",
-"0/5321=0",
-"0/5322=0",
-"0/5323=0",
-"0/5324=0",
-"0/5325=0",
-"0/5326=0",
-"0/5327=0",
-"0/5328=0",
-"0/5329=0",
-"0/5330=0",
-"0/5331=0",
-"0/5332=0",
-"0/5333=0",
-"0/5334=0",
-"0/5335=0",
-"0/5336=0",
-"0/5337=0",
-"0/5338=0",
-"0/5339=0",
-"0/5340=0",
-"0/5341=0",
-"0/5342=0",
-"0/5343=0",
-"0/5344=0",
-"0/5345=0",
-"0/5346=0",
-"0/5347=0",
-"0/5348=0",
-"0/5349=0",
-"0/5350=0",
-"0/5351=0",
-"0/5352=0",
-"0/5353=0",
-"0/5354=0",
-"0/5355=0",
-"0/5356=0",
-"0/5357=0",
-"0/5358=0",
-"0/5359=0",
-"0/5360=0",
-"0/5361=0",
-"0/5362=0",
-"0/5363=0",
-"0/5364=0",
-"0/5365=0",
-"0/5366=0",
-"0/5367=0",
-"0/5368=0",
-"0/5369=0",
-"0/5370=0",
-"0/5371=0",
-"0/5372=0",
-"0/5373=0",
-"0/5374=0",
-"0/5375=0",
-"0/5376=0",
-"0/5377=0",
-"0/5378=0",
-"0/5379=0",
-"0/5380=0",
-"0/5381=0",
-"0/5382=0",
-"0/5383=0",
-"0/5384=0",
-"0/5385=0",
-"0/5386=0",
-"0/5387=0",
-"0/5388=0",
-"0/5389=0",
-"0/5390=0",
-"0/5391=0",
-"0/5392=0",
-"0/5393=0",
-"0/5394=0",
-"0/5395=0",
-"0/5396=0",
-"0/5397=0",
-"0/5398=0",
-"0/5399=0",
-"0/53+0=0",
-"0/53+1=1",
-"0/53+2=2",
-"0/53+3=3",
-"0/53+4=4",
-"0/53+5=5",
-"0/53+6=6",
-"0/53+7=7",
-"0/53+8=8",
-"0/53+9=9",
-"0/53-0=0",
-"0/53*0=0",
-"0/53*1=0",
-"0/53*2=0",
-"0/53*3=0",
-"0/53*4=0",
-"0/53*5=0",
-"0/53*6=0",
-"0/53*7=0",
-"0/53*8=0",
-"0/53*9=0",
-"0/53/1=0",
-"0/53/2=0",
-"0/53/3=0",
-"0/53/4=0",
-"0/53/5=0",
-"0/53/6=0",
-"0/53/7=0",
-"0/53/8=0",
-"0/53/9=0",
-"0/5400=0",
-"0/5401=0",
-"0/5402=0",
-"0/5403=0",
-"0/5404=0",
-"0/5405=0",
-"0/5406=0",
-"0/5407=0",
-"0/5408=0",
-"0/5409=0",
-"0/5410=0",
-"0/5411=0",
-"0/5412=0",
-"0/5413=0",
-"0/5414=0",
-"0/5415=0",
-"0/5416=0",
-"0/5417=0",
-"0/5418=0",
-"0/5419=0",
-"0/5420=0",
-"0/5421=0",
-"0/5422=0",
-"0/5423=0",
-"0/5424=0",
-"0/5425=0",
-"0/5426=0",
-"0/5427=0",
-"0/5428=0",
-"0/5429=0",
-"0/5430=0",
-"0/5431=0",
-"0/5432=0",
-"0/5433=0",
-"0/5434=0",
-"0/5435=0",
-"0/5436=0",
-"0/5437=0",
-"0/5438=0",
-"0/5439=0",
-"0/5440=0",
-"0/5441=0",
-"0/5442=0",
-"0/5443=0",
-"0/5444=0",
-"0/5445=0",
-"0/5446=0",
-"0/5447=0",
-"0/5448=0",
-"0/5449=0",
-"0/5450=0",
-"0/5451=0",
-"0/5452=0",
-"0/5453=0",
-"0/5454=0",
-"0/5455=0",
-"0/5456=0",
-"0/5457=0",
-"0/5458=0",
-"0/5459=0",
-"0/5460=0",
-"0/5461=0",
-"0/5462=0",
-"0/5463=0",
-"0/5464=0",
-"0/5465=0",
-"0/5466=0",
-"0/5467=0",
-"0/5468=0",
-"0/5469=0",
-"0/5470=0",
-"0/5471=0",
-"0/5472=0",
-"0/5473=0",
-"0/5474=0",
-"0/5475=0",
-"0/5476=0",
-"0/5477=0",
-"0/5478=0",
-"0/5479=0",
-"0/5480=0",
-"0/5481=0",
-"0/5482=0",
-"0/5483=0",
-"0/5484=0",
-"0/5485=0",
-"0/5486=0",
-"0/5487=0",
-"0/5488=0",
-"0/5489=0",
-"0/5490=0",
-"0/5491=0",
-"0/5492=0",
-"0/5493=0",
-"0/5494=0",
-"0/5495=0",
-"0/5496=0",
-"0/5497=0",
-"0/5498=0",
-"0/5499=0",
-"0/54+0=0",
-"0/54+1=1",
-"0/54+2=2",
-"0/54+3=3",
-"0/54+4=4",
-"0/54+5=5",
-"0/54+6=6",
-"0/54+7=7",
-"0/54+8=8",
-"0/54+9=9",
-"0/54-0=0",
-"0/54*0=0",
-"0/54*1=0",
-"0/54*2=0",
-"0/54*3=0",
-"0/54*4=0",
-"0/54*5=0",
-"0/54*6=0",
-"0/54*7=0",
-"0/54*8=0",
-"0/54*9=0",
-"0/54/1=0",
-"0/54/2=0",
-"0/54/3=0",
-"0/54/4=0",
-"0/54/5=0",
-"0/54/6=0",
-"0/54/7=0",
-"0/54/8=0",
-"0/54/9=0",
-"0/5500=0",
-"0/5501=0",
-"0/5502=0",
-"0/5503=0",
-"0/5504=0",
-"0/5505=0",
-"0/5506=0",
-"0/5507=0",
-"0/5508=0",
-"0/5509=0",
-"0/5510=0",
-"0/5511=0",
-"0/5512=0",
-"0/5513=0",
-"0/5514=0",
-"0/5515=0",
-"0/5516=0",
-"0/5517=0",
-"0/5518=0",
-"0/5519=0",
-"0/5520=0",
-"0/5521=0",
-"0/5522=0",
-"0/5523=0",
-"0/5524=0",
-"0/5525=0",
-"0/5526=0",
-"0/5527=0",
-"0/5528=0",
-"0/5529=0",
-"0/5530=0",
-"0/5531=0",
-"0/5532=0",
-"0/5533=0",
-"0/5534=0",
-"0/5535=0",
-"0/5536=0",
-"0/5537=0",
-"0/5538=0",
-"0/5539=0",
-"0/5540=0",
-"0/5541=0",
-"0/5542=0",
-"0/5543=0",
-"0/5544=0",
-"0/5545=0",
-"0/5546=0",
-"0/5547=0",
-"0/5548=0",
-"0/5549=0",
-"0/5550=0",
-"0/5551=0",
-"0/5552=0",
-"0/5553=0",
-"0/5554=0",
-"0/5555=0",
-"0/5556=0",
-"0/5557=0",
-"0/5558=0",
-"0/5559=0",
-"0/5560=0",
-"0/5561=0",
-"0/5562=0",
-"0/5563=0",
-"0/5564=0",
-"0/5565=0",
-"0/5566=0",
-"0/5567=0",
-"0/5568=0",
-"0/5569=0",
-"0/5570=0",
-"0/5571=0",
-"0/5572=0",
-"0/5573=0",
-"0/5574=0",
-"0/5575=0",
-"0/5576=0",
-"0/5577=0",
-"0/5578=0",
-"0/5579=0",
-"0/5580=0",
-"0/5581=0",
-"0/5582=0",
-"0/5583=0",
-"0/5584=0",
-"0/5585=0",
-"0/5586=0",
-"0/5587=0",
-"0/5588=0",
-"0/5589=0",
-"0/5590=0",
-"0/5591=0",
-"0/5592=0",
-"0/5593=0",
-"0/5594=0",
-"0/5595=0",
-"0/5596=0",
-"0/5597=0",
-"0/5598=0",
-"0/5599=0",
-"0/55+0=0",
-"0/55+1=1",
-"0/55+2=2",
-"0/55+3=3",
-"0/55+4=4",
-"0/55+5=5",
-"0/55+6=6",
-"0/55+7=7",
-"0/55+8=8",
-"0/55+9=9",
-"0/55-0=0",
-"0/55*0=0",
-"0/55*1=0",
-"0/55*2=0",
-"0/55*3=0",
-"0/55*4=0",
-"0/55*5=0",
-"0/55*6=0",
-"0/55*7=0",
-"0/55*8=0",
-"0/55*9=0",
-"0/55/1=0",
-"0/55/2=0",
-"0/55/3=0",
-"0/55/4=0",
-"0/55/5=0",
-"0/55/6=0",
-"0/55/7=0",
-"0/55/8=0",
-"0/55/9=0",
-"0/5600=0",
-"0/5601=0",
-"0/5602=0",
-"0/5603=0",
-"0/5604=0",
-"0/5605=0",
-"0/5606=0",
-"0/5607=0",
-"0/5608=0",
-"0/5609=0",
-"0/5610=0",
-"0/5611=0",
-"0/5612=0",
-"0/5613=0",
-"0/5614=0",
-"0/5615=0",
-"0/5616=0",
-"0/5617=0",
-"0/5618=0",
-"0/5619=0",
-"0/5620=0",
-"0/5621=0",
-"0/5622=0",
-"0/5623=0",
-"0/5624=0",
-"0/5625=0",
-"0/5626=0",
-"0/5627=0",
-"0/5628=0",
-"0/5629=0",
-"0/5630=0",
-"0/5631=0",
-"0/5632=0",
-"0/5633=0",
-"0/5634=0",
-"0/5635=0",
-"0/5636=0",
-"0/5637=0",
-"0/5638=0",
-"0/5639=0",
-"0/5640=0",
-"0/5641=0",
-"0/5642=0",
-"0/5643=0",
-"0/5644=0",
-"0/5645=0",
-"0/5646=0",
-"0/5647=0",
-"0/5648=0",
-"0/5649=0",
-"0/5650=0",
-"0/5651=0",
-"0/5652=0",
-"0/5653=0",
-"0/5654=0",
-"0/5655=0",
-"0/5656=0",
-"0/5657=0",
-"0/5658=0",
-"0/5659=0",
-"0/5660=0",
-"0/5661=0",
-"0/5662=0",
-"0/5663=0",
-"0/5664=0",
-"0/5665=0",
-"0/5666=0",
-"0/5667=0",
-"0/5668=0",
-"0/5669=0",
-"0/5670=0",
-"0/5671=0",
-"0/5672=0",
-"0/5673=0",
-"0/5674=0",
-"0/5675=0",
-"0/5676=0",
-"0/5677=0",
-"0/5678=0",
-"0/5679=0",
-"0/5680=0",
-"0/5681=0",
-"0/5682=0",
-"0/5683=0",
-"0/5684=0",
-"0/5685=0",
-"0/5686=0",
-"0/5687=0",
-"0/5688=0",
-"0/5689=0",
-"0/5690=0",
-"0/5691=0",
-"0/5692=0",
-"0/5693=0",
-"0/5694=0",
-"0/5695=0",
-"0/5696=0",
-"0/5697=0",
-"0/5698=0",
-"0/5699=0",
-"0/56+0=0",
-"0/56+1=1",
-"0/56+2=2",
-"0/56+3=3",
-"0/56+4=4",
-"0/56+5=5",
-"0/56+6=6",
-"0/56+7=7",
-"0/56+8=8",
-"0/56+9=9",
-"0/56-0=0",
-"0/56*0=0",
-"0/56*1=0",
-"0/56*2=0",
-"0/56*3=0",
-"0/56*4=0",
-"0/56*5=0",
-"0/56*6=0",
-"0/56*7=0",
-"0/56*8=0",
-"0/56*9=0",
-"0/56/1=0",
-"0/56/2=0",
-"0/56/3=0",
-"0/56/4=0",
-"0/56/5=0",
-"0/56/6=0",
-"0/56/7=0",
-"0/56/8=0",
-"0/56/9=0",
-"0/5700=0",
-"0/5701=0",
-"0/5702=0",
-"0/5703=0",
-"0/5704=0",
-"0/5705=0",
-"0/5706=0",
-"0/5707=0",
-"0/5708=0",
-"0/5709=0",
-"0/5710=0",
-"0/5711=0",
-"0/5712=0",
-"0/5713=0",
-"0/5714=0",
-"0/5715=0",
-"0/5716=0",
-"0/5717=0",
-"0/5718=0",
-"0/5719=0",
-"0/5720=0",
-"0/5721=0",
-"0/5722=0",
-"0/5723=0",
-"0/5724=0",
-"0/5725=0",
-"0/5726=0",
-"0/5727=0",
-"0/5728=0",
-"0/5729=0",
-"0/5730=0",
-"0/5731=0",
-"0/5732=0",
-"0/5733=0",
-"0/5734=0",
-"0/5735=0",
-"0/5736=0",
-"0/5737=0",
-"0/5738=0",
-"0/5739=0",
-"0/5740=0",
-"0/5741=0",
-"0/5742=0",
-"0/5743=0",
-"0/5744=0",
-"0/5745=0",
-"0/5746=0",
-"0/5747=0",
-"0/5748=0",
-"0/5749=0",
-"0/5750=0",
-"0/5751=0",
-"0/5752=0",
-"0/5753=0",
-"0/5754=0",
-"0/5755=0",
-"0/5756=0",
-"0/5757=0",
-"0/5758=0",
-"0/5759=0",
-"0/5760=0",
-"0/5761=0",
-"0/5762=0",
-"0/5763=0",
-"0/5764=0",
-"0/5765=0",
-"0/5766=0",
-"0/5767=0",
-"0/5768=0",
-"0/5769=0",
-"0/5770=0",
-"0/5771=0",
-"0/5772=0",
-"0/5773=0",
-"0/5774=0",
-"0/5775=0",
-"0/5776=0",
-"0/5777=0",
-"0/5778=0",
-"0/5779=0",
-"0/5780=0",
-"0/5781=0",
-"0/5782=0",
-"0/5783=0",
-"0/5784=0",
-"0/5785=0",
-"0/5786=0",
-"0/5787=0",
-"0/5788=0",
-"0/5789=0",
-"0/5790=0",
-"0/5791=0",
-"0/5792=0",
-"0/5793=0",
-"0/5794=0",
-"0/5795=0",
-"0/5796=0",
-"0/5797=0",
-"0/5798=0",
-"0/5799=0",
-"0/57+0=0",
-"0/57+1=1",
-"0/57+2=2",
-"0/57+3=3",
-"0/57+4=4",
-"0/57+5=5",
-"0/57+6=6",
-"0/57+7=7",
-"0/57+8=8",
-"0/57+9=9",
-"0/57-0=0",
-"0/57*0=0",
-"0/57*1=0",
-"0/57*2=0",
-"0/57*3=0",
-"0/57*4=0",
-"0/57*5=0",
-"0/57*6=0",
-"0/57*7=0",
-"0/57*8=0",
-"0/57*9=0",
-"0/57/1=0",
-"0/57/2=0",
-"0/57/3=0",
-"0/57/4=0",
-"0/57/5=0",
-"0/57/6=0",
-"0/57/7=0",
-"0/57/8=0",
-"0/57/9=0",
-"0/5800=0",
-"0/5801=0",
-"0/5802=0",
-"0/5803=0",
-"0/5804=0",
-"0/5805=0",
-"0/5806=0",
-"0/5807=0",
-"0/5808=0",
-"0/5809=0",
-"0/5810=0",
-"0/5811=0",
-"0/5812=0",
-"0/5813=0",
-"0/5814=0",
-"0/5815=0",
-"0/5816=0",
-"0/5817=0",
-"0/5818=0",
-"0/5819=0",
-"0/5820=0",
-"0/5821=0",
-"0/5822=0",
-"0/5823=0",
-"0/5824=0",
-"0/5825=0",
-"0/5826=0",
-"0/5827=0",
-"0/5828=0",
-"0/5829=0",
-"0/5830=0",
-"0/5831=0",
-"0/5832=0",
-"0/5833=0",
-"0/5834=0",
-"0/5835=0",
-"0/5836=0",
-"0/5837=0",
-"0/5838=0",
-"0/5839=0",
-"0/5840=0",
-"0/5841=0",
-"0/5842=0",
-"0/5843=0",
-"0/5844=0",
-"0/5845=0",
-"0/5846=0",
-"0/5847=0",
-"0/5848=0",
-"0/5849=0",
-"0/5850=0",
-"0/5851=0",
-"0/5852=0",
-"0/5853=0",
-"0/5854=0",
-"0/5855=0",
-"0/5856=0",
-"0/5857=0",
-"0/5858=0",
-"0/5859=0",
-"0/5860=0",
-"0/5861=0",
-"0/5862=0",
-"0/5863=0",
-"0/5864=0",
-"0/5865=0",
-"0/5866=0",
-"0/5867=0",
-"0/5868=0",
-"0/5869=0",
-"0/5870=0",
-"0/5871=0",
-"0/5872=0",
-"0/5873=0",
-"0/5874=0",
-"0/5875=0",
-"0/5876=0",
-"0/5877=0",
-"0/5878=0",
-"0/5879=0",
-"0/5880=0",
-"0/5881=0",
-"0/5882=0",
-"0/5883=0",
-"0/5884=0",
-"0/5885=0",
-"0/5886=0",
-"0/5887=0",
-"0/5888=0",
-"0/5889=0",
-"0/5890=0",
-"0/5891=0",
-"0/5892=0",
-"0/5893=0",
-"0/5894=0",
-"0/5895=0",
-"0/5896=0",
-"0/5897=0",
-"0/5898=0",
-"0/5899=0",
-"0/58+0=0",
-"0/58+1=1",
-"0/58+2=2",
-"0/58+3=3",
-"0/58+4=4",
-"0/58+5=5",
-"0/58+6=6",
-"0/58+7=7",
-"0/58+8=8",
-"0/58+9=9",
-"0/58-0=0",
-"0/58*0=0",
-"0/58*1=0",
-"0/58*2=0",
-"0/58*3=0",
-"0/58*4=0",
-"0/58*5=0",
-"0/58*6=0",
-"0/58*7=0",
-"0/58*8=0",
-"0/58*9=0",
-"0/58/1=0",
-"0/58/2=0",
-"0/58/3=0",
-"0/58/4=0",
-"0/58/5=0",
-"0/58/6=0",
-"0/58/7=0",
-"0/58/8=0",
-"0/58/9=0",
-"0/5900=0",
-"0/5901=0",
-"0/5902=0",
-"0/5903=0",
-"0/5904=0",
-"0/5905=0",
-"0/5906=0",
-"0/5907=0",
-"0/5908=0",
-"0/5909=0",
-"0/5910=0",
-"0/5911=0",
-"0/5912=0",
-"0/5913=0",
-"0/5914=0",
-"0/5915=0",
-"0/5916=0",
-"0/5917=0",
-"0/5918=0",
-"0/5919=0",
-"0/5920=0",
-"0/5921=0",
-"0/5922=0",
-"0/5923=0",
-"0/5924=0",
-"0/5925=0",
-"0/5926=0",
-"0/5927=0",
-"0/5928=0",
-"0/5929=0",
-"0/5930=0",
-"0/5931=0",
-"0/5932=0",
-"0/5933=0",
-"0/5934=0",
-"0/5935=0",
-"0/5936=0",
-"0/5937=0",
-"0/5938=0",
-"0/5939=0",
-"0/5940=0",
-"0/5941=0",
-"0/5942=0",
-"0/5943=0",
-"0/5944=0",
-"0/5945=0",
-"0/5946=0",
-"0/5947=0",
-"0/5948=0",
-"0/5949=0",
-"0/5950=0",
-"0/5951=0",
-"0/5952=0",
-"0/5953=0",
-"0/5954=0",
-"0/5955=0",
-"0/5956=0",
-"0/5957=0",
-"0/5958=0",
-"0/5959=0",
-"0/5960=0",
-"0/5961=0",
-"0/5962=0",
-"0/5963=0",
-"0/5964=0",
-"0/5965=0",
-"0/5966=0",
-"0/5967=0",
-"0/5968=0",
-"0/5969=0",
-"0/5970=0",
-"0/5971=0",
-"0/5972=0",
-"0/5973=0",
-"0/5974=0",
-"0/5975=0",
-"0/5976=0",
-"0/5977=0",
-"0/5978=0",
-"0/5979=0",
-"0/5980=0",
-"0/5981=0",
-"0/5982=0",
-"0/5983=0",
-"0/5984=0",
-"0/5985=0",
-"0/5986=0",
-"0/5987=0",
-"0/5988=0",
-"0/5989=0",
-"0/5990=0",
-"0/5991=0",
-"0/5992=0",
-"0/5993=0",
-"0/5994=0",
-"0/5995=0",
-"0/5996=0",
-"0/5997=0",
-"0/5998=0",
-"0/5999=0",
-"0/59+0=0",
-"0/59+1=1",
-"0/59+2=2",
-"0/59+3=3",
-"0/59+4=4",
-"0/59+5=5",
-"0/59+6=6",
-"0/59+7=7",
-"0/59+8=8",
-"0/59+9=9",
-"0/59-0=0",
-"0/59*0=0",
-"0/59*1=0",
-"0/59*2=0",
-"0/59*3=0",
-"0/59*4=0",
-"0/59*5=0",
-"0/59*6=0",
-"0/59*7=0",
-"0/59*8=0",
-"0/59*9=0",
-"0/59/1=0",
-"0/59/2=0",
-"0/59/3=0",
-"0/59/4=0",
-"0/59/5=0",
-"0/59/6=0",
-"0/59/7=0",
-"0/59/8=0",
-"0/59/9=0",
-"0/5-1=-1",
-"0/5-2=-2",
-"0/5-3=-3",
-"0/5-4=-4",
-"0/5-5=-5",
-"0/5-6=-6",
-"0/5-7=-7",
-"0/5-8=-8",
-"0/5-9=-9",
-"0/5*10=0",
-"0/5*11=0",
-"0/5*12=0",
-"0/5*13=0",
-"0/5*14=0",
-"0/5*15=0",
-"0/5*16=0",
-"0/5*17=0",
-"0/5*18=0",
-"0/5*19=0",
-"0/5*20=0",
-"0/5*21=0",
-"0/5*22=0",
-"0/5*23=0",
-"0/5*24=0",
-"0/5*25=0",
-"0/5*26=0",
-"0/5*27=0",
-"0/5*28=0",
-"0/5*29=0",
-"0/5*30=0",
-"0/5*31=0",
-"0/5*32=0",
-"0/5*33=0",
-"0/5*34=0",
-"0/5*35=0",
-"0/5*36=0",
-"0/5*37=0",
-"0/5*38=0",
-"0/5*39=0",
-"0/5*40=0",
-"0/5*41=0",
-"0/5*42=0",
-"0/5*43=0",
-"0/5*44=0",
-"0/5*45=0",
-"0/5*46=0",
-"0/5*47=0",
-"0/5*48=0",
-"0/5*49=0",
-"0/5*50=0",
-"0/5*51=0",
-"0/5*52=0",
-"0/5*53=0",
-"0/5*54=0",
-"0/5*55=0",
-"0/5*56=0",
-"0/5*57=0",
-"0/5*58=0",
-"0/5*59=0",
-"0/5*60=0",
-"0/5*61=0",
-"0/5*62=0",
-"0/5*63=0",
-"0/5*64=0",
-"0/5*65=0",
-"0/5*66=0",
-"0/5*67=0",
-"0/5*68=0",
-"0/5*69=0",
-"0/5*70=0",
-"0/5*71=0",
-"0/5*72=0",
-"0/5*73=0",
-"0/5*74=0",
-"0/5*75=0",
-"0/5*76=0",
-"0/5*77=0",
-"0/5*78=0",
-"0/5*79=0",
-"0/5*80=0",
-"0/5*81=0",
-"0/5*82=0",
-"0/5*83=0",
-"0/5*84=0",
-"0/5*85=0",
-"0/5*86=0",
-"0/5*87=0",
-"0/5*88=0",
-"0/5*89=0",
-"0/5*90=0",
-"0/5*91=0",
-"0/5*92=0",
-"0/5*93=0",
-"0/5*94=0",
-"0/5*95=0",
-"0/5*96=0",
-"0/5*97=0",
-"0/5*98=0",
-"0/5*99=0",
-"0/5/10=0",
-"0/5/11=0",
-"0/5/12=0",
-"0/5/13=0",
-"0/5/14=0",
-"0/5/15=0",
-"0/5/16=0",
-"0/5/17=0",
-"0/5/18=0",
-"0/5/19=0",
-"0/5/20=0",
-"0/5/21=0",
-"0/5/22=0",
-"0/5/23=0",
-"0/5/24=0",
-"0/5/25=0",
-"0/5/26=0",
-"0/5/27=0",
-"0/5/28=0",
-"0/5/29=0",
-"0/5/30=0",
-"0/5/31=0",
-"0/5/32=0",
-"0/5/33=0",
-"0/5/34=0",
-"0/5/35=0",
-"0/5/36=0",
-"0/5/37=0",
-"0/5/38=0",
-"0/5/39=0",
-"0/5/40=0",
-"0/5/41=0",
-"0/5/42=0",
-"0/5/43=0",
-"0/5/44=0",
-"0/5/45=0",
-"0/5/46=0",
-"0/5/47=0",
-"0/5/48=0",
-"0/5/49=0",
-"0/5/50=0",
-"0/5/51=0",
-"0/5/52=0",
-"0/5/53=0",
-"0/5/54=0",
-"0/5/55=0",
-"0/5/56=0",
-"0/5/57=0",
-"0/5/58=0",
-"0/5/59=0",
-"0/5/60=0",
-"0/5/61=0",
-"0/5/62=0",
-"0/5/63=0",
-"0/5/64=0",
-"0/5/65=0",
-"0/5/66=0",
-"0/5/67=0",
-"0/5/68=0",
-"0/5/69=0",
-"0/5/70=0",
-"0/5/71=0",
-"0/5/72=0",
-"0/5/73=0",
-"0/5/74=0",
-"0/5/75=0",
-"0/5/76=0",
-"0/5/77=0",
-"0/5/78=0",
-"0/5/79=0",
-"0/5/80=0",
-"0/5/81=0",
-"0/5/82=0",
-"0/5/83=0",
-"0/5/84=0",
-"0/5/85=0",
-"0/5/86=0",
-"0/5/87=0",
-"0/5/88=0",
-"0/5/89=0",
-"0/5/90=0",
-"0/5/91=0",
-"0/5/92=0",
-"0/5/93=0",
-"0/5/94=0",
-"0/5/95=0",
-"0/5/96=0",
-"0/5/97=0",
-"0/5/98=0",
-"0/5/99=0",
-"0/6000=0",
-"0/6001=0",
-"0/6002=0",
-"0/6003=0",
-"0/6004=0",
-"0/6005=0",
-"0/6006=0",
-"0/6007=0",
-"0/6008=0",
-"0/6009=0",
-"0/6010=0",
-"0/6011=0",
-"0/6012=0",
-"0/6013=0",
-"0/6014=0",
-"0/6015=0",
-"0/6016=0",
-"0/6017=0",
-"0/6018=0",
-"0/6019=0",
-"0/6020=0",
-"0/6021=0",
-"0/6022=0",
-"0/6023=0",
-"0/6024=0",
-"0/6025=0",
-"0/6026=0",
-"0/6027=0",
-"0/6028=0",
-"0/6029=0",
-"0/6030=0",
-"0/6031=0",
-"0/6032=0",
-"0/6033=0",
-"0/6034=0",
-"0/6035=0",
-"0/6036=0",
-"0/6037=0",
-"0/6038=0",
-"0/6039=0",
-"0/6040=0",
-"0/6041=0",
-"0/6042=0",
-"0/6043=0",
-"0/6044=0",
-"0/6045=0",
-"0/6046=0",
-"0/6047=0",
-"0/6048=0",
-"0/6049=0",
-"0/6050=0",
-"0/6051=0",
-"0/6052=0",
-"0/6053=0",
-"0/6054=0",
-"0/6055=0",
-"0/6056=0",
-"0/6057=0",
-"0/6058=0",
-"0/6059=0",
-"0/6060=0",
-"0/6061=0",
-"0/6062=0",
-"0/6063=0",
-"0/6064=0",
-"0/6065=0",
-"0/6066=0",
-"0/6067=0",
-"0/6068=0",
-"0/6069=0",
-"0/6070=0",
-"0/6071=0",
-"0/6072=0",
-"0/6073=0",
-"0/6074=0",
-"0/6075=0",
-"0/6076=0",
-"0/6077=0",
-"0/6078=0",
-"0/6079=0",
-"0/6080=0",
-"0/6081=0",
-"0/6082=0",
-"0/6083=0",
-"0/6084=0",
-"0/6085=0",
-"0/6086=0",
-"0/6087=0",
-"0/6088=0",
-"0/6089=0",
-"0/6090=0",
-"0/6091=0",
-"0/6092=0",
-"0/6093=0",
-"0/6094=0",
-"0/6095=0",
-"0/6096=0",
-"0/6097=0",
-"0/6098=0",
-"0/6099=0",
-"0/60+0=0",
-"0/60+1=1",
-"0/60+2=2",
-"0/60+3=3",
-"0/60+4=4",
-"0/60+5=5",
-"0/60+6=6",
-"0/60+7=7",
-"0/60+8=8",
-"0/60+9=9",
-"0/60-0=0",
-"0/60*0=0",
-"0/60*1=0",
-"0/60*2=0",
-"0/60*3=0",
-"0/60*4=0",
-"0/60*5=0",
-"0/60*6=0",
-"0/60*7=0",
-"0/60*8=0",
-"0/60*9=0",
-"0/60/1=0",
-"0/60/2=0",
-"0/60/3=0",
-"0/60/4=0",
-"0/60/5=0",
-"0/60/6=0",
-"0/60/7=0",
-"0/60/8=0",
-"0/60/9=0",
-"0/6100=0",
-"0/6101=0",
-"0/6102=0",
-"0/6103=0",
-"0/6104=0",
-"0/6105=0",
-"0/6106=0",
-"0/6107=0",
-"0/6108=0",
-"0/6109=0",
-"0/6110=0",
-"0/6111=0",
-"0/6112=0",
-"0/6113=0",
-"0/6114=0",
-"0/6115=0",
-"0/6116=0",
-"0/6117=0",
-"0/6118=0",
-"0/6119=0",
-"0/6120=0",
-"0/6121=0",
-"0/6122=0",
-"0/6123=0",
-"0/6124=0",
-"0/6125=0",
-"0/6126=0",
-"0/6127=0",
-"0/6128=0",
-"0/6129=0",
-"0/6130=0",
-"0/6131=0",
-"0/6132=0",
-"0/6133=0",
-"0/6134=0",
-"0/6135=0",
-"0/6136=0",
-"0/6137=0",
-"0/6138=0",
-"0/6139=0",
-"0/6140=0",
-"0/6141=0",
-"0/6142=0",
-"0/6143=0",
-"0/6144=0",
-"0/6145=0",
-"0/6146=0",
-"0/6147=0",
-"0/6148=0",
-"0/6149=0",
-"0/6150=0",
-"0/6151=0",
-"0/6152=0",
-"0/6153=0",
-"0/6154=0",
-"0/6155=0",
-"0/6156=0",
-"0/6157=0",
-"0/6158=0",
-"0/6159=0",
-"0/6160=0",
-"0/6161=0",
-"0/6162=0",
-"0/6163=0",
-"0/6164=0",
-"0/6165=0",
-"0/6166=0",
-"0/6167=0",
-"0/6168=0",
-"0/6169=0",
-"0/6170=0",
-"0/6171=0",
-"0/6172=0",
-"0/6173=0",
-"0/6174=0",
-"0/6175=0",
-"0/6176=0",
-"0/6177=0",
-"0/6178=0",
-"0/6179=0",
-"0/6180=0",
-"0/6181=0",
-"0/6182=0",
-"0/6183=0",
-"0/6184=0",
-"0/6185=0",
-"0/6186=0",
-"0/6187=0",
-"0/6188=0",
-"0/6189=0",
-"0/6190=0",
-"0/6191=0",
-"0/6192=0",
-"0/6193=0",
-"0/6194=0",
-"0/6195=0",
-"0/6196=0",
-"0/6197=0",
-"0/6198=0",
-"0/6199=0",
-"0/61+0=0",
-"0/61+1=1",
-"0/61+2=2",
-"0/61+3=3",
-"0/61+4=4",
-"0/61+5=5",
-"0/61+6=6",
-"0/61+7=7",
-"0/61+8=8",
-"0/61+9=9",
-"0/61-0=0",
-"0/61*0=0",
-"0/61*1=0",
-"0/61*2=0",
-"0/61*3=0",
-"0/61*4=0",
-"0/61*5=0",
-"0/61*6=0",
-"0/61*7=0",
-"0/61*8=0",
-"0/61*9=0",
-"0/61/1=0",
-"0/61/2=0",
-"0/61/3=0",
-"0/61/4=0",
-"0/61/5=0",
-"0/61/6=0",
-"0/61/7=0",
-"0/61/8=0",
-"0/61/9=0",
-"0/6200=0",
-"0/6201=0",
-"0/6202=0",
-"0/6203=0",
-"0/6204=0",
-"0/6205=0",
-"0/6206=0",
-"0/6207=0",
-"0/6208=0",
-"0/6209=0",
-"0/6210=0",
-"0/6211=0",
-"0/6212=0",
-"0/6213=0",
-"0/6214=0",
-"0/6215=0",
-"0/6216=0",
-"0/6217=0",
-"0/6218=0",
-"0/6219=0",
-"0/6220=0",
-"0/6221=0",
-"0/6222=0",
-"0/6223=0",
-"0/6224=0",
-"0/6225=0",
-"0/6226=0",
-"0/6227=0",
-"0/6228=0",
-"0/6229=0",
-"0/6230=0",
-"0/6231=0",
-"0/6232=0",
-"0/6233=0",
-"0/6234=0",
-"0/6235=0",
-"0/6236=0",
-"0/6237=0",
-"0/6238=0",
-"0/6239=0",
-"0/6240=0",
-"0/6241=0",
-"0/6242=0",
-"0/6243=0",
-"0/6244=0",
-"0/6245=0",
-"0/6246=0",
-"0/6247=0",
-"0/6248=0",
-"0/6249=0",
-"0/6250=0",
-"0/6251=0",
-"0/6252=0",
-"0/6253=0",
-"0/6254=0",
-"0/6255=0",
-"0/6256=0",
-"0/6257=0",
-"0/6258=0",
-"0/6259=0",
-"0/6260=0",
-"0/6261=0",
-"0/6262=0",
-"0/6263=0",
-"0/6264=0",
-"0/6265=0",
-"0/6266=0",
-"0/6267=0",
-"0/6268=0",
-"0/6269=0",
-"0/6270=0",
-"0/6271=0",
-"0/6272=0",
-"0/6273=0",
-"0/6274=0",
-"0/6275=0",
-"0/6276=0",
-"0/6277=0",
-"0/6278=0",
-"0/6279=0",
-"0/6280=0",
-"0/6281=0",
-"0/6282=0",
-"0/6283=0",
-"0/6284=0",
-"0/6285=0",
-"0/6286=0",
-"0/6287=0",
-"0/6288=0",
-"0/6289=0",
-"0/6290=0",
-"0/6291=0",
-"0/6292=0",
-"0/6293=0",
-"0/6294=0",
-"0/6295=0",
-"0/6296=0",
-"0/6297=0",
-"0/6298=0",
-"0/6299=0",
-"0/62+0=0",
-"0/62+1=1",
-"0/62+2=2",
-"0/62+3=3",
-"0/62+4=4",
-"0/62+5=5",
-"0/62+6=6",
-"0/62+7=7",
-"0/62+8=8",
-"0/62+9=9",
-"0/62-0=0",
-"0/62*0=0",
-"0/62*1=0",
-"0/62*2=0",
-"0/62*3=0",
-"0/62*4=0",
-"0/62*5=0",
-"0/62*6=0",
-"0/62*7=0",
-"0/62*8=0",
-"0/62*9=0",
-"0/62/1=0",
-"0/62/2=0",
-"0/62/3=0",
-"0/62/4=0",
-"0/62/5=0",
-"0/62/6=0",
-"0/62/7=0",
-"0/62/8=0",
-"0/62/9=0",
-"0/6300=0",
-"0/6301=0",
-"0/6302=0",
-"0/6303=0",
-"0/6304=0",
-"0/6305=0",
-"0/6306=0",
-"0/6307=0",
-"0/6308=0",
-"0/6309=0",
-"0/6310=0",
-"0/6311=0",
-"0/6312=0",
-"0/6313=0",
-"0/6314=0",
-"0/6315=0",
-"0/6316=0",
-"0/6317=0",
-"0/6318=0",
-"0/6319=0",
-"0/6320=0",
-"0/6321=0",
-"0/6322=0",
-"0/6323=0",
-"0/6324=0",
-"0/6325=0",
-"0/6326=0",
-"0/6327=0",
-"0/6328=0",
-"0/6329=0",
-"0/6330=0",
-"0/6331=0",
-"0/6332=0",
-"0/6333=0",
-"0/6334=0",
-"0/6335=0",
-"0/6336=0",
-"0/6337=0",
-"0/6338=0",
-"0/6339=0",
-"0/6340=0",
-"0/6341=0",
-"0/6342=0",
-"0/6343=0",
-"0/6344=0",
-"0/6345=0",
-"0/6346=0",
-"0/6347=0",
-"0/6348=0",
-"0/6349=0",
-"0/6350=0",
-"0/6351=0",
-"0/6352=0",
-"0/6353=0",
-"0/6354=0",
-"0/6355=0",
-"0/6356=0",
-"0/6357=0",
-"0/6358=0",
-"0/6359=0",
-"0/6360=0",
-"0/6361=0",
-"0/6362=0",
-"0/6363=0",
-"0/6364=0",
-"0/6365=0",
-"0/6366=0",
-"0/6367=0",
-"0/6368=0",
-"0/6369=0",
-"0/6370=0",
-"0/6371=0",
-"0/6372=0",
-"0/6373=0",
-"0/6374=0",
-"0/6375=0",
-"0/6376=0",
-"0/6377=0",
-"0/6378=0",
-"0/6379=0",
-"0/6380=0",
-"0/6381=0",
-"0/6382=0",
-"0/6383=0",
-"0/6384=0",
-"0/6385=0",
-"0/6386=0",
-"0/6387=0",
-"0/6388=0",
-"0/6389=0",
-"0/6390=0",
-"0/6391=0",
-"0/6392=0",
-"0/6393=0",
-"0/6394=0",
-"0/6395=0",
-"0/6396=0",
-"0/6397=0",
-"0/6398=0",
-"0/6399=0",
-"0/63+0=0",
-"0/63+1=1",
-"0/63+2=2",
-"0/63+3=3",
-"0/63+4=4",
-"0/63+5=5",
-"0/63+6=6",
-"0/63+7=7",
-"0/63+8=8",
-"0/63+9=9",
-"0/63-0=0",
-"0/63*0=0",
-"0/63*1=0",
-"0/63*2=0",
-"0/63*3=0",
-"0/63*4=0",
-"0/63*5=0",
-"0/63*6=0",
-"0/63*7=0",
-"0/63*8=0",
-"0/63*9=0",
-"0/63/1=0",
-"0/63/2=0",
-"0/63/3=0",
-"0/63/4=0",
-"0/63/5=0",
-"0/63/6=0",
-"0/63/7=0",
-"0/63/8=0",
-"0/63/9=0",
-"0/6400=0",
-"0/6401=0",
-"0/6402=0",
-"0/6403=0",
-"0/6404=0",
-"0/6405=0",
-"0/6406=0",
-"0/6407=0",
-"0/6408=0",
-"0/6409=0",
-"0/6410=0",
-"0/6411=0",
-"0/6412=0",
-"0/6413=0",
-"0/6414=0",
-"0/6415=0",
-"0/6416=0",
-"0/6417=0",
-"0/6418=0",
-"0/6419=0",
-"0/6420=0",
-"0/6421=0",
-"0/6422=0",
-"0/6423=0",
-"0/6424=0",
-"0/6425=0",
-"0/6426=0",
-"0/6427=0",
-"0/6428=0",
-"0/6429=0",
-"0/6430=0",
-"0/6431=0",
-"0/6432=0",
-"0/6433=0",
-"0/6434=0",
-"0/6435=0",
-"0/6436=0",
-"0/6437=0",
-"0/6438=0",
-"0/6439=0",
-"0/6440=0",
-"0/6441=0",
-"0/6442=0",
-"0/6443=0",
-"0/6444=0",
-"0/6445=0",
-"0/6446=0",
-"0/6447=0",
-"0/6448=0",
-"0/6449=0",
-"0/6450=0",
-"0/6451=0",
-"0/6452=0",
-"0/6453=0",
-"0/6454=0",
-"0/6455=0",
-"0/6456=0",
-"0/6457=0",
-"0/6458=0",
-"0/6459=0",
-"0/6460=0",
-"0/6461=0",
-"0/6462=0",
-"0/6463=0",
-"0/6464=0",
-"0/6465=0",
-"0/6466=0",
-"0/6467=0",
-"0/6468=0",
-"0/6469=0",
-"0/6470=0",
-"0/6471=0",
-"0/6472=0",
-"0/6473=0",
-"0/6474=0",
-"0/6475=0",
-"0/6476=0",
-"0/6477=0",
-"0/6478=0",
-"0/6479=0",
-"0/6480=0",
-"0/6481=0",
-"0/6482=0",
-"0/6483=0",
-"0/6484=0",
-"0/6485=0",
-"0/6486=0",
-"0/6487=0",
-"0/6488=0",
-"0/6489=0",
-"0/6490=0",
-"0/6491=0",
-"0/6492=0",
-"0/6493=0",
-"0/6494=0",
-"0/6495=0",
-"0/6496=0",
-"0/6497=0",
-"0/6498=0",
-"0/6499=0",
-"0/64+0=0",
-"0/64+1=1",
-"0/64+2=2",
-"0/64+3=3",
-"0/64+4=4",
-"0/64+5=5",
-"0/64+6=6",
-"0/64+7=7",
-"0/64+8=8",
-"0/64+9=9",
-"0/64-0=0",
-"0/64*0=0",
-"0/64*1=0",
-"0/64*2=0",
-"0/64*3=0",
-"0/64*4=0",
-"0/64*5=0",
-"0/64*6=0",
-"0/64*7=0",
-"0/64*8=0",
-"0/64*9=0",
-"0/64/1=0",
-"0/64/2=0",
-"0/64/3=0",
-"0/64/4=0",
-"0/64/5=0",
-"0/64/6=0",
-"0/64/7=0",
-"0/64/8=0",
-"0/64/9=0",
-"0/6500=0",
-"0/6501=0",
-"0/6502=0",
-"0/6503=0",
-"0/6504=0",
-"0/6505=0",
-"0/6506=0",
-"0/6507=0",
-"0/6508=0",
-"0/6509=0",
-"0/6510=0",
-"0/6511=0",
-"0/6512=0",
-"0/6513=0",
-"0/6514=0",
-"0/6515=0",
-"0/6516=0",
-"0/6517=0",
-"0/6518=0",
-"0/6519=0",
-"0/6520=0",
-"0/6521=0",
-"0/6522=0",
-"0/6523=0",
-"0/6524=0",
-"0/6525=0",
-"0/6526=0",
-"0/6527=0",
-"0/6528=0",
-"0/6529=0",
-"0/6530=0",
-"0/6531=0",
-"0/6532=0",
-"0/6533=0",
-"0/6534=0",
-"0/6535=0",
-"0/6536=0",
-"0/6537=0",
-"0/6538=0",
-"0/6539=0",
-"0/6540=0",
-"0/6541=0",
-"0/6542=0",
-"0/6543=0",
-"0/6544=0",
-"0/6545=0",
-"0/6546=0",
-"0/6547=0",
-"0/6548=0",
-"0/6549=0",
-"0/6550=0",
-"0/6551=0",
-"0/6552=0",
-"0/6553=0",
-"0/6554=0",
-"0/6555=0",
-"0/6556=0",
-"0/6557=0",
-"0/6558=0",
-"0/6559=0",
-"0/6560=0",
-"0/6561=0",
-"0/6562=0",
-"0/6563=0",
-"0/6564=0",
-"0/6565=0",
-"0/6566=0",
-"0/6567=0",
-"0/6568=0",
-"0/6569=0",
-"0/6570=0",
-"0/6571=0",
-"0/6572=0",
-"0/6573=0",
-"0/6574=0",
-"0/6575=0",
-"0/6576=0",
-"0/6577=0",
-"0/6578=0",
-"0/6579=0",
-"0/6580=0",
-"0/6581=0",
-"0/6582=0",
-"0/6583=0",
-"0/6584=0",
-"0/6585=0",
-"0/6586=0",
-"0/6587=0",
-"0/6588=0",
-"0/6589=0",
-"0/6590=0",
-"0/6591=0",
-"0/6592=0",
-"0/6593=0",
-"0/6594=0",
-"0/6595=0",
-"0/6596=0",
-"0/6597=0",
-"0/6598=0",
-"0/6599=0",
-"0/65+0=0",
-"0/65+1=1",
-"0/65+2=2",
-"0/65+3=3",
-"0/65+4=4",
-"0/65+5=5",
-"0/65+6=6",
-"0/65+7=7",
-"0/65+8=8",
-"0/65+9=9",
-"0/65-0=0",
-"0/65*0=0",
-"0/65*1=0",
-"0/65*2=0",
-"0/65*3=0",
-"0/65*4=0",
-"0/65*5=0",
-"0/65*6=0",
-"0/65*7=0",
-"0/65*8=0",
-"0/65*9=0",
-"0/65/1=0",
-"0/65/2=0",
-"0/65/3=0",
-"0/65/4=0",
-"0/65/5=0",
-"0/65/6=0",
-"0/65/7=0",
-"0/65/8=0",
-"0/65/9=0",
-"0/6600=0",
-"0/6601=0",
-"0/6602=0",
-"0/6603=0",
-"0/6604=0",
-"0/6605=0",
-"0/6606=0",
-"0/6607=0",
-"0/6608=0",
-"0/6609=0",
-"0/6610=0",
-"0/6611=0",
-"0/6612=0",
-"0/6613=0",
-"0/6614=0",
-"0/6615=0",
-"0/6616=0",
-"0/6617=0",
-"0/6618=0",
-"0/6619=0",
-"0/6620=0",
-"0/6621=0",
-"0/6622=0",
-"0/6623=0",
-"0/6624=0",
-"0/6625=0",
-"0/6626=0",
-"0/6627=0",
-"0/6628=0",
-"0/6629=0",
-"0/6630=0",
-"0/6631=0",
-"0/6632=0",
-"0/6633=0",
-"0/6634=0",
-"0/6635=0",
-"0/6636=0",
-"0/6637=0",
-"0/6638=0",
-"0/6639=0",
-"0/6640=0",
-"0/6641=0",
-"0/6642=0",
-"0/6643=0",
-"0/6644=0",
-"0/6645=0",
-"0/6646=0",
-"0/6647=0",
-"0/6648=0",
-"0/6649=0",
-"0/6650=0",
-"0/6651=0",
-"0/6652=0",
-"0/6653=0",
-"0/6654=0",
-"0/6655=0",
-"0/6656=0",
-"0/6657=0",
-"0/6658=0",
-"0/6659=0",
-"0/6660=0",
-"0/6661=0",
-"0/6662=0",
-"0/6663=0",
-"0/6664=0",
-"0/6665=0",
-"0/6666=0",
-"0/6667=0",
-"0/6668=0",
-"0/6669=0",
-"0/6670=0",
-"0/6671=0",
-"0/6672=0",
-"0/6673=0",
-"0/6674=0",
-"0/6675=0",
-"0/6676=0",
-"0/6677=0",
-"0/6678=0",
-"0/6679=0",
-"0/6680=0",
-"0/6681=0",
-"0/6682=0",
-"0/6683=0",
-"0/6684=0",
-"0/6685=0",
-"0/6686=0",
-"0/6687=0",
-"0/6688=0",
-"0/6689=0",
-"0/6690=0",
-"0/6691=0",
-"0/6692=0",
-"0/6693=0",
-"0/6694=0",
-"0/6695=0",
-"0/6696=0",
-"0/6697=0",
-"0/6698=0",
-"0/6699=0",
-"0/66+0=0",
-"0/66+1=1",
-"0/66+2=2",
-"0/66+3=3",
-"0/66+4=4",
-"0/66+5=5",
-"0/66+6=6",
-"0/66+7=7",
-"0/66+8=8",
-"0/66+9=9",
-"0/66-0=0",
-"0/66*0=0",
-"0/66*1=0",
-"0/66*2=0",
-"0/66*3=0",
-"0/66*4=0",
-"0/66*5=0",
-"0/66*6=0",
-"0/66*7=0",
-"0/66*8=0",
-"0/66*9=0",
-"0/66/1=0",
-"0/66/2=0",
-"0/66/3=0",
-"0/66/4=0",
-"0/66/5=0",
-"0/66/6=0",
-"0/66/7=0",
-"0/66/8=0",
-"0/66/9=0",
-"0/6700=0",
-"0/6701=0",
-"0/6702=0",
-"0/6703=0",
-"0/6704=0",
-"0/6705=0",
-"0/6706=0",
-"0/6707=0",
-"0/6708=0",
-"0/6709=0",
-"0/6710=0",
-"0/6711=0",
-"0/6712=0",
-"0/6713=0",
-"0/6714=0",
-"0/6715=0",
-"0/6716=0",
-"0/6717=0",
-"0/6718=0",
-"0/6719=0",
-"0/6720=0",
-"0/6721=0",
-"0/6722=0",
-"0/6723=0",
-"0/6724=0",
-"0/6725=0",
-"0/6726=0",
-"0/6727=0",
-"0/6728=0",
-"0/6729=0",
-"0/6730=0",
-"0/6731=0",
-"0/6732=0",
-"0/6733=0",
-"0/6734=0",
-"0/6735=0",
-"0/6736=0",
-"0/6737=0",
-"0/6738=0",
-"0/6739=0",
-"0/6740=0",
-"0/6741=0",
-"0/6742=0",
-"0/6743=0",
-"0/6744=0",
-"0/6745=0",
-"0/6746=0",
-"0/6747=0",
-"0/6748=0",
-"0/6749=0",
-"0/6750=0",
-"0/6751=0",
-"0/6752=0",
-"0/6753=0",
-"0/6754=0",
-"0/6755=0",
-"0/6756=0",
-"0/6757=0",
-"0/6758=0",
-"0/6759=0",
-"0/6760=0",
-"0/6761=0",
-"0/6762=0",
-"0/6763=0",
-"0/6764=0",
-"0/6765=0",
-"0/6766=0",
-"0/6767=0",
-"0/6768=0",
-"0/6769=0",
-"0/6770=0",
-"0/6771=0",
-"0/6772=0",
-"0/6773=0",
-"0/6774=0",
-"0/6775=0",
-"0/6776=0",
-"0/6777=0",
-"0/6778=0",
-"0/6779=0",
-"0/6780=0",
-"0/6781=0",
-"0/6782=0",
-"0/6783=0",
-"0/6784=0",
-"0/6785=0",
-"0/6786=0",
-"0/6787=0",
-"0/6788=0",
-"0/6789=0",
-"0/6790=0",
-"0/6791=0",
-"0/6792=0",
-"0/6793=0",
-"0/6794=0",
-"0/6795=0",
-"0/6796=0",
-"0/6797=0",
-"0/6798=0",
-"0/6799=0",
-"0/67+0=0",
-"0/67+1=1",
-"0/67+2=2",
-"0/67+3=3",
-"0/67+4=4",
-"0/67+5=5",
-"0/67+6=6",
-"0/67+7=7",
-"0/67+8=8",
-"0/67+9=9",
-"0/67-0=0",
-"0/67*0=0",
-"0/67*1=0",
-"0/67*2=0",
-"0/67*3=0",
-"0/67*4=0",
-"0/67*5=0",
-"0/67*6=0",
-"0/67*7=0",
-"0/67*8=0",
-"0/67*9=0",
-"0/67/1=0",
-"0/67/2=0",
-"0/67/3=0",
-"0/67/4=0",
-"0/67/5=0",
-"0/67/6=0",
-"0/67/7=0",
-"0/67/8=0",
-"0/67/9=0",
-"0/6800=0",
-"0/6801=0",
-"0/6802=0",
-"0/6803=0",
-"0/6804=0",
-"0/6805=0",
-"0/6806=0",
-"0/6807=0",
-"0/6808=0",
-"0/6809=0",
-"0/6810=0",
-"0/6811=0",
-"0/6812=0",
-"0/6813=0",
-"0/6814=0",
-"0/6815=0",
-"0/6816=0",
-"0/6817=0",
-"0/6818=0",
-"0/6819=0",
-"0/6820=0",
-"0/6821=0",
-"0/6822=0",
-"0/6823=0",
-"0/6824=0",
-"0/6825=0",
-"0/6826=0",
-"0/6827=0",
-"0/6828=0",
-"0/6829=0",
-"0/6830=0",
-"0/6831=0",
-"0/6832=0",
-"0/6833=0",
-"0/6834=0",
-"0/6835=0",
-"0/6836=0",
-"0/6837=0",
-"0/6838=0",
-"0/6839=0",
-"0/6840=0",
-"0/6841=0",
-"0/6842=0",
-"0/6843=0",
-"0/6844=0",
-"0/6845=0",
-"0/6846=0",
-"0/6847=0",
-"0/6848=0",
-"0/6849=0",
-"0/6850=0",
-"0/6851=0",
-"0/6852=0",
-"0/6853=0",
-"0/6854=0",
-"0/6855=0",
-"0/6856=0",
-"0/6857=0",
-"0/6858=0",
-"0/6859=0",
-"0/6860=0",
-"0/6861=0",
-"0/6862=0",
-"0/6863=0",
-"0/6864=0",
-"0/6865=0",
-"0/6866=0",
-"0/6867=0",
-"0/6868=0",
-"0/6869=0",
-"0/6870=0",
-"0/6871=0",
-"0/6872=0",
-"0/6873=0",
-"0/6874=0",
-"0/6875=0",
-"0/6876=0",
-"0/6877=0",
-"0/6878=0",
-"0/6879=0",
-"0/6880=0",
-"0/6881=0",
-"0/6882=0",
-"0/6883=0",
-"0/6884=0",
-"0/6885=0",
-"0/6886=0",
-"0/6887=0",
-"0/6888=0",
-"0/6889=0",
-"0/6890=0",
-"0/6891=0",
-"0/6892=0",
-"0/6893=0",
-"0/6894=0",
-"0/6895=0",
-"0/6896=0",
-"0/6897=0",
-"0/6898=0",
-"0/6899=0",
-"0/68+0=0",
-"0/68+1=1",
-"0/68+2=2",
-"0/68+3=3",
-"0/68+4=4",
-"0/68+5=5",
-"0/68+6=6",
-"0/68+7=7",
-"0/68+8=8",
-"0/68+9=9",
-"0/68-0=0",
-"0/68*0=0",
-"0/68*1=0",
-"0/68*2=0",
-"0/68*3=0",
-"0/68*4=0",
-"0/68*5=0",
-"0/68*6=0",
-"0/68*7=0",
-"0/68*8=0",
-"0/68*9=0",
-"0/68/1=0",
-"0/68/2=0",
-"0/68/3=0",
-"0/68/4=0",
-"0/68/5=0",
-"0/68/6=0",
-"0/68/7=0",
-"0/68/8=0",
-"0/68/9=0",
-"0/6900=0",
-"0/6901=0",
-"0/6902=0",
-"0/6903=0",
-"0/6904=0",
-"0/6905=0",
-"0/6906=0",
-"0/6907=0",
-"0/6908=0",
-"0/6909=0",
-"0/6910=0",
-"0/6911=0",
-"0/6912=0",
-"0/6913=0",
-"0/6914=0",
-"0/6915=0",
-"0/6916=0",
-"0/6917=0",
-"0/6918=0",
-"0/6919=0",
-"0/6920=0",
-"0/6921=0",
-"0/6922=0",
-"0/6923=0",
-"0/6924=0",
-"0/6925=0",
-"0/6926=0",
-"0/6927=0",
-"0/6928=0",
-"0/6929=0",
-"0/6930=0",
-"0/6931=0",
-"0/6932=0",
-"0/6933=0",
-"0/6934=0",
-"0/6935=0",
-"0/6936=0",
-"0/6937=0",
-"0/6938=0",
-"0/6939=0",
-"0/6940=0",
-"0/6941=0",
-"0/6942=0",
-"0/6943=0",
-"0/6944=0",
-"0/6945=0",
-"0/6946=0",
-"0/6947=0",
-"0/6948=0",
-"0/6949=0",
-"0/6950=0",
-"0/6951=0",
-"0/6952=0",
-"0/6953=0",
-"0/6954=0",
-"0/6955=0",
-"0/6956=0",
-"0/6957=0",
-"0/6958=0",
-"0/6959=0",
-"0/6960=0",
-"0/6961=0",
-"0/6962=0",
-"0/6963=0",
-"0/6964=0",
-"0/6965=0",
-"0/6966=0",
-"0/6967=0",
-"0/6968=0",
-"0/6969=0",
-"0/6970=0",
-"0/6971=0",
-"0/6972=0",
-"0/6973=0",
-"0/6974=0",
-"0/6975=0",
-"0/6976=0",
-"0/6977=0",
-"0/6978=0",
-"0/6979=0",
-"0/6980=0",
-"0/6981=0",
-"0/6982=0",
-"0/6983=0",
-"0/6984=0",
-"0/6985=0",
-"0/6986=0",
-"0/6987=0",
-"0/6988=0",
-"0/6989=0",
-"0/6990=0",
-"0/6991=0",
-"0/6992=0",
-"0/6993=0",
-"0/6994=0",
-"0/6995=0",
-"0/6996=0",
-"0/6997=0",
-"0/6998=0",
-"0/6999=0",
-"0/69+0=0",
-"0/69+1=1",
-"0/69+2=2",
-"0/69+3=3",
-"0/69+4=4",
-"0/69+5=5",
-"0/69+6=6",
-"0/69+7=7",
-"0/69+8=8",
-"0/69+9=9",
-"0/69-0=0",
-"0/69*0=0",
-"0/69*1=0",
-"0/69*2=0",
-"0/69*3=0",
-"0/69*4=0",
-"0/69*5=0",
-"0/69*6=0",
-"0/69*7=0",
-"0/69*8=0",
-"0/69*9=0",
-"0/69/1=0",
-"0/69/2=0",
-"0/69/3=0",
-"0/69/4=0",
-"0/69/5=0",
-"0/69/6=0",
-"0/69/7=0",
-"0/69/8=0",
-"0/69/9=0",
-"0/6-1=-1",
-"0/6-2=-2",
-"0/6-3=-3",
-"0/6-4=-4",
-"0/6-5=-5",
-"0/6-6=-6",
-"0/6-7=-7",
-"0/6-8=-8",
-"0/6-9=-9",
-"0/6*10=0",
-"0/6*11=0",
-"0/6*12=0",
-"0/6*13=0",
-"0/6*14=0",
-"0/6*15=0",
-"0/6*16=0",
-"0/6*17=0",
-"0/6*18=0",
-"0/6*19=0",
-"0/6*20=0",
-"0/6*21=0",
-"0/6*22=0",
-"0/6*23=0",
-"0/6*24=0",
-"0/6*25=0",
-"0/6*26=0",
-"0/6*27=0",
-"0/6*28=0",
-"0/6*29=0",
-"0/6*30=0",
-"0/6*31=0",
-"0/6*32=0",
-"0/6*33=0",
-"0/6*34=0",
-"0/6*35=0",
-"0/6*36=0",
-"0/6*37=0",
-"0/6*38=0",
-"0/6*39=0",
-"0/6*40=0",
-"0/6*41=0",
-"0/6*42=0",
-"0/6*43=0",
-"0/6*44=0",
-"0/6*45=0",
-"0/6*46=0",
-"0/6*47=0",
-"0/6*48=0",
-"0/6*49=0",
-"0/6*50=0",
-"0/6*51=0",
-"0/6*52=0",
-"0/6*53=0",
-"0/6*54=0",
-"0/6*55=0",
-"0/6*56=0",
-"0/6*57=0",
-"0/6*58=0",
-"0/6*59=0",
-"0/6*60=0",
-"0/6*61=0",
-"0/6*62=0",
-"0/6*63=0",
-"0/6*64=0",
-"0/6*65=0",
-"0/6*66=0",
-"0/6*67=0",
-"0/6*68=0",
-"0/6*69=0",
-"0/6*70=0",
-"0/6*71=0",
-"0/6*72=0",
-"0/6*73=0",
-"0/6*74=0",
-"0/6*75=0",
-"0/6*76=0",
-"0/6*77=0",
-"0/6*78=0",
-"0/6*79=0",
-"0/6*80=0",
-"0/6*81=0",
-"0/6*82=0",
-"0/6*83=0",
-"0/6*84=0",
-"0/6*85=0",
-"0/6*86=0",
-"0/6*87=0",
-"0/6*88=0",
-"0/6*89=0",
-"0/6*90=0",
-"0/6*91=0",
-"0/6*92=0",
-"0/6*93=0",
-"0/6*94=0",
-"0/6*95=0",
-"0/6*96=0",
-"0/6*97=0",
-"0/6*98=0",
-"0/6*99=0",
-"0/6/10=0",
-"0/6/11=0",
-"0/6/12=0",
-"0/6/13=0",
-"0/6/14=0",
-"0/6/15=0",
-"0/6/16=0",
-"0/6/17=0",
-"0/6/18=0",
-"0/6/19=0",
-"0/6/20=0",
-"0/6/21=0",
-"0/6/22=0",
-"0/6/23=0",
-"0/6/24=0",
-"0/6/25=0",
-"0/6/26=0",
-"0/6/27=0",
-"0/6/28=0",
-"0/6/29=0",
-"0/6/30=0",
-"0/6/31=0",
-"0/6/32=0",
-"0/6/33=0",
-"0/6/34=0",
-"0/6/35=0",
-"0/6/36=0",
-"0/6/37=0",
-"0/6/38=0",
-"0/6/39=0",
-"0/6/40=0",
-"0/6/41=0",
-"0/6/42=0",
-"0/6/43=0",
-"0/6/44=0",
-"0/6/45=0",
-"0/6/46=0",
-"0/6/47=0",
-"0/6/48=0",
-"0/6/49=0",
-"0/6/50=0",
-"0/6/51=0",
-"0/6/52=0",
-"0/6/53=0",
-"0/6/54=0",
-"0/6/55=0",
-"0/6/56=0",
-"0/6/57=0",
-"0/6/58=0",
-"0/6/59=0",
-"0/6/60=0",
-"0/6/61=0",
-"0/6/62=0",
-"0/6/63=0",
-"0/6/64=0",
-"0/6/65=0",
-"0/6/66=0",
-"0/6/67=0",
-"0/6/68=0",
-"0/6/69=0",
-"0/6/70=0",
-"0/6/71=0",
-"0/6/72=0",
-"0/6/73=0",
-"0/6/74=0",
-"0/6/75=0",
-"0/6/76=0",
-"0/6/77=0",
-"0/6/78=0",
-"0/6/79=0",
-"0/6/80=0",
-"0/6/81=0",
-"0/6/82=0",
-"0/6/83=0",
-"0/6/84=0",
-"0/6/85=0",
-"0/6/86=0",
-"0/6/87=0",
-"0/6/88=0",
-"0/6/89=0",
-"0/6/90=0",
-"0/6/91=0",
-"0/6/92=0",
-"0/6/93=0",
-"0/6/94=0",
-"0/6/95=0",
-"0/6/96=0",
-"0/6/97=0",
-"0/6/98=0",
-"0/6/99=0",
-"0/7000=0",
-"0/7001=0",
-"0/7002=0",
-"0/7003=0",
-"0/7004=0",
-"0/7005=0",
-"0/7006=0",
-"0/7007=0",
-"0/7008=0",
-"0/7009=0",
-"0/7010=0",
-"0/7011=0",
-"0/7012=0",
-"0/7013=0",
-"0/7014=0",
-"0/7015=0",
-"0/7016=0",
-"0/7017=0",
-"0/7018=0",
-"0/7019=0",
-"0/7020=0",
-"0/7021=0",
-"0/7022=0",
-"0/7023=0",
-"0/7024=0",
-"0/7025=0",
-"0/7026=0",
-"0/7027=0",
-"0/7028=0",
-"0/7029=0",
-"0/7030=0",
-"0/7031=0",
-"0/7032=0",
-"0/7033=0",
-"0/7034=0",
-"0/7035=0",
-"0/7036=0",
-"0/7037=0",
-"0/7038=0",
-"0/7039=0",
-"0/7040=0",
-"0/7041=0",
-"0/7042=0",
-"0/7043=0",
-"0/7044=0",
-"0/7045=0",
-"0/7046=0",
-"0/7047=0",
-"0/7048=0",
-"0/7049=0",
-"0/7050=0",
-"0/7051=0",
-"0/7052=0",
-"0/7053=0",
-"0/7054=0",
-"0/7055=0",
-"0/7056=0",
-"0/7057=0",
-"0/7058=0",
-"0/7059=0",
-"0/7060=0",
-"0/7061=0",
-"0/7062=0",
-"0/7063=0",
-"0/7064=0",
-"0/7065=0",
-"0/7066=0",
-"0/7067=0",
-"0/7068=0",
-"0/7069=0",
-"0/7070=0",
-"0/7071=0",
-"0/7072=0",
-"0/7073=0",
-"0/7074=0",
-"0/7075=0",
-"0/7076=0",
-"0/7077=0",
-"0/7078=0",
-"0/7079=0",
-"0/7080=0",
-"0/7081=0",
-"0/7082=0",
-"0/7083=0",
-"0/7084=0",
-"0/7085=0",
-"0/7086=0",
-"0/7087=0",
-"0/7088=0",
-"0/7089=0",
-"0/7090=0",
-"0/7091=0",
-"0/7092=0",
-"0/7093=0",
-"0/7094=0",
-"0/7095=0",
-"0/7096=0",
-"0/7097=0",
-"0/7098=0",
-"0/7099=0",
-"0/70+0=0",
-"0/70+1=1",
-"0/70+2=2",
-"0/70+3=3",
-"0/70+4=4",
-"0/70+5=5",
-"0/70+6=6",
-"0/70+7=7",
-"0/70+8=8",
-"0/70+9=9",
-"0/70-0=0",
-"0/70*0=0",
-"0/70*1=0",
-"0/70*2=0",
-"0/70*3=0",
-"0/70*4=0",
-"0/70*5=0",
-"0/70*6=0",
-"0/70*7=0",
-"0/70*8=0",
-"0/70*9=0",
-"0/70/1=0",
-"0/70/2=0",
-"0/70/3=0",
-"0/70/4=0",
-"0/70/5=0",
-"0/70/6=0",
-"0/70/7=0",
-"0/70/8=0",
-"0/70/9=0",
-"0/7100=0",
-"0/7101=0",
-"0/7102=0",
-"0/7103=0",
-"0/7104=0",
-"0/7105=0",
-"0/7106=0",
-"0/7107=0",
-"0/7108=0",
-"0/7109=0",
-"0/7110=0",
-"0/7111=0",
-"0/7112=0",
-"0/7113=0",
-"0/7114=0",
-"0/7115=0",
-"0/7116=0",
-"0/7117=0",
-"0/7118=0",
-"0/7119=0",
-"0/7120=0",
-"0/7121=0",
-"0/7122=0",
-"0/7123=0",
-"0/7124=0",
-"0/7125=0",
-"0/7126=0",
-"0/7127=0",
-"0/7128=0",
-"0/7129=0",
-"0/7130=0",
-"0/7131=0",
-"0/7132=0",
-"0/7133=0",
-"0/7134=0",
-"0/7135=0",
-"0/7136=0",
-"0/7137=0",
-"0/7138=0",
-"0/7139=0",
-"0/7140=0",
-"0/7141=0",
-"0/7142=0",
-"0/7143=0",
-"0/7144=0",
-"0/7145=0",
-"0/7146=0",
-"0/7147=0",
-"0/7148=0",
-"0/7149=0",
-"0/7150=0",
-"0/7151=0",
-"0/7152=0",
-"0/7153=0",
-"0/7154=0",
-"0/7155=0",
-"0/7156=0",
-"0/7157=0",
-"0/7158=0",
-"0/7159=0",
-"0/7160=0",
-"0/7161=0",
-"0/7162=0",
-"0/7163=0",
-"0/7164=0",
-"0/7165=0",
-"0/7166=0",
-"0/7167=0",
-"0/7168=0",
-"0/7169=0",
-"0/7170=0",
-"0/7171=0",
-"0/7172=0",
-"0/7173=0",
-"0/7174=0",
-"0/7175=0",
-"0/7176=0",
-"0/7177=0",
-"0/7178=0",
-"0/7179=0",
-"0/7180=0",
-"0/7181=0",
-"0/7182=0",
-"0/7183=0",
-"0/7184=0",
-"0/7185=0",
-"0/7186=0",
-"0/7187=0",
-"0/7188=0",
-"0/7189=0",
-"0/7190=0",
-"0/7191=0",
-"0/7192=0",
-"0/7193=0",
-"0/7194=0",
-"0/7195=0",
-"0/7196=0",
-"0/7197=0",
-"0/7198=0",
-"0/7199=0",
-"0/71+0=0",
-"0/71+1=1",
-"0/71+2=2",
-"0/71+3=3",
-"0/71+4=4",
-"0/71+5=5",
-"0/71+6=6",
-"0/71+7=7",
-"0/71+8=8",
-"0/71+9=9",
-"0/71-0=0",
-"0/71*0=0",
-"0/71*1=0",
-"0/71*2=0",
-"0/71*3=0",
-"0/71*4=0",
-"0/71*5=0",
-"0/71*6=0",
-"0/71*7=0",
-"0/71*8=0",
-"0/71*9=0",
-"0/71/1=0",
-"0/71/2=0",
-"0/71/3=0",
-"0/71/4=0",
-"0/71/5=0",
-"0/71/6=0",
-"0/71/7=0",
-"0/71/8=0",
-"0/71/9=0",
-"0/7200=0",
-"0/7201=0",
-"0/7202=0",
-"0/7203=0",
-"0/7204=0",
-"0/7205=0",
-"0/7206=0",
-"0/7207=0",
-"0/7208=0",
-"0/7209=0",
-"0/7210=0",
-"0/7211=0",
-"0/7212=0",
-"0/7213=0",
-"0/7214=0",
-"0/7215=0",
-"0/7216=0",
-"0/7217=0",
-"0/7218=0",
-"0/7219=0",
-"0/7220=0",
-"0/7221=0",
-"0/7222=0",
-"0/7223=0",
-"0/7224=0",
-"0/7225=0",
-"0/7226=0",
-"0/7227=0",
-"0/7228=0",
-"0/7229=0",
-"0/7230=0",
-"0/7231=0",
-"0/7232=0",
-"0/7233=0",
-"0/7234=0",
-"0/7235=0",
-"0/7236=0",
-"0/7237=0",
-"0/7238=0",
-"0/7239=0",
-"0/7240=0",
-"0/7241=0",
-"0/7242=0",
-"0/7243=0",
-"0/7244=0",
-"0/7245=0",
-"0/7246=0",
-"0/7247=0",
-"0/7248=0",
-"0/7249=0",
-"0/7250=0",
-"0/7251=0",
-"0/7252=0",
-"0/7253=0",
-"0/7254=0",
-"0/7255=0",
-"0/7256=0",
-"0/7257=0",
-"0/7258=0",
-"0/7259=0",
-"0/7260=0",
-"0/7261=0",
-"0/7262=0",
-"0/7263=0",
-"0/7264=0",
-"0/7265=0",
-"0/7266=0",
-"0/7267=0",
-"0/7268=0",
-"0/7269=0",
-"0/7270=0",
-"0/7271=0",
-"0/7272=0",
-"0/7273=0",
-"0/7274=0",
-"0/7275=0",
-"0/7276=0",
-"0/7277=0",
-"0/7278=0",
-"0/7279=0",
-"0/7280=0",
-"0/7281=0",
-"0/7282=0",
-"0/7283=0",
-"0/7284=0",
-"0/7285=0",
-"0/7286=0",
-"0/7287=0",
-"0/7288=0",
-"0/7289=0",
-"0/7290=0",
-"0/7291=0",
-"0/7292=0",
-"0/7293=0",
-"0/7294=0",
-"0/7295=0",
-"0/7296=0",
-"0/7297=0",
-"0/7298=0",
-"0/7299=0",
-"0/72+0=0",
-"0/72+1=1",
-"0/72+2=2",
-"0/72+3=3",
-"0/72+4=4",
-"0/72+5=5",
-"0/72+6=6",
-"0/72+7=7",
-"0/72+8=8",
-"0/72+9=9",
-"0/72-0=0",
-"0/72*0=0",
-"0/72*1=0",
-"0/72*2=0",
-"0/72*3=0",
-"0/72*4=0",
-"0/72*5=0",
-"0/72*6=0",
-"0/72*7=0",
-"0/72*8=0",
-"0/72*9=0",
-"0/72/1=0",
-"0/72/2=0",
-"0/72/3=0",
-"0/72/4=0",
-"0/72/5=0",
-"0/72/6=0",
-"0/72/7=0",
-"0/72/8=0",
-"0/72/9=0",
-"0/7300=0",
-"0/7301=0",
-"0/7302=0",
-"0/7303=0",
-"0/7304=0",
-"0/7305=0",
-"0/7306=0",
-"0/7307=0",
-"0/7308=0",
-"0/7309=0",
-"0/7310=0",
-"0/7311=0",
-"0/7312=0",
-"0/7313=0",
-"0/7314=0",
-"0/7315=0",
-"0/7316=0",
-"0/7317=0",
-"0/7318=0",
-"0/7319=0",
-"0/7320=0",
-"0/7321=0",
-"0/7322=0",
-"0/7323=0",
-"0/7324=0",
-"0/7325=0",
-"0/7326=0",
-"0/7327=0",
-"0/7328=0",
-"0/7329=0",
-"0/7330=0",
-"0/7331=0",
-"0/7332=0",
-"0/7333=0",
-"0/7334=0",
-"0/7335=0",
-"0/7336=0",
-"0/7337=0",
-"0/7338=0",
-"0/7339=0",
-"0/7340=0",
-"0/7341=0",
-"0/7342=0",
-"0/7343=0",
-"0/7344=0",
-"0/7345=0",
-"0/7346=0",
-"0/7347=0",
-"0/7348=0",
-"0/7349=0",
-"0/7350=0",
-"0/7351=0",
-"0/7352=0",
-"0/7353=0",
-"0/7354=0",
-"0/7355=0",
-"0/7356=0",
-"0/7357=0",
-"0/7358=0",
-"0/7359=0",
-"0/7360=0",
-"0/7361=0",
-"0/7362=0",
-"0/7363=0",
-"0/7364=0",
-"0/7365=0",
-"0/7366=0",
-"0/7367=0",
-"0/7368=0",
-"0/7369=0",
-"0/7370=0",
-"0/7371=0",
-"0/7372=0",
-"0/7373=0",
-"0/7374=0",
-"0/7375=0",
-"0/7376=0",
-"0/7377=0",
-"0/7378=0",
-"0/7379=0",
-"0/7380=0",
-"0/7381=0",
-"0/7382=0",
-"0/7383=0",
-"0/7384=0",
-"0/7385=0",
-"0/7386=0",
-"0/7387=0",
-"0/7388=0",
-"0/7389=0",
-"0/7390=0",
-"0/7391=0",
-"0/7392=0",
-"0/7393=0",
-"0/7394=0",
-"0/7395=0",
-"0/7396=0",
-"0/7397=0",
-"0/7398=0",
-"0/7399=0",
-"0/73+0=0",
-"0/73+1=1",
-"0/73+2=2",
-"0/73+3=3",
-"0/73+4=4",
-"0/73+5=5",
-"0/73+6=6",
-"0/73+7=7",
-"0/73+8=8",
-"0/73+9=9",
-"0/73-0=0",
-"0/73*0=0",
-"0/73*1=0",
-"0/73*2=0",
-"0/73*3=0",
-"0/73*4=0",
-"0/73*5=0",
-"0/73*6=0",
-"0/73*7=0",
-"0/73*8=0",
-"0/73*9=0",
-"0/73/1=0",
-"0/73/2=0",
-"0/73/3=0",
-"0/73/4=0",
-"0/73/5=0",
-"0/73/6=0",
-"0/73/7=0",
-"0/73/8=0",
-"0/73/9=0",
-"0/7400=0",
-"0/7401=0",
-"0/7402=0",
-"0/7403=0",
-"0/7404=0",
-"0/7405=0",
-"0/7406=0",
-"0/7407=0",
-"0/7408=0",
-"0/7409=0",
-"0/7410=0",
-"0/7411=0",
-"0/7412=0",
-"0/7413=0",
-"0/7414=0",
-"0/7415=0",
-"0/7416=0",
-"0/7417=0",
-"0/7418=0",
-"0/7419=0",
-"0/7420=0",
-"0/7421=0",
-"0/7422=0",
-"0/7423=0",
-"0/7424=0",
-"0/7425=0",
-"0/7426=0",
-"0/7427=0",
-"0/7428=0",
-"0/7429=0",
-"0/7430=0",
-"0/7431=0",
-"0/7432=0",
-"0/7433=0",
-"0/7434=0",
-"0/7435=0",
-"0/7436=0",
-"0/7437=0",
-"0/7438=0",
-"0/7439=0",
-"0/7440=0",
-"0/7441=0",
-"0/7442=0",
-"0/7443=0",
-"0/7444=0",
-"0/7445=0",
-"0/7446=0",
-"0/7447=0",
-"0/7448=0",
-"0/7449=0",
-"0/7450=0",
-"0/7451=0",
-"0/7452=0",
-"0/7453=0",
-"0/7454=0",
-"0/7455=0",
-"0/7456=0",
-"0/7457=0",
-"0/7458=0",
-"0/7459=0",
-"0/7460=0",
-"0/7461=0",
-"0/7462=0",
-"0/7463=0",
-"0/7464=0",
-"0/7465=0",
-"0/7466=0",
-"0/7467=0",
-"0/7468=0",
-"0/7469=0",
-"0/7470=0",
-"0/7471=0",
-"0/7472=0",
-"0/7473=0",
-"0/7474=0",
-"0/7475=0",
-"0/7476=0",
-"0/7477=0",
-"0/7478=0",
-"0/7479=0",
-"0/7480=0",
-"0/7481=0",
-"0/7482=0",
-"0/7483=0",
-"0/7484=0",
-"0/7485=0",
-"0/7486=0",
-"0/7487=0",
-"0/7488=0",
-"0/7489=0",
-"0/7490=0",
-"0/7491=0",
-"0/7492=0",
-"0/7493=0",
-"0/7494=0",
-"0/7495=0",
-"0/7496=0",
-"0/7497=0",
-"0/7498=0",
-"0/7499=0",
-"0/74+0=0",
-"0/74+1=1",
-"0/74+2=2",
-"0/74+3=3",
-"0/74+4=4",
-"0/74+5=5",
-"0/74+6=6",
-"0/74+7=7",
-"0/74+8=8",
-"0/74+9=9",
-"0/74-0=0",
-"0/74*0=0",
-"0/74*1=0",
-"0/74*2=0",
-"0/74*3=0",
-"0/74*4=0",
-"0/74*5=0",
-"0/74*6=0",
-"0/74*7=0",
-"0/74*8=0",
-"0/74*9=0",
-"0/74/1=0",
-"0/74/2=0",
-"0/74/3=0",
-"0/74/4=0",
-"0/74/5=0",
-"0/74/6=0",
-"0/74/7=0",
-"0/74/8=0",
-"0/74/9=0",
-"0/7500=0",
-"0/7501=0",
-"0/7502=0",
-"0/7503=0",
-"0/7504=0",
-"0/7505=0",
-"0/7506=0",
-"0/7507=0",
-"0/7508=0",
-"0/7509=0",
-"0/7510=0",
-"0/7511=0",
-"0/7512=0",
-"0/7513=0",
-"0/7514=0",
-"0/7515=0",
-"0/7516=0",
-"0/7517=0",
-"0/7518=0",
-"0/7519=0",
-"0/7520=0",
-"0/7521=0",
-"0/7522=0",
-"0/7523=0",
-"0/7524=0",
-"0/7525=0",
-"0/7526=0",
-"0/7527=0",
-"0/7528=0",
-"0/7529=0",
-"0/7530=0",
-"0/7531=0",
-"0/7532=0",
-"0/7533=0",
-"0/7534=0",
-"0/7535=0",
-"0/7536=0",
-"0/7537=0",
-"0/7538=0",
-"0/7539=0",
-"0/7540=0",
-"0/7541=0",
-"0/7542=0",
-"0/7543=0",
-"0/7544=0",
-"0/7545=0",
-"0/7546=0",
-"0/7547=0",
-"0/7548=0",
-"0/7549=0",
-"0/7550=0",
-"0/7551=0",
-"0/7552=0",
-"0/7553=0",
-"0/7554=0",
-"0/7555=0",
-"0/7556=0",
-"0/7557=0",
-"0/7558=0",
-"0/7559=0",
-"0/7560=0",
-"0/7561=0",
-"0/7562=0",
-"0/7563=0",
-"0/7564=0",
-"0/7565=0",
-"0/7566=0",
-"0/7567=0",
-"0/7568=0",
-"0/7569=0",
-"0/7570=0",
-"0/7571=0",
-"0/7572=0",
-"0/7573=0",
-"0/7574=0",
-"0/7575=0",
-"0/7576=0",
-"0/7577=0",
-"0/7578=0",
-"0/7579=0",
-"0/7580=0",
-"0/7581=0",
-"0/7582=0",
-"0/7583=0",
-"0/7584=0",
-"0/7585=0",
-"0/7586=0",
-"0/7587=0",
-"0/7588=0",
-"0/7589=0",
-"0/7590=0",
-"0/7591=0",
-"0/7592=0",
-"0/7593=0",
-"0/7594=0",
-"0/7595=0",
-"0/7596=0",
-"0/7597=0",
-"0/7598=0",
-"0/7599=0",
-"0/75+0=0",
-"0/75+1=1",
-"0/75+2=2",
-"0/75+3=3",
-"0/75+4=4",
-"0/75+5=5",
-"0/75+6=6",
-"0/75+7=7",
-"0/75+8=8",
-"0/75+9=9",
-"0/75-0=0",
-"0/75*0=0",
-"0/75*1=0",
-"0/75*2=0",
-"0/75*3=0",
-"0/75*4=0",
-"0/75*5=0",
-"0/75*6=0",
-"0/75*7=0",
-"0/75*8=0",
-"0/75*9=0",
-"0/75/1=0",
-"0/75/2=0",
-"0/75/3=0",
-"0/75/4=0",
-"0/75/5=0",
-"0/75/6=0",
-"0/75/7=0",
-"0/75/8=0",
-"0/75/9=0",
-"0/7600=0",
-"0/7601=0",
-"0/7602=0",
-"0/7603=0",
-"0/7604=0",
-"0/7605=0",
-"0/7606=0",
-"0/7607=0",
-"0/7608=0",
-"0/7609=0",
-"0/7610=0",
-"0/7611=0",
-"0/7612=0",
-"0/7613=0",
-"0/7614=0",
-"0/7615=0",
-"0/7616=0",
-"0/7617=0",
-"0/7618=0",
-"0/7619=0",
-"0/7620=0",
-"0/7621=0",
-"0/7622=0",
-"0/7623=0",
-"0/7624=0",
-"0/7625=0",
-"0/7626=0",
-"0/7627=0",
-"0/7628=0",
-"0/7629=0",
-"0/7630=0",
-"0/7631=0",
-"0/7632=0",
-"0/7633=0",
-"0/7634=0",
-"0/7635=0",
-"0/7636=0",
-"0/7637=0",
-"0/7638=0",
-"0/7639=0",
-"0/7640=0",
-"0/7641=0",
-"0/7642=0",
-"0/7643=0",
-"0/7644=0",
-"0/7645=0",
-"0/7646=0",
-"0/7647=0",
-"0/7648=0",
-"0/7649=0",
-"0/7650=0",
-"0/7651=0",
-"0/7652=0",
-"0/7653=0",
-"0/7654=0",
-"0/7655=0",
-"0/7656=0",
-"0/7657=0",
-"0/7658=0",
-"0/7659=0",
-"0/7660=0",
-"0/7661=0",
-"0/7662=0",
-"0/7663=0",
-"0/7664=0",
-"0/7665=0",
-"0/7666=0",
-"0/7667=0",
-"0/7668=0",
-"0/7669=0",
-"0/7670=0",
-"0/7671=0",
-"0/7672=0",
-"0/7673=0",
-"0/7674=0",
-"0/7675=0",
-"0/7676=0",
-"0/7677=0",
-"0/7678=0",
-"0/7679=0",
-"0/7680=0",
-"0/7681=0",
-"0/7682=0",
-"0/7683=0",
-"0/7684=0",
-"0/7685=0",
-"0/7686=0",
-"0/7687=0",
-"0/7688=0",
-"0/7689=0",
-"0/7690=0",
-"0/7691=0",
-"0/7692=0",
-"0/7693=0",
-"0/7694=0",
-"0/7695=0",
-"0/7696=0",
-"0/7697=0",
-"0/7698=0",
-"0/7699=0",
-"0/76+0=0",
-"0/76+1=1",
-"0/76+2=2",
-"0/76+3=3",
-"0/76+4=4",
-"0/76+5=5",
-"0/76+6=6",
-"0/76+7=7",
-"0/76+8=8",
-"0/76+9=9",
-"0/76-0=0",
-"0/76*0=0",
-"0/76*1=0",
-"0/76*2=0",
-"0/76*3=0",
-"0/76*4=0",
-"0/76*5=0",
-"0/76*6=0",
-"0/76*7=0",
-"0/76*8=0",
-"0/76*9=0",
-"0/76/1=0",
-"0/76/2=0",
-"0/76/3=0",
-"0/76/4=0",
-"0/76/5=0",
-"0/76/6=0",
-"0/76/7=0",
-"0/76/8=0",
-"0/76/9=0",
-"0/7700=0",
-"0/7701=0",
-"0/7702=0",
-"0/7703=0",
-"0/7704=0",
-"0/7705=0",
-"0/7706=0",
-"0/7707=0",
-"0/7708=0",
-"0/7709=0",
-"0/7710=0",
-"0/7711=0",
-"0/7712=0",
-"0/7713=0",
-"0/7714=0",
-"0/7715=0",
-"0/7716=0",
-"0/7717=0",
-"0/7718=0",
-"0/7719=0",
-"0/7720=0",
-"0/7721=0",
-"0/7722=0",
-"0/7723=0",
-"0/7724=0",
-"0/7725=0",
-"0/7726=0",
-"0/7727=0",
-"0/7728=0",
-"0/7729=0",
-"0/7730=0",
-"0/7731=0",
-"0/7732=0",
-"0/7733=0",
-"0/7734=0",
-"0/7735=0",
-"0/7736=0",
-"0/7737=0",
-"0/7738=0",
-"0/7739=0",
-"0/7740=0",
-"0/7741=0",
-"0/7742=0",
-"0/7743=0",
-"0/7744=0",
-"0/7745=0",
-"0/7746=0",
-"0/7747=0",
-"0/7748=0",
-"0/7749=0",
-"0/7750=0",
-"0/7751=0",
-"0/7752=0",
-"0/7753=0",
-"0/7754=0",
-"0/7755=0",
-"0/7756=0",
-"0/7757=0",
-"0/7758=0",
-"0/7759=0",
-"0/7760=0",
-"0/7761=0",
-"0/7762=0",
-"0/7763=0",
-"0/7764=0",
-"0/7765=0",
-"0/7766=0",
-"0/7767=0",
-"0/7768=0",
-"0/7769=0",
-"0/7770=0",
-"0/7771=0",
-"0/7772=0",
-"0/7773=0",
-"0/7774=0",
-"0/7775=0",
-"0/7776=0",
-"0/7777=0",
-"0/7778=0",
-"0/7779=0",
-"0/7780=0",
-"0/7781=0",
-"0/7782=0",
-"0/7783=0",
-"0/7784=0",
-"0/7785=0",
-"0/7786=0",
-"0/7787=0",
-"0/7788=0",
-"0/7789=0",
-"0/7790=0",
-"0/7791=0",
-"0/7792=0",
-"0/7793=0",
-"0/7794=0",
-"0/7795=0",
-"0/7796=0",
-"0/7797=0",
-"0/7798=0",
-"0/7799=0",
-"0/77+0=0",
-"0/77+1=1",
-"0/77+2=2",
-"0/77+3=3",
-"0/77+4=4",
-"0/77+5=5",
-"0/77+6=6",
-"0/77+7=7",
-"0/77+8=8",
-"0/77+9=9",
-"0/77-0=0",
-"0/77*0=0",
-"0/77*1=0",
-"0/77*2=0",
-"0/77*3=0",
-"0/77*4=0",
-"0/77*5=0",
-"0/77*6=0",
-"0/77*7=0",
-"0/77*8=0",
-"0/77*9=0",
-"0/77/1=0",
-"0/77/2=0",
-"0/77/3=0",
-"0/77/4=0",
-"0/77/5=0",
-"0/77/6=0",
-"0/77/7=0",
-"0/77/8=0",
-"0/77/9=0",
-"0/7800=0",
-"0/7801=0",
-"0/7802=0",
-"0/7803=0",
-"0/7804=0",
-"0/7805=0",
-"0/7806=0",
-"0/7807=0",
-"0/7808=0",
-"0/7809=0",
-"0/7810=0",
-"0/7811=0",
-"0/7812=0",
-"0/7813=0",
-"0/7814=0",
-"0/7815=0",
-"0/7816=0",
-"0/7817=0",
-"0/7818=0",
-"0/7819=0",
-"0/7820=0",
-"0/7821=0",
-"0/7822=0",
-"0/7823=0",
-"0/7824=0",
-"0/7825=0",
-"0/7826=0",
-"0/7827=0",
-"0/7828=0",
-"0/7829=0",
-"0/7830=0",
-"0/7831=0",
-"0/7832=0",
-"0/7833=0",
-"0/7834=0",
-"0/7835=0",
-"0/7836=0",
-"0/7837=0",
-"0/7838=0",
-"0/7839=0",
-"0/7840=0",
-"0/7841=0",
-"0/7842=0",
-"0/7843=0",
-"0/7844=0",
-"0/7845=0",
-"0/7846=0",
-"0/7847=0",
-"0/7848=0",
-"0/7849=0",
-"0/7850=0",
-"0/7851=0",
-"0/7852=0",
-"0/7853=0",
-"0/7854=0",
-"0/7855=0",
-"0/7856=0",
-"0/7857=0",
-"0/7858=0",
-"0/7859=0",
-"0/7860=0",
-"0/7861=0",
-"0/7862=0",
-"0/7863=0",
-"0/7864=0",
-"0/7865=0",
-"0/7866=0",
-"0/7867=0",
-"0/7868=0",
-"0/7869=0",
-"0/7870=0",
-"0/7871=0",
-"0/7872=0",
-"0/7873=0",
-"0/7874=0",
-"0/7875=0",
-"0/7876=0",
-"0/7877=0",
-"0/7878=0",
-"0/7879=0",
-"0/7880=0",
-"0/7881=0",
-"0/7882=0",
-"0/7883=0",
-"0/7884=0",
-"0/7885=0",
-"0/7886=0",
-"0/7887=0",
-"0/7888=0",
-"0/7889=0",
-"0/7890=0",
-"0/7891=0",
-"0/7892=0",
-"0/7893=0",
-"0/7894=0",
-"0/7895=0",
-"0/7896=0",
-"0/7897=0",
-"0/7898=0",
-"0/7899=0",
-"0/78+0=0",
-"0/78+1=1",
-"0/78+2=2",
-"0/78+3=3",
-"0/78+4=4",
-"0/78+5=5",
-"0/78+6=6",
-"0/78+7=7",
-"0/78+8=8",
-"0/78+9=9",
-"0/78-0=0",
-"0/78*0=0",
-"0/78*1=0",
-"0/78*2=0",
-"0/78*3=0",
-"0/78*4=0",
-"0/78*5=0",
-"0/78*6=0",
-"0/78*7=0",
-"0/78*8=0",
-"0/78*9=0",
-"0/78/1=0",
-"0/78/2=0",
-"0/78/3=0",
-"0/78/4=0",
-"0/78/5=0",
-"0/78/6=0",
-"0/78/7=0",
-"0/78/8=0",
-"0/78/9=0",
-"0/7900=0",
-"0/7901=0",
-"0/7902=0",
-"0/7903=0",
-"0/7904=0",
-"0/7905=0",
-"0/7906=0",
-"0/7907=0",
-"0/7908=0",
-"0/7909=0",
-"0/7910=0",
-"0/7911=0",
-"0/7912=0",
-"0/7913=0",
-"0/7914=0",
-"0/7915=0",
-"0/7916=0",
-"0/7917=0",
-"0/7918=0",
-"0/7919=0",
-"0/7920=0",
-"0/7921=0",
-"0/7922=0",
-"0/7923=0",
-"0/7924=0",
-"0/7925=0",
-"0/7926=0",
-"0/7927=0",
-"0/7928=0",
-"0/7929=0",
-"0/7930=0",
-"0/7931=0",
-"0/7932=0",
-"0/7933=0",
-"0/7934=0",
-"0/7935=0",
-"0/7936=0",
-"0/7937=0",
-"0/7938=0",
-"0/7939=0",
-"0/7940=0",
-"0/7941=0",
-"0/7942=0",
-"0/7943=0",
-"0/7944=0",
-"0/7945=0",
-"0/7946=0",
-"0/7947=0",
-"0/7948=0",
-"0/7949=0",
-"0/7950=0",
-"0/7951=0",
-"0/7952=0",
-"0/7953=0",
-"0/7954=0",
-"0/7955=0",
-"0/7956=0",
-"0/7957=0",
-"0/7958=0",
-"0/7959=0",
-"0/7960=0",
-"0/7961=0",
-"0/7962=0",
-"0/7963=0",
-"0/7964=0",
-"0/7965=0",
-"0/7966=0",
-"0/7967=0",
-"0/7968=0",
-"0/7969=0",
-"0/7970=0",
-"0/7971=0",
-"0/7972=0",
-"0/7973=0",
-"0/7974=0",
-"0/7975=0",
-"0/7976=0",
-"0/7977=0",
-"0/7978=0",
-"0/7979=0",
-"0/7980=0",
-"0/7981=0",
-"0/7982=0",
-"0/7983=0",
-"0/7984=0",
-"0/7985=0",
-"0/7986=0",
-"0/7987=0",
-"0/7988=0",
-"0/7989=0",
-"0/7990=0",
-"0/7991=0",
-"0/7992=0",
-"0/7993=0",
-"0/7994=0",
-"0/7995=0",
-"0/7996=0",
-"0/7997=0",
-"0/7998=0",
-"0/7999=0",
-"0/79+0=0",
-"0/79+1=1",
-"0/79+2=2",
-"0/79+3=3",
-"0/79+4=4",
-"0/79+5=5",
-"0/79+6=6",
-"0/79+7=7",
-"0/79+8=8",
-"0/79+9=9",
-"0/79-0=0",
-"0/79*0=0",
-"0/79*1=0",
-"0/79*2=0",
-"0/79*3=0",
-"0/79*4=0",
-"0/79*5=0",
-"0/79*6=0",
-"0/79*7=0",
-"0/79*8=0",
-"0/79*9=0",
-"0/79/1=0",
-"0/79/2=0",
-"0/79/3=0",
-"0/79/4=0",
-"0/79/5=0",
-"0/79/6=0",
-"0/79/7=0",
-"0/79/8=0",
-"0/79/9=0",
-"0/7-1=-1",
-"0/7-2=-2",
-"0/7-3=-3",
-"0/7-4=-4",
-"0/7-5=-5",
-"0/7-6=-6",
-"0/7-7=-7",
-"0/7-8=-8",
-"0/7-9=-9",
-"0/7*10=0",
-"0/7*11=0",
-"0/7*12=0",
-"0/7*13=0",
-"0/7*14=0",
-"0/7*15=0",
-"0/7*16=0",
-"0/7*17=0",
-"0/7*18=0",
-"0/7*19=0",
-"0/7*20=0",
-"0/7*21=0",
-"0/7*22=0",
-"0/7*23=0",
-"0/7*24=0",
-"0/7*25=0",
-"0/7*26=0",
-"0/7*27=0",
-"0/7*28=0",
-"0/7*29=0",
-"0/7*30=0",
-"0/7*31=0",
-"0/7*32=0",
-"0/7*33=0",
-"0/7*34=0",
-"0/7*35=0",
-"0/7*36=0",
-"0/7*37=0",
-"0/7*38=0",
-"0/7*39=0",
-"0/7*40=0",
-"0/7*41=0",
-"0/7*42=0",
-"0/7*43=0",
-"0/7*44=0",
-"0/7*45=0",
-"0/7*46=0",
-"0/7*47=0",
-"0/7*48=0",
-"0/7*49=0",
-"0/7*50=0",
-"0/7*51=0",
-"0/7*52=0",
-"0/7*53=0",
-"0/7*54=0",
-"0/7*55=0",
-"0/7*56=0",
-"0/7*57=0",
-"0/7*58=0",
-"0/7*59=0",
-"0/7*60=0",
-"0/7*61=0",
-"0/7*62=0",
-"0/7*63=0",
-"0/7*64=0",
-"0/7*65=0",
-"0/7*66=0",
-"0/7*67=0",
-"0/7*68=0",
-"0/7*69=0",
-"0/7*70=0",
-"0/7*71=0",
-"0/7*72=0",
-"0/7*73=0",
-"0/7*74=0",
-"0/7*75=0",
-"0/7*76=0",
-"0/7*77=0",
-"0/7*78=0",
-"0/7*79=0",
-"0/7*80=0",
-"0/7*81=0",
-"0/7*82=0",
-"0/7*83=0",
-"0/7*84=0",
-"0/7*85=0",
-"0/7*86=0",
-"0/7*87=0",
-"0/7*88=0",
-"0/7*89=0",
-"0/7*90=0",
-"0/7*91=0",
-"0/7*92=0",
-"0/7*93=0",
-"0/7*94=0",
-"0/7*95=0",
-"0/7*96=0",
-"0/7*97=0",
-"0/7*98=0",
-"0/7*99=0",
-"0/7/10=0",
-"0/7/11=0",
-"0/7/12=0",
-"0/7/13=0",
-"0/7/14=0",
-"0/7/15=0",
-"0/7/16=0",
-"0/7/17=0",
-"0/7/18=0",
-"0/7/19=0",
-"0/7/20=0",
-"0/7/21=0",
-"0/7/22=0",
-"0/7/23=0",
-"0/7/24=0",
-"0/7/25=0",
-"0/7/26=0",
-"0/7/27=0",
-"0/7/28=0",
-"0/7/29=0",
-"0/7/30=0",
-"0/7/31=0",
-"0/7/32=0",
-"0/7/33=0",
-"0/7/34=0",
-"0/7/35=0",
-"0/7/36=0",
-"0/7/37=0",
-"0/7/38=0",
-"0/7/39=0",
-"0/7/40=0",
-"0/7/41=0",
-"0/7/42=0",
-"0/7/43=0",
-"0/7/44=0",
-"0/7/45=0",
-"0/7/46=0",
-"0/7/47=0",
-"0/7/48=0",
-"0/7/49=0",
-"0/7/50=0",
-"0/7/51=0",
-"0/7/52=0",
-"0/7/53=0",
-"0/7/54=0",
-"0/7/55=0",
-"0/7/56=0",
-"0/7/57=0",
-"0/7/58=0",
-"0/7/59=0",
-"0/7/60=0",
-"0/7/61=0",
-"0/7/62=0",
-"0/7/63=0",
-"0/7/64=0",
-"0/7/65=0",
-"0/7/66=0",
-"0/7/67=0",
-"0/7/68=0",
-"0/7/69=0",
-"0/7/70=0",
-"0/7/71=0",
-"0/7/72=0",
-"0/7/73=0",
-"0/7/74=0",
-"0/7/75=0",
-"0/7/76=0",
-"0/7/77=0",
-"0/7/78=0",
-"0/7/79=0",
-"0/7/80=0",
-"0/7/81=0",
-"0/7/82=0",
-"0/7/83=0",
-"0/7/84=0",
-"0/7/85=0",
-"0/7/86=0",
-"0/7/87=0",
-"0/7/88=0",
-"0/7/89=0",
-"0/7/90=0",
-"0/7/91=0",
-"0/7/92=0",
-"0/7/93=0",
-"0/7/94=0",
-"0/7/95=0",
-"0/7/96=0",
-"0/7/97=0",
-"0/7/98=0",
-"0/7/99=0",
-"0/8000=0",
-"0/8001=0",
-"0/8002=0",
-"0/8003=0",
-"0/8004=0",
-"0/8005=0",
-"0/8006=0",
-"0/8007=0",
-"0/8008=0",
-"0/8009=0",
-"0/8010=0",
-"0/8011=0",
-"0/8012=0",
-"0/8013=0",
-"0/8014=0",
-"0/8015=0",
-"0/8016=0",
-"0/8017=0",
-"0/8018=0",
-"0/8019=0",
-"0/8020=0",
-"0/8021=0",
-"0/8022=0",
-"0/8023=0",
-"0/8024=0",
-"0/8025=0",
-"0/8026=0",
-"0/8027=0",
-"0/8028=0",
-"0/8029=0",
-"0/8030=0",
-"0/8031=0",
-"0/8032=0",
-"0/8033=0",
-"0/8034=0",
-"0/8035=0",
-"0/8036=0",
-"0/8037=0",
-"0/8038=0",
-"0/8039=0",
-"0/8040=0",
-"0/8041=0",
-"0/8042=0",
-"0/8043=0",
-"0/8044=0",
-"0/8045=0",
-"0/8046=0",
-"0/8047=0",
-"0/8048=0",
-"0/8049=0",
-"0/8050=0",
-"0/8051=0",
-"0/8052=0",
-"0/8053=0",
-"0/8054=0",
-"0/8055=0",
-"0/8056=0",
-"0/8057=0",
-"0/8058=0",
-"0/8059=0",
-"0/8060=0",
-"0/8061=0",
-"0/8062=0",
-"0/8063=0",
-"0/8064=0",
-"0/8065=0",
-"0/8066=0",
-"0/8067=0",
-"0/8068=0",
-"0/8069=0",
-"0/8070=0",
-"0/8071=0",
-"0/8072=0",
-"0/8073=0",
-"0/8074=0",
-"0/8075=0",
-"0/8076=0",
-"0/8077=0",
-"0/8078=0",
-"0/8079=0",
-"0/8080=0",
-"0/8081=0",
-"0/8082=0",
-"0/8083=0",
-"0/8084=0",
-"0/8085=0",
-"0/8086=0",
-"0/8087=0",
-"0/8088=0",
-"0/8089=0",
-"0/8090=0",
-"0/8091=0",
-"0/8092=0",
-"0/8093=0",
-"0/8094=0",
-"0/8095=0",
-"0/8096=0",
-"0/8097=0",
-"0/8098=0",
-"0/8099=0",
-"0/80+0=0",
-"0/80+1=1",
-"0/80+2=2",
-"0/80+3=3",
-"0/80+4=4",
-"0/80+5=5",
-"0/80+6=6",
-"0/80+7=7",
-"0/80+8=8",
-"0/80+9=9",
-"0/80-0=0",
-"0/80*0=0",
-"0/80*1=0",
-"0/80*2=0",
-"0/80*3=0",
-"0/80*4=0",
-"0/80*5=0",
-"0/80*6=0",
-"0/80*7=0",
-"0/80*8=0",
-"0/80*9=0",
-"0/80/1=0",
-"0/80/2=0",
-"0/80/3=0",
-"0/80/4=0",
-"0/80/5=0",
-"0/80/6=0",
-"0/80/7=0",
-"0/80/8=0",
-"0/80/9=0",
-"0/8100=0",
-"0/8101=0",
-"0/8102=0",
-"0/8103=0",
-"0/8104=0",
-"0/8105=0",
-"0/8106=0",
-"0/8107=0",
-"0/8108=0",
-"0/8109=0",
-"0/8110=0",
-"0/8111=0",
-"0/8112=0",
-"0/8113=0",
-"0/8114=0",
-"0/8115=0",
-"0/8116=0",
-"0/8117=0",
-"0/8118=0",
-"0/8119=0",
-"0/8120=0",
-"0/8121=0",
-"0/8122=0",
-"0/8123=0",
-"0/8124=0",
-"0/8125=0",
-"0/8126=0",
-"0/8127=0",
-"0/8128=0",
-"0/8129=0",
-"0/8130=0",
-"0/8131=0",
-"0/8132=0",
-"0/8133=0",
-"0/8134=0",
-"0/8135=0",
-"0/8136=0",
-"0/8137=0",
-"0/8138=0",
-"0/8139=0",
-"0/8140=0",
-"0/8141=0",
-"0/8142=0",
-"0/8143=0",
-"0/8144=0",
-"0/8145=0",
-"0/8146=0",
-"0/8147=0",
-"0/8148=0",
-"0/8149=0",
-"0/8150=0",
-"0/8151=0",
-"0/8152=0",
-"0/8153=0",
-"0/8154=0",
-"0/8155=0",
-"0/8156=0",
-"0/8157=0",
-"0/8158=0",
-"0/8159=0",
-"0/8160=0",
-"0/8161=0",
-"0/8162=0",
-"0/8163=0",
-"0/8164=0",
-"0/8165=0",
-"0/8166=0",
-"0/8167=0",
-"0/8168=0",
-"0/8169=0",
-"0/8170=0",
-"0/8171=0",
-"0/8172=0",
-"0/8173=0",
-"0/8174=0",
-"0/8175=0",
-"0/8176=0",
-"0/8177=0",
-"0/8178=0",
-"0/8179=0",
-"0/8180=0",
-"0/8181=0",
-"0/8182=0",
-"0/8183=0",
-"0/8184=0",
-"0/8185=0",
-"0/8186=0",
-"0/8187=0",
-"0/8188=0",
-"0/8189=0",
-"0/8190=0",
-"0/8191=0",
-"0/8192=0",
-"0/8193=0",
-"0/8194=0",
-"0/8195=0",
-"0/8196=0",
-"0/8197=0",
-"0/8198=0",
-"0/8199=0",
-"0/81+0=0",
-"0/81+1=1",
-"0/81+2=2",
-"0/81+3=3",
-"0/81+4=4",
-"0/81+5=5",
-"0/81+6=6",
-"0/81+7=7",
-"0/81+8=8",
-"0/81+9=9",
-"0/81-0=0",
-"0/81*0=0",
-"0/81*1=0",
-"0/81*2=0",
-"0/81*3=0",
-"0/81*4=0",
-"0/81*5=0",
-"0/81*6=0",
-"0/81*7=0",
-"0/81*8=0",
-"0/81*9=0",
-"0/81/1=0",
-"0/81/2=0",
-"0/81/3=0",
-"0/81/4=0",
-"0/81/5=0",
-"0/81/6=0",
-"0/81/7=0",
-"0/81/8=0",
-"0/81/9=0",
-"0/8200=0",
-"0/8201=0",
-"0/8202=0",
-"0/8203=0",
-"0/8204=0",
-"0/8205=0",
-"0/8206=0",
-"0/8207=0",
-"0/8208=0",
-"0/8209=0",
-"0/8210=0",
-"0/8211=0",
-"0/8212=0",
-"0/8213=0",
-"0/8214=0",
-"0/8215=0",
-"0/8216=0",
-"0/8217=0",
-"0/8218=0",
-"0/8219=0",
-"0/8220=0",
-"0/8221=0",
-"0/8222=0",
-"0/8223=0",
-"0/8224=0",
-"0/8225=0",
-"0/8226=0",
-"0/8227=0",
-"0/8228=0",
-"0/8229=0",
-"0/8230=0",
-"0/8231=0",
-"0/8232=0",
-"0/8233=0",
-"0/8234=0",
-"0/8235=0",
-"0/8236=0",
-"0/8237=0",
-"0/8238=0",
-"0/8239=0",
-"0/8240=0",
-"0/8241=0",
-"0/8242=0",
-"0/8243=0",
-"0/8244=0",
-"0/8245=0",
-"0/8246=0",
-"0/8247=0",
-"0/8248=0",
-"0/8249=0",
-"0/8250=0",
-"0/8251=0",
-"0/8252=0",
-"0/8253=0",
-"0/8254=0",
-"0/8255=0",
-"0/8256=0",
-"0/8257=0",
-"0/8258=0",
-"0/8259=0",
-"0/8260=0",
-"0/8261=0",
-"0/8262=0",
-"0/8263=0",
-"0/8264=0",
-"0/8265=0",
-"0/8266=0",
-"0/8267=0",
-"0/8268=0",
-"0/8269=0",
-"0/8270=0",
-"0/8271=0",
-"0/8272=0",
-"0/8273=0",
-"0/8274=0",
-"0/8275=0",
-"0/8276=0",
-"0/8277=0",
-"0/8278=0",
-"0/8279=0",
-"0/8280=0",
-"0/8281=0",
-"0/8282=0",
-"0/8283=0",
-"0/8284=0",
-"0/8285=0",
-"0/8286=0",
-"0/8287=0",
-"0/8288=0",
-"0/8289=0",
-"0/8290=0",
-"0/8291=0",
-"0/8292=0",
-"0/8293=0",
-"0/8294=0",
-"0/8295=0",
-"0/8296=0",
-"0/8297=0",
-"0/8298=0",
-"0/8299=0",
-"0/82+0=0",
-"0/82+1=1",
-"0/82+2=2",
-"0/82+3=3",
-"0/82+4=4",
-"0/82+5=5",
-"0/82+6=6",
-"0/82+7=7",
-"0/82+8=8",
-"0/82+9=9",
-"0/82-0=0",
-"0/82*0=0",
-"0/82*1=0",
-"0/82*2=0",
-"0/82*3=0",
-"0/82*4=0",
-"0/82*5=0",
-"0/82*6=0",
-"0/82*7=0",
-"0/82*8=0",
-"0/82*9=0",
-"0/82/1=0",
-"0/82/2=0",
-"0/82/3=0",
-"0/82/4=0",
-"0/82/5=0",
-"0/82/6=0",
-"0/82/7=0",
-"0/82/8=0",
-"0/82/9=0",
-"0/8300=0",
-"0/8301=0",
-"0/8302=0",
-"0/8303=0",
-"0/8304=0",
-"0/8305=0",
-"0/8306=0",
-"0/8307=0",
-"0/8308=0",
-"0/8309=0",
-"0/8310=0",
-"0/8311=0",
-"0/8312=0",
-"0/8313=0",
-"0/8314=0",
-"0/8315=0",
-"0/8316=0",
-"0/8317=0",
-"0/8318=0",
-"0/8319=0",
-"0/8320=0",
-"0/8321=0",
-"0/8322=0",
-"0/8323=0",
-"0/8324=0",
-"0/8325=0",
-"0/8326=0",
-"0/8327=0",
-"0/8328=0",
-"0/8329=0",
-"0/8330=0",
-"0/8331=0",
-"0/8332=0",
-"0/8333=0",
-"0/8334=0",
-"0/8335=0",
-"0/8336=0",
-"0/8337=0",
-"0/8338=0",
-"0/8339=0",
-"0/8340=0",
-"0/8341=0",
-"0/8342=0",
-"0/8343=0",
-"0/8344=0",
-"0/8345=0",
-"0/8346=0",
-"0/8347=0",
-"0/8348=0",
-"0/8349=0",
-"0/8350=0",
-"0/8351=0",
-"0/8352=0",
-"0/8353=0",
-"0/8354=0",
-"0/8355=0",
-"0/8356=0",
-"0/8357=0",
-"0/8358=0",
-"0/8359=0",
-"0/8360=0",
-"0/8361=0",
-"0/8362=0",
-"0/8363=0",
-"0/8364=0",
-"0/8365=0",
-"0/8366=0",
-"0/8367=0",
-"0/8368=0",
-"0/8369=0",
-"0/8370=0",
-"0/8371=0",
-"0/8372=0",
-"0/8373=0",
-"0/8374=0",
-"0/8375=0",
-"0/8376=0",
-"0/8377=0",
-"0/8378=0",
-"0/8379=0",
-"0/8380=0",
-"0/8381=0",
-"0/8382=0",
-"0/8383=0",
-"0/8384=0",
-"0/8385=0",
-"0/8386=0",
-"0/8387=0",
-"0/8388=0",
-"0/8389=0",
-"0/8390=0",
-"0/8391=0",
-"0/8392=0",
-"0/8393=0",
-"0/8394=0",
-"0/8395=0",
-"0/8396=0",
-"0/8397=0",
-"0/8398=0",
-"0/8399=0",
-"0/83+0=0",
-"0/83+1=1",
-"0/83+2=2",
-"0/83+3=3",
-"0/83+4=4",
-"0/83+5=5",
-"0/83+6=6",
-"0/83+7=7",
-"0/83+8=8",
-"0/83+9=9",
-"0/83-0=0",
-"0/83*0=0",
-"0/83*1=0",
-"0/83*2=0",
-"0/83*3=0",
-"0/83*4=0",
-"0/83*5=0",
-"0/83*6=0",
-"0/83*7=0",
-"0/83*8=0",
-"0/83*9=0",
-"0/83/1=0",
-"0/83/2=0",
-"0/83/3=0",
-"0/83/4=0",
-"0/83/5=0",
-"0/83/6=0",
-"0/83/7=0",
-"0/83/8=0",
-"0/83/9=0",
-"0/8400=0",
-"0/8401=0",
-"0/8402=0",
-"0/8403=0",
-"0/8404=0",
-"0/8405=0",
-"0/8406=0",
-"0/8407=0",
-"0/8408=0",
-"0/8409=0",
-"0/8410=0",
-"0/8411=0",
-"0/8412=0",
-"0/8413=0",
-"0/8414=0",
-"0/8415=0",
-"0/8416=0",
-"0/8417=0",
-"0/8418=0",
-"0/8419=0",
-"0/8420=0",
-"0/8421=0",
-"0/8422=0",
-"0/8423=0",
-"0/8424=0",
-"0/8425=0",
-"0/8426=0",
-"0/8427=0",
-"0/8428=0",
-"0/8429=0",
-"0/8430=0",
-"0/8431=0",
-"0/8432=0",
-"0/8433=0",
-"0/8434=0",
-"0/8435=0",
-"0/8436=0",
-"0/8437=0",
-"0/8438=0",
-"0/8439=0",
-"0/8440=0",
-"0/8441=0",
-"0/8442=0",
-"0/8443=0",
-"0/8444=0",
-"0/8445=0",
-"0/8446=0",
-"0/8447=0",
-"0/8448=0",
-"0/8449=0",
-"0/8450=0",
-"0/8451=0",
-"0/8452=0",
-"0/8453=0",
-"0/8454=0",
-"0/8455=0",
-"0/8456=0",
-"0/8457=0",
-"0/8458=0",
-"0/8459=0",
-"0/8460=0",
-"0/8461=0",
-"0/8462=0",
-"0/8463=0",
-"0/8464=0",
-"0/8465=0",
-"0/8466=0",
-"0/8467=0",
-"0/8468=0",
-"0/8469=0",
-"0/8470=0",
-"0/8471=0",
-"0/8472=0",
-"0/8473=0",
-"0/8474=0",
-"0/8475=0",
-"0/8476=0",
-"0/8477=0",
-"0/8478=0",
-"0/8479=0",
-"0/8480=0",
-"0/8481=0",
-"0/8482=0",
-"0/8483=0",
-"0/8484=0",
-"0/8485=0",
-"0/8486=0",
-"0/8487=0",
-"0/8488=0",
-"0/8489=0",
-"0/8490=0",
-"0/8491=0",
-"0/8492=0",
-"0/8493=0",
-"0/8494=0",
-"0/8495=0",
-"0/8496=0",
-"0/8497=0",
-"0/8498=0",
-"0/8499=0",
-"0/84+0=0",
-"0/84+1=1",
-"0/84+2=2",
-"0/84+3=3",
-"0/84+4=4",
-"0/84+5=5",
-"0/84+6=6",
-"0/84+7=7",
-"0/84+8=8",
-"0/84+9=9",
-"0/84-0=0",
-"0/84*0=0",
-"0/84*1=0",
-"0/84*2=0",
-"0/84*3=0",
-"0/84*4=0",
-"0/84*5=0",
-"0/84*6=0",
-"0/84*7=0",
-"0/84*8=0",
-"0/84*9=0",
-"0/84/1=0",
-"0/84/2=0",
-"0/84/3=0",
-"0/84/4=0",
-"0/84/5=0",
-"0/84/6=0",
-"0/84/7=0",
-"0/84/8=0",
-"0/84/9=0",
-"0/8500=0",
-"0/8501=0",
-"0/8502=0",
-"0/8503=0",
-"0/8504=0",
-"0/8505=0",
-"0/8506=0",
-"0/8507=0",
-"0/8508=0",
-"0/8509=0",
-"0/8510=0",
-"0/8511=0",
-"0/8512=0",
-"0/8513=0",
-"0/8514=0",
-"0/8515=0",
-"0/8516=0",
-"0/8517=0",
-"0/8518=0",
-"0/8519=0",
-"0/8520=0",
-"0/8521=0",
-"0/8522=0",
-"0/8523=0",
-"0/8524=0",
-"0/8525=0",
-"0/8526=0",
-"0/8527=0",
-"0/8528=0",
-"0/8529=0",
-"0/8530=0",
-"0/8531=0",
-"0/8532=0",
-"0/8533=0",
-"0/8534=0",
-"0/8535=0",
-"0/8536=0",
-"0/8537=0",
-"0/8538=0",
-"0/8539=0",
-"0/8540=0",
-"0/8541=0",
-"0/8542=0",
-"0/8543=0",
-"0/8544=0",
-"0/8545=0",
-"0/8546=0",
-"0/8547=0",
-"0/8548=0",
-"0/8549=0",
-"0/8550=0",
-"0/8551=0",
-"0/8552=0",
-"0/8553=0",
-"0/8554=0",
-"0/8555=0",
-"0/8556=0",
-"0/8557=0",
-"0/8558=0",
-"0/8559=0",
-"0/8560=0",
-"0/8561=0",
-"0/8562=0",
-"0/8563=0",
-"0/8564=0",
-"0/8565=0",
-"0/8566=0",
-"0/8567=0",
-"0/8568=0",
-"0/8569=0",
-"0/8570=0",
-"0/8571=0",
-"0/8572=0",
-"0/8573=0",
-"0/8574=0",
-"0/8575=0",
-"0/8576=0",
-"0/8577=0",
-"0/8578=0",
-"0/8579=0",
-"0/8580=0",
-"0/8581=0",
-"0/8582=0",
-"0/8583=0",
-"0/8584=0",
-"0/8585=0",
-"0/8586=0",
-"0/8587=0",
-"0/8588=0",
-"0/8589=0",
-"0/8590=0",
-"0/8591=0",
-"0/8592=0",
-"0/8593=0",
-"0/8594=0",
-"0/8595=0",
-"0/8596=0",
-"0/8597=0",
-"0/8598=0",
-"0/8599=0",
-"0/85+0=0",
-"0/85+1=1",
-"0/85+2=2",
-"0/85+3=3",
-"0/85+4=4",
-"0/85+5=5",
-"0/85+6=6",
-"0/85+7=7",
-"0/85+8=8",
-"0/85+9=9",
-"0/85-0=0",
-"0/85*0=0",
-"0/85*1=0",
-"0/85*2=0",
-"0/85*3=0",
-"0/85*4=0",
-"0/85*5=0",
-"0/85*6=0",
-"0/85*7=0",
-"0/85*8=0",
-"0/85*9=0",
-"0/85/1=0",
-"0/85/2=0",
-"0/85/3=0",
-"0/85/4=0",
-"0/85/5=0",
-"0/85/6=0",
-"0/85/7=0",
-"0/85/8=0",
-"0/85/9=0",
-"0/8600=0",
-"0/8601=0",
-"0/8602=0",
-"0/8603=0",
-"0/8604=0",
-"0/8605=0",
-"0/8606=0",
-"0/8607=0",
-"0/8608=0",
-"0/8609=0",
-"0/8610=0",
-"0/8611=0",
-"0/8612=0",
-"0/8613=0",
-"0/8614=0",
-"0/8615=0",
-"0/8616=0",
-"0/8617=0",
-"0/8618=0",
-"0/8619=0",
-"0/8620=0",
-"0/8621=0",
-"0/8622=0",
-"0/8623=0",
-"0/8624=0",
-"0/8625=0",
-"0/8626=0",
-"0/8627=0",
-"0/8628=0",
-"0/8629=0",
-"0/8630=0",
-"0/8631=0",
-"0/8632=0",
-"0/8633=0",
-"0/8634=0",
-"0/8635=0",
-"0/8636=0",
-"0/8637=0",
-"0/8638=0",
-"0/8639=0",
-"0/8640=0",
-"0/8641=0",
-"0/8642=0",
-"0/8643=0",
-"0/8644=0",
-"0/8645=0",
-"0/8646=0",
-"0/8647=0",
-"0/8648=0",
-"0/8649=0",
-"0/8650=0",
-"0/8651=0",
-"0/8652=0",
-"0/8653=0",
-"0/8654=0",
-"0/8655=0",
-"0/8656=0",
-"0/8657=0",
-"0/8658=0",
-"0/8659=0",
-"0/8660=0",
-"0/8661=0",
-"0/8662=0",
-"0/8663=0",
-"0/8664=0",
-"0/8665=0",
-"0/8666=0",
-"0/8667=0",
-"0/8668=0",
-"0/8669=0",
-"0/8670=0",
-"0/8671=0",
-"0/8672=0",
-"0/8673=0",
-"0/8674=0",
-"0/8675=0",
-"0/8676=0",
-"0/8677=0",
-"0/8678=0",
-"0/8679=0",
-"0/8680=0",
-"0/8681=0",
-"0/8682=0",
-"0/8683=0",
-"0/8684=0",
-"0/8685=0",
-"0/8686=0",
-"0/8687=0",
-"0/8688=0",
-"0/8689=0",
-"0/8690=0",
-"0/8691=0",
-"0/8692=0",
-"0/8693=0",
-"0/8694=0",
-"0/8695=0",
-"0/8696=0",
-"0/8697=0",
-"0/8698=0",
-"0/8699=0",
-"0/86+0=0",
-"0/86+1=1",
-"0/86+2=2",
-"0/86+3=3",
-"0/86+4=4",
-"0/86+5=5",
-"0/86+6=6",
-"0/86+7=7",
-"0/86+8=8",
-"0/86+9=9",
-"0/86-0=0",
-"0/86*0=0",
-"0/86*1=0",
-"0/86*2=0",
-"0/86*3=0",
-"0/86*4=0",
-"0/86*5=0",
-"0/86*6=0",
-"0/86*7=0",
-"0/86*8=0",
-"0/86*9=0",
-"0/86/1=0",
-"0/86/2=0",
-"0/86/3=0",
-"0/86/4=0",
-"0/86/5=0",
-"0/86/6=0",
-"0/86/7=0",
-"0/86/8=0",
-"0/86/9=0",
-"0/8700=0",
-"0/8701=0",
-"0/8702=0",
-"0/8703=0",
-"0/8704=0",
-"0/8705=0",
-"0/8706=0",
-"0/8707=0",
-"0/8708=0",
-"0/8709=0",
-"0/8710=0",
-"0/8711=0",
-"0/8712=0",
-"0/8713=0",
-"0/8714=0",
-"0/8715=0",
-"0/8716=0",
-"0/8717=0",
-"0/8718=0",
-"0/8719=0",
-"0/8720=0",
-"0/8721=0",
-"0/8722=0",
-"0/8723=0",
-"0/8724=0",
-"0/8725=0",
-"0/8726=0",
-"0/8727=0",
-"0/8728=0",
-"0/8729=0",
-"0/8730=0",
-"0/8731=0",
-"0/8732=0",
-"0/8733=0",
-"0/8734=0",
-"0/8735=0",
-"0/8736=0",
-"0/8737=0",
-"0/8738=0",
-"0/8739=0",
-"0/8740=0",
-"0/8741=0",
-"0/8742=0",
-"0/8743=0",
-"0/8744=0",
-"0/8745=0",
-"0/8746=0",
-"0/8747=0",
-"0/8748=0",
-"0/8749=0",
-"0/8750=0",
-"0/8751=0",
-"0/8752=0",
-"0/8753=0",
-"0/8754=0",
-"0/8755=0",
-"0/8756=0",
-"0/8757=0",
-"0/8758=0",
-"0/8759=0",
-"0/8760=0",
-"0/8761=0",
-"0/8762=0",
-"0/8763=0",
-"0/8764=0",
-"0/8765=0",
-"0/8766=0",
-"0/8767=0",
-"0/8768=0",
-"0/8769=0",
-"0/8770=0",
-"0/8771=0",
-"0/8772=0",
-"0/8773=0",
-"0/8774=0",
-"0/8775=0",
-"0/8776=0",
-"0/8777=0",
-"0/8778=0",
-"0/8779=0",
-"0/8780=0",
-"0/8781=0",
-"0/8782=0",
-"0/8783=0",
-"0/8784=0",
-"0/8785=0",
-"0/8786=0",
-"0/8787=0",
-"0/8788=0",
-"0/8789=0",
-"0/8790=0",
-"0/8791=0",
-"0/8792=0",
-"0/8793=0",
-"0/8794=0",
-"0/8795=0",
-"0/8796=0",
-"0/8797=0",
-"0/8798=0",
-"0/8799=0",
-"0/87+0=0",
-"0/87+1=1",
-"0/87+2=2",
-"0/87+3=3",
-"0/87+4=4",
-"0/87+5=5",
-"0/87+6=6",
-"0/87+7=7",
-"0/87+8=8",
-"0/87+9=9",
-"0/87-0=0",
-"0/87*0=0",
-"0/87*1=0",
-"0/87*2=0",
-"0/87*3=0",
-"0/87*4=0",
-"0/87*5=0",
-"0/87*6=0",
-"0/87*7=0",
-"0/87*8=0",
-"0/87*9=0",
-"0/87/1=0",
-"0/87/2=0",
-"0/87/3=0",
-"0/87/4=0",
-"0/87/5=0",
-"0/87/6=0",
-"0/87/7=0",
-"0/87/8=0",
-"0/87/9=0",
-"0/8800=0",
-"0/8801=0",
-"0/8802=0",
-"0/8803=0",
-"0/8804=0",
-"0/8805=0",
-"0/8806=0",
-"0/8807=0",
-"0/8808=0",
-"0/8809=0",
-"0/8810=0",
-"0/8811=0",
-"0/8812=0",
-"0/8813=0",
-"0/8814=0",
-"0/8815=0",
-"0/8816=0",
-"0/8817=0",
-"0/8818=0",
-"0/8819=0",
-"0/8820=0",
-"0/8821=0",
-"0/8822=0",
-"0/8823=0",
-"0/8824=0",
-"0/8825=0",
-"0/8826=0",
-"0/8827=0",
-"0/8828=0",
-"0/8829=0",
-"0/8830=0",
-"0/8831=0",
-"0/8832=0",
-"0/8833=0",
-"0/8834=0",
-"0/8835=0",
-"0/8836=0",
-"0/8837=0",
-"0/8838=0",
-"0/8839=0",
-"0/8840=0",
-"0/8841=0",
-"0/8842=0",
-"0/8843=0",
-"0/8844=0",
-"0/8845=0",
-"0/8846=0",
-"0/8847=0",
-"0/8848=0",
-"0/8849=0",
-"0/8850=0",
-"0/8851=0",
-"0/8852=0",
-"0/8853=0",
-"0/8854=0",
-"0/8855=0",
-"0/8856=0",
-"0/8857=0",
-"0/8858=0",
-"0/8859=0",
-"0/8860=0",
-"0/8861=0",
-"0/8862=0",
-"0/8863=0",
-"0/8864=0",
-"0/8865=0",
-"0/8866=0",
-"0/8867=0",
-"0/8868=0",
-"0/8869=0",
-"0/8870=0",
-"0/8871=0",
-"0/8872=0",
-"0/8873=0",
-"0/8874=0",
-"0/8875=0",
-"0/8876=0",
-"0/8877=0",
-"0/8878=0",
-"0/8879=0",
-"0/8880=0",
-"0/8881=0",
-"0/8882=0",
-"0/8883=0",
-"0/8884=0",
-"0/8885=0",
-"0/8886=0",
-"0/8887=0",
-"0/8888=0",
-"0/8889=0",
-"0/8890=0",
-"0/8891=0",
-"0/8892=0",
-"0/8893=0",
-"0/8894=0",
-"0/8895=0",
-"0/8896=0",
-"0/8897=0",
-"0/8898=0",
-"0/8899=0",
-"0/88+0=0",
-"0/88+1=1",
-"0/88+2=2",
-"0/88+3=3",
-"0/88+4=4",
-"0/88+5=5",
-"0/88+6=6",
-"0/88+7=7",
-"0/88+8=8",
-"0/88+9=9",
-"0/88-0=0",
-"0/88*0=0",
-"0/88*1=0",
-"0/88*2=0",
-"0/88*3=0",
-"0/88*4=0",
-"0/88*5=0",
-"0/88*6=0",
-"0/88*7=0",
-"0/88*8=0",
-"0/88*9=0",
-"0/88/1=0",
-"0/88/2=0",
-"0/88/3=0",
-"0/88/4=0",
-"0/88/5=0",
-"0/88/6=0",
-"0/88/7=0",
-"0/88/8=0",
-"0/88/9=0",
-"0/8900=0",
-"0/8901=0",
-"0/8902=0",
-"0/8903=0",
-"0/8904=0",
-"0/8905=0",
-"0/8906=0",
-"0/8907=0",
-"0/8908=0",
-"0/8909=0",
-"0/8910=0",
-"0/8911=0",
-"0/8912=0",
-"0/8913=0",
-"0/8914=0",
-"0/8915=0",
-"0/8916=0",
-"0/8917=0",
-"0/8918=0",
-"0/8919=0",
-"0/8920=0",
-"0/8921=0",
-"0/8922=0",
-"0/8923=0",
-"0/8924=0",
-"0/8925=0",
-"0/8926=0",
-"0/8927=0",
-"0/8928=0",
-"0/8929=0",
-"0/8930=0",
-"0/8931=0",
-"0/8932=0",
-"0/8933=0",
-"0/8934=0",
-"0/8935=0",
-"0/8936=0",
-"0/8937=0",
-"0/8938=0",
-"0/8939=0",
-"0/8940=0",
-"0/8941=0",
-"0/8942=0",
-"0/8943=0",
-"0/8944=0",
-"0/8945=0",
-"0/8946=0",
-"0/8947=0",
-"0/8948=0",
-"0/8949=0",
-"0/8950=0",
-"0/8951=0",
-"0/8952=0",
-"0/8953=0",
-"0/8954=0",
-"0/8955=0",
-"0/8956=0",
-"0/8957=0",
-"0/8958=0",
-"0/8959=0",
-"0/8960=0",
-"0/8961=0",
-"0/8962=0",
-"0/8963=0",
-"0/8964=0",
-"0/8965=0",
-"0/8966=0",
-"0/8967=0",
-"0/8968=0",
-"0/8969=0",
-"0/8970=0",
-"0/8971=0",
-"0/8972=0",
-"0/8973=0",
-"0/8974=0",
-"0/8975=0",
-"0/8976=0",
-"0/8977=0",
-"0/8978=0",
-"0/8979=0",
-"0/8980=0",
-"0/8981=0",
-"0/8982=0",
-"0/8983=0",
-"0/8984=0",
-"0/8985=0",
-"0/8986=0",
-"0/8987=0",
-"0/8988=0",
-"0/8989=0",
-"0/8990=0",
-"0/8991=0",
-"0/8992=0",
-"0/8993=0",
-"0/8994=0",
-"0/8995=0",
-"0/8996=0",
-"0/8997=0",
-"0/8998=0",
-"0/8999=0",
-"0/89+0=0",
-"0/89+1=1",
-"0/89+2=2",
-"0/89+3=3",
-"0/89+4=4",
-"0/89+5=5",
-"0/89+6=6",
-"0/89+7=7",
-"0/89+8=8",
-"0/89+9=9",
-"0/89-0=0",
-"0/89*0=0",
-"0/89*1=0",
-"0/89*2=0",
-"0/89*3=0",
-"0/89*4=0",
-"0/89*5=0",
-"0/89*6=0",
-"0/89*7=0",
-"0/89*8=0",
-"0/89*9=0",
-"0/89/1=0",
-"0/89/2=0",
-"0/89/3=0",
-"0/89/4=0",
-"0/89/5=0",
-"0/89/6=0",
-"0/89/7=0",
-"0/89/8=0",
-"0/89/9=0",
-"0/8-1=-1",
-"0/8-2=-2",
-"0/8-3=-3",
-"0/8-4=-4",
-"0/8-5=-5",
-"0/8-6=-6",
-"0/8-7=-7",
-"0/8-8=-8",
-"0/8-9=-9",
-"0/8*10=0",
-"0/8*11=0",
-"0/8*12=0",
-"0/8*13=0",
-"0/8*14=0",
-"0/8*15=0",
-"0/8*16=0",
-"0/8*17=0",
-"0/8*18=0",
-"0/8*19=0",
-"0/8*20=0",
-"0/8*21=0",
-"0/8*22=0",
-"0/8*23=0",
-"0/8*24=0",
-"0/8*25=0",
-"0/8*26=0",
-"0/8*27=0",
-"0/8*28=0",
-"0/8*29=0",
-"0/8*30=0",
-"0/8*31=0",
-"0/8*32=0",
-"0/8*33=0",
-"0/8*34=0",
-"0/8*35=0",
-"0/8*36=0",
-"0/8*37=0",
-"0/8*38=0",
-"0/8*39=0",
-"0/8*40=0",
-"0/8*41=0",
-"0/8*42=0",
-"0/8*43=0",
-"0/8*44=0",
-"0/8*45=0",
-"0/8*46=0",
-"0/8*47=0",
-"0/8*48=0",
-"0/8*49=0",
-"0/8*50=0",
-"0/8*51=0",
-"0/8*52=0",
-"0/8*53=0",
-"0/8*54=0",
-"0/8*55=0",
-"0/8*56=0",
-"0/8*57=0",
-"0/8*58=0",
-"0/8*59=0",
-"0/8*60=0",
-"0/8*61=0",
-"0/8*62=0",
-"0/8*63=0",
-"0/8*64=0",
-"0/8*65=0",
-"0/8*66=0",
-"0/8*67=0",
-"0/8*68=0",
-"0/8*69=0",
-"0/8*70=0",
-"0/8*71=0",
-"0/8*72=0",
-"0/8*73=0",
-"0/8*74=0",
-"0/8*75=0",
-"0/8*76=0",
-"0/8*77=0",
-"0/8*78=0",
-"0/8*79=0",
-"0/8*80=0",
-"0/8*81=0",
-"0/8*82=0",
-"0/8*83=0",
-"0/8*84=0",
-"0/8*85=0",
-"0/8*86=0",
-"0/8*87=0",
-"0/8*88=0",
-"0/8*89=0",
-"0/8*90=0",
-"0/8*91=0",
-"0/8*92=0",
-"0/8*93=0",
-"0/8*94=0",
-"0/8*95=0",
-"0/8*96=0",
-"0/8*97=0",
-"0/8*98=0",
-"0/8*99=0",
-"0/8/10=0",
-"0/8/11=0",
-"0/8/12=0",
-"0/8/13=0",
-"0/8/14=0",
-"0/8/15=0",
-"0/8/16=0",
-"0/8/17=0",
-"0/8/18=0",
-"0/8/19=0",
-"0/8/20=0",
-"0/8/21=0",
-"0/8/22=0",
-"0/8/23=0",
-"0/8/24=0",
-"0/8/25=0",
-"0/8/26=0",
-"0/8/27=0",
-"0/8/28=0",
-"0/8/29=0",
-"0/8/30=0",
-"0/8/31=0",
-"0/8/32=0",
-"0/8/33=0",
-"0/8/34=0",
-"0/8/35=0",
-"0/8/36=0",
-"0/8/37=0",
-"0/8/38=0",
-"0/8/39=0",
-"0/8/40=0",
-"0/8/41=0",
-"0/8/42=0",
-"0/8/43=0",
-"0/8/44=0",
-"0/8/45=0",
-"0/8/46=0",
-"0/8/47=0",
-"0/8/48=0",
-"0/8/49=0",
-"0/8/50=0",
-"0/8/51=0",
-"0/8/52=0",
-"0/8/53=0",
-"0/8/54=0",
-"0/8/55=0",
-"0/8/56=0",
-"0/8/57=0",
-"0/8/58=0",
-"0/8/59=0",
-"0/8/60=0",
-"0/8/61=0",
-"0/8/62=0",
-"0/8/63=0",
-"0/8/64=0",
-"0/8/65=0",
-"0/8/66=0",
-"0/8/67=0",
-"0/8/68=0",
-"0/8/69=0",
-"0/8/70=0",
-"0/8/71=0",
-"0/8/72=0",
-"0/8/73=0",
-"0/8/74=0",
-"0/8/75=0",
-"0/8/76=0",
-"0/8/77=0",
-"0/8/78=0",
-"0/8/79=0",
-"0/8/80=0",
-"0/8/81=0",
-"0/8/82=0",
-"0/8/83=0",
-"0/8/84=0",
-"0/8/85=0",
-"0/8/86=0",
-"0/8/87=0",
-"0/8/88=0",
-"0/8/89=0",
-"0/8/90=0",
-"0/8/91=0",
-"0/8/92=0",
-"0/8/93=0",
-"0/8/94=0",
-"0/8/95=0",
-"0/8/96=0",
-"0/8/97=0",
-"0/8/98=0",
-"0/8/99=0",
-"0/9000=0",
-"0/9001=0",
-"0/9002=0",
-"0/9003=0",
-"0/9004=0",
-"0/9005=0",
-"0/9006=0",
-"0/9007=0",
-"0/9008=0",
-"0/9009=0",
-"0/9010=0",
-"0/9011=0",
-"0/9012=0",
-"0/9013=0",
-"0/9014=0",
-"0/9015=0",
-"0/9016=0",
-"0/9017=0",
-"0/9018=0",
-"0/9019=0",
-"0/9020=0",
-"0/9021=0",
-"0/9022=0",
-"0/9023=0",
-"0/9024=0",
-"0/9025=0",
-"0/9026=0",
-"0/9027=0",
-"0/9028=0",
-"0/9029=0",
-"0/9030=0",
-"0/9031=0",
-"0/9032=0",
-"0/9033=0",
-"0/9034=0",
-"0/9035=0",
-"0/9036=0",
-"0/9037=0",
-"0/9038=0",
-"0/9039=0",
-"0/9040=0",
-"0/9041=0",
-"0/9042=0",
-"0/9043=0",
-"0/9044=0",
-"0/9045=0",
-"0/9046=0",
-"0/9047=0",
-"0/9048=0",
-"0/9049=0",
-"0/9050=0",
-"0/9051=0",
-"0/9052=0",
-"0/9053=0",
-"0/9054=0",
-"0/9055=0",
-"0/9056=0",
-"0/9057=0",
-"0/9058=0",
-"0/9059=0",
-"0/9060=0",
-"0/9061=0",
-"0/9062=0",
-"0/9063=0",
-"0/9064=0",
-"0/9065=0",
-"0/9066=0",
-"0/9067=0",
-"0/9068=0",
-"0/9069=0",
-"0/9070=0",
-"0/9071=0",
-"0/9072=0",
-"0/9073=0",
-"0/9074=0",
-"0/9075=0",
-"0/9076=0",
-"0/9077=0",
-"0/9078=0",
-"0/9079=0",
-"0/9080=0",
-"0/9081=0",
-"0/9082=0",
-"0/9083=0",
-"0/9084=0",
-"0/9085=0",
-"0/9086=0",
-"0/9087=0",
-"0/9088=0",
-"0/9089=0",
-"0/9090=0",
-"0/9091=0",
-"0/9092=0",
-"0/9093=0",
-"0/9094=0",
-"0/9095=0",
-"0/9096=0",
-"0/9097=0",
-"0/9098=0",
-"0/9099=0",
-"0/90+0=0",
-"0/90+1=1",
-"0/90+2=2",
-"0/90+3=3",
-"0/90+4=4",
-"0/90+5=5",
-"0/90+6=6",
-"0/90+7=7",
-"0/90+8=8",
-"0/90+9=9",
-"0/90-0=0",
-"0/90*0=0",
-"0/90*1=0",
-"0/90*2=0",
-"0/90*3=0",
-"0/90*4=0",
-"0/90*5=0",
-"0/90*6=0",
-"0/90*7=0",
-"0/90*8=0",
-"0/90*9=0",
-"0/90/1=0",
-"0/90/2=0",
-"0/90/3=0",
-"0/90/4=0",
-"0/90/5=0",
-"0/90/6=0",
-"0/90/7=0",
-"0/90/8=0",
-"0/90/9=0",
-"0/9100=0",
-"0/9101=0",
-"0/9102=0",
-"0/9103=0",
-"0/9104=0",
-"0/9105=0",
-"0/9106=0",
-"0/9107=0",
-"0/9108=0",
-"0/9109=0",
-"0/9110=0",
-"0/9111=0",
-"0/9112=0",
-"0/9113=0",
-"0/9114=0",
-"0/9115=0",
-"0/9116=0",
-"0/9117=0",
-"0/9118=0",
-"0/9119=0",
-"0/9120=0",
-"0/9121=0",
-"0/9122=0",
-"0/9123=0",
-"0/9124=0",
-"0/9125=0",
-"0/9126=0",
-"0/9127=0",
-"0/9128=0",
-"0/9129=0",
-"0/9130=0",
-"0/9131=0",
-"0/9132=0",
-"0/9133=0",
-"0/9134=0",
-"0/9135=0",
-"0/9136=0",
-"0/9137=0",
-"0/9138=0",
-"0/9139=0",
-"0/9140=0",
-"0/9141=0",
-"0/9142=0",
-"0/9143=0",
-"0/9144=0",
-"0/9145=0",
-"0/9146=0",
-"0/9147=0",
-"0/9148=0",
-"0/9149=0",
-"0/9150=0",
-"0/9151=0",
-"0/9152=0",
-"0/9153=0",
-"0/9154=0",
-"0/9155=0",
-"0/9156=0",
-"0/9157=0",
-"0/9158=0",
-"0/9159=0",
-"0/9160=0",
-"0/9161=0",
-"0/9162=0",
-"0/9163=0",
-"0/9164=0",
-"0/9165=0",
-"0/9166=0",
-"0/9167=0",
-"0/9168=0",
-"0/9169=0",
-"0/9170=0",
-"0/9171=0",
-"0/9172=0",
-"0/9173=0",
-"0/9174=0",
-"0/9175=0",
-"0/9176=0",
-"0/9177=0",
-"0/9178=0",
-"0/9179=0",
-"0/9180=0",
-"0/9181=0",
-"0/9182=0",
-"0/9183=0",
-"0/9184=0",
-"0/9185=0",
-"0/9186=0",
-"0/9187=0",
-"0/9188=0",
-"0/9189=0",
-"0/9190=0",
-"0/9191=0",
-"0/9192=0",
-"0/9193=0",
-"0/9194=0",
-"0/9195=0",
-"0/9196=0",
-"0/9197=0",
-"0/9198=0",
-"0/9199=0",
-"0/91+0=0",
-"0/91+1=1",
-"0/91+2=2",
-"0/91+3=3",
-"0/91+4=4",
-"0/91+5=5",
-"0/91+6=6",
-"0/91+7=7",
-"0/91+8=8",
-"0/91+9=9",
-"0/91-0=0",
-"0/91*0=0",
-"0/91*1=0",
-"0/91*2=0",
-"0/91*3=0",
-"0/91*4=0",
-"0/91*5=0",
-"0/91*6=0",
-"0/91*7=0",
-"0/91*8=0",
-"0/91*9=0",
-"0/91/1=0",
-"0/91/2=0",
-"0/91/3=0",
-"0/91/4=0",
-"0/91/5=0",
-"0/91/6=0",
-"0/91/7=0",
-"0/91/8=0",
-"0/91/9=0",
-"0/9200=0",
-"0/9201=0",
-"0/9202=0",
-"0/9203=0",
-"0/9204=0",
-"0/9205=0",
-"0/9206=0",
-"0/9207=0",
-"0/9208=0",
-"0/9209=0",
-"0/9210=0",
-"0/9211=0",
-"0/9212=0",
-"0/9213=0",
-"0/9214=0",
-"0/9215=0",
-"0/9216=0",
-"0/9217=0",
-"0/9218=0",
-"0/9219=0",
-"0/9220=0",
-"0/9221=0",
-"0/9222=0",
-"0/9223=0",
-"0/9224=0",
-"0/9225=0",
-"0/9226=0",
-"0/9227=0",
-"0/9228=0",
-"0/9229=0",
-"0/9230=0",
-"0/9231=0",
-"0/9232=0",
-"0/9233=0",
-"0/9234=0",
-"0/9235=0",
-"0/9236=0",
-"0/9237=0",
-"0/9238=0",
-"0/9239=0",
-"0/9240=0",
-"0/9241=0",
-"0/9242=0",
-"0/9243=0",
-"0/9244=0",
-"0/9245=0",
-"0/9246=0",
-"0/9247=0",
-"0/9248=0",
-"0/9249=0",
-"0/9250=0",
-"0/9251=0",
-"0/9252=0",
-"0/9253=0",
-"0/9254=0",
-"0/9255=0",
-"0/9256=0",
-"0/9257=0",
-"0/9258=0",
-"0/9259=0",
-"0/9260=0",
-"0/9261=0",
-"0/9262=0",
-"0/9263=0",
-"0/9264=0",
-"0/9265=0",
-"0/9266=0",
-"0/9267=0",
-"0/9268=0",
-"0/9269=0",
-"0/9270=0",
-"0/9271=0",
-"0/9272=0",
-"0/9273=0",
-"0/9274=0",
-"0/9275=0",
-"0/9276=0",
-"0/9277=0",
-"0/9278=0",
-"0/9279=0",
-"0/9280=0",
-"0/9281=0",
-"0/9282=0",
-"0/9283=0",
-"0/9284=0",
-"0/9285=0",
-"0/9286=0",
-"0/9287=0",
-"0/9288=0",
-"0/9289=0",
-"0/9290=0",
-"0/9291=0",
-"0/9292=0",
-"0/9293=0",
-"0/9294=0",
-"0/9295=0",
-"0/9296=0",
-"0/9297=0",
-"0/9298=0",
-"0/9299=0",
-"0/92+0=0",
-"0/92+1=1",
-"0/92+2=2",
-"0/92+3=3",
-"0/92+4=4",
-"0/92+5=5",
-"0/92+6=6",
-"0/92+7=7",
-"0/92+8=8",
-"0/92+9=9",
-"0/92-0=0",
-"0/92*0=0",
-"0/92*1=0",
-"0/92*2=0",
-"0/92*3=0",
-"0/92*4=0",
-"0/92*5=0",
-"0/92*6=0",
-"0/92*7=0",
-"0/92*8=0",
-"0/92*9=0",
-"0/92/1=0",
-"0/92/2=0",
-"0/92/3=0",
-"0/92/4=0",
-"0/92/5=0",
-"0/92/6=0",
-"0/92/7=0",
-"0/92/8=0",
-"0/92/9=0",
-"0/9300=0",
-"0/9301=0",
-"0/9302=0",
-"0/9303=0",
-"0/9304=0",
-"0/9305=0",
-"0/9306=0",
-"0/9307=0",
-"0/9308=0",
-"0/9309=0",
-"0/9310=0",
-"0/9311=0",
-"0/9312=0",
-"0/9313=0",
-"0/9314=0",
-"0/9315=0",
-"0/9316=0",
-"0/9317=0",
-"0/9318=0",
-"0/9319=0",
-"0/9320=0",
-"0/9321=0",
-"0/9322=0",
-"0/9323=0",
-"0/9324=0",
-"0/9325=0",
-"0/9326=0",
-"0/9327=0",
-"0/9328=0",
-"0/9329=0",
-"0/9330=0",
-"0/9331=0",
-"0/9332=0",
-"0/9333=0",
-"0/9334=0",
-"0/9335=0",
-"0/9336=0",
-"0/9337=0",
-"0/9338=0",
-"0/9339=0",
-"0/9340=0",
-"0/9341=0",
-"0/9342=0",
-"0/9343=0",
-"0/9344=0",
-"0/9345=0",
-"0/9346=0",
-"0/9347=0",
-"0/9348=0",
-"0/9349=0",
-"0/9350=0",
-"0/9351=0",
-"0/9352=0",
-"0/9353=0",
-"0/9354=0",
-"0/9355=0",
-"0/9356=0",
-"0/9357=0",
-"0/9358=0",
-"0/9359=0",
-"0/9360=0",
-"0/9361=0",
-"0/9362=0",
-"0/9363=0",
-"0/9364=0",
-"0/9365=0",
-"0/9366=0",
-"0/9367=0",
-"0/9368=0",
-"0/9369=0",
-"0/9370=0",
-"0/9371=0",
-"0/9372=0",
-"0/9373=0",
-"0/9374=0",
-"0/9375=0",
-"0/9376=0",
-"0/9377=0",
-"0/9378=0",
-"0/9379=0",
-"0/9380=0",
-"0/9381=0",
-"0/9382=0",
-"0/9383=0",
-"0/9384=0",
-"0/9385=0",
-"0/9386=0",
-"0/9387=0",
-"0/9388=0",
-"0/9389=0",
-"0/9390=0",
-"0/9391=0",
-"0/9392=0",
-"0/9393=0",
-"0/9394=0",
-"0/9395=0",
-"0/9396=0",
-"0/9397=0",
-"0/9398=0",
-"0/9399=0",
-"0/93+0=0",
-"0/93+1=1",
-"0/93+2=2",
-"0/93+3=3",
-"0/93+4=4",
-"0/93+5=5",
-"0/93+6=6",
-"0/93+7=7",
-"0/93+8=8",
-"0/93+9=9",
-"0/93-0=0",
-"0/93*0=0",
-"0/93*1=0",
-"0/93*2=0",
-"0/93*3=0",
-"0/93*4=0",
-"0/93*5=0",
-"0/93*6=0",
-"0/93*7=0",
-"0/93*8=0",
-"0/93*9=0",
-"0/93/1=0",
-"0/93/2=0",
-"0/93/3=0",
-"0/93/4=0",
-"0/93/5=0",
-"0/93/6=0",
-"0/93/7=0",
-"0/93/8=0",
-"0/93/9=0",
-"0/9400=0",
-"0/9401=0",
-"0/9402=0",
-"0/9403=0",
-"0/9404=0",
-"0/9405=0",
-"0/9406=0",
-"0/9407=0",
-"0/9408=0",
-"0/9409=0",
-"0/9410=0",
-"0/9411=0",
-"0/9412=0",
-"0/9413=0",
-"0/9414=0",
-"0/9415=0",
-"0/9416=0",
-"0/9417=0",
-"0/9418=0",
-"0/9419=0",
-"0/9420=0",
-"0/9421=0",
-"0/9422=0",
-"0/9423=0",
-"0/9424=0",
-"0/9425=0",
-"0/9426=0",
-"0/9427=0",
-"0/9428=0",
-"0/9429=0",
-"0/9430=0",
-"0/9431=0",
-"0/9432=0",
-"0/9433=0",
-"0/9434=0",
-"0/9435=0",
-"0/9436=0",
-"0/9437=0",
-"0/9438=0",
-"0/9439=0",
-"0/9440=0",
-"0/9441=0",
-"0/9442=0",
-"0/9443=0",
-"0/9444=0",
-"0/9445=0",
-"0/9446=0",
-"0/9447=0",
-"0/9448=0",
-"0/9449=0",
-"0/9450=0",
-"0/9451=0",
-"0/9452=0",
-"0/9453=0",
-"0/9454=0",
-"0/9455=0",
-"0/9456=0",
-"0/9457=0",
-"0/9458=0",
-"0/9459=0",
-"0/9460=0",
-"0/9461=0",
-"0/9462=0",
-"0/9463=0",
-"0/9464=0",
-"0/9465=0",
-"0/9466=0",
-"0/9467=0",
-"0/9468=0",
-"0/9469=0",
-"0/9470=0",
-"0/9471=0",
-"0/9472=0",
-"0/9473=0",
-"0/9474=0",
-"0/9475=0",
-"0/9476=0",
-"0/9477=0",
-"0/9478=0",
-"0/9479=0",
-"0/9480=0",
-"0/9481=0",
-"0/9482=0",
-"0/9483=0",
-"0/9484=0",
-"0/9485=0",
-"0/9486=0",
-"0/9487=0",
-"0/9488=0",
-"0/9489=0",
-"0/9490=0",
-"0/9491=0",
-"0/9492=0",
-"0/9493=0",
-"0/9494=0",
-"0/9495=0",
-"0/9496=0",
-"0/9497=0",
-"0/9498=0",
-"0/9499=0",
-"0/94+0=0",
-"0/94+1=1",
-"0/94+2=2",
-"0/94+3=3",
-"0/94+4=4",
-"0/94+5=5",
-"0/94+6=6",
-"0/94+7=7",
-"0/94+8=8",
-"0/94+9=9",
-"0/94-0=0",
-"0/94*0=0",
-"0/94*1=0",
-"0/94*2=0",
-"0/94*3=0",
-"0/94*4=0",
-"0/94*5=0",
-"0/94*6=0",
-"0/94*7=0",
-"0/94*8=0",
-"0/94*9=0",
-"0/94/1=0",
-"0/94/2=0",
-"0/94/3=0",
-"0/94/4=0",
-"0/94/5=0",
-"0/94/6=0",
-"0/94/7=0",
-"0/94/8=0",
-"0/94/9=0",
-"0/9500=0",
-"0/9501=0",
-"0/9502=0",
-"0/9503=0",
-"0/9504=0",
-"0/9505=0",
-"0/9506=0",
-"0/9507=0",
-"0/9508=0",
-"0/9509=0",
-"0/9510=0",
-"0/9511=0",
-"0/9512=0",
-"0/9513=0",
-"0/9514=0",
-"0/9515=0",
-"0/9516=0",
-"0/9517=0",
-"0/9518=0",
-"0/9519=0",
-"0/9520=0",
-"0/9521=0",
-"0/9522=0",
-"0/9523=0",
-"0/9524=0",
-"0/9525=0",
-"0/9526=0",
-"0/9527=0",
-"0/9528=0",
-"0/9529=0",
-"0/9530=0",
-"0/9531=0",
-"0/9532=0",
-"0/9533=0",
-"0/9534=0",
-"0/9535=0",
-"0/9536=0",
-"0/9537=0",
-"0/9538=0",
-"0/9539=0",
-"0/9540=0",
-"0/9541=0",
-"0/9542=0",
-"0/9543=0",
-"0/9544=0",
-"0/9545=0",
-"0/9546=0",
-"0/9547=0",
-"0/9548=0",
-"0/9549=0",
-"0/9550=0",
-"0/9551=0",
-"0/9552=0",
-"0/9553=0",
-"0/9554=0",
-"0/9555=0",
-"0/9556=0",
-"0/9557=0",
-"0/9558=0",
-"0/9559=0",
-"0/9560=0",
-"0/9561=0",
-"0/9562=0",
-"0/9563=0",
-"0/9564=0",
-"0/9565=0",
-"0/9566=0",
-"0/9567=0",
-"0/9568=0",
-"0/9569=0",
-"0/9570=0",
-"0/9571=0",
-"0/9572=0",
-"0/9573=0",
-"0/9574=0",
-"0/9575=0",
-"0/9576=0",
-"0/9577=0",
-"0/9578=0",
-"0/9579=0",
-"0/9580=0",
-"0/9581=0",
-"0/9582=0",
-"0/9583=0",
-"0/9584=0",
-"0/9585=0",
-"0/9586=0",
-"0/9587=0",
-"0/9588=0",
-"0/9589=0",
-"0/9590=0",
-"0/9591=0",
-"0/9592=0",
-"0/9593=0",
-"0/9594=0",
-"0/9595=0",
-"0/9596=0",
-"0/9597=0",
-"0/9598=0",
-"0/9599=0",
-"0/95+0=0",
-"0/95+1=1",
-"0/95+2=2",
-"0/95+3=3",
-"0/95+4=4",
-"0/95+5=5",
-"0/95+6=6",
-"0/95+7=7",
-"0/95+8=8",
-"0/95+9=9",
-"0/95-0=0",
-"0/95*0=0",
-"0/95*1=0",
-"0/95*2=0",
-"0/95*3=0",
-"0/95*4=0",
-"0/95*5=0",
-"0/95*6=0",
-"0/95*7=0",
-"0/95*8=0",
-"0/95*9=0",
-"0/95/1=0",
-"0/95/2=0",
-"0/95/3=0",
-"0/95/4=0",
-"0/95/5=0",
-"0/95/6=0",
-"0/95/7=0",
-"0/95/8=0",
-"0/95/9=0",
-"0/9600=0",
-"0/9601=0",
-"0/9602=0",
-"0/9603=0",
-"0/9604=0",
-"0/9605=0",
-"0/9606=0",
-"0/9607=0",
-"0/9608=0",
-"0/9609=0",
-"0/9610=0",
-"0/9611=0",
-"0/9612=0",
-"0/9613=0",
-"0/9614=0",
-"0/9615=0",
-"0/9616=0",
-"0/9617=0",
-"0/9618=0",
-"0/9619=0",
-"0/9620=0",
-"0/9621=0",
-"0/9622=0",
-"0/9623=0",
-"0/9624=0",
-"0/9625=0",
-"0/9626=0",
-"0/9627=0",
-"0/9628=0",
-"0/9629=0",
-"0/9630=0",
-"0/9631=0",
-"0/9632=0",
-"0/9633=0",
-"0/9634=0",
-"0/9635=0",
-"0/9636=0",
-"0/9637=0",
-"0/9638=0",
-"0/9639=0",
-"0/9640=0",
-"0/9641=0",
-"0/9642=0",
-"0/9643=0",
-"0/9644=0",
-"0/9645=0",
-"0/9646=0",
-"0/9647=0",
-"0/9648=0",
-"0/9649=0",
-"0/9650=0",
-"0/9651=0",
-"0/9652=0",
-"0/9653=0",
-"0/9654=0",
-"0/9655=0",
-"0/9656=0",
-"0/9657=0",
-"0/9658=0",
-"0/9659=0",
-"0/9660=0",
-"0/9661=0",
-"0/9662=0",
-"0/9663=0",
-"0/9664=0",
-"0/9665=0",
-"0/9666=0",
-"0/9667=0",
-"0/9668=0",
-"0/9669=0",
-"0/9670=0",
-"0/9671=0",
-"0/9672=0",
-"0/9673=0",
-"0/9674=0",
-"0/9675=0",
-"0/9676=0",
-"0/9677=0",
-"0/9678=0",
-"0/9679=0",
-"0/9680=0",
-"0/9681=0",
-"0/9682=0",
-"0/9683=0",
-"0/9684=0",
-"0/9685=0",
-"0/9686=0",
-"0/9687=0",
-"0/9688=0",
-"0/9689=0",
-"0/9690=0",
-"0/9691=0",
-"0/9692=0",
-"0/9693=0",
-"0/9694=0",
-"0/9695=0",
-"0/9696=0",
-"0/9697=0",
-"0/9698=0",
-"0/9699=0",
-"0/96+0=0",
-"0/96+1=1",
-"0/96+2=2",
-"0/96+3=3",
-"0/96+4=4",
-"0/96+5=5",
-"0/96+6=6",
-"0/96+7=7",
-"0/96+8=8",
-"0/96+9=9",
-"0/96-0=0",
-"0/96*0=0",
-"0/96*1=0",
-"0/96*2=0",
-"0/96*3=0",
-"0/96*4=0",
-"0/96*5=0",
-"0/96*6=0",
-"0/96*7=0",
-"0/96*8=0",
-"0/96*9=0",
-"0/96/1=0",
-"0/96/2=0",
-"0/96/3=0",
-"0/96/4=0",
-"0/96/5=0",
-"0/96/6=0",
-"0/96/7=0",
-"0/96/8=0",
-"0/96/9=0",
-"0/9700=0",
-"0/9701=0",
-"0/9702=0",
-"0/9703=0",
-"0/9704=0",
-"0/9705=0",
-"0/9706=0",
-"0/9707=0",
-"0/9708=0",
-"0/9709=0",
-"0/9710=0",
-"0/9711=0",
-"0/9712=0",
-"0/9713=0",
-"0/9714=0",
-"0/9715=0",
-"0/9716=0",
-"0/9717=0",
-"0/9718=0",
-"0/9719=0",
-"0/9720=0",
-"0/9721=0",
-"0/9722=0",
-"0/9723=0",
-"0/9724=0",
-"0/9725=0",
-"0/9726=0",
-"0/9727=0",
-"0/9728=0",
-"0/9729=0",
-"0/9730=0",
-"0/9731=0",
-"0/9732=0",
-"0/9733=0",
-"0/9734=0",
-"0/9735=0",
-"0/9736=0",
-"0/9737=0",
-"0/9738=0",
-"0/9739=0",
-"0/9740=0",
-"0/9741=0",
-"0/9742=0",
-"0/9743=0",
-"0/9744=0",
-"0/9745=0",
-"0/9746=0",
-"0/9747=0",
-"0/9748=0",
-"0/9749=0",
-"0/9750=0",
-"0/9751=0",
-"0/9752=0",
-"0/9753=0",
-"0/9754=0",
-"0/9755=0",
-"0/9756=0",
-"0/9757=0",
-"0/9758=0",
-"0/9759=0",
-"0/9760=0",
-"0/9761=0",
-"0/9762=0",
-"0/9763=0",
-"0/9764=0",
-"0/9765=0",
-"0/9766=0",
-"0/9767=0",
-"0/9768=0",
-"0/9769=0",
-"0/9770=0",
-"0/9771=0",
-"0/9772=0",
-"0/9773=0",
-"0/9774=0",
-"0/9775=0",
-"0/9776=0",
-"0/9777=0",
-"0/9778=0",
-"0/9779=0",
-"0/9780=0",
-"0/9781=0",
-"0/9782=0",
-"0/9783=0",
-"0/9784=0",
-"0/9785=0",
-"0/9786=0",
-"0/9787=0",
-"0/9788=0",
-"0/9789=0",
-"0/9790=0",
-"0/9791=0",
-"0/9792=0",
-"0/9793=0",
-"0/9794=0",
-"0/9795=0",
-"0/9796=0",
-"0/9797=0",
-"0/9798=0",
-"0/9799=0",
-"0/97+0=0",
-"0/97+1=1",
-"0/97+2=2",
-"0/97+3=3",
-"0/97+4=4",
-"0/97+5=5",
-"0/97+6=6",
-"0/97+7=7",
-"0/97+8=8",
-"0/97+9=9",
-"0/97-0=0",
-"0/97*0=0",
-"0/97*1=0",
-"0/97*2=0",
-"0/97*3=0",
-"0/97*4=0",
-"0/97*5=0",
-"0/97*6=0",
-"0/97*7=0",
-"0/97*8=0",
-"0/97*9=0",
-"0/97/1=0",
-"0/97/2=0",
-"0/97/3=0",
-"0/97/4=0",
-"0/97/5=0",
-"0/97/6=0",
-"0/97/7=0",
-"0/97/8=0",
-"0/97/9=0",
-"0/9800=0",
-"0/9801=0",
-"0/9802=0",
-"0/9803=0",
-"0/9804=0",
-"0/9805=0",
-"0/9806=0",
-"0/9807=0",
-"0/9808=0",
-"0/9809=0",
-"0/9810=0",
-"0/9811=0",
-"0/9812=0",
-"0/9813=0",
-"0/9814=0",
-"0/9815=0",
-"0/9816=0",
-"0/9817=0",
-"0/9818=0",
-"0/9819=0",
-"0/9820=0",
-"0/9821=0",
-"0/9822=0",
-"0/9823=0",
-"0/9824=0",
-"0/9825=0",
-"0/9826=0",
-"0/9827=0",
-"0/9828=0",
-"0/9829=0",
-"0/9830=0",
-"0/9831=0",
-"0/9832=0",
-"0/9833=0",
-"0/9834=0",
-"0/9835=0",
-"0/9836=0",
-"0/9837=0",
-"0/9838=0",
-"0/9839=0",
-"0/9840=0",
-"0/9841=0",
-"0/9842=0",
-"0/9843=0",
-"0/9844=0",
-"0/9845=0",
-"0/9846=0",
-"0/9847=0",
-"0/9848=0",
-"0/9849=0",
-"0/9850=0",
-"0/9851=0",
-"0/9852=0",
-"0/9853=0",
-"0/9854=0",
-"0/9855=0",
-"0/9856=0",
-"0/9857=0",
-"0/9858=0",
-"0/9859=0",
-"0/9860=0",
-"0/9861=0",
-"0/9862=0",
-"0/9863=0",
-"0/9864=0",
-"0/9865=0",
-"0/9866=0",
-"0/9867=0",
-"0/9868=0",
-"0/9869=0",
-"0/9870=0",
-"0/9871=0",
-"0/9872=0",
-"0/9873=0",
-"0/9874=0",
-"0/9875=0",
-"0/9876=0",
-"0/9877=0",
-"0/9878=0",
-"0/9879=0",
-"0/9880=0",
-"0/9881=0",
-"0/9882=0",
-"0/9883=0",
-"0/9884=0",
-"0/9885=0",
-"0/9886=0",
-"0/9887=0",
-"0/9888=0",
-"0/9889=0",
-"0/9890=0",
-"0/9891=0",
-"0/9892=0",
-"0/9893=0",
-"0/9894=0",
-"0/9895=0",
-"0/9896=0",
-"0/9897=0",
-"0/9898=0",
-"0/9899=0",
-"0/98+0=0",
-"0/98+1=1",
-"0/98+2=2",
-"0/98+3=3",
-"0/98+4=4",
-"0/98+5=5",
-"0/98+6=6",
-"0/98+7=7",
-"0/98+8=8",
-"0/98+9=9",
-"0/98-0=0",
-"0/98*0=0",
-"0/98*1=0",
-"0/98*2=0",
-"0/98*3=0",
-"0/98*4=0",
-"0/98*5=0",
-"0/98*6=0",
-"0/98*7=0",
-"0/98*8=0",
-"0/98*9=0",
-"0/98/1=0",
-"0/98/2=0",
-"0/98/3=0",
-"0/98/4=0",
-"0/98/5=0",
-"0/98/6=0",
-"0/98/7=0",
-"0/98/8=0",
-"0/98/9=0",
-"0/9900=0",
-"0/9901=0",
-"0/9902=0",
-"0/9903=0",
-"0/9904=0",
-"0/9905=0",
-"0/9906=0",
-"0/9907=0",
-"0/9908=0",
-"0/9909=0",
-"0/9910=0",
-"0/9911=0",
-"0/9912=0",
-"0/9913=0",
-"0/9914=0",
-"0/9915=0",
-"0/9916=0",
-"0/9917=0",
-"0/9918=0",
-"0/9919=0",
-"0/9920=0",
-"0/9921=0",
-"0/9922=0",
-"0/9923=0",
-"0/9924=0",
-"0/9925=0",
-"0/9926=0",
-"0/9927=0",
-"0/9928=0",
-"0/9929=0",
-"0/9930=0",
-"0/9931=0",
-"0/9932=0",
-"0/9933=0",
-"0/9934=0",
-"0/9935=0",
-"0/9936=0",
-"0/9937=0",
-"0/9938=0",
-"0/9939=0",
-"0/9940=0",
-"0/9941=0",
-"0/9942=0",
-"0/9943=0",
-"0/9944=0",
-"0/9945=0",
-"0/9946=0",
-"0/9947=0",
-"0/9948=0",
-"0/9949=0",
-"0/9950=0",
-"0/9951=0",
-"0/9952=0",
-"0/9953=0",
-"0/9954=0",
-"0/9955=0",
-"0/9956=0",
-"0/9957=0",
-"0/9958=0",
-"0/9959=0",
-"0/9960=0",
-"0/9961=0",
-"0/9962=0",
-"0/9963=0",
-"0/9964=0",
-"0/9965=0",
-"0/9966=0",
-"0/9967=0",
-"0/9968=0",
-"0/9969=0",
-"0/9970=0",
-"0/9971=0",
-"0/9972=0",
-"0/9973=0",
-"0/9974=0",
-"0/9975=0",
-"0/9976=0",
-"0/9977=0",
-"0/9978=0",
-"0/9979=0",
-"0/9980=0",
-"0/9981=0",
-"0/9982=0",
-"0/9983=0",
-"0/9984=0",
-"0/9985=0",
-"0/9986=0",
-"0/9987=0",
-"0/9988=0",
-"0/9989=0",
-"0/9990=0",
-"0/9991=0",
-"0/9992=0",
-"0/9993=0",
-"0/9994=0",
-"0/9995=0",
-"0/9996=0",
-"0/9997=0",
-"0/9998=0",
-"0/9999=0",
-"0/99+0=0",
-"0/99+1=1",
-"0/99+2=2",
-"0/99+3=3",
-"0/99+4=4",
-"0/99+5=5",
-"0/99+6=6",
-"0/99+7=7",
-"0/99+8=8",
-"0/99+9=9",
-"0/99-0=0",
-"0/99*0=0",
-"0/99*1=0",
-"0/99*2=0",
-"0/99*3=0",
-"0/99*4=0",
-"0/99*5=0",
-"0/99*6=0",
-"0/99*7=0",
-"0/99*8=0",
-"0/99*9=0",
-"0/99/1=0",
-"0/99/2=0",
-"0/99/3=0",
-"0/99/4=0",
-"0/99/5=0",
-"0/99/6=0",
-"0/99/7=0",
-"0/99/8=0",
-"0/99/9=0",
-"0/9-1=-1",
-"0/9-2=-2",
-"0/9-3=-3",
-"0/9-4=-4",
-"0/9-5=-5",
-"0/9-6=-6",
-"0/9-7=-7",
-"0/9-8=-8",
-"0/9-9=-9",
-"0/9*10=0",
-"0/9*11=0",
-"0/9*12=0",
-"0/9*13=0",
-"0/9*14=0",
-"0/9*15=0",
-"0/9*16=0",
-"0/9*17=0",
-"0/9*18=0",
-"0/9*19=0",
-"0/9*20=0",
-"0/9*21=0",
-"0/9*22=0",
-"0/9*23=0",
-"0/9*24=0",
-"0/9*25=0",
-"0/9*26=0",
-"0/9*27=0",
-"0/9*28=0",
-"0/9*29=0",
-"0/9*30=0",
-"0/9*31=0",
-"0/9*32=0",
-"0/9*33=0",
-"0/9*34=0",
-"0/9*35=0",
-"0/9*36=0",
-"0/9*37=0",
-"0/9*38=0",
-"0/9*39=0",
-"0/9*40=0",
-"0/9*41=0",
-"0/9*42=0",
-"0/9*43=0",
-"0/9*44=0",
-"0/9*45=0",
-"0/9*46=0",
-"0/9*47=0",
-"0/9*48=0",
-"0/9*49=0",
-"0/9*50=0",
-"0/9*51=0",
-"0/9*52=0",
-"0/9*53=0",
-"0/9*54=0",
-"0/9*55=0",
-"0/9*56=0",
-"0/9*57=0",
-"0/9*58=0",
-"0/9*59=0",
-"0/9*60=0",
-"0/9*61=0",
-"0/9*62=0",
-"0/9*63=0",
-"0/9*64=0",
-"0/9*65=0",
-"0/9*66=0",
-"0/9*67=0",
-"0/9*68=0",
-"0/9*69=0",
-"0/9*70=0",
-"0/9*71=0",
-"0/9*72=0",
-"0/9*73=0",
-"0/9*74=0",
-"0/9*75=0",
-"0/9*76=0",
-"0/9*77=0",
-"0/9*78=0",
-"0/9*79=0",
-"0/9*80=0",
-"0/9*81=0",
-"0/9*82=0",
-"0/9*83=0",
-"0/9*84=0",
-"0/9*85=0",
-"0/9*86=0",
-"0/9*87=0",
-"0/9*88=0",
-"0/9*89=0",
-"0/9*90=0",
-"0/9*91=0",
-"0/9*92=0",
-"0/9*93=0",
-"0/9*94=0",
-"0/9*95=0",
-"0/9*96=0",
-"0/9*97=0",
-"0/9*98=0",
-"0/9*99=0",
-"0/9/10=0",
-"0/9/11=0",
-"0/9/12=0",
-"0/9/13=0",
-"0/9/14=0",
-"0/9/15=0",
-"0/9/16=0",
-"0/9/17=0",
-"0/9/18=0",
-"0/9/19=0",
-"0/9/20=0",
-"0/9/21=0",
-"0/9/22=0",
-"0/9/23=0",
-"0/9/24=0",
-"0/9/25=0",
-"0/9/26=0",
-"0/9/27=0",
-"0/9/28=0",
-"0/9/29=0",
-"0/9/30=0",
-"0/9/31=0",
-"0/9/32=0",
-"0/9/33=0",
-"0/9/34=0",
-"0/9/35=0",
-"0/9/36=0",
-"0/9/37=0",
-"0/9/38=0",
-"0/9/39=0",
-"0/9/40=0",
-"0/9/41=0",
-"0/9/42=0",
-"0/9/43=0",
-"0/9/44=0",
-"0/9/45=0",
-"0/9/46=0",
-"0/9/47=0",
-"0/9/48=0",
-"0/9/49=0",
-"0/9/50=0",
-"0/9/51=0",
-"0/9/52=0",
-"0/9/53=0",
-"0/9/54=0",
-"0/9/55=0",
-"0/9/56=0",
-"0/9/57=0",
-"0/9/58=0",
-"0/9/59=0",
-"0/9/60=0",
-"0/9/61=0",
-"0/9/62=0",
-"0/9/63=0",
-"0/9/64=0",
-"0/9/65=0",
-"0/9/66=0",
-"0/9/67=0",
-"0/9/68=0",
-"0/9/69=0",
-"0/9/70=0",
-"0/9/71=0",
-"0/9/72=0",
-"0/9/73=0",
-"0/9/74=0",
-"0/9/75=0",
-"0/9/76=0",
-"0/9/77=0",
-"0/9/78=0",
-"0/9/79=0",
-"0/9/80=0",
-"0/9/81=0",
-"0/9/82=0",
-"0/9/83=0",
-"0/9/84=0",
-"0/9/85=0",
-"0/9/86=0",
-"0/9/87=0",
-"0/9/88=0",
-"0/9/89=0",
-"0/9/90=0",
-"0/9/91=0",
-"0/9/92=0",
-"0/9/93=0",
-"0/9/94=0",
-"0/9/95=0",
-"0/9/96=0",
-"0/9/97=0",
-"0/9/98=0",
-"0/9/99=0",
-"1000*0=0",
-"1001*0=0",
-"1002*0=0",
-"1003*0=0",
-"1004*0=0",
-"1005*0=0",
-"1006*0=0",
-"1007*0=0",
-"1008*0=0",
-"1009*0=0",
-"100-1=99",
-"100-2=98",
-"100-3=97",
-"100-4=96",
-"100-5=95",
-"100-6=94",
-"100-7=93",
-"100-8=92",
-"100-91=9",
-"100-92=8",
-"100-93=7",
-"100-94=6",
-"100-95=5",
-"100-96=4",
-"100-97=3",
-"100-98=2",
-"100-99=1",
-"100-9=91",
-"100/20=5",
-"100/25=4",
-"100/2=50",
-"100/4=25",
-"100/50=2",
-"100/5=20",
-"1010*0=0",
-"1011*0=0",
-"1012*0=0",
-"1013*0=0",
-"1014*0=0",
-"1015*0=0",
-"1016*0=0",
-"1017*0=0",
-"1018*0=0",
-"1019*0=0",
-"101-2=99",
-"101-3=98",
-"101-4=97",
-"101-5=96",
-"101-6=95",
-"101-7=94",
-"101-8=93",
-"101-92=9",
-"101-93=8",
-"101-94=7",
-"101-95=6",
-"101-96=5",
-"101-97=4",
-"101-98=3",
-"101-99=2",
-"101-9=92",
-"1020*0=0",
-"1021*0=0",
-"1022*0=0",
-"1023*0=0",
-"1024*0=0",
-"1025*0=0",
-"1026*0=0",
-"1027*0=0",
-"1028*0=0",
-"1029*0=0",
-"102-3=99",
-"102-4=98",
-"102-5=97",
-"102-6=96",
-"102-7=95",
-"102-8=94",
-"102-93=9",
-"102-94=8",
-"102-95=7",
-"102-96=6",
-"102-97=5",
-"102-98=4",
-"102-99=3",
-"102-9=93",
-"102/17=6",
-"102/2=51",
-"102/34=3",
-"102/3=34",
-"102/51=2",
-"102/6=17",
-"1030*0=0",
-"1031*0=0",
-"1032*0=0",
-"1033*0=0",
-"1034*0=0",
-"1035*0=0",
-"1036*0=0",
-"1037*0=0",
-"1038*0=0",
-"1039*0=0",
-"103-4=99",
-"103-5=98",
-"103-6=97",
-"103-7=96",
-"103-8=95",
-"103-94=9",
-"103-95=8",
-"103-96=7",
-"103-97=6",
-"103-98=5",
-"103-99=4",
-"103-9=94",
-"1040*0=0",
-"1041*0=0",
-"1042*0=0",
-"1043*0=0",
-"1044*0=0",
-"1045*0=0",
-"1046*0=0",
-"1047*0=0",
-"1048*0=0",
-"1049*0=0",
-"104-5=99",
-"104-6=98",
-"104-7=97",
-"104-8=96",
-"104-95=9",
-"104-96=8",
-"104-97=7",
-"104-98=6",
-"104-99=5",
-"104-9=95",
-"104/13=8",
-"104/26=4",
-"104/2=52",
-"104/4=26",
-"104/52=2",
-"104/8=13",
-"1050*0=0",
-"1051*0=0",
-"1052*0=0",
-"1053*0=0",
-"1054*0=0",
-"1055*0=0",
-"1056*0=0",
-"1057*0=0",
-"1058*0=0",
-"1059*0=0",
-"105-6=99",
-"105-7=98",
-"105-8=97",
-"105-96=9",
-"105-97=8",
-"105-98=7",
-"105-99=6",
-"105-9=96",
-"105/15=7",
-"105/21=5",
-"105/35=3",
-"105/3=35",
-"105/5=21",
-"105/7=15",
-"1060*0=0",
-"1061*0=0",
-"1062*0=0",
-"1063*0=0",
-"1064*0=0",
-"1065*0=0",
-"1066*0=0",
-"1067*0=0",
-"1068*0=0",
-"1069*0=0",
-"106-7=99",
-"106-8=98",
-"106-97=9",
-"106-98=8",
-"106-99=7",
-"106-9=97",
-"106/2=53",
-"106/53=2",
-"1070*0=0",
-"1071*0=0",
-"1072*0=0",
-"1073*0=0",
-"1074*0=0",
-"1075*0=0",
-"1076*0=0",
-"1077*0=0",
-"1078*0=0",
-"1079*0=0",
-"107-8=99",
-"107-98=9",
-"107-99=8",
-"107-9=98",
-"1080*0=0",
-"1081*0=0",
-"1082*0=0",
-"1083*0=0",
-"1084*0=0",
-"1085*0=0",
-"1086*0=0",
-"1087*0=0",
-"1088*0=0",
-"1089*0=0",
-"108-99=9",
-"108-9=99",
-"108/12=9",
-"108/18=6",
-"108/27=4",
-"108/2=54",
-"108/36=3",
-"108/3=36",
-"108/4=27",
-"108/54=2",
-"108/6=18",
-"108/9=12",
-"1090*0=0",
-"1091*0=0",
-"1092*0=0",
-"1093*0=0",
-"1094*0=0",
-"1095*0=0",
-"1096*0=0",
-"1097*0=0",
-"1098*0=0",
-"1099*0=0",
-"10+0-1=9",
-"10+0-2=8",
-"10+0-3=7",
-"10+0-4=6",
-"10+0-5=5",
-"10+0-6=4",
-"10+0-7=3",
-"10+0-8=2",
-"10+0-9=1",
-"10+10=20",
-"10+11=21",
-"10+12=22",
-"10+13=23",
-"10+14=24",
-"10+15=25",
-"10+16=26",
-"10+17=27",
-"10+18=28",
-"10+19=29",
-"10+1-2=9",
-"10+1-3=8",
-"10+1-4=7",
-"10+1-5=6",
-"10+1-6=5",
-"10+1-7=4",
-"10+1-8=3",
-"10+1-9=2",
-"10+20=30",
-"10+21=31",
-"10+22=32",
-"10+23=33",
-"10+24=34",
-"10+25=35",
-"10+26=36",
-"10+27=37",
-"10+28=38",
-"10+29=39",
-"10+2-3=9",
-"10+2-4=8",
-"10+2-5=7",
-"10+2-6=6",
-"10+2-7=5",
-"10+2-8=4",
-"10+2-9=3",
-"10+30=40",
-"10+31=41",
-"10+32=42",
-"10+33=43",
-"10+34=44",
-"10+35=45",
-"10+36=46",
-"10+37=47",
-"10+38=48",
-"10+39=49",
-"10+3-4=9",
-"10+3-5=8",
-"10+3-6=7",
-"10+3-7=6",
-"10+3-8=5",
-"10+3-9=4",
-"10+40=50",
-"10+41=51",
-"10+42=52",
-"10+43=53",
-"10+44=54",
-"10+45=55",
-"10+46=56",
-"10+47=57",
-"10+48=58",
-"10+49=59",
-"10+4-5=9",
-"10+4-6=8",
-"10+4-7=7",
-"10+4-8=6",
-"10+4-9=5",
-"10+50=60",
-"10+51=61",
-"10+52=62",
-"10+53=63",
-"10+54=64",
-"10+55=65",
-"10+56=66",
-"10+57=67",
-"10+58=68",
-"10+59=69",
-"10+5-6=9",
-"10+5-7=8",
-"10+5-8=7",
-"10+5-9=6",
-"10+60=70",
-"10+61=71",
-"10+62=72",
-"10+63=73",
-"10+64=74",
-"10+65=75",
-"10+66=76",
-"10+67=77",
-"10+68=78",
-"10+69=79",
-"10+6-7=9",
-"10+6-8=8",
-"10+6-9=7",
-"10+70=80",
-"10+71=81",
-"10+72=82",
-"10+73=83",
-"10+74=84",
-"10+75=85",
-"10+76=86",
-"10+77=87",
-"10+78=88",
-"10+79=89",
-"10+7-8=9",
-"10+7-9=8",
-"10+80=90",
-"10+81=91",
-"10+82=92",
-"10+83=93",
-"10+84=94",
-"10+85=95",
-"10+86=96",
-"10+87=97",
-"10+88=98",
-"10+89=99",
-"10+8-9=9",
-"10-0-1=9",
-"10-0-2=8",
-"10-0-3=7",
-"10-0-4=6",
-"10-0-5=5",
-"10-0-6=4",
-"10-0-7=3",
-"10-0-8=2",
-"10-0-9=1",
-"10-11=-1",
-"10-12=-2",
-"10-13=-3",
-"10-14=-4",
-"10-15=-5",
-"10-16=-6",
-"10-17=-7",
-"10-18=-8",
-"10-19=-9",
-"10-1+0=9",
-"10-1-0=9",
-"10-1-1=8",
-"10-1-2=7",
-"10-1-3=6",
-"10-1-4=5",
-"10-1-5=4",
-"10-1-6=3",
-"10-1-7=2",
-"10-1-8=1",
-"10-1-9=0",
-"10-1*1=9",
-"10-1*2=8",
-"10-1*3=7",
-"10-1*4=6",
-"10-1*5=5",
-"10-1*6=4",
-"10-1*7=3",
-"10-1*8=2",
-"10-1*9=1",
-"10-1/1=9",
-"10-2+0=8",
-"10-2+1=9",
-"10-2-0=8",
-"10-2-1=7",
-"10-2-2=6",
-"10-2-3=5",
-"10-2-4=4",
-"10-2-5=3",
-"10-2-6=2",
-"10-2-7=1",
-"10-2-8=0",
-"10-2*1=8",
-"10-2*2=6",
-"10-2*3=4",
-"10-2*4=2",
-"10-2*5=0",
-"10-2/1=8",
-"10-2/2=9",
-"10-3+0=7",
-"10-3+1=8",
-"10-3+2=9",
-"10-3-0=7",
-"10-3-1=6",
-"10-3-2=5",
-"10-3-3=4",
-"10-3-4=3",
-"10-3-5=2",
-"10-3-6=1",
-"10-3-7=0",
-"10-3*1=7",
-"10-3*2=4",
-"10-3*3=1",
-"10-3/1=7",
-"10-3/3=9",
-"10-4+0=6",
-"10-4+1=7",
-"10-4+2=8",
-"10-4+3=9",
-"10-4-0=6",
-"10-4-1=5",
-"10-4-2=4",
-"10-4-3=3",
-"10-4-4=2",
-"10-4-5=1",
-"10-4-6=0",
-"10-4*1=6",
-"10-4*2=2",
-"10-4/1=6",
-"10-4/2=8",
-"10-4/4=9",
-"10-5+0=5",
-"10-5+1=6",
-"10-5+2=7",
-"10-5+3=8",
-"10-5+4=9",
-"10-5-0=5",
-"10-5-1=4",
-"10-5-2=3",
-"10-5-3=2",
-"10-5-4=1",
-"10-5-5=0",
-"10-5*1=5",
-"10-5*2=0",
-"10-5/1=5",
-"10-5/5=9",
-"10-6+0=4",
-"10-6+1=5",
-"10-6+2=6",
-"10-6+3=7",
-"10-6+4=8",
-"10-6+5=9",
-"10-6-0=4",
-"10-6-1=3",
-"10-6-2=2",
-"10-6-3=1",
-"10-6-4=0",
-"10-6*1=4",
-"10-6/1=4",
-"10-6/2=7",
-"10-6/3=8",
-"10-6/6=9",
-"10-7+0=3",
-"10-7+1=4",
-"10-7+2=5",
-"10-7+3=6",
-"10-7+4=7",
-"10-7+5=8",
-"10-7+6=9",
-"10-7-0=3",
-"10-7-1=2",
-"10-7-2=1",
-"10-7-3=0",
-"10-7*1=3",
-"10-7/1=3",
-"10-7/7=9",
-"10-8+0=2",
-"10-8+1=3",
-"10-8+2=4",
-"10-8+3=5",
-"10-8+4=6",
-"10-8+5=7",
-"10-8+6=8",
-"10-8+7=9",
-"10-8-0=2",
-"10-8-1=1",
-"10-8-2=0",
-"10-8*1=2",
-"10-8/1=2",
-"10-8/2=6",
-"10-8/4=8",
-"10-8/8=9",
-"10-9+0=1",
-"10-9+1=2",
-"10-9+2=3",
-"10-9+3=4",
-"10-9+4=5",
-"10-9+5=6",
-"10-9+6=7",
-"10-9+7=8",
-"10-9+8=9",
-"10-9-0=1",
-"10-9-1=0",
-"10-9*1=1",
-"10-9/1=1",
-"10-9/3=7",
-"10-9/9=9",
-"10*0+0=0",
-"10*0+1=1",
-"10*0+2=2",
-"10*0+3=3",
-"10*0+4=4",
-"10*0+5=5",
-"10*0+6=6",
-"10*0+7=7",
-"10*0+8=8",
-"10*0+9=9",
-"10*0-0=0",
-"10*0*0=0",
-"10*0*1=0",
-"10*0*2=0",
-"10*0*3=0",
-"10*0*4=0",
-"10*0*5=0",
-"10*0*6=0",
-"10*0*7=0",
-"10*0*8=0",
-"10*0*9=0",
-"10*0/1=0",
-"10*0/2=0",
-"10*0/3=0",
-"10*0/4=0",
-"10*0/5=0",
-"10*0/6=0",
-"10*0/7=0",
-"10*0/8=0",
-"10*0/9=0",
-"10*1-1=9",
-"10*1-2=8",
-"10*1-3=7",
-"10*1-4=6",
-"10*1-5=5",
-"10*1-6=4",
-"10*1-7=3",
-"10*1-8=2",
-"10*1-9=1",
-"10*1*0=0",
-"10*1/2=5",
-"10*1/5=2",
-"10*2*0=0",
-"10*2/4=5",
-"10*2/5=4",
-"10*3*0=0",
-"10*3/5=6",
-"10*3/6=5",
-"10*4*0=0",
-"10*4/5=8",
-"10*4/8=5",
-"10*5*0=0",
-"10*6*0=0",
-"10*7*0=0",
-"10*8*0=0",
-"10*9*0=0",
-"10/1-1=9",
-"10/1-2=8",
-"10/1-3=7",
-"10/1-4=6",
-"10/1-5=5",
-"10/1-6=4",
-"10/1-7=3",
-"10/1-8=2",
-"10/1-9=1",
-"10/1*0=0",
-"10/1/2=5",
-"10/1/5=2",
-"10/2+0=5",
-"10/2+1=6",
-"10/2+2=7",
-"10/2+3=8",
-"10/2+4=9",
-"10/2-0=5",
-"10/2-1=4",
-"10/2-2=3",
-"10/2-3=2",
-"10/2-4=1",
-"10/2-5=0",
-"10/2*0=0",
-"10/2*1=5",
-"10/2/1=5",
-"10/2/5=1",
-"10/3*0=0",
-"10/4*0=0",
-"10/4*2=5",
-"10/5+0=2",
-"10/5+1=3",
-"10/5+2=4",
-"10/5+3=5",
-"10/5+4=6",
-"10/5+5=7",
-"10/5+6=8",
-"10/5+7=9",
-"10/5-0=2",
-"10/5-1=1",
-"10/5-2=0",
-"10/5*0=0",
-"10/5*1=2",
-"10/5*2=4",
-"10/5*3=6",
-"10/5*4=8",
-"10/5/1=2",
-"10/5/2=1",
-"10/6*0=0",
-"10/6*3=5",
-"10/7*0=0",
-"10/8*0=0",
-"10/8*4=5",
-"10/9*0=0",
-"1100*0=0",
-"1101*0=0",
-"1102*0=0",
-"1103*0=0",
-"1104*0=0",
-"1105*0=0",
-"1106*0=0",
-"1107*0=0",
-"1108*0=0",
-"1109*0=0",
-"110/22=5",
-"110/2=55",
-"110/55=2",
-"110/5=22",
-"1110*0=0",
-"1111*0=0",
-"1112*0=0",
-"1113*0=0",
-"1114*0=0",
-"1115*0=0",
-"1116*0=0",
-"1117*0=0",
-"1118*0=0",
-"1119*0=0",
-"111/37=3",
-"111/3=37",
-"1120*0=0",
-"1121*0=0",
-"1122*0=0",
-"1123*0=0",
-"1124*0=0",
-"1125*0=0",
-"1126*0=0",
-"1127*0=0",
-"1128*0=0",
-"1129*0=0",
-"112/14=8",
-"112/16=7",
-"112/28=4",
-"112/2=56",
-"112/4=28",
-"112/56=2",
-"112/7=16",
-"112/8=14",
-"1130*0=0",
-"1131*0=0",
-"1132*0=0",
-"1133*0=0",
-"1134*0=0",
-"1135*0=0",
-"1136*0=0",
-"1137*0=0",
-"1138*0=0",
-"1139*0=0",
-"1140*0=0",
-"1141*0=0",
-"1142*0=0",
-"1143*0=0",
-"1144*0=0",
-"1145*0=0",
-"1146*0=0",
-"1147*0=0",
-"1148*0=0",
-"1149*0=0",
-"114/19=6",
-"114/2=57",
-"114/38=3",
-"114/3=38",
-"114/57=2",
-"114/6=19",
-"1150*0=0",
-"1151*0=0",
-"1152*0=0",
-"1153*0=0",
-"1154*0=0",
-"1155*0=0",
-"1156*0=0",
-"1157*0=0",
-"1158*0=0",
-"1159*0=0",
-"115/23=5",
-"115/5=23",
-"1160*0=0",
-"1161*0=0",
-"1162*0=0",
-"1163*0=0",
-"1164*0=0",
-"1165*0=0",
-"1166*0=0",
-"1167*0=0",
-"1168*0=0",
-"1169*0=0",
-"116/29=4",
-"116/2=58",
-"116/4=29",
-"116/58=2",
-"1170*0=0",
-"1171*0=0",
-"1172*0=0",
-"1173*0=0",
-"1174*0=0",
-"1175*0=0",
-"1176*0=0",
-"1177*0=0",
-"1178*0=0",
-"1179*0=0",
-"117/13=9",
-"117/39=3",
-"117/3=39",
-"117/9=13",
-"1180*0=0",
-"1181*0=0",
-"1182*0=0",
-"1183*0=0",
-"1184*0=0",
-"1185*0=0",
-"1186*0=0",
-"1187*0=0",
-"1188*0=0",
-"1189*0=0",
-"118/2=59",
-"118/59=2",
-"1190*0=0",
-"1191*0=0",
-"1192*0=0",
-"1193*0=0",
-"1194*0=0",
-"1195*0=0",
-"1196*0=0",
-"1197*0=0",
-"1198*0=0",
-"1199*0=0",
-"119/17=7",
-"119/7=17",
-"11+0-2=9",
-"11+0-3=8",
-"11+0-4=7",
-"11+0-5=6",
-"11+0-6=5",
-"11+0-7=4",
-"11+0-8=3",
-"11+0-9=2",
-"11+10=21",
-"11+11=22",
-"11+12=23",
-"11+13=24",
-"11+14=25",
-"11+15=26",
-"11+16=27",
-"11+17=28",
-"11+18=29",
-"11+19=30",
-"11+1-3=9",
-"11+1-4=8",
-"11+1-5=7",
-"11+1-6=6",
-"11+1-7=5",
-"11+1-8=4",
-"11+1-9=3",
-"11+20=31",
-"11+21=32",
-"11+22=33",
-"11+23=34",
-"11+24=35",
-"11+25=36",
-"11+26=37",
-"11+27=38",
-"11+28=39",
-"11+29=40",
-"11+2-4=9",
-"11+2-5=8",
-"11+2-6=7",
-"11+2-7=6",
-"11+2-8=5",
-"11+2-9=4",
-"11+30=41",
-"11+31=42",
-"11+32=43",
-"11+33=44",
-"11+34=45",
-"11+35=46",
-"11+36=47",
-"11+37=48",
-"11+38=49",
-"11+39=50",
-"11+3-5=9",
-"11+3-6=8",
-"11+3-7=7",
-"11+3-8=6",
-"11+3-9=5",
-"11+40=51",
-"11+41=52",
-"11+42=53",
-"11+43=54",
-"11+44=55",
-"11+45=56",
-"11+46=57",
-"11+47=58",
-"11+48=59",
-"11+49=60",
-"11+4-6=9",
-"11+4-7=8",
-"11+4-8=7",
-"11+4-9=6",
-"11+50=61",
-"11+51=62",
-"11+52=63",
-"11+53=64",
-"11+54=65",
-"11+55=66",
-"11+56=67",
-"11+57=68",
-"11+58=69",
-"11+59=70",
-"11+5-7=9",
-"11+5-8=8",
-"11+5-9=7",
-"11+60=71",
-"11+61=72",
-"11+62=73",
-"11+63=74",
-"11+64=75",
-"11+65=76",
-"11+66=77",
-"11+67=78",
-"11+68=79",
-"11+69=80",
-"11+6-8=9",
-"11+6-9=8",
-"11+70=81",
-"11+71=82",
-"11+72=83",
-"11+73=84",
-"11+74=85",
-"11+75=86",
-"11+76=87",
-"11+77=88",
-"11+78=89",
-"11+79=90",
-"11+7-9=9",
-"11+80=91",
-"11+81=92",
-"11+82=93",
-"11+83=94",
-"11+84=95",
-"11+85=96",
-"11+86=97",
-"11+87=98",
-"11+88=99",
-"11-0-2=9",
-"11-0-3=8",
-"11-0-4=7",
-"11-0-5=6",
-"11-0-6=5",
-"11-0-7=4",
-"11-0-8=3",
-"11-0-9=2",
-"11-12=-1",
-"11-13=-2",
-"11-14=-3",
-"11-15=-4",
-"11-16=-5",
-"11-17=-6",
-"11-18=-7",
-"11-19=-8",
-"11-1-1=9",
-"11-1-2=8",
-"11-1-3=7",
-"11-1-4=6",
-"11-1-5=5",
-"11-1-6=4",
-"11-1-7=3",
-"11-1-8=2",
-"11-1-9=1",
-"11-1*2=9",
-"11-1*3=8",
-"11-1*4=7",
-"11-1*5=6",
-"11-1*6=5",
-"11-1*7=4",
-"11-1*8=3",
-"11-1*9=2",
-"11-20=-9",
-"11-2+0=9",
-"11-2-0=9",
-"11-2-1=8",
-"11-2-2=7",
-"11-2-3=6",
-"11-2-4=5",
-"11-2-5=4",
-"11-2-6=3",
-"11-2-7=2",
-"11-2-8=1",
-"11-2-9=0",
-"11-2*1=9",
-"11-2*2=7",
-"11-2*3=5",
-"11-2*4=3",
-"11-2*5=1",
-"11-2/1=9",
-"11-3+0=8",
-"11-3+1=9",
-"11-3-0=8",
-"11-3-1=7",
-"11-3-2=6",
-"11-3-3=5",
-"11-3-4=4",
-"11-3-5=3",
-"11-3-6=2",
-"11-3-7=1",
-"11-3-8=0",
-"11-3*1=8",
-"11-3*2=5",
-"11-3*3=2",
-"11-3/1=8",
-"11-4+0=7",
-"11-4+1=8",
-"11-4+2=9",
-"11-4-0=7",
-"11-4-1=6",
-"11-4-2=5",
-"11-4-3=4",
-"11-4-4=3",
-"11-4-5=2",
-"11-4-6=1",
-"11-4-7=0",
-"11-4*1=7",
-"11-4*2=3",
-"11-4/1=7",
-"11-4/2=9",
-"11-5+0=6",
-"11-5+1=7",
-"11-5+2=8",
-"11-5+3=9",
-"11-5-0=6",
-"11-5-1=5",
-"11-5-2=4",
-"11-5-3=3",
-"11-5-4=2",
-"11-5-5=1",
-"11-5-6=0",
-"11-5*1=6",
-"11-5*2=1",
-"11-5/1=6",
-"11-6+0=5",
-"11-6+1=6",
-"11-6+2=7",
-"11-6+3=8",
-"11-6+4=9",
-"11-6-0=5",
-"11-6-1=4",
-"11-6-2=3",
-"11-6-3=2",
-"11-6-4=1",
-"11-6-5=0",
-"11-6*1=5",
-"11-6/1=5",
-"11-6/2=8",
-"11-6/3=9",
-"11-7+0=4",
-"11-7+1=5",
-"11-7+2=6",
-"11-7+3=7",
-"11-7+4=8",
-"11-7+5=9",
-"11-7-0=4",
-"11-7-1=3",
-"11-7-2=2",
-"11-7-3=1",
-"11-7-4=0",
-"11-7*1=4",
-"11-7/1=4",
-"11-8+0=3",
-"11-8+1=4",
-"11-8+2=5",
-"11-8+3=6",
-"11-8+4=7",
-"11-8+5=8",
-"11-8+6=9",
-"11-8-0=3",
-"11-8-1=2",
-"11-8-2=1",
-"11-8-3=0",
-"11-8*1=3",
-"11-8/1=3",
-"11-8/2=7",
-"11-8/4=9",
-"11-9+0=2",
-"11-9+1=3",
-"11-9+2=4",
-"11-9+3=5",
-"11-9+4=6",
-"11-9+5=7",
-"11-9+6=8",
-"11-9+7=9",
-"11-9-0=2",
-"11-9-1=1",
-"11-9-2=0",
-"11-9*1=2",
-"11-9/1=2",
-"11-9/3=8",
-"11*0+0=0",
-"11*0+1=1",
-"11*0+2=2",
-"11*0+3=3",
-"11*0+4=4",
-"11*0+5=5",
-"11*0+6=6",
-"11*0+7=7",
-"11*0+8=8",
-"11*0+9=9",
-"11*0-0=0",
-"11*0*0=0",
-"11*0*1=0",
-"11*0*2=0",
-"11*0*3=0",
-"11*0*4=0",
-"11*0*5=0",
-"11*0*6=0",
-"11*0*7=0",
-"11*0*8=0",
-"11*0*9=0",
-"11*0/1=0",
-"11*0/2=0",
-"11*0/3=0",
-"11*0/4=0",
-"11*0/5=0",
-"11*0/6=0",
-"11*0/7=0",
-"11*0/8=0",
-"11*0/9=0",
-"11*1-2=9",
-"11*1-3=8",
-"11*1-4=7",
-"11*1-5=6",
-"11*1-6=5",
-"11*1-7=4",
-"11*1-8=3",
-"11*1-9=2",
-"11*1*0=0",
-"11*2*0=0",
-"11*3*0=0",
-"11*4*0=0",
-"11*5*0=0",
-"11*6*0=0",
-"11*7*0=0",
-"11*8*0=0",
-"11*9*0=0",
-"11/1-2=9",
-"11/1-3=8",
-"11/1-4=7",
-"11/1-5=6",
-"11/1-6=5",
-"11/1-7=4",
-"11/1-8=3",
-"11/1-9=2",
-"11/1*0=0",
-"11/2*0=0",
-"11/3*0=0",
-"11/4*0=0",
-"11/5*0=0",
-"11/6*0=0",
-"11/7*0=0",
-"11/8*0=0",
-"11/9*0=0",
-"1200*0=0",
-"1201*0=0",
-"1202*0=0",
-"1203*0=0",
-"1204*0=0",
-"1205*0=0",
-"1206*0=0",
-"1207*0=0",
-"1208*0=0",
-"1209*0=0",
-"120/15=8",
-"120/20=6",
-"120/24=5",
-"120/2=60",
-"120/30=4",
-"120/3=40",
-"120/40=3",
-"120/4=30",
-"120/5=24",
-"120/60=2",
-"120/6=20",
-"120/8=15",
-"1210*0=0",
-"1211*0=0",
-"1212*0=0",
-"1213*0=0",
-"1214*0=0",
-"1215*0=0",
-"1216*0=0",
-"1217*0=0",
-"1218*0=0",
-"1219*0=0",
-"1220*0=0",
-"1221*0=0",
-"1222*0=0",
-"1223*0=0",
-"1224*0=0",
-"1225*0=0",
-"1226*0=0",
-"1227*0=0",
-"1228*0=0",
-"1229*0=0",
-"122/2=61",
-"122/61=2",
-"1230*0=0",
-"1231*0=0",
-"1232*0=0",
-"1233*0=0",
-"1234*0=0",
-"1235*0=0",
-"1236*0=0",
-"1237*0=0",
-"1238*0=0",
-"1239*0=0",
-"123/3=41",
-"123/41=3",
-"1240*0=0",
-"1241*0=0",
-"1242*0=0",
-"1243*0=0",
-"1244*0=0",
-"1245*0=0",
-"1246*0=0",
-"1247*0=0",
-"1248*0=0",
-"1249*0=0",
-"124/2=62",
-"124/31=4",
-"124/4=31",
-"124/62=2",
-"1250*0=0",
-"1251*0=0",
-"1252*0=0",
-"1253*0=0",
-"1254*0=0",
-"1255*0=0",
-"1256*0=0",
-"1257*0=0",
-"1258*0=0",
-"1259*0=0",
-"125/25=5",
-"125/5=25",
-"1260*0=0",
-"1261*0=0",
-"1262*0=0",
-"1263*0=0",
-"1264*0=0",
-"1265*0=0",
-"1266*0=0",
-"1267*0=0",
-"1268*0=0",
-"1269*0=0",
-"126/14=9",
-"126/18=7",
-"126/21=6",
-"126/2=63",
-"126/3=42",
-"126/42=3",
-"126/63=2",
-"126/6=21",
-"126/7=18",
-"126/9=14",
-"1270*0=0",
-"1271*0=0",
-"1272*0=0",
-"1273*0=0",
-"1274*0=0",
-"1275*0=0",
-"1276*0=0",
-"1277*0=0",
-"1278*0=0",
-"1279*0=0",
-"1280*0=0",
-"1281*0=0",
-"1282*0=0",
-"1283*0=0",
-"1284*0=0",
-"1285*0=0",
-"1286*0=0",
-"1287*0=0",
-"1288*0=0",
-"1289*0=0",
-"128/16=8",
-"128/2=64",
-"128/32=4",
-"128/4=32",
-"128/64=2",
-"128/8=16",
-"1290*0=0",
-"1291*0=0",
-"1292*0=0",
-"1293*0=0",
-"1294*0=0",
-"1295*0=0",
-"1296*0=0",
-"1297*0=0",
-"1298*0=0",
-"1299*0=0",
-"129/3=43",
-"129/43=3",
-"12+0-3=9",
-"12+0-4=8",
-"12+0-5=7",
-"12+0-6=6",
-"12+0-7=5",
-"12+0-8=4",
-"12+0-9=3",
-"12+10=22",
-"12+11=23",
-"12+12=24",
-"12+13=25",
-"12+14=26",
-"12+15=27",
-"12+16=28",
-"12+17=29",
-"12+18=30",
-"12+19=31",
-"12+1-4=9",
-"12+1-5=8",
-"12+1-6=7",
-"12+1-7=6",
-"12+1-8=5",
-"12+1-9=4",
-"12+20=32",
-"12+21=33",
-"12+22=34",
-"12+23=35",
-"12+24=36",
-"12+25=37",
-"12+26=38",
-"12+27=39",
-"12+28=40",
-"12+29=41",
-"12+2-5=9",
-"12+2-6=8",
-"12+2-7=7",
-"12+2-8=6",
-"12+2-9=5",
-"12+30=42",
-"12+31=43",
-"12+32=44",
-"12+33=45",
-"12+34=46",
-"12+35=47",
-"12+36=48",
-"12+37=49",
-"12+38=50",
-"12+39=51",
-"12+3-6=9",
-"12+3-7=8",
-"12+3-8=7",
-"12+3-9=6",
-"12+40=52",
-"12+41=53",
-"12+42=54",
-"12+43=55",
-"12+44=56",
-"12+45=57",
-"12+46=58",
-"12+47=59",
-"12+48=60",
-"12+49=61",
-"12+4-7=9",
-"12+4-8=8",
-"12+4-9=7",
-"12+50=62",
-"12+51=63",
-"12+52=64",
-"12+53=65",
-"12+54=66",
-"12+55=67",
-"12+56=68",
-"12+57=69",
-"12+58=70",
-"12+59=71",
-"12+5-8=9",
-"12+5-9=8",
-"12+60=72",
-"12+61=73",
-"12+62=74",
-"12+63=75",
-"12+64=76",
-"12+65=77",
-"12+66=78",
-"12+67=79",
-"12+68=80",
-"12+69=81",
-"12+6-9=9",
-"12+70=82",
-"12+71=83",
-"12+72=84",
-"12+73=85",
-"12+74=86",
-"12+75=87",
-"12+76=88",
-"12+77=89",
-"12+78=90",
-"12+79=91",
-"12+80=92",
-"12+81=93",
-"12+82=94",
-"12+83=95",
-"12+84=96",
-"12+85=97",
-"12+86=98",
-"12+87=99",
-"12-0-3=9",
-"12-0-4=8",
-"12-0-5=7",
-"12-0-6=6",
-"12-0-7=5",
-"12-0-8=4",
-"12-0-9=3",
-"12-13=-1",
-"12-14=-2",
-"12-15=-3",
-"12-16=-4",
-"12-17=-5",
-"12-18=-6",
-"12-19=-7",
-"12-1-2=9",
-"12-1-3=8",
-"12-1-4=7",
-"12-1-5=6",
-"12-1-6=5",
-"12-1-7=4",
-"12-1-8=3",
-"12-1-9=2",
-"12-1*3=9",
-"12-1*4=8",
-"12-1*5=7",
-"12-1*6=6",
-"12-1*7=5",
-"12-1*8=4",
-"12-1*9=3",
-"12-20=-8",
-"12-21=-9",
-"12-2-1=9",
-"12-2-2=8",
-"12-2-3=7",
-"12-2-4=6",
-"12-2-5=5",
-"12-2-6=4",
-"12-2-7=3",
-"12-2-8=2",
-"12-2-9=1",
-"12-2*2=8",
-"12-2*3=6",
-"12-2*4=4",
-"12-2*5=2",
-"12-2*6=0",
-"12-3+0=9",
-"12-3-0=9",
-"12-3-1=8",
-"12-3-2=7",
-"12-3-3=6",
-"12-3-4=5",
-"12-3-5=4",
-"12-3-6=3",
-"12-3-7=2",
-"12-3-8=1",
-"12-3-9=0",
-"12-3*1=9",
-"12-3*2=6",
-"12-3*3=3",
-"12-3*4=0",
-"12-3/1=9",
-"12-4+0=8",
-"12-4+1=9",
-"12-4-0=8",
-"12-4-1=7",
-"12-4-2=6",
-"12-4-3=5",
-"12-4-4=4",
-"12-4-5=3",
-"12-4-6=2",
-"12-4-7=1",
-"12-4-8=0",
-"12-4*1=8",
-"12-4*2=4",
-"12-4*3=0",
-"12-4/1=8",
-"12-5+0=7",
-"12-5+1=8",
-"12-5+2=9",
-"12-5-0=7",
-"12-5-1=6",
-"12-5-2=5",
-"12-5-3=4",
-"12-5-4=3",
-"12-5-5=2",
-"12-5-6=1",
-"12-5-7=0",
-"12-5*1=7",
-"12-5*2=2",
-"12-5/1=7",
-"12-6+0=6",
-"12-6+1=7",
-"12-6+2=8",
-"12-6+3=9",
-"12-6-0=6",
-"12-6-1=5",
-"12-6-2=4",
-"12-6-3=3",
-"12-6-4=2",
-"12-6-5=1",
-"12-6-6=0",
-"12-6*1=6",
-"12-6*2=0",
-"12-6/1=6",
-"12-6/2=9",
-"12-7+0=5",
-"12-7+1=6",
-"12-7+2=7",
-"12-7+3=8",
-"12-7+4=9",
-"12-7-0=5",
-"12-7-1=4",
-"12-7-2=3",
-"12-7-3=2",
-"12-7-4=1",
-"12-7-5=0",
-"12-7*1=5",
-"12-7/1=5",
-"12-8+0=4",
-"12-8+1=5",
-"12-8+2=6",
-"12-8+3=7",
-"12-8+4=8",
-"12-8+5=9",
-"12-8-0=4",
-"12-8-1=3",
-"12-8-2=2",
-"12-8-3=1",
-"12-8-4=0",
-"12-8*1=4",
-"12-8/1=4",
-"12-8/2=8",
-"12-9+0=3",
-"12-9+1=4",
-"12-9+2=5",
-"12-9+3=6",
-"12-9+4=7",
-"12-9+5=8",
-"12-9+6=9",
-"12-9-0=3",
-"12-9-1=2",
-"12-9-2=1",
-"12-9-3=0",
-"12-9*1=3",
-"12-9/1=3",
-"12-9/3=9",
-"12*0+0=0",
-"12*0+1=1",
-"12*0+2=2",
-"12*0+3=3",
-"12*0+4=4",
-"12*0+5=5",
-"12*0+6=6",
-"12*0+7=7",
-"12*0+8=8",
-"12*0+9=9",
-"12*0-0=0",
-"12*0*0=0",
-"12*0*1=0",
-"12*0*2=0",
-"12*0*3=0",
-"12*0*4=0",
-"12*0*5=0",
-"12*0*6=0",
-"12*0*7=0",
-"12*0*8=0",
-"12*0*9=0",
-"12*0/1=0",
-"12*0/2=0",
-"12*0/3=0",
-"12*0/4=0",
-"12*0/5=0",
-"12*0/6=0",
-"12*0/7=0",
-"12*0/8=0",
-"12*0/9=0",
-"12*1-3=9",
-"12*1-4=8",
-"12*1-5=7",
-"12*1-6=6",
-"12*1-7=5",
-"12*1-8=4",
-"12*1-9=3",
-"12*1*0=0",
-"12*1/2=6",
-"12*1/3=4",
-"12*1/4=3",
-"12*1/6=2",
-"12*2*0=0",
-"12*2/3=8",
-"12*2/4=6",
-"12*2/6=4",
-"12*2/8=3",
-"12*3*0=0",
-"12*3/4=9",
-"12*3/6=6",
-"12*3/9=4",
-"12*4*0=0",
-"12*4/6=8",
-"12*4/8=6",
-"12*5*0=0",
-"12*6*0=0",
-"12*6/8=9",
-"12*6/9=8",
-"12*7*0=0",
-"12*8*0=0",
-"12*9*0=0",
-"12*9=108",
-"12/1-3=9",
-"12/1-4=8",
-"12/1-5=7",
-"12/1-6=6",
-"12/1-7=5",
-"12/1-8=4",
-"12/1-9=3",
-"12/1*0=0",
-"12/1/2=6",
-"12/1/3=4",
-"12/1/4=3",
-"12/1/6=2",
-"12/2+0=6",
-"12/2+1=7",
-"12/2+2=8",
-"12/2+3=9",
-"12/2-0=6",
-"12/2-1=5",
-"12/2-2=4",
-"12/2-3=3",
-"12/2-4=2",
-"12/2-5=1",
-"12/2-6=0",
-"12/2*0=0",
-"12/2*1=6",
-"12/2/1=6",
-"12/2/2=3",
-"12/2/3=2",
-"12/2/6=1",
-"12/3+0=4",
-"12/3+1=5",
-"12/3+2=6",
-"12/3+3=7",
-"12/3+4=8",
-"12/3+5=9",
-"12/3-0=4",
-"12/3-1=3",
-"12/3-2=2",
-"12/3-3=1",
-"12/3-4=0",
-"12/3*0=0",
-"12/3*1=4",
-"12/3*2=8",
-"12/3/1=4",
-"12/3/2=2",
-"12/3/4=1",
-"12/4+0=3",
-"12/4+1=4",
-"12/4+2=5",
-"12/4+3=6",
-"12/4+4=7",
-"12/4+5=8",
-"12/4+6=9",
-"12/4-0=3",
-"12/4-1=2",
-"12/4-2=1",
-"12/4-3=0",
-"12/4*0=0",
-"12/4*1=3",
-"12/4*2=6",
-"12/4*3=9",
-"12/4/1=3",
-"12/4/3=1",
-"12/5*0=0",
-"12/6+0=2",
-"12/6+1=3",
-"12/6+2=4",
-"12/6+3=5",
-"12/6+4=6",
-"12/6+5=7",
-"12/6+6=8",
-"12/6+7=9",
-"12/6-0=2",
-"12/6-1=1",
-"12/6-2=0",
-"12/6*0=0",
-"12/6*1=2",
-"12/6*2=4",
-"12/6*3=6",
-"12/6*4=8",
-"12/6/1=2",
-"12/6/2=1",
-"12/7*0=0",
-"12/8*0=0",
-"12/8*2=3",
-"12/8*4=6",
-"12/8*6=9",
-"12/9*0=0",
-"12/9*3=4",
-"12/9*6=8",
-"1300*0=0",
-"1301*0=0",
-"1302*0=0",
-"1303*0=0",
-"1304*0=0",
-"1305*0=0",
-"1306*0=0",
-"1307*0=0",
-"1308*0=0",
-"1309*0=0",
-"130/26=5",
-"130/2=65",
-"130/5=26",
-"130/65=2",
-"1310*0=0",
-"1311*0=0",
-"1312*0=0",
-"1313*0=0",
-"1314*0=0",
-"1315*0=0",
-"1316*0=0",
-"1317*0=0",
-"1318*0=0",
-"1319*0=0",
-"1320*0=0",
-"1321*0=0",
-"1322*0=0",
-"1323*0=0",
-"1324*0=0",
-"1325*0=0",
-"1326*0=0",
-"1327*0=0",
-"1328*0=0",
-"1329*0=0",
-"132/22=6",
-"132/2=66",
-"132/33=4",
-"132/3=44",
-"132/44=3",
-"132/4=33",
-"132/66=2",
-"132/6=22",
-"1330*0=0",
-"1331*0=0",
-"1332*0=0",
-"1333*0=0",
-"1334*0=0",
-"1335*0=0",
-"1336*0=0",
-"1337*0=0",
-"1338*0=0",
-"1339*0=0",
-"133/19=7",
-"133/7=19",
-"1340*0=0",
-"1341*0=0",
-"1342*0=0",
-"1343*0=0",
-"1344*0=0",
-"1345*0=0",
-"1346*0=0",
-"1347*0=0",
-"1348*0=0",
-"1349*0=0",
-"134/2=67",
-"134/67=2",
-"1350*0=0",
-"1351*0=0",
-"1352*0=0",
-"1353*0=0",
-"1354*0=0",
-"1355*0=0",
-"1356*0=0",
-"1357*0=0",
-"1358*0=0",
-"1359*0=0",
-"135/15=9",
-"135/27=5",
-"135/3=45",
-"135/45=3",
-"135/5=27",
-"135/9=15",
-"1360*0=0",
-"1361*0=0",
-"1362*0=0",
-"1363*0=0",
-"1364*0=0",
-"1365*0=0",
-"1366*0=0",
-"1367*0=0",
-"1368*0=0",
-"1369*0=0",
-"136/17=8",
-"136/2=68",
-"136/34=4",
-"136/4=34",
-"136/68=2",
-"136/8=17",
-"1370*0=0",
-"1371*0=0",
-"1372*0=0",
-"1373*0=0",
-"1374*0=0",
-"1375*0=0",
-"1376*0=0",
-"1377*0=0",
-"1378*0=0",
-"1379*0=0",
-"1380*0=0",
-"1381*0=0",
-"1382*0=0",
-"1383*0=0",
-"1384*0=0",
-"1385*0=0",
-"1386*0=0",
-"1387*0=0",
-"1388*0=0",
-"1389*0=0",
-"138/23=6",
-"138/2=69",
-"138/3=46",
-"138/46=3",
-"138/69=2",
-"138/6=23",
-"1390*0=0",
-"1391*0=0",
-"1392*0=0",
-"1393*0=0",
-"1394*0=0",
-"1395*0=0",
-"1396*0=0",
-"1397*0=0",
-"1398*0=0",
-"1399*0=0",
-"13+0-4=9",
-"13+0-5=8",
-"13+0-6=7",
-"13+0-7=6",
-"13+0-8=5",
-"13+0-9=4",
-"13+10=23",
-"13+11=24",
-"13+12=25",
-"13+13=26",
-"13+14=27",
-"13+15=28",
-"13+16=29",
-"13+17=30",
-"13+18=31",
-"13+19=32",
-"13+1-5=9",
-"13+1-6=8",
-"13+1-7=7",
-"13+1-8=6",
-"13+1-9=5",
-"13+20=33",
-"13+21=34",
-"13+22=35",
-"13+23=36",
-"13+24=37",
-"13+25=38",
-"13+26=39",
-"13+27=40",
-"13+28=41",
-"13+29=42",
-"13+2-6=9",
-"13+2-7=8",
-"13+2-8=7",
-"13+2-9=6",
-"13+30=43",
-"13+31=44",
-"13+32=45",
-"13+33=46",
-"13+34=47",
-"13+35=48",
-"13+36=49",
-"13+37=50",
-"13+38=51",
-"13+39=52",
-"13+3-7=9",
-"13+3-8=8",
-"13+3-9=7",
-"13+40=53",
-"13+41=54",
-"13+42=55",
-"13+43=56",
-"13+44=57",
-"13+45=58",
-"13+46=59",
-"13+47=60",
-"13+48=61",
-"13+49=62",
-"13+4-8=9",
-"13+4-9=8",
-"13+50=63",
-"13+51=64",
-"13+52=65",
-"13+53=66",
-"13+54=67",
-"13+55=68",
-"13+56=69",
-"13+57=70",
-"13+58=71",
-"13+59=72",
-"13+5-9=9",
-"13+60=73",
-"13+61=74",
-"13+62=75",
-"13+63=76",
-"13+64=77",
-"13+65=78",
-"13+66=79",
-"13+67=80",
-"13+68=81",
-"13+69=82",
-"13+70=83",
-"13+71=84",
-"13+72=85",
-"13+73=86",
-"13+74=87",
-"13+75=88",
-"13+76=89",
-"13+77=90",
-"13+78=91",
-"13+79=92",
-"13+80=93",
-"13+81=94",
-"13+82=95",
-"13+83=96",
-"13+84=97",
-"13+85=98",
-"13+86=99",
-"13-0-4=9",
-"13-0-5=8",
-"13-0-6=7",
-"13-0-7=6",
-"13-0-8=5",
-"13-0-9=4",
-"13-14=-1",
-"13-15=-2",
-"13-16=-3",
-"13-17=-4",
-"13-18=-5",
-"13-19=-6",
-"13-1-3=9",
-"13-1-4=8",
-"13-1-5=7",
-"13-1-6=6",
-"13-1-7=5",
-"13-1-8=4",
-"13-1-9=3",
-"13-1*4=9",
-"13-1*5=8",
-"13-1*6=7",
-"13-1*7=6",
-"13-1*8=5",
-"13-1*9=4",
-"13-20=-7",
-"13-21=-8",
-"13-22=-9",
-"13-2-2=9",
-"13-2-3=8",
-"13-2-4=7",
-"13-2-5=6",
-"13-2-6=5",
-"13-2-7=4",
-"13-2-8=3",
-"13-2-9=2",
-"13-2*2=9",
-"13-2*3=7",
-"13-2*4=5",
-"13-2*5=3",
-"13-2*6=1",
-"13-3-1=9",
-"13-3-2=8",
-"13-3-3=7",
-"13-3-4=6",
-"13-3-5=5",
-"13-3-6=4",
-"13-3-7=3",
-"13-3-8=2",
-"13-3-9=1",
-"13-3*2=7",
-"13-3*3=4",
-"13-3*4=1",
-"13-4+0=9",
-"13-4-0=9",
-"13-4-1=8",
-"13-4-2=7",
-"13-4-3=6",
-"13-4-4=5",
-"13-4-5=4",
-"13-4-6=3",
-"13-4-7=2",
-"13-4-8=1",
-"13-4-9=0",
-"13-4*1=9",
-"13-4*2=5",
-"13-4*3=1",
-"13-4/1=9",
-"13-5+0=8",
-"13-5+1=9",
-"13-5-0=8",
-"13-5-1=7",
-"13-5-2=6",
-"13-5-3=5",
-"13-5-4=4",
-"13-5-5=3",
-"13-5-6=2",
-"13-5-7=1",
-"13-5-8=0",
-"13-5*1=8",
-"13-5*2=3",
-"13-5/1=8",
-"13-6+0=7",
-"13-6+1=8",
-"13-6+2=9",
-"13-6-0=7",
-"13-6-1=6",
-"13-6-2=5",
-"13-6-3=4",
-"13-6-4=3",
-"13-6-5=2",
-"13-6-6=1",
-"13-6-7=0",
-"13-6*1=7",
-"13-6*2=1",
-"13-6/1=7",
-"13-7+0=6",
-"13-7+1=7",
-"13-7+2=8",
-"13-7+3=9",
-"13-7-0=6",
-"13-7-1=5",
-"13-7-2=4",
-"13-7-3=3",
-"13-7-4=2",
-"13-7-5=1",
-"13-7-6=0",
-"13-7*1=6",
-"13-7/1=6",
-"13-8+0=5",
-"13-8+1=6",
-"13-8+2=7",
-"13-8+3=8",
-"13-8+4=9",
-"13-8-0=5",
-"13-8-1=4",
-"13-8-2=3",
-"13-8-3=2",
-"13-8-4=1",
-"13-8-5=0",
-"13-8*1=5",
-"13-8/1=5",
-"13-8/2=9",
-"13-9+0=4",
-"13-9+1=5",
-"13-9+2=6",
-"13-9+3=7",
-"13-9+4=8",
-"13-9+5=9",
-"13-9-0=4",
-"13-9-1=3",
-"13-9-2=2",
-"13-9-3=1",
-"13-9-4=0",
-"13-9*1=4",
-"13-9/1=4",
-"13*0+0=0",
-"13*0+1=1",
-"13*0+2=2",
-"13*0+3=3",
-"13*0+4=4",
-"13*0+5=5",
-"13*0+6=6",
-"13*0+7=7",
-"13*0+8=8",
-"13*0+9=9",
-"13*0-0=0",
-"13*0*0=0",
-"13*0*1=0",
-"13*0*2=0",
-"13*0*3=0",
-"13*0*4=0",
-"13*0*5=0",
-"13*0*6=0",
-"13*0*7=0",
-"13*0*8=0",
-"13*0*9=0",
-"13*0/1=0",
-"13*0/2=0",
-"13*0/3=0",
-"13*0/4=0",
-"13*0/5=0",
-"13*0/6=0",
-"13*0/7=0",
-"13*0/8=0",
-"13*0/9=0",
-"13*1-4=9",
-"13*1-5=8",
-"13*1-6=7",
-"13*1-7=6",
-"13*1-8=5",
-"13*1-9=4",
-"13*1*0=0",
-"13*2*0=0",
-"13*3*0=0",
-"13*4*0=0",
-"13*5*0=0",
-"13*6*0=0",
-"13*7*0=0",
-"13*8*0=0",
-"13*8=104",
-"13*9*0=0",
-"13*9=117",
-"13/1-4=9",
-"13/1-5=8",
-"13/1-6=7",
-"13/1-7=6",
-"13/1-8=5",
-"13/1-9=4",
-"13/1*0=0",
-"13/2*0=0",
-"13/3*0=0",
-"13/4*0=0",
-"13/5*0=0",
-"13/6*0=0",
-"13/7*0=0",
-"13/8*0=0",
-"13/9*0=0",
-"1400*0=0",
-"1401*0=0",
-"1402*0=0",
-"1403*0=0",
-"1404*0=0",
-"1405*0=0",
-"1406*0=0",
-"1407*0=0",
-"1408*0=0",
-"1409*0=0",
-"140/20=7",
-"140/28=5",
-"140/2=70",
-"140/35=4",
-"140/4=35",
-"140/5=28",
-"140/70=2",
-"140/7=20",
-"1410*0=0",
-"1411*0=0",
-"1412*0=0",
-"1413*0=0",
-"1414*0=0",
-"1415*0=0",
-"1416*0=0",
-"1417*0=0",
-"1418*0=0",
-"1419*0=0",
-"141/3=47",
-"141/47=3",
-"1420*0=0",
-"1421*0=0",
-"1422*0=0",
-"1423*0=0",
-"1424*0=0",
-"1425*0=0",
-"1426*0=0",
-"1427*0=0",
-"1428*0=0",
-"1429*0=0",
-"142/2=71",
-"142/71=2",
-"1430*0=0",
-"1431*0=0",
-"1432*0=0",
-"1433*0=0",
-"1434*0=0",
-"1435*0=0",
-"1436*0=0",
-"1437*0=0",
-"1438*0=0",
-"1439*0=0",
-"1440*0=0",
-"1441*0=0",
-"1442*0=0",
-"1443*0=0",
-"1444*0=0",
-"1445*0=0",
-"1446*0=0",
-"1447*0=0",
-"1448*0=0",
-"1449*0=0",
-"144/16=9",
-"144/18=8",
-"144/24=6",
-"144/2=72",
-"144/36=4",
-"144/3=48",
-"144/48=3",
-"144/4=36",
-"144/6=24",
-"144/72=2",
-"144/8=18",
-"144/9=16",
-"1450*0=0",
-"1451*0=0",
-"1452*0=0",
-"1453*0=0",
-"1454*0=0",
-"1455*0=0",
-"1456*0=0",
-"1457*0=0",
-"1458*0=0",
-"1459*0=0",
-"145/29=5",
-"145/5=29",
-"1460*0=0",
-"1461*0=0",
-"1462*0=0",
-"1463*0=0",
-"1464*0=0",
-"1465*0=0",
-"1466*0=0",
-"1467*0=0",
-"1468*0=0",
-"1469*0=0",
-"146/2=73",
-"146/73=2",
-"1470*0=0",
-"1471*0=0",
-"1472*0=0",
-"1473*0=0",
-"1474*0=0",
-"1475*0=0",
-"1476*0=0",
-"1477*0=0",
-"1478*0=0",
-"1479*0=0",
-"147/21=7",
-"147/3=49",
-"147/49=3",
-"147/7=21",
-"1480*0=0",
-"1481*0=0",
-"1482*0=0",
-"1483*0=0",
-"1484*0=0",
-"1485*0=0",
-"1486*0=0",
-"1487*0=0",
-"1488*0=0",
-"1489*0=0",
-"148/2=74",
-"148/37=4",
-"148/4=37",
-"148/74=2",
-"1490*0=0",
-"1491*0=0",
-"1492*0=0",
-"1493*0=0",
-"1494*0=0",
-"1495*0=0",
-"1496*0=0",
-"1497*0=0",
-"1498*0=0",
-"1499*0=0",
-"14+0-5=9",
-"14+0-6=8",
-"14+0-7=7",
-"14+0-8=6",
-"14+0-9=5",
-"14+10=24",
-"14+11=25",
-"14+12=26",
-"14+13=27",
-"14+14=28",
-"14+15=29",
-"14+16=30",
-"14+17=31",
-"14+18=32",
-"14+19=33",
-"14+1-6=9",
-"14+1-7=8",
-"14+1-8=7",
-"14+1-9=6",
-"14+20=34",
-"14+21=35",
-"14+22=36",
-"14+23=37",
-"14+24=38",
-"14+25=39",
-"14+26=40",
-"14+27=41",
-"14+28=42",
-"14+29=43",
-"14+2-7=9",
-"14+2-8=8",
-"14+2-9=7",
-"14+30=44",
-"14+31=45",
-"14+32=46",
-"14+33=47",
-"14+34=48",
-"14+35=49",
-"14+36=50",
-"14+37=51",
-"14+38=52",
-"14+39=53",
-"14+3-8=9",
-"14+3-9=8",
-"14+40=54",
-"14+41=55",
-"14+42=56",
-"14+43=57",
-"14+44=58",
-"14+45=59",
-"14+46=60",
-"14+47=61",
-"14+48=62",
-"14+49=63",
-"14+4-9=9",
-"14+50=64",
-"14+51=65",
-"14+52=66",
-"14+53=67",
-"14+54=68",
-"14+55=69",
-"14+56=70",
-"14+57=71",
-"14+58=72",
-"14+59=73",
-"14+60=74",
-"14+61=75",
-"14+62=76",
-"14+63=77",
-"14+64=78",
-"14+65=79",
-"14+66=80",
-"14+67=81",
-"14+68=82",
-"14+69=83",
-"14+70=84",
-"14+71=85",
-"14+72=86",
-"14+73=87",
-"14+74=88",
-"14+75=89",
-"14+76=90",
-"14+77=91",
-"14+78=92",
-"14+79=93",
-"14+80=94",
-"14+81=95",
-"14+82=96",
-"14+83=97",
-"14+84=98",
-"14+85=99",
-"14-0-5=9",
-"14-0-6=8",
-"14-0-7=7",
-"14-0-8=6",
-"14-0-9=5",
-"14-15=-1",
-"14-16=-2",
-"14-17=-3",
-"14-18=-4",
-"14-19=-5",
-"14-1-4=9",
-"14-1-5=8",
-"14-1-6=7",
-"14-1-7=6",
-"14-1-8=5",
-"14-1-9=4",
-"14-1*5=9",
-"14-1*6=8",
-"14-1*7=7",
-"14-1*8=6",
-"14-1*9=5",
-"14-20=-6",
-"14-21=-7",
-"14-22=-8",
-"14-23=-9",
-"14-2-3=9",
-"14-2-4=8",
-"14-2-5=7",
-"14-2-6=6",
-"14-2-7=5",
-"14-2-8=4",
-"14-2-9=3",
-"14-2*3=8",
-"14-2*4=6",
-"14-2*5=4",
-"14-2*6=2",
-"14-2*7=0",
-"14-3-2=9",
-"14-3-3=8",
-"14-3-4=7",
-"14-3-5=6",
-"14-3-6=5",
-"14-3-7=4",
-"14-3-8=3",
-"14-3-9=2",
-"14-3*2=8",
-"14-3*3=5",
-"14-3*4=2",
-"14-4-1=9",
-"14-4-2=8",
-"14-4-3=7",
-"14-4-4=6",
-"14-4-5=5",
-"14-4-6=4",
-"14-4-7=3",
-"14-4-8=2",
-"14-4-9=1",
-"14-4*2=6",
-"14-4*3=2",
-"14-5+0=9",
-"14-5-0=9",
-"14-5-1=8",
-"14-5-2=7",
-"14-5-3=6",
-"14-5-4=5",
-"14-5-5=4",
-"14-5-6=3",
-"14-5-7=2",
-"14-5-8=1",
-"14-5-9=0",
-"14-5*1=9",
-"14-5*2=4",
-"14-5/1=9",
-"14-6+0=8",
-"14-6+1=9",
-"14-6-0=8",
-"14-6-1=7",
-"14-6-2=6",
-"14-6-3=5",
-"14-6-4=4",
-"14-6-5=3",
-"14-6-6=2",
-"14-6-7=1",
-"14-6-8=0",
-"14-6*1=8",
-"14-6*2=2",
-"14-6/1=8",
-"14-7+0=7",
-"14-7+1=8",
-"14-7+2=9",
-"14-7-0=7",
-"14-7-1=6",
-"14-7-2=5",
-"14-7-3=4",
-"14-7-4=3",
-"14-7-5=2",
-"14-7-6=1",
-"14-7-7=0",
-"14-7*1=7",
-"14-7*2=0",
-"14-7/1=7",
-"14-8+0=6",
-"14-8+1=7",
-"14-8+2=8",
-"14-8+3=9",
-"14-8-0=6",
-"14-8-1=5",
-"14-8-2=4",
-"14-8-3=3",
-"14-8-4=2",
-"14-8-5=1",
-"14-8-6=0",
-"14-8*1=6",
-"14-8/1=6",
-"14-9+0=5",
-"14-9+1=6",
-"14-9+2=7",
-"14-9+3=8",
-"14-9+4=9",
-"14-9-0=5",
-"14-9-1=4",
-"14-9-2=3",
-"14-9-3=2",
-"14-9-4=1",
-"14-9-5=0",
-"14-9*1=5",
-"14-9/1=5",
-"14*0+0=0",
-"14*0+1=1",
-"14*0+2=2",
-"14*0+3=3",
-"14*0+4=4",
-"14*0+5=5",
-"14*0+6=6",
-"14*0+7=7",
-"14*0+8=8",
-"14*0+9=9",
-"14*0-0=0",
-"14*0*0=0",
-"14*0*1=0",
-"14*0*2=0",
-"14*0*3=0",
-"14*0*4=0",
-"14*0*5=0",
-"14*0*6=0",
-"14*0*7=0",
-"14*0*8=0",
-"14*0*9=0",
-"14*0/1=0",
-"14*0/2=0",
-"14*0/3=0",
-"14*0/4=0",
-"14*0/5=0",
-"14*0/6=0",
-"14*0/7=0",
-"14*0/8=0",
-"14*0/9=0",
-"14*1-5=9",
-"14*1-6=8",
-"14*1-7=7",
-"14*1-8=6",
-"14*1-9=5",
-"14*1*0=0",
-"14*1/2=7",
-"14*1/7=2",
-"14*2*0=0",
-"14*2/4=7",
-"14*2/7=4",
-"14*3*0=0",
-"14*3/6=7",
-"14*3/7=6",
-"14*4*0=0",
-"14*4/7=8",
-"14*4/8=7",
-"14*5*0=0",
-"14*6*0=0",
-"14*7*0=0",
-"14*8*0=0",
-"14*8=112",
-"14*9*0=0",
-"14*9=126",
-"14/1-5=9",
-"14/1-6=8",
-"14/1-7=7",
-"14/1-8=6",
-"14/1-9=5",
-"14/1*0=0",
-"14/1/2=7",
-"14/1/7=2",
-"14/2+0=7",
-"14/2+1=8",
-"14/2+2=9",
-"14/2-0=7",
-"14/2-1=6",
-"14/2-2=5",
-"14/2-3=4",
-"14/2-4=3",
-"14/2-5=2",
-"14/2-6=1",
-"14/2-7=0",
-"14/2*0=0",
-"14/2*1=7",
-"14/2/1=7",
-"14/2/7=1",
-"14/3*0=0",
-"14/4*0=0",
-"14/4*2=7",
-"14/5*0=0",
-"14/6*0=0",
-"14/6*3=7",
-"14/7+0=2",
-"14/7+1=3",
-"14/7+2=4",
-"14/7+3=5",
-"14/7+4=6",
-"14/7+5=7",
-"14/7+6=8",
-"14/7+7=9",
-"14/7-0=2",
-"14/7-1=1",
-"14/7-2=0",
-"14/7*0=0",
-"14/7*1=2",
-"14/7*2=4",
-"14/7*3=6",
-"14/7*4=8",
-"14/7/1=2",
-"14/7/2=1",
-"14/8*0=0",
-"14/8*4=7",
-"14/9*0=0",
-"1500*0=0",
-"1501*0=0",
-"1502*0=0",
-"1503*0=0",
-"1504*0=0",
-"1505*0=0",
-"1506*0=0",
-"1507*0=0",
-"1508*0=0",
-"1509*0=0",
-"150/25=6",
-"150/2=75",
-"150/30=5",
-"150/3=50",
-"150/50=3",
-"150/5=30",
-"150/6=25",
-"150/75=2",
-"1510*0=0",
-"1511*0=0",
-"1512*0=0",
-"1513*0=0",
-"1514*0=0",
-"1515*0=0",
-"1516*0=0",
-"1517*0=0",
-"1518*0=0",
-"1519*0=0",
-"1520*0=0",
-"1521*0=0",
-"1522*0=0",
-"1523*0=0",
-"1524*0=0",
-"1525*0=0",
-"1526*0=0",
-"1527*0=0",
-"1528*0=0",
-"1529*0=0",
-"152/19=8",
-"152/2=76",
-"152/38=4",
-"152/4=38",
-"152/76=2",
-"152/8=19",
-"1530*0=0",
-"1531*0=0",
-"1532*0=0",
-"1533*0=0",
-"1534*0=0",
-"1535*0=0",
-"1536*0=0",
-"1537*0=0",
-"1538*0=0",
-"1539*0=0",
-"153/17=9",
-"153/3=51",
-"153/51=3",
-"153/9=17",
-"1540*0=0",
-"1541*0=0",
-"1542*0=0",
-"1543*0=0",
-"1544*0=0",
-"1545*0=0",
-"1546*0=0",
-"1547*0=0",
-"1548*0=0",
-"1549*0=0",
-"154/22=7",
-"154/2=77",
-"154/77=2",
-"154/7=22",
-"1550*0=0",
-"1551*0=0",
-"1552*0=0",
-"1553*0=0",
-"1554*0=0",
-"1555*0=0",
-"1556*0=0",
-"1557*0=0",
-"1558*0=0",
-"1559*0=0",
-"155/31=5",
-"155/5=31",
-"1560*0=0",
-"1561*0=0",
-"1562*0=0",
-"1563*0=0",
-"1564*0=0",
-"1565*0=0",
-"1566*0=0",
-"1567*0=0",
-"1568*0=0",
-"1569*0=0",
-"156/26=6",
-"156/2=78",
-"156/39=4",
-"156/3=52",
-"156/4=39",
-"156/52=3",
-"156/6=26",
-"156/78=2",
-"1570*0=0",
-"1571*0=0",
-"1572*0=0",
-"1573*0=0",
-"1574*0=0",
-"1575*0=0",
-"1576*0=0",
-"1577*0=0",
-"1578*0=0",
-"1579*0=0",
-"1580*0=0",
-"1581*0=0",
-"1582*0=0",
-"1583*0=0",
-"1584*0=0",
-"1585*0=0",
-"1586*0=0",
-"1587*0=0",
-"1588*0=0",
-"1589*0=0",
-"158/2=79",
-"158/79=2",
-"1590*0=0",
-"1591*0=0",
-"1592*0=0",
-"1593*0=0",
-"1594*0=0",
-"1595*0=0",
-"1596*0=0",
-"1597*0=0",
-"1598*0=0",
-"1599*0=0",
-"159/3=53",
-"159/53=3",
-"15+0-6=9",
-"15+0-7=8",
-"15+0-8=7",
-"15+0-9=6",
-"15+10=25",
-"15+11=26",
-"15+12=27",
-"15+13=28",
-"15+14=29",
-"15+15=30",
-"15+16=31",
-"15+17=32",
-"15+18=33",
-"15+19=34",
-"15+1-7=9",
-"15+1-8=8",
-"15+1-9=7",
-"15+20=35",
-"15+21=36",
-"15+22=37",
-"15+23=38",
-"15+24=39",
-"15+25=40",
-"15+26=41",
-"15+27=42",
-"15+28=43",
-"15+29=44",
-"15+2-8=9",
-"15+2-9=8",
-"15+30=45",
-"15+31=46",
-"15+32=47",
-"15+33=48",
-"15+34=49",
-"15+35=50",
-"15+36=51",
-"15+37=52",
-"15+38=53",
-"15+39=54",
-"15+3-9=9",
-"15+40=55",
-"15+41=56",
-"15+42=57",
-"15+43=58",
-"15+44=59",
-"15+45=60",
-"15+46=61",
-"15+47=62",
-"15+48=63",
-"15+49=64",
-"15+50=65",
-"15+51=66",
-"15+52=67",
-"15+53=68",
-"15+54=69",
-"15+55=70",
-"15+56=71",
-"15+57=72",
-"15+58=73",
-"15+59=74",
-"15+60=75",
-"15+61=76",
-"15+62=77",
-"15+63=78",
-"15+64=79",
-"15+65=80",
-"15+66=81",
-"15+67=82",
-"15+68=83",
-"15+69=84",
-"15+70=85",
-"15+71=86",
-"15+72=87",
-"15+73=88",
-"15+74=89",
-"15+75=90",
-"15+76=91",
-"15+77=92",
-"15+78=93",
-"15+79=94",
-"15+80=95",
-"15+81=96",
-"15+82=97",
-"15+83=98",
-"15+84=99",
-"15-0-6=9",
-"15-0-7=8",
-"15-0-8=7",
-"15-0-9=6",
-"15-16=-1",
-"15-17=-2",
-"15-18=-3",
-"15-19=-4",
-"15-1-5=9",
-"15-1-6=8",
-"15-1-7=7",
-"15-1-8=6",
-"15-1-9=5",
-"15-1*6=9",
-"15-1*7=8",
-"15-1*8=7",
-"15-1*9=6",
-"15-20=-5",
-"15-21=-6",
-"15-22=-7",
-"15-23=-8",
-"15-24=-9",
-"15-2-4=9",
-"15-2-5=8",
-"15-2-6=7",
-"15-2-7=6",
-"15-2-8=5",
-"15-2-9=4",
-"15-2*3=9",
-"15-2*4=7",
-"15-2*5=5",
-"15-2*6=3",
-"15-2*7=1",
-"15-3-3=9",
-"15-3-4=8",
-"15-3-5=7",
-"15-3-6=6",
-"15-3-7=5",
-"15-3-8=4",
-"15-3-9=3",
-"15-3*2=9",
-"15-3*3=6",
-"15-3*4=3",
-"15-3*5=0",
-"15-4-2=9",
-"15-4-3=8",
-"15-4-4=7",
-"15-4-5=6",
-"15-4-6=5",
-"15-4-7=4",
-"15-4-8=3",
-"15-4-9=2",
-"15-4*2=7",
-"15-4*3=3",
-"15-5-1=9",
-"15-5-2=8",
-"15-5-3=7",
-"15-5-4=6",
-"15-5-5=5",
-"15-5-6=4",
-"15-5-7=3",
-"15-5-8=2",
-"15-5-9=1",
-"15-5*2=5",
-"15-5*3=0",
-"15-6+0=9",
-"15-6-0=9",
-"15-6-1=8",
-"15-6-2=7",
-"15-6-3=6",
-"15-6-4=5",
-"15-6-5=4",
-"15-6-6=3",
-"15-6-7=2",
-"15-6-8=1",
-"15-6-9=0",
-"15-6*1=9",
-"15-6*2=3",
-"15-6/1=9",
-"15-7+0=8",
-"15-7+1=9",
-"15-7-0=8",
-"15-7-1=7",
-"15-7-2=6",
-"15-7-3=5",
-"15-7-4=4",
-"15-7-5=3",
-"15-7-6=2",
-"15-7-7=1",
-"15-7-8=0",
-"15-7*1=8",
-"15-7*2=1",
-"15-7/1=8",
-"15-8+0=7",
-"15-8+1=8",
-"15-8+2=9",
-"15-8-0=7",
-"15-8-1=6",
-"15-8-2=5",
-"15-8-3=4",
-"15-8-4=3",
-"15-8-5=2",
-"15-8-6=1",
-"15-8-7=0",
-"15-8*1=7",
-"15-8/1=7",
-"15-9+0=6",
-"15-9+1=7",
-"15-9+2=8",
-"15-9+3=9",
-"15-9-0=6",
-"15-9-1=5",
-"15-9-2=4",
-"15-9-3=3",
-"15-9-4=2",
-"15-9-5=1",
-"15-9-6=0",
-"15-9*1=6",
-"15-9/1=6",
-"15*0+0=0",
-"15*0+1=1",
-"15*0+2=2",
-"15*0+3=3",
-"15*0+4=4",
-"15*0+5=5",
-"15*0+6=6",
-"15*0+7=7",
-"15*0+8=8",
-"15*0+9=9",
-"15*0-0=0",
-"15*0*0=0",
-"15*0*1=0",
-"15*0*2=0",
-"15*0*3=0",
-"15*0*4=0",
-"15*0*5=0",
-"15*0*6=0",
-"15*0*7=0",
-"15*0*8=0",
-"15*0*9=0",
-"15*0/1=0",
-"15*0/2=0",
-"15*0/3=0",
-"15*0/4=0",
-"15*0/5=0",
-"15*0/6=0",
-"15*0/7=0",
-"15*0/8=0",
-"15*0/9=0",
-"15*1-6=9",
-"15*1-7=8",
-"15*1-8=7",
-"15*1-9=6",
-"15*1*0=0",
-"15*1/3=5",
-"15*1/5=3",
-"15*2*0=0",
-"15*2/5=6",
-"15*2/6=5",
-"15*3*0=0",
-"15*3/5=9",
-"15*3/9=5",
-"15*4*0=0",
-"15*5*0=0",
-"15*6*0=0",
-"15*7*0=0",
-"15*7=105",
-"15*8*0=0",
-"15*8=120",
-"15*9*0=0",
-"15*9=135",
-"15/1-6=9",
-"15/1-7=8",
-"15/1-8=7",
-"15/1-9=6",
-"15/1*0=0",
-"15/1/3=5",
-"15/1/5=3",
-"15/2*0=0",
-"15/3+0=5",
-"15/3+1=6",
-"15/3+2=7",
-"15/3+3=8",
-"15/3+4=9",
-"15/3-0=5",
-"15/3-1=4",
-"15/3-2=3",
-"15/3-3=2",
-"15/3-4=1",
-"15/3-5=0",
-"15/3*0=0",
-"15/3*1=5",
-"15/3/1=5",
-"15/3/5=1",
-"15/4*0=0",
-"15/5+0=3",
-"15/5+1=4",
-"15/5+2=5",
-"15/5+3=6",
-"15/5+4=7",
-"15/5+5=8",
-"15/5+6=9",
-"15/5-0=3",
-"15/5-1=2",
-"15/5-2=1",
-"15/5-3=0",
-"15/5*0=0",
-"15/5*1=3",
-"15/5*2=6",
-"15/5*3=9",
-"15/5/1=3",
-"15/5/3=1",
-"15/6*0=0",
-"15/6*2=5",
-"15/7*0=0",
-"15/8*0=0",
-"15/9*0=0",
-"15/9*3=5",
-"1600*0=0",
-"1601*0=0",
-"1602*0=0",
-"1603*0=0",
-"1604*0=0",
-"1605*0=0",
-"1606*0=0",
-"1607*0=0",
-"1608*0=0",
-"1609*0=0",
-"160/20=8",
-"160/2=80",
-"160/32=5",
-"160/40=4",
-"160/4=40",
-"160/5=32",
-"160/80=2",
-"160/8=20",
-"1610*0=0",
-"1611*0=0",
-"1612*0=0",
-"1613*0=0",
-"1614*0=0",
-"1615*0=0",
-"1616*0=0",
-"1617*0=0",
-"1618*0=0",
-"1619*0=0",
-"161/23=7",
-"161/7=23",
-"1620*0=0",
-"1621*0=0",
-"1622*0=0",
-"1623*0=0",
-"1624*0=0",
-"1625*0=0",
-"1626*0=0",
-"1627*0=0",
-"1628*0=0",
-"1629*0=0",
-"162/18=9",
-"162/27=6",
-"162/2=81",
-"162/3=54",
-"162/54=3",
-"162/6=27",
-"162/81=2",
-"162/9=18",
-"1630*0=0",
-"1631*0=0",
-"1632*0=0",
-"1633*0=0",
-"1634*0=0",
-"1635*0=0",
-"1636*0=0",
-"1637*0=0",
-"1638*0=0",
-"1639*0=0",
-"1640*0=0",
-"1641*0=0",
-"1642*0=0",
-"1643*0=0",
-"1644*0=0",
-"1645*0=0",
-"1646*0=0",
-"1647*0=0",
-"1648*0=0",
-"1649*0=0",
-"164/2=82",
-"164/41=4",
-"164/4=41",
-"164/82=2",
-"1650*0=0",
-"1651*0=0",
-"1652*0=0",
-"1653*0=0",
-"1654*0=0",
-"1655*0=0",
-"1656*0=0",
-"1657*0=0",
-"1658*0=0",
-"1659*0=0",
-"165/33=5",
-"165/3=55",
-"165/55=3",
-"165/5=33",
-"1660*0=0",
-"1661*0=0",
-"1662*0=0",
-"1663*0=0",
-"1664*0=0",
-"1665*0=0",
-"1666*0=0",
-"1667*0=0",
-"1668*0=0",
-"1669*0=0",
-"166/2=83",
-"166/83=2",
-"1670*0=0",
-"1671*0=0",
-"1672*0=0",
-"1673*0=0",
-"1674*0=0",
-"1675*0=0",
-"1676*0=0",
-"1677*0=0",
-"1678*0=0",
-"1679*0=0",
-"1680*0=0",
-"1681*0=0",
-"1682*0=0",
-"1683*0=0",
-"1684*0=0",
-"1685*0=0",
-"1686*0=0",
-"1687*0=0",
-"1688*0=0",
-"1689*0=0",
-"168/21=8",
-"168/24=7",
-"168/28=6",
-"168/2=84",
-"168/3=56",
-"168/42=4",
-"168/4=42",
-"168/56=3",
-"168/6=28",
-"168/7=24",
-"168/84=2",
-"168/8=21",
-"1690*0=0",
-"1691*0=0",
-"1692*0=0",
-"1693*0=0",
-"1694*0=0",
-"1695*0=0",
-"1696*0=0",
-"1697*0=0",
-"1698*0=0",
-"1699*0=0",
-"16+0-7=9",
-"16+0-8=8",
-"16+0-9=7",
-"16+10=26",
-"16+11=27",
-"16+12=28",
-"16+13=29",
-"16+14=30",
-"16+15=31",
-"16+16=32",
-"16+17=33",
-"16+18=34",
-"16+19=35",
-"16+1-8=9",
-"16+1-9=8",
-"16+20=36",
-"16+21=37",
-"16+22=38",
-"16+23=39",
-"16+24=40",
-"16+25=41",
-"16+26=42",
-"16+27=43",
-"16+28=44",
-"16+29=45",
-"16+2-9=9",
-"16+30=46",
-"16+31=47",
-"16+32=48",
-"16+33=49",
-"16+34=50",
-"16+35=51",
-"16+36=52",
-"16+37=53",
-"16+38=54",
-"16+39=55",
-"16+40=56",
-"16+41=57",
-"16+42=58",
-"16+43=59",
-"16+44=60",
-"16+45=61",
-"16+46=62",
-"16+47=63",
-"16+48=64",
-"16+49=65",
-"16+50=66",
-"16+51=67",
-"16+52=68",
-"16+53=69",
-"16+54=70",
-"16+55=71",
-"16+56=72",
-"16+57=73",
-"16+58=74",
-"16+59=75",
-"16+60=76",
-"16+61=77",
-"16+62=78",
-"16+63=79",
-"16+64=80",
-"16+65=81",
-"16+66=82",
-"16+67=83",
-"16+68=84",
-"16+69=85",
-"16+70=86",
-"16+71=87",
-"16+72=88",
-"16+73=89",
-"16+74=90",
-"16+75=91",
-"16+76=92",
-"16+77=93",
-"16+78=94",
-"16+79=95",
-"16+80=96",
-"16+81=97",
-"16+82=98",
-"16+83=99",
-"16-0-7=9",
-"16-0-8=8",
-"16-0-9=7",
-"16-17=-1",
-"16-18=-2",
-"16-19=-3",
-"16-1-6=9",
-"16-1-7=8",
-"16-1-8=7",
-"16-1-9=6",
-"16-1*7=9",
-"16-1*8=8",
-"16-1*9=7",
-"16-20=-4",
-"16-21=-5",
-"16-22=-6",
-"16-23=-7",
-"16-24=-8",
-"16-25=-9",
-"16-2-5=9",
-"16-2-6=8",
-"16-2-7=7",
-"16-2-8=6",
-"16-2-9=5",
-"16-2*4=8",
-"16-2*5=6",
-"16-2*6=4",
-"16-2*7=2",
-"16-2*8=0",
-"16-3-4=9",
-"16-3-5=8",
-"16-3-6=7",
-"16-3-7=6",
-"16-3-8=5",
-"16-3-9=4",
-"16-3*3=7",
-"16-3*4=4",
-"16-3*5=1",
-"16-4-3=9",
-"16-4-4=8",
-"16-4-5=7",
-"16-4-6=6",
-"16-4-7=5",
-"16-4-8=4",
-"16-4-9=3",
-"16-4*2=8",
-"16-4*3=4",
-"16-4*4=0",
-"16-5-2=9",
-"16-5-3=8",
-"16-5-4=7",
-"16-5-5=6",
-"16-5-6=5",
-"16-5-7=4",
-"16-5-8=3",
-"16-5-9=2",
-"16-5*2=6",
-"16-5*3=1",
-"16-6-1=9",
-"16-6-2=8",
-"16-6-3=7",
-"16-6-4=6",
-"16-6-5=5",
-"16-6-6=4",
-"16-6-7=3",
-"16-6-8=2",
-"16-6-9=1",
-"16-6*2=4",
-"16-7+0=9",
-"16-7-0=9",
-"16-7-1=8",
-"16-7-2=7",
-"16-7-3=6",
-"16-7-4=5",
-"16-7-5=4",
-"16-7-6=3",
-"16-7-7=2",
-"16-7-8=1",
-"16-7-9=0",
-"16-7*1=9",
-"16-7*2=2",
-"16-7/1=9",
-"16-8+0=8",
-"16-8+1=9",
-"16-8-0=8",
-"16-8-1=7",
-"16-8-2=6",
-"16-8-3=5",
-"16-8-4=4",
-"16-8-5=3",
-"16-8-6=2",
-"16-8-7=1",
-"16-8-8=0",
-"16-8*1=8",
-"16-8*2=0",
-"16-8/1=8",
-"16-9+0=7",
-"16-9+1=8",
-"16-9+2=9",
-"16-9-0=7",
-"16-9-1=6",
-"16-9-2=5",
-"16-9-3=4",
-"16-9-4=3",
-"16-9-5=2",
-"16-9-6=1",
-"16-9-7=0",
-"16-9*1=7",
-"16-9/1=7",
-"16*0+0=0",
-"16*0+1=1",
-"16*0+2=2",
-"16*0+3=3",
-"16*0+4=4",
-"16*0+5=5",
-"16*0+6=6",
-"16*0+7=7",
-"16*0+8=8",
-"16*0+9=9",
-"16*0-0=0",
-"16*0*0=0",
-"16*0*1=0",
-"16*0*2=0",
-"16*0*3=0",
-"16*0*4=0",
-"16*0*5=0",
-"16*0*6=0",
-"16*0*7=0",
-"16*0*8=0",
-"16*0*9=0",
-"16*0/1=0",
-"16*0/2=0",
-"16*0/3=0",
-"16*0/4=0",
-"16*0/5=0",
-"16*0/6=0",
-"16*0/7=0",
-"16*0/8=0",
-"16*0/9=0",
-"16*1-7=9",
-"16*1-8=8",
-"16*1-9=7",
-"16*1*0=0",
-"16*1/2=8",
-"16*1/4=4",
-"16*1/8=2",
-"16*2*0=0",
-"16*2/4=8",
-"16*2/8=4",
-"16*3*0=0",
-"16*3/6=8",
-"16*3/8=6",
-"16*4*0=0",
-"16*4/8=8",
-"16*5*0=0",
-"16*6*0=0",
-"16*7*0=0",
-"16*7=112",
-"16*8*0=0",
-"16*8=128",
-"16*9*0=0",
-"16*9=144",
-"16/1-7=9",
-"16/1-8=8",
-"16/1-9=7",
-"16/1*0=0",
-"16/1/2=8",
-"16/1/4=4",
-"16/1/8=2",
-"16/2+0=8",
-"16/2+1=9",
-"16/2-0=8",
-"16/2-1=7",
-"16/2-2=6",
-"16/2-3=5",
-"16/2-4=4",
-"16/2-5=3",
-"16/2-6=2",
-"16/2-7=1",
-"16/2-8=0",
-"16/2*0=0",
-"16/2*1=8",
-"16/2/1=8",
-"16/2/2=4",
-"16/2/4=2",
-"16/2/8=1",
-"16/3*0=0",
-"16/4+0=4",
-"16/4+1=5",
-"16/4+2=6",
-"16/4+3=7",
-"16/4+4=8",
-"16/4+5=9",
-"16/4-0=4",
-"16/4-1=3",
-"16/4-2=2",
-"16/4-3=1",
-"16/4-4=0",
-"16/4*0=0",
-"16/4*1=4",
-"16/4*2=8",
-"16/4/1=4",
-"16/4/2=2",
-"16/4/4=1",
-"16/5*0=0",
-"16/6*0=0",
-"16/6*3=8",
-"16/7*0=0",
-"16/8+0=2",
-"16/8+1=3",
-"16/8+2=4",
-"16/8+3=5",
-"16/8+4=6",
-"16/8+5=7",
-"16/8+6=8",
-"16/8+7=9",
-"16/8-0=2",
-"16/8-1=1",
-"16/8-2=0",
-"16/8*0=0",
-"16/8*1=2",
-"16/8*2=4",
-"16/8*3=6",
-"16/8*4=8",
-"16/8/1=2",
-"16/8/2=1",
-"16/9*0=0",
-"1700*0=0",
-"1701*0=0",
-"1702*0=0",
-"1703*0=0",
-"1704*0=0",
-"1705*0=0",
-"1706*0=0",
-"1707*0=0",
-"1708*0=0",
-"1709*0=0",
-"170/2=85",
-"170/34=5",
-"170/5=34",
-"170/85=2",
-"1710*0=0",
-"1711*0=0",
-"1712*0=0",
-"1713*0=0",
-"1714*0=0",
-"1715*0=0",
-"1716*0=0",
-"1717*0=0",
-"1718*0=0",
-"1719*0=0",
-"171/19=9",
-"171/3=57",
-"171/57=3",
-"171/9=19",
-"1720*0=0",
-"1721*0=0",
-"1722*0=0",
-"1723*0=0",
-"1724*0=0",
-"1725*0=0",
-"1726*0=0",
-"1727*0=0",
-"1728*0=0",
-"1729*0=0",
-"172/2=86",
-"172/43=4",
-"172/4=43",
-"172/86=2",
-"1730*0=0",
-"1731*0=0",
-"1732*0=0",
-"1733*0=0",
-"1734*0=0",
-"1735*0=0",
-"1736*0=0",
-"1737*0=0",
-"1738*0=0",
-"1739*0=0",
-"1740*0=0",
-"1741*0=0",
-"1742*0=0",
-"1743*0=0",
-"1744*0=0",
-"1745*0=0",
-"1746*0=0",
-"1747*0=0",
-"1748*0=0",
-"1749*0=0",
-"174/29=6",
-"174/2=87",
-"174/3=58",
-"174/58=3",
-"174/6=29",
-"174/87=2",
-"1750*0=0",
-"1751*0=0",
-"1752*0=0",
-"1753*0=0",
-"1754*0=0",
-"1755*0=0",
-"1756*0=0",
-"1757*0=0",
-"1758*0=0",
-"1759*0=0",
-"175/25=7",
-"175/35=5",
-"175/5=35",
-"175/7=25",
-"1760*0=0",
-"1761*0=0",
-"1762*0=0",
-"1763*0=0",
-"1764*0=0",
-"1765*0=0",
-"1766*0=0",
-"1767*0=0",
-"1768*0=0",
-"1769*0=0",
-"176/22=8",
-"176/2=88",
-"176/44=4",
-"176/4=44",
-"176/88=2",
-"176/8=22",
-"1770*0=0",
-"1771*0=0",
-"1772*0=0",
-"1773*0=0",
-"1774*0=0",
-"1775*0=0",
-"1776*0=0",
-"1777*0=0",
-"1778*0=0",
-"1779*0=0",
-"177/3=59",
-"177/59=3",
-"1780*0=0",
-"1781*0=0",
-"1782*0=0",
-"1783*0=0",
-"1784*0=0",
-"1785*0=0",
-"1786*0=0",
-"1787*0=0",
-"1788*0=0",
-"1789*0=0",
-"178/2=89",
-"178/89=2",
-"1790*0=0",
-"1791*0=0",
-"1792*0=0",
-"1793*0=0",
-"1794*0=0",
-"1795*0=0",
-"1796*0=0",
-"1797*0=0",
-"1798*0=0",
-"1799*0=0",
-"17+0-8=9",
-"17+0-9=8",
-"17+10=27",
-"17+11=28",
-"17+12=29",
-"17+13=30",
-"17+14=31",
-"17+15=32",
-"17+16=33",
-"17+17=34",
-"17+18=35",
-"17+19=36",
-"17+1-9=9",
-"17+20=37",
-"17+21=38",
-"17+22=39",
-"17+23=40",
-"17+24=41",
-"17+25=42",
-"17+26=43",
-"17+27=44",
-"17+28=45",
-"17+29=46",
-"17+30=47",
-"17+31=48",
-"17+32=49",
-"17+33=50",
-"17+34=51",
-"17+35=52",
-"17+36=53",
-"17+37=54",
-"17+38=55",
-"17+39=56",
-"17+40=57",
-"17+41=58",
-"17+42=59",
-"17+43=60",
-"17+44=61",
-"17+45=62",
-"17+46=63",
-"17+47=64",
-"17+48=65",
-"17+49=66",
-"17+50=67",
-"17+51=68",
-"17+52=69",
-"17+53=70",
-"17+54=71",
-"17+55=72",
-"17+56=73",
-"17+57=74",
-"17+58=75",
-"17+59=76",
-"17+60=77",
-"17+61=78",
-"17+62=79",
-"17+63=80",
-"17+64=81",
-"17+65=82",
-"17+66=83",
-"17+67=84",
-"17+68=85",
-"17+69=86",
-"17+70=87",
-"17+71=88",
-"17+72=89",
-"17+73=90",
-"17+74=91",
-"17+75=92",
-"17+76=93",
-"17+77=94",
-"17+78=95",
-"17+79=96",
-"17+80=97",
-"17+81=98",
-"17+82=99",
-"17-0-8=9",
-"17-0-9=8",
-"17-18=-1",
-"17-19=-2",
-"17-1-7=9",
-"17-1-8=8",
-"17-1-9=7",
-"17-1*8=9",
-"17-1*9=8",
-"17-20=-3",
-"17-21=-4",
-"17-22=-5",
-"17-23=-6",
-"17-24=-7",
-"17-25=-8",
-"17-26=-9",
-"17-2-6=9",
-"17-2-7=8",
-"17-2-8=7",
-"17-2-9=6",
-"17-2*4=9",
-"17-2*5=7",
-"17-2*6=5",
-"17-2*7=3",
-"17-2*8=1",
-"17-3-5=9",
-"17-3-6=8",
-"17-3-7=7",
-"17-3-8=6",
-"17-3-9=5",
-"17-3*3=8",
-"17-3*4=5",
-"17-3*5=2",
-"17-4-4=9",
-"17-4-5=8",
-"17-4-6=7",
-"17-4-7=6",
-"17-4-8=5",
-"17-4-9=4",
-"17-4*2=9",
-"17-4*3=5",
-"17-4*4=1",
-"17-5-3=9",
-"17-5-4=8",
-"17-5-5=7",
-"17-5-6=6",
-"17-5-7=5",
-"17-5-8=4",
-"17-5-9=3",
-"17-5*2=7",
-"17-5*3=2",
-"17-6-2=9",
-"17-6-3=8",
-"17-6-4=7",
-"17-6-5=6",
-"17-6-6=5",
-"17-6-7=4",
-"17-6-8=3",
-"17-6-9=2",
-"17-6*2=5",
-"17-7-1=9",
-"17-7-2=8",
-"17-7-3=7",
-"17-7-4=6",
-"17-7-5=5",
-"17-7-6=4",
-"17-7-7=3",
-"17-7-8=2",
-"17-7-9=1",
-"17-7*2=3",
-"17-8+0=9",
-"17-8-0=9",
-"17-8-1=8",
-"17-8-2=7",
-"17-8-3=6",
-"17-8-4=5",
-"17-8-5=4",
-"17-8-6=3",
-"17-8-7=2",
-"17-8-8=1",
-"17-8-9=0",
-"17-8*1=9",
-"17-8*2=1",
-"17-8/1=9",
-"17-9+0=8",
-"17-9+1=9",
-"17-9-0=8",
-"17-9-1=7",
-"17-9-2=6",
-"17-9-3=5",
-"17-9-4=4",
-"17-9-5=3",
-"17-9-6=2",
-"17-9-7=1",
-"17-9-8=0",
-"17-9*1=8",
-"17-9/1=8",
-"17*0+0=0",
-"17*0+1=1",
-"17*0+2=2",
-"17*0+3=3",
-"17*0+4=4",
-"17*0+5=5",
-"17*0+6=6",
-"17*0+7=7",
-"17*0+8=8",
-"17*0+9=9",
-"17*0-0=0",
-"17*0*0=0",
-"17*0*1=0",
-"17*0*2=0",
-"17*0*3=0",
-"17*0*4=0",
-"17*0*5=0",
-"17*0*6=0",
-"17*0*7=0",
-"17*0*8=0",
-"17*0*9=0",
-"17*0/1=0",
-"17*0/2=0",
-"17*0/3=0",
-"17*0/4=0",
-"17*0/5=0",
-"17*0/6=0",
-"17*0/7=0",
-"17*0/8=0",
-"17*0/9=0",
-"17*1-8=9",
-"17*1-9=8",
-"17*1*0=0",
-"17*2*0=0",
-"17*3*0=0",
-"17*4*0=0",
-"17*5*0=0",
-"17*6*0=0",
-"17*6=102",
-"17*7*0=0",
-"17*7=119",
-"17*8*0=0",
-"17*8=136",
-"17*9*0=0",
-"17*9=153",
-"17/1-8=9",
-"17/1-9=8",
-"17/1*0=0",
-"17/2*0=0",
-"17/3*0=0",
-"17/4*0=0",
-"17/5*0=0",
-"17/6*0=0",
-"17/7*0=0",
-"17/8*0=0",
-"17/9*0=0",
-"1800*0=0",
-"1801*0=0",
-"1802*0=0",
-"1803*0=0",
-"1804*0=0",
-"1805*0=0",
-"1806*0=0",
-"1807*0=0",
-"1808*0=0",
-"1809*0=0",
-"180/20=9",
-"180/2=90",
-"180/30=6",
-"180/36=5",
-"180/3=60",
-"180/45=4",
-"180/4=45",
-"180/5=36",
-"180/60=3",
-"180/6=30",
-"180/90=2",
-"180/9=20",
-"1810*0=0",
-"1811*0=0",
-"1812*0=0",
-"1813*0=0",
-"1814*0=0",
-"1815*0=0",
-"1816*0=0",
-"1817*0=0",
-"1818*0=0",
-"1819*0=0",
-"1820*0=0",
-"1821*0=0",
-"1822*0=0",
-"1823*0=0",
-"1824*0=0",
-"1825*0=0",
-"1826*0=0",
-"1827*0=0",
-"1828*0=0",
-"1829*0=0",
-"182/26=7",
-"182/2=91",
-"182/7=26",
-"182/91=2",
-"1830*0=0",
-"1831*0=0",
-"1832*0=0",
-"1833*0=0",
-"1834*0=0",
-"1835*0=0",
-"1836*0=0",
-"1837*0=0",
-"1838*0=0",
-"1839*0=0",
-"183/3=61",
-"183/61=3",
-"1840*0=0",
-"1841*0=0",
-"1842*0=0",
-"1843*0=0",
-"1844*0=0",
-"1845*0=0",
-"1846*0=0",
-"1847*0=0",
-"1848*0=0",
-"1849*0=0",
-"184/23=8",
-"184/2=92",
-"184/46=4",
-"184/4=46",
-"184/8=23",
-"184/92=2",
-"1850*0=0",
-"1851*0=0",
-"1852*0=0",
-"1853*0=0",
-"1854*0=0",
-"1855*0=0",
-"1856*0=0",
-"1857*0=0",
-"1858*0=0",
-"1859*0=0",
-"185/37=5",
-"185/5=37",
-"1860*0=0",
-"1861*0=0",
-"1862*0=0",
-"1863*0=0",
-"1864*0=0",
-"1865*0=0",
-"1866*0=0",
-"1867*0=0",
-"1868*0=0",
-"1869*0=0",
-"186/2=93",
-"186/31=6",
-"186/3=62",
-"186/62=3",
-"186/6=31",
-"186/93=2",
-"1870*0=0",
-"1871*0=0",
-"1872*0=0",
-"1873*0=0",
-"1874*0=0",
-"1875*0=0",
-"1876*0=0",
-"1877*0=0",
-"1878*0=0",
-"1879*0=0",
-"1880*0=0",
-"1881*0=0",
-"1882*0=0",
-"1883*0=0",
-"1884*0=0",
-"1885*0=0",
-"1886*0=0",
-"1887*0=0",
-"1888*0=0",
-"1889*0=0",
-"188/2=94",
-"188/47=4",
-"188/4=47",
-"188/94=2",
-"1890*0=0",
-"1891*0=0",
-"1892*0=0",
-"1893*0=0",
-"1894*0=0",
-"1895*0=0",
-"1896*0=0",
-"1897*0=0",
-"1898*0=0",
-"1899*0=0",
-"189/21=9",
-"189/27=7",
-"189/3=63",
-"189/63=3",
-"189/7=27",
-"189/9=21",
-"18+0-9=9",
-"18+10=28",
-"18+11=29",
-"18+12=30",
-"18+13=31",
-"18+14=32",
-"18+15=33",
-"18+16=34",
-"18+17=35",
-"18+18=36",
-"18+19=37",
-"18+20=38",
-"18+21=39",
-"18+22=40",
-"18+23=41",
-"18+24=42",
-"18+25=43",
-"18+26=44",
-"18+27=45",
-"18+28=46",
-"18+29=47",
-"18+30=48",
-"18+31=49",
-"18+32=50",
-"18+33=51",
-"18+34=52",
-"18+35=53",
-"18+36=54",
-"18+37=55",
-"18+38=56",
-"18+39=57",
-"18+40=58",
-"18+41=59",
-"18+42=60",
-"18+43=61",
-"18+44=62",
-"18+45=63",
-"18+46=64",
-"18+47=65",
-"18+48=66",
-"18+49=67",
-"18+50=68",
-"18+51=69",
-"18+52=70",
-"18+53=71",
-"18+54=72",
-"18+55=73",
-"18+56=74",
-"18+57=75",
-"18+58=76",
-"18+59=77",
-"18+60=78",
-"18+61=79",
-"18+62=80",
-"18+63=81",
-"18+64=82",
-"18+65=83",
-"18+66=84",
-"18+67=85",
-"18+68=86",
-"18+69=87",
-"18+70=88",
-"18+71=89",
-"18+72=90",
-"18+73=91",
-"18+74=92",
-"18+75=93",
-"18+76=94",
-"18+77=95",
-"18+78=96",
-"18+79=97",
-"18+80=98",
-"18+81=99",
-"18-0-9=9",
-"18-19=-1",
-"18-1-8=9",
-"18-1-9=8",
-"18-1*9=9",
-"18-20=-2",
-"18-21=-3",
-"18-22=-4",
-"18-23=-5",
-"18-24=-6",
-"18-25=-7",
-"18-26=-8",
-"18-27=-9",
-"18-2-7=9",
-"18-2-8=8",
-"18-2-9=7",
-"18-2*5=8",
-"18-2*6=6",
-"18-2*7=4",
-"18-2*8=2",
-"18-2*9=0",
-"18-3-6=9",
-"18-3-7=8",
-"18-3-8=7",
-"18-3-9=6",
-"18-3*3=9",
-"18-3*4=6",
-"18-3*5=3",
-"18-3*6=0",
-"18-4-5=9",
-"18-4-6=8",
-"18-4-7=7",
-"18-4-8=6",
-"18-4-9=5",
-"18-4*3=6",
-"18-4*4=2",
-"18-5-4=9",
-"18-5-5=8",
-"18-5-6=7",
-"18-5-7=6",
-"18-5-8=5",
-"18-5-9=4",
-"18-5*2=8",
-"18-5*3=3",
-"18-6-3=9",
-"18-6-4=8",
-"18-6-5=7",
-"18-6-6=6",
-"18-6-7=5",
-"18-6-8=4",
-"18-6-9=3",
-"18-6*2=6",
-"18-6*3=0",
-"18-7-2=9",
-"18-7-3=8",
-"18-7-4=7",
-"18-7-5=6",
-"18-7-6=5",
-"18-7-7=4",
-"18-7-8=3",
-"18-7-9=2",
-"18-7*2=4",
-"18-8-1=9",
-"18-8-2=8",
-"18-8-3=7",
-"18-8-4=6",
-"18-8-5=5",
-"18-8-6=4",
-"18-8-7=3",
-"18-8-8=2",
-"18-8-9=1",
-"18-8*2=2",
-"18-9+0=9",
-"18-9-0=9",
-"18-9-1=8",
-"18-9-2=7",
-"18-9-3=6",
-"18-9-4=5",
-"18-9-5=4",
-"18-9-6=3",
-"18-9-7=2",
-"18-9-8=1",
-"18-9-9=0",
-"18-9*1=9",
-"18-9*2=0",
-"18-9/1=9",
-"18*0+0=0",
-"18*0+1=1",
-"18*0+2=2",
-"18*0+3=3",
-"18*0+4=4",
-"18*0+5=5",
-"18*0+6=6",
-"18*0+7=7",
-"18*0+8=8",
-"18*0+9=9",
-"18*0-0=0",
-"18*0*0=0",
-"18*0*1=0",
-"18*0*2=0",
-"18*0*3=0",
-"18*0*4=0",
-"18*0*5=0",
-"18*0*6=0",
-"18*0*7=0",
-"18*0*8=0",
-"18*0*9=0",
-"18*0/1=0",
-"18*0/2=0",
-"18*0/3=0",
-"18*0/4=0",
-"18*0/5=0",
-"18*0/6=0",
-"18*0/7=0",
-"18*0/8=0",
-"18*0/9=0",
-"18*1-9=9",
-"18*1*0=0",
-"18*1/2=9",
-"18*1/3=6",
-"18*1/6=3",
-"18*1/9=2",
-"18*2*0=0",
-"18*2/4=9",
-"18*2/6=6",
-"18*2/9=4",
-"18*3*0=0",
-"18*3/6=9",
-"18*3/9=6",
-"18*4*0=0",
-"18*4/8=9",
-"18*4/9=8",
-"18*5*0=0",
-"18*6*0=0",
-"18*6=108",
-"18*7*0=0",
-"18*7=126",
-"18*8*0=0",
-"18*8=144",
-"18*9*0=0",
-"18*9=162",
-"18/1-9=9",
-"18/1*0=0",
-"18/1/2=9",
-"18/1/3=6",
-"18/1/6=3",
-"18/1/9=2",
-"18/2+0=9",
-"18/2-0=9",
-"18/2-1=8",
-"18/2-2=7",
-"18/2-3=6",
-"18/2-4=5",
-"18/2-5=4",
-"18/2-6=3",
-"18/2-7=2",
-"18/2-8=1",
-"18/2-9=0",
-"18/2*0=0",
-"18/2*1=9",
-"18/2/1=9",
-"18/2/3=3",
-"18/2/9=1",
-"18/3+0=6",
-"18/3+1=7",
-"18/3+2=8",
-"18/3+3=9",
-"18/3-0=6",
-"18/3-1=5",
-"18/3-2=4",
-"18/3-3=3",
-"18/3-4=2",
-"18/3-5=1",
-"18/3-6=0",
-"18/3*0=0",
-"18/3*1=6",
-"18/3/1=6",
-"18/3/2=3",
-"18/3/3=2",
-"18/3/6=1",
-"18/4*0=0",
-"18/4*2=9",
-"18/5*0=0",
-"18/6+0=3",
-"18/6+1=4",
-"18/6+2=5",
-"18/6+3=6",
-"18/6+4=7",
-"18/6+5=8",
-"18/6+6=9",
-"18/6-0=3",
-"18/6-1=2",
-"18/6-2=1",
-"18/6-3=0",
-"18/6*0=0",
-"18/6*1=3",
-"18/6*2=6",
-"18/6*3=9",
-"18/6/1=3",
-"18/6/3=1",
-"18/7*0=0",
-"18/8*0=0",
-"18/8*4=9",
-"18/9+0=2",
-"18/9+1=3",
-"18/9+2=4",
-"18/9+3=5",
-"18/9+4=6",
-"18/9+5=7",
-"18/9+6=8",
-"18/9+7=9",
-"18/9-0=2",
-"18/9-1=1",
-"18/9-2=0",
-"18/9*0=0",
-"18/9*1=2",
-"18/9*2=4",
-"18/9*3=6",
-"18/9*4=8",
-"18/9/1=2",
-"18/9/2=1",
-"1900*0=0",
-"1901*0=0",
-"1902*0=0",
-"1903*0=0",
-"1904*0=0",
-"1905*0=0",
-"1906*0=0",
-"1907*0=0",
-"1908*0=0",
-"1909*0=0",
-"190/2=95",
-"190/38=5",
-"190/5=38",
-"190/95=2",
-"1910*0=0",
-"1911*0=0",
-"1912*0=0",
-"1913*0=0",
-"1914*0=0",
-"1915*0=0",
-"1916*0=0",
-"1917*0=0",
-"1918*0=0",
-"1919*0=0",
-"1920*0=0",
-"1921*0=0",
-"1922*0=0",
-"1923*0=0",
-"1924*0=0",
-"1925*0=0",
-"1926*0=0",
-"1927*0=0",
-"1928*0=0",
-"1929*0=0",
-"192/24=8",
-"192/2=96",
-"192/32=6",
-"192/3=64",
-"192/48=4",
-"192/4=48",
-"192/64=3",
-"192/6=32",
-"192/8=24",
-"192/96=2",
-"1930*0=0",
-"1931*0=0",
-"1932*0=0",
-"1933*0=0",
-"1934*0=0",
-"1935*0=0",
-"1936*0=0",
-"1937*0=0",
-"1938*0=0",
-"1939*0=0",
-"1940*0=0",
-"1941*0=0",
-"1942*0=0",
-"1943*0=0",
-"1944*0=0",
-"1945*0=0",
-"1946*0=0",
-"1947*0=0",
-"1948*0=0",
-"1949*0=0",
-"194/2=97",
-"194/97=2",
-"1950*0=0",
-"1951*0=0",
-"1952*0=0",
-"1953*0=0",
-"1954*0=0",
-"1955*0=0",
-"1956*0=0",
-"1957*0=0",
-"1958*0=0",
-"1959*0=0",
-"195/39=5",
-"195/3=65",
-"195/5=39",
-"195/65=3",
-"1960*0=0",
-"1961*0=0",
-"1962*0=0",
-"1963*0=0",
-"1964*0=0",
-"1965*0=0",
-"1966*0=0",
-"1967*0=0",
-"1968*0=0",
-"1969*0=0",
-"196/28=7",
-"196/2=98",
-"196/49=4",
-"196/4=49",
-"196/7=28",
-"196/98=2",
-"1970*0=0",
-"1971*0=0",
-"1972*0=0",
-"1973*0=0",
-"1974*0=0",
-"1975*0=0",
-"1976*0=0",
-"1977*0=0",
-"1978*0=0",
-"1979*0=0",
-"1980*0=0",
-"1981*0=0",
-"1982*0=0",
-"1983*0=0",
-"1984*0=0",
-"1985*0=0",
-"1986*0=0",
-"1987*0=0",
-"1988*0=0",
-"1989*0=0",
-"198/22=9",
-"198/2=99",
-"198/33=6",
-"198/3=66",
-"198/66=3",
-"198/6=33",
-"198/99=2",
-"198/9=22",
-"1990*0=0",
-"1991*0=0",
-"1992*0=0",
-"1993*0=0",
-"1994*0=0",
-"1995*0=0",
-"1996*0=0",
-"1997*0=0",
-"1998*0=0",
-"1999*0=0",
-"19+10=29",
-"19+11=30",
-"19+12=31",
-"19+13=32",
-"19+14=33",
-"19+15=34",
-"19+16=35",
-"19+17=36",
-"19+18=37",
-"19+19=38",
-"19+20=39",
-"19+21=40",
-"19+22=41",
-"19+23=42",
-"19+24=43",
-"19+25=44",
-"19+26=45",
-"19+27=46",
-"19+28=47",
-"19+29=48",
-"19+30=49",
-"19+31=50",
-"19+32=51",
-"19+33=52",
-"19+34=53",
-"19+35=54",
-"19+36=55",
-"19+37=56",
-"19+38=57",
-"19+39=58",
-"19+40=59",
-"19+41=60",
-"19+42=61",
-"19+43=62",
-"19+44=63",
-"19+45=64",
-"19+46=65",
-"19+47=66",
-"19+48=67",
-"19+49=68",
-"19+50=69",
-"19+51=70",
-"19+52=71",
-"19+53=72",
-"19+54=73",
-"19+55=74",
-"19+56=75",
-"19+57=76",
-"19+58=77",
-"19+59=78",
-"19+60=79",
-"19+61=80",
-"19+62=81",
-"19+63=82",
-"19+64=83",
-"19+65=84",
-"19+66=85",
-"19+67=86",
-"19+68=87",
-"19+69=88",
-"19+70=89",
-"19+71=90",
-"19+72=91",
-"19+73=92",
-"19+74=93",
-"19+75=94",
-"19+76=95",
-"19+77=96",
-"19+78=97",
-"19+79=98",
-"19+80=99",
-"19-1-9=9",
-"19-20=-1",
-"19-21=-2",
-"19-22=-3",
-"19-23=-4",
-"19-24=-5",
-"19-25=-6",
-"19-26=-7",
-"19-27=-8",
-"19-28=-9",
-"19-2-8=9",
-"19-2-9=8",
-"19-2*5=9",
-"19-2*6=7",
-"19-2*7=5",
-"19-2*8=3",
-"19-2*9=1",
-"19-3-7=9",
-"19-3-8=8",
-"19-3-9=7",
-"19-3*4=7",
-"19-3*5=4",
-"19-3*6=1",
-"19-4-6=9",
-"19-4-7=8",
-"19-4-8=7",
-"19-4-9=6",
-"19-4*3=7",
-"19-4*4=3",
-"19-5-5=9",
-"19-5-6=8",
-"19-5-7=7",
-"19-5-8=6",
-"19-5-9=5",
-"19-5*2=9",
-"19-5*3=4",
-"19-6-4=9",
-"19-6-5=8",
-"19-6-6=7",
-"19-6-7=6",
-"19-6-8=5",
-"19-6-9=4",
-"19-6*2=7",
-"19-6*3=1",
-"19-7-3=9",
-"19-7-4=8",
-"19-7-5=7",
-"19-7-6=6",
-"19-7-7=5",
-"19-7-8=4",
-"19-7-9=3",
-"19-7*2=5",
-"19-8-2=9",
-"19-8-3=8",
-"19-8-4=7",
-"19-8-5=6",
-"19-8-6=5",
-"19-8-7=4",
-"19-8-8=3",
-"19-8-9=2",
-"19-8*2=3",
-"19-9-1=9",
-"19-9-2=8",
-"19-9-3=7",
-"19-9-4=6",
-"19-9-5=5",
-"19-9-6=4",
-"19-9-7=3",
-"19-9-8=2",
-"19-9-9=1",
-"19-9*2=1",
-"19*0+0=0",
-"19*0+1=1",
-"19*0+2=2",
-"19*0+3=3",
-"19*0+4=4",
-"19*0+5=5",
-"19*0+6=6",
-"19*0+7=7",
-"19*0+8=8",
-"19*0+9=9",
-"19*0-0=0",
-"19*0*0=0",
-"19*0*1=0",
-"19*0*2=0",
-"19*0*3=0",
-"19*0*4=0",
-"19*0*5=0",
-"19*0*6=0",
-"19*0*7=0",
-"19*0*8=0",
-"19*0*9=0",
-"19*0/1=0",
-"19*0/2=0",
-"19*0/3=0",
-"19*0/4=0",
-"19*0/5=0",
-"19*0/6=0",
-"19*0/7=0",
-"19*0/8=0",
-"19*0/9=0",
-"19*1*0=0",
-"19*2*0=0",
-"19*3*0=0",
-"19*4*0=0",
-"19*5*0=0",
-"19*6*0=0",
-"19*6=114",
-"19*7*0=0",
-"19*7=133",
-"19*8*0=0",
-"19*8=152",
-"19*9*0=0",
-"19*9=171",
-"19/1*0=0",
-"19/2*0=0",
-"19/3*0=0",
-"19/4*0=0",
-"19/5*0=0",
-"19/6*0=0",
-"19/7*0=0",
-"19/8*0=0",
-"19/9*0=0",
-"1+0+9=10",
-"1+0-2=-1",
-"1+0-3=-2",
-"1+0-4=-3",
-"1+0-5=-4",
-"1+0-6=-5",
-"1+0-7=-6",
-"1+0-8=-7",
-"1+0-9=-8",
-"1+0*10=1",
-"1+0*11=1",
-"1+0*12=1",
-"1+0*13=1",
-"1+0*14=1",
-"1+0*15=1",
-"1+0*16=1",
-"1+0*17=1",
-"1+0*18=1",
-"1+0*19=1",
-"1+0*20=1",
-"1+0*21=1",
-"1+0*22=1",
-"1+0*23=1",
-"1+0*24=1",
-"1+0*25=1",
-"1+0*26=1",
-"1+0*27=1",
-"1+0*28=1",
-"1+0*29=1",
-"1+0*30=1",
-"1+0*31=1",
-"1+0*32=1",
-"1+0*33=1",
-"1+0*34=1",
-"1+0*35=1",
-"1+0*36=1",
-"1+0*37=1",
-"1+0*38=1",
-"1+0*39=1",
-"1+0*40=1",
-"1+0*41=1",
-"1+0*42=1",
-"1+0*43=1",
-"1+0*44=1",
-"1+0*45=1",
-"1+0*46=1",
-"1+0*47=1",
-"1+0*48=1",
-"1+0*49=1",
-"1+0*50=1",
-"1+0*51=1",
-"1+0*52=1",
-"1+0*53=1",
-"1+0*54=1",
-"1+0*55=1",
-"1+0*56=1",
-"1+0*57=1",
-"1+0*58=1",
-"1+0*59=1",
-"1+0*60=1",
-"1+0*61=1",
-"1+0*62=1",
-"1+0*63=1",
-"1+0*64=1",
-"1+0*65=1",
-"1+0*66=1",
-"1+0*67=1",
-"1+0*68=1",
-"1+0*69=1",
-"1+0*70=1",
-"1+0*71=1",
-"1+0*72=1",
-"1+0*73=1",
-"1+0*74=1",
-"1+0*75=1",
-"1+0*76=1",
-"1+0*77=1",
-"1+0*78=1",
-"1+0*79=1",
-"1+0*80=1",
-"1+0*81=1",
-"1+0*82=1",
-"1+0*83=1",
-"1+0*84=1",
-"1+0*85=1",
-"1+0*86=1",
-"1+0*87=1",
-"1+0*88=1",
-"1+0*89=1",
-"1+0*90=1",
-"1+0*91=1",
-"1+0*92=1",
-"1+0*93=1",
-"1+0*94=1",
-"1+0*95=1",
-"1+0*96=1",
-"1+0*97=1",
-"1+0*98=1",
-"1+0*99=1",
-"1+0/10=1",
-"1+0/11=1",
-"1+0/12=1",
-"1+0/13=1",
-"1+0/14=1",
-"1+0/15=1",
-"1+0/16=1",
-"1+0/17=1",
-"1+0/18=1",
-"1+0/19=1",
-"1+0/20=1",
-"1+0/21=1",
-"1+0/22=1",
-"1+0/23=1",
-"1+0/24=1",
-"1+0/25=1",
-"1+0/26=1",
-"1+0/27=1",
-"1+0/28=1",
-"1+0/29=1",
-"1+0/30=1",
-"1+0/31=1",
-"1+0/32=1",
-"1+0/33=1",
-"1+0/34=1",
-"1+0/35=1",
-"1+0/36=1",
-"1+0/37=1",
-"1+0/38=1",
-"1+0/39=1",
-"1+0/40=1",
-"1+0/41=1",
-"1+0/42=1",
-"1+0/43=1",
-"1+0/44=1",
-"1+0/45=1",
-"1+0/46=1",
-"1+0/47=1",
-"1+0/48=1",
-"1+0/49=1",
-"1+0/50=1",
-"1+0/51=1",
-"1+0/52=1",
-"1+0/53=1",
-"1+0/54=1",
-"1+0/55=1",
-"1+0/56=1",
-"1+0/57=1",
-"1+0/58=1",
-"1+0/59=1",
-"1+0/60=1",
-"1+0/61=1",
-"1+0/62=1",
-"1+0/63=1",
-"1+0/64=1",
-"1+0/65=1",
-"1+0/66=1",
-"1+0/67=1",
-"1+0/68=1",
-"1+0/69=1",
-"1+0/70=1",
-"1+0/71=1",
-"1+0/72=1",
-"1+0/73=1",
-"1+0/74=1",
-"1+0/75=1",
-"1+0/76=1",
-"1+0/77=1",
-"1+0/78=1",
-"1+0/79=1",
-"1+0/80=1",
-"1+0/81=1",
-"1+0/82=1",
-"1+0/83=1",
-"1+0/84=1",
-"1+0/85=1",
-"1+0/86=1",
-"1+0/87=1",
-"1+0/88=1",
-"1+0/89=1",
-"1+0/90=1",
-"1+0/91=1",
-"1+0/92=1",
-"1+0/93=1",
-"1+0/94=1",
-"1+0/95=1",
-"1+0/96=1",
-"1+0/97=1",
-"1+0/98=1",
-"1+0/99=1",
-"1+10-2=9",
-"1+10-3=8",
-"1+10-4=7",
-"1+10-5=6",
-"1+10-6=5",
-"1+10-7=4",
-"1+10-8=3",
-"1+10-9=2",
-"1+10*0=1",
-"1+10/2=6",
-"1+10/5=3",
-"1+11-3=9",
-"1+11-4=8",
-"1+11-5=7",
-"1+11-6=6",
-"1+11-7=5",
-"1+11-8=4",
-"1+11-9=3",
-"1+11*0=1",
-"1+12-4=9",
-"1+12-5=8",
-"1+12-6=7",
-"1+12-7=6",
-"1+12-8=5",
-"1+12-9=4",
-"1+12*0=1",
-"1+12/2=7",
-"1+12/3=5",
-"1+12/4=4",
-"1+12/6=3",
-"1+13-5=9",
-"1+13-6=8",
-"1+13-7=7",
-"1+13-8=6",
-"1+13-9=5",
-"1+13*0=1",
-"1+14-6=9",
-"1+14-7=8",
-"1+14-8=7",
-"1+14-9=6",
-"1+14*0=1",
-"1+14/2=8",
-"1+14/7=3",
-"1+15-7=9",
-"1+15-8=8",
-"1+15-9=7",
-"1+15*0=1",
-"1+15/3=6",
-"1+15/5=4",
-"1+16-8=9",
-"1+16-9=8",
-"1+16*0=1",
-"1+16/2=9",
-"1+16/4=5",
-"1+16/8=3",
-"1+17-9=9",
-"1+17*0=1",
-"1+18*0=1",
-"1+18/3=7",
-"1+18/6=4",
-"1+18/9=3",
-"1+19*0=1",
-"1+1+8=10",
-"1+1+9=11",
-"1+1-3=-1",
-"1+1-4=-2",
-"1+1-5=-3",
-"1+1-6=-4",
-"1+1-7=-5",
-"1+1-8=-6",
-"1+1-9=-7",
-"1+1*9=10",
-"1+20*0=1",
-"1+20/4=6",
-"1+20/5=5",
-"1+21*0=1",
-"1+21/3=8",
-"1+21/7=4",
-"1+22*0=1",
-"1+23*0=1",
-"1+24*0=1",
-"1+24/3=9",
-"1+24/4=7",
-"1+24/6=5",
-"1+24/8=4",
-"1+25*0=1",
-"1+25/5=6",
-"1+26*0=1",
-"1+27*0=1",
-"1+27/9=4",
-"1+28*0=1",
-"1+28/4=8",
-"1+28/7=5",
-"1+29*0=1",
-"1+2+7=10",
-"1+2+8=11",
-"1+2+9=12",
-"1+2-4=-1",
-"1+2-5=-2",
-"1+2-6=-3",
-"1+2-7=-4",
-"1+2-8=-5",
-"1+2-9=-6",
-"1+2*5=11",
-"1+2*6=13",
-"1+2*7=15",
-"1+2*8=17",
-"1+2*9=19",
-"1+30*0=1",
-"1+30/5=7",
-"1+30/6=6",
-"1+31*0=1",
-"1+32*0=1",
-"1+32/4=9",
-"1+32/8=5",
-"1+33*0=1",
-"1+34*0=1",
-"1+35*0=1",
-"1+35/5=8",
-"1+35/7=6",
-"1+36*0=1",
-"1+36/6=7",
-"1+36/9=5",
-"1+37*0=1",
-"1+38*0=1",
-"1+39*0=1",
-"1+3+6=10",
-"1+3+7=11",
-"1+3+8=12",
-"1+3+9=13",
-"1+3-5=-1",
-"1+3-6=-2",
-"1+3-7=-3",
-"1+3-8=-4",
-"1+3-9=-5",
-"1+3*3=10",
-"1+3*4=13",
-"1+3*5=16",
-"1+3*6=19",
-"1+3*7=22",
-"1+3*8=25",
-"1+3*9=28",
-"1+40*0=1",
-"1+40/5=9",
-"1+40/8=6",
-"1+41*0=1",
-"1+42*0=1",
-"1+42/6=8",
-"1+42/7=7",
-"1+43*0=1",
-"1+44*0=1",
-"1+45*0=1",
-"1+45/9=6",
-"1+46*0=1",
-"1+47*0=1",
-"1+48*0=1",
-"1+48/6=9",
-"1+48/8=7",
-"1+49*0=1",
-"1+49/7=8",
-"1+4+5=10",
-"1+4+6=11",
-"1+4+7=12",
-"1+4+8=13",
-"1+4+9=14",
-"1+4-6=-1",
-"1+4-7=-2",
-"1+4-8=-3",
-"1+4-9=-4",
-"1+4*3=13",
-"1+4*4=17",
-"1+4*5=21",
-"1+4*6=25",
-"1+4*7=29",
-"1+4*8=33",
-"1+4*9=37",
-"1+50*0=1",
-"1+51*0=1",
-"1+52*0=1",
-"1+53*0=1",
-"1+54*0=1",
-"1+54/9=7",
-"1+55*0=1",
-"1+56*0=1",
-"1+56/7=9",
-"1+56/8=8",
-"1+57*0=1",
-"1+58*0=1",
-"1+59*0=1",
-"1+5+4=10",
-"1+5+5=11",
-"1+5+6=12",
-"1+5+7=13",
-"1+5+8=14",
-"1+5+9=15",
-"1+5-7=-1",
-"1+5-8=-2",
-"1+5-9=-3",
-"1+5*2=11",
-"1+5*3=16",
-"1+5*4=21",
-"1+5*5=26",
-"1+5*6=31",
-"1+5*7=36",
-"1+5*8=41",
-"1+5*9=46",
-"1+60*0=1",
-"1+61*0=1",
-"1+62*0=1",
-"1+63*0=1",
-"1+63/9=8",
-"1+64*0=1",
-"1+64/8=9",
-"1+65*0=1",
-"1+66*0=1",
-"1+67*0=1",
-"1+68*0=1",
-"1+69*0=1",
-"1+6+3=10",
-"1+6+4=11",
-"1+6+5=12",
-"1+6+6=13",
-"1+6+7=14",
-"1+6+8=15",
-"1+6+9=16",
-"1+6-8=-1",
-"1+6-9=-2",
-"1+6*2=13",
-"1+6*3=19",
-"1+6*4=25",
-"1+6*5=31",
-"1+6*6=37",
-"1+6*7=43",
-"1+6*8=49",
-"1+6*9=55",
-"1+70*0=1",
-"1+71*0=1",
-"1+72*0=1",
-"1+72/9=9",
-"1+73*0=1",
-"1+74*0=1",
-"1+75*0=1",
-"1+76*0=1",
-"1+77*0=1",
-"1+78*0=1",
-"1+79*0=1",
-"1+7+2=10",
-"1+7+3=11",
-"1+7+4=12",
-"1+7+5=13",
-"1+7+6=14",
-"1+7+7=15",
-"1+7+8=16",
-"1+7+9=17",
-"1+7-9=-1",
-"1+7*2=15",
-"1+7*3=22",
-"1+7*4=29",
-"1+7*5=36",
-"1+7*6=43",
-"1+7*7=50",
-"1+7*8=57",
-"1+7*9=64",
-"1+80*0=1",
-"1+81*0=1",
-"1+82*0=1",
-"1+83*0=1",
-"1+84*0=1",
-"1+85*0=1",
-"1+86*0=1",
-"1+87*0=1",
-"1+88*0=1",
-"1+89*0=1",
-"1+8+1=10",
-"1+8+2=11",
-"1+8+3=12",
-"1+8+4=13",
-"1+8+5=14",
-"1+8+6=15",
-"1+8+7=16",
-"1+8+8=17",
-"1+8+9=18",
-"1+8*2=17",
-"1+8*3=25",
-"1+8*4=33",
-"1+8*5=41",
-"1+8*6=49",
-"1+8*7=57",
-"1+8*8=65",
-"1+8*9=73",
-"1+90*0=1",
-"1+91*0=1",
-"1+92*0=1",
-"1+93*0=1",
-"1+94*0=1",
-"1+95*0=1",
-"1+96*0=1",
-"1+97*0=1",
-"1+98*0=1",
-"1+99*0=1",
-"1+99=100",
-"1+9+0=10",
-"1+9+1=11",
-"1+9+2=12",
-"1+9+3=13",
-"1+9+4=14",
-"1+9+5=15",
-"1+9+6=16",
-"1+9+7=17",
-"1+9+8=18",
-"1+9+9=19",
-"1+9-0=10",
-"1+9-10=0",
-"1+9*1=10",
-"1+9*2=19",
-"1+9*3=28",
-"1+9*4=37",
-"1+9*5=46",
-"1+9*6=55",
-"1+9*7=64",
-"1+9*8=73",
-"1+9*9=82",
-"1+9/1=10",
-"1-0+9=10",
-"1-0-2=-1",
-"1-0-3=-2",
-"1-0-4=-3",
-"1-0-5=-4",
-"1-0-6=-5",
-"1-0-7=-6",
-"1-0-8=-7",
-"1-0-9=-8",
-"1-0*10=1",
-"1-0*11=1",
-"1-0*12=1",
-"1-0*13=1",
-"1-0*14=1",
-"1-0*15=1",
-"1-0*16=1",
-"1-0*17=1",
-"1-0*18=1",
-"1-0*19=1",
-"1-0*20=1",
-"1-0*21=1",
-"1-0*22=1",
-"1-0*23=1",
-"1-0*24=1",
-"1-0*25=1",
-"1-0*26=1",
-"1-0*27=1",
-"1-0*28=1",
-"1-0*29=1",
-"1-0*30=1",
-"1-0*31=1",
-"1-0*32=1",
-"1-0*33=1",
-"1-0*34=1",
-"1-0*35=1",
-"1-0*36=1",
-"1-0*37=1",
-"1-0*38=1",
-"1-0*39=1",
-"1-0*40=1",
-"1-0*41=1",
-"1-0*42=1",
-"1-0*43=1",
-"1-0*44=1",
-"1-0*45=1",
-"1-0*46=1",
-"1-0*47=1",
-"1-0*48=1",
-"1-0*49=1",
-"1-0*50=1",
-"1-0*51=1",
-"1-0*52=1",
-"1-0*53=1",
-"1-0*54=1",
-"1-0*55=1",
-"1-0*56=1",
-"1-0*57=1",
-"1-0*58=1",
-"1-0*59=1",
-"1-0*60=1",
-"1-0*61=1",
-"1-0*62=1",
-"1-0*63=1",
-"1-0*64=1",
-"1-0*65=1",
-"1-0*66=1",
-"1-0*67=1",
-"1-0*68=1",
-"1-0*69=1",
-"1-0*70=1",
-"1-0*71=1",
-"1-0*72=1",
-"1-0*73=1",
-"1-0*74=1",
-"1-0*75=1",
-"1-0*76=1",
-"1-0*77=1",
-"1-0*78=1",
-"1-0*79=1",
-"1-0*80=1",
-"1-0*81=1",
-"1-0*82=1",
-"1-0*83=1",
-"1-0*84=1",
-"1-0*85=1",
-"1-0*86=1",
-"1-0*87=1",
-"1-0*88=1",
-"1-0*89=1",
-"1-0*90=1",
-"1-0*91=1",
-"1-0*92=1",
-"1-0*93=1",
-"1-0*94=1",
-"1-0*95=1",
-"1-0*96=1",
-"1-0*97=1",
-"1-0*98=1",
-"1-0*99=1",
-"1-0/10=1",
-"1-0/11=1",
-"1-0/12=1",
-"1-0/13=1",
-"1-0/14=1",
-"1-0/15=1",
-"1-0/16=1",
-"1-0/17=1",
-"1-0/18=1",
-"1-0/19=1",
-"1-0/20=1",
-"1-0/21=1",
-"1-0/22=1",
-"1-0/23=1",
-"1-0/24=1",
-"1-0/25=1",
-"1-0/26=1",
-"1-0/27=1",
-"1-0/28=1",
-"1-0/29=1",
-"1-0/30=1",
-"1-0/31=1",
-"1-0/32=1",
-"1-0/33=1",
-"1-0/34=1",
-"1-0/35=1",
-"1-0/36=1",
-"1-0/37=1",
-"1-0/38=1",
-"1-0/39=1",
-"1-0/40=1",
-"1-0/41=1",
-"1-0/42=1",
-"1-0/43=1",
-"1-0/44=1",
-"1-0/45=1",
-"1-0/46=1",
-"1-0/47=1",
-"1-0/48=1",
-"1-0/49=1",
-"1-0/50=1",
-"1-0/51=1",
-"1-0/52=1",
-"1-0/53=1",
-"1-0/54=1",
-"1-0/55=1",
-"1-0/56=1",
-"1-0/57=1",
-"1-0/58=1",
-"1-0/59=1",
-"1-0/60=1",
-"1-0/61=1",
-"1-0/62=1",
-"1-0/63=1",
-"1-0/64=1",
-"1-0/65=1",
-"1-0/66=1",
-"1-0/67=1",
-"1-0/68=1",
-"1-0/69=1",
-"1-0/70=1",
-"1-0/71=1",
-"1-0/72=1",
-"1-0/73=1",
-"1-0/74=1",
-"1-0/75=1",
-"1-0/76=1",
-"1-0/77=1",
-"1-0/78=1",
-"1-0/79=1",
-"1-0/80=1",
-"1-0/81=1",
-"1-0/82=1",
-"1-0/83=1",
-"1-0/84=1",
-"1-0/85=1",
-"1-0/86=1",
-"1-0/87=1",
-"1-0/88=1",
-"1-0/89=1",
-"1-0/90=1",
-"1-0/91=1",
-"1-0/92=1",
-"1-0/93=1",
-"1-0/94=1",
-"1-0/95=1",
-"1-0/96=1",
-"1-0/97=1",
-"1-0/98=1",
-"1-0/99=1",
-"1-10+9=0",
-"1-10*0=1",
-"1-11*0=1",
-"1-11=-10",
-"1-12*0=1",
-"1-12=-11",
-"1-13*0=1",
-"1-13=-12",
-"1-14*0=1",
-"1-14=-13",
-"1-15*0=1",
-"1-15=-14",
-"1-16*0=1",
-"1-16=-15",
-"1-17*0=1",
-"1-17=-16",
-"1-18*0=1",
-"1-18=-17",
-"1-19*0=1",
-"1-19=-18",
-"1-1-1=-1",
-"1-1-2=-2",
-"1-1-3=-3",
-"1-1-4=-4",
-"1-1-5=-5",
-"1-1-6=-6",
-"1-1-7=-7",
-"1-1-8=-8",
-"1-1-9=-9",
-"1-1*2=-1",
-"1-1*3=-2",
-"1-1*4=-3",
-"1-1*5=-4",
-"1-1*6=-5",
-"1-1*7=-6",
-"1-1*8=-7",
-"1-1*9=-8",
-"1-20*0=1",
-"1-20=-19",
-"1-21*0=1",
-"1-21=-20",
-"1-22*0=1",
-"1-22=-21",
-"1-23*0=1",
-"1-23=-22",
-"1-24*0=1",
-"1-24=-23",
-"1-25*0=1",
-"1-25=-24",
-"1-26*0=1",
-"1-26=-25",
-"1-27*0=1",
-"1-27=-26",
-"1-28*0=1",
-"1-28=-27",
-"1-29*0=1",
-"1-29=-28",
-"1-2+0=-1",
-"1-2+10=9",
-"1-2-0=-1",
-"1-2-1=-2",
-"1-2-2=-3",
-"1-2-3=-4",
-"1-2-4=-5",
-"1-2-5=-6",
-"1-2-6=-7",
-"1-2-7=-8",
-"1-2-8=-9",
-"1-2*1=-1",
-"1-2*2=-3",
-"1-2*3=-5",
-"1-2*4=-7",
-"1-2*5=-9",
-"1-2/1=-1",
-"1-30*0=1",
-"1-30=-29",
-"1-31*0=1",
-"1-31=-30",
-"1-32*0=1",
-"1-32=-31",
-"1-33*0=1",
-"1-33=-32",
-"1-34*0=1",
-"1-34=-33",
-"1-35*0=1",
-"1-35=-34",
-"1-36*0=1",
-"1-36=-35",
-"1-37*0=1",
-"1-37=-36",
-"1-38*0=1",
-"1-38=-37",
-"1-39*0=1",
-"1-39=-38",
-"1-3+0=-2",
-"1-3+10=8",
-"1-3+11=9",
-"1-3+1=-1",
-"1-3-0=-2",
-"1-3-1=-3",
-"1-3-2=-4",
-"1-3-3=-5",
-"1-3-4=-6",
-"1-3-5=-7",
-"1-3-6=-8",
-"1-3-7=-9",
-"1-3*1=-2",
-"1-3*2=-5",
-"1-3*3=-8",
-"1-3/1=-2",
-"1-40*0=1",
-"1-40=-39",
-"1-41*0=1",
-"1-41=-40",
-"1-42*0=1",
-"1-42=-41",
-"1-43*0=1",
-"1-43=-42",
-"1-44*0=1",
-"1-44=-43",
-"1-45*0=1",
-"1-45=-44",
-"1-46*0=1",
-"1-46=-45",
-"1-47*0=1",
-"1-47=-46",
-"1-48*0=1",
-"1-48=-47",
-"1-49*0=1",
-"1-49=-48",
-"1-4+0=-3",
-"1-4+10=7",
-"1-4+11=8",
-"1-4+12=9",
-"1-4+1=-2",
-"1-4+2=-1",
-"1-4-0=-3",
-"1-4-1=-4",
-"1-4-2=-5",
-"1-4-3=-6",
-"1-4-4=-7",
-"1-4-5=-8",
-"1-4-6=-9",
-"1-4*1=-3",
-"1-4*2=-7",
-"1-4/1=-3",
-"1-4/2=-1",
-"1-50*0=1",
-"1-50=-49",
-"1-51*0=1",
-"1-51=-50",
-"1-52*0=1",
-"1-52=-51",
-"1-53*0=1",
-"1-53=-52",
-"1-54*0=1",
-"1-54=-53",
-"1-55*0=1",
-"1-55=-54",
-"1-56*0=1",
-"1-56=-55",
-"1-57*0=1",
-"1-57=-56",
-"1-58*0=1",
-"1-58=-57",
-"1-59*0=1",
-"1-59=-58",
-"1-5+0=-4",
-"1-5+10=6",
-"1-5+11=7",
-"1-5+12=8",
-"1-5+13=9",
-"1-5+1=-3",
-"1-5+2=-2",
-"1-5+3=-1",
-"1-5-0=-4",
-"1-5-1=-5",
-"1-5-2=-6",
-"1-5-3=-7",
-"1-5-4=-8",
-"1-5-5=-9",
-"1-5*1=-4",
-"1-5*2=-9",
-"1-5/1=-4",
-"1-60*0=1",
-"1-60=-59",
-"1-61*0=1",
-"1-61=-60",
-"1-62*0=1",
-"1-62=-61",
-"1-63*0=1",
-"1-63=-62",
-"1-64*0=1",
-"1-64=-63",
-"1-65*0=1",
-"1-65=-64",
-"1-66*0=1",
-"1-66=-65",
-"1-67*0=1",
-"1-67=-66",
-"1-68*0=1",
-"1-68=-67",
-"1-69*0=1",
-"1-69=-68",
-"1-6+0=-5",
-"1-6+10=5",
-"1-6+11=6",
-"1-6+12=7",
-"1-6+13=8",
-"1-6+14=9",
-"1-6+1=-4",
-"1-6+2=-3",
-"1-6+3=-2",
-"1-6+4=-1",
-"1-6-0=-5",
-"1-6-1=-6",
-"1-6-2=-7",
-"1-6-3=-8",
-"1-6-4=-9",
-"1-6*1=-5",
-"1-6/1=-5",
-"1-6/2=-2",
-"1-6/3=-1",
-"1-70*0=1",
-"1-70=-69",
-"1-71*0=1",
-"1-71=-70",
-"1-72*0=1",
-"1-72=-71",
-"1-73*0=1",
-"1-73=-72",
-"1-74*0=1",
-"1-74=-73",
-"1-75*0=1",
-"1-75=-74",
-"1-76*0=1",
-"1-76=-75",
-"1-77*0=1",
-"1-77=-76",
-"1-78*0=1",
-"1-78=-77",
-"1-79*0=1",
-"1-79=-78",
-"1-7+0=-6",
-"1-7+10=4",
-"1-7+11=5",
-"1-7+12=6",
-"1-7+13=7",
-"1-7+14=8",
-"1-7+15=9",
-"1-7+1=-5",
-"1-7+2=-4",
-"1-7+3=-3",
-"1-7+4=-2",
-"1-7+5=-1",
-"1-7-0=-6",
-"1-7-1=-7",
-"1-7-2=-8",
-"1-7-3=-9",
-"1-7*1=-6",
-"1-7/1=-6",
-"1-80*0=1",
-"1-80=-79",
-"1-81*0=1",
-"1-81=-80",
-"1-82*0=1",
-"1-82=-81",
-"1-83*0=1",
-"1-83=-82",
-"1-84*0=1",
-"1-84=-83",
-"1-85*0=1",
-"1-85=-84",
-"1-86*0=1",
-"1-86=-85",
-"1-87*0=1",
-"1-87=-86",
-"1-88*0=1",
-"1-88=-87",
-"1-89*0=1",
-"1-89=-88",
-"1-8+0=-7",
-"1-8+10=3",
-"1-8+11=4",
-"1-8+12=5",
-"1-8+13=6",
-"1-8+14=7",
-"1-8+15=8",
-"1-8+16=9",
-"1-8+1=-6",
-"1-8+2=-5",
-"1-8+3=-4",
-"1-8+4=-3",
-"1-8+5=-2",
-"1-8+6=-1",
-"1-8-0=-7",
-"1-8-1=-8",
-"1-8-2=-9",
-"1-8*1=-7",
-"1-8/1=-7",
-"1-8/2=-3",
-"1-8/4=-1",
-"1-90*0=1",
-"1-90=-89",
-"1-91*0=1",
-"1-91=-90",
-"1-92*0=1",
-"1-92=-91",
-"1-93*0=1",
-"1-93=-92",
-"1-94*0=1",
-"1-94=-93",
-"1-95*0=1",
-"1-95=-94",
-"1-96*0=1",
-"1-96=-95",
-"1-97*0=1",
-"1-97=-96",
-"1-98*0=1",
-"1-98=-97",
-"1-99*0=1",
-"1-99=-98",
-"1-9+0=-8",
-"1-9+10=2",
-"1-9+11=3",
-"1-9+12=4",
-"1-9+13=5",
-"1-9+14=6",
-"1-9+15=7",
-"1-9+16=8",
-"1-9+17=9",
-"1-9+1=-7",
-"1-9+2=-6",
-"1-9+3=-5",
-"1-9+4=-4",
-"1-9+5=-3",
-"1-9+6=-2",
-"1-9+7=-1",
-"1-9-0=-8",
-"1-9-1=-9",
-"1-9*1=-8",
-"1-9/1=-8",
-"1-9/3=-2",
-"1*0-1=-1",
-"1*0-2=-2",
-"1*0-3=-3",
-"1*0-4=-4",
-"1*0-5=-5",
-"1*0-6=-6",
-"1*0-7=-7",
-"1*0-8=-8",
-"1*0-9=-9",
-"1*0*10=0",
-"1*0*11=0",
-"1*0*12=0",
-"1*0*13=0",
-"1*0*14=0",
-"1*0*15=0",
-"1*0*16=0",
-"1*0*17=0",
-"1*0*18=0",
-"1*0*19=0",
-"1*0*20=0",
-"1*0*21=0",
-"1*0*22=0",
-"1*0*23=0",
-"1*0*24=0",
-"1*0*25=0",
-"1*0*26=0",
-"1*0*27=0",
-"1*0*28=0",
-"1*0*29=0",
-"1*0*30=0",
-"1*0*31=0",
-"1*0*32=0",
-"1*0*33=0",
-"1*0*34=0",
-"1*0*35=0",
-"1*0*36=0",
-"1*0*37=0",
-"1*0*38=0",
-"1*0*39=0",
-"1*0*40=0",
-"1*0*41=0",
-"1*0*42=0",
-"1*0*43=0",
-"1*0*44=0",
-"1*0*45=0",
-"1*0*46=0",
-"1*0*47=0",
-"1*0*48=0",
-"1*0*49=0",
-"1*0*50=0",
-"1*0*51=0",
-"1*0*52=0",
-"1*0*53=0",
-"1*0*54=0",
-"1*0*55=0",
-"1*0*56=0",
-"1*0*57=0",
-"1*0*58=0",
-"1*0*59=0",
-"1*0*60=0",
-"1*0*61=0",
-"1*0*62=0",
-"1*0*63=0",
-"1*0*64=0",
-"1*0*65=0",
-"1*0*66=0",
-"1*0*67=0",
-"1*0*68=0",
-"1*0*69=0",
-"1*0*70=0",
-"1*0*71=0",
-"1*0*72=0",
-"1*0*73=0",
-"1*0*74=0",
-"1*0*75=0",
-"1*0*76=0",
-"1*0*77=0",
-"1*0*78=0",
-"1*0*79=0",
-"1*0*80=0",
-"1*0*81=0",
-"1*0*82=0",
-"1*0*83=0",
-"1*0*84=0",
-"1*0*85=0",
-"1*0*86=0",
-"1*0*87=0",
-"1*0*88=0",
-"1*0*89=0",
-"1*0*90=0",
-"1*0*91=0",
-"1*0*92=0",
-"1*0*93=0",
-"1*0*94=0",
-"1*0*95=0",
-"1*0*96=0",
-"1*0*97=0",
-"1*0*98=0",
-"1*0*99=0",
-"1*0/10=0",
-"1*0/11=0",
-"1*0/12=0",
-"1*0/13=0",
-"1*0/14=0",
-"1*0/15=0",
-"1*0/16=0",
-"1*0/17=0",
-"1*0/18=0",
-"1*0/19=0",
-"1*0/20=0",
-"1*0/21=0",
-"1*0/22=0",
-"1*0/23=0",
-"1*0/24=0",
-"1*0/25=0",
-"1*0/26=0",
-"1*0/27=0",
-"1*0/28=0",
-"1*0/29=0",
-"1*0/30=0",
-"1*0/31=0",
-"1*0/32=0",
-"1*0/33=0",
-"1*0/34=0",
-"1*0/35=0",
-"1*0/36=0",
-"1*0/37=0",
-"1*0/38=0",
-"1*0/39=0",
-"1*0/40=0",
-"1*0/41=0",
-"1*0/42=0",
-"1*0/43=0",
-"1*0/44=0",
-"1*0/45=0",
-"1*0/46=0",
-"1*0/47=0",
-"1*0/48=0",
-"1*0/49=0",
-"1*0/50=0",
-"1*0/51=0",
-"1*0/52=0",
-"1*0/53=0",
-"1*0/54=0",
-"1*0/55=0",
-"1*0/56=0",
-"1*0/57=0",
-"1*0/58=0",
-"1*0/59=0",
-"1*0/60=0",
-"1*0/61=0",
-"1*0/62=0",
-"1*0/63=0",
-"1*0/64=0",
-"1*0/65=0",
-"1*0/66=0",
-"1*0/67=0",
-"1*0/68=0",
-"1*0/69=0",
-"1*0/70=0",
-"1*0/71=0",
-"1*0/72=0",
-"1*0/73=0",
-"1*0/74=0",
-"1*0/75=0",
-"1*0/76=0",
-"1*0/77=0",
-"1*0/78=0",
-"1*0/79=0",
-"1*0/80=0",
-"1*0/81=0",
-"1*0/82=0",
-"1*0/83=0",
-"1*0/84=0",
-"1*0/85=0",
-"1*0/86=0",
-"1*0/87=0",
-"1*0/88=0",
-"1*0/89=0",
-"1*0/90=0",
-"1*0/91=0",
-"1*0/92=0",
-"1*0/93=0",
-"1*0/94=0",
-"1*0/95=0",
-"1*0/96=0",
-"1*0/97=0",
-"1*0/98=0",
-"1*0/99=0",
-"1*10-1=9",
-"1*10-2=8",
-"1*10-3=7",
-"1*10-4=6",
-"1*10-5=5",
-"1*10-6=4",
-"1*10-7=3",
-"1*10-8=2",
-"1*10-9=1",
-"1*10*0=0",
-"1*10/2=5",
-"1*10/5=2",
-"1*11-2=9",
-"1*11-3=8",
-"1*11-4=7",
-"1*11-5=6",
-"1*11-6=5",
-"1*11-7=4",
-"1*11-8=3",
-"1*11-9=2",
-"1*11*0=0",
-"1*12-3=9",
-"1*12-4=8",
-"1*12-5=7",
-"1*12-6=6",
-"1*12-7=5",
-"1*12-8=4",
-"1*12-9=3",
-"1*12*0=0",
-"1*12/2=6",
-"1*12/3=4",
-"1*12/4=3",
-"1*12/6=2",
-"1*13-4=9",
-"1*13-5=8",
-"1*13-6=7",
-"1*13-7=6",
-"1*13-8=5",
-"1*13-9=4",
-"1*13*0=0",
-"1*14-5=9",
-"1*14-6=8",
-"1*14-7=7",
-"1*14-8=6",
-"1*14-9=5",
-"1*14*0=0",
-"1*14/2=7",
-"1*14/7=2",
-"1*15-6=9",
-"1*15-7=8",
-"1*15-8=7",
-"1*15-9=6",
-"1*15*0=0",
-"1*15/3=5",
-"1*15/5=3",
-"1*16-7=9",
-"1*16-8=8",
-"1*16-9=7",
-"1*16*0=0",
-"1*16/2=8",
-"1*16/4=4",
-"1*16/8=2",
-"1*17-8=9",
-"1*17-9=8",
-"1*17*0=0",
-"1*18-9=9",
-"1*18*0=0",
-"1*18/2=9",
-"1*18/3=6",
-"1*18/6=3",
-"1*18/9=2",
-"1*19*0=0",
-"1*1+9=10",
-"1*1-2=-1",
-"1*1-3=-2",
-"1*1-4=-3",
-"1*1-5=-4",
-"1*1-6=-5",
-"1*1-7=-6",
-"1*1-8=-7",
-"1*1-9=-8",
-"1*20*0=0",
-"1*20/4=5",
-"1*20/5=4",
-"1*21*0=0",
-"1*21/3=7",
-"1*21/7=3",
-"1*22*0=0",
-"1*23*0=0",
-"1*24*0=0",
-"1*24/3=8",
-"1*24/4=6",
-"1*24/6=4",
-"1*24/8=3",
-"1*25*0=0",
-"1*25/5=5",
-"1*26*0=0",
-"1*27*0=0",
-"1*27/3=9",
-"1*27/9=3",
-"1*28*0=0",
-"1*28/4=7",
-"1*28/7=4",
-"1*29*0=0",
-"1*2+8=10",
-"1*2+9=11",
-"1*2-3=-1",
-"1*2-4=-2",
-"1*2-5=-3",
-"1*2-6=-4",
-"1*2-7=-5",
-"1*2-8=-6",
-"1*2-9=-7",
-"1*2*5=10",
-"1*2*6=12",
-"1*2*7=14",
-"1*2*8=16",
-"1*2*9=18",
-"1*30*0=0",
-"1*30/5=6",
-"1*30/6=5",
-"1*31*0=0",
-"1*32*0=0",
-"1*32/4=8",
-"1*32/8=4",
-"1*33*0=0",
-"1*34*0=0",
-"1*35*0=0",
-"1*35/5=7",
-"1*35/7=5",
-"1*36*0=0",
-"1*36/4=9",
-"1*36/6=6",
-"1*36/9=4",
-"1*37*0=0",
-"1*38*0=0",
-"1*39*0=0",
-"1*3+7=10",
-"1*3+8=11",
-"1*3+9=12",
-"1*3-4=-1",
-"1*3-5=-2",
-"1*3-6=-3",
-"1*3-7=-4",
-"1*3-8=-5",
-"1*3-9=-6",
-"1*3*4=12",
-"1*3*5=15",
-"1*3*6=18",
-"1*3*7=21",
-"1*3*8=24",
-"1*3*9=27",
-"1*40*0=0",
-"1*40/5=8",
-"1*40/8=5",
-"1*41*0=0",
-"1*42*0=0",
-"1*42/6=7",
-"1*42/7=6",
-"1*43*0=0",
-"1*44*0=0",
-"1*45*0=0",
-"1*45/5=9",
-"1*45/9=5",
-"1*46*0=0",
-"1*47*0=0",
-"1*48*0=0",
-"1*48/6=8",
-"1*48/8=6",
-"1*49*0=0",
-"1*49/7=7",
-"1*4+6=10",
-"1*4+7=11",
-"1*4+8=12",
-"1*4+9=13",
-"1*4-5=-1",
-"1*4-6=-2",
-"1*4-7=-3",
-"1*4-8=-4",
-"1*4-9=-5",
-"1*4*3=12",
-"1*4*4=16",
-"1*4*5=20",
-"1*4*6=24",
-"1*4*7=28",
-"1*4*8=32",
-"1*4*9=36",
-"1*50*0=0",
-"1*51*0=0",
-"1*52*0=0",
-"1*53*0=0",
-"1*54*0=0",
-"1*54/6=9",
-"1*54/9=6",
-"1*55*0=0",
-"1*56*0=0",
-"1*56/7=8",
-"1*56/8=7",
-"1*57*0=0",
-"1*58*0=0",
-"1*59*0=0",
-"1*5+5=10",
-"1*5+6=11",
-"1*5+7=12",
-"1*5+8=13",
-"1*5+9=14",
-"1*5-6=-1",
-"1*5-7=-2",
-"1*5-8=-3",
-"1*5-9=-4",
-"1*5*2=10",
-"1*5*3=15",
-"1*5*4=20",
-"1*5*5=25",
-"1*5*6=30",
-"1*5*7=35",
-"1*5*8=40",
-"1*5*9=45",
-"1*60*0=0",
-"1*61*0=0",
-"1*62*0=0",
-"1*63*0=0",
-"1*63/7=9",
-"1*63/9=7",
-"1*64*0=0",
-"1*64/8=8",
-"1*65*0=0",
-"1*66*0=0",
-"1*67*0=0",
-"1*68*0=0",
-"1*69*0=0",
-"1*6+4=10",
-"1*6+5=11",
-"1*6+6=12",
-"1*6+7=13",
-"1*6+8=14",
-"1*6+9=15",
-"1*6-7=-1",
-"1*6-8=-2",
-"1*6-9=-3",
-"1*6*2=12",
-"1*6*3=18",
-"1*6*4=24",
-"1*6*5=30",
-"1*6*6=36",
-"1*6*7=42",
-"1*6*8=48",
-"1*6*9=54",
-"1*70*0=0",
-"1*71*0=0",
-"1*72*0=0",
-"1*72/8=9",
-"1*72/9=8",
-"1*73*0=0",
-"1*74*0=0",
-"1*75*0=0",
-"1*76*0=0",
-"1*77*0=0",
-"1*78*0=0",
-"1*79*0=0",
-"1*7+3=10",
-"1*7+4=11",
-"1*7+5=12",
-"1*7+6=13",
-"1*7+7=14",
-"1*7+8=15",
-"1*7+9=16",
-"1*7-8=-1",
-"1*7-9=-2",
-"1*7*2=14",
-"1*7*3=21",
-"1*7*4=28",
-"1*7*5=35",
-"1*7*6=42",
-"1*7*7=49",
-"1*7*8=56",
-"1*7*9=63",
-"1*80*0=0",
-"1*81*0=0",
-"1*81/9=9",
-"1*82*0=0",
-"1*83*0=0",
-"1*84*0=0",
-"1*85*0=0",
-"1*86*0=0",
-"1*87*0=0",
-"1*88*0=0",
-"1*89*0=0",
-"1*8+2=10",
-"1*8+3=11",
-"1*8+4=12",
-"1*8+5=13",
-"1*8+6=14",
-"1*8+7=15",
-"1*8+8=16",
-"1*8+9=17",
-"1*8-9=-1",
-"1*8*2=16",
-"1*8*3=24",
-"1*8*4=32",
-"1*8*5=40",
-"1*8*6=48",
-"1*8*7=56",
-"1*8*8=64",
-"1*8*9=72",
-"1*90*0=0",
-"1*91*0=0",
-"1*92*0=0",
-"1*93*0=0",
-"1*94*0=0",
-"1*95*0=0",
-"1*96*0=0",
-"1*97*0=0",
-"1*98*0=0",
-"1*99*0=0",
-"1*9+1=10",
-"1*9+2=11",
-"1*9+3=12",
-"1*9+4=13",
-"1*9+5=14",
-"1*9+6=15",
-"1*9+7=16",
-"1*9+8=17",
-"1*9+9=18",
-"1*9*2=18",
-"1*9*3=27",
-"1*9*4=36",
-"1*9*5=45",
-"1*9*6=54",
-"1*9*7=63",
-"1*9*8=72",
-"1*9*9=81",
-"1/10*0=0",
-"1/11*0=0",
-"1/12*0=0",
-"1/13*0=0",
-"1/14*0=0",
-"1/15*0=0",
-"1/16*0=0",
-"1/17*0=0",
-"1/18*0=0",
-"1/19*0=0",
-"1/1+9=10",
-"1/1-2=-1",
-"1/1-3=-2",
-"1/1-4=-3",
-"1/1-5=-4",
-"1/1-6=-5",
-"1/1-7=-6",
-"1/1-8=-7",
-"1/1-9=-8",
-"1/20*0=0",
-"1/21*0=0",
-"1/22*0=0",
-"1/23*0=0",
-"1/24*0=0",
-"1/25*0=0",
-"1/26*0=0",
-"1/27*0=0",
-"1/28*0=0",
-"1/29*0=0",
-"1/2*10=5",
-"1/2*12=6",
-"1/2*14=7",
-"1/2*16=8",
-"1/2*18=9",
-"1/30*0=0",
-"1/31*0=0",
-"1/32*0=0",
-"1/33*0=0",
-"1/34*0=0",
-"1/35*0=0",
-"1/36*0=0",
-"1/37*0=0",
-"1/38*0=0",
-"1/39*0=0",
-"1/3*12=4",
-"1/3*15=5",
-"1/3*18=6",
-"1/3*21=7",
-"1/3*24=8",
-"1/3*27=9",
-"1/40*0=0",
-"1/41*0=0",
-"1/42*0=0",
-"1/43*0=0",
-"1/44*0=0",
-"1/45*0=0",
-"1/46*0=0",
-"1/47*0=0",
-"1/48*0=0",
-"1/49*0=0",
-"1/4*12=3",
-"1/4*16=4",
-"1/4*20=5",
-"1/4*24=6",
-"1/4*28=7",
-"1/4*32=8",
-"1/4*36=9",
-"1/50*0=0",
-"1/51*0=0",
-"1/52*0=0",
-"1/53*0=0",
-"1/54*0=0",
-"1/55*0=0",
-"1/56*0=0",
-"1/57*0=0",
-"1/58*0=0",
-"1/59*0=0",
-"1/5*10=2",
-"1/5*15=3",
-"1/5*20=4",
-"1/5*25=5",
-"1/5*30=6",
-"1/5*35=7",
-"1/5*40=8",
-"1/5*45=9",
-"1/60*0=0",
-"1/61*0=0",
-"1/62*0=0",
-"1/63*0=0",
-"1/64*0=0",
-"1/65*0=0",
-"1/66*0=0",
-"1/67*0=0",
-"1/68*0=0",
-"1/69*0=0",
-"1/6*12=2",
-"1/6*18=3",
-"1/6*24=4",
-"1/6*30=5",
-"1/6*36=6",
-"1/6*42=7",
-"1/6*48=8",
-"1/6*54=9",
-"1/70*0=0",
-"1/71*0=0",
-"1/72*0=0",
-"1/73*0=0",
-"1/74*0=0",
-"1/75*0=0",
-"1/76*0=0",
-"1/77*0=0",
-"1/78*0=0",
-"1/79*0=0",
-"1/7*14=2",
-"1/7*21=3",
-"1/7*28=4",
-"1/7*35=5",
-"1/7*42=6",
-"1/7*49=7",
-"1/7*56=8",
-"1/7*63=9",
-"1/80*0=0",
-"1/81*0=0",
-"1/82*0=0",
-"1/83*0=0",
-"1/84*0=0",
-"1/85*0=0",
-"1/86*0=0",
-"1/87*0=0",
-"1/88*0=0",
-"1/89*0=0",
-"1/8*16=2",
-"1/8*24=3",
-"1/8*32=4",
-"1/8*40=5",
-"1/8*48=6",
-"1/8*56=7",
-"1/8*64=8",
-"1/8*72=9",
-"1/90*0=0",
-"1/91*0=0",
-"1/92*0=0",
-"1/93*0=0",
-"1/94*0=0",
-"1/95*0=0",
-"1/96*0=0",
-"1/97*0=0",
-"1/98*0=0",
-"1/99*0=0",
-"1/9*18=2",
-"1/9*27=3",
-"1/9*36=4",
-"1/9*45=5",
-"1/9*54=6",
-"1/9*63=7",
-"1/9*72=8",
-"1/9*81=9",
-"2000*0=0",
-"2001*0=0",
-"2002*0=0",
-"2003*0=0",
-"2004*0=0",
-"2005*0=0",
-"2006*0=0",
-"2007*0=0",
-"2008*0=0",
-"2009*0=0",
-"200/25=8",
-"200/40=5",
-"200/4=50",
-"200/50=4",
-"200/5=40",
-"200/8=25",
-"2010*0=0",
-"2011*0=0",
-"2012*0=0",
-"2013*0=0",
-"2014*0=0",
-"2015*0=0",
-"2016*0=0",
-"2017*0=0",
-"2018*0=0",
-"2019*0=0",
-"201/3=67",
-"201/67=3",
-"2020*0=0",
-"2021*0=0",
-"2022*0=0",
-"2023*0=0",
-"2024*0=0",
-"2025*0=0",
-"2026*0=0",
-"2027*0=0",
-"2028*0=0",
-"2029*0=0",
-"2030*0=0",
-"2031*0=0",
-"2032*0=0",
-"2033*0=0",
-"2034*0=0",
-"2035*0=0",
-"2036*0=0",
-"2037*0=0",
-"2038*0=0",
-"2039*0=0",
-"203/29=7",
-"203/7=29",
-"2040*0=0",
-"2041*0=0",
-"2042*0=0",
-"2043*0=0",
-"2044*0=0",
-"2045*0=0",
-"2046*0=0",
-"2047*0=0",
-"2048*0=0",
-"2049*0=0",
-"204/34=6",
-"204/3=68",
-"204/4=51",
-"204/51=4",
-"204/68=3",
-"204/6=34",
-"2050*0=0",
-"2051*0=0",
-"2052*0=0",
-"2053*0=0",
-"2054*0=0",
-"2055*0=0",
-"2056*0=0",
-"2057*0=0",
-"2058*0=0",
-"2059*0=0",
-"205/41=5",
-"205/5=41",
-"2060*0=0",
-"2061*0=0",
-"2062*0=0",
-"2063*0=0",
-"2064*0=0",
-"2065*0=0",
-"2066*0=0",
-"2067*0=0",
-"2068*0=0",
-"2069*0=0",
-"2070*0=0",
-"2071*0=0",
-"2072*0=0",
-"2073*0=0",
-"2074*0=0",
-"2075*0=0",
-"2076*0=0",
-"2077*0=0",
-"2078*0=0",
-"2079*0=0",
-"207/23=9",
-"207/3=69",
-"207/69=3",
-"207/9=23",
-"2080*0=0",
-"2081*0=0",
-"2082*0=0",
-"2083*0=0",
-"2084*0=0",
-"2085*0=0",
-"2086*0=0",
-"2087*0=0",
-"2088*0=0",
-"2089*0=0",
-"208/26=8",
-"208/4=52",
-"208/52=4",
-"208/8=26",
-"2090*0=0",
-"2091*0=0",
-"2092*0=0",
-"2093*0=0",
-"2094*0=0",
-"2095*0=0",
-"2096*0=0",
-"2097*0=0",
-"2098*0=0",
-"2099*0=0",
-"20+10=30",
-"20+11=31",
-"20+12=32",
-"20+13=33",
-"20+14=34",
-"20+15=35",
-"20+16=36",
-"20+17=37",
-"20+18=38",
-"20+19=39",
-"20+20=40",
-"20+21=41",
-"20+22=42",
-"20+23=43",
-"20+24=44",
-"20+25=45",
-"20+26=46",
-"20+27=47",
-"20+28=48",
-"20+29=49",
-"20+30=50",
-"20+31=51",
-"20+32=52",
-"20+33=53",
-"20+34=54",
-"20+35=55",
-"20+36=56",
-"20+37=57",
-"20+38=58",
-"20+39=59",
-"20+40=60",
-"20+41=61",
-"20+42=62",
-"20+43=63",
-"20+44=64",
-"20+45=65",
-"20+46=66",
-"20+47=67",
-"20+48=68",
-"20+49=69",
-"20+50=70",
-"20+51=71",
-"20+52=72",
-"20+53=73",
-"20+54=74",
-"20+55=75",
-"20+56=76",
-"20+57=77",
-"20+58=78",
-"20+59=79",
-"20+60=80",
-"20+61=81",
-"20+62=82",
-"20+63=83",
-"20+64=84",
-"20+65=85",
-"20+66=86",
-"20+67=87",
-"20+68=88",
-"20+69=89",
-"20+70=90",
-"20+71=91",
-"20+72=92",
-"20+73=93",
-"20+74=94",
-"20+75=95",
-"20+76=96",
-"20+77=97",
-"20+78=98",
-"20+79=99",
-"20-10=10",
-"20-21=-1",
-"20-22=-2",
-"20-23=-3",
-"20-24=-4",
-"20-25=-5",
-"20-26=-6",
-"20-27=-7",
-"20-28=-8",
-"20-29=-9",
-"20-2-9=9",
-"20-2*6=8",
-"20-2*7=6",
-"20-2*8=4",
-"20-2*9=2",
-"20-3-8=9",
-"20-3-9=8",
-"20-3*4=8",
-"20-3*5=5",
-"20-3*6=2",
-"20-4-7=9",
-"20-4-8=8",
-"20-4-9=7",
-"20-4*3=8",
-"20-4*4=4",
-"20-4*5=0",
-"20-5-6=9",
-"20-5-7=8",
-"20-5-8=7",
-"20-5-9=6",
-"20-5*3=5",
-"20-5*4=0",
-"20-6-5=9",
-"20-6-6=8",
-"20-6-7=7",
-"20-6-8=6",
-"20-6-9=5",
-"20-6*2=8",
-"20-6*3=2",
-"20-7-4=9",
-"20-7-5=8",
-"20-7-6=7",
-"20-7-7=6",
-"20-7-8=5",
-"20-7-9=4",
-"20-7*2=6",
-"20-8-3=9",
-"20-8-4=8",
-"20-8-5=7",
-"20-8-6=6",
-"20-8-7=5",
-"20-8-8=4",
-"20-8-9=3",
-"20-8*2=4",
-"20-9-2=9",
-"20-9-3=8",
-"20-9-4=7",
-"20-9-5=6",
-"20-9-6=5",
-"20-9-7=4",
-"20-9-8=3",
-"20-9-9=2",
-"20-9*2=2",
-"20*0+0=0",
-"20*0+1=1",
-"20*0+2=2",
-"20*0+3=3",
-"20*0+4=4",
-"20*0+5=5",
-"20*0+6=6",
-"20*0+7=7",
-"20*0+8=8",
-"20*0+9=9",
-"20*0-0=0",
-"20*0*0=0",
-"20*0*1=0",
-"20*0*2=0",
-"20*0*3=0",
-"20*0*4=0",
-"20*0*5=0",
-"20*0*6=0",
-"20*0*7=0",
-"20*0*8=0",
-"20*0*9=0",
-"20*0/1=0",
-"20*0/2=0",
-"20*0/3=0",
-"20*0/4=0",
-"20*0/5=0",
-"20*0/6=0",
-"20*0/7=0",
-"20*0/8=0",
-"20*0/9=0",
-"20*1*0=0",
-"20*1/4=5",
-"20*1/5=4",
-"20*2*0=0",
-"20*2/5=8",
-"20*2/8=5",
-"20*3*0=0",
-"20*4*0=0",
-"20*5*0=0",
-"20*5=100",
-"20*6*0=0",
-"20*6=120",
-"20*7*0=0",
-"20*7=140",
-"20*8*0=0",
-"20*8=160",
-"20*9*0=0",
-"20*9=180",
-"20/1*0=0",
-"20/1/4=5",
-"20/1/5=4",
-"20/2-1=9",
-"20/2-2=8",
-"20/2-3=7",
-"20/2-4=6",
-"20/2-5=5",
-"20/2-6=4",
-"20/2-7=3",
-"20/2-8=2",
-"20/2-9=1",
-"20/2*0=0",
-"20/2/2=5",
-"20/2/5=2",
-"20/3*0=0",
-"20/4+0=5",
-"20/4+1=6",
-"20/4+2=7",
-"20/4+3=8",
-"20/4+4=9",
-"20/4-0=5",
-"20/4-1=4",
-"20/4-2=3",
-"20/4-3=2",
-"20/4-4=1",
-"20/4-5=0",
-"20/4*0=0",
-"20/4*1=5",
-"20/4/1=5",
-"20/4/5=1",
-"20/5+0=4",
-"20/5+1=5",
-"20/5+2=6",
-"20/5+3=7",
-"20/5+4=8",
-"20/5+5=9",
-"20/5-0=4",
-"20/5-1=3",
-"20/5-2=2",
-"20/5-3=1",
-"20/5-4=0",
-"20/5*0=0",
-"20/5*1=4",
-"20/5*2=8",
-"20/5/1=4",
-"20/5/2=2",
-"20/5/4=1",
-"20/6*0=0",
-"20/7*0=0",
-"20/8*0=0",
-"20/8*2=5",
-"20/9*0=0",
-"2100*0=0",
-"2101*0=0",
-"2102*0=0",
-"2103*0=0",
-"2104*0=0",
-"2105*0=0",
-"2106*0=0",
-"2107*0=0",
-"2108*0=0",
-"2109*0=0",
-"210/30=7",
-"210/35=6",
-"210/3=70",
-"210/42=5",
-"210/5=42",
-"210/6=35",
-"210/70=3",
-"210/7=30",
-"2110*0=0",
-"2111*0=0",
-"2112*0=0",
-"2113*0=0",
-"2114*0=0",
-"2115*0=0",
-"2116*0=0",
-"2117*0=0",
-"2118*0=0",
-"2119*0=0",
-"2120*0=0",
-"2121*0=0",
-"2122*0=0",
-"2123*0=0",
-"2124*0=0",
-"2125*0=0",
-"2126*0=0",
-"2127*0=0",
-"2128*0=0",
-"2129*0=0",
-"212/4=53",
-"212/53=4",
-"2130*0=0",
-"2131*0=0",
-"2132*0=0",
-"2133*0=0",
-"2134*0=0",
-"2135*0=0",
-"2136*0=0",
-"2137*0=0",
-"2138*0=0",
-"2139*0=0",
-"213/3=71",
-"213/71=3",
-"2140*0=0",
-"2141*0=0",
-"2142*0=0",
-"2143*0=0",
-"2144*0=0",
-"2145*0=0",
-"2146*0=0",
-"2147*0=0",
-"2148*0=0",
-"2149*0=0",
-"2150*0=0",
-"2151*0=0",
-"2152*0=0",
-"2153*0=0",
-"2154*0=0",
-"2155*0=0",
-"2156*0=0",
-"2157*0=0",
-"2158*0=0",
-"2159*0=0",
-"215/43=5",
-"215/5=43",
-"2160*0=0",
-"2161*0=0",
-"2162*0=0",
-"2163*0=0",
-"2164*0=0",
-"2165*0=0",
-"2166*0=0",
-"2167*0=0",
-"2168*0=0",
-"2169*0=0",
-"216/24=9",
-"216/27=8",
-"216/36=6",
-"216/3=72",
-"216/4=54",
-"216/54=4",
-"216/6=36",
-"216/72=3",
-"216/8=27",
-"216/9=24",
-"2170*0=0",
-"2171*0=0",
-"2172*0=0",
-"2173*0=0",
-"2174*0=0",
-"2175*0=0",
-"2176*0=0",
-"2177*0=0",
-"2178*0=0",
-"2179*0=0",
-"217/31=7",
-"217/7=31",
-"2180*0=0",
-"2181*0=0",
-"2182*0=0",
-"2183*0=0",
-"2184*0=0",
-"2185*0=0",
-"2186*0=0",
-"2187*0=0",
-"2188*0=0",
-"2189*0=0",
-"2190*0=0",
-"2191*0=0",
-"2192*0=0",
-"2193*0=0",
-"2194*0=0",
-"2195*0=0",
-"2196*0=0",
-"2197*0=0",
-"2198*0=0",
-"2199*0=0",
-"219/3=73",
-"219/73=3",
-"21+10=31",
-"21+11=32",
-"21+12=33",
-"21+13=34",
-"21+14=35",
-"21+15=36",
-"21+16=37",
-"21+17=38",
-"21+18=39",
-"21+19=40",
-"21+20=41",
-"21+21=42",
-"21+22=43",
-"21+23=44",
-"21+24=45",
-"21+25=46",
-"21+26=47",
-"21+27=48",
-"21+28=49",
-"21+29=50",
-"21+30=51",
-"21+31=52",
-"21+32=53",
-"21+33=54",
-"21+34=55",
-"21+35=56",
-"21+36=57",
-"21+37=58",
-"21+38=59",
-"21+39=60",
-"21+40=61",
-"21+41=62",
-"21+42=63",
-"21+43=64",
-"21+44=65",
-"21+45=66",
-"21+46=67",
-"21+47=68",
-"21+48=69",
-"21+49=70",
-"21+50=71",
-"21+51=72",
-"21+52=73",
-"21+53=74",
-"21+54=75",
-"21+55=76",
-"21+56=77",
-"21+57=78",
-"21+58=79",
-"21+59=80",
-"21+60=81",
-"21+61=82",
-"21+62=83",
-"21+63=84",
-"21+64=85",
-"21+65=86",
-"21+66=87",
-"21+67=88",
-"21+68=89",
-"21+69=90",
-"21+70=91",
-"21+71=92",
-"21+72=93",
-"21+73=94",
-"21+74=95",
-"21+75=96",
-"21+76=97",
-"21+77=98",
-"21+78=99",
-"21-10=11",
-"21-11=10",
-"21-22=-1",
-"21-23=-2",
-"21-24=-3",
-"21-25=-4",
-"21-26=-5",
-"21-27=-6",
-"21-28=-7",
-"21-29=-8",
-"21-2*6=9",
-"21-2*7=7",
-"21-2*8=5",
-"21-2*9=3",
-"21-30=-9",
-"21-3-9=9",
-"21-3*4=9",
-"21-3*5=6",
-"21-3*6=3",
-"21-3*7=0",
-"21-4-8=9",
-"21-4-9=8",
-"21-4*3=9",
-"21-4*4=5",
-"21-4*5=1",
-"21-5-7=9",
-"21-5-8=8",
-"21-5-9=7",
-"21-5*3=6",
-"21-5*4=1",
-"21-6-6=9",
-"21-6-7=8",
-"21-6-8=7",
-"21-6-9=6",
-"21-6*2=9",
-"21-6*3=3",
-"21-7-5=9",
-"21-7-6=8",
-"21-7-7=7",
-"21-7-8=6",
-"21-7-9=5",
-"21-7*2=7",
-"21-7*3=0",
-"21-8-4=9",
-"21-8-5=8",
-"21-8-6=7",
-"21-8-7=6",
-"21-8-8=5",
-"21-8-9=4",
-"21-8*2=5",
-"21-9-3=9",
-"21-9-4=8",
-"21-9-5=7",
-"21-9-6=6",
-"21-9-7=5",
-"21-9-8=4",
-"21-9-9=3",
-"21-9*2=3",
-"21*0+0=0",
-"21*0+1=1",
-"21*0+2=2",
-"21*0+3=3",
-"21*0+4=4",
-"21*0+5=5",
-"21*0+6=6",
-"21*0+7=7",
-"21*0+8=8",
-"21*0+9=9",
-"21*0-0=0",
-"21*0*0=0",
-"21*0*1=0",
-"21*0*2=0",
-"21*0*3=0",
-"21*0*4=0",
-"21*0*5=0",
-"21*0*6=0",
-"21*0*7=0",
-"21*0*8=0",
-"21*0*9=0",
-"21*0/1=0",
-"21*0/2=0",
-"21*0/3=0",
-"21*0/4=0",
-"21*0/5=0",
-"21*0/6=0",
-"21*0/7=0",
-"21*0/8=0",
-"21*0/9=0",
-"21*1*0=0",
-"21*1/3=7",
-"21*1/7=3",
-"21*2*0=0",
-"21*2/6=7",
-"21*2/7=6",
-"21*3*0=0",
-"21*3/7=9",
-"21*3/9=7",
-"21*4*0=0",
-"21*5*0=0",
-"21*5=105",
-"21*6*0=0",
-"21*6=126",
-"21*7*0=0",
-"21*7=147",
-"21*8*0=0",
-"21*8=168",
-"21*9*0=0",
-"21*9=189",
-"21/1*0=0",
-"21/1/3=7",
-"21/1/7=3",
-"21/2*0=0",
-"21/3+0=7",
-"21/3+1=8",
-"21/3+2=9",
-"21/3-0=7",
-"21/3-1=6",
-"21/3-2=5",
-"21/3-3=4",
-"21/3-4=3",
-"21/3-5=2",
-"21/3-6=1",
-"21/3-7=0",
-"21/3*0=0",
-"21/3*1=7",
-"21/3/1=7",
-"21/3/7=1",
-"21/4*0=0",
-"21/5*0=0",
-"21/6*0=0",
-"21/6*2=7",
-"21/7+0=3",
-"21/7+1=4",
-"21/7+2=5",
-"21/7+3=6",
-"21/7+4=7",
-"21/7+5=8",
-"21/7+6=9",
-"21/7-0=3",
-"21/7-1=2",
-"21/7-2=1",
-"21/7-3=0",
-"21/7*0=0",
-"21/7*1=3",
-"21/7*2=6",
-"21/7*3=9",
-"21/7/1=3",
-"21/7/3=1",
-"21/8*0=0",
-"21/9*0=0",
-"21/9*3=7",
-"2200*0=0",
-"2201*0=0",
-"2202*0=0",
-"2203*0=0",
-"2204*0=0",
-"2205*0=0",
-"2206*0=0",
-"2207*0=0",
-"2208*0=0",
-"2209*0=0",
-"220/44=5",
-"220/4=55",
-"220/55=4",
-"220/5=44",
-"2210*0=0",
-"2211*0=0",
-"2212*0=0",
-"2213*0=0",
-"2214*0=0",
-"2215*0=0",
-"2216*0=0",
-"2217*0=0",
-"2218*0=0",
-"2219*0=0",
-"2220*0=0",
-"2221*0=0",
-"2222*0=0",
-"2223*0=0",
-"2224*0=0",
-"2225*0=0",
-"2226*0=0",
-"2227*0=0",
-"2228*0=0",
-"2229*0=0",
-"222/37=6",
-"222/3=74",
-"222/6=37",
-"222/74=3",
-"2230*0=0",
-"2231*0=0",
-"2232*0=0",
-"2233*0=0",
-"2234*0=0",
-"2235*0=0",
-"2236*0=0",
-"2237*0=0",
-"2238*0=0",
-"2239*0=0",
-"2240*0=0",
-"2241*0=0",
-"2242*0=0",
-"2243*0=0",
-"2244*0=0",
-"2245*0=0",
-"2246*0=0",
-"2247*0=0",
-"2248*0=0",
-"2249*0=0",
-"224/28=8",
-"224/32=7",
-"224/4=56",
-"224/56=4",
-"224/7=32",
-"224/8=28",
-"2250*0=0",
-"2251*0=0",
-"2252*0=0",
-"2253*0=0",
-"2254*0=0",
-"2255*0=0",
-"2256*0=0",
-"2257*0=0",
-"2258*0=0",
-"2259*0=0",
-"225/25=9",
-"225/3=75",
-"225/45=5",
-"225/5=45",
-"225/75=3",
-"225/9=25",
-"2260*0=0",
-"2261*0=0",
-"2262*0=0",
-"2263*0=0",
-"2264*0=0",
-"2265*0=0",
-"2266*0=0",
-"2267*0=0",
-"2268*0=0",
-"2269*0=0",
-"2270*0=0",
-"2271*0=0",
-"2272*0=0",
-"2273*0=0",
-"2274*0=0",
-"2275*0=0",
-"2276*0=0",
-"2277*0=0",
-"2278*0=0",
-"2279*0=0",
-"2280*0=0",
-"2281*0=0",
-"2282*0=0",
-"2283*0=0",
-"2284*0=0",
-"2285*0=0",
-"2286*0=0",
-"2287*0=0",
-"2288*0=0",
-"2289*0=0",
-"228/38=6",
-"228/3=76",
-"228/4=57",
-"228/57=4",
-"228/6=38",
-"228/76=3",
-"2290*0=0",
-"2291*0=0",
-"2292*0=0",
-"2293*0=0",
-"2294*0=0",
-"2295*0=0",
-"2296*0=0",
-"2297*0=0",
-"2298*0=0",
-"2299*0=0",
-"22+10=32",
-"22+11=33",
-"22+12=34",
-"22+13=35",
-"22+14=36",
-"22+15=37",
-"22+16=38",
-"22+17=39",
-"22+18=40",
-"22+19=41",
-"22+20=42",
-"22+21=43",
-"22+22=44",
-"22+23=45",
-"22+24=46",
-"22+25=47",
-"22+26=48",
-"22+27=49",
-"22+28=50",
-"22+29=51",
-"22+30=52",
-"22+31=53",
-"22+32=54",
-"22+33=55",
-"22+34=56",
-"22+35=57",
-"22+36=58",
-"22+37=59",
-"22+38=60",
-"22+39=61",
-"22+40=62",
-"22+41=63",
-"22+42=64",
-"22+43=65",
-"22+44=66",
-"22+45=67",
-"22+46=68",
-"22+47=69",
-"22+48=70",
-"22+49=71",
-"22+50=72",
-"22+51=73",
-"22+52=74",
-"22+53=75",
-"22+54=76",
-"22+55=77",
-"22+56=78",
-"22+57=79",
-"22+58=80",
-"22+59=81",
-"22+60=82",
-"22+61=83",
-"22+62=84",
-"22+63=85",
-"22+64=86",
-"22+65=87",
-"22+66=88",
-"22+67=89",
-"22+68=90",
-"22+69=91",
-"22+70=92",
-"22+71=93",
-"22+72=94",
-"22+73=95",
-"22+74=96",
-"22+75=97",
-"22+76=98",
-"22+77=99",
-"22-10=12",
-"22-11=11",
-"22-12=10",
-"22-23=-1",
-"22-24=-2",
-"22-25=-3",
-"22-26=-4",
-"22-27=-5",
-"22-28=-6",
-"22-29=-7",
-"22-2*7=8",
-"22-2*8=6",
-"22-2*9=4",
-"22-30=-8",
-"22-31=-9",
-"22-3*5=7",
-"22-3*6=4",
-"22-3*7=1",
-"22-4-9=9",
-"22-4*4=6",
-"22-4*5=2",
-"22-5-8=9",
-"22-5-9=8",
-"22-5*3=7",
-"22-5*4=2",
-"22-6-7=9",
-"22-6-8=8",
-"22-6-9=7",
-"22-6*3=4",
-"22-7-6=9",
-"22-7-7=8",
-"22-7-8=7",
-"22-7-9=6",
-"22-7*2=8",
-"22-7*3=1",
-"22-8-5=9",
-"22-8-6=8",
-"22-8-7=7",
-"22-8-8=6",
-"22-8-9=5",
-"22-8*2=6",
-"22-9-4=9",
-"22-9-5=8",
-"22-9-6=7",
-"22-9-7=6",
-"22-9-8=5",
-"22-9-9=4",
-"22-9*2=4",
-"22*0+0=0",
-"22*0+1=1",
-"22*0+2=2",
-"22*0+3=3",
-"22*0+4=4",
-"22*0+5=5",
-"22*0+6=6",
-"22*0+7=7",
-"22*0+8=8",
-"22*0+9=9",
-"22*0-0=0",
-"22*0*0=0",
-"22*0*1=0",
-"22*0*2=0",
-"22*0*3=0",
-"22*0*4=0",
-"22*0*5=0",
-"22*0*6=0",
-"22*0*7=0",
-"22*0*8=0",
-"22*0*9=0",
-"22*0/1=0",
-"22*0/2=0",
-"22*0/3=0",
-"22*0/4=0",
-"22*0/5=0",
-"22*0/6=0",
-"22*0/7=0",
-"22*0/8=0",
-"22*0/9=0",
-"22*1*0=0",
-"22*2*0=0",
-"22*3*0=0",
-"22*4*0=0",
-"22*5*0=0",
-"22*5=110",
-"22*6*0=0",
-"22*6=132",
-"22*7*0=0",
-"22*7=154",
-"22*8*0=0",
-"22*8=176",
-"22*9*0=0",
-"22*9=198",
-"22/1*0=0",
-"22/2-2=9",
-"22/2-3=8",
-"22/2-4=7",
-"22/2-5=6",
-"22/2-6=5",
-"22/2-7=4",
-"22/2-8=3",
-"22/2-9=2",
-"22/2*0=0",
-"22/3*0=0",
-"22/4*0=0",
-"22/5*0=0",
-"22/6*0=0",
-"22/7*0=0",
-"22/8*0=0",
-"22/9*0=0",
-"2300*0=0",
-"2301*0=0",
-"2302*0=0",
-"2303*0=0",
-"2304*0=0",
-"2305*0=0",
-"2306*0=0",
-"2307*0=0",
-"2308*0=0",
-"2309*0=0",
-"230/46=5",
-"230/5=46",
-"2310*0=0",
-"2311*0=0",
-"2312*0=0",
-"2313*0=0",
-"2314*0=0",
-"2315*0=0",
-"2316*0=0",
-"2317*0=0",
-"2318*0=0",
-"2319*0=0",
-"231/33=7",
-"231/3=77",
-"231/77=3",
-"231/7=33",
-"2320*0=0",
-"2321*0=0",
-"2322*0=0",
-"2323*0=0",
-"2324*0=0",
-"2325*0=0",
-"2326*0=0",
-"2327*0=0",
-"2328*0=0",
-"2329*0=0",
-"232/29=8",
-"232/4=58",
-"232/58=4",
-"232/8=29",
-"2330*0=0",
-"2331*0=0",
-"2332*0=0",
-"2333*0=0",
-"2334*0=0",
-"2335*0=0",
-"2336*0=0",
-"2337*0=0",
-"2338*0=0",
-"2339*0=0",
-"2340*0=0",
-"2341*0=0",
-"2342*0=0",
-"2343*0=0",
-"2344*0=0",
-"2345*0=0",
-"2346*0=0",
-"2347*0=0",
-"2348*0=0",
-"2349*0=0",
-"234/26=9",
-"234/39=6",
-"234/3=78",
-"234/6=39",
-"234/78=3",
-"234/9=26",
-"2350*0=0",
-"2351*0=0",
-"2352*0=0",
-"2353*0=0",
-"2354*0=0",
-"2355*0=0",
-"2356*0=0",
-"2357*0=0",
-"2358*0=0",
-"2359*0=0",
-"235/47=5",
-"235/5=47",
-"2360*0=0",
-"2361*0=0",
-"2362*0=0",
-"2363*0=0",
-"2364*0=0",
-"2365*0=0",
-"2366*0=0",
-"2367*0=0",
-"2368*0=0",
-"2369*0=0",
-"236/4=59",
-"236/59=4",
-"2370*0=0",
-"2371*0=0",
-"2372*0=0",
-"2373*0=0",
-"2374*0=0",
-"2375*0=0",
-"2376*0=0",
-"2377*0=0",
-"2378*0=0",
-"2379*0=0",
-"237/3=79",
-"237/79=3",
-"2380*0=0",
-"2381*0=0",
-"2382*0=0",
-"2383*0=0",
-"2384*0=0",
-"2385*0=0",
-"2386*0=0",
-"2387*0=0",
-"2388*0=0",
-"2389*0=0",
-"238/34=7",
-"238/7=34",
-"2390*0=0",
-"2391*0=0",
-"2392*0=0",
-"2393*0=0",
-"2394*0=0",
-"2395*0=0",
-"2396*0=0",
-"2397*0=0",
-"2398*0=0",
-"2399*0=0",
-"23+10=33",
-"23+11=34",
-"23+12=35",
-"23+13=36",
-"23+14=37",
-"23+15=38",
-"23+16=39",
-"23+17=40",
-"23+18=41",
-"23+19=42",
-"23+20=43",
-"23+21=44",
-"23+22=45",
-"23+23=46",
-"23+24=47",
-"23+25=48",
-"23+26=49",
-"23+27=50",
-"23+28=51",
-"23+29=52",
-"23+30=53",
-"23+31=54",
-"23+32=55",
-"23+33=56",
-"23+34=57",
-"23+35=58",
-"23+36=59",
-"23+37=60",
-"23+38=61",
-"23+39=62",
-"23+40=63",
-"23+41=64",
-"23+42=65",
-"23+43=66",
-"23+44=67",
-"23+45=68",
-"23+46=69",
-"23+47=70",
-"23+48=71",
-"23+49=72",
-"23+50=73",
-"23+51=74",
-"23+52=75",
-"23+53=76",
-"23+54=77",
-"23+55=78",
-"23+56=79",
-"23+57=80",
-"23+58=81",
-"23+59=82",
-"23+60=83",
-"23+61=84",
-"23+62=85",
-"23+63=86",
-"23+64=87",
-"23+65=88",
-"23+66=89",
-"23+67=90",
-"23+68=91",
-"23+69=92",
-"23+70=93",
-"23+71=94",
-"23+72=95",
-"23+73=96",
-"23+74=97",
-"23+75=98",
-"23+76=99",
-"23-10=13",
-"23-11=12",
-"23-12=11",
-"23-13=10",
-"23-24=-1",
-"23-25=-2",
-"23-26=-3",
-"23-27=-4",
-"23-28=-5",
-"23-29=-6",
-"23-2*7=9",
-"23-2*8=7",
-"23-2*9=5",
-"23-30=-7",
-"23-31=-8",
-"23-32=-9",
-"23-3*5=8",
-"23-3*6=5",
-"23-3*7=2",
-"23-4*4=7",
-"23-4*5=3",
-"23-5-9=9",
-"23-5*3=8",
-"23-5*4=3",
-"23-6-8=9",
-"23-6-9=8",
-"23-6*3=5",
-"23-7-7=9",
-"23-7-8=8",
-"23-7-9=7",
-"23-7*2=9",
-"23-7*3=2",
-"23-8-6=9",
-"23-8-7=8",
-"23-8-8=7",
-"23-8-9=6",
-"23-8*2=7",
-"23-9-5=9",
-"23-9-6=8",
-"23-9-7=7",
-"23-9-8=6",
-"23-9-9=5",
-"23-9*2=5",
-"23*0+0=0",
-"23*0+1=1",
-"23*0+2=2",
-"23*0+3=3",
-"23*0+4=4",
-"23*0+5=5",
-"23*0+6=6",
-"23*0+7=7",
-"23*0+8=8",
-"23*0+9=9",
-"23*0-0=0",
-"23*0*0=0",
-"23*0*1=0",
-"23*0*2=0",
-"23*0*3=0",
-"23*0*4=0",
-"23*0*5=0",
-"23*0*6=0",
-"23*0*7=0",
-"23*0*8=0",
-"23*0*9=0",
-"23*0/1=0",
-"23*0/2=0",
-"23*0/3=0",
-"23*0/4=0",
-"23*0/5=0",
-"23*0/6=0",
-"23*0/7=0",
-"23*0/8=0",
-"23*0/9=0",
-"23*1*0=0",
-"23*2*0=0",
-"23*3*0=0",
-"23*4*0=0",
-"23*5*0=0",
-"23*5=115",
-"23*6*0=0",
-"23*6=138",
-"23*7*0=0",
-"23*7=161",
-"23*8*0=0",
-"23*8=184",
-"23*9*0=0",
-"23*9=207",
-"23/1*0=0",
-"23/2*0=0",
-"23/3*0=0",
-"23/4*0=0",
-"23/5*0=0",
-"23/6*0=0",
-"23/7*0=0",
-"23/8*0=0",
-"23/9*0=0",
-"2400*0=0",
-"2401*0=0",
-"2402*0=0",
-"2403*0=0",
-"2404*0=0",
-"2405*0=0",
-"2406*0=0",
-"2407*0=0",
-"2408*0=0",
-"2409*0=0",
-"240/30=8",
-"240/3=80",
-"240/40=6",
-"240/48=5",
-"240/4=60",
-"240/5=48",
-"240/60=4",
-"240/6=40",
-"240/80=3",
-"240/8=30",
-"2410*0=0",
-"2411*0=0",
-"2412*0=0",
-"2413*0=0",
-"2414*0=0",
-"2415*0=0",
-"2416*0=0",
-"2417*0=0",
-"2418*0=0",
-"2419*0=0",
-"2420*0=0",
-"2421*0=0",
-"2422*0=0",
-"2423*0=0",
-"2424*0=0",
-"2425*0=0",
-"2426*0=0",
-"2427*0=0",
-"2428*0=0",
-"2429*0=0",
-"2430*0=0",
-"2431*0=0",
-"2432*0=0",
-"2433*0=0",
-"2434*0=0",
-"2435*0=0",
-"2436*0=0",
-"2437*0=0",
-"2438*0=0",
-"2439*0=0",
-"243/27=9",
-"243/3=81",
-"243/81=3",
-"243/9=27",
-"2440*0=0",
-"2441*0=0",
-"2442*0=0",
-"2443*0=0",
-"2444*0=0",
-"2445*0=0",
-"2446*0=0",
-"2447*0=0",
-"2448*0=0",
-"2449*0=0",
-"244/4=61",
-"244/61=4",
-"2450*0=0",
-"2451*0=0",
-"2452*0=0",
-"2453*0=0",
-"2454*0=0",
-"2455*0=0",
-"2456*0=0",
-"2457*0=0",
-"2458*0=0",
-"2459*0=0",
-"245/35=7",
-"245/49=5",
-"245/5=49",
-"245/7=35",
-"2460*0=0",
-"2461*0=0",
-"2462*0=0",
-"2463*0=0",
-"2464*0=0",
-"2465*0=0",
-"2466*0=0",
-"2467*0=0",
-"2468*0=0",
-"2469*0=0",
-"246/3=82",
-"246/41=6",
-"246/6=41",
-"246/82=3",
-"2470*0=0",
-"2471*0=0",
-"2472*0=0",
-"2473*0=0",
-"2474*0=0",
-"2475*0=0",
-"2476*0=0",
-"2477*0=0",
-"2478*0=0",
-"2479*0=0",
-"2480*0=0",
-"2481*0=0",
-"2482*0=0",
-"2483*0=0",
-"2484*0=0",
-"2485*0=0",
-"2486*0=0",
-"2487*0=0",
-"2488*0=0",
-"2489*0=0",
-"248/31=8",
-"248/4=62",
-"248/62=4",
-"248/8=31",
-"2490*0=0",
-"2491*0=0",
-"2492*0=0",
-"2493*0=0",
-"2494*0=0",
-"2495*0=0",
-"2496*0=0",
-"2497*0=0",
-"2498*0=0",
-"2499*0=0",
-"249/3=83",
-"249/83=3",
-"24+10=34",
-"24+11=35",
-"24+12=36",
-"24+13=37",
-"24+14=38",
-"24+15=39",
-"24+16=40",
-"24+17=41",
-"24+18=42",
-"24+19=43",
-"24+20=44",
-"24+21=45",
-"24+22=46",
-"24+23=47",
-"24+24=48",
-"24+25=49",
-"24+26=50",
-"24+27=51",
-"24+28=52",
-"24+29=53",
-"24+30=54",
-"24+31=55",
-"24+32=56",
-"24+33=57",
-"24+34=58",
-"24+35=59",
-"24+36=60",
-"24+37=61",
-"24+38=62",
-"24+39=63",
-"24+40=64",
-"24+41=65",
-"24+42=66",
-"24+43=67",
-"24+44=68",
-"24+45=69",
-"24+46=70",
-"24+47=71",
-"24+48=72",
-"24+49=73",
-"24+50=74",
-"24+51=75",
-"24+52=76",
-"24+53=77",
-"24+54=78",
-"24+55=79",
-"24+56=80",
-"24+57=81",
-"24+58=82",
-"24+59=83",
-"24+60=84",
-"24+61=85",
-"24+62=86",
-"24+63=87",
-"24+64=88",
-"24+65=89",
-"24+66=90",
-"24+67=91",
-"24+68=92",
-"24+69=93",
-"24+70=94",
-"24+71=95",
-"24+72=96",
-"24+73=97",
-"24+74=98",
-"24+75=99",
-"24-10=14",
-"24-11=13",
-"24-12=12",
-"24-13=11",
-"24-14=10",
-"24-25=-1",
-"24-26=-2",
-"24-27=-3",
-"24-28=-4",
-"24-29=-5",
-"24-2*8=8",
-"24-2*9=6",
-"24-30=-6",
-"24-31=-7",
-"24-32=-8",
-"24-33=-9",
-"24-3*5=9",
-"24-3*6=6",
-"24-3*7=3",
-"24-3*8=0",
-"24-4*4=8",
-"24-4*5=4",
-"24-4*6=0",
-"24-5*3=9",
-"24-5*4=4",
-"24-6-9=9",
-"24-6*3=6",
-"24-6*4=0",
-"24-7-8=9",
-"24-7-9=8",
-"24-7*3=3",
-"24-8-7=9",
-"24-8-8=8",
-"24-8-9=7",
-"24-8*2=8",
-"24-8*3=0",
-"24-9-6=9",
-"24-9-7=8",
-"24-9-8=7",
-"24-9-9=6",
-"24-9*2=6",
-"24*0+0=0",
-"24*0+1=1",
-"24*0+2=2",
-"24*0+3=3",
-"24*0+4=4",
-"24*0+5=5",
-"24*0+6=6",
-"24*0+7=7",
-"24*0+8=8",
-"24*0+9=9",
-"24*0-0=0",
-"24*0*0=0",
-"24*0*1=0",
-"24*0*2=0",
-"24*0*3=0",
-"24*0*4=0",
-"24*0*5=0",
-"24*0*6=0",
-"24*0*7=0",
-"24*0*8=0",
-"24*0*9=0",
-"24*0/1=0",
-"24*0/2=0",
-"24*0/3=0",
-"24*0/4=0",
-"24*0/5=0",
-"24*0/6=0",
-"24*0/7=0",
-"24*0/8=0",
-"24*0/9=0",
-"24*1*0=0",
-"24*1/3=8",
-"24*1/4=6",
-"24*1/6=4",
-"24*1/8=3",
-"24*2*0=0",
-"24*2/6=8",
-"24*2/8=6",
-"24*3*0=0",
-"24*3/8=9",
-"24*3/9=8",
-"24*4*0=0",
-"24*5*0=0",
-"24*5=120",
-"24*6*0=0",
-"24*6=144",
-"24*7*0=0",
-"24*7=168",
-"24*8*0=0",
-"24*8=192",
-"24*9*0=0",
-"24*9=216",
-"24/1*0=0",
-"24/1/3=8",
-"24/1/4=6",
-"24/1/6=4",
-"24/1/8=3",
-"24/2-3=9",
-"24/2-4=8",
-"24/2-5=7",
-"24/2-6=6",
-"24/2-7=5",
-"24/2-8=4",
-"24/2-9=3",
-"24/2*0=0",
-"24/2/2=6",
-"24/2/3=4",
-"24/2/4=3",
-"24/2/6=2",
-"24/3+0=8",
-"24/3+1=9",
-"24/3-0=8",
-"24/3-1=7",
-"24/3-2=6",
-"24/3-3=5",
-"24/3-4=4",
-"24/3-5=3",
-"24/3-6=2",
-"24/3-7=1",
-"24/3-8=0",
-"24/3*0=0",
-"24/3*1=8",
-"24/3/1=8",
-"24/3/2=4",
-"24/3/4=2",
-"24/3/8=1",
-"24/4+0=6",
-"24/4+1=7",
-"24/4+2=8",
-"24/4+3=9",
-"24/4-0=6",
-"24/4-1=5",
-"24/4-2=4",
-"24/4-3=3",
-"24/4-4=2",
-"24/4-5=1",
-"24/4-6=0",
-"24/4*0=0",
-"24/4*1=6",
-"24/4/1=6",
-"24/4/2=3",
-"24/4/3=2",
-"24/4/6=1",
-"24/5*0=0",
-"24/6+0=4",
-"24/6+1=5",
-"24/6+2=6",
-"24/6+3=7",
-"24/6+4=8",
-"24/6+5=9",
-"24/6-0=4",
-"24/6-1=3",
-"24/6-2=2",
-"24/6-3=1",
-"24/6-4=0",
-"24/6*0=0",
-"24/6*1=4",
-"24/6*2=8",
-"24/6/1=4",
-"24/6/2=2",
-"24/6/4=1",
-"24/7*0=0",
-"24/8+0=3",
-"24/8+1=4",
-"24/8+2=5",
-"24/8+3=6",
-"24/8+4=7",
-"24/8+5=8",
-"24/8+6=9",
-"24/8-0=3",
-"24/8-1=2",
-"24/8-2=1",
-"24/8-3=0",
-"24/8*0=0",
-"24/8*1=3",
-"24/8*2=6",
-"24/8*3=9",
-"24/8/1=3",
-"24/8/3=1",
-"24/9*0=0",
-"24/9*3=8",
-"2500*0=0",
-"2501*0=0",
-"2502*0=0",
-"2503*0=0",
-"2504*0=0",
-"2505*0=0",
-"2506*0=0",
-"2507*0=0",
-"2508*0=0",
-"2509*0=0",
-"250/50=5",
-"250/5=50",
-"2510*0=0",
-"2511*0=0",
-"2512*0=0",
-"2513*0=0",
-"2514*0=0",
-"2515*0=0",
-"2516*0=0",
-"2517*0=0",
-"2518*0=0",
-"2519*0=0",
-"2520*0=0",
-"2521*0=0",
-"2522*0=0",
-"2523*0=0",
-"2524*0=0",
-"2525*0=0",
-"2526*0=0",
-"2527*0=0",
-"2528*0=0",
-"2529*0=0",
-"252/28=9",
-"252/36=7",
-"252/3=84",
-"252/42=6",
-"252/4=63",
-"252/63=4",
-"252/6=42",
-"252/7=36",
-"252/84=3",
-"252/9=28",
-"2530*0=0",
-"2531*0=0",
-"2532*0=0",
-"2533*0=0",
-"2534*0=0",
-"2535*0=0",
-"2536*0=0",
-"2537*0=0",
-"2538*0=0",
-"2539*0=0",
-"2540*0=0",
-"2541*0=0",
-"2542*0=0",
-"2543*0=0",
-"2544*0=0",
-"2545*0=0",
-"2546*0=0",
-"2547*0=0",
-"2548*0=0",
-"2549*0=0",
-"2550*0=0",
-"2551*0=0",
-"2552*0=0",
-"2553*0=0",
-"2554*0=0",
-"2555*0=0",
-"2556*0=0",
-"2557*0=0",
-"2558*0=0",
-"2559*0=0",
-"255/3=85",
-"255/51=5",
-"255/5=51",
-"255/85=3",
-"2560*0=0",
-"2561*0=0",
-"2562*0=0",
-"2563*0=0",
-"2564*0=0",
-"2565*0=0",
-"2566*0=0",
-"2567*0=0",
-"2568*0=0",
-"2569*0=0",
-"256/32=8",
-"256/4=64",
-"256/64=4",
-"256/8=32",
-"2570*0=0",
-"2571*0=0",
-"2572*0=0",
-"2573*0=0",
-"2574*0=0",
-"2575*0=0",
-"2576*0=0",
-"2577*0=0",
-"2578*0=0",
-"2579*0=0",
-"2580*0=0",
-"2581*0=0",
-"2582*0=0",
-"2583*0=0",
-"2584*0=0",
-"2585*0=0",
-"2586*0=0",
-"2587*0=0",
-"2588*0=0",
-"2589*0=0",
-"258/3=86",
-"258/43=6",
-"258/6=43",
-"258/86=3",
-"2590*0=0",
-"2591*0=0",
-"2592*0=0",
-"2593*0=0",
-"2594*0=0",
-"2595*0=0",
-"2596*0=0",
-"2597*0=0",
-"2598*0=0",
-"2599*0=0",
-"259/37=7",
-"259/7=37",
-"25+10=35",
-"25+11=36",
-"25+12=37",
-"25+13=38",
-"25+14=39",
-"25+15=40",
-"25+16=41",
-"25+17=42",
-"25+18=43",
-"25+19=44",
-"25+20=45",
-"25+21=46",
-"25+22=47",
-"25+23=48",
-"25+24=49",
-"25+25=50",
-"25+26=51",
-"25+27=52",
-"25+28=53",
-"25+29=54",
-"25+30=55",
-"25+31=56",
-"25+32=57",
-"25+33=58",
-"25+34=59",
-"25+35=60",
-"25+36=61",
-"25+37=62",
-"25+38=63",
-"25+39=64",
-"25+40=65",
-"25+41=66",
-"25+42=67",
-"25+43=68",
-"25+44=69",
-"25+45=70",
-"25+46=71",
-"25+47=72",
-"25+48=73",
-"25+49=74",
-"25+50=75",
-"25+51=76",
-"25+52=77",
-"25+53=78",
-"25+54=79",
-"25+55=80",
-"25+56=81",
-"25+57=82",
-"25+58=83",
-"25+59=84",
-"25+60=85",
-"25+61=86",
-"25+62=87",
-"25+63=88",
-"25+64=89",
-"25+65=90",
-"25+66=91",
-"25+67=92",
-"25+68=93",
-"25+69=94",
-"25+70=95",
-"25+71=96",
-"25+72=97",
-"25+73=98",
-"25+74=99",
-"25-10=15",
-"25-11=14",
-"25-12=13",
-"25-13=12",
-"25-14=11",
-"25-15=10",
-"25-26=-1",
-"25-27=-2",
-"25-28=-3",
-"25-29=-4",
-"25-2*8=9",
-"25-2*9=7",
-"25-30=-5",
-"25-31=-6",
-"25-32=-7",
-"25-33=-8",
-"25-34=-9",
-"25-3*6=7",
-"25-3*7=4",
-"25-3*8=1",
-"25-4*4=9",
-"25-4*5=5",
-"25-4*6=1",
-"25-5*4=5",
-"25-5*5=0",
-"25-6*3=7",
-"25-6*4=1",
-"25-7-9=9",
-"25-7*3=4",
-"25-8-8=9",
-"25-8-9=8",
-"25-8*2=9",
-"25-8*3=1",
-"25-9-7=9",
-"25-9-8=8",
-"25-9-9=7",
-"25-9*2=7",
-"25*0+0=0",
-"25*0+1=1",
-"25*0+2=2",
-"25*0+3=3",
-"25*0+4=4",
-"25*0+5=5",
-"25*0+6=6",
-"25*0+7=7",
-"25*0+8=8",
-"25*0+9=9",
-"25*0-0=0",
-"25*0*0=0",
-"25*0*1=0",
-"25*0*2=0",
-"25*0*3=0",
-"25*0*4=0",
-"25*0*5=0",
-"25*0*6=0",
-"25*0*7=0",
-"25*0*8=0",
-"25*0*9=0",
-"25*0/1=0",
-"25*0/2=0",
-"25*0/3=0",
-"25*0/4=0",
-"25*0/5=0",
-"25*0/6=0",
-"25*0/7=0",
-"25*0/8=0",
-"25*0/9=0",
-"25*1*0=0",
-"25*1/5=5",
-"25*2*0=0",
-"25*3*0=0",
-"25*4*0=0",
-"25*4=100",
-"25*5*0=0",
-"25*5=125",
-"25*6*0=0",
-"25*6=150",
-"25*7*0=0",
-"25*7=175",
-"25*8*0=0",
-"25*8=200",
-"25*9*0=0",
-"25*9=225",
-"25/1*0=0",
-"25/1/5=5",
-"25/2*0=0",
-"25/3*0=0",
-"25/4*0=0",
-"25/5+0=5",
-"25/5+1=6",
-"25/5+2=7",
-"25/5+3=8",
-"25/5+4=9",
-"25/5-0=5",
-"25/5-1=4",
-"25/5-2=3",
-"25/5-3=2",
-"25/5-4=1",
-"25/5-5=0",
-"25/5*0=0",
-"25/5*1=5",
-"25/5/1=5",
-"25/5/5=1",
-"25/6*0=0",
-"25/7*0=0",
-"25/8*0=0",
-"25/9*0=0",
-"2600*0=0",
-"2601*0=0",
-"2602*0=0",
-"2603*0=0",
-"2604*0=0",
-"2605*0=0",
-"2606*0=0",
-"2607*0=0",
-"2608*0=0",
-"2609*0=0",
-"260/4=65",
-"260/52=5",
-"260/5=52",
-"260/65=4",
-"2610*0=0",
-"2611*0=0",
-"2612*0=0",
-"2613*0=0",
-"2614*0=0",
-"2615*0=0",
-"2616*0=0",
-"2617*0=0",
-"2618*0=0",
-"2619*0=0",
-"261/29=9",
-"261/3=87",
-"261/87=3",
-"261/9=29",
-"2620*0=0",
-"2621*0=0",
-"2622*0=0",
-"2623*0=0",
-"2624*0=0",
-"2625*0=0",
-"2626*0=0",
-"2627*0=0",
-"2628*0=0",
-"2629*0=0",
-"2630*0=0",
-"2631*0=0",
-"2632*0=0",
-"2633*0=0",
-"2634*0=0",
-"2635*0=0",
-"2636*0=0",
-"2637*0=0",
-"2638*0=0",
-"2639*0=0",
-"2640*0=0",
-"2641*0=0",
-"2642*0=0",
-"2643*0=0",
-"2644*0=0",
-"2645*0=0",
-"2646*0=0",
-"2647*0=0",
-"2648*0=0",
-"2649*0=0",
-"264/33=8",
-"264/3=88",
-"264/44=6",
-"264/4=66",
-"264/66=4",
-"264/6=44",
-"264/88=3",
-"264/8=33",
-"2650*0=0",
-"2651*0=0",
-"2652*0=0",
-"2653*0=0",
-"2654*0=0",
-"2655*0=0",
-"2656*0=0",
-"2657*0=0",
-"2658*0=0",
-"2659*0=0",
-"265/53=5",
-"265/5=53",
-"2660*0=0",
-"2661*0=0",
-"2662*0=0",
-"2663*0=0",
-"2664*0=0",
-"2665*0=0",
-"2666*0=0",
-"2667*0=0",
-"2668*0=0",
-"2669*0=0",
-"266/38=7",
-"266/7=38",
-"2670*0=0",
-"2671*0=0",
-"2672*0=0",
-"2673*0=0",
-"2674*0=0",
-"2675*0=0",
-"2676*0=0",
-"2677*0=0",
-"2678*0=0",
-"2679*0=0",
-"267/3=89",
-"267/89=3",
-"2680*0=0",
-"2681*0=0",
-"2682*0=0",
-"2683*0=0",
-"2684*0=0",
-"2685*0=0",
-"2686*0=0",
-"2687*0=0",
-"2688*0=0",
-"2689*0=0",
-"268/4=67",
-"268/67=4",
-"2690*0=0",
-"2691*0=0",
-"2692*0=0",
-"2693*0=0",
-"2694*0=0",
-"2695*0=0",
-"2696*0=0",
-"2697*0=0",
-"2698*0=0",
-"2699*0=0",
-"26+10=36",
-"26+11=37",
-"26+12=38",
-"26+13=39",
-"26+14=40",
-"26+15=41",
-"26+16=42",
-"26+17=43",
-"26+18=44",
-"26+19=45",
-"26+20=46",
-"26+21=47",
-"26+22=48",
-"26+23=49",
-"26+24=50",
-"26+25=51",
-"26+26=52",
-"26+27=53",
-"26+28=54",
-"26+29=55",
-"26+30=56",
-"26+31=57",
-"26+32=58",
-"26+33=59",
-"26+34=60",
-"26+35=61",
-"26+36=62",
-"26+37=63",
-"26+38=64",
-"26+39=65",
-"26+40=66",
-"26+41=67",
-"26+42=68",
-"26+43=69",
-"26+44=70",
-"26+45=71",
-"26+46=72",
-"26+47=73",
-"26+48=74",
-"26+49=75",
-"26+50=76",
-"26+51=77",
-"26+52=78",
-"26+53=79",
-"26+54=80",
-"26+55=81",
-"26+56=82",
-"26+57=83",
-"26+58=84",
-"26+59=85",
-"26+60=86",
-"26+61=87",
-"26+62=88",
-"26+63=89",
-"26+64=90",
-"26+65=91",
-"26+66=92",
-"26+67=93",
-"26+68=94",
-"26+69=95",
-"26+70=96",
-"26+71=97",
-"26+72=98",
-"26+73=99",
-"26-10=16",
-"26-11=15",
-"26-12=14",
-"26-13=13",
-"26-14=12",
-"26-15=11",
-"26-16=10",
-"26-27=-1",
-"26-28=-2",
-"26-29=-3",
-"26-2*9=8",
-"26-30=-4",
-"26-31=-5",
-"26-32=-6",
-"26-33=-7",
-"26-34=-8",
-"26-35=-9",
-"26-3*6=8",
-"26-3*7=5",
-"26-3*8=2",
-"26-4*5=6",
-"26-4*6=2",
-"26-5*4=6",
-"26-5*5=1",
-"26-6*3=8",
-"26-6*4=2",
-"26-7*3=5",
-"26-8-9=9",
-"26-8*3=2",
-"26-9-8=9",
-"26-9-9=8",
-"26-9*2=8",
-"26*0+0=0",
-"26*0+1=1",
-"26*0+2=2",
-"26*0+3=3",
-"26*0+4=4",
-"26*0+5=5",
-"26*0+6=6",
-"26*0+7=7",
-"26*0+8=8",
-"26*0+9=9",
-"26*0-0=0",
-"26*0*0=0",
-"26*0*1=0",
-"26*0*2=0",
-"26*0*3=0",
-"26*0*4=0",
-"26*0*5=0",
-"26*0*6=0",
-"26*0*7=0",
-"26*0*8=0",
-"26*0*9=0",
-"26*0/1=0",
-"26*0/2=0",
-"26*0/3=0",
-"26*0/4=0",
-"26*0/5=0",
-"26*0/6=0",
-"26*0/7=0",
-"26*0/8=0",
-"26*0/9=0",
-"26*1*0=0",
-"26*2*0=0",
-"26*3*0=0",
-"26*4*0=0",
-"26*4=104",
-"26*5*0=0",
-"26*5=130",
-"26*6*0=0",
-"26*6=156",
-"26*7*0=0",
-"26*7=182",
-"26*8*0=0",
-"26*8=208",
-"26*9*0=0",
-"26*9=234",
-"26/1*0=0",
-"26/2-4=9",
-"26/2-5=8",
-"26/2-6=7",
-"26/2-7=6",
-"26/2-8=5",
-"26/2-9=4",
-"26/2*0=0",
-"26/3*0=0",
-"26/4*0=0",
-"26/5*0=0",
-"26/6*0=0",
-"26/7*0=0",
-"26/8*0=0",
-"26/9*0=0",
-"2700*0=0",
-"2701*0=0",
-"2702*0=0",
-"2703*0=0",
-"2704*0=0",
-"2705*0=0",
-"2706*0=0",
-"2707*0=0",
-"2708*0=0",
-"2709*0=0",
-"270/30=9",
-"270/3=90",
-"270/45=6",
-"270/54=5",
-"270/5=54",
-"270/6=45",
-"270/90=3",
-"270/9=30",
-"2710*0=0",
-"2711*0=0",
-"2712*0=0",
-"2713*0=0",
-"2714*0=0",
-"2715*0=0",
-"2716*0=0",
-"2717*0=0",
-"2718*0=0",
-"2719*0=0",
-"2720*0=0",
-"2721*0=0",
-"2722*0=0",
-"2723*0=0",
-"2724*0=0",
-"2725*0=0",
-"2726*0=0",
-"2727*0=0",
-"2728*0=0",
-"2729*0=0",
-"272/34=8",
-"272/4=68",
-"272/68=4",
-"272/8=34",
-"2730*0=0",
-"2731*0=0",
-"2732*0=0",
-"2733*0=0",
-"2734*0=0",
-"2735*0=0",
-"2736*0=0",
-"2737*0=0",
-"2738*0=0",
-"2739*0=0",
-"273/39=7",
-"273/3=91",
-"273/7=39",
-"273/91=3",
-"2740*0=0",
-"2741*0=0",
-"2742*0=0",
-"2743*0=0",
-"2744*0=0",
-"2745*0=0",
-"2746*0=0",
-"2747*0=0",
-"2748*0=0",
-"2749*0=0",
-"2750*0=0",
-"2751*0=0",
-"2752*0=0",
-"2753*0=0",
-"2754*0=0",
-"2755*0=0",
-"2756*0=0",
-"2757*0=0",
-"2758*0=0",
-"2759*0=0",
-"275/55=5",
-"275/5=55",
-"2760*0=0",
-"2761*0=0",
-"2762*0=0",
-"2763*0=0",
-"2764*0=0",
-"2765*0=0",
-"2766*0=0",
-"2767*0=0",
-"2768*0=0",
-"2769*0=0",
-"276/3=92",
-"276/46=6",
-"276/4=69",
-"276/69=4",
-"276/6=46",
-"276/92=3",
-"2770*0=0",
-"2771*0=0",
-"2772*0=0",
-"2773*0=0",
-"2774*0=0",
-"2775*0=0",
-"2776*0=0",
-"2777*0=0",
-"2778*0=0",
-"2779*0=0",
-"2780*0=0",
-"2781*0=0",
-"2782*0=0",
-"2783*0=0",
-"2784*0=0",
-"2785*0=0",
-"2786*0=0",
-"2787*0=0",
-"2788*0=0",
-"2789*0=0",
-"2790*0=0",
-"2791*0=0",
-"2792*0=0",
-"2793*0=0",
-"2794*0=0",
-"2795*0=0",
-"2796*0=0",
-"2797*0=0",
-"2798*0=0",
-"2799*0=0",
-"279/31=9",
-"279/3=93",
-"279/93=3",
-"279/9=31",
-"27+10=37",
-"27+11=38",
-"27+12=39",
-"27+13=40",
-"27+14=41",
-"27+15=42",
-"27+16=43",
-"27+17=44",
-"27+18=45",
-"27+19=46",
-"27+20=47",
-"27+21=48",
-"27+22=49",
-"27+23=50",
-"27+24=51",
-"27+25=52",
-"27+26=53",
-"27+27=54",
-"27+28=55",
-"27+29=56",
-"27+30=57",
-"27+31=58",
-"27+32=59",
-"27+33=60",
-"27+34=61",
-"27+35=62",
-"27+36=63",
-"27+37=64",
-"27+38=65",
-"27+39=66",
-"27+40=67",
-"27+41=68",
-"27+42=69",
-"27+43=70",
-"27+44=71",
-"27+45=72",
-"27+46=73",
-"27+47=74",
-"27+48=75",
-"27+49=76",
-"27+50=77",
-"27+51=78",
-"27+52=79",
-"27+53=80",
-"27+54=81",
-"27+55=82",
-"27+56=83",
-"27+57=84",
-"27+58=85",
-"27+59=86",
-"27+60=87",
-"27+61=88",
-"27+62=89",
-"27+63=90",
-"27+64=91",
-"27+65=92",
-"27+66=93",
-"27+67=94",
-"27+68=95",
-"27+69=96",
-"27+70=97",
-"27+71=98",
-"27+72=99",
-"27-10=17",
-"27-11=16",
-"27-12=15",
-"27-13=14",
-"27-14=13",
-"27-15=12",
-"27-16=11",
-"27-17=10",
-"27-28=-1",
-"27-29=-2",
-"27-2*9=9",
-"27-30=-3",
-"27-31=-4",
-"27-32=-5",
-"27-33=-6",
-"27-34=-7",
-"27-35=-8",
-"27-36=-9",
-"27-3*6=9",
-"27-3*7=6",
-"27-3*8=3",
-"27-3*9=0",
-"27-4*5=7",
-"27-4*6=3",
-"27-5*4=7",
-"27-5*5=2",
-"27-6*3=9",
-"27-6*4=3",
-"27-7*3=6",
-"27-8*3=3",
-"27-9-9=9",
-"27-9*2=9",
-"27-9*3=0",
-"27*0+0=0",
-"27*0+1=1",
-"27*0+2=2",
-"27*0+3=3",
-"27*0+4=4",
-"27*0+5=5",
-"27*0+6=6",
-"27*0+7=7",
-"27*0+8=8",
-"27*0+9=9",
-"27*0-0=0",
-"27*0*0=0",
-"27*0*1=0",
-"27*0*2=0",
-"27*0*3=0",
-"27*0*4=0",
-"27*0*5=0",
-"27*0*6=0",
-"27*0*7=0",
-"27*0*8=0",
-"27*0*9=0",
-"27*0/1=0",
-"27*0/2=0",
-"27*0/3=0",
-"27*0/4=0",
-"27*0/5=0",
-"27*0/6=0",
-"27*0/7=0",
-"27*0/8=0",
-"27*0/9=0",
-"27*1*0=0",
-"27*1/3=9",
-"27*1/9=3",
-"27*2*0=0",
-"27*2/6=9",
-"27*2/9=6",
-"27*3*0=0",
-"27*3/9=9",
-"27*4*0=0",
-"27*4=108",
-"27*5*0=0",
-"27*5=135",
-"27*6*0=0",
-"27*6=162",
-"27*7*0=0",
-"27*7=189",
-"27*8*0=0",
-"27*8=216",
-"27*9*0=0",
-"27*9=243",
-"27/1*0=0",
-"27/1/3=9",
-"27/1/9=3",
-"27/2*0=0",
-"27/3+0=9",
-"27/3-0=9",
-"27/3-1=8",
-"27/3-2=7",
-"27/3-3=6",
-"27/3-4=5",
-"27/3-5=4",
-"27/3-6=3",
-"27/3-7=2",
-"27/3-8=1",
-"27/3-9=0",
-"27/3*0=0",
-"27/3*1=9",
-"27/3/1=9",
-"27/3/3=3",
-"27/3/9=1",
-"27/4*0=0",
-"27/5*0=0",
-"27/6*0=0",
-"27/6*2=9",
-"27/7*0=0",
-"27/8*0=0",
-"27/9+0=3",
-"27/9+1=4",
-"27/9+2=5",
-"27/9+3=6",
-"27/9+4=7",
-"27/9+5=8",
-"27/9+6=9",
-"27/9-0=3",
-"27/9-1=2",
-"27/9-2=1",
-"27/9-3=0",
-"27/9*0=0",
-"27/9*1=3",
-"27/9*2=6",
-"27/9*3=9",
-"27/9/1=3",
-"27/9/3=1",
-"2800*0=0",
-"2801*0=0",
-"2802*0=0",
-"2803*0=0",
-"2804*0=0",
-"2805*0=0",
-"2806*0=0",
-"2807*0=0",
-"2808*0=0",
-"2809*0=0",
-"280/35=8",
-"280/40=7",
-"280/4=70",
-"280/56=5",
-"280/5=56",
-"280/70=4",
-"280/7=40",
-"280/8=35",
-"2810*0=0",
-"2811*0=0",
-"2812*0=0",
-"2813*0=0",
-"2814*0=0",
-"2815*0=0",
-"2816*0=0",
-"2817*0=0",
-"2818*0=0",
-"2819*0=0",
-"2820*0=0",
-"2821*0=0",
-"2822*0=0",
-"2823*0=0",
-"2824*0=0",
-"2825*0=0",
-"2826*0=0",
-"2827*0=0",
-"2828*0=0",
-"2829*0=0",
-"282/3=94",
-"282/47=6",
-"282/6=47",
-"282/94=3",
-"2830*0=0",
-"2831*0=0",
-"2832*0=0",
-"2833*0=0",
-"2834*0=0",
-"2835*0=0",
-"2836*0=0",
-"2837*0=0",
-"2838*0=0",
-"2839*0=0",
-"2840*0=0",
-"2841*0=0",
-"2842*0=0",
-"2843*0=0",
-"2844*0=0",
-"2845*0=0",
-"2846*0=0",
-"2847*0=0",
-"2848*0=0",
-"2849*0=0",
-"284/4=71",
-"284/71=4",
-"2850*0=0",
-"2851*0=0",
-"2852*0=0",
-"2853*0=0",
-"2854*0=0",
-"2855*0=0",
-"2856*0=0",
-"2857*0=0",
-"2858*0=0",
-"2859*0=0",
-"285/3=95",
-"285/57=5",
-"285/5=57",
-"285/95=3",
-"2860*0=0",
-"2861*0=0",
-"2862*0=0",
-"2863*0=0",
-"2864*0=0",
-"2865*0=0",
-"2866*0=0",
-"2867*0=0",
-"2868*0=0",
-"2869*0=0",
-"2870*0=0",
-"2871*0=0",
-"2872*0=0",
-"2873*0=0",
-"2874*0=0",
-"2875*0=0",
-"2876*0=0",
-"2877*0=0",
-"2878*0=0",
-"2879*0=0",
-"287/41=7",
-"287/7=41",
-"2880*0=0",
-"2881*0=0",
-"2882*0=0",
-"2883*0=0",
-"2884*0=0",
-"2885*0=0",
-"2886*0=0",
-"2887*0=0",
-"2888*0=0",
-"2889*0=0",
-"288/32=9",
-"288/36=8",
-"288/3=96",
-"288/48=6",
-"288/4=72",
-"288/6=48",
-"288/72=4",
-"288/8=36",
-"288/96=3",
-"288/9=32",
-"2890*0=0",
-"2891*0=0",
-"2892*0=0",
-"2893*0=0",
-"2894*0=0",
-"2895*0=0",
-"2896*0=0",
-"2897*0=0",
-"2898*0=0",
-"2899*0=0",
-"28+10=38",
-"28+11=39",
-"28+12=40",
-"28+13=41",
-"28+14=42",
-"28+15=43",
-"28+16=44",
-"28+17=45",
-"28+18=46",
-"28+19=47",
-"28+20=48",
-"28+21=49",
-"28+22=50",
-"28+23=51",
-"28+24=52",
-"28+25=53",
-"28+26=54",
-"28+27=55",
-"28+28=56",
-"28+29=57",
-"28+30=58",
-"28+31=59",
-"28+32=60",
-"28+33=61",
-"28+34=62",
-"28+35=63",
-"28+36=64",
-"28+37=65",
-"28+38=66",
-"28+39=67",
-"28+40=68",
-"28+41=69",
-"28+42=70",
-"28+43=71",
-"28+44=72",
-"28+45=73",
-"28+46=74",
-"28+47=75",
-"28+48=76",
-"28+49=77",
-"28+50=78",
-"28+51=79",
-"28+52=80",
-"28+53=81",
-"28+54=82",
-"28+55=83",
-"28+56=84",
-"28+57=85",
-"28+58=86",
-"28+59=87",
-"28+60=88",
-"28+61=89",
-"28+62=90",
-"28+63=91",
-"28+64=92",
-"28+65=93",
-"28+66=94",
-"28+67=95",
-"28+68=96",
-"28+69=97",
-"28+70=98",
-"28+71=99",
-"28-10=18",
-"28-11=17",
-"28-12=16",
-"28-13=15",
-"28-14=14",
-"28-15=13",
-"28-16=12",
-"28-17=11",
-"28-18=10",
-"28-29=-1",
-"28-30=-2",
-"28-31=-3",
-"28-32=-4",
-"28-33=-5",
-"28-34=-6",
-"28-35=-7",
-"28-36=-8",
-"28-37=-9",
-"28-3*7=7",
-"28-3*8=4",
-"28-3*9=1",
-"28-4*5=8",
-"28-4*6=4",
-"28-4*7=0",
-"28-5*4=8",
-"28-5*5=3",
-"28-6*4=4",
-"28-7*3=7",
-"28-7*4=0",
-"28-8*3=4",
-"28-9*3=1",
-"28*0+0=0",
-"28*0+1=1",
-"28*0+2=2",
-"28*0+3=3",
-"28*0+4=4",
-"28*0+5=5",
-"28*0+6=6",
-"28*0+7=7",
-"28*0+8=8",
-"28*0+9=9",
-"28*0-0=0",
-"28*0*0=0",
-"28*0*1=0",
-"28*0*2=0",
-"28*0*3=0",
-"28*0*4=0",
-"28*0*5=0",
-"28*0*6=0",
-"28*0*7=0",
-"28*0*8=0",
-"28*0*9=0",
-"28*0/1=0",
-"28*0/2=0",
-"28*0/3=0",
-"28*0/4=0",
-"28*0/5=0",
-"28*0/6=0",
-"28*0/7=0",
-"28*0/8=0",
-"28*0/9=0",
-"28*1*0=0",
-"28*1/4=7",
-"28*1/7=4",
-"28*2*0=0",
-"28*2/7=8",
-"28*2/8=7",
-"28*3*0=0",
-"28*4*0=0",
-"28*4=112",
-"28*5*0=0",
-"28*5=140",
-"28*6*0=0",
-"28*6=168",
-"28*7*0=0",
-"28*7=196",
-"28*8*0=0",
-"28*8=224",
-"28*9*0=0",
-"28*9=252",
-"28/1*0=0",
-"28/1/4=7",
-"28/1/7=4",
-"28/2-5=9",
-"28/2-6=8",
-"28/2-7=7",
-"28/2-8=6",
-"28/2-9=5",
-"28/2*0=0",
-"28/2/2=7",
-"28/2/7=2",
-"28/3*0=0",
-"28/4+0=7",
-"28/4+1=8",
-"28/4+2=9",
-"28/4-0=7",
-"28/4-1=6",
-"28/4-2=5",
-"28/4-3=4",
-"28/4-4=3",
-"28/4-5=2",
-"28/4-6=1",
-"28/4-7=0",
-"28/4*0=0",
-"28/4*1=7",
-"28/4/1=7",
-"28/4/7=1",
-"28/5*0=0",
-"28/6*0=0",
-"28/7+0=4",
-"28/7+1=5",
-"28/7+2=6",
-"28/7+3=7",
-"28/7+4=8",
-"28/7+5=9",
-"28/7-0=4",
-"28/7-1=3",
-"28/7-2=2",
-"28/7-3=1",
-"28/7-4=0",
-"28/7*0=0",
-"28/7*1=4",
-"28/7*2=8",
-"28/7/1=4",
-"28/7/2=2",
-"28/7/4=1",
-"28/8*0=0",
-"28/8*2=7",
-"28/9*0=0",
-"2900*0=0",
-"2901*0=0",
-"2902*0=0",
-"2903*0=0",
-"2904*0=0",
-"2905*0=0",
-"2906*0=0",
-"2907*0=0",
-"2908*0=0",
-"2909*0=0",
-"290/58=5",
-"290/5=58",
-"2910*0=0",
-"2911*0=0",
-"2912*0=0",
-"2913*0=0",
-"2914*0=0",
-"2915*0=0",
-"2916*0=0",
-"2917*0=0",
-"2918*0=0",
-"2919*0=0",
-"291/3=97",
-"291/97=3",
-"2920*0=0",
-"2921*0=0",
-"2922*0=0",
-"2923*0=0",
-"2924*0=0",
-"2925*0=0",
-"2926*0=0",
-"2927*0=0",
-"2928*0=0",
-"2929*0=0",
-"292/4=73",
-"292/73=4",
-"2930*0=0",
-"2931*0=0",
-"2932*0=0",
-"2933*0=0",
-"2934*0=0",
-"2935*0=0",
-"2936*0=0",
-"2937*0=0",
-"2938*0=0",
-"2939*0=0",
-"2940*0=0",
-"2941*0=0",
-"2942*0=0",
-"2943*0=0",
-"2944*0=0",
-"2945*0=0",
-"2946*0=0",
-"2947*0=0",
-"2948*0=0",
-"2949*0=0",
-"294/3=98",
-"294/42=7",
-"294/49=6",
-"294/6=49",
-"294/7=42",
-"294/98=3",
-"2950*0=0",
-"2951*0=0",
-"2952*0=0",
-"2953*0=0",
-"2954*0=0",
-"2955*0=0",
-"2956*0=0",
-"2957*0=0",
-"2958*0=0",
-"2959*0=0",
-"295/59=5",
-"295/5=59",
-"2960*0=0",
-"2961*0=0",
-"2962*0=0",
-"2963*0=0",
-"2964*0=0",
-"2965*0=0",
-"2966*0=0",
-"2967*0=0",
-"2968*0=0",
-"2969*0=0",
-"296/37=8",
-"296/4=74",
-"296/74=4",
-"296/8=37",
-"2970*0=0",
-"2971*0=0",
-"2972*0=0",
-"2973*0=0",
-"2974*0=0",
-"2975*0=0",
-"2976*0=0",
-"2977*0=0",
-"2978*0=0",
-"2979*0=0",
-"297/33=9",
-"297/3=99",
-"297/99=3",
-"297/9=33",
-"2980*0=0",
-"2981*0=0",
-"2982*0=0",
-"2983*0=0",
-"2984*0=0",
-"2985*0=0",
-"2986*0=0",
-"2987*0=0",
-"2988*0=0",
-"2989*0=0",
-"2990*0=0",
-"2991*0=0",
-"2992*0=0",
-"2993*0=0",
-"2994*0=0",
-"2995*0=0",
-"2996*0=0",
-"2997*0=0",
-"2998*0=0",
-"2999*0=0",
-"29+10=39",
-"29+11=40",
-"29+12=41",
-"29+13=42",
-"29+14=43",
-"29+15=44",
-"29+16=45",
-"29+17=46",
-"29+18=47",
-"29+19=48",
-"29+20=49",
-"29+21=50",
-"29+22=51",
-"29+23=52",
-"29+24=53",
-"29+25=54",
-"29+26=55",
-"29+27=56",
-"29+28=57",
-"29+29=58",
-"29+30=59",
-"29+31=60",
-"29+32=61",
-"29+33=62",
-"29+34=63",
-"29+35=64",
-"29+36=65",
-"29+37=66",
-"29+38=67",
-"29+39=68",
-"29+40=69",
-"29+41=70",
-"29+42=71",
-"29+43=72",
-"29+44=73",
-"29+45=74",
-"29+46=75",
-"29+47=76",
-"29+48=77",
-"29+49=78",
-"29+50=79",
-"29+51=80",
-"29+52=81",
-"29+53=82",
-"29+54=83",
-"29+55=84",
-"29+56=85",
-"29+57=86",
-"29+58=87",
-"29+59=88",
-"29+60=89",
-"29+61=90",
-"29+62=91",
-"29+63=92",
-"29+64=93",
-"29+65=94",
-"29+66=95",
-"29+67=96",
-"29+68=97",
-"29+69=98",
-"29+70=99",
-"29-10=19",
-"29-11=18",
-"29-12=17",
-"29-13=16",
-"29-14=15",
-"29-15=14",
-"29-16=13",
-"29-17=12",
-"29-18=11",
-"29-19=10",
-"29-30=-1",
-"29-31=-2",
-"29-32=-3",
-"29-33=-4",
-"29-34=-5",
-"29-35=-6",
-"29-36=-7",
-"29-37=-8",
-"29-38=-9",
-"29-3*7=8",
-"29-3*8=5",
-"29-3*9=2",
-"29-4*5=9",
-"29-4*6=5",
-"29-4*7=1",
-"29-5*4=9",
-"29-5*5=4",
-"29-6*4=5",
-"29-7*3=8",
-"29-7*4=1",
-"29-8*3=5",
-"29-9*3=2",
-"29*0+0=0",
-"29*0+1=1",
-"29*0+2=2",
-"29*0+3=3",
-"29*0+4=4",
-"29*0+5=5",
-"29*0+6=6",
-"29*0+7=7",
-"29*0+8=8",
-"29*0+9=9",
-"29*0-0=0",
-"29*0*0=0",
-"29*0*1=0",
-"29*0*2=0",
-"29*0*3=0",
-"29*0*4=0",
-"29*0*5=0",
-"29*0*6=0",
-"29*0*7=0",
-"29*0*8=0",
-"29*0*9=0",
-"29*0/1=0",
-"29*0/2=0",
-"29*0/3=0",
-"29*0/4=0",
-"29*0/5=0",
-"29*0/6=0",
-"29*0/7=0",
-"29*0/8=0",
-"29*0/9=0",
-"29*1*0=0",
-"29*2*0=0",
-"29*3*0=0",
-"29*4*0=0",
-"29*4=116",
-"29*5*0=0",
-"29*5=145",
-"29*6*0=0",
-"29*6=174",
-"29*7*0=0",
-"29*7=203",
-"29*8*0=0",
-"29*8=232",
-"29*9*0=0",
-"29*9=261",
-"29/1*0=0",
-"29/2*0=0",
-"29/3*0=0",
-"29/4*0=0",
-"29/5*0=0",
-"29/6*0=0",
-"29/7*0=0",
-"29/8*0=0",
-"29/9*0=0",
-"2+0+8=10",
-"2+0+9=11",
-"2+0-3=-1",
-"2+0-4=-2",
-"2+0-5=-3",
-"2+0-6=-4",
-"2+0-7=-5",
-"2+0-8=-6",
-"2+0-9=-7",
-"2+0*10=2",
-"2+0*11=2",
-"2+0*12=2",
-"2+0*13=2",
-"2+0*14=2",
-"2+0*15=2",
-"2+0*16=2",
-"2+0*17=2",
-"2+0*18=2",
-"2+0*19=2",
-"2+0*20=2",
-"2+0*21=2",
-"2+0*22=2",
-"2+0*23=2",
-"2+0*24=2",
-"2+0*25=2",
-"2+0*26=2",
-"2+0*27=2",
-"2+0*28=2",
-"2+0*29=2",
-"2+0*30=2",
-"2+0*31=2",
-"2+0*32=2",
-"2+0*33=2",
-"2+0*34=2",
-"2+0*35=2",
-"2+0*36=2",
-"2+0*37=2",
-"2+0*38=2",
-"2+0*39=2",
-"2+0*40=2",
-"2+0*41=2",
-"2+0*42=2",
-"2+0*43=2",
-"2+0*44=2",
-"2+0*45=2",
-"2+0*46=2",
-"2+0*47=2",
-"2+0*48=2",
-"2+0*49=2",
-"2+0*50=2",
-"2+0*51=2",
-"2+0*52=2",
-"2+0*53=2",
-"2+0*54=2",
-"2+0*55=2",
-"2+0*56=2",
-"2+0*57=2",
-"2+0*58=2",
-"2+0*59=2",
-"2+0*60=2",
-"2+0*61=2",
-"2+0*62=2",
-"2+0*63=2",
-"2+0*64=2",
-"2+0*65=2",
-"2+0*66=2",
-"2+0*67=2",
-"2+0*68=2",
-"2+0*69=2",
-"2+0*70=2",
-"2+0*71=2",
-"2+0*72=2",
-"2+0*73=2",
-"2+0*74=2",
-"2+0*75=2",
-"2+0*76=2",
-"2+0*77=2",
-"2+0*78=2",
-"2+0*79=2",
-"2+0*80=2",
-"2+0*81=2",
-"2+0*82=2",
-"2+0*83=2",
-"2+0*84=2",
-"2+0*85=2",
-"2+0*86=2",
-"2+0*87=2",
-"2+0*88=2",
-"2+0*89=2",
-"2+0*90=2",
-"2+0*91=2",
-"2+0*92=2",
-"2+0*93=2",
-"2+0*94=2",
-"2+0*95=2",
-"2+0*96=2",
-"2+0*97=2",
-"2+0*98=2",
-"2+0*99=2",
-"2+0/10=2",
-"2+0/11=2",
-"2+0/12=2",
-"2+0/13=2",
-"2+0/14=2",
-"2+0/15=2",
-"2+0/16=2",
-"2+0/17=2",
-"2+0/18=2",
-"2+0/19=2",
-"2+0/20=2",
-"2+0/21=2",
-"2+0/22=2",
-"2+0/23=2",
-"2+0/24=2",
-"2+0/25=2",
-"2+0/26=2",
-"2+0/27=2",
-"2+0/28=2",
-"2+0/29=2",
-"2+0/30=2",
-"2+0/31=2",
-"2+0/32=2",
-"2+0/33=2",
-"2+0/34=2",
-"2+0/35=2",
-"2+0/36=2",
-"2+0/37=2",
-"2+0/38=2",
-"2+0/39=2",
-"2+0/40=2",
-"2+0/41=2",
-"2+0/42=2",
-"2+0/43=2",
-"2+0/44=2",
-"2+0/45=2",
-"2+0/46=2",
-"2+0/47=2",
-"2+0/48=2",
-"2+0/49=2",
-"2+0/50=2",
-"2+0/51=2",
-"2+0/52=2",
-"2+0/53=2",
-"2+0/54=2",
-"2+0/55=2",
-"2+0/56=2",
-"2+0/57=2",
-"2+0/58=2",
-"2+0/59=2",
-"2+0/60=2",
-"2+0/61=2",
-"2+0/62=2",
-"2+0/63=2",
-"2+0/64=2",
-"2+0/65=2",
-"2+0/66=2",
-"2+0/67=2",
-"2+0/68=2",
-"2+0/69=2",
-"2+0/70=2",
-"2+0/71=2",
-"2+0/72=2",
-"2+0/73=2",
-"2+0/74=2",
-"2+0/75=2",
-"2+0/76=2",
-"2+0/77=2",
-"2+0/78=2",
-"2+0/79=2",
-"2+0/80=2",
-"2+0/81=2",
-"2+0/82=2",
-"2+0/83=2",
-"2+0/84=2",
-"2+0/85=2",
-"2+0/86=2",
-"2+0/87=2",
-"2+0/88=2",
-"2+0/89=2",
-"2+0/90=2",
-"2+0/91=2",
-"2+0/92=2",
-"2+0/93=2",
-"2+0/94=2",
-"2+0/95=2",
-"2+0/96=2",
-"2+0/97=2",
-"2+0/98=2",
-"2+0/99=2",
-"2+10-3=9",
-"2+10-4=8",
-"2+10-5=7",
-"2+10-6=6",
-"2+10-7=5",
-"2+10-8=4",
-"2+10-9=3",
-"2+10*0=2",
-"2+10/2=7",
-"2+10/5=4",
-"2+11-4=9",
-"2+11-5=8",
-"2+11-6=7",
-"2+11-7=6",
-"2+11-8=5",
-"2+11-9=4",
-"2+11*0=2",
-"2+12-5=9",
-"2+12-6=8",
-"2+12-7=7",
-"2+12-8=6",
-"2+12-9=5",
-"2+12*0=2",
-"2+12/2=8",
-"2+12/3=6",
-"2+12/4=5",
-"2+12/6=4",
-"2+13-6=9",
-"2+13-7=8",
-"2+13-8=7",
-"2+13-9=6",
-"2+13*0=2",
-"2+14-7=9",
-"2+14-8=8",
-"2+14-9=7",
-"2+14*0=2",
-"2+14/2=9",
-"2+14/7=4",
-"2+15-8=9",
-"2+15-9=8",
-"2+15*0=2",
-"2+15/3=7",
-"2+15/5=5",
-"2+16-9=9",
-"2+16*0=2",
-"2+16/4=6",
-"2+16/8=4",
-"2+17*0=2",
-"2+18*0=2",
-"2+18/3=8",
-"2+18/6=5",
-"2+18/9=4",
-"2+19*0=2",
-"2+1+7=10",
-"2+1+8=11",
-"2+1+9=12",
-"2+1-4=-1",
-"2+1-5=-2",
-"2+1-6=-3",
-"2+1-7=-4",
-"2+1-8=-5",
-"2+1-9=-6",
-"2+1*8=10",
-"2+1*9=11",
-"2+20*0=2",
-"2+20/4=7",
-"2+20/5=6",
-"2+21*0=2",
-"2+21/3=9",
-"2+21/7=5",
-"2+22*0=2",
-"2+23*0=2",
-"2+24*0=2",
-"2+24/4=8",
-"2+24/6=6",
-"2+24/8=5",
-"2+25*0=2",
-"2+25/5=7",
-"2+26*0=2",
-"2+27*0=2",
-"2+27/9=5",
-"2+28*0=2",
-"2+28/4=9",
-"2+28/7=6",
-"2+29*0=2",
-"2+2+6=10",
-"2+2+7=11",
-"2+2+8=12",
-"2+2+9=13",
-"2+2-5=-1",
-"2+2-6=-2",
-"2+2-7=-3",
-"2+2-8=-4",
-"2+2-9=-5",
-"2+2*4=10",
-"2+2*5=12",
-"2+2*6=14",
-"2+2*7=16",
-"2+2*8=18",
-"2+2*9=20",
-"2+30*0=2",
-"2+30/5=8",
-"2+30/6=7",
-"2+31*0=2",
-"2+32*0=2",
-"2+32/8=6",
-"2+33*0=2",
-"2+34*0=2",
-"2+35*0=2",
-"2+35/5=9",
-"2+35/7=7",
-"2+36*0=2",
-"2+36/6=8",
-"2+36/9=6",
-"2+37*0=2",
-"2+38*0=2",
-"2+39*0=2",
-"2+3+5=10",
-"2+3+6=11",
-"2+3+7=12",
-"2+3+8=13",
-"2+3+9=14",
-"2+3-6=-1",
-"2+3-7=-2",
-"2+3-8=-3",
-"2+3-9=-4",
-"2+3*3=11",
-"2+3*4=14",
-"2+3*5=17",
-"2+3*6=20",
-"2+3*7=23",
-"2+3*8=26",
-"2+3*9=29",
-"2+40*0=2",
-"2+40/8=7",
-"2+41*0=2",
-"2+42*0=2",
-"2+42/6=9",
-"2+42/7=8",
-"2+43*0=2",
-"2+44*0=2",
-"2+45*0=2",
-"2+45/9=7",
-"2+46*0=2",
-"2+47*0=2",
-"2+48*0=2",
-"2+48/8=8",
-"2+49*0=2",
-"2+49/7=9",
-"2+4+4=10",
-"2+4+5=11",
-"2+4+6=12",
-"2+4+7=13",
-"2+4+8=14",
-"2+4+9=15",
-"2+4-7=-1",
-"2+4-8=-2",
-"2+4-9=-3",
-"2+4*2=10",
-"2+4*3=14",
-"2+4*4=18",
-"2+4*5=22",
-"2+4*6=26",
-"2+4*7=30",
-"2+4*8=34",
-"2+4*9=38",
-"2+50*0=2",
-"2+51*0=2",
-"2+52*0=2",
-"2+53*0=2",
-"2+54*0=2",
-"2+54/9=8",
-"2+55*0=2",
-"2+56*0=2",
-"2+56/8=9",
-"2+57*0=2",
-"2+58*0=2",
-"2+59*0=2",
-"2+5+3=10",
-"2+5+4=11",
-"2+5+5=12",
-"2+5+6=13",
-"2+5+7=14",
-"2+5+8=15",
-"2+5+9=16",
-"2+5-8=-1",
-"2+5-9=-2",
-"2+5*2=12",
-"2+5*3=17",
-"2+5*4=22",
-"2+5*5=27",
-"2+5*6=32",
-"2+5*7=37",
-"2+5*8=42",
-"2+5*9=47",
-"2+60*0=2",
-"2+61*0=2",
-"2+62*0=2",
-"2+63*0=2",
-"2+63/9=9",
-"2+64*0=2",
-"2+65*0=2",
-"2+66*0=2",
-"2+67*0=2",
-"2+68*0=2",
-"2+69*0=2",
-"2+6+2=10",
-"2+6+3=11",
-"2+6+4=12",
-"2+6+5=13",
-"2+6+6=14",
-"2+6+7=15",
-"2+6+8=16",
-"2+6+9=17",
-"2+6-9=-1",
-"2+6*2=14",
-"2+6*3=20",
-"2+6*4=26",
-"2+6*5=32",
-"2+6*6=38",
-"2+6*7=44",
-"2+6*8=50",
-"2+6*9=56",
-"2+70*0=2",
-"2+71*0=2",
-"2+72*0=2",
-"2+73*0=2",
-"2+74*0=2",
-"2+75*0=2",
-"2+76*0=2",
-"2+77*0=2",
-"2+78*0=2",
-"2+79*0=2",
-"2+7+1=10",
-"2+7+2=11",
-"2+7+3=12",
-"2+7+4=13",
-"2+7+5=14",
-"2+7+6=15",
-"2+7+7=16",
-"2+7+8=17",
-"2+7+9=18",
-"2+7*2=16",
-"2+7*3=23",
-"2+7*4=30",
-"2+7*5=37",
-"2+7*6=44",
-"2+7*7=51",
-"2+7*8=58",
-"2+7*9=65",
-"2+80*0=2",
-"2+81*0=2",
-"2+82*0=2",
-"2+83*0=2",
-"2+84*0=2",
-"2+85*0=2",
-"2+86*0=2",
-"2+87*0=2",
-"2+88*0=2",
-"2+89*0=2",
-"2+8+0=10",
-"2+8+1=11",
-"2+8+2=12",
-"2+8+3=13",
-"2+8+4=14",
-"2+8+5=15",
-"2+8+6=16",
-"2+8+7=17",
-"2+8+8=18",
-"2+8+9=19",
-"2+8-0=10",
-"2+8-10=0",
-"2+8*1=10",
-"2+8*2=18",
-"2+8*3=26",
-"2+8*4=34",
-"2+8*5=42",
-"2+8*6=50",
-"2+8*7=58",
-"2+8*8=66",
-"2+8*9=74",
-"2+8/1=10",
-"2+90*0=2",
-"2+91*0=2",
-"2+92*0=2",
-"2+93*0=2",
-"2+94*0=2",
-"2+95*0=2",
-"2+96*0=2",
-"2+97*0=2",
-"2+98*0=2",
-"2+98=100",
-"2+99*0=2",
-"2+99=101",
-"2+9+0=11",
-"2+9+1=12",
-"2+9+2=13",
-"2+9+3=14",
-"2+9+4=15",
-"2+9+5=16",
-"2+9+6=17",
-"2+9+7=18",
-"2+9+8=19",
-"2+9+9=20",
-"2+9-0=11",
-"2+9-10=1",
-"2+9-11=0",
-"2+9-1=10",
-"2+9*1=11",
-"2+9*2=20",
-"2+9*3=29",
-"2+9*4=38",
-"2+9*5=47",
-"2+9*6=56",
-"2+9*7=65",
-"2+9*8=74",
-"2+9*9=83",
-"2+9/1=11",
-"2-0+8=10",
-"2-0+9=11",
-"2-0-3=-1",
-"2-0-4=-2",
-"2-0-5=-3",
-"2-0-6=-4",
-"2-0-7=-5",
-"2-0-8=-6",
-"2-0-9=-7",
-"2-0*10=2",
-"2-0*11=2",
-"2-0*12=2",
-"2-0*13=2",
-"2-0*14=2",
-"2-0*15=2",
-"2-0*16=2",
-"2-0*17=2",
-"2-0*18=2",
-"2-0*19=2",
-"2-0*20=2",
-"2-0*21=2",
-"2-0*22=2",
-"2-0*23=2",
-"2-0*24=2",
-"2-0*25=2",
-"2-0*26=2",
-"2-0*27=2",
-"2-0*28=2",
-"2-0*29=2",
-"2-0*30=2",
-"2-0*31=2",
-"2-0*32=2",
-"2-0*33=2",
-"2-0*34=2",
-"2-0*35=2",
-"2-0*36=2",
-"2-0*37=2",
-"2-0*38=2",
-"2-0*39=2",
-"2-0*40=2",
-"2-0*41=2",
-"2-0*42=2",
-"2-0*43=2",
-"2-0*44=2",
-"2-0*45=2",
-"2-0*46=2",
-"2-0*47=2",
-"2-0*48=2",
-"2-0*49=2",
-"2-0*50=2",
-"2-0*51=2",
-"2-0*52=2",
-"2-0*53=2",
-"2-0*54=2",
-"2-0*55=2",
-"2-0*56=2",
-"2-0*57=2",
-"2-0*58=2",
-"2-0*59=2",
-"2-0*60=2",
-"2-0*61=2",
-"2-0*62=2",
-"2-0*63=2",
-"2-0*64=2",
-"2-0*65=2",
-"2-0*66=2",
-"2-0*67=2",
-"2-0*68=2",
-"2-0*69=2",
-"2-0*70=2",
-"2-0*71=2",
-"2-0*72=2",
-"2-0*73=2",
-"2-0*74=2",
-"2-0*75=2",
-"2-0*76=2",
-"2-0*77=2",
-"2-0*78=2",
-"2-0*79=2",
-"2-0*80=2",
-"2-0*81=2",
-"2-0*82=2",
-"2-0*83=2",
-"2-0*84=2",
-"2-0*85=2",
-"2-0*86=2",
-"2-0*87=2",
-"2-0*88=2",
-"2-0*89=2",
-"2-0*90=2",
-"2-0*91=2",
-"2-0*92=2",
-"2-0*93=2",
-"2-0*94=2",
-"2-0*95=2",
-"2-0*96=2",
-"2-0*97=2",
-"2-0*98=2",
-"2-0*99=2",
-"2-0/10=2",
-"2-0/11=2",
-"2-0/12=2",
-"2-0/13=2",
-"2-0/14=2",
-"2-0/15=2",
-"2-0/16=2",
-"2-0/17=2",
-"2-0/18=2",
-"2-0/19=2",
-"2-0/20=2",
-"2-0/21=2",
-"2-0/22=2",
-"2-0/23=2",
-"2-0/24=2",
-"2-0/25=2",
-"2-0/26=2",
-"2-0/27=2",
-"2-0/28=2",
-"2-0/29=2",
-"2-0/30=2",
-"2-0/31=2",
-"2-0/32=2",
-"2-0/33=2",
-"2-0/34=2",
-"2-0/35=2",
-"2-0/36=2",
-"2-0/37=2",
-"2-0/38=2",
-"2-0/39=2",
-"2-0/40=2",
-"2-0/41=2",
-"2-0/42=2",
-"2-0/43=2",
-"2-0/44=2",
-"2-0/45=2",
-"2-0/46=2",
-"2-0/47=2",
-"2-0/48=2",
-"2-0/49=2",
-"2-0/50=2",
-"2-0/51=2",
-"2-0/52=2",
-"2-0/53=2",
-"2-0/54=2",
-"2-0/55=2",
-"2-0/56=2",
-"2-0/57=2",
-"2-0/58=2",
-"2-0/59=2",
-"2-0/60=2",
-"2-0/61=2",
-"2-0/62=2",
-"2-0/63=2",
-"2-0/64=2",
-"2-0/65=2",
-"2-0/66=2",
-"2-0/67=2",
-"2-0/68=2",
-"2-0/69=2",
-"2-0/70=2",
-"2-0/71=2",
-"2-0/72=2",
-"2-0/73=2",
-"2-0/74=2",
-"2-0/75=2",
-"2-0/76=2",
-"2-0/77=2",
-"2-0/78=2",
-"2-0/79=2",
-"2-0/80=2",
-"2-0/81=2",
-"2-0/82=2",
-"2-0/83=2",
-"2-0/84=2",
-"2-0/85=2",
-"2-0/86=2",
-"2-0/87=2",
-"2-0/88=2",
-"2-0/89=2",
-"2-0/90=2",
-"2-0/91=2",
-"2-0/92=2",
-"2-0/93=2",
-"2-0/94=2",
-"2-0/95=2",
-"2-0/96=2",
-"2-0/97=2",
-"2-0/98=2",
-"2-0/99=2",
-"2-10+8=0",
-"2-10+9=1",
-"2-10*0=2",
-"2-10/5=0",
-"2-11+9=0",
-"2-11*0=2",
-"2-12*0=2",
-"2-12/6=0",
-"2-12=-10",
-"2-13*0=2",
-"2-13=-11",
-"2-14*0=2",
-"2-14/7=0",
-"2-14=-12",
-"2-15*0=2",
-"2-15=-13",
-"2-16*0=2",
-"2-16/8=0",
-"2-16=-14",
-"2-17*0=2",
-"2-17=-15",
-"2-18*0=2",
-"2-18/9=0",
-"2-18=-16",
-"2-19*0=2",
-"2-19=-17",
-"2-1+9=10",
-"2-1-2=-1",
-"2-1-3=-2",
-"2-1-4=-3",
-"2-1-5=-4",
-"2-1-6=-5",
-"2-1-7=-6",
-"2-1-8=-7",
-"2-1-9=-8",
-"2-1*3=-1",
-"2-1*4=-2",
-"2-1*5=-3",
-"2-1*6=-4",
-"2-1*7=-5",
-"2-1*8=-6",
-"2-1*9=-7",
-"2-20*0=2",
-"2-20=-18",
-"2-21*0=2",
-"2-21=-19",
-"2-22*0=2",
-"2-22=-20",
-"2-23*0=2",
-"2-23=-21",
-"2-24*0=2",
-"2-24=-22",
-"2-25*0=2",
-"2-25=-23",
-"2-26*0=2",
-"2-26=-24",
-"2-27*0=2",
-"2-27=-25",
-"2-28*0=2",
-"2-28=-26",
-"2-29*0=2",
-"2-29=-27",
-"2-2-1=-1",
-"2-2-2=-2",
-"2-2-3=-3",
-"2-2-4=-4",
-"2-2-5=-5",
-"2-2-6=-6",
-"2-2-7=-7",
-"2-2-8=-8",
-"2-2-9=-9",
-"2-2*2=-2",
-"2-2*3=-4",
-"2-2*4=-6",
-"2-2*5=-8",
-"2-30*0=2",
-"2-30=-28",
-"2-31*0=2",
-"2-31=-29",
-"2-32*0=2",
-"2-32=-30",
-"2-33*0=2",
-"2-33=-31",
-"2-34*0=2",
-"2-34=-32",
-"2-35*0=2",
-"2-35=-33",
-"2-36*0=2",
-"2-36=-34",
-"2-37*0=2",
-"2-37=-35",
-"2-38*0=2",
-"2-38=-36",
-"2-39*0=2",
-"2-39=-37",
-"2-3+0=-1",
-"2-3+10=9",
-"2-3-0=-1",
-"2-3-1=-2",
-"2-3-2=-3",
-"2-3-3=-4",
-"2-3-4=-5",
-"2-3-5=-6",
-"2-3-6=-7",
-"2-3-7=-8",
-"2-3-8=-9",
-"2-3*1=-1",
-"2-3*2=-4",
-"2-3*3=-7",
-"2-3/1=-1",
-"2-40*0=2",
-"2-40=-38",
-"2-41*0=2",
-"2-41=-39",
-"2-42*0=2",
-"2-42=-40",
-"2-43*0=2",
-"2-43=-41",
-"2-44*0=2",
-"2-44=-42",
-"2-45*0=2",
-"2-45=-43",
-"2-46*0=2",
-"2-46=-44",
-"2-47*0=2",
-"2-47=-45",
-"2-48*0=2",
-"2-48=-46",
-"2-49*0=2",
-"2-49=-47",
-"2-4+0=-2",
-"2-4+10=8",
-"2-4+11=9",
-"2-4+1=-1",
-"2-4-0=-2",
-"2-4-1=-3",
-"2-4-2=-4",
-"2-4-3=-5",
-"2-4-4=-6",
-"2-4-5=-7",
-"2-4-6=-8",
-"2-4-7=-9",
-"2-4*1=-2",
-"2-4*2=-6",
-"2-4/1=-2",
-"2-50*0=2",
-"2-50=-48",
-"2-51*0=2",
-"2-51=-49",
-"2-52*0=2",
-"2-52=-50",
-"2-53*0=2",
-"2-53=-51",
-"2-54*0=2",
-"2-54=-52",
-"2-55*0=2",
-"2-55=-53",
-"2-56*0=2",
-"2-56=-54",
-"2-57*0=2",
-"2-57=-55",
-"2-58*0=2",
-"2-58=-56",
-"2-59*0=2",
-"2-59=-57",
-"2-5+0=-3",
-"2-5+10=7",
-"2-5+11=8",
-"2-5+12=9",
-"2-5+1=-2",
-"2-5+2=-1",
-"2-5-0=-3",
-"2-5-1=-4",
-"2-5-2=-5",
-"2-5-3=-6",
-"2-5-4=-7",
-"2-5-5=-8",
-"2-5-6=-9",
-"2-5*1=-3",
-"2-5*2=-8",
-"2-5/1=-3",
-"2-60*0=2",
-"2-60=-58",
-"2-61*0=2",
-"2-61=-59",
-"2-62*0=2",
-"2-62=-60",
-"2-63*0=2",
-"2-63=-61",
-"2-64*0=2",
-"2-64=-62",
-"2-65*0=2",
-"2-65=-63",
-"2-66*0=2",
-"2-66=-64",
-"2-67*0=2",
-"2-67=-65",
-"2-68*0=2",
-"2-68=-66",
-"2-69*0=2",
-"2-69=-67",
-"2-6+0=-4",
-"2-6+10=6",
-"2-6+11=7",
-"2-6+12=8",
-"2-6+13=9",
-"2-6+1=-3",
-"2-6+2=-2",
-"2-6+3=-1",
-"2-6-0=-4",
-"2-6-1=-5",
-"2-6-2=-6",
-"2-6-3=-7",
-"2-6-4=-8",
-"2-6-5=-9",
-"2-6*1=-4",
-"2-6/1=-4",
-"2-6/2=-1",
-"2-70*0=2",
-"2-70=-68",
-"2-71*0=2",
-"2-71=-69",
-"2-72*0=2",
-"2-72=-70",
-"2-73*0=2",
-"2-73=-71",
-"2-74*0=2",
-"2-74=-72",
-"2-75*0=2",
-"2-75=-73",
-"2-76*0=2",
-"2-76=-74",
-"2-77*0=2",
-"2-77=-75",
-"2-78*0=2",
-"2-78=-76",
-"2-79*0=2",
-"2-79=-77",
-"2-7+0=-5",
-"2-7+10=5",
-"2-7+11=6",
-"2-7+12=7",
-"2-7+13=8",
-"2-7+14=9",
-"2-7+1=-4",
-"2-7+2=-3",
-"2-7+3=-2",
-"2-7+4=-1",
-"2-7-0=-5",
-"2-7-1=-6",
-"2-7-2=-7",
-"2-7-3=-8",
-"2-7-4=-9",
-"2-7*1=-5",
-"2-7/1=-5",
-"2-80*0=2",
-"2-80=-78",
-"2-81*0=2",
-"2-81=-79",
-"2-82*0=2",
-"2-82=-80",
-"2-83*0=2",
-"2-83=-81",
-"2-84*0=2",
-"2-84=-82",
-"2-85*0=2",
-"2-85=-83",
-"2-86*0=2",
-"2-86=-84",
-"2-87*0=2",
-"2-87=-85",
-"2-88*0=2",
-"2-88=-86",
-"2-89*0=2",
-"2-89=-87",
-"2-8+0=-6",
-"2-8+10=4",
-"2-8+11=5",
-"2-8+12=6",
-"2-8+13=7",
-"2-8+14=8",
-"2-8+15=9",
-"2-8+1=-5",
-"2-8+2=-4",
-"2-8+3=-3",
-"2-8+4=-2",
-"2-8+5=-1",
-"2-8-0=-6",
-"2-8-1=-7",
-"2-8-2=-8",
-"2-8-3=-9",
-"2-8*1=-6",
-"2-8/1=-6",
-"2-8/2=-2",
-"2-90*0=2",
-"2-90=-88",
-"2-91*0=2",
-"2-91=-89",
-"2-92*0=2",
-"2-92=-90",
-"2-93*0=2",
-"2-93=-91",
-"2-94*0=2",
-"2-94=-92",
-"2-95*0=2",
-"2-95=-93",
-"2-96*0=2",
-"2-96=-94",
-"2-97*0=2",
-"2-97=-95",
-"2-98*0=2",
-"2-98=-96",
-"2-99*0=2",
-"2-99=-97",
-"2-9+0=-7",
-"2-9+10=3",
-"2-9+11=4",
-"2-9+12=5",
-"2-9+13=6",
-"2-9+14=7",
-"2-9+15=8",
-"2-9+16=9",
-"2-9+1=-6",
-"2-9+2=-5",
-"2-9+3=-4",
-"2-9+4=-3",
-"2-9+5=-2",
-"2-9+6=-1",
-"2-9-0=-7",
-"2-9-1=-8",
-"2-9-2=-9",
-"2-9*1=-7",
-"2-9/1=-7",
-"2-9/3=-1",
-"2*0-1=-1",
-"2*0-2=-2",
-"2*0-3=-3",
-"2*0-4=-4",
-"2*0-5=-5",
-"2*0-6=-6",
-"2*0-7=-7",
-"2*0-8=-8",
-"2*0-9=-9",
-"2*0*10=0",
-"2*0*11=0",
-"2*0*12=0",
-"2*0*13=0",
-"2*0*14=0",
-"2*0*15=0",
-"2*0*16=0",
-"2*0*17=0",
-"2*0*18=0",
-"2*0*19=0",
-"2*0*20=0",
-"2*0*21=0",
-"2*0*22=0",
-"2*0*23=0",
-"2*0*24=0",
-"2*0*25=0",
-"2*0*26=0",
-"2*0*27=0",
-"2*0*28=0",
-"2*0*29=0",
-"2*0*30=0",
-"2*0*31=0",
-"2*0*32=0",
-"2*0*33=0",
-"2*0*34=0",
-"2*0*35=0",
-"2*0*36=0",
-"2*0*37=0",
-"2*0*38=0",
-"2*0*39=0",
-"2*0*40=0",
-"2*0*41=0",
-"2*0*42=0",
-"2*0*43=0",
-"2*0*44=0",
-"2*0*45=0",
-"2*0*46=0",
-"2*0*47=0",
-"2*0*48=0",
-"2*0*49=0",
-"2*0*50=0",
-"2*0*51=0",
-"2*0*52=0",
-"2*0*53=0",
-"2*0*54=0",
-"2*0*55=0",
-"2*0*56=0",
-"2*0*57=0",
-"2*0*58=0",
-"2*0*59=0",
-"2*0*60=0",
-"2*0*61=0",
-"2*0*62=0",
-"2*0*63=0",
-"2*0*64=0",
-"2*0*65=0",
-"2*0*66=0",
-"2*0*67=0",
-"2*0*68=0",
-"2*0*69=0",
-"2*0*70=0",
-"2*0*71=0",
-"2*0*72=0",
-"2*0*73=0",
-"2*0*74=0",
-"2*0*75=0",
-"2*0*76=0",
-"2*0*77=0",
-"2*0*78=0",
-"2*0*79=0",
-"2*0*80=0",
-"2*0*81=0",
-"2*0*82=0",
-"2*0*83=0",
-"2*0*84=0",
-"2*0*85=0",
-"2*0*86=0",
-"2*0*87=0",
-"2*0*88=0",
-"2*0*89=0",
-"2*0*90=0",
-"2*0*91=0",
-"2*0*92=0",
-"2*0*93=0",
-"2*0*94=0",
-"2*0*95=0",
-"2*0*96=0",
-"2*0*97=0",
-"2*0*98=0",
-"2*0*99=0",
-"2*0/10=0",
-"2*0/11=0",
-"2*0/12=0",
-"2*0/13=0",
-"2*0/14=0",
-"2*0/15=0",
-"2*0/16=0",
-"2*0/17=0",
-"2*0/18=0",
-"2*0/19=0",
-"2*0/20=0",
-"2*0/21=0",
-"2*0/22=0",
-"2*0/23=0",
-"2*0/24=0",
-"2*0/25=0",
-"2*0/26=0",
-"2*0/27=0",
-"2*0/28=0",
-"2*0/29=0",
-"2*0/30=0",
-"2*0/31=0",
-"2*0/32=0",
-"2*0/33=0",
-"2*0/34=0",
-"2*0/35=0",
-"2*0/36=0",
-"2*0/37=0",
-"2*0/38=0",
-"2*0/39=0",
-"2*0/40=0",
-"2*0/41=0",
-"2*0/42=0",
-"2*0/43=0",
-"2*0/44=0",
-"2*0/45=0",
-"2*0/46=0",
-"2*0/47=0",
-"2*0/48=0",
-"2*0/49=0",
-"2*0/50=0",
-"2*0/51=0",
-"2*0/52=0",
-"2*0/53=0",
-"2*0/54=0",
-"2*0/55=0",
-"2*0/56=0",
-"2*0/57=0",
-"2*0/58=0",
-"2*0/59=0",
-"2*0/60=0",
-"2*0/61=0",
-"2*0/62=0",
-"2*0/63=0",
-"2*0/64=0",
-"2*0/65=0",
-"2*0/66=0",
-"2*0/67=0",
-"2*0/68=0",
-"2*0/69=0",
-"2*0/70=0",
-"2*0/71=0",
-"2*0/72=0",
-"2*0/73=0",
-"2*0/74=0",
-"2*0/75=0",
-"2*0/76=0",
-"2*0/77=0",
-"2*0/78=0",
-"2*0/79=0",
-"2*0/80=0",
-"2*0/81=0",
-"2*0/82=0",
-"2*0/83=0",
-"2*0/84=0",
-"2*0/85=0",
-"2*0/86=0",
-"2*0/87=0",
-"2*0/88=0",
-"2*0/89=0",
-"2*0/90=0",
-"2*0/91=0",
-"2*0/92=0",
-"2*0/93=0",
-"2*0/94=0",
-"2*0/95=0",
-"2*0/96=0",
-"2*0/97=0",
-"2*0/98=0",
-"2*0/99=0",
-"2*10*0=0",
-"2*10/4=5",
-"2*10/5=4",
-"2*11*0=0",
-"2*12*0=0",
-"2*12/3=8",
-"2*12/4=6",
-"2*12/6=4",
-"2*12/8=3",
-"2*13*0=0",
-"2*14*0=0",
-"2*14/4=7",
-"2*14/7=4",
-"2*15*0=0",
-"2*15/5=6",
-"2*15/6=5",
-"2*16*0=0",
-"2*16/4=8",
-"2*16/8=4",
-"2*17*0=0",
-"2*18*0=0",
-"2*18/4=9",
-"2*18/6=6",
-"2*18/9=4",
-"2*19*0=0",
-"2*1+8=10",
-"2*1+9=11",
-"2*1-3=-1",
-"2*1-4=-2",
-"2*1-5=-3",
-"2*1-6=-4",
-"2*1-7=-5",
-"2*1-8=-6",
-"2*1-9=-7",
-"2*1*5=10",
-"2*1*6=12",
-"2*1*7=14",
-"2*1*8=16",
-"2*1*9=18",
-"2*20*0=0",
-"2*20/5=8",
-"2*20/8=5",
-"2*21*0=0",
-"2*21/6=7",
-"2*21/7=6",
-"2*22*0=0",
-"2*23*0=0",
-"2*24*0=0",
-"2*24/6=8",
-"2*24/8=6",
-"2*25*0=0",
-"2*26*0=0",
-"2*27*0=0",
-"2*27/6=9",
-"2*27/9=6",
-"2*28*0=0",
-"2*28/7=8",
-"2*28/8=7",
-"2*29*0=0",
-"2*2+6=10",
-"2*2+7=11",
-"2*2+8=12",
-"2*2+9=13",
-"2*2-5=-1",
-"2*2-6=-2",
-"2*2-7=-3",
-"2*2-8=-4",
-"2*2-9=-5",
-"2*2*3=12",
-"2*2*4=16",
-"2*2*5=20",
-"2*2*6=24",
-"2*2*7=28",
-"2*2*8=32",
-"2*2*9=36",
-"2*30*0=0",
-"2*31*0=0",
-"2*32*0=0",
-"2*32/8=8",
-"2*33*0=0",
-"2*34*0=0",
-"2*35*0=0",
-"2*36*0=0",
-"2*36/8=9",
-"2*36/9=8",
-"2*37*0=0",
-"2*38*0=0",
-"2*39*0=0",
-"2*3+4=10",
-"2*3+5=11",
-"2*3+6=12",
-"2*3+7=13",
-"2*3+8=14",
-"2*3+9=15",
-"2*3-7=-1",
-"2*3-8=-2",
-"2*3-9=-3",
-"2*3*2=12",
-"2*3*3=18",
-"2*3*4=24",
-"2*3*5=30",
-"2*3*6=36",
-"2*3*7=42",
-"2*3*8=48",
-"2*3*9=54",
-"2*40*0=0",
-"2*41*0=0",
-"2*42*0=0",
-"2*43*0=0",
-"2*44*0=0",
-"2*45*0=0",
-"2*46*0=0",
-"2*47*0=0",
-"2*48*0=0",
-"2*49*0=0",
-"2*4+2=10",
-"2*4+3=11",
-"2*4+4=12",
-"2*4+5=13",
-"2*4+6=14",
-"2*4+7=15",
-"2*4+8=16",
-"2*4+9=17",
-"2*4-9=-1",
-"2*4*2=16",
-"2*4*3=24",
-"2*4*4=32",
-"2*4*5=40",
-"2*4*6=48",
-"2*4*7=56",
-"2*4*8=64",
-"2*4*9=72",
-"2*50*0=0",
-"2*50=100",
-"2*51*0=0",
-"2*51=102",
-"2*52*0=0",
-"2*52=104",
-"2*53*0=0",
-"2*53=106",
-"2*54*0=0",
-"2*54=108",
-"2*55*0=0",
-"2*55=110",
-"2*56*0=0",
-"2*56=112",
-"2*57*0=0",
-"2*57=114",
-"2*58*0=0",
-"2*58=116",
-"2*59*0=0",
-"2*59=118",
-"2*5+0=10",
-"2*5+1=11",
-"2*5+2=12",
-"2*5+3=13",
-"2*5+4=14",
-"2*5+5=15",
-"2*5+6=16",
-"2*5+7=17",
-"2*5+8=18",
-"2*5+9=19",
-"2*5-0=10",
-"2*5-10=0",
-"2*5*1=10",
-"2*5*2=20",
-"2*5*3=30",
-"2*5*4=40",
-"2*5*5=50",
-"2*5*6=60",
-"2*5*7=70",
-"2*5*8=80",
-"2*5*9=90",
-"2*5/10=1",
-"2*5/1=10",
-"2*60*0=0",
-"2*60=120",
-"2*61*0=0",
-"2*61=122",
-"2*62*0=0",
-"2*62=124",
-"2*63*0=0",
-"2*63=126",
-"2*64*0=0",
-"2*64=128",
-"2*65*0=0",
-"2*65=130",
-"2*66*0=0",
-"2*66=132",
-"2*67*0=0",
-"2*67=134",
-"2*68*0=0",
-"2*68=136",
-"2*69*0=0",
-"2*69=138",
-"2*6+0=12",
-"2*6+1=13",
-"2*6+2=14",
-"2*6+3=15",
-"2*6+4=16",
-"2*6+5=17",
-"2*6+6=18",
-"2*6+7=19",
-"2*6+8=20",
-"2*6+9=21",
-"2*6-0=12",
-"2*6-10=2",
-"2*6-11=1",
-"2*6-12=0",
-"2*6-1=11",
-"2*6-2=10",
-"2*6*1=12",
-"2*6*2=24",
-"2*6*3=36",
-"2*6*4=48",
-"2*6*5=60",
-"2*6*6=72",
-"2*6*7=84",
-"2*6*8=96",
-"2*6/12=1",
-"2*6/1=12",
-"2*70*0=0",
-"2*70=140",
-"2*71*0=0",
-"2*71=142",
-"2*72*0=0",
-"2*72=144",
-"2*73*0=0",
-"2*73=146",
-"2*74*0=0",
-"2*74=148",
-"2*75*0=0",
-"2*75=150",
-"2*76*0=0",
-"2*76=152",
-"2*77*0=0",
-"2*77=154",
-"2*78*0=0",
-"2*78=156",
-"2*79*0=0",
-"2*79=158",
-"2*7+0=14",
-"2*7+1=15",
-"2*7+2=16",
-"2*7+3=17",
-"2*7+4=18",
-"2*7+5=19",
-"2*7+6=20",
-"2*7+7=21",
-"2*7+8=22",
-"2*7+9=23",
-"2*7-0=14",
-"2*7-10=4",
-"2*7-11=3",
-"2*7-12=2",
-"2*7-13=1",
-"2*7-14=0",
-"2*7-1=13",
-"2*7-2=12",
-"2*7-3=11",
-"2*7-4=10",
-"2*7*1=14",
-"2*7*2=28",
-"2*7*3=42",
-"2*7*4=56",
-"2*7*5=70",
-"2*7*6=84",
-"2*7*7=98",
-"2*7/14=1",
-"2*7/1=14",
-"2*80*0=0",
-"2*80=160",
-"2*81*0=0",
-"2*81=162",
-"2*82*0=0",
-"2*82=164",
-"2*83*0=0",
-"2*83=166",
-"2*84*0=0",
-"2*84=168",
-"2*85*0=0",
-"2*85=170",
-"2*86*0=0",
-"2*86=172",
-"2*87*0=0",
-"2*87=174",
-"2*88*0=0",
-"2*88=176",
-"2*89*0=0",
-"2*89=178",
-"2*8+0=16",
-"2*8+1=17",
-"2*8+2=18",
-"2*8+3=19",
-"2*8+4=20",
-"2*8+5=21",
-"2*8+6=22",
-"2*8+7=23",
-"2*8+8=24",
-"2*8+9=25",
-"2*8-0=16",
-"2*8-10=6",
-"2*8-11=5",
-"2*8-12=4",
-"2*8-13=3",
-"2*8-14=2",
-"2*8-15=1",
-"2*8-16=0",
-"2*8-1=15",
-"2*8-2=14",
-"2*8-3=13",
-"2*8-4=12",
-"2*8-5=11",
-"2*8-6=10",
-"2*8*1=16",
-"2*8*2=32",
-"2*8*3=48",
-"2*8*4=64",
-"2*8*5=80",
-"2*8*6=96",
-"2*8/16=1",
-"2*8/1=16",
-"2*90*0=0",
-"2*90=180",
-"2*91*0=0",
-"2*91=182",
-"2*92*0=0",
-"2*92=184",
-"2*93*0=0",
-"2*93=186",
-"2*94*0=0",
-"2*94=188",
-"2*95*0=0",
-"2*95=190",
-"2*96*0=0",
-"2*96=192",
-"2*97*0=0",
-"2*97=194",
-"2*98*0=0",
-"2*98=196",
-"2*99*0=0",
-"2*99=198",
-"2*9+0=18",
-"2*9+1=19",
-"2*9+2=20",
-"2*9+3=21",
-"2*9+4=22",
-"2*9+5=23",
-"2*9+6=24",
-"2*9+7=25",
-"2*9+8=26",
-"2*9+9=27",
-"2*9-0=18",
-"2*9-10=8",
-"2*9-11=7",
-"2*9-12=6",
-"2*9-13=5",
-"2*9-14=4",
-"2*9-15=3",
-"2*9-16=2",
-"2*9-17=1",
-"2*9-18=0",
-"2*9-1=17",
-"2*9-2=16",
-"2*9-3=15",
-"2*9-4=14",
-"2*9-5=13",
-"2*9-6=12",
-"2*9-7=11",
-"2*9-8=10",
-"2*9*1=18",
-"2*9*2=36",
-"2*9*3=54",
-"2*9*4=72",
-"2*9*5=90",
-"2*9/18=1",
-"2*9/1=18",
-"2/10*0=0",
-"2/10*5=1",
-"2/11*0=0",
-"2/12*0=0",
-"2/12*6=1",
-"2/13*0=0",
-"2/14*0=0",
-"2/14*7=1",
-"2/15*0=0",
-"2/16*0=0",
-"2/16*8=1",
-"2/17*0=0",
-"2/18*0=0",
-"2/18*9=1",
-"2/19*0=0",
-"2/1+8=10",
-"2/1+9=11",
-"2/1-3=-1",
-"2/1-4=-2",
-"2/1-5=-3",
-"2/1-6=-4",
-"2/1-7=-5",
-"2/1-8=-6",
-"2/1-9=-7",
-"2/1*5=10",
-"2/1*6=12",
-"2/1*7=14",
-"2/1*8=16",
-"2/1*9=18",
-"2/20*0=0",
-"2/21*0=0",
-"2/22*0=0",
-"2/23*0=0",
-"2/24*0=0",
-"2/25*0=0",
-"2/26*0=0",
-"2/27*0=0",
-"2/28*0=0",
-"2/29*0=0",
-"2/2+9=10",
-"2/2-2=-1",
-"2/2-3=-2",
-"2/2-4=-3",
-"2/2-5=-4",
-"2/2-6=-5",
-"2/2-7=-6",
-"2/2-8=-7",
-"2/2-9=-8",
-"2/30*0=0",
-"2/31*0=0",
-"2/32*0=0",
-"2/33*0=0",
-"2/34*0=0",
-"2/35*0=0",
-"2/36*0=0",
-"2/37*0=0",
-"2/38*0=0",
-"2/39*0=0",
-"2/3*12=8",
-"2/40*0=0",
-"2/41*0=0",
-"2/42*0=0",
-"2/43*0=0",
-"2/44*0=0",
-"2/45*0=0",
-"2/46*0=0",
-"2/47*0=0",
-"2/48*0=0",
-"2/49*0=0",
-"2/4*10=5",
-"2/4*12=6",
-"2/4*14=7",
-"2/4*16=8",
-"2/4*18=9",
-"2/50*0=0",
-"2/51*0=0",
-"2/52*0=0",
-"2/53*0=0",
-"2/54*0=0",
-"2/55*0=0",
-"2/56*0=0",
-"2/57*0=0",
-"2/58*0=0",
-"2/59*0=0",
-"2/5*10=4",
-"2/5*15=6",
-"2/5*20=8",
-"2/60*0=0",
-"2/61*0=0",
-"2/62*0=0",
-"2/63*0=0",
-"2/64*0=0",
-"2/65*0=0",
-"2/66*0=0",
-"2/67*0=0",
-"2/68*0=0",
-"2/69*0=0",
-"2/6*12=4",
-"2/6*15=5",
-"2/6*18=6",
-"2/6*21=7",
-"2/6*24=8",
-"2/6*27=9",
-"2/70*0=0",
-"2/71*0=0",
-"2/72*0=0",
-"2/73*0=0",
-"2/74*0=0",
-"2/75*0=0",
-"2/76*0=0",
-"2/77*0=0",
-"2/78*0=0",
-"2/79*0=0",
-"2/7*14=4",
-"2/7*21=6",
-"2/7*28=8",
-"2/80*0=0",
-"2/81*0=0",
-"2/82*0=0",
-"2/83*0=0",
-"2/84*0=0",
-"2/85*0=0",
-"2/86*0=0",
-"2/87*0=0",
-"2/88*0=0",
-"2/89*0=0",
-"2/8*12=3",
-"2/8*16=4",
-"2/8*20=5",
-"2/8*24=6",
-"2/8*28=7",
-"2/8*32=8",
-"2/8*36=9",
-"2/90*0=0",
-"2/91*0=0",
-"2/92*0=0",
-"2/93*0=0",
-"2/94*0=0",
-"2/95*0=0",
-"2/96*0=0",
-"2/97*0=0",
-"2/98*0=0",
-"2/99*0=0",
-"2/9*18=4",
-"2/9*27=6",
-"2/9*36=8",
-"3000*0=0",
-"3001*0=0",
-"3002*0=0",
-"3003*0=0",
-"3004*0=0",
-"3005*0=0",
-"3006*0=0",
-"3007*0=0",
-"3008*0=0",
-"3009*0=0",
-"300/4=75",
-"300/50=6",
-"300/5=60",
-"300/60=5",
-"300/6=50",
-"300/75=4",
-"3010*0=0",
-"3011*0=0",
-"3012*0=0",
-"3013*0=0",
-"3014*0=0",
-"3015*0=0",
-"3016*0=0",
-"3017*0=0",
-"3018*0=0",
-"3019*0=0",
-"301/43=7",
-"301/7=43",
-"3020*0=0",
-"3021*0=0",
-"3022*0=0",
-"3023*0=0",
-"3024*0=0",
-"3025*0=0",
-"3026*0=0",
-"3027*0=0",
-"3028*0=0",
-"3029*0=0",
-"3030*0=0",
-"3031*0=0",
-"3032*0=0",
-"3033*0=0",
-"3034*0=0",
-"3035*0=0",
-"3036*0=0",
-"3037*0=0",
-"3038*0=0",
-"3039*0=0",
-"3040*0=0",
-"3041*0=0",
-"3042*0=0",
-"3043*0=0",
-"3044*0=0",
-"3045*0=0",
-"3046*0=0",
-"3047*0=0",
-"3048*0=0",
-"3049*0=0",
-"304/38=8",
-"304/4=76",
-"304/76=4",
-"304/8=38",
-"3050*0=0",
-"3051*0=0",
-"3052*0=0",
-"3053*0=0",
-"3054*0=0",
-"3055*0=0",
-"3056*0=0",
-"3057*0=0",
-"3058*0=0",
-"3059*0=0",
-"305/5=61",
-"305/61=5",
-"3060*0=0",
-"3061*0=0",
-"3062*0=0",
-"3063*0=0",
-"3064*0=0",
-"3065*0=0",
-"3066*0=0",
-"3067*0=0",
-"3068*0=0",
-"3069*0=0",
-"306/34=9",
-"306/51=6",
-"306/6=51",
-"306/9=34",
-"3070*0=0",
-"3071*0=0",
-"3072*0=0",
-"3073*0=0",
-"3074*0=0",
-"3075*0=0",
-"3076*0=0",
-"3077*0=0",
-"3078*0=0",
-"3079*0=0",
-"3080*0=0",
-"3081*0=0",
-"3082*0=0",
-"3083*0=0",
-"3084*0=0",
-"3085*0=0",
-"3086*0=0",
-"3087*0=0",
-"3088*0=0",
-"3089*0=0",
-"308/44=7",
-"308/4=77",
-"308/77=4",
-"308/7=44",
-"3090*0=0",
-"3091*0=0",
-"3092*0=0",
-"3093*0=0",
-"3094*0=0",
-"3095*0=0",
-"3096*0=0",
-"3097*0=0",
-"3098*0=0",
-"3099*0=0",
-"30+10=40",
-"30+11=41",
-"30+12=42",
-"30+13=43",
-"30+14=44",
-"30+15=45",
-"30+16=46",
-"30+17=47",
-"30+18=48",
-"30+19=49",
-"30+20=50",
-"30+21=51",
-"30+22=52",
-"30+23=53",
-"30+24=54",
-"30+25=55",
-"30+26=56",
-"30+27=57",
-"30+28=58",
-"30+29=59",
-"30+30=60",
-"30+31=61",
-"30+32=62",
-"30+33=63",
-"30+34=64",
-"30+35=65",
-"30+36=66",
-"30+37=67",
-"30+38=68",
-"30+39=69",
-"30+40=70",
-"30+41=71",
-"30+42=72",
-"30+43=73",
-"30+44=74",
-"30+45=75",
-"30+46=76",
-"30+47=77",
-"30+48=78",
-"30+49=79",
-"30+50=80",
-"30+51=81",
-"30+52=82",
-"30+53=83",
-"30+54=84",
-"30+55=85",
-"30+56=86",
-"30+57=87",
-"30+58=88",
-"30+59=89",
-"30+60=90",
-"30+61=91",
-"30+62=92",
-"30+63=93",
-"30+64=94",
-"30+65=95",
-"30+66=96",
-"30+67=97",
-"30+68=98",
-"30+69=99",
-"30-10=20",
-"30-11=19",
-"30-12=18",
-"30-13=17",
-"30-14=16",
-"30-15=15",
-"30-16=14",
-"30-17=13",
-"30-18=12",
-"30-19=11",
-"30-20=10",
-"30-31=-1",
-"30-32=-2",
-"30-33=-3",
-"30-34=-4",
-"30-35=-5",
-"30-36=-6",
-"30-37=-7",
-"30-38=-8",
-"30-39=-9",
-"30-3*7=9",
-"30-3*8=6",
-"30-3*9=3",
-"30-4*6=6",
-"30-4*7=2",
-"30-5*5=5",
-"30-5*6=0",
-"30-6*4=6",
-"30-6*5=0",
-"30-7*3=9",
-"30-7*4=2",
-"30-8*3=6",
-"30-9*3=3",
-"30*0+0=0",
-"30*0+1=1",
-"30*0+2=2",
-"30*0+3=3",
-"30*0+4=4",
-"30*0+5=5",
-"30*0+6=6",
-"30*0+7=7",
-"30*0+8=8",
-"30*0+9=9",
-"30*0-0=0",
-"30*0*0=0",
-"30*0*1=0",
-"30*0*2=0",
-"30*0*3=0",
-"30*0*4=0",
-"30*0*5=0",
-"30*0*6=0",
-"30*0*7=0",
-"30*0*8=0",
-"30*0*9=0",
-"30*0/1=0",
-"30*0/2=0",
-"30*0/3=0",
-"30*0/4=0",
-"30*0/5=0",
-"30*0/6=0",
-"30*0/7=0",
-"30*0/8=0",
-"30*0/9=0",
-"30*1*0=0",
-"30*1/5=6",
-"30*1/6=5",
-"30*2*0=0",
-"30*3*0=0",
-"30*4*0=0",
-"30*4=120",
-"30*5*0=0",
-"30*5=150",
-"30*6*0=0",
-"30*6=180",
-"30*7*0=0",
-"30*7=210",
-"30*8*0=0",
-"30*8=240",
-"30*9*0=0",
-"30*9=270",
-"30/1*0=0",
-"30/1/5=6",
-"30/1/6=5",
-"30/2-6=9",
-"30/2-7=8",
-"30/2-8=7",
-"30/2-9=6",
-"30/2*0=0",
-"30/2/3=5",
-"30/2/5=3",
-"30/3-1=9",
-"30/3-2=8",
-"30/3-3=7",
-"30/3-4=6",
-"30/3-5=5",
-"30/3-6=4",
-"30/3-7=3",
-"30/3-8=2",
-"30/3-9=1",
-"30/3*0=0",
-"30/3/2=5",
-"30/3/5=2",
-"30/4*0=0",
-"30/5+0=6",
-"30/5+1=7",
-"30/5+2=8",
-"30/5+3=9",
-"30/5-0=6",
-"30/5-1=5",
-"30/5-2=4",
-"30/5-3=3",
-"30/5-4=2",
-"30/5-5=1",
-"30/5-6=0",
-"30/5*0=0",
-"30/5*1=6",
-"30/5/1=6",
-"30/5/2=3",
-"30/5/3=2",
-"30/5/6=1",
-"30/6+0=5",
-"30/6+1=6",
-"30/6+2=7",
-"30/6+3=8",
-"30/6+4=9",
-"30/6-0=5",
-"30/6-1=4",
-"30/6-2=3",
-"30/6-3=2",
-"30/6-4=1",
-"30/6-5=0",
-"30/6*0=0",
-"30/6*1=5",
-"30/6/1=5",
-"30/6/5=1",
-"30/7*0=0",
-"30/8*0=0",
-"30/9*0=0",
-"3100*0=0",
-"3101*0=0",
-"3102*0=0",
-"3103*0=0",
-"3104*0=0",
-"3105*0=0",
-"3106*0=0",
-"3107*0=0",
-"3108*0=0",
-"3109*0=0",
-"310/5=62",
-"310/62=5",
-"3110*0=0",
-"3111*0=0",
-"3112*0=0",
-"3113*0=0",
-"3114*0=0",
-"3115*0=0",
-"3116*0=0",
-"3117*0=0",
-"3118*0=0",
-"3119*0=0",
-"3120*0=0",
-"3121*0=0",
-"3122*0=0",
-"3123*0=0",
-"3124*0=0",
-"3125*0=0",
-"3126*0=0",
-"3127*0=0",
-"3128*0=0",
-"3129*0=0",
-"312/39=8",
-"312/4=78",
-"312/52=6",
-"312/6=52",
-"312/78=4",
-"312/8=39",
-"3130*0=0",
-"3131*0=0",
-"3132*0=0",
-"3133*0=0",
-"3134*0=0",
-"3135*0=0",
-"3136*0=0",
-"3137*0=0",
-"3138*0=0",
-"3139*0=0",
-"3140*0=0",
-"3141*0=0",
-"3142*0=0",
-"3143*0=0",
-"3144*0=0",
-"3145*0=0",
-"3146*0=0",
-"3147*0=0",
-"3148*0=0",
-"3149*0=0",
-"3150*0=0",
-"3151*0=0",
-"3152*0=0",
-"3153*0=0",
-"3154*0=0",
-"3155*0=0",
-"3156*0=0",
-"3157*0=0",
-"3158*0=0",
-"3159*0=0",
-"315/35=9",
-"315/45=7",
-"315/5=63",
-"315/63=5",
-"315/7=45",
-"315/9=35",
-"3160*0=0",
-"3161*0=0",
-"3162*0=0",
-"3163*0=0",
-"3164*0=0",
-"3165*0=0",
-"3166*0=0",
-"3167*0=0",
-"3168*0=0",
-"3169*0=0",
-"316/4=79",
-"316/79=4",
-"3170*0=0",
-"3171*0=0",
-"3172*0=0",
-"3173*0=0",
-"3174*0=0",
-"3175*0=0",
-"3176*0=0",
-"3177*0=0",
-"3178*0=0",
-"3179*0=0",
-"3180*0=0",
-"3181*0=0",
-"3182*0=0",
-"3183*0=0",
-"3184*0=0",
-"3185*0=0",
-"3186*0=0",
-"3187*0=0",
-"3188*0=0",
-"3189*0=0",
-"318/53=6",
-"318/6=53",
-"3190*0=0",
-"3191*0=0",
-"3192*0=0",
-"3193*0=0",
-"3194*0=0",
-"3195*0=0",
-"3196*0=0",
-"3197*0=0",
-"3198*0=0",
-"3199*0=0",
-"31+10=41",
-"31+11=42",
-"31+12=43",
-"31+13=44",
-"31+14=45",
-"31+15=46",
-"31+16=47",
-"31+17=48",
-"31+18=49",
-"31+19=50",
-"31+20=51",
-"31+21=52",
-"31+22=53",
-"31+23=54",
-"31+24=55",
-"31+25=56",
-"31+26=57",
-"31+27=58",
-"31+28=59",
-"31+29=60",
-"31+30=61",
-"31+31=62",
-"31+32=63",
-"31+33=64",
-"31+34=65",
-"31+35=66",
-"31+36=67",
-"31+37=68",
-"31+38=69",
-"31+39=70",
-"31+40=71",
-"31+41=72",
-"31+42=73",
-"31+43=74",
-"31+44=75",
-"31+45=76",
-"31+46=77",
-"31+47=78",
-"31+48=79",
-"31+49=80",
-"31+50=81",
-"31+51=82",
-"31+52=83",
-"31+53=84",
-"31+54=85",
-"31+55=86",
-"31+56=87",
-"31+57=88",
-"31+58=89",
-"31+59=90",
-"31+60=91",
-"31+61=92",
-"31+62=93",
-"31+63=94",
-"31+64=95",
-"31+65=96",
-"31+66=97",
-"31+67=98",
-"31+68=99",
-"31-10=21",
-"31-11=20",
-"31-12=19",
-"31-13=18",
-"31-14=17",
-"31-15=16",
-"31-16=15",
-"31-17=14",
-"31-18=13",
-"31-19=12",
-"31-20=11",
-"31-21=10",
-"31-32=-1",
-"31-33=-2",
-"31-34=-3",
-"31-35=-4",
-"31-36=-5",
-"31-37=-6",
-"31-38=-7",
-"31-39=-8",
-"31-3*8=7",
-"31-3*9=4",
-"31-40=-9",
-"31-4*6=7",
-"31-4*7=3",
-"31-5*5=6",
-"31-5*6=1",
-"31-6*4=7",
-"31-6*5=1",
-"31-7*4=3",
-"31-8*3=7",
-"31-9*3=4",
-"31*0+0=0",
-"31*0+1=1",
-"31*0+2=2",
-"31*0+3=3",
-"31*0+4=4",
-"31*0+5=5",
-"31*0+6=6",
-"31*0+7=7",
-"31*0+8=8",
-"31*0+9=9",
-"31*0-0=0",
-"31*0*0=0",
-"31*0*1=0",
-"31*0*2=0",
-"31*0*3=0",
-"31*0*4=0",
-"31*0*5=0",
-"31*0*6=0",
-"31*0*7=0",
-"31*0*8=0",
-"31*0*9=0",
-"31*0/1=0",
-"31*0/2=0",
-"31*0/3=0",
-"31*0/4=0",
-"31*0/5=0",
-"31*0/6=0",
-"31*0/7=0",
-"31*0/8=0",
-"31*0/9=0",
-"31*1*0=0",
-"31*2*0=0",
-"31*3*0=0",
-"31*4*0=0",
-"31*4=124",
-"31*5*0=0",
-"31*5=155",
-"31*6*0=0",
-"31*6=186",
-"31*7*0=0",
-"31*7=217",
-"31*8*0=0",
-"31*8=248",
-"31*9*0=0",
-"31*9=279",
-"31/1*0=0",
-"31/2*0=0",
-"31/3*0=0",
-"31/4*0=0",
-"31/5*0=0",
-"31/6*0=0",
-"31/7*0=0",
-"31/8*0=0",
-"31/9*0=0",
-"3200*0=0",
-"3201*0=0",
-"3202*0=0",
-"3203*0=0",
-"3204*0=0",
-"3205*0=0",
-"3206*0=0",
-"3207*0=0",
-"3208*0=0",
-"3209*0=0",
-"320/40=8",
-"320/4=80",
-"320/5=64",
-"320/64=5",
-"320/80=4",
-"320/8=40",
-"3210*0=0",
-"3211*0=0",
-"3212*0=0",
-"3213*0=0",
-"3214*0=0",
-"3215*0=0",
-"3216*0=0",
-"3217*0=0",
-"3218*0=0",
-"3219*0=0",
-"3220*0=0",
-"3221*0=0",
-"3222*0=0",
-"3223*0=0",
-"3224*0=0",
-"3225*0=0",
-"3226*0=0",
-"3227*0=0",
-"3228*0=0",
-"3229*0=0",
-"322/46=7",
-"322/7=46",
-"3230*0=0",
-"3231*0=0",
-"3232*0=0",
-"3233*0=0",
-"3234*0=0",
-"3235*0=0",
-"3236*0=0",
-"3237*0=0",
-"3238*0=0",
-"3239*0=0",
-"3240*0=0",
-"3241*0=0",
-"3242*0=0",
-"3243*0=0",
-"3244*0=0",
-"3245*0=0",
-"3246*0=0",
-"3247*0=0",
-"3248*0=0",
-"3249*0=0",
-"324/36=9",
-"324/4=81",
-"324/54=6",
-"324/6=54",
-"324/81=4",
-"324/9=36",
-"3250*0=0",
-"3251*0=0",
-"3252*0=0",
-"3253*0=0",
-"3254*0=0",
-"3255*0=0",
-"3256*0=0",
-"3257*0=0",
-"3258*0=0",
-"3259*0=0",
-"325/5=65",
-"325/65=5",
-"3260*0=0",
-"3261*0=0",
-"3262*0=0",
-"3263*0=0",
-"3264*0=0",
-"3265*0=0",
-"3266*0=0",
-"3267*0=0",
-"3268*0=0",
-"3269*0=0",
-"3270*0=0",
-"3271*0=0",
-"3272*0=0",
-"3273*0=0",
-"3274*0=0",
-"3275*0=0",
-"3276*0=0",
-"3277*0=0",
-"3278*0=0",
-"3279*0=0",
-"3280*0=0",
-"3281*0=0",
-"3282*0=0",
-"3283*0=0",
-"3284*0=0",
-"3285*0=0",
-"3286*0=0",
-"3287*0=0",
-"3288*0=0",
-"3289*0=0",
-"328/41=8",
-"328/4=82",
-"328/82=4",
-"328/8=41",
-"3290*0=0",
-"3291*0=0",
-"3292*0=0",
-"3293*0=0",
-"3294*0=0",
-"3295*0=0",
-"3296*0=0",
-"3297*0=0",
-"3298*0=0",
-"3299*0=0",
-"329/47=7",
-"329/7=47",
-"32+10=42",
-"32+11=43",
-"32+12=44",
-"32+13=45",
-"32+14=46",
-"32+15=47",
-"32+16=48",
-"32+17=49",
-"32+18=50",
-"32+19=51",
-"32+20=52",
-"32+21=53",
-"32+22=54",
-"32+23=55",
-"32+24=56",
-"32+25=57",
-"32+26=58",
-"32+27=59",
-"32+28=60",
-"32+29=61",
-"32+30=62",
-"32+31=63",
-"32+32=64",
-"32+33=65",
-"32+34=66",
-"32+35=67",
-"32+36=68",
-"32+37=69",
-"32+38=70",
-"32+39=71",
-"32+40=72",
-"32+41=73",
-"32+42=74",
-"32+43=75",
-"32+44=76",
-"32+45=77",
-"32+46=78",
-"32+47=79",
-"32+48=80",
-"32+49=81",
-"32+50=82",
-"32+51=83",
-"32+52=84",
-"32+53=85",
-"32+54=86",
-"32+55=87",
-"32+56=88",
-"32+57=89",
-"32+58=90",
-"32+59=91",
-"32+60=92",
-"32+61=93",
-"32+62=94",
-"32+63=95",
-"32+64=96",
-"32+65=97",
-"32+66=98",
-"32+67=99",
-"32-10=22",
-"32-11=21",
-"32-12=20",
-"32-13=19",
-"32-14=18",
-"32-15=17",
-"32-16=16",
-"32-17=15",
-"32-18=14",
-"32-19=13",
-"32-20=12",
-"32-21=11",
-"32-22=10",
-"32-33=-1",
-"32-34=-2",
-"32-35=-3",
-"32-36=-4",
-"32-37=-5",
-"32-38=-6",
-"32-39=-7",
-"32-3*8=8",
-"32-3*9=5",
-"32-40=-8",
-"32-41=-9",
-"32-4*6=8",
-"32-4*7=4",
-"32-4*8=0",
-"32-5*5=7",
-"32-5*6=2",
-"32-6*4=8",
-"32-6*5=2",
-"32-7*4=4",
-"32-8*3=8",
-"32-8*4=0",
-"32-9*3=5",
-"32*0+0=0",
-"32*0+1=1",
-"32*0+2=2",
-"32*0+3=3",
-"32*0+4=4",
-"32*0+5=5",
-"32*0+6=6",
-"32*0+7=7",
-"32*0+8=8",
-"32*0+9=9",
-"32*0-0=0",
-"32*0*0=0",
-"32*0*1=0",
-"32*0*2=0",
-"32*0*3=0",
-"32*0*4=0",
-"32*0*5=0",
-"32*0*6=0",
-"32*0*7=0",
-"32*0*8=0",
-"32*0*9=0",
-"32*0/1=0",
-"32*0/2=0",
-"32*0/3=0",
-"32*0/4=0",
-"32*0/5=0",
-"32*0/6=0",
-"32*0/7=0",
-"32*0/8=0",
-"32*0/9=0",
-"32*1*0=0",
-"32*1/4=8",
-"32*1/8=4",
-"32*2*0=0",
-"32*2/8=8",
-"32*3*0=0",
-"32*4*0=0",
-"32*4=128",
-"32*5*0=0",
-"32*5=160",
-"32*6*0=0",
-"32*6=192",
-"32*7*0=0",
-"32*7=224",
-"32*8*0=0",
-"32*8=256",
-"32*9*0=0",
-"32*9=288",
-"32/1*0=0",
-"32/1/4=8",
-"32/1/8=4",
-"32/2-7=9",
-"32/2-8=8",
-"32/2-9=7",
-"32/2*0=0",
-"32/2/2=8",
-"32/2/4=4",
-"32/2/8=2",
-"32/3*0=0",
-"32/4+0=8",
-"32/4+1=9",
-"32/4-0=8",
-"32/4-1=7",
-"32/4-2=6",
-"32/4-3=5",
-"32/4-4=4",
-"32/4-5=3",
-"32/4-6=2",
-"32/4-7=1",
-"32/4-8=0",
-"32/4*0=0",
-"32/4*1=8",
-"32/4/1=8",
-"32/4/2=4",
-"32/4/4=2",
-"32/4/8=1",
-"32/5*0=0",
-"32/6*0=0",
-"32/7*0=0",
-"32/8+0=4",
-"32/8+1=5",
-"32/8+2=6",
-"32/8+3=7",
-"32/8+4=8",
-"32/8+5=9",
-"32/8-0=4",
-"32/8-1=3",
-"32/8-2=2",
-"32/8-3=1",
-"32/8-4=0",
-"32/8*0=0",
-"32/8*1=4",
-"32/8*2=8",
-"32/8/1=4",
-"32/8/2=2",
-"32/8/4=1",
-"32/9*0=0",
-"3300*0=0",
-"3301*0=0",
-"3302*0=0",
-"3303*0=0",
-"3304*0=0",
-"3305*0=0",
-"3306*0=0",
-"3307*0=0",
-"3308*0=0",
-"3309*0=0",
-"330/55=6",
-"330/5=66",
-"330/66=5",
-"330/6=55",
-"3310*0=0",
-"3311*0=0",
-"3312*0=0",
-"3313*0=0",
-"3314*0=0",
-"3315*0=0",
-"3316*0=0",
-"3317*0=0",
-"3318*0=0",
-"3319*0=0",
-"3320*0=0",
-"3321*0=0",
-"3322*0=0",
-"3323*0=0",
-"3324*0=0",
-"3325*0=0",
-"3326*0=0",
-"3327*0=0",
-"3328*0=0",
-"3329*0=0",
-"332/4=83",
-"332/83=4",
-"3330*0=0",
-"3331*0=0",
-"3332*0=0",
-"3333*0=0",
-"3334*0=0",
-"3335*0=0",
-"3336*0=0",
-"3337*0=0",
-"3338*0=0",
-"3339*0=0",
-"333/37=9",
-"333/9=37",
-"3340*0=0",
-"3341*0=0",
-"3342*0=0",
-"3343*0=0",
-"3344*0=0",
-"3345*0=0",
-"3346*0=0",
-"3347*0=0",
-"3348*0=0",
-"3349*0=0",
-"3350*0=0",
-"3351*0=0",
-"3352*0=0",
-"3353*0=0",
-"3354*0=0",
-"3355*0=0",
-"3356*0=0",
-"3357*0=0",
-"3358*0=0",
-"3359*0=0",
-"335/5=67",
-"335/67=5",
-"3360*0=0",
-"3361*0=0",
-"3362*0=0",
-"3363*0=0",
-"3364*0=0",
-"3365*0=0",
-"3366*0=0",
-"3367*0=0",
-"3368*0=0",
-"3369*0=0",
-"336/42=8",
-"336/48=7",
-"336/4=84",
-"336/56=6",
-"336/6=56",
-"336/7=48",
-"336/84=4",
-"336/8=42",
-"3370*0=0",
-"3371*0=0",
-"3372*0=0",
-"3373*0=0",
-"3374*0=0",
-"3375*0=0",
-"3376*0=0",
-"3377*0=0",
-"3378*0=0",
-"3379*0=0",
-"3380*0=0",
-"3381*0=0",
-"3382*0=0",
-"3383*0=0",
-"3384*0=0",
-"3385*0=0",
-"3386*0=0",
-"3387*0=0",
-"3388*0=0",
-"3389*0=0",
-"3390*0=0",
-"3391*0=0",
-"3392*0=0",
-"3393*0=0",
-"3394*0=0",
-"3395*0=0",
-"3396*0=0",
-"3397*0=0",
-"3398*0=0",
-"3399*0=0",
-"33+10=43",
-"33+11=44",
-"33+12=45",
-"33+13=46",
-"33+14=47",
-"33+15=48",
-"33+16=49",
-"33+17=50",
-"33+18=51",
-"33+19=52",
-"33+20=53",
-"33+21=54",
-"33+22=55",
-"33+23=56",
-"33+24=57",
-"33+25=58",
-"33+26=59",
-"33+27=60",
-"33+28=61",
-"33+29=62",
-"33+30=63",
-"33+31=64",
-"33+32=65",
-"33+33=66",
-"33+34=67",
-"33+35=68",
-"33+36=69",
-"33+37=70",
-"33+38=71",
-"33+39=72",
-"33+40=73",
-"33+41=74",
-"33+42=75",
-"33+43=76",
-"33+44=77",
-"33+45=78",
-"33+46=79",
-"33+47=80",
-"33+48=81",
-"33+49=82",
-"33+50=83",
-"33+51=84",
-"33+52=85",
-"33+53=86",
-"33+54=87",
-"33+55=88",
-"33+56=89",
-"33+57=90",
-"33+58=91",
-"33+59=92",
-"33+60=93",
-"33+61=94",
-"33+62=95",
-"33+63=96",
-"33+64=97",
-"33+65=98",
-"33+66=99",
-"33-10=23",
-"33-11=22",
-"33-12=21",
-"33-13=20",
-"33-14=19",
-"33-15=18",
-"33-16=17",
-"33-17=16",
-"33-18=15",
-"33-19=14",
-"33-20=13",
-"33-21=12",
-"33-22=11",
-"33-23=10",
-"33-34=-1",
-"33-35=-2",
-"33-36=-3",
-"33-37=-4",
-"33-38=-5",
-"33-39=-6",
-"33-3*8=9",
-"33-3*9=6",
-"33-40=-7",
-"33-41=-8",
-"33-42=-9",
-"33-4*6=9",
-"33-4*7=5",
-"33-4*8=1",
-"33-5*5=8",
-"33-5*6=3",
-"33-6*4=9",
-"33-6*5=3",
-"33-7*4=5",
-"33-8*3=9",
-"33-8*4=1",
-"33-9*3=6",
-"33*0+0=0",
-"33*0+1=1",
-"33*0+2=2",
-"33*0+3=3",
-"33*0+4=4",
-"33*0+5=5",
-"33*0+6=6",
-"33*0+7=7",
-"33*0+8=8",
-"33*0+9=9",
-"33*0-0=0",
-"33*0*0=0",
-"33*0*1=0",
-"33*0*2=0",
-"33*0*3=0",
-"33*0*4=0",
-"33*0*5=0",
-"33*0*6=0",
-"33*0*7=0",
-"33*0*8=0",
-"33*0*9=0",
-"33*0/1=0",
-"33*0/2=0",
-"33*0/3=0",
-"33*0/4=0",
-"33*0/5=0",
-"33*0/6=0",
-"33*0/7=0",
-"33*0/8=0",
-"33*0/9=0",
-"33*1*0=0",
-"33*2*0=0",
-"33*3*0=0",
-"33*4*0=0",
-"33*4=132",
-"33*5*0=0",
-"33*5=165",
-"33*6*0=0",
-"33*6=198",
-"33*7*0=0",
-"33*7=231",
-"33*8*0=0",
-"33*8=264",
-"33*9*0=0",
-"33*9=297",
-"33/1*0=0",
-"33/2*0=0",
-"33/3-2=9",
-"33/3-3=8",
-"33/3-4=7",
-"33/3-5=6",
-"33/3-6=5",
-"33/3-7=4",
-"33/3-8=3",
-"33/3-9=2",
-"33/3*0=0",
-"33/4*0=0",
-"33/5*0=0",
-"33/6*0=0",
-"33/7*0=0",
-"33/8*0=0",
-"33/9*0=0",
-"3400*0=0",
-"3401*0=0",
-"3402*0=0",
-"3403*0=0",
-"3404*0=0",
-"3405*0=0",
-"3406*0=0",
-"3407*0=0",
-"3408*0=0",
-"3409*0=0",
-"340/4=85",
-"340/5=68",
-"340/68=5",
-"340/85=4",
-"3410*0=0",
-"3411*0=0",
-"3412*0=0",
-"3413*0=0",
-"3414*0=0",
-"3415*0=0",
-"3416*0=0",
-"3417*0=0",
-"3418*0=0",
-"3419*0=0",
-"3420*0=0",
-"3421*0=0",
-"3422*0=0",
-"3423*0=0",
-"3424*0=0",
-"3425*0=0",
-"3426*0=0",
-"3427*0=0",
-"3428*0=0",
-"3429*0=0",
-"342/38=9",
-"342/57=6",
-"342/6=57",
-"342/9=38",
-"3430*0=0",
-"3431*0=0",
-"3432*0=0",
-"3433*0=0",
-"3434*0=0",
-"3435*0=0",
-"3436*0=0",
-"3437*0=0",
-"3438*0=0",
-"3439*0=0",
-"343/49=7",
-"343/7=49",
-"3440*0=0",
-"3441*0=0",
-"3442*0=0",
-"3443*0=0",
-"3444*0=0",
-"3445*0=0",
-"3446*0=0",
-"3447*0=0",
-"3448*0=0",
-"3449*0=0",
-"344/43=8",
-"344/4=86",
-"344/86=4",
-"344/8=43",
-"3450*0=0",
-"3451*0=0",
-"3452*0=0",
-"3453*0=0",
-"3454*0=0",
-"3455*0=0",
-"3456*0=0",
-"3457*0=0",
-"3458*0=0",
-"3459*0=0",
-"345/5=69",
-"345/69=5",
-"3460*0=0",
-"3461*0=0",
-"3462*0=0",
-"3463*0=0",
-"3464*0=0",
-"3465*0=0",
-"3466*0=0",
-"3467*0=0",
-"3468*0=0",
-"3469*0=0",
-"3470*0=0",
-"3471*0=0",
-"3472*0=0",
-"3473*0=0",
-"3474*0=0",
-"3475*0=0",
-"3476*0=0",
-"3477*0=0",
-"3478*0=0",
-"3479*0=0",
-"3480*0=0",
-"3481*0=0",
-"3482*0=0",
-"3483*0=0",
-"3484*0=0",
-"3485*0=0",
-"3486*0=0",
-"3487*0=0",
-"3488*0=0",
-"3489*0=0",
-"348/4=87",
-"348/58=6",
-"348/6=58",
-"348/87=4",
-"3490*0=0",
-"3491*0=0",
-"3492*0=0",
-"3493*0=0",
-"3494*0=0",
-"3495*0=0",
-"3496*0=0",
-"3497*0=0",
-"3498*0=0",
-"3499*0=0",
-"34+10=44",
-"34+11=45",
-"34+12=46",
-"34+13=47",
-"34+14=48",
-"34+15=49",
-"34+16=50",
-"34+17=51",
-"34+18=52",
-"34+19=53",
-"34+20=54",
-"34+21=55",
-"34+22=56",
-"34+23=57",
-"34+24=58",
-"34+25=59",
-"34+26=60",
-"34+27=61",
-"34+28=62",
-"34+29=63",
-"34+30=64",
-"34+31=65",
-"34+32=66",
-"34+33=67",
-"34+34=68",
-"34+35=69",
-"34+36=70",
-"34+37=71",
-"34+38=72",
-"34+39=73",
-"34+40=74",
-"34+41=75",
-"34+42=76",
-"34+43=77",
-"34+44=78",
-"34+45=79",
-"34+46=80",
-"34+47=81",
-"34+48=82",
-"34+49=83",
-"34+50=84",
-"34+51=85",
-"34+52=86",
-"34+53=87",
-"34+54=88",
-"34+55=89",
-"34+56=90",
-"34+57=91",
-"34+58=92",
-"34+59=93",
-"34+60=94",
-"34+61=95",
-"34+62=96",
-"34+63=97",
-"34+64=98",
-"34+65=99",
-"34-10=24",
-"34-11=23",
-"34-12=22",
-"34-13=21",
-"34-14=20",
-"34-15=19",
-"34-16=18",
-"34-17=17",
-"34-18=16",
-"34-19=15",
-"34-20=14",
-"34-21=13",
-"34-22=12",
-"34-23=11",
-"34-24=10",
-"34-35=-1",
-"34-36=-2",
-"34-37=-3",
-"34-38=-4",
-"34-39=-5",
-"34-3*9=7",
-"34-40=-6",
-"34-41=-7",
-"34-42=-8",
-"34-43=-9",
-"34-4*7=6",
-"34-4*8=2",
-"34-5*5=9",
-"34-5*6=4",
-"34-6*5=4",
-"34-7*4=6",
-"34-8*4=2",
-"34-9*3=7",
-"34*0+0=0",
-"34*0+1=1",
-"34*0+2=2",
-"34*0+3=3",
-"34*0+4=4",
-"34*0+5=5",
-"34*0+6=6",
-"34*0+7=7",
-"34*0+8=8",
-"34*0+9=9",
-"34*0-0=0",
-"34*0*0=0",
-"34*0*1=0",
-"34*0*2=0",
-"34*0*3=0",
-"34*0*4=0",
-"34*0*5=0",
-"34*0*6=0",
-"34*0*7=0",
-"34*0*8=0",
-"34*0*9=0",
-"34*0/1=0",
-"34*0/2=0",
-"34*0/3=0",
-"34*0/4=0",
-"34*0/5=0",
-"34*0/6=0",
-"34*0/7=0",
-"34*0/8=0",
-"34*0/9=0",
-"34*1*0=0",
-"34*2*0=0",
-"34*3*0=0",
-"34*3=102",
-"34*4*0=0",
-"34*4=136",
-"34*5*0=0",
-"34*5=170",
-"34*6*0=0",
-"34*6=204",
-"34*7*0=0",
-"34*7=238",
-"34*8*0=0",
-"34*8=272",
-"34*9*0=0",
-"34*9=306",
-"34/1*0=0",
-"34/2-8=9",
-"34/2-9=8",
-"34/2*0=0",
-"34/3*0=0",
-"34/4*0=0",
-"34/5*0=0",
-"34/6*0=0",
-"34/7*0=0",
-"34/8*0=0",
-"34/9*0=0",
-"3500*0=0",
-"3501*0=0",
-"3502*0=0",
-"3503*0=0",
-"3504*0=0",
-"3505*0=0",
-"3506*0=0",
-"3507*0=0",
-"3508*0=0",
-"3509*0=0",
-"350/50=7",
-"350/5=70",
-"350/70=5",
-"350/7=50",
-"3510*0=0",
-"3511*0=0",
-"3512*0=0",
-"3513*0=0",
-"3514*0=0",
-"3515*0=0",
-"3516*0=0",
-"3517*0=0",
-"3518*0=0",
-"3519*0=0",
-"351/39=9",
-"351/9=39",
-"3520*0=0",
-"3521*0=0",
-"3522*0=0",
-"3523*0=0",
-"3524*0=0",
-"3525*0=0",
-"3526*0=0",
-"3527*0=0",
-"3528*0=0",
-"3529*0=0",
-"352/44=8",
-"352/4=88",
-"352/88=4",
-"352/8=44",
-"3530*0=0",
-"3531*0=0",
-"3532*0=0",
-"3533*0=0",
-"3534*0=0",
-"3535*0=0",
-"3536*0=0",
-"3537*0=0",
-"3538*0=0",
-"3539*0=0",
-"3540*0=0",
-"3541*0=0",
-"3542*0=0",
-"3543*0=0",
-"3544*0=0",
-"3545*0=0",
-"3546*0=0",
-"3547*0=0",
-"3548*0=0",
-"3549*0=0",
-"354/59=6",
-"354/6=59",
-"3550*0=0",
-"3551*0=0",
-"3552*0=0",
-"3553*0=0",
-"3554*0=0",
-"3555*0=0",
-"3556*0=0",
-"3557*0=0",
-"3558*0=0",
-"3559*0=0",
-"355/5=71",
-"355/71=5",
-"3560*0=0",
-"3561*0=0",
-"3562*0=0",
-"3563*0=0",
-"3564*0=0",
-"3565*0=0",
-"3566*0=0",
-"3567*0=0",
-"3568*0=0",
-"3569*0=0",
-"356/4=89",
-"356/89=4",
-"3570*0=0",
-"3571*0=0",
-"3572*0=0",
-"3573*0=0",
-"3574*0=0",
-"3575*0=0",
-"3576*0=0",
-"3577*0=0",
-"3578*0=0",
-"3579*0=0",
-"357/51=7",
-"357/7=51",
-"3580*0=0",
-"3581*0=0",
-"3582*0=0",
-"3583*0=0",
-"3584*0=0",
-"3585*0=0",
-"3586*0=0",
-"3587*0=0",
-"3588*0=0",
-"3589*0=0",
-"3590*0=0",
-"3591*0=0",
-"3592*0=0",
-"3593*0=0",
-"3594*0=0",
-"3595*0=0",
-"3596*0=0",
-"3597*0=0",
-"3598*0=0",
-"3599*0=0",
-"35+10=45",
-"35+11=46",
-"35+12=47",
-"35+13=48",
-"35+14=49",
-"35+15=50",
-"35+16=51",
-"35+17=52",
-"35+18=53",
-"35+19=54",
-"35+20=55",
-"35+21=56",
-"35+22=57",
-"35+23=58",
-"35+24=59",
-"35+25=60",
-"35+26=61",
-"35+27=62",
-"35+28=63",
-"35+29=64",
-"35+30=65",
-"35+31=66",
-"35+32=67",
-"35+33=68",
-"35+34=69",
-"35+35=70",
-"35+36=71",
-"35+37=72",
-"35+38=73",
-"35+39=74",
-"35+40=75",
-"35+41=76",
-"35+42=77",
-"35+43=78",
-"35+44=79",
-"35+45=80",
-"35+46=81",
-"35+47=82",
-"35+48=83",
-"35+49=84",
-"35+50=85",
-"35+51=86",
-"35+52=87",
-"35+53=88",
-"35+54=89",
-"35+55=90",
-"35+56=91",
-"35+57=92",
-"35+58=93",
-"35+59=94",
-"35+60=95",
-"35+61=96",
-"35+62=97",
-"35+63=98",
-"35+64=99",
-"35-10=25",
-"35-11=24",
-"35-12=23",
-"35-13=22",
-"35-14=21",
-"35-15=20",
-"35-16=19",
-"35-17=18",
-"35-18=17",
-"35-19=16",
-"35-20=15",
-"35-21=14",
-"35-22=13",
-"35-23=12",
-"35-24=11",
-"35-25=10",
-"35-36=-1",
-"35-37=-2",
-"35-38=-3",
-"35-39=-4",
-"35-3*9=8",
-"35-40=-5",
-"35-41=-6",
-"35-42=-7",
-"35-43=-8",
-"35-44=-9",
-"35-4*7=7",
-"35-4*8=3",
-"35-5*6=5",
-"35-5*7=0",
-"35-6*5=5",
-"35-7*4=7",
-"35-7*5=0",
-"35-8*4=3",
-"35-9*3=8",
-"35*0+0=0",
-"35*0+1=1",
-"35*0+2=2",
-"35*0+3=3",
-"35*0+4=4",
-"35*0+5=5",
-"35*0+6=6",
-"35*0+7=7",
-"35*0+8=8",
-"35*0+9=9",
-"35*0-0=0",
-"35*0*0=0",
-"35*0*1=0",
-"35*0*2=0",
-"35*0*3=0",
-"35*0*4=0",
-"35*0*5=0",
-"35*0*6=0",
-"35*0*7=0",
-"35*0*8=0",
-"35*0*9=0",
-"35*0/1=0",
-"35*0/2=0",
-"35*0/3=0",
-"35*0/4=0",
-"35*0/5=0",
-"35*0/6=0",
-"35*0/7=0",
-"35*0/8=0",
-"35*0/9=0",
-"35*1*0=0",
-"35*1/5=7",
-"35*1/7=5",
-"35*2*0=0",
-"35*3*0=0",
-"35*3=105",
-"35*4*0=0",
-"35*4=140",
-"35*5*0=0",
-"35*5=175",
-"35*6*0=0",
-"35*6=210",
-"35*7*0=0",
-"35*7=245",
-"35*8*0=0",
-"35*8=280",
-"35*9*0=0",
-"35*9=315",
-"35/1*0=0",
-"35/1/5=7",
-"35/1/7=5",
-"35/2*0=0",
-"35/3*0=0",
-"35/4*0=0",
-"35/5+0=7",
-"35/5+1=8",
-"35/5+2=9",
-"35/5-0=7",
-"35/5-1=6",
-"35/5-2=5",
-"35/5-3=4",
-"35/5-4=3",
-"35/5-5=2",
-"35/5-6=1",
-"35/5-7=0",
-"35/5*0=0",
-"35/5*1=7",
-"35/5/1=7",
-"35/5/7=1",
-"35/6*0=0",
-"35/7+0=5",
-"35/7+1=6",
-"35/7+2=7",
-"35/7+3=8",
-"35/7+4=9",
-"35/7-0=5",
-"35/7-1=4",
-"35/7-2=3",
-"35/7-3=2",
-"35/7-4=1",
-"35/7-5=0",
-"35/7*0=0",
-"35/7*1=5",
-"35/7/1=5",
-"35/7/5=1",
-"35/8*0=0",
-"35/9*0=0",
-"3600*0=0",
-"3601*0=0",
-"3602*0=0",
-"3603*0=0",
-"3604*0=0",
-"3605*0=0",
-"3606*0=0",
-"3607*0=0",
-"3608*0=0",
-"3609*0=0",
-"360/40=9",
-"360/45=8",
-"360/4=90",
-"360/5=72",
-"360/60=6",
-"360/6=60",
-"360/72=5",
-"360/8=45",
-"360/90=4",
-"360/9=40",
-"3610*0=0",
-"3611*0=0",
-"3612*0=0",
-"3613*0=0",
-"3614*0=0",
-"3615*0=0",
-"3616*0=0",
-"3617*0=0",
-"3618*0=0",
-"3619*0=0",
-"3620*0=0",
-"3621*0=0",
-"3622*0=0",
-"3623*0=0",
-"3624*0=0",
-"3625*0=0",
-"3626*0=0",
-"3627*0=0",
-"3628*0=0",
-"3629*0=0",
-"3630*0=0",
-"3631*0=0",
-"3632*0=0",
-"3633*0=0",
-"3634*0=0",
-"3635*0=0",
-"3636*0=0",
-"3637*0=0",
-"3638*0=0",
-"3639*0=0",
-"3640*0=0",
-"3641*0=0",
-"3642*0=0",
-"3643*0=0",
-"3644*0=0",
-"3645*0=0",
-"3646*0=0",
-"3647*0=0",
-"3648*0=0",
-"3649*0=0",
-"364/4=91",
-"364/52=7",
-"364/7=52",
-"364/91=4",
-"3650*0=0",
-"3651*0=0",
-"3652*0=0",
-"3653*0=0",
-"3654*0=0",
-"3655*0=0",
-"3656*0=0",
-"3657*0=0",
-"3658*0=0",
-"3659*0=0",
-"365/5=73",
-"365/73=5",
-"3660*0=0",
-"3661*0=0",
-"3662*0=0",
-"3663*0=0",
-"3664*0=0",
-"3665*0=0",
-"3666*0=0",
-"3667*0=0",
-"3668*0=0",
-"3669*0=0",
-"366/61=6",
-"366/6=61",
-"3670*0=0",
-"3671*0=0",
-"3672*0=0",
-"3673*0=0",
-"3674*0=0",
-"3675*0=0",
-"3676*0=0",
-"3677*0=0",
-"3678*0=0",
-"3679*0=0",
-"3680*0=0",
-"3681*0=0",
-"3682*0=0",
-"3683*0=0",
-"3684*0=0",
-"3685*0=0",
-"3686*0=0",
-"3687*0=0",
-"3688*0=0",
-"3689*0=0",
-"368/46=8",
-"368/4=92",
-"368/8=46",
-"368/92=4",
-"3690*0=0",
-"3691*0=0",
-"3692*0=0",
-"3693*0=0",
-"3694*0=0",
-"3695*0=0",
-"3696*0=0",
-"3697*0=0",
-"3698*0=0",
-"3699*0=0",
-"369/41=9",
-"369/9=41",
-"36+10=46",
-"36+11=47",
-"36+12=48",
-"36+13=49",
-"36+14=50",
-"36+15=51",
-"36+16=52",
-"36+17=53",
-"36+18=54",
-"36+19=55",
-"36+20=56",
-"36+21=57",
-"36+22=58",
-"36+23=59",
-"36+24=60",
-"36+25=61",
-"36+26=62",
-"36+27=63",
-"36+28=64",
-"36+29=65",
-"36+30=66",
-"36+31=67",
-"36+32=68",
-"36+33=69",
-"36+34=70",
-"36+35=71",
-"36+36=72",
-"36+37=73",
-"36+38=74",
-"36+39=75",
-"36+40=76",
-"36+41=77",
-"36+42=78",
-"36+43=79",
-"36+44=80",
-"36+45=81",
-"36+46=82",
-"36+47=83",
-"36+48=84",
-"36+49=85",
-"36+50=86",
-"36+51=87",
-"36+52=88",
-"36+53=89",
-"36+54=90",
-"36+55=91",
-"36+56=92",
-"36+57=93",
-"36+58=94",
-"36+59=95",
-"36+60=96",
-"36+61=97",
-"36+62=98",
-"36+63=99",
-"36-10=26",
-"36-11=25",
-"36-12=24",
-"36-13=23",
-"36-14=22",
-"36-15=21",
-"36-16=20",
-"36-17=19",
-"36-18=18",
-"36-19=17",
-"36-20=16",
-"36-21=15",
-"36-22=14",
-"36-23=13",
-"36-24=12",
-"36-25=11",
-"36-26=10",
-"36-37=-1",
-"36-38=-2",
-"36-39=-3",
-"36-3*9=9",
-"36-40=-4",
-"36-41=-5",
-"36-42=-6",
-"36-43=-7",
-"36-44=-8",
-"36-45=-9",
-"36-4*7=8",
-"36-4*8=4",
-"36-4*9=0",
-"36-5*6=6",
-"36-5*7=1",
-"36-6*5=6",
-"36-6*6=0",
-"36-7*4=8",
-"36-7*5=1",
-"36-8*4=4",
-"36-9*3=9",
-"36-9*4=0",
-"36*0+0=0",
-"36*0+1=1",
-"36*0+2=2",
-"36*0+3=3",
-"36*0+4=4",
-"36*0+5=5",
-"36*0+6=6",
-"36*0+7=7",
-"36*0+8=8",
-"36*0+9=9",
-"36*0-0=0",
-"36*0*0=0",
-"36*0*1=0",
-"36*0*2=0",
-"36*0*3=0",
-"36*0*4=0",
-"36*0*5=0",
-"36*0*6=0",
-"36*0*7=0",
-"36*0*8=0",
-"36*0*9=0",
-"36*0/1=0",
-"36*0/2=0",
-"36*0/3=0",
-"36*0/4=0",
-"36*0/5=0",
-"36*0/6=0",
-"36*0/7=0",
-"36*0/8=0",
-"36*0/9=0",
-"36*1*0=0",
-"36*1/4=9",
-"36*1/6=6",
-"36*1/9=4",
-"36*2*0=0",
-"36*2/8=9",
-"36*2/9=8",
-"36*3*0=0",
-"36*3=108",
-"36*4*0=0",
-"36*4=144",
-"36*5*0=0",
-"36*5=180",
-"36*6*0=0",
-"36*6=216",
-"36*7*0=0",
-"36*7=252",
-"36*8*0=0",
-"36*8=288",
-"36*9*0=0",
-"36*9=324",
-"36/1*0=0",
-"36/1/4=9",
-"36/1/6=6",
-"36/1/9=4",
-"36/2-9=9",
-"36/2*0=0",
-"36/2/2=9",
-"36/2/3=6",
-"36/2/6=3",
-"36/2/9=2",
-"36/3-3=9",
-"36/3-4=8",
-"36/3-5=7",
-"36/3-6=6",
-"36/3-7=5",
-"36/3-8=4",
-"36/3-9=3",
-"36/3*0=0",
-"36/3/2=6",
-"36/3/3=4",
-"36/3/4=3",
-"36/3/6=2",
-"36/4+0=9",
-"36/4-0=9",
-"36/4-1=8",
-"36/4-2=7",
-"36/4-3=6",
-"36/4-4=5",
-"36/4-5=4",
-"36/4-6=3",
-"36/4-7=2",
-"36/4-8=1",
-"36/4-9=0",
-"36/4*0=0",
-"36/4*1=9",
-"36/4/1=9",
-"36/4/3=3",
-"36/4/9=1",
-"36/5*0=0",
-"36/6+0=6",
-"36/6+1=7",
-"36/6+2=8",
-"36/6+3=9",
-"36/6-0=6",
-"36/6-1=5",
-"36/6-2=4",
-"36/6-3=3",
-"36/6-4=2",
-"36/6-5=1",
-"36/6-6=0",
-"36/6*0=0",
-"36/6*1=6",
-"36/6/1=6",
-"36/6/2=3",
-"36/6/3=2",
-"36/6/6=1",
-"36/7*0=0",
-"36/8*0=0",
-"36/8*2=9",
-"36/9+0=4",
-"36/9+1=5",
-"36/9+2=6",
-"36/9+3=7",
-"36/9+4=8",
-"36/9+5=9",
-"36/9-0=4",
-"36/9-1=3",
-"36/9-2=2",
-"36/9-3=1",
-"36/9-4=0",
-"36/9*0=0",
-"36/9*1=4",
-"36/9*2=8",
-"36/9/1=4",
-"36/9/2=2",
-"36/9/4=1",
-"3700*0=0",
-"3701*0=0",
-"3702*0=0",
-"3703*0=0",
-"3704*0=0",
-"3705*0=0",
-"3706*0=0",
-"3707*0=0",
-"3708*0=0",
-"3709*0=0",
-"370/5=74",
-"370/74=5",
-"3710*0=0",
-"3711*0=0",
-"3712*0=0",
-"3713*0=0",
-"3714*0=0",
-"3715*0=0",
-"3716*0=0",
-"3717*0=0",
-"3718*0=0",
-"3719*0=0",
-"371/53=7",
-"371/7=53",
-"3720*0=0",
-"3721*0=0",
-"3722*0=0",
-"3723*0=0",
-"3724*0=0",
-"3725*0=0",
-"3726*0=0",
-"3727*0=0",
-"3728*0=0",
-"3729*0=0",
-"372/4=93",
-"372/62=6",
-"372/6=62",
-"372/93=4",
-"3730*0=0",
-"3731*0=0",
-"3732*0=0",
-"3733*0=0",
-"3734*0=0",
-"3735*0=0",
-"3736*0=0",
-"3737*0=0",
-"3738*0=0",
-"3739*0=0",
-"3740*0=0",
-"3741*0=0",
-"3742*0=0",
-"3743*0=0",
-"3744*0=0",
-"3745*0=0",
-"3746*0=0",
-"3747*0=0",
-"3748*0=0",
-"3749*0=0",
-"3750*0=0",
-"3751*0=0",
-"3752*0=0",
-"3753*0=0",
-"3754*0=0",
-"3755*0=0",
-"3756*0=0",
-"3757*0=0",
-"3758*0=0",
-"3759*0=0",
-"375/5=75",
-"375/75=5",
-"3760*0=0",
-"3761*0=0",
-"3762*0=0",
-"3763*0=0",
-"3764*0=0",
-"3765*0=0",
-"3766*0=0",
-"3767*0=0",
-"3768*0=0",
-"3769*0=0",
-"376/47=8",
-"376/4=94",
-"376/8=47",
-"376/94=4",
-"3770*0=0",
-"3771*0=0",
-"3772*0=0",
-"3773*0=0",
-"3774*0=0",
-"3775*0=0",
-"3776*0=0",
-"3777*0=0",
-"3778*0=0",
-"3779*0=0",
-"3780*0=0",
-"3781*0=0",
-"3782*0=0",
-"3783*0=0",
-"3784*0=0",
-"3785*0=0",
-"3786*0=0",
-"3787*0=0",
-"3788*0=0",
-"3789*0=0",
-"378/42=9",
-"378/54=7",
-"378/63=6",
-"378/6=63",
-"378/7=54",
-"378/9=42",
-"3790*0=0",
-"3791*0=0",
-"3792*0=0",
-"3793*0=0",
-"3794*0=0",
-"3795*0=0",
-"3796*0=0",
-"3797*0=0",
-"3798*0=0",
-"3799*0=0",
-"37+10=47",
-"37+11=48",
-"37+12=49",
-"37+13=50",
-"37+14=51",
-"37+15=52",
-"37+16=53",
-"37+17=54",
-"37+18=55",
-"37+19=56",
-"37+20=57",
-"37+21=58",
-"37+22=59",
-"37+23=60",
-"37+24=61",
-"37+25=62",
-"37+26=63",
-"37+27=64",
-"37+28=65",
-"37+29=66",
-"37+30=67",
-"37+31=68",
-"37+32=69",
-"37+33=70",
-"37+34=71",
-"37+35=72",
-"37+36=73",
-"37+37=74",
-"37+38=75",
-"37+39=76",
-"37+40=77",
-"37+41=78",
-"37+42=79",
-"37+43=80",
-"37+44=81",
-"37+45=82",
-"37+46=83",
-"37+47=84",
-"37+48=85",
-"37+49=86",
-"37+50=87",
-"37+51=88",
-"37+52=89",
-"37+53=90",
-"37+54=91",
-"37+55=92",
-"37+56=93",
-"37+57=94",
-"37+58=95",
-"37+59=96",
-"37+60=97",
-"37+61=98",
-"37+62=99",
-"37-10=27",
-"37-11=26",
-"37-12=25",
-"37-13=24",
-"37-14=23",
-"37-15=22",
-"37-16=21",
-"37-17=20",
-"37-18=19",
-"37-19=18",
-"37-20=17",
-"37-21=16",
-"37-22=15",
-"37-23=14",
-"37-24=13",
-"37-25=12",
-"37-26=11",
-"37-27=10",
-"37-38=-1",
-"37-39=-2",
-"37-40=-3",
-"37-41=-4",
-"37-42=-5",
-"37-43=-6",
-"37-44=-7",
-"37-45=-8",
-"37-46=-9",
-"37-4*7=9",
-"37-4*8=5",
-"37-4*9=1",
-"37-5*6=7",
-"37-5*7=2",
-"37-6*5=7",
-"37-6*6=1",
-"37-7*4=9",
-"37-7*5=2",
-"37-8*4=5",
-"37-9*4=1",
-"37*0+0=0",
-"37*0+1=1",
-"37*0+2=2",
-"37*0+3=3",
-"37*0+4=4",
-"37*0+5=5",
-"37*0+6=6",
-"37*0+7=7",
-"37*0+8=8",
-"37*0+9=9",
-"37*0-0=0",
-"37*0*0=0",
-"37*0*1=0",
-"37*0*2=0",
-"37*0*3=0",
-"37*0*4=0",
-"37*0*5=0",
-"37*0*6=0",
-"37*0*7=0",
-"37*0*8=0",
-"37*0*9=0",
-"37*0/1=0",
-"37*0/2=0",
-"37*0/3=0",
-"37*0/4=0",
-"37*0/5=0",
-"37*0/6=0",
-"37*0/7=0",
-"37*0/8=0",
-"37*0/9=0",
-"37*1*0=0",
-"37*2*0=0",
-"37*3*0=0",
-"37*3=111",
-"37*4*0=0",
-"37*4=148",
-"37*5*0=0",
-"37*5=185",
-"37*6*0=0",
-"37*6=222",
-"37*7*0=0",
-"37*7=259",
-"37*8*0=0",
-"37*8=296",
-"37*9*0=0",
-"37*9=333",
-"37/1*0=0",
-"37/2*0=0",
-"37/3*0=0",
-"37/4*0=0",
-"37/5*0=0",
-"37/6*0=0",
-"37/7*0=0",
-"37/8*0=0",
-"37/9*0=0",
-"3800*0=0",
-"3801*0=0",
-"3802*0=0",
-"3803*0=0",
-"3804*0=0",
-"3805*0=0",
-"3806*0=0",
-"3807*0=0",
-"3808*0=0",
-"3809*0=0",
-"380/4=95",
-"380/5=76",
-"380/76=5",
-"380/95=4",
-"3810*0=0",
-"3811*0=0",
-"3812*0=0",
-"3813*0=0",
-"3814*0=0",
-"3815*0=0",
-"3816*0=0",
-"3817*0=0",
-"3818*0=0",
-"3819*0=0",
-"3820*0=0",
-"3821*0=0",
-"3822*0=0",
-"3823*0=0",
-"3824*0=0",
-"3825*0=0",
-"3826*0=0",
-"3827*0=0",
-"3828*0=0",
-"3829*0=0",
-"3830*0=0",
-"3831*0=0",
-"3832*0=0",
-"3833*0=0",
-"3834*0=0",
-"3835*0=0",
-"3836*0=0",
-"3837*0=0",
-"3838*0=0",
-"3839*0=0",
-"3840*0=0",
-"3841*0=0",
-"3842*0=0",
-"3843*0=0",
-"3844*0=0",
-"3845*0=0",
-"3846*0=0",
-"3847*0=0",
-"3848*0=0",
-"3849*0=0",
-"384/48=8",
-"384/4=96",
-"384/64=6",
-"384/6=64",
-"384/8=48",
-"384/96=4",
-"3850*0=0",
-"3851*0=0",
-"3852*0=0",
-"3853*0=0",
-"3854*0=0",
-"3855*0=0",
-"3856*0=0",
-"3857*0=0",
-"3858*0=0",
-"3859*0=0",
-"385/55=7",
-"385/5=77",
-"385/77=5",
-"385/7=55",
-"3860*0=0",
-"3861*0=0",
-"3862*0=0",
-"3863*0=0",
-"3864*0=0",
-"3865*0=0",
-"3866*0=0",
-"3867*0=0",
-"3868*0=0",
-"3869*0=0",
-"3870*0=0",
-"3871*0=0",
-"3872*0=0",
-"3873*0=0",
-"3874*0=0",
-"3875*0=0",
-"3876*0=0",
-"3877*0=0",
-"3878*0=0",
-"3879*0=0",
-"387/43=9",
-"387/9=43",
-"3880*0=0",
-"3881*0=0",
-"3882*0=0",
-"3883*0=0",
-"3884*0=0",
-"3885*0=0",
-"3886*0=0",
-"3887*0=0",
-"3888*0=0",
-"3889*0=0",
-"388/4=97",
-"388/97=4",
-"3890*0=0",
-"3891*0=0",
-"3892*0=0",
-"3893*0=0",
-"3894*0=0",
-"3895*0=0",
-"3896*0=0",
-"3897*0=0",
-"3898*0=0",
-"3899*0=0",
-"38+10=48",
-"38+11=49",
-"38+12=50",
-"38+13=51",
-"38+14=52",
-"38+15=53",
-"38+16=54",
-"38+17=55",
-"38+18=56",
-"38+19=57",
-"38+20=58",
-"38+21=59",
-"38+22=60",
-"38+23=61",
-"38+24=62",
-"38+25=63",
-"38+26=64",
-"38+27=65",
-"38+28=66",
-"38+29=67",
-"38+30=68",
-"38+31=69",
-"38+32=70",
-"38+33=71",
-"38+34=72",
-"38+35=73",
-"38+36=74",
-"38+37=75",
-"38+38=76",
-"38+39=77",
-"38+40=78",
-"38+41=79",
-"38+42=80",
-"38+43=81",
-"38+44=82",
-"38+45=83",
-"38+46=84",
-"38+47=85",
-"38+48=86",
-"38+49=87",
-"38+50=88",
-"38+51=89",
-"38+52=90",
-"38+53=91",
-"38+54=92",
-"38+55=93",
-"38+56=94",
-"38+57=95",
-"38+58=96",
-"38+59=97",
-"38+60=98",
-"38+61=99",
-"38-10=28",
-"38-11=27",
-"38-12=26",
-"38-13=25",
-"38-14=24",
-"38-15=23",
-"38-16=22",
-"38-17=21",
-"38-18=20",
-"38-19=19",
-"38-20=18",
-"38-21=17",
-"38-22=16",
-"38-23=15",
-"38-24=14",
-"38-25=13",
-"38-26=12",
-"38-27=11",
-"38-28=10",
-"38-39=-1",
-"38-40=-2",
-"38-41=-3",
-"38-42=-4",
-"38-43=-5",
-"38-44=-6",
-"38-45=-7",
-"38-46=-8",
-"38-47=-9",
-"38-4*8=6",
-"38-4*9=2",
-"38-5*6=8",
-"38-5*7=3",
-"38-6*5=8",
-"38-6*6=2",
-"38-7*5=3",
-"38-8*4=6",
-"38-9*4=2",
-"38*0+0=0",
-"38*0+1=1",
-"38*0+2=2",
-"38*0+3=3",
-"38*0+4=4",
-"38*0+5=5",
-"38*0+6=6",
-"38*0+7=7",
-"38*0+8=8",
-"38*0+9=9",
-"38*0-0=0",
-"38*0*0=0",
-"38*0*1=0",
-"38*0*2=0",
-"38*0*3=0",
-"38*0*4=0",
-"38*0*5=0",
-"38*0*6=0",
-"38*0*7=0",
-"38*0*8=0",
-"38*0*9=0",
-"38*0/1=0",
-"38*0/2=0",
-"38*0/3=0",
-"38*0/4=0",
-"38*0/5=0",
-"38*0/6=0",
-"38*0/7=0",
-"38*0/8=0",
-"38*0/9=0",
-"38*1*0=0",
-"38*2*0=0",
-"38*3*0=0",
-"38*3=114",
-"38*4*0=0",
-"38*4=152",
-"38*5*0=0",
-"38*5=190",
-"38*6*0=0",
-"38*6=228",
-"38*7*0=0",
-"38*7=266",
-"38*8*0=0",
-"38*8=304",
-"38*9*0=0",
-"38*9=342",
-"38/1*0=0",
-"38/2*0=0",
-"38/3*0=0",
-"38/4*0=0",
-"38/5*0=0",
-"38/6*0=0",
-"38/7*0=0",
-"38/8*0=0",
-"38/9*0=0",
-"3900*0=0",
-"3901*0=0",
-"3902*0=0",
-"3903*0=0",
-"3904*0=0",
-"3905*0=0",
-"3906*0=0",
-"3907*0=0",
-"3908*0=0",
-"3909*0=0",
-"390/5=78",
-"390/65=6",
-"390/6=65",
-"390/78=5",
-"3910*0=0",
-"3911*0=0",
-"3912*0=0",
-"3913*0=0",
-"3914*0=0",
-"3915*0=0",
-"3916*0=0",
-"3917*0=0",
-"3918*0=0",
-"3919*0=0",
-"3920*0=0",
-"3921*0=0",
-"3922*0=0",
-"3923*0=0",
-"3924*0=0",
-"3925*0=0",
-"3926*0=0",
-"3927*0=0",
-"3928*0=0",
-"3929*0=0",
-"392/49=8",
-"392/4=98",
-"392/56=7",
-"392/7=56",
-"392/8=49",
-"392/98=4",
-"3930*0=0",
-"3931*0=0",
-"3932*0=0",
-"3933*0=0",
-"3934*0=0",
-"3935*0=0",
-"3936*0=0",
-"3937*0=0",
-"3938*0=0",
-"3939*0=0",
-"3940*0=0",
-"3941*0=0",
-"3942*0=0",
-"3943*0=0",
-"3944*0=0",
-"3945*0=0",
-"3946*0=0",
-"3947*0=0",
-"3948*0=0",
-"3949*0=0",
-"3950*0=0",
-"3951*0=0",
-"3952*0=0",
-"3953*0=0",
-"3954*0=0",
-"3955*0=0",
-"3956*0=0",
-"3957*0=0",
-"3958*0=0",
-"3959*0=0",
-"395/5=79",
-"395/79=5",
-"3960*0=0",
-"3961*0=0",
-"3962*0=0",
-"3963*0=0",
-"3964*0=0",
-"3965*0=0",
-"3966*0=0",
-"3967*0=0",
-"3968*0=0",
-"3969*0=0",
-"396/44=9",
-"396/4=99",
-"396/66=6",
-"396/6=66",
-"396/99=4",
-"396/9=44",
-"3970*0=0",
-"3971*0=0",
-"3972*0=0",
-"3973*0=0",
-"3974*0=0",
-"3975*0=0",
-"3976*0=0",
-"3977*0=0",
-"3978*0=0",
-"3979*0=0",
-"3980*0=0",
-"3981*0=0",
-"3982*0=0",
-"3983*0=0",
-"3984*0=0",
-"3985*0=0",
-"3986*0=0",
-"3987*0=0",
-"3988*0=0",
-"3989*0=0",
-"3990*0=0",
-"3991*0=0",
-"3992*0=0",
-"3993*0=0",
-"3994*0=0",
-"3995*0=0",
-"3996*0=0",
-"3997*0=0",
-"3998*0=0",
-"3999*0=0",
-"399/57=7",
-"399/7=57",
-"39+10=49",
-"39+11=50",
-"39+12=51",
-"39+13=52",
-"39+14=53",
-"39+15=54",
-"39+16=55",
-"39+17=56",
-"39+18=57",
-"39+19=58",
-"39+20=59",
-"39+21=60",
-"39+22=61",
-"39+23=62",
-"39+24=63",
-"39+25=64",
-"39+26=65",
-"39+27=66",
-"39+28=67",
-"39+29=68",
-"39+30=69",
-"39+31=70",
-"39+32=71",
-"39+33=72",
-"39+34=73",
-"39+35=74",
-"39+36=75",
-"39+37=76",
-"39+38=77",
-"39+39=78",
-"39+40=79",
-"39+41=80",
-"39+42=81",
-"39+43=82",
-"39+44=83",
-"39+45=84",
-"39+46=85",
-"39+47=86",
-"39+48=87",
-"39+49=88",
-"39+50=89",
-"39+51=90",
-"39+52=91",
-"39+53=92",
-"39+54=93",
-"39+55=94",
-"39+56=95",
-"39+57=96",
-"39+58=97",
-"39+59=98",
-"39+60=99",
-"39-10=29",
-"39-11=28",
-"39-12=27",
-"39-13=26",
-"39-14=25",
-"39-15=24",
-"39-16=23",
-"39-17=22",
-"39-18=21",
-"39-19=20",
-"39-20=19",
-"39-21=18",
-"39-22=17",
-"39-23=16",
-"39-24=15",
-"39-25=14",
-"39-26=13",
-"39-27=12",
-"39-28=11",
-"39-29=10",
-"39-40=-1",
-"39-41=-2",
-"39-42=-3",
-"39-43=-4",
-"39-44=-5",
-"39-45=-6",
-"39-46=-7",
-"39-47=-8",
-"39-48=-9",
-"39-4*8=7",
-"39-4*9=3",
-"39-5*6=9",
-"39-5*7=4",
-"39-6*5=9",
-"39-6*6=3",
-"39-7*5=4",
-"39-8*4=7",
-"39-9*4=3",
-"39*0+0=0",
-"39*0+1=1",
-"39*0+2=2",
-"39*0+3=3",
-"39*0+4=4",
-"39*0+5=5",
-"39*0+6=6",
-"39*0+7=7",
-"39*0+8=8",
-"39*0+9=9",
-"39*0-0=0",
-"39*0*0=0",
-"39*0*1=0",
-"39*0*2=0",
-"39*0*3=0",
-"39*0*4=0",
-"39*0*5=0",
-"39*0*6=0",
-"39*0*7=0",
-"39*0*8=0",
-"39*0*9=0",
-"39*0/1=0",
-"39*0/2=0",
-"39*0/3=0",
-"39*0/4=0",
-"39*0/5=0",
-"39*0/6=0",
-"39*0/7=0",
-"39*0/8=0",
-"39*0/9=0",
-"39*1*0=0",
-"39*2*0=0",
-"39*3*0=0",
-"39*3=117",
-"39*4*0=0",
-"39*4=156",
-"39*5*0=0",
-"39*5=195",
-"39*6*0=0",
-"39*6=234",
-"39*7*0=0",
-"39*7=273",
-"39*8*0=0",
-"39*8=312",
-"39*9*0=0",
-"39*9=351",
-"39/1*0=0",
-"39/2*0=0",
-"39/3-4=9",
-"39/3-5=8",
-"39/3-6=7",
-"39/3-7=6",
-"39/3-8=5",
-"39/3-9=4",
-"39/3*0=0",
-"39/4*0=0",
-"39/5*0=0",
-"39/6*0=0",
-"39/7*0=0",
-"39/8*0=0",
-"39/9*0=0",
-"3+0+7=10",
-"3+0+8=11",
-"3+0+9=12",
-"3+0-4=-1",
-"3+0-5=-2",
-"3+0-6=-3",
-"3+0-7=-4",
-"3+0-8=-5",
-"3+0-9=-6",
-"3+0*10=3",
-"3+0*11=3",
-"3+0*12=3",
-"3+0*13=3",
-"3+0*14=3",
-"3+0*15=3",
-"3+0*16=3",
-"3+0*17=3",
-"3+0*18=3",
-"3+0*19=3",
-"3+0*20=3",
-"3+0*21=3",
-"3+0*22=3",
-"3+0*23=3",
-"3+0*24=3",
-"3+0*25=3",
-"3+0*26=3",
-"3+0*27=3",
-"3+0*28=3",
-"3+0*29=3",
-"3+0*30=3",
-"3+0*31=3",
-"3+0*32=3",
-"3+0*33=3",
-"3+0*34=3",
-"3+0*35=3",
-"3+0*36=3",
-"3+0*37=3",
-"3+0*38=3",
-"3+0*39=3",
-"3+0*40=3",
-"3+0*41=3",
-"3+0*42=3",
-"3+0*43=3",
-"3+0*44=3",
-"3+0*45=3",
-"3+0*46=3",
-"3+0*47=3",
-"3+0*48=3",
-"3+0*49=3",
-"3+0*50=3",
-"3+0*51=3",
-"3+0*52=3",
-"3+0*53=3",
-"3+0*54=3",
-"3+0*55=3",
-"3+0*56=3",
-"3+0*57=3",
-"3+0*58=3",
-"3+0*59=3",
-"3+0*60=3",
-"3+0*61=3",
-"3+0*62=3",
-"3+0*63=3",
-"3+0*64=3",
-"3+0*65=3",
-"3+0*66=3",
-"3+0*67=3",
-"3+0*68=3",
-"3+0*69=3",
-"3+0*70=3",
-"3+0*71=3",
-"3+0*72=3",
-"3+0*73=3",
-"3+0*74=3",
-"3+0*75=3",
-"3+0*76=3",
-"3+0*77=3",
-"3+0*78=3",
-"3+0*79=3",
-"3+0*80=3",
-"3+0*81=3",
-"3+0*82=3",
-"3+0*83=3",
-"3+0*84=3",
-"3+0*85=3",
-"3+0*86=3",
-"3+0*87=3",
-"3+0*88=3",
-"3+0*89=3",
-"3+0*90=3",
-"3+0*91=3",
-"3+0*92=3",
-"3+0*93=3",
-"3+0*94=3",
-"3+0*95=3",
-"3+0*96=3",
-"3+0*97=3",
-"3+0*98=3",
-"3+0*99=3",
-"3+0/10=3",
-"3+0/11=3",
-"3+0/12=3",
-"3+0/13=3",
-"3+0/14=3",
-"3+0/15=3",
-"3+0/16=3",
-"3+0/17=3",
-"3+0/18=3",
-"3+0/19=3",
-"3+0/20=3",
-"3+0/21=3",
-"3+0/22=3",
-"3+0/23=3",
-"3+0/24=3",
-"3+0/25=3",
-"3+0/26=3",
-"3+0/27=3",
-"3+0/28=3",
-"3+0/29=3",
-"3+0/30=3",
-"3+0/31=3",
-"3+0/32=3",
-"3+0/33=3",
-"3+0/34=3",
-"3+0/35=3",
-"3+0/36=3",
-"3+0/37=3",
-"3+0/38=3",
-"3+0/39=3",
-"3+0/40=3",
-"3+0/41=3",
-"3+0/42=3",
-"3+0/43=3",
-"3+0/44=3",
-"3+0/45=3",
-"3+0/46=3",
-"3+0/47=3",
-"3+0/48=3",
-"3+0/49=3",
-"3+0/50=3",
-"3+0/51=3",
-"3+0/52=3",
-"3+0/53=3",
-"3+0/54=3",
-"3+0/55=3",
-"3+0/56=3",
-"3+0/57=3",
-"3+0/58=3",
-"3+0/59=3",
-"3+0/60=3",
-"3+0/61=3",
-"3+0/62=3",
-"3+0/63=3",
-"3+0/64=3",
-"3+0/65=3",
-"3+0/66=3",
-"3+0/67=3",
-"3+0/68=3",
-"3+0/69=3",
-"3+0/70=3",
-"3+0/71=3",
-"3+0/72=3",
-"3+0/73=3",
-"3+0/74=3",
-"3+0/75=3",
-"3+0/76=3",
-"3+0/77=3",
-"3+0/78=3",
-"3+0/79=3",
-"3+0/80=3",
-"3+0/81=3",
-"3+0/82=3",
-"3+0/83=3",
-"3+0/84=3",
-"3+0/85=3",
-"3+0/86=3",
-"3+0/87=3",
-"3+0/88=3",
-"3+0/89=3",
-"3+0/90=3",
-"3+0/91=3",
-"3+0/92=3",
-"3+0/93=3",
-"3+0/94=3",
-"3+0/95=3",
-"3+0/96=3",
-"3+0/97=3",
-"3+0/98=3",
-"3+0/99=3",
-"3+10-4=9",
-"3+10-5=8",
-"3+10-6=7",
-"3+10-7=6",
-"3+10-8=5",
-"3+10-9=4",
-"3+10*0=3",
-"3+10/2=8",
-"3+10/5=5",
-"3+11-5=9",
-"3+11-6=8",
-"3+11-7=7",
-"3+11-8=6",
-"3+11-9=5",
-"3+11*0=3",
-"3+12-6=9",
-"3+12-7=8",
-"3+12-8=7",
-"3+12-9=6",
-"3+12*0=3",
-"3+12/2=9",
-"3+12/3=7",
-"3+12/4=6",
-"3+12/6=5",
-"3+13-7=9",
-"3+13-8=8",
-"3+13-9=7",
-"3+13*0=3",
-"3+14-8=9",
-"3+14-9=8",
-"3+14*0=3",
-"3+14/7=5",
-"3+15-9=9",
-"3+15*0=3",
-"3+15/3=8",
-"3+15/5=6",
-"3+16*0=3",
-"3+16/4=7",
-"3+16/8=5",
-"3+17*0=3",
-"3+18*0=3",
-"3+18/3=9",
-"3+18/6=6",
-"3+18/9=5",
-"3+19*0=3",
-"3+1+6=10",
-"3+1+7=11",
-"3+1+8=12",
-"3+1+9=13",
-"3+1-5=-1",
-"3+1-6=-2",
-"3+1-7=-3",
-"3+1-8=-4",
-"3+1-9=-5",
-"3+1*7=10",
-"3+1*8=11",
-"3+1*9=12",
-"3+20*0=3",
-"3+20/4=8",
-"3+20/5=7",
-"3+21*0=3",
-"3+21/7=6",
-"3+22*0=3",
-"3+23*0=3",
-"3+24*0=3",
-"3+24/4=9",
-"3+24/6=7",
-"3+24/8=6",
-"3+25*0=3",
-"3+25/5=8",
-"3+26*0=3",
-"3+27*0=3",
-"3+27/9=6",
-"3+28*0=3",
-"3+28/7=7",
-"3+29*0=3",
-"3+2+5=10",
-"3+2+6=11",
-"3+2+7=12",
-"3+2+8=13",
-"3+2+9=14",
-"3+2-6=-1",
-"3+2-7=-2",
-"3+2-8=-3",
-"3+2-9=-4",
-"3+2*4=11",
-"3+2*5=13",
-"3+2*6=15",
-"3+2*7=17",
-"3+2*8=19",
-"3+2*9=21",
-"3+30*0=3",
-"3+30/5=9",
-"3+30/6=8",
-"3+31*0=3",
-"3+32*0=3",
-"3+32/8=7",
-"3+33*0=3",
-"3+34*0=3",
-"3+35*0=3",
-"3+35/7=8",
-"3+36*0=3",
-"3+36/6=9",
-"3+36/9=7",
-"3+37*0=3",
-"3+38*0=3",
-"3+39*0=3",
-"3+3+4=10",
-"3+3+5=11",
-"3+3+6=12",
-"3+3+7=13",
-"3+3+8=14",
-"3+3+9=15",
-"3+3-7=-1",
-"3+3-8=-2",
-"3+3-9=-3",
-"3+3*3=12",
-"3+3*4=15",
-"3+3*5=18",
-"3+3*6=21",
-"3+3*7=24",
-"3+3*8=27",
-"3+3*9=30",
-"3+40*0=3",
-"3+40/8=8",
-"3+41*0=3",
-"3+42*0=3",
-"3+42/7=9",
-"3+43*0=3",
-"3+44*0=3",
-"3+45*0=3",
-"3+45/9=8",
-"3+46*0=3",
-"3+47*0=3",
-"3+48*0=3",
-"3+48/8=9",
-"3+49*0=3",
-"3+4+3=10",
-"3+4+4=11",
-"3+4+5=12",
-"3+4+6=13",
-"3+4+7=14",
-"3+4+8=15",
-"3+4+9=16",
-"3+4-8=-1",
-"3+4-9=-2",
-"3+4*2=11",
-"3+4*3=15",
-"3+4*4=19",
-"3+4*5=23",
-"3+4*6=27",
-"3+4*7=31",
-"3+4*8=35",
-"3+4*9=39",
-"3+50*0=3",
-"3+51*0=3",
-"3+52*0=3",
-"3+53*0=3",
-"3+54*0=3",
-"3+54/9=9",
-"3+55*0=3",
-"3+56*0=3",
-"3+57*0=3",
-"3+58*0=3",
-"3+59*0=3",
-"3+5+2=10",
-"3+5+3=11",
-"3+5+4=12",
-"3+5+5=13",
-"3+5+6=14",
-"3+5+7=15",
-"3+5+8=16",
-"3+5+9=17",
-"3+5-9=-1",
-"3+5*2=13",
-"3+5*3=18",
-"3+5*4=23",
-"3+5*5=28",
-"3+5*6=33",
-"3+5*7=38",
-"3+5*8=43",
-"3+5*9=48",
-"3+60*0=3",
-"3+61*0=3",
-"3+62*0=3",
-"3+63*0=3",
-"3+64*0=3",
-"3+65*0=3",
-"3+66*0=3",
-"3+67*0=3",
-"3+68*0=3",
-"3+69*0=3",
-"3+6+1=10",
-"3+6+2=11",
-"3+6+3=12",
-"3+6+4=13",
-"3+6+5=14",
-"3+6+6=15",
-"3+6+7=16",
-"3+6+8=17",
-"3+6+9=18",
-"3+6*2=15",
-"3+6*3=21",
-"3+6*4=27",
-"3+6*5=33",
-"3+6*6=39",
-"3+6*7=45",
-"3+6*8=51",
-"3+6*9=57",
-"3+70*0=3",
-"3+71*0=3",
-"3+72*0=3",
-"3+73*0=3",
-"3+74*0=3",
-"3+75*0=3",
-"3+76*0=3",
-"3+77*0=3",
-"3+78*0=3",
-"3+79*0=3",
-"3+7+0=10",
-"3+7+1=11",
-"3+7+2=12",
-"3+7+3=13",
-"3+7+4=14",
-"3+7+5=15",
-"3+7+6=16",
-"3+7+7=17",
-"3+7+8=18",
-"3+7+9=19",
-"3+7-0=10",
-"3+7-10=0",
-"3+7*1=10",
-"3+7*2=17",
-"3+7*3=24",
-"3+7*4=31",
-"3+7*5=38",
-"3+7*6=45",
-"3+7*7=52",
-"3+7*8=59",
-"3+7*9=66",
-"3+7/1=10",
-"3+80*0=3",
-"3+81*0=3",
-"3+82*0=3",
-"3+83*0=3",
-"3+84*0=3",
-"3+85*0=3",
-"3+86*0=3",
-"3+87*0=3",
-"3+88*0=3",
-"3+89*0=3",
-"3+8+0=11",
-"3+8+1=12",
-"3+8+2=13",
-"3+8+3=14",
-"3+8+4=15",
-"3+8+5=16",
-"3+8+6=17",
-"3+8+7=18",
-"3+8+8=19",
-"3+8+9=20",
-"3+8-0=11",
-"3+8-10=1",
-"3+8-11=0",
-"3+8-1=10",
-"3+8*1=11",
-"3+8*2=19",
-"3+8*3=27",
-"3+8*4=35",
-"3+8*5=43",
-"3+8*6=51",
-"3+8*7=59",
-"3+8*8=67",
-"3+8*9=75",
-"3+8/1=11",
-"3+90*0=3",
-"3+91*0=3",
-"3+92*0=3",
-"3+93*0=3",
-"3+94*0=3",
-"3+95*0=3",
-"3+96*0=3",
-"3+97*0=3",
-"3+97=100",
-"3+98*0=3",
-"3+98=101",
-"3+99*0=3",
-"3+99=102",
-"3+9+0=12",
-"3+9+1=13",
-"3+9+2=14",
-"3+9+3=15",
-"3+9+4=16",
-"3+9+5=17",
-"3+9+6=18",
-"3+9+7=19",
-"3+9+8=20",
-"3+9+9=21",
-"3+9-0=12",
-"3+9-10=2",
-"3+9-11=1",
-"3+9-12=0",
-"3+9-1=11",
-"3+9-2=10",
-"3+9*1=12",
-"3+9*2=21",
-"3+9*3=30",
-"3+9*4=39",
-"3+9*5=48",
-"3+9*6=57",
-"3+9*7=66",
-"3+9*8=75",
-"3+9*9=84",
-"3+9/1=12",
-"3-0+7=10",
-"3-0+8=11",
-"3-0+9=12",
-"3-0-4=-1",
-"3-0-5=-2",
-"3-0-6=-3",
-"3-0-7=-4",
-"3-0-8=-5",
-"3-0-9=-6",
-"3-0*10=3",
-"3-0*11=3",
-"3-0*12=3",
-"3-0*13=3",
-"3-0*14=3",
-"3-0*15=3",
-"3-0*16=3",
-"3-0*17=3",
-"3-0*18=3",
-"3-0*19=3",
-"3-0*20=3",
-"3-0*21=3",
-"3-0*22=3",
-"3-0*23=3",
-"3-0*24=3",
-"3-0*25=3",
-"3-0*26=3",
-"3-0*27=3",
-"3-0*28=3",
-"3-0*29=3",
-"3-0*30=3",
-"3-0*31=3",
-"3-0*32=3",
-"3-0*33=3",
-"3-0*34=3",
-"3-0*35=3",
-"3-0*36=3",
-"3-0*37=3",
-"3-0*38=3",
-"3-0*39=3",
-"3-0*40=3",
-"3-0*41=3",
-"3-0*42=3",
-"3-0*43=3",
-"3-0*44=3",
-"3-0*45=3",
-"3-0*46=3",
-"3-0*47=3",
-"3-0*48=3",
-"3-0*49=3",
-"3-0*50=3",
-"3-0*51=3",
-"3-0*52=3",
-"3-0*53=3",
-"3-0*54=3",
-"3-0*55=3",
-"3-0*56=3",
-"3-0*57=3",
-"3-0*58=3",
-"3-0*59=3",
-"3-0*60=3",
-"3-0*61=3",
-"3-0*62=3",
-"3-0*63=3",
-"3-0*64=3",
-"3-0*65=3",
-"3-0*66=3",
-"3-0*67=3",
-"3-0*68=3",
-"3-0*69=3",
-"3-0*70=3",
-"3-0*71=3",
-"3-0*72=3",
-"3-0*73=3",
-"3-0*74=3",
-"3-0*75=3",
-"3-0*76=3",
-"3-0*77=3",
-"3-0*78=3",
-"3-0*79=3",
-"3-0*80=3",
-"3-0*81=3",
-"3-0*82=3",
-"3-0*83=3",
-"3-0*84=3",
-"3-0*85=3",
-"3-0*86=3",
-"3-0*87=3",
-"3-0*88=3",
-"3-0*89=3",
-"3-0*90=3",
-"3-0*91=3",
-"3-0*92=3",
-"3-0*93=3",
-"3-0*94=3",
-"3-0*95=3",
-"3-0*96=3",
-"3-0*97=3",
-"3-0*98=3",
-"3-0*99=3",
-"3-0/10=3",
-"3-0/11=3",
-"3-0/12=3",
-"3-0/13=3",
-"3-0/14=3",
-"3-0/15=3",
-"3-0/16=3",
-"3-0/17=3",
-"3-0/18=3",
-"3-0/19=3",
-"3-0/20=3",
-"3-0/21=3",
-"3-0/22=3",
-"3-0/23=3",
-"3-0/24=3",
-"3-0/25=3",
-"3-0/26=3",
-"3-0/27=3",
-"3-0/28=3",
-"3-0/29=3",
-"3-0/30=3",
-"3-0/31=3",
-"3-0/32=3",
-"3-0/33=3",
-"3-0/34=3",
-"3-0/35=3",
-"3-0/36=3",
-"3-0/37=3",
-"3-0/38=3",
-"3-0/39=3",
-"3-0/40=3",
-"3-0/41=3",
-"3-0/42=3",
-"3-0/43=3",
-"3-0/44=3",
-"3-0/45=3",
-"3-0/46=3",
-"3-0/47=3",
-"3-0/48=3",
-"3-0/49=3",
-"3-0/50=3",
-"3-0/51=3",
-"3-0/52=3",
-"3-0/53=3",
-"3-0/54=3",
-"3-0/55=3",
-"3-0/56=3",
-"3-0/57=3",
-"3-0/58=3",
-"3-0/59=3",
-"3-0/60=3",
-"3-0/61=3",
-"3-0/62=3",
-"3-0/63=3",
-"3-0/64=3",
-"3-0/65=3",
-"3-0/66=3",
-"3-0/67=3",
-"3-0/68=3",
-"3-0/69=3",
-"3-0/70=3",
-"3-0/71=3",
-"3-0/72=3",
-"3-0/73=3",
-"3-0/74=3",
-"3-0/75=3",
-"3-0/76=3",
-"3-0/77=3",
-"3-0/78=3",
-"3-0/79=3",
-"3-0/80=3",
-"3-0/81=3",
-"3-0/82=3",
-"3-0/83=3",
-"3-0/84=3",
-"3-0/85=3",
-"3-0/86=3",
-"3-0/87=3",
-"3-0/88=3",
-"3-0/89=3",
-"3-0/90=3",
-"3-0/91=3",
-"3-0/92=3",
-"3-0/93=3",
-"3-0/94=3",
-"3-0/95=3",
-"3-0/96=3",
-"3-0/97=3",
-"3-0/98=3",
-"3-0/99=3",
-"3-10+7=0",
-"3-10+8=1",
-"3-10+9=2",
-"3-10*0=3",
-"3-10/5=1",
-"3-11+8=0",
-"3-11+9=1",
-"3-11*0=3",
-"3-12+9=0",
-"3-12*0=3",
-"3-12/4=0",
-"3-12/6=1",
-"3-13*0=3",
-"3-13=-10",
-"3-14*0=3",
-"3-14/7=1",
-"3-14=-11",
-"3-15*0=3",
-"3-15/5=0",
-"3-15=-12",
-"3-16*0=3",
-"3-16/8=1",
-"3-16=-13",
-"3-17*0=3",
-"3-17=-14",
-"3-18*0=3",
-"3-18/6=0",
-"3-18/9=1",
-"3-18=-15",
-"3-19*0=3",
-"3-19=-16",
-"3-1+8=10",
-"3-1+9=11",
-"3-1-3=-1",
-"3-1-4=-2",
-"3-1-5=-3",
-"3-1-6=-4",
-"3-1-7=-5",
-"3-1-8=-6",
-"3-1-9=-7",
-"3-1*4=-1",
-"3-1*5=-2",
-"3-1*6=-3",
-"3-1*7=-4",
-"3-1*8=-5",
-"3-1*9=-6",
-"3-20*0=3",
-"3-20=-17",
-"3-21*0=3",
-"3-21/7=0",
-"3-21=-18",
-"3-22*0=3",
-"3-22=-19",
-"3-23*0=3",
-"3-23=-20",
-"3-24*0=3",
-"3-24/8=0",
-"3-24=-21",
-"3-25*0=3",
-"3-25=-22",
-"3-26*0=3",
-"3-26=-23",
-"3-27*0=3",
-"3-27/9=0",
-"3-27=-24",
-"3-28*0=3",
-"3-28=-25",
-"3-29*0=3",
-"3-29=-26",
-"3-2+9=10",
-"3-2-2=-1",
-"3-2-3=-2",
-"3-2-4=-3",
-"3-2-5=-4",
-"3-2-6=-5",
-"3-2-7=-6",
-"3-2-8=-7",
-"3-2-9=-8",
-"3-2*2=-1",
-"3-2*3=-3",
-"3-2*4=-5",
-"3-2*5=-7",
-"3-2*6=-9",
-"3-30*0=3",
-"3-30=-27",
-"3-31*0=3",
-"3-31=-28",
-"3-32*0=3",
-"3-32=-29",
-"3-33*0=3",
-"3-33=-30",
-"3-34*0=3",
-"3-34=-31",
-"3-35*0=3",
-"3-35=-32",
-"3-36*0=3",
-"3-36=-33",
-"3-37*0=3",
-"3-37=-34",
-"3-38*0=3",
-"3-38=-35",
-"3-39*0=3",
-"3-39=-36",
-"3-3-1=-1",
-"3-3-2=-2",
-"3-3-3=-3",
-"3-3-4=-4",
-"3-3-5=-5",
-"3-3-6=-6",
-"3-3-7=-7",
-"3-3-8=-8",
-"3-3-9=-9",
-"3-3*2=-3",
-"3-3*3=-6",
-"3-3*4=-9",
-"3-40*0=3",
-"3-40=-37",
-"3-41*0=3",
-"3-41=-38",
-"3-42*0=3",
-"3-42=-39",
-"3-43*0=3",
-"3-43=-40",
-"3-44*0=3",
-"3-44=-41",
-"3-45*0=3",
-"3-45=-42",
-"3-46*0=3",
-"3-46=-43",
-"3-47*0=3",
-"3-47=-44",
-"3-48*0=3",
-"3-48=-45",
-"3-49*0=3",
-"3-49=-46",
-"3-4+0=-1",
-"3-4+10=9",
-"3-4-0=-1",
-"3-4-1=-2",
-"3-4-2=-3",
-"3-4-3=-4",
-"3-4-4=-5",
-"3-4-5=-6",
-"3-4-6=-7",
-"3-4-7=-8",
-"3-4-8=-9",
-"3-4*1=-1",
-"3-4*2=-5",
-"3-4*3=-9",
-"3-4/1=-1",
-"3-50*0=3",
-"3-50=-47",
-"3-51*0=3",
-"3-51=-48",
-"3-52*0=3",
-"3-52=-49",
-"3-53*0=3",
-"3-53=-50",
-"3-54*0=3",
-"3-54=-51",
-"3-55*0=3",
-"3-55=-52",
-"3-56*0=3",
-"3-56=-53",
-"3-57*0=3",
-"3-57=-54",
-"3-58*0=3",
-"3-58=-55",
-"3-59*0=3",
-"3-59=-56",
-"3-5+0=-2",
-"3-5+10=8",
-"3-5+11=9",
-"3-5+1=-1",
-"3-5-0=-2",
-"3-5-1=-3",
-"3-5-2=-4",
-"3-5-3=-5",
-"3-5-4=-6",
-"3-5-5=-7",
-"3-5-6=-8",
-"3-5-7=-9",
-"3-5*1=-2",
-"3-5*2=-7",
-"3-5/1=-2",
-"3-60*0=3",
-"3-60=-57",
-"3-61*0=3",
-"3-61=-58",
-"3-62*0=3",
-"3-62=-59",
-"3-63*0=3",
-"3-63=-60",
-"3-64*0=3",
-"3-64=-61",
-"3-65*0=3",
-"3-65=-62",
-"3-66*0=3",
-"3-66=-63",
-"3-67*0=3",
-"3-67=-64",
-"3-68*0=3",
-"3-68=-65",
-"3-69*0=3",
-"3-69=-66",
-"3-6+0=-3",
-"3-6+10=7",
-"3-6+11=8",
-"3-6+12=9",
-"3-6+1=-2",
-"3-6+2=-1",
-"3-6-0=-3",
-"3-6-1=-4",
-"3-6-2=-5",
-"3-6-3=-6",
-"3-6-4=-7",
-"3-6-5=-8",
-"3-6-6=-9",
-"3-6*1=-3",
-"3-6*2=-9",
-"3-6/1=-3",
-"3-70*0=3",
-"3-70=-67",
-"3-71*0=3",
-"3-71=-68",
-"3-72*0=3",
-"3-72=-69",
-"3-73*0=3",
-"3-73=-70",
-"3-74*0=3",
-"3-74=-71",
-"3-75*0=3",
-"3-75=-72",
-"3-76*0=3",
-"3-76=-73",
-"3-77*0=3",
-"3-77=-74",
-"3-78*0=3",
-"3-78=-75",
-"3-79*0=3",
-"3-79=-76",
-"3-7+0=-4",
-"3-7+10=6",
-"3-7+11=7",
-"3-7+12=8",
-"3-7+13=9",
-"3-7+1=-3",
-"3-7+2=-2",
-"3-7+3=-1",
-"3-7-0=-4",
-"3-7-1=-5",
-"3-7-2=-6",
-"3-7-3=-7",
-"3-7-4=-8",
-"3-7-5=-9",
-"3-7*1=-4",
-"3-7/1=-4",
-"3-80*0=3",
-"3-80=-77",
-"3-81*0=3",
-"3-81=-78",
-"3-82*0=3",
-"3-82=-79",
-"3-83*0=3",
-"3-83=-80",
-"3-84*0=3",
-"3-84=-81",
-"3-85*0=3",
-"3-85=-82",
-"3-86*0=3",
-"3-86=-83",
-"3-87*0=3",
-"3-87=-84",
-"3-88*0=3",
-"3-88=-85",
-"3-89*0=3",
-"3-89=-86",
-"3-8+0=-5",
-"3-8+10=5",
-"3-8+11=6",
-"3-8+12=7",
-"3-8+13=8",
-"3-8+14=9",
-"3-8+1=-4",
-"3-8+2=-3",
-"3-8+3=-2",
-"3-8+4=-1",
-"3-8-0=-5",
-"3-8-1=-6",
-"3-8-2=-7",
-"3-8-3=-8",
-"3-8-4=-9",
-"3-8*1=-5",
-"3-8/1=-5",
-"3-8/2=-1",
-"3-90*0=3",
-"3-90=-87",
-"3-91*0=3",
-"3-91=-88",
-"3-92*0=3",
-"3-92=-89",
-"3-93*0=3",
-"3-93=-90",
-"3-94*0=3",
-"3-94=-91",
-"3-95*0=3",
-"3-95=-92",
-"3-96*0=3",
-"3-96=-93",
-"3-97*0=3",
-"3-97=-94",
-"3-98*0=3",
-"3-98=-95",
-"3-99*0=3",
-"3-99=-96",
-"3-9+0=-6",
-"3-9+10=4",
-"3-9+11=5",
-"3-9+12=6",
-"3-9+13=7",
-"3-9+14=8",
-"3-9+15=9",
-"3-9+1=-5",
-"3-9+2=-4",
-"3-9+3=-3",
-"3-9+4=-2",
-"3-9+5=-1",
-"3-9-0=-6",
-"3-9-1=-7",
-"3-9-2=-8",
-"3-9-3=-9",
-"3-9*1=-6",
-"3-9/1=-6",
-"3*0-1=-1",
-"3*0-2=-2",
-"3*0-3=-3",
-"3*0-4=-4",
-"3*0-5=-5",
-"3*0-6=-6",
-"3*0-7=-7",
-"3*0-8=-8",
-"3*0-9=-9",
-"3*0*10=0",
-"3*0*11=0",
-"3*0*12=0",
-"3*0*13=0",
-"3*0*14=0",
-"3*0*15=0",
-"3*0*16=0",
-"3*0*17=0",
-"3*0*18=0",
-"3*0*19=0",
-"3*0*20=0",
-"3*0*21=0",
-"3*0*22=0",
-"3*0*23=0",
-"3*0*24=0",
-"3*0*25=0",
-"3*0*26=0",
-"3*0*27=0",
-"3*0*28=0",
-"3*0*29=0",
-"3*0*30=0",
-"3*0*31=0",
-"3*0*32=0",
-"3*0*33=0",
-"3*0*34=0",
-"3*0*35=0",
-"3*0*36=0",
-"3*0*37=0",
-"3*0*38=0",
-"3*0*39=0",
-"3*0*40=0",
-"3*0*41=0",
-"3*0*42=0",
-"3*0*43=0",
-"3*0*44=0",
-"3*0*45=0",
-"3*0*46=0",
-"3*0*47=0",
-"3*0*48=0",
-"3*0*49=0",
-"3*0*50=0",
-"3*0*51=0",
-"3*0*52=0",
-"3*0*53=0",
-"3*0*54=0",
-"3*0*55=0",
-"3*0*56=0",
-"3*0*57=0",
-"3*0*58=0",
-"3*0*59=0",
-"3*0*60=0",
-"3*0*61=0",
-"3*0*62=0",
-"3*0*63=0",
-"3*0*64=0",
-"3*0*65=0",
-"3*0*66=0",
-"3*0*67=0",
-"3*0*68=0",
-"3*0*69=0",
-"3*0*70=0",
-"3*0*71=0",
-"3*0*72=0",
-"3*0*73=0",
-"3*0*74=0",
-"3*0*75=0",
-"3*0*76=0",
-"3*0*77=0",
-"3*0*78=0",
-"3*0*79=0",
-"3*0*80=0",
-"3*0*81=0",
-"3*0*82=0",
-"3*0*83=0",
-"3*0*84=0",
-"3*0*85=0",
-"3*0*86=0",
-"3*0*87=0",
-"3*0*88=0",
-"3*0*89=0",
-"3*0*90=0",
-"3*0*91=0",
-"3*0*92=0",
-"3*0*93=0",
-"3*0*94=0",
-"3*0*95=0",
-"3*0*96=0",
-"3*0*97=0",
-"3*0*98=0",
-"3*0*99=0",
-"3*0/10=0",
-"3*0/11=0",
-"3*0/12=0",
-"3*0/13=0",
-"3*0/14=0",
-"3*0/15=0",
-"3*0/16=0",
-"3*0/17=0",
-"3*0/18=0",
-"3*0/19=0",
-"3*0/20=0",
-"3*0/21=0",
-"3*0/22=0",
-"3*0/23=0",
-"3*0/24=0",
-"3*0/25=0",
-"3*0/26=0",
-"3*0/27=0",
-"3*0/28=0",
-"3*0/29=0",
-"3*0/30=0",
-"3*0/31=0",
-"3*0/32=0",
-"3*0/33=0",
-"3*0/34=0",
-"3*0/35=0",
-"3*0/36=0",
-"3*0/37=0",
-"3*0/38=0",
-"3*0/39=0",
-"3*0/40=0",
-"3*0/41=0",
-"3*0/42=0",
-"3*0/43=0",
-"3*0/44=0",
-"3*0/45=0",
-"3*0/46=0",
-"3*0/47=0",
-"3*0/48=0",
-"3*0/49=0",
-"3*0/50=0",
-"3*0/51=0",
-"3*0/52=0",
-"3*0/53=0",
-"3*0/54=0",
-"3*0/55=0",
-"3*0/56=0",
-"3*0/57=0",
-"3*0/58=0",
-"3*0/59=0",
-"3*0/60=0",
-"3*0/61=0",
-"3*0/62=0",
-"3*0/63=0",
-"3*0/64=0",
-"3*0/65=0",
-"3*0/66=0",
-"3*0/67=0",
-"3*0/68=0",
-"3*0/69=0",
-"3*0/70=0",
-"3*0/71=0",
-"3*0/72=0",
-"3*0/73=0",
-"3*0/74=0",
-"3*0/75=0",
-"3*0/76=0",
-"3*0/77=0",
-"3*0/78=0",
-"3*0/79=0",
-"3*0/80=0",
-"3*0/81=0",
-"3*0/82=0",
-"3*0/83=0",
-"3*0/84=0",
-"3*0/85=0",
-"3*0/86=0",
-"3*0/87=0",
-"3*0/88=0",
-"3*0/89=0",
-"3*0/90=0",
-"3*0/91=0",
-"3*0/92=0",
-"3*0/93=0",
-"3*0/94=0",
-"3*0/95=0",
-"3*0/96=0",
-"3*0/97=0",
-"3*0/98=0",
-"3*0/99=0",
-"3*10*0=0",
-"3*10/5=6",
-"3*10/6=5",
-"3*11*0=0",
-"3*12*0=0",
-"3*12/4=9",
-"3*12/6=6",
-"3*12/9=4",
-"3*13*0=0",
-"3*14*0=0",
-"3*14/6=7",
-"3*14/7=6",
-"3*15*0=0",
-"3*15/5=9",
-"3*15/9=5",
-"3*16*0=0",
-"3*16/6=8",
-"3*16/8=6",
-"3*17*0=0",
-"3*18*0=0",
-"3*18/6=9",
-"3*18/9=6",
-"3*19*0=0",
-"3*1+7=10",
-"3*1+8=11",
-"3*1+9=12",
-"3*1-4=-1",
-"3*1-5=-2",
-"3*1-6=-3",
-"3*1-7=-4",
-"3*1-8=-5",
-"3*1-9=-6",
-"3*1*4=12",
-"3*1*5=15",
-"3*1*6=18",
-"3*1*7=21",
-"3*1*8=24",
-"3*1*9=27",
-"3*20*0=0",
-"3*21*0=0",
-"3*21/7=9",
-"3*21/9=7",
-"3*22*0=0",
-"3*23*0=0",
-"3*24*0=0",
-"3*24/8=9",
-"3*24/9=8",
-"3*25*0=0",
-"3*26*0=0",
-"3*27*0=0",
-"3*27/9=9",
-"3*28*0=0",
-"3*29*0=0",
-"3*2+4=10",
-"3*2+5=11",
-"3*2+6=12",
-"3*2+7=13",
-"3*2+8=14",
-"3*2+9=15",
-"3*2-7=-1",
-"3*2-8=-2",
-"3*2-9=-3",
-"3*2*2=12",
-"3*2*3=18",
-"3*2*4=24",
-"3*2*5=30",
-"3*2*6=36",
-"3*2*7=42",
-"3*2*8=48",
-"3*2*9=54",
-"3*30*0=0",
-"3*31*0=0",
-"3*32*0=0",
-"3*33*0=0",
-"3*34*0=0",
-"3*34=102",
-"3*35*0=0",
-"3*35=105",
-"3*36*0=0",
-"3*36=108",
-"3*37*0=0",
-"3*37=111",
-"3*38*0=0",
-"3*38=114",
-"3*39*0=0",
-"3*39=117",
-"3*3+1=10",
-"3*3+2=11",
-"3*3+3=12",
-"3*3+4=13",
-"3*3+5=14",
-"3*3+6=15",
-"3*3+7=16",
-"3*3+8=17",
-"3*3+9=18",
-"3*3*2=18",
-"3*3*3=27",
-"3*3*4=36",
-"3*3*5=45",
-"3*3*6=54",
-"3*3*7=63",
-"3*3*8=72",
-"3*3*9=81",
-"3*40*0=0",
-"3*40=120",
-"3*41*0=0",
-"3*41=123",
-"3*42*0=0",
-"3*42=126",
-"3*43*0=0",
-"3*43=129",
-"3*44*0=0",
-"3*44=132",
-"3*45*0=0",
-"3*45=135",
-"3*46*0=0",
-"3*46=138",
-"3*47*0=0",
-"3*47=141",
-"3*48*0=0",
-"3*48=144",
-"3*49*0=0",
-"3*49=147",
-"3*4+0=12",
-"3*4+1=13",
-"3*4+2=14",
-"3*4+3=15",
-"3*4+4=16",
-"3*4+5=17",
-"3*4+6=18",
-"3*4+7=19",
-"3*4+8=20",
-"3*4+9=21",
-"3*4-0=12",
-"3*4-10=2",
-"3*4-11=1",
-"3*4-12=0",
-"3*4-1=11",
-"3*4-2=10",
-"3*4*1=12",
-"3*4*2=24",
-"3*4*3=36",
-"3*4*4=48",
-"3*4*5=60",
-"3*4*6=72",
-"3*4*7=84",
-"3*4*8=96",
-"3*4/12=1",
-"3*4/1=12",
-"3*50*0=0",
-"3*50=150",
-"3*51*0=0",
-"3*51=153",
-"3*52*0=0",
-"3*52=156",
-"3*53*0=0",
-"3*53=159",
-"3*54*0=0",
-"3*54=162",
-"3*55*0=0",
-"3*55=165",
-"3*56*0=0",
-"3*56=168",
-"3*57*0=0",
-"3*57=171",
-"3*58*0=0",
-"3*58=174",
-"3*59*0=0",
-"3*59=177",
-"3*5+0=15",
-"3*5+1=16",
-"3*5+2=17",
-"3*5+3=18",
-"3*5+4=19",
-"3*5+5=20",
-"3*5+6=21",
-"3*5+7=22",
-"3*5+8=23",
-"3*5+9=24",
-"3*5-0=15",
-"3*5-10=5",
-"3*5-11=4",
-"3*5-12=3",
-"3*5-13=2",
-"3*5-14=1",
-"3*5-15=0",
-"3*5-1=14",
-"3*5-2=13",
-"3*5-3=12",
-"3*5-4=11",
-"3*5-5=10",
-"3*5*1=15",
-"3*5*2=30",
-"3*5*3=45",
-"3*5*4=60",
-"3*5*5=75",
-"3*5*6=90",
-"3*5/15=1",
-"3*5/1=15",
-"3*60*0=0",
-"3*60=180",
-"3*61*0=0",
-"3*61=183",
-"3*62*0=0",
-"3*62=186",
-"3*63*0=0",
-"3*63=189",
-"3*64*0=0",
-"3*64=192",
-"3*65*0=0",
-"3*65=195",
-"3*66*0=0",
-"3*66=198",
-"3*67*0=0",
-"3*67=201",
-"3*68*0=0",
-"3*68=204",
-"3*69*0=0",
-"3*69=207",
-"3*6+0=18",
-"3*6+1=19",
-"3*6+2=20",
-"3*6+3=21",
-"3*6+4=22",
-"3*6+5=23",
-"3*6+6=24",
-"3*6+7=25",
-"3*6+8=26",
-"3*6+9=27",
-"3*6-0=18",
-"3*6-10=8",
-"3*6-11=7",
-"3*6-12=6",
-"3*6-13=5",
-"3*6-14=4",
-"3*6-15=3",
-"3*6-16=2",
-"3*6-17=1",
-"3*6-18=0",
-"3*6-1=17",
-"3*6-2=16",
-"3*6-3=15",
-"3*6-4=14",
-"3*6-5=13",
-"3*6-6=12",
-"3*6-7=11",
-"3*6-8=10",
-"3*6*1=18",
-"3*6*2=36",
-"3*6*3=54",
-"3*6*4=72",
-"3*6*5=90",
-"3*6/18=1",
-"3*6/1=18",
-"3*70*0=0",
-"3*70=210",
-"3*71*0=0",
-"3*71=213",
-"3*72*0=0",
-"3*72=216",
-"3*73*0=0",
-"3*73=219",
-"3*74*0=0",
-"3*74=222",
-"3*75*0=0",
-"3*75=225",
-"3*76*0=0",
-"3*76=228",
-"3*77*0=0",
-"3*77=231",
-"3*78*0=0",
-"3*78=234",
-"3*79*0=0",
-"3*79=237",
-"3*7+0=21",
-"3*7+1=22",
-"3*7+2=23",
-"3*7+3=24",
-"3*7+4=25",
-"3*7+5=26",
-"3*7+6=27",
-"3*7+7=28",
-"3*7+8=29",
-"3*7+9=30",
-"3*7-0=21",
-"3*7-12=9",
-"3*7-13=8",
-"3*7-14=7",
-"3*7-15=6",
-"3*7-16=5",
-"3*7-17=4",
-"3*7-18=3",
-"3*7-19=2",
-"3*7-1=20",
-"3*7-20=1",
-"3*7-21=0",
-"3*7-2=19",
-"3*7-3=18",
-"3*7-4=17",
-"3*7-5=16",
-"3*7-6=15",
-"3*7-7=14",
-"3*7-8=13",
-"3*7-9=12",
-"3*7*1=21",
-"3*7*2=42",
-"3*7*3=63",
-"3*7*4=84",
-"3*7/1=21",
-"3*7/21=1",
-"3*80*0=0",
-"3*80=240",
-"3*81*0=0",
-"3*81=243",
-"3*82*0=0",
-"3*82=246",
-"3*83*0=0",
-"3*83=249",
-"3*84*0=0",
-"3*84=252",
-"3*85*0=0",
-"3*85=255",
-"3*86*0=0",
-"3*86=258",
-"3*87*0=0",
-"3*87=261",
-"3*88*0=0",
-"3*88=264",
-"3*89*0=0",
-"3*89=267",
-"3*8+0=24",
-"3*8+1=25",
-"3*8+2=26",
-"3*8+3=27",
-"3*8+4=28",
-"3*8+5=29",
-"3*8+6=30",
-"3*8+7=31",
-"3*8+8=32",
-"3*8+9=33",
-"3*8-0=24",
-"3*8-15=9",
-"3*8-16=8",
-"3*8-17=7",
-"3*8-18=6",
-"3*8-19=5",
-"3*8-1=23",
-"3*8-20=4",
-"3*8-21=3",
-"3*8-22=2",
-"3*8-23=1",
-"3*8-24=0",
-"3*8-2=22",
-"3*8-3=21",
-"3*8-4=20",
-"3*8-5=19",
-"3*8-6=18",
-"3*8-7=17",
-"3*8-8=16",
-"3*8-9=15",
-"3*8*1=24",
-"3*8*2=48",
-"3*8*3=72",
-"3*8*4=96",
-"3*8/12=2",
-"3*8/1=24",
-"3*8/24=1",
-"3*8/2=12",
-"3*90*0=0",
-"3*90=270",
-"3*91*0=0",
-"3*91=273",
-"3*92*0=0",
-"3*92=276",
-"3*93*0=0",
-"3*93=279",
-"3*94*0=0",
-"3*94=282",
-"3*95*0=0",
-"3*95=285",
-"3*96*0=0",
-"3*96=288",
-"3*97*0=0",
-"3*97=291",
-"3*98*0=0",
-"3*98=294",
-"3*99*0=0",
-"3*99=297",
-"3*9+0=27",
-"3*9+1=28",
-"3*9+2=29",
-"3*9+3=30",
-"3*9+4=31",
-"3*9+5=32",
-"3*9+6=33",
-"3*9+7=34",
-"3*9+8=35",
-"3*9+9=36",
-"3*9-0=27",
-"3*9-18=9",
-"3*9-19=8",
-"3*9-1=26",
-"3*9-20=7",
-"3*9-21=6",
-"3*9-22=5",
-"3*9-23=4",
-"3*9-24=3",
-"3*9-25=2",
-"3*9-26=1",
-"3*9-27=0",
-"3*9-2=25",
-"3*9-3=24",
-"3*9-4=23",
-"3*9-5=22",
-"3*9-6=21",
-"3*9-7=20",
-"3*9-8=19",
-"3*9-9=18",
-"3*9*1=27",
-"3*9*2=54",
-"3*9*3=81",
-"3*9/1=27",
-"3*9/27=1",
-"3/10*0=0",
-"3/11*0=0",
-"3/12*0=0",
-"3/12*4=1",
-"3/12*8=2",
-"3/13*0=0",
-"3/14*0=0",
-"3/15*0=0",
-"3/15*5=1",
-"3/16*0=0",
-"3/17*0=0",
-"3/18*0=0",
-"3/18*6=1",
-"3/19*0=0",
-"3/1+7=10",
-"3/1+8=11",
-"3/1+9=12",
-"3/1-4=-1",
-"3/1-5=-2",
-"3/1-6=-3",
-"3/1-7=-4",
-"3/1-8=-5",
-"3/1-9=-6",
-"3/1*4=12",
-"3/1*5=15",
-"3/1*6=18",
-"3/1*7=21",
-"3/1*8=24",
-"3/1*9=27",
-"3/20*0=0",
-"3/21*0=0",
-"3/21*7=1",
-"3/22*0=0",
-"3/23*0=0",
-"3/24*0=0",
-"3/24*8=1",
-"3/25*0=0",
-"3/26*0=0",
-"3/27*0=0",
-"3/27*9=1",
-"3/28*0=0",
-"3/29*0=0",
-"3/2*8=12",
-"3/30*0=0",
-"3/31*0=0",
-"3/32*0=0",
-"3/33*0=0",
-"3/34*0=0",
-"3/35*0=0",
-"3/36*0=0",
-"3/37*0=0",
-"3/38*0=0",
-"3/39*0=0",
-"3/3+9=10",
-"3/3-2=-1",
-"3/3-3=-2",
-"3/3-4=-3",
-"3/3-5=-4",
-"3/3-6=-5",
-"3/3-7=-6",
-"3/3-8=-7",
-"3/3-9=-8",
-"3/40*0=0",
-"3/41*0=0",
-"3/42*0=0",
-"3/43*0=0",
-"3/44*0=0",
-"3/45*0=0",
-"3/46*0=0",
-"3/47*0=0",
-"3/48*0=0",
-"3/49*0=0",
-"3/4*12=9",
-"3/50*0=0",
-"3/51*0=0",
-"3/52*0=0",
-"3/53*0=0",
-"3/54*0=0",
-"3/55*0=0",
-"3/56*0=0",
-"3/57*0=0",
-"3/58*0=0",
-"3/59*0=0",
-"3/5*10=6",
-"3/5*15=9",
-"3/60*0=0",
-"3/61*0=0",
-"3/62*0=0",
-"3/63*0=0",
-"3/64*0=0",
-"3/65*0=0",
-"3/66*0=0",
-"3/67*0=0",
-"3/68*0=0",
-"3/69*0=0",
-"3/6*10=5",
-"3/6*12=6",
-"3/6*14=7",
-"3/6*16=8",
-"3/6*18=9",
-"3/70*0=0",
-"3/71*0=0",
-"3/72*0=0",
-"3/73*0=0",
-"3/74*0=0",
-"3/75*0=0",
-"3/76*0=0",
-"3/77*0=0",
-"3/78*0=0",
-"3/79*0=0",
-"3/7*14=6",
-"3/7*21=9",
-"3/80*0=0",
-"3/81*0=0",
-"3/82*0=0",
-"3/83*0=0",
-"3/84*0=0",
-"3/85*0=0",
-"3/86*0=0",
-"3/87*0=0",
-"3/88*0=0",
-"3/89*0=0",
-"3/8*16=6",
-"3/8*24=9",
-"3/90*0=0",
-"3/91*0=0",
-"3/92*0=0",
-"3/93*0=0",
-"3/94*0=0",
-"3/95*0=0",
-"3/96*0=0",
-"3/97*0=0",
-"3/98*0=0",
-"3/99*0=0",
-"3/9*12=4",
-"3/9*15=5",
-"3/9*18=6",
-"3/9*21=7",
-"3/9*24=8",
-"3/9*27=9",
-"4000*0=0",
-"4001*0=0",
-"4002*0=0",
-"4003*0=0",
-"4004*0=0",
-"4005*0=0",
-"4006*0=0",
-"4007*0=0",
-"4008*0=0",
-"4009*0=0",
-"400/50=8",
-"400/5=80",
-"400/80=5",
-"400/8=50",
-"4010*0=0",
-"4011*0=0",
-"4012*0=0",
-"4013*0=0",
-"4014*0=0",
-"4015*0=0",
-"4016*0=0",
-"4017*0=0",
-"4018*0=0",
-"4019*0=0",
-"4020*0=0",
-"4021*0=0",
-"4022*0=0",
-"4023*0=0",
-"4024*0=0",
-"4025*0=0",
-"4026*0=0",
-"4027*0=0",
-"4028*0=0",
-"4029*0=0",
-"402/67=6",
-"402/6=67",
-"4030*0=0",
-"4031*0=0",
-"4032*0=0",
-"4033*0=0",
-"4034*0=0",
-"4035*0=0",
-"4036*0=0",
-"4037*0=0",
-"4038*0=0",
-"4039*0=0",
-"4040*0=0",
-"4041*0=0",
-"4042*0=0",
-"4043*0=0",
-"4044*0=0",
-"4045*0=0",
-"4046*0=0",
-"4047*0=0",
-"4048*0=0",
-"4049*0=0",
-"4050*0=0",
-"4051*0=0",
-"4052*0=0",
-"4053*0=0",
-"4054*0=0",
-"4055*0=0",
-"4056*0=0",
-"4057*0=0",
-"4058*0=0",
-"4059*0=0",
-"405/45=9",
-"405/5=81",
-"405/81=5",
-"405/9=45",
-"4060*0=0",
-"4061*0=0",
-"4062*0=0",
-"4063*0=0",
-"4064*0=0",
-"4065*0=0",
-"4066*0=0",
-"4067*0=0",
-"4068*0=0",
-"4069*0=0",
-"406/58=7",
-"406/7=58",
-"4070*0=0",
-"4071*0=0",
-"4072*0=0",
-"4073*0=0",
-"4074*0=0",
-"4075*0=0",
-"4076*0=0",
-"4077*0=0",
-"4078*0=0",
-"4079*0=0",
-"4080*0=0",
-"4081*0=0",
-"4082*0=0",
-"4083*0=0",
-"4084*0=0",
-"4085*0=0",
-"4086*0=0",
-"4087*0=0",
-"4088*0=0",
-"4089*0=0",
-"408/51=8",
-"408/68=6",
-"408/6=68",
-"408/8=51",
-"4090*0=0",
-"4091*0=0",
-"4092*0=0",
-"4093*0=0",
-"4094*0=0",
-"4095*0=0",
-"4096*0=0",
-"4097*0=0",
-"4098*0=0",
-"4099*0=0",
-"40+10=50",
-"40+11=51",
-"40+12=52",
-"40+13=53",
-"40+14=54",
-"40+15=55",
-"40+16=56",
-"40+17=57",
-"40+18=58",
-"40+19=59",
-"40+20=60",
-"40+21=61",
-"40+22=62",
-"40+23=63",
-"40+24=64",
-"40+25=65",
-"40+26=66",
-"40+27=67",
-"40+28=68",
-"40+29=69",
-"40+30=70",
-"40+31=71",
-"40+32=72",
-"40+33=73",
-"40+34=74",
-"40+35=75",
-"40+36=76",
-"40+37=77",
-"40+38=78",
-"40+39=79",
-"40+40=80",
-"40+41=81",
-"40+42=82",
-"40+43=83",
-"40+44=84",
-"40+45=85",
-"40+46=86",
-"40+47=87",
-"40+48=88",
-"40+49=89",
-"40+50=90",
-"40+51=91",
-"40+52=92",
-"40+53=93",
-"40+54=94",
-"40+55=95",
-"40+56=96",
-"40+57=97",
-"40+58=98",
-"40+59=99",
-"40-10=30",
-"40-11=29",
-"40-12=28",
-"40-13=27",
-"40-14=26",
-"40-15=25",
-"40-16=24",
-"40-17=23",
-"40-18=22",
-"40-19=21",
-"40-20=20",
-"40-21=19",
-"40-22=18",
-"40-23=17",
-"40-24=16",
-"40-25=15",
-"40-26=14",
-"40-27=13",
-"40-28=12",
-"40-29=11",
-"40-30=10",
-"40-41=-1",
-"40-42=-2",
-"40-43=-3",
-"40-44=-4",
-"40-45=-5",
-"40-46=-6",
-"40-47=-7",
-"40-48=-8",
-"40-49=-9",
-"40-4*8=8",
-"40-4*9=4",
-"40-5*7=5",
-"40-5*8=0",
-"40-6*6=4",
-"40-7*5=5",
-"40-8*4=8",
-"40-8*5=0",
-"40-9*4=4",
-"40*0+0=0",
-"40*0+1=1",
-"40*0+2=2",
-"40*0+3=3",
-"40*0+4=4",
-"40*0+5=5",
-"40*0+6=6",
-"40*0+7=7",
-"40*0+8=8",
-"40*0+9=9",
-"40*0-0=0",
-"40*0*0=0",
-"40*0*1=0",
-"40*0*2=0",
-"40*0*3=0",
-"40*0*4=0",
-"40*0*5=0",
-"40*0*6=0",
-"40*0*7=0",
-"40*0*8=0",
-"40*0*9=0",
-"40*0/1=0",
-"40*0/2=0",
-"40*0/3=0",
-"40*0/4=0",
-"40*0/5=0",
-"40*0/6=0",
-"40*0/7=0",
-"40*0/8=0",
-"40*0/9=0",
-"40*1*0=0",
-"40*1/5=8",
-"40*1/8=5",
-"40*2*0=0",
-"40*3*0=0",
-"40*3=120",
-"40*4*0=0",
-"40*4=160",
-"40*5*0=0",
-"40*5=200",
-"40*6*0=0",
-"40*6=240",
-"40*7*0=0",
-"40*7=280",
-"40*8*0=0",
-"40*8=320",
-"40*9*0=0",
-"40*9=360",
-"40/1*0=0",
-"40/1/5=8",
-"40/1/8=5",
-"40/2*0=0",
-"40/2/4=5",
-"40/2/5=4",
-"40/3*0=0",
-"40/4-1=9",
-"40/4-2=8",
-"40/4-3=7",
-"40/4-4=6",
-"40/4-5=5",
-"40/4-6=4",
-"40/4-7=3",
-"40/4-8=2",
-"40/4-9=1",
-"40/4*0=0",
-"40/4/2=5",
-"40/4/5=2",
-"40/5+0=8",
-"40/5+1=9",
-"40/5-0=8",
-"40/5-1=7",
-"40/5-2=6",
-"40/5-3=5",
-"40/5-4=4",
-"40/5-5=3",
-"40/5-6=2",
-"40/5-7=1",
-"40/5-8=0",
-"40/5*0=0",
-"40/5*1=8",
-"40/5/1=8",
-"40/5/2=4",
-"40/5/4=2",
-"40/5/8=1",
-"40/6*0=0",
-"40/7*0=0",
-"40/8+0=5",
-"40/8+1=6",
-"40/8+2=7",
-"40/8+3=8",
-"40/8+4=9",
-"40/8-0=5",
-"40/8-1=4",
-"40/8-2=3",
-"40/8-3=2",
-"40/8-4=1",
-"40/8-5=0",
-"40/8*0=0",
-"40/8*1=5",
-"40/8/1=5",
-"40/8/5=1",
-"40/9*0=0",
-"4100*0=0",
-"4101*0=0",
-"4102*0=0",
-"4103*0=0",
-"4104*0=0",
-"4105*0=0",
-"4106*0=0",
-"4107*0=0",
-"4108*0=0",
-"4109*0=0",
-"410/5=82",
-"410/82=5",
-"4110*0=0",
-"4111*0=0",
-"4112*0=0",
-"4113*0=0",
-"4114*0=0",
-"4115*0=0",
-"4116*0=0",
-"4117*0=0",
-"4118*0=0",
-"4119*0=0",
-"4120*0=0",
-"4121*0=0",
-"4122*0=0",
-"4123*0=0",
-"4124*0=0",
-"4125*0=0",
-"4126*0=0",
-"4127*0=0",
-"4128*0=0",
-"4129*0=0",
-"4130*0=0",
-"4131*0=0",
-"4132*0=0",
-"4133*0=0",
-"4134*0=0",
-"4135*0=0",
-"4136*0=0",
-"4137*0=0",
-"4138*0=0",
-"4139*0=0",
-"413/59=7",
-"413/7=59",
-"4140*0=0",
-"4141*0=0",
-"4142*0=0",
-"4143*0=0",
-"4144*0=0",
-"4145*0=0",
-"4146*0=0",
-"4147*0=0",
-"4148*0=0",
-"4149*0=0",
-"414/46=9",
-"414/69=6",
-"414/6=69",
-"414/9=46",
-"4150*0=0",
-"4151*0=0",
-"4152*0=0",
-"4153*0=0",
-"4154*0=0",
-"4155*0=0",
-"4156*0=0",
-"4157*0=0",
-"4158*0=0",
-"4159*0=0",
-"415/5=83",
-"415/83=5",
-"4160*0=0",
-"4161*0=0",
-"4162*0=0",
-"4163*0=0",
-"4164*0=0",
-"4165*0=0",
-"4166*0=0",
-"4167*0=0",
-"4168*0=0",
-"4169*0=0",
-"416/52=8",
-"416/8=52",
-"4170*0=0",
-"4171*0=0",
-"4172*0=0",
-"4173*0=0",
-"4174*0=0",
-"4175*0=0",
-"4176*0=0",
-"4177*0=0",
-"4178*0=0",
-"4179*0=0",
-"4180*0=0",
-"4181*0=0",
-"4182*0=0",
-"4183*0=0",
-"4184*0=0",
-"4185*0=0",
-"4186*0=0",
-"4187*0=0",
-"4188*0=0",
-"4189*0=0",
-"4190*0=0",
-"4191*0=0",
-"4192*0=0",
-"4193*0=0",
-"4194*0=0",
-"4195*0=0",
-"4196*0=0",
-"4197*0=0",
-"4198*0=0",
-"4199*0=0",
-"41+10=51",
-"41+11=52",
-"41+12=53",
-"41+13=54",
-"41+14=55",
-"41+15=56",
-"41+16=57",
-"41+17=58",
-"41+18=59",
-"41+19=60",
-"41+20=61",
-"41+21=62",
-"41+22=63",
-"41+23=64",
-"41+24=65",
-"41+25=66",
-"41+26=67",
-"41+27=68",
-"41+28=69",
-"41+29=70",
-"41+30=71",
-"41+31=72",
-"41+32=73",
-"41+33=74",
-"41+34=75",
-"41+35=76",
-"41+36=77",
-"41+37=78",
-"41+38=79",
-"41+39=80",
-"41+40=81",
-"41+41=82",
-"41+42=83",
-"41+43=84",
-"41+44=85",
-"41+45=86",
-"41+46=87",
-"41+47=88",
-"41+48=89",
-"41+49=90",
-"41+50=91",
-"41+51=92",
-"41+52=93",
-"41+53=94",
-"41+54=95",
-"41+55=96",
-"41+56=97",
-"41+57=98",
-"41+58=99",
-"41-10=31",
-"41-11=30",
-"41-12=29",
-"41-13=28",
-"41-14=27",
-"41-15=26",
-"41-16=25",
-"41-17=24",
-"41-18=23",
-"41-19=22",
-"41-20=21",
-"41-21=20",
-"41-22=19",
-"41-23=18",
-"41-24=17",
-"41-25=16",
-"41-26=15",
-"41-27=14",
-"41-28=13",
-"41-29=12",
-"41-30=11",
-"41-31=10",
-"41-42=-1",
-"41-43=-2",
-"41-44=-3",
-"41-45=-4",
-"41-46=-5",
-"41-47=-6",
-"41-48=-7",
-"41-49=-8",
-"41-4*8=9",
-"41-4*9=5",
-"41-50=-9",
-"41-5*7=6",
-"41-5*8=1",
-"41-6*6=5",
-"41-7*5=6",
-"41-8*4=9",
-"41-8*5=1",
-"41-9*4=5",
-"41*0+0=0",
-"41*0+1=1",
-"41*0+2=2",
-"41*0+3=3",
-"41*0+4=4",
-"41*0+5=5",
-"41*0+6=6",
-"41*0+7=7",
-"41*0+8=8",
-"41*0+9=9",
-"41*0-0=0",
-"41*0*0=0",
-"41*0*1=0",
-"41*0*2=0",
-"41*0*3=0",
-"41*0*4=0",
-"41*0*5=0",
-"41*0*6=0",
-"41*0*7=0",
-"41*0*8=0",
-"41*0*9=0",
-"41*0/1=0",
-"41*0/2=0",
-"41*0/3=0",
-"41*0/4=0",
-"41*0/5=0",
-"41*0/6=0",
-"41*0/7=0",
-"41*0/8=0",
-"41*0/9=0",
-"41*1*0=0",
-"41*2*0=0",
-"41*3*0=0",
-"41*3=123",
-"41*4*0=0",
-"41*4=164",
-"41*5*0=0",
-"41*5=205",
-"41*6*0=0",
-"41*6=246",
-"41*7*0=0",
-"41*7=287",
-"41*8*0=0",
-"41*8=328",
-"41*9*0=0",
-"41*9=369",
-"41/1*0=0",
-"41/2*0=0",
-"41/3*0=0",
-"41/4*0=0",
-"41/5*0=0",
-"41/6*0=0",
-"41/7*0=0",
-"41/8*0=0",
-"41/9*0=0",
-"4200*0=0",
-"4201*0=0",
-"4202*0=0",
-"4203*0=0",
-"4204*0=0",
-"4205*0=0",
-"4206*0=0",
-"4207*0=0",
-"4208*0=0",
-"4209*0=0",
-"420/5=84",
-"420/60=7",
-"420/6=70",
-"420/70=6",
-"420/7=60",
-"420/84=5",
-"4210*0=0",
-"4211*0=0",
-"4212*0=0",
-"4213*0=0",
-"4214*0=0",
-"4215*0=0",
-"4216*0=0",
-"4217*0=0",
-"4218*0=0",
-"4219*0=0",
-"4220*0=0",
-"4221*0=0",
-"4222*0=0",
-"4223*0=0",
-"4224*0=0",
-"4225*0=0",
-"4226*0=0",
-"4227*0=0",
-"4228*0=0",
-"4229*0=0",
-"4230*0=0",
-"4231*0=0",
-"4232*0=0",
-"4233*0=0",
-"4234*0=0",
-"4235*0=0",
-"4236*0=0",
-"4237*0=0",
-"4238*0=0",
-"4239*0=0",
-"423/47=9",
-"423/9=47",
-"4240*0=0",
-"4241*0=0",
-"4242*0=0",
-"4243*0=0",
-"4244*0=0",
-"4245*0=0",
-"4246*0=0",
-"4247*0=0",
-"4248*0=0",
-"4249*0=0",
-"424/53=8",
-"424/8=53",
-"4250*0=0",
-"4251*0=0",
-"4252*0=0",
-"4253*0=0",
-"4254*0=0",
-"4255*0=0",
-"4256*0=0",
-"4257*0=0",
-"4258*0=0",
-"4259*0=0",
-"425/5=85",
-"425/85=5",
-"4260*0=0",
-"4261*0=0",
-"4262*0=0",
-"4263*0=0",
-"4264*0=0",
-"4265*0=0",
-"4266*0=0",
-"4267*0=0",
-"4268*0=0",
-"4269*0=0",
-"426/6=71",
-"426/71=6",
-"4270*0=0",
-"4271*0=0",
-"4272*0=0",
-"4273*0=0",
-"4274*0=0",
-"4275*0=0",
-"4276*0=0",
-"4277*0=0",
-"4278*0=0",
-"4279*0=0",
-"427/61=7",
-"427/7=61",
-"4280*0=0",
-"4281*0=0",
-"4282*0=0",
-"4283*0=0",
-"4284*0=0",
-"4285*0=0",
-"4286*0=0",
-"4287*0=0",
-"4288*0=0",
-"4289*0=0",
-"4290*0=0",
-"4291*0=0",
-"4292*0=0",
-"4293*0=0",
-"4294*0=0",
-"4295*0=0",
-"4296*0=0",
-"4297*0=0",
-"4298*0=0",
-"4299*0=0",
-"42+10=52",
-"42+11=53",
-"42+12=54",
-"42+13=55",
-"42+14=56",
-"42+15=57",
-"42+16=58",
-"42+17=59",
-"42+18=60",
-"42+19=61",
-"42+20=62",
-"42+21=63",
-"42+22=64",
-"42+23=65",
-"42+24=66",
-"42+25=67",
-"42+26=68",
-"42+27=69",
-"42+28=70",
-"42+29=71",
-"42+30=72",
-"42+31=73",
-"42+32=74",
-"42+33=75",
-"42+34=76",
-"42+35=77",
-"42+36=78",
-"42+37=79",
-"42+38=80",
-"42+39=81",
-"42+40=82",
-"42+41=83",
-"42+42=84",
-"42+43=85",
-"42+44=86",
-"42+45=87",
-"42+46=88",
-"42+47=89",
-"42+48=90",
-"42+49=91",
-"42+50=92",
-"42+51=93",
-"42+52=94",
-"42+53=95",
-"42+54=96",
-"42+55=97",
-"42+56=98",
-"42+57=99",
-"42-10=32",
-"42-11=31",
-"42-12=30",
-"42-13=29",
-"42-14=28",
-"42-15=27",
-"42-16=26",
-"42-17=25",
-"42-18=24",
-"42-19=23",
-"42-20=22",
-"42-21=21",
-"42-22=20",
-"42-23=19",
-"42-24=18",
-"42-25=17",
-"42-26=16",
-"42-27=15",
-"42-28=14",
-"42-29=13",
-"42-30=12",
-"42-31=11",
-"42-32=10",
-"42-43=-1",
-"42-44=-2",
-"42-45=-3",
-"42-46=-4",
-"42-47=-5",
-"42-48=-6",
-"42-49=-7",
-"42-4*9=6",
-"42-50=-8",
-"42-51=-9",
-"42-5*7=7",
-"42-5*8=2",
-"42-6*6=6",
-"42-6*7=0",
-"42-7*5=7",
-"42-7*6=0",
-"42-8*5=2",
-"42-9*4=6",
-"42*0+0=0",
-"42*0+1=1",
-"42*0+2=2",
-"42*0+3=3",
-"42*0+4=4",
-"42*0+5=5",
-"42*0+6=6",
-"42*0+7=7",
-"42*0+8=8",
-"42*0+9=9",
-"42*0-0=0",
-"42*0*0=0",
-"42*0*1=0",
-"42*0*2=0",
-"42*0*3=0",
-"42*0*4=0",
-"42*0*5=0",
-"42*0*6=0",
-"42*0*7=0",
-"42*0*8=0",
-"42*0*9=0",
-"42*0/1=0",
-"42*0/2=0",
-"42*0/3=0",
-"42*0/4=0",
-"42*0/5=0",
-"42*0/6=0",
-"42*0/7=0",
-"42*0/8=0",
-"42*0/9=0",
-"42*1*0=0",
-"42*1/6=7",
-"42*1/7=6",
-"42*2*0=0",
-"42*3*0=0",
-"42*3=126",
-"42*4*0=0",
-"42*4=168",
-"42*5*0=0",
-"42*5=210",
-"42*6*0=0",
-"42*6=252",
-"42*7*0=0",
-"42*7=294",
-"42*8*0=0",
-"42*8=336",
-"42*9*0=0",
-"42*9=378",
-"42/1*0=0",
-"42/1/6=7",
-"42/1/7=6",
-"42/2*0=0",
-"42/2/3=7",
-"42/2/7=3",
-"42/3-5=9",
-"42/3-6=8",
-"42/3-7=7",
-"42/3-8=6",
-"42/3-9=5",
-"42/3*0=0",
-"42/3/2=7",
-"42/3/7=2",
-"42/4*0=0",
-"42/5*0=0",
-"42/6+0=7",
-"42/6+1=8",
-"42/6+2=9",
-"42/6-0=7",
-"42/6-1=6",
-"42/6-2=5",
-"42/6-3=4",
-"42/6-4=3",
-"42/6-5=2",
-"42/6-6=1",
-"42/6-7=0",
-"42/6*0=0",
-"42/6*1=7",
-"42/6/1=7",
-"42/6/7=1",
-"42/7+0=6",
-"42/7+1=7",
-"42/7+2=8",
-"42/7+3=9",
-"42/7-0=6",
-"42/7-1=5",
-"42/7-2=4",
-"42/7-3=3",
-"42/7-4=2",
-"42/7-5=1",
-"42/7-6=0",
-"42/7*0=0",
-"42/7*1=6",
-"42/7/1=6",
-"42/7/2=3",
-"42/7/3=2",
-"42/7/6=1",
-"42/8*0=0",
-"42/9*0=0",
-"4300*0=0",
-"4301*0=0",
-"4302*0=0",
-"4303*0=0",
-"4304*0=0",
-"4305*0=0",
-"4306*0=0",
-"4307*0=0",
-"4308*0=0",
-"4309*0=0",
-"430/5=86",
-"430/86=5",
-"4310*0=0",
-"4311*0=0",
-"4312*0=0",
-"4313*0=0",
-"4314*0=0",
-"4315*0=0",
-"4316*0=0",
-"4317*0=0",
-"4318*0=0",
-"4319*0=0",
-"4320*0=0",
-"4321*0=0",
-"4322*0=0",
-"4323*0=0",
-"4324*0=0",
-"4325*0=0",
-"4326*0=0",
-"4327*0=0",
-"4328*0=0",
-"4329*0=0",
-"432/48=9",
-"432/54=8",
-"432/6=72",
-"432/72=6",
-"432/8=54",
-"432/9=48",
-"4330*0=0",
-"4331*0=0",
-"4332*0=0",
-"4333*0=0",
-"4334*0=0",
-"4335*0=0",
-"4336*0=0",
-"4337*0=0",
-"4338*0=0",
-"4339*0=0",
-"4340*0=0",
-"4341*0=0",
-"4342*0=0",
-"4343*0=0",
-"4344*0=0",
-"4345*0=0",
-"4346*0=0",
-"4347*0=0",
-"4348*0=0",
-"4349*0=0",
-"434/62=7",
-"434/7=62",
-"4350*0=0",
-"4351*0=0",
-"4352*0=0",
-"4353*0=0",
-"4354*0=0",
-"4355*0=0",
-"4356*0=0",
-"4357*0=0",
-"4358*0=0",
-"4359*0=0",
-"435/5=87",
-"435/87=5",
-"4360*0=0",
-"4361*0=0",
-"4362*0=0",
-"4363*0=0",
-"4364*0=0",
-"4365*0=0",
-"4366*0=0",
-"4367*0=0",
-"4368*0=0",
-"4369*0=0",
-"4370*0=0",
-"4371*0=0",
-"4372*0=0",
-"4373*0=0",
-"4374*0=0",
-"4375*0=0",
-"4376*0=0",
-"4377*0=0",
-"4378*0=0",
-"4379*0=0",
-"4380*0=0",
-"4381*0=0",
-"4382*0=0",
-"4383*0=0",
-"4384*0=0",
-"4385*0=0",
-"4386*0=0",
-"4387*0=0",
-"4388*0=0",
-"4389*0=0",
-"438/6=73",
-"438/73=6",
-"4390*0=0",
-"4391*0=0",
-"4392*0=0",
-"4393*0=0",
-"4394*0=0",
-"4395*0=0",
-"4396*0=0",
-"4397*0=0",
-"4398*0=0",
-"4399*0=0",
-"43+10=53",
-"43+11=54",
-"43+12=55",
-"43+13=56",
-"43+14=57",
-"43+15=58",
-"43+16=59",
-"43+17=60",
-"43+18=61",
-"43+19=62",
-"43+20=63",
-"43+21=64",
-"43+22=65",
-"43+23=66",
-"43+24=67",
-"43+25=68",
-"43+26=69",
-"43+27=70",
-"43+28=71",
-"43+29=72",
-"43+30=73",
-"43+31=74",
-"43+32=75",
-"43+33=76",
-"43+34=77",
-"43+35=78",
-"43+36=79",
-"43+37=80",
-"43+38=81",
-"43+39=82",
-"43+40=83",
-"43+41=84",
-"43+42=85",
-"43+43=86",
-"43+44=87",
-"43+45=88",
-"43+46=89",
-"43+47=90",
-"43+48=91",
-"43+49=92",
-"43+50=93",
-"43+51=94",
-"43+52=95",
-"43+53=96",
-"43+54=97",
-"43+55=98",
-"43+56=99",
-"43-10=33",
-"43-11=32",
-"43-12=31",
-"43-13=30",
-"43-14=29",
-"43-15=28",
-"43-16=27",
-"43-17=26",
-"43-18=25",
-"43-19=24",
-"43-20=23",
-"43-21=22",
-"43-22=21",
-"43-23=20",
-"43-24=19",
-"43-25=18",
-"43-26=17",
-"43-27=16",
-"43-28=15",
-"43-29=14",
-"43-30=13",
-"43-31=12",
-"43-32=11",
-"43-33=10",
-"43-44=-1",
-"43-45=-2",
-"43-46=-3",
-"43-47=-4",
-"43-48=-5",
-"43-49=-6",
-"43-4*9=7",
-"43-50=-7",
-"43-51=-8",
-"43-52=-9",
-"43-5*7=8",
-"43-5*8=3",
-"43-6*6=7",
-"43-6*7=1",
-"43-7*5=8",
-"43-7*6=1",
-"43-8*5=3",
-"43-9*4=7",
-"43*0+0=0",
-"43*0+1=1",
-"43*0+2=2",
-"43*0+3=3",
-"43*0+4=4",
-"43*0+5=5",
-"43*0+6=6",
-"43*0+7=7",
-"43*0+8=8",
-"43*0+9=9",
-"43*0-0=0",
-"43*0*0=0",
-"43*0*1=0",
-"43*0*2=0",
-"43*0*3=0",
-"43*0*4=0",
-"43*0*5=0",
-"43*0*6=0",
-"43*0*7=0",
-"43*0*8=0",
-"43*0*9=0",
-"43*0/1=0",
-"43*0/2=0",
-"43*0/3=0",
-"43*0/4=0",
-"43*0/5=0",
-"43*0/6=0",
-"43*0/7=0",
-"43*0/8=0",
-"43*0/9=0",
-"43*1*0=0",
-"43*2*0=0",
-"43*3*0=0",
-"43*3=129",
-"43*4*0=0",
-"43*4=172",
-"43*5*0=0",
-"43*5=215",
-"43*6*0=0",
-"43*6=258",
-"43*7*0=0",
-"43*7=301",
-"43*8*0=0",
-"43*8=344",
-"43*9*0=0",
-"43*9=387",
-"43/1*0=0",
-"43/2*0=0",
-"43/3*0=0",
-"43/4*0=0",
-"43/5*0=0",
-"43/6*0=0",
-"43/7*0=0",
-"43/8*0=0",
-"43/9*0=0",
-"4400*0=0",
-"4401*0=0",
-"4402*0=0",
-"4403*0=0",
-"4404*0=0",
-"4405*0=0",
-"4406*0=0",
-"4407*0=0",
-"4408*0=0",
-"4409*0=0",
-"440/55=8",
-"440/5=88",
-"440/88=5",
-"440/8=55",
-"4410*0=0",
-"4411*0=0",
-"4412*0=0",
-"4413*0=0",
-"4414*0=0",
-"4415*0=0",
-"4416*0=0",
-"4417*0=0",
-"4418*0=0",
-"4419*0=0",
-"441/49=9",
-"441/63=7",
-"441/7=63",
-"441/9=49",
-"4420*0=0",
-"4421*0=0",
-"4422*0=0",
-"4423*0=0",
-"4424*0=0",
-"4425*0=0",
-"4426*0=0",
-"4427*0=0",
-"4428*0=0",
-"4429*0=0",
-"4430*0=0",
-"4431*0=0",
-"4432*0=0",
-"4433*0=0",
-"4434*0=0",
-"4435*0=0",
-"4436*0=0",
-"4437*0=0",
-"4438*0=0",
-"4439*0=0",
-"4440*0=0",
-"4441*0=0",
-"4442*0=0",
-"4443*0=0",
-"4444*0=0",
-"4445*0=0",
-"4446*0=0",
-"4447*0=0",
-"4448*0=0",
-"4449*0=0",
-"444/6=74",
-"444/74=6",
-"4450*0=0",
-"4451*0=0",
-"4452*0=0",
-"4453*0=0",
-"4454*0=0",
-"4455*0=0",
-"4456*0=0",
-"4457*0=0",
-"4458*0=0",
-"4459*0=0",
-"445/5=89",
-"445/89=5",
-"4460*0=0",
-"4461*0=0",
-"4462*0=0",
-"4463*0=0",
-"4464*0=0",
-"4465*0=0",
-"4466*0=0",
-"4467*0=0",
-"4468*0=0",
-"4469*0=0",
-"4470*0=0",
-"4471*0=0",
-"4472*0=0",
-"4473*0=0",
-"4474*0=0",
-"4475*0=0",
-"4476*0=0",
-"4477*0=0",
-"4478*0=0",
-"4479*0=0",
-"4480*0=0",
-"4481*0=0",
-"4482*0=0",
-"4483*0=0",
-"4484*0=0",
-"4485*0=0",
-"4486*0=0",
-"4487*0=0",
-"4488*0=0",
-"4489*0=0",
-"448/56=8",
-"448/64=7",
-"448/7=64",
-"448/8=56",
-"4490*0=0",
-"4491*0=0",
-"4492*0=0",
-"4493*0=0",
-"4494*0=0",
-"4495*0=0",
-"4496*0=0",
-"4497*0=0",
-"4498*0=0",
-"4499*0=0",
-"44+10=54",
-"44+11=55",
-"44+12=56",
-"44+13=57",
-"44+14=58",
-"44+15=59",
-"44+16=60",
-"44+17=61",
-"44+18=62",
-"44+19=63",
-"44+20=64",
-"44+21=65",
-"44+22=66",
-"44+23=67",
-"44+24=68",
-"44+25=69",
-"44+26=70",
-"44+27=71",
-"44+28=72",
-"44+29=73",
-"44+30=74",
-"44+31=75",
-"44+32=76",
-"44+33=77",
-"44+34=78",
-"44+35=79",
-"44+36=80",
-"44+37=81",
-"44+38=82",
-"44+39=83",
-"44+40=84",
-"44+41=85",
-"44+42=86",
-"44+43=87",
-"44+44=88",
-"44+45=89",
-"44+46=90",
-"44+47=91",
-"44+48=92",
-"44+49=93",
-"44+50=94",
-"44+51=95",
-"44+52=96",
-"44+53=97",
-"44+54=98",
-"44+55=99",
-"44-10=34",
-"44-11=33",
-"44-12=32",
-"44-13=31",
-"44-14=30",
-"44-15=29",
-"44-16=28",
-"44-17=27",
-"44-18=26",
-"44-19=25",
-"44-20=24",
-"44-21=23",
-"44-22=22",
-"44-23=21",
-"44-24=20",
-"44-25=19",
-"44-26=18",
-"44-27=17",
-"44-28=16",
-"44-29=15",
-"44-30=14",
-"44-31=13",
-"44-32=12",
-"44-33=11",
-"44-34=10",
-"44-45=-1",
-"44-46=-2",
-"44-47=-3",
-"44-48=-4",
-"44-49=-5",
-"44-4*9=8",
-"44-50=-6",
-"44-51=-7",
-"44-52=-8",
-"44-53=-9",
-"44-5*7=9",
-"44-5*8=4",
-"44-6*6=8",
-"44-6*7=2",
-"44-7*5=9",
-"44-7*6=2",
-"44-8*5=4",
-"44-9*4=8",
-"44*0+0=0",
-"44*0+1=1",
-"44*0+2=2",
-"44*0+3=3",
-"44*0+4=4",
-"44*0+5=5",
-"44*0+6=6",
-"44*0+7=7",
-"44*0+8=8",
-"44*0+9=9",
-"44*0-0=0",
-"44*0*0=0",
-"44*0*1=0",
-"44*0*2=0",
-"44*0*3=0",
-"44*0*4=0",
-"44*0*5=0",
-"44*0*6=0",
-"44*0*7=0",
-"44*0*8=0",
-"44*0*9=0",
-"44*0/1=0",
-"44*0/2=0",
-"44*0/3=0",
-"44*0/4=0",
-"44*0/5=0",
-"44*0/6=0",
-"44*0/7=0",
-"44*0/8=0",
-"44*0/9=0",
-"44*1*0=0",
-"44*2*0=0",
-"44*3*0=0",
-"44*3=132",
-"44*4*0=0",
-"44*4=176",
-"44*5*0=0",
-"44*5=220",
-"44*6*0=0",
-"44*6=264",
-"44*7*0=0",
-"44*7=308",
-"44*8*0=0",
-"44*8=352",
-"44*9*0=0",
-"44*9=396",
-"44/1*0=0",
-"44/2*0=0",
-"44/3*0=0",
-"44/4-2=9",
-"44/4-3=8",
-"44/4-4=7",
-"44/4-5=6",
-"44/4-6=5",
-"44/4-7=4",
-"44/4-8=3",
-"44/4-9=2",
-"44/4*0=0",
-"44/5*0=0",
-"44/6*0=0",
-"44/7*0=0",
-"44/8*0=0",
-"44/9*0=0",
-"4500*0=0",
-"4501*0=0",
-"4502*0=0",
-"4503*0=0",
-"4504*0=0",
-"4505*0=0",
-"4506*0=0",
-"4507*0=0",
-"4508*0=0",
-"4509*0=0",
-"450/50=9",
-"450/5=90",
-"450/6=75",
-"450/75=6",
-"450/90=5",
-"450/9=50",
-"4510*0=0",
-"4511*0=0",
-"4512*0=0",
-"4513*0=0",
-"4514*0=0",
-"4515*0=0",
-"4516*0=0",
-"4517*0=0",
-"4518*0=0",
-"4519*0=0",
-"4520*0=0",
-"4521*0=0",
-"4522*0=0",
-"4523*0=0",
-"4524*0=0",
-"4525*0=0",
-"4526*0=0",
-"4527*0=0",
-"4528*0=0",
-"4529*0=0",
-"4530*0=0",
-"4531*0=0",
-"4532*0=0",
-"4533*0=0",
-"4534*0=0",
-"4535*0=0",
-"4536*0=0",
-"4537*0=0",
-"4538*0=0",
-"4539*0=0",
-"4540*0=0",
-"4541*0=0",
-"4542*0=0",
-"4543*0=0",
-"4544*0=0",
-"4545*0=0",
-"4546*0=0",
-"4547*0=0",
-"4548*0=0",
-"4549*0=0",
-"4550*0=0",
-"4551*0=0",
-"4552*0=0",
-"4553*0=0",
-"4554*0=0",
-"4555*0=0",
-"4556*0=0",
-"4557*0=0",
-"4558*0=0",
-"4559*0=0",
-"455/5=91",
-"455/65=7",
-"455/7=65",
-"455/91=5",
-"4560*0=0",
-"4561*0=0",
-"4562*0=0",
-"4563*0=0",
-"4564*0=0",
-"4565*0=0",
-"4566*0=0",
-"4567*0=0",
-"4568*0=0",
-"4569*0=0",
-"456/57=8",
-"456/6=76",
-"456/76=6",
-"456/8=57",
-"4570*0=0",
-"4571*0=0",
-"4572*0=0",
-"4573*0=0",
-"4574*0=0",
-"4575*0=0",
-"4576*0=0",
-"4577*0=0",
-"4578*0=0",
-"4579*0=0",
-"4580*0=0",
-"4581*0=0",
-"4582*0=0",
-"4583*0=0",
-"4584*0=0",
-"4585*0=0",
-"4586*0=0",
-"4587*0=0",
-"4588*0=0",
-"4589*0=0",
-"4590*0=0",
-"4591*0=0",
-"4592*0=0",
-"4593*0=0",
-"4594*0=0",
-"4595*0=0",
-"4596*0=0",
-"4597*0=0",
-"4598*0=0",
-"4599*0=0",
-"459/51=9",
-"459/9=51",
-"45+10=55",
-"45+11=56",
-"45+12=57",
-"45+13=58",
-"45+14=59",
-"45+15=60",
-"45+16=61",
-"45+17=62",
-"45+18=63",
-"45+19=64",
-"45+20=65",
-"45+21=66",
-"45+22=67",
-"45+23=68",
-"45+24=69",
-"45+25=70",
-"45+26=71",
-"45+27=72",
-"45+28=73",
-"45+29=74",
-"45+30=75",
-"45+31=76",
-"45+32=77",
-"45+33=78",
-"45+34=79",
-"45+35=80",
-"45+36=81",
-"45+37=82",
-"45+38=83",
-"45+39=84",
-"45+40=85",
-"45+41=86",
-"45+42=87",
-"45+43=88",
-"45+44=89",
-"45+45=90",
-"45+46=91",
-"45+47=92",
-"45+48=93",
-"45+49=94",
-"45+50=95",
-"45+51=96",
-"45+52=97",
-"45+53=98",
-"45+54=99",
-"45-10=35",
-"45-11=34",
-"45-12=33",
-"45-13=32",
-"45-14=31",
-"45-15=30",
-"45-16=29",
-"45-17=28",
-"45-18=27",
-"45-19=26",
-"45-20=25",
-"45-21=24",
-"45-22=23",
-"45-23=22",
-"45-24=21",
-"45-25=20",
-"45-26=19",
-"45-27=18",
-"45-28=17",
-"45-29=16",
-"45-30=15",
-"45-31=14",
-"45-32=13",
-"45-33=12",
-"45-34=11",
-"45-35=10",
-"45-46=-1",
-"45-47=-2",
-"45-48=-3",
-"45-49=-4",
-"45-4*9=9",
-"45-50=-5",
-"45-51=-6",
-"45-52=-7",
-"45-53=-8",
-"45-54=-9",
-"45-5*8=5",
-"45-5*9=0",
-"45-6*6=9",
-"45-6*7=3",
-"45-7*6=3",
-"45-8*5=5",
-"45-9*4=9",
-"45-9*5=0",
-"45*0+0=0",
-"45*0+1=1",
-"45*0+2=2",
-"45*0+3=3",
-"45*0+4=4",
-"45*0+5=5",
-"45*0+6=6",
-"45*0+7=7",
-"45*0+8=8",
-"45*0+9=9",
-"45*0-0=0",
-"45*0*0=0",
-"45*0*1=0",
-"45*0*2=0",
-"45*0*3=0",
-"45*0*4=0",
-"45*0*5=0",
-"45*0*6=0",
-"45*0*7=0",
-"45*0*8=0",
-"45*0*9=0",
-"45*0/1=0",
-"45*0/2=0",
-"45*0/3=0",
-"45*0/4=0",
-"45*0/5=0",
-"45*0/6=0",
-"45*0/7=0",
-"45*0/8=0",
-"45*0/9=0",
-"45*1*0=0",
-"45*1/5=9",
-"45*1/9=5",
-"45*2*0=0",
-"45*3*0=0",
-"45*3=135",
-"45*4*0=0",
-"45*4=180",
-"45*5*0=0",
-"45*5=225",
-"45*6*0=0",
-"45*6=270",
-"45*7*0=0",
-"45*7=315",
-"45*8*0=0",
-"45*8=360",
-"45*9*0=0",
-"45*9=405",
-"45/1*0=0",
-"45/1/5=9",
-"45/1/9=5",
-"45/2*0=0",
-"45/3-6=9",
-"45/3-7=8",
-"45/3-8=7",
-"45/3-9=6",
-"45/3*0=0",
-"45/3/3=5",
-"45/3/5=3",
-"45/4*0=0",
-"45/5+0=9",
-"45/5-0=9",
-"45/5-1=8",
-"45/5-2=7",
-"45/5-3=6",
-"45/5-4=5",
-"45/5-5=4",
-"45/5-6=3",
-"45/5-7=2",
-"45/5-8=1",
-"45/5-9=0",
-"45/5*0=0",
-"45/5*1=9",
-"45/5/1=9",
-"45/5/3=3",
-"45/5/9=1",
-"45/6*0=0",
-"45/7*0=0",
-"45/8*0=0",
-"45/9+0=5",
-"45/9+1=6",
-"45/9+2=7",
-"45/9+3=8",
-"45/9+4=9",
-"45/9-0=5",
-"45/9-1=4",
-"45/9-2=3",
-"45/9-3=2",
-"45/9-4=1",
-"45/9-5=0",
-"45/9*0=0",
-"45/9*1=5",
-"45/9/1=5",
-"45/9/5=1",
-"4600*0=0",
-"4601*0=0",
-"4602*0=0",
-"4603*0=0",
-"4604*0=0",
-"4605*0=0",
-"4606*0=0",
-"4607*0=0",
-"4608*0=0",
-"4609*0=0",
-"460/5=92",
-"460/92=5",
-"4610*0=0",
-"4611*0=0",
-"4612*0=0",
-"4613*0=0",
-"4614*0=0",
-"4615*0=0",
-"4616*0=0",
-"4617*0=0",
-"4618*0=0",
-"4619*0=0",
-"4620*0=0",
-"4621*0=0",
-"4622*0=0",
-"4623*0=0",
-"4624*0=0",
-"4625*0=0",
-"4626*0=0",
-"4627*0=0",
-"4628*0=0",
-"4629*0=0",
-"462/66=7",
-"462/6=77",
-"462/77=6",
-"462/7=66",
-"4630*0=0",
-"4631*0=0",
-"4632*0=0",
-"4633*0=0",
-"4634*0=0",
-"4635*0=0",
-"4636*0=0",
-"4637*0=0",
-"4638*0=0",
-"4639*0=0",
-"4640*0=0",
-"4641*0=0",
-"4642*0=0",
-"4643*0=0",
-"4644*0=0",
-"4645*0=0",
-"4646*0=0",
-"4647*0=0",
-"4648*0=0",
-"4649*0=0",
-"464/58=8",
-"464/8=58",
-"4650*0=0",
-"4651*0=0",
-"4652*0=0",
-"4653*0=0",
-"4654*0=0",
-"4655*0=0",
-"4656*0=0",
-"4657*0=0",
-"4658*0=0",
-"4659*0=0",
-"465/5=93",
-"465/93=5",
-"4660*0=0",
-"4661*0=0",
-"4662*0=0",
-"4663*0=0",
-"4664*0=0",
-"4665*0=0",
-"4666*0=0",
-"4667*0=0",
-"4668*0=0",
-"4669*0=0",
-"4670*0=0",
-"4671*0=0",
-"4672*0=0",
-"4673*0=0",
-"4674*0=0",
-"4675*0=0",
-"4676*0=0",
-"4677*0=0",
-"4678*0=0",
-"4679*0=0",
-"4680*0=0",
-"4681*0=0",
-"4682*0=0",
-"4683*0=0",
-"4684*0=0",
-"4685*0=0",
-"4686*0=0",
-"4687*0=0",
-"4688*0=0",
-"4689*0=0",
-"468/52=9",
-"468/6=78",
-"468/78=6",
-"468/9=52",
-"4690*0=0",
-"4691*0=0",
-"4692*0=0",
-"4693*0=0",
-"4694*0=0",
-"4695*0=0",
-"4696*0=0",
-"4697*0=0",
-"4698*0=0",
-"4699*0=0",
-"469/67=7",
-"469/7=67",
-"46+10=56",
-"46+11=57",
-"46+12=58",
-"46+13=59",
-"46+14=60",
-"46+15=61",
-"46+16=62",
-"46+17=63",
-"46+18=64",
-"46+19=65",
-"46+20=66",
-"46+21=67",
-"46+22=68",
-"46+23=69",
-"46+24=70",
-"46+25=71",
-"46+26=72",
-"46+27=73",
-"46+28=74",
-"46+29=75",
-"46+30=76",
-"46+31=77",
-"46+32=78",
-"46+33=79",
-"46+34=80",
-"46+35=81",
-"46+36=82",
-"46+37=83",
-"46+38=84",
-"46+39=85",
-"46+40=86",
-"46+41=87",
-"46+42=88",
-"46+43=89",
-"46+44=90",
-"46+45=91",
-"46+46=92",
-"46+47=93",
-"46+48=94",
-"46+49=95",
-"46+50=96",
-"46+51=97",
-"46+52=98",
-"46+53=99",
-"46-10=36",
-"46-11=35",
-"46-12=34",
-"46-13=33",
-"46-14=32",
-"46-15=31",
-"46-16=30",
-"46-17=29",
-"46-18=28",
-"46-19=27",
-"46-20=26",
-"46-21=25",
-"46-22=24",
-"46-23=23",
-"46-24=22",
-"46-25=21",
-"46-26=20",
-"46-27=19",
-"46-28=18",
-"46-29=17",
-"46-30=16",
-"46-31=15",
-"46-32=14",
-"46-33=13",
-"46-34=12",
-"46-35=11",
-"46-36=10",
-"46-47=-1",
-"46-48=-2",
-"46-49=-3",
-"46-50=-4",
-"46-51=-5",
-"46-52=-6",
-"46-53=-7",
-"46-54=-8",
-"46-55=-9",
-"46-5*8=6",
-"46-5*9=1",
-"46-6*7=4",
-"46-7*6=4",
-"46-8*5=6",
-"46-9*5=1",
-"46*0+0=0",
-"46*0+1=1",
-"46*0+2=2",
-"46*0+3=3",
-"46*0+4=4",
-"46*0+5=5",
-"46*0+6=6",
-"46*0+7=7",
-"46*0+8=8",
-"46*0+9=9",
-"46*0-0=0",
-"46*0*0=0",
-"46*0*1=0",
-"46*0*2=0",
-"46*0*3=0",
-"46*0*4=0",
-"46*0*5=0",
-"46*0*6=0",
-"46*0*7=0",
-"46*0*8=0",
-"46*0*9=0",
-"46*0/1=0",
-"46*0/2=0",
-"46*0/3=0",
-"46*0/4=0",
-"46*0/5=0",
-"46*0/6=0",
-"46*0/7=0",
-"46*0/8=0",
-"46*0/9=0",
-"46*1*0=0",
-"46*2*0=0",
-"46*3*0=0",
-"46*3=138",
-"46*4*0=0",
-"46*4=184",
-"46*5*0=0",
-"46*5=230",
-"46*6*0=0",
-"46*6=276",
-"46*7*0=0",
-"46*7=322",
-"46*8*0=0",
-"46*8=368",
-"46*9*0=0",
-"46*9=414",
-"46/1*0=0",
-"46/2*0=0",
-"46/3*0=0",
-"46/4*0=0",
-"46/5*0=0",
-"46/6*0=0",
-"46/7*0=0",
-"46/8*0=0",
-"46/9*0=0",
-"4700*0=0",
-"4701*0=0",
-"4702*0=0",
-"4703*0=0",
-"4704*0=0",
-"4705*0=0",
-"4706*0=0",
-"4707*0=0",
-"4708*0=0",
-"4709*0=0",
-"470/5=94",
-"470/94=5",
-"4710*0=0",
-"4711*0=0",
-"4712*0=0",
-"4713*0=0",
-"4714*0=0",
-"4715*0=0",
-"4716*0=0",
-"4717*0=0",
-"4718*0=0",
-"4719*0=0",
-"4720*0=0",
-"4721*0=0",
-"4722*0=0",
-"4723*0=0",
-"4724*0=0",
-"4725*0=0",
-"4726*0=0",
-"4727*0=0",
-"4728*0=0",
-"4729*0=0",
-"472/59=8",
-"472/8=59",
-"4730*0=0",
-"4731*0=0",
-"4732*0=0",
-"4733*0=0",
-"4734*0=0",
-"4735*0=0",
-"4736*0=0",
-"4737*0=0",
-"4738*0=0",
-"4739*0=0",
-"4740*0=0",
-"4741*0=0",
-"4742*0=0",
-"4743*0=0",
-"4744*0=0",
-"4745*0=0",
-"4746*0=0",
-"4747*0=0",
-"4748*0=0",
-"4749*0=0",
-"474/6=79",
-"474/79=6",
-"4750*0=0",
-"4751*0=0",
-"4752*0=0",
-"4753*0=0",
-"4754*0=0",
-"4755*0=0",
-"4756*0=0",
-"4757*0=0",
-"4758*0=0",
-"4759*0=0",
-"475/5=95",
-"475/95=5",
-"4760*0=0",
-"4761*0=0",
-"4762*0=0",
-"4763*0=0",
-"4764*0=0",
-"4765*0=0",
-"4766*0=0",
-"4767*0=0",
-"4768*0=0",
-"4769*0=0",
-"476/68=7",
-"476/7=68",
-"4770*0=0",
-"4771*0=0",
-"4772*0=0",
-"4773*0=0",
-"4774*0=0",
-"4775*0=0",
-"4776*0=0",
-"4777*0=0",
-"4778*0=0",
-"4779*0=0",
-"477/53=9",
-"477/9=53",
-"4780*0=0",
-"4781*0=0",
-"4782*0=0",
-"4783*0=0",
-"4784*0=0",
-"4785*0=0",
-"4786*0=0",
-"4787*0=0",
-"4788*0=0",
-"4789*0=0",
-"4790*0=0",
-"4791*0=0",
-"4792*0=0",
-"4793*0=0",
-"4794*0=0",
-"4795*0=0",
-"4796*0=0",
-"4797*0=0",
-"4798*0=0",
-"4799*0=0",
-"47+10=57",
-"47+11=58",
-"47+12=59",
-"47+13=60",
-"47+14=61",
-"47+15=62",
-"47+16=63",
-"47+17=64",
-"47+18=65",
-"47+19=66",
-"47+20=67",
-"47+21=68",
-"47+22=69",
-"47+23=70",
-"47+24=71",
-"47+25=72",
-"47+26=73",
-"47+27=74",
-"47+28=75",
-"47+29=76",
-"47+30=77",
-"47+31=78",
-"47+32=79",
-"47+33=80",
-"47+34=81",
-"47+35=82",
-"47+36=83",
-"47+37=84",
-"47+38=85",
-"47+39=86",
-"47+40=87",
-"47+41=88",
-"47+42=89",
-"47+43=90",
-"47+44=91",
-"47+45=92",
-"47+46=93",
-"47+47=94",
-"47+48=95",
-"47+49=96",
-"47+50=97",
-"47+51=98",
-"47+52=99",
-"47-10=37",
-"47-11=36",
-"47-12=35",
-"47-13=34",
-"47-14=33",
-"47-15=32",
-"47-16=31",
-"47-17=30",
-"47-18=29",
-"47-19=28",
-"47-20=27",
-"47-21=26",
-"47-22=25",
-"47-23=24",
-"47-24=23",
-"47-25=22",
-"47-26=21",
-"47-27=20",
-"47-28=19",
-"47-29=18",
-"47-30=17",
-"47-31=16",
-"47-32=15",
-"47-33=14",
-"47-34=13",
-"47-35=12",
-"47-36=11",
-"47-37=10",
-"47-48=-1",
-"47-49=-2",
-"47-50=-3",
-"47-51=-4",
-"47-52=-5",
-"47-53=-6",
-"47-54=-7",
-"47-55=-8",
-"47-56=-9",
-"47-5*8=7",
-"47-5*9=2",
-"47-6*7=5",
-"47-7*6=5",
-"47-8*5=7",
-"47-9*5=2",
-"47*0+0=0",
-"47*0+1=1",
-"47*0+2=2",
-"47*0+3=3",
-"47*0+4=4",
-"47*0+5=5",
-"47*0+6=6",
-"47*0+7=7",
-"47*0+8=8",
-"47*0+9=9",
-"47*0-0=0",
-"47*0*0=0",
-"47*0*1=0",
-"47*0*2=0",
-"47*0*3=0",
-"47*0*4=0",
-"47*0*5=0",
-"47*0*6=0",
-"47*0*7=0",
-"47*0*8=0",
-"47*0*9=0",
-"47*0/1=0",
-"47*0/2=0",
-"47*0/3=0",
-"47*0/4=0",
-"47*0/5=0",
-"47*0/6=0",
-"47*0/7=0",
-"47*0/8=0",
-"47*0/9=0",
-"47*1*0=0",
-"47*2*0=0",
-"47*3*0=0",
-"47*3=141",
-"47*4*0=0",
-"47*4=188",
-"47*5*0=0",
-"47*5=235",
-"47*6*0=0",
-"47*6=282",
-"47*7*0=0",
-"47*7=329",
-"47*8*0=0",
-"47*8=376",
-"47*9*0=0",
-"47*9=423",
-"47/1*0=0",
-"47/2*0=0",
-"47/3*0=0",
-"47/4*0=0",
-"47/5*0=0",
-"47/6*0=0",
-"47/7*0=0",
-"47/8*0=0",
-"47/9*0=0",
-"4800*0=0",
-"4801*0=0",
-"4802*0=0",
-"4803*0=0",
-"4804*0=0",
-"4805*0=0",
-"4806*0=0",
-"4807*0=0",
-"4808*0=0",
-"4809*0=0",
-"480/5=96",
-"480/60=8",
-"480/6=80",
-"480/80=6",
-"480/8=60",
-"480/96=5",
-"4810*0=0",
-"4811*0=0",
-"4812*0=0",
-"4813*0=0",
-"4814*0=0",
-"4815*0=0",
-"4816*0=0",
-"4817*0=0",
-"4818*0=0",
-"4819*0=0",
-"4820*0=0",
-"4821*0=0",
-"4822*0=0",
-"4823*0=0",
-"4824*0=0",
-"4825*0=0",
-"4826*0=0",
-"4827*0=0",
-"4828*0=0",
-"4829*0=0",
-"4830*0=0",
-"4831*0=0",
-"4832*0=0",
-"4833*0=0",
-"4834*0=0",
-"4835*0=0",
-"4836*0=0",
-"4837*0=0",
-"4838*0=0",
-"4839*0=0",
-"483/69=7",
-"483/7=69",
-"4840*0=0",
-"4841*0=0",
-"4842*0=0",
-"4843*0=0",
-"4844*0=0",
-"4845*0=0",
-"4846*0=0",
-"4847*0=0",
-"4848*0=0",
-"4849*0=0",
-"4850*0=0",
-"4851*0=0",
-"4852*0=0",
-"4853*0=0",
-"4854*0=0",
-"4855*0=0",
-"4856*0=0",
-"4857*0=0",
-"4858*0=0",
-"4859*0=0",
-"485/5=97",
-"485/97=5",
-"4860*0=0",
-"4861*0=0",
-"4862*0=0",
-"4863*0=0",
-"4864*0=0",
-"4865*0=0",
-"4866*0=0",
-"4867*0=0",
-"4868*0=0",
-"4869*0=0",
-"486/54=9",
-"486/6=81",
-"486/81=6",
-"486/9=54",
-"4870*0=0",
-"4871*0=0",
-"4872*0=0",
-"4873*0=0",
-"4874*0=0",
-"4875*0=0",
-"4876*0=0",
-"4877*0=0",
-"4878*0=0",
-"4879*0=0",
-"4880*0=0",
-"4881*0=0",
-"4882*0=0",
-"4883*0=0",
-"4884*0=0",
-"4885*0=0",
-"4886*0=0",
-"4887*0=0",
-"4888*0=0",
-"4889*0=0",
-"488/61=8",
-"488/8=61",
-"4890*0=0",
-"4891*0=0",
-"4892*0=0",
-"4893*0=0",
-"4894*0=0",
-"4895*0=0",
-"4896*0=0",
-"4897*0=0",
-"4898*0=0",
-"4899*0=0",
-"48+10=58",
-"48+11=59",
-"48+12=60",
-"48+13=61",
-"48+14=62",
-"48+15=63",
-"48+16=64",
-"48+17=65",
-"48+18=66",
-"48+19=67",
-"48+20=68",
-"48+21=69",
-"48+22=70",
-"48+23=71",
-"48+24=72",
-"48+25=73",
-"48+26=74",
-"48+27=75",
-"48+28=76",
-"48+29=77",
-"48+30=78",
-"48+31=79",
-"48+32=80",
-"48+33=81",
-"48+34=82",
-"48+35=83",
-"48+36=84",
-"48+37=85",
-"48+38=86",
-"48+39=87",
-"48+40=88",
-"48+41=89",
-"48+42=90",
-"48+43=91",
-"48+44=92",
-"48+45=93",
-"48+46=94",
-"48+47=95",
-"48+48=96",
-"48+49=97",
-"48+50=98",
-"48+51=99",
-"48-10=38",
-"48-11=37",
-"48-12=36",
-"48-13=35",
-"48-14=34",
-"48-15=33",
-"48-16=32",
-"48-17=31",
-"48-18=30",
-"48-19=29",
-"48-20=28",
-"48-21=27",
-"48-22=26",
-"48-23=25",
-"48-24=24",
-"48-25=23",
-"48-26=22",
-"48-27=21",
-"48-28=20",
-"48-29=19",
-"48-30=18",
-"48-31=17",
-"48-32=16",
-"48-33=15",
-"48-34=14",
-"48-35=13",
-"48-36=12",
-"48-37=11",
-"48-38=10",
-"48-49=-1",
-"48-50=-2",
-"48-51=-3",
-"48-52=-4",
-"48-53=-5",
-"48-54=-6",
-"48-55=-7",
-"48-56=-8",
-"48-57=-9",
-"48-5*8=8",
-"48-5*9=3",
-"48-6*7=6",
-"48-6*8=0",
-"48-7*6=6",
-"48-8*5=8",
-"48-8*6=0",
-"48-9*5=3",
-"48*0+0=0",
-"48*0+1=1",
-"48*0+2=2",
-"48*0+3=3",
-"48*0+4=4",
-"48*0+5=5",
-"48*0+6=6",
-"48*0+7=7",
-"48*0+8=8",
-"48*0+9=9",
-"48*0-0=0",
-"48*0*0=0",
-"48*0*1=0",
-"48*0*2=0",
-"48*0*3=0",
-"48*0*4=0",
-"48*0*5=0",
-"48*0*6=0",
-"48*0*7=0",
-"48*0*8=0",
-"48*0*9=0",
-"48*0/1=0",
-"48*0/2=0",
-"48*0/3=0",
-"48*0/4=0",
-"48*0/5=0",
-"48*0/6=0",
-"48*0/7=0",
-"48*0/8=0",
-"48*0/9=0",
-"48*1*0=0",
-"48*1/6=8",
-"48*1/8=6",
-"48*2*0=0",
-"48*3*0=0",
-"48*3=144",
-"48*4*0=0",
-"48*4=192",
-"48*5*0=0",
-"48*5=240",
-"48*6*0=0",
-"48*6=288",
-"48*7*0=0",
-"48*7=336",
-"48*8*0=0",
-"48*8=384",
-"48*9*0=0",
-"48*9=432",
-"48/1*0=0",
-"48/1/6=8",
-"48/1/8=6",
-"48/2*0=0",
-"48/2/3=8",
-"48/2/4=6",
-"48/2/6=4",
-"48/2/8=3",
-"48/3-7=9",
-"48/3-8=8",
-"48/3-9=7",
-"48/3*0=0",
-"48/3/2=8",
-"48/3/4=4",
-"48/3/8=2",
-"48/4-3=9",
-"48/4-4=8",
-"48/4-5=7",
-"48/4-6=6",
-"48/4-7=5",
-"48/4-8=4",
-"48/4-9=3",
-"48/4*0=0",
-"48/4/2=6",
-"48/4/3=4",
-"48/4/4=3",
-"48/4/6=2",
-"48/5*0=0",
-"48/6+0=8",
-"48/6+1=9",
-"48/6-0=8",
-"48/6-1=7",
-"48/6-2=6",
-"48/6-3=5",
-"48/6-4=4",
-"48/6-5=3",
-"48/6-6=2",
-"48/6-7=1",
-"48/6-8=0",
-"48/6*0=0",
-"48/6*1=8",
-"48/6/1=8",
-"48/6/2=4",
-"48/6/4=2",
-"48/6/8=1",
-"48/7*0=0",
-"48/8+0=6",
-"48/8+1=7",
-"48/8+2=8",
-"48/8+3=9",
-"48/8-0=6",
-"48/8-1=5",
-"48/8-2=4",
-"48/8-3=3",
-"48/8-4=2",
-"48/8-5=1",
-"48/8-6=0",
-"48/8*0=0",
-"48/8*1=6",
-"48/8/1=6",
-"48/8/2=3",
-"48/8/3=2",
-"48/8/6=1",
-"48/9*0=0",
-"4900*0=0",
-"4901*0=0",
-"4902*0=0",
-"4903*0=0",
-"4904*0=0",
-"4905*0=0",
-"4906*0=0",
-"4907*0=0",
-"4908*0=0",
-"4909*0=0",
-"490/5=98",
-"490/70=7",
-"490/7=70",
-"490/98=5",
-"4910*0=0",
-"4911*0=0",
-"4912*0=0",
-"4913*0=0",
-"4914*0=0",
-"4915*0=0",
-"4916*0=0",
-"4917*0=0",
-"4918*0=0",
-"4919*0=0",
-"4920*0=0",
-"4921*0=0",
-"4922*0=0",
-"4923*0=0",
-"4924*0=0",
-"4925*0=0",
-"4926*0=0",
-"4927*0=0",
-"4928*0=0",
-"4929*0=0",
-"492/6=82",
-"492/82=6",
-"4930*0=0",
-"4931*0=0",
-"4932*0=0",
-"4933*0=0",
-"4934*0=0",
-"4935*0=0",
-"4936*0=0",
-"4937*0=0",
-"4938*0=0",
-"4939*0=0",
-"4940*0=0",
-"4941*0=0",
-"4942*0=0",
-"4943*0=0",
-"4944*0=0",
-"4945*0=0",
-"4946*0=0",
-"4947*0=0",
-"4948*0=0",
-"4949*0=0",
-"4950*0=0",
-"4951*0=0",
-"4952*0=0",
-"4953*0=0",
-"4954*0=0",
-"4955*0=0",
-"4956*0=0",
-"4957*0=0",
-"4958*0=0",
-"4959*0=0",
-"495/55=9",
-"495/5=99",
-"495/99=5",
-"495/9=55",
-"4960*0=0",
-"4961*0=0",
-"4962*0=0",
-"4963*0=0",
-"4964*0=0",
-"4965*0=0",
-"4966*0=0",
-"4967*0=0",
-"4968*0=0",
-"4969*0=0",
-"496/62=8",
-"496/8=62",
-"4970*0=0",
-"4971*0=0",
-"4972*0=0",
-"4973*0=0",
-"4974*0=0",
-"4975*0=0",
-"4976*0=0",
-"4977*0=0",
-"4978*0=0",
-"4979*0=0",
-"497/71=7",
-"497/7=71",
-"4980*0=0",
-"4981*0=0",
-"4982*0=0",
-"4983*0=0",
-"4984*0=0",
-"4985*0=0",
-"4986*0=0",
-"4987*0=0",
-"4988*0=0",
-"4989*0=0",
-"498/6=83",
-"498/83=6",
-"4990*0=0",
-"4991*0=0",
-"4992*0=0",
-"4993*0=0",
-"4994*0=0",
-"4995*0=0",
-"4996*0=0",
-"4997*0=0",
-"4998*0=0",
-"4999*0=0",
-"49+10=59",
-"49+11=60",
-"49+12=61",
-"49+13=62",
-"49+14=63",
-"49+15=64",
-"49+16=65",
-"49+17=66",
-"49+18=67",
-"49+19=68",
-"49+20=69",
-"49+21=70",
-"49+22=71",
-"49+23=72",
-"49+24=73",
-"49+25=74",
-"49+26=75",
-"49+27=76",
-"49+28=77",
-"49+29=78",
-"49+30=79",
-"49+31=80",
-"49+32=81",
-"49+33=82",
-"49+34=83",
-"49+35=84",
-"49+36=85",
-"49+37=86",
-"49+38=87",
-"49+39=88",
-"49+40=89",
-"49+41=90",
-"49+42=91",
-"49+43=92",
-"49+44=93",
-"49+45=94",
-"49+46=95",
-"49+47=96",
-"49+48=97",
-"49+49=98",
-"49+50=99",
-"49-10=39",
-"49-11=38",
-"49-12=37",
-"49-13=36",
-"49-14=35",
-"49-15=34",
-"49-16=33",
-"49-17=32",
-"49-18=31",
-"49-19=30",
-"49-20=29",
-"49-21=28",
-"49-22=27",
-"49-23=26",
-"49-24=25",
-"49-25=24",
-"49-26=23",
-"49-27=22",
-"49-28=21",
-"49-29=20",
-"49-30=19",
-"49-31=18",
-"49-32=17",
-"49-33=16",
-"49-34=15",
-"49-35=14",
-"49-36=13",
-"49-37=12",
-"49-38=11",
-"49-39=10",
-"49-50=-1",
-"49-51=-2",
-"49-52=-3",
-"49-53=-4",
-"49-54=-5",
-"49-55=-6",
-"49-56=-7",
-"49-57=-8",
-"49-58=-9",
-"49-5*8=9",
-"49-5*9=4",
-"49-6*7=7",
-"49-6*8=1",
-"49-7*6=7",
-"49-7*7=0",
-"49-8*5=9",
-"49-8*6=1",
-"49-9*5=4",
-"49*0+0=0",
-"49*0+1=1",
-"49*0+2=2",
-"49*0+3=3",
-"49*0+4=4",
-"49*0+5=5",
-"49*0+6=6",
-"49*0+7=7",
-"49*0+8=8",
-"49*0+9=9",
-"49*0-0=0",
-"49*0*0=0",
-"49*0*1=0",
-"49*0*2=0",
-"49*0*3=0",
-"49*0*4=0",
-"49*0*5=0",
-"49*0*6=0",
-"49*0*7=0",
-"49*0*8=0",
-"49*0*9=0",
-"49*0/1=0",
-"49*0/2=0",
-"49*0/3=0",
-"49*0/4=0",
-"49*0/5=0",
-"49*0/6=0",
-"49*0/7=0",
-"49*0/8=0",
-"49*0/9=0",
-"49*1*0=0",
-"49*1/7=7",
-"49*2*0=0",
-"49*3*0=0",
-"49*3=147",
-"49*4*0=0",
-"49*4=196",
-"49*5*0=0",
-"49*5=245",
-"49*6*0=0",
-"49*6=294",
-"49*7*0=0",
-"49*7=343",
-"49*8*0=0",
-"49*8=392",
-"49*9*0=0",
-"49*9=441",
-"49/1*0=0",
-"49/1/7=7",
-"49/2*0=0",
-"49/3*0=0",
-"49/4*0=0",
-"49/5*0=0",
-"49/6*0=0",
-"49/7+0=7",
-"49/7+1=8",
-"49/7+2=9",
-"49/7-0=7",
-"49/7-1=6",
-"49/7-2=5",
-"49/7-3=4",
-"49/7-4=3",
-"49/7-5=2",
-"49/7-6=1",
-"49/7-7=0",
-"49/7*0=0",
-"49/7*1=7",
-"49/7/1=7",
-"49/7/7=1",
-"49/8*0=0",
-"49/9*0=0",
-"4+0+6=10",
-"4+0+7=11",
-"4+0+8=12",
-"4+0+9=13",
-"4+0-5=-1",
-"4+0-6=-2",
-"4+0-7=-3",
-"4+0-8=-4",
-"4+0-9=-5",
-"4+0*10=4",
-"4+0*11=4",
-"4+0*12=4",
-"4+0*13=4",
-"4+0*14=4",
-"4+0*15=4",
-"4+0*16=4",
-"4+0*17=4",
-"4+0*18=4",
-"4+0*19=4",
-"4+0*20=4",
-"4+0*21=4",
-"4+0*22=4",
-"4+0*23=4",
-"4+0*24=4",
-"4+0*25=4",
-"4+0*26=4",
-"4+0*27=4",
-"4+0*28=4",
-"4+0*29=4",
-"4+0*30=4",
-"4+0*31=4",
-"4+0*32=4",
-"4+0*33=4",
-"4+0*34=4",
-"4+0*35=4",
-"4+0*36=4",
-"4+0*37=4",
-"4+0*38=4",
-"4+0*39=4",
-"4+0*40=4",
-"4+0*41=4",
-"4+0*42=4",
-"4+0*43=4",
-"4+0*44=4",
-"4+0*45=4",
-"4+0*46=4",
-"4+0*47=4",
-"4+0*48=4",
-"4+0*49=4",
-"4+0*50=4",
-"4+0*51=4",
-"4+0*52=4",
-"4+0*53=4",
-"4+0*54=4",
-"4+0*55=4",
-"4+0*56=4",
-"4+0*57=4",
-"4+0*58=4",
-"4+0*59=4",
-"4+0*60=4",
-"4+0*61=4",
-"4+0*62=4",
-"4+0*63=4",
-"4+0*64=4",
-"4+0*65=4",
-"4+0*66=4",
-"4+0*67=4",
-"4+0*68=4",
-"4+0*69=4",
-"4+0*70=4",
-"4+0*71=4",
-"4+0*72=4",
-"4+0*73=4",
-"4+0*74=4",
-"4+0*75=4",
-"4+0*76=4",
-"4+0*77=4",
-"4+0*78=4",
-"4+0*79=4",
-"4+0*80=4",
-"4+0*81=4",
-"4+0*82=4",
-"4+0*83=4",
-"4+0*84=4",
-"4+0*85=4",
-"4+0*86=4",
-"4+0*87=4",
-"4+0*88=4",
-"4+0*89=4",
-"4+0*90=4",
-"4+0*91=4",
-"4+0*92=4",
-"4+0*93=4",
-"4+0*94=4",
-"4+0*95=4",
-"4+0*96=4",
-"4+0*97=4",
-"4+0*98=4",
-"4+0*99=4",
-"4+0/10=4",
-"4+0/11=4",
-"4+0/12=4",
-"4+0/13=4",
-"4+0/14=4",
-"4+0/15=4",
-"4+0/16=4",
-"4+0/17=4",
-"4+0/18=4",
-"4+0/19=4",
-"4+0/20=4",
-"4+0/21=4",
-"4+0/22=4",
-"4+0/23=4",
-"4+0/24=4",
-"4+0/25=4",
-"4+0/26=4",
-"4+0/27=4",
-"4+0/28=4",
-"4+0/29=4",
-"4+0/30=4",
-"4+0/31=4",
-"4+0/32=4",
-"4+0/33=4",
-"4+0/34=4",
-"4+0/35=4",
-"4+0/36=4",
-"4+0/37=4",
-"4+0/38=4",
-"4+0/39=4",
-"4+0/40=4",
-"4+0/41=4",
-"4+0/42=4",
-"4+0/43=4",
-"4+0/44=4",
-"4+0/45=4",
-"4+0/46=4",
-"4+0/47=4",
-"4+0/48=4",
-"4+0/49=4",
-"4+0/50=4",
-"4+0/51=4",
-"4+0/52=4",
-"4+0/53=4",
-"4+0/54=4",
-"4+0/55=4",
-"4+0/56=4",
-"4+0/57=4",
-"4+0/58=4",
-"4+0/59=4",
-"4+0/60=4",
-"4+0/61=4",
-"4+0/62=4",
-"4+0/63=4",
-"4+0/64=4",
-"4+0/65=4",
-"4+0/66=4",
-"4+0/67=4",
-"4+0/68=4",
-"4+0/69=4",
-"4+0/70=4",
-"4+0/71=4",
-"4+0/72=4",
-"4+0/73=4",
-"4+0/74=4",
-"4+0/75=4",
-"4+0/76=4",
-"4+0/77=4",
-"4+0/78=4",
-"4+0/79=4",
-"4+0/80=4",
-"4+0/81=4",
-"4+0/82=4",
-"4+0/83=4",
-"4+0/84=4",
-"4+0/85=4",
-"4+0/86=4",
-"4+0/87=4",
-"4+0/88=4",
-"4+0/89=4",
-"4+0/90=4",
-"4+0/91=4",
-"4+0/92=4",
-"4+0/93=4",
-"4+0/94=4",
-"4+0/95=4",
-"4+0/96=4",
-"4+0/97=4",
-"4+0/98=4",
-"4+0/99=4",
-"4+10-5=9",
-"4+10-6=8",
-"4+10-7=7",
-"4+10-8=6",
-"4+10-9=5",
-"4+10*0=4",
-"4+10/2=9",
-"4+10/5=6",
-"4+11-6=9",
-"4+11-7=8",
-"4+11-8=7",
-"4+11-9=6",
-"4+11*0=4",
-"4+12-7=9",
-"4+12-8=8",
-"4+12-9=7",
-"4+12*0=4",
-"4+12/3=8",
-"4+12/4=7",
-"4+12/6=6",
-"4+13-8=9",
-"4+13-9=8",
-"4+13*0=4",
-"4+14-9=9",
-"4+14*0=4",
-"4+14/7=6",
-"4+15*0=4",
-"4+15/3=9",
-"4+15/5=7",
-"4+16*0=4",
-"4+16/4=8",
-"4+16/8=6",
-"4+17*0=4",
-"4+18*0=4",
-"4+18/6=7",
-"4+18/9=6",
-"4+19*0=4",
-"4+1+5=10",
-"4+1+6=11",
-"4+1+7=12",
-"4+1+8=13",
-"4+1+9=14",
-"4+1-6=-1",
-"4+1-7=-2",
-"4+1-8=-3",
-"4+1-9=-4",
-"4+1*6=10",
-"4+1*7=11",
-"4+1*8=12",
-"4+1*9=13",
-"4+20*0=4",
-"4+20/4=9",
-"4+20/5=8",
-"4+21*0=4",
-"4+21/7=7",
-"4+22*0=4",
-"4+23*0=4",
-"4+24*0=4",
-"4+24/6=8",
-"4+24/8=7",
-"4+25*0=4",
-"4+25/5=9",
-"4+26*0=4",
-"4+27*0=4",
-"4+27/9=7",
-"4+28*0=4",
-"4+28/7=8",
-"4+29*0=4",
-"4+2+4=10",
-"4+2+5=11",
-"4+2+6=12",
-"4+2+7=13",
-"4+2+8=14",
-"4+2+9=15",
-"4+2-7=-1",
-"4+2-8=-2",
-"4+2-9=-3",
-"4+2*3=10",
-"4+2*4=12",
-"4+2*5=14",
-"4+2*6=16",
-"4+2*7=18",
-"4+2*8=20",
-"4+2*9=22",
-"4+30*0=4",
-"4+30/6=9",
-"4+31*0=4",
-"4+32*0=4",
-"4+32/8=8",
-"4+33*0=4",
-"4+34*0=4",
-"4+35*0=4",
-"4+35/7=9",
-"4+36*0=4",
-"4+36/9=8",
-"4+37*0=4",
-"4+38*0=4",
-"4+39*0=4",
-"4+3+3=10",
-"4+3+4=11",
-"4+3+5=12",
-"4+3+6=13",
-"4+3+7=14",
-"4+3+8=15",
-"4+3+9=16",
-"4+3-8=-1",
-"4+3-9=-2",
-"4+3*2=10",
-"4+3*3=13",
-"4+3*4=16",
-"4+3*5=19",
-"4+3*6=22",
-"4+3*7=25",
-"4+3*8=28",
-"4+3*9=31",
-"4+40*0=4",
-"4+40/8=9",
-"4+41*0=4",
-"4+42*0=4",
-"4+43*0=4",
-"4+44*0=4",
-"4+45*0=4",
-"4+45/9=9",
-"4+46*0=4",
-"4+47*0=4",
-"4+48*0=4",
-"4+49*0=4",
-"4+4+2=10",
-"4+4+3=11",
-"4+4+4=12",
-"4+4+5=13",
-"4+4+6=14",
-"4+4+7=15",
-"4+4+8=16",
-"4+4+9=17",
-"4+4-9=-1",
-"4+4*2=12",
-"4+4*3=16",
-"4+4*4=20",
-"4+4*5=24",
-"4+4*6=28",
-"4+4*7=32",
-"4+4*8=36",
-"4+4*9=40",
-"4+50*0=4",
-"4+51*0=4",
-"4+52*0=4",
-"4+53*0=4",
-"4+54*0=4",
-"4+55*0=4",
-"4+56*0=4",
-"4+57*0=4",
-"4+58*0=4",
-"4+59*0=4",
-"4+5+1=10",
-"4+5+2=11",
-"4+5+3=12",
-"4+5+4=13",
-"4+5+5=14",
-"4+5+6=15",
-"4+5+7=16",
-"4+5+8=17",
-"4+5+9=18",
-"4+5*2=14",
-"4+5*3=19",
-"4+5*4=24",
-"4+5*5=29",
-"4+5*6=34",
-"4+5*7=39",
-"4+5*8=44",
-"4+5*9=49",
-"4+60*0=4",
-"4+61*0=4",
-"4+62*0=4",
-"4+63*0=4",
-"4+64*0=4",
-"4+65*0=4",
-"4+66*0=4",
-"4+67*0=4",
-"4+68*0=4",
-"4+69*0=4",
-"4+6+0=10",
-"4+6+1=11",
-"4+6+2=12",
-"4+6+3=13",
-"4+6+4=14",
-"4+6+5=15",
-"4+6+6=16",
-"4+6+7=17",
-"4+6+8=18",
-"4+6+9=19",
-"4+6-0=10",
-"4+6-10=0",
-"4+6*1=10",
-"4+6*2=16",
-"4+6*3=22",
-"4+6*4=28",
-"4+6*5=34",
-"4+6*6=40",
-"4+6*7=46",
-"4+6*8=52",
-"4+6*9=58",
-"4+6/1=10",
-"4+70*0=4",
-"4+71*0=4",
-"4+72*0=4",
-"4+73*0=4",
-"4+74*0=4",
-"4+75*0=4",
-"4+76*0=4",
-"4+77*0=4",
-"4+78*0=4",
-"4+79*0=4",
-"4+7+0=11",
-"4+7+1=12",
-"4+7+2=13",
-"4+7+3=14",
-"4+7+4=15",
-"4+7+5=16",
-"4+7+6=17",
-"4+7+7=18",
-"4+7+8=19",
-"4+7+9=20",
-"4+7-0=11",
-"4+7-10=1",
-"4+7-11=0",
-"4+7-1=10",
-"4+7*1=11",
-"4+7*2=18",
-"4+7*3=25",
-"4+7*4=32",
-"4+7*5=39",
-"4+7*6=46",
-"4+7*7=53",
-"4+7*8=60",
-"4+7*9=67",
-"4+7/1=11",
-"4+80*0=4",
-"4+81*0=4",
-"4+82*0=4",
-"4+83*0=4",
-"4+84*0=4",
-"4+85*0=4",
-"4+86*0=4",
-"4+87*0=4",
-"4+88*0=4",
-"4+89*0=4",
-"4+8+0=12",
-"4+8+1=13",
-"4+8+2=14",
-"4+8+3=15",
-"4+8+4=16",
-"4+8+5=17",
-"4+8+6=18",
-"4+8+7=19",
-"4+8+8=20",
-"4+8+9=21",
-"4+8-0=12",
-"4+8-10=2",
-"4+8-11=1",
-"4+8-12=0",
-"4+8-1=11",
-"4+8-2=10",
-"4+8*1=12",
-"4+8*2=20",
-"4+8*3=28",
-"4+8*4=36",
-"4+8*5=44",
-"4+8*6=52",
-"4+8*7=60",
-"4+8*8=68",
-"4+8*9=76",
-"4+8/1=12",
-"4+90*0=4",
-"4+91*0=4",
-"4+92*0=4",
-"4+93*0=4",
-"4+94*0=4",
-"4+95*0=4",
-"4+96*0=4",
-"4+96=100",
-"4+97*0=4",
-"4+97=101",
-"4+98*0=4",
-"4+98=102",
-"4+99*0=4",
-"4+99=103",
-"4+9+0=13",
-"4+9+1=14",
-"4+9+2=15",
-"4+9+3=16",
-"4+9+4=17",
-"4+9+5=18",
-"4+9+6=19",
-"4+9+7=20",
-"4+9+8=21",
-"4+9+9=22",
-"4+9-0=13",
-"4+9-10=3",
-"4+9-11=2",
-"4+9-12=1",
-"4+9-13=0",
-"4+9-1=12",
-"4+9-2=11",
-"4+9-3=10",
-"4+9*1=13",
-"4+9*2=22",
-"4+9*3=31",
-"4+9*4=40",
-"4+9*5=49",
-"4+9*6=58",
-"4+9*7=67",
-"4+9*8=76",
-"4+9*9=85",
-"4+9/1=13",
-"4-0+6=10",
-"4-0+7=11",
-"4-0+8=12",
-"4-0+9=13",
-"4-0-5=-1",
-"4-0-6=-2",
-"4-0-7=-3",
-"4-0-8=-4",
-"4-0-9=-5",
-"4-0*10=4",
-"4-0*11=4",
-"4-0*12=4",
-"4-0*13=4",
-"4-0*14=4",
-"4-0*15=4",
-"4-0*16=4",
-"4-0*17=4",
-"4-0*18=4",
-"4-0*19=4",
-"4-0*20=4",
-"4-0*21=4",
-"4-0*22=4",
-"4-0*23=4",
-"4-0*24=4",
-"4-0*25=4",
-"4-0*26=4",
-"4-0*27=4",
-"4-0*28=4",
-"4-0*29=4",
-"4-0*30=4",
-"4-0*31=4",
-"4-0*32=4",
-"4-0*33=4",
-"4-0*34=4",
-"4-0*35=4",
-"4-0*36=4",
-"4-0*37=4",
-"4-0*38=4",
-"4-0*39=4",
-"4-0*40=4",
-"4-0*41=4",
-"4-0*42=4",
-"4-0*43=4",
-"4-0*44=4",
-"4-0*45=4",
-"4-0*46=4",
-"4-0*47=4",
-"4-0*48=4",
-"4-0*49=4",
-"4-0*50=4",
-"4-0*51=4",
-"4-0*52=4",
-"4-0*53=4",
-"4-0*54=4",
-"4-0*55=4",
-"4-0*56=4",
-"4-0*57=4",
-"4-0*58=4",
-"4-0*59=4",
-"4-0*60=4",
-"4-0*61=4",
-"4-0*62=4",
-"4-0*63=4",
-"4-0*64=4",
-"4-0*65=4",
-"4-0*66=4",
-"4-0*67=4",
-"4-0*68=4",
-"4-0*69=4",
-"4-0*70=4",
-"4-0*71=4",
-"4-0*72=4",
-"4-0*73=4",
-"4-0*74=4",
-"4-0*75=4",
-"4-0*76=4",
-"4-0*77=4",
-"4-0*78=4",
-"4-0*79=4",
-"4-0*80=4",
-"4-0*81=4",
-"4-0*82=4",
-"4-0*83=4",
-"4-0*84=4",
-"4-0*85=4",
-"4-0*86=4",
-"4-0*87=4",
-"4-0*88=4",
-"4-0*89=4",
-"4-0*90=4",
-"4-0*91=4",
-"4-0*92=4",
-"4-0*93=4",
-"4-0*94=4",
-"4-0*95=4",
-"4-0*96=4",
-"4-0*97=4",
-"4-0*98=4",
-"4-0*99=4",
-"4-0/10=4",
-"4-0/11=4",
-"4-0/12=4",
-"4-0/13=4",
-"4-0/14=4",
-"4-0/15=4",
-"4-0/16=4",
-"4-0/17=4",
-"4-0/18=4",
-"4-0/19=4",
-"4-0/20=4",
-"4-0/21=4",
-"4-0/22=4",
-"4-0/23=4",
-"4-0/24=4",
-"4-0/25=4",
-"4-0/26=4",
-"4-0/27=4",
-"4-0/28=4",
-"4-0/29=4",
-"4-0/30=4",
-"4-0/31=4",
-"4-0/32=4",
-"4-0/33=4",
-"4-0/34=4",
-"4-0/35=4",
-"4-0/36=4",
-"4-0/37=4",
-"4-0/38=4",
-"4-0/39=4",
-"4-0/40=4",
-"4-0/41=4",
-"4-0/42=4",
-"4-0/43=4",
-"4-0/44=4",
-"4-0/45=4",
-"4-0/46=4",
-"4-0/47=4",
-"4-0/48=4",
-"4-0/49=4",
-"4-0/50=4",
-"4-0/51=4",
-"4-0/52=4",
-"4-0/53=4",
-"4-0/54=4",
-"4-0/55=4",
-"4-0/56=4",
-"4-0/57=4",
-"4-0/58=4",
-"4-0/59=4",
-"4-0/60=4",
-"4-0/61=4",
-"4-0/62=4",
-"4-0/63=4",
-"4-0/64=4",
-"4-0/65=4",
-"4-0/66=4",
-"4-0/67=4",
-"4-0/68=4",
-"4-0/69=4",
-"4-0/70=4",
-"4-0/71=4",
-"4-0/72=4",
-"4-0/73=4",
-"4-0/74=4",
-"4-0/75=4",
-"4-0/76=4",
-"4-0/77=4",
-"4-0/78=4",
-"4-0/79=4",
-"4-0/80=4",
-"4-0/81=4",
-"4-0/82=4",
-"4-0/83=4",
-"4-0/84=4",
-"4-0/85=4",
-"4-0/86=4",
-"4-0/87=4",
-"4-0/88=4",
-"4-0/89=4",
-"4-0/90=4",
-"4-0/91=4",
-"4-0/92=4",
-"4-0/93=4",
-"4-0/94=4",
-"4-0/95=4",
-"4-0/96=4",
-"4-0/97=4",
-"4-0/98=4",
-"4-0/99=4",
-"4-10+6=0",
-"4-10+7=1",
-"4-10+8=2",
-"4-10+9=3",
-"4-10*0=4",
-"4-10/5=2",
-"4-11+7=0",
-"4-11+8=1",
-"4-11+9=2",
-"4-11*0=4",
-"4-12+8=0",
-"4-12+9=1",
-"4-12*0=4",
-"4-12/3=0",
-"4-12/4=1",
-"4-12/6=2",
-"4-13+9=0",
-"4-13*0=4",
-"4-14*0=4",
-"4-14/7=2",
-"4-14=-10",
-"4-15*0=4",
-"4-15/5=1",
-"4-15=-11",
-"4-16*0=4",
-"4-16/4=0",
-"4-16/8=2",
-"4-16=-12",
-"4-17*0=4",
-"4-17=-13",
-"4-18*0=4",
-"4-18/6=1",
-"4-18/9=2",
-"4-18=-14",
-"4-19*0=4",
-"4-19=-15",
-"4-1+7=10",
-"4-1+8=11",
-"4-1+9=12",
-"4-1-4=-1",
-"4-1-5=-2",
-"4-1-6=-3",
-"4-1-7=-4",
-"4-1-8=-5",
-"4-1-9=-6",
-"4-1*5=-1",
-"4-1*6=-2",
-"4-1*7=-3",
-"4-1*8=-4",
-"4-1*9=-5",
-"4-20*0=4",
-"4-20/5=0",
-"4-20=-16",
-"4-21*0=4",
-"4-21/7=1",
-"4-21=-17",
-"4-22*0=4",
-"4-22=-18",
-"4-23*0=4",
-"4-23=-19",
-"4-24*0=4",
-"4-24/6=0",
-"4-24/8=1",
-"4-24=-20",
-"4-25*0=4",
-"4-25=-21",
-"4-26*0=4",
-"4-26=-22",
-"4-27*0=4",
-"4-27/9=1",
-"4-27=-23",
-"4-28*0=4",
-"4-28/7=0",
-"4-28=-24",
-"4-29*0=4",
-"4-29=-25",
-"4-2+8=10",
-"4-2+9=11",
-"4-2-3=-1",
-"4-2-4=-2",
-"4-2-5=-3",
-"4-2-6=-4",
-"4-2-7=-5",
-"4-2-8=-6",
-"4-2-9=-7",
-"4-2*3=-2",
-"4-2*4=-4",
-"4-2*5=-6",
-"4-2*6=-8",
-"4-30*0=4",
-"4-30=-26",
-"4-31*0=4",
-"4-31=-27",
-"4-32*0=4",
-"4-32/8=0",
-"4-32=-28",
-"4-33*0=4",
-"4-33=-29",
-"4-34*0=4",
-"4-34=-30",
-"4-35*0=4",
-"4-35=-31",
-"4-36*0=4",
-"4-36/9=0",
-"4-36=-32",
-"4-37*0=4",
-"4-37=-33",
-"4-38*0=4",
-"4-38=-34",
-"4-39*0=4",
-"4-39=-35",
-"4-3+9=10",
-"4-3-2=-1",
-"4-3-3=-2",
-"4-3-4=-3",
-"4-3-5=-4",
-"4-3-6=-5",
-"4-3-7=-6",
-"4-3-8=-7",
-"4-3-9=-8",
-"4-3*2=-2",
-"4-3*3=-5",
-"4-3*4=-8",
-"4-40*0=4",
-"4-40=-36",
-"4-41*0=4",
-"4-41=-37",
-"4-42*0=4",
-"4-42=-38",
-"4-43*0=4",
-"4-43=-39",
-"4-44*0=4",
-"4-44=-40",
-"4-45*0=4",
-"4-45=-41",
-"4-46*0=4",
-"4-46=-42",
-"4-47*0=4",
-"4-47=-43",
-"4-48*0=4",
-"4-48=-44",
-"4-49*0=4",
-"4-49=-45",
-"4-4-1=-1",
-"4-4-2=-2",
-"4-4-3=-3",
-"4-4-4=-4",
-"4-4-5=-5",
-"4-4-6=-6",
-"4-4-7=-7",
-"4-4-8=-8",
-"4-4-9=-9",
-"4-4*2=-4",
-"4-4*3=-8",
-"4-50*0=4",
-"4-50=-46",
-"4-51*0=4",
-"4-51=-47",
-"4-52*0=4",
-"4-52=-48",
-"4-53*0=4",
-"4-53=-49",
-"4-54*0=4",
-"4-54=-50",
-"4-55*0=4",
-"4-55=-51",
-"4-56*0=4",
-"4-56=-52",
-"4-57*0=4",
-"4-57=-53",
-"4-58*0=4",
-"4-58=-54",
-"4-59*0=4",
-"4-59=-55",
-"4-5+0=-1",
-"4-5+10=9",
-"4-5-0=-1",
-"4-5-1=-2",
-"4-5-2=-3",
-"4-5-3=-4",
-"4-5-4=-5",
-"4-5-5=-6",
-"4-5-6=-7",
-"4-5-7=-8",
-"4-5-8=-9",
-"4-5*1=-1",
-"4-5*2=-6",
-"4-5/1=-1",
-"4-60*0=4",
-"4-60=-56",
-"4-61*0=4",
-"4-61=-57",
-"4-62*0=4",
-"4-62=-58",
-"4-63*0=4",
-"4-63=-59",
-"4-64*0=4",
-"4-64=-60",
-"4-65*0=4",
-"4-65=-61",
-"4-66*0=4",
-"4-66=-62",
-"4-67*0=4",
-"4-67=-63",
-"4-68*0=4",
-"4-68=-64",
-"4-69*0=4",
-"4-69=-65",
-"4-6+0=-2",
-"4-6+10=8",
-"4-6+11=9",
-"4-6+1=-1",
-"4-6-0=-2",
-"4-6-1=-3",
-"4-6-2=-4",
-"4-6-3=-5",
-"4-6-4=-6",
-"4-6-5=-7",
-"4-6-6=-8",
-"4-6-7=-9",
-"4-6*1=-2",
-"4-6*2=-8",
-"4-6/1=-2",
-"4-70*0=4",
-"4-70=-66",
-"4-71*0=4",
-"4-71=-67",
-"4-72*0=4",
-"4-72=-68",
-"4-73*0=4",
-"4-73=-69",
-"4-74*0=4",
-"4-74=-70",
-"4-75*0=4",
-"4-75=-71",
-"4-76*0=4",
-"4-76=-72",
-"4-77*0=4",
-"4-77=-73",
-"4-78*0=4",
-"4-78=-74",
-"4-79*0=4",
-"4-79=-75",
-"4-7+0=-3",
-"4-7+10=7",
-"4-7+11=8",
-"4-7+12=9",
-"4-7+1=-2",
-"4-7+2=-1",
-"4-7-0=-3",
-"4-7-1=-4",
-"4-7-2=-5",
-"4-7-3=-6",
-"4-7-4=-7",
-"4-7-5=-8",
-"4-7-6=-9",
-"4-7*1=-3",
-"4-7/1=-3",
-"4-80*0=4",
-"4-80=-76",
-"4-81*0=4",
-"4-81=-77",
-"4-82*0=4",
-"4-82=-78",
-"4-83*0=4",
-"4-83=-79",
-"4-84*0=4",
-"4-84=-80",
-"4-85*0=4",
-"4-85=-81",
-"4-86*0=4",
-"4-86=-82",
-"4-87*0=4",
-"4-87=-83",
-"4-88*0=4",
-"4-88=-84",
-"4-89*0=4",
-"4-89=-85",
-"4-8+0=-4",
-"4-8+10=6",
-"4-8+11=7",
-"4-8+12=8",
-"4-8+13=9",
-"4-8+1=-3",
-"4-8+2=-2",
-"4-8+3=-1",
-"4-8-0=-4",
-"4-8-1=-5",
-"4-8-2=-6",
-"4-8-3=-7",
-"4-8-4=-8",
-"4-8-5=-9",
-"4-8*1=-4",
-"4-8/1=-4",
-"4-90*0=4",
-"4-90=-86",
-"4-91*0=4",
-"4-91=-87",
-"4-92*0=4",
-"4-92=-88",
-"4-93*0=4",
-"4-93=-89",
-"4-94*0=4",
-"4-94=-90",
-"4-95*0=4",
-"4-95=-91",
-"4-96*0=4",
-"4-96=-92",
-"4-97*0=4",
-"4-97=-93",
-"4-98*0=4",
-"4-98=-94",
-"4-99*0=4",
-"4-99=-95",
-"4-9+0=-5",
-"4-9+10=5",
-"4-9+11=6",
-"4-9+12=7",
-"4-9+13=8",
-"4-9+14=9",
-"4-9+1=-4",
-"4-9+2=-3",
-"4-9+3=-2",
-"4-9+4=-1",
-"4-9-0=-5",
-"4-9-1=-6",
-"4-9-2=-7",
-"4-9-3=-8",
-"4-9-4=-9",
-"4-9*1=-5",
-"4-9/1=-5",
-"4*0-1=-1",
-"4*0-2=-2",
-"4*0-3=-3",
-"4*0-4=-4",
-"4*0-5=-5",
-"4*0-6=-6",
-"4*0-7=-7",
-"4*0-8=-8",
-"4*0-9=-9",
-"4*0*10=0",
-"4*0*11=0",
-"4*0*12=0",
-"4*0*13=0",
-"4*0*14=0",
-"4*0*15=0",
-"4*0*16=0",
-"4*0*17=0",
-"4*0*18=0",
-"4*0*19=0",
-"4*0*20=0",
-"4*0*21=0",
-"4*0*22=0",
-"4*0*23=0",
-"4*0*24=0",
-"4*0*25=0",
-"4*0*26=0",
-"4*0*27=0",
-"4*0*28=0",
-"4*0*29=0",
-"4*0*30=0",
-"4*0*31=0",
-"4*0*32=0",
-"4*0*33=0",
-"4*0*34=0",
-"4*0*35=0",
-"4*0*36=0",
-"4*0*37=0",
-"4*0*38=0",
-"4*0*39=0",
-"4*0*40=0",
-"4*0*41=0",
-"4*0*42=0",
-"4*0*43=0",
-"4*0*44=0",
-"4*0*45=0",
-"4*0*46=0",
-"4*0*47=0",
-"4*0*48=0",
-"4*0*49=0",
-"4*0*50=0",
-"4*0*51=0",
-"4*0*52=0",
-"4*0*53=0",
-"4*0*54=0",
-"4*0*55=0",
-"4*0*56=0",
-"4*0*57=0",
-"4*0*58=0",
-"4*0*59=0",
-"4*0*60=0",
-"4*0*61=0",
-"4*0*62=0",
-"4*0*63=0",
-"4*0*64=0",
-"4*0*65=0",
-"4*0*66=0",
-"4*0*67=0",
-"4*0*68=0",
-"4*0*69=0",
-"4*0*70=0",
-"4*0*71=0",
-"4*0*72=0",
-"4*0*73=0",
-"4*0*74=0",
-"4*0*75=0",
-"4*0*76=0",
-"4*0*77=0",
-"4*0*78=0",
-"4*0*79=0",
-"4*0*80=0",
-"4*0*81=0",
-"4*0*82=0",
-"4*0*83=0",
-"4*0*84=0",
-"4*0*85=0",
-"4*0*86=0",
-"4*0*87=0",
-"4*0*88=0",
-"4*0*89=0",
-"4*0*90=0",
-"4*0*91=0",
-"4*0*92=0",
-"4*0*93=0",
-"4*0*94=0",
-"4*0*95=0",
-"4*0*96=0",
-"4*0*97=0",
-"4*0*98=0",
-"4*0*99=0",
-"4*0/10=0",
-"4*0/11=0",
-"4*0/12=0",
-"4*0/13=0",
-"4*0/14=0",
-"4*0/15=0",
-"4*0/16=0",
-"4*0/17=0",
-"4*0/18=0",
-"4*0/19=0",
-"4*0/20=0",
-"4*0/21=0",
-"4*0/22=0",
-"4*0/23=0",
-"4*0/24=0",
-"4*0/25=0",
-"4*0/26=0",
-"4*0/27=0",
-"4*0/28=0",
-"4*0/29=0",
-"4*0/30=0",
-"4*0/31=0",
-"4*0/32=0",
-"4*0/33=0",
-"4*0/34=0",
-"4*0/35=0",
-"4*0/36=0",
-"4*0/37=0",
-"4*0/38=0",
-"4*0/39=0",
-"4*0/40=0",
-"4*0/41=0",
-"4*0/42=0",
-"4*0/43=0",
-"4*0/44=0",
-"4*0/45=0",
-"4*0/46=0",
-"4*0/47=0",
-"4*0/48=0",
-"4*0/49=0",
-"4*0/50=0",
-"4*0/51=0",
-"4*0/52=0",
-"4*0/53=0",
-"4*0/54=0",
-"4*0/55=0",
-"4*0/56=0",
-"4*0/57=0",
-"4*0/58=0",
-"4*0/59=0",
-"4*0/60=0",
-"4*0/61=0",
-"4*0/62=0",
-"4*0/63=0",
-"4*0/64=0",
-"4*0/65=0",
-"4*0/66=0",
-"4*0/67=0",
-"4*0/68=0",
-"4*0/69=0",
-"4*0/70=0",
-"4*0/71=0",
-"4*0/72=0",
-"4*0/73=0",
-"4*0/74=0",
-"4*0/75=0",
-"4*0/76=0",
-"4*0/77=0",
-"4*0/78=0",
-"4*0/79=0",
-"4*0/80=0",
-"4*0/81=0",
-"4*0/82=0",
-"4*0/83=0",
-"4*0/84=0",
-"4*0/85=0",
-"4*0/86=0",
-"4*0/87=0",
-"4*0/88=0",
-"4*0/89=0",
-"4*0/90=0",
-"4*0/91=0",
-"4*0/92=0",
-"4*0/93=0",
-"4*0/94=0",
-"4*0/95=0",
-"4*0/96=0",
-"4*0/97=0",
-"4*0/98=0",
-"4*0/99=0",
-"4*10*0=0",
-"4*10/5=8",
-"4*10/8=5",
-"4*11*0=0",
-"4*12*0=0",
-"4*12/6=8",
-"4*12/8=6",
-"4*13*0=0",
-"4*14*0=0",
-"4*14/7=8",
-"4*14/8=7",
-"4*15*0=0",
-"4*16*0=0",
-"4*16/8=8",
-"4*17*0=0",
-"4*18*0=0",
-"4*18/8=9",
-"4*18/9=8",
-"4*19*0=0",
-"4*1+6=10",
-"4*1+7=11",
-"4*1+8=12",
-"4*1+9=13",
-"4*1-5=-1",
-"4*1-6=-2",
-"4*1-7=-3",
-"4*1-8=-4",
-"4*1-9=-5",
-"4*1*3=12",
-"4*1*4=16",
-"4*1*5=20",
-"4*1*6=24",
-"4*1*7=28",
-"4*1*8=32",
-"4*1*9=36",
-"4*20*0=0",
-"4*21*0=0",
-"4*22*0=0",
-"4*23*0=0",
-"4*24*0=0",
-"4*25*0=0",
-"4*25=100",
-"4*26*0=0",
-"4*26=104",
-"4*27*0=0",
-"4*27=108",
-"4*28*0=0",
-"4*28=112",
-"4*29*0=0",
-"4*29=116",
-"4*2+2=10",
-"4*2+3=11",
-"4*2+4=12",
-"4*2+5=13",
-"4*2+6=14",
-"4*2+7=15",
-"4*2+8=16",
-"4*2+9=17",
-"4*2-9=-1",
-"4*2*2=16",
-"4*2*3=24",
-"4*2*4=32",
-"4*2*5=40",
-"4*2*6=48",
-"4*2*7=56",
-"4*2*8=64",
-"4*2*9=72",
-"4*30*0=0",
-"4*30=120",
-"4*31*0=0",
-"4*31=124",
-"4*32*0=0",
-"4*32=128",
-"4*33*0=0",
-"4*33=132",
-"4*34*0=0",
-"4*34=136",
-"4*35*0=0",
-"4*35=140",
-"4*36*0=0",
-"4*36=144",
-"4*37*0=0",
-"4*37=148",
-"4*38*0=0",
-"4*38=152",
-"4*39*0=0",
-"4*39=156",
-"4*3+0=12",
-"4*3+1=13",
-"4*3+2=14",
-"4*3+3=15",
-"4*3+4=16",
-"4*3+5=17",
-"4*3+6=18",
-"4*3+7=19",
-"4*3+8=20",
-"4*3+9=21",
-"4*3-0=12",
-"4*3-10=2",
-"4*3-11=1",
-"4*3-12=0",
-"4*3-1=11",
-"4*3-2=10",
-"4*3*1=12",
-"4*3*2=24",
-"4*3*3=36",
-"4*3*4=48",
-"4*3*5=60",
-"4*3*6=72",
-"4*3*7=84",
-"4*3*8=96",
-"4*3/12=1",
-"4*3/1=12",
-"4*40*0=0",
-"4*40=160",
-"4*41*0=0",
-"4*41=164",
-"4*42*0=0",
-"4*42=168",
-"4*43*0=0",
-"4*43=172",
-"4*44*0=0",
-"4*44=176",
-"4*45*0=0",
-"4*45=180",
-"4*46*0=0",
-"4*46=184",
-"4*47*0=0",
-"4*47=188",
-"4*48*0=0",
-"4*48=192",
-"4*49*0=0",
-"4*49=196",
-"4*4+0=16",
-"4*4+1=17",
-"4*4+2=18",
-"4*4+3=19",
-"4*4+4=20",
-"4*4+5=21",
-"4*4+6=22",
-"4*4+7=23",
-"4*4+8=24",
-"4*4+9=25",
-"4*4-0=16",
-"4*4-10=6",
-"4*4-11=5",
-"4*4-12=4",
-"4*4-13=3",
-"4*4-14=2",
-"4*4-15=1",
-"4*4-16=0",
-"4*4-1=15",
-"4*4-2=14",
-"4*4-3=13",
-"4*4-4=12",
-"4*4-5=11",
-"4*4-6=10",
-"4*4*1=16",
-"4*4*2=32",
-"4*4*3=48",
-"4*4*4=64",
-"4*4*5=80",
-"4*4*6=96",
-"4*4/16=1",
-"4*4/1=16",
-"4*50*0=0",
-"4*50=200",
-"4*51*0=0",
-"4*51=204",
-"4*52*0=0",
-"4*52=208",
-"4*53*0=0",
-"4*53=212",
-"4*54*0=0",
-"4*54=216",
-"4*55*0=0",
-"4*55=220",
-"4*56*0=0",
-"4*56=224",
-"4*57*0=0",
-"4*57=228",
-"4*58*0=0",
-"4*58=232",
-"4*59*0=0",
-"4*59=236",
-"4*5+0=20",
-"4*5+1=21",
-"4*5+2=22",
-"4*5+3=23",
-"4*5+4=24",
-"4*5+5=25",
-"4*5+6=26",
-"4*5+7=27",
-"4*5+8=28",
-"4*5+9=29",
-"4*5-0=20",
-"4*5-11=9",
-"4*5-12=8",
-"4*5-13=7",
-"4*5-14=6",
-"4*5-15=5",
-"4*5-16=4",
-"4*5-17=3",
-"4*5-18=2",
-"4*5-19=1",
-"4*5-1=19",
-"4*5-20=0",
-"4*5-2=18",
-"4*5-3=17",
-"4*5-4=16",
-"4*5-5=15",
-"4*5-6=14",
-"4*5-7=13",
-"4*5-8=12",
-"4*5-9=11",
-"4*5*1=20",
-"4*5*2=40",
-"4*5*3=60",
-"4*5*4=80",
-"4*5/10=2",
-"4*5/1=20",
-"4*5/20=1",
-"4*5/2=10",
-"4*60*0=0",
-"4*60=240",
-"4*61*0=0",
-"4*61=244",
-"4*62*0=0",
-"4*62=248",
-"4*63*0=0",
-"4*63=252",
-"4*64*0=0",
-"4*64=256",
-"4*65*0=0",
-"4*65=260",
-"4*66*0=0",
-"4*66=264",
-"4*67*0=0",
-"4*67=268",
-"4*68*0=0",
-"4*68=272",
-"4*69*0=0",
-"4*69=276",
-"4*6+0=24",
-"4*6+1=25",
-"4*6+2=26",
-"4*6+3=27",
-"4*6+4=28",
-"4*6+5=29",
-"4*6+6=30",
-"4*6+7=31",
-"4*6+8=32",
-"4*6+9=33",
-"4*6-0=24",
-"4*6-15=9",
-"4*6-16=8",
-"4*6-17=7",
-"4*6-18=6",
-"4*6-19=5",
-"4*6-1=23",
-"4*6-20=4",
-"4*6-21=3",
-"4*6-22=2",
-"4*6-23=1",
-"4*6-24=0",
-"4*6-2=22",
-"4*6-3=21",
-"4*6-4=20",
-"4*6-5=19",
-"4*6-6=18",
-"4*6-7=17",
-"4*6-8=16",
-"4*6-9=15",
-"4*6*1=24",
-"4*6*2=48",
-"4*6*3=72",
-"4*6*4=96",
-"4*6/12=2",
-"4*6/1=24",
-"4*6/24=1",
-"4*6/2=12",
-"4*70*0=0",
-"4*70=280",
-"4*71*0=0",
-"4*71=284",
-"4*72*0=0",
-"4*72=288",
-"4*73*0=0",
-"4*73=292",
-"4*74*0=0",
-"4*74=296",
-"4*75*0=0",
-"4*75=300",
-"4*76*0=0",
-"4*76=304",
-"4*77*0=0",
-"4*77=308",
-"4*78*0=0",
-"4*78=312",
-"4*79*0=0",
-"4*79=316",
-"4*7+0=28",
-"4*7+1=29",
-"4*7+2=30",
-"4*7+3=31",
-"4*7+4=32",
-"4*7+5=33",
-"4*7+6=34",
-"4*7+7=35",
-"4*7+8=36",
-"4*7+9=37",
-"4*7-0=28",
-"4*7-19=9",
-"4*7-1=27",
-"4*7-20=8",
-"4*7-21=7",
-"4*7-22=6",
-"4*7-23=5",
-"4*7-24=4",
-"4*7-25=3",
-"4*7-26=2",
-"4*7-27=1",
-"4*7-28=0",
-"4*7-2=26",
-"4*7-3=25",
-"4*7-4=24",
-"4*7-5=23",
-"4*7-6=22",
-"4*7-7=21",
-"4*7-8=20",
-"4*7-9=19",
-"4*7*1=28",
-"4*7*2=56",
-"4*7*3=84",
-"4*7/14=2",
-"4*7/1=28",
-"4*7/28=1",
-"4*7/2=14",
-"4*80*0=0",
-"4*80=320",
-"4*81*0=0",
-"4*81=324",
-"4*82*0=0",
-"4*82=328",
-"4*83*0=0",
-"4*83=332",
-"4*84*0=0",
-"4*84=336",
-"4*85*0=0",
-"4*85=340",
-"4*86*0=0",
-"4*86=344",
-"4*87*0=0",
-"4*87=348",
-"4*88*0=0",
-"4*88=352",
-"4*89*0=0",
-"4*89=356",
-"4*8+0=32",
-"4*8+1=33",
-"4*8+2=34",
-"4*8+3=35",
-"4*8+4=36",
-"4*8+5=37",
-"4*8+6=38",
-"4*8+7=39",
-"4*8+8=40",
-"4*8+9=41",
-"4*8-0=32",
-"4*8-1=31",
-"4*8-23=9",
-"4*8-24=8",
-"4*8-25=7",
-"4*8-26=6",
-"4*8-27=5",
-"4*8-28=4",
-"4*8-29=3",
-"4*8-2=30",
-"4*8-30=2",
-"4*8-31=1",
-"4*8-32=0",
-"4*8-3=29",
-"4*8-4=28",
-"4*8-5=27",
-"4*8-6=26",
-"4*8-7=25",
-"4*8-8=24",
-"4*8-9=23",
-"4*8*1=32",
-"4*8*2=64",
-"4*8*3=96",
-"4*8/16=2",
-"4*8/1=32",
-"4*8/2=16",
-"4*8/32=1",
-"4*90*0=0",
-"4*90=360",
-"4*91*0=0",
-"4*91=364",
-"4*92*0=0",
-"4*92=368",
-"4*93*0=0",
-"4*93=372",
-"4*94*0=0",
-"4*94=376",
-"4*95*0=0",
-"4*95=380",
-"4*96*0=0",
-"4*96=384",
-"4*97*0=0",
-"4*97=388",
-"4*98*0=0",
-"4*98=392",
-"4*99*0=0",
-"4*99=396",
-"4*9+0=36",
-"4*9+1=37",
-"4*9+2=38",
-"4*9+3=39",
-"4*9+4=40",
-"4*9+5=41",
-"4*9+6=42",
-"4*9+7=43",
-"4*9+8=44",
-"4*9+9=45",
-"4*9-0=36",
-"4*9-1=35",
-"4*9-27=9",
-"4*9-28=8",
-"4*9-29=7",
-"4*9-2=34",
-"4*9-30=6",
-"4*9-31=5",
-"4*9-32=4",
-"4*9-33=3",
-"4*9-34=2",
-"4*9-35=1",
-"4*9-36=0",
-"4*9-3=33",
-"4*9-4=32",
-"4*9-5=31",
-"4*9-6=30",
-"4*9-7=29",
-"4*9-8=28",
-"4*9-9=27",
-"4*9*1=36",
-"4*9*2=72",
-"4*9/12=3",
-"4*9/18=2",
-"4*9/1=36",
-"4*9/2=18",
-"4*9/36=1",
-"4*9/3=12",
-"4/10*0=0",
-"4/10*5=2",
-"4/11*0=0",
-"4/12*0=0",
-"4/12*3=1",
-"4/12*6=2",
-"4/12*9=3",
-"4/13*0=0",
-"4/14*0=0",
-"4/14*7=2",
-"4/15*0=0",
-"4/16*0=0",
-"4/16*4=1",
-"4/16*8=2",
-"4/17*0=0",
-"4/18*0=0",
-"4/18*9=2",
-"4/19*0=0",
-"4/1+6=10",
-"4/1+7=11",
-"4/1+8=12",
-"4/1+9=13",
-"4/1-5=-1",
-"4/1-6=-2",
-"4/1-7=-3",
-"4/1-8=-4",
-"4/1-9=-5",
-"4/1*3=12",
-"4/1*4=16",
-"4/1*5=20",
-"4/1*6=24",
-"4/1*7=28",
-"4/1*8=32",
-"4/1*9=36",
-"4/20*0=0",
-"4/20*5=1",
-"4/21*0=0",
-"4/22*0=0",
-"4/23*0=0",
-"4/24*0=0",
-"4/24*6=1",
-"4/25*0=0",
-"4/26*0=0",
-"4/27*0=0",
-"4/28*0=0",
-"4/28*7=1",
-"4/29*0=0",
-"4/2+8=10",
-"4/2+9=11",
-"4/2-3=-1",
-"4/2-4=-2",
-"4/2-5=-3",
-"4/2-6=-4",
-"4/2-7=-5",
-"4/2-8=-6",
-"4/2-9=-7",
-"4/2*5=10",
-"4/2*6=12",
-"4/2*7=14",
-"4/2*8=16",
-"4/2*9=18",
-"4/30*0=0",
-"4/31*0=0",
-"4/32*0=0",
-"4/32*8=1",
-"4/33*0=0",
-"4/34*0=0",
-"4/35*0=0",
-"4/36*0=0",
-"4/36*9=1",
-"4/37*0=0",
-"4/38*0=0",
-"4/39*0=0",
-"4/3*9=12",
-"4/40*0=0",
-"4/41*0=0",
-"4/42*0=0",
-"4/43*0=0",
-"4/44*0=0",
-"4/45*0=0",
-"4/46*0=0",
-"4/47*0=0",
-"4/48*0=0",
-"4/49*0=0",
-"4/4+9=10",
-"4/4-2=-1",
-"4/4-3=-2",
-"4/4-4=-3",
-"4/4-5=-4",
-"4/4-6=-5",
-"4/4-7=-6",
-"4/4-8=-7",
-"4/4-9=-8",
-"4/50*0=0",
-"4/51*0=0",
-"4/52*0=0",
-"4/53*0=0",
-"4/54*0=0",
-"4/55*0=0",
-"4/56*0=0",
-"4/57*0=0",
-"4/58*0=0",
-"4/59*0=0",
-"4/5*10=8",
-"4/60*0=0",
-"4/61*0=0",
-"4/62*0=0",
-"4/63*0=0",
-"4/64*0=0",
-"4/65*0=0",
-"4/66*0=0",
-"4/67*0=0",
-"4/68*0=0",
-"4/69*0=0",
-"4/6*12=8",
-"4/70*0=0",
-"4/71*0=0",
-"4/72*0=0",
-"4/73*0=0",
-"4/74*0=0",
-"4/75*0=0",
-"4/76*0=0",
-"4/77*0=0",
-"4/78*0=0",
-"4/79*0=0",
-"4/7*14=8",
-"4/80*0=0",
-"4/81*0=0",
-"4/82*0=0",
-"4/83*0=0",
-"4/84*0=0",
-"4/85*0=0",
-"4/86*0=0",
-"4/87*0=0",
-"4/88*0=0",
-"4/89*0=0",
-"4/8*10=5",
-"4/8*12=6",
-"4/8*14=7",
-"4/8*16=8",
-"4/8*18=9",
-"4/90*0=0",
-"4/91*0=0",
-"4/92*0=0",
-"4/93*0=0",
-"4/94*0=0",
-"4/95*0=0",
-"4/96*0=0",
-"4/97*0=0",
-"4/98*0=0",
-"4/99*0=0",
-"4/9*18=8",
-"5000*0=0",
-"5001*0=0",
-"5002*0=0",
-"5003*0=0",
-"5004*0=0",
-"5005*0=0",
-"5006*0=0",
-"5007*0=0",
-"5008*0=0",
-"5009*0=0",
-"5010*0=0",
-"5011*0=0",
-"5012*0=0",
-"5013*0=0",
-"5014*0=0",
-"5015*0=0",
-"5016*0=0",
-"5017*0=0",
-"5018*0=0",
-"5019*0=0",
-"5020*0=0",
-"5021*0=0",
-"5022*0=0",
-"5023*0=0",
-"5024*0=0",
-"5025*0=0",
-"5026*0=0",
-"5027*0=0",
-"5028*0=0",
-"5029*0=0",
-"5030*0=0",
-"5031*0=0",
-"5032*0=0",
-"5033*0=0",
-"5034*0=0",
-"5035*0=0",
-"5036*0=0",
-"5037*0=0",
-"5038*0=0",
-"5039*0=0",
-"5040*0=0",
-"5041*0=0",
-"5042*0=0",
-"5043*0=0",
-"5044*0=0",
-"5045*0=0",
-"5046*0=0",
-"5047*0=0",
-"5048*0=0",
-"5049*0=0",
-"504/56=9",
-"504/63=8",
-"504/6=84",
-"504/72=7",
-"504/7=72",
-"504/84=6",
-"504/8=63",
-"504/9=56",
-"5050*0=0",
-"5051*0=0",
-"5052*0=0",
-"5053*0=0",
-"5054*0=0",
-"5055*0=0",
-"5056*0=0",
-"5057*0=0",
-"5058*0=0",
-"5059*0=0",
-"5060*0=0",
-"5061*0=0",
-"5062*0=0",
-"5063*0=0",
-"5064*0=0",
-"5065*0=0",
-"5066*0=0",
-"5067*0=0",
-"5068*0=0",
-"5069*0=0",
-"5070*0=0",
-"5071*0=0",
-"5072*0=0",
-"5073*0=0",
-"5074*0=0",
-"5075*0=0",
-"5076*0=0",
-"5077*0=0",
-"5078*0=0",
-"5079*0=0",
-"5080*0=0",
-"5081*0=0",
-"5082*0=0",
-"5083*0=0",
-"5084*0=0",
-"5085*0=0",
-"5086*0=0",
-"5087*0=0",
-"5088*0=0",
-"5089*0=0",
-"5090*0=0",
-"5091*0=0",
-"5092*0=0",
-"5093*0=0",
-"5094*0=0",
-"5095*0=0",
-"5096*0=0",
-"5097*0=0",
-"5098*0=0",
-"5099*0=0",
-"50+10=60",
-"50+11=61",
-"50+12=62",
-"50+13=63",
-"50+14=64",
-"50+15=65",
-"50+16=66",
-"50+17=67",
-"50+18=68",
-"50+19=69",
-"50+20=70",
-"50+21=71",
-"50+22=72",
-"50+23=73",
-"50+24=74",
-"50+25=75",
-"50+26=76",
-"50+27=77",
-"50+28=78",
-"50+29=79",
-"50+30=80",
-"50+31=81",
-"50+32=82",
-"50+33=83",
-"50+34=84",
-"50+35=85",
-"50+36=86",
-"50+37=87",
-"50+38=88",
-"50+39=89",
-"50+40=90",
-"50+41=91",
-"50+42=92",
-"50+43=93",
-"50+44=94",
-"50+45=95",
-"50+46=96",
-"50+47=97",
-"50+48=98",
-"50+49=99",
-"50-10=40",
-"50-11=39",
-"50-12=38",
-"50-13=37",
-"50-14=36",
-"50-15=35",
-"50-16=34",
-"50-17=33",
-"50-18=32",
-"50-19=31",
-"50-20=30",
-"50-21=29",
-"50-22=28",
-"50-23=27",
-"50-24=26",
-"50-25=25",
-"50-26=24",
-"50-27=23",
-"50-28=22",
-"50-29=21",
-"50-30=20",
-"50-31=19",
-"50-32=18",
-"50-33=17",
-"50-34=16",
-"50-35=15",
-"50-36=14",
-"50-37=13",
-"50-38=12",
-"50-39=11",
-"50-40=10",
-"50-51=-1",
-"50-52=-2",
-"50-53=-3",
-"50-54=-4",
-"50-55=-5",
-"50-56=-6",
-"50-57=-7",
-"50-58=-8",
-"50-59=-9",
-"50-5*9=5",
-"50-6*7=8",
-"50-6*8=2",
-"50-7*6=8",
-"50-7*7=1",
-"50-8*6=2",
-"50-9*5=5",
-"50*0+0=0",
-"50*0+1=1",
-"50*0+2=2",
-"50*0+3=3",
-"50*0+4=4",
-"50*0+5=5",
-"50*0+6=6",
-"50*0+7=7",
-"50*0+8=8",
-"50*0+9=9",
-"50*0-0=0",
-"50*0*0=0",
-"50*0*1=0",
-"50*0*2=0",
-"50*0*3=0",
-"50*0*4=0",
-"50*0*5=0",
-"50*0*6=0",
-"50*0*7=0",
-"50*0*8=0",
-"50*0*9=0",
-"50*0/1=0",
-"50*0/2=0",
-"50*0/3=0",
-"50*0/4=0",
-"50*0/5=0",
-"50*0/6=0",
-"50*0/7=0",
-"50*0/8=0",
-"50*0/9=0",
-"50*1*0=0",
-"50*2*0=0",
-"50*2=100",
-"50*3*0=0",
-"50*3=150",
-"50*4*0=0",
-"50*4=200",
-"50*5*0=0",
-"50*5=250",
-"50*6*0=0",
-"50*6=300",
-"50*7*0=0",
-"50*7=350",
-"50*8*0=0",
-"50*8=400",
-"50*9*0=0",
-"50*9=450",
-"50/1*0=0",
-"50/2*0=0",
-"50/2/5=5",
-"50/3*0=0",
-"50/4*0=0",
-"50/5-1=9",
-"50/5-2=8",
-"50/5-3=7",
-"50/5-4=6",
-"50/5-5=5",
-"50/5-6=4",
-"50/5-7=3",
-"50/5-8=2",
-"50/5-9=1",
-"50/5*0=0",
-"50/5/2=5",
-"50/5/5=2",
-"50/6*0=0",
-"50/7*0=0",
-"50/8*0=0",
-"50/9*0=0",
-"5100*0=0",
-"5101*0=0",
-"5102*0=0",
-"5103*0=0",
-"5104*0=0",
-"5105*0=0",
-"5106*0=0",
-"5107*0=0",
-"5108*0=0",
-"5109*0=0",
-"510/6=85",
-"510/85=6",
-"5110*0=0",
-"5111*0=0",
-"5112*0=0",
-"5113*0=0",
-"5114*0=0",
-"5115*0=0",
-"5116*0=0",
-"5117*0=0",
-"5118*0=0",
-"5119*0=0",
-"511/73=7",
-"511/7=73",
-"5120*0=0",
-"5121*0=0",
-"5122*0=0",
-"5123*0=0",
-"5124*0=0",
-"5125*0=0",
-"5126*0=0",
-"5127*0=0",
-"5128*0=0",
-"5129*0=0",
-"512/64=8",
-"512/8=64",
-"5130*0=0",
-"5131*0=0",
-"5132*0=0",
-"5133*0=0",
-"5134*0=0",
-"5135*0=0",
-"5136*0=0",
-"5137*0=0",
-"5138*0=0",
-"5139*0=0",
-"513/57=9",
-"513/9=57",
-"5140*0=0",
-"5141*0=0",
-"5142*0=0",
-"5143*0=0",
-"5144*0=0",
-"5145*0=0",
-"5146*0=0",
-"5147*0=0",
-"5148*0=0",
-"5149*0=0",
-"5150*0=0",
-"5151*0=0",
-"5152*0=0",
-"5153*0=0",
-"5154*0=0",
-"5155*0=0",
-"5156*0=0",
-"5157*0=0",
-"5158*0=0",
-"5159*0=0",
-"5160*0=0",
-"5161*0=0",
-"5162*0=0",
-"5163*0=0",
-"5164*0=0",
-"5165*0=0",
-"5166*0=0",
-"5167*0=0",
-"5168*0=0",
-"5169*0=0",
-"516/6=86",
-"516/86=6",
-"5170*0=0",
-"5171*0=0",
-"5172*0=0",
-"5173*0=0",
-"5174*0=0",
-"5175*0=0",
-"5176*0=0",
-"5177*0=0",
-"5178*0=0",
-"5179*0=0",
-"5180*0=0",
-"5181*0=0",
-"5182*0=0",
-"5183*0=0",
-"5184*0=0",
-"5185*0=0",
-"5186*0=0",
-"5187*0=0",
-"5188*0=0",
-"5189*0=0",
-"518/74=7",
-"518/7=74",
-"5190*0=0",
-"5191*0=0",
-"5192*0=0",
-"5193*0=0",
-"5194*0=0",
-"5195*0=0",
-"5196*0=0",
-"5197*0=0",
-"5198*0=0",
-"5199*0=0",
-"51+10=61",
-"51+11=62",
-"51+12=63",
-"51+13=64",
-"51+14=65",
-"51+15=66",
-"51+16=67",
-"51+17=68",
-"51+18=69",
-"51+19=70",
-"51+20=71",
-"51+21=72",
-"51+22=73",
-"51+23=74",
-"51+24=75",
-"51+25=76",
-"51+26=77",
-"51+27=78",
-"51+28=79",
-"51+29=80",
-"51+30=81",
-"51+31=82",
-"51+32=83",
-"51+33=84",
-"51+34=85",
-"51+35=86",
-"51+36=87",
-"51+37=88",
-"51+38=89",
-"51+39=90",
-"51+40=91",
-"51+41=92",
-"51+42=93",
-"51+43=94",
-"51+44=95",
-"51+45=96",
-"51+46=97",
-"51+47=98",
-"51+48=99",
-"51-10=41",
-"51-11=40",
-"51-12=39",
-"51-13=38",
-"51-14=37",
-"51-15=36",
-"51-16=35",
-"51-17=34",
-"51-18=33",
-"51-19=32",
-"51-20=31",
-"51-21=30",
-"51-22=29",
-"51-23=28",
-"51-24=27",
-"51-25=26",
-"51-26=25",
-"51-27=24",
-"51-28=23",
-"51-29=22",
-"51-30=21",
-"51-31=20",
-"51-32=19",
-"51-33=18",
-"51-34=17",
-"51-35=16",
-"51-36=15",
-"51-37=14",
-"51-38=13",
-"51-39=12",
-"51-40=11",
-"51-41=10",
-"51-52=-1",
-"51-53=-2",
-"51-54=-3",
-"51-55=-4",
-"51-56=-5",
-"51-57=-6",
-"51-58=-7",
-"51-59=-8",
-"51-5*9=6",
-"51-60=-9",
-"51-6*7=9",
-"51-6*8=3",
-"51-7*6=9",
-"51-7*7=2",
-"51-8*6=3",
-"51-9*5=6",
-"51*0+0=0",
-"51*0+1=1",
-"51*0+2=2",
-"51*0+3=3",
-"51*0+4=4",
-"51*0+5=5",
-"51*0+6=6",
-"51*0+7=7",
-"51*0+8=8",
-"51*0+9=9",
-"51*0-0=0",
-"51*0*0=0",
-"51*0*1=0",
-"51*0*2=0",
-"51*0*3=0",
-"51*0*4=0",
-"51*0*5=0",
-"51*0*6=0",
-"51*0*7=0",
-"51*0*8=0",
-"51*0*9=0",
-"51*0/1=0",
-"51*0/2=0",
-"51*0/3=0",
-"51*0/4=0",
-"51*0/5=0",
-"51*0/6=0",
-"51*0/7=0",
-"51*0/8=0",
-"51*0/9=0",
-"51*1*0=0",
-"51*2*0=0",
-"51*2=102",
-"51*3*0=0",
-"51*3=153",
-"51*4*0=0",
-"51*4=204",
-"51*5*0=0",
-"51*5=255",
-"51*6*0=0",
-"51*6=306",
-"51*7*0=0",
-"51*7=357",
-"51*8*0=0",
-"51*8=408",
-"51*9*0=0",
-"51*9=459",
-"51/1*0=0",
-"51/2*0=0",
-"51/3-8=9",
-"51/3-9=8",
-"51/3*0=0",
-"51/4*0=0",
-"51/5*0=0",
-"51/6*0=0",
-"51/7*0=0",
-"51/8*0=0",
-"51/9*0=0",
-"5200*0=0",
-"5201*0=0",
-"5202*0=0",
-"5203*0=0",
-"5204*0=0",
-"5205*0=0",
-"5206*0=0",
-"5207*0=0",
-"5208*0=0",
-"5209*0=0",
-"520/65=8",
-"520/8=65",
-"5210*0=0",
-"5211*0=0",
-"5212*0=0",
-"5213*0=0",
-"5214*0=0",
-"5215*0=0",
-"5216*0=0",
-"5217*0=0",
-"5218*0=0",
-"5219*0=0",
-"5220*0=0",
-"5221*0=0",
-"5222*0=0",
-"5223*0=0",
-"5224*0=0",
-"5225*0=0",
-"5226*0=0",
-"5227*0=0",
-"5228*0=0",
-"5229*0=0",
-"522/58=9",
-"522/6=87",
-"522/87=6",
-"522/9=58",
-"5230*0=0",
-"5231*0=0",
-"5232*0=0",
-"5233*0=0",
-"5234*0=0",
-"5235*0=0",
-"5236*0=0",
-"5237*0=0",
-"5238*0=0",
-"5239*0=0",
-"5240*0=0",
-"5241*0=0",
-"5242*0=0",
-"5243*0=0",
-"5244*0=0",
-"5245*0=0",
-"5246*0=0",
-"5247*0=0",
-"5248*0=0",
-"5249*0=0",
-"5250*0=0",
-"5251*0=0",
-"5252*0=0",
-"5253*0=0",
-"5254*0=0",
-"5255*0=0",
-"5256*0=0",
-"5257*0=0",
-"5258*0=0",
-"5259*0=0",
-"525/75=7",
-"525/7=75",
-"5260*0=0",
-"5261*0=0",
-"5262*0=0",
-"5263*0=0",
-"5264*0=0",
-"5265*0=0",
-"5266*0=0",
-"5267*0=0",
-"5268*0=0",
-"5269*0=0",
-"5270*0=0",
-"5271*0=0",
-"5272*0=0",
-"5273*0=0",
-"5274*0=0",
-"5275*0=0",
-"5276*0=0",
-"5277*0=0",
-"5278*0=0",
-"5279*0=0",
-"5280*0=0",
-"5281*0=0",
-"5282*0=0",
-"5283*0=0",
-"5284*0=0",
-"5285*0=0",
-"5286*0=0",
-"5287*0=0",
-"5288*0=0",
-"5289*0=0",
-"528/66=8",
-"528/6=88",
-"528/88=6",
-"528/8=66",
-"5290*0=0",
-"5291*0=0",
-"5292*0=0",
-"5293*0=0",
-"5294*0=0",
-"5295*0=0",
-"5296*0=0",
-"5297*0=0",
-"5298*0=0",
-"5299*0=0",
-"52+10=62",
-"52+11=63",
-"52+12=64",
-"52+13=65",
-"52+14=66",
-"52+15=67",
-"52+16=68",
-"52+17=69",
-"52+18=70",
-"52+19=71",
-"52+20=72",
-"52+21=73",
-"52+22=74",
-"52+23=75",
-"52+24=76",
-"52+25=77",
-"52+26=78",
-"52+27=79",
-"52+28=80",
-"52+29=81",
-"52+30=82",
-"52+31=83",
-"52+32=84",
-"52+33=85",
-"52+34=86",
-"52+35=87",
-"52+36=88",
-"52+37=89",
-"52+38=90",
-"52+39=91",
-"52+40=92",
-"52+41=93",
-"52+42=94",
-"52+43=95",
-"52+44=96",
-"52+45=97",
-"52+46=98",
-"52+47=99",
-"52-10=42",
-"52-11=41",
-"52-12=40",
-"52-13=39",
-"52-14=38",
-"52-15=37",
-"52-16=36",
-"52-17=35",
-"52-18=34",
-"52-19=33",
-"52-20=32",
-"52-21=31",
-"52-22=30",
-"52-23=29",
-"52-24=28",
-"52-25=27",
-"52-26=26",
-"52-27=25",
-"52-28=24",
-"52-29=23",
-"52-30=22",
-"52-31=21",
-"52-32=20",
-"52-33=19",
-"52-34=18",
-"52-35=17",
-"52-36=16",
-"52-37=15",
-"52-38=14",
-"52-39=13",
-"52-40=12",
-"52-41=11",
-"52-42=10",
-"52-53=-1",
-"52-54=-2",
-"52-55=-3",
-"52-56=-4",
-"52-57=-5",
-"52-58=-6",
-"52-59=-7",
-"52-5*9=7",
-"52-60=-8",
-"52-61=-9",
-"52-6*8=4",
-"52-7*7=3",
-"52-8*6=4",
-"52-9*5=7",
-"52*0+0=0",
-"52*0+1=1",
-"52*0+2=2",
-"52*0+3=3",
-"52*0+4=4",
-"52*0+5=5",
-"52*0+6=6",
-"52*0+7=7",
-"52*0+8=8",
-"52*0+9=9",
-"52*0-0=0",
-"52*0*0=0",
-"52*0*1=0",
-"52*0*2=0",
-"52*0*3=0",
-"52*0*4=0",
-"52*0*5=0",
-"52*0*6=0",
-"52*0*7=0",
-"52*0*8=0",
-"52*0*9=0",
-"52*0/1=0",
-"52*0/2=0",
-"52*0/3=0",
-"52*0/4=0",
-"52*0/5=0",
-"52*0/6=0",
-"52*0/7=0",
-"52*0/8=0",
-"52*0/9=0",
-"52*1*0=0",
-"52*2*0=0",
-"52*2=104",
-"52*3*0=0",
-"52*3=156",
-"52*4*0=0",
-"52*4=208",
-"52*5*0=0",
-"52*5=260",
-"52*6*0=0",
-"52*6=312",
-"52*7*0=0",
-"52*7=364",
-"52*8*0=0",
-"52*8=416",
-"52*9*0=0",
-"52*9=468",
-"52/1*0=0",
-"52/2*0=0",
-"52/3*0=0",
-"52/4-4=9",
-"52/4-5=8",
-"52/4-6=7",
-"52/4-7=6",
-"52/4-8=5",
-"52/4-9=4",
-"52/4*0=0",
-"52/5*0=0",
-"52/6*0=0",
-"52/7*0=0",
-"52/8*0=0",
-"52/9*0=0",
-"5300*0=0",
-"5301*0=0",
-"5302*0=0",
-"5303*0=0",
-"5304*0=0",
-"5305*0=0",
-"5306*0=0",
-"5307*0=0",
-"5308*0=0",
-"5309*0=0",
-"5310*0=0",
-"5311*0=0",
-"5312*0=0",
-"5313*0=0",
-"5314*0=0",
-"5315*0=0",
-"5316*0=0",
-"5317*0=0",
-"5318*0=0",
-"5319*0=0",
-"531/59=9",
-"531/9=59",
-"5320*0=0",
-"5321*0=0",
-"5322*0=0",
-"5323*0=0",
-"5324*0=0",
-"5325*0=0",
-"5326*0=0",
-"5327*0=0",
-"5328*0=0",
-"5329*0=0",
-"532/76=7",
-"532/7=76",
-"5330*0=0",
-"5331*0=0",
-"5332*0=0",
-"5333*0=0",
-"5334*0=0",
-"5335*0=0",
-"5336*0=0",
-"5337*0=0",
-"5338*0=0",
-"5339*0=0",
-"5340*0=0",
-"5341*0=0",
-"5342*0=0",
-"5343*0=0",
-"5344*0=0",
-"5345*0=0",
-"5346*0=0",
-"5347*0=0",
-"5348*0=0",
-"5349*0=0",
-"534/6=89",
-"534/89=6",
-"5350*0=0",
-"5351*0=0",
-"5352*0=0",
-"5353*0=0",
-"5354*0=0",
-"5355*0=0",
-"5356*0=0",
-"5357*0=0",
-"5358*0=0",
-"5359*0=0",
-"5360*0=0",
-"5361*0=0",
-"5362*0=0",
-"5363*0=0",
-"5364*0=0",
-"5365*0=0",
-"5366*0=0",
-"5367*0=0",
-"5368*0=0",
-"5369*0=0",
-"536/67=8",
-"536/8=67",
-"5370*0=0",
-"5371*0=0",
-"5372*0=0",
-"5373*0=0",
-"5374*0=0",
-"5375*0=0",
-"5376*0=0",
-"5377*0=0",
-"5378*0=0",
-"5379*0=0",
-"5380*0=0",
-"5381*0=0",
-"5382*0=0",
-"5383*0=0",
-"5384*0=0",
-"5385*0=0",
-"5386*0=0",
-"5387*0=0",
-"5388*0=0",
-"5389*0=0",
-"5390*0=0",
-"5391*0=0",
-"5392*0=0",
-"5393*0=0",
-"5394*0=0",
-"5395*0=0",
-"5396*0=0",
-"5397*0=0",
-"5398*0=0",
-"5399*0=0",
-"539/77=7",
-"539/7=77",
-"53+10=63",
-"53+11=64",
-"53+12=65",
-"53+13=66",
-"53+14=67",
-"53+15=68",
-"53+16=69",
-"53+17=70",
-"53+18=71",
-"53+19=72",
-"53+20=73",
-"53+21=74",
-"53+22=75",
-"53+23=76",
-"53+24=77",
-"53+25=78",
-"53+26=79",
-"53+27=80",
-"53+28=81",
-"53+29=82",
-"53+30=83",
-"53+31=84",
-"53+32=85",
-"53+33=86",
-"53+34=87",
-"53+35=88",
-"53+36=89",
-"53+37=90",
-"53+38=91",
-"53+39=92",
-"53+40=93",
-"53+41=94",
-"53+42=95",
-"53+43=96",
-"53+44=97",
-"53+45=98",
-"53+46=99",
-"53-10=43",
-"53-11=42",
-"53-12=41",
-"53-13=40",
-"53-14=39",
-"53-15=38",
-"53-16=37",
-"53-17=36",
-"53-18=35",
-"53-19=34",
-"53-20=33",
-"53-21=32",
-"53-22=31",
-"53-23=30",
-"53-24=29",
-"53-25=28",
-"53-26=27",
-"53-27=26",
-"53-28=25",
-"53-29=24",
-"53-30=23",
-"53-31=22",
-"53-32=21",
-"53-33=20",
-"53-34=19",
-"53-35=18",
-"53-36=17",
-"53-37=16",
-"53-38=15",
-"53-39=14",
-"53-40=13",
-"53-41=12",
-"53-42=11",
-"53-43=10",
-"53-54=-1",
-"53-55=-2",
-"53-56=-3",
-"53-57=-4",
-"53-58=-5",
-"53-59=-6",
-"53-5*9=8",
-"53-60=-7",
-"53-61=-8",
-"53-62=-9",
-"53-6*8=5",
-"53-7*7=4",
-"53-8*6=5",
-"53-9*5=8",
-"53*0+0=0",
-"53*0+1=1",
-"53*0+2=2",
-"53*0+3=3",
-"53*0+4=4",
-"53*0+5=5",
-"53*0+6=6",
-"53*0+7=7",
-"53*0+8=8",
-"53*0+9=9",
-"53*0-0=0",
-"53*0*0=0",
-"53*0*1=0",
-"53*0*2=0",
-"53*0*3=0",
-"53*0*4=0",
-"53*0*5=0",
-"53*0*6=0",
-"53*0*7=0",
-"53*0*8=0",
-"53*0*9=0",
-"53*0/1=0",
-"53*0/2=0",
-"53*0/3=0",
-"53*0/4=0",
-"53*0/5=0",
-"53*0/6=0",
-"53*0/7=0",
-"53*0/8=0",
-"53*0/9=0",
-"53*1*0=0",
-"53*2*0=0",
-"53*2=106",
-"53*3*0=0",
-"53*3=159",
-"53*4*0=0",
-"53*4=212",
-"53*5*0=0",
-"53*5=265",
-"53*6*0=0",
-"53*6=318",
-"53*7*0=0",
-"53*7=371",
-"53*8*0=0",
-"53*8=424",
-"53*9*0=0",
-"53*9=477",
-"53/1*0=0",
-"53/2*0=0",
-"53/3*0=0",
-"53/4*0=0",
-"53/5*0=0",
-"53/6*0=0",
-"53/7*0=0",
-"53/8*0=0",
-"53/9*0=0",
-"5400*0=0",
-"5401*0=0",
-"5402*0=0",
-"5403*0=0",
-"5404*0=0",
-"5405*0=0",
-"5406*0=0",
-"5407*0=0",
-"5408*0=0",
-"5409*0=0",
-"540/60=9",
-"540/6=90",
-"540/90=6",
-"540/9=60",
-"5410*0=0",
-"5411*0=0",
-"5412*0=0",
-"5413*0=0",
-"5414*0=0",
-"5415*0=0",
-"5416*0=0",
-"5417*0=0",
-"5418*0=0",
-"5419*0=0",
-"5420*0=0",
-"5421*0=0",
-"5422*0=0",
-"5423*0=0",
-"5424*0=0",
-"5425*0=0",
-"5426*0=0",
-"5427*0=0",
-"5428*0=0",
-"5429*0=0",
-"5430*0=0",
-"5431*0=0",
-"5432*0=0",
-"5433*0=0",
-"5434*0=0",
-"5435*0=0",
-"5436*0=0",
-"5437*0=0",
-"5438*0=0",
-"5439*0=0",
-"5440*0=0",
-"5441*0=0",
-"5442*0=0",
-"5443*0=0",
-"5444*0=0",
-"5445*0=0",
-"5446*0=0",
-"5447*0=0",
-"5448*0=0",
-"5449*0=0",
-"544/68=8",
-"544/8=68",
-"5450*0=0",
-"5451*0=0",
-"5452*0=0",
-"5453*0=0",
-"5454*0=0",
-"5455*0=0",
-"5456*0=0",
-"5457*0=0",
-"5458*0=0",
-"5459*0=0",
-"5460*0=0",
-"5461*0=0",
-"5462*0=0",
-"5463*0=0",
-"5464*0=0",
-"5465*0=0",
-"5466*0=0",
-"5467*0=0",
-"5468*0=0",
-"5469*0=0",
-"546/6=91",
-"546/78=7",
-"546/7=78",
-"546/91=6",
-"5470*0=0",
-"5471*0=0",
-"5472*0=0",
-"5473*0=0",
-"5474*0=0",
-"5475*0=0",
-"5476*0=0",
-"5477*0=0",
-"5478*0=0",
-"5479*0=0",
-"5480*0=0",
-"5481*0=0",
-"5482*0=0",
-"5483*0=0",
-"5484*0=0",
-"5485*0=0",
-"5486*0=0",
-"5487*0=0",
-"5488*0=0",
-"5489*0=0",
-"5490*0=0",
-"5491*0=0",
-"5492*0=0",
-"5493*0=0",
-"5494*0=0",
-"5495*0=0",
-"5496*0=0",
-"5497*0=0",
-"5498*0=0",
-"5499*0=0",
-"549/61=9",
-"549/9=61",
-"54+10=64",
-"54+11=65",
-"54+12=66",
-"54+13=67",
-"54+14=68",
-"54+15=69",
-"54+16=70",
-"54+17=71",
-"54+18=72",
-"54+19=73",
-"54+20=74",
-"54+21=75",
-"54+22=76",
-"54+23=77",
-"54+24=78",
-"54+25=79",
-"54+26=80",
-"54+27=81",
-"54+28=82",
-"54+29=83",
-"54+30=84",
-"54+31=85",
-"54+32=86",
-"54+33=87",
-"54+34=88",
-"54+35=89",
-"54+36=90",
-"54+37=91",
-"54+38=92",
-"54+39=93",
-"54+40=94",
-"54+41=95",
-"54+42=96",
-"54+43=97",
-"54+44=98",
-"54+45=99",
-"54-10=44",
-"54-11=43",
-"54-12=42",
-"54-13=41",
-"54-14=40",
-"54-15=39",
-"54-16=38",
-"54-17=37",
-"54-18=36",
-"54-19=35",
-"54-20=34",
-"54-21=33",
-"54-22=32",
-"54-23=31",
-"54-24=30",
-"54-25=29",
-"54-26=28",
-"54-27=27",
-"54-28=26",
-"54-29=25",
-"54-30=24",
-"54-31=23",
-"54-32=22",
-"54-33=21",
-"54-34=20",
-"54-35=19",
-"54-36=18",
-"54-37=17",
-"54-38=16",
-"54-39=15",
-"54-40=14",
-"54-41=13",
-"54-42=12",
-"54-43=11",
-"54-44=10",
-"54-55=-1",
-"54-56=-2",
-"54-57=-3",
-"54-58=-4",
-"54-59=-5",
-"54-5*9=9",
-"54-60=-6",
-"54-61=-7",
-"54-62=-8",
-"54-63=-9",
-"54-6*8=6",
-"54-6*9=0",
-"54-7*7=5",
-"54-8*6=6",
-"54-9*5=9",
-"54-9*6=0",
-"54*0+0=0",
-"54*0+1=1",
-"54*0+2=2",
-"54*0+3=3",
-"54*0+4=4",
-"54*0+5=5",
-"54*0+6=6",
-"54*0+7=7",
-"54*0+8=8",
-"54*0+9=9",
-"54*0-0=0",
-"54*0*0=0",
-"54*0*1=0",
-"54*0*2=0",
-"54*0*3=0",
-"54*0*4=0",
-"54*0*5=0",
-"54*0*6=0",
-"54*0*7=0",
-"54*0*8=0",
-"54*0*9=0",
-"54*0/1=0",
-"54*0/2=0",
-"54*0/3=0",
-"54*0/4=0",
-"54*0/5=0",
-"54*0/6=0",
-"54*0/7=0",
-"54*0/8=0",
-"54*0/9=0",
-"54*1*0=0",
-"54*1/6=9",
-"54*1/9=6",
-"54*2*0=0",
-"54*2=108",
-"54*3*0=0",
-"54*3=162",
-"54*4*0=0",
-"54*4=216",
-"54*5*0=0",
-"54*5=270",
-"54*6*0=0",
-"54*6=324",
-"54*7*0=0",
-"54*7=378",
-"54*8*0=0",
-"54*8=432",
-"54*9*0=0",
-"54*9=486",
-"54/1*0=0",
-"54/1/6=9",
-"54/1/9=6",
-"54/2*0=0",
-"54/2/3=9",
-"54/2/9=3",
-"54/3-9=9",
-"54/3*0=0",
-"54/3/2=9",
-"54/3/3=6",
-"54/3/6=3",
-"54/3/9=2",
-"54/4*0=0",
-"54/5*0=0",
-"54/6+0=9",
-"54/6-0=9",
-"54/6-1=8",
-"54/6-2=7",
-"54/6-3=6",
-"54/6-4=5",
-"54/6-5=4",
-"54/6-6=3",
-"54/6-7=2",
-"54/6-8=1",
-"54/6-9=0",
-"54/6*0=0",
-"54/6*1=9",
-"54/6/1=9",
-"54/6/3=3",
-"54/6/9=1",
-"54/7*0=0",
-"54/8*0=0",
-"54/9+0=6",
-"54/9+1=7",
-"54/9+2=8",
-"54/9+3=9",
-"54/9-0=6",
-"54/9-1=5",
-"54/9-2=4",
-"54/9-3=3",
-"54/9-4=2",
-"54/9-5=1",
-"54/9-6=0",
-"54/9*0=0",
-"54/9*1=6",
-"54/9/1=6",
-"54/9/2=3",
-"54/9/3=2",
-"54/9/6=1",
-"5500*0=0",
-"5501*0=0",
-"5502*0=0",
-"5503*0=0",
-"5504*0=0",
-"5505*0=0",
-"5506*0=0",
-"5507*0=0",
-"5508*0=0",
-"5509*0=0",
-"5510*0=0",
-"5511*0=0",
-"5512*0=0",
-"5513*0=0",
-"5514*0=0",
-"5515*0=0",
-"5516*0=0",
-"5517*0=0",
-"5518*0=0",
-"5519*0=0",
-"5520*0=0",
-"5521*0=0",
-"5522*0=0",
-"5523*0=0",
-"5524*0=0",
-"5525*0=0",
-"5526*0=0",
-"5527*0=0",
-"5528*0=0",
-"5529*0=0",
-"552/69=8",
-"552/6=92",
-"552/8=69",
-"552/92=6",
-"5530*0=0",
-"5531*0=0",
-"5532*0=0",
-"5533*0=0",
-"5534*0=0",
-"5535*0=0",
-"5536*0=0",
-"5537*0=0",
-"5538*0=0",
-"5539*0=0",
-"553/79=7",
-"553/7=79",
-"5540*0=0",
-"5541*0=0",
-"5542*0=0",
-"5543*0=0",
-"5544*0=0",
-"5545*0=0",
-"5546*0=0",
-"5547*0=0",
-"5548*0=0",
-"5549*0=0",
-"5550*0=0",
-"5551*0=0",
-"5552*0=0",
-"5553*0=0",
-"5554*0=0",
-"5555*0=0",
-"5556*0=0",
-"5557*0=0",
-"5558*0=0",
-"5559*0=0",
-"5560*0=0",
-"5561*0=0",
-"5562*0=0",
-"5563*0=0",
-"5564*0=0",
-"5565*0=0",
-"5566*0=0",
-"5567*0=0",
-"5568*0=0",
-"5569*0=0",
-"5570*0=0",
-"5571*0=0",
-"5572*0=0",
-"5573*0=0",
-"5574*0=0",
-"5575*0=0",
-"5576*0=0",
-"5577*0=0",
-"5578*0=0",
-"5579*0=0",
-"5580*0=0",
-"5581*0=0",
-"5582*0=0",
-"5583*0=0",
-"5584*0=0",
-"5585*0=0",
-"5586*0=0",
-"5587*0=0",
-"5588*0=0",
-"5589*0=0",
-"558/62=9",
-"558/6=93",
-"558/93=6",
-"558/9=62",
-"5590*0=0",
-"5591*0=0",
-"5592*0=0",
-"5593*0=0",
-"5594*0=0",
-"5595*0=0",
-"5596*0=0",
-"5597*0=0",
-"5598*0=0",
-"5599*0=0",
-"55+10=65",
-"55+11=66",
-"55+12=67",
-"55+13=68",
-"55+14=69",
-"55+15=70",
-"55+16=71",
-"55+17=72",
-"55+18=73",
-"55+19=74",
-"55+20=75",
-"55+21=76",
-"55+22=77",
-"55+23=78",
-"55+24=79",
-"55+25=80",
-"55+26=81",
-"55+27=82",
-"55+28=83",
-"55+29=84",
-"55+30=85",
-"55+31=86",
-"55+32=87",
-"55+33=88",
-"55+34=89",
-"55+35=90",
-"55+36=91",
-"55+37=92",
-"55+38=93",
-"55+39=94",
-"55+40=95",
-"55+41=96",
-"55+42=97",
-"55+43=98",
-"55+44=99",
-"55-10=45",
-"55-11=44",
-"55-12=43",
-"55-13=42",
-"55-14=41",
-"55-15=40",
-"55-16=39",
-"55-17=38",
-"55-18=37",
-"55-19=36",
-"55-20=35",
-"55-21=34",
-"55-22=33",
-"55-23=32",
-"55-24=31",
-"55-25=30",
-"55-26=29",
-"55-27=28",
-"55-28=27",
-"55-29=26",
-"55-30=25",
-"55-31=24",
-"55-32=23",
-"55-33=22",
-"55-34=21",
-"55-35=20",
-"55-36=19",
-"55-37=18",
-"55-38=17",
-"55-39=16",
-"55-40=15",
-"55-41=14",
-"55-42=13",
-"55-43=12",
-"55-44=11",
-"55-45=10",
-"55-56=-1",
-"55-57=-2",
-"55-58=-3",
-"55-59=-4",
-"55-60=-5",
-"55-61=-6",
-"55-62=-7",
-"55-63=-8",
-"55-64=-9",
-"55-6*8=7",
-"55-6*9=1",
-"55-7*7=6",
-"55-8*6=7",
-"55-9*6=1",
-"55*0+0=0",
-"55*0+1=1",
-"55*0+2=2",
-"55*0+3=3",
-"55*0+4=4",
-"55*0+5=5",
-"55*0+6=6",
-"55*0+7=7",
-"55*0+8=8",
-"55*0+9=9",
-"55*0-0=0",
-"55*0*0=0",
-"55*0*1=0",
-"55*0*2=0",
-"55*0*3=0",
-"55*0*4=0",
-"55*0*5=0",
-"55*0*6=0",
-"55*0*7=0",
-"55*0*8=0",
-"55*0*9=0",
-"55*0/1=0",
-"55*0/2=0",
-"55*0/3=0",
-"55*0/4=0",
-"55*0/5=0",
-"55*0/6=0",
-"55*0/7=0",
-"55*0/8=0",
-"55*0/9=0",
-"55*1*0=0",
-"55*2*0=0",
-"55*2=110",
-"55*3*0=0",
-"55*3=165",
-"55*4*0=0",
-"55*4=220",
-"55*5*0=0",
-"55*5=275",
-"55*6*0=0",
-"55*6=330",
-"55*7*0=0",
-"55*7=385",
-"55*8*0=0",
-"55*8=440",
-"55*9*0=0",
-"55*9=495",
-"55/1*0=0",
-"55/2*0=0",
-"55/3*0=0",
-"55/4*0=0",
-"55/5-2=9",
-"55/5-3=8",
-"55/5-4=7",
-"55/5-5=6",
-"55/5-6=5",
-"55/5-7=4",
-"55/5-8=3",
-"55/5-9=2",
-"55/5*0=0",
-"55/6*0=0",
-"55/7*0=0",
-"55/8*0=0",
-"55/9*0=0",
-"5600*0=0",
-"5601*0=0",
-"5602*0=0",
-"5603*0=0",
-"5604*0=0",
-"5605*0=0",
-"5606*0=0",
-"5607*0=0",
-"5608*0=0",
-"5609*0=0",
-"560/70=8",
-"560/7=80",
-"560/80=7",
-"560/8=70",
-"5610*0=0",
-"5611*0=0",
-"5612*0=0",
-"5613*0=0",
-"5614*0=0",
-"5615*0=0",
-"5616*0=0",
-"5617*0=0",
-"5618*0=0",
-"5619*0=0",
-"5620*0=0",
-"5621*0=0",
-"5622*0=0",
-"5623*0=0",
-"5624*0=0",
-"5625*0=0",
-"5626*0=0",
-"5627*0=0",
-"5628*0=0",
-"5629*0=0",
-"5630*0=0",
-"5631*0=0",
-"5632*0=0",
-"5633*0=0",
-"5634*0=0",
-"5635*0=0",
-"5636*0=0",
-"5637*0=0",
-"5638*0=0",
-"5639*0=0",
-"5640*0=0",
-"5641*0=0",
-"5642*0=0",
-"5643*0=0",
-"5644*0=0",
-"5645*0=0",
-"5646*0=0",
-"5647*0=0",
-"5648*0=0",
-"5649*0=0",
-"564/6=94",
-"564/94=6",
-"5650*0=0",
-"5651*0=0",
-"5652*0=0",
-"5653*0=0",
-"5654*0=0",
-"5655*0=0",
-"5656*0=0",
-"5657*0=0",
-"5658*0=0",
-"5659*0=0",
-"5660*0=0",
-"5661*0=0",
-"5662*0=0",
-"5663*0=0",
-"5664*0=0",
-"5665*0=0",
-"5666*0=0",
-"5667*0=0",
-"5668*0=0",
-"5669*0=0",
-"5670*0=0",
-"5671*0=0",
-"5672*0=0",
-"5673*0=0",
-"5674*0=0",
-"5675*0=0",
-"5676*0=0",
-"5677*0=0",
-"5678*0=0",
-"5679*0=0",
-"567/63=9",
-"567/7=81",
-"567/81=7",
-"567/9=63",
-"5680*0=0",
-"5681*0=0",
-"5682*0=0",
-"5683*0=0",
-"5684*0=0",
-"5685*0=0",
-"5686*0=0",
-"5687*0=0",
-"5688*0=0",
-"5689*0=0",
-"568/71=8",
-"568/8=71",
-"5690*0=0",
-"5691*0=0",
-"5692*0=0",
-"5693*0=0",
-"5694*0=0",
-"5695*0=0",
-"5696*0=0",
-"5697*0=0",
-"5698*0=0",
-"5699*0=0",
-"56+10=66",
-"56+11=67",
-"56+12=68",
-"56+13=69",
-"56+14=70",
-"56+15=71",
-"56+16=72",
-"56+17=73",
-"56+18=74",
-"56+19=75",
-"56+20=76",
-"56+21=77",
-"56+22=78",
-"56+23=79",
-"56+24=80",
-"56+25=81",
-"56+26=82",
-"56+27=83",
-"56+28=84",
-"56+29=85",
-"56+30=86",
-"56+31=87",
-"56+32=88",
-"56+33=89",
-"56+34=90",
-"56+35=91",
-"56+36=92",
-"56+37=93",
-"56+38=94",
-"56+39=95",
-"56+40=96",
-"56+41=97",
-"56+42=98",
-"56+43=99",
-"56-10=46",
-"56-11=45",
-"56-12=44",
-"56-13=43",
-"56-14=42",
-"56-15=41",
-"56-16=40",
-"56-17=39",
-"56-18=38",
-"56-19=37",
-"56-20=36",
-"56-21=35",
-"56-22=34",
-"56-23=33",
-"56-24=32",
-"56-25=31",
-"56-26=30",
-"56-27=29",
-"56-28=28",
-"56-29=27",
-"56-30=26",
-"56-31=25",
-"56-32=24",
-"56-33=23",
-"56-34=22",
-"56-35=21",
-"56-36=20",
-"56-37=19",
-"56-38=18",
-"56-39=17",
-"56-40=16",
-"56-41=15",
-"56-42=14",
-"56-43=13",
-"56-44=12",
-"56-45=11",
-"56-46=10",
-"56-57=-1",
-"56-58=-2",
-"56-59=-3",
-"56-60=-4",
-"56-61=-5",
-"56-62=-6",
-"56-63=-7",
-"56-64=-8",
-"56-65=-9",
-"56-6*8=8",
-"56-6*9=2",
-"56-7*7=7",
-"56-7*8=0",
-"56-8*6=8",
-"56-8*7=0",
-"56-9*6=2",
-"56*0+0=0",
-"56*0+1=1",
-"56*0+2=2",
-"56*0+3=3",
-"56*0+4=4",
-"56*0+5=5",
-"56*0+6=6",
-"56*0+7=7",
-"56*0+8=8",
-"56*0+9=9",
-"56*0-0=0",
-"56*0*0=0",
-"56*0*1=0",
-"56*0*2=0",
-"56*0*3=0",
-"56*0*4=0",
-"56*0*5=0",
-"56*0*6=0",
-"56*0*7=0",
-"56*0*8=0",
-"56*0*9=0",
-"56*0/1=0",
-"56*0/2=0",
-"56*0/3=0",
-"56*0/4=0",
-"56*0/5=0",
-"56*0/6=0",
-"56*0/7=0",
-"56*0/8=0",
-"56*0/9=0",
-"56*1*0=0",
-"56*1/7=8",
-"56*1/8=7",
-"56*2*0=0",
-"56*2=112",
-"56*3*0=0",
-"56*3=168",
-"56*4*0=0",
-"56*4=224",
-"56*5*0=0",
-"56*5=280",
-"56*6*0=0",
-"56*6=336",
-"56*7*0=0",
-"56*7=392",
-"56*8*0=0",
-"56*8=448",
-"56*9*0=0",
-"56*9=504",
-"56/1*0=0",
-"56/1/7=8",
-"56/1/8=7",
-"56/2*0=0",
-"56/2/4=7",
-"56/2/7=4",
-"56/3*0=0",
-"56/4-5=9",
-"56/4-6=8",
-"56/4-7=7",
-"56/4-8=6",
-"56/4-9=5",
-"56/4*0=0",
-"56/4/2=7",
-"56/4/7=2",
-"56/5*0=0",
-"56/6*0=0",
-"56/7+0=8",
-"56/7+1=9",
-"56/7-0=8",
-"56/7-1=7",
-"56/7-2=6",
-"56/7-3=5",
-"56/7-4=4",
-"56/7-5=3",
-"56/7-6=2",
-"56/7-7=1",
-"56/7-8=0",
-"56/7*0=0",
-"56/7*1=8",
-"56/7/1=8",
-"56/7/2=4",
-"56/7/4=2",
-"56/7/8=1",
-"56/8+0=7",
-"56/8+1=8",
-"56/8+2=9",
-"56/8-0=7",
-"56/8-1=6",
-"56/8-2=5",
-"56/8-3=4",
-"56/8-4=3",
-"56/8-5=2",
-"56/8-6=1",
-"56/8-7=0",
-"56/8*0=0",
-"56/8*1=7",
-"56/8/1=7",
-"56/8/7=1",
-"56/9*0=0",
-"5700*0=0",
-"5701*0=0",
-"5702*0=0",
-"5703*0=0",
-"5704*0=0",
-"5705*0=0",
-"5706*0=0",
-"5707*0=0",
-"5708*0=0",
-"5709*0=0",
-"570/6=95",
-"570/95=6",
-"5710*0=0",
-"5711*0=0",
-"5712*0=0",
-"5713*0=0",
-"5714*0=0",
-"5715*0=0",
-"5716*0=0",
-"5717*0=0",
-"5718*0=0",
-"5719*0=0",
-"5720*0=0",
-"5721*0=0",
-"5722*0=0",
-"5723*0=0",
-"5724*0=0",
-"5725*0=0",
-"5726*0=0",
-"5727*0=0",
-"5728*0=0",
-"5729*0=0",
-"5730*0=0",
-"5731*0=0",
-"5732*0=0",
-"5733*0=0",
-"5734*0=0",
-"5735*0=0",
-"5736*0=0",
-"5737*0=0",
-"5738*0=0",
-"5739*0=0",
-"5740*0=0",
-"5741*0=0",
-"5742*0=0",
-"5743*0=0",
-"5744*0=0",
-"5745*0=0",
-"5746*0=0",
-"5747*0=0",
-"5748*0=0",
-"5749*0=0",
-"574/7=82",
-"574/82=7",
-"5750*0=0",
-"5751*0=0",
-"5752*0=0",
-"5753*0=0",
-"5754*0=0",
-"5755*0=0",
-"5756*0=0",
-"5757*0=0",
-"5758*0=0",
-"5759*0=0",
-"5760*0=0",
-"5761*0=0",
-"5762*0=0",
-"5763*0=0",
-"5764*0=0",
-"5765*0=0",
-"5766*0=0",
-"5767*0=0",
-"5768*0=0",
-"5769*0=0",
-"576/64=9",
-"576/6=96",
-"576/72=8",
-"576/8=72",
-"576/96=6",
-"576/9=64",
-"5770*0=0",
-"5771*0=0",
-"5772*0=0",
-"5773*0=0",
-"5774*0=0",
-"5775*0=0",
-"5776*0=0",
-"5777*0=0",
-"5778*0=0",
-"5779*0=0",
-"5780*0=0",
-"5781*0=0",
-"5782*0=0",
-"5783*0=0",
-"5784*0=0",
-"5785*0=0",
-"5786*0=0",
-"5787*0=0",
-"5788*0=0",
-"5789*0=0",
-"5790*0=0",
-"5791*0=0",
-"5792*0=0",
-"5793*0=0",
-"5794*0=0",
-"5795*0=0",
-"5796*0=0",
-"5797*0=0",
-"5798*0=0",
-"5799*0=0",
-"57+10=67",
-"57+11=68",
-"57+12=69",
-"57+13=70",
-"57+14=71",
-"57+15=72",
-"57+16=73",
-"57+17=74",
-"57+18=75",
-"57+19=76",
-"57+20=77",
-"57+21=78",
-"57+22=79",
-"57+23=80",
-"57+24=81",
-"57+25=82",
-"57+26=83",
-"57+27=84",
-"57+28=85",
-"57+29=86",
-"57+30=87",
-"57+31=88",
-"57+32=89",
-"57+33=90",
-"57+34=91",
-"57+35=92",
-"57+36=93",
-"57+37=94",
-"57+38=95",
-"57+39=96",
-"57+40=97",
-"57+41=98",
-"57+42=99",
-"57-10=47",
-"57-11=46",
-"57-12=45",
-"57-13=44",
-"57-14=43",
-"57-15=42",
-"57-16=41",
-"57-17=40",
-"57-18=39",
-"57-19=38",
-"57-20=37",
-"57-21=36",
-"57-22=35",
-"57-23=34",
-"57-24=33",
-"57-25=32",
-"57-26=31",
-"57-27=30",
-"57-28=29",
-"57-29=28",
-"57-30=27",
-"57-31=26",
-"57-32=25",
-"57-33=24",
-"57-34=23",
-"57-35=22",
-"57-36=21",
-"57-37=20",
-"57-38=19",
-"57-39=18",
-"57-40=17",
-"57-41=16",
-"57-42=15",
-"57-43=14",
-"57-44=13",
-"57-45=12",
-"57-46=11",
-"57-47=10",
-"57-58=-1",
-"57-59=-2",
-"57-60=-3",
-"57-61=-4",
-"57-62=-5",
-"57-63=-6",
-"57-64=-7",
-"57-65=-8",
-"57-66=-9",
-"57-6*8=9",
-"57-6*9=3",
-"57-7*7=8",
-"57-7*8=1",
-"57-8*6=9",
-"57-8*7=1",
-"57-9*6=3",
-"57*0+0=0",
-"57*0+1=1",
-"57*0+2=2",
-"57*0+3=3",
-"57*0+4=4",
-"57*0+5=5",
-"57*0+6=6",
-"57*0+7=7",
-"57*0+8=8",
-"57*0+9=9",
-"57*0-0=0",
-"57*0*0=0",
-"57*0*1=0",
-"57*0*2=0",
-"57*0*3=0",
-"57*0*4=0",
-"57*0*5=0",
-"57*0*6=0",
-"57*0*7=0",
-"57*0*8=0",
-"57*0*9=0",
-"57*0/1=0",
-"57*0/2=0",
-"57*0/3=0",
-"57*0/4=0",
-"57*0/5=0",
-"57*0/6=0",
-"57*0/7=0",
-"57*0/8=0",
-"57*0/9=0",
-"57*1*0=0",
-"57*2*0=0",
-"57*2=114",
-"57*3*0=0",
-"57*3=171",
-"57*4*0=0",
-"57*4=228",
-"57*5*0=0",
-"57*5=285",
-"57*6*0=0",
-"57*6=342",
-"57*7*0=0",
-"57*7=399",
-"57*8*0=0",
-"57*8=456",
-"57*9*0=0",
-"57*9=513",
-"57/1*0=0",
-"57/2*0=0",
-"57/3*0=0",
-"57/4*0=0",
-"57/5*0=0",
-"57/6*0=0",
-"57/7*0=0",
-"57/8*0=0",
-"57/9*0=0",
-"5800*0=0",
-"5801*0=0",
-"5802*0=0",
-"5803*0=0",
-"5804*0=0",
-"5805*0=0",
-"5806*0=0",
-"5807*0=0",
-"5808*0=0",
-"5809*0=0",
-"5810*0=0",
-"5811*0=0",
-"5812*0=0",
-"5813*0=0",
-"5814*0=0",
-"5815*0=0",
-"5816*0=0",
-"5817*0=0",
-"5818*0=0",
-"5819*0=0",
-"581/7=83",
-"581/83=7",
-"5820*0=0",
-"5821*0=0",
-"5822*0=0",
-"5823*0=0",
-"5824*0=0",
-"5825*0=0",
-"5826*0=0",
-"5827*0=0",
-"5828*0=0",
-"5829*0=0",
-"582/6=97",
-"582/97=6",
-"5830*0=0",
-"5831*0=0",
-"5832*0=0",
-"5833*0=0",
-"5834*0=0",
-"5835*0=0",
-"5836*0=0",
-"5837*0=0",
-"5838*0=0",
-"5839*0=0",
-"5840*0=0",
-"5841*0=0",
-"5842*0=0",
-"5843*0=0",
-"5844*0=0",
-"5845*0=0",
-"5846*0=0",
-"5847*0=0",
-"5848*0=0",
-"5849*0=0",
-"584/73=8",
-"584/8=73",
-"5850*0=0",
-"5851*0=0",
-"5852*0=0",
-"5853*0=0",
-"5854*0=0",
-"5855*0=0",
-"5856*0=0",
-"5857*0=0",
-"5858*0=0",
-"5859*0=0",
-"585/65=9",
-"585/9=65",
-"5860*0=0",
-"5861*0=0",
-"5862*0=0",
-"5863*0=0",
-"5864*0=0",
-"5865*0=0",
-"5866*0=0",
-"5867*0=0",
-"5868*0=0",
-"5869*0=0",
-"5870*0=0",
-"5871*0=0",
-"5872*0=0",
-"5873*0=0",
-"5874*0=0",
-"5875*0=0",
-"5876*0=0",
-"5877*0=0",
-"5878*0=0",
-"5879*0=0",
-"5880*0=0",
-"5881*0=0",
-"5882*0=0",
-"5883*0=0",
-"5884*0=0",
-"5885*0=0",
-"5886*0=0",
-"5887*0=0",
-"5888*0=0",
-"5889*0=0",
-"588/6=98",
-"588/7=84",
-"588/84=7",
-"588/98=6",
-"5890*0=0",
-"5891*0=0",
-"5892*0=0",
-"5893*0=0",
-"5894*0=0",
-"5895*0=0",
-"5896*0=0",
-"5897*0=0",
-"5898*0=0",
-"5899*0=0",
-"58+10=68",
-"58+11=69",
-"58+12=70",
-"58+13=71",
-"58+14=72",
-"58+15=73",
-"58+16=74",
-"58+17=75",
-"58+18=76",
-"58+19=77",
-"58+20=78",
-"58+21=79",
-"58+22=80",
-"58+23=81",
-"58+24=82",
-"58+25=83",
-"58+26=84",
-"58+27=85",
-"58+28=86",
-"58+29=87",
-"58+30=88",
-"58+31=89",
-"58+32=90",
-"58+33=91",
-"58+34=92",
-"58+35=93",
-"58+36=94",
-"58+37=95",
-"58+38=96",
-"58+39=97",
-"58+40=98",
-"58+41=99",
-"58-10=48",
-"58-11=47",
-"58-12=46",
-"58-13=45",
-"58-14=44",
-"58-15=43",
-"58-16=42",
-"58-17=41",
-"58-18=40",
-"58-19=39",
-"58-20=38",
-"58-21=37",
-"58-22=36",
-"58-23=35",
-"58-24=34",
-"58-25=33",
-"58-26=32",
-"58-27=31",
-"58-28=30",
-"58-29=29",
-"58-30=28",
-"58-31=27",
-"58-32=26",
-"58-33=25",
-"58-34=24",
-"58-35=23",
-"58-36=22",
-"58-37=21",
-"58-38=20",
-"58-39=19",
-"58-40=18",
-"58-41=17",
-"58-42=16",
-"58-43=15",
-"58-44=14",
-"58-45=13",
-"58-46=12",
-"58-47=11",
-"58-48=10",
-"58-59=-1",
-"58-60=-2",
-"58-61=-3",
-"58-62=-4",
-"58-63=-5",
-"58-64=-6",
-"58-65=-7",
-"58-66=-8",
-"58-67=-9",
-"58-6*9=4",
-"58-7*7=9",
-"58-7*8=2",
-"58-8*7=2",
-"58-9*6=4",
-"58*0+0=0",
-"58*0+1=1",
-"58*0+2=2",
-"58*0+3=3",
-"58*0+4=4",
-"58*0+5=5",
-"58*0+6=6",
-"58*0+7=7",
-"58*0+8=8",
-"58*0+9=9",
-"58*0-0=0",
-"58*0*0=0",
-"58*0*1=0",
-"58*0*2=0",
-"58*0*3=0",
-"58*0*4=0",
-"58*0*5=0",
-"58*0*6=0",
-"58*0*7=0",
-"58*0*8=0",
-"58*0*9=0",
-"58*0/1=0",
-"58*0/2=0",
-"58*0/3=0",
-"58*0/4=0",
-"58*0/5=0",
-"58*0/6=0",
-"58*0/7=0",
-"58*0/8=0",
-"58*0/9=0",
-"58*1*0=0",
-"58*2*0=0",
-"58*2=116",
-"58*3*0=0",
-"58*3=174",
-"58*4*0=0",
-"58*4=232",
-"58*5*0=0",
-"58*5=290",
-"58*6*0=0",
-"58*6=348",
-"58*7*0=0",
-"58*7=406",
-"58*8*0=0",
-"58*8=464",
-"58*9*0=0",
-"58*9=522",
-"58/1*0=0",
-"58/2*0=0",
-"58/3*0=0",
-"58/4*0=0",
-"58/5*0=0",
-"58/6*0=0",
-"58/7*0=0",
-"58/8*0=0",
-"58/9*0=0",
-"5900*0=0",
-"5901*0=0",
-"5902*0=0",
-"5903*0=0",
-"5904*0=0",
-"5905*0=0",
-"5906*0=0",
-"5907*0=0",
-"5908*0=0",
-"5909*0=0",
-"5910*0=0",
-"5911*0=0",
-"5912*0=0",
-"5913*0=0",
-"5914*0=0",
-"5915*0=0",
-"5916*0=0",
-"5917*0=0",
-"5918*0=0",
-"5919*0=0",
-"5920*0=0",
-"5921*0=0",
-"5922*0=0",
-"5923*0=0",
-"5924*0=0",
-"5925*0=0",
-"5926*0=0",
-"5927*0=0",
-"5928*0=0",
-"5929*0=0",
-"592/74=8",
-"592/8=74",
-"5930*0=0",
-"5931*0=0",
-"5932*0=0",
-"5933*0=0",
-"5934*0=0",
-"5935*0=0",
-"5936*0=0",
-"5937*0=0",
-"5938*0=0",
-"5939*0=0",
-"5940*0=0",
-"5941*0=0",
-"5942*0=0",
-"5943*0=0",
-"5944*0=0",
-"5945*0=0",
-"5946*0=0",
-"5947*0=0",
-"5948*0=0",
-"5949*0=0",
-"594/66=9",
-"594/6=99",
-"594/99=6",
-"594/9=66",
-"5950*0=0",
-"5951*0=0",
-"5952*0=0",
-"5953*0=0",
-"5954*0=0",
-"5955*0=0",
-"5956*0=0",
-"5957*0=0",
-"5958*0=0",
-"5959*0=0",
-"595/7=85",
-"595/85=7",
-"5960*0=0",
-"5961*0=0",
-"5962*0=0",
-"5963*0=0",
-"5964*0=0",
-"5965*0=0",
-"5966*0=0",
-"5967*0=0",
-"5968*0=0",
-"5969*0=0",
-"5970*0=0",
-"5971*0=0",
-"5972*0=0",
-"5973*0=0",
-"5974*0=0",
-"5975*0=0",
-"5976*0=0",
-"5977*0=0",
-"5978*0=0",
-"5979*0=0",
-"5980*0=0",
-"5981*0=0",
-"5982*0=0",
-"5983*0=0",
-"5984*0=0",
-"5985*0=0",
-"5986*0=0",
-"5987*0=0",
-"5988*0=0",
-"5989*0=0",
-"5990*0=0",
-"5991*0=0",
-"5992*0=0",
-"5993*0=0",
-"5994*0=0",
-"5995*0=0",
-"5996*0=0",
-"5997*0=0",
-"5998*0=0",
-"5999*0=0",
-"59+10=69",
-"59+11=70",
-"59+12=71",
-"59+13=72",
-"59+14=73",
-"59+15=74",
-"59+16=75",
-"59+17=76",
-"59+18=77",
-"59+19=78",
-"59+20=79",
-"59+21=80",
-"59+22=81",
-"59+23=82",
-"59+24=83",
-"59+25=84",
-"59+26=85",
-"59+27=86",
-"59+28=87",
-"59+29=88",
-"59+30=89",
-"59+31=90",
-"59+32=91",
-"59+33=92",
-"59+34=93",
-"59+35=94",
-"59+36=95",
-"59+37=96",
-"59+38=97",
-"59+39=98",
-"59+40=99",
-"59-10=49",
-"59-11=48",
-"59-12=47",
-"59-13=46",
-"59-14=45",
-"59-15=44",
-"59-16=43",
-"59-17=42",
-"59-18=41",
-"59-19=40",
-"59-20=39",
-"59-21=38",
-"59-22=37",
-"59-23=36",
-"59-24=35",
-"59-25=34",
-"59-26=33",
-"59-27=32",
-"59-28=31",
-"59-29=30",
-"59-30=29",
-"59-31=28",
-"59-32=27",
-"59-33=26",
-"59-34=25",
-"59-35=24",
-"59-36=23",
-"59-37=22",
-"59-38=21",
-"59-39=20",
-"59-40=19",
-"59-41=18",
-"59-42=17",
-"59-43=16",
-"59-44=15",
-"59-45=14",
-"59-46=13",
-"59-47=12",
-"59-48=11",
-"59-49=10",
-"59-60=-1",
-"59-61=-2",
-"59-62=-3",
-"59-63=-4",
-"59-64=-5",
-"59-65=-6",
-"59-66=-7",
-"59-67=-8",
-"59-68=-9",
-"59-6*9=5",
-"59-7*8=3",
-"59-8*7=3",
-"59-9*6=5",
-"59*0+0=0",
-"59*0+1=1",
-"59*0+2=2",
-"59*0+3=3",
-"59*0+4=4",
-"59*0+5=5",
-"59*0+6=6",
-"59*0+7=7",
-"59*0+8=8",
-"59*0+9=9",
-"59*0-0=0",
-"59*0*0=0",
-"59*0*1=0",
-"59*0*2=0",
-"59*0*3=0",
-"59*0*4=0",
-"59*0*5=0",
-"59*0*6=0",
-"59*0*7=0",
-"59*0*8=0",
-"59*0*9=0",
-"59*0/1=0",
-"59*0/2=0",
-"59*0/3=0",
-"59*0/4=0",
-"59*0/5=0",
-"59*0/6=0",
-"59*0/7=0",
-"59*0/8=0",
-"59*0/9=0",
-"59*1*0=0",
-"59*2*0=0",
-"59*2=118",
-"59*3*0=0",
-"59*3=177",
-"59*4*0=0",
-"59*4=236",
-"59*5*0=0",
-"59*5=295",
-"59*6*0=0",
-"59*6=354",
-"59*7*0=0",
-"59*7=413",
-"59*8*0=0",
-"59*8=472",
-"59*9*0=0",
-"59*9=531",
-"59/1*0=0",
-"59/2*0=0",
-"59/3*0=0",
-"59/4*0=0",
-"59/5*0=0",
-"59/6*0=0",
-"59/7*0=0",
-"59/8*0=0",
-"59/9*0=0",
-"5+0+5=10",
-"5+0+6=11",
-"5+0+7=12",
-"5+0+8=13",
-"5+0+9=14",
-"5+0-6=-1",
-"5+0-7=-2",
-"5+0-8=-3",
-"5+0-9=-4",
-"5+0*10=5",
-"5+0*11=5",
-"5+0*12=5",
-"5+0*13=5",
-"5+0*14=5",
-"5+0*15=5",
-"5+0*16=5",
-"5+0*17=5",
-"5+0*18=5",
-"5+0*19=5",
-"5+0*20=5",
-"5+0*21=5",
-"5+0*22=5",
-"5+0*23=5",
-"5+0*24=5",
-"5+0*25=5",
-"5+0*26=5",
-"5+0*27=5",
-"5+0*28=5",
-"5+0*29=5",
-"5+0*30=5",
-"5+0*31=5",
-"5+0*32=5",
-"5+0*33=5",
-"5+0*34=5",
-"5+0*35=5",
-"5+0*36=5",
-"5+0*37=5",
-"5+0*38=5",
-"5+0*39=5",
-"5+0*40=5",
-"5+0*41=5",
-"5+0*42=5",
-"5+0*43=5",
-"5+0*44=5",
-"5+0*45=5",
-"5+0*46=5",
-"5+0*47=5",
-"5+0*48=5",
-"5+0*49=5",
-"5+0*50=5",
-"5+0*51=5",
-"5+0*52=5",
-"5+0*53=5",
-"5+0*54=5",
-"5+0*55=5",
-"5+0*56=5",
-"5+0*57=5",
-"5+0*58=5",
-"5+0*59=5",
-"5+0*60=5",
-"5+0*61=5",
-"5+0*62=5",
-"5+0*63=5",
-"5+0*64=5",
-"5+0*65=5",
-"5+0*66=5",
-"5+0*67=5",
-"5+0*68=5",
-"5+0*69=5",
-"5+0*70=5",
-"5+0*71=5",
-"5+0*72=5",
-"5+0*73=5",
-"5+0*74=5",
-"5+0*75=5",
-"5+0*76=5",
-"5+0*77=5",
-"5+0*78=5",
-"5+0*79=5",
-"5+0*80=5",
-"5+0*81=5",
-"5+0*82=5",
-"5+0*83=5",
-"5+0*84=5",
-"5+0*85=5",
-"5+0*86=5",
-"5+0*87=5",
-"5+0*88=5",
-"5+0*89=5",
-"5+0*90=5",
-"5+0*91=5",
-"5+0*92=5",
-"5+0*93=5",
-"5+0*94=5",
-"5+0*95=5",
-"5+0*96=5",
-"5+0*97=5",
-"5+0*98=5",
-"5+0*99=5",
-"5+0/10=5",
-"5+0/11=5",
-"5+0/12=5",
-"5+0/13=5",
-"5+0/14=5",
-"5+0/15=5",
-"5+0/16=5",
-"5+0/17=5",
-"5+0/18=5",
-"5+0/19=5",
-"5+0/20=5",
-"5+0/21=5",
-"5+0/22=5",
-"5+0/23=5",
-"5+0/24=5",
-"5+0/25=5",
-"5+0/26=5",
-"5+0/27=5",
-"5+0/28=5",
-"5+0/29=5",
-"5+0/30=5",
-"5+0/31=5",
-"5+0/32=5",
-"5+0/33=5",
-"5+0/34=5",
-"5+0/35=5",
-"5+0/36=5",
-"5+0/37=5",
-"5+0/38=5",
-"5+0/39=5",
-"5+0/40=5",
-"5+0/41=5",
-"5+0/42=5",
-"5+0/43=5",
-"5+0/44=5",
-"5+0/45=5",
-"5+0/46=5",
-"5+0/47=5",
-"5+0/48=5",
-"5+0/49=5",
-"5+0/50=5",
-"5+0/51=5",
-"5+0/52=5",
-"5+0/53=5",
-"5+0/54=5",
-"5+0/55=5",
-"5+0/56=5",
-"5+0/57=5",
-"5+0/58=5",
-"5+0/59=5",
-"5+0/60=5",
-"5+0/61=5",
-"5+0/62=5",
-"5+0/63=5",
-"5+0/64=5",
-"5+0/65=5",
-"5+0/66=5",
-"5+0/67=5",
-"5+0/68=5",
-"5+0/69=5",
-"5+0/70=5",
-"5+0/71=5",
-"5+0/72=5",
-"5+0/73=5",
-"5+0/74=5",
-"5+0/75=5",
-"5+0/76=5",
-"5+0/77=5",
-"5+0/78=5",
-"5+0/79=5",
-"5+0/80=5",
-"5+0/81=5",
-"5+0/82=5",
-"5+0/83=5",
-"5+0/84=5",
-"5+0/85=5",
-"5+0/86=5",
-"5+0/87=5",
-"5+0/88=5",
-"5+0/89=5",
-"5+0/90=5",
-"5+0/91=5",
-"5+0/92=5",
-"5+0/93=5",
-"5+0/94=5",
-"5+0/95=5",
-"5+0/96=5",
-"5+0/97=5",
-"5+0/98=5",
-"5+0/99=5",
-"5+10-6=9",
-"5+10-7=8",
-"5+10-8=7",
-"5+10-9=6",
-"5+10*0=5",
-"5+10/5=7",
-"5+11-7=9",
-"5+11-8=8",
-"5+11-9=7",
-"5+11*0=5",
-"5+12-8=9",
-"5+12-9=8",
-"5+12*0=5",
-"5+12/3=9",
-"5+12/4=8",
-"5+12/6=7",
-"5+13-9=9",
-"5+13*0=5",
-"5+14*0=5",
-"5+14/7=7",
-"5+15*0=5",
-"5+15/5=8",
-"5+16*0=5",
-"5+16/4=9",
-"5+16/8=7",
-"5+17*0=5",
-"5+18*0=5",
-"5+18/6=8",
-"5+18/9=7",
-"5+19*0=5",
-"5+1+4=10",
-"5+1+5=11",
-"5+1+6=12",
-"5+1+7=13",
-"5+1+8=14",
-"5+1+9=15",
-"5+1-7=-1",
-"5+1-8=-2",
-"5+1-9=-3",
-"5+1*5=10",
-"5+1*6=11",
-"5+1*7=12",
-"5+1*8=13",
-"5+1*9=14",
-"5+20*0=5",
-"5+20/5=9",
-"5+21*0=5",
-"5+21/7=8",
-"5+22*0=5",
-"5+23*0=5",
-"5+24*0=5",
-"5+24/6=9",
-"5+24/8=8",
-"5+25*0=5",
-"5+26*0=5",
-"5+27*0=5",
-"5+27/9=8",
-"5+28*0=5",
-"5+28/7=9",
-"5+29*0=5",
-"5+2+3=10",
-"5+2+4=11",
-"5+2+5=12",
-"5+2+6=13",
-"5+2+7=14",
-"5+2+8=15",
-"5+2+9=16",
-"5+2-8=-1",
-"5+2-9=-2",
-"5+2*3=11",
-"5+2*4=13",
-"5+2*5=15",
-"5+2*6=17",
-"5+2*7=19",
-"5+2*8=21",
-"5+2*9=23",
-"5+30*0=5",
-"5+31*0=5",
-"5+32*0=5",
-"5+32/8=9",
-"5+33*0=5",
-"5+34*0=5",
-"5+35*0=5",
-"5+36*0=5",
-"5+36/9=9",
-"5+37*0=5",
-"5+38*0=5",
-"5+39*0=5",
-"5+3+2=10",
-"5+3+3=11",
-"5+3+4=12",
-"5+3+5=13",
-"5+3+6=14",
-"5+3+7=15",
-"5+3+8=16",
-"5+3+9=17",
-"5+3-9=-1",
-"5+3*2=11",
-"5+3*3=14",
-"5+3*4=17",
-"5+3*5=20",
-"5+3*6=23",
-"5+3*7=26",
-"5+3*8=29",
-"5+3*9=32",
-"5+40*0=5",
-"5+41*0=5",
-"5+42*0=5",
-"5+43*0=5",
-"5+44*0=5",
-"5+45*0=5",
-"5+46*0=5",
-"5+47*0=5",
-"5+48*0=5",
-"5+49*0=5",
-"5+4+1=10",
-"5+4+2=11",
-"5+4+3=12",
-"5+4+4=13",
-"5+4+5=14",
-"5+4+6=15",
-"5+4+7=16",
-"5+4+8=17",
-"5+4+9=18",
-"5+4*2=13",
-"5+4*3=17",
-"5+4*4=21",
-"5+4*5=25",
-"5+4*6=29",
-"5+4*7=33",
-"5+4*8=37",
-"5+4*9=41",
-"5+50*0=5",
-"5+51*0=5",
-"5+52*0=5",
-"5+53*0=5",
-"5+54*0=5",
-"5+55*0=5",
-"5+56*0=5",
-"5+57*0=5",
-"5+58*0=5",
-"5+59*0=5",
-"5+5+0=10",
-"5+5+1=11",
-"5+5+2=12",
-"5+5+3=13",
-"5+5+4=14",
-"5+5+5=15",
-"5+5+6=16",
-"5+5+7=17",
-"5+5+8=18",
-"5+5+9=19",
-"5+5-0=10",
-"5+5-10=0",
-"5+5*1=10",
-"5+5*2=15",
-"5+5*3=20",
-"5+5*4=25",
-"5+5*5=30",
-"5+5*6=35",
-"5+5*7=40",
-"5+5*8=45",
-"5+5*9=50",
-"5+5/1=10",
-"5+60*0=5",
-"5+61*0=5",
-"5+62*0=5",
-"5+63*0=5",
-"5+64*0=5",
-"5+65*0=5",
-"5+66*0=5",
-"5+67*0=5",
-"5+68*0=5",
-"5+69*0=5",
-"5+6+0=11",
-"5+6+1=12",
-"5+6+2=13",
-"5+6+3=14",
-"5+6+4=15",
-"5+6+5=16",
-"5+6+6=17",
-"5+6+7=18",
-"5+6+8=19",
-"5+6+9=20",
-"5+6-0=11",
-"5+6-10=1",
-"5+6-11=0",
-"5+6-1=10",
-"5+6*1=11",
-"5+6*2=17",
-"5+6*3=23",
-"5+6*4=29",
-"5+6*5=35",
-"5+6*6=41",
-"5+6*7=47",
-"5+6*8=53",
-"5+6*9=59",
-"5+6/1=11",
-"5+70*0=5",
-"5+71*0=5",
-"5+72*0=5",
-"5+73*0=5",
-"5+74*0=5",
-"5+75*0=5",
-"5+76*0=5",
-"5+77*0=5",
-"5+78*0=5",
-"5+79*0=5",
-"5+7+0=12",
-"5+7+1=13",
-"5+7+2=14",
-"5+7+3=15",
-"5+7+4=16",
-"5+7+5=17",
-"5+7+6=18",
-"5+7+7=19",
-"5+7+8=20",
-"5+7+9=21",
-"5+7-0=12",
-"5+7-10=2",
-"5+7-11=1",
-"5+7-12=0",
-"5+7-1=11",
-"5+7-2=10",
-"5+7*1=12",
-"5+7*2=19",
-"5+7*3=26",
-"5+7*4=33",
-"5+7*5=40",
-"5+7*6=47",
-"5+7*7=54",
-"5+7*8=61",
-"5+7*9=68",
-"5+7/1=12",
-"5+80*0=5",
-"5+81*0=5",
-"5+82*0=5",
-"5+83*0=5",
-"5+84*0=5",
-"5+85*0=5",
-"5+86*0=5",
-"5+87*0=5",
-"5+88*0=5",
-"5+89*0=5",
-"5+8+0=13",
-"5+8+1=14",
-"5+8+2=15",
-"5+8+3=16",
-"5+8+4=17",
-"5+8+5=18",
-"5+8+6=19",
-"5+8+7=20",
-"5+8+8=21",
-"5+8+9=22",
-"5+8-0=13",
-"5+8-10=3",
-"5+8-11=2",
-"5+8-12=1",
-"5+8-13=0",
-"5+8-1=12",
-"5+8-2=11",
-"5+8-3=10",
-"5+8*1=13",
-"5+8*2=21",
-"5+8*3=29",
-"5+8*4=37",
-"5+8*5=45",
-"5+8*6=53",
-"5+8*7=61",
-"5+8*8=69",
-"5+8*9=77",
-"5+8/1=13",
-"5+90*0=5",
-"5+91*0=5",
-"5+92*0=5",
-"5+93*0=5",
-"5+94*0=5",
-"5+95*0=5",
-"5+95=100",
-"5+96*0=5",
-"5+96=101",
-"5+97*0=5",
-"5+97=102",
-"5+98*0=5",
-"5+98=103",
-"5+99*0=5",
-"5+99=104",
-"5+9+0=14",
-"5+9+1=15",
-"5+9+2=16",
-"5+9+3=17",
-"5+9+4=18",
-"5+9+5=19",
-"5+9+6=20",
-"5+9+7=21",
-"5+9+8=22",
-"5+9+9=23",
-"5+9-0=14",
-"5+9-10=4",
-"5+9-11=3",
-"5+9-12=2",
-"5+9-13=1",
-"5+9-14=0",
-"5+9-1=13",
-"5+9-2=12",
-"5+9-3=11",
-"5+9-4=10",
-"5+9*1=14",
-"5+9*2=23",
-"5+9*3=32",
-"5+9*4=41",
-"5+9*5=50",
-"5+9*6=59",
-"5+9*7=68",
-"5+9*8=77",
-"5+9*9=86",
-"5+9/1=14",
-"5-0+5=10",
-"5-0+6=11",
-"5-0+7=12",
-"5-0+8=13",
-"5-0+9=14",
-"5-0-6=-1",
-"5-0-7=-2",
-"5-0-8=-3",
-"5-0-9=-4",
-"5-0*10=5",
-"5-0*11=5",
-"5-0*12=5",
-"5-0*13=5",
-"5-0*14=5",
-"5-0*15=5",
-"5-0*16=5",
-"5-0*17=5",
-"5-0*18=5",
-"5-0*19=5",
-"5-0*20=5",
-"5-0*21=5",
-"5-0*22=5",
-"5-0*23=5",
-"5-0*24=5",
-"5-0*25=5",
-"5-0*26=5",
-"5-0*27=5",
-"5-0*28=5",
-"5-0*29=5",
-"5-0*30=5",
-"5-0*31=5",
-"5-0*32=5",
-"5-0*33=5",
-"5-0*34=5",
-"5-0*35=5",
-"5-0*36=5",
-"5-0*37=5",
-"5-0*38=5",
-"5-0*39=5",
-"5-0*40=5",
-"5-0*41=5",
-"5-0*42=5",
-"5-0*43=5",
-"5-0*44=5",
-"5-0*45=5",
-"5-0*46=5",
-"5-0*47=5",
-"5-0*48=5",
-"5-0*49=5",
-"5-0*50=5",
-"5-0*51=5",
-"5-0*52=5",
-"5-0*53=5",
-"5-0*54=5",
-"5-0*55=5",
-"5-0*56=5",
-"5-0*57=5",
-"5-0*58=5",
-"5-0*59=5",
-"5-0*60=5",
-"5-0*61=5",
-"5-0*62=5",
-"5-0*63=5",
-"5-0*64=5",
-"5-0*65=5",
-"5-0*66=5",
-"5-0*67=5",
-"5-0*68=5",
-"5-0*69=5",
-"5-0*70=5",
-"5-0*71=5",
-"5-0*72=5",
-"5-0*73=5",
-"5-0*74=5",
-"5-0*75=5",
-"5-0*76=5",
-"5-0*77=5",
-"5-0*78=5",
-"5-0*79=5",
-"5-0*80=5",
-"5-0*81=5",
-"5-0*82=5",
-"5-0*83=5",
-"5-0*84=5",
-"5-0*85=5",
-"5-0*86=5",
-"5-0*87=5",
-"5-0*88=5",
-"5-0*89=5",
-"5-0*90=5",
-"5-0*91=5",
-"5-0*92=5",
-"5-0*93=5",
-"5-0*94=5",
-"5-0*95=5",
-"5-0*96=5",
-"5-0*97=5",
-"5-0*98=5",
-"5-0*99=5",
-"5-0/10=5",
-"5-0/11=5",
-"5-0/12=5",
-"5-0/13=5",
-"5-0/14=5",
-"5-0/15=5",
-"5-0/16=5",
-"5-0/17=5",
-"5-0/18=5",
-"5-0/19=5",
-"5-0/20=5",
-"5-0/21=5",
-"5-0/22=5",
-"5-0/23=5",
-"5-0/24=5",
-"5-0/25=5",
-"5-0/26=5",
-"5-0/27=5",
-"5-0/28=5",
-"5-0/29=5",
-"5-0/30=5",
-"5-0/31=5",
-"5-0/32=5",
-"5-0/33=5",
-"5-0/34=5",
-"5-0/35=5",
-"5-0/36=5",
-"5-0/37=5",
-"5-0/38=5",
-"5-0/39=5",
-"5-0/40=5",
-"5-0/41=5",
-"5-0/42=5",
-"5-0/43=5",
-"5-0/44=5",
-"5-0/45=5",
-"5-0/46=5",
-"5-0/47=5",
-"5-0/48=5",
-"5-0/49=5",
-"5-0/50=5",
-"5-0/51=5",
-"5-0/52=5",
-"5-0/53=5",
-"5-0/54=5",
-"5-0/55=5",
-"5-0/56=5",
-"5-0/57=5",
-"5-0/58=5",
-"5-0/59=5",
-"5-0/60=5",
-"5-0/61=5",
-"5-0/62=5",
-"5-0/63=5",
-"5-0/64=5",
-"5-0/65=5",
-"5-0/66=5",
-"5-0/67=5",
-"5-0/68=5",
-"5-0/69=5",
-"5-0/70=5",
-"5-0/71=5",
-"5-0/72=5",
-"5-0/73=5",
-"5-0/74=5",
-"5-0/75=5",
-"5-0/76=5",
-"5-0/77=5",
-"5-0/78=5",
-"5-0/79=5",
-"5-0/80=5",
-"5-0/81=5",
-"5-0/82=5",
-"5-0/83=5",
-"5-0/84=5",
-"5-0/85=5",
-"5-0/86=5",
-"5-0/87=5",
-"5-0/88=5",
-"5-0/89=5",
-"5-0/90=5",
-"5-0/91=5",
-"5-0/92=5",
-"5-0/93=5",
-"5-0/94=5",
-"5-0/95=5",
-"5-0/96=5",
-"5-0/97=5",
-"5-0/98=5",
-"5-0/99=5",
-"5-10+5=0",
-"5-10+6=1",
-"5-10+7=2",
-"5-10+8=3",
-"5-10+9=4",
-"5-10*0=5",
-"5-10/2=0",
-"5-10/5=3",
-"5-11+6=0",
-"5-11+7=1",
-"5-11+8=2",
-"5-11+9=3",
-"5-11*0=5",
-"5-12+7=0",
-"5-12+8=1",
-"5-12+9=2",
-"5-12*0=5",
-"5-12/3=1",
-"5-12/4=2",
-"5-12/6=3",
-"5-13+8=0",
-"5-13+9=1",
-"5-13*0=5",
-"5-14+9=0",
-"5-14*0=5",
-"5-14/7=3",
-"5-15*0=5",
-"5-15/3=0",
-"5-15/5=2",
-"5-15=-10",
-"5-16*0=5",
-"5-16/4=1",
-"5-16/8=3",
-"5-16=-11",
-"5-17*0=5",
-"5-17=-12",
-"5-18*0=5",
-"5-18/6=2",
-"5-18/9=3",
-"5-18=-13",
-"5-19*0=5",
-"5-19=-14",
-"5-1+6=10",
-"5-1+7=11",
-"5-1+8=12",
-"5-1+9=13",
-"5-1-5=-1",
-"5-1-6=-2",
-"5-1-7=-3",
-"5-1-8=-4",
-"5-1-9=-5",
-"5-1*6=-1",
-"5-1*7=-2",
-"5-1*8=-3",
-"5-1*9=-4",
-"5-20*0=5",
-"5-20/4=0",
-"5-20/5=1",
-"5-20=-15",
-"5-21*0=5",
-"5-21/7=2",
-"5-21=-16",
-"5-22*0=5",
-"5-22=-17",
-"5-23*0=5",
-"5-23=-18",
-"5-24*0=5",
-"5-24/6=1",
-"5-24/8=2",
-"5-24=-19",
-"5-25*0=5",
-"5-25/5=0",
-"5-25=-20",
-"5-26*0=5",
-"5-26=-21",
-"5-27*0=5",
-"5-27/9=2",
-"5-27=-22",
-"5-28*0=5",
-"5-28/7=1",
-"5-28=-23",
-"5-29*0=5",
-"5-29=-24",
-"5-2+7=10",
-"5-2+8=11",
-"5-2+9=12",
-"5-2-4=-1",
-"5-2-5=-2",
-"5-2-6=-3",
-"5-2-7=-4",
-"5-2-8=-5",
-"5-2-9=-6",
-"5-2*3=-1",
-"5-2*4=-3",
-"5-2*5=-5",
-"5-2*6=-7",
-"5-2*7=-9",
-"5-30*0=5",
-"5-30/6=0",
-"5-30=-25",
-"5-31*0=5",
-"5-31=-26",
-"5-32*0=5",
-"5-32/8=1",
-"5-32=-27",
-"5-33*0=5",
-"5-33=-28",
-"5-34*0=5",
-"5-34=-29",
-"5-35*0=5",
-"5-35/7=0",
-"5-35=-30",
-"5-36*0=5",
-"5-36/9=1",
-"5-36=-31",
-"5-37*0=5",
-"5-37=-32",
-"5-38*0=5",
-"5-38=-33",
-"5-39*0=5",
-"5-39=-34",
-"5-3+8=10",
-"5-3+9=11",
-"5-3-3=-1",
-"5-3-4=-2",
-"5-3-5=-3",
-"5-3-6=-4",
-"5-3-7=-5",
-"5-3-8=-6",
-"5-3-9=-7",
-"5-3*2=-1",
-"5-3*3=-4",
-"5-3*4=-7",
-"5-40*0=5",
-"5-40/8=0",
-"5-40=-35",
-"5-41*0=5",
-"5-41=-36",
-"5-42*0=5",
-"5-42=-37",
-"5-43*0=5",
-"5-43=-38",
-"5-44*0=5",
-"5-44=-39",
-"5-45*0=5",
-"5-45/9=0",
-"5-45=-40",
-"5-46*0=5",
-"5-46=-41",
-"5-47*0=5",
-"5-47=-42",
-"5-48*0=5",
-"5-48=-43",
-"5-49*0=5",
-"5-49=-44",
-"5-4+9=10",
-"5-4-2=-1",
-"5-4-3=-2",
-"5-4-4=-3",
-"5-4-5=-4",
-"5-4-6=-5",
-"5-4-7=-6",
-"5-4-8=-7",
-"5-4-9=-8",
-"5-4*2=-3",
-"5-4*3=-7",
-"5-50*0=5",
-"5-50=-45",
-"5-51*0=5",
-"5-51=-46",
-"5-52*0=5",
-"5-52=-47",
-"5-53*0=5",
-"5-53=-48",
-"5-54*0=5",
-"5-54=-49",
-"5-55*0=5",
-"5-55=-50",
-"5-56*0=5",
-"5-56=-51",
-"5-57*0=5",
-"5-57=-52",
-"5-58*0=5",
-"5-58=-53",
-"5-59*0=5",
-"5-59=-54",
-"5-5-1=-1",
-"5-5-2=-2",
-"5-5-3=-3",
-"5-5-4=-4",
-"5-5-5=-5",
-"5-5-6=-6",
-"5-5-7=-7",
-"5-5-8=-8",
-"5-5-9=-9",
-"5-5*2=-5",
-"5-60*0=5",
-"5-60=-55",
-"5-61*0=5",
-"5-61=-56",
-"5-62*0=5",
-"5-62=-57",
-"5-63*0=5",
-"5-63=-58",
-"5-64*0=5",
-"5-64=-59",
-"5-65*0=5",
-"5-65=-60",
-"5-66*0=5",
-"5-66=-61",
-"5-67*0=5",
-"5-67=-62",
-"5-68*0=5",
-"5-68=-63",
-"5-69*0=5",
-"5-69=-64",
-"5-6+0=-1",
-"5-6+10=9",
-"5-6-0=-1",
-"5-6-1=-2",
-"5-6-2=-3",
-"5-6-3=-4",
-"5-6-4=-5",
-"5-6-5=-6",
-"5-6-6=-7",
-"5-6-7=-8",
-"5-6-8=-9",
-"5-6*1=-1",
-"5-6*2=-7",
-"5-6/1=-1",
-"5-70*0=5",
-"5-70=-65",
-"5-71*0=5",
-"5-71=-66",
-"5-72*0=5",
-"5-72=-67",
-"5-73*0=5",
-"5-73=-68",
-"5-74*0=5",
-"5-74=-69",
-"5-75*0=5",
-"5-75=-70",
-"5-76*0=5",
-"5-76=-71",
-"5-77*0=5",
-"5-77=-72",
-"5-78*0=5",
-"5-78=-73",
-"5-79*0=5",
-"5-79=-74",
-"5-7+0=-2",
-"5-7+10=8",
-"5-7+11=9",
-"5-7+1=-1",
-"5-7-0=-2",
-"5-7-1=-3",
-"5-7-2=-4",
-"5-7-3=-5",
-"5-7-4=-6",
-"5-7-5=-7",
-"5-7-6=-8",
-"5-7-7=-9",
-"5-7*1=-2",
-"5-7*2=-9",
-"5-7/1=-2",
-"5-80*0=5",
-"5-80=-75",
-"5-81*0=5",
-"5-81=-76",
-"5-82*0=5",
-"5-82=-77",
-"5-83*0=5",
-"5-83=-78",
-"5-84*0=5",
-"5-84=-79",
-"5-85*0=5",
-"5-85=-80",
-"5-86*0=5",
-"5-86=-81",
-"5-87*0=5",
-"5-87=-82",
-"5-88*0=5",
-"5-88=-83",
-"5-89*0=5",
-"5-89=-84",
-"5-8+0=-3",
-"5-8+10=7",
-"5-8+11=8",
-"5-8+12=9",
-"5-8+1=-2",
-"5-8+2=-1",
-"5-8-0=-3",
-"5-8-1=-4",
-"5-8-2=-5",
-"5-8-3=-6",
-"5-8-4=-7",
-"5-8-5=-8",
-"5-8-6=-9",
-"5-8*1=-3",
-"5-8/1=-3",
-"5-90*0=5",
-"5-90=-85",
-"5-91*0=5",
-"5-91=-86",
-"5-92*0=5",
-"5-92=-87",
-"5-93*0=5",
-"5-93=-88",
-"5-94*0=5",
-"5-94=-89",
-"5-95*0=5",
-"5-95=-90",
-"5-96*0=5",
-"5-96=-91",
-"5-97*0=5",
-"5-97=-92",
-"5-98*0=5",
-"5-98=-93",
-"5-99*0=5",
-"5-99=-94",
-"5-9+0=-4",
-"5-9+10=6",
-"5-9+11=7",
-"5-9+12=8",
-"5-9+13=9",
-"5-9+1=-3",
-"5-9+2=-2",
-"5-9+3=-1",
-"5-9-0=-4",
-"5-9-1=-5",
-"5-9-2=-6",
-"5-9-3=-7",
-"5-9-4=-8",
-"5-9-5=-9",
-"5-9*1=-4",
-"5-9/1=-4",
-"5*0-1=-1",
-"5*0-2=-2",
-"5*0-3=-3",
-"5*0-4=-4",
-"5*0-5=-5",
-"5*0-6=-6",
-"5*0-7=-7",
-"5*0-8=-8",
-"5*0-9=-9",
-"5*0*10=0",
-"5*0*11=0",
-"5*0*12=0",
-"5*0*13=0",
-"5*0*14=0",
-"5*0*15=0",
-"5*0*16=0",
-"5*0*17=0",
-"5*0*18=0",
-"5*0*19=0",
-"5*0*20=0",
-"5*0*21=0",
-"5*0*22=0",
-"5*0*23=0",
-"5*0*24=0",
-"5*0*25=0",
-"5*0*26=0",
-"5*0*27=0",
-"5*0*28=0",
-"5*0*29=0",
-"5*0*30=0",
-"5*0*31=0",
-"5*0*32=0",
-"5*0*33=0",
-"5*0*34=0",
-"5*0*35=0",
-"5*0*36=0",
-"5*0*37=0",
-"5*0*38=0",
-"5*0*39=0",
-"5*0*40=0",
-"5*0*41=0",
-"5*0*42=0",
-"5*0*43=0",
-"5*0*44=0",
-"5*0*45=0",
-"5*0*46=0",
-"5*0*47=0",
-"5*0*48=0",
-"5*0*49=0",
-"5*0*50=0",
-"5*0*51=0",
-"5*0*52=0",
-"5*0*53=0",
-"5*0*54=0",
-"5*0*55=0",
-"5*0*56=0",
-"5*0*57=0",
-"5*0*58=0",
-"5*0*59=0",
-"5*0*60=0",
-"5*0*61=0",
-"5*0*62=0",
-"5*0*63=0",
-"5*0*64=0",
-"5*0*65=0",
-"5*0*66=0",
-"5*0*67=0",
-"5*0*68=0",
-"5*0*69=0",
-"5*0*70=0",
-"5*0*71=0",
-"5*0*72=0",
-"5*0*73=0",
-"5*0*74=0",
-"5*0*75=0",
-"5*0*76=0",
-"5*0*77=0",
-"5*0*78=0",
-"5*0*79=0",
-"5*0*80=0",
-"5*0*81=0",
-"5*0*82=0",
-"5*0*83=0",
-"5*0*84=0",
-"5*0*85=0",
-"5*0*86=0",
-"5*0*87=0",
-"5*0*88=0",
-"5*0*89=0",
-"5*0*90=0",
-"5*0*91=0",
-"5*0*92=0",
-"5*0*93=0",
-"5*0*94=0",
-"5*0*95=0",
-"5*0*96=0",
-"5*0*97=0",
-"5*0*98=0",
-"5*0*99=0",
-"5*0/10=0",
-"5*0/11=0",
-"5*0/12=0",
-"5*0/13=0",
-"5*0/14=0",
-"5*0/15=0",
-"5*0/16=0",
-"5*0/17=0",
-"5*0/18=0",
-"5*0/19=0",
-"5*0/20=0",
-"5*0/21=0",
-"5*0/22=0",
-"5*0/23=0",
-"5*0/24=0",
-"5*0/25=0",
-"5*0/26=0",
-"5*0/27=0",
-"5*0/28=0",
-"5*0/29=0",
-"5*0/30=0",
-"5*0/31=0",
-"5*0/32=0",
-"5*0/33=0",
-"5*0/34=0",
-"5*0/35=0",
-"5*0/36=0",
-"5*0/37=0",
-"5*0/38=0",
-"5*0/39=0",
-"5*0/40=0",
-"5*0/41=0",
-"5*0/42=0",
-"5*0/43=0",
-"5*0/44=0",
-"5*0/45=0",
-"5*0/46=0",
-"5*0/47=0",
-"5*0/48=0",
-"5*0/49=0",
-"5*0/50=0",
-"5*0/51=0",
-"5*0/52=0",
-"5*0/53=0",
-"5*0/54=0",
-"5*0/55=0",
-"5*0/56=0",
-"5*0/57=0",
-"5*0/58=0",
-"5*0/59=0",
-"5*0/60=0",
-"5*0/61=0",
-"5*0/62=0",
-"5*0/63=0",
-"5*0/64=0",
-"5*0/65=0",
-"5*0/66=0",
-"5*0/67=0",
-"5*0/68=0",
-"5*0/69=0",
-"5*0/70=0",
-"5*0/71=0",
-"5*0/72=0",
-"5*0/73=0",
-"5*0/74=0",
-"5*0/75=0",
-"5*0/76=0",
-"5*0/77=0",
-"5*0/78=0",
-"5*0/79=0",
-"5*0/80=0",
-"5*0/81=0",
-"5*0/82=0",
-"5*0/83=0",
-"5*0/84=0",
-"5*0/85=0",
-"5*0/86=0",
-"5*0/87=0",
-"5*0/88=0",
-"5*0/89=0",
-"5*0/90=0",
-"5*0/91=0",
-"5*0/92=0",
-"5*0/93=0",
-"5*0/94=0",
-"5*0/95=0",
-"5*0/96=0",
-"5*0/97=0",
-"5*0/98=0",
-"5*0/99=0",
-"5*10*0=0",
-"5*11*0=0",
-"5*12*0=0",
-"5*13*0=0",
-"5*14*0=0",
-"5*15*0=0",
-"5*16*0=0",
-"5*17*0=0",
-"5*18*0=0",
-"5*19*0=0",
-"5*1+5=10",
-"5*1+6=11",
-"5*1+7=12",
-"5*1+8=13",
-"5*1+9=14",
-"5*1-6=-1",
-"5*1-7=-2",
-"5*1-8=-3",
-"5*1-9=-4",
-"5*1*2=10",
-"5*1*3=15",
-"5*1*4=20",
-"5*1*5=25",
-"5*1*6=30",
-"5*1*7=35",
-"5*1*8=40",
-"5*1*9=45",
-"5*20*0=0",
-"5*20=100",
-"5*21*0=0",
-"5*21=105",
-"5*22*0=0",
-"5*22=110",
-"5*23*0=0",
-"5*23=115",
-"5*24*0=0",
-"5*24=120",
-"5*25*0=0",
-"5*25=125",
-"5*26*0=0",
-"5*26=130",
-"5*27*0=0",
-"5*27=135",
-"5*28*0=0",
-"5*28=140",
-"5*29*0=0",
-"5*29=145",
-"5*2+0=10",
-"5*2+1=11",
-"5*2+2=12",
-"5*2+3=13",
-"5*2+4=14",
-"5*2+5=15",
-"5*2+6=16",
-"5*2+7=17",
-"5*2+8=18",
-"5*2+9=19",
-"5*2-0=10",
-"5*2-10=0",
-"5*2*1=10",
-"5*2*2=20",
-"5*2*3=30",
-"5*2*4=40",
-"5*2*5=50",
-"5*2*6=60",
-"5*2*7=70",
-"5*2*8=80",
-"5*2*9=90",
-"5*2/10=1",
-"5*2/1=10",
-"5*30*0=0",
-"5*30=150",
-"5*31*0=0",
-"5*31=155",
-"5*32*0=0",
-"5*32=160",
-"5*33*0=0",
-"5*33=165",
-"5*34*0=0",
-"5*34=170",
-"5*35*0=0",
-"5*35=175",
-"5*36*0=0",
-"5*36=180",
-"5*37*0=0",
-"5*37=185",
-"5*38*0=0",
-"5*38=190",
-"5*39*0=0",
-"5*39=195",
-"5*3+0=15",
-"5*3+1=16",
-"5*3+2=17",
-"5*3+3=18",
-"5*3+4=19",
-"5*3+5=20",
-"5*3+6=21",
-"5*3+7=22",
-"5*3+8=23",
-"5*3+9=24",
-"5*3-0=15",
-"5*3-10=5",
-"5*3-11=4",
-"5*3-12=3",
-"5*3-13=2",
-"5*3-14=1",
-"5*3-15=0",
-"5*3-1=14",
-"5*3-2=13",
-"5*3-3=12",
-"5*3-4=11",
-"5*3-5=10",
-"5*3*1=15",
-"5*3*2=30",
-"5*3*3=45",
-"5*3*4=60",
-"5*3*5=75",
-"5*3*6=90",
-"5*3/15=1",
-"5*3/1=15",
-"5*40*0=0",
-"5*40=200",
-"5*41*0=0",
-"5*41=205",
-"5*42*0=0",
-"5*42=210",
-"5*43*0=0",
-"5*43=215",
-"5*44*0=0",
-"5*44=220",
-"5*45*0=0",
-"5*45=225",
-"5*46*0=0",
-"5*46=230",
-"5*47*0=0",
-"5*47=235",
-"5*48*0=0",
-"5*48=240",
-"5*49*0=0",
-"5*49=245",
-"5*4+0=20",
-"5*4+1=21",
-"5*4+2=22",
-"5*4+3=23",
-"5*4+4=24",
-"5*4+5=25",
-"5*4+6=26",
-"5*4+7=27",
-"5*4+8=28",
-"5*4+9=29",
-"5*4-0=20",
-"5*4-11=9",
-"5*4-12=8",
-"5*4-13=7",
-"5*4-14=6",
-"5*4-15=5",
-"5*4-16=4",
-"5*4-17=3",
-"5*4-18=2",
-"5*4-19=1",
-"5*4-1=19",
-"5*4-20=0",
-"5*4-2=18",
-"5*4-3=17",
-"5*4-4=16",
-"5*4-5=15",
-"5*4-6=14",
-"5*4-7=13",
-"5*4-8=12",
-"5*4-9=11",
-"5*4*1=20",
-"5*4*2=40",
-"5*4*3=60",
-"5*4*4=80",
-"5*4/10=2",
-"5*4/1=20",
-"5*4/20=1",
-"5*4/2=10",
-"5*50*0=0",
-"5*50=250",
-"5*51*0=0",
-"5*51=255",
-"5*52*0=0",
-"5*52=260",
-"5*53*0=0",
-"5*53=265",
-"5*54*0=0",
-"5*54=270",
-"5*55*0=0",
-"5*55=275",
-"5*56*0=0",
-"5*56=280",
-"5*57*0=0",
-"5*57=285",
-"5*58*0=0",
-"5*58=290",
-"5*59*0=0",
-"5*59=295",
-"5*5+0=25",
-"5*5+1=26",
-"5*5+2=27",
-"5*5+3=28",
-"5*5+4=29",
-"5*5+5=30",
-"5*5+6=31",
-"5*5+7=32",
-"5*5+8=33",
-"5*5+9=34",
-"5*5-0=25",
-"5*5-16=9",
-"5*5-17=8",
-"5*5-18=7",
-"5*5-19=6",
-"5*5-1=24",
-"5*5-20=5",
-"5*5-21=4",
-"5*5-22=3",
-"5*5-23=2",
-"5*5-24=1",
-"5*5-25=0",
-"5*5-2=23",
-"5*5-3=22",
-"5*5-4=21",
-"5*5-5=20",
-"5*5-6=19",
-"5*5-7=18",
-"5*5-8=17",
-"5*5-9=16",
-"5*5*1=25",
-"5*5*2=50",
-"5*5*3=75",
-"5*5/1=25",
-"5*5/25=1",
-"5*60*0=0",
-"5*60=300",
-"5*61*0=0",
-"5*61=305",
-"5*62*0=0",
-"5*62=310",
-"5*63*0=0",
-"5*63=315",
-"5*64*0=0",
-"5*64=320",
-"5*65*0=0",
-"5*65=325",
-"5*66*0=0",
-"5*66=330",
-"5*67*0=0",
-"5*67=335",
-"5*68*0=0",
-"5*68=340",
-"5*69*0=0",
-"5*69=345",
-"5*6+0=30",
-"5*6+1=31",
-"5*6+2=32",
-"5*6+3=33",
-"5*6+4=34",
-"5*6+5=35",
-"5*6+6=36",
-"5*6+7=37",
-"5*6+8=38",
-"5*6+9=39",
-"5*6-0=30",
-"5*6-1=29",
-"5*6-21=9",
-"5*6-22=8",
-"5*6-23=7",
-"5*6-24=6",
-"5*6-25=5",
-"5*6-26=4",
-"5*6-27=3",
-"5*6-28=2",
-"5*6-29=1",
-"5*6-2=28",
-"5*6-30=0",
-"5*6-3=27",
-"5*6-4=26",
-"5*6-5=25",
-"5*6-6=24",
-"5*6-7=23",
-"5*6-8=22",
-"5*6-9=21",
-"5*6*1=30",
-"5*6*2=60",
-"5*6*3=90",
-"5*6/10=3",
-"5*6/15=2",
-"5*6/1=30",
-"5*6/2=15",
-"5*6/30=1",
-"5*6/3=10",
-"5*70*0=0",
-"5*70=350",
-"5*71*0=0",
-"5*71=355",
-"5*72*0=0",
-"5*72=360",
-"5*73*0=0",
-"5*73=365",
-"5*74*0=0",
-"5*74=370",
-"5*75*0=0",
-"5*75=375",
-"5*76*0=0",
-"5*76=380",
-"5*77*0=0",
-"5*77=385",
-"5*78*0=0",
-"5*78=390",
-"5*79*0=0",
-"5*79=395",
-"5*7+0=35",
-"5*7+1=36",
-"5*7+2=37",
-"5*7+3=38",
-"5*7+4=39",
-"5*7+5=40",
-"5*7+6=41",
-"5*7+7=42",
-"5*7+8=43",
-"5*7+9=44",
-"5*7-0=35",
-"5*7-1=34",
-"5*7-26=9",
-"5*7-27=8",
-"5*7-28=7",
-"5*7-29=6",
-"5*7-2=33",
-"5*7-30=5",
-"5*7-31=4",
-"5*7-32=3",
-"5*7-33=2",
-"5*7-34=1",
-"5*7-35=0",
-"5*7-3=32",
-"5*7-4=31",
-"5*7-5=30",
-"5*7-6=29",
-"5*7-7=28",
-"5*7-8=27",
-"5*7-9=26",
-"5*7*1=35",
-"5*7*2=70",
-"5*7/1=35",
-"5*7/35=1",
-"5*80*0=0",
-"5*80=400",
-"5*81*0=0",
-"5*81=405",
-"5*82*0=0",
-"5*82=410",
-"5*83*0=0",
-"5*83=415",
-"5*84*0=0",
-"5*84=420",
-"5*85*0=0",
-"5*85=425",
-"5*86*0=0",
-"5*86=430",
-"5*87*0=0",
-"5*87=435",
-"5*88*0=0",
-"5*88=440",
-"5*89*0=0",
-"5*89=445",
-"5*8+0=40",
-"5*8+1=41",
-"5*8+2=42",
-"5*8+3=43",
-"5*8+4=44",
-"5*8+5=45",
-"5*8+6=46",
-"5*8+7=47",
-"5*8+8=48",
-"5*8+9=49",
-"5*8-0=40",
-"5*8-1=39",
-"5*8-2=38",
-"5*8-31=9",
-"5*8-32=8",
-"5*8-33=7",
-"5*8-34=6",
-"5*8-35=5",
-"5*8-36=4",
-"5*8-37=3",
-"5*8-38=2",
-"5*8-39=1",
-"5*8-3=37",
-"5*8-40=0",
-"5*8-4=36",
-"5*8-5=35",
-"5*8-6=34",
-"5*8-7=33",
-"5*8-8=32",
-"5*8-9=31",
-"5*8*1=40",
-"5*8*2=80",
-"5*8/10=4",
-"5*8/1=40",
-"5*8/20=2",
-"5*8/2=20",
-"5*8/40=1",
-"5*8/4=10",
-"5*90*0=0",
-"5*90=450",
-"5*91*0=0",
-"5*91=455",
-"5*92*0=0",
-"5*92=460",
-"5*93*0=0",
-"5*93=465",
-"5*94*0=0",
-"5*94=470",
-"5*95*0=0",
-"5*95=475",
-"5*96*0=0",
-"5*96=480",
-"5*97*0=0",
-"5*97=485",
-"5*98*0=0",
-"5*98=490",
-"5*99*0=0",
-"5*99=495",
-"5*9+0=45",
-"5*9+1=46",
-"5*9+2=47",
-"5*9+3=48",
-"5*9+4=49",
-"5*9+5=50",
-"5*9+6=51",
-"5*9+7=52",
-"5*9+8=53",
-"5*9+9=54",
-"5*9-0=45",
-"5*9-1=44",
-"5*9-2=43",
-"5*9-36=9",
-"5*9-37=8",
-"5*9-38=7",
-"5*9-39=6",
-"5*9-3=42",
-"5*9-40=5",
-"5*9-41=4",
-"5*9-42=3",
-"5*9-43=2",
-"5*9-44=1",
-"5*9-45=0",
-"5*9-4=41",
-"5*9-5=40",
-"5*9-6=39",
-"5*9-7=38",
-"5*9-8=37",
-"5*9-9=36",
-"5*9*1=45",
-"5*9*2=90",
-"5*9/15=3",
-"5*9/1=45",
-"5*9/3=15",
-"5*9/45=1",
-"5/10*0=0",
-"5/10*2=1",
-"5/10*4=2",
-"5/10*6=3",
-"5/10*8=4",
-"5/11*0=0",
-"5/12*0=0",
-"5/13*0=0",
-"5/14*0=0",
-"5/15*0=0",
-"5/15*3=1",
-"5/15*6=2",
-"5/15*9=3",
-"5/16*0=0",
-"5/17*0=0",
-"5/18*0=0",
-"5/19*0=0",
-"5/1+5=10",
-"5/1+6=11",
-"5/1+7=12",
-"5/1+8=13",
-"5/1+9=14",
-"5/1-6=-1",
-"5/1-7=-2",
-"5/1-8=-3",
-"5/1-9=-4",
-"5/1*2=10",
-"5/1*3=15",
-"5/1*4=20",
-"5/1*5=25",
-"5/1*6=30",
-"5/1*7=35",
-"5/1*8=40",
-"5/1*9=45",
-"5/20*0=0",
-"5/20*4=1",
-"5/20*8=2",
-"5/21*0=0",
-"5/22*0=0",
-"5/23*0=0",
-"5/24*0=0",
-"5/25*0=0",
-"5/25*5=1",
-"5/26*0=0",
-"5/27*0=0",
-"5/28*0=0",
-"5/29*0=0",
-"5/2*4=10",
-"5/2*6=15",
-"5/2*8=20",
-"5/30*0=0",
-"5/30*6=1",
-"5/31*0=0",
-"5/32*0=0",
-"5/33*0=0",
-"5/34*0=0",
-"5/35*0=0",
-"5/35*7=1",
-"5/36*0=0",
-"5/37*0=0",
-"5/38*0=0",
-"5/39*0=0",
-"5/3*6=10",
-"5/3*9=15",
-"5/40*0=0",
-"5/40*8=1",
-"5/41*0=0",
-"5/42*0=0",
-"5/43*0=0",
-"5/44*0=0",
-"5/45*0=0",
-"5/45*9=1",
-"5/46*0=0",
-"5/47*0=0",
-"5/48*0=0",
-"5/49*0=0",
-"5/4*8=10",
-"5/50*0=0",
-"5/51*0=0",
-"5/52*0=0",
-"5/53*0=0",
-"5/54*0=0",
-"5/55*0=0",
-"5/56*0=0",
-"5/57*0=0",
-"5/58*0=0",
-"5/59*0=0",
-"5/5+9=10",
-"5/5-2=-1",
-"5/5-3=-2",
-"5/5-4=-3",
-"5/5-5=-4",
-"5/5-6=-5",
-"5/5-7=-6",
-"5/5-8=-7",
-"5/5-9=-8",
-"5/60*0=0",
-"5/61*0=0",
-"5/62*0=0",
-"5/63*0=0",
-"5/64*0=0",
-"5/65*0=0",
-"5/66*0=0",
-"5/67*0=0",
-"5/68*0=0",
-"5/69*0=0",
-"5/70*0=0",
-"5/71*0=0",
-"5/72*0=0",
-"5/73*0=0",
-"5/74*0=0",
-"5/75*0=0",
-"5/76*0=0",
-"5/77*0=0",
-"5/78*0=0",
-"5/79*0=0",
-"5/80*0=0",
-"5/81*0=0",
-"5/82*0=0",
-"5/83*0=0",
-"5/84*0=0",
-"5/85*0=0",
-"5/86*0=0",
-"5/87*0=0",
-"5/88*0=0",
-"5/89*0=0",
-"5/90*0=0",
-"5/91*0=0",
-"5/92*0=0",
-"5/93*0=0",
-"5/94*0=0",
-"5/95*0=0",
-"5/96*0=0",
-"5/97*0=0",
-"5/98*0=0",
-"5/99*0=0",
-"6000*0=0",
-"6001*0=0",
-"6002*0=0",
-"6003*0=0",
-"6004*0=0",
-"6005*0=0",
-"6006*0=0",
-"6007*0=0",
-"6008*0=0",
-"6009*0=0",
-"600/75=8",
-"600/8=75",
-"6010*0=0",
-"6011*0=0",
-"6012*0=0",
-"6013*0=0",
-"6014*0=0",
-"6015*0=0",
-"6016*0=0",
-"6017*0=0",
-"6018*0=0",
-"6019*0=0",
-"6020*0=0",
-"6021*0=0",
-"6022*0=0",
-"6023*0=0",
-"6024*0=0",
-"6025*0=0",
-"6026*0=0",
-"6027*0=0",
-"6028*0=0",
-"6029*0=0",
-"602/7=86",
-"602/86=7",
-"6030*0=0",
-"6031*0=0",
-"6032*0=0",
-"6033*0=0",
-"6034*0=0",
-"6035*0=0",
-"6036*0=0",
-"6037*0=0",
-"6038*0=0",
-"6039*0=0",
-"603/67=9",
-"603/9=67",
-"6040*0=0",
-"6041*0=0",
-"6042*0=0",
-"6043*0=0",
-"6044*0=0",
-"6045*0=0",
-"6046*0=0",
-"6047*0=0",
-"6048*0=0",
-"6049*0=0",
-"6050*0=0",
-"6051*0=0",
-"6052*0=0",
-"6053*0=0",
-"6054*0=0",
-"6055*0=0",
-"6056*0=0",
-"6057*0=0",
-"6058*0=0",
-"6059*0=0",
-"6060*0=0",
-"6061*0=0",
-"6062*0=0",
-"6063*0=0",
-"6064*0=0",
-"6065*0=0",
-"6066*0=0",
-"6067*0=0",
-"6068*0=0",
-"6069*0=0",
-"6070*0=0",
-"6071*0=0",
-"6072*0=0",
-"6073*0=0",
-"6074*0=0",
-"6075*0=0",
-"6076*0=0",
-"6077*0=0",
-"6078*0=0",
-"6079*0=0",
-"6080*0=0",
-"6081*0=0",
-"6082*0=0",
-"6083*0=0",
-"6084*0=0",
-"6085*0=0",
-"6086*0=0",
-"6087*0=0",
-"6088*0=0",
-"6089*0=0",
-"608/76=8",
-"608/8=76",
-"6090*0=0",
-"6091*0=0",
-"6092*0=0",
-"6093*0=0",
-"6094*0=0",
-"6095*0=0",
-"6096*0=0",
-"6097*0=0",
-"6098*0=0",
-"6099*0=0",
-"609/7=87",
-"609/87=7",
-"60+10=70",
-"60+11=71",
-"60+12=72",
-"60+13=73",
-"60+14=74",
-"60+15=75",
-"60+16=76",
-"60+17=77",
-"60+18=78",
-"60+19=79",
-"60+20=80",
-"60+21=81",
-"60+22=82",
-"60+23=83",
-"60+24=84",
-"60+25=85",
-"60+26=86",
-"60+27=87",
-"60+28=88",
-"60+29=89",
-"60+30=90",
-"60+31=91",
-"60+32=92",
-"60+33=93",
-"60+34=94",
-"60+35=95",
-"60+36=96",
-"60+37=97",
-"60+38=98",
-"60+39=99",
-"60-10=50",
-"60-11=49",
-"60-12=48",
-"60-13=47",
-"60-14=46",
-"60-15=45",
-"60-16=44",
-"60-17=43",
-"60-18=42",
-"60-19=41",
-"60-20=40",
-"60-21=39",
-"60-22=38",
-"60-23=37",
-"60-24=36",
-"60-25=35",
-"60-26=34",
-"60-27=33",
-"60-28=32",
-"60-29=31",
-"60-30=30",
-"60-31=29",
-"60-32=28",
-"60-33=27",
-"60-34=26",
-"60-35=25",
-"60-36=24",
-"60-37=23",
-"60-38=22",
-"60-39=21",
-"60-40=20",
-"60-41=19",
-"60-42=18",
-"60-43=17",
-"60-44=16",
-"60-45=15",
-"60-46=14",
-"60-47=13",
-"60-48=12",
-"60-49=11",
-"60-50=10",
-"60-61=-1",
-"60-62=-2",
-"60-63=-3",
-"60-64=-4",
-"60-65=-5",
-"60-66=-6",
-"60-67=-7",
-"60-68=-8",
-"60-69=-9",
-"60-6*9=6",
-"60-7*8=4",
-"60-8*7=4",
-"60-9*6=6",
-"60*0+0=0",
-"60*0+1=1",
-"60*0+2=2",
-"60*0+3=3",
-"60*0+4=4",
-"60*0+5=5",
-"60*0+6=6",
-"60*0+7=7",
-"60*0+8=8",
-"60*0+9=9",
-"60*0-0=0",
-"60*0*0=0",
-"60*0*1=0",
-"60*0*2=0",
-"60*0*3=0",
-"60*0*4=0",
-"60*0*5=0",
-"60*0*6=0",
-"60*0*7=0",
-"60*0*8=0",
-"60*0*9=0",
-"60*0/1=0",
-"60*0/2=0",
-"60*0/3=0",
-"60*0/4=0",
-"60*0/5=0",
-"60*0/6=0",
-"60*0/7=0",
-"60*0/8=0",
-"60*0/9=0",
-"60*1*0=0",
-"60*2*0=0",
-"60*2=120",
-"60*3*0=0",
-"60*3=180",
-"60*4*0=0",
-"60*4=240",
-"60*5*0=0",
-"60*5=300",
-"60*6*0=0",
-"60*6=360",
-"60*7*0=0",
-"60*7=420",
-"60*8*0=0",
-"60*8=480",
-"60*9*0=0",
-"60*9=540",
-"60/1*0=0",
-"60/2*0=0",
-"60/2/5=6",
-"60/2/6=5",
-"60/3*0=0",
-"60/3/4=5",
-"60/3/5=4",
-"60/4-6=9",
-"60/4-7=8",
-"60/4-8=7",
-"60/4-9=6",
-"60/4*0=0",
-"60/4/3=5",
-"60/4/5=3",
-"60/5-3=9",
-"60/5-4=8",
-"60/5-5=7",
-"60/5-6=6",
-"60/5-7=5",
-"60/5-8=4",
-"60/5-9=3",
-"60/5*0=0",
-"60/5/2=6",
-"60/5/3=4",
-"60/5/4=3",
-"60/5/6=2",
-"60/6-1=9",
-"60/6-2=8",
-"60/6-3=7",
-"60/6-4=6",
-"60/6-5=5",
-"60/6-6=4",
-"60/6-7=3",
-"60/6-8=2",
-"60/6-9=1",
-"60/6*0=0",
-"60/6/2=5",
-"60/6/5=2",
-"60/7*0=0",
-"60/8*0=0",
-"60/9*0=0",
-"6100*0=0",
-"6101*0=0",
-"6102*0=0",
-"6103*0=0",
-"6104*0=0",
-"6105*0=0",
-"6106*0=0",
-"6107*0=0",
-"6108*0=0",
-"6109*0=0",
-"6110*0=0",
-"6111*0=0",
-"6112*0=0",
-"6113*0=0",
-"6114*0=0",
-"6115*0=0",
-"6116*0=0",
-"6117*0=0",
-"6118*0=0",
-"6119*0=0",
-"6120*0=0",
-"6121*0=0",
-"6122*0=0",
-"6123*0=0",
-"6124*0=0",
-"6125*0=0",
-"6126*0=0",
-"6127*0=0",
-"6128*0=0",
-"6129*0=0",
-"612/68=9",
-"612/9=68",
-"6130*0=0",
-"6131*0=0",
-"6132*0=0",
-"6133*0=0",
-"6134*0=0",
-"6135*0=0",
-"6136*0=0",
-"6137*0=0",
-"6138*0=0",
-"6139*0=0",
-"6140*0=0",
-"6141*0=0",
-"6142*0=0",
-"6143*0=0",
-"6144*0=0",
-"6145*0=0",
-"6146*0=0",
-"6147*0=0",
-"6148*0=0",
-"6149*0=0",
-"6150*0=0",
-"6151*0=0",
-"6152*0=0",
-"6153*0=0",
-"6154*0=0",
-"6155*0=0",
-"6156*0=0",
-"6157*0=0",
-"6158*0=0",
-"6159*0=0",
-"6160*0=0",
-"6161*0=0",
-"6162*0=0",
-"6163*0=0",
-"6164*0=0",
-"6165*0=0",
-"6166*0=0",
-"6167*0=0",
-"6168*0=0",
-"6169*0=0",
-"616/77=8",
-"616/7=88",
-"616/88=7",
-"616/8=77",
-"6170*0=0",
-"6171*0=0",
-"6172*0=0",
-"6173*0=0",
-"6174*0=0",
-"6175*0=0",
-"6176*0=0",
-"6177*0=0",
-"6178*0=0",
-"6179*0=0",
-"6180*0=0",
-"6181*0=0",
-"6182*0=0",
-"6183*0=0",
-"6184*0=0",
-"6185*0=0",
-"6186*0=0",
-"6187*0=0",
-"6188*0=0",
-"6189*0=0",
-"6190*0=0",
-"6191*0=0",
-"6192*0=0",
-"6193*0=0",
-"6194*0=0",
-"6195*0=0",
-"6196*0=0",
-"6197*0=0",
-"6198*0=0",
-"6199*0=0",
-"61+10=71",
-"61+11=72",
-"61+12=73",
-"61+13=74",
-"61+14=75",
-"61+15=76",
-"61+16=77",
-"61+17=78",
-"61+18=79",
-"61+19=80",
-"61+20=81",
-"61+21=82",
-"61+22=83",
-"61+23=84",
-"61+24=85",
-"61+25=86",
-"61+26=87",
-"61+27=88",
-"61+28=89",
-"61+29=90",
-"61+30=91",
-"61+31=92",
-"61+32=93",
-"61+33=94",
-"61+34=95",
-"61+35=96",
-"61+36=97",
-"61+37=98",
-"61+38=99",
-"61-10=51",
-"61-11=50",
-"61-12=49",
-"61-13=48",
-"61-14=47",
-"61-15=46",
-"61-16=45",
-"61-17=44",
-"61-18=43",
-"61-19=42",
-"61-20=41",
-"61-21=40",
-"61-22=39",
-"61-23=38",
-"61-24=37",
-"61-25=36",
-"61-26=35",
-"61-27=34",
-"61-28=33",
-"61-29=32",
-"61-30=31",
-"61-31=30",
-"61-32=29",
-"61-33=28",
-"61-34=27",
-"61-35=26",
-"61-36=25",
-"61-37=24",
-"61-38=23",
-"61-39=22",
-"61-40=21",
-"61-41=20",
-"61-42=19",
-"61-43=18",
-"61-44=17",
-"61-45=16",
-"61-46=15",
-"61-47=14",
-"61-48=13",
-"61-49=12",
-"61-50=11",
-"61-51=10",
-"61-62=-1",
-"61-63=-2",
-"61-64=-3",
-"61-65=-4",
-"61-66=-5",
-"61-67=-6",
-"61-68=-7",
-"61-69=-8",
-"61-6*9=7",
-"61-70=-9",
-"61-7*8=5",
-"61-8*7=5",
-"61-9*6=7",
-"61*0+0=0",
-"61*0+1=1",
-"61*0+2=2",
-"61*0+3=3",
-"61*0+4=4",
-"61*0+5=5",
-"61*0+6=6",
-"61*0+7=7",
-"61*0+8=8",
-"61*0+9=9",
-"61*0-0=0",
-"61*0*0=0",
-"61*0*1=0",
-"61*0*2=0",
-"61*0*3=0",
-"61*0*4=0",
-"61*0*5=0",
-"61*0*6=0",
-"61*0*7=0",
-"61*0*8=0",
-"61*0*9=0",
-"61*0/1=0",
-"61*0/2=0",
-"61*0/3=0",
-"61*0/4=0",
-"61*0/5=0",
-"61*0/6=0",
-"61*0/7=0",
-"61*0/8=0",
-"61*0/9=0",
-"61*1*0=0",
-"61*2*0=0",
-"61*2=122",
-"61*3*0=0",
-"61*3=183",
-"61*4*0=0",
-"61*4=244",
-"61*5*0=0",
-"61*5=305",
-"61*6*0=0",
-"61*6=366",
-"61*7*0=0",
-"61*7=427",
-"61*8*0=0",
-"61*8=488",
-"61*9*0=0",
-"61*9=549",
-"61/1*0=0",
-"61/2*0=0",
-"61/3*0=0",
-"61/4*0=0",
-"61/5*0=0",
-"61/6*0=0",
-"61/7*0=0",
-"61/8*0=0",
-"61/9*0=0",
-"6200*0=0",
-"6201*0=0",
-"6202*0=0",
-"6203*0=0",
-"6204*0=0",
-"6205*0=0",
-"6206*0=0",
-"6207*0=0",
-"6208*0=0",
-"6209*0=0",
-"6210*0=0",
-"6211*0=0",
-"6212*0=0",
-"6213*0=0",
-"6214*0=0",
-"6215*0=0",
-"6216*0=0",
-"6217*0=0",
-"6218*0=0",
-"6219*0=0",
-"621/69=9",
-"621/9=69",
-"6220*0=0",
-"6221*0=0",
-"6222*0=0",
-"6223*0=0",
-"6224*0=0",
-"6225*0=0",
-"6226*0=0",
-"6227*0=0",
-"6228*0=0",
-"6229*0=0",
-"6230*0=0",
-"6231*0=0",
-"6232*0=0",
-"6233*0=0",
-"6234*0=0",
-"6235*0=0",
-"6236*0=0",
-"6237*0=0",
-"6238*0=0",
-"6239*0=0",
-"623/7=89",
-"623/89=7",
-"6240*0=0",
-"6241*0=0",
-"6242*0=0",
-"6243*0=0",
-"6244*0=0",
-"6245*0=0",
-"6246*0=0",
-"6247*0=0",
-"6248*0=0",
-"6249*0=0",
-"624/78=8",
-"624/8=78",
-"6250*0=0",
-"6251*0=0",
-"6252*0=0",
-"6253*0=0",
-"6254*0=0",
-"6255*0=0",
-"6256*0=0",
-"6257*0=0",
-"6258*0=0",
-"6259*0=0",
-"6260*0=0",
-"6261*0=0",
-"6262*0=0",
-"6263*0=0",
-"6264*0=0",
-"6265*0=0",
-"6266*0=0",
-"6267*0=0",
-"6268*0=0",
-"6269*0=0",
-"6270*0=0",
-"6271*0=0",
-"6272*0=0",
-"6273*0=0",
-"6274*0=0",
-"6275*0=0",
-"6276*0=0",
-"6277*0=0",
-"6278*0=0",
-"6279*0=0",
-"6280*0=0",
-"6281*0=0",
-"6282*0=0",
-"6283*0=0",
-"6284*0=0",
-"6285*0=0",
-"6286*0=0",
-"6287*0=0",
-"6288*0=0",
-"6289*0=0",
-"6290*0=0",
-"6291*0=0",
-"6292*0=0",
-"6293*0=0",
-"6294*0=0",
-"6295*0=0",
-"6296*0=0",
-"6297*0=0",
-"6298*0=0",
-"6299*0=0",
-"62+10=72",
-"62+11=73",
-"62+12=74",
-"62+13=75",
-"62+14=76",
-"62+15=77",
-"62+16=78",
-"62+17=79",
-"62+18=80",
-"62+19=81",
-"62+20=82",
-"62+21=83",
-"62+22=84",
-"62+23=85",
-"62+24=86",
-"62+25=87",
-"62+26=88",
-"62+27=89",
-"62+28=90",
-"62+29=91",
-"62+30=92",
-"62+31=93",
-"62+32=94",
-"62+33=95",
-"62+34=96",
-"62+35=97",
-"62+36=98",
-"62+37=99",
-"62-10=52",
-"62-11=51",
-"62-12=50",
-"62-13=49",
-"62-14=48",
-"62-15=47",
-"62-16=46",
-"62-17=45",
-"62-18=44",
-"62-19=43",
-"62-20=42",
-"62-21=41",
-"62-22=40",
-"62-23=39",
-"62-24=38",
-"62-25=37",
-"62-26=36",
-"62-27=35",
-"62-28=34",
-"62-29=33",
-"62-30=32",
-"62-31=31",
-"62-32=30",
-"62-33=29",
-"62-34=28",
-"62-35=27",
-"62-36=26",
-"62-37=25",
-"62-38=24",
-"62-39=23",
-"62-40=22",
-"62-41=21",
-"62-42=20",
-"62-43=19",
-"62-44=18",
-"62-45=17",
-"62-46=16",
-"62-47=15",
-"62-48=14",
-"62-49=13",
-"62-50=12",
-"62-51=11",
-"62-52=10",
-"62-63=-1",
-"62-64=-2",
-"62-65=-3",
-"62-66=-4",
-"62-67=-5",
-"62-68=-6",
-"62-69=-7",
-"62-6*9=8",
-"62-70=-8",
-"62-71=-9",
-"62-7*8=6",
-"62-8*7=6",
-"62-9*6=8",
-"62*0+0=0",
-"62*0+1=1",
-"62*0+2=2",
-"62*0+3=3",
-"62*0+4=4",
-"62*0+5=5",
-"62*0+6=6",
-"62*0+7=7",
-"62*0+8=8",
-"62*0+9=9",
-"62*0-0=0",
-"62*0*0=0",
-"62*0*1=0",
-"62*0*2=0",
-"62*0*3=0",
-"62*0*4=0",
-"62*0*5=0",
-"62*0*6=0",
-"62*0*7=0",
-"62*0*8=0",
-"62*0*9=0",
-"62*0/1=0",
-"62*0/2=0",
-"62*0/3=0",
-"62*0/4=0",
-"62*0/5=0",
-"62*0/6=0",
-"62*0/7=0",
-"62*0/8=0",
-"62*0/9=0",
-"62*1*0=0",
-"62*2*0=0",
-"62*2=124",
-"62*3*0=0",
-"62*3=186",
-"62*4*0=0",
-"62*4=248",
-"62*5*0=0",
-"62*5=310",
-"62*6*0=0",
-"62*6=372",
-"62*7*0=0",
-"62*7=434",
-"62*8*0=0",
-"62*8=496",
-"62*9*0=0",
-"62*9=558",
-"62/1*0=0",
-"62/2*0=0",
-"62/3*0=0",
-"62/4*0=0",
-"62/5*0=0",
-"62/6*0=0",
-"62/7*0=0",
-"62/8*0=0",
-"62/9*0=0",
-"6300*0=0",
-"6301*0=0",
-"6302*0=0",
-"6303*0=0",
-"6304*0=0",
-"6305*0=0",
-"6306*0=0",
-"6307*0=0",
-"6308*0=0",
-"6309*0=0",
-"630/70=9",
-"630/7=90",
-"630/90=7",
-"630/9=70",
-"6310*0=0",
-"6311*0=0",
-"6312*0=0",
-"6313*0=0",
-"6314*0=0",
-"6315*0=0",
-"6316*0=0",
-"6317*0=0",
-"6318*0=0",
-"6319*0=0",
-"6320*0=0",
-"6321*0=0",
-"6322*0=0",
-"6323*0=0",
-"6324*0=0",
-"6325*0=0",
-"6326*0=0",
-"6327*0=0",
-"6328*0=0",
-"6329*0=0",
-"632/79=8",
-"632/8=79",
-"6330*0=0",
-"6331*0=0",
-"6332*0=0",
-"6333*0=0",
-"6334*0=0",
-"6335*0=0",
-"6336*0=0",
-"6337*0=0",
-"6338*0=0",
-"6339*0=0",
-"6340*0=0",
-"6341*0=0",
-"6342*0=0",
-"6343*0=0",
-"6344*0=0",
-"6345*0=0",
-"6346*0=0",
-"6347*0=0",
-"6348*0=0",
-"6349*0=0",
-"6350*0=0",
-"6351*0=0",
-"6352*0=0",
-"6353*0=0",
-"6354*0=0",
-"6355*0=0",
-"6356*0=0",
-"6357*0=0",
-"6358*0=0",
-"6359*0=0",
-"6360*0=0",
-"6361*0=0",
-"6362*0=0",
-"6363*0=0",
-"6364*0=0",
-"6365*0=0",
-"6366*0=0",
-"6367*0=0",
-"6368*0=0",
-"6369*0=0",
-"6370*0=0",
-"6371*0=0",
-"6372*0=0",
-"6373*0=0",
-"6374*0=0",
-"6375*0=0",
-"6376*0=0",
-"6377*0=0",
-"6378*0=0",
-"6379*0=0",
-"637/7=91",
-"637/91=7",
-"6380*0=0",
-"6381*0=0",
-"6382*0=0",
-"6383*0=0",
-"6384*0=0",
-"6385*0=0",
-"6386*0=0",
-"6387*0=0",
-"6388*0=0",
-"6389*0=0",
-"6390*0=0",
-"6391*0=0",
-"6392*0=0",
-"6393*0=0",
-"6394*0=0",
-"6395*0=0",
-"6396*0=0",
-"6397*0=0",
-"6398*0=0",
-"6399*0=0",
-"639/71=9",
-"639/9=71",
-"63+10=73",
-"63+11=74",
-"63+12=75",
-"63+13=76",
-"63+14=77",
-"63+15=78",
-"63+16=79",
-"63+17=80",
-"63+18=81",
-"63+19=82",
-"63+20=83",
-"63+21=84",
-"63+22=85",
-"63+23=86",
-"63+24=87",
-"63+25=88",
-"63+26=89",
-"63+27=90",
-"63+28=91",
-"63+29=92",
-"63+30=93",
-"63+31=94",
-"63+32=95",
-"63+33=96",
-"63+34=97",
-"63+35=98",
-"63+36=99",
-"63-10=53",
-"63-11=52",
-"63-12=51",
-"63-13=50",
-"63-14=49",
-"63-15=48",
-"63-16=47",
-"63-17=46",
-"63-18=45",
-"63-19=44",
-"63-20=43",
-"63-21=42",
-"63-22=41",
-"63-23=40",
-"63-24=39",
-"63-25=38",
-"63-26=37",
-"63-27=36",
-"63-28=35",
-"63-29=34",
-"63-30=33",
-"63-31=32",
-"63-32=31",
-"63-33=30",
-"63-34=29",
-"63-35=28",
-"63-36=27",
-"63-37=26",
-"63-38=25",
-"63-39=24",
-"63-40=23",
-"63-41=22",
-"63-42=21",
-"63-43=20",
-"63-44=19",
-"63-45=18",
-"63-46=17",
-"63-47=16",
-"63-48=15",
-"63-49=14",
-"63-50=13",
-"63-51=12",
-"63-52=11",
-"63-53=10",
-"63-64=-1",
-"63-65=-2",
-"63-66=-3",
-"63-67=-4",
-"63-68=-5",
-"63-69=-6",
-"63-6*9=9",
-"63-70=-7",
-"63-71=-8",
-"63-72=-9",
-"63-7*8=7",
-"63-7*9=0",
-"63-8*7=7",
-"63-9*6=9",
-"63-9*7=0",
-"63*0+0=0",
-"63*0+1=1",
-"63*0+2=2",
-"63*0+3=3",
-"63*0+4=4",
-"63*0+5=5",
-"63*0+6=6",
-"63*0+7=7",
-"63*0+8=8",
-"63*0+9=9",
-"63*0-0=0",
-"63*0*0=0",
-"63*0*1=0",
-"63*0*2=0",
-"63*0*3=0",
-"63*0*4=0",
-"63*0*5=0",
-"63*0*6=0",
-"63*0*7=0",
-"63*0*8=0",
-"63*0*9=0",
-"63*0/1=0",
-"63*0/2=0",
-"63*0/3=0",
-"63*0/4=0",
-"63*0/5=0",
-"63*0/6=0",
-"63*0/7=0",
-"63*0/8=0",
-"63*0/9=0",
-"63*1*0=0",
-"63*1/7=9",
-"63*1/9=7",
-"63*2*0=0",
-"63*2=126",
-"63*3*0=0",
-"63*3=189",
-"63*4*0=0",
-"63*4=252",
-"63*5*0=0",
-"63*5=315",
-"63*6*0=0",
-"63*6=378",
-"63*7*0=0",
-"63*7=441",
-"63*8*0=0",
-"63*8=504",
-"63*9*0=0",
-"63*9=567",
-"63/1*0=0",
-"63/1/7=9",
-"63/1/9=7",
-"63/2*0=0",
-"63/3*0=0",
-"63/3/3=7",
-"63/3/7=3",
-"63/4*0=0",
-"63/5*0=0",
-"63/6*0=0",
-"63/7+0=9",
-"63/7-0=9",
-"63/7-1=8",
-"63/7-2=7",
-"63/7-3=6",
-"63/7-4=5",
-"63/7-5=4",
-"63/7-6=3",
-"63/7-7=2",
-"63/7-8=1",
-"63/7-9=0",
-"63/7*0=0",
-"63/7*1=9",
-"63/7/1=9",
-"63/7/3=3",
-"63/7/9=1",
-"63/8*0=0",
-"63/9+0=7",
-"63/9+1=8",
-"63/9+2=9",
-"63/9-0=7",
-"63/9-1=6",
-"63/9-2=5",
-"63/9-3=4",
-"63/9-4=3",
-"63/9-5=2",
-"63/9-6=1",
-"63/9-7=0",
-"63/9*0=0",
-"63/9*1=7",
-"63/9/1=7",
-"63/9/7=1",
-"6400*0=0",
-"6401*0=0",
-"6402*0=0",
-"6403*0=0",
-"6404*0=0",
-"6405*0=0",
-"6406*0=0",
-"6407*0=0",
-"6408*0=0",
-"6409*0=0",
-"640/80=8",
-"640/8=80",
-"6410*0=0",
-"6411*0=0",
-"6412*0=0",
-"6413*0=0",
-"6414*0=0",
-"6415*0=0",
-"6416*0=0",
-"6417*0=0",
-"6418*0=0",
-"6419*0=0",
-"6420*0=0",
-"6421*0=0",
-"6422*0=0",
-"6423*0=0",
-"6424*0=0",
-"6425*0=0",
-"6426*0=0",
-"6427*0=0",
-"6428*0=0",
-"6429*0=0",
-"6430*0=0",
-"6431*0=0",
-"6432*0=0",
-"6433*0=0",
-"6434*0=0",
-"6435*0=0",
-"6436*0=0",
-"6437*0=0",
-"6438*0=0",
-"6439*0=0",
-"6440*0=0",
-"6441*0=0",
-"6442*0=0",
-"6443*0=0",
-"6444*0=0",
-"6445*0=0",
-"6446*0=0",
-"6447*0=0",
-"6448*0=0",
-"6449*0=0",
-"644/7=92",
-"644/92=7",
-"6450*0=0",
-"6451*0=0",
-"6452*0=0",
-"6453*0=0",
-"6454*0=0",
-"6455*0=0",
-"6456*0=0",
-"6457*0=0",
-"6458*0=0",
-"6459*0=0",
-"6460*0=0",
-"6461*0=0",
-"6462*0=0",
-"6463*0=0",
-"6464*0=0",
-"6465*0=0",
-"6466*0=0",
-"6467*0=0",
-"6468*0=0",
-"6469*0=0",
-"6470*0=0",
-"6471*0=0",
-"6472*0=0",
-"6473*0=0",
-"6474*0=0",
-"6475*0=0",
-"6476*0=0",
-"6477*0=0",
-"6478*0=0",
-"6479*0=0",
-"6480*0=0",
-"6481*0=0",
-"6482*0=0",
-"6483*0=0",
-"6484*0=0",
-"6485*0=0",
-"6486*0=0",
-"6487*0=0",
-"6488*0=0",
-"6489*0=0",
-"648/72=9",
-"648/81=8",
-"648/8=81",
-"648/9=72",
-"6490*0=0",
-"6491*0=0",
-"6492*0=0",
-"6493*0=0",
-"6494*0=0",
-"6495*0=0",
-"6496*0=0",
-"6497*0=0",
-"6498*0=0",
-"6499*0=0",
-"64+10=74",
-"64+11=75",
-"64+12=76",
-"64+13=77",
-"64+14=78",
-"64+15=79",
-"64+16=80",
-"64+17=81",
-"64+18=82",
-"64+19=83",
-"64+20=84",
-"64+21=85",
-"64+22=86",
-"64+23=87",
-"64+24=88",
-"64+25=89",
-"64+26=90",
-"64+27=91",
-"64+28=92",
-"64+29=93",
-"64+30=94",
-"64+31=95",
-"64+32=96",
-"64+33=97",
-"64+34=98",
-"64+35=99",
-"64-10=54",
-"64-11=53",
-"64-12=52",
-"64-13=51",
-"64-14=50",
-"64-15=49",
-"64-16=48",
-"64-17=47",
-"64-18=46",
-"64-19=45",
-"64-20=44",
-"64-21=43",
-"64-22=42",
-"64-23=41",
-"64-24=40",
-"64-25=39",
-"64-26=38",
-"64-27=37",
-"64-28=36",
-"64-29=35",
-"64-30=34",
-"64-31=33",
-"64-32=32",
-"64-33=31",
-"64-34=30",
-"64-35=29",
-"64-36=28",
-"64-37=27",
-"64-38=26",
-"64-39=25",
-"64-40=24",
-"64-41=23",
-"64-42=22",
-"64-43=21",
-"64-44=20",
-"64-45=19",
-"64-46=18",
-"64-47=17",
-"64-48=16",
-"64-49=15",
-"64-50=14",
-"64-51=13",
-"64-52=12",
-"64-53=11",
-"64-54=10",
-"64-65=-1",
-"64-66=-2",
-"64-67=-3",
-"64-68=-4",
-"64-69=-5",
-"64-70=-6",
-"64-71=-7",
-"64-72=-8",
-"64-73=-9",
-"64-7*8=8",
-"64-7*9=1",
-"64-8*7=8",
-"64-8*8=0",
-"64-9*7=1",
-"64*0+0=0",
-"64*0+1=1",
-"64*0+2=2",
-"64*0+3=3",
-"64*0+4=4",
-"64*0+5=5",
-"64*0+6=6",
-"64*0+7=7",
-"64*0+8=8",
-"64*0+9=9",
-"64*0-0=0",
-"64*0*0=0",
-"64*0*1=0",
-"64*0*2=0",
-"64*0*3=0",
-"64*0*4=0",
-"64*0*5=0",
-"64*0*6=0",
-"64*0*7=0",
-"64*0*8=0",
-"64*0*9=0",
-"64*0/1=0",
-"64*0/2=0",
-"64*0/3=0",
-"64*0/4=0",
-"64*0/5=0",
-"64*0/6=0",
-"64*0/7=0",
-"64*0/8=0",
-"64*0/9=0",
-"64*1*0=0",
-"64*1/8=8",
-"64*2*0=0",
-"64*2=128",
-"64*3*0=0",
-"64*3=192",
-"64*4*0=0",
-"64*4=256",
-"64*5*0=0",
-"64*5=320",
-"64*6*0=0",
-"64*6=384",
-"64*7*0=0",
-"64*7=448",
-"64*8*0=0",
-"64*8=512",
-"64*9*0=0",
-"64*9=576",
-"64/1*0=0",
-"64/1/8=8",
-"64/2*0=0",
-"64/2/4=8",
-"64/2/8=4",
-"64/3*0=0",
-"64/4-7=9",
-"64/4-8=8",
-"64/4-9=7",
-"64/4*0=0",
-"64/4/2=8",
-"64/4/4=4",
-"64/4/8=2",
-"64/5*0=0",
-"64/6*0=0",
-"64/7*0=0",
-"64/8+0=8",
-"64/8+1=9",
-"64/8-0=8",
-"64/8-1=7",
-"64/8-2=6",
-"64/8-3=5",
-"64/8-4=4",
-"64/8-5=3",
-"64/8-6=2",
-"64/8-7=1",
-"64/8-8=0",
-"64/8*0=0",
-"64/8*1=8",
-"64/8/1=8",
-"64/8/2=4",
-"64/8/4=2",
-"64/8/8=1",
-"64/9*0=0",
-"6500*0=0",
-"6501*0=0",
-"6502*0=0",
-"6503*0=0",
-"6504*0=0",
-"6505*0=0",
-"6506*0=0",
-"6507*0=0",
-"6508*0=0",
-"6509*0=0",
-"6510*0=0",
-"6511*0=0",
-"6512*0=0",
-"6513*0=0",
-"6514*0=0",
-"6515*0=0",
-"6516*0=0",
-"6517*0=0",
-"6518*0=0",
-"6519*0=0",
-"651/7=93",
-"651/93=7",
-"6520*0=0",
-"6521*0=0",
-"6522*0=0",
-"6523*0=0",
-"6524*0=0",
-"6525*0=0",
-"6526*0=0",
-"6527*0=0",
-"6528*0=0",
-"6529*0=0",
-"6530*0=0",
-"6531*0=0",
-"6532*0=0",
-"6533*0=0",
-"6534*0=0",
-"6535*0=0",
-"6536*0=0",
-"6537*0=0",
-"6538*0=0",
-"6539*0=0",
-"6540*0=0",
-"6541*0=0",
-"6542*0=0",
-"6543*0=0",
-"6544*0=0",
-"6545*0=0",
-"6546*0=0",
-"6547*0=0",
-"6548*0=0",
-"6549*0=0",
-"6550*0=0",
-"6551*0=0",
-"6552*0=0",
-"6553*0=0",
-"6554*0=0",
-"6555*0=0",
-"6556*0=0",
-"6557*0=0",
-"6558*0=0",
-"6559*0=0",
-"6560*0=0",
-"6561*0=0",
-"6562*0=0",
-"6563*0=0",
-"6564*0=0",
-"6565*0=0",
-"6566*0=0",
-"6567*0=0",
-"6568*0=0",
-"6569*0=0",
-"656/82=8",
-"656/8=82",
-"6570*0=0",
-"6571*0=0",
-"6572*0=0",
-"6573*0=0",
-"6574*0=0",
-"6575*0=0",
-"6576*0=0",
-"6577*0=0",
-"6578*0=0",
-"6579*0=0",
-"657/73=9",
-"657/9=73",
-"6580*0=0",
-"6581*0=0",
-"6582*0=0",
-"6583*0=0",
-"6584*0=0",
-"6585*0=0",
-"6586*0=0",
-"6587*0=0",
-"6588*0=0",
-"6589*0=0",
-"658/7=94",
-"658/94=7",
-"6590*0=0",
-"6591*0=0",
-"6592*0=0",
-"6593*0=0",
-"6594*0=0",
-"6595*0=0",
-"6596*0=0",
-"6597*0=0",
-"6598*0=0",
-"6599*0=0",
-"65+10=75",
-"65+11=76",
-"65+12=77",
-"65+13=78",
-"65+14=79",
-"65+15=80",
-"65+16=81",
-"65+17=82",
-"65+18=83",
-"65+19=84",
-"65+20=85",
-"65+21=86",
-"65+22=87",
-"65+23=88",
-"65+24=89",
-"65+25=90",
-"65+26=91",
-"65+27=92",
-"65+28=93",
-"65+29=94",
-"65+30=95",
-"65+31=96",
-"65+32=97",
-"65+33=98",
-"65+34=99",
-"65-10=55",
-"65-11=54",
-"65-12=53",
-"65-13=52",
-"65-14=51",
-"65-15=50",
-"65-16=49",
-"65-17=48",
-"65-18=47",
-"65-19=46",
-"65-20=45",
-"65-21=44",
-"65-22=43",
-"65-23=42",
-"65-24=41",
-"65-25=40",
-"65-26=39",
-"65-27=38",
-"65-28=37",
-"65-29=36",
-"65-30=35",
-"65-31=34",
-"65-32=33",
-"65-33=32",
-"65-34=31",
-"65-35=30",
-"65-36=29",
-"65-37=28",
-"65-38=27",
-"65-39=26",
-"65-40=25",
-"65-41=24",
-"65-42=23",
-"65-43=22",
-"65-44=21",
-"65-45=20",
-"65-46=19",
-"65-47=18",
-"65-48=17",
-"65-49=16",
-"65-50=15",
-"65-51=14",
-"65-52=13",
-"65-53=12",
-"65-54=11",
-"65-55=10",
-"65-66=-1",
-"65-67=-2",
-"65-68=-3",
-"65-69=-4",
-"65-70=-5",
-"65-71=-6",
-"65-72=-7",
-"65-73=-8",
-"65-74=-9",
-"65-7*8=9",
-"65-7*9=2",
-"65-8*7=9",
-"65-8*8=1",
-"65-9*7=2",
-"65*0+0=0",
-"65*0+1=1",
-"65*0+2=2",
-"65*0+3=3",
-"65*0+4=4",
-"65*0+5=5",
-"65*0+6=6",
-"65*0+7=7",
-"65*0+8=8",
-"65*0+9=9",
-"65*0-0=0",
-"65*0*0=0",
-"65*0*1=0",
-"65*0*2=0",
-"65*0*3=0",
-"65*0*4=0",
-"65*0*5=0",
-"65*0*6=0",
-"65*0*7=0",
-"65*0*8=0",
-"65*0*9=0",
-"65*0/1=0",
-"65*0/2=0",
-"65*0/3=0",
-"65*0/4=0",
-"65*0/5=0",
-"65*0/6=0",
-"65*0/7=0",
-"65*0/8=0",
-"65*0/9=0",
-"65*1*0=0",
-"65*2*0=0",
-"65*2=130",
-"65*3*0=0",
-"65*3=195",
-"65*4*0=0",
-"65*4=260",
-"65*5*0=0",
-"65*5=325",
-"65*6*0=0",
-"65*6=390",
-"65*7*0=0",
-"65*7=455",
-"65*8*0=0",
-"65*8=520",
-"65*9*0=0",
-"65*9=585",
-"65/1*0=0",
-"65/2*0=0",
-"65/3*0=0",
-"65/4*0=0",
-"65/5-4=9",
-"65/5-5=8",
-"65/5-6=7",
-"65/5-7=6",
-"65/5-8=5",
-"65/5-9=4",
-"65/5*0=0",
-"65/6*0=0",
-"65/7*0=0",
-"65/8*0=0",
-"65/9*0=0",
-"6600*0=0",
-"6601*0=0",
-"6602*0=0",
-"6603*0=0",
-"6604*0=0",
-"6605*0=0",
-"6606*0=0",
-"6607*0=0",
-"6608*0=0",
-"6609*0=0",
-"6610*0=0",
-"6611*0=0",
-"6612*0=0",
-"6613*0=0",
-"6614*0=0",
-"6615*0=0",
-"6616*0=0",
-"6617*0=0",
-"6618*0=0",
-"6619*0=0",
-"6620*0=0",
-"6621*0=0",
-"6622*0=0",
-"6623*0=0",
-"6624*0=0",
-"6625*0=0",
-"6626*0=0",
-"6627*0=0",
-"6628*0=0",
-"6629*0=0",
-"6630*0=0",
-"6631*0=0",
-"6632*0=0",
-"6633*0=0",
-"6634*0=0",
-"6635*0=0",
-"6636*0=0",
-"6637*0=0",
-"6638*0=0",
-"6639*0=0",
-"6640*0=0",
-"6641*0=0",
-"6642*0=0",
-"6643*0=0",
-"6644*0=0",
-"6645*0=0",
-"6646*0=0",
-"6647*0=0",
-"6648*0=0",
-"6649*0=0",
-"664/83=8",
-"664/8=83",
-"6650*0=0",
-"6651*0=0",
-"6652*0=0",
-"6653*0=0",
-"6654*0=0",
-"6655*0=0",
-"6656*0=0",
-"6657*0=0",
-"6658*0=0",
-"6659*0=0",
-"665/7=95",
-"665/95=7",
-"6660*0=0",
-"6661*0=0",
-"6662*0=0",
-"6663*0=0",
-"6664*0=0",
-"6665*0=0",
-"6666*0=0",
-"6667*0=0",
-"6668*0=0",
-"6669*0=0",
-"666/74=9",
-"666/9=74",
-"6670*0=0",
-"6671*0=0",
-"6672*0=0",
-"6673*0=0",
-"6674*0=0",
-"6675*0=0",
-"6676*0=0",
-"6677*0=0",
-"6678*0=0",
-"6679*0=0",
-"6680*0=0",
-"6681*0=0",
-"6682*0=0",
-"6683*0=0",
-"6684*0=0",
-"6685*0=0",
-"6686*0=0",
-"6687*0=0",
-"6688*0=0",
-"6689*0=0",
-"6690*0=0",
-"6691*0=0",
-"6692*0=0",
-"6693*0=0",
-"6694*0=0",
-"6695*0=0",
-"6696*0=0",
-"6697*0=0",
-"6698*0=0",
-"6699*0=0",
-"66+10=76",
-"66+11=77",
-"66+12=78",
-"66+13=79",
-"66+14=80",
-"66+15=81",
-"66+16=82",
-"66+17=83",
-"66+18=84",
-"66+19=85",
-"66+20=86",
-"66+21=87",
-"66+22=88",
-"66+23=89",
-"66+24=90",
-"66+25=91",
-"66+26=92",
-"66+27=93",
-"66+28=94",
-"66+29=95",
-"66+30=96",
-"66+31=97",
-"66+32=98",
-"66+33=99",
-"66-10=56",
-"66-11=55",
-"66-12=54",
-"66-13=53",
-"66-14=52",
-"66-15=51",
-"66-16=50",
-"66-17=49",
-"66-18=48",
-"66-19=47",
-"66-20=46",
-"66-21=45",
-"66-22=44",
-"66-23=43",
-"66-24=42",
-"66-25=41",
-"66-26=40",
-"66-27=39",
-"66-28=38",
-"66-29=37",
-"66-30=36",
-"66-31=35",
-"66-32=34",
-"66-33=33",
-"66-34=32",
-"66-35=31",
-"66-36=30",
-"66-37=29",
-"66-38=28",
-"66-39=27",
-"66-40=26",
-"66-41=25",
-"66-42=24",
-"66-43=23",
-"66-44=22",
-"66-45=21",
-"66-46=20",
-"66-47=19",
-"66-48=18",
-"66-49=17",
-"66-50=16",
-"66-51=15",
-"66-52=14",
-"66-53=13",
-"66-54=12",
-"66-55=11",
-"66-56=10",
-"66-67=-1",
-"66-68=-2",
-"66-69=-3",
-"66-70=-4",
-"66-71=-5",
-"66-72=-6",
-"66-73=-7",
-"66-74=-8",
-"66-75=-9",
-"66-7*9=3",
-"66-8*8=2",
-"66-9*7=3",
-"66*0+0=0",
-"66*0+1=1",
-"66*0+2=2",
-"66*0+3=3",
-"66*0+4=4",
-"66*0+5=5",
-"66*0+6=6",
-"66*0+7=7",
-"66*0+8=8",
-"66*0+9=9",
-"66*0-0=0",
-"66*0*0=0",
-"66*0*1=0",
-"66*0*2=0",
-"66*0*3=0",
-"66*0*4=0",
-"66*0*5=0",
-"66*0*6=0",
-"66*0*7=0",
-"66*0*8=0",
-"66*0*9=0",
-"66*0/1=0",
-"66*0/2=0",
-"66*0/3=0",
-"66*0/4=0",
-"66*0/5=0",
-"66*0/6=0",
-"66*0/7=0",
-"66*0/8=0",
-"66*0/9=0",
-"66*1*0=0",
-"66*2*0=0",
-"66*2=132",
-"66*3*0=0",
-"66*3=198",
-"66*4*0=0",
-"66*4=264",
-"66*5*0=0",
-"66*5=330",
-"66*6*0=0",
-"66*6=396",
-"66*7*0=0",
-"66*7=462",
-"66*8*0=0",
-"66*8=528",
-"66*9*0=0",
-"66*9=594",
-"66/1*0=0",
-"66/2*0=0",
-"66/3*0=0",
-"66/4*0=0",
-"66/5*0=0",
-"66/6-2=9",
-"66/6-3=8",
-"66/6-4=7",
-"66/6-5=6",
-"66/6-6=5",
-"66/6-7=4",
-"66/6-8=3",
-"66/6-9=2",
-"66/6*0=0",
-"66/7*0=0",
-"66/8*0=0",
-"66/9*0=0",
-"6700*0=0",
-"6701*0=0",
-"6702*0=0",
-"6703*0=0",
-"6704*0=0",
-"6705*0=0",
-"6706*0=0",
-"6707*0=0",
-"6708*0=0",
-"6709*0=0",
-"6710*0=0",
-"6711*0=0",
-"6712*0=0",
-"6713*0=0",
-"6714*0=0",
-"6715*0=0",
-"6716*0=0",
-"6717*0=0",
-"6718*0=0",
-"6719*0=0",
-"6720*0=0",
-"6721*0=0",
-"6722*0=0",
-"6723*0=0",
-"6724*0=0",
-"6725*0=0",
-"6726*0=0",
-"6727*0=0",
-"6728*0=0",
-"6729*0=0",
-"672/7=96",
-"672/84=8",
-"672/8=84",
-"672/96=7",
-"6730*0=0",
-"6731*0=0",
-"6732*0=0",
-"6733*0=0",
-"6734*0=0",
-"6735*0=0",
-"6736*0=0",
-"6737*0=0",
-"6738*0=0",
-"6739*0=0",
-"6740*0=0",
-"6741*0=0",
-"6742*0=0",
-"6743*0=0",
-"6744*0=0",
-"6745*0=0",
-"6746*0=0",
-"6747*0=0",
-"6748*0=0",
-"6749*0=0",
-"6750*0=0",
-"6751*0=0",
-"6752*0=0",
-"6753*0=0",
-"6754*0=0",
-"6755*0=0",
-"6756*0=0",
-"6757*0=0",
-"6758*0=0",
-"6759*0=0",
-"675/75=9",
-"675/9=75",
-"6760*0=0",
-"6761*0=0",
-"6762*0=0",
-"6763*0=0",
-"6764*0=0",
-"6765*0=0",
-"6766*0=0",
-"6767*0=0",
-"6768*0=0",
-"6769*0=0",
-"6770*0=0",
-"6771*0=0",
-"6772*0=0",
-"6773*0=0",
-"6774*0=0",
-"6775*0=0",
-"6776*0=0",
-"6777*0=0",
-"6778*0=0",
-"6779*0=0",
-"6780*0=0",
-"6781*0=0",
-"6782*0=0",
-"6783*0=0",
-"6784*0=0",
-"6785*0=0",
-"6786*0=0",
-"6787*0=0",
-"6788*0=0",
-"6789*0=0",
-"6790*0=0",
-"6791*0=0",
-"6792*0=0",
-"6793*0=0",
-"6794*0=0",
-"6795*0=0",
-"6796*0=0",
-"6797*0=0",
-"6798*0=0",
-"6799*0=0",
-"679/7=97",
-"679/97=7",
-"67+10=77",
-"67+11=78",
-"67+12=79",
-"67+13=80",
-"67+14=81",
-"67+15=82",
-"67+16=83",
-"67+17=84",
-"67+18=85",
-"67+19=86",
-"67+20=87",
-"67+21=88",
-"67+22=89",
-"67+23=90",
-"67+24=91",
-"67+25=92",
-"67+26=93",
-"67+27=94",
-"67+28=95",
-"67+29=96",
-"67+30=97",
-"67+31=98",
-"67+32=99",
-"67-10=57",
-"67-11=56",
-"67-12=55",
-"67-13=54",
-"67-14=53",
-"67-15=52",
-"67-16=51",
-"67-17=50",
-"67-18=49",
-"67-19=48",
-"67-20=47",
-"67-21=46",
-"67-22=45",
-"67-23=44",
-"67-24=43",
-"67-25=42",
-"67-26=41",
-"67-27=40",
-"67-28=39",
-"67-29=38",
-"67-30=37",
-"67-31=36",
-"67-32=35",
-"67-33=34",
-"67-34=33",
-"67-35=32",
-"67-36=31",
-"67-37=30",
-"67-38=29",
-"67-39=28",
-"67-40=27",
-"67-41=26",
-"67-42=25",
-"67-43=24",
-"67-44=23",
-"67-45=22",
-"67-46=21",
-"67-47=20",
-"67-48=19",
-"67-49=18",
-"67-50=17",
-"67-51=16",
-"67-52=15",
-"67-53=14",
-"67-54=13",
-"67-55=12",
-"67-56=11",
-"67-57=10",
-"67-68=-1",
-"67-69=-2",
-"67-70=-3",
-"67-71=-4",
-"67-72=-5",
-"67-73=-6",
-"67-74=-7",
-"67-75=-8",
-"67-76=-9",
-"67-7*9=4",
-"67-8*8=3",
-"67-9*7=4",
-"67*0+0=0",
-"67*0+1=1",
-"67*0+2=2",
-"67*0+3=3",
-"67*0+4=4",
-"67*0+5=5",
-"67*0+6=6",
-"67*0+7=7",
-"67*0+8=8",
-"67*0+9=9",
-"67*0-0=0",
-"67*0*0=0",
-"67*0*1=0",
-"67*0*2=0",
-"67*0*3=0",
-"67*0*4=0",
-"67*0*5=0",
-"67*0*6=0",
-"67*0*7=0",
-"67*0*8=0",
-"67*0*9=0",
-"67*0/1=0",
-"67*0/2=0",
-"67*0/3=0",
-"67*0/4=0",
-"67*0/5=0",
-"67*0/6=0",
-"67*0/7=0",
-"67*0/8=0",
-"67*0/9=0",
-"67*1*0=0",
-"67*2*0=0",
-"67*2=134",
-"67*3*0=0",
-"67*3=201",
-"67*4*0=0",
-"67*4=268",
-"67*5*0=0",
-"67*5=335",
-"67*6*0=0",
-"67*6=402",
-"67*7*0=0",
-"67*7=469",
-"67*8*0=0",
-"67*8=536",
-"67*9*0=0",
-"67*9=603",
-"67/1*0=0",
-"67/2*0=0",
-"67/3*0=0",
-"67/4*0=0",
-"67/5*0=0",
-"67/6*0=0",
-"67/7*0=0",
-"67/8*0=0",
-"67/9*0=0",
-"6800*0=0",
-"6801*0=0",
-"6802*0=0",
-"6803*0=0",
-"6804*0=0",
-"6805*0=0",
-"6806*0=0",
-"6807*0=0",
-"6808*0=0",
-"6809*0=0",
-"680/85=8",
-"680/8=85",
-"6810*0=0",
-"6811*0=0",
-"6812*0=0",
-"6813*0=0",
-"6814*0=0",
-"6815*0=0",
-"6816*0=0",
-"6817*0=0",
-"6818*0=0",
-"6819*0=0",
-"6820*0=0",
-"6821*0=0",
-"6822*0=0",
-"6823*0=0",
-"6824*0=0",
-"6825*0=0",
-"6826*0=0",
-"6827*0=0",
-"6828*0=0",
-"6829*0=0",
-"6830*0=0",
-"6831*0=0",
-"6832*0=0",
-"6833*0=0",
-"6834*0=0",
-"6835*0=0",
-"6836*0=0",
-"6837*0=0",
-"6838*0=0",
-"6839*0=0",
-"6840*0=0",
-"6841*0=0",
-"6842*0=0",
-"6843*0=0",
-"6844*0=0",
-"6845*0=0",
-"6846*0=0",
-"6847*0=0",
-"6848*0=0",
-"6849*0=0",
-"684/76=9",
-"684/9=76",
-"6850*0=0",
-"6851*0=0",
-"6852*0=0",
-"6853*0=0",
-"6854*0=0",
-"6855*0=0",
-"6856*0=0",
-"6857*0=0",
-"6858*0=0",
-"6859*0=0",
-"6860*0=0",
-"6861*0=0",
-"6862*0=0",
-"6863*0=0",
-"6864*0=0",
-"6865*0=0",
-"6866*0=0",
-"6867*0=0",
-"6868*0=0",
-"6869*0=0",
-"686/7=98",
-"686/98=7",
-"6870*0=0",
-"6871*0=0",
-"6872*0=0",
-"6873*0=0",
-"6874*0=0",
-"6875*0=0",
-"6876*0=0",
-"6877*0=0",
-"6878*0=0",
-"6879*0=0",
-"6880*0=0",
-"6881*0=0",
-"6882*0=0",
-"6883*0=0",
-"6884*0=0",
-"6885*0=0",
-"6886*0=0",
-"6887*0=0",
-"6888*0=0",
-"6889*0=0",
-"688/86=8",
-"688/8=86",
-"6890*0=0",
-"6891*0=0",
-"6892*0=0",
-"6893*0=0",
-"6894*0=0",
-"6895*0=0",
-"6896*0=0",
-"6897*0=0",
-"6898*0=0",
-"6899*0=0",
-"68+10=78",
-"68+11=79",
-"68+12=80",
-"68+13=81",
-"68+14=82",
-"68+15=83",
-"68+16=84",
-"68+17=85",
-"68+18=86",
-"68+19=87",
-"68+20=88",
-"68+21=89",
-"68+22=90",
-"68+23=91",
-"68+24=92",
-"68+25=93",
-"68+26=94",
-"68+27=95",
-"68+28=96",
-"68+29=97",
-"68+30=98",
-"68+31=99",
-"68-10=58",
-"68-11=57",
-"68-12=56",
-"68-13=55",
-"68-14=54",
-"68-15=53",
-"68-16=52",
-"68-17=51",
-"68-18=50",
-"68-19=49",
-"68-20=48",
-"68-21=47",
-"68-22=46",
-"68-23=45",
-"68-24=44",
-"68-25=43",
-"68-26=42",
-"68-27=41",
-"68-28=40",
-"68-29=39",
-"68-30=38",
-"68-31=37",
-"68-32=36",
-"68-33=35",
-"68-34=34",
-"68-35=33",
-"68-36=32",
-"68-37=31",
-"68-38=30",
-"68-39=29",
-"68-40=28",
-"68-41=27",
-"68-42=26",
-"68-43=25",
-"68-44=24",
-"68-45=23",
-"68-46=22",
-"68-47=21",
-"68-48=20",
-"68-49=19",
-"68-50=18",
-"68-51=17",
-"68-52=16",
-"68-53=15",
-"68-54=14",
-"68-55=13",
-"68-56=12",
-"68-57=11",
-"68-58=10",
-"68-69=-1",
-"68-70=-2",
-"68-71=-3",
-"68-72=-4",
-"68-73=-5",
-"68-74=-6",
-"68-75=-7",
-"68-76=-8",
-"68-77=-9",
-"68-7*9=5",
-"68-8*8=4",
-"68-9*7=5",
-"68*0+0=0",
-"68*0+1=1",
-"68*0+2=2",
-"68*0+3=3",
-"68*0+4=4",
-"68*0+5=5",
-"68*0+6=6",
-"68*0+7=7",
-"68*0+8=8",
-"68*0+9=9",
-"68*0-0=0",
-"68*0*0=0",
-"68*0*1=0",
-"68*0*2=0",
-"68*0*3=0",
-"68*0*4=0",
-"68*0*5=0",
-"68*0*6=0",
-"68*0*7=0",
-"68*0*8=0",
-"68*0*9=0",
-"68*0/1=0",
-"68*0/2=0",
-"68*0/3=0",
-"68*0/4=0",
-"68*0/5=0",
-"68*0/6=0",
-"68*0/7=0",
-"68*0/8=0",
-"68*0/9=0",
-"68*1*0=0",
-"68*2*0=0",
-"68*2=136",
-"68*3*0=0",
-"68*3=204",
-"68*4*0=0",
-"68*4=272",
-"68*5*0=0",
-"68*5=340",
-"68*6*0=0",
-"68*6=408",
-"68*7*0=0",
-"68*7=476",
-"68*8*0=0",
-"68*8=544",
-"68*9*0=0",
-"68*9=612",
-"68/1*0=0",
-"68/2*0=0",
-"68/3*0=0",
-"68/4-8=9",
-"68/4-9=8",
-"68/4*0=0",
-"68/5*0=0",
-"68/6*0=0",
-"68/7*0=0",
-"68/8*0=0",
-"68/9*0=0",
-"6900*0=0",
-"6901*0=0",
-"6902*0=0",
-"6903*0=0",
-"6904*0=0",
-"6905*0=0",
-"6906*0=0",
-"6907*0=0",
-"6908*0=0",
-"6909*0=0",
-"6910*0=0",
-"6911*0=0",
-"6912*0=0",
-"6913*0=0",
-"6914*0=0",
-"6915*0=0",
-"6916*0=0",
-"6917*0=0",
-"6918*0=0",
-"6919*0=0",
-"6920*0=0",
-"6921*0=0",
-"6922*0=0",
-"6923*0=0",
-"6924*0=0",
-"6925*0=0",
-"6926*0=0",
-"6927*0=0",
-"6928*0=0",
-"6929*0=0",
-"6930*0=0",
-"6931*0=0",
-"6932*0=0",
-"6933*0=0",
-"6934*0=0",
-"6935*0=0",
-"6936*0=0",
-"6937*0=0",
-"6938*0=0",
-"6939*0=0",
-"693/77=9",
-"693/7=99",
-"693/99=7",
-"693/9=77",
-"6940*0=0",
-"6941*0=0",
-"6942*0=0",
-"6943*0=0",
-"6944*0=0",
-"6945*0=0",
-"6946*0=0",
-"6947*0=0",
-"6948*0=0",
-"6949*0=0",
-"6950*0=0",
-"6951*0=0",
-"6952*0=0",
-"6953*0=0",
-"6954*0=0",
-"6955*0=0",
-"6956*0=0",
-"6957*0=0",
-"6958*0=0",
-"6959*0=0",
-"6960*0=0",
-"6961*0=0",
-"6962*0=0",
-"6963*0=0",
-"6964*0=0",
-"6965*0=0",
-"6966*0=0",
-"6967*0=0",
-"6968*0=0",
-"6969*0=0",
-"696/87=8",
-"696/8=87",
-"6970*0=0",
-"6971*0=0",
-"6972*0=0",
-"6973*0=0",
-"6974*0=0",
-"6975*0=0",
-"6976*0=0",
-"6977*0=0",
-"6978*0=0",
-"6979*0=0",
-"6980*0=0",
-"6981*0=0",
-"6982*0=0",
-"6983*0=0",
-"6984*0=0",
-"6985*0=0",
-"6986*0=0",
-"6987*0=0",
-"6988*0=0",
-"6989*0=0",
-"6990*0=0",
-"6991*0=0",
-"6992*0=0",
-"6993*0=0",
-"6994*0=0",
-"6995*0=0",
-"6996*0=0",
-"6997*0=0",
-"6998*0=0",
-"6999*0=0",
-"69+10=79",
-"69+11=80",
-"69+12=81",
-"69+13=82",
-"69+14=83",
-"69+15=84",
-"69+16=85",
-"69+17=86",
-"69+18=87",
-"69+19=88",
-"69+20=89",
-"69+21=90",
-"69+22=91",
-"69+23=92",
-"69+24=93",
-"69+25=94",
-"69+26=95",
-"69+27=96",
-"69+28=97",
-"69+29=98",
-"69+30=99",
-"69-10=59",
-"69-11=58",
-"69-12=57",
-"69-13=56",
-"69-14=55",
-"69-15=54",
-"69-16=53",
-"69-17=52",
-"69-18=51",
-"69-19=50",
-"69-20=49",
-"69-21=48",
-"69-22=47",
-"69-23=46",
-"69-24=45",
-"69-25=44",
-"69-26=43",
-"69-27=42",
-"69-28=41",
-"69-29=40",
-"69-30=39",
-"69-31=38",
-"69-32=37",
-"69-33=36",
-"69-34=35",
-"69-35=34",
-"69-36=33",
-"69-37=32",
-"69-38=31",
-"69-39=30",
-"69-40=29",
-"69-41=28",
-"69-42=27",
-"69-43=26",
-"69-44=25",
-"69-45=24",
-"69-46=23",
-"69-47=22",
-"69-48=21",
-"69-49=20",
-"69-50=19",
-"69-51=18",
-"69-52=17",
-"69-53=16",
-"69-54=15",
-"69-55=14",
-"69-56=13",
-"69-57=12",
-"69-58=11",
-"69-59=10",
-"69-70=-1",
-"69-71=-2",
-"69-72=-3",
-"69-73=-4",
-"69-74=-5",
-"69-75=-6",
-"69-76=-7",
-"69-77=-8",
-"69-78=-9",
-"69-7*9=6",
-"69-8*8=5",
-"69-9*7=6",
-"69*0+0=0",
-"69*0+1=1",
-"69*0+2=2",
-"69*0+3=3",
-"69*0+4=4",
-"69*0+5=5",
-"69*0+6=6",
-"69*0+7=7",
-"69*0+8=8",
-"69*0+9=9",
-"69*0-0=0",
-"69*0*0=0",
-"69*0*1=0",
-"69*0*2=0",
-"69*0*3=0",
-"69*0*4=0",
-"69*0*5=0",
-"69*0*6=0",
-"69*0*7=0",
-"69*0*8=0",
-"69*0*9=0",
-"69*0/1=0",
-"69*0/2=0",
-"69*0/3=0",
-"69*0/4=0",
-"69*0/5=0",
-"69*0/6=0",
-"69*0/7=0",
-"69*0/8=0",
-"69*0/9=0",
-"69*1*0=0",
-"69*2*0=0",
-"69*2=138",
-"69*3*0=0",
-"69*3=207",
-"69*4*0=0",
-"69*4=276",
-"69*5*0=0",
-"69*5=345",
-"69*6*0=0",
-"69*6=414",
-"69*7*0=0",
-"69*7=483",
-"69*8*0=0",
-"69*8=552",
-"69*9*0=0",
-"69*9=621",
-"69/1*0=0",
-"69/2*0=0",
-"69/3*0=0",
-"69/4*0=0",
-"69/5*0=0",
-"69/6*0=0",
-"69/7*0=0",
-"69/8*0=0",
-"69/9*0=0",
-"6+0+4=10",
-"6+0+5=11",
-"6+0+6=12",
-"6+0+7=13",
-"6+0+8=14",
-"6+0+9=15",
-"6+0-7=-1",
-"6+0-8=-2",
-"6+0-9=-3",
-"6+0*10=6",
-"6+0*11=6",
-"6+0*12=6",
-"6+0*13=6",
-"6+0*14=6",
-"6+0*15=6",
-"6+0*16=6",
-"6+0*17=6",
-"6+0*18=6",
-"6+0*19=6",
-"6+0*20=6",
-"6+0*21=6",
-"6+0*22=6",
-"6+0*23=6",
-"6+0*24=6",
-"6+0*25=6",
-"6+0*26=6",
-"6+0*27=6",
-"6+0*28=6",
-"6+0*29=6",
-"6+0*30=6",
-"6+0*31=6",
-"6+0*32=6",
-"6+0*33=6",
-"6+0*34=6",
-"6+0*35=6",
-"6+0*36=6",
-"6+0*37=6",
-"6+0*38=6",
-"6+0*39=6",
-"6+0*40=6",
-"6+0*41=6",
-"6+0*42=6",
-"6+0*43=6",
-"6+0*44=6",
-"6+0*45=6",
-"6+0*46=6",
-"6+0*47=6",
-"6+0*48=6",
-"6+0*49=6",
-"6+0*50=6",
-"6+0*51=6",
-"6+0*52=6",
-"6+0*53=6",
-"6+0*54=6",
-"6+0*55=6",
-"6+0*56=6",
-"6+0*57=6",
-"6+0*58=6",
-"6+0*59=6",
-"6+0*60=6",
-"6+0*61=6",
-"6+0*62=6",
-"6+0*63=6",
-"6+0*64=6",
-"6+0*65=6",
-"6+0*66=6",
-"6+0*67=6",
-"6+0*68=6",
-"6+0*69=6",
-"6+0*70=6",
-"6+0*71=6",
-"6+0*72=6",
-"6+0*73=6",
-"6+0*74=6",
-"6+0*75=6",
-"6+0*76=6",
-"6+0*77=6",
-"6+0*78=6",
-"6+0*79=6",
-"6+0*80=6",
-"6+0*81=6",
-"6+0*82=6",
-"6+0*83=6",
-"6+0*84=6",
-"6+0*85=6",
-"6+0*86=6",
-"6+0*87=6",
-"6+0*88=6",
-"6+0*89=6",
-"6+0*90=6",
-"6+0*91=6",
-"6+0*92=6",
-"6+0*93=6",
-"6+0*94=6",
-"6+0*95=6",
-"6+0*96=6",
-"6+0*97=6",
-"6+0*98=6",
-"6+0*99=6",
-"6+0/10=6",
-"6+0/11=6",
-"6+0/12=6",
-"6+0/13=6",
-"6+0/14=6",
-"6+0/15=6",
-"6+0/16=6",
-"6+0/17=6",
-"6+0/18=6",
-"6+0/19=6",
-"6+0/20=6",
-"6+0/21=6",
-"6+0/22=6",
-"6+0/23=6",
-"6+0/24=6",
-"6+0/25=6",
-"6+0/26=6",
-"6+0/27=6",
-"6+0/28=6",
-"6+0/29=6",
-"6+0/30=6",
-"6+0/31=6",
-"6+0/32=6",
-"6+0/33=6",
-"6+0/34=6",
-"6+0/35=6",
-"6+0/36=6",
-"6+0/37=6",
-"6+0/38=6",
-"6+0/39=6",
-"6+0/40=6",
-"6+0/41=6",
-"6+0/42=6",
-"6+0/43=6",
-"6+0/44=6",
-"6+0/45=6",
-"6+0/46=6",
-"6+0/47=6",
-"6+0/48=6",
-"6+0/49=6",
-"6+0/50=6",
-"6+0/51=6",
-"6+0/52=6",
-"6+0/53=6",
-"6+0/54=6",
-"6+0/55=6",
-"6+0/56=6",
-"6+0/57=6",
-"6+0/58=6",
-"6+0/59=6",
-"6+0/60=6",
-"6+0/61=6",
-"6+0/62=6",
-"6+0/63=6",
-"6+0/64=6",
-"6+0/65=6",
-"6+0/66=6",
-"6+0/67=6",
-"6+0/68=6",
-"6+0/69=6",
-"6+0/70=6",
-"6+0/71=6",
-"6+0/72=6",
-"6+0/73=6",
-"6+0/74=6",
-"6+0/75=6",
-"6+0/76=6",
-"6+0/77=6",
-"6+0/78=6",
-"6+0/79=6",
-"6+0/80=6",
-"6+0/81=6",
-"6+0/82=6",
-"6+0/83=6",
-"6+0/84=6",
-"6+0/85=6",
-"6+0/86=6",
-"6+0/87=6",
-"6+0/88=6",
-"6+0/89=6",
-"6+0/90=6",
-"6+0/91=6",
-"6+0/92=6",
-"6+0/93=6",
-"6+0/94=6",
-"6+0/95=6",
-"6+0/96=6",
-"6+0/97=6",
-"6+0/98=6",
-"6+0/99=6",
-"6+10-7=9",
-"6+10-8=8",
-"6+10-9=7",
-"6+10*0=6",
-"6+10/5=8",
-"6+11-8=9",
-"6+11-9=8",
-"6+11*0=6",
-"6+12-9=9",
-"6+12*0=6",
-"6+12/4=9",
-"6+12/6=8",
-"6+13*0=6",
-"6+14*0=6",
-"6+14/7=8",
-"6+15*0=6",
-"6+15/5=9",
-"6+16*0=6",
-"6+16/8=8",
-"6+17*0=6",
-"6+18*0=6",
-"6+18/6=9",
-"6+18/9=8",
-"6+19*0=6",
-"6+1+3=10",
-"6+1+4=11",
-"6+1+5=12",
-"6+1+6=13",
-"6+1+7=14",
-"6+1+8=15",
-"6+1+9=16",
-"6+1-8=-1",
-"6+1-9=-2",
-"6+1*4=10",
-"6+1*5=11",
-"6+1*6=12",
-"6+1*7=13",
-"6+1*8=14",
-"6+1*9=15",
-"6+20*0=6",
-"6+21*0=6",
-"6+21/7=9",
-"6+22*0=6",
-"6+23*0=6",
-"6+24*0=6",
-"6+24/8=9",
-"6+25*0=6",
-"6+26*0=6",
-"6+27*0=6",
-"6+27/9=9",
-"6+28*0=6",
-"6+29*0=6",
-"6+2+2=10",
-"6+2+3=11",
-"6+2+4=12",
-"6+2+5=13",
-"6+2+6=14",
-"6+2+7=15",
-"6+2+8=16",
-"6+2+9=17",
-"6+2-9=-1",
-"6+2*2=10",
-"6+2*3=12",
-"6+2*4=14",
-"6+2*5=16",
-"6+2*6=18",
-"6+2*7=20",
-"6+2*8=22",
-"6+2*9=24",
-"6+30*0=6",
-"6+31*0=6",
-"6+32*0=6",
-"6+33*0=6",
-"6+34*0=6",
-"6+35*0=6",
-"6+36*0=6",
-"6+37*0=6",
-"6+38*0=6",
-"6+39*0=6",
-"6+3+1=10",
-"6+3+2=11",
-"6+3+3=12",
-"6+3+4=13",
-"6+3+5=14",
-"6+3+6=15",
-"6+3+7=16",
-"6+3+8=17",
-"6+3+9=18",
-"6+3*2=12",
-"6+3*3=15",
-"6+3*4=18",
-"6+3*5=21",
-"6+3*6=24",
-"6+3*7=27",
-"6+3*8=30",
-"6+3*9=33",
-"6+40*0=6",
-"6+41*0=6",
-"6+42*0=6",
-"6+43*0=6",
-"6+44*0=6",
-"6+45*0=6",
-"6+46*0=6",
-"6+47*0=6",
-"6+48*0=6",
-"6+49*0=6",
-"6+4+0=10",
-"6+4+1=11",
-"6+4+2=12",
-"6+4+3=13",
-"6+4+4=14",
-"6+4+5=15",
-"6+4+6=16",
-"6+4+7=17",
-"6+4+8=18",
-"6+4+9=19",
-"6+4-0=10",
-"6+4-10=0",
-"6+4*1=10",
-"6+4*2=14",
-"6+4*3=18",
-"6+4*4=22",
-"6+4*5=26",
-"6+4*6=30",
-"6+4*7=34",
-"6+4*8=38",
-"6+4*9=42",
-"6+4/1=10",
-"6+50*0=6",
-"6+51*0=6",
-"6+52*0=6",
-"6+53*0=6",
-"6+54*0=6",
-"6+55*0=6",
-"6+56*0=6",
-"6+57*0=6",
-"6+58*0=6",
-"6+59*0=6",
-"6+5+0=11",
-"6+5+1=12",
-"6+5+2=13",
-"6+5+3=14",
-"6+5+4=15",
-"6+5+5=16",
-"6+5+6=17",
-"6+5+7=18",
-"6+5+8=19",
-"6+5+9=20",
-"6+5-0=11",
-"6+5-10=1",
-"6+5-11=0",
-"6+5-1=10",
-"6+5*1=11",
-"6+5*2=16",
-"6+5*3=21",
-"6+5*4=26",
-"6+5*5=31",
-"6+5*6=36",
-"6+5*7=41",
-"6+5*8=46",
-"6+5*9=51",
-"6+5/1=11",
-"6+60*0=6",
-"6+61*0=6",
-"6+62*0=6",
-"6+63*0=6",
-"6+64*0=6",
-"6+65*0=6",
-"6+66*0=6",
-"6+67*0=6",
-"6+68*0=6",
-"6+69*0=6",
-"6+6+0=12",
-"6+6+1=13",
-"6+6+2=14",
-"6+6+3=15",
-"6+6+4=16",
-"6+6+5=17",
-"6+6+6=18",
-"6+6+7=19",
-"6+6+8=20",
-"6+6+9=21",
-"6+6-0=12",
-"6+6-10=2",
-"6+6-11=1",
-"6+6-12=0",
-"6+6-1=11",
-"6+6-2=10",
-"6+6*1=12",
-"6+6*2=18",
-"6+6*3=24",
-"6+6*4=30",
-"6+6*5=36",
-"6+6*6=42",
-"6+6*7=48",
-"6+6*8=54",
-"6+6*9=60",
-"6+6/1=12",
-"6+70*0=6",
-"6+71*0=6",
-"6+72*0=6",
-"6+73*0=6",
-"6+74*0=6",
-"6+75*0=6",
-"6+76*0=6",
-"6+77*0=6",
-"6+78*0=6",
-"6+79*0=6",
-"6+7+0=13",
-"6+7+1=14",
-"6+7+2=15",
-"6+7+3=16",
-"6+7+4=17",
-"6+7+5=18",
-"6+7+6=19",
-"6+7+7=20",
-"6+7+8=21",
-"6+7+9=22",
-"6+7-0=13",
-"6+7-10=3",
-"6+7-11=2",
-"6+7-12=1",
-"6+7-13=0",
-"6+7-1=12",
-"6+7-2=11",
-"6+7-3=10",
-"6+7*1=13",
-"6+7*2=20",
-"6+7*3=27",
-"6+7*4=34",
-"6+7*5=41",
-"6+7*6=48",
-"6+7*7=55",
-"6+7*8=62",
-"6+7*9=69",
-"6+7/1=13",
-"6+80*0=6",
-"6+81*0=6",
-"6+82*0=6",
-"6+83*0=6",
-"6+84*0=6",
-"6+85*0=6",
-"6+86*0=6",
-"6+87*0=6",
-"6+88*0=6",
-"6+89*0=6",
-"6+8+0=14",
-"6+8+1=15",
-"6+8+2=16",
-"6+8+3=17",
-"6+8+4=18",
-"6+8+5=19",
-"6+8+6=20",
-"6+8+7=21",
-"6+8+8=22",
-"6+8+9=23",
-"6+8-0=14",
-"6+8-10=4",
-"6+8-11=3",
-"6+8-12=2",
-"6+8-13=1",
-"6+8-14=0",
-"6+8-1=13",
-"6+8-2=12",
-"6+8-3=11",
-"6+8-4=10",
-"6+8*1=14",
-"6+8*2=22",
-"6+8*3=30",
-"6+8*4=38",
-"6+8*5=46",
-"6+8*6=54",
-"6+8*7=62",
-"6+8*8=70",
-"6+8*9=78",
-"6+8/1=14",
-"6+8/2=10",
-"6+90*0=6",
-"6+91*0=6",
-"6+92*0=6",
-"6+93*0=6",
-"6+94*0=6",
-"6+94=100",
-"6+95*0=6",
-"6+95=101",
-"6+96*0=6",
-"6+96=102",
-"6+97*0=6",
-"6+97=103",
-"6+98*0=6",
-"6+98=104",
-"6+99*0=6",
-"6+99=105",
-"6+9+0=15",
-"6+9+1=16",
-"6+9+2=17",
-"6+9+3=18",
-"6+9+4=19",
-"6+9+5=20",
-"6+9+6=21",
-"6+9+7=22",
-"6+9+8=23",
-"6+9+9=24",
-"6+9-0=15",
-"6+9-10=5",
-"6+9-11=4",
-"6+9-12=3",
-"6+9-13=2",
-"6+9-14=1",
-"6+9-15=0",
-"6+9-1=14",
-"6+9-2=13",
-"6+9-3=12",
-"6+9-4=11",
-"6+9-5=10",
-"6+9*1=15",
-"6+9*2=24",
-"6+9*3=33",
-"6+9*4=42",
-"6+9*5=51",
-"6+9*6=60",
-"6+9*7=69",
-"6+9*8=78",
-"6+9*9=87",
-"6+9/1=15",
-"6-0+4=10",
-"6-0+5=11",
-"6-0+6=12",
-"6-0+7=13",
-"6-0+8=14",
-"6-0+9=15",
-"6-0-7=-1",
-"6-0-8=-2",
-"6-0-9=-3",
-"6-0*10=6",
-"6-0*11=6",
-"6-0*12=6",
-"6-0*13=6",
-"6-0*14=6",
-"6-0*15=6",
-"6-0*16=6",
-"6-0*17=6",
-"6-0*18=6",
-"6-0*19=6",
-"6-0*20=6",
-"6-0*21=6",
-"6-0*22=6",
-"6-0*23=6",
-"6-0*24=6",
-"6-0*25=6",
-"6-0*26=6",
-"6-0*27=6",
-"6-0*28=6",
-"6-0*29=6",
-"6-0*30=6",
-"6-0*31=6",
-"6-0*32=6",
-"6-0*33=6",
-"6-0*34=6",
-"6-0*35=6",
-"6-0*36=6",
-"6-0*37=6",
-"6-0*38=6",
-"6-0*39=6",
-"6-0*40=6",
-"6-0*41=6",
-"6-0*42=6",
-"6-0*43=6",
-"6-0*44=6",
-"6-0*45=6",
-"6-0*46=6",
-"6-0*47=6",
-"6-0*48=6",
-"6-0*49=6",
-"6-0*50=6",
-"6-0*51=6",
-"6-0*52=6",
-"6-0*53=6",
-"6-0*54=6",
-"6-0*55=6",
-"6-0*56=6",
-"6-0*57=6",
-"6-0*58=6",
-"6-0*59=6",
-"6-0*60=6",
-"6-0*61=6",
-"6-0*62=6",
-"6-0*63=6",
-"6-0*64=6",
-"6-0*65=6",
-"6-0*66=6",
-"6-0*67=6",
-"6-0*68=6",
-"6-0*69=6",
-"6-0*70=6",
-"6-0*71=6",
-"6-0*72=6",
-"6-0*73=6",
-"6-0*74=6",
-"6-0*75=6",
-"6-0*76=6",
-"6-0*77=6",
-"6-0*78=6",
-"6-0*79=6",
-"6-0*80=6",
-"6-0*81=6",
-"6-0*82=6",
-"6-0*83=6",
-"6-0*84=6",
-"6-0*85=6",
-"6-0*86=6",
-"6-0*87=6",
-"6-0*88=6",
-"6-0*89=6",
-"6-0*90=6",
-"6-0*91=6",
-"6-0*92=6",
-"6-0*93=6",
-"6-0*94=6",
-"6-0*95=6",
-"6-0*96=6",
-"6-0*97=6",
-"6-0*98=6",
-"6-0*99=6",
-"6-0/10=6",
-"6-0/11=6",
-"6-0/12=6",
-"6-0/13=6",
-"6-0/14=6",
-"6-0/15=6",
-"6-0/16=6",
-"6-0/17=6",
-"6-0/18=6",
-"6-0/19=6",
-"6-0/20=6",
-"6-0/21=6",
-"6-0/22=6",
-"6-0/23=6",
-"6-0/24=6",
-"6-0/25=6",
-"6-0/26=6",
-"6-0/27=6",
-"6-0/28=6",
-"6-0/29=6",
-"6-0/30=6",
-"6-0/31=6",
-"6-0/32=6",
-"6-0/33=6",
-"6-0/34=6",
-"6-0/35=6",
-"6-0/36=6",
-"6-0/37=6",
-"6-0/38=6",
-"6-0/39=6",
-"6-0/40=6",
-"6-0/41=6",
-"6-0/42=6",
-"6-0/43=6",
-"6-0/44=6",
-"6-0/45=6",
-"6-0/46=6",
-"6-0/47=6",
-"6-0/48=6",
-"6-0/49=6",
-"6-0/50=6",
-"6-0/51=6",
-"6-0/52=6",
-"6-0/53=6",
-"6-0/54=6",
-"6-0/55=6",
-"6-0/56=6",
-"6-0/57=6",
-"6-0/58=6",
-"6-0/59=6",
-"6-0/60=6",
-"6-0/61=6",
-"6-0/62=6",
-"6-0/63=6",
-"6-0/64=6",
-"6-0/65=6",
-"6-0/66=6",
-"6-0/67=6",
-"6-0/68=6",
-"6-0/69=6",
-"6-0/70=6",
-"6-0/71=6",
-"6-0/72=6",
-"6-0/73=6",
-"6-0/74=6",
-"6-0/75=6",
-"6-0/76=6",
-"6-0/77=6",
-"6-0/78=6",
-"6-0/79=6",
-"6-0/80=6",
-"6-0/81=6",
-"6-0/82=6",
-"6-0/83=6",
-"6-0/84=6",
-"6-0/85=6",
-"6-0/86=6",
-"6-0/87=6",
-"6-0/88=6",
-"6-0/89=6",
-"6-0/90=6",
-"6-0/91=6",
-"6-0/92=6",
-"6-0/93=6",
-"6-0/94=6",
-"6-0/95=6",
-"6-0/96=6",
-"6-0/97=6",
-"6-0/98=6",
-"6-0/99=6",
-"6-10+4=0",
-"6-10+5=1",
-"6-10+6=2",
-"6-10+7=3",
-"6-10+8=4",
-"6-10+9=5",
-"6-10*0=6",
-"6-10/2=1",
-"6-10/5=4",
-"6-11+5=0",
-"6-11+6=1",
-"6-11+7=2",
-"6-11+8=3",
-"6-11+9=4",
-"6-11*0=6",
-"6-12+6=0",
-"6-12+7=1",
-"6-12+8=2",
-"6-12+9=3",
-"6-12*0=6",
-"6-12/2=0",
-"6-12/3=2",
-"6-12/4=3",
-"6-12/6=4",
-"6-13+7=0",
-"6-13+8=1",
-"6-13+9=2",
-"6-13*0=6",
-"6-14+8=0",
-"6-14+9=1",
-"6-14*0=6",
-"6-14/7=4",
-"6-15+9=0",
-"6-15*0=6",
-"6-15/3=1",
-"6-15/5=3",
-"6-16*0=6",
-"6-16/4=2",
-"6-16/8=4",
-"6-16=-10",
-"6-17*0=6",
-"6-17=-11",
-"6-18*0=6",
-"6-18/3=0",
-"6-18/6=3",
-"6-18/9=4",
-"6-18=-12",
-"6-19*0=6",
-"6-19=-13",
-"6-1+5=10",
-"6-1+6=11",
-"6-1+7=12",
-"6-1+8=13",
-"6-1+9=14",
-"6-1-6=-1",
-"6-1-7=-2",
-"6-1-8=-3",
-"6-1-9=-4",
-"6-1*7=-1",
-"6-1*8=-2",
-"6-1*9=-3",
-"6-20*0=6",
-"6-20/4=1",
-"6-20/5=2",
-"6-20=-14",
-"6-21*0=6",
-"6-21/7=3",
-"6-21=-15",
-"6-22*0=6",
-"6-22=-16",
-"6-23*0=6",
-"6-23=-17",
-"6-24*0=6",
-"6-24/4=0",
-"6-24/6=2",
-"6-24/8=3",
-"6-24=-18",
-"6-25*0=6",
-"6-25/5=1",
-"6-25=-19",
-"6-26*0=6",
-"6-26=-20",
-"6-27*0=6",
-"6-27/9=3",
-"6-27=-21",
-"6-28*0=6",
-"6-28/7=2",
-"6-28=-22",
-"6-29*0=6",
-"6-29=-23",
-"6-2+6=10",
-"6-2+7=11",
-"6-2+8=12",
-"6-2+9=13",
-"6-2-5=-1",
-"6-2-6=-2",
-"6-2-7=-3",
-"6-2-8=-4",
-"6-2-9=-5",
-"6-2*4=-2",
-"6-2*5=-4",
-"6-2*6=-6",
-"6-2*7=-8",
-"6-30*0=6",
-"6-30/5=0",
-"6-30/6=1",
-"6-30=-24",
-"6-31*0=6",
-"6-31=-25",
-"6-32*0=6",
-"6-32/8=2",
-"6-32=-26",
-"6-33*0=6",
-"6-33=-27",
-"6-34*0=6",
-"6-34=-28",
-"6-35*0=6",
-"6-35/7=1",
-"6-35=-29",
-"6-36*0=6",
-"6-36/6=0",
-"6-36/9=2",
-"6-36=-30",
-"6-37*0=6",
-"6-37=-31",
-"6-38*0=6",
-"6-38=-32",
-"6-39*0=6",
-"6-39=-33",
-"6-3+7=10",
-"6-3+8=11",
-"6-3+9=12",
-"6-3-4=-1",
-"6-3-5=-2",
-"6-3-6=-3",
-"6-3-7=-4",
-"6-3-8=-5",
-"6-3-9=-6",
-"6-3*3=-3",
-"6-3*4=-6",
-"6-3*5=-9",
-"6-40*0=6",
-"6-40/8=1",
-"6-40=-34",
-"6-41*0=6",
-"6-41=-35",
-"6-42*0=6",
-"6-42/7=0",
-"6-42=-36",
-"6-43*0=6",
-"6-43=-37",
-"6-44*0=6",
-"6-44=-38",
-"6-45*0=6",
-"6-45/9=1",
-"6-45=-39",
-"6-46*0=6",
-"6-46=-40",
-"6-47*0=6",
-"6-47=-41",
-"6-48*0=6",
-"6-48/8=0",
-"6-48=-42",
-"6-49*0=6",
-"6-49=-43",
-"6-4+8=10",
-"6-4+9=11",
-"6-4-3=-1",
-"6-4-4=-2",
-"6-4-5=-3",
-"6-4-6=-4",
-"6-4-7=-5",
-"6-4-8=-6",
-"6-4-9=-7",
-"6-4*2=-2",
-"6-4*3=-6",
-"6-50*0=6",
-"6-50=-44",
-"6-51*0=6",
-"6-51=-45",
-"6-52*0=6",
-"6-52=-46",
-"6-53*0=6",
-"6-53=-47",
-"6-54*0=6",
-"6-54/9=0",
-"6-54=-48",
-"6-55*0=6",
-"6-55=-49",
-"6-56*0=6",
-"6-56=-50",
-"6-57*0=6",
-"6-57=-51",
-"6-58*0=6",
-"6-58=-52",
-"6-59*0=6",
-"6-59=-53",
-"6-5+9=10",
-"6-5-2=-1",
-"6-5-3=-2",
-"6-5-4=-3",
-"6-5-5=-4",
-"6-5-6=-5",
-"6-5-7=-6",
-"6-5-8=-7",
-"6-5-9=-8",
-"6-5*2=-4",
-"6-5*3=-9",
-"6-60*0=6",
-"6-60=-54",
-"6-61*0=6",
-"6-61=-55",
-"6-62*0=6",
-"6-62=-56",
-"6-63*0=6",
-"6-63=-57",
-"6-64*0=6",
-"6-64=-58",
-"6-65*0=6",
-"6-65=-59",
-"6-66*0=6",
-"6-66=-60",
-"6-67*0=6",
-"6-67=-61",
-"6-68*0=6",
-"6-68=-62",
-"6-69*0=6",
-"6-69=-63",
-"6-6-1=-1",
-"6-6-2=-2",
-"6-6-3=-3",
-"6-6-4=-4",
-"6-6-5=-5",
-"6-6-6=-6",
-"6-6-7=-7",
-"6-6-8=-8",
-"6-6-9=-9",
-"6-6*2=-6",
-"6-70*0=6",
-"6-70=-64",
-"6-71*0=6",
-"6-71=-65",
-"6-72*0=6",
-"6-72=-66",
-"6-73*0=6",
-"6-73=-67",
-"6-74*0=6",
-"6-74=-68",
-"6-75*0=6",
-"6-75=-69",
-"6-76*0=6",
-"6-76=-70",
-"6-77*0=6",
-"6-77=-71",
-"6-78*0=6",
-"6-78=-72",
-"6-79*0=6",
-"6-79=-73",
-"6-7+0=-1",
-"6-7+10=9",
-"6-7-0=-1",
-"6-7-1=-2",
-"6-7-2=-3",
-"6-7-3=-4",
-"6-7-4=-5",
-"6-7-5=-6",
-"6-7-6=-7",
-"6-7-7=-8",
-"6-7-8=-9",
-"6-7*1=-1",
-"6-7*2=-8",
-"6-7/1=-1",
-"6-80*0=6",
-"6-80=-74",
-"6-81*0=6",
-"6-81=-75",
-"6-82*0=6",
-"6-82=-76",
-"6-83*0=6",
-"6-83=-77",
-"6-84*0=6",
-"6-84=-78",
-"6-85*0=6",
-"6-85=-79",
-"6-86*0=6",
-"6-86=-80",
-"6-87*0=6",
-"6-87=-81",
-"6-88*0=6",
-"6-88=-82",
-"6-89*0=6",
-"6-89=-83",
-"6-8+0=-2",
-"6-8+10=8",
-"6-8+11=9",
-"6-8+1=-1",
-"6-8-0=-2",
-"6-8-1=-3",
-"6-8-2=-4",
-"6-8-3=-5",
-"6-8-4=-6",
-"6-8-5=-7",
-"6-8-6=-8",
-"6-8-7=-9",
-"6-8*1=-2",
-"6-8/1=-2",
-"6-90*0=6",
-"6-90=-84",
-"6-91*0=6",
-"6-91=-85",
-"6-92*0=6",
-"6-92=-86",
-"6-93*0=6",
-"6-93=-87",
-"6-94*0=6",
-"6-94=-88",
-"6-95*0=6",
-"6-95=-89",
-"6-96*0=6",
-"6-96=-90",
-"6-97*0=6",
-"6-97=-91",
-"6-98*0=6",
-"6-98=-92",
-"6-99*0=6",
-"6-99=-93",
-"6-9+0=-3",
-"6-9+10=7",
-"6-9+11=8",
-"6-9+12=9",
-"6-9+1=-2",
-"6-9+2=-1",
-"6-9-0=-3",
-"6-9-1=-4",
-"6-9-2=-5",
-"6-9-3=-6",
-"6-9-4=-7",
-"6-9-5=-8",
-"6-9-6=-9",
-"6-9*1=-3",
-"6-9/1=-3",
-"6*0-1=-1",
-"6*0-2=-2",
-"6*0-3=-3",
-"6*0-4=-4",
-"6*0-5=-5",
-"6*0-6=-6",
-"6*0-7=-7",
-"6*0-8=-8",
-"6*0-9=-9",
-"6*0*10=0",
-"6*0*11=0",
-"6*0*12=0",
-"6*0*13=0",
-"6*0*14=0",
-"6*0*15=0",
-"6*0*16=0",
-"6*0*17=0",
-"6*0*18=0",
-"6*0*19=0",
-"6*0*20=0",
-"6*0*21=0",
-"6*0*22=0",
-"6*0*23=0",
-"6*0*24=0",
-"6*0*25=0",
-"6*0*26=0",
-"6*0*27=0",
-"6*0*28=0",
-"6*0*29=0",
-"6*0*30=0",
-"6*0*31=0",
-"6*0*32=0",
-"6*0*33=0",
-"6*0*34=0",
-"6*0*35=0",
-"6*0*36=0",
-"6*0*37=0",
-"6*0*38=0",
-"6*0*39=0",
-"6*0*40=0",
-"6*0*41=0",
-"6*0*42=0",
-"6*0*43=0",
-"6*0*44=0",
-"6*0*45=0",
-"6*0*46=0",
-"6*0*47=0",
-"6*0*48=0",
-"6*0*49=0",
-"6*0*50=0",
-"6*0*51=0",
-"6*0*52=0",
-"6*0*53=0",
-"6*0*54=0",
-"6*0*55=0",
-"6*0*56=0",
-"6*0*57=0",
-"6*0*58=0",
-"6*0*59=0",
-"6*0*60=0",
-"6*0*61=0",
-"6*0*62=0",
-"6*0*63=0",
-"6*0*64=0",
-"6*0*65=0",
-"6*0*66=0",
-"6*0*67=0",
-"6*0*68=0",
-"6*0*69=0",
-"6*0*70=0",
-"6*0*71=0",
-"6*0*72=0",
-"6*0*73=0",
-"6*0*74=0",
-"6*0*75=0",
-"6*0*76=0",
-"6*0*77=0",
-"6*0*78=0",
-"6*0*79=0",
-"6*0*80=0",
-"6*0*81=0",
-"6*0*82=0",
-"6*0*83=0",
-"6*0*84=0",
-"6*0*85=0",
-"6*0*86=0",
-"6*0*87=0",
-"6*0*88=0",
-"6*0*89=0",
-"6*0*90=0",
-"6*0*91=0",
-"6*0*92=0",
-"6*0*93=0",
-"6*0*94=0",
-"6*0*95=0",
-"6*0*96=0",
-"6*0*97=0",
-"6*0*98=0",
-"6*0*99=0",
-"6*0/10=0",
-"6*0/11=0",
-"6*0/12=0",
-"6*0/13=0",
-"6*0/14=0",
-"6*0/15=0",
-"6*0/16=0",
-"6*0/17=0",
-"6*0/18=0",
-"6*0/19=0",
-"6*0/20=0",
-"6*0/21=0",
-"6*0/22=0",
-"6*0/23=0",
-"6*0/24=0",
-"6*0/25=0",
-"6*0/26=0",
-"6*0/27=0",
-"6*0/28=0",
-"6*0/29=0",
-"6*0/30=0",
-"6*0/31=0",
-"6*0/32=0",
-"6*0/33=0",
-"6*0/34=0",
-"6*0/35=0",
-"6*0/36=0",
-"6*0/37=0",
-"6*0/38=0",
-"6*0/39=0",
-"6*0/40=0",
-"6*0/41=0",
-"6*0/42=0",
-"6*0/43=0",
-"6*0/44=0",
-"6*0/45=0",
-"6*0/46=0",
-"6*0/47=0",
-"6*0/48=0",
-"6*0/49=0",
-"6*0/50=0",
-"6*0/51=0",
-"6*0/52=0",
-"6*0/53=0",
-"6*0/54=0",
-"6*0/55=0",
-"6*0/56=0",
-"6*0/57=0",
-"6*0/58=0",
-"6*0/59=0",
-"6*0/60=0",
-"6*0/61=0",
-"6*0/62=0",
-"6*0/63=0",
-"6*0/64=0",
-"6*0/65=0",
-"6*0/66=0",
-"6*0/67=0",
-"6*0/68=0",
-"6*0/69=0",
-"6*0/70=0",
-"6*0/71=0",
-"6*0/72=0",
-"6*0/73=0",
-"6*0/74=0",
-"6*0/75=0",
-"6*0/76=0",
-"6*0/77=0",
-"6*0/78=0",
-"6*0/79=0",
-"6*0/80=0",
-"6*0/81=0",
-"6*0/82=0",
-"6*0/83=0",
-"6*0/84=0",
-"6*0/85=0",
-"6*0/86=0",
-"6*0/87=0",
-"6*0/88=0",
-"6*0/89=0",
-"6*0/90=0",
-"6*0/91=0",
-"6*0/92=0",
-"6*0/93=0",
-"6*0/94=0",
-"6*0/95=0",
-"6*0/96=0",
-"6*0/97=0",
-"6*0/98=0",
-"6*0/99=0",
-"6*10*0=0",
-"6*11*0=0",
-"6*12*0=0",
-"6*12/8=9",
-"6*12/9=8",
-"6*13*0=0",
-"6*14*0=0",
-"6*15*0=0",
-"6*16*0=0",
-"6*17*0=0",
-"6*17=102",
-"6*18*0=0",
-"6*18=108",
-"6*19*0=0",
-"6*19=114",
-"6*1+4=10",
-"6*1+5=11",
-"6*1+6=12",
-"6*1+7=13",
-"6*1+8=14",
-"6*1+9=15",
-"6*1-7=-1",
-"6*1-8=-2",
-"6*1-9=-3",
-"6*1*2=12",
-"6*1*3=18",
-"6*1*4=24",
-"6*1*5=30",
-"6*1*6=36",
-"6*1*7=42",
-"6*1*8=48",
-"6*1*9=54",
-"6*20*0=0",
-"6*20=120",
-"6*21*0=0",
-"6*21=126",
-"6*22*0=0",
-"6*22=132",
-"6*23*0=0",
-"6*23=138",
-"6*24*0=0",
-"6*24=144",
-"6*25*0=0",
-"6*25=150",
-"6*26*0=0",
-"6*26=156",
-"6*27*0=0",
-"6*27=162",
-"6*28*0=0",
-"6*28=168",
-"6*29*0=0",
-"6*29=174",
-"6*2+0=12",
-"6*2+1=13",
-"6*2+2=14",
-"6*2+3=15",
-"6*2+4=16",
-"6*2+5=17",
-"6*2+6=18",
-"6*2+7=19",
-"6*2+8=20",
-"6*2+9=21",
-"6*2-0=12",
-"6*2-10=2",
-"6*2-11=1",
-"6*2-12=0",
-"6*2-1=11",
-"6*2-2=10",
-"6*2*1=12",
-"6*2*2=24",
-"6*2*3=36",
-"6*2*4=48",
-"6*2*5=60",
-"6*2*6=72",
-"6*2*7=84",
-"6*2*8=96",
-"6*2/12=1",
-"6*2/1=12",
-"6*30*0=0",
-"6*30=180",
-"6*31*0=0",
-"6*31=186",
-"6*32*0=0",
-"6*32=192",
-"6*33*0=0",
-"6*33=198",
-"6*34*0=0",
-"6*34=204",
-"6*35*0=0",
-"6*35=210",
-"6*36*0=0",
-"6*36=216",
-"6*37*0=0",
-"6*37=222",
-"6*38*0=0",
-"6*38=228",
-"6*39*0=0",
-"6*39=234",
-"6*3+0=18",
-"6*3+1=19",
-"6*3+2=20",
-"6*3+3=21",
-"6*3+4=22",
-"6*3+5=23",
-"6*3+6=24",
-"6*3+7=25",
-"6*3+8=26",
-"6*3+9=27",
-"6*3-0=18",
-"6*3-10=8",
-"6*3-11=7",
-"6*3-12=6",
-"6*3-13=5",
-"6*3-14=4",
-"6*3-15=3",
-"6*3-16=2",
-"6*3-17=1",
-"6*3-18=0",
-"6*3-1=17",
-"6*3-2=16",
-"6*3-3=15",
-"6*3-4=14",
-"6*3-5=13",
-"6*3-6=12",
-"6*3-7=11",
-"6*3-8=10",
-"6*3*1=18",
-"6*3*2=36",
-"6*3*3=54",
-"6*3*4=72",
-"6*3*5=90",
-"6*3/18=1",
-"6*3/1=18",
-"6*40*0=0",
-"6*40=240",
-"6*41*0=0",
-"6*41=246",
-"6*42*0=0",
-"6*42=252",
-"6*43*0=0",
-"6*43=258",
-"6*44*0=0",
-"6*44=264",
-"6*45*0=0",
-"6*45=270",
-"6*46*0=0",
-"6*46=276",
-"6*47*0=0",
-"6*47=282",
-"6*48*0=0",
-"6*48=288",
-"6*49*0=0",
-"6*49=294",
-"6*4+0=24",
-"6*4+1=25",
-"6*4+2=26",
-"6*4+3=27",
-"6*4+4=28",
-"6*4+5=29",
-"6*4+6=30",
-"6*4+7=31",
-"6*4+8=32",
-"6*4+9=33",
-"6*4-0=24",
-"6*4-15=9",
-"6*4-16=8",
-"6*4-17=7",
-"6*4-18=6",
-"6*4-19=5",
-"6*4-1=23",
-"6*4-20=4",
-"6*4-21=3",
-"6*4-22=2",
-"6*4-23=1",
-"6*4-24=0",
-"6*4-2=22",
-"6*4-3=21",
-"6*4-4=20",
-"6*4-5=19",
-"6*4-6=18",
-"6*4-7=17",
-"6*4-8=16",
-"6*4-9=15",
-"6*4*1=24",
-"6*4*2=48",
-"6*4*3=72",
-"6*4*4=96",
-"6*4/12=2",
-"6*4/1=24",
-"6*4/24=1",
-"6*4/2=12",
-"6*50*0=0",
-"6*50=300",
-"6*51*0=0",
-"6*51=306",
-"6*52*0=0",
-"6*52=312",
-"6*53*0=0",
-"6*53=318",
-"6*54*0=0",
-"6*54=324",
-"6*55*0=0",
-"6*55=330",
-"6*56*0=0",
-"6*56=336",
-"6*57*0=0",
-"6*57=342",
-"6*58*0=0",
-"6*58=348",
-"6*59*0=0",
-"6*59=354",
-"6*5+0=30",
-"6*5+1=31",
-"6*5+2=32",
-"6*5+3=33",
-"6*5+4=34",
-"6*5+5=35",
-"6*5+6=36",
-"6*5+7=37",
-"6*5+8=38",
-"6*5+9=39",
-"6*5-0=30",
-"6*5-1=29",
-"6*5-21=9",
-"6*5-22=8",
-"6*5-23=7",
-"6*5-24=6",
-"6*5-25=5",
-"6*5-26=4",
-"6*5-27=3",
-"6*5-28=2",
-"6*5-29=1",
-"6*5-2=28",
-"6*5-30=0",
-"6*5-3=27",
-"6*5-4=26",
-"6*5-5=25",
-"6*5-6=24",
-"6*5-7=23",
-"6*5-8=22",
-"6*5-9=21",
-"6*5*1=30",
-"6*5*2=60",
-"6*5*3=90",
-"6*5/10=3",
-"6*5/15=2",
-"6*5/1=30",
-"6*5/2=15",
-"6*5/30=1",
-"6*5/3=10",
-"6*60*0=0",
-"6*60=360",
-"6*61*0=0",
-"6*61=366",
-"6*62*0=0",
-"6*62=372",
-"6*63*0=0",
-"6*63=378",
-"6*64*0=0",
-"6*64=384",
-"6*65*0=0",
-"6*65=390",
-"6*66*0=0",
-"6*66=396",
-"6*67*0=0",
-"6*67=402",
-"6*68*0=0",
-"6*68=408",
-"6*69*0=0",
-"6*69=414",
-"6*6+0=36",
-"6*6+1=37",
-"6*6+2=38",
-"6*6+3=39",
-"6*6+4=40",
-"6*6+5=41",
-"6*6+6=42",
-"6*6+7=43",
-"6*6+8=44",
-"6*6+9=45",
-"6*6-0=36",
-"6*6-1=35",
-"6*6-27=9",
-"6*6-28=8",
-"6*6-29=7",
-"6*6-2=34",
-"6*6-30=6",
-"6*6-31=5",
-"6*6-32=4",
-"6*6-33=3",
-"6*6-34=2",
-"6*6-35=1",
-"6*6-36=0",
-"6*6-3=33",
-"6*6-4=32",
-"6*6-5=31",
-"6*6-6=30",
-"6*6-7=29",
-"6*6-8=28",
-"6*6-9=27",
-"6*6*1=36",
-"6*6*2=72",
-"6*6/12=3",
-"6*6/18=2",
-"6*6/1=36",
-"6*6/2=18",
-"6*6/36=1",
-"6*6/3=12",
-"6*70*0=0",
-"6*70=420",
-"6*71*0=0",
-"6*71=426",
-"6*72*0=0",
-"6*72=432",
-"6*73*0=0",
-"6*73=438",
-"6*74*0=0",
-"6*74=444",
-"6*75*0=0",
-"6*75=450",
-"6*76*0=0",
-"6*76=456",
-"6*77*0=0",
-"6*77=462",
-"6*78*0=0",
-"6*78=468",
-"6*79*0=0",
-"6*79=474",
-"6*7+0=42",
-"6*7+1=43",
-"6*7+2=44",
-"6*7+3=45",
-"6*7+4=46",
-"6*7+5=47",
-"6*7+6=48",
-"6*7+7=49",
-"6*7+8=50",
-"6*7+9=51",
-"6*7-0=42",
-"6*7-1=41",
-"6*7-2=40",
-"6*7-33=9",
-"6*7-34=8",
-"6*7-35=7",
-"6*7-36=6",
-"6*7-37=5",
-"6*7-38=4",
-"6*7-39=3",
-"6*7-3=39",
-"6*7-40=2",
-"6*7-41=1",
-"6*7-42=0",
-"6*7-4=38",
-"6*7-5=37",
-"6*7-6=36",
-"6*7-7=35",
-"6*7-8=34",
-"6*7-9=33",
-"6*7*1=42",
-"6*7*2=84",
-"6*7/14=3",
-"6*7/1=42",
-"6*7/21=2",
-"6*7/2=21",
-"6*7/3=14",
-"6*7/42=1",
-"6*80*0=0",
-"6*80=480",
-"6*81*0=0",
-"6*81=486",
-"6*82*0=0",
-"6*82=492",
-"6*83*0=0",
-"6*83=498",
-"6*84*0=0",
-"6*84=504",
-"6*85*0=0",
-"6*85=510",
-"6*86*0=0",
-"6*86=516",
-"6*87*0=0",
-"6*87=522",
-"6*88*0=0",
-"6*88=528",
-"6*89*0=0",
-"6*89=534",
-"6*8+0=48",
-"6*8+1=49",
-"6*8+2=50",
-"6*8+3=51",
-"6*8+4=52",
-"6*8+5=53",
-"6*8+6=54",
-"6*8+7=55",
-"6*8+8=56",
-"6*8+9=57",
-"6*8-0=48",
-"6*8-1=47",
-"6*8-2=46",
-"6*8-39=9",
-"6*8-3=45",
-"6*8-40=8",
-"6*8-41=7",
-"6*8-42=6",
-"6*8-43=5",
-"6*8-44=4",
-"6*8-45=3",
-"6*8-46=2",
-"6*8-47=1",
-"6*8-48=0",
-"6*8-4=44",
-"6*8-5=43",
-"6*8-6=42",
-"6*8-7=41",
-"6*8-8=40",
-"6*8-9=39",
-"6*8*1=48",
-"6*8*2=96",
-"6*8/12=4",
-"6*8/16=3",
-"6*8/1=48",
-"6*8/24=2",
-"6*8/2=24",
-"6*8/3=16",
-"6*8/48=1",
-"6*8/4=12",
-"6*90*0=0",
-"6*90=540",
-"6*91*0=0",
-"6*91=546",
-"6*92*0=0",
-"6*92=552",
-"6*93*0=0",
-"6*93=558",
-"6*94*0=0",
-"6*94=564",
-"6*95*0=0",
-"6*95=570",
-"6*96*0=0",
-"6*96=576",
-"6*97*0=0",
-"6*97=582",
-"6*98*0=0",
-"6*98=588",
-"6*99*0=0",
-"6*99=594",
-"6*9+0=54",
-"6*9+1=55",
-"6*9+2=56",
-"6*9+3=57",
-"6*9+4=58",
-"6*9+5=59",
-"6*9+6=60",
-"6*9+7=61",
-"6*9+8=62",
-"6*9+9=63",
-"6*9-0=54",
-"6*9-1=53",
-"6*9-2=52",
-"6*9-3=51",
-"6*9-45=9",
-"6*9-46=8",
-"6*9-47=7",
-"6*9-48=6",
-"6*9-49=5",
-"6*9-4=50",
-"6*9-50=4",
-"6*9-51=3",
-"6*9-52=2",
-"6*9-53=1",
-"6*9-54=0",
-"6*9-5=49",
-"6*9-6=48",
-"6*9-7=47",
-"6*9-8=46",
-"6*9-9=45",
-"6*9*1=54",
-"6*9/18=3",
-"6*9/1=54",
-"6*9/27=2",
-"6*9/2=27",
-"6*9/3=18",
-"6*9/54=1",
-"6/10*0=0",
-"6/10*5=3",
-"6/11*0=0",
-"6/12*0=0",
-"6/12*2=1",
-"6/12*4=2",
-"6/12*6=3",
-"6/12*8=4",
-"6/13*0=0",
-"6/14*0=0",
-"6/14*7=3",
-"6/15*0=0",
-"6/15*5=2",
-"6/16*0=0",
-"6/16*8=3",
-"6/17*0=0",
-"6/18*0=0",
-"6/18*3=1",
-"6/18*6=2",
-"6/18*9=3",
-"6/19*0=0",
-"6/1+4=10",
-"6/1+5=11",
-"6/1+6=12",
-"6/1+7=13",
-"6/1+8=14",
-"6/1+9=15",
-"6/1-7=-1",
-"6/1-8=-2",
-"6/1-9=-3",
-"6/1*2=12",
-"6/1*3=18",
-"6/1*4=24",
-"6/1*5=30",
-"6/1*6=36",
-"6/1*7=42",
-"6/1*8=48",
-"6/1*9=54",
-"6/20*0=0",
-"6/21*0=0",
-"6/21*7=2",
-"6/22*0=0",
-"6/23*0=0",
-"6/24*0=0",
-"6/24*4=1",
-"6/24*8=2",
-"6/25*0=0",
-"6/26*0=0",
-"6/27*0=0",
-"6/27*9=2",
-"6/28*0=0",
-"6/29*0=0",
-"6/2+7=10",
-"6/2+8=11",
-"6/2+9=12",
-"6/2-4=-1",
-"6/2-5=-2",
-"6/2-6=-3",
-"6/2-7=-4",
-"6/2-8=-5",
-"6/2-9=-6",
-"6/2*4=12",
-"6/2*5=15",
-"6/2*6=18",
-"6/2*7=21",
-"6/2*8=24",
-"6/2*9=27",
-"6/30*0=0",
-"6/30*5=1",
-"6/31*0=0",
-"6/32*0=0",
-"6/33*0=0",
-"6/34*0=0",
-"6/35*0=0",
-"6/36*0=0",
-"6/36*6=1",
-"6/37*0=0",
-"6/38*0=0",
-"6/39*0=0",
-"6/3+8=10",
-"6/3+9=11",
-"6/3-3=-1",
-"6/3-4=-2",
-"6/3-5=-3",
-"6/3-6=-4",
-"6/3-7=-5",
-"6/3-8=-6",
-"6/3-9=-7",
-"6/3*5=10",
-"6/3*6=12",
-"6/3*7=14",
-"6/3*8=16",
-"6/3*9=18",
-"6/40*0=0",
-"6/41*0=0",
-"6/42*0=0",
-"6/42*7=1",
-"6/43*0=0",
-"6/44*0=0",
-"6/45*0=0",
-"6/46*0=0",
-"6/47*0=0",
-"6/48*0=0",
-"6/48*8=1",
-"6/49*0=0",
-"6/4*8=12",
-"6/50*0=0",
-"6/51*0=0",
-"6/52*0=0",
-"6/53*0=0",
-"6/54*0=0",
-"6/54*9=1",
-"6/55*0=0",
-"6/56*0=0",
-"6/57*0=0",
-"6/58*0=0",
-"6/59*0=0",
-"6/60*0=0",
-"6/61*0=0",
-"6/62*0=0",
-"6/63*0=0",
-"6/64*0=0",
-"6/65*0=0",
-"6/66*0=0",
-"6/67*0=0",
-"6/68*0=0",
-"6/69*0=0",
-"6/6+9=10",
-"6/6-2=-1",
-"6/6-3=-2",
-"6/6-4=-3",
-"6/6-5=-4",
-"6/6-6=-5",
-"6/6-7=-6",
-"6/6-8=-7",
-"6/6-9=-8",
-"6/70*0=0",
-"6/71*0=0",
-"6/72*0=0",
-"6/73*0=0",
-"6/74*0=0",
-"6/75*0=0",
-"6/76*0=0",
-"6/77*0=0",
-"6/78*0=0",
-"6/79*0=0",
-"6/80*0=0",
-"6/81*0=0",
-"6/82*0=0",
-"6/83*0=0",
-"6/84*0=0",
-"6/85*0=0",
-"6/86*0=0",
-"6/87*0=0",
-"6/88*0=0",
-"6/89*0=0",
-"6/8*12=9",
-"6/90*0=0",
-"6/91*0=0",
-"6/92*0=0",
-"6/93*0=0",
-"6/94*0=0",
-"6/95*0=0",
-"6/96*0=0",
-"6/97*0=0",
-"6/98*0=0",
-"6/99*0=0",
-"6/9*12=8",
-"7000*0=0",
-"7001*0=0",
-"7002*0=0",
-"7003*0=0",
-"7004*0=0",
-"7005*0=0",
-"7006*0=0",
-"7007*0=0",
-"7008*0=0",
-"7009*0=0",
-"7010*0=0",
-"7011*0=0",
-"7012*0=0",
-"7013*0=0",
-"7014*0=0",
-"7015*0=0",
-"7016*0=0",
-"7017*0=0",
-"7018*0=0",
-"7019*0=0",
-"7020*0=0",
-"7021*0=0",
-"7022*0=0",
-"7023*0=0",
-"7024*0=0",
-"7025*0=0",
-"7026*0=0",
-"7027*0=0",
-"7028*0=0",
-"7029*0=0",
-"702/78=9",
-"702/9=78",
-"7030*0=0",
-"7031*0=0",
-"7032*0=0",
-"7033*0=0",
-"7034*0=0",
-"7035*0=0",
-"7036*0=0",
-"7037*0=0",
-"7038*0=0",
-"7039*0=0",
-"7040*0=0",
-"7041*0=0",
-"7042*0=0",
-"7043*0=0",
-"7044*0=0",
-"7045*0=0",
-"7046*0=0",
-"7047*0=0",
-"7048*0=0",
-"7049*0=0",
-"704/88=8",
-"704/8=88",
-"7050*0=0",
-"7051*0=0",
-"7052*0=0",
-"7053*0=0",
-"7054*0=0",
-"7055*0=0",
-"7056*0=0",
-"7057*0=0",
-"7058*0=0",
-"7059*0=0",
-"7060*0=0",
-"7061*0=0",
-"7062*0=0",
-"7063*0=0",
-"7064*0=0",
-"7065*0=0",
-"7066*0=0",
-"7067*0=0",
-"7068*0=0",
-"7069*0=0",
-"7070*0=0",
-"7071*0=0",
-"7072*0=0",
-"7073*0=0",
-"7074*0=0",
-"7075*0=0",
-"7076*0=0",
-"7077*0=0",
-"7078*0=0",
-"7079*0=0",
-"7080*0=0",
-"7081*0=0",
-"7082*0=0",
-"7083*0=0",
-"7084*0=0",
-"7085*0=0",
-"7086*0=0",
-"7087*0=0",
-"7088*0=0",
-"7089*0=0",
-"7090*0=0",
-"7091*0=0",
-"7092*0=0",
-"7093*0=0",
-"7094*0=0",
-"7095*0=0",
-"7096*0=0",
-"7097*0=0",
-"7098*0=0",
-"7099*0=0",
-"70+10=80",
-"70+11=81",
-"70+12=82",
-"70+13=83",
-"70+14=84",
-"70+15=85",
-"70+16=86",
-"70+17=87",
-"70+18=88",
-"70+19=89",
-"70+20=90",
-"70+21=91",
-"70+22=92",
-"70+23=93",
-"70+24=94",
-"70+25=95",
-"70+26=96",
-"70+27=97",
-"70+28=98",
-"70+29=99",
-"70-10=60",
-"70-11=59",
-"70-12=58",
-"70-13=57",
-"70-14=56",
-"70-15=55",
-"70-16=54",
-"70-17=53",
-"70-18=52",
-"70-19=51",
-"70-20=50",
-"70-21=49",
-"70-22=48",
-"70-23=47",
-"70-24=46",
-"70-25=45",
-"70-26=44",
-"70-27=43",
-"70-28=42",
-"70-29=41",
-"70-30=40",
-"70-31=39",
-"70-32=38",
-"70-33=37",
-"70-34=36",
-"70-35=35",
-"70-36=34",
-"70-37=33",
-"70-38=32",
-"70-39=31",
-"70-40=30",
-"70-41=29",
-"70-42=28",
-"70-43=27",
-"70-44=26",
-"70-45=25",
-"70-46=24",
-"70-47=23",
-"70-48=22",
-"70-49=21",
-"70-50=20",
-"70-51=19",
-"70-52=18",
-"70-53=17",
-"70-54=16",
-"70-55=15",
-"70-56=14",
-"70-57=13",
-"70-58=12",
-"70-59=11",
-"70-60=10",
-"70-71=-1",
-"70-72=-2",
-"70-73=-3",
-"70-74=-4",
-"70-75=-5",
-"70-76=-6",
-"70-77=-7",
-"70-78=-8",
-"70-79=-9",
-"70-7*9=7",
-"70-8*8=6",
-"70-9*7=7",
-"70*0+0=0",
-"70*0+1=1",
-"70*0+2=2",
-"70*0+3=3",
-"70*0+4=4",
-"70*0+5=5",
-"70*0+6=6",
-"70*0+7=7",
-"70*0+8=8",
-"70*0+9=9",
-"70*0-0=0",
-"70*0*0=0",
-"70*0*1=0",
-"70*0*2=0",
-"70*0*3=0",
-"70*0*4=0",
-"70*0*5=0",
-"70*0*6=0",
-"70*0*7=0",
-"70*0*8=0",
-"70*0*9=0",
-"70*0/1=0",
-"70*0/2=0",
-"70*0/3=0",
-"70*0/4=0",
-"70*0/5=0",
-"70*0/6=0",
-"70*0/7=0",
-"70*0/8=0",
-"70*0/9=0",
-"70*1*0=0",
-"70*2*0=0",
-"70*2=140",
-"70*3*0=0",
-"70*3=210",
-"70*4*0=0",
-"70*4=280",
-"70*5*0=0",
-"70*5=350",
-"70*6*0=0",
-"70*6=420",
-"70*7*0=0",
-"70*7=490",
-"70*8*0=0",
-"70*8=560",
-"70*9*0=0",
-"70*9=630",
-"70/1*0=0",
-"70/2*0=0",
-"70/2/5=7",
-"70/2/7=5",
-"70/3*0=0",
-"70/4*0=0",
-"70/5-5=9",
-"70/5-6=8",
-"70/5-7=7",
-"70/5-8=6",
-"70/5-9=5",
-"70/5*0=0",
-"70/5/2=7",
-"70/5/7=2",
-"70/6*0=0",
-"70/7-1=9",
-"70/7-2=8",
-"70/7-3=7",
-"70/7-4=6",
-"70/7-5=5",
-"70/7-6=4",
-"70/7-7=3",
-"70/7-8=2",
-"70/7-9=1",
-"70/7*0=0",
-"70/7/2=5",
-"70/7/5=2",
-"70/8*0=0",
-"70/9*0=0",
-"7100*0=0",
-"7101*0=0",
-"7102*0=0",
-"7103*0=0",
-"7104*0=0",
-"7105*0=0",
-"7106*0=0",
-"7107*0=0",
-"7108*0=0",
-"7109*0=0",
-"7110*0=0",
-"7111*0=0",
-"7112*0=0",
-"7113*0=0",
-"7114*0=0",
-"7115*0=0",
-"7116*0=0",
-"7117*0=0",
-"7118*0=0",
-"7119*0=0",
-"711/79=9",
-"711/9=79",
-"7120*0=0",
-"7121*0=0",
-"7122*0=0",
-"7123*0=0",
-"7124*0=0",
-"7125*0=0",
-"7126*0=0",
-"7127*0=0",
-"7128*0=0",
-"7129*0=0",
-"712/89=8",
-"712/8=89",
-"7130*0=0",
-"7131*0=0",
-"7132*0=0",
-"7133*0=0",
-"7134*0=0",
-"7135*0=0",
-"7136*0=0",
-"7137*0=0",
-"7138*0=0",
-"7139*0=0",
-"7140*0=0",
-"7141*0=0",
-"7142*0=0",
-"7143*0=0",
-"7144*0=0",
-"7145*0=0",
-"7146*0=0",
-"7147*0=0",
-"7148*0=0",
-"7149*0=0",
-"7150*0=0",
-"7151*0=0",
-"7152*0=0",
-"7153*0=0",
-"7154*0=0",
-"7155*0=0",
-"7156*0=0",
-"7157*0=0",
-"7158*0=0",
-"7159*0=0",
-"7160*0=0",
-"7161*0=0",
-"7162*0=0",
-"7163*0=0",
-"7164*0=0",
-"7165*0=0",
-"7166*0=0",
-"7167*0=0",
-"7168*0=0",
-"7169*0=0",
-"7170*0=0",
-"7171*0=0",
-"7172*0=0",
-"7173*0=0",
-"7174*0=0",
-"7175*0=0",
-"7176*0=0",
-"7177*0=0",
-"7178*0=0",
-"7179*0=0",
-"7180*0=0",
-"7181*0=0",
-"7182*0=0",
-"7183*0=0",
-"7184*0=0",
-"7185*0=0",
-"7186*0=0",
-"7187*0=0",
-"7188*0=0",
-"7189*0=0",
-"7190*0=0",
-"7191*0=0",
-"7192*0=0",
-"7193*0=0",
-"7194*0=0",
-"7195*0=0",
-"7196*0=0",
-"7197*0=0",
-"7198*0=0",
-"7199*0=0",
-"71+10=81",
-"71+11=82",
-"71+12=83",
-"71+13=84",
-"71+14=85",
-"71+15=86",
-"71+16=87",
-"71+17=88",
-"71+18=89",
-"71+19=90",
-"71+20=91",
-"71+21=92",
-"71+22=93",
-"71+23=94",
-"71+24=95",
-"71+25=96",
-"71+26=97",
-"71+27=98",
-"71+28=99",
-"71-10=61",
-"71-11=60",
-"71-12=59",
-"71-13=58",
-"71-14=57",
-"71-15=56",
-"71-16=55",
-"71-17=54",
-"71-18=53",
-"71-19=52",
-"71-20=51",
-"71-21=50",
-"71-22=49",
-"71-23=48",
-"71-24=47",
-"71-25=46",
-"71-26=45",
-"71-27=44",
-"71-28=43",
-"71-29=42",
-"71-30=41",
-"71-31=40",
-"71-32=39",
-"71-33=38",
-"71-34=37",
-"71-35=36",
-"71-36=35",
-"71-37=34",
-"71-38=33",
-"71-39=32",
-"71-40=31",
-"71-41=30",
-"71-42=29",
-"71-43=28",
-"71-44=27",
-"71-45=26",
-"71-46=25",
-"71-47=24",
-"71-48=23",
-"71-49=22",
-"71-50=21",
-"71-51=20",
-"71-52=19",
-"71-53=18",
-"71-54=17",
-"71-55=16",
-"71-56=15",
-"71-57=14",
-"71-58=13",
-"71-59=12",
-"71-60=11",
-"71-61=10",
-"71-72=-1",
-"71-73=-2",
-"71-74=-3",
-"71-75=-4",
-"71-76=-5",
-"71-77=-6",
-"71-78=-7",
-"71-79=-8",
-"71-7*9=8",
-"71-80=-9",
-"71-8*8=7",
-"71-9*7=8",
-"71*0+0=0",
-"71*0+1=1",
-"71*0+2=2",
-"71*0+3=3",
-"71*0+4=4",
-"71*0+5=5",
-"71*0+6=6",
-"71*0+7=7",
-"71*0+8=8",
-"71*0+9=9",
-"71*0-0=0",
-"71*0*0=0",
-"71*0*1=0",
-"71*0*2=0",
-"71*0*3=0",
-"71*0*4=0",
-"71*0*5=0",
-"71*0*6=0",
-"71*0*7=0",
-"71*0*8=0",
-"71*0*9=0",
-"71*0/1=0",
-"71*0/2=0",
-"71*0/3=0",
-"71*0/4=0",
-"71*0/5=0",
-"71*0/6=0",
-"71*0/7=0",
-"71*0/8=0",
-"71*0/9=0",
-"71*1*0=0",
-"71*2*0=0",
-"71*2=142",
-"71*3*0=0",
-"71*3=213",
-"71*4*0=0",
-"71*4=284",
-"71*5*0=0",
-"71*5=355",
-"71*6*0=0",
-"71*6=426",
-"71*7*0=0",
-"71*7=497",
-"71*8*0=0",
-"71*8=568",
-"71*9*0=0",
-"71*9=639",
-"71/1*0=0",
-"71/2*0=0",
-"71/3*0=0",
-"71/4*0=0",
-"71/5*0=0",
-"71/6*0=0",
-"71/7*0=0",
-"71/8*0=0",
-"71/9*0=0",
-"7200*0=0",
-"7201*0=0",
-"7202*0=0",
-"7203*0=0",
-"7204*0=0",
-"7205*0=0",
-"7206*0=0",
-"7207*0=0",
-"7208*0=0",
-"7209*0=0",
-"720/80=9",
-"720/8=90",
-"720/90=8",
-"720/9=80",
-"7210*0=0",
-"7211*0=0",
-"7212*0=0",
-"7213*0=0",
-"7214*0=0",
-"7215*0=0",
-"7216*0=0",
-"7217*0=0",
-"7218*0=0",
-"7219*0=0",
-"7220*0=0",
-"7221*0=0",
-"7222*0=0",
-"7223*0=0",
-"7224*0=0",
-"7225*0=0",
-"7226*0=0",
-"7227*0=0",
-"7228*0=0",
-"7229*0=0",
-"7230*0=0",
-"7231*0=0",
-"7232*0=0",
-"7233*0=0",
-"7234*0=0",
-"7235*0=0",
-"7236*0=0",
-"7237*0=0",
-"7238*0=0",
-"7239*0=0",
-"7240*0=0",
-"7241*0=0",
-"7242*0=0",
-"7243*0=0",
-"7244*0=0",
-"7245*0=0",
-"7246*0=0",
-"7247*0=0",
-"7248*0=0",
-"7249*0=0",
-"7250*0=0",
-"7251*0=0",
-"7252*0=0",
-"7253*0=0",
-"7254*0=0",
-"7255*0=0",
-"7256*0=0",
-"7257*0=0",
-"7258*0=0",
-"7259*0=0",
-"7260*0=0",
-"7261*0=0",
-"7262*0=0",
-"7263*0=0",
-"7264*0=0",
-"7265*0=0",
-"7266*0=0",
-"7267*0=0",
-"7268*0=0",
-"7269*0=0",
-"7270*0=0",
-"7271*0=0",
-"7272*0=0",
-"7273*0=0",
-"7274*0=0",
-"7275*0=0",
-"7276*0=0",
-"7277*0=0",
-"7278*0=0",
-"7279*0=0",
-"7280*0=0",
-"7281*0=0",
-"7282*0=0",
-"7283*0=0",
-"7284*0=0",
-"7285*0=0",
-"7286*0=0",
-"7287*0=0",
-"7288*0=0",
-"7289*0=0",
-"728/8=91",
-"728/91=8",
-"7290*0=0",
-"7291*0=0",
-"7292*0=0",
-"7293*0=0",
-"7294*0=0",
-"7295*0=0",
-"7296*0=0",
-"7297*0=0",
-"7298*0=0",
-"7299*0=0",
-"729/81=9",
-"729/9=81",
-"72+10=82",
-"72+11=83",
-"72+12=84",
-"72+13=85",
-"72+14=86",
-"72+15=87",
-"72+16=88",
-"72+17=89",
-"72+18=90",
-"72+19=91",
-"72+20=92",
-"72+21=93",
-"72+22=94",
-"72+23=95",
-"72+24=96",
-"72+25=97",
-"72+26=98",
-"72+27=99",
-"72-10=62",
-"72-11=61",
-"72-12=60",
-"72-13=59",
-"72-14=58",
-"72-15=57",
-"72-16=56",
-"72-17=55",
-"72-18=54",
-"72-19=53",
-"72-20=52",
-"72-21=51",
-"72-22=50",
-"72-23=49",
-"72-24=48",
-"72-25=47",
-"72-26=46",
-"72-27=45",
-"72-28=44",
-"72-29=43",
-"72-30=42",
-"72-31=41",
-"72-32=40",
-"72-33=39",
-"72-34=38",
-"72-35=37",
-"72-36=36",
-"72-37=35",
-"72-38=34",
-"72-39=33",
-"72-40=32",
-"72-41=31",
-"72-42=30",
-"72-43=29",
-"72-44=28",
-"72-45=27",
-"72-46=26",
-"72-47=25",
-"72-48=24",
-"72-49=23",
-"72-50=22",
-"72-51=21",
-"72-52=20",
-"72-53=19",
-"72-54=18",
-"72-55=17",
-"72-56=16",
-"72-57=15",
-"72-58=14",
-"72-59=13",
-"72-60=12",
-"72-61=11",
-"72-62=10",
-"72-73=-1",
-"72-74=-2",
-"72-75=-3",
-"72-76=-4",
-"72-77=-5",
-"72-78=-6",
-"72-79=-7",
-"72-7*9=9",
-"72-80=-8",
-"72-81=-9",
-"72-8*8=8",
-"72-8*9=0",
-"72-9*7=9",
-"72-9*8=0",
-"72*0+0=0",
-"72*0+1=1",
-"72*0+2=2",
-"72*0+3=3",
-"72*0+4=4",
-"72*0+5=5",
-"72*0+6=6",
-"72*0+7=7",
-"72*0+8=8",
-"72*0+9=9",
-"72*0-0=0",
-"72*0*0=0",
-"72*0*1=0",
-"72*0*2=0",
-"72*0*3=0",
-"72*0*4=0",
-"72*0*5=0",
-"72*0*6=0",
-"72*0*7=0",
-"72*0*8=0",
-"72*0*9=0",
-"72*0/1=0",
-"72*0/2=0",
-"72*0/3=0",
-"72*0/4=0",
-"72*0/5=0",
-"72*0/6=0",
-"72*0/7=0",
-"72*0/8=0",
-"72*0/9=0",
-"72*1*0=0",
-"72*1/8=9",
-"72*1/9=8",
-"72*2*0=0",
-"72*2=144",
-"72*3*0=0",
-"72*3=216",
-"72*4*0=0",
-"72*4=288",
-"72*5*0=0",
-"72*5=360",
-"72*6*0=0",
-"72*6=432",
-"72*7*0=0",
-"72*7=504",
-"72*8*0=0",
-"72*8=576",
-"72*9*0=0",
-"72*9=648",
-"72/1*0=0",
-"72/1/8=9",
-"72/1/9=8",
-"72/2*0=0",
-"72/2/4=9",
-"72/2/6=6",
-"72/2/9=4",
-"72/3*0=0",
-"72/3/3=8",
-"72/3/4=6",
-"72/3/6=4",
-"72/3/8=3",
-"72/4-9=9",
-"72/4*0=0",
-"72/4/2=9",
-"72/4/3=6",
-"72/4/6=3",
-"72/4/9=2",
-"72/5*0=0",
-"72/6-3=9",
-"72/6-4=8",
-"72/6-5=7",
-"72/6-6=6",
-"72/6-7=5",
-"72/6-8=4",
-"72/6-9=3",
-"72/6*0=0",
-"72/6/2=6",
-"72/6/3=4",
-"72/6/4=3",
-"72/6/6=2",
-"72/7*0=0",
-"72/8+0=9",
-"72/8-0=9",
-"72/8-1=8",
-"72/8-2=7",
-"72/8-3=6",
-"72/8-4=5",
-"72/8-5=4",
-"72/8-6=3",
-"72/8-7=2",
-"72/8-8=1",
-"72/8-9=0",
-"72/8*0=0",
-"72/8*1=9",
-"72/8/1=9",
-"72/8/3=3",
-"72/8/9=1",
-"72/9+0=8",
-"72/9+1=9",
-"72/9-0=8",
-"72/9-1=7",
-"72/9-2=6",
-"72/9-3=5",
-"72/9-4=4",
-"72/9-5=3",
-"72/9-6=2",
-"72/9-7=1",
-"72/9-8=0",
-"72/9*0=0",
-"72/9*1=8",
-"72/9/1=8",
-"72/9/2=4",
-"72/9/4=2",
-"72/9/8=1",
-"7300*0=0",
-"7301*0=0",
-"7302*0=0",
-"7303*0=0",
-"7304*0=0",
-"7305*0=0",
-"7306*0=0",
-"7307*0=0",
-"7308*0=0",
-"7309*0=0",
-"7310*0=0",
-"7311*0=0",
-"7312*0=0",
-"7313*0=0",
-"7314*0=0",
-"7315*0=0",
-"7316*0=0",
-"7317*0=0",
-"7318*0=0",
-"7319*0=0",
-"7320*0=0",
-"7321*0=0",
-"7322*0=0",
-"7323*0=0",
-"7324*0=0",
-"7325*0=0",
-"7326*0=0",
-"7327*0=0",
-"7328*0=0",
-"7329*0=0",
-"7330*0=0",
-"7331*0=0",
-"7332*0=0",
-"7333*0=0",
-"7334*0=0",
-"7335*0=0",
-"7336*0=0",
-"7337*0=0",
-"7338*0=0",
-"7339*0=0",
-"7340*0=0",
-"7341*0=0",
-"7342*0=0",
-"7343*0=0",
-"7344*0=0",
-"7345*0=0",
-"7346*0=0",
-"7347*0=0",
-"7348*0=0",
-"7349*0=0",
-"7350*0=0",
-"7351*0=0",
-"7352*0=0",
-"7353*0=0",
-"7354*0=0",
-"7355*0=0",
-"7356*0=0",
-"7357*0=0",
-"7358*0=0",
-"7359*0=0",
-"7360*0=0",
-"7361*0=0",
-"7362*0=0",
-"7363*0=0",
-"7364*0=0",
-"7365*0=0",
-"7366*0=0",
-"7367*0=0",
-"7368*0=0",
-"7369*0=0",
-"736/8=92",
-"736/92=8",
-"7370*0=0",
-"7371*0=0",
-"7372*0=0",
-"7373*0=0",
-"7374*0=0",
-"7375*0=0",
-"7376*0=0",
-"7377*0=0",
-"7378*0=0",
-"7379*0=0",
-"7380*0=0",
-"7381*0=0",
-"7382*0=0",
-"7383*0=0",
-"7384*0=0",
-"7385*0=0",
-"7386*0=0",
-"7387*0=0",
-"7388*0=0",
-"7389*0=0",
-"738/82=9",
-"738/9=82",
-"7390*0=0",
-"7391*0=0",
-"7392*0=0",
-"7393*0=0",
-"7394*0=0",
-"7395*0=0",
-"7396*0=0",
-"7397*0=0",
-"7398*0=0",
-"7399*0=0",
-"73+10=83",
-"73+11=84",
-"73+12=85",
-"73+13=86",
-"73+14=87",
-"73+15=88",
-"73+16=89",
-"73+17=90",
-"73+18=91",
-"73+19=92",
-"73+20=93",
-"73+21=94",
-"73+22=95",
-"73+23=96",
-"73+24=97",
-"73+25=98",
-"73+26=99",
-"73-10=63",
-"73-11=62",
-"73-12=61",
-"73-13=60",
-"73-14=59",
-"73-15=58",
-"73-16=57",
-"73-17=56",
-"73-18=55",
-"73-19=54",
-"73-20=53",
-"73-21=52",
-"73-22=51",
-"73-23=50",
-"73-24=49",
-"73-25=48",
-"73-26=47",
-"73-27=46",
-"73-28=45",
-"73-29=44",
-"73-30=43",
-"73-31=42",
-"73-32=41",
-"73-33=40",
-"73-34=39",
-"73-35=38",
-"73-36=37",
-"73-37=36",
-"73-38=35",
-"73-39=34",
-"73-40=33",
-"73-41=32",
-"73-42=31",
-"73-43=30",
-"73-44=29",
-"73-45=28",
-"73-46=27",
-"73-47=26",
-"73-48=25",
-"73-49=24",
-"73-50=23",
-"73-51=22",
-"73-52=21",
-"73-53=20",
-"73-54=19",
-"73-55=18",
-"73-56=17",
-"73-57=16",
-"73-58=15",
-"73-59=14",
-"73-60=13",
-"73-61=12",
-"73-62=11",
-"73-63=10",
-"73-74=-1",
-"73-75=-2",
-"73-76=-3",
-"73-77=-4",
-"73-78=-5",
-"73-79=-6",
-"73-80=-7",
-"73-81=-8",
-"73-82=-9",
-"73-8*8=9",
-"73-8*9=1",
-"73-9*8=1",
-"73*0+0=0",
-"73*0+1=1",
-"73*0+2=2",
-"73*0+3=3",
-"73*0+4=4",
-"73*0+5=5",
-"73*0+6=6",
-"73*0+7=7",
-"73*0+8=8",
-"73*0+9=9",
-"73*0-0=0",
-"73*0*0=0",
-"73*0*1=0",
-"73*0*2=0",
-"73*0*3=0",
-"73*0*4=0",
-"73*0*5=0",
-"73*0*6=0",
-"73*0*7=0",
-"73*0*8=0",
-"73*0*9=0",
-"73*0/1=0",
-"73*0/2=0",
-"73*0/3=0",
-"73*0/4=0",
-"73*0/5=0",
-"73*0/6=0",
-"73*0/7=0",
-"73*0/8=0",
-"73*0/9=0",
-"73*1*0=0",
-"73*2*0=0",
-"73*2=146",
-"73*3*0=0",
-"73*3=219",
-"73*4*0=0",
-"73*4=292",
-"73*5*0=0",
-"73*5=365",
-"73*6*0=0",
-"73*6=438",
-"73*7*0=0",
-"73*7=511",
-"73*8*0=0",
-"73*8=584",
-"73*9*0=0",
-"73*9=657",
-"73/1*0=0",
-"73/2*0=0",
-"73/3*0=0",
-"73/4*0=0",
-"73/5*0=0",
-"73/6*0=0",
-"73/7*0=0",
-"73/8*0=0",
-"73/9*0=0",
-"7400*0=0",
-"7401*0=0",
-"7402*0=0",
-"7403*0=0",
-"7404*0=0",
-"7405*0=0",
-"7406*0=0",
-"7407*0=0",
-"7408*0=0",
-"7409*0=0",
-"7410*0=0",
-"7411*0=0",
-"7412*0=0",
-"7413*0=0",
-"7414*0=0",
-"7415*0=0",
-"7416*0=0",
-"7417*0=0",
-"7418*0=0",
-"7419*0=0",
-"7420*0=0",
-"7421*0=0",
-"7422*0=0",
-"7423*0=0",
-"7424*0=0",
-"7425*0=0",
-"7426*0=0",
-"7427*0=0",
-"7428*0=0",
-"7429*0=0",
-"7430*0=0",
-"7431*0=0",
-"7432*0=0",
-"7433*0=0",
-"7434*0=0",
-"7435*0=0",
-"7436*0=0",
-"7437*0=0",
-"7438*0=0",
-"7439*0=0",
-"7440*0=0",
-"7441*0=0",
-"7442*0=0",
-"7443*0=0",
-"7444*0=0",
-"7445*0=0",
-"7446*0=0",
-"7447*0=0",
-"7448*0=0",
-"7449*0=0",
-"744/8=93",
-"744/93=8",
-"7450*0=0",
-"7451*0=0",
-"7452*0=0",
-"7453*0=0",
-"7454*0=0",
-"7455*0=0",
-"7456*0=0",
-"7457*0=0",
-"7458*0=0",
-"7459*0=0",
-"7460*0=0",
-"7461*0=0",
-"7462*0=0",
-"7463*0=0",
-"7464*0=0",
-"7465*0=0",
-"7466*0=0",
-"7467*0=0",
-"7468*0=0",
-"7469*0=0",
-"7470*0=0",
-"7471*0=0",
-"7472*0=0",
-"7473*0=0",
-"7474*0=0",
-"7475*0=0",
-"7476*0=0",
-"7477*0=0",
-"7478*0=0",
-"7479*0=0",
-"747/83=9",
-"747/9=83",
-"7480*0=0",
-"7481*0=0",
-"7482*0=0",
-"7483*0=0",
-"7484*0=0",
-"7485*0=0",
-"7486*0=0",
-"7487*0=0",
-"7488*0=0",
-"7489*0=0",
-"7490*0=0",
-"7491*0=0",
-"7492*0=0",
-"7493*0=0",
-"7494*0=0",
-"7495*0=0",
-"7496*0=0",
-"7497*0=0",
-"7498*0=0",
-"7499*0=0",
-"74+10=84",
-"74+11=85",
-"74+12=86",
-"74+13=87",
-"74+14=88",
-"74+15=89",
-"74+16=90",
-"74+17=91",
-"74+18=92",
-"74+19=93",
-"74+20=94",
-"74+21=95",
-"74+22=96",
-"74+23=97",
-"74+24=98",
-"74+25=99",
-"74-10=64",
-"74-11=63",
-"74-12=62",
-"74-13=61",
-"74-14=60",
-"74-15=59",
-"74-16=58",
-"74-17=57",
-"74-18=56",
-"74-19=55",
-"74-20=54",
-"74-21=53",
-"74-22=52",
-"74-23=51",
-"74-24=50",
-"74-25=49",
-"74-26=48",
-"74-27=47",
-"74-28=46",
-"74-29=45",
-"74-30=44",
-"74-31=43",
-"74-32=42",
-"74-33=41",
-"74-34=40",
-"74-35=39",
-"74-36=38",
-"74-37=37",
-"74-38=36",
-"74-39=35",
-"74-40=34",
-"74-41=33",
-"74-42=32",
-"74-43=31",
-"74-44=30",
-"74-45=29",
-"74-46=28",
-"74-47=27",
-"74-48=26",
-"74-49=25",
-"74-50=24",
-"74-51=23",
-"74-52=22",
-"74-53=21",
-"74-54=20",
-"74-55=19",
-"74-56=18",
-"74-57=17",
-"74-58=16",
-"74-59=15",
-"74-60=14",
-"74-61=13",
-"74-62=12",
-"74-63=11",
-"74-64=10",
-"74-75=-1",
-"74-76=-2",
-"74-77=-3",
-"74-78=-4",
-"74-79=-5",
-"74-80=-6",
-"74-81=-7",
-"74-82=-8",
-"74-83=-9",
-"74-8*9=2",
-"74-9*8=2",
-"74*0+0=0",
-"74*0+1=1",
-"74*0+2=2",
-"74*0+3=3",
-"74*0+4=4",
-"74*0+5=5",
-"74*0+6=6",
-"74*0+7=7",
-"74*0+8=8",
-"74*0+9=9",
-"74*0-0=0",
-"74*0*0=0",
-"74*0*1=0",
-"74*0*2=0",
-"74*0*3=0",
-"74*0*4=0",
-"74*0*5=0",
-"74*0*6=0",
-"74*0*7=0",
-"74*0*8=0",
-"74*0*9=0",
-"74*0/1=0",
-"74*0/2=0",
-"74*0/3=0",
-"74*0/4=0",
-"74*0/5=0",
-"74*0/6=0",
-"74*0/7=0",
-"74*0/8=0",
-"74*0/9=0",
-"74*1*0=0",
-"74*2*0=0",
-"74*2=148",
-"74*3*0=0",
-"74*3=222",
-"74*4*0=0",
-"74*4=296",
-"74*5*0=0",
-"74*5=370",
-"74*6*0=0",
-"74*6=444",
-"74*7*0=0",
-"74*7=518",
-"74*8*0=0",
-"74*8=592",
-"74*9*0=0",
-"74*9=666",
-"74/1*0=0",
-"74/2*0=0",
-"74/3*0=0",
-"74/4*0=0",
-"74/5*0=0",
-"74/6*0=0",
-"74/7*0=0",
-"74/8*0=0",
-"74/9*0=0",
-"7500*0=0",
-"7501*0=0",
-"7502*0=0",
-"7503*0=0",
-"7504*0=0",
-"7505*0=0",
-"7506*0=0",
-"7507*0=0",
-"7508*0=0",
-"7509*0=0",
-"7510*0=0",
-"7511*0=0",
-"7512*0=0",
-"7513*0=0",
-"7514*0=0",
-"7515*0=0",
-"7516*0=0",
-"7517*0=0",
-"7518*0=0",
-"7519*0=0",
-"7520*0=0",
-"7521*0=0",
-"7522*0=0",
-"7523*0=0",
-"7524*0=0",
-"7525*0=0",
-"7526*0=0",
-"7527*0=0",
-"7528*0=0",
-"7529*0=0",
-"752/8=94",
-"752/94=8",
-"7530*0=0",
-"7531*0=0",
-"7532*0=0",
-"7533*0=0",
-"7534*0=0",
-"7535*0=0",
-"7536*0=0",
-"7537*0=0",
-"7538*0=0",
-"7539*0=0",
-"7540*0=0",
-"7541*0=0",
-"7542*0=0",
-"7543*0=0",
-"7544*0=0",
-"7545*0=0",
-"7546*0=0",
-"7547*0=0",
-"7548*0=0",
-"7549*0=0",
-"7550*0=0",
-"7551*0=0",
-"7552*0=0",
-"7553*0=0",
-"7554*0=0",
-"7555*0=0",
-"7556*0=0",
-"7557*0=0",
-"7558*0=0",
-"7559*0=0",
-"7560*0=0",
-"7561*0=0",
-"7562*0=0",
-"7563*0=0",
-"7564*0=0",
-"7565*0=0",
-"7566*0=0",
-"7567*0=0",
-"7568*0=0",
-"7569*0=0",
-"756/84=9",
-"756/9=84",
-"7570*0=0",
-"7571*0=0",
-"7572*0=0",
-"7573*0=0",
-"7574*0=0",
-"7575*0=0",
-"7576*0=0",
-"7577*0=0",
-"7578*0=0",
-"7579*0=0",
-"7580*0=0",
-"7581*0=0",
-"7582*0=0",
-"7583*0=0",
-"7584*0=0",
-"7585*0=0",
-"7586*0=0",
-"7587*0=0",
-"7588*0=0",
-"7589*0=0",
-"7590*0=0",
-"7591*0=0",
-"7592*0=0",
-"7593*0=0",
-"7594*0=0",
-"7595*0=0",
-"7596*0=0",
-"7597*0=0",
-"7598*0=0",
-"7599*0=0",
-"75+10=85",
-"75+11=86",
-"75+12=87",
-"75+13=88",
-"75+14=89",
-"75+15=90",
-"75+16=91",
-"75+17=92",
-"75+18=93",
-"75+19=94",
-"75+20=95",
-"75+21=96",
-"75+22=97",
-"75+23=98",
-"75+24=99",
-"75-10=65",
-"75-11=64",
-"75-12=63",
-"75-13=62",
-"75-14=61",
-"75-15=60",
-"75-16=59",
-"75-17=58",
-"75-18=57",
-"75-19=56",
-"75-20=55",
-"75-21=54",
-"75-22=53",
-"75-23=52",
-"75-24=51",
-"75-25=50",
-"75-26=49",
-"75-27=48",
-"75-28=47",
-"75-29=46",
-"75-30=45",
-"75-31=44",
-"75-32=43",
-"75-33=42",
-"75-34=41",
-"75-35=40",
-"75-36=39",
-"75-37=38",
-"75-38=37",
-"75-39=36",
-"75-40=35",
-"75-41=34",
-"75-42=33",
-"75-43=32",
-"75-44=31",
-"75-45=30",
-"75-46=29",
-"75-47=28",
-"75-48=27",
-"75-49=26",
-"75-50=25",
-"75-51=24",
-"75-52=23",
-"75-53=22",
-"75-54=21",
-"75-55=20",
-"75-56=19",
-"75-57=18",
-"75-58=17",
-"75-59=16",
-"75-60=15",
-"75-61=14",
-"75-62=13",
-"75-63=12",
-"75-64=11",
-"75-65=10",
-"75-76=-1",
-"75-77=-2",
-"75-78=-3",
-"75-79=-4",
-"75-80=-5",
-"75-81=-6",
-"75-82=-7",
-"75-83=-8",
-"75-84=-9",
-"75-8*9=3",
-"75-9*8=3",
-"75*0+0=0",
-"75*0+1=1",
-"75*0+2=2",
-"75*0+3=3",
-"75*0+4=4",
-"75*0+5=5",
-"75*0+6=6",
-"75*0+7=7",
-"75*0+8=8",
-"75*0+9=9",
-"75*0-0=0",
-"75*0*0=0",
-"75*0*1=0",
-"75*0*2=0",
-"75*0*3=0",
-"75*0*4=0",
-"75*0*5=0",
-"75*0*6=0",
-"75*0*7=0",
-"75*0*8=0",
-"75*0*9=0",
-"75*0/1=0",
-"75*0/2=0",
-"75*0/3=0",
-"75*0/4=0",
-"75*0/5=0",
-"75*0/6=0",
-"75*0/7=0",
-"75*0/8=0",
-"75*0/9=0",
-"75*1*0=0",
-"75*2*0=0",
-"75*2=150",
-"75*3*0=0",
-"75*3=225",
-"75*4*0=0",
-"75*4=300",
-"75*5*0=0",
-"75*5=375",
-"75*6*0=0",
-"75*6=450",
-"75*7*0=0",
-"75*7=525",
-"75*8*0=0",
-"75*8=600",
-"75*9*0=0",
-"75*9=675",
-"75/1*0=0",
-"75/2*0=0",
-"75/3*0=0",
-"75/3/5=5",
-"75/4*0=0",
-"75/5-6=9",
-"75/5-7=8",
-"75/5-8=7",
-"75/5-9=6",
-"75/5*0=0",
-"75/5/3=5",
-"75/5/5=3",
-"75/6*0=0",
-"75/7*0=0",
-"75/8*0=0",
-"75/9*0=0",
-"7600*0=0",
-"7601*0=0",
-"7602*0=0",
-"7603*0=0",
-"7604*0=0",
-"7605*0=0",
-"7606*0=0",
-"7607*0=0",
-"7608*0=0",
-"7609*0=0",
-"760/8=95",
-"760/95=8",
-"7610*0=0",
-"7611*0=0",
-"7612*0=0",
-"7613*0=0",
-"7614*0=0",
-"7615*0=0",
-"7616*0=0",
-"7617*0=0",
-"7618*0=0",
-"7619*0=0",
-"7620*0=0",
-"7621*0=0",
-"7622*0=0",
-"7623*0=0",
-"7624*0=0",
-"7625*0=0",
-"7626*0=0",
-"7627*0=0",
-"7628*0=0",
-"7629*0=0",
-"7630*0=0",
-"7631*0=0",
-"7632*0=0",
-"7633*0=0",
-"7634*0=0",
-"7635*0=0",
-"7636*0=0",
-"7637*0=0",
-"7638*0=0",
-"7639*0=0",
-"7640*0=0",
-"7641*0=0",
-"7642*0=0",
-"7643*0=0",
-"7644*0=0",
-"7645*0=0",
-"7646*0=0",
-"7647*0=0",
-"7648*0=0",
-"7649*0=0",
-"7650*0=0",
-"7651*0=0",
-"7652*0=0",
-"7653*0=0",
-"7654*0=0",
-"7655*0=0",
-"7656*0=0",
-"7657*0=0",
-"7658*0=0",
-"7659*0=0",
-"765/85=9",
-"765/9=85",
-"7660*0=0",
-"7661*0=0",
-"7662*0=0",
-"7663*0=0",
-"7664*0=0",
-"7665*0=0",
-"7666*0=0",
-"7667*0=0",
-"7668*0=0",
-"7669*0=0",
-"7670*0=0",
-"7671*0=0",
-"7672*0=0",
-"7673*0=0",
-"7674*0=0",
-"7675*0=0",
-"7676*0=0",
-"7677*0=0",
-"7678*0=0",
-"7679*0=0",
-"7680*0=0",
-"7681*0=0",
-"7682*0=0",
-"7683*0=0",
-"7684*0=0",
-"7685*0=0",
-"7686*0=0",
-"7687*0=0",
-"7688*0=0",
-"7689*0=0",
-"768/8=96",
-"768/96=8",
-"7690*0=0",
-"7691*0=0",
-"7692*0=0",
-"7693*0=0",
-"7694*0=0",
-"7695*0=0",
-"7696*0=0",
-"7697*0=0",
-"7698*0=0",
-"7699*0=0",
-"76+10=86",
-"76+11=87",
-"76+12=88",
-"76+13=89",
-"76+14=90",
-"76+15=91",
-"76+16=92",
-"76+17=93",
-"76+18=94",
-"76+19=95",
-"76+20=96",
-"76+21=97",
-"76+22=98",
-"76+23=99",
-"76-10=66",
-"76-11=65",
-"76-12=64",
-"76-13=63",
-"76-14=62",
-"76-15=61",
-"76-16=60",
-"76-17=59",
-"76-18=58",
-"76-19=57",
-"76-20=56",
-"76-21=55",
-"76-22=54",
-"76-23=53",
-"76-24=52",
-"76-25=51",
-"76-26=50",
-"76-27=49",
-"76-28=48",
-"76-29=47",
-"76-30=46",
-"76-31=45",
-"76-32=44",
-"76-33=43",
-"76-34=42",
-"76-35=41",
-"76-36=40",
-"76-37=39",
-"76-38=38",
-"76-39=37",
-"76-40=36",
-"76-41=35",
-"76-42=34",
-"76-43=33",
-"76-44=32",
-"76-45=31",
-"76-46=30",
-"76-47=29",
-"76-48=28",
-"76-49=27",
-"76-50=26",
-"76-51=25",
-"76-52=24",
-"76-53=23",
-"76-54=22",
-"76-55=21",
-"76-56=20",
-"76-57=19",
-"76-58=18",
-"76-59=17",
-"76-60=16",
-"76-61=15",
-"76-62=14",
-"76-63=13",
-"76-64=12",
-"76-65=11",
-"76-66=10",
-"76-77=-1",
-"76-78=-2",
-"76-79=-3",
-"76-80=-4",
-"76-81=-5",
-"76-82=-6",
-"76-83=-7",
-"76-84=-8",
-"76-85=-9",
-"76-8*9=4",
-"76-9*8=4",
-"76*0+0=0",
-"76*0+1=1",
-"76*0+2=2",
-"76*0+3=3",
-"76*0+4=4",
-"76*0+5=5",
-"76*0+6=6",
-"76*0+7=7",
-"76*0+8=8",
-"76*0+9=9",
-"76*0-0=0",
-"76*0*0=0",
-"76*0*1=0",
-"76*0*2=0",
-"76*0*3=0",
-"76*0*4=0",
-"76*0*5=0",
-"76*0*6=0",
-"76*0*7=0",
-"76*0*8=0",
-"76*0*9=0",
-"76*0/1=0",
-"76*0/2=0",
-"76*0/3=0",
-"76*0/4=0",
-"76*0/5=0",
-"76*0/6=0",
-"76*0/7=0",
-"76*0/8=0",
-"76*0/9=0",
-"76*1*0=0",
-"76*2*0=0",
-"76*2=152",
-"76*3*0=0",
-"76*3=228",
-"76*4*0=0",
-"76*4=304",
-"76*5*0=0",
-"76*5=380",
-"76*6*0=0",
-"76*6=456",
-"76*7*0=0",
-"76*7=532",
-"76*8*0=0",
-"76*8=608",
-"76*9*0=0",
-"76*9=684",
-"76/1*0=0",
-"76/2*0=0",
-"76/3*0=0",
-"76/4*0=0",
-"76/5*0=0",
-"76/6*0=0",
-"76/7*0=0",
-"76/8*0=0",
-"76/9*0=0",
-"7700*0=0",
-"7701*0=0",
-"7702*0=0",
-"7703*0=0",
-"7704*0=0",
-"7705*0=0",
-"7706*0=0",
-"7707*0=0",
-"7708*0=0",
-"7709*0=0",
-"7710*0=0",
-"7711*0=0",
-"7712*0=0",
-"7713*0=0",
-"7714*0=0",
-"7715*0=0",
-"7716*0=0",
-"7717*0=0",
-"7718*0=0",
-"7719*0=0",
-"7720*0=0",
-"7721*0=0",
-"7722*0=0",
-"7723*0=0",
-"7724*0=0",
-"7725*0=0",
-"7726*0=0",
-"7727*0=0",
-"7728*0=0",
-"7729*0=0",
-"7730*0=0",
-"7731*0=0",
-"7732*0=0",
-"7733*0=0",
-"7734*0=0",
-"7735*0=0",
-"7736*0=0",
-"7737*0=0",
-"7738*0=0",
-"7739*0=0",
-"7740*0=0",
-"7741*0=0",
-"7742*0=0",
-"7743*0=0",
-"7744*0=0",
-"7745*0=0",
-"7746*0=0",
-"7747*0=0",
-"7748*0=0",
-"7749*0=0",
-"774/86=9",
-"774/9=86",
-"7750*0=0",
-"7751*0=0",
-"7752*0=0",
-"7753*0=0",
-"7754*0=0",
-"7755*0=0",
-"7756*0=0",
-"7757*0=0",
-"7758*0=0",
-"7759*0=0",
-"7760*0=0",
-"7761*0=0",
-"7762*0=0",
-"7763*0=0",
-"7764*0=0",
-"7765*0=0",
-"7766*0=0",
-"7767*0=0",
-"7768*0=0",
-"7769*0=0",
-"776/8=97",
-"776/97=8",
-"7770*0=0",
-"7771*0=0",
-"7772*0=0",
-"7773*0=0",
-"7774*0=0",
-"7775*0=0",
-"7776*0=0",
-"7777*0=0",
-"7778*0=0",
-"7779*0=0",
-"7780*0=0",
-"7781*0=0",
-"7782*0=0",
-"7783*0=0",
-"7784*0=0",
-"7785*0=0",
-"7786*0=0",
-"7787*0=0",
-"7788*0=0",
-"7789*0=0",
-"7790*0=0",
-"7791*0=0",
-"7792*0=0",
-"7793*0=0",
-"7794*0=0",
-"7795*0=0",
-"7796*0=0",
-"7797*0=0",
-"7798*0=0",
-"7799*0=0",
-"77+10=87",
-"77+11=88",
-"77+12=89",
-"77+13=90",
-"77+14=91",
-"77+15=92",
-"77+16=93",
-"77+17=94",
-"77+18=95",
-"77+19=96",
-"77+20=97",
-"77+21=98",
-"77+22=99",
-"77-10=67",
-"77-11=66",
-"77-12=65",
-"77-13=64",
-"77-14=63",
-"77-15=62",
-"77-16=61",
-"77-17=60",
-"77-18=59",
-"77-19=58",
-"77-20=57",
-"77-21=56",
-"77-22=55",
-"77-23=54",
-"77-24=53",
-"77-25=52",
-"77-26=51",
-"77-27=50",
-"77-28=49",
-"77-29=48",
-"77-30=47",
-"77-31=46",
-"77-32=45",
-"77-33=44",
-"77-34=43",
-"77-35=42",
-"77-36=41",
-"77-37=40",
-"77-38=39",
-"77-39=38",
-"77-40=37",
-"77-41=36",
-"77-42=35",
-"77-43=34",
-"77-44=33",
-"77-45=32",
-"77-46=31",
-"77-47=30",
-"77-48=29",
-"77-49=28",
-"77-50=27",
-"77-51=26",
-"77-52=25",
-"77-53=24",
-"77-54=23",
-"77-55=22",
-"77-56=21",
-"77-57=20",
-"77-58=19",
-"77-59=18",
-"77-60=17",
-"77-61=16",
-"77-62=15",
-"77-63=14",
-"77-64=13",
-"77-65=12",
-"77-66=11",
-"77-67=10",
-"77-78=-1",
-"77-79=-2",
-"77-80=-3",
-"77-81=-4",
-"77-82=-5",
-"77-83=-6",
-"77-84=-7",
-"77-85=-8",
-"77-86=-9",
-"77-8*9=5",
-"77-9*8=5",
-"77*0+0=0",
-"77*0+1=1",
-"77*0+2=2",
-"77*0+3=3",
-"77*0+4=4",
-"77*0+5=5",
-"77*0+6=6",
-"77*0+7=7",
-"77*0+8=8",
-"77*0+9=9",
-"77*0-0=0",
-"77*0*0=0",
-"77*0*1=0",
-"77*0*2=0",
-"77*0*3=0",
-"77*0*4=0",
-"77*0*5=0",
-"77*0*6=0",
-"77*0*7=0",
-"77*0*8=0",
-"77*0*9=0",
-"77*0/1=0",
-"77*0/2=0",
-"77*0/3=0",
-"77*0/4=0",
-"77*0/5=0",
-"77*0/6=0",
-"77*0/7=0",
-"77*0/8=0",
-"77*0/9=0",
-"77*1*0=0",
-"77*2*0=0",
-"77*2=154",
-"77*3*0=0",
-"77*3=231",
-"77*4*0=0",
-"77*4=308",
-"77*5*0=0",
-"77*5=385",
-"77*6*0=0",
-"77*6=462",
-"77*7*0=0",
-"77*7=539",
-"77*8*0=0",
-"77*8=616",
-"77*9*0=0",
-"77*9=693",
-"77/1*0=0",
-"77/2*0=0",
-"77/3*0=0",
-"77/4*0=0",
-"77/5*0=0",
-"77/6*0=0",
-"77/7-2=9",
-"77/7-3=8",
-"77/7-4=7",
-"77/7-5=6",
-"77/7-6=5",
-"77/7-7=4",
-"77/7-8=3",
-"77/7-9=2",
-"77/7*0=0",
-"77/8*0=0",
-"77/9*0=0",
-"7800*0=0",
-"7801*0=0",
-"7802*0=0",
-"7803*0=0",
-"7804*0=0",
-"7805*0=0",
-"7806*0=0",
-"7807*0=0",
-"7808*0=0",
-"7809*0=0",
-"7810*0=0",
-"7811*0=0",
-"7812*0=0",
-"7813*0=0",
-"7814*0=0",
-"7815*0=0",
-"7816*0=0",
-"7817*0=0",
-"7818*0=0",
-"7819*0=0",
-"7820*0=0",
-"7821*0=0",
-"7822*0=0",
-"7823*0=0",
-"7824*0=0",
-"7825*0=0",
-"7826*0=0",
-"7827*0=0",
-"7828*0=0",
-"7829*0=0",
-"7830*0=0",
-"7831*0=0",
-"7832*0=0",
-"7833*0=0",
-"7834*0=0",
-"7835*0=0",
-"7836*0=0",
-"7837*0=0",
-"7838*0=0",
-"7839*0=0",
-"783/87=9",
-"783/9=87",
-"7840*0=0",
-"7841*0=0",
-"7842*0=0",
-"7843*0=0",
-"7844*0=0",
-"7845*0=0",
-"7846*0=0",
-"7847*0=0",
-"7848*0=0",
-"7849*0=0",
-"784/8=98",
-"784/98=8",
-"7850*0=0",
-"7851*0=0",
-"7852*0=0",
-"7853*0=0",
-"7854*0=0",
-"7855*0=0",
-"7856*0=0",
-"7857*0=0",
-"7858*0=0",
-"7859*0=0",
-"7860*0=0",
-"7861*0=0",
-"7862*0=0",
-"7863*0=0",
-"7864*0=0",
-"7865*0=0",
-"7866*0=0",
-"7867*0=0",
-"7868*0=0",
-"7869*0=0",
-"7870*0=0",
-"7871*0=0",
-"7872*0=0",
-"7873*0=0",
-"7874*0=0",
-"7875*0=0",
-"7876*0=0",
-"7877*0=0",
-"7878*0=0",
-"7879*0=0",
-"7880*0=0",
-"7881*0=0",
-"7882*0=0",
-"7883*0=0",
-"7884*0=0",
-"7885*0=0",
-"7886*0=0",
-"7887*0=0",
-"7888*0=0",
-"7889*0=0",
-"7890*0=0",
-"7891*0=0",
-"7892*0=0",
-"7893*0=0",
-"7894*0=0",
-"7895*0=0",
-"7896*0=0",
-"7897*0=0",
-"7898*0=0",
-"7899*0=0",
-"78+10=88",
-"78+11=89",
-"78+12=90",
-"78+13=91",
-"78+14=92",
-"78+15=93",
-"78+16=94",
-"78+17=95",
-"78+18=96",
-"78+19=97",
-"78+20=98",
-"78+21=99",
-"78-10=68",
-"78-11=67",
-"78-12=66",
-"78-13=65",
-"78-14=64",
-"78-15=63",
-"78-16=62",
-"78-17=61",
-"78-18=60",
-"78-19=59",
-"78-20=58",
-"78-21=57",
-"78-22=56",
-"78-23=55",
-"78-24=54",
-"78-25=53",
-"78-26=52",
-"78-27=51",
-"78-28=50",
-"78-29=49",
-"78-30=48",
-"78-31=47",
-"78-32=46",
-"78-33=45",
-"78-34=44",
-"78-35=43",
-"78-36=42",
-"78-37=41",
-"78-38=40",
-"78-39=39",
-"78-40=38",
-"78-41=37",
-"78-42=36",
-"78-43=35",
-"78-44=34",
-"78-45=33",
-"78-46=32",
-"78-47=31",
-"78-48=30",
-"78-49=29",
-"78-50=28",
-"78-51=27",
-"78-52=26",
-"78-53=25",
-"78-54=24",
-"78-55=23",
-"78-56=22",
-"78-57=21",
-"78-58=20",
-"78-59=19",
-"78-60=18",
-"78-61=17",
-"78-62=16",
-"78-63=15",
-"78-64=14",
-"78-65=13",
-"78-66=12",
-"78-67=11",
-"78-68=10",
-"78-79=-1",
-"78-80=-2",
-"78-81=-3",
-"78-82=-4",
-"78-83=-5",
-"78-84=-6",
-"78-85=-7",
-"78-86=-8",
-"78-87=-9",
-"78-8*9=6",
-"78-9*8=6",
-"78*0+0=0",
-"78*0+1=1",
-"78*0+2=2",
-"78*0+3=3",
-"78*0+4=4",
-"78*0+5=5",
-"78*0+6=6",
-"78*0+7=7",
-"78*0+8=8",
-"78*0+9=9",
-"78*0-0=0",
-"78*0*0=0",
-"78*0*1=0",
-"78*0*2=0",
-"78*0*3=0",
-"78*0*4=0",
-"78*0*5=0",
-"78*0*6=0",
-"78*0*7=0",
-"78*0*8=0",
-"78*0*9=0",
-"78*0/1=0",
-"78*0/2=0",
-"78*0/3=0",
-"78*0/4=0",
-"78*0/5=0",
-"78*0/6=0",
-"78*0/7=0",
-"78*0/8=0",
-"78*0/9=0",
-"78*1*0=0",
-"78*2*0=0",
-"78*2=156",
-"78*3*0=0",
-"78*3=234",
-"78*4*0=0",
-"78*4=312",
-"78*5*0=0",
-"78*5=390",
-"78*6*0=0",
-"78*6=468",
-"78*7*0=0",
-"78*7=546",
-"78*8*0=0",
-"78*8=624",
-"78*9*0=0",
-"78*9=702",
-"78/1*0=0",
-"78/2*0=0",
-"78/3*0=0",
-"78/4*0=0",
-"78/5*0=0",
-"78/6-4=9",
-"78/6-5=8",
-"78/6-6=7",
-"78/6-7=6",
-"78/6-8=5",
-"78/6-9=4",
-"78/6*0=0",
-"78/7*0=0",
-"78/8*0=0",
-"78/9*0=0",
-"7900*0=0",
-"7901*0=0",
-"7902*0=0",
-"7903*0=0",
-"7904*0=0",
-"7905*0=0",
-"7906*0=0",
-"7907*0=0",
-"7908*0=0",
-"7909*0=0",
-"7910*0=0",
-"7911*0=0",
-"7912*0=0",
-"7913*0=0",
-"7914*0=0",
-"7915*0=0",
-"7916*0=0",
-"7917*0=0",
-"7918*0=0",
-"7919*0=0",
-"7920*0=0",
-"7921*0=0",
-"7922*0=0",
-"7923*0=0",
-"7924*0=0",
-"7925*0=0",
-"7926*0=0",
-"7927*0=0",
-"7928*0=0",
-"7929*0=0",
-"792/88=9",
-"792/8=99",
-"792/99=8",
-"792/9=88",
-"7930*0=0",
-"7931*0=0",
-"7932*0=0",
-"7933*0=0",
-"7934*0=0",
-"7935*0=0",
-"7936*0=0",
-"7937*0=0",
-"7938*0=0",
-"7939*0=0",
-"7940*0=0",
-"7941*0=0",
-"7942*0=0",
-"7943*0=0",
-"7944*0=0",
-"7945*0=0",
-"7946*0=0",
-"7947*0=0",
-"7948*0=0",
-"7949*0=0",
-"7950*0=0",
-"7951*0=0",
-"7952*0=0",
-"7953*0=0",
-"7954*0=0",
-"7955*0=0",
-"7956*0=0",
-"7957*0=0",
-"7958*0=0",
-"7959*0=0",
-"7960*0=0",
-"7961*0=0",
-"7962*0=0",
-"7963*0=0",
-"7964*0=0",
-"7965*0=0",
-"7966*0=0",
-"7967*0=0",
-"7968*0=0",
-"7969*0=0",
-"7970*0=0",
-"7971*0=0",
-"7972*0=0",
-"7973*0=0",
-"7974*0=0",
-"7975*0=0",
-"7976*0=0",
-"7977*0=0",
-"7978*0=0",
-"7979*0=0",
-"7980*0=0",
-"7981*0=0",
-"7982*0=0",
-"7983*0=0",
-"7984*0=0",
-"7985*0=0",
-"7986*0=0",
-"7987*0=0",
-"7988*0=0",
-"7989*0=0",
-"7990*0=0",
-"7991*0=0",
-"7992*0=0",
-"7993*0=0",
-"7994*0=0",
-"7995*0=0",
-"7996*0=0",
-"7997*0=0",
-"7998*0=0",
-"7999*0=0",
-"79+10=89",
-"79+11=90",
-"79+12=91",
-"79+13=92",
-"79+14=93",
-"79+15=94",
-"79+16=95",
-"79+17=96",
-"79+18=97",
-"79+19=98",
-"79+20=99",
-"79-10=69",
-"79-11=68",
-"79-12=67",
-"79-13=66",
-"79-14=65",
-"79-15=64",
-"79-16=63",
-"79-17=62",
-"79-18=61",
-"79-19=60",
-"79-20=59",
-"79-21=58",
-"79-22=57",
-"79-23=56",
-"79-24=55",
-"79-25=54",
-"79-26=53",
-"79-27=52",
-"79-28=51",
-"79-29=50",
-"79-30=49",
-"79-31=48",
-"79-32=47",
-"79-33=46",
-"79-34=45",
-"79-35=44",
-"79-36=43",
-"79-37=42",
-"79-38=41",
-"79-39=40",
-"79-40=39",
-"79-41=38",
-"79-42=37",
-"79-43=36",
-"79-44=35",
-"79-45=34",
-"79-46=33",
-"79-47=32",
-"79-48=31",
-"79-49=30",
-"79-50=29",
-"79-51=28",
-"79-52=27",
-"79-53=26",
-"79-54=25",
-"79-55=24",
-"79-56=23",
-"79-57=22",
-"79-58=21",
-"79-59=20",
-"79-60=19",
-"79-61=18",
-"79-62=17",
-"79-63=16",
-"79-64=15",
-"79-65=14",
-"79-66=13",
-"79-67=12",
-"79-68=11",
-"79-69=10",
-"79-80=-1",
-"79-81=-2",
-"79-82=-3",
-"79-83=-4",
-"79-84=-5",
-"79-85=-6",
-"79-86=-7",
-"79-87=-8",
-"79-88=-9",
-"79-8*9=7",
-"79-9*8=7",
-"79*0+0=0",
-"79*0+1=1",
-"79*0+2=2",
-"79*0+3=3",
-"79*0+4=4",
-"79*0+5=5",
-"79*0+6=6",
-"79*0+7=7",
-"79*0+8=8",
-"79*0+9=9",
-"79*0-0=0",
-"79*0*0=0",
-"79*0*1=0",
-"79*0*2=0",
-"79*0*3=0",
-"79*0*4=0",
-"79*0*5=0",
-"79*0*6=0",
-"79*0*7=0",
-"79*0*8=0",
-"79*0*9=0",
-"79*0/1=0",
-"79*0/2=0",
-"79*0/3=0",
-"79*0/4=0",
-"79*0/5=0",
-"79*0/6=0",
-"79*0/7=0",
-"79*0/8=0",
-"79*0/9=0",
-"79*1*0=0",
-"79*2*0=0",
-"79*2=158",
-"79*3*0=0",
-"79*3=237",
-"79*4*0=0",
-"79*4=316",
-"79*5*0=0",
-"79*5=395",
-"79*6*0=0",
-"79*6=474",
-"79*7*0=0",
-"79*7=553",
-"79*8*0=0",
-"79*8=632",
-"79*9*0=0",
-"79*9=711",
-"79/1*0=0",
-"79/2*0=0",
-"79/3*0=0",
-"79/4*0=0",
-"79/5*0=0",
-"79/6*0=0",
-"79/7*0=0",
-"79/8*0=0",
-"79/9*0=0",
-"7+0+3=10",
-"7+0+4=11",
-"7+0+5=12",
-"7+0+6=13",
-"7+0+7=14",
-"7+0+8=15",
-"7+0+9=16",
-"7+0-8=-1",
-"7+0-9=-2",
-"7+0*10=7",
-"7+0*11=7",
-"7+0*12=7",
-"7+0*13=7",
-"7+0*14=7",
-"7+0*15=7",
-"7+0*16=7",
-"7+0*17=7",
-"7+0*18=7",
-"7+0*19=7",
-"7+0*20=7",
-"7+0*21=7",
-"7+0*22=7",
-"7+0*23=7",
-"7+0*24=7",
-"7+0*25=7",
-"7+0*26=7",
-"7+0*27=7",
-"7+0*28=7",
-"7+0*29=7",
-"7+0*30=7",
-"7+0*31=7",
-"7+0*32=7",
-"7+0*33=7",
-"7+0*34=7",
-"7+0*35=7",
-"7+0*36=7",
-"7+0*37=7",
-"7+0*38=7",
-"7+0*39=7",
-"7+0*40=7",
-"7+0*41=7",
-"7+0*42=7",
-"7+0*43=7",
-"7+0*44=7",
-"7+0*45=7",
-"7+0*46=7",
-"7+0*47=7",
-"7+0*48=7",
-"7+0*49=7",
-"7+0*50=7",
-"7+0*51=7",
-"7+0*52=7",
-"7+0*53=7",
-"7+0*54=7",
-"7+0*55=7",
-"7+0*56=7",
-"7+0*57=7",
-"7+0*58=7",
-"7+0*59=7",
-"7+0*60=7",
-"7+0*61=7",
-"7+0*62=7",
-"7+0*63=7",
-"7+0*64=7",
-"7+0*65=7",
-"7+0*66=7",
-"7+0*67=7",
-"7+0*68=7",
-"7+0*69=7",
-"7+0*70=7",
-"7+0*71=7",
-"7+0*72=7",
-"7+0*73=7",
-"7+0*74=7",
-"7+0*75=7",
-"7+0*76=7",
-"7+0*77=7",
-"7+0*78=7",
-"7+0*79=7",
-"7+0*80=7",
-"7+0*81=7",
-"7+0*82=7",
-"7+0*83=7",
-"7+0*84=7",
-"7+0*85=7",
-"7+0*86=7",
-"7+0*87=7",
-"7+0*88=7",
-"7+0*89=7",
-"7+0*90=7",
-"7+0*91=7",
-"7+0*92=7",
-"7+0*93=7",
-"7+0*94=7",
-"7+0*95=7",
-"7+0*96=7",
-"7+0*97=7",
-"7+0*98=7",
-"7+0*99=7",
-"7+0/10=7",
-"7+0/11=7",
-"7+0/12=7",
-"7+0/13=7",
-"7+0/14=7",
-"7+0/15=7",
-"7+0/16=7",
-"7+0/17=7",
-"7+0/18=7",
-"7+0/19=7",
-"7+0/20=7",
-"7+0/21=7",
-"7+0/22=7",
-"7+0/23=7",
-"7+0/24=7",
-"7+0/25=7",
-"7+0/26=7",
-"7+0/27=7",
-"7+0/28=7",
-"7+0/29=7",
-"7+0/30=7",
-"7+0/31=7",
-"7+0/32=7",
-"7+0/33=7",
-"7+0/34=7",
-"7+0/35=7",
-"7+0/36=7",
-"7+0/37=7",
-"7+0/38=7",
-"7+0/39=7",
-"7+0/40=7",
-"7+0/41=7",
-"7+0/42=7",
-"7+0/43=7",
-"7+0/44=7",
-"7+0/45=7",
-"7+0/46=7",
-"7+0/47=7",
-"7+0/48=7",
-"7+0/49=7",
-"7+0/50=7",
-"7+0/51=7",
-"7+0/52=7",
-"7+0/53=7",
-"7+0/54=7",
-"7+0/55=7",
-"7+0/56=7",
-"7+0/57=7",
-"7+0/58=7",
-"7+0/59=7",
-"7+0/60=7",
-"7+0/61=7",
-"7+0/62=7",
-"7+0/63=7",
-"7+0/64=7",
-"7+0/65=7",
-"7+0/66=7",
-"7+0/67=7",
-"7+0/68=7",
-"7+0/69=7",
-"7+0/70=7",
-"7+0/71=7",
-"7+0/72=7",
-"7+0/73=7",
-"7+0/74=7",
-"7+0/75=7",
-"7+0/76=7",
-"7+0/77=7",
-"7+0/78=7",
-"7+0/79=7",
-"7+0/80=7",
-"7+0/81=7",
-"7+0/82=7",
-"7+0/83=7",
-"7+0/84=7",
-"7+0/85=7",
-"7+0/86=7",
-"7+0/87=7",
-"7+0/88=7",
-"7+0/89=7",
-"7+0/90=7",
-"7+0/91=7",
-"7+0/92=7",
-"7+0/93=7",
-"7+0/94=7",
-"7+0/95=7",
-"7+0/96=7",
-"7+0/97=7",
-"7+0/98=7",
-"7+0/99=7",
-"7+10-8=9",
-"7+10-9=8",
-"7+10*0=7",
-"7+10/5=9",
-"7+11-9=9",
-"7+11*0=7",
-"7+12*0=7",
-"7+12/6=9",
-"7+13*0=7",
-"7+14*0=7",
-"7+14/7=9",
-"7+15*0=7",
-"7+16*0=7",
-"7+16/8=9",
-"7+17*0=7",
-"7+18*0=7",
-"7+18/9=9",
-"7+19*0=7",
-"7+1+2=10",
-"7+1+3=11",
-"7+1+4=12",
-"7+1+5=13",
-"7+1+6=14",
-"7+1+7=15",
-"7+1+8=16",
-"7+1+9=17",
-"7+1-9=-1",
-"7+1*3=10",
-"7+1*4=11",
-"7+1*5=12",
-"7+1*6=13",
-"7+1*7=14",
-"7+1*8=15",
-"7+1*9=16",
-"7+20*0=7",
-"7+21*0=7",
-"7+22*0=7",
-"7+23*0=7",
-"7+24*0=7",
-"7+25*0=7",
-"7+26*0=7",
-"7+27*0=7",
-"7+28*0=7",
-"7+29*0=7",
-"7+2+1=10",
-"7+2+2=11",
-"7+2+3=12",
-"7+2+4=13",
-"7+2+5=14",
-"7+2+6=15",
-"7+2+7=16",
-"7+2+8=17",
-"7+2+9=18",
-"7+2*2=11",
-"7+2*3=13",
-"7+2*4=15",
-"7+2*5=17",
-"7+2*6=19",
-"7+2*7=21",
-"7+2*8=23",
-"7+2*9=25",
-"7+30*0=7",
-"7+31*0=7",
-"7+32*0=7",
-"7+33*0=7",
-"7+34*0=7",
-"7+35*0=7",
-"7+36*0=7",
-"7+37*0=7",
-"7+38*0=7",
-"7+39*0=7",
-"7+3+0=10",
-"7+3+1=11",
-"7+3+2=12",
-"7+3+3=13",
-"7+3+4=14",
-"7+3+5=15",
-"7+3+6=16",
-"7+3+7=17",
-"7+3+8=18",
-"7+3+9=19",
-"7+3-0=10",
-"7+3-10=0",
-"7+3*1=10",
-"7+3*2=13",
-"7+3*3=16",
-"7+3*4=19",
-"7+3*5=22",
-"7+3*6=25",
-"7+3*7=28",
-"7+3*8=31",
-"7+3*9=34",
-"7+3/1=10",
-"7+40*0=7",
-"7+41*0=7",
-"7+42*0=7",
-"7+43*0=7",
-"7+44*0=7",
-"7+45*0=7",
-"7+46*0=7",
-"7+47*0=7",
-"7+48*0=7",
-"7+49*0=7",
-"7+4+0=11",
-"7+4+1=12",
-"7+4+2=13",
-"7+4+3=14",
-"7+4+4=15",
-"7+4+5=16",
-"7+4+6=17",
-"7+4+7=18",
-"7+4+8=19",
-"7+4+9=20",
-"7+4-0=11",
-"7+4-10=1",
-"7+4-11=0",
-"7+4-1=10",
-"7+4*1=11",
-"7+4*2=15",
-"7+4*3=19",
-"7+4*4=23",
-"7+4*5=27",
-"7+4*6=31",
-"7+4*7=35",
-"7+4*8=39",
-"7+4*9=43",
-"7+4/1=11",
-"7+50*0=7",
-"7+51*0=7",
-"7+52*0=7",
-"7+53*0=7",
-"7+54*0=7",
-"7+55*0=7",
-"7+56*0=7",
-"7+57*0=7",
-"7+58*0=7",
-"7+59*0=7",
-"7+5+0=12",
-"7+5+1=13",
-"7+5+2=14",
-"7+5+3=15",
-"7+5+4=16",
-"7+5+5=17",
-"7+5+6=18",
-"7+5+7=19",
-"7+5+8=20",
-"7+5+9=21",
-"7+5-0=12",
-"7+5-10=2",
-"7+5-11=1",
-"7+5-12=0",
-"7+5-1=11",
-"7+5-2=10",
-"7+5*1=12",
-"7+5*2=17",
-"7+5*3=22",
-"7+5*4=27",
-"7+5*5=32",
-"7+5*6=37",
-"7+5*7=42",
-"7+5*8=47",
-"7+5*9=52",
-"7+5/1=12",
-"7+60*0=7",
-"7+61*0=7",
-"7+62*0=7",
-"7+63*0=7",
-"7+64*0=7",
-"7+65*0=7",
-"7+66*0=7",
-"7+67*0=7",
-"7+68*0=7",
-"7+69*0=7",
-"7+6+0=13",
-"7+6+1=14",
-"7+6+2=15",
-"7+6+3=16",
-"7+6+4=17",
-"7+6+5=18",
-"7+6+6=19",
-"7+6+7=20",
-"7+6+8=21",
-"7+6+9=22",
-"7+6-0=13",
-"7+6-10=3",
-"7+6-11=2",
-"7+6-12=1",
-"7+6-13=0",
-"7+6-1=12",
-"7+6-2=11",
-"7+6-3=10",
-"7+6*1=13",
-"7+6*2=19",
-"7+6*3=25",
-"7+6*4=31",
-"7+6*5=37",
-"7+6*6=43",
-"7+6*7=49",
-"7+6*8=55",
-"7+6*9=61",
-"7+6/1=13",
-"7+6/2=10",
-"7+70*0=7",
-"7+71*0=7",
-"7+72*0=7",
-"7+73*0=7",
-"7+74*0=7",
-"7+75*0=7",
-"7+76*0=7",
-"7+77*0=7",
-"7+78*0=7",
-"7+79*0=7",
-"7+7+0=14",
-"7+7+1=15",
-"7+7+2=16",
-"7+7+3=17",
-"7+7+4=18",
-"7+7+5=19",
-"7+7+6=20",
-"7+7+7=21",
-"7+7+8=22",
-"7+7+9=23",
-"7+7-0=14",
-"7+7-10=4",
-"7+7-11=3",
-"7+7-12=2",
-"7+7-13=1",
-"7+7-14=0",
-"7+7-1=13",
-"7+7-2=12",
-"7+7-3=11",
-"7+7-4=10",
-"7+7*1=14",
-"7+7*2=21",
-"7+7*3=28",
-"7+7*4=35",
-"7+7*5=42",
-"7+7*6=49",
-"7+7*7=56",
-"7+7*8=63",
-"7+7*9=70",
-"7+7/1=14",
-"7+80*0=7",
-"7+81*0=7",
-"7+82*0=7",
-"7+83*0=7",
-"7+84*0=7",
-"7+85*0=7",
-"7+86*0=7",
-"7+87*0=7",
-"7+88*0=7",
-"7+89*0=7",
-"7+8+0=15",
-"7+8+1=16",
-"7+8+2=17",
-"7+8+3=18",
-"7+8+4=19",
-"7+8+5=20",
-"7+8+6=21",
-"7+8+7=22",
-"7+8+8=23",
-"7+8+9=24",
-"7+8-0=15",
-"7+8-10=5",
-"7+8-11=4",
-"7+8-12=3",
-"7+8-13=2",
-"7+8-14=1",
-"7+8-15=0",
-"7+8-1=14",
-"7+8-2=13",
-"7+8-3=12",
-"7+8-4=11",
-"7+8-5=10",
-"7+8*1=15",
-"7+8*2=23",
-"7+8*3=31",
-"7+8*4=39",
-"7+8*5=47",
-"7+8*6=55",
-"7+8*7=63",
-"7+8*8=71",
-"7+8*9=79",
-"7+8/1=15",
-"7+8/2=11",
-"7+90*0=7",
-"7+91*0=7",
-"7+92*0=7",
-"7+93*0=7",
-"7+93=100",
-"7+94*0=7",
-"7+94=101",
-"7+95*0=7",
-"7+95=102",
-"7+96*0=7",
-"7+96=103",
-"7+97*0=7",
-"7+97=104",
-"7+98*0=7",
-"7+98=105",
-"7+99*0=7",
-"7+99=106",
-"7+9+0=16",
-"7+9+1=17",
-"7+9+2=18",
-"7+9+3=19",
-"7+9+4=20",
-"7+9+5=21",
-"7+9+6=22",
-"7+9+7=23",
-"7+9+8=24",
-"7+9+9=25",
-"7+9-0=16",
-"7+9-10=6",
-"7+9-11=5",
-"7+9-12=4",
-"7+9-13=3",
-"7+9-14=2",
-"7+9-15=1",
-"7+9-16=0",
-"7+9-1=15",
-"7+9-2=14",
-"7+9-3=13",
-"7+9-4=12",
-"7+9-5=11",
-"7+9-6=10",
-"7+9*1=16",
-"7+9*2=25",
-"7+9*3=34",
-"7+9*4=43",
-"7+9*5=52",
-"7+9*6=61",
-"7+9*7=70",
-"7+9*8=79",
-"7+9*9=88",
-"7+9/1=16",
-"7+9/3=10",
-"7-0+3=10",
-"7-0+4=11",
-"7-0+5=12",
-"7-0+6=13",
-"7-0+7=14",
-"7-0+8=15",
-"7-0+9=16",
-"7-0-8=-1",
-"7-0-9=-2",
-"7-0*10=7",
-"7-0*11=7",
-"7-0*12=7",
-"7-0*13=7",
-"7-0*14=7",
-"7-0*15=7",
-"7-0*16=7",
-"7-0*17=7",
-"7-0*18=7",
-"7-0*19=7",
-"7-0*20=7",
-"7-0*21=7",
-"7-0*22=7",
-"7-0*23=7",
-"7-0*24=7",
-"7-0*25=7",
-"7-0*26=7",
-"7-0*27=7",
-"7-0*28=7",
-"7-0*29=7",
-"7-0*30=7",
-"7-0*31=7",
-"7-0*32=7",
-"7-0*33=7",
-"7-0*34=7",
-"7-0*35=7",
-"7-0*36=7",
-"7-0*37=7",
-"7-0*38=7",
-"7-0*39=7",
-"7-0*40=7",
-"7-0*41=7",
-"7-0*42=7",
-"7-0*43=7",
-"7-0*44=7",
-"7-0*45=7",
-"7-0*46=7",
-"7-0*47=7",
-"7-0*48=7",
-"7-0*49=7",
-"7-0*50=7",
-"7-0*51=7",
-"7-0*52=7",
-"7-0*53=7",
-"7-0*54=7",
-"7-0*55=7",
-"7-0*56=7",
-"7-0*57=7",
-"7-0*58=7",
-"7-0*59=7",
-"7-0*60=7",
-"7-0*61=7",
-"7-0*62=7",
-"7-0*63=7",
-"7-0*64=7",
-"7-0*65=7",
-"7-0*66=7",
-"7-0*67=7",
-"7-0*68=7",
-"7-0*69=7",
-"7-0*70=7",
-"7-0*71=7",
-"7-0*72=7",
-"7-0*73=7",
-"7-0*74=7",
-"7-0*75=7",
-"7-0*76=7",
-"7-0*77=7",
-"7-0*78=7",
-"7-0*79=7",
-"7-0*80=7",
-"7-0*81=7",
-"7-0*82=7",
-"7-0*83=7",
-"7-0*84=7",
-"7-0*85=7",
-"7-0*86=7",
-"7-0*87=7",
-"7-0*88=7",
-"7-0*89=7",
-"7-0*90=7",
-"7-0*91=7",
-"7-0*92=7",
-"7-0*93=7",
-"7-0*94=7",
-"7-0*95=7",
-"7-0*96=7",
-"7-0*97=7",
-"7-0*98=7",
-"7-0*99=7",
-"7-0/10=7",
-"7-0/11=7",
-"7-0/12=7",
-"7-0/13=7",
-"7-0/14=7",
-"7-0/15=7",
-"7-0/16=7",
-"7-0/17=7",
-"7-0/18=7",
-"7-0/19=7",
-"7-0/20=7",
-"7-0/21=7",
-"7-0/22=7",
-"7-0/23=7",
-"7-0/24=7",
-"7-0/25=7",
-"7-0/26=7",
-"7-0/27=7",
-"7-0/28=7",
-"7-0/29=7",
-"7-0/30=7",
-"7-0/31=7",
-"7-0/32=7",
-"7-0/33=7",
-"7-0/34=7",
-"7-0/35=7",
-"7-0/36=7",
-"7-0/37=7",
-"7-0/38=7",
-"7-0/39=7",
-"7-0/40=7",
-"7-0/41=7",
-"7-0/42=7",
-"7-0/43=7",
-"7-0/44=7",
-"7-0/45=7",
-"7-0/46=7",
-"7-0/47=7",
-"7-0/48=7",
-"7-0/49=7",
-"7-0/50=7",
-"7-0/51=7",
-"7-0/52=7",
-"7-0/53=7",
-"7-0/54=7",
-"7-0/55=7",
-"7-0/56=7",
-"7-0/57=7",
-"7-0/58=7",
-"7-0/59=7",
-"7-0/60=7",
-"7-0/61=7",
-"7-0/62=7",
-"7-0/63=7",
-"7-0/64=7",
-"7-0/65=7",
-"7-0/66=7",
-"7-0/67=7",
-"7-0/68=7",
-"7-0/69=7",
-"7-0/70=7",
-"7-0/71=7",
-"7-0/72=7",
-"7-0/73=7",
-"7-0/74=7",
-"7-0/75=7",
-"7-0/76=7",
-"7-0/77=7",
-"7-0/78=7",
-"7-0/79=7",
-"7-0/80=7",
-"7-0/81=7",
-"7-0/82=7",
-"7-0/83=7",
-"7-0/84=7",
-"7-0/85=7",
-"7-0/86=7",
-"7-0/87=7",
-"7-0/88=7",
-"7-0/89=7",
-"7-0/90=7",
-"7-0/91=7",
-"7-0/92=7",
-"7-0/93=7",
-"7-0/94=7",
-"7-0/95=7",
-"7-0/96=7",
-"7-0/97=7",
-"7-0/98=7",
-"7-0/99=7",
-"7-10+3=0",
-"7-10+4=1",
-"7-10+5=2",
-"7-10+6=3",
-"7-10+7=4",
-"7-10+8=5",
-"7-10+9=6",
-"7-10*0=7",
-"7-10/2=2",
-"7-10/5=5",
-"7-11+4=0",
-"7-11+5=1",
-"7-11+6=2",
-"7-11+7=3",
-"7-11+8=4",
-"7-11+9=5",
-"7-11*0=7",
-"7-12+5=0",
-"7-12+6=1",
-"7-12+7=2",
-"7-12+8=3",
-"7-12+9=4",
-"7-12*0=7",
-"7-12/2=1",
-"7-12/3=3",
-"7-12/4=4",
-"7-12/6=5",
-"7-13+6=0",
-"7-13+7=1",
-"7-13+8=2",
-"7-13+9=3",
-"7-13*0=7",
-"7-14+7=0",
-"7-14+8=1",
-"7-14+9=2",
-"7-14*0=7",
-"7-14/2=0",
-"7-14/7=5",
-"7-15+8=0",
-"7-15+9=1",
-"7-15*0=7",
-"7-15/3=2",
-"7-15/5=4",
-"7-16+9=0",
-"7-16*0=7",
-"7-16/4=3",
-"7-16/8=5",
-"7-17*0=7",
-"7-17=-10",
-"7-18*0=7",
-"7-18/3=1",
-"7-18/6=4",
-"7-18/9=5",
-"7-18=-11",
-"7-19*0=7",
-"7-19=-12",
-"7-1+4=10",
-"7-1+5=11",
-"7-1+6=12",
-"7-1+7=13",
-"7-1+8=14",
-"7-1+9=15",
-"7-1-7=-1",
-"7-1-8=-2",
-"7-1-9=-3",
-"7-1*8=-1",
-"7-1*9=-2",
-"7-20*0=7",
-"7-20/4=2",
-"7-20/5=3",
-"7-20=-13",
-"7-21*0=7",
-"7-21/3=0",
-"7-21/7=4",
-"7-21=-14",
-"7-22*0=7",
-"7-22=-15",
-"7-23*0=7",
-"7-23=-16",
-"7-24*0=7",
-"7-24/4=1",
-"7-24/6=3",
-"7-24/8=4",
-"7-24=-17",
-"7-25*0=7",
-"7-25/5=2",
-"7-25=-18",
-"7-26*0=7",
-"7-26=-19",
-"7-27*0=7",
-"7-27/9=4",
-"7-27=-20",
-"7-28*0=7",
-"7-28/4=0",
-"7-28/7=3",
-"7-28=-21",
-"7-29*0=7",
-"7-29=-22",
-"7-2+5=10",
-"7-2+6=11",
-"7-2+7=12",
-"7-2+8=13",
-"7-2+9=14",
-"7-2-6=-1",
-"7-2-7=-2",
-"7-2-8=-3",
-"7-2-9=-4",
-"7-2*4=-1",
-"7-2*5=-3",
-"7-2*6=-5",
-"7-2*7=-7",
-"7-2*8=-9",
-"7-30*0=7",
-"7-30/5=1",
-"7-30/6=2",
-"7-30=-23",
-"7-31*0=7",
-"7-31=-24",
-"7-32*0=7",
-"7-32/8=3",
-"7-32=-25",
-"7-33*0=7",
-"7-33=-26",
-"7-34*0=7",
-"7-34=-27",
-"7-35*0=7",
-"7-35/5=0",
-"7-35/7=2",
-"7-35=-28",
-"7-36*0=7",
-"7-36/6=1",
-"7-36/9=3",
-"7-36=-29",
-"7-37*0=7",
-"7-37=-30",
-"7-38*0=7",
-"7-38=-31",
-"7-39*0=7",
-"7-39=-32",
-"7-3+6=10",
-"7-3+7=11",
-"7-3+8=12",
-"7-3+9=13",
-"7-3-5=-1",
-"7-3-6=-2",
-"7-3-7=-3",
-"7-3-8=-4",
-"7-3-9=-5",
-"7-3*3=-2",
-"7-3*4=-5",
-"7-3*5=-8",
-"7-40*0=7",
-"7-40/8=2",
-"7-40=-33",
-"7-41*0=7",
-"7-41=-34",
-"7-42*0=7",
-"7-42/6=0",
-"7-42/7=1",
-"7-42=-35",
-"7-43*0=7",
-"7-43=-36",
-"7-44*0=7",
-"7-44=-37",
-"7-45*0=7",
-"7-45/9=2",
-"7-45=-38",
-"7-46*0=7",
-"7-46=-39",
-"7-47*0=7",
-"7-47=-40",
-"7-48*0=7",
-"7-48/8=1",
-"7-48=-41",
-"7-49*0=7",
-"7-49/7=0",
-"7-49=-42",
-"7-4+7=10",
-"7-4+8=11",
-"7-4+9=12",
-"7-4-4=-1",
-"7-4-5=-2",
-"7-4-6=-3",
-"7-4-7=-4",
-"7-4-8=-5",
-"7-4-9=-6",
-"7-4*2=-1",
-"7-4*3=-5",
-"7-4*4=-9",
-"7-50*0=7",
-"7-50=-43",
-"7-51*0=7",
-"7-51=-44",
-"7-52*0=7",
-"7-52=-45",
-"7-53*0=7",
-"7-53=-46",
-"7-54*0=7",
-"7-54/9=1",
-"7-54=-47",
-"7-55*0=7",
-"7-55=-48",
-"7-56*0=7",
-"7-56/8=0",
-"7-56=-49",
-"7-57*0=7",
-"7-57=-50",
-"7-58*0=7",
-"7-58=-51",
-"7-59*0=7",
-"7-59=-52",
-"7-5+8=10",
-"7-5+9=11",
-"7-5-3=-1",
-"7-5-4=-2",
-"7-5-5=-3",
-"7-5-6=-4",
-"7-5-7=-5",
-"7-5-8=-6",
-"7-5-9=-7",
-"7-5*2=-3",
-"7-5*3=-8",
-"7-60*0=7",
-"7-60=-53",
-"7-61*0=7",
-"7-61=-54",
-"7-62*0=7",
-"7-62=-55",
-"7-63*0=7",
-"7-63/9=0",
-"7-63=-56",
-"7-64*0=7",
-"7-64=-57",
-"7-65*0=7",
-"7-65=-58",
-"7-66*0=7",
-"7-66=-59",
-"7-67*0=7",
-"7-67=-60",
-"7-68*0=7",
-"7-68=-61",
-"7-69*0=7",
-"7-69=-62",
-"7-6+9=10",
-"7-6-2=-1",
-"7-6-3=-2",
-"7-6-4=-3",
-"7-6-5=-4",
-"7-6-6=-5",
-"7-6-7=-6",
-"7-6-8=-7",
-"7-6-9=-8",
-"7-6*2=-5",
-"7-70*0=7",
-"7-70=-63",
-"7-71*0=7",
-"7-71=-64",
-"7-72*0=7",
-"7-72=-65",
-"7-73*0=7",
-"7-73=-66",
-"7-74*0=7",
-"7-74=-67",
-"7-75*0=7",
-"7-75=-68",
-"7-76*0=7",
-"7-76=-69",
-"7-77*0=7",
-"7-77=-70",
-"7-78*0=7",
-"7-78=-71",
-"7-79*0=7",
-"7-79=-72",
-"7-7-1=-1",
-"7-7-2=-2",
-"7-7-3=-3",
-"7-7-4=-4",
-"7-7-5=-5",
-"7-7-6=-6",
-"7-7-7=-7",
-"7-7-8=-8",
-"7-7-9=-9",
-"7-7*2=-7",
-"7-80*0=7",
-"7-80=-73",
-"7-81*0=7",
-"7-81=-74",
-"7-82*0=7",
-"7-82=-75",
-"7-83*0=7",
-"7-83=-76",
-"7-84*0=7",
-"7-84=-77",
-"7-85*0=7",
-"7-85=-78",
-"7-86*0=7",
-"7-86=-79",
-"7-87*0=7",
-"7-87=-80",
-"7-88*0=7",
-"7-88=-81",
-"7-89*0=7",
-"7-89=-82",
-"7-8+0=-1",
-"7-8+10=9",
-"7-8-0=-1",
-"7-8-1=-2",
-"7-8-2=-3",
-"7-8-3=-4",
-"7-8-4=-5",
-"7-8-5=-6",
-"7-8-6=-7",
-"7-8-7=-8",
-"7-8-8=-9",
-"7-8*1=-1",
-"7-8*2=-9",
-"7-8/1=-1",
-"7-90*0=7",
-"7-90=-83",
-"7-91*0=7",
-"7-91=-84",
-"7-92*0=7",
-"7-92=-85",
-"7-93*0=7",
-"7-93=-86",
-"7-94*0=7",
-"7-94=-87",
-"7-95*0=7",
-"7-95=-88",
-"7-96*0=7",
-"7-96=-89",
-"7-97*0=7",
-"7-97=-90",
-"7-98*0=7",
-"7-98=-91",
-"7-99*0=7",
-"7-99=-92",
-"7-9+0=-2",
-"7-9+10=8",
-"7-9+11=9",
-"7-9+1=-1",
-"7-9-0=-2",
-"7-9-1=-3",
-"7-9-2=-4",
-"7-9-3=-5",
-"7-9-4=-6",
-"7-9-5=-7",
-"7-9-6=-8",
-"7-9-7=-9",
-"7-9*1=-2",
-"7-9/1=-2",
-"7*0-1=-1",
-"7*0-2=-2",
-"7*0-3=-3",
-"7*0-4=-4",
-"7*0-5=-5",
-"7*0-6=-6",
-"7*0-7=-7",
-"7*0-8=-8",
-"7*0-9=-9",
-"7*0*10=0",
-"7*0*11=0",
-"7*0*12=0",
-"7*0*13=0",
-"7*0*14=0",
-"7*0*15=0",
-"7*0*16=0",
-"7*0*17=0",
-"7*0*18=0",
-"7*0*19=0",
-"7*0*20=0",
-"7*0*21=0",
-"7*0*22=0",
-"7*0*23=0",
-"7*0*24=0",
-"7*0*25=0",
-"7*0*26=0",
-"7*0*27=0",
-"7*0*28=0",
-"7*0*29=0",
-"7*0*30=0",
-"7*0*31=0",
-"7*0*32=0",
-"7*0*33=0",
-"7*0*34=0",
-"7*0*35=0",
-"7*0*36=0",
-"7*0*37=0",
-"7*0*38=0",
-"7*0*39=0",
-"7*0*40=0",
-"7*0*41=0",
-"7*0*42=0",
-"7*0*43=0",
-"7*0*44=0",
-"7*0*45=0",
-"7*0*46=0",
-"7*0*47=0",
-"7*0*48=0",
-"7*0*49=0",
-"7*0*50=0",
-"7*0*51=0",
-"7*0*52=0",
-"7*0*53=0",
-"7*0*54=0",
-"7*0*55=0",
-"7*0*56=0",
-"7*0*57=0",
-"7*0*58=0",
-"7*0*59=0",
-"7*0*60=0",
-"7*0*61=0",
-"7*0*62=0",
-"7*0*63=0",
-"7*0*64=0",
-"7*0*65=0",
-"7*0*66=0",
-"7*0*67=0",
-"7*0*68=0",
-"7*0*69=0",
-"7*0*70=0",
-"7*0*71=0",
-"7*0*72=0",
-"7*0*73=0",
-"7*0*74=0",
-"7*0*75=0",
-"7*0*76=0",
-"7*0*77=0",
-"7*0*78=0",
-"7*0*79=0",
-"7*0*80=0",
-"7*0*81=0",
-"7*0*82=0",
-"7*0*83=0",
-"7*0*84=0",
-"7*0*85=0",
-"7*0*86=0",
-"7*0*87=0",
-"7*0*88=0",
-"7*0*89=0",
-"7*0*90=0",
-"7*0*91=0",
-"7*0*92=0",
-"7*0*93=0",
-"7*0*94=0",
-"7*0*95=0",
-"7*0*96=0",
-"7*0*97=0",
-"7*0*98=0",
-"7*0*99=0",
-"7*0/10=0",
-"7*0/11=0",
-"7*0/12=0",
-"7*0/13=0",
-"7*0/14=0",
-"7*0/15=0",
-"7*0/16=0",
-"7*0/17=0",
-"7*0/18=0",
-"7*0/19=0",
-"7*0/20=0",
-"7*0/21=0",
-"7*0/22=0",
-"7*0/23=0",
-"7*0/24=0",
-"7*0/25=0",
-"7*0/26=0",
-"7*0/27=0",
-"7*0/28=0",
-"7*0/29=0",
-"7*0/30=0",
-"7*0/31=0",
-"7*0/32=0",
-"7*0/33=0",
-"7*0/34=0",
-"7*0/35=0",
-"7*0/36=0",
-"7*0/37=0",
-"7*0/38=0",
-"7*0/39=0",
-"7*0/40=0",
-"7*0/41=0",
-"7*0/42=0",
-"7*0/43=0",
-"7*0/44=0",
-"7*0/45=0",
-"7*0/46=0",
-"7*0/47=0",
-"7*0/48=0",
-"7*0/49=0",
-"7*0/50=0",
-"7*0/51=0",
-"7*0/52=0",
-"7*0/53=0",
-"7*0/54=0",
-"7*0/55=0",
-"7*0/56=0",
-"7*0/57=0",
-"7*0/58=0",
-"7*0/59=0",
-"7*0/60=0",
-"7*0/61=0",
-"7*0/62=0",
-"7*0/63=0",
-"7*0/64=0",
-"7*0/65=0",
-"7*0/66=0",
-"7*0/67=0",
-"7*0/68=0",
-"7*0/69=0",
-"7*0/70=0",
-"7*0/71=0",
-"7*0/72=0",
-"7*0/73=0",
-"7*0/74=0",
-"7*0/75=0",
-"7*0/76=0",
-"7*0/77=0",
-"7*0/78=0",
-"7*0/79=0",
-"7*0/80=0",
-"7*0/81=0",
-"7*0/82=0",
-"7*0/83=0",
-"7*0/84=0",
-"7*0/85=0",
-"7*0/86=0",
-"7*0/87=0",
-"7*0/88=0",
-"7*0/89=0",
-"7*0/90=0",
-"7*0/91=0",
-"7*0/92=0",
-"7*0/93=0",
-"7*0/94=0",
-"7*0/95=0",
-"7*0/96=0",
-"7*0/97=0",
-"7*0/98=0",
-"7*0/99=0",
-"7*10*0=0",
-"7*11*0=0",
-"7*12*0=0",
-"7*13*0=0",
-"7*14*0=0",
-"7*15*0=0",
-"7*15=105",
-"7*16*0=0",
-"7*16=112",
-"7*17*0=0",
-"7*17=119",
-"7*18*0=0",
-"7*18=126",
-"7*19*0=0",
-"7*19=133",
-"7*1+3=10",
-"7*1+4=11",
-"7*1+5=12",
-"7*1+6=13",
-"7*1+7=14",
-"7*1+8=15",
-"7*1+9=16",
-"7*1-8=-1",
-"7*1-9=-2",
-"7*1*2=14",
-"7*1*3=21",
-"7*1*4=28",
-"7*1*5=35",
-"7*1*6=42",
-"7*1*7=49",
-"7*1*8=56",
-"7*1*9=63",
-"7*20*0=0",
-"7*20=140",
-"7*21*0=0",
-"7*21=147",
-"7*22*0=0",
-"7*22=154",
-"7*23*0=0",
-"7*23=161",
-"7*24*0=0",
-"7*24=168",
-"7*25*0=0",
-"7*25=175",
-"7*26*0=0",
-"7*26=182",
-"7*27*0=0",
-"7*27=189",
-"7*28*0=0",
-"7*28=196",
-"7*29*0=0",
-"7*29=203",
-"7*2+0=14",
-"7*2+1=15",
-"7*2+2=16",
-"7*2+3=17",
-"7*2+4=18",
-"7*2+5=19",
-"7*2+6=20",
-"7*2+7=21",
-"7*2+8=22",
-"7*2+9=23",
-"7*2-0=14",
-"7*2-10=4",
-"7*2-11=3",
-"7*2-12=2",
-"7*2-13=1",
-"7*2-14=0",
-"7*2-1=13",
-"7*2-2=12",
-"7*2-3=11",
-"7*2-4=10",
-"7*2*1=14",
-"7*2*2=28",
-"7*2*3=42",
-"7*2*4=56",
-"7*2*5=70",
-"7*2*6=84",
-"7*2*7=98",
-"7*2/14=1",
-"7*2/1=14",
-"7*30*0=0",
-"7*30=210",
-"7*31*0=0",
-"7*31=217",
-"7*32*0=0",
-"7*32=224",
-"7*33*0=0",
-"7*33=231",
-"7*34*0=0",
-"7*34=238",
-"7*35*0=0",
-"7*35=245",
-"7*36*0=0",
-"7*36=252",
-"7*37*0=0",
-"7*37=259",
-"7*38*0=0",
-"7*38=266",
-"7*39*0=0",
-"7*39=273",
-"7*3+0=21",
-"7*3+1=22",
-"7*3+2=23",
-"7*3+3=24",
-"7*3+4=25",
-"7*3+5=26",
-"7*3+6=27",
-"7*3+7=28",
-"7*3+8=29",
-"7*3+9=30",
-"7*3-0=21",
-"7*3-12=9",
-"7*3-13=8",
-"7*3-14=7",
-"7*3-15=6",
-"7*3-16=5",
-"7*3-17=4",
-"7*3-18=3",
-"7*3-19=2",
-"7*3-1=20",
-"7*3-20=1",
-"7*3-21=0",
-"7*3-2=19",
-"7*3-3=18",
-"7*3-4=17",
-"7*3-5=16",
-"7*3-6=15",
-"7*3-7=14",
-"7*3-8=13",
-"7*3-9=12",
-"7*3*1=21",
-"7*3*2=42",
-"7*3*3=63",
-"7*3*4=84",
-"7*3/1=21",
-"7*3/21=1",
-"7*40*0=0",
-"7*40=280",
-"7*41*0=0",
-"7*41=287",
-"7*42*0=0",
-"7*42=294",
-"7*43*0=0",
-"7*43=301",
-"7*44*0=0",
-"7*44=308",
-"7*45*0=0",
-"7*45=315",
-"7*46*0=0",
-"7*46=322",
-"7*47*0=0",
-"7*47=329",
-"7*48*0=0",
-"7*48=336",
-"7*49*0=0",
-"7*49=343",
-"7*4+0=28",
-"7*4+1=29",
-"7*4+2=30",
-"7*4+3=31",
-"7*4+4=32",
-"7*4+5=33",
-"7*4+6=34",
-"7*4+7=35",
-"7*4+8=36",
-"7*4+9=37",
-"7*4-0=28",
-"7*4-19=9",
-"7*4-1=27",
-"7*4-20=8",
-"7*4-21=7",
-"7*4-22=6",
-"7*4-23=5",
-"7*4-24=4",
-"7*4-25=3",
-"7*4-26=2",
-"7*4-27=1",
-"7*4-28=0",
-"7*4-2=26",
-"7*4-3=25",
-"7*4-4=24",
-"7*4-5=23",
-"7*4-6=22",
-"7*4-7=21",
-"7*4-8=20",
-"7*4-9=19",
-"7*4*1=28",
-"7*4*2=56",
-"7*4*3=84",
-"7*4/14=2",
-"7*4/1=28",
-"7*4/28=1",
-"7*4/2=14",
-"7*50*0=0",
-"7*50=350",
-"7*51*0=0",
-"7*51=357",
-"7*52*0=0",
-"7*52=364",
-"7*53*0=0",
-"7*53=371",
-"7*54*0=0",
-"7*54=378",
-"7*55*0=0",
-"7*55=385",
-"7*56*0=0",
-"7*56=392",
-"7*57*0=0",
-"7*57=399",
-"7*58*0=0",
-"7*58=406",
-"7*59*0=0",
-"7*59=413",
-"7*5+0=35",
-"7*5+1=36",
-"7*5+2=37",
-"7*5+3=38",
-"7*5+4=39",
-"7*5+5=40",
-"7*5+6=41",
-"7*5+7=42",
-"7*5+8=43",
-"7*5+9=44",
-"7*5-0=35",
-"7*5-1=34",
-"7*5-26=9",
-"7*5-27=8",
-"7*5-28=7",
-"7*5-29=6",
-"7*5-2=33",
-"7*5-30=5",
-"7*5-31=4",
-"7*5-32=3",
-"7*5-33=2",
-"7*5-34=1",
-"7*5-35=0",
-"7*5-3=32",
-"7*5-4=31",
-"7*5-5=30",
-"7*5-6=29",
-"7*5-7=28",
-"7*5-8=27",
-"7*5-9=26",
-"7*5*1=35",
-"7*5*2=70",
-"7*5/1=35",
-"7*5/35=1",
-"7*60*0=0",
-"7*60=420",
-"7*61*0=0",
-"7*61=427",
-"7*62*0=0",
-"7*62=434",
-"7*63*0=0",
-"7*63=441",
-"7*64*0=0",
-"7*64=448",
-"7*65*0=0",
-"7*65=455",
-"7*66*0=0",
-"7*66=462",
-"7*67*0=0",
-"7*67=469",
-"7*68*0=0",
-"7*68=476",
-"7*69*0=0",
-"7*69=483",
-"7*6+0=42",
-"7*6+1=43",
-"7*6+2=44",
-"7*6+3=45",
-"7*6+4=46",
-"7*6+5=47",
-"7*6+6=48",
-"7*6+7=49",
-"7*6+8=50",
-"7*6+9=51",
-"7*6-0=42",
-"7*6-1=41",
-"7*6-2=40",
-"7*6-33=9",
-"7*6-34=8",
-"7*6-35=7",
-"7*6-36=6",
-"7*6-37=5",
-"7*6-38=4",
-"7*6-39=3",
-"7*6-3=39",
-"7*6-40=2",
-"7*6-41=1",
-"7*6-42=0",
-"7*6-4=38",
-"7*6-5=37",
-"7*6-6=36",
-"7*6-7=35",
-"7*6-8=34",
-"7*6-9=33",
-"7*6*1=42",
-"7*6*2=84",
-"7*6/14=3",
-"7*6/1=42",
-"7*6/21=2",
-"7*6/2=21",
-"7*6/3=14",
-"7*6/42=1",
-"7*70*0=0",
-"7*70=490",
-"7*71*0=0",
-"7*71=497",
-"7*72*0=0",
-"7*72=504",
-"7*73*0=0",
-"7*73=511",
-"7*74*0=0",
-"7*74=518",
-"7*75*0=0",
-"7*75=525",
-"7*76*0=0",
-"7*76=532",
-"7*77*0=0",
-"7*77=539",
-"7*78*0=0",
-"7*78=546",
-"7*79*0=0",
-"7*79=553",
-"7*7+0=49",
-"7*7+1=50",
-"7*7+2=51",
-"7*7+3=52",
-"7*7+4=53",
-"7*7+5=54",
-"7*7+6=55",
-"7*7+7=56",
-"7*7+8=57",
-"7*7+9=58",
-"7*7-0=49",
-"7*7-1=48",
-"7*7-2=47",
-"7*7-3=46",
-"7*7-40=9",
-"7*7-41=8",
-"7*7-42=7",
-"7*7-43=6",
-"7*7-44=5",
-"7*7-45=4",
-"7*7-46=3",
-"7*7-47=2",
-"7*7-48=1",
-"7*7-49=0",
-"7*7-4=45",
-"7*7-5=44",
-"7*7-6=43",
-"7*7-7=42",
-"7*7-8=41",
-"7*7-9=40",
-"7*7*1=49",
-"7*7*2=98",
-"7*7/1=49",
-"7*7/49=1",
-"7*80*0=0",
-"7*80=560",
-"7*81*0=0",
-"7*81=567",
-"7*82*0=0",
-"7*82=574",
-"7*83*0=0",
-"7*83=581",
-"7*84*0=0",
-"7*84=588",
-"7*85*0=0",
-"7*85=595",
-"7*86*0=0",
-"7*86=602",
-"7*87*0=0",
-"7*87=609",
-"7*88*0=0",
-"7*88=616",
-"7*89*0=0",
-"7*89=623",
-"7*8+0=56",
-"7*8+1=57",
-"7*8+2=58",
-"7*8+3=59",
-"7*8+4=60",
-"7*8+5=61",
-"7*8+6=62",
-"7*8+7=63",
-"7*8+8=64",
-"7*8+9=65",
-"7*8-0=56",
-"7*8-1=55",
-"7*8-2=54",
-"7*8-3=53",
-"7*8-47=9",
-"7*8-48=8",
-"7*8-49=7",
-"7*8-4=52",
-"7*8-50=6",
-"7*8-51=5",
-"7*8-52=4",
-"7*8-53=3",
-"7*8-54=2",
-"7*8-55=1",
-"7*8-56=0",
-"7*8-5=51",
-"7*8-6=50",
-"7*8-7=49",
-"7*8-8=48",
-"7*8-9=47",
-"7*8*1=56",
-"7*8/14=4",
-"7*8/1=56",
-"7*8/28=2",
-"7*8/2=28",
-"7*8/4=14",
-"7*8/56=1",
-"7*90*0=0",
-"7*90=630",
-"7*91*0=0",
-"7*91=637",
-"7*92*0=0",
-"7*92=644",
-"7*93*0=0",
-"7*93=651",
-"7*94*0=0",
-"7*94=658",
-"7*95*0=0",
-"7*95=665",
-"7*96*0=0",
-"7*96=672",
-"7*97*0=0",
-"7*97=679",
-"7*98*0=0",
-"7*98=686",
-"7*99*0=0",
-"7*99=693",
-"7*9+0=63",
-"7*9+1=64",
-"7*9+2=65",
-"7*9+3=66",
-"7*9+4=67",
-"7*9+5=68",
-"7*9+6=69",
-"7*9+7=70",
-"7*9+8=71",
-"7*9+9=72",
-"7*9-0=63",
-"7*9-1=62",
-"7*9-2=61",
-"7*9-3=60",
-"7*9-4=59",
-"7*9-54=9",
-"7*9-55=8",
-"7*9-56=7",
-"7*9-57=6",
-"7*9-58=5",
-"7*9-59=4",
-"7*9-5=58",
-"7*9-60=3",
-"7*9-61=2",
-"7*9-62=1",
-"7*9-63=0",
-"7*9-6=57",
-"7*9-7=56",
-"7*9-8=55",
-"7*9-9=54",
-"7*9*1=63",
-"7*9/1=63",
-"7*9/21=3",
-"7*9/3=21",
-"7*9/63=1",
-"7/10*0=0",
-"7/11*0=0",
-"7/12*0=0",
-"7/13*0=0",
-"7/14*0=0",
-"7/14*2=1",
-"7/14*4=2",
-"7/14*6=3",
-"7/14*8=4",
-"7/15*0=0",
-"7/16*0=0",
-"7/17*0=0",
-"7/18*0=0",
-"7/19*0=0",
-"7/1+3=10",
-"7/1+4=11",
-"7/1+5=12",
-"7/1+6=13",
-"7/1+7=14",
-"7/1+8=15",
-"7/1+9=16",
-"7/1-8=-1",
-"7/1-9=-2",
-"7/1*2=14",
-"7/1*3=21",
-"7/1*4=28",
-"7/1*5=35",
-"7/1*6=42",
-"7/1*7=49",
-"7/1*8=56",
-"7/1*9=63",
-"7/20*0=0",
-"7/21*0=0",
-"7/21*3=1",
-"7/21*6=2",
-"7/21*9=3",
-"7/22*0=0",
-"7/23*0=0",
-"7/24*0=0",
-"7/25*0=0",
-"7/26*0=0",
-"7/27*0=0",
-"7/28*0=0",
-"7/28*4=1",
-"7/28*8=2",
-"7/29*0=0",
-"7/2*4=14",
-"7/2*6=21",
-"7/2*8=28",
-"7/30*0=0",
-"7/31*0=0",
-"7/32*0=0",
-"7/33*0=0",
-"7/34*0=0",
-"7/35*0=0",
-"7/35*5=1",
-"7/36*0=0",
-"7/37*0=0",
-"7/38*0=0",
-"7/39*0=0",
-"7/3*6=14",
-"7/3*9=21",
-"7/40*0=0",
-"7/41*0=0",
-"7/42*0=0",
-"7/42*6=1",
-"7/43*0=0",
-"7/44*0=0",
-"7/45*0=0",
-"7/46*0=0",
-"7/47*0=0",
-"7/48*0=0",
-"7/49*0=0",
-"7/49*7=1",
-"7/4*8=14",
-"7/50*0=0",
-"7/51*0=0",
-"7/52*0=0",
-"7/53*0=0",
-"7/54*0=0",
-"7/55*0=0",
-"7/56*0=0",
-"7/56*8=1",
-"7/57*0=0",
-"7/58*0=0",
-"7/59*0=0",
-"7/60*0=0",
-"7/61*0=0",
-"7/62*0=0",
-"7/63*0=0",
-"7/63*9=1",
-"7/64*0=0",
-"7/65*0=0",
-"7/66*0=0",
-"7/67*0=0",
-"7/68*0=0",
-"7/69*0=0",
-"7/70*0=0",
-"7/71*0=0",
-"7/72*0=0",
-"7/73*0=0",
-"7/74*0=0",
-"7/75*0=0",
-"7/76*0=0",
-"7/77*0=0",
-"7/78*0=0",
-"7/79*0=0",
-"7/7+9=10",
-"7/7-2=-1",
-"7/7-3=-2",
-"7/7-4=-3",
-"7/7-5=-4",
-"7/7-6=-5",
-"7/7-7=-6",
-"7/7-8=-7",
-"7/7-9=-8",
-"7/80*0=0",
-"7/81*0=0",
-"7/82*0=0",
-"7/83*0=0",
-"7/84*0=0",
-"7/85*0=0",
-"7/86*0=0",
-"7/87*0=0",
-"7/88*0=0",
-"7/89*0=0",
-"7/90*0=0",
-"7/91*0=0",
-"7/92*0=0",
-"7/93*0=0",
-"7/94*0=0",
-"7/95*0=0",
-"7/96*0=0",
-"7/97*0=0",
-"7/98*0=0",
-"7/99*0=0",
-"8000*0=0",
-"8001*0=0",
-"8002*0=0",
-"8003*0=0",
-"8004*0=0",
-"8005*0=0",
-"8006*0=0",
-"8007*0=0",
-"8008*0=0",
-"8009*0=0",
-"8010*0=0",
-"8011*0=0",
-"8012*0=0",
-"8013*0=0",
-"8014*0=0",
-"8015*0=0",
-"8016*0=0",
-"8017*0=0",
-"8018*0=0",
-"8019*0=0",
-"801/89=9",
-"801/9=89",
-"8020*0=0",
-"8021*0=0",
-"8022*0=0",
-"8023*0=0",
-"8024*0=0",
-"8025*0=0",
-"8026*0=0",
-"8027*0=0",
-"8028*0=0",
-"8029*0=0",
-"8030*0=0",
-"8031*0=0",
-"8032*0=0",
-"8033*0=0",
-"8034*0=0",
-"8035*0=0",
-"8036*0=0",
-"8037*0=0",
-"8038*0=0",
-"8039*0=0",
-"8040*0=0",
-"8041*0=0",
-"8042*0=0",
-"8043*0=0",
-"8044*0=0",
-"8045*0=0",
-"8046*0=0",
-"8047*0=0",
-"8048*0=0",
-"8049*0=0",
-"8050*0=0",
-"8051*0=0",
-"8052*0=0",
-"8053*0=0",
-"8054*0=0",
-"8055*0=0",
-"8056*0=0",
-"8057*0=0",
-"8058*0=0",
-"8059*0=0",
-"8060*0=0",
-"8061*0=0",
-"8062*0=0",
-"8063*0=0",
-"8064*0=0",
-"8065*0=0",
-"8066*0=0",
-"8067*0=0",
-"8068*0=0",
-"8069*0=0",
-"8070*0=0",
-"8071*0=0",
-"8072*0=0",
-"8073*0=0",
-"8074*0=0",
-"8075*0=0",
-"8076*0=0",
-"8077*0=0",
-"8078*0=0",
-"8079*0=0",
-"8080*0=0",
-"8081*0=0",
-"8082*0=0",
-"8083*0=0",
-"8084*0=0",
-"8085*0=0",
-"8086*0=0",
-"8087*0=0",
-"8088*0=0",
-"8089*0=0",
-"8090*0=0",
-"8091*0=0",
-"8092*0=0",
-"8093*0=0",
-"8094*0=0",
-"8095*0=0",
-"8096*0=0",
-"8097*0=0",
-"8098*0=0",
-"8099*0=0",
-"80+10=90",
-"80+11=91",
-"80+12=92",
-"80+13=93",
-"80+14=94",
-"80+15=95",
-"80+16=96",
-"80+17=97",
-"80+18=98",
-"80+19=99",
-"80-10=70",
-"80-11=69",
-"80-12=68",
-"80-13=67",
-"80-14=66",
-"80-15=65",
-"80-16=64",
-"80-17=63",
-"80-18=62",
-"80-19=61",
-"80-20=60",
-"80-21=59",
-"80-22=58",
-"80-23=57",
-"80-24=56",
-"80-25=55",
-"80-26=54",
-"80-27=53",
-"80-28=52",
-"80-29=51",
-"80-30=50",
-"80-31=49",
-"80-32=48",
-"80-33=47",
-"80-34=46",
-"80-35=45",
-"80-36=44",
-"80-37=43",
-"80-38=42",
-"80-39=41",
-"80-40=40",
-"80-41=39",
-"80-42=38",
-"80-43=37",
-"80-44=36",
-"80-45=35",
-"80-46=34",
-"80-47=33",
-"80-48=32",
-"80-49=31",
-"80-50=30",
-"80-51=29",
-"80-52=28",
-"80-53=27",
-"80-54=26",
-"80-55=25",
-"80-56=24",
-"80-57=23",
-"80-58=22",
-"80-59=21",
-"80-60=20",
-"80-61=19",
-"80-62=18",
-"80-63=17",
-"80-64=16",
-"80-65=15",
-"80-66=14",
-"80-67=13",
-"80-68=12",
-"80-69=11",
-"80-70=10",
-"80-81=-1",
-"80-82=-2",
-"80-83=-3",
-"80-84=-4",
-"80-85=-5",
-"80-86=-6",
-"80-87=-7",
-"80-88=-8",
-"80-89=-9",
-"80-8*9=8",
-"80-9*8=8",
-"80*0+0=0",
-"80*0+1=1",
-"80*0+2=2",
-"80*0+3=3",
-"80*0+4=4",
-"80*0+5=5",
-"80*0+6=6",
-"80*0+7=7",
-"80*0+8=8",
-"80*0+9=9",
-"80*0-0=0",
-"80*0*0=0",
-"80*0*1=0",
-"80*0*2=0",
-"80*0*3=0",
-"80*0*4=0",
-"80*0*5=0",
-"80*0*6=0",
-"80*0*7=0",
-"80*0*8=0",
-"80*0*9=0",
-"80*0/1=0",
-"80*0/2=0",
-"80*0/3=0",
-"80*0/4=0",
-"80*0/5=0",
-"80*0/6=0",
-"80*0/7=0",
-"80*0/8=0",
-"80*0/9=0",
-"80*1*0=0",
-"80*2*0=0",
-"80*2=160",
-"80*3*0=0",
-"80*3=240",
-"80*4*0=0",
-"80*4=320",
-"80*5*0=0",
-"80*5=400",
-"80*6*0=0",
-"80*6=480",
-"80*7*0=0",
-"80*7=560",
-"80*8*0=0",
-"80*8=640",
-"80*9*0=0",
-"80*9=720",
-"80/1*0=0",
-"80/2*0=0",
-"80/2/5=8",
-"80/2/8=5",
-"80/3*0=0",
-"80/4*0=0",
-"80/4/4=5",
-"80/4/5=4",
-"80/5-7=9",
-"80/5-8=8",
-"80/5-9=7",
-"80/5*0=0",
-"80/5/2=8",
-"80/5/4=4",
-"80/5/8=2",
-"80/6*0=0",
-"80/7*0=0",
-"80/8-1=9",
-"80/8-2=8",
-"80/8-3=7",
-"80/8-4=6",
-"80/8-5=5",
-"80/8-6=4",
-"80/8-7=3",
-"80/8-8=2",
-"80/8-9=1",
-"80/8*0=0",
-"80/8/2=5",
-"80/8/5=2",
-"80/9*0=0",
-"8100*0=0",
-"8101*0=0",
-"8102*0=0",
-"8103*0=0",
-"8104*0=0",
-"8105*0=0",
-"8106*0=0",
-"8107*0=0",
-"8108*0=0",
-"8109*0=0",
-"810/90=9",
-"810/9=90",
-"8110*0=0",
-"8111*0=0",
-"8112*0=0",
-"8113*0=0",
-"8114*0=0",
-"8115*0=0",
-"8116*0=0",
-"8117*0=0",
-"8118*0=0",
-"8119*0=0",
-"8120*0=0",
-"8121*0=0",
-"8122*0=0",
-"8123*0=0",
-"8124*0=0",
-"8125*0=0",
-"8126*0=0",
-"8127*0=0",
-"8128*0=0",
-"8129*0=0",
-"8130*0=0",
-"8131*0=0",
-"8132*0=0",
-"8133*0=0",
-"8134*0=0",
-"8135*0=0",
-"8136*0=0",
-"8137*0=0",
-"8138*0=0",
-"8139*0=0",
-"8140*0=0",
-"8141*0=0",
-"8142*0=0",
-"8143*0=0",
-"8144*0=0",
-"8145*0=0",
-"8146*0=0",
-"8147*0=0",
-"8148*0=0",
-"8149*0=0",
-"8150*0=0",
-"8151*0=0",
-"8152*0=0",
-"8153*0=0",
-"8154*0=0",
-"8155*0=0",
-"8156*0=0",
-"8157*0=0",
-"8158*0=0",
-"8159*0=0",
-"8160*0=0",
-"8161*0=0",
-"8162*0=0",
-"8163*0=0",
-"8164*0=0",
-"8165*0=0",
-"8166*0=0",
-"8167*0=0",
-"8168*0=0",
-"8169*0=0",
-"8170*0=0",
-"8171*0=0",
-"8172*0=0",
-"8173*0=0",
-"8174*0=0",
-"8175*0=0",
-"8176*0=0",
-"8177*0=0",
-"8178*0=0",
-"8179*0=0",
-"8180*0=0",
-"8181*0=0",
-"8182*0=0",
-"8183*0=0",
-"8184*0=0",
-"8185*0=0",
-"8186*0=0",
-"8187*0=0",
-"8188*0=0",
-"8189*0=0",
-"8190*0=0",
-"8191*0=0",
-"8192*0=0",
-"8193*0=0",
-"8194*0=0",
-"8195*0=0",
-"8196*0=0",
-"8197*0=0",
-"8198*0=0",
-"8199*0=0",
-"819/91=9",
-"819/9=91",
-"81+10=91",
-"81+11=92",
-"81+12=93",
-"81+13=94",
-"81+14=95",
-"81+15=96",
-"81+16=97",
-"81+17=98",
-"81+18=99",
-"81-10=71",
-"81-11=70",
-"81-12=69",
-"81-13=68",
-"81-14=67",
-"81-15=66",
-"81-16=65",
-"81-17=64",
-"81-18=63",
-"81-19=62",
-"81-20=61",
-"81-21=60",
-"81-22=59",
-"81-23=58",
-"81-24=57",
-"81-25=56",
-"81-26=55",
-"81-27=54",
-"81-28=53",
-"81-29=52",
-"81-30=51",
-"81-31=50",
-"81-32=49",
-"81-33=48",
-"81-34=47",
-"81-35=46",
-"81-36=45",
-"81-37=44",
-"81-38=43",
-"81-39=42",
-"81-40=41",
-"81-41=40",
-"81-42=39",
-"81-43=38",
-"81-44=37",
-"81-45=36",
-"81-46=35",
-"81-47=34",
-"81-48=33",
-"81-49=32",
-"81-50=31",
-"81-51=30",
-"81-52=29",
-"81-53=28",
-"81-54=27",
-"81-55=26",
-"81-56=25",
-"81-57=24",
-"81-58=23",
-"81-59=22",
-"81-60=21",
-"81-61=20",
-"81-62=19",
-"81-63=18",
-"81-64=17",
-"81-65=16",
-"81-66=15",
-"81-67=14",
-"81-68=13",
-"81-69=12",
-"81-70=11",
-"81-71=10",
-"81-82=-1",
-"81-83=-2",
-"81-84=-3",
-"81-85=-4",
-"81-86=-5",
-"81-87=-6",
-"81-88=-7",
-"81-89=-8",
-"81-8*9=9",
-"81-90=-9",
-"81-9*8=9",
-"81-9*9=0",
-"81*0+0=0",
-"81*0+1=1",
-"81*0+2=2",
-"81*0+3=3",
-"81*0+4=4",
-"81*0+5=5",
-"81*0+6=6",
-"81*0+7=7",
-"81*0+8=8",
-"81*0+9=9",
-"81*0-0=0",
-"81*0*0=0",
-"81*0*1=0",
-"81*0*2=0",
-"81*0*3=0",
-"81*0*4=0",
-"81*0*5=0",
-"81*0*6=0",
-"81*0*7=0",
-"81*0*8=0",
-"81*0*9=0",
-"81*0/1=0",
-"81*0/2=0",
-"81*0/3=0",
-"81*0/4=0",
-"81*0/5=0",
-"81*0/6=0",
-"81*0/7=0",
-"81*0/8=0",
-"81*0/9=0",
-"81*1*0=0",
-"81*1/9=9",
-"81*2*0=0",
-"81*2=162",
-"81*3*0=0",
-"81*3=243",
-"81*4*0=0",
-"81*4=324",
-"81*5*0=0",
-"81*5=405",
-"81*6*0=0",
-"81*6=486",
-"81*7*0=0",
-"81*7=567",
-"81*8*0=0",
-"81*8=648",
-"81*9*0=0",
-"81*9=729",
-"81/1*0=0",
-"81/1/9=9",
-"81/2*0=0",
-"81/3*0=0",
-"81/3/3=9",
-"81/3/9=3",
-"81/4*0=0",
-"81/5*0=0",
-"81/6*0=0",
-"81/7*0=0",
-"81/8*0=0",
-"81/9+0=9",
-"81/9-0=9",
-"81/9-1=8",
-"81/9-2=7",
-"81/9-3=6",
-"81/9-4=5",
-"81/9-5=4",
-"81/9-6=3",
-"81/9-7=2",
-"81/9-8=1",
-"81/9-9=0",
-"81/9*0=0",
-"81/9*1=9",
-"81/9/1=9",
-"81/9/3=3",
-"81/9/9=1",
-"8200*0=0",
-"8201*0=0",
-"8202*0=0",
-"8203*0=0",
-"8204*0=0",
-"8205*0=0",
-"8206*0=0",
-"8207*0=0",
-"8208*0=0",
-"8209*0=0",
-"8210*0=0",
-"8211*0=0",
-"8212*0=0",
-"8213*0=0",
-"8214*0=0",
-"8215*0=0",
-"8216*0=0",
-"8217*0=0",
-"8218*0=0",
-"8219*0=0",
-"8220*0=0",
-"8221*0=0",
-"8222*0=0",
-"8223*0=0",
-"8224*0=0",
-"8225*0=0",
-"8226*0=0",
-"8227*0=0",
-"8228*0=0",
-"8229*0=0",
-"8230*0=0",
-"8231*0=0",
-"8232*0=0",
-"8233*0=0",
-"8234*0=0",
-"8235*0=0",
-"8236*0=0",
-"8237*0=0",
-"8238*0=0",
-"8239*0=0",
-"8240*0=0",
-"8241*0=0",
-"8242*0=0",
-"8243*0=0",
-"8244*0=0",
-"8245*0=0",
-"8246*0=0",
-"8247*0=0",
-"8248*0=0",
-"8249*0=0",
-"8250*0=0",
-"8251*0=0",
-"8252*0=0",
-"8253*0=0",
-"8254*0=0",
-"8255*0=0",
-"8256*0=0",
-"8257*0=0",
-"8258*0=0",
-"8259*0=0",
-"8260*0=0",
-"8261*0=0",
-"8262*0=0",
-"8263*0=0",
-"8264*0=0",
-"8265*0=0",
-"8266*0=0",
-"8267*0=0",
-"8268*0=0",
-"8269*0=0",
-"8270*0=0",
-"8271*0=0",
-"8272*0=0",
-"8273*0=0",
-"8274*0=0",
-"8275*0=0",
-"8276*0=0",
-"8277*0=0",
-"8278*0=0",
-"8279*0=0",
-"8280*0=0",
-"8281*0=0",
-"8282*0=0",
-"8283*0=0",
-"8284*0=0",
-"8285*0=0",
-"8286*0=0",
-"8287*0=0",
-"8288*0=0",
-"8289*0=0",
-"828/92=9",
-"828/9=92",
-"8290*0=0",
-"8291*0=0",
-"8292*0=0",
-"8293*0=0",
-"8294*0=0",
-"8295*0=0",
-"8296*0=0",
-"8297*0=0",
-"8298*0=0",
-"8299*0=0",
-"82+10=92",
-"82+11=93",
-"82+12=94",
-"82+13=95",
-"82+14=96",
-"82+15=97",
-"82+16=98",
-"82+17=99",
-"82-10=72",
-"82-11=71",
-"82-12=70",
-"82-13=69",
-"82-14=68",
-"82-15=67",
-"82-16=66",
-"82-17=65",
-"82-18=64",
-"82-19=63",
-"82-20=62",
-"82-21=61",
-"82-22=60",
-"82-23=59",
-"82-24=58",
-"82-25=57",
-"82-26=56",
-"82-27=55",
-"82-28=54",
-"82-29=53",
-"82-30=52",
-"82-31=51",
-"82-32=50",
-"82-33=49",
-"82-34=48",
-"82-35=47",
-"82-36=46",
-"82-37=45",
-"82-38=44",
-"82-39=43",
-"82-40=42",
-"82-41=41",
-"82-42=40",
-"82-43=39",
-"82-44=38",
-"82-45=37",
-"82-46=36",
-"82-47=35",
-"82-48=34",
-"82-49=33",
-"82-50=32",
-"82-51=31",
-"82-52=30",
-"82-53=29",
-"82-54=28",
-"82-55=27",
-"82-56=26",
-"82-57=25",
-"82-58=24",
-"82-59=23",
-"82-60=22",
-"82-61=21",
-"82-62=20",
-"82-63=19",
-"82-64=18",
-"82-65=17",
-"82-66=16",
-"82-67=15",
-"82-68=14",
-"82-69=13",
-"82-70=12",
-"82-71=11",
-"82-72=10",
-"82-83=-1",
-"82-84=-2",
-"82-85=-3",
-"82-86=-4",
-"82-87=-5",
-"82-88=-6",
-"82-89=-7",
-"82-90=-8",
-"82-91=-9",
-"82-9*9=1",
-"82*0+0=0",
-"82*0+1=1",
-"82*0+2=2",
-"82*0+3=3",
-"82*0+4=4",
-"82*0+5=5",
-"82*0+6=6",
-"82*0+7=7",
-"82*0+8=8",
-"82*0+9=9",
-"82*0-0=0",
-"82*0*0=0",
-"82*0*1=0",
-"82*0*2=0",
-"82*0*3=0",
-"82*0*4=0",
-"82*0*5=0",
-"82*0*6=0",
-"82*0*7=0",
-"82*0*8=0",
-"82*0*9=0",
-"82*0/1=0",
-"82*0/2=0",
-"82*0/3=0",
-"82*0/4=0",
-"82*0/5=0",
-"82*0/6=0",
-"82*0/7=0",
-"82*0/8=0",
-"82*0/9=0",
-"82*1*0=0",
-"82*2*0=0",
-"82*2=164",
-"82*3*0=0",
-"82*3=246",
-"82*4*0=0",
-"82*4=328",
-"82*5*0=0",
-"82*5=410",
-"82*6*0=0",
-"82*6=492",
-"82*7*0=0",
-"82*7=574",
-"82*8*0=0",
-"82*8=656",
-"82*9*0=0",
-"82*9=738",
-"82/1*0=0",
-"82/2*0=0",
-"82/3*0=0",
-"82/4*0=0",
-"82/5*0=0",
-"82/6*0=0",
-"82/7*0=0",
-"82/8*0=0",
-"82/9*0=0",
-"8300*0=0",
-"8301*0=0",
-"8302*0=0",
-"8303*0=0",
-"8304*0=0",
-"8305*0=0",
-"8306*0=0",
-"8307*0=0",
-"8308*0=0",
-"8309*0=0",
-"8310*0=0",
-"8311*0=0",
-"8312*0=0",
-"8313*0=0",
-"8314*0=0",
-"8315*0=0",
-"8316*0=0",
-"8317*0=0",
-"8318*0=0",
-"8319*0=0",
-"8320*0=0",
-"8321*0=0",
-"8322*0=0",
-"8323*0=0",
-"8324*0=0",
-"8325*0=0",
-"8326*0=0",
-"8327*0=0",
-"8328*0=0",
-"8329*0=0",
-"8330*0=0",
-"8331*0=0",
-"8332*0=0",
-"8333*0=0",
-"8334*0=0",
-"8335*0=0",
-"8336*0=0",
-"8337*0=0",
-"8338*0=0",
-"8339*0=0",
-"8340*0=0",
-"8341*0=0",
-"8342*0=0",
-"8343*0=0",
-"8344*0=0",
-"8345*0=0",
-"8346*0=0",
-"8347*0=0",
-"8348*0=0",
-"8349*0=0",
-"8350*0=0",
-"8351*0=0",
-"8352*0=0",
-"8353*0=0",
-"8354*0=0",
-"8355*0=0",
-"8356*0=0",
-"8357*0=0",
-"8358*0=0",
-"8359*0=0",
-"8360*0=0",
-"8361*0=0",
-"8362*0=0",
-"8363*0=0",
-"8364*0=0",
-"8365*0=0",
-"8366*0=0",
-"8367*0=0",
-"8368*0=0",
-"8369*0=0",
-"8370*0=0",
-"8371*0=0",
-"8372*0=0",
-"8373*0=0",
-"8374*0=0",
-"8375*0=0",
-"8376*0=0",
-"8377*0=0",
-"8378*0=0",
-"8379*0=0",
-"837/93=9",
-"837/9=93",
-"8380*0=0",
-"8381*0=0",
-"8382*0=0",
-"8383*0=0",
-"8384*0=0",
-"8385*0=0",
-"8386*0=0",
-"8387*0=0",
-"8388*0=0",
-"8389*0=0",
-"8390*0=0",
-"8391*0=0",
-"8392*0=0",
-"8393*0=0",
-"8394*0=0",
-"8395*0=0",
-"8396*0=0",
-"8397*0=0",
-"8398*0=0",
-"8399*0=0",
-"83+10=93",
-"83+11=94",
-"83+12=95",
-"83+13=96",
-"83+14=97",
-"83+15=98",
-"83+16=99",
-"83-10=73",
-"83-11=72",
-"83-12=71",
-"83-13=70",
-"83-14=69",
-"83-15=68",
-"83-16=67",
-"83-17=66",
-"83-18=65",
-"83-19=64",
-"83-20=63",
-"83-21=62",
-"83-22=61",
-"83-23=60",
-"83-24=59",
-"83-25=58",
-"83-26=57",
-"83-27=56",
-"83-28=55",
-"83-29=54",
-"83-30=53",
-"83-31=52",
-"83-32=51",
-"83-33=50",
-"83-34=49",
-"83-35=48",
-"83-36=47",
-"83-37=46",
-"83-38=45",
-"83-39=44",
-"83-40=43",
-"83-41=42",
-"83-42=41",
-"83-43=40",
-"83-44=39",
-"83-45=38",
-"83-46=37",
-"83-47=36",
-"83-48=35",
-"83-49=34",
-"83-50=33",
-"83-51=32",
-"83-52=31",
-"83-53=30",
-"83-54=29",
-"83-55=28",
-"83-56=27",
-"83-57=26",
-"83-58=25",
-"83-59=24",
-"83-60=23",
-"83-61=22",
-"83-62=21",
-"83-63=20",
-"83-64=19",
-"83-65=18",
-"83-66=17",
-"83-67=16",
-"83-68=15",
-"83-69=14",
-"83-70=13",
-"83-71=12",
-"83-72=11",
-"83-73=10",
-"83-84=-1",
-"83-85=-2",
-"83-86=-3",
-"83-87=-4",
-"83-88=-5",
-"83-89=-6",
-"83-90=-7",
-"83-91=-8",
-"83-92=-9",
-"83-9*9=2",
-"83*0+0=0",
-"83*0+1=1",
-"83*0+2=2",
-"83*0+3=3",
-"83*0+4=4",
-"83*0+5=5",
-"83*0+6=6",
-"83*0+7=7",
-"83*0+8=8",
-"83*0+9=9",
-"83*0-0=0",
-"83*0*0=0",
-"83*0*1=0",
-"83*0*2=0",
-"83*0*3=0",
-"83*0*4=0",
-"83*0*5=0",
-"83*0*6=0",
-"83*0*7=0",
-"83*0*8=0",
-"83*0*9=0",
-"83*0/1=0",
-"83*0/2=0",
-"83*0/3=0",
-"83*0/4=0",
-"83*0/5=0",
-"83*0/6=0",
-"83*0/7=0",
-"83*0/8=0",
-"83*0/9=0",
-"83*1*0=0",
-"83*2*0=0",
-"83*2=166",
-"83*3*0=0",
-"83*3=249",
-"83*4*0=0",
-"83*4=332",
-"83*5*0=0",
-"83*5=415",
-"83*6*0=0",
-"83*6=498",
-"83*7*0=0",
-"83*7=581",
-"83*8*0=0",
-"83*8=664",
-"83*9*0=0",
-"83*9=747",
-"83/1*0=0",
-"83/2*0=0",
-"83/3*0=0",
-"83/4*0=0",
-"83/5*0=0",
-"83/6*0=0",
-"83/7*0=0",
-"83/8*0=0",
-"83/9*0=0",
-"8400*0=0",
-"8401*0=0",
-"8402*0=0",
-"8403*0=0",
-"8404*0=0",
-"8405*0=0",
-"8406*0=0",
-"8407*0=0",
-"8408*0=0",
-"8409*0=0",
-"8410*0=0",
-"8411*0=0",
-"8412*0=0",
-"8413*0=0",
-"8414*0=0",
-"8415*0=0",
-"8416*0=0",
-"8417*0=0",
-"8418*0=0",
-"8419*0=0",
-"8420*0=0",
-"8421*0=0",
-"8422*0=0",
-"8423*0=0",
-"8424*0=0",
-"8425*0=0",
-"8426*0=0",
-"8427*0=0",
-"8428*0=0",
-"8429*0=0",
-"8430*0=0",
-"8431*0=0",
-"8432*0=0",
-"8433*0=0",
-"8434*0=0",
-"8435*0=0",
-"8436*0=0",
-"8437*0=0",
-"8438*0=0",
-"8439*0=0",
-"8440*0=0",
-"8441*0=0",
-"8442*0=0",
-"8443*0=0",
-"8444*0=0",
-"8445*0=0",
-"8446*0=0",
-"8447*0=0",
-"8448*0=0",
-"8449*0=0",
-"8450*0=0",
-"8451*0=0",
-"8452*0=0",
-"8453*0=0",
-"8454*0=0",
-"8455*0=0",
-"8456*0=0",
-"8457*0=0",
-"8458*0=0",
-"8459*0=0",
-"8460*0=0",
-"8461*0=0",
-"8462*0=0",
-"8463*0=0",
-"8464*0=0",
-"8465*0=0",
-"8466*0=0",
-"8467*0=0",
-"8468*0=0",
-"8469*0=0",
-"846/94=9",
-"846/9=94",
-"8470*0=0",
-"8471*0=0",
-"8472*0=0",
-"8473*0=0",
-"8474*0=0",
-"8475*0=0",
-"8476*0=0",
-"8477*0=0",
-"8478*0=0",
-"8479*0=0",
-"8480*0=0",
-"8481*0=0",
-"8482*0=0",
-"8483*0=0",
-"8484*0=0",
-"8485*0=0",
-"8486*0=0",
-"8487*0=0",
-"8488*0=0",
-"8489*0=0",
-"8490*0=0",
-"8491*0=0",
-"8492*0=0",
-"8493*0=0",
-"8494*0=0",
-"8495*0=0",
-"8496*0=0",
-"8497*0=0",
-"8498*0=0",
-"8499*0=0",
-"84+10=94",
-"84+11=95",
-"84+12=96",
-"84+13=97",
-"84+14=98",
-"84+15=99",
-"84-10=74",
-"84-11=73",
-"84-12=72",
-"84-13=71",
-"84-14=70",
-"84-15=69",
-"84-16=68",
-"84-17=67",
-"84-18=66",
-"84-19=65",
-"84-20=64",
-"84-21=63",
-"84-22=62",
-"84-23=61",
-"84-24=60",
-"84-25=59",
-"84-26=58",
-"84-27=57",
-"84-28=56",
-"84-29=55",
-"84-30=54",
-"84-31=53",
-"84-32=52",
-"84-33=51",
-"84-34=50",
-"84-35=49",
-"84-36=48",
-"84-37=47",
-"84-38=46",
-"84-39=45",
-"84-40=44",
-"84-41=43",
-"84-42=42",
-"84-43=41",
-"84-44=40",
-"84-45=39",
-"84-46=38",
-"84-47=37",
-"84-48=36",
-"84-49=35",
-"84-50=34",
-"84-51=33",
-"84-52=32",
-"84-53=31",
-"84-54=30",
-"84-55=29",
-"84-56=28",
-"84-57=27",
-"84-58=26",
-"84-59=25",
-"84-60=24",
-"84-61=23",
-"84-62=22",
-"84-63=21",
-"84-64=20",
-"84-65=19",
-"84-66=18",
-"84-67=17",
-"84-68=16",
-"84-69=15",
-"84-70=14",
-"84-71=13",
-"84-72=12",
-"84-73=11",
-"84-74=10",
-"84-85=-1",
-"84-86=-2",
-"84-87=-3",
-"84-88=-4",
-"84-89=-5",
-"84-90=-6",
-"84-91=-7",
-"84-92=-8",
-"84-93=-9",
-"84-9*9=3",
-"84*0+0=0",
-"84*0+1=1",
-"84*0+2=2",
-"84*0+3=3",
-"84*0+4=4",
-"84*0+5=5",
-"84*0+6=6",
-"84*0+7=7",
-"84*0+8=8",
-"84*0+9=9",
-"84*0-0=0",
-"84*0*0=0",
-"84*0*1=0",
-"84*0*2=0",
-"84*0*3=0",
-"84*0*4=0",
-"84*0*5=0",
-"84*0*6=0",
-"84*0*7=0",
-"84*0*8=0",
-"84*0*9=0",
-"84*0/1=0",
-"84*0/2=0",
-"84*0/3=0",
-"84*0/4=0",
-"84*0/5=0",
-"84*0/6=0",
-"84*0/7=0",
-"84*0/8=0",
-"84*0/9=0",
-"84*1*0=0",
-"84*2*0=0",
-"84*2=168",
-"84*3*0=0",
-"84*3=252",
-"84*4*0=0",
-"84*4=336",
-"84*5*0=0",
-"84*5=420",
-"84*6*0=0",
-"84*6=504",
-"84*7*0=0",
-"84*7=588",
-"84*8*0=0",
-"84*8=672",
-"84*9*0=0",
-"84*9=756",
-"84/1*0=0",
-"84/2*0=0",
-"84/2/6=7",
-"84/2/7=6",
-"84/3*0=0",
-"84/3/4=7",
-"84/3/7=4",
-"84/4*0=0",
-"84/4/3=7",
-"84/4/7=3",
-"84/5*0=0",
-"84/6-5=9",
-"84/6-6=8",
-"84/6-7=7",
-"84/6-8=6",
-"84/6-9=5",
-"84/6*0=0",
-"84/6/2=7",
-"84/6/7=2",
-"84/7-3=9",
-"84/7-4=8",
-"84/7-5=7",
-"84/7-6=6",
-"84/7-7=5",
-"84/7-8=4",
-"84/7-9=3",
-"84/7*0=0",
-"84/7/2=6",
-"84/7/3=4",
-"84/7/4=3",
-"84/7/6=2",
-"84/8*0=0",
-"84/9*0=0",
-"8500*0=0",
-"8501*0=0",
-"8502*0=0",
-"8503*0=0",
-"8504*0=0",
-"8505*0=0",
-"8506*0=0",
-"8507*0=0",
-"8508*0=0",
-"8509*0=0",
-"8510*0=0",
-"8511*0=0",
-"8512*0=0",
-"8513*0=0",
-"8514*0=0",
-"8515*0=0",
-"8516*0=0",
-"8517*0=0",
-"8518*0=0",
-"8519*0=0",
-"8520*0=0",
-"8521*0=0",
-"8522*0=0",
-"8523*0=0",
-"8524*0=0",
-"8525*0=0",
-"8526*0=0",
-"8527*0=0",
-"8528*0=0",
-"8529*0=0",
-"8530*0=0",
-"8531*0=0",
-"8532*0=0",
-"8533*0=0",
-"8534*0=0",
-"8535*0=0",
-"8536*0=0",
-"8537*0=0",
-"8538*0=0",
-"8539*0=0",
-"8540*0=0",
-"8541*0=0",
-"8542*0=0",
-"8543*0=0",
-"8544*0=0",
-"8545*0=0",
-"8546*0=0",
-"8547*0=0",
-"8548*0=0",
-"8549*0=0",
-"8550*0=0",
-"8551*0=0",
-"8552*0=0",
-"8553*0=0",
-"8554*0=0",
-"8555*0=0",
-"8556*0=0",
-"8557*0=0",
-"8558*0=0",
-"8559*0=0",
-"855/95=9",
-"855/9=95",
-"8560*0=0",
-"8561*0=0",
-"8562*0=0",
-"8563*0=0",
-"8564*0=0",
-"8565*0=0",
-"8566*0=0",
-"8567*0=0",
-"8568*0=0",
-"8569*0=0",
-"8570*0=0",
-"8571*0=0",
-"8572*0=0",
-"8573*0=0",
-"8574*0=0",
-"8575*0=0",
-"8576*0=0",
-"8577*0=0",
-"8578*0=0",
-"8579*0=0",
-"8580*0=0",
-"8581*0=0",
-"8582*0=0",
-"8583*0=0",
-"8584*0=0",
-"8585*0=0",
-"8586*0=0",
-"8587*0=0",
-"8588*0=0",
-"8589*0=0",
-"8590*0=0",
-"8591*0=0",
-"8592*0=0",
-"8593*0=0",
-"8594*0=0",
-"8595*0=0",
-"8596*0=0",
-"8597*0=0",
-"8598*0=0",
-"8599*0=0",
-"85+10=95",
-"85+11=96",
-"85+12=97",
-"85+13=98",
-"85+14=99",
-"85-10=75",
-"85-11=74",
-"85-12=73",
-"85-13=72",
-"85-14=71",
-"85-15=70",
-"85-16=69",
-"85-17=68",
-"85-18=67",
-"85-19=66",
-"85-20=65",
-"85-21=64",
-"85-22=63",
-"85-23=62",
-"85-24=61",
-"85-25=60",
-"85-26=59",
-"85-27=58",
-"85-28=57",
-"85-29=56",
-"85-30=55",
-"85-31=54",
-"85-32=53",
-"85-33=52",
-"85-34=51",
-"85-35=50",
-"85-36=49",
-"85-37=48",
-"85-38=47",
-"85-39=46",
-"85-40=45",
-"85-41=44",
-"85-42=43",
-"85-43=42",
-"85-44=41",
-"85-45=40",
-"85-46=39",
-"85-47=38",
-"85-48=37",
-"85-49=36",
-"85-50=35",
-"85-51=34",
-"85-52=33",
-"85-53=32",
-"85-54=31",
-"85-55=30",
-"85-56=29",
-"85-57=28",
-"85-58=27",
-"85-59=26",
-"85-60=25",
-"85-61=24",
-"85-62=23",
-"85-63=22",
-"85-64=21",
-"85-65=20",
-"85-66=19",
-"85-67=18",
-"85-68=17",
-"85-69=16",
-"85-70=15",
-"85-71=14",
-"85-72=13",
-"85-73=12",
-"85-74=11",
-"85-75=10",
-"85-86=-1",
-"85-87=-2",
-"85-88=-3",
-"85-89=-4",
-"85-90=-5",
-"85-91=-6",
-"85-92=-7",
-"85-93=-8",
-"85-94=-9",
-"85-9*9=4",
-"85*0+0=0",
-"85*0+1=1",
-"85*0+2=2",
-"85*0+3=3",
-"85*0+4=4",
-"85*0+5=5",
-"85*0+6=6",
-"85*0+7=7",
-"85*0+8=8",
-"85*0+9=9",
-"85*0-0=0",
-"85*0*0=0",
-"85*0*1=0",
-"85*0*2=0",
-"85*0*3=0",
-"85*0*4=0",
-"85*0*5=0",
-"85*0*6=0",
-"85*0*7=0",
-"85*0*8=0",
-"85*0*9=0",
-"85*0/1=0",
-"85*0/2=0",
-"85*0/3=0",
-"85*0/4=0",
-"85*0/5=0",
-"85*0/6=0",
-"85*0/7=0",
-"85*0/8=0",
-"85*0/9=0",
-"85*1*0=0",
-"85*2*0=0",
-"85*2=170",
-"85*3*0=0",
-"85*3=255",
-"85*4*0=0",
-"85*4=340",
-"85*5*0=0",
-"85*5=425",
-"85*6*0=0",
-"85*6=510",
-"85*7*0=0",
-"85*7=595",
-"85*8*0=0",
-"85*8=680",
-"85*9*0=0",
-"85*9=765",
-"85/1*0=0",
-"85/2*0=0",
-"85/3*0=0",
-"85/4*0=0",
-"85/5-8=9",
-"85/5-9=8",
-"85/5*0=0",
-"85/6*0=0",
-"85/7*0=0",
-"85/8*0=0",
-"85/9*0=0",
-"8600*0=0",
-"8601*0=0",
-"8602*0=0",
-"8603*0=0",
-"8604*0=0",
-"8605*0=0",
-"8606*0=0",
-"8607*0=0",
-"8608*0=0",
-"8609*0=0",
-"8610*0=0",
-"8611*0=0",
-"8612*0=0",
-"8613*0=0",
-"8614*0=0",
-"8615*0=0",
-"8616*0=0",
-"8617*0=0",
-"8618*0=0",
-"8619*0=0",
-"8620*0=0",
-"8621*0=0",
-"8622*0=0",
-"8623*0=0",
-"8624*0=0",
-"8625*0=0",
-"8626*0=0",
-"8627*0=0",
-"8628*0=0",
-"8629*0=0",
-"8630*0=0",
-"8631*0=0",
-"8632*0=0",
-"8633*0=0",
-"8634*0=0",
-"8635*0=0",
-"8636*0=0",
-"8637*0=0",
-"8638*0=0",
-"8639*0=0",
-"8640*0=0",
-"8641*0=0",
-"8642*0=0",
-"8643*0=0",
-"8644*0=0",
-"8645*0=0",
-"8646*0=0",
-"8647*0=0",
-"8648*0=0",
-"8649*0=0",
-"864/96=9",
-"864/9=96",
-"8650*0=0",
-"8651*0=0",
-"8652*0=0",
-"8653*0=0",
-"8654*0=0",
-"8655*0=0",
-"8656*0=0",
-"8657*0=0",
-"8658*0=0",
-"8659*0=0",
-"8660*0=0",
-"8661*0=0",
-"8662*0=0",
-"8663*0=0",
-"8664*0=0",
-"8665*0=0",
-"8666*0=0",
-"8667*0=0",
-"8668*0=0",
-"8669*0=0",
-"8670*0=0",
-"8671*0=0",
-"8672*0=0",
-"8673*0=0",
-"8674*0=0",
-"8675*0=0",
-"8676*0=0",
-"8677*0=0",
-"8678*0=0",
-"8679*0=0",
-"8680*0=0",
-"8681*0=0",
-"8682*0=0",
-"8683*0=0",
-"8684*0=0",
-"8685*0=0",
-"8686*0=0",
-"8687*0=0",
-"8688*0=0",
-"8689*0=0",
-"8690*0=0",
-"8691*0=0",
-"8692*0=0",
-"8693*0=0",
-"8694*0=0",
-"8695*0=0",
-"8696*0=0",
-"8697*0=0",
-"8698*0=0",
-"8699*0=0",
-"86+10=96",
-"86+11=97",
-"86+12=98",
-"86+13=99",
-"86-10=76",
-"86-11=75",
-"86-12=74",
-"86-13=73",
-"86-14=72",
-"86-15=71",
-"86-16=70",
-"86-17=69",
-"86-18=68",
-"86-19=67",
-"86-20=66",
-"86-21=65",
-"86-22=64",
-"86-23=63",
-"86-24=62",
-"86-25=61",
-"86-26=60",
-"86-27=59",
-"86-28=58",
-"86-29=57",
-"86-30=56",
-"86-31=55",
-"86-32=54",
-"86-33=53",
-"86-34=52",
-"86-35=51",
-"86-36=50",
-"86-37=49",
-"86-38=48",
-"86-39=47",
-"86-40=46",
-"86-41=45",
-"86-42=44",
-"86-43=43",
-"86-44=42",
-"86-45=41",
-"86-46=40",
-"86-47=39",
-"86-48=38",
-"86-49=37",
-"86-50=36",
-"86-51=35",
-"86-52=34",
-"86-53=33",
-"86-54=32",
-"86-55=31",
-"86-56=30",
-"86-57=29",
-"86-58=28",
-"86-59=27",
-"86-60=26",
-"86-61=25",
-"86-62=24",
-"86-63=23",
-"86-64=22",
-"86-65=21",
-"86-66=20",
-"86-67=19",
-"86-68=18",
-"86-69=17",
-"86-70=16",
-"86-71=15",
-"86-72=14",
-"86-73=13",
-"86-74=12",
-"86-75=11",
-"86-76=10",
-"86-87=-1",
-"86-88=-2",
-"86-89=-3",
-"86-90=-4",
-"86-91=-5",
-"86-92=-6",
-"86-93=-7",
-"86-94=-8",
-"86-95=-9",
-"86-9*9=5",
-"86*0+0=0",
-"86*0+1=1",
-"86*0+2=2",
-"86*0+3=3",
-"86*0+4=4",
-"86*0+5=5",
-"86*0+6=6",
-"86*0+7=7",
-"86*0+8=8",
-"86*0+9=9",
-"86*0-0=0",
-"86*0*0=0",
-"86*0*1=0",
-"86*0*2=0",
-"86*0*3=0",
-"86*0*4=0",
-"86*0*5=0",
-"86*0*6=0",
-"86*0*7=0",
-"86*0*8=0",
-"86*0*9=0",
-"86*0/1=0",
-"86*0/2=0",
-"86*0/3=0",
-"86*0/4=0",
-"86*0/5=0",
-"86*0/6=0",
-"86*0/7=0",
-"86*0/8=0",
-"86*0/9=0",
-"86*1*0=0",
-"86*2*0=0",
-"86*2=172",
-"86*3*0=0",
-"86*3=258",
-"86*4*0=0",
-"86*4=344",
-"86*5*0=0",
-"86*5=430",
-"86*6*0=0",
-"86*6=516",
-"86*7*0=0",
-"86*7=602",
-"86*8*0=0",
-"86*8=688",
-"86*9*0=0",
-"86*9=774",
-"86/1*0=0",
-"86/2*0=0",
-"86/3*0=0",
-"86/4*0=0",
-"86/5*0=0",
-"86/6*0=0",
-"86/7*0=0",
-"86/8*0=0",
-"86/9*0=0",
-"8700*0=0",
-"8701*0=0",
-"8702*0=0",
-"8703*0=0",
-"8704*0=0",
-"8705*0=0",
-"8706*0=0",
-"8707*0=0",
-"8708*0=0",
-"8709*0=0",
-"8710*0=0",
-"8711*0=0",
-"8712*0=0",
-"8713*0=0",
-"8714*0=0",
-"8715*0=0",
-"8716*0=0",
-"8717*0=0",
-"8718*0=0",
-"8719*0=0",
-"8720*0=0",
-"8721*0=0",
-"8722*0=0",
-"8723*0=0",
-"8724*0=0",
-"8725*0=0",
-"8726*0=0",
-"8727*0=0",
-"8728*0=0",
-"8729*0=0",
-"8730*0=0",
-"8731*0=0",
-"8732*0=0",
-"8733*0=0",
-"8734*0=0",
-"8735*0=0",
-"8736*0=0",
-"8737*0=0",
-"8738*0=0",
-"8739*0=0",
-"873/97=9",
-"873/9=97",
-"8740*0=0",
-"8741*0=0",
-"8742*0=0",
-"8743*0=0",
-"8744*0=0",
-"8745*0=0",
-"8746*0=0",
-"8747*0=0",
-"8748*0=0",
-"8749*0=0",
-"8750*0=0",
-"8751*0=0",
-"8752*0=0",
-"8753*0=0",
-"8754*0=0",
-"8755*0=0",
-"8756*0=0",
-"8757*0=0",
-"8758*0=0",
-"8759*0=0",
-"8760*0=0",
-"8761*0=0",
-"8762*0=0",
-"8763*0=0",
-"8764*0=0",
-"8765*0=0",
-"8766*0=0",
-"8767*0=0",
-"8768*0=0",
-"8769*0=0",
-"8770*0=0",
-"8771*0=0",
-"8772*0=0",
-"8773*0=0",
-"8774*0=0",
-"8775*0=0",
-"8776*0=0",
-"8777*0=0",
-"8778*0=0",
-"8779*0=0",
-"8780*0=0",
-"8781*0=0",
-"8782*0=0",
-"8783*0=0",
-"8784*0=0",
-"8785*0=0",
-"8786*0=0",
-"8787*0=0",
-"8788*0=0",
-"8789*0=0",
-"8790*0=0",
-"8791*0=0",
-"8792*0=0",
-"8793*0=0",
-"8794*0=0",
-"8795*0=0",
-"8796*0=0",
-"8797*0=0",
-"8798*0=0",
-"8799*0=0",
-"87+10=97",
-"87+11=98",
-"87+12=99",
-"87-10=77",
-"87-11=76",
-"87-12=75",
-"87-13=74",
-"87-14=73",
-"87-15=72",
-"87-16=71",
-"87-17=70",
-"87-18=69",
-"87-19=68",
-"87-20=67",
-"87-21=66",
-"87-22=65",
-"87-23=64",
-"87-24=63",
-"87-25=62",
-"87-26=61",
-"87-27=60",
-"87-28=59",
-"87-29=58",
-"87-30=57",
-"87-31=56",
-"87-32=55",
-"87-33=54",
-"87-34=53",
-"87-35=52",
-"87-36=51",
-"87-37=50",
-"87-38=49",
-"87-39=48",
-"87-40=47",
-"87-41=46",
-"87-42=45",
-"87-43=44",
-"87-44=43",
-"87-45=42",
-"87-46=41",
-"87-47=40",
-"87-48=39",
-"87-49=38",
-"87-50=37",
-"87-51=36",
-"87-52=35",
-"87-53=34",
-"87-54=33",
-"87-55=32",
-"87-56=31",
-"87-57=30",
-"87-58=29",
-"87-59=28",
-"87-60=27",
-"87-61=26",
-"87-62=25",
-"87-63=24",
-"87-64=23",
-"87-65=22",
-"87-66=21",
-"87-67=20",
-"87-68=19",
-"87-69=18",
-"87-70=17",
-"87-71=16",
-"87-72=15",
-"87-73=14",
-"87-74=13",
-"87-75=12",
-"87-76=11",
-"87-77=10",
-"87-88=-1",
-"87-89=-2",
-"87-90=-3",
-"87-91=-4",
-"87-92=-5",
-"87-93=-6",
-"87-94=-7",
-"87-95=-8",
-"87-96=-9",
-"87-9*9=6",
-"87*0+0=0",
-"87*0+1=1",
-"87*0+2=2",
-"87*0+3=3",
-"87*0+4=4",
-"87*0+5=5",
-"87*0+6=6",
-"87*0+7=7",
-"87*0+8=8",
-"87*0+9=9",
-"87*0-0=0",
-"87*0*0=0",
-"87*0*1=0",
-"87*0*2=0",
-"87*0*3=0",
-"87*0*4=0",
-"87*0*5=0",
-"87*0*6=0",
-"87*0*7=0",
-"87*0*8=0",
-"87*0*9=0",
-"87*0/1=0",
-"87*0/2=0",
-"87*0/3=0",
-"87*0/4=0",
-"87*0/5=0",
-"87*0/6=0",
-"87*0/7=0",
-"87*0/8=0",
-"87*0/9=0",
-"87*1*0=0",
-"87*2*0=0",
-"87*2=174",
-"87*3*0=0",
-"87*3=261",
-"87*4*0=0",
-"87*4=348",
-"87*5*0=0",
-"87*5=435",
-"87*6*0=0",
-"87*6=522",
-"87*7*0=0",
-"87*7=609",
-"87*8*0=0",
-"87*8=696",
-"87*9*0=0",
-"87*9=783",
-"87/1*0=0",
-"87/2*0=0",
-"87/3*0=0",
-"87/4*0=0",
-"87/5*0=0",
-"87/6*0=0",
-"87/7*0=0",
-"87/8*0=0",
-"87/9*0=0",
-"8800*0=0",
-"8801*0=0",
-"8802*0=0",
-"8803*0=0",
-"8804*0=0",
-"8805*0=0",
-"8806*0=0",
-"8807*0=0",
-"8808*0=0",
-"8809*0=0",
-"8810*0=0",
-"8811*0=0",
-"8812*0=0",
-"8813*0=0",
-"8814*0=0",
-"8815*0=0",
-"8816*0=0",
-"8817*0=0",
-"8818*0=0",
-"8819*0=0",
-"8820*0=0",
-"8821*0=0",
-"8822*0=0",
-"8823*0=0",
-"8824*0=0",
-"8825*0=0",
-"8826*0=0",
-"8827*0=0",
-"8828*0=0",
-"8829*0=0",
-"882/98=9",
-"882/9=98",
-"8830*0=0",
-"8831*0=0",
-"8832*0=0",
-"8833*0=0",
-"8834*0=0",
-"8835*0=0",
-"8836*0=0",
-"8837*0=0",
-"8838*0=0",
-"8839*0=0",
-"8840*0=0",
-"8841*0=0",
-"8842*0=0",
-"8843*0=0",
-"8844*0=0",
-"8845*0=0",
-"8846*0=0",
-"8847*0=0",
-"8848*0=0",
-"8849*0=0",
-"8850*0=0",
-"8851*0=0",
-"8852*0=0",
-"8853*0=0",
-"8854*0=0",
-"8855*0=0",
-"8856*0=0",
-"8857*0=0",
-"8858*0=0",
-"8859*0=0",
-"8860*0=0",
-"8861*0=0",
-"8862*0=0",
-"8863*0=0",
-"8864*0=0",
-"8865*0=0",
-"8866*0=0",
-"8867*0=0",
-"8868*0=0",
-"8869*0=0",
-"8870*0=0",
-"8871*0=0",
-"8872*0=0",
-"8873*0=0",
-"8874*0=0",
-"8875*0=0",
-"8876*0=0",
-"8877*0=0",
-"8878*0=0",
-"8879*0=0",
-"8880*0=0",
-"8881*0=0",
-"8882*0=0",
-"8883*0=0",
-"8884*0=0",
-"8885*0=0",
-"8886*0=0",
-"8887*0=0",
-"8888*0=0",
-"8889*0=0",
-"8890*0=0",
-"8891*0=0",
-"8892*0=0",
-"8893*0=0",
-"8894*0=0",
-"8895*0=0",
-"8896*0=0",
-"8897*0=0",
-"8898*0=0",
-"8899*0=0",
-"88+10=98",
-"88+11=99",
-"88-10=78",
-"88-11=77",
-"88-12=76",
-"88-13=75",
-"88-14=74",
-"88-15=73",
-"88-16=72",
-"88-17=71",
-"88-18=70",
-"88-19=69",
-"88-20=68",
-"88-21=67",
-"88-22=66",
-"88-23=65",
-"88-24=64",
-"88-25=63",
-"88-26=62",
-"88-27=61",
-"88-28=60",
-"88-29=59",
-"88-30=58",
-"88-31=57",
-"88-32=56",
-"88-33=55",
-"88-34=54",
-"88-35=53",
-"88-36=52",
-"88-37=51",
-"88-38=50",
-"88-39=49",
-"88-40=48",
-"88-41=47",
-"88-42=46",
-"88-43=45",
-"88-44=44",
-"88-45=43",
-"88-46=42",
-"88-47=41",
-"88-48=40",
-"88-49=39",
-"88-50=38",
-"88-51=37",
-"88-52=36",
-"88-53=35",
-"88-54=34",
-"88-55=33",
-"88-56=32",
-"88-57=31",
-"88-58=30",
-"88-59=29",
-"88-60=28",
-"88-61=27",
-"88-62=26",
-"88-63=25",
-"88-64=24",
-"88-65=23",
-"88-66=22",
-"88-67=21",
-"88-68=20",
-"88-69=19",
-"88-70=18",
-"88-71=17",
-"88-72=16",
-"88-73=15",
-"88-74=14",
-"88-75=13",
-"88-76=12",
-"88-77=11",
-"88-78=10",
-"88-89=-1",
-"88-90=-2",
-"88-91=-3",
-"88-92=-4",
-"88-93=-5",
-"88-94=-6",
-"88-95=-7",
-"88-96=-8",
-"88-97=-9",
-"88-9*9=7",
-"88*0+0=0",
-"88*0+1=1",
-"88*0+2=2",
-"88*0+3=3",
-"88*0+4=4",
-"88*0+5=5",
-"88*0+6=6",
-"88*0+7=7",
-"88*0+8=8",
-"88*0+9=9",
-"88*0-0=0",
-"88*0*0=0",
-"88*0*1=0",
-"88*0*2=0",
-"88*0*3=0",
-"88*0*4=0",
-"88*0*5=0",
-"88*0*6=0",
-"88*0*7=0",
-"88*0*8=0",
-"88*0*9=0",
-"88*0/1=0",
-"88*0/2=0",
-"88*0/3=0",
-"88*0/4=0",
-"88*0/5=0",
-"88*0/6=0",
-"88*0/7=0",
-"88*0/8=0",
-"88*0/9=0",
-"88*1*0=0",
-"88*2*0=0",
-"88*2=176",
-"88*3*0=0",
-"88*3=264",
-"88*4*0=0",
-"88*4=352",
-"88*5*0=0",
-"88*5=440",
-"88*6*0=0",
-"88*6=528",
-"88*7*0=0",
-"88*7=616",
-"88*8*0=0",
-"88*8=704",
-"88*9*0=0",
-"88*9=792",
-"88/1*0=0",
-"88/2*0=0",
-"88/3*0=0",
-"88/4*0=0",
-"88/5*0=0",
-"88/6*0=0",
-"88/7*0=0",
-"88/8-2=9",
-"88/8-3=8",
-"88/8-4=7",
-"88/8-5=6",
-"88/8-6=5",
-"88/8-7=4",
-"88/8-8=3",
-"88/8-9=2",
-"88/8*0=0",
-"88/9*0=0",
-"8900*0=0",
-"8901*0=0",
-"8902*0=0",
-"8903*0=0",
-"8904*0=0",
-"8905*0=0",
-"8906*0=0",
-"8907*0=0",
-"8908*0=0",
-"8909*0=0",
-"8910*0=0",
-"8911*0=0",
-"8912*0=0",
-"8913*0=0",
-"8914*0=0",
-"8915*0=0",
-"8916*0=0",
-"8917*0=0",
-"8918*0=0",
-"8919*0=0",
-"891/99=9",
-"891/9=99",
-"8920*0=0",
-"8921*0=0",
-"8922*0=0",
-"8923*0=0",
-"8924*0=0",
-"8925*0=0",
-"8926*0=0",
-"8927*0=0",
-"8928*0=0",
-"8929*0=0",
-"8930*0=0",
-"8931*0=0",
-"8932*0=0",
-"8933*0=0",
-"8934*0=0",
-"8935*0=0",
-"8936*0=0",
-"8937*0=0",
-"8938*0=0",
-"8939*0=0",
-"8940*0=0",
-"8941*0=0",
-"8942*0=0",
-"8943*0=0",
-"8944*0=0",
-"8945*0=0",
-"8946*0=0",
-"8947*0=0",
-"8948*0=0",
-"8949*0=0",
-"8950*0=0",
-"8951*0=0",
-"8952*0=0",
-"8953*0=0",
-"8954*0=0",
-"8955*0=0",
-"8956*0=0",
-"8957*0=0",
-"8958*0=0",
-"8959*0=0",
-"8960*0=0",
-"8961*0=0",
-"8962*0=0",
-"8963*0=0",
-"8964*0=0",
-"8965*0=0",
-"8966*0=0",
-"8967*0=0",
-"8968*0=0",
-"8969*0=0",
-"8970*0=0",
-"8971*0=0",
-"8972*0=0",
-"8973*0=0",
-"8974*0=0",
-"8975*0=0",
-"8976*0=0",
-"8977*0=0",
-"8978*0=0",
-"8979*0=0",
-"8980*0=0",
-"8981*0=0",
-"8982*0=0",
-"8983*0=0",
-"8984*0=0",
-"8985*0=0",
-"8986*0=0",
-"8987*0=0",
-"8988*0=0",
-"8989*0=0",
-"8990*0=0",
-"8991*0=0",
-"8992*0=0",
-"8993*0=0",
-"8994*0=0",
-"8995*0=0",
-"8996*0=0",
-"8997*0=0",
-"8998*0=0",
-"8999*0=0",
-"89+10=99",
-"89-10=79",
-"89-11=78",
-"89-12=77",
-"89-13=76",
-"89-14=75",
-"89-15=74",
-"89-16=73",
-"89-17=72",
-"89-18=71",
-"89-19=70",
-"89-20=69",
-"89-21=68",
-"89-22=67",
-"89-23=66",
-"89-24=65",
-"89-25=64",
-"89-26=63",
-"89-27=62",
-"89-28=61",
-"89-29=60",
-"89-30=59",
-"89-31=58",
-"89-32=57",
-"89-33=56",
-"89-34=55",
-"89-35=54",
-"89-36=53",
-"89-37=52",
-"89-38=51",
-"89-39=50",
-"89-40=49",
-"89-41=48",
-"89-42=47",
-"89-43=46",
-"89-44=45",
-"89-45=44",
-"89-46=43",
-"89-47=42",
-"89-48=41",
-"89-49=40",
-"89-50=39",
-"89-51=38",
-"89-52=37",
-"89-53=36",
-"89-54=35",
-"89-55=34",
-"89-56=33",
-"89-57=32",
-"89-58=31",
-"89-59=30",
-"89-60=29",
-"89-61=28",
-"89-62=27",
-"89-63=26",
-"89-64=25",
-"89-65=24",
-"89-66=23",
-"89-67=22",
-"89-68=21",
-"89-69=20",
-"89-70=19",
-"89-71=18",
-"89-72=17",
-"89-73=16",
-"89-74=15",
-"89-75=14",
-"89-76=13",
-"89-77=12",
-"89-78=11",
-"89-79=10",
-"89-90=-1",
-"89-91=-2",
-"89-92=-3",
-"89-93=-4",
-"89-94=-5",
-"89-95=-6",
-"89-96=-7",
-"89-97=-8",
-"89-98=-9",
-"89-9*9=8",
-"89*0+0=0",
-"89*0+1=1",
-"89*0+2=2",
-"89*0+3=3",
-"89*0+4=4",
-"89*0+5=5",
-"89*0+6=6",
-"89*0+7=7",
-"89*0+8=8",
-"89*0+9=9",
-"89*0-0=0",
-"89*0*0=0",
-"89*0*1=0",
-"89*0*2=0",
-"89*0*3=0",
-"89*0*4=0",
-"89*0*5=0",
-"89*0*6=0",
-"89*0*7=0",
-"89*0*8=0",
-"89*0*9=0",
-"89*0/1=0",
-"89*0/2=0",
-"89*0/3=0",
-"89*0/4=0",
-"89*0/5=0",
-"89*0/6=0",
-"89*0/7=0",
-"89*0/8=0",
-"89*0/9=0",
-"89*1*0=0",
-"89*2*0=0",
-"89*2=178",
-"89*3*0=0",
-"89*3=267",
-"89*4*0=0",
-"89*4=356",
-"89*5*0=0",
-"89*5=445",
-"89*6*0=0",
-"89*6=534",
-"89*7*0=0",
-"89*7=623",
-"89*8*0=0",
-"89*8=712",
-"89*9*0=0",
-"89*9=801",
-"89/1*0=0",
-"89/2*0=0",
-"89/3*0=0",
-"89/4*0=0",
-"89/5*0=0",
-"89/6*0=0",
-"89/7*0=0",
-"89/8*0=0",
-"89/9*0=0",
-"8+0+2=10",
-"8+0+3=11",
-"8+0+4=12",
-"8+0+5=13",
-"8+0+6=14",
-"8+0+7=15",
-"8+0+8=16",
-"8+0+9=17",
-"8+0-9=-1",
-"8+0*10=8",
-"8+0*11=8",
-"8+0*12=8",
-"8+0*13=8",
-"8+0*14=8",
-"8+0*15=8",
-"8+0*16=8",
-"8+0*17=8",
-"8+0*18=8",
-"8+0*19=8",
-"8+0*20=8",
-"8+0*21=8",
-"8+0*22=8",
-"8+0*23=8",
-"8+0*24=8",
-"8+0*25=8",
-"8+0*26=8",
-"8+0*27=8",
-"8+0*28=8",
-"8+0*29=8",
-"8+0*30=8",
-"8+0*31=8",
-"8+0*32=8",
-"8+0*33=8",
-"8+0*34=8",
-"8+0*35=8",
-"8+0*36=8",
-"8+0*37=8",
-"8+0*38=8",
-"8+0*39=8",
-"8+0*40=8",
-"8+0*41=8",
-"8+0*42=8",
-"8+0*43=8",
-"8+0*44=8",
-"8+0*45=8",
-"8+0*46=8",
-"8+0*47=8",
-"8+0*48=8",
-"8+0*49=8",
-"8+0*50=8",
-"8+0*51=8",
-"8+0*52=8",
-"8+0*53=8",
-"8+0*54=8",
-"8+0*55=8",
-"8+0*56=8",
-"8+0*57=8",
-"8+0*58=8",
-"8+0*59=8",
-"8+0*60=8",
-"8+0*61=8",
-"8+0*62=8",
-"8+0*63=8",
-"8+0*64=8",
-"8+0*65=8",
-"8+0*66=8",
-"8+0*67=8",
-"8+0*68=8",
-"8+0*69=8",
-"8+0*70=8",
-"8+0*71=8",
-"8+0*72=8",
-"8+0*73=8",
-"8+0*74=8",
-"8+0*75=8",
-"8+0*76=8",
-"8+0*77=8",
-"8+0*78=8",
-"8+0*79=8",
-"8+0*80=8",
-"8+0*81=8",
-"8+0*82=8",
-"8+0*83=8",
-"8+0*84=8",
-"8+0*85=8",
-"8+0*86=8",
-"8+0*87=8",
-"8+0*88=8",
-"8+0*89=8",
-"8+0*90=8",
-"8+0*91=8",
-"8+0*92=8",
-"8+0*93=8",
-"8+0*94=8",
-"8+0*95=8",
-"8+0*96=8",
-"8+0*97=8",
-"8+0*98=8",
-"8+0*99=8",
-"8+0/10=8",
-"8+0/11=8",
-"8+0/12=8",
-"8+0/13=8",
-"8+0/14=8",
-"8+0/15=8",
-"8+0/16=8",
-"8+0/17=8",
-"8+0/18=8",
-"8+0/19=8",
-"8+0/20=8",
-"8+0/21=8",
-"8+0/22=8",
-"8+0/23=8",
-"8+0/24=8",
-"8+0/25=8",
-"8+0/26=8",
-"8+0/27=8",
-"8+0/28=8",
-"8+0/29=8",
-"8+0/30=8",
-"8+0/31=8",
-"8+0/32=8",
-"8+0/33=8",
-"8+0/34=8",
-"8+0/35=8",
-"8+0/36=8",
-"8+0/37=8",
-"8+0/38=8",
-"8+0/39=8",
-"8+0/40=8",
-"8+0/41=8",
-"8+0/42=8",
-"8+0/43=8",
-"8+0/44=8",
-"8+0/45=8",
-"8+0/46=8",
-"8+0/47=8",
-"8+0/48=8",
-"8+0/49=8",
-"8+0/50=8",
-"8+0/51=8",
-"8+0/52=8",
-"8+0/53=8",
-"8+0/54=8",
-"8+0/55=8",
-"8+0/56=8",
-"8+0/57=8",
-"8+0/58=8",
-"8+0/59=8",
-"8+0/60=8",
-"8+0/61=8",
-"8+0/62=8",
-"8+0/63=8",
-"8+0/64=8",
-"8+0/65=8",
-"8+0/66=8",
-"8+0/67=8",
-"8+0/68=8",
-"8+0/69=8",
-"8+0/70=8",
-"8+0/71=8",
-"8+0/72=8",
-"8+0/73=8",
-"8+0/74=8",
-"8+0/75=8",
-"8+0/76=8",
-"8+0/77=8",
-"8+0/78=8",
-"8+0/79=8",
-"8+0/80=8",
-"8+0/81=8",
-"8+0/82=8",
-"8+0/83=8",
-"8+0/84=8",
-"8+0/85=8",
-"8+0/86=8",
-"8+0/87=8",
-"8+0/88=8",
-"8+0/89=8",
-"8+0/90=8",
-"8+0/91=8",
-"8+0/92=8",
-"8+0/93=8",
-"8+0/94=8",
-"8+0/95=8",
-"8+0/96=8",
-"8+0/97=8",
-"8+0/98=8",
-"8+0/99=8",
-"8+10-9=9",
-"8+10*0=8",
-"8+11*0=8",
-"8+12*0=8",
-"8+13*0=8",
-"8+14*0=8",
-"8+15*0=8",
-"8+16*0=8",
-"8+17*0=8",
-"8+18*0=8",
-"8+19*0=8",
-"8+1+1=10",
-"8+1+2=11",
-"8+1+3=12",
-"8+1+4=13",
-"8+1+5=14",
-"8+1+6=15",
-"8+1+7=16",
-"8+1+8=17",
-"8+1+9=18",
-"8+1*2=10",
-"8+1*3=11",
-"8+1*4=12",
-"8+1*5=13",
-"8+1*6=14",
-"8+1*7=15",
-"8+1*8=16",
-"8+1*9=17",
-"8+20*0=8",
-"8+21*0=8",
-"8+22*0=8",
-"8+23*0=8",
-"8+24*0=8",
-"8+25*0=8",
-"8+26*0=8",
-"8+27*0=8",
-"8+28*0=8",
-"8+29*0=8",
-"8+2+0=10",
-"8+2+1=11",
-"8+2+2=12",
-"8+2+3=13",
-"8+2+4=14",
-"8+2+5=15",
-"8+2+6=16",
-"8+2+7=17",
-"8+2+8=18",
-"8+2+9=19",
-"8+2-0=10",
-"8+2-10=0",
-"8+2*1=10",
-"8+2*2=12",
-"8+2*3=14",
-"8+2*4=16",
-"8+2*5=18",
-"8+2*6=20",
-"8+2*7=22",
-"8+2*8=24",
-"8+2*9=26",
-"8+2/1=10",
-"8+30*0=8",
-"8+31*0=8",
-"8+32*0=8",
-"8+33*0=8",
-"8+34*0=8",
-"8+35*0=8",
-"8+36*0=8",
-"8+37*0=8",
-"8+38*0=8",
-"8+39*0=8",
-"8+3+0=11",
-"8+3+1=12",
-"8+3+2=13",
-"8+3+3=14",
-"8+3+4=15",
-"8+3+5=16",
-"8+3+6=17",
-"8+3+7=18",
-"8+3+8=19",
-"8+3+9=20",
-"8+3-0=11",
-"8+3-10=1",
-"8+3-11=0",
-"8+3-1=10",
-"8+3*1=11",
-"8+3*2=14",
-"8+3*3=17",
-"8+3*4=20",
-"8+3*5=23",
-"8+3*6=26",
-"8+3*7=29",
-"8+3*8=32",
-"8+3*9=35",
-"8+3/1=11",
-"8+40*0=8",
-"8+41*0=8",
-"8+42*0=8",
-"8+43*0=8",
-"8+44*0=8",
-"8+45*0=8",
-"8+46*0=8",
-"8+47*0=8",
-"8+48*0=8",
-"8+49*0=8",
-"8+4+0=12",
-"8+4+1=13",
-"8+4+2=14",
-"8+4+3=15",
-"8+4+4=16",
-"8+4+5=17",
-"8+4+6=18",
-"8+4+7=19",
-"8+4+8=20",
-"8+4+9=21",
-"8+4-0=12",
-"8+4-10=2",
-"8+4-11=1",
-"8+4-12=0",
-"8+4-1=11",
-"8+4-2=10",
-"8+4*1=12",
-"8+4*2=16",
-"8+4*3=20",
-"8+4*4=24",
-"8+4*5=28",
-"8+4*6=32",
-"8+4*7=36",
-"8+4*8=40",
-"8+4*9=44",
-"8+4/1=12",
-"8+4/2=10",
-"8+50*0=8",
-"8+51*0=8",
-"8+52*0=8",
-"8+53*0=8",
-"8+54*0=8",
-"8+55*0=8",
-"8+56*0=8",
-"8+57*0=8",
-"8+58*0=8",
-"8+59*0=8",
-"8+5+0=13",
-"8+5+1=14",
-"8+5+2=15",
-"8+5+3=16",
-"8+5+4=17",
-"8+5+5=18",
-"8+5+6=19",
-"8+5+7=20",
-"8+5+8=21",
-"8+5+9=22",
-"8+5-0=13",
-"8+5-10=3",
-"8+5-11=2",
-"8+5-12=1",
-"8+5-13=0",
-"8+5-1=12",
-"8+5-2=11",
-"8+5-3=10",
-"8+5*1=13",
-"8+5*2=18",
-"8+5*3=23",
-"8+5*4=28",
-"8+5*5=33",
-"8+5*6=38",
-"8+5*7=43",
-"8+5*8=48",
-"8+5*9=53",
-"8+5/1=13",
-"8+60*0=8",
-"8+61*0=8",
-"8+62*0=8",
-"8+63*0=8",
-"8+64*0=8",
-"8+65*0=8",
-"8+66*0=8",
-"8+67*0=8",
-"8+68*0=8",
-"8+69*0=8",
-"8+6+0=14",
-"8+6+1=15",
-"8+6+2=16",
-"8+6+3=17",
-"8+6+4=18",
-"8+6+5=19",
-"8+6+6=20",
-"8+6+7=21",
-"8+6+8=22",
-"8+6+9=23",
-"8+6-0=14",
-"8+6-10=4",
-"8+6-11=3",
-"8+6-12=2",
-"8+6-13=1",
-"8+6-14=0",
-"8+6-1=13",
-"8+6-2=12",
-"8+6-3=11",
-"8+6-4=10",
-"8+6*1=14",
-"8+6*2=20",
-"8+6*3=26",
-"8+6*4=32",
-"8+6*5=38",
-"8+6*6=44",
-"8+6*7=50",
-"8+6*8=56",
-"8+6*9=62",
-"8+6/1=14",
-"8+6/2=11",
-"8+6/3=10",
-"8+70*0=8",
-"8+71*0=8",
-"8+72*0=8",
-"8+73*0=8",
-"8+74*0=8",
-"8+75*0=8",
-"8+76*0=8",
-"8+77*0=8",
-"8+78*0=8",
-"8+79*0=8",
-"8+7+0=15",
-"8+7+1=16",
-"8+7+2=17",
-"8+7+3=18",
-"8+7+4=19",
-"8+7+5=20",
-"8+7+6=21",
-"8+7+7=22",
-"8+7+8=23",
-"8+7+9=24",
-"8+7-0=15",
-"8+7-10=5",
-"8+7-11=4",
-"8+7-12=3",
-"8+7-13=2",
-"8+7-14=1",
-"8+7-15=0",
-"8+7-1=14",
-"8+7-2=13",
-"8+7-3=12",
-"8+7-4=11",
-"8+7-5=10",
-"8+7*1=15",
-"8+7*2=22",
-"8+7*3=29",
-"8+7*4=36",
-"8+7*5=43",
-"8+7*6=50",
-"8+7*7=57",
-"8+7*8=64",
-"8+7*9=71",
-"8+7/1=15",
-"8+80*0=8",
-"8+81*0=8",
-"8+82*0=8",
-"8+83*0=8",
-"8+84*0=8",
-"8+85*0=8",
-"8+86*0=8",
-"8+87*0=8",
-"8+88*0=8",
-"8+89*0=8",
-"8+8+0=16",
-"8+8+1=17",
-"8+8+2=18",
-"8+8+3=19",
-"8+8+4=20",
-"8+8+5=21",
-"8+8+6=22",
-"8+8+7=23",
-"8+8+8=24",
-"8+8+9=25",
-"8+8-0=16",
-"8+8-10=6",
-"8+8-11=5",
-"8+8-12=4",
-"8+8-13=3",
-"8+8-14=2",
-"8+8-15=1",
-"8+8-16=0",
-"8+8-1=15",
-"8+8-2=14",
-"8+8-3=13",
-"8+8-4=12",
-"8+8-5=11",
-"8+8-6=10",
-"8+8*1=16",
-"8+8*2=24",
-"8+8*3=32",
-"8+8*4=40",
-"8+8*5=48",
-"8+8*6=56",
-"8+8*7=64",
-"8+8*8=72",
-"8+8*9=80",
-"8+8/1=16",
-"8+8/2=12",
-"8+8/4=10",
-"8+90*0=8",
-"8+91*0=8",
-"8+92*0=8",
-"8+92=100",
-"8+93*0=8",
-"8+93=101",
-"8+94*0=8",
-"8+94=102",
-"8+95*0=8",
-"8+95=103",
-"8+96*0=8",
-"8+96=104",
-"8+97*0=8",
-"8+97=105",
-"8+98*0=8",
-"8+98=106",
-"8+99*0=8",
-"8+99=107",
-"8+9+0=17",
-"8+9+1=18",
-"8+9+2=19",
-"8+9+3=20",
-"8+9+4=21",
-"8+9+5=22",
-"8+9+6=23",
-"8+9+7=24",
-"8+9+8=25",
-"8+9+9=26",
-"8+9-0=17",
-"8+9-10=7",
-"8+9-11=6",
-"8+9-12=5",
-"8+9-13=4",
-"8+9-14=3",
-"8+9-15=2",
-"8+9-16=1",
-"8+9-17=0",
-"8+9-1=16",
-"8+9-2=15",
-"8+9-3=14",
-"8+9-4=13",
-"8+9-5=12",
-"8+9-6=11",
-"8+9-7=10",
-"8+9*1=17",
-"8+9*2=26",
-"8+9*3=35",
-"8+9*4=44",
-"8+9*5=53",
-"8+9*6=62",
-"8+9*7=71",
-"8+9*8=80",
-"8+9*9=89",
-"8+9/1=17",
-"8+9/3=11",
-"8-0+2=10",
-"8-0+3=11",
-"8-0+4=12",
-"8-0+5=13",
-"8-0+6=14",
-"8-0+7=15",
-"8-0+8=16",
-"8-0+9=17",
-"8-0-9=-1",
-"8-0*10=8",
-"8-0*11=8",
-"8-0*12=8",
-"8-0*13=8",
-"8-0*14=8",
-"8-0*15=8",
-"8-0*16=8",
-"8-0*17=8",
-"8-0*18=8",
-"8-0*19=8",
-"8-0*20=8",
-"8-0*21=8",
-"8-0*22=8",
-"8-0*23=8",
-"8-0*24=8",
-"8-0*25=8",
-"8-0*26=8",
-"8-0*27=8",
-"8-0*28=8",
-"8-0*29=8",
-"8-0*30=8",
-"8-0*31=8",
-"8-0*32=8",
-"8-0*33=8",
-"8-0*34=8",
-"8-0*35=8",
-"8-0*36=8",
-"8-0*37=8",
-"8-0*38=8",
-"8-0*39=8",
-"8-0*40=8",
-"8-0*41=8",
-"8-0*42=8",
-"8-0*43=8",
-"8-0*44=8",
-"8-0*45=8",
-"8-0*46=8",
-"8-0*47=8",
-"8-0*48=8",
-"8-0*49=8",
-"8-0*50=8",
-"8-0*51=8",
-"8-0*52=8",
-"8-0*53=8",
-"8-0*54=8",
-"8-0*55=8",
-"8-0*56=8",
-"8-0*57=8",
-"8-0*58=8",
-"8-0*59=8",
-"8-0*60=8",
-"8-0*61=8",
-"8-0*62=8",
-"8-0*63=8",
-"8-0*64=8",
-"8-0*65=8",
-"8-0*66=8",
-"8-0*67=8",
-"8-0*68=8",
-"8-0*69=8",
-"8-0*70=8",
-"8-0*71=8",
-"8-0*72=8",
-"8-0*73=8",
-"8-0*74=8",
-"8-0*75=8",
-"8-0*76=8",
-"8-0*77=8",
-"8-0*78=8",
-"8-0*79=8",
-"8-0*80=8",
-"8-0*81=8",
-"8-0*82=8",
-"8-0*83=8",
-"8-0*84=8",
-"8-0*85=8",
-"8-0*86=8",
-"8-0*87=8",
-"8-0*88=8",
-"8-0*89=8",
-"8-0*90=8",
-"8-0*91=8",
-"8-0*92=8",
-"8-0*93=8",
-"8-0*94=8",
-"8-0*95=8",
-"8-0*96=8",
-"8-0*97=8",
-"8-0*98=8",
-"8-0*99=8",
-"8-0/10=8",
-"8-0/11=8",
-"8-0/12=8",
-"8-0/13=8",
-"8-0/14=8",
-"8-0/15=8",
-"8-0/16=8",
-"8-0/17=8",
-"8-0/18=8",
-"8-0/19=8",
-"8-0/20=8",
-"8-0/21=8",
-"8-0/22=8",
-"8-0/23=8",
-"8-0/24=8",
-"8-0/25=8",
-"8-0/26=8",
-"8-0/27=8",
-"8-0/28=8",
-"8-0/29=8",
-"8-0/30=8",
-"8-0/31=8",
-"8-0/32=8",
-"8-0/33=8",
-"8-0/34=8",
-"8-0/35=8",
-"8-0/36=8",
-"8-0/37=8",
-"8-0/38=8",
-"8-0/39=8",
-"8-0/40=8",
-"8-0/41=8",
-"8-0/42=8",
-"8-0/43=8",
-"8-0/44=8",
-"8-0/45=8",
-"8-0/46=8",
-"8-0/47=8",
-"8-0/48=8",
-"8-0/49=8",
-"8-0/50=8",
-"8-0/51=8",
-"8-0/52=8",
-"8-0/53=8",
-"8-0/54=8",
-"8-0/55=8",
-"8-0/56=8",
-"8-0/57=8",
-"8-0/58=8",
-"8-0/59=8",
-"8-0/60=8",
-"8-0/61=8",
-"8-0/62=8",
-"8-0/63=8",
-"8-0/64=8",
-"8-0/65=8",
-"8-0/66=8",
-"8-0/67=8",
-"8-0/68=8",
-"8-0/69=8",
-"8-0/70=8",
-"8-0/71=8",
-"8-0/72=8",
-"8-0/73=8",
-"8-0/74=8",
-"8-0/75=8",
-"8-0/76=8",
-"8-0/77=8",
-"8-0/78=8",
-"8-0/79=8",
-"8-0/80=8",
-"8-0/81=8",
-"8-0/82=8",
-"8-0/83=8",
-"8-0/84=8",
-"8-0/85=8",
-"8-0/86=8",
-"8-0/87=8",
-"8-0/88=8",
-"8-0/89=8",
-"8-0/90=8",
-"8-0/91=8",
-"8-0/92=8",
-"8-0/93=8",
-"8-0/94=8",
-"8-0/95=8",
-"8-0/96=8",
-"8-0/97=8",
-"8-0/98=8",
-"8-0/99=8",
-"8-10+2=0",
-"8-10+3=1",
-"8-10+4=2",
-"8-10+5=3",
-"8-10+6=4",
-"8-10+7=5",
-"8-10+8=6",
-"8-10+9=7",
-"8-10*0=8",
-"8-10/2=3",
-"8-10/5=6",
-"8-11+3=0",
-"8-11+4=1",
-"8-11+5=2",
-"8-11+6=3",
-"8-11+7=4",
-"8-11+8=5",
-"8-11+9=6",
-"8-11*0=8",
-"8-12+4=0",
-"8-12+5=1",
-"8-12+6=2",
-"8-12+7=3",
-"8-12+8=4",
-"8-12+9=5",
-"8-12*0=8",
-"8-12/2=2",
-"8-12/3=4",
-"8-12/4=5",
-"8-12/6=6",
-"8-13+5=0",
-"8-13+6=1",
-"8-13+7=2",
-"8-13+8=3",
-"8-13+9=4",
-"8-13*0=8",
-"8-14+6=0",
-"8-14+7=1",
-"8-14+8=2",
-"8-14+9=3",
-"8-14*0=8",
-"8-14/2=1",
-"8-14/7=6",
-"8-15+7=0",
-"8-15+8=1",
-"8-15+9=2",
-"8-15*0=8",
-"8-15/3=3",
-"8-15/5=5",
-"8-16+8=0",
-"8-16+9=1",
-"8-16*0=8",
-"8-16/2=0",
-"8-16/4=4",
-"8-16/8=6",
-"8-17+9=0",
-"8-17*0=8",
-"8-18*0=8",
-"8-18/3=2",
-"8-18/6=5",
-"8-18/9=6",
-"8-18=-10",
-"8-19*0=8",
-"8-19=-11",
-"8-1+3=10",
-"8-1+4=11",
-"8-1+5=12",
-"8-1+6=13",
-"8-1+7=14",
-"8-1+8=15",
-"8-1+9=16",
-"8-1-8=-1",
-"8-1-9=-2",
-"8-1*9=-1",
-"8-20*0=8",
-"8-20/4=3",
-"8-20/5=4",
-"8-20=-12",
-"8-21*0=8",
-"8-21/3=1",
-"8-21/7=5",
-"8-21=-13",
-"8-22*0=8",
-"8-22=-14",
-"8-23*0=8",
-"8-23=-15",
-"8-24*0=8",
-"8-24/3=0",
-"8-24/4=2",
-"8-24/6=4",
-"8-24/8=5",
-"8-24=-16",
-"8-25*0=8",
-"8-25/5=3",
-"8-25=-17",
-"8-26*0=8",
-"8-26=-18",
-"8-27*0=8",
-"8-27/9=5",
-"8-27=-19",
-"8-28*0=8",
-"8-28/4=1",
-"8-28/7=4",
-"8-28=-20",
-"8-29*0=8",
-"8-29=-21",
-"8-2+4=10",
-"8-2+5=11",
-"8-2+6=12",
-"8-2+7=13",
-"8-2+8=14",
-"8-2+9=15",
-"8-2-7=-1",
-"8-2-8=-2",
-"8-2-9=-3",
-"8-2*5=-2",
-"8-2*6=-4",
-"8-2*7=-6",
-"8-2*8=-8",
-"8-30*0=8",
-"8-30/5=2",
-"8-30/6=3",
-"8-30=-22",
-"8-31*0=8",
-"8-31=-23",
-"8-32*0=8",
-"8-32/4=0",
-"8-32/8=4",
-"8-32=-24",
-"8-33*0=8",
-"8-33=-25",
-"8-34*0=8",
-"8-34=-26",
-"8-35*0=8",
-"8-35/5=1",
-"8-35/7=3",
-"8-35=-27",
-"8-36*0=8",
-"8-36/6=2",
-"8-36/9=4",
-"8-36=-28",
-"8-37*0=8",
-"8-37=-29",
-"8-38*0=8",
-"8-38=-30",
-"8-39*0=8",
-"8-39=-31",
-"8-3+5=10",
-"8-3+6=11",
-"8-3+7=12",
-"8-3+8=13",
-"8-3+9=14",
-"8-3-6=-1",
-"8-3-7=-2",
-"8-3-8=-3",
-"8-3-9=-4",
-"8-3*3=-1",
-"8-3*4=-4",
-"8-3*5=-7",
-"8-40*0=8",
-"8-40/5=0",
-"8-40/8=3",
-"8-40=-32",
-"8-41*0=8",
-"8-41=-33",
-"8-42*0=8",
-"8-42/6=1",
-"8-42/7=2",
-"8-42=-34",
-"8-43*0=8",
-"8-43=-35",
-"8-44*0=8",
-"8-44=-36",
-"8-45*0=8",
-"8-45/9=3",
-"8-45=-37",
-"8-46*0=8",
-"8-46=-38",
-"8-47*0=8",
-"8-47=-39",
-"8-48*0=8",
-"8-48/6=0",
-"8-48/8=2",
-"8-48=-40",
-"8-49*0=8",
-"8-49/7=1",
-"8-49=-41",
-"8-4+6=10",
-"8-4+7=11",
-"8-4+8=12",
-"8-4+9=13",
-"8-4-5=-1",
-"8-4-6=-2",
-"8-4-7=-3",
-"8-4-8=-4",
-"8-4-9=-5",
-"8-4*3=-4",
-"8-4*4=-8",
-"8-50*0=8",
-"8-50=-42",
-"8-51*0=8",
-"8-51=-43",
-"8-52*0=8",
-"8-52=-44",
-"8-53*0=8",
-"8-53=-45",
-"8-54*0=8",
-"8-54/9=2",
-"8-54=-46",
-"8-55*0=8",
-"8-55=-47",
-"8-56*0=8",
-"8-56/7=0",
-"8-56/8=1",
-"8-56=-48",
-"8-57*0=8",
-"8-57=-49",
-"8-58*0=8",
-"8-58=-50",
-"8-59*0=8",
-"8-59=-51",
-"8-5+7=10",
-"8-5+8=11",
-"8-5+9=12",
-"8-5-4=-1",
-"8-5-5=-2",
-"8-5-6=-3",
-"8-5-7=-4",
-"8-5-8=-5",
-"8-5-9=-6",
-"8-5*2=-2",
-"8-5*3=-7",
-"8-60*0=8",
-"8-60=-52",
-"8-61*0=8",
-"8-61=-53",
-"8-62*0=8",
-"8-62=-54",
-"8-63*0=8",
-"8-63/9=1",
-"8-63=-55",
-"8-64*0=8",
-"8-64/8=0",
-"8-64=-56",
-"8-65*0=8",
-"8-65=-57",
-"8-66*0=8",
-"8-66=-58",
-"8-67*0=8",
-"8-67=-59",
-"8-68*0=8",
-"8-68=-60",
-"8-69*0=8",
-"8-69=-61",
-"8-6+8=10",
-"8-6+9=11",
-"8-6-3=-1",
-"8-6-4=-2",
-"8-6-5=-3",
-"8-6-6=-4",
-"8-6-7=-5",
-"8-6-8=-6",
-"8-6-9=-7",
-"8-6*2=-4",
-"8-70*0=8",
-"8-70=-62",
-"8-71*0=8",
-"8-71=-63",
-"8-72*0=8",
-"8-72/9=0",
-"8-72=-64",
-"8-73*0=8",
-"8-73=-65",
-"8-74*0=8",
-"8-74=-66",
-"8-75*0=8",
-"8-75=-67",
-"8-76*0=8",
-"8-76=-68",
-"8-77*0=8",
-"8-77=-69",
-"8-78*0=8",
-"8-78=-70",
-"8-79*0=8",
-"8-79=-71",
-"8-7+9=10",
-"8-7-2=-1",
-"8-7-3=-2",
-"8-7-4=-3",
-"8-7-5=-4",
-"8-7-6=-5",
-"8-7-7=-6",
-"8-7-8=-7",
-"8-7-9=-8",
-"8-7*2=-6",
-"8-80*0=8",
-"8-80=-72",
-"8-81*0=8",
-"8-81=-73",
-"8-82*0=8",
-"8-82=-74",
-"8-83*0=8",
-"8-83=-75",
-"8-84*0=8",
-"8-84=-76",
-"8-85*0=8",
-"8-85=-77",
-"8-86*0=8",
-"8-86=-78",
-"8-87*0=8",
-"8-87=-79",
-"8-88*0=8",
-"8-88=-80",
-"8-89*0=8",
-"8-89=-81",
-"8-8-1=-1",
-"8-8-2=-2",
-"8-8-3=-3",
-"8-8-4=-4",
-"8-8-5=-5",
-"8-8-6=-6",
-"8-8-7=-7",
-"8-8-8=-8",
-"8-8-9=-9",
-"8-8*2=-8",
-"8-90*0=8",
-"8-90=-82",
-"8-91*0=8",
-"8-91=-83",
-"8-92*0=8",
-"8-92=-84",
-"8-93*0=8",
-"8-93=-85",
-"8-94*0=8",
-"8-94=-86",
-"8-95*0=8",
-"8-95=-87",
-"8-96*0=8",
-"8-96=-88",
-"8-97*0=8",
-"8-97=-89",
-"8-98*0=8",
-"8-98=-90",
-"8-99*0=8",
-"8-99=-91",
-"8-9+0=-1",
-"8-9+10=9",
-"8-9-0=-1",
-"8-9-1=-2",
-"8-9-2=-3",
-"8-9-3=-4",
-"8-9-4=-5",
-"8-9-5=-6",
-"8-9-6=-7",
-"8-9-7=-8",
-"8-9-8=-9",
-"8-9*1=-1",
-"8-9/1=-1",
-"8*0-1=-1",
-"8*0-2=-2",
-"8*0-3=-3",
-"8*0-4=-4",
-"8*0-5=-5",
-"8*0-6=-6",
-"8*0-7=-7",
-"8*0-8=-8",
-"8*0-9=-9",
-"8*0*10=0",
-"8*0*11=0",
-"8*0*12=0",
-"8*0*13=0",
-"8*0*14=0",
-"8*0*15=0",
-"8*0*16=0",
-"8*0*17=0",
-"8*0*18=0",
-"8*0*19=0",
-"8*0*20=0",
-"8*0*21=0",
-"8*0*22=0",
-"8*0*23=0",
-"8*0*24=0",
-"8*0*25=0",
-"8*0*26=0",
-"8*0*27=0",
-"8*0*28=0",
-"8*0*29=0",
-"8*0*30=0",
-"8*0*31=0",
-"8*0*32=0",
-"8*0*33=0",
-"8*0*34=0",
-"8*0*35=0",
-"8*0*36=0",
-"8*0*37=0",
-"8*0*38=0",
-"8*0*39=0",
-"8*0*40=0",
-"8*0*41=0",
-"8*0*42=0",
-"8*0*43=0",
-"8*0*44=0",
-"8*0*45=0",
-"8*0*46=0",
-"8*0*47=0",
-"8*0*48=0",
-"8*0*49=0",
-"8*0*50=0",
-"8*0*51=0",
-"8*0*52=0",
-"8*0*53=0",
-"8*0*54=0",
-"8*0*55=0",
-"8*0*56=0",
-"8*0*57=0",
-"8*0*58=0",
-"8*0*59=0",
-"8*0*60=0",
-"8*0*61=0",
-"8*0*62=0",
-"8*0*63=0",
-"8*0*64=0",
-"8*0*65=0",
-"8*0*66=0",
-"8*0*67=0",
-"8*0*68=0",
-"8*0*69=0",
-"8*0*70=0",
-"8*0*71=0",
-"8*0*72=0",
-"8*0*73=0",
-"8*0*74=0",
-"8*0*75=0",
-"8*0*76=0",
-"8*0*77=0",
-"8*0*78=0",
-"8*0*79=0",
-"8*0*80=0",
-"8*0*81=0",
-"8*0*82=0",
-"8*0*83=0",
-"8*0*84=0",
-"8*0*85=0",
-"8*0*86=0",
-"8*0*87=0",
-"8*0*88=0",
-"8*0*89=0",
-"8*0*90=0",
-"8*0*91=0",
-"8*0*92=0",
-"8*0*93=0",
-"8*0*94=0",
-"8*0*95=0",
-"8*0*96=0",
-"8*0*97=0",
-"8*0*98=0",
-"8*0*99=0",
-"8*0/10=0",
-"8*0/11=0",
-"8*0/12=0",
-"8*0/13=0",
-"8*0/14=0",
-"8*0/15=0",
-"8*0/16=0",
-"8*0/17=0",
-"8*0/18=0",
-"8*0/19=0",
-"8*0/20=0",
-"8*0/21=0",
-"8*0/22=0",
-"8*0/23=0",
-"8*0/24=0",
-"8*0/25=0",
-"8*0/26=0",
-"8*0/27=0",
-"8*0/28=0",
-"8*0/29=0",
-"8*0/30=0",
-"8*0/31=0",
-"8*0/32=0",
-"8*0/33=0",
-"8*0/34=0",
-"8*0/35=0",
-"8*0/36=0",
-"8*0/37=0",
-"8*0/38=0",
-"8*0/39=0",
-"8*0/40=0",
-"8*0/41=0",
-"8*0/42=0",
-"8*0/43=0",
-"8*0/44=0",
-"8*0/45=0",
-"8*0/46=0",
-"8*0/47=0",
-"8*0/48=0",
-"8*0/49=0",
-"8*0/50=0",
-"8*0/51=0",
-"8*0/52=0",
-"8*0/53=0",
-"8*0/54=0",
-"8*0/55=0",
-"8*0/56=0",
-"8*0/57=0",
-"8*0/58=0",
-"8*0/59=0",
-"8*0/60=0",
-"8*0/61=0",
-"8*0/62=0",
-"8*0/63=0",
-"8*0/64=0",
-"8*0/65=0",
-"8*0/66=0",
-"8*0/67=0",
-"8*0/68=0",
-"8*0/69=0",
-"8*0/70=0",
-"8*0/71=0",
-"8*0/72=0",
-"8*0/73=0",
-"8*0/74=0",
-"8*0/75=0",
-"8*0/76=0",
-"8*0/77=0",
-"8*0/78=0",
-"8*0/79=0",
-"8*0/80=0",
-"8*0/81=0",
-"8*0/82=0",
-"8*0/83=0",
-"8*0/84=0",
-"8*0/85=0",
-"8*0/86=0",
-"8*0/87=0",
-"8*0/88=0",
-"8*0/89=0",
-"8*0/90=0",
-"8*0/91=0",
-"8*0/92=0",
-"8*0/93=0",
-"8*0/94=0",
-"8*0/95=0",
-"8*0/96=0",
-"8*0/97=0",
-"8*0/98=0",
-"8*0/99=0",
-"8*10*0=0",
-"8*11*0=0",
-"8*12*0=0",
-"8*13*0=0",
-"8*13=104",
-"8*14*0=0",
-"8*14=112",
-"8*15*0=0",
-"8*15=120",
-"8*16*0=0",
-"8*16=128",
-"8*17*0=0",
-"8*17=136",
-"8*18*0=0",
-"8*18=144",
-"8*19*0=0",
-"8*19=152",
-"8*1+2=10",
-"8*1+3=11",
-"8*1+4=12",
-"8*1+5=13",
-"8*1+6=14",
-"8*1+7=15",
-"8*1+8=16",
-"8*1+9=17",
-"8*1-9=-1",
-"8*1*2=16",
-"8*1*3=24",
-"8*1*4=32",
-"8*1*5=40",
-"8*1*6=48",
-"8*1*7=56",
-"8*1*8=64",
-"8*1*9=72",
-"8*20*0=0",
-"8*20=160",
-"8*21*0=0",
-"8*21=168",
-"8*22*0=0",
-"8*22=176",
-"8*23*0=0",
-"8*23=184",
-"8*24*0=0",
-"8*24=192",
-"8*25*0=0",
-"8*25=200",
-"8*26*0=0",
-"8*26=208",
-"8*27*0=0",
-"8*27=216",
-"8*28*0=0",
-"8*28=224",
-"8*29*0=0",
-"8*29=232",
-"8*2+0=16",
-"8*2+1=17",
-"8*2+2=18",
-"8*2+3=19",
-"8*2+4=20",
-"8*2+5=21",
-"8*2+6=22",
-"8*2+7=23",
-"8*2+8=24",
-"8*2+9=25",
-"8*2-0=16",
-"8*2-10=6",
-"8*2-11=5",
-"8*2-12=4",
-"8*2-13=3",
-"8*2-14=2",
-"8*2-15=1",
-"8*2-16=0",
-"8*2-1=15",
-"8*2-2=14",
-"8*2-3=13",
-"8*2-4=12",
-"8*2-5=11",
-"8*2-6=10",
-"8*2*1=16",
-"8*2*2=32",
-"8*2*3=48",
-"8*2*4=64",
-"8*2*5=80",
-"8*2*6=96",
-"8*2/16=1",
-"8*2/1=16",
-"8*30*0=0",
-"8*30=240",
-"8*31*0=0",
-"8*31=248",
-"8*32*0=0",
-"8*32=256",
-"8*33*0=0",
-"8*33=264",
-"8*34*0=0",
-"8*34=272",
-"8*35*0=0",
-"8*35=280",
-"8*36*0=0",
-"8*36=288",
-"8*37*0=0",
-"8*37=296",
-"8*38*0=0",
-"8*38=304",
-"8*39*0=0",
-"8*39=312",
-"8*3+0=24",
-"8*3+1=25",
-"8*3+2=26",
-"8*3+3=27",
-"8*3+4=28",
-"8*3+5=29",
-"8*3+6=30",
-"8*3+7=31",
-"8*3+8=32",
-"8*3+9=33",
-"8*3-0=24",
-"8*3-15=9",
-"8*3-16=8",
-"8*3-17=7",
-"8*3-18=6",
-"8*3-19=5",
-"8*3-1=23",
-"8*3-20=4",
-"8*3-21=3",
-"8*3-22=2",
-"8*3-23=1",
-"8*3-24=0",
-"8*3-2=22",
-"8*3-3=21",
-"8*3-4=20",
-"8*3-5=19",
-"8*3-6=18",
-"8*3-7=17",
-"8*3-8=16",
-"8*3-9=15",
-"8*3*1=24",
-"8*3*2=48",
-"8*3*3=72",
-"8*3*4=96",
-"8*3/12=2",
-"8*3/1=24",
-"8*3/24=1",
-"8*3/2=12",
-"8*40*0=0",
-"8*40=320",
-"8*41*0=0",
-"8*41=328",
-"8*42*0=0",
-"8*42=336",
-"8*43*0=0",
-"8*43=344",
-"8*44*0=0",
-"8*44=352",
-"8*45*0=0",
-"8*45=360",
-"8*46*0=0",
-"8*46=368",
-"8*47*0=0",
-"8*47=376",
-"8*48*0=0",
-"8*48=384",
-"8*49*0=0",
-"8*49=392",
-"8*4+0=32",
-"8*4+1=33",
-"8*4+2=34",
-"8*4+3=35",
-"8*4+4=36",
-"8*4+5=37",
-"8*4+6=38",
-"8*4+7=39",
-"8*4+8=40",
-"8*4+9=41",
-"8*4-0=32",
-"8*4-1=31",
-"8*4-23=9",
-"8*4-24=8",
-"8*4-25=7",
-"8*4-26=6",
-"8*4-27=5",
-"8*4-28=4",
-"8*4-29=3",
-"8*4-2=30",
-"8*4-30=2",
-"8*4-31=1",
-"8*4-32=0",
-"8*4-3=29",
-"8*4-4=28",
-"8*4-5=27",
-"8*4-6=26",
-"8*4-7=25",
-"8*4-8=24",
-"8*4-9=23",
-"8*4*1=32",
-"8*4*2=64",
-"8*4*3=96",
-"8*4/16=2",
-"8*4/1=32",
-"8*4/2=16",
-"8*4/32=1",
-"8*50*0=0",
-"8*50=400",
-"8*51*0=0",
-"8*51=408",
-"8*52*0=0",
-"8*52=416",
-"8*53*0=0",
-"8*53=424",
-"8*54*0=0",
-"8*54=432",
-"8*55*0=0",
-"8*55=440",
-"8*56*0=0",
-"8*56=448",
-"8*57*0=0",
-"8*57=456",
-"8*58*0=0",
-"8*58=464",
-"8*59*0=0",
-"8*59=472",
-"8*5+0=40",
-"8*5+1=41",
-"8*5+2=42",
-"8*5+3=43",
-"8*5+4=44",
-"8*5+5=45",
-"8*5+6=46",
-"8*5+7=47",
-"8*5+8=48",
-"8*5+9=49",
-"8*5-0=40",
-"8*5-1=39",
-"8*5-2=38",
-"8*5-31=9",
-"8*5-32=8",
-"8*5-33=7",
-"8*5-34=6",
-"8*5-35=5",
-"8*5-36=4",
-"8*5-37=3",
-"8*5-38=2",
-"8*5-39=1",
-"8*5-3=37",
-"8*5-40=0",
-"8*5-4=36",
-"8*5-5=35",
-"8*5-6=34",
-"8*5-7=33",
-"8*5-8=32",
-"8*5-9=31",
-"8*5*1=40",
-"8*5*2=80",
-"8*5/10=4",
-"8*5/1=40",
-"8*5/20=2",
-"8*5/2=20",
-"8*5/40=1",
-"8*5/4=10",
-"8*60*0=0",
-"8*60=480",
-"8*61*0=0",
-"8*61=488",
-"8*62*0=0",
-"8*62=496",
-"8*63*0=0",
-"8*63=504",
-"8*64*0=0",
-"8*64=512",
-"8*65*0=0",
-"8*65=520",
-"8*66*0=0",
-"8*66=528",
-"8*67*0=0",
-"8*67=536",
-"8*68*0=0",
-"8*68=544",
-"8*69*0=0",
-"8*69=552",
-"8*6+0=48",
-"8*6+1=49",
-"8*6+2=50",
-"8*6+3=51",
-"8*6+4=52",
-"8*6+5=53",
-"8*6+6=54",
-"8*6+7=55",
-"8*6+8=56",
-"8*6+9=57",
-"8*6-0=48",
-"8*6-1=47",
-"8*6-2=46",
-"8*6-39=9",
-"8*6-3=45",
-"8*6-40=8",
-"8*6-41=7",
-"8*6-42=6",
-"8*6-43=5",
-"8*6-44=4",
-"8*6-45=3",
-"8*6-46=2",
-"8*6-47=1",
-"8*6-48=0",
-"8*6-4=44",
-"8*6-5=43",
-"8*6-6=42",
-"8*6-7=41",
-"8*6-8=40",
-"8*6-9=39",
-"8*6*1=48",
-"8*6*2=96",
-"8*6/12=4",
-"8*6/16=3",
-"8*6/1=48",
-"8*6/24=2",
-"8*6/2=24",
-"8*6/3=16",
-"8*6/48=1",
-"8*6/4=12",
-"8*70*0=0",
-"8*70=560",
-"8*71*0=0",
-"8*71=568",
-"8*72*0=0",
-"8*72=576",
-"8*73*0=0",
-"8*73=584",
-"8*74*0=0",
-"8*74=592",
-"8*75*0=0",
-"8*75=600",
-"8*76*0=0",
-"8*76=608",
-"8*77*0=0",
-"8*77=616",
-"8*78*0=0",
-"8*78=624",
-"8*79*0=0",
-"8*79=632",
-"8*7+0=56",
-"8*7+1=57",
-"8*7+2=58",
-"8*7+3=59",
-"8*7+4=60",
-"8*7+5=61",
-"8*7+6=62",
-"8*7+7=63",
-"8*7+8=64",
-"8*7+9=65",
-"8*7-0=56",
-"8*7-1=55",
-"8*7-2=54",
-"8*7-3=53",
-"8*7-47=9",
-"8*7-48=8",
-"8*7-49=7",
-"8*7-4=52",
-"8*7-50=6",
-"8*7-51=5",
-"8*7-52=4",
-"8*7-53=3",
-"8*7-54=2",
-"8*7-55=1",
-"8*7-56=0",
-"8*7-5=51",
-"8*7-6=50",
-"8*7-7=49",
-"8*7-8=48",
-"8*7-9=47",
-"8*7*1=56",
-"8*7/14=4",
-"8*7/1=56",
-"8*7/28=2",
-"8*7/2=28",
-"8*7/4=14",
-"8*7/56=1",
-"8*80*0=0",
-"8*80=640",
-"8*81*0=0",
-"8*81=648",
-"8*82*0=0",
-"8*82=656",
-"8*83*0=0",
-"8*83=664",
-"8*84*0=0",
-"8*84=672",
-"8*85*0=0",
-"8*85=680",
-"8*86*0=0",
-"8*86=688",
-"8*87*0=0",
-"8*87=696",
-"8*88*0=0",
-"8*88=704",
-"8*89*0=0",
-"8*89=712",
-"8*8+0=64",
-"8*8+1=65",
-"8*8+2=66",
-"8*8+3=67",
-"8*8+4=68",
-"8*8+5=69",
-"8*8+6=70",
-"8*8+7=71",
-"8*8+8=72",
-"8*8+9=73",
-"8*8-0=64",
-"8*8-1=63",
-"8*8-2=62",
-"8*8-3=61",
-"8*8-4=60",
-"8*8-55=9",
-"8*8-56=8",
-"8*8-57=7",
-"8*8-58=6",
-"8*8-59=5",
-"8*8-5=59",
-"8*8-60=4",
-"8*8-61=3",
-"8*8-62=2",
-"8*8-63=1",
-"8*8-64=0",
-"8*8-6=58",
-"8*8-7=57",
-"8*8-8=56",
-"8*8-9=55",
-"8*8*1=64",
-"8*8/16=4",
-"8*8/1=64",
-"8*8/2=32",
-"8*8/32=2",
-"8*8/4=16",
-"8*8/64=1",
-"8*90*0=0",
-"8*90=720",
-"8*91*0=0",
-"8*91=728",
-"8*92*0=0",
-"8*92=736",
-"8*93*0=0",
-"8*93=744",
-"8*94*0=0",
-"8*94=752",
-"8*95*0=0",
-"8*95=760",
-"8*96*0=0",
-"8*96=768",
-"8*97*0=0",
-"8*97=776",
-"8*98*0=0",
-"8*98=784",
-"8*99*0=0",
-"8*99=792",
-"8*9+0=72",
-"8*9+1=73",
-"8*9+2=74",
-"8*9+3=75",
-"8*9+4=76",
-"8*9+5=77",
-"8*9+6=78",
-"8*9+7=79",
-"8*9+8=80",
-"8*9+9=81",
-"8*9-0=72",
-"8*9-1=71",
-"8*9-2=70",
-"8*9-3=69",
-"8*9-4=68",
-"8*9-5=67",
-"8*9-63=9",
-"8*9-64=8",
-"8*9-65=7",
-"8*9-66=6",
-"8*9-67=5",
-"8*9-68=4",
-"8*9-69=3",
-"8*9-6=66",
-"8*9-70=2",
-"8*9-71=1",
-"8*9-72=0",
-"8*9-7=65",
-"8*9-8=64",
-"8*9-9=63",
-"8*9*1=72",
-"8*9/12=6",
-"8*9/18=4",
-"8*9/1=72",
-"8*9/24=3",
-"8*9/2=36",
-"8*9/36=2",
-"8*9/3=24",
-"8*9/4=18",
-"8*9/6=12",
-"8*9/72=1",
-"8/10*0=0",
-"8/10*5=4",
-"8/11*0=0",
-"8/12*0=0",
-"8/12*3=2",
-"8/12*6=4",
-"8/12*9=6",
-"8/13*0=0",
-"8/14*0=0",
-"8/14*7=4",
-"8/15*0=0",
-"8/16*0=0",
-"8/16*2=1",
-"8/16*4=2",
-"8/16*6=3",
-"8/16*8=4",
-"8/17*0=0",
-"8/18*0=0",
-"8/18*9=4",
-"8/19*0=0",
-"8/1+2=10",
-"8/1+3=11",
-"8/1+4=12",
-"8/1+5=13",
-"8/1+6=14",
-"8/1+7=15",
-"8/1+8=16",
-"8/1+9=17",
-"8/1-9=-1",
-"8/1*2=16",
-"8/1*3=24",
-"8/1*4=32",
-"8/1*5=40",
-"8/1*6=48",
-"8/1*7=56",
-"8/1*8=64",
-"8/1*9=72",
-"8/20*0=0",
-"8/20*5=2",
-"8/21*0=0",
-"8/22*0=0",
-"8/23*0=0",
-"8/24*0=0",
-"8/24*3=1",
-"8/24*6=2",
-"8/24*9=3",
-"8/25*0=0",
-"8/26*0=0",
-"8/27*0=0",
-"8/28*0=0",
-"8/28*7=2",
-"8/29*0=0",
-"8/2+6=10",
-"8/2+7=11",
-"8/2+8=12",
-"8/2+9=13",
-"8/2-5=-1",
-"8/2-6=-2",
-"8/2-7=-3",
-"8/2-8=-4",
-"8/2-9=-5",
-"8/2*3=12",
-"8/2*4=16",
-"8/2*5=20",
-"8/2*6=24",
-"8/2*7=28",
-"8/2*8=32",
-"8/2*9=36",
-"8/30*0=0",
-"8/31*0=0",
-"8/32*0=0",
-"8/32*4=1",
-"8/32*8=2",
-"8/33*0=0",
-"8/34*0=0",
-"8/35*0=0",
-"8/36*0=0",
-"8/36*9=2",
-"8/37*0=0",
-"8/38*0=0",
-"8/39*0=0",
-"8/3*6=16",
-"8/3*9=24",
-"8/40*0=0",
-"8/40*5=1",
-"8/41*0=0",
-"8/42*0=0",
-"8/43*0=0",
-"8/44*0=0",
-"8/45*0=0",
-"8/46*0=0",
-"8/47*0=0",
-"8/48*0=0",
-"8/48*6=1",
-"8/49*0=0",
-"8/4+8=10",
-"8/4+9=11",
-"8/4-3=-1",
-"8/4-4=-2",
-"8/4-5=-3",
-"8/4-6=-4",
-"8/4-7=-5",
-"8/4-8=-6",
-"8/4-9=-7",
-"8/4*5=10",
-"8/4*6=12",
-"8/4*7=14",
-"8/4*8=16",
-"8/4*9=18",
-"8/50*0=0",
-"8/51*0=0",
-"8/52*0=0",
-"8/53*0=0",
-"8/54*0=0",
-"8/55*0=0",
-"8/56*0=0",
-"8/56*7=1",
-"8/57*0=0",
-"8/58*0=0",
-"8/59*0=0",
-"8/60*0=0",
-"8/61*0=0",
-"8/62*0=0",
-"8/63*0=0",
-"8/64*0=0",
-"8/64*8=1",
-"8/65*0=0",
-"8/66*0=0",
-"8/67*0=0",
-"8/68*0=0",
-"8/69*0=0",
-"8/6*9=12",
-"8/70*0=0",
-"8/71*0=0",
-"8/72*0=0",
-"8/72*9=1",
-"8/73*0=0",
-"8/74*0=0",
-"8/75*0=0",
-"8/76*0=0",
-"8/77*0=0",
-"8/78*0=0",
-"8/79*0=0",
-"8/80*0=0",
-"8/81*0=0",
-"8/82*0=0",
-"8/83*0=0",
-"8/84*0=0",
-"8/85*0=0",
-"8/86*0=0",
-"8/87*0=0",
-"8/88*0=0",
-"8/89*0=0",
-"8/8+9=10",
-"8/8-2=-1",
-"8/8-3=-2",
-"8/8-4=-3",
-"8/8-5=-4",
-"8/8-6=-5",
-"8/8-7=-6",
-"8/8-8=-7",
-"8/8-9=-8",
-"8/90*0=0",
-"8/91*0=0",
-"8/92*0=0",
-"8/93*0=0",
-"8/94*0=0",
-"8/95*0=0",
-"8/96*0=0",
-"8/97*0=0",
-"8/98*0=0",
-"8/99*0=0",
-"9000*0=0",
-"9001*0=0",
-"9002*0=0",
-"9003*0=0",
-"9004*0=0",
-"9005*0=0",
-"9006*0=0",
-"9007*0=0",
-"9008*0=0",
-"9009*0=0",
-"9010*0=0",
-"9011*0=0",
-"9012*0=0",
-"9013*0=0",
-"9014*0=0",
-"9015*0=0",
-"9016*0=0",
-"9017*0=0",
-"9018*0=0",
-"9019*0=0",
-"9020*0=0",
-"9021*0=0",
-"9022*0=0",
-"9023*0=0",
-"9024*0=0",
-"9025*0=0",
-"9026*0=0",
-"9027*0=0",
-"9028*0=0",
-"9029*0=0",
-"9030*0=0",
-"9031*0=0",
-"9032*0=0",
-"9033*0=0",
-"9034*0=0",
-"9035*0=0",
-"9036*0=0",
-"9037*0=0",
-"9038*0=0",
-"9039*0=0",
-"9040*0=0",
-"9041*0=0",
-"9042*0=0",
-"9043*0=0",
-"9044*0=0",
-"9045*0=0",
-"9046*0=0",
-"9047*0=0",
-"9048*0=0",
-"9049*0=0",
-"9050*0=0",
-"9051*0=0",
-"9052*0=0",
-"9053*0=0",
-"9054*0=0",
-"9055*0=0",
-"9056*0=0",
-"9057*0=0",
-"9058*0=0",
-"9059*0=0",
-"9060*0=0",
-"9061*0=0",
-"9062*0=0",
-"9063*0=0",
-"9064*0=0",
-"9065*0=0",
-"9066*0=0",
-"9067*0=0",
-"9068*0=0",
-"9069*0=0",
-"9070*0=0",
-"9071*0=0",
-"9072*0=0",
-"9073*0=0",
-"9074*0=0",
-"9075*0=0",
-"9076*0=0",
-"9077*0=0",
-"9078*0=0",
-"9079*0=0",
-"9080*0=0",
-"9081*0=0",
-"9082*0=0",
-"9083*0=0",
-"9084*0=0",
-"9085*0=0",
-"9086*0=0",
-"9087*0=0",
-"9088*0=0",
-"9089*0=0",
-"9090*0=0",
-"9091*0=0",
-"9092*0=0",
-"9093*0=0",
-"9094*0=0",
-"9095*0=0",
-"9096*0=0",
-"9097*0=0",
-"9098*0=0",
-"9099*0=0",
-"90-10=80",
-"90-11=79",
-"90-12=78",
-"90-13=77",
-"90-14=76",
-"90-15=75",
-"90-16=74",
-"90-17=73",
-"90-18=72",
-"90-19=71",
-"90-20=70",
-"90-21=69",
-"90-22=68",
-"90-23=67",
-"90-24=66",
-"90-25=65",
-"90-26=64",
-"90-27=63",
-"90-28=62",
-"90-29=61",
-"90-30=60",
-"90-31=59",
-"90-32=58",
-"90-33=57",
-"90-34=56",
-"90-35=55",
-"90-36=54",
-"90-37=53",
-"90-38=52",
-"90-39=51",
-"90-40=50",
-"90-41=49",
-"90-42=48",
-"90-43=47",
-"90-44=46",
-"90-45=45",
-"90-46=44",
-"90-47=43",
-"90-48=42",
-"90-49=41",
-"90-50=40",
-"90-51=39",
-"90-52=38",
-"90-53=37",
-"90-54=36",
-"90-55=35",
-"90-56=34",
-"90-57=33",
-"90-58=32",
-"90-59=31",
-"90-60=30",
-"90-61=29",
-"90-62=28",
-"90-63=27",
-"90-64=26",
-"90-65=25",
-"90-66=24",
-"90-67=23",
-"90-68=22",
-"90-69=21",
-"90-70=20",
-"90-71=19",
-"90-72=18",
-"90-73=17",
-"90-74=16",
-"90-75=15",
-"90-76=14",
-"90-77=13",
-"90-78=12",
-"90-79=11",
-"90-80=10",
-"90-91=-1",
-"90-92=-2",
-"90-93=-3",
-"90-94=-4",
-"90-95=-5",
-"90-96=-6",
-"90-97=-7",
-"90-98=-8",
-"90-99=-9",
-"90-9*9=9",
-"90*0+0=0",
-"90*0+1=1",
-"90*0+2=2",
-"90*0+3=3",
-"90*0+4=4",
-"90*0+5=5",
-"90*0+6=6",
-"90*0+7=7",
-"90*0+8=8",
-"90*0+9=9",
-"90*0-0=0",
-"90*0*0=0",
-"90*0*1=0",
-"90*0*2=0",
-"90*0*3=0",
-"90*0*4=0",
-"90*0*5=0",
-"90*0*6=0",
-"90*0*7=0",
-"90*0*8=0",
-"90*0*9=0",
-"90*0/1=0",
-"90*0/2=0",
-"90*0/3=0",
-"90*0/4=0",
-"90*0/5=0",
-"90*0/6=0",
-"90*0/7=0",
-"90*0/8=0",
-"90*0/9=0",
-"90*1*0=0",
-"90*2*0=0",
-"90*2=180",
-"90*3*0=0",
-"90*3=270",
-"90*4*0=0",
-"90*4=360",
-"90*5*0=0",
-"90*5=450",
-"90*6*0=0",
-"90*6=540",
-"90*7*0=0",
-"90*7=630",
-"90*8*0=0",
-"90*8=720",
-"90*9*0=0",
-"90*9=810",
-"90/1*0=0",
-"90/2*0=0",
-"90/2/5=9",
-"90/2/9=5",
-"90/3*0=0",
-"90/3/5=6",
-"90/3/6=5",
-"90/4*0=0",
-"90/5-9=9",
-"90/5*0=0",
-"90/5/2=9",
-"90/5/3=6",
-"90/5/6=3",
-"90/5/9=2",
-"90/6-6=9",
-"90/6-7=8",
-"90/6-8=7",
-"90/6-9=6",
-"90/6*0=0",
-"90/6/3=5",
-"90/6/5=3",
-"90/7*0=0",
-"90/8*0=0",
-"90/9-1=9",
-"90/9-2=8",
-"90/9-3=7",
-"90/9-4=6",
-"90/9-5=5",
-"90/9-6=4",
-"90/9-7=3",
-"90/9-8=2",
-"90/9-9=1",
-"90/9*0=0",
-"90/9/2=5",
-"90/9/5=2",
-"9100*0=0",
-"9101*0=0",
-"9102*0=0",
-"9103*0=0",
-"9104*0=0",
-"9105*0=0",
-"9106*0=0",
-"9107*0=0",
-"9108*0=0",
-"9109*0=0",
-"9110*0=0",
-"9111*0=0",
-"9112*0=0",
-"9113*0=0",
-"9114*0=0",
-"9115*0=0",
-"9116*0=0",
-"9117*0=0",
-"9118*0=0",
-"9119*0=0",
-"9120*0=0",
-"9121*0=0",
-"9122*0=0",
-"9123*0=0",
-"9124*0=0",
-"9125*0=0",
-"9126*0=0",
-"9127*0=0",
-"9128*0=0",
-"9129*0=0",
-"9130*0=0",
-"9131*0=0",
-"9132*0=0",
-"9133*0=0",
-"9134*0=0",
-"9135*0=0",
-"9136*0=0",
-"9137*0=0",
-"9138*0=0",
-"9139*0=0",
-"9140*0=0",
-"9141*0=0",
-"9142*0=0",
-"9143*0=0",
-"9144*0=0",
-"9145*0=0",
-"9146*0=0",
-"9147*0=0",
-"9148*0=0",
-"9149*0=0",
-"9150*0=0",
-"9151*0=0",
-"9152*0=0",
-"9153*0=0",
-"9154*0=0",
-"9155*0=0",
-"9156*0=0",
-"9157*0=0",
-"9158*0=0",
-"9159*0=0",
-"9160*0=0",
-"9161*0=0",
-"9162*0=0",
-"9163*0=0",
-"9164*0=0",
-"9165*0=0",
-"9166*0=0",
-"9167*0=0",
-"9168*0=0",
-"9169*0=0",
-"9170*0=0",
-"9171*0=0",
-"9172*0=0",
-"9173*0=0",
-"9174*0=0",
-"9175*0=0",
-"9176*0=0",
-"9177*0=0",
-"9178*0=0",
-"9179*0=0",
-"9180*0=0",
-"9181*0=0",
-"9182*0=0",
-"9183*0=0",
-"9184*0=0",
-"9185*0=0",
-"9186*0=0",
-"9187*0=0",
-"9188*0=0",
-"9189*0=0",
-"9190*0=0",
-"9191*0=0",
-"9192*0=0",
-"9193*0=0",
-"9194*0=0",
-"9195*0=0",
-"9196*0=0",
-"9197*0=0",
-"9198*0=0",
-"9199*0=0",
-"91+9=100",
-"91-10=81",
-"91-11=80",
-"91-12=79",
-"91-13=78",
-"91-14=77",
-"91-15=76",
-"91-16=75",
-"91-17=74",
-"91-18=73",
-"91-19=72",
-"91-20=71",
-"91-21=70",
-"91-22=69",
-"91-23=68",
-"91-24=67",
-"91-25=66",
-"91-26=65",
-"91-27=64",
-"91-28=63",
-"91-29=62",
-"91-30=61",
-"91-31=60",
-"91-32=59",
-"91-33=58",
-"91-34=57",
-"91-35=56",
-"91-36=55",
-"91-37=54",
-"91-38=53",
-"91-39=52",
-"91-40=51",
-"91-41=50",
-"91-42=49",
-"91-43=48",
-"91-44=47",
-"91-45=46",
-"91-46=45",
-"91-47=44",
-"91-48=43",
-"91-49=42",
-"91-50=41",
-"91-51=40",
-"91-52=39",
-"91-53=38",
-"91-54=37",
-"91-55=36",
-"91-56=35",
-"91-57=34",
-"91-58=33",
-"91-59=32",
-"91-60=31",
-"91-61=30",
-"91-62=29",
-"91-63=28",
-"91-64=27",
-"91-65=26",
-"91-66=25",
-"91-67=24",
-"91-68=23",
-"91-69=22",
-"91-70=21",
-"91-71=20",
-"91-72=19",
-"91-73=18",
-"91-74=17",
-"91-75=16",
-"91-76=15",
-"91-77=14",
-"91-78=13",
-"91-79=12",
-"91-80=11",
-"91-81=10",
-"91-92=-1",
-"91-93=-2",
-"91-94=-3",
-"91-95=-4",
-"91-96=-5",
-"91-97=-6",
-"91-98=-7",
-"91-99=-8",
-"91*0+0=0",
-"91*0+1=1",
-"91*0+2=2",
-"91*0+3=3",
-"91*0+4=4",
-"91*0+5=5",
-"91*0+6=6",
-"91*0+7=7",
-"91*0+8=8",
-"91*0+9=9",
-"91*0-0=0",
-"91*0*0=0",
-"91*0*1=0",
-"91*0*2=0",
-"91*0*3=0",
-"91*0*4=0",
-"91*0*5=0",
-"91*0*6=0",
-"91*0*7=0",
-"91*0*8=0",
-"91*0*9=0",
-"91*0/1=0",
-"91*0/2=0",
-"91*0/3=0",
-"91*0/4=0",
-"91*0/5=0",
-"91*0/6=0",
-"91*0/7=0",
-"91*0/8=0",
-"91*0/9=0",
-"91*1*0=0",
-"91*2*0=0",
-"91*2=182",
-"91*3*0=0",
-"91*3=273",
-"91*4*0=0",
-"91*4=364",
-"91*5*0=0",
-"91*5=455",
-"91*6*0=0",
-"91*6=546",
-"91*7*0=0",
-"91*7=637",
-"91*8*0=0",
-"91*8=728",
-"91*9*0=0",
-"91*9=819",
-"91/1*0=0",
-"91/2*0=0",
-"91/3*0=0",
-"91/4*0=0",
-"91/5*0=0",
-"91/6*0=0",
-"91/7-4=9",
-"91/7-5=8",
-"91/7-6=7",
-"91/7-7=6",
-"91/7-8=5",
-"91/7-9=4",
-"91/7*0=0",
-"91/8*0=0",
-"91/9*0=0",
-"9200*0=0",
-"9201*0=0",
-"9202*0=0",
-"9203*0=0",
-"9204*0=0",
-"9205*0=0",
-"9206*0=0",
-"9207*0=0",
-"9208*0=0",
-"9209*0=0",
-"9210*0=0",
-"9211*0=0",
-"9212*0=0",
-"9213*0=0",
-"9214*0=0",
-"9215*0=0",
-"9216*0=0",
-"9217*0=0",
-"9218*0=0",
-"9219*0=0",
-"9220*0=0",
-"9221*0=0",
-"9222*0=0",
-"9223*0=0",
-"9224*0=0",
-"9225*0=0",
-"9226*0=0",
-"9227*0=0",
-"9228*0=0",
-"9229*0=0",
-"9230*0=0",
-"9231*0=0",
-"9232*0=0",
-"9233*0=0",
-"9234*0=0",
-"9235*0=0",
-"9236*0=0",
-"9237*0=0",
-"9238*0=0",
-"9239*0=0",
-"9240*0=0",
-"9241*0=0",
-"9242*0=0",
-"9243*0=0",
-"9244*0=0",
-"9245*0=0",
-"9246*0=0",
-"9247*0=0",
-"9248*0=0",
-"9249*0=0",
-"9250*0=0",
-"9251*0=0",
-"9252*0=0",
-"9253*0=0",
-"9254*0=0",
-"9255*0=0",
-"9256*0=0",
-"9257*0=0",
-"9258*0=0",
-"9259*0=0",
-"9260*0=0",
-"9261*0=0",
-"9262*0=0",
-"9263*0=0",
-"9264*0=0",
-"9265*0=0",
-"9266*0=0",
-"9267*0=0",
-"9268*0=0",
-"9269*0=0",
-"9270*0=0",
-"9271*0=0",
-"9272*0=0",
-"9273*0=0",
-"9274*0=0",
-"9275*0=0",
-"9276*0=0",
-"9277*0=0",
-"9278*0=0",
-"9279*0=0",
-"9280*0=0",
-"9281*0=0",
-"9282*0=0",
-"9283*0=0",
-"9284*0=0",
-"9285*0=0",
-"9286*0=0",
-"9287*0=0",
-"9288*0=0",
-"9289*0=0",
-"9290*0=0",
-"9291*0=0",
-"9292*0=0",
-"9293*0=0",
-"9294*0=0",
-"9295*0=0",
-"9296*0=0",
-"9297*0=0",
-"9298*0=0",
-"9299*0=0",
-"92+8=100",
-"92+9=101",
-"92-10=82",
-"92-11=81",
-"92-12=80",
-"92-13=79",
-"92-14=78",
-"92-15=77",
-"92-16=76",
-"92-17=75",
-"92-18=74",
-"92-19=73",
-"92-20=72",
-"92-21=71",
-"92-22=70",
-"92-23=69",
-"92-24=68",
-"92-25=67",
-"92-26=66",
-"92-27=65",
-"92-28=64",
-"92-29=63",
-"92-30=62",
-"92-31=61",
-"92-32=60",
-"92-33=59",
-"92-34=58",
-"92-35=57",
-"92-36=56",
-"92-37=55",
-"92-38=54",
-"92-39=53",
-"92-40=52",
-"92-41=51",
-"92-42=50",
-"92-43=49",
-"92-44=48",
-"92-45=47",
-"92-46=46",
-"92-47=45",
-"92-48=44",
-"92-49=43",
-"92-50=42",
-"92-51=41",
-"92-52=40",
-"92-53=39",
-"92-54=38",
-"92-55=37",
-"92-56=36",
-"92-57=35",
-"92-58=34",
-"92-59=33",
-"92-60=32",
-"92-61=31",
-"92-62=30",
-"92-63=29",
-"92-64=28",
-"92-65=27",
-"92-66=26",
-"92-67=25",
-"92-68=24",
-"92-69=23",
-"92-70=22",
-"92-71=21",
-"92-72=20",
-"92-73=19",
-"92-74=18",
-"92-75=17",
-"92-76=16",
-"92-77=15",
-"92-78=14",
-"92-79=13",
-"92-80=12",
-"92-81=11",
-"92-82=10",
-"92-93=-1",
-"92-94=-2",
-"92-95=-3",
-"92-96=-4",
-"92-97=-5",
-"92-98=-6",
-"92-99=-7",
-"92*0+0=0",
-"92*0+1=1",
-"92*0+2=2",
-"92*0+3=3",
-"92*0+4=4",
-"92*0+5=5",
-"92*0+6=6",
-"92*0+7=7",
-"92*0+8=8",
-"92*0+9=9",
-"92*0-0=0",
-"92*0*0=0",
-"92*0*1=0",
-"92*0*2=0",
-"92*0*3=0",
-"92*0*4=0",
-"92*0*5=0",
-"92*0*6=0",
-"92*0*7=0",
-"92*0*8=0",
-"92*0*9=0",
-"92*0/1=0",
-"92*0/2=0",
-"92*0/3=0",
-"92*0/4=0",
-"92*0/5=0",
-"92*0/6=0",
-"92*0/7=0",
-"92*0/8=0",
-"92*0/9=0",
-"92*1*0=0",
-"92*2*0=0",
-"92*2=184",
-"92*3*0=0",
-"92*3=276",
-"92*4*0=0",
-"92*4=368",
-"92*5*0=0",
-"92*5=460",
-"92*6*0=0",
-"92*6=552",
-"92*7*0=0",
-"92*7=644",
-"92*8*0=0",
-"92*8=736",
-"92*9*0=0",
-"92*9=828",
-"92/1*0=0",
-"92/2*0=0",
-"92/3*0=0",
-"92/4*0=0",
-"92/5*0=0",
-"92/6*0=0",
-"92/7*0=0",
-"92/8*0=0",
-"92/9*0=0",
-"9300*0=0",
-"9301*0=0",
-"9302*0=0",
-"9303*0=0",
-"9304*0=0",
-"9305*0=0",
-"9306*0=0",
-"9307*0=0",
-"9308*0=0",
-"9309*0=0",
-"9310*0=0",
-"9311*0=0",
-"9312*0=0",
-"9313*0=0",
-"9314*0=0",
-"9315*0=0",
-"9316*0=0",
-"9317*0=0",
-"9318*0=0",
-"9319*0=0",
-"9320*0=0",
-"9321*0=0",
-"9322*0=0",
-"9323*0=0",
-"9324*0=0",
-"9325*0=0",
-"9326*0=0",
-"9327*0=0",
-"9328*0=0",
-"9329*0=0",
-"9330*0=0",
-"9331*0=0",
-"9332*0=0",
-"9333*0=0",
-"9334*0=0",
-"9335*0=0",
-"9336*0=0",
-"9337*0=0",
-"9338*0=0",
-"9339*0=0",
-"9340*0=0",
-"9341*0=0",
-"9342*0=0",
-"9343*0=0",
-"9344*0=0",
-"9345*0=0",
-"9346*0=0",
-"9347*0=0",
-"9348*0=0",
-"9349*0=0",
-"9350*0=0",
-"9351*0=0",
-"9352*0=0",
-"9353*0=0",
-"9354*0=0",
-"9355*0=0",
-"9356*0=0",
-"9357*0=0",
-"9358*0=0",
-"9359*0=0",
-"9360*0=0",
-"9361*0=0",
-"9362*0=0",
-"9363*0=0",
-"9364*0=0",
-"9365*0=0",
-"9366*0=0",
-"9367*0=0",
-"9368*0=0",
-"9369*0=0",
-"9370*0=0",
-"9371*0=0",
-"9372*0=0",
-"9373*0=0",
-"9374*0=0",
-"9375*0=0",
-"9376*0=0",
-"9377*0=0",
-"9378*0=0",
-"9379*0=0",
-"9380*0=0",
-"9381*0=0",
-"9382*0=0",
-"9383*0=0",
-"9384*0=0",
-"9385*0=0",
-"9386*0=0",
-"9387*0=0",
-"9388*0=0",
-"9389*0=0",
-"9390*0=0",
-"9391*0=0",
-"9392*0=0",
-"9393*0=0",
-"9394*0=0",
-"9395*0=0",
-"9396*0=0",
-"9397*0=0",
-"9398*0=0",
-"9399*0=0",
-"93+7=100",
-"93+8=101",
-"93+9=102",
-"93-10=83",
-"93-11=82",
-"93-12=81",
-"93-13=80",
-"93-14=79",
-"93-15=78",
-"93-16=77",
-"93-17=76",
-"93-18=75",
-"93-19=74",
-"93-20=73",
-"93-21=72",
-"93-22=71",
-"93-23=70",
-"93-24=69",
-"93-25=68",
-"93-26=67",
-"93-27=66",
-"93-28=65",
-"93-29=64",
-"93-30=63",
-"93-31=62",
-"93-32=61",
-"93-33=60",
-"93-34=59",
-"93-35=58",
-"93-36=57",
-"93-37=56",
-"93-38=55",
-"93-39=54",
-"93-40=53",
-"93-41=52",
-"93-42=51",
-"93-43=50",
-"93-44=49",
-"93-45=48",
-"93-46=47",
-"93-47=46",
-"93-48=45",
-"93-49=44",
-"93-50=43",
-"93-51=42",
-"93-52=41",
-"93-53=40",
-"93-54=39",
-"93-55=38",
-"93-56=37",
-"93-57=36",
-"93-58=35",
-"93-59=34",
-"93-60=33",
-"93-61=32",
-"93-62=31",
-"93-63=30",
-"93-64=29",
-"93-65=28",
-"93-66=27",
-"93-67=26",
-"93-68=25",
-"93-69=24",
-"93-70=23",
-"93-71=22",
-"93-72=21",
-"93-73=20",
-"93-74=19",
-"93-75=18",
-"93-76=17",
-"93-77=16",
-"93-78=15",
-"93-79=14",
-"93-80=13",
-"93-81=12",
-"93-82=11",
-"93-83=10",
-"93-94=-1",
-"93-95=-2",
-"93-96=-3",
-"93-97=-4",
-"93-98=-5",
-"93-99=-6",
-"93*0+0=0",
-"93*0+1=1",
-"93*0+2=2",
-"93*0+3=3",
-"93*0+4=4",
-"93*0+5=5",
-"93*0+6=6",
-"93*0+7=7",
-"93*0+8=8",
-"93*0+9=9",
-"93*0-0=0",
-"93*0*0=0",
-"93*0*1=0",
-"93*0*2=0",
-"93*0*3=0",
-"93*0*4=0",
-"93*0*5=0",
-"93*0*6=0",
-"93*0*7=0",
-"93*0*8=0",
-"93*0*9=0",
-"93*0/1=0",
-"93*0/2=0",
-"93*0/3=0",
-"93*0/4=0",
-"93*0/5=0",
-"93*0/6=0",
-"93*0/7=0",
-"93*0/8=0",
-"93*0/9=0",
-"93*1*0=0",
-"93*2*0=0",
-"93*2=186",
-"93*3*0=0",
-"93*3=279",
-"93*4*0=0",
-"93*4=372",
-"93*5*0=0",
-"93*5=465",
-"93*6*0=0",
-"93*6=558",
-"93*7*0=0",
-"93*7=651",
-"93*8*0=0",
-"93*8=744",
-"93*9*0=0",
-"93*9=837",
-"93/1*0=0",
-"93/2*0=0",
-"93/3*0=0",
-"93/4*0=0",
-"93/5*0=0",
-"93/6*0=0",
-"93/7*0=0",
-"93/8*0=0",
-"93/9*0=0",
-"9400*0=0",
-"9401*0=0",
-"9402*0=0",
-"9403*0=0",
-"9404*0=0",
-"9405*0=0",
-"9406*0=0",
-"9407*0=0",
-"9408*0=0",
-"9409*0=0",
-"9410*0=0",
-"9411*0=0",
-"9412*0=0",
-"9413*0=0",
-"9414*0=0",
-"9415*0=0",
-"9416*0=0",
-"9417*0=0",
-"9418*0=0",
-"9419*0=0",
-"9420*0=0",
-"9421*0=0",
-"9422*0=0",
-"9423*0=0",
-"9424*0=0",
-"9425*0=0",
-"9426*0=0",
-"9427*0=0",
-"9428*0=0",
-"9429*0=0",
-"9430*0=0",
-"9431*0=0",
-"9432*0=0",
-"9433*0=0",
-"9434*0=0",
-"9435*0=0",
-"9436*0=0",
-"9437*0=0",
-"9438*0=0",
-"9439*0=0",
-"9440*0=0",
-"9441*0=0",
-"9442*0=0",
-"9443*0=0",
-"9444*0=0",
-"9445*0=0",
-"9446*0=0",
-"9447*0=0",
-"9448*0=0",
-"9449*0=0",
-"9450*0=0",
-"9451*0=0",
-"9452*0=0",
-"9453*0=0",
-"9454*0=0",
-"9455*0=0",
-"9456*0=0",
-"9457*0=0",
-"9458*0=0",
-"9459*0=0",
-"9460*0=0",
-"9461*0=0",
-"9462*0=0",
-"9463*0=0",
-"9464*0=0",
-"9465*0=0",
-"9466*0=0",
-"9467*0=0",
-"9468*0=0",
-"9469*0=0",
-"9470*0=0",
-"9471*0=0",
-"9472*0=0",
-"9473*0=0",
-"9474*0=0",
-"9475*0=0",
-"9476*0=0",
-"9477*0=0",
-"9478*0=0",
-"9479*0=0",
-"9480*0=0",
-"9481*0=0",
-"9482*0=0",
-"9483*0=0",
-"9484*0=0",
-"9485*0=0",
-"9486*0=0",
-"9487*0=0",
-"9488*0=0",
-"9489*0=0",
-"9490*0=0",
-"9491*0=0",
-"9492*0=0",
-"9493*0=0",
-"9494*0=0",
-"9495*0=0",
-"9496*0=0",
-"9497*0=0",
-"9498*0=0",
-"9499*0=0",
-"94+6=100",
-"94+7=101",
-"94+8=102",
-"94+9=103",
-"94-10=84",
-"94-11=83",
-"94-12=82",
-"94-13=81",
-"94-14=80",
-"94-15=79",
-"94-16=78",
-"94-17=77",
-"94-18=76",
-"94-19=75",
-"94-20=74",
-"94-21=73",
-"94-22=72",
-"94-23=71",
-"94-24=70",
-"94-25=69",
-"94-26=68",
-"94-27=67",
-"94-28=66",
-"94-29=65",
-"94-30=64",
-"94-31=63",
-"94-32=62",
-"94-33=61",
-"94-34=60",
-"94-35=59",
-"94-36=58",
-"94-37=57",
-"94-38=56",
-"94-39=55",
-"94-40=54",
-"94-41=53",
-"94-42=52",
-"94-43=51",
-"94-44=50",
-"94-45=49",
-"94-46=48",
-"94-47=47",
-"94-48=46",
-"94-49=45",
-"94-50=44",
-"94-51=43",
-"94-52=42",
-"94-53=41",
-"94-54=40",
-"94-55=39",
-"94-56=38",
-"94-57=37",
-"94-58=36",
-"94-59=35",
-"94-60=34",
-"94-61=33",
-"94-62=32",
-"94-63=31",
-"94-64=30",
-"94-65=29",
-"94-66=28",
-"94-67=27",
-"94-68=26",
-"94-69=25",
-"94-70=24",
-"94-71=23",
-"94-72=22",
-"94-73=21",
-"94-74=20",
-"94-75=19",
-"94-76=18",
-"94-77=17",
-"94-78=16",
-"94-79=15",
-"94-80=14",
-"94-81=13",
-"94-82=12",
-"94-83=11",
-"94-84=10",
-"94-95=-1",
-"94-96=-2",
-"94-97=-3",
-"94-98=-4",
-"94-99=-5",
-"94*0+0=0",
-"94*0+1=1",
-"94*0+2=2",
-"94*0+3=3",
-"94*0+4=4",
-"94*0+5=5",
-"94*0+6=6",
-"94*0+7=7",
-"94*0+8=8",
-"94*0+9=9",
-"94*0-0=0",
-"94*0*0=0",
-"94*0*1=0",
-"94*0*2=0",
-"94*0*3=0",
-"94*0*4=0",
-"94*0*5=0",
-"94*0*6=0",
-"94*0*7=0",
-"94*0*8=0",
-"94*0*9=0",
-"94*0/1=0",
-"94*0/2=0",
-"94*0/3=0",
-"94*0/4=0",
-"94*0/5=0",
-"94*0/6=0",
-"94*0/7=0",
-"94*0/8=0",
-"94*0/9=0",
-"94*1*0=0",
-"94*2*0=0",
-"94*2=188",
-"94*3*0=0",
-"94*3=282",
-"94*4*0=0",
-"94*4=376",
-"94*5*0=0",
-"94*5=470",
-"94*6*0=0",
-"94*6=564",
-"94*7*0=0",
-"94*7=658",
-"94*8*0=0",
-"94*8=752",
-"94*9*0=0",
-"94*9=846",
-"94/1*0=0",
-"94/2*0=0",
-"94/3*0=0",
-"94/4*0=0",
-"94/5*0=0",
-"94/6*0=0",
-"94/7*0=0",
-"94/8*0=0",
-"94/9*0=0",
-"9500*0=0",
-"9501*0=0",
-"9502*0=0",
-"9503*0=0",
-"9504*0=0",
-"9505*0=0",
-"9506*0=0",
-"9507*0=0",
-"9508*0=0",
-"9509*0=0",
-"9510*0=0",
-"9511*0=0",
-"9512*0=0",
-"9513*0=0",
-"9514*0=0",
-"9515*0=0",
-"9516*0=0",
-"9517*0=0",
-"9518*0=0",
-"9519*0=0",
-"9520*0=0",
-"9521*0=0",
-"9522*0=0",
-"9523*0=0",
-"9524*0=0",
-"9525*0=0",
-"9526*0=0",
-"9527*0=0",
-"9528*0=0",
-"9529*0=0",
-"9530*0=0",
-"9531*0=0",
-"9532*0=0",
-"9533*0=0",
-"9534*0=0",
-"9535*0=0",
-"9536*0=0",
-"9537*0=0",
-"9538*0=0",
-"9539*0=0",
-"9540*0=0",
-"9541*0=0",
-"9542*0=0",
-"9543*0=0",
-"9544*0=0",
-"9545*0=0",
-"9546*0=0",
-"9547*0=0",
-"9548*0=0",
-"9549*0=0",
-"9550*0=0",
-"9551*0=0",
-"9552*0=0",
-"9553*0=0",
-"9554*0=0",
-"9555*0=0",
-"9556*0=0",
-"9557*0=0",
-"9558*0=0",
-"9559*0=0",
-"9560*0=0",
-"9561*0=0",
-"9562*0=0",
-"9563*0=0",
-"9564*0=0",
-"9565*0=0",
-"9566*0=0",
-"9567*0=0",
-"9568*0=0",
-"9569*0=0",
-"9570*0=0",
-"9571*0=0",
-"9572*0=0",
-"9573*0=0",
-"9574*0=0",
-"9575*0=0",
-"9576*0=0",
-"9577*0=0",
-"9578*0=0",
-"9579*0=0",
-"9580*0=0",
-"9581*0=0",
-"9582*0=0",
-"9583*0=0",
-"9584*0=0",
-"9585*0=0",
-"9586*0=0",
-"9587*0=0",
-"9588*0=0",
-"9589*0=0",
-"9590*0=0",
-"9591*0=0",
-"9592*0=0",
-"9593*0=0",
-"9594*0=0",
-"9595*0=0",
-"9596*0=0",
-"9597*0=0",
-"9598*0=0",
-"9599*0=0",
-"95+5=100",
-"95+6=101",
-"95+7=102",
-"95+8=103",
-"95+9=104",
-"95-10=85",
-"95-11=84",
-"95-12=83",
-"95-13=82",
-"95-14=81",
-"95-15=80",
-"95-16=79",
-"95-17=78",
-"95-18=77",
-"95-19=76",
-"95-20=75",
-"95-21=74",
-"95-22=73",
-"95-23=72",
-"95-24=71",
-"95-25=70",
-"95-26=69",
-"95-27=68",
-"95-28=67",
-"95-29=66",
-"95-30=65",
-"95-31=64",
-"95-32=63",
-"95-33=62",
-"95-34=61",
-"95-35=60",
-"95-36=59",
-"95-37=58",
-"95-38=57",
-"95-39=56",
-"95-40=55",
-"95-41=54",
-"95-42=53",
-"95-43=52",
-"95-44=51",
-"95-45=50",
-"95-46=49",
-"95-47=48",
-"95-48=47",
-"95-49=46",
-"95-50=45",
-"95-51=44",
-"95-52=43",
-"95-53=42",
-"95-54=41",
-"95-55=40",
-"95-56=39",
-"95-57=38",
-"95-58=37",
-"95-59=36",
-"95-60=35",
-"95-61=34",
-"95-62=33",
-"95-63=32",
-"95-64=31",
-"95-65=30",
-"95-66=29",
-"95-67=28",
-"95-68=27",
-"95-69=26",
-"95-70=25",
-"95-71=24",
-"95-72=23",
-"95-73=22",
-"95-74=21",
-"95-75=20",
-"95-76=19",
-"95-77=18",
-"95-78=17",
-"95-79=16",
-"95-80=15",
-"95-81=14",
-"95-82=13",
-"95-83=12",
-"95-84=11",
-"95-85=10",
-"95-96=-1",
-"95-97=-2",
-"95-98=-3",
-"95-99=-4",
-"95*0+0=0",
-"95*0+1=1",
-"95*0+2=2",
-"95*0+3=3",
-"95*0+4=4",
-"95*0+5=5",
-"95*0+6=6",
-"95*0+7=7",
-"95*0+8=8",
-"95*0+9=9",
-"95*0-0=0",
-"95*0*0=0",
-"95*0*1=0",
-"95*0*2=0",
-"95*0*3=0",
-"95*0*4=0",
-"95*0*5=0",
-"95*0*6=0",
-"95*0*7=0",
-"95*0*8=0",
-"95*0*9=0",
-"95*0/1=0",
-"95*0/2=0",
-"95*0/3=0",
-"95*0/4=0",
-"95*0/5=0",
-"95*0/6=0",
-"95*0/7=0",
-"95*0/8=0",
-"95*0/9=0",
-"95*1*0=0",
-"95*2*0=0",
-"95*2=190",
-"95*3*0=0",
-"95*3=285",
-"95*4*0=0",
-"95*4=380",
-"95*5*0=0",
-"95*5=475",
-"95*6*0=0",
-"95*6=570",
-"95*7*0=0",
-"95*7=665",
-"95*8*0=0",
-"95*8=760",
-"95*9*0=0",
-"95*9=855",
-"95/1*0=0",
-"95/2*0=0",
-"95/3*0=0",
-"95/4*0=0",
-"95/5*0=0",
-"95/6*0=0",
-"95/7*0=0",
-"95/8*0=0",
-"95/9*0=0",
-"9600*0=0",
-"9601*0=0",
-"9602*0=0",
-"9603*0=0",
-"9604*0=0",
-"9605*0=0",
-"9606*0=0",
-"9607*0=0",
-"9608*0=0",
-"9609*0=0",
-"9610*0=0",
-"9611*0=0",
-"9612*0=0",
-"9613*0=0",
-"9614*0=0",
-"9615*0=0",
-"9616*0=0",
-"9617*0=0",
-"9618*0=0",
-"9619*0=0",
-"9620*0=0",
-"9621*0=0",
-"9622*0=0",
-"9623*0=0",
-"9624*0=0",
-"9625*0=0",
-"9626*0=0",
-"9627*0=0",
-"9628*0=0",
-"9629*0=0",
-"9630*0=0",
-"9631*0=0",
-"9632*0=0",
-"9633*0=0",
-"9634*0=0",
-"9635*0=0",
-"9636*0=0",
-"9637*0=0",
-"9638*0=0",
-"9639*0=0",
-"9640*0=0",
-"9641*0=0",
-"9642*0=0",
-"9643*0=0",
-"9644*0=0",
-"9645*0=0",
-"9646*0=0",
-"9647*0=0",
-"9648*0=0",
-"9649*0=0",
-"9650*0=0",
-"9651*0=0",
-"9652*0=0",
-"9653*0=0",
-"9654*0=0",
-"9655*0=0",
-"9656*0=0",
-"9657*0=0",
-"9658*0=0",
-"9659*0=0",
-"9660*0=0",
-"9661*0=0",
-"9662*0=0",
-"9663*0=0",
-"9664*0=0",
-"9665*0=0",
-"9666*0=0",
-"9667*0=0",
-"9668*0=0",
-"9669*0=0",
-"9670*0=0",
-"9671*0=0",
-"9672*0=0",
-"9673*0=0",
-"9674*0=0",
-"9675*0=0",
-"9676*0=0",
-"9677*0=0",
-"9678*0=0",
-"9679*0=0",
-"9680*0=0",
-"9681*0=0",
-"9682*0=0",
-"9683*0=0",
-"9684*0=0",
-"9685*0=0",
-"9686*0=0",
-"9687*0=0",
-"9688*0=0",
-"9689*0=0",
-"9690*0=0",
-"9691*0=0",
-"9692*0=0",
-"9693*0=0",
-"9694*0=0",
-"9695*0=0",
-"9696*0=0",
-"9697*0=0",
-"9698*0=0",
-"9699*0=0",
-"96+4=100",
-"96+5=101",
-"96+6=102",
-"96+7=103",
-"96+8=104",
-"96+9=105",
-"96-10=86",
-"96-11=85",
-"96-12=84",
-"96-13=83",
-"96-14=82",
-"96-15=81",
-"96-16=80",
-"96-17=79",
-"96-18=78",
-"96-19=77",
-"96-20=76",
-"96-21=75",
-"96-22=74",
-"96-23=73",
-"96-24=72",
-"96-25=71",
-"96-26=70",
-"96-27=69",
-"96-28=68",
-"96-29=67",
-"96-30=66",
-"96-31=65",
-"96-32=64",
-"96-33=63",
-"96-34=62",
-"96-35=61",
-"96-36=60",
-"96-37=59",
-"96-38=58",
-"96-39=57",
-"96-40=56",
-"96-41=55",
-"96-42=54",
-"96-43=53",
-"96-44=52",
-"96-45=51",
-"96-46=50",
-"96-47=49",
-"96-48=48",
-"96-49=47",
-"96-50=46",
-"96-51=45",
-"96-52=44",
-"96-53=43",
-"96-54=42",
-"96-55=41",
-"96-56=40",
-"96-57=39",
-"96-58=38",
-"96-59=37",
-"96-60=36",
-"96-61=35",
-"96-62=34",
-"96-63=33",
-"96-64=32",
-"96-65=31",
-"96-66=30",
-"96-67=29",
-"96-68=28",
-"96-69=27",
-"96-70=26",
-"96-71=25",
-"96-72=24",
-"96-73=23",
-"96-74=22",
-"96-75=21",
-"96-76=20",
-"96-77=19",
-"96-78=18",
-"96-79=17",
-"96-80=16",
-"96-81=15",
-"96-82=14",
-"96-83=13",
-"96-84=12",
-"96-85=11",
-"96-86=10",
-"96-97=-1",
-"96-98=-2",
-"96-99=-3",
-"96*0+0=0",
-"96*0+1=1",
-"96*0+2=2",
-"96*0+3=3",
-"96*0+4=4",
-"96*0+5=5",
-"96*0+6=6",
-"96*0+7=7",
-"96*0+8=8",
-"96*0+9=9",
-"96*0-0=0",
-"96*0*0=0",
-"96*0*1=0",
-"96*0*2=0",
-"96*0*3=0",
-"96*0*4=0",
-"96*0*5=0",
-"96*0*6=0",
-"96*0*7=0",
-"96*0*8=0",
-"96*0*9=0",
-"96*0/1=0",
-"96*0/2=0",
-"96*0/3=0",
-"96*0/4=0",
-"96*0/5=0",
-"96*0/6=0",
-"96*0/7=0",
-"96*0/8=0",
-"96*0/9=0",
-"96*1*0=0",
-"96*2*0=0",
-"96*2=192",
-"96*3*0=0",
-"96*3=288",
-"96*4*0=0",
-"96*4=384",
-"96*5*0=0",
-"96*5=480",
-"96*6*0=0",
-"96*6=576",
-"96*7*0=0",
-"96*7=672",
-"96*8*0=0",
-"96*8=768",
-"96*9*0=0",
-"96*9=864",
-"96/1*0=0",
-"96/2*0=0",
-"96/2/6=8",
-"96/2/8=6",
-"96/3*0=0",
-"96/3/4=8",
-"96/3/8=4",
-"96/4*0=0",
-"96/4/3=8",
-"96/4/4=6",
-"96/4/6=4",
-"96/4/8=3",
-"96/5*0=0",
-"96/6-7=9",
-"96/6-8=8",
-"96/6-9=7",
-"96/6*0=0",
-"96/6/2=8",
-"96/6/4=4",
-"96/6/8=2",
-"96/7*0=0",
-"96/8-3=9",
-"96/8-4=8",
-"96/8-5=7",
-"96/8-6=6",
-"96/8-7=5",
-"96/8-8=4",
-"96/8-9=3",
-"96/8*0=0",
-"96/8/2=6",
-"96/8/3=4",
-"96/8/4=3",
-"96/8/6=2",
-"96/9*0=0",
-"9700*0=0",
-"9701*0=0",
-"9702*0=0",
-"9703*0=0",
-"9704*0=0",
-"9705*0=0",
-"9706*0=0",
-"9707*0=0",
-"9708*0=0",
-"9709*0=0",
-"9710*0=0",
-"9711*0=0",
-"9712*0=0",
-"9713*0=0",
-"9714*0=0",
-"9715*0=0",
-"9716*0=0",
-"9717*0=0",
-"9718*0=0",
-"9719*0=0",
-"9720*0=0",
-"9721*0=0",
-"9722*0=0",
-"9723*0=0",
-"9724*0=0",
-"9725*0=0",
-"9726*0=0",
-"9727*0=0",
-"9728*0=0",
-"9729*0=0",
-"9730*0=0",
-"9731*0=0",
-"9732*0=0",
-"9733*0=0",
-"9734*0=0",
-"9735*0=0",
-"9736*0=0",
-"9737*0=0",
-"9738*0=0",
-"9739*0=0",
-"9740*0=0",
-"9741*0=0",
-"9742*0=0",
-"9743*0=0",
-"9744*0=0",
-"9745*0=0",
-"9746*0=0",
-"9747*0=0",
-"9748*0=0",
-"9749*0=0",
-"9750*0=0",
-"9751*0=0",
-"9752*0=0",
-"9753*0=0",
-"9754*0=0",
-"9755*0=0",
-"9756*0=0",
-"9757*0=0",
-"9758*0=0",
-"9759*0=0",
-"9760*0=0",
-"9761*0=0",
-"9762*0=0",
-"9763*0=0",
-"9764*0=0",
-"9765*0=0",
-"9766*0=0",
-"9767*0=0",
-"9768*0=0",
-"9769*0=0",
-"9770*0=0",
-"9771*0=0",
-"9772*0=0",
-"9773*0=0",
-"9774*0=0",
-"9775*0=0",
-"9776*0=0",
-"9777*0=0",
-"9778*0=0",
-"9779*0=0",
-"9780*0=0",
-"9781*0=0",
-"9782*0=0",
-"9783*0=0",
-"9784*0=0",
-"9785*0=0",
-"9786*0=0",
-"9787*0=0",
-"9788*0=0",
-"9789*0=0",
-"9790*0=0",
-"9791*0=0",
-"9792*0=0",
-"9793*0=0",
-"9794*0=0",
-"9795*0=0",
-"9796*0=0",
-"9797*0=0",
-"9798*0=0",
-"9799*0=0",
-"97+3=100",
-"97+4=101",
-"97+5=102",
-"97+6=103",
-"97+7=104",
-"97+8=105",
-"97+9=106",
-"97-10=87",
-"97-11=86",
-"97-12=85",
-"97-13=84",
-"97-14=83",
-"97-15=82",
-"97-16=81",
-"97-17=80",
-"97-18=79",
-"97-19=78",
-"97-20=77",
-"97-21=76",
-"97-22=75",
-"97-23=74",
-"97-24=73",
-"97-25=72",
-"97-26=71",
-"97-27=70",
-"97-28=69",
-"97-29=68",
-"97-30=67",
-"97-31=66",
-"97-32=65",
-"97-33=64",
-"97-34=63",
-"97-35=62",
-"97-36=61",
-"97-37=60",
-"97-38=59",
-"97-39=58",
-"97-40=57",
-"97-41=56",
-"97-42=55",
-"97-43=54",
-"97-44=53",
-"97-45=52",
-"97-46=51",
-"97-47=50",
-"97-48=49",
-"97-49=48",
-"97-50=47",
-"97-51=46",
-"97-52=45",
-"97-53=44",
-"97-54=43",
-"97-55=42",
-"97-56=41",
-"97-57=40",
-"97-58=39",
-"97-59=38",
-"97-60=37",
-"97-61=36",
-"97-62=35",
-"97-63=34",
-"97-64=33",
-"97-65=32",
-"97-66=31",
-"97-67=30",
-"97-68=29",
-"97-69=28",
-"97-70=27",
-"97-71=26",
-"97-72=25",
-"97-73=24",
-"97-74=23",
-"97-75=22",
-"97-76=21",
-"97-77=20",
-"97-78=19",
-"97-79=18",
-"97-80=17",
-"97-81=16",
-"97-82=15",
-"97-83=14",
-"97-84=13",
-"97-85=12",
-"97-86=11",
-"97-87=10",
-"97-98=-1",
-"97-99=-2",
-"97*0+0=0",
-"97*0+1=1",
-"97*0+2=2",
-"97*0+3=3",
-"97*0+4=4",
-"97*0+5=5",
-"97*0+6=6",
-"97*0+7=7",
-"97*0+8=8",
-"97*0+9=9",
-"97*0-0=0",
-"97*0*0=0",
-"97*0*1=0",
-"97*0*2=0",
-"97*0*3=0",
-"97*0*4=0",
-"97*0*5=0",
-"97*0*6=0",
-"97*0*7=0",
-"97*0*8=0",
-"97*0*9=0",
-"97*0/1=0",
-"97*0/2=0",
-"97*0/3=0",
-"97*0/4=0",
-"97*0/5=0",
-"97*0/6=0",
-"97*0/7=0",
-"97*0/8=0",
-"97*0/9=0",
-"97*1*0=0",
-"97*2*0=0",
-"97*2=194",
-"97*3*0=0",
-"97*3=291",
-"97*4*0=0",
-"97*4=388",
-"97*5*0=0",
-"97*5=485",
-"97*6*0=0",
-"97*6=582",
-"97*7*0=0",
-"97*7=679",
-"97*8*0=0",
-"97*8=776",
-"97*9*0=0",
-"97*9=873",
-"97/1*0=0",
-"97/2*0=0",
-"97/3*0=0",
-"97/4*0=0",
-"97/5*0=0",
-"97/6*0=0",
-"97/7*0=0",
-"97/8*0=0",
-"97/9*0=0",
-"9800*0=0",
-"9801*0=0",
-"9802*0=0",
-"9803*0=0",
-"9804*0=0",
-"9805*0=0",
-"9806*0=0",
-"9807*0=0",
-"9808*0=0",
-"9809*0=0",
-"9810*0=0",
-"9811*0=0",
-"9812*0=0",
-"9813*0=0",
-"9814*0=0",
-"9815*0=0",
-"9816*0=0",
-"9817*0=0",
-"9818*0=0",
-"9819*0=0",
-"9820*0=0",
-"9821*0=0",
-"9822*0=0",
-"9823*0=0",
-"9824*0=0",
-"9825*0=0",
-"9826*0=0",
-"9827*0=0",
-"9828*0=0",
-"9829*0=0",
-"9830*0=0",
-"9831*0=0",
-"9832*0=0",
-"9833*0=0",
-"9834*0=0",
-"9835*0=0",
-"9836*0=0",
-"9837*0=0",
-"9838*0=0",
-"9839*0=0",
-"9840*0=0",
-"9841*0=0",
-"9842*0=0",
-"9843*0=0",
-"9844*0=0",
-"9845*0=0",
-"9846*0=0",
-"9847*0=0",
-"9848*0=0",
-"9849*0=0",
-"9850*0=0",
-"9851*0=0",
-"9852*0=0",
-"9853*0=0",
-"9854*0=0",
-"9855*0=0",
-"9856*0=0",
-"9857*0=0",
-"9858*0=0",
-"9859*0=0",
-"9860*0=0",
-"9861*0=0",
-"9862*0=0",
-"9863*0=0",
-"9864*0=0",
-"9865*0=0",
-"9866*0=0",
-"9867*0=0",
-"9868*0=0",
-"9869*0=0",
-"9870*0=0",
-"9871*0=0",
-"9872*0=0",
-"9873*0=0",
-"9874*0=0",
-"9875*0=0",
-"9876*0=0",
-"9877*0=0",
-"9878*0=0",
-"9879*0=0",
-"9880*0=0",
-"9881*0=0",
-"9882*0=0",
-"9883*0=0",
-"9884*0=0",
-"9885*0=0",
-"9886*0=0",
-"9887*0=0",
-"9888*0=0",
-"9889*0=0",
-"9890*0=0",
-"9891*0=0",
-"9892*0=0",
-"9893*0=0",
-"9894*0=0",
-"9895*0=0",
-"9896*0=0",
-"9897*0=0",
-"9898*0=0",
-"9899*0=0",
-"98+2=100",
-"98+3=101",
-"98+4=102",
-"98+5=103",
-"98+6=104",
-"98+7=105",
-"98+8=106",
-"98+9=107",
-"98-10=88",
-"98-11=87",
-"98-12=86",
-"98-13=85",
-"98-14=84",
-"98-15=83",
-"98-16=82",
-"98-17=81",
-"98-18=80",
-"98-19=79",
-"98-20=78",
-"98-21=77",
-"98-22=76",
-"98-23=75",
-"98-24=74",
-"98-25=73",
-"98-26=72",
-"98-27=71",
-"98-28=70",
-"98-29=69",
-"98-30=68",
-"98-31=67",
-"98-32=66",
-"98-33=65",
-"98-34=64",
-"98-35=63",
-"98-36=62",
-"98-37=61",
-"98-38=60",
-"98-39=59",
-"98-40=58",
-"98-41=57",
-"98-42=56",
-"98-43=55",
-"98-44=54",
-"98-45=53",
-"98-46=52",
-"98-47=51",
-"98-48=50",
-"98-49=49",
-"98-50=48",
-"98-51=47",
-"98-52=46",
-"98-53=45",
-"98-54=44",
-"98-55=43",
-"98-56=42",
-"98-57=41",
-"98-58=40",
-"98-59=39",
-"98-60=38",
-"98-61=37",
-"98-62=36",
-"98-63=35",
-"98-64=34",
-"98-65=33",
-"98-66=32",
-"98-67=31",
-"98-68=30",
-"98-69=29",
-"98-70=28",
-"98-71=27",
-"98-72=26",
-"98-73=25",
-"98-74=24",
-"98-75=23",
-"98-76=22",
-"98-77=21",
-"98-78=20",
-"98-79=19",
-"98-80=18",
-"98-81=17",
-"98-82=16",
-"98-83=15",
-"98-84=14",
-"98-85=13",
-"98-86=12",
-"98-87=11",
-"98-88=10",
-"98-99=-1",
-"98*0+0=0",
-"98*0+1=1",
-"98*0+2=2",
-"98*0+3=3",
-"98*0+4=4",
-"98*0+5=5",
-"98*0+6=6",
-"98*0+7=7",
-"98*0+8=8",
-"98*0+9=9",
-"98*0-0=0",
-"98*0*0=0",
-"98*0*1=0",
-"98*0*2=0",
-"98*0*3=0",
-"98*0*4=0",
-"98*0*5=0",
-"98*0*6=0",
-"98*0*7=0",
-"98*0*8=0",
-"98*0*9=0",
-"98*0/1=0",
-"98*0/2=0",
-"98*0/3=0",
-"98*0/4=0",
-"98*0/5=0",
-"98*0/6=0",
-"98*0/7=0",
-"98*0/8=0",
-"98*0/9=0",
-"98*1*0=0",
-"98*2*0=0",
-"98*2=196",
-"98*3*0=0",
-"98*3=294",
-"98*4*0=0",
-"98*4=392",
-"98*5*0=0",
-"98*5=490",
-"98*6*0=0",
-"98*6=588",
-"98*7*0=0",
-"98*7=686",
-"98*8*0=0",
-"98*8=784",
-"98*9*0=0",
-"98*9=882",
-"98/1*0=0",
-"98/2*0=0",
-"98/2/7=7",
-"98/3*0=0",
-"98/4*0=0",
-"98/5*0=0",
-"98/6*0=0",
-"98/7-5=9",
-"98/7-6=8",
-"98/7-7=7",
-"98/7-8=6",
-"98/7-9=5",
-"98/7*0=0",
-"98/7/2=7",
-"98/7/7=2",
-"98/8*0=0",
-"98/9*0=0",
-"9900*0=0",
-"9901*0=0",
-"9902*0=0",
-"9903*0=0",
-"9904*0=0",
-"9905*0=0",
-"9906*0=0",
-"9907*0=0",
-"9908*0=0",
-"9909*0=0",
-"9910*0=0",
-"9911*0=0",
-"9912*0=0",
-"9913*0=0",
-"9914*0=0",
-"9915*0=0",
-"9916*0=0",
-"9917*0=0",
-"9918*0=0",
-"9919*0=0",
-"9920*0=0",
-"9921*0=0",
-"9922*0=0",
-"9923*0=0",
-"9924*0=0",
-"9925*0=0",
-"9926*0=0",
-"9927*0=0",
-"9928*0=0",
-"9929*0=0",
-"9930*0=0",
-"9931*0=0",
-"9932*0=0",
-"9933*0=0",
-"9934*0=0",
-"9935*0=0",
-"9936*0=0",
-"9937*0=0",
-"9938*0=0",
-"9939*0=0",
-"9940*0=0",
-"9941*0=0",
-"9942*0=0",
-"9943*0=0",
-"9944*0=0",
-"9945*0=0",
-"9946*0=0",
-"9947*0=0",
-"9948*0=0",
-"9949*0=0",
-"9950*0=0",
-"9951*0=0",
-"9952*0=0",
-"9953*0=0",
-"9954*0=0",
-"9955*0=0",
-"9956*0=0",
-"9957*0=0",
-"9958*0=0",
-"9959*0=0",
-"9960*0=0",
-"9961*0=0",
-"9962*0=0",
-"9963*0=0",
-"9964*0=0",
-"9965*0=0",
-"9966*0=0",
-"9967*0=0",
-"9968*0=0",
-"9969*0=0",
-"9970*0=0",
-"9971*0=0",
-"9972*0=0",
-"9973*0=0",
-"9974*0=0",
-"9975*0=0",
-"9976*0=0",
-"9977*0=0",
-"9978*0=0",
-"9979*0=0",
-"9980*0=0",
-"9981*0=0",
-"9982*0=0",
-"9983*0=0",
-"9984*0=0",
-"9985*0=0",
-"9986*0=0",
-"9987*0=0",
-"9988*0=0",
-"9989*0=0",
-"9990*0=0",
-"9991*0=0",
-"9992*0=0",
-"9993*0=0",
-"9994*0=0",
-"9995*0=0",
-"9996*0=0",
-"9997*0=0",
-"9998*0=0",
-"9999*0=0",
-"99+1=100",
-"99+2=101",
-"99+3=102",
-"99+4=103",
-"99+5=104",
-"99+6=105",
-"99+7=106",
-"99+8=107",
-"99+9=108",
-"99-10=89",
-"99-11=88",
-"99-12=87",
-"99-13=86",
-"99-14=85",
-"99-15=84",
-"99-16=83",
-"99-17=82",
-"99-18=81",
-"99-19=80",
-"99-20=79",
-"99-21=78",
-"99-22=77",
-"99-23=76",
-"99-24=75",
-"99-25=74",
-"99-26=73",
-"99-27=72",
-"99-28=71",
-"99-29=70",
-"99-30=69",
-"99-31=68",
-"99-32=67",
-"99-33=66",
-"99-34=65",
-"99-35=64",
-"99-36=63",
-"99-37=62",
-"99-38=61",
-"99-39=60",
-"99-40=59",
-"99-41=58",
-"99-42=57",
-"99-43=56",
-"99-44=55",
-"99-45=54",
-"99-46=53",
-"99-47=52",
-"99-48=51",
-"99-49=50",
-"99-50=49",
-"99-51=48",
-"99-52=47",
-"99-53=46",
-"99-54=45",
-"99-55=44",
-"99-56=43",
-"99-57=42",
-"99-58=41",
-"99-59=40",
-"99-60=39",
-"99-61=38",
-"99-62=37",
-"99-63=36",
-"99-64=35",
-"99-65=34",
-"99-66=33",
-"99-67=32",
-"99-68=31",
-"99-69=30",
-"99-70=29",
-"99-71=28",
-"99-72=27",
-"99-73=26",
-"99-74=25",
-"99-75=24",
-"99-76=23",
-"99-77=22",
-"99-78=21",
-"99-79=20",
-"99-80=19",
-"99-81=18",
-"99-82=17",
-"99-83=16",
-"99-84=15",
-"99-85=14",
-"99-86=13",
-"99-87=12",
-"99-88=11",
-"99-89=10",
-"99*0+0=0",
-"99*0+1=1",
-"99*0+2=2",
-"99*0+3=3",
-"99*0+4=4",
-"99*0+5=5",
-"99*0+6=6",
-"99*0+7=7",
-"99*0+8=8",
-"99*0+9=9",
-"99*0-0=0",
-"99*0*0=0",
-"99*0*1=0",
-"99*0*2=0",
-"99*0*3=0",
-"99*0*4=0",
-"99*0*5=0",
-"99*0*6=0",
-"99*0*7=0",
-"99*0*8=0",
-"99*0*9=0",
-"99*0/1=0",
-"99*0/2=0",
-"99*0/3=0",
-"99*0/4=0",
-"99*0/5=0",
-"99*0/6=0",
-"99*0/7=0",
-"99*0/8=0",
-"99*0/9=0",
-"99*1*0=0",
-"99*2*0=0",
-"99*2=198",
-"99*3*0=0",
-"99*3=297",
-"99*4*0=0",
-"99*4=396",
-"99*5*0=0",
-"99*5=495",
-"99*6*0=0",
-"99*6=594",
-"99*7*0=0",
-"99*7=693",
-"99*8*0=0",
-"99*8=792",
-"99*9*0=0",
-"99*9=891",
-"99/1*0=0",
-"99/2*0=0",
-"99/3*0=0",
-"99/4*0=0",
-"99/5*0=0",
-"99/6*0=0",
-"99/7*0=0",
-"99/8*0=0",
-"99/9-2=9",
-"99/9-3=8",
-"99/9-4=7",
-"99/9-5=6",
-"99/9-6=5",
-"99/9-7=4",
-"99/9-8=3",
-"99/9-9=2",
-"99/9*0=0",
-"9+0+1=10",
-"9+0+2=11",
-"9+0+3=12",
-"9+0+4=13",
-"9+0+5=14",
-"9+0+6=15",
-"9+0+7=16",
-"9+0+8=17",
-"9+0+9=18",
-"9+0*10=9",
-"9+0*11=9",
-"9+0*12=9",
-"9+0*13=9",
-"9+0*14=9",
-"9+0*15=9",
-"9+0*16=9",
-"9+0*17=9",
-"9+0*18=9",
-"9+0*19=9",
-"9+0*20=9",
-"9+0*21=9",
-"9+0*22=9",
-"9+0*23=9",
-"9+0*24=9",
-"9+0*25=9",
-"9+0*26=9",
-"9+0*27=9",
-"9+0*28=9",
-"9+0*29=9",
-"9+0*30=9",
-"9+0*31=9",
-"9+0*32=9",
-"9+0*33=9",
-"9+0*34=9",
-"9+0*35=9",
-"9+0*36=9",
-"9+0*37=9",
-"9+0*38=9",
-"9+0*39=9",
-"9+0*40=9",
-"9+0*41=9",
-"9+0*42=9",
-"9+0*43=9",
-"9+0*44=9",
-"9+0*45=9",
-"9+0*46=9",
-"9+0*47=9",
-"9+0*48=9",
-"9+0*49=9",
-"9+0*50=9",
-"9+0*51=9",
-"9+0*52=9",
-"9+0*53=9",
-"9+0*54=9",
-"9+0*55=9",
-"9+0*56=9",
-"9+0*57=9",
-"9+0*58=9",
-"9+0*59=9",
-"9+0*60=9",
-"9+0*61=9",
-"9+0*62=9",
-"9+0*63=9",
-"9+0*64=9",
-"9+0*65=9",
-"9+0*66=9",
-"9+0*67=9",
-"9+0*68=9",
-"9+0*69=9",
-"9+0*70=9",
-"9+0*71=9",
-"9+0*72=9",
-"9+0*73=9",
-"9+0*74=9",
-"9+0*75=9",
-"9+0*76=9",
-"9+0*77=9",
-"9+0*78=9",
-"9+0*79=9",
-"9+0*80=9",
-"9+0*81=9",
-"9+0*82=9",
-"9+0*83=9",
-"9+0*84=9",
-"9+0*85=9",
-"9+0*86=9",
-"9+0*87=9",
-"9+0*88=9",
-"9+0*89=9",
-"9+0*90=9",
-"9+0*91=9",
-"9+0*92=9",
-"9+0*93=9",
-"9+0*94=9",
-"9+0*95=9",
-"9+0*96=9",
-"9+0*97=9",
-"9+0*98=9",
-"9+0*99=9",
-"9+0/10=9",
-"9+0/11=9",
-"9+0/12=9",
-"9+0/13=9",
-"9+0/14=9",
-"9+0/15=9",
-"9+0/16=9",
-"9+0/17=9",
-"9+0/18=9",
-"9+0/19=9",
-"9+0/20=9",
-"9+0/21=9",
-"9+0/22=9",
-"9+0/23=9",
-"9+0/24=9",
-"9+0/25=9",
-"9+0/26=9",
-"9+0/27=9",
-"9+0/28=9",
-"9+0/29=9",
-"9+0/30=9",
-"9+0/31=9",
-"9+0/32=9",
-"9+0/33=9",
-"9+0/34=9",
-"9+0/35=9",
-"9+0/36=9",
-"9+0/37=9",
-"9+0/38=9",
-"9+0/39=9",
-"9+0/40=9",
-"9+0/41=9",
-"9+0/42=9",
-"9+0/43=9",
-"9+0/44=9",
-"9+0/45=9",
-"9+0/46=9",
-"9+0/47=9",
-"9+0/48=9",
-"9+0/49=9",
-"9+0/50=9",
-"9+0/51=9",
-"9+0/52=9",
-"9+0/53=9",
-"9+0/54=9",
-"9+0/55=9",
-"9+0/56=9",
-"9+0/57=9",
-"9+0/58=9",
-"9+0/59=9",
-"9+0/60=9",
-"9+0/61=9",
-"9+0/62=9",
-"9+0/63=9",
-"9+0/64=9",
-"9+0/65=9",
-"9+0/66=9",
-"9+0/67=9",
-"9+0/68=9",
-"9+0/69=9",
-"9+0/70=9",
-"9+0/71=9",
-"9+0/72=9",
-"9+0/73=9",
-"9+0/74=9",
-"9+0/75=9",
-"9+0/76=9",
-"9+0/77=9",
-"9+0/78=9",
-"9+0/79=9",
-"9+0/80=9",
-"9+0/81=9",
-"9+0/82=9",
-"9+0/83=9",
-"9+0/84=9",
-"9+0/85=9",
-"9+0/86=9",
-"9+0/87=9",
-"9+0/88=9",
-"9+0/89=9",
-"9+0/90=9",
-"9+0/91=9",
-"9+0/92=9",
-"9+0/93=9",
-"9+0/94=9",
-"9+0/95=9",
-"9+0/96=9",
-"9+0/97=9",
-"9+0/98=9",
-"9+0/99=9",
-"9+10*0=9",
-"9+11*0=9",
-"9+12*0=9",
-"9+13*0=9",
-"9+14*0=9",
-"9+15*0=9",
-"9+16*0=9",
-"9+17*0=9",
-"9+18*0=9",
-"9+19*0=9",
-"9+1+0=10",
-"9+1+1=11",
-"9+1+2=12",
-"9+1+3=13",
-"9+1+4=14",
-"9+1+5=15",
-"9+1+6=16",
-"9+1+7=17",
-"9+1+8=18",
-"9+1+9=19",
-"9+1-0=10",
-"9+1-10=0",
-"9+1*1=10",
-"9+1*2=11",
-"9+1*3=12",
-"9+1*4=13",
-"9+1*5=14",
-"9+1*6=15",
-"9+1*7=16",
-"9+1*8=17",
-"9+1*9=18",
-"9+1/1=10",
-"9+20*0=9",
-"9+21*0=9",
-"9+22*0=9",
-"9+23*0=9",
-"9+24*0=9",
-"9+25*0=9",
-"9+26*0=9",
-"9+27*0=9",
-"9+28*0=9",
-"9+29*0=9",
-"9+2+0=11",
-"9+2+1=12",
-"9+2+2=13",
-"9+2+3=14",
-"9+2+4=15",
-"9+2+5=16",
-"9+2+6=17",
-"9+2+7=18",
-"9+2+8=19",
-"9+2+9=20",
-"9+2-0=11",
-"9+2-10=1",
-"9+2-11=0",
-"9+2-1=10",
-"9+2*1=11",
-"9+2*2=13",
-"9+2*3=15",
-"9+2*4=17",
-"9+2*5=19",
-"9+2*6=21",
-"9+2*7=23",
-"9+2*8=25",
-"9+2*9=27",
-"9+2/1=11",
-"9+2/2=10",
-"9+30*0=9",
-"9+31*0=9",
-"9+32*0=9",
-"9+33*0=9",
-"9+34*0=9",
-"9+35*0=9",
-"9+36*0=9",
-"9+37*0=9",
-"9+38*0=9",
-"9+39*0=9",
-"9+3+0=12",
-"9+3+1=13",
-"9+3+2=14",
-"9+3+3=15",
-"9+3+4=16",
-"9+3+5=17",
-"9+3+6=18",
-"9+3+7=19",
-"9+3+8=20",
-"9+3+9=21",
-"9+3-0=12",
-"9+3-10=2",
-"9+3-11=1",
-"9+3-12=0",
-"9+3-1=11",
-"9+3-2=10",
-"9+3*1=12",
-"9+3*2=15",
-"9+3*3=18",
-"9+3*4=21",
-"9+3*5=24",
-"9+3*6=27",
-"9+3*7=30",
-"9+3*8=33",
-"9+3*9=36",
-"9+3/1=12",
-"9+3/3=10",
-"9+40*0=9",
-"9+41*0=9",
-"9+42*0=9",
-"9+43*0=9",
-"9+44*0=9",
-"9+45*0=9",
-"9+46*0=9",
-"9+47*0=9",
-"9+48*0=9",
-"9+49*0=9",
-"9+4+0=13",
-"9+4+1=14",
-"9+4+2=15",
-"9+4+3=16",
-"9+4+4=17",
-"9+4+5=18",
-"9+4+6=19",
-"9+4+7=20",
-"9+4+8=21",
-"9+4+9=22",
-"9+4-0=13",
-"9+4-10=3",
-"9+4-11=2",
-"9+4-12=1",
-"9+4-13=0",
-"9+4-1=12",
-"9+4-2=11",
-"9+4-3=10",
-"9+4*1=13",
-"9+4*2=17",
-"9+4*3=21",
-"9+4*4=25",
-"9+4*5=29",
-"9+4*6=33",
-"9+4*7=37",
-"9+4*8=41",
-"9+4*9=45",
-"9+4/1=13",
-"9+4/2=11",
-"9+4/4=10",
-"9+50*0=9",
-"9+51*0=9",
-"9+52*0=9",
-"9+53*0=9",
-"9+54*0=9",
-"9+55*0=9",
-"9+56*0=9",
-"9+57*0=9",
-"9+58*0=9",
-"9+59*0=9",
-"9+5+0=14",
-"9+5+1=15",
-"9+5+2=16",
-"9+5+3=17",
-"9+5+4=18",
-"9+5+5=19",
-"9+5+6=20",
-"9+5+7=21",
-"9+5+8=22",
-"9+5+9=23",
-"9+5-0=14",
-"9+5-10=4",
-"9+5-11=3",
-"9+5-12=2",
-"9+5-13=1",
-"9+5-14=0",
-"9+5-1=13",
-"9+5-2=12",
-"9+5-3=11",
-"9+5-4=10",
-"9+5*1=14",
-"9+5*2=19",
-"9+5*3=24",
-"9+5*4=29",
-"9+5*5=34",
-"9+5*6=39",
-"9+5*7=44",
-"9+5*8=49",
-"9+5*9=54",
-"9+5/1=14",
-"9+5/5=10",
-"9+60*0=9",
-"9+61*0=9",
-"9+62*0=9",
-"9+63*0=9",
-"9+64*0=9",
-"9+65*0=9",
-"9+66*0=9",
-"9+67*0=9",
-"9+68*0=9",
-"9+69*0=9",
-"9+6+0=15",
-"9+6+1=16",
-"9+6+2=17",
-"9+6+3=18",
-"9+6+4=19",
-"9+6+5=20",
-"9+6+6=21",
-"9+6+7=22",
-"9+6+8=23",
-"9+6+9=24",
-"9+6-0=15",
-"9+6-10=5",
-"9+6-11=4",
-"9+6-12=3",
-"9+6-13=2",
-"9+6-14=1",
-"9+6-15=0",
-"9+6-1=14",
-"9+6-2=13",
-"9+6-3=12",
-"9+6-4=11",
-"9+6-5=10",
-"9+6*1=15",
-"9+6*2=21",
-"9+6*3=27",
-"9+6*4=33",
-"9+6*5=39",
-"9+6*6=45",
-"9+6*7=51",
-"9+6*8=57",
-"9+6*9=63",
-"9+6/1=15",
-"9+6/2=12",
-"9+6/3=11",
-"9+6/6=10",
-"9+70*0=9",
-"9+71*0=9",
-"9+72*0=9",
-"9+73*0=9",
-"9+74*0=9",
-"9+75*0=9",
-"9+76*0=9",
-"9+77*0=9",
-"9+78*0=9",
-"9+79*0=9",
-"9+7+0=16",
-"9+7+1=17",
-"9+7+2=18",
-"9+7+3=19",
-"9+7+4=20",
-"9+7+5=21",
-"9+7+6=22",
-"9+7+7=23",
-"9+7+8=24",
-"9+7+9=25",
-"9+7-0=16",
-"9+7-10=6",
-"9+7-11=5",
-"9+7-12=4",
-"9+7-13=3",
-"9+7-14=2",
-"9+7-15=1",
-"9+7-16=0",
-"9+7-1=15",
-"9+7-2=14",
-"9+7-3=13",
-"9+7-4=12",
-"9+7-5=11",
-"9+7-6=10",
-"9+7*1=16",
-"9+7*2=23",
-"9+7*3=30",
-"9+7*4=37",
-"9+7*5=44",
-"9+7*6=51",
-"9+7*7=58",
-"9+7*8=65",
-"9+7*9=72",
-"9+7/1=16",
-"9+7/7=10",
-"9+80*0=9",
-"9+81*0=9",
-"9+82*0=9",
-"9+83*0=9",
-"9+84*0=9",
-"9+85*0=9",
-"9+86*0=9",
-"9+87*0=9",
-"9+88*0=9",
-"9+89*0=9",
-"9+8+0=17",
-"9+8+1=18",
-"9+8+2=19",
-"9+8+3=20",
-"9+8+4=21",
-"9+8+5=22",
-"9+8+6=23",
-"9+8+7=24",
-"9+8+8=25",
-"9+8+9=26",
-"9+8-0=17",
-"9+8-10=7",
-"9+8-11=6",
-"9+8-12=5",
-"9+8-13=4",
-"9+8-14=3",
-"9+8-15=2",
-"9+8-16=1",
-"9+8-17=0",
-"9+8-1=16",
-"9+8-2=15",
-"9+8-3=14",
-"9+8-4=13",
-"9+8-5=12",
-"9+8-6=11",
-"9+8-7=10",
-"9+8*1=17",
-"9+8*2=25",
-"9+8*3=33",
-"9+8*4=41",
-"9+8*5=49",
-"9+8*6=57",
-"9+8*7=65",
-"9+8*8=73",
-"9+8*9=81",
-"9+8/1=17",
-"9+8/2=13",
-"9+8/4=11",
-"9+8/8=10",
-"9+90*0=9",
-"9+91*0=9",
-"9+91=100",
-"9+92*0=9",
-"9+92=101",
-"9+93*0=9",
-"9+93=102",
-"9+94*0=9",
-"9+94=103",
-"9+95*0=9",
-"9+95=104",
-"9+96*0=9",
-"9+96=105",
-"9+97*0=9",
-"9+97=106",
-"9+98*0=9",
-"9+98=107",
-"9+99*0=9",
-"9+99=108",
-"9+9+0=18",
-"9+9+1=19",
-"9+9+2=20",
-"9+9+3=21",
-"9+9+4=22",
-"9+9+5=23",
-"9+9+6=24",
-"9+9+7=25",
-"9+9+8=26",
-"9+9+9=27",
-"9+9-0=18",
-"9+9-10=8",
-"9+9-11=7",
-"9+9-12=6",
-"9+9-13=5",
-"9+9-14=4",
-"9+9-15=3",
-"9+9-16=2",
-"9+9-17=1",
-"9+9-18=0",
-"9+9-1=17",
-"9+9-2=16",
-"9+9-3=15",
-"9+9-4=14",
-"9+9-5=13",
-"9+9-6=12",
-"9+9-7=11",
-"9+9-8=10",
-"9+9*1=18",
-"9+9*2=27",
-"9+9*3=36",
-"9+9*4=45",
-"9+9*5=54",
-"9+9*6=63",
-"9+9*7=72",
-"9+9*8=81",
-"9+9*9=90",
-"9+9/1=18",
-"9+9/3=12",
-"9+9/9=10",
-"9-0+1=10",
-"9-0+2=11",
-"9-0+3=12",
-"9-0+4=13",
-"9-0+5=14",
-"9-0+6=15",
-"9-0+7=16",
-"9-0+8=17",
-"9-0+9=18",
-"9-0*10=9",
-"9-0*11=9",
-"9-0*12=9",
-"9-0*13=9",
-"9-0*14=9",
-"9-0*15=9",
-"9-0*16=9",
-"9-0*17=9",
-"9-0*18=9",
-"9-0*19=9",
-"9-0*20=9",
-"9-0*21=9",
-"9-0*22=9",
-"9-0*23=9",
-"9-0*24=9",
-"9-0*25=9",
-"9-0*26=9",
-"9-0*27=9",
-"9-0*28=9",
-"9-0*29=9",
-"9-0*30=9",
-"9-0*31=9",
-"9-0*32=9",
-"9-0*33=9",
-"9-0*34=9",
-"9-0*35=9",
-"9-0*36=9",
-"9-0*37=9",
-"9-0*38=9",
-"9-0*39=9",
-"9-0*40=9",
-"9-0*41=9",
-"9-0*42=9",
-"9-0*43=9",
-"9-0*44=9",
-"9-0*45=9",
-"9-0*46=9",
-"9-0*47=9",
-"9-0*48=9",
-"9-0*49=9",
-"9-0*50=9",
-"9-0*51=9",
-"9-0*52=9",
-"9-0*53=9",
-"9-0*54=9",
-"9-0*55=9",
-"9-0*56=9",
-"9-0*57=9",
-"9-0*58=9",
-"9-0*59=9",
-"9-0*60=9",
-"9-0*61=9",
-"9-0*62=9",
-"9-0*63=9",
-"9-0*64=9",
-"9-0*65=9",
-"9-0*66=9",
-"9-0*67=9",
-"9-0*68=9",
-"9-0*69=9",
-"9-0*70=9",
-"9-0*71=9",
-"9-0*72=9",
-"9-0*73=9",
-"9-0*74=9",
-"9-0*75=9",
-"9-0*76=9",
-"9-0*77=9",
-"9-0*78=9",
-"9-0*79=9",
-"9-0*80=9",
-"9-0*81=9",
-"9-0*82=9",
-"9-0*83=9",
-"9-0*84=9",
-"9-0*85=9",
-"9-0*86=9",
-"9-0*87=9",
-"9-0*88=9",
-"9-0*89=9",
-"9-0*90=9",
-"9-0*91=9",
-"9-0*92=9",
-"9-0*93=9",
-"9-0*94=9",
-"9-0*95=9",
-"9-0*96=9",
-"9-0*97=9",
-"9-0*98=9",
-"9-0*99=9",
-"9-0/10=9",
-"9-0/11=9",
-"9-0/12=9",
-"9-0/13=9",
-"9-0/14=9",
-"9-0/15=9",
-"9-0/16=9",
-"9-0/17=9",
-"9-0/18=9",
-"9-0/19=9",
-"9-0/20=9",
-"9-0/21=9",
-"9-0/22=9",
-"9-0/23=9",
-"9-0/24=9",
-"9-0/25=9",
-"9-0/26=9",
-"9-0/27=9",
-"9-0/28=9",
-"9-0/29=9",
-"9-0/30=9",
-"9-0/31=9",
-"9-0/32=9",
-"9-0/33=9",
-"9-0/34=9",
-"9-0/35=9",
-"9-0/36=9",
-"9-0/37=9",
-"9-0/38=9",
-"9-0/39=9",
-"9-0/40=9",
-"9-0/41=9",
-"9-0/42=9",
-"9-0/43=9",
-"9-0/44=9",
-"9-0/45=9",
-"9-0/46=9",
-"9-0/47=9",
-"9-0/48=9",
-"9-0/49=9",
-"9-0/50=9",
-"9-0/51=9",
-"9-0/52=9",
-"9-0/53=9",
-"9-0/54=9",
-"9-0/55=9",
-"9-0/56=9",
-"9-0/57=9",
-"9-0/58=9",
-"9-0/59=9",
-"9-0/60=9",
-"9-0/61=9",
-"9-0/62=9",
-"9-0/63=9",
-"9-0/64=9",
-"9-0/65=9",
-"9-0/66=9",
-"9-0/67=9",
-"9-0/68=9",
-"9-0/69=9",
-"9-0/70=9",
-"9-0/71=9",
-"9-0/72=9",
-"9-0/73=9",
-"9-0/74=9",
-"9-0/75=9",
-"9-0/76=9",
-"9-0/77=9",
-"9-0/78=9",
-"9-0/79=9",
-"9-0/80=9",
-"9-0/81=9",
-"9-0/82=9",
-"9-0/83=9",
-"9-0/84=9",
-"9-0/85=9",
-"9-0/86=9",
-"9-0/87=9",
-"9-0/88=9",
-"9-0/89=9",
-"9-0/90=9",
-"9-0/91=9",
-"9-0/92=9",
-"9-0/93=9",
-"9-0/94=9",
-"9-0/95=9",
-"9-0/96=9",
-"9-0/97=9",
-"9-0/98=9",
-"9-0/99=9",
-"9-10+1=0",
-"9-10+2=1",
-"9-10+3=2",
-"9-10+4=3",
-"9-10+5=4",
-"9-10+6=5",
-"9-10+7=6",
-"9-10+8=7",
-"9-10+9=8",
-"9-10*0=9",
-"9-10/2=4",
-"9-10/5=7",
-"9-11+2=0",
-"9-11+3=1",
-"9-11+4=2",
-"9-11+5=3",
-"9-11+6=4",
-"9-11+7=5",
-"9-11+8=6",
-"9-11+9=7",
-"9-11*0=9",
-"9-12+3=0",
-"9-12+4=1",
-"9-12+5=2",
-"9-12+6=3",
-"9-12+7=4",
-"9-12+8=5",
-"9-12+9=6",
-"9-12*0=9",
-"9-12/2=3",
-"9-12/3=5",
-"9-12/4=6",
-"9-12/6=7",
-"9-13+4=0",
-"9-13+5=1",
-"9-13+6=2",
-"9-13+7=3",
-"9-13+8=4",
-"9-13+9=5",
-"9-13*0=9",
-"9-14+5=0",
-"9-14+6=1",
-"9-14+7=2",
-"9-14+8=3",
-"9-14+9=4",
-"9-14*0=9",
-"9-14/2=2",
-"9-14/7=7",
-"9-15+6=0",
-"9-15+7=1",
-"9-15+8=2",
-"9-15+9=3",
-"9-15*0=9",
-"9-15/3=4",
-"9-15/5=6",
-"9-16+7=0",
-"9-16+8=1",
-"9-16+9=2",
-"9-16*0=9",
-"9-16/2=1",
-"9-16/4=5",
-"9-16/8=7",
-"9-17+8=0",
-"9-17+9=1",
-"9-17*0=9",
-"9-18+9=0",
-"9-18*0=9",
-"9-18/2=0",
-"9-18/3=3",
-"9-18/6=6",
-"9-18/9=7",
-"9-19*0=9",
-"9-19=-10",
-"9-1+2=10",
-"9-1+3=11",
-"9-1+4=12",
-"9-1+5=13",
-"9-1+6=14",
-"9-1+7=15",
-"9-1+8=16",
-"9-1+9=17",
-"9-1-9=-1",
-"9-20*0=9",
-"9-20/4=4",
-"9-20/5=5",
-"9-20=-11",
-"9-21*0=9",
-"9-21/3=2",
-"9-21/7=6",
-"9-21=-12",
-"9-22*0=9",
-"9-22=-13",
-"9-23*0=9",
-"9-23=-14",
-"9-24*0=9",
-"9-24/3=1",
-"9-24/4=3",
-"9-24/6=5",
-"9-24/8=6",
-"9-24=-15",
-"9-25*0=9",
-"9-25/5=4",
-"9-25=-16",
-"9-26*0=9",
-"9-26=-17",
-"9-27*0=9",
-"9-27/3=0",
-"9-27/9=6",
-"9-27=-18",
-"9-28*0=9",
-"9-28/4=2",
-"9-28/7=5",
-"9-28=-19",
-"9-29*0=9",
-"9-29=-20",
-"9-2+3=10",
-"9-2+4=11",
-"9-2+5=12",
-"9-2+6=13",
-"9-2+7=14",
-"9-2+8=15",
-"9-2+9=16",
-"9-2-8=-1",
-"9-2-9=-2",
-"9-2*5=-1",
-"9-2*6=-3",
-"9-2*7=-5",
-"9-2*8=-7",
-"9-2*9=-9",
-"9-30*0=9",
-"9-30/5=3",
-"9-30/6=4",
-"9-30=-21",
-"9-31*0=9",
-"9-31=-22",
-"9-32*0=9",
-"9-32/4=1",
-"9-32/8=5",
-"9-32=-23",
-"9-33*0=9",
-"9-33=-24",
-"9-34*0=9",
-"9-34=-25",
-"9-35*0=9",
-"9-35/5=2",
-"9-35/7=4",
-"9-35=-26",
-"9-36*0=9",
-"9-36/4=0",
-"9-36/6=3",
-"9-36/9=5",
-"9-36=-27",
-"9-37*0=9",
-"9-37=-28",
-"9-38*0=9",
-"9-38=-29",
-"9-39*0=9",
-"9-39=-30",
-"9-3+4=10",
-"9-3+5=11",
-"9-3+6=12",
-"9-3+7=13",
-"9-3+8=14",
-"9-3+9=15",
-"9-3-7=-1",
-"9-3-8=-2",
-"9-3-9=-3",
-"9-3*4=-3",
-"9-3*5=-6",
-"9-3*6=-9",
-"9-40*0=9",
-"9-40/5=1",
-"9-40/8=4",
-"9-40=-31",
-"9-41*0=9",
-"9-41=-32",
-"9-42*0=9",
-"9-42/6=2",
-"9-42/7=3",
-"9-42=-33",
-"9-43*0=9",
-"9-43=-34",
-"9-44*0=9",
-"9-44=-35",
-"9-45*0=9",
-"9-45/5=0",
-"9-45/9=4",
-"9-45=-36",
-"9-46*0=9",
-"9-46=-37",
-"9-47*0=9",
-"9-47=-38",
-"9-48*0=9",
-"9-48/6=1",
-"9-48/8=3",
-"9-48=-39",
-"9-49*0=9",
-"9-49/7=2",
-"9-49=-40",
-"9-4+5=10",
-"9-4+6=11",
-"9-4+7=12",
-"9-4+8=13",
-"9-4+9=14",
-"9-4-6=-1",
-"9-4-7=-2",
-"9-4-8=-3",
-"9-4-9=-4",
-"9-4*3=-3",
-"9-4*4=-7",
-"9-50*0=9",
-"9-50=-41",
-"9-51*0=9",
-"9-51=-42",
-"9-52*0=9",
-"9-52=-43",
-"9-53*0=9",
-"9-53=-44",
-"9-54*0=9",
-"9-54/6=0",
-"9-54/9=3",
-"9-54=-45",
-"9-55*0=9",
-"9-55=-46",
-"9-56*0=9",
-"9-56/7=1",
-"9-56/8=2",
-"9-56=-47",
-"9-57*0=9",
-"9-57=-48",
-"9-58*0=9",
-"9-58=-49",
-"9-59*0=9",
-"9-59=-50",
-"9-5+6=10",
-"9-5+7=11",
-"9-5+8=12",
-"9-5+9=13",
-"9-5-5=-1",
-"9-5-6=-2",
-"9-5-7=-3",
-"9-5-8=-4",
-"9-5-9=-5",
-"9-5*2=-1",
-"9-5*3=-6",
-"9-60*0=9",
-"9-60=-51",
-"9-61*0=9",
-"9-61=-52",
-"9-62*0=9",
-"9-62=-53",
-"9-63*0=9",
-"9-63/7=0",
-"9-63/9=2",
-"9-63=-54",
-"9-64*0=9",
-"9-64/8=1",
-"9-64=-55",
-"9-65*0=9",
-"9-65=-56",
-"9-66*0=9",
-"9-66=-57",
-"9-67*0=9",
-"9-67=-58",
-"9-68*0=9",
-"9-68=-59",
-"9-69*0=9",
-"9-69=-60",
-"9-6+7=10",
-"9-6+8=11",
-"9-6+9=12",
-"9-6-4=-1",
-"9-6-5=-2",
-"9-6-6=-3",
-"9-6-7=-4",
-"9-6-8=-5",
-"9-6-9=-6",
-"9-6*2=-3",
-"9-6*3=-9",
-"9-70*0=9",
-"9-70=-61",
-"9-71*0=9",
-"9-71=-62",
-"9-72*0=9",
-"9-72/8=0",
-"9-72/9=1",
-"9-72=-63",
-"9-73*0=9",
-"9-73=-64",
-"9-74*0=9",
-"9-74=-65",
-"9-75*0=9",
-"9-75=-66",
-"9-76*0=9",
-"9-76=-67",
-"9-77*0=9",
-"9-77=-68",
-"9-78*0=9",
-"9-78=-69",
-"9-79*0=9",
-"9-79=-70",
-"9-7+8=10",
-"9-7+9=11",
-"9-7-3=-1",
-"9-7-4=-2",
-"9-7-5=-3",
-"9-7-6=-4",
-"9-7-7=-5",
-"9-7-8=-6",
-"9-7-9=-7",
-"9-7*2=-5",
-"9-80*0=9",
-"9-80=-71",
-"9-81*0=9",
-"9-81/9=0",
-"9-81=-72",
-"9-82*0=9",
-"9-82=-73",
-"9-83*0=9",
-"9-83=-74",
-"9-84*0=9",
-"9-84=-75",
-"9-85*0=9",
-"9-85=-76",
-"9-86*0=9",
-"9-86=-77",
-"9-87*0=9",
-"9-87=-78",
-"9-88*0=9",
-"9-88=-79",
-"9-89*0=9",
-"9-89=-80",
-"9-8+9=10",
-"9-8-2=-1",
-"9-8-3=-2",
-"9-8-4=-3",
-"9-8-5=-4",
-"9-8-6=-5",
-"9-8-7=-6",
-"9-8-8=-7",
-"9-8-9=-8",
-"9-8*2=-7",
-"9-90*0=9",
-"9-90=-81",
-"9-91*0=9",
-"9-91=-82",
-"9-92*0=9",
-"9-92=-83",
-"9-93*0=9",
-"9-93=-84",
-"9-94*0=9",
-"9-94=-85",
-"9-95*0=9",
-"9-95=-86",
-"9-96*0=9",
-"9-96=-87",
-"9-97*0=9",
-"9-97=-88",
-"9-98*0=9",
-"9-98=-89",
-"9-99*0=9",
-"9-99=-90",
-"9-9-1=-1",
-"9-9-2=-2",
-"9-9-3=-3",
-"9-9-4=-4",
-"9-9-5=-5",
-"9-9-6=-6",
-"9-9-7=-7",
-"9-9-8=-8",
-"9-9-9=-9",
-"9-9*2=-9",
-"9*0-1=-1",
-"9*0-2=-2",
-"9*0-3=-3",
-"9*0-4=-4",
-"9*0-5=-5",
-"9*0-6=-6",
-"9*0-7=-7",
-"9*0-8=-8",
-"9*0-9=-9",
-"9*0*10=0",
-"9*0*11=0",
-"9*0*12=0",
-"9*0*13=0",
-"9*0*14=0",
-"9*0*15=0",
-"9*0*16=0",
-"9*0*17=0",
-"9*0*18=0",
-"9*0*19=0",
-"9*0*20=0",
-"9*0*21=0",
-"9*0*22=0",
-"9*0*23=0",
-"9*0*24=0",
-"9*0*25=0",
-"9*0*26=0",
-"9*0*27=0",
-"9*0*28=0",
-"9*0*29=0",
-"9*0*30=0",
-"9*0*31=0",
-"9*0*32=0",
-"9*0*33=0",
-"9*0*34=0",
-"9*0*35=0",
-"9*0*36=0",
-"9*0*37=0",
-"9*0*38=0",
-"9*0*39=0",
-"9*0*40=0",
-"9*0*41=0",
-"9*0*42=0",
-"9*0*43=0",
-"9*0*44=0",
-"9*0*45=0",
-"9*0*46=0",
-"9*0*47=0",
-"9*0*48=0",
-"9*0*49=0",
-"9*0*50=0",
-"9*0*51=0",
-"9*0*52=0",
-"9*0*53=0",
-"9*0*54=0",
-"9*0*55=0",
-"9*0*56=0",
-"9*0*57=0",
-"9*0*58=0",
-"9*0*59=0",
-"9*0*60=0",
-"9*0*61=0",
-"9*0*62=0",
-"9*0*63=0",
-"9*0*64=0",
-"9*0*65=0",
-"9*0*66=0",
-"9*0*67=0",
-"9*0*68=0",
-"9*0*69=0",
-"9*0*70=0",
-"9*0*71=0",
-"9*0*72=0",
-"9*0*73=0",
-"9*0*74=0",
-"9*0*75=0",
-"9*0*76=0",
-"9*0*77=0",
-"9*0*78=0",
-"9*0*79=0",
-"9*0*80=0",
-"9*0*81=0",
-"9*0*82=0",
-"9*0*83=0",
-"9*0*84=0",
-"9*0*85=0",
-"9*0*86=0",
-"9*0*87=0",
-"9*0*88=0",
-"9*0*89=0",
-"9*0*90=0",
-"9*0*91=0",
-"9*0*92=0",
-"9*0*93=0",
-"9*0*94=0",
-"9*0*95=0",
-"9*0*96=0",
-"9*0*97=0",
-"9*0*98=0",
-"9*0*99=0",
-"9*0/10=0",
-"9*0/11=0",
-"9*0/12=0",
-"9*0/13=0",
-"9*0/14=0",
-"9*0/15=0",
-"9*0/16=0",
-"9*0/17=0",
-"9*0/18=0",
-"9*0/19=0",
-"9*0/20=0",
-"9*0/21=0",
-"9*0/22=0",
-"9*0/23=0",
-"9*0/24=0",
-"9*0/25=0",
-"9*0/26=0",
-"9*0/27=0",
-"9*0/28=0",
-"9*0/29=0",
-"9*0/30=0",
-"9*0/31=0",
-"9*0/32=0",
-"9*0/33=0",
-"9*0/34=0",
-"9*0/35=0",
-"9*0/36=0",
-"9*0/37=0",
-"9*0/38=0",
-"9*0/39=0",
-"9*0/40=0",
-"9*0/41=0",
-"9*0/42=0",
-"9*0/43=0",
-"9*0/44=0",
-"9*0/45=0",
-"9*0/46=0",
-"9*0/47=0",
-"9*0/48=0",
-"9*0/49=0",
-"9*0/50=0",
-"9*0/51=0",
-"9*0/52=0",
-"9*0/53=0",
-"9*0/54=0",
-"9*0/55=0",
-"9*0/56=0",
-"9*0/57=0",
-"9*0/58=0",
-"9*0/59=0",
-"9*0/60=0",
-"9*0/61=0",
-"9*0/62=0",
-"9*0/63=0",
-"9*0/64=0",
-"9*0/65=0",
-"9*0/66=0",
-"9*0/67=0",
-"9*0/68=0",
-"9*0/69=0",
-"9*0/70=0",
-"9*0/71=0",
-"9*0/72=0",
-"9*0/73=0",
-"9*0/74=0",
-"9*0/75=0",
-"9*0/76=0",
-"9*0/77=0",
-"9*0/78=0",
-"9*0/79=0",
-"9*0/80=0",
-"9*0/81=0",
-"9*0/82=0",
-"9*0/83=0",
-"9*0/84=0",
-"9*0/85=0",
-"9*0/86=0",
-"9*0/87=0",
-"9*0/88=0",
-"9*0/89=0",
-"9*0/90=0",
-"9*0/91=0",
-"9*0/92=0",
-"9*0/93=0",
-"9*0/94=0",
-"9*0/95=0",
-"9*0/96=0",
-"9*0/97=0",
-"9*0/98=0",
-"9*0/99=0",
-"9*10*0=0",
-"9*11*0=0",
-"9*12*0=0",
-"9*12=108",
-"9*13*0=0",
-"9*13=117",
-"9*14*0=0",
-"9*14=126",
-"9*15*0=0",
-"9*15=135",
-"9*16*0=0",
-"9*16=144",
-"9*17*0=0",
-"9*17=153",
-"9*18*0=0",
-"9*18=162",
-"9*19*0=0",
-"9*19=171",
-"9*1+1=10",
-"9*1+2=11",
-"9*1+3=12",
-"9*1+4=13",
-"9*1+5=14",
-"9*1+6=15",
-"9*1+7=16",
-"9*1+8=17",
-"9*1+9=18",
-"9*1*2=18",
-"9*1*3=27",
-"9*1*4=36",
-"9*1*5=45",
-"9*1*6=54",
-"9*1*7=63",
-"9*1*8=72",
-"9*1*9=81",
-"9*20*0=0",
-"9*20=180",
-"9*21*0=0",
-"9*21=189",
-"9*22*0=0",
-"9*22=198",
-"9*23*0=0",
-"9*23=207",
-"9*24*0=0",
-"9*24=216",
-"9*25*0=0",
-"9*25=225",
-"9*26*0=0",
-"9*26=234",
-"9*27*0=0",
-"9*27=243",
-"9*28*0=0",
-"9*28=252",
-"9*29*0=0",
-"9*29=261",
-"9*2+0=18",
-"9*2+1=19",
-"9*2+2=20",
-"9*2+3=21",
-"9*2+4=22",
-"9*2+5=23",
-"9*2+6=24",
-"9*2+7=25",
-"9*2+8=26",
-"9*2+9=27",
-"9*2-0=18",
-"9*2-10=8",
-"9*2-11=7",
-"9*2-12=6",
-"9*2-13=5",
-"9*2-14=4",
-"9*2-15=3",
-"9*2-16=2",
-"9*2-17=1",
-"9*2-18=0",
-"9*2-1=17",
-"9*2-2=16",
-"9*2-3=15",
-"9*2-4=14",
-"9*2-5=13",
-"9*2-6=12",
-"9*2-7=11",
-"9*2-8=10",
-"9*2*1=18",
-"9*2*2=36",
-"9*2*3=54",
-"9*2*4=72",
-"9*2*5=90",
-"9*2/18=1",
-"9*2/1=18",
-"9*30*0=0",
-"9*30=270",
-"9*31*0=0",
-"9*31=279",
-"9*32*0=0",
-"9*32=288",
-"9*33*0=0",
-"9*33=297",
-"9*34*0=0",
-"9*34=306",
-"9*35*0=0",
-"9*35=315",
-"9*36*0=0",
-"9*36=324",
-"9*37*0=0",
-"9*37=333",
-"9*38*0=0",
-"9*38=342",
-"9*39*0=0",
-"9*39=351",
-"9*3+0=27",
-"9*3+1=28",
-"9*3+2=29",
-"9*3+3=30",
-"9*3+4=31",
-"9*3+5=32",
-"9*3+6=33",
-"9*3+7=34",
-"9*3+8=35",
-"9*3+9=36",
-"9*3-0=27",
-"9*3-18=9",
-"9*3-19=8",
-"9*3-1=26",
-"9*3-20=7",
-"9*3-21=6",
-"9*3-22=5",
-"9*3-23=4",
-"9*3-24=3",
-"9*3-25=2",
-"9*3-26=1",
-"9*3-27=0",
-"9*3-2=25",
-"9*3-3=24",
-"9*3-4=23",
-"9*3-5=22",
-"9*3-6=21",
-"9*3-7=20",
-"9*3-8=19",
-"9*3-9=18",
-"9*3*1=27",
-"9*3*2=54",
-"9*3*3=81",
-"9*3/1=27",
-"9*3/27=1",
-"9*40*0=0",
-"9*40=360",
-"9*41*0=0",
-"9*41=369",
-"9*42*0=0",
-"9*42=378",
-"9*43*0=0",
-"9*43=387",
-"9*44*0=0",
-"9*44=396",
-"9*45*0=0",
-"9*45=405",
-"9*46*0=0",
-"9*46=414",
-"9*47*0=0",
-"9*47=423",
-"9*48*0=0",
-"9*48=432",
-"9*49*0=0",
-"9*49=441",
-"9*4+0=36",
-"9*4+1=37",
-"9*4+2=38",
-"9*4+3=39",
-"9*4+4=40",
-"9*4+5=41",
-"9*4+6=42",
-"9*4+7=43",
-"9*4+8=44",
-"9*4+9=45",
-"9*4-0=36",
-"9*4-1=35",
-"9*4-27=9",
-"9*4-28=8",
-"9*4-29=7",
-"9*4-2=34",
-"9*4-30=6",
-"9*4-31=5",
-"9*4-32=4",
-"9*4-33=3",
-"9*4-34=2",
-"9*4-35=1",
-"9*4-36=0",
-"9*4-3=33",
-"9*4-4=32",
-"9*4-5=31",
-"9*4-6=30",
-"9*4-7=29",
-"9*4-8=28",
-"9*4-9=27",
-"9*4*1=36",
-"9*4*2=72",
-"9*4/12=3",
-"9*4/18=2",
-"9*4/1=36",
-"9*4/2=18",
-"9*4/36=1",
-"9*4/3=12",
-"9*50*0=0",
-"9*50=450",
-"9*51*0=0",
-"9*51=459",
-"9*52*0=0",
-"9*52=468",
-"9*53*0=0",
-"9*53=477",
-"9*54*0=0",
-"9*54=486",
-"9*55*0=0",
-"9*55=495",
-"9*56*0=0",
-"9*56=504",
-"9*57*0=0",
-"9*57=513",
-"9*58*0=0",
-"9*58=522",
-"9*59*0=0",
-"9*59=531",
-"9*5+0=45",
-"9*5+1=46",
-"9*5+2=47",
-"9*5+3=48",
-"9*5+4=49",
-"9*5+5=50",
-"9*5+6=51",
-"9*5+7=52",
-"9*5+8=53",
-"9*5+9=54",
-"9*5-0=45",
-"9*5-1=44",
-"9*5-2=43",
-"9*5-36=9",
-"9*5-37=8",
-"9*5-38=7",
-"9*5-39=6",
-"9*5-3=42",
-"9*5-40=5",
-"9*5-41=4",
-"9*5-42=3",
-"9*5-43=2",
-"9*5-44=1",
-"9*5-45=0",
-"9*5-4=41",
-"9*5-5=40",
-"9*5-6=39",
-"9*5-7=38",
-"9*5-8=37",
-"9*5-9=36",
-"9*5*1=45",
-"9*5*2=90",
-"9*5/15=3",
-"9*5/1=45",
-"9*5/3=15",
-"9*5/45=1",
-"9*60*0=0",
-"9*60=540",
-"9*61*0=0",
-"9*61=549",
-"9*62*0=0",
-"9*62=558",
-"9*63*0=0",
-"9*63=567",
-"9*64*0=0",
-"9*64=576",
-"9*65*0=0",
-"9*65=585",
-"9*66*0=0",
-"9*66=594",
-"9*67*0=0",
-"9*67=603",
-"9*68*0=0",
-"9*68=612",
-"9*69*0=0",
-"9*69=621",
-"9*6+0=54",
-"9*6+1=55",
-"9*6+2=56",
-"9*6+3=57",
-"9*6+4=58",
-"9*6+5=59",
-"9*6+6=60",
-"9*6+7=61",
-"9*6+8=62",
-"9*6+9=63",
-"9*6-0=54",
-"9*6-1=53",
-"9*6-2=52",
-"9*6-3=51",
-"9*6-45=9",
-"9*6-46=8",
-"9*6-47=7",
-"9*6-48=6",
-"9*6-49=5",
-"9*6-4=50",
-"9*6-50=4",
-"9*6-51=3",
-"9*6-52=2",
-"9*6-53=1",
-"9*6-54=0",
-"9*6-5=49",
-"9*6-6=48",
-"9*6-7=47",
-"9*6-8=46",
-"9*6-9=45",
-"9*6*1=54",
-"9*6/18=3",
-"9*6/1=54",
-"9*6/27=2",
-"9*6/2=27",
-"9*6/3=18",
-"9*6/54=1",
-"9*70*0=0",
-"9*70=630",
-"9*71*0=0",
-"9*71=639",
-"9*72*0=0",
-"9*72=648",
-"9*73*0=0",
-"9*73=657",
-"9*74*0=0",
-"9*74=666",
-"9*75*0=0",
-"9*75=675",
-"9*76*0=0",
-"9*76=684",
-"9*77*0=0",
-"9*77=693",
-"9*78*0=0",
-"9*78=702",
-"9*79*0=0",
-"9*79=711",
-"9*7+0=63",
-"9*7+1=64",
-"9*7+2=65",
-"9*7+3=66",
-"9*7+4=67",
-"9*7+5=68",
-"9*7+6=69",
-"9*7+7=70",
-"9*7+8=71",
-"9*7+9=72",
-"9*7-0=63",
-"9*7-1=62",
-"9*7-2=61",
-"9*7-3=60",
-"9*7-4=59",
-"9*7-54=9",
-"9*7-55=8",
-"9*7-56=7",
-"9*7-57=6",
-"9*7-58=5",
-"9*7-59=4",
-"9*7-5=58",
-"9*7-60=3",
-"9*7-61=2",
-"9*7-62=1",
-"9*7-63=0",
-"9*7-6=57",
-"9*7-7=56",
-"9*7-8=55",
-"9*7-9=54",
-"9*7*1=63",
-"9*7/1=63",
-"9*7/21=3",
-"9*7/3=21",
-"9*7/63=1",
-"9*80*0=0",
-"9*80=720",
-"9*81*0=0",
-"9*81=729",
-"9*82*0=0",
-"9*82=738",
-"9*83*0=0",
-"9*83=747",
-"9*84*0=0",
-"9*84=756",
-"9*85*0=0",
-"9*85=765",
-"9*86*0=0",
-"9*86=774",
-"9*87*0=0",
-"9*87=783",
-"9*88*0=0",
-"9*88=792",
-"9*89*0=0",
-"9*89=801",
-"9*8+0=72",
-"9*8+1=73",
-"9*8+2=74",
-"9*8+3=75",
-"9*8+4=76",
-"9*8+5=77",
-"9*8+6=78",
-"9*8+7=79",
-"9*8+8=80",
-"9*8+9=81",
-"9*8-0=72",
-"9*8-1=71",
-"9*8-2=70",
-"9*8-3=69",
-"9*8-4=68",
-"9*8-5=67",
-"9*8-63=9",
-"9*8-64=8",
-"9*8-65=7",
-"9*8-66=6",
-"9*8-67=5",
-"9*8-68=4",
-"9*8-69=3",
-"9*8-6=66",
-"9*8-70=2",
-"9*8-71=1",
-"9*8-72=0",
-"9*8-7=65",
-"9*8-8=64",
-"9*8-9=63",
-"9*8*1=72",
-"9*8/12=6",
-"9*8/18=4",
-"9*8/1=72",
-"9*8/24=3",
-"9*8/2=36",
-"9*8/36=2",
-"9*8/3=24",
-"9*8/4=18",
-"9*8/6=12",
-"9*8/72=1",
-"9*90*0=0",
-"9*90=810",
-"9*91*0=0",
-"9*91=819",
-"9*92*0=0",
-"9*92=828",
-"9*93*0=0",
-"9*93=837",
-"9*94*0=0",
-"9*94=846",
-"9*95*0=0",
-"9*95=855",
-"9*96*0=0",
-"9*96=864",
-"9*97*0=0",
-"9*97=873",
-"9*98*0=0",
-"9*98=882",
-"9*99*0=0",
-"9*99=891",
-"9*9+0=81",
-"9*9+1=82",
-"9*9+2=83",
-"9*9+3=84",
-"9*9+4=85",
-"9*9+5=86",
-"9*9+6=87",
-"9*9+7=88",
-"9*9+8=89",
-"9*9+9=90",
-"9*9-0=81",
-"9*9-1=80",
-"9*9-2=79",
-"9*9-3=78",
-"9*9-4=77",
-"9*9-5=76",
-"9*9-6=75",
-"9*9-72=9",
-"9*9-73=8",
-"9*9-74=7",
-"9*9-75=6",
-"9*9-76=5",
-"9*9-77=4",
-"9*9-78=3",
-"9*9-79=2",
-"9*9-7=74",
-"9*9-80=1",
-"9*9-81=0",
-"9*9-8=73",
-"9*9-9=72",
-"9*9*1=81",
-"9*9/1=81",
-"9*9/27=3",
-"9*9/3=27",
-"9*9/81=1",
-"9/10*0=0",
-"9/11*0=0",
-"9/12*0=0",
-"9/12*4=3",
-"9/12*8=6",
-"9/13*0=0",
-"9/14*0=0",
-"9/15*0=0",
-"9/15*5=3",
-"9/16*0=0",
-"9/17*0=0",
-"9/18*0=0",
-"9/18*2=1",
-"9/18*4=2",
-"9/18*6=3",
-"9/18*8=4",
-"9/19*0=0",
-"9/1+1=10",
-"9/1+2=11",
-"9/1+3=12",
-"9/1+4=13",
-"9/1+5=14",
-"9/1+6=15",
-"9/1+7=16",
-"9/1+8=17",
-"9/1+9=18",
-"9/1*2=18",
-"9/1*3=27",
-"9/1*4=36",
-"9/1*5=45",
-"9/1*6=54",
-"9/1*7=63",
-"9/1*8=72",
-"9/1*9=81",
-"9/20*0=0",
-"9/21*0=0",
-"9/21*7=3",
-"9/22*0=0",
-"9/23*0=0",
-"9/24*0=0",
-"9/24*8=3",
-"9/25*0=0",
-"9/26*0=0",
-"9/27*0=0",
-"9/27*3=1",
-"9/27*6=2",
-"9/27*9=3",
-"9/28*0=0",
-"9/29*0=0",
-"9/2*4=18",
-"9/2*6=27",
-"9/2*8=36",
-"9/30*0=0",
-"9/31*0=0",
-"9/32*0=0",
-"9/33*0=0",
-"9/34*0=0",
-"9/35*0=0",
-"9/36*0=0",
-"9/36*4=1",
-"9/36*8=2",
-"9/37*0=0",
-"9/38*0=0",
-"9/39*0=0",
-"9/3+7=10",
-"9/3+8=11",
-"9/3+9=12",
-"9/3-4=-1",
-"9/3-5=-2",
-"9/3-6=-3",
-"9/3-7=-4",
-"9/3-8=-5",
-"9/3-9=-6",
-"9/3*4=12",
-"9/3*5=15",
-"9/3*6=18",
-"9/3*7=21",
-"9/3*8=24",
-"9/3*9=27",
-"9/40*0=0",
-"9/41*0=0",
-"9/42*0=0",
-"9/43*0=0",
-"9/44*0=0",
-"9/45*0=0",
-"9/45*5=1",
-"9/46*0=0",
-"9/47*0=0",
-"9/48*0=0",
-"9/49*0=0",
-"9/4*8=18",
-"9/50*0=0",
-"9/51*0=0",
-"9/52*0=0",
-"9/53*0=0",
-"9/54*0=0",
-"9/54*6=1",
-"9/55*0=0",
-"9/56*0=0",
-"9/57*0=0",
-"9/58*0=0",
-"9/59*0=0",
-"9/60*0=0",
-"9/61*0=0",
-"9/62*0=0",
-"9/63*0=0",
-"9/63*7=1",
-"9/64*0=0",
-"9/65*0=0",
-"9/66*0=0",
-"9/67*0=0",
-"9/68*0=0",
-"9/69*0=0",
-"9/6*8=12",
-"9/70*0=0",
-"9/71*0=0",
-"9/72*0=0",
-"9/72*8=1",
-"9/73*0=0",
-"9/74*0=0",
-"9/75*0=0",
-"9/76*0=0",
-"9/77*0=0",
-"9/78*0=0",
-"9/79*0=0",
-"9/80*0=0",
-"9/81*0=0",
-"9/81*9=1",
-"9/82*0=0",
-"9/83*0=0",
-"9/84*0=0",
-"9/85*0=0",
-"9/86*0=0",
-"9/87*0=0",
-"9/88*0=0",
-"9/89*0=0",
-"9/90*0=0",
-"9/91*0=0",
-"9/92*0=0",
-"9/93*0=0",
-"9/94*0=0",
-"9/95*0=0",
-"9/96*0=0",
-"9/97*0=0",
-"9/98*0=0",
-"9/99*0=0",
-"9/9+9=10",
-"9/9-2=-1",
-"9/9-3=-2",
-"9/9-4=-3",
-"9/9-5=-4",
-"9/9-6=-5",
-"9/9-7=-6",
-"9/9-8=-7",
-"9/9-9=-8"]
+EQUATIONSFILE = "equations3.txt"  #shipped next to this file in the task bundle
+
+#the file is memory mapped read-only, so executors on a node share the one copy in the page cache while reading it
+def loadEquations() -> "list[str]":
+    f = open(os.path.join(os.path.dirname(os.path.abspath(__file__)), EQUATIONSFILE), "rb")
+    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    equations = [line.strip().decode() for line in iter(data.readline, b"") if line.strip()]
+    data.close()
+    f.close()
+    return equations
 
 def generatePossibleResHelper(curRes: list, curIndex: int, totalCollection: list):
     for x in POSSIBLE_RES:
@@ -70860,43 +217,57 @@ def manualTryWord(guess: "list"):
 
 
 #main
-wordsAsStr = equationsAsStr
-print("loaded equations ("+str(len(wordsAsStr))+")")
-#preprocess
-wordsAsNums = [wordToNums(w) for w in wordsAsStr]
-possibleRes = generatePossibleRes()
-print("done preprocessing")
+wordsAsNums = None
+possibleRes = None
 
-#get input
-f = open("in.txt", "r")
-iteratedWordAsStr = f.read().strip()
-f.close()
-iteratedWordAsNums = wordToNums(iteratedWordAsStr)
+#done once per worker when run by nodeWorker.py, instead of once per subtask
+def setup():
+    global wordsAsNums, possibleRes
+    wordsAsStr = loadEquations()
+    print("loaded equations ("+str(len(wordsAsStr))+")")
+    #preprocess
+    wordsAsNums = [wordToNums(w) for w in wordsAsStr]
+    possibleRes = generatePossibleRes()
+    print("done preprocessing")
 
-#process
-totalScore = 0  #bascially stores the average number of words removed considering each possibility
-numMatchRes = [0]*len(possibleRes)
-for w2 in tqdm.tqdm(wordsAsNums, file=sys.stdout):
-    res = tryWord(iteratedWordAsNums, w2)
-    numMatchRes[resToIndex(res, 0)] += 1
+def process(inputData: str) -> str:
+    iteratedWordAsStr = inputData.strip()
+    iteratedWordAsNums = wordToNums(iteratedWordAsStr)
 
-for j in tqdm.tqdm(range(len(possibleRes)), file=sys.stdout):
-    #if we guessed a word w2 and had res result, count how many words would we eliminate from the list
-    newKnownLetters = [None]*WORD_LEN
-    for i in range(WORD_LEN):
-        newKnownLetters[i] = [None]*NUM_LETTERS
-    newKnownNumLetters = [-1]*NUM_LETTERS
-    newKnownIsExactNum = [0]*NUM_LETTERS
-    
-    if(updateBasedOnRes(newKnownLetters, newKnownNumLetters, newKnownIsExactNum, iteratedWordAsNums, possibleRes[j], False)):
-        numEliminated = 0
-        for k in range(len(wordsAsNums)):
-            if(not isValidWord(newKnownLetters, newKnownNumLetters, newKnownIsExactNum, wordsAsNums[k])):
-                numEliminated += 1
-        totalScore += numEliminated * numMatchRes[j]
+    #process
+    totalScore = 0  #bascially stores the average number of words removed considering each possibility
+    numMatchRes = [0]*len(possibleRes)
+    for w2 in tqdm.tqdm(wordsAsNums, file=sys.stdout):
+        res = tryWord(iteratedWordAsNums, w2)
+        numMatchRes[resToIndex(res, 0)] += 1
+
+    for j in tqdm.tqdm(range(len(possibleRes)), file=sys.stdout):
+        #if we guessed a word w2 and had res result, count how many words would we eliminate from the list
+        newKnownLetters = [None]*WORD_LEN
+        for i in range(WORD_LEN):
+            newKnownLetters[i] = [None]*NUM_LETTERS
+        newKnownNumLetters = [-1]*NUM_LETTERS
+        newKnownIsExactNum = [0]*NUM_LETTERS
+        
+        if(updateBasedOnRes(newKnownLetters, newKnownNumLetters, newKnownIsExactNum, iteratedWordAsNums, possibleRes[j], False)):
+            numEliminated = 0
+            for k in range(len(wordsAsNums)):
+                if(not isValidWord(newKnownLetters, newKnownNumLetters, newKnownIsExactNum, wordsAsNums[k])):
+                    numEliminated += 1
+            totalScore += numEliminated * numMatchRes[j]
+    return str(totalScore)
+
+if(__name__ == "__main__"):
+    setup()
+
+    #get input
+    f = open("in.txt", "r")
+    inputData = f.read()
+    f.close()
 
+    outputData = process(inputData)
 
-#write output
-f = open("out.txt", "w")
-f.write(totalScore)
-f.close()
+    #write output
+    f = open("out.txt", "w")
+    f.write(outputData)
+    f.close()
@@ -0,0 +1,81 @@
+import os
+import sys
+import inspect
+import cProfile
+
+#the processor contract, used by nodeWorker.py and importable by processors (node.py puts this folder on PYTHONPATH)
+#a processor defines any of:
+#   setup(shared)                       called once per worker process, shared is the task's shared input (bytes, None if there is none)
+#                                       the parameter is optional
+#   process(inputData) -> output        one subtask
+#   process_batch(inputs) -> outputs    several subtasks at once, in the same order, the server decides how many
+#outputs can be str, bytes or anything that can be str()'d
+#processors that define neither keep working the old way, reading in.txt and writing out.txt
+
+
+
+def sharedInput() -> bytes:
+    path = os.environ.get("DCSHAREDINPUT")
+    if(path is None):
+        return None
+    f = open(path, "rb")
+    data = f.read()
+    f.close()
+    return data
+
+def callSetup(processor):
+    setup = getattr(processor, "setup", None)
+    if(setup is None):
+        return
+    if(len(inspect.signature(setup).parameters) > 0):
+        setup(sharedInput())
+    else:
+        setup()
+
+def toBytes(output) -> bytes:
+    if(output is None):
+        return bytes()
+    if(isinstance(output, (bytes, bytearray))):
+        return bytes(output)
+    return str(output).encode()
+
+def processBatch(processor, inputs:"list[str]") -> "list[bytes]":
+    if(hasattr(processor, "process_batch")):
+        outputs = list(processor.process_batch(inputs))
+        assert len(outputs) == len(inputs), "process_batch returned "+str(len(outputs))+" outputs for "+str(len(inputs))+" inputs"
+    else:
+        outputs = [processor.process(inputData) for inputData in inputs]
+    return [toBytes(output) for output in outputs]
+
+#lets an sdk processor also run on its own with in.txt/out.txt, for testing it locally:
+#if(__name__ == "__main__"):
+#    processorSDK.runScript(sys.modules[__name__])
+def runScript(processor):
+    callSetup(processor)
+    f = open("in.txt", "r")
+    inputData = f.read()
+    f.close()
+    outputData = processBatch(processor, [inputData])[0]
+    f = open("out.txt", "wb")
+    f.write(outputData)
+    f.close()
+
+#runs a script processor under cProfile for node.py, unlike python -m cProfile this keeps the processor's exit status
+def profileScript(processorFile:str, profilePath:str):
+    sys.argv = [processorFile]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(processorFile)))
+    f = open(processorFile, "rb")
+    code = compile(f.read(), processorFile, "exec")
+    f.close()
+    profiler = cProfile.Profile()
+    try:
+        profiler.runctx(code, {"__name__": "__main__", "__file__": processorFile, "__builtins__": __builtins__}, None)
+    finally:
+        profiler.dump_stats(profilePath)
+
+
+
+#usage: python -m processorSDK --profile <profile file> <processor file>
+if(__name__ == "__main__"):
+    assert len(sys.argv) == 4 and sys.argv[1] == "--profile", "usage: python -m processorSDK --profile <profile file> <processor file>"
+    profileScript(sys.argv[3], sys.argv[2])
@@ -1,5 +1,9 @@
 import os, sys
 import queue
+import collections
+import itertools
+import heapq
+import shutil
 import typing
 import colorama
 import threading
@@ -7,9 +11,17 @@ import socket
 import time
 import uuid
 import datetime
-
-#error logging
-sys.stderr = open('error.log', 'w')
+import http.server
+import struct
+import json
+import math
+import hashlib
+import pstats
+import marshal
+import base64
+import io
+import re
+import urllib.parse
 
 serverStartTime = time.time()
 
@@ -34,6 +46,9 @@ COMMAND_GETSUBTASK = 11
 COMMAND_SUBMITSUBTASK = 12
 COMMAND_ISSUBTASKDONE = 13
 COMMAND_SUBMITSUBTASKOUTPUT = 14
+COMMAND_SUBMITSUBTASKOUTPUTS = 15  #several results in one packet, see plan.txt
+COMMAND_GETSUBTASKS = 16  #several subtasks in one packet, see plan.txt
+COMMAND_GETTASKEXCLUDING = 17  #like GETTASK, but skips tasks the node can't run, see plan.txt
 #responses
 RESPONSE_NODE = 83
 RESPONSE_CLIENT = 98
@@ -46,17 +61,88 @@ RESPONSE_NOTENOUGHSPACE = 14
 RESPONSE_NONEWRESULTS = 15
 RESPONSE_SENDAUUID = 16  #algorithm uuid
 RESPONSE_NOAUUID = 17
+RESPONSE_SENDTASKOPTIONS = 18  #json, see plan.txt
+RESPONSE_SENDSHAREDINPUT = 19  #input common to every subtask of the task
+RESPONSE_FAILED = 20  #the subtask was dead-lettered, the data is why
+
+#log levels
+LOG_ERROR = 0
+LOG_INFO = 1
+LOG_VERBOSE = 2
+LOG_SUBTASK = 3  #per-subtask events, these are sampled
 
 MAXSUBTASKS = 10  #max stored in server memory per client
+MAXBATCHSIZE = 64  #max subtasks given to a node at once
+MAXATTEMPTS = 5  #subtasks lost with a node or timed out this many times are dead-lettered instead of queued again
+RETRYBACKOFF = 1  #seconds before a failed subtask is queued again, doubled after every attempt
+MAXRETRYBACKOFF = 60
+RETRYELSEWHEREWAIT = 5  #seconds a due retry waits for another node before the one it failed on may take it again
+PHITHRESHOLD = 8  #nodes are considered dead past this suspicion level, see FailureDetector
+ACCEPTABLEHEARTBEATPAUSE = 1  #seconds of silence on top of the usual gap that are always tolerated
+MINHEARTBEATSTDDEV = 0.1  #keeps very regular nodes from being suspected after a tiny delay
+MINHEARTBEATS = 5  #gaps seen before a node can be suspected
+HEARTBEATWINDOW = 100  #most recent gaps used for the estimate
+FAILUREDETECTORINTERVAL = 0.1
+KEEPALIVEIDLE = 5  #tcp keepalive, in seconds, so dead peers are noticed by the kernel as well
+KEEPALIVEINTERVAL = 1
+KEEPALIVECOUNT = 3
 SERVERFOLDER = "serverFiles"
-VERBOSE = True
+LOGLEVEL = LOG_SUBTASK
+SUBTASKLOGSAMPLERATE = 1  #only display 1 in every n per-subtask events
+MAXPENDINGLOGLINES = 1000  #oldest lines are dropped if the ui thread falls behind
+HEADLESS = "--headless" in sys.argv or not sys.stdout.isatty()  #no redraw loop, log lines are printed as they come
+METRICSHOST = "127.0.0.1"  #metrics are only served locally
+METRICSPORT = 8112
+SLOWTRACEQUANTILE = 0.99  #completed subtasks slower than this quantile have their trace exported
+SLOWTRACEMINSAMPLES = 100  #don't export outliers until the quantile is meaningful
+SLOWTRACEFILE = os.path.join(SERVERFOLDER, "slowTraces.jsonl")
+EVENTLOGFILE = os.path.join(SERVERFOLDER, "events.bin")  #replay with analyzeEventLog.py
+EVENTLOGFLUSHINTERVAL = 1
+ARTIFACTFOLDER = os.path.join(SERVERFOLDER, "artifacts")  #processors by sha256, shared by every client that submits the same one
+ARTIFACTCACHEMAXBYTES = 64 * 1024**2  #processors kept in memory, least recently sent are dropped past this
+SENDFILEMINBYTES = 1024**2  #bigger artifacts aren't kept in memory and are sent straight from disk with sendfile
+PROFILEFOLDER = os.path.join(SERVERFOLDER, "profiles")  #merged processor profiles per task, <task>.pstats and <task>.collapsed
+PROFILEWRITEINTERVAL = 30  #merged profiles of running tasks are rewritten at most this often
+MAXSTACKDEPTH = 64  #deeper call chains are cut off in collapsed stacks
+MINSTACKFRACTION = 1e-4  #collapsed stacks below this fraction of the total time are dropped, keeps the number of paths bounded
+SAMPLERINTERVAL = 0.01  #default seconds between samples of the server's threads, see ThreadSampler
+SAMPLERFOLDER = os.path.join(SERVERFOLDER, "serverProfiles")  #collapsed stacks of the server's threads, one file per sampling run
+USAGEFIELDS = ["cpuUser", "cpuSystem", "wall", "maxRSS", "bytesIn", "bytesOut"]  #processor resource usage nodes add to the output info
+
+#event log, see analyzeEventLog.py for the reader
+EVENTLOGMAGIC = b"DCEV"
+EVENTLOGVERSION = 1
+EVENTHEADER = struct.Struct(">BdI16s16sI")  #type, time, size, connection id, subtask uuid, length of extra data
+EVENT_START = 0  #server started, extra is the server ip
+EVENT_CONNECT = 1  #extra is the peer address
+EVENT_REGISTERCLIENT = 2
+EVENT_REGISTERNODE = 3
+EVENT_DISCONNECT = 4
+EVENT_SUBMIT = 5  #size is the input size
+EVENT_DISPATCH = 6
+EVENT_COMPLETE = 7  #size is the output size
+EVENT_DELIVER = 8
+EVENT_REQUEUE = 9  #node disconnected while processing the subtask, or the subtask timed out
 
+COMMANDNAMES = {
+    COMMAND_PING: "ping",
+    COMMAND_PONG: "pong",
+    COMMAND_EXIT: "exit",
+    COMMAND_GETTASK: "gettask",
+    COMMAND_GETSUBTASK: "getsubtask",
+    COMMAND_SUBMITSUBTASK: "submitsubtask",
+    COMMAND_ISSUBTASKDONE: "issubtaskdone",
+    COMMAND_SUBMITSUBTASKOUTPUT: "submitsubtaskoutput",
+    COMMAND_SUBMITSUBTASKOUTPUTS: "submitsubtaskoutputs",
+    COMMAND_GETSUBTASKS: "getsubtasks",
+    COMMAND_GETTASKEXCLUDING: "gettaskexcluding",
+}
 
 
-colorama.init()
 
 clients : "list[socket.socket]" = []
 nodes : "list[socket.socket]" = []
+nodeDetectors : "dict[socket._RetAddress, FailureDetector]" = dict()
 isServerShuttingDown = False
 
 #dicts for clients (subtask UUID)
@@ -64,18 +150,350 @@ processingQueues : "dict[socket._RetAddress, queue.Queue[uuid.UUID]]" = dict()
 resultQueues : "dict[socket._RetAddress, queue.Queue[uuid.UUID]]" = dict()
 numTasksSubmitted : "dict[socket._RetAddress, int]" = dict()
 numTasksDone : "dict[socket._RetAddress, int]" = dict()
+resultQueuesMutex = threading.Lock()  #results can be added from node threads while the client's thread unregisters it
 
 #dicts for nodes
 nodeHasTask : "dict[socket._RetAddress, bool]" = dict()
 nodeSubTasks : "dict[socket._RetAddress, list[uuid.UUID]]" = dict()
+nodeTaskAddr : "dict[socket._RetAddress, socket._RetAddress]" = dict()  #client of the task each node last took subtasks from
 
 #client UUID
 addrToUUID : "dict[socket._RetAddress, uuid.UUID]" = dict()
 UUIDToAddr : "dict[uuid.UUID, socket._RetAddress]" = dict()
 UUIDToAUUID : "dict[uuid.UUID, uuid.UUID]" = dict()
+UUIDToTaskOptions : "dict[uuid.UUID, dict]" = dict()
+UUIDToProcessorHash : "dict[uuid.UUID, str]" = dict()  #sha256 of the processor, nodes cache processors by it
+UUIDToSharedInputHash : "dict[uuid.UUID, str]" = dict()  #only for tasks with a shared input, stored like processors
 
 #subtask UUID
 UUIDToInOutData : "dict[uuid.UUID, typing.Tuple[bytes, bytes]]" = dict()
+subtaskAttempts : "dict[uuid.UUID, int]" = dict()  #failed attempts so far, only for subtasks that failed at least once
+failedSubtasks : "set[uuid.UUID]" = set()  #dead-lettered, their output is why they failed
+retryHeap : "list[typing.Tuple[float, int, uuid.UUID]]" = []  #(time it can be queued again, tiebreaker, subtask uuid)
+retryCounter = itertools.count()
+retryMutex = threading.Lock()
+numRetrying : "dict[socket._RetAddress, int]" = dict()  #subtasks per client in retryHeap, they count towards MAXSUBTASKS
+subtaskLastNode : "dict[uuid.UUID, typing.Tuple[str, float]]" = dict()  #(host of the node the last attempt failed on, until when it should go elsewhere)
+
+#processor resource usage per task and per node, summed except maxRSS which is the peak
+taskUsage : "dict[uuid.UUID, dict[str, float]]" = dict()
+nodeUsage : "dict[socket._RetAddress, dict[str, float]]" = dict()
+usageMutex = threading.Lock()
+
+#profiles of sampled subtasks, merged per task
+taskProfiles : "dict[uuid.UUID, pstats.Stats]" = dict()
+profileWriteTimes : "dict[uuid.UUID, float]" = dict()
+profileMutex = threading.Lock()
+profileWriteMutex = threading.Lock()  #so an older snapshot is never written over a newer one
+
+#subtask UUID -> timestamps (server clock) of each point in its life
+subtaskTraces : "dict[uuid.UUID, dict[str, typing.Any]]" = dict()
+
+#packed events waiting for the event log writer thread
+pendingEvents : "collections.deque[bytes]" = collections.deque()
+eventLogEnabled = False
+
+#metrics, keyed by (name, labels)
+metricCounters : "dict[typing.Tuple[str, str], float]" = collections.defaultdict(float)
+metricsMutex = threading.Lock()
+#the command currently being handled by each connection thread, used to label byte counts
+connectionState = threading.local()
+
+def incrementMetric(name:str, amount:float = 1, labels:str = ""):
+    with metricsMutex:
+        metricCounters[(name, labels)] += amount
+
+def addrLabel(key:str, addr) -> str:
+    if(type(addr) == tuple):
+        addr = str(addr[0])+":"+str(addr[1])
+    return key+"=\""+str(addr)+"\""
+
+def logEvent(eventType:int, subtaskUUID:uuid.UUID = None, size:int = 0, extra:str = ""):
+    if(not eventLogEnabled):
+        return
+    connectionID = getattr(connectionState, "connectionID", None)
+    extraBytes = extra.encode()
+    pendingEvents.append(EVENTHEADER.pack(eventType, time.time(), size, connectionID.bytes if connectionID else bytes(16), subtaskUUID.bytes if subtaskUUID else bytes(16), len(extraBytes)) + extraBytes)
+
+#writes events in batches so the connection threads never wait on the disk
+def startEventLogWriter():
+    f = open(EVENTLOGFILE, "ab")
+    if(f.tell() == 0):
+        f.write(EVENTLOGMAGIC + EVENTLOGVERSION.to_bytes(2, "big"))
+    while True:
+        events = []
+        while True:
+            try:
+                events.append(pendingEvents.popleft())
+            except IndexError:
+                break
+        if(len(events) > 0):
+            f.write(b"".join(events))
+            f.flush()
+        elif(isServerShuttingDown):
+            break
+        time.sleep(EVENTLOGFLUSHINTERVAL)
+    f.close()
+
+#log-linear buckets in the style of HdrHistogram, relative error is at most 1/2^(SUBBUCKETBITS-1)
+class LatencyHistogram:
+    SUBBUCKETBITS = 7
+    SUBBUCKETHALF = 1 << (SUBBUCKETBITS - 1)
+
+    def __init__(self):
+        self.counts : "dict[int, int]" = dict()
+        self.count = 0
+        self.total = 0.0
+        self.mutex = threading.Lock()
+
+    def record(self, seconds:float):
+        value = max(int(seconds * 1e6), 0)  #microseconds
+        magnitude = max(value.bit_length() - LatencyHistogram.SUBBUCKETBITS, 0)
+        index = magnitude * LatencyHistogram.SUBBUCKETHALF + (value >> magnitude)
+        with self.mutex:
+            self.counts[index] = self.counts.get(index, 0) + 1
+            self.count += 1
+            self.total += max(seconds, 0)
+
+    @staticmethod
+    def _bucketValue(index:int) -> float:
+        if(index < 2 * LatencyHistogram.SUBBUCKETHALF):
+            return index / 1e6
+        magnitude = index // LatencyHistogram.SUBBUCKETHALF - 1
+        subBucket = index - magnitude * LatencyHistogram.SUBBUCKETHALF
+        return ((subBucket << magnitude) + (1 << magnitude) - 1) / 1e6  #highest value in the bucket
+
+    def quantile(self, q:float) -> float:
+        with self.mutex:
+            counts = sorted(self.counts.items())
+            count = self.count
+        if(count == 0):
+            return math.nan
+        target = max(math.ceil(q * count), 1)
+        seen = 0
+        for index, n in counts:
+            seen += n
+            if(seen >= target):
+                return LatencyHistogram._bucketValue(index)
+        return LatencyHistogram._bucketValue(counts[-1][0])
+
+#(phase, start point, end point)
+TRACEPHASES = [
+    ("submit", "submit", "enqueue"),  #client to server transfer
+    ("queue", "enqueue", "dispatch"),
+    ("dispatch", "dispatch", "nodeStart"),  #transfer to node and waiting on the node
+    ("compute", "nodeStart", "processEnd"),
+    ("uploadwait", "processEnd", "upload"),
+    ("upload", "upload", "complete"),  #node to server transfer
+    ("delivery", "complete", "delivered"),  #waiting for the client to collect the result
+    ("total", "submit", "delivered"),
+]
+phaseHistograms = {phase: LatencyHistogram() for phase, _, _ in TRACEPHASES}
+slowTraceMutex = threading.Lock()
+
+def addTracePoint(subtaskUUID:uuid.UUID, point:str, value = None):
+    trace = subtaskTraces.get(subtaskUUID)
+    if(trace is not None):
+        trace[point] = time.time() if value is None else value
+
+def finishTrace(subtaskUUID:uuid.UUID):
+    trace = subtaskTraces.pop(subtaskUUID, None)
+    if(trace is None):
+        return
+    phases = dict()
+    for phase, start, end in TRACEPHASES:
+        if(start in trace and end in trace):
+            phases[phase] = trace[end] - trace[start]
+            phaseHistograms[phase].record(phases[phase])
+    #export outliers so they can be looked at individually
+    totalHistogram = phaseHistograms["total"]
+    if("total" in phases and totalHistogram.count >= SLOWTRACEMINSAMPLES and phases["total"] >= totalHistogram.quantile(SLOWTRACEQUANTILE)):
+        trace["subtask"] = str(subtaskUUID)
+        trace["phases"] = phases
+        with slowTraceMutex:
+            f = open(SLOWTRACEFILE, "a")
+            f.write(json.dumps(trace)+"\n")
+            f.close()
+
+#lets pstats.Stats load a stats dict that was sent by a node
+class ReceivedProfile:
+    def __init__(self, stats:dict):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+#the marshaled stats of cProfile: {(file, line, name): (primitive calls, calls, self time, cumulative time, {caller: (4 numbers)})}
+def isProfileStats(stats) -> bool:
+    def isFunc(func) -> bool:
+        return type(func) == tuple and len(func) == 3 and type(func[0]) == str and type(func[1]) == int and type(func[2]) == str
+    def isNumbers(values, count:int) -> bool:
+        return type(values) == tuple and len(values) == count and all(type(v) in (int, float) for v in values)
+    if(type(stats) != dict or len(stats) == 0):
+        return False
+    for func, stat in stats.items():
+        if(not isFunc(func) or type(stat) != tuple or len(stat) != 5 or not isNumbers(stat[:4], 4) or type(stat[4]) != dict):
+            return False
+        for caller, edge in stat[4].items():
+            if(not isFunc(caller) or not isNumbers(edge, 4)):
+                return False
+    return True
+
+#profiles come from nodes, so nothing in them may take down the node's connection thread
+def mergeProfile(taskUUID:uuid.UUID, nodeAddr, profileData:str):
+    try:
+        stats = marshal.loads(base64.b64decode(profileData))
+        assert isProfileStats(stats), "not profile stats"
+        profile = ReceivedProfile(stats)
+        with profileMutex:
+            if(taskUUID in taskProfiles):
+                taskProfiles[taskUUID].add(pstats.Stats(profile, stream=io.StringIO()))
+            else:
+                taskProfiles[taskUUID] = pstats.Stats(profile, stream=io.StringIO())  #pstats prints its errors
+                profileWriteTimes[taskUUID] = 0
+            due = time.time() - profileWriteTimes[taskUUID] >= PROFILEWRITEINTERVAL
+            if(due):
+                profileWriteTimes[taskUUID] = time.time()
+    except Exception as e:
+        addLineToDisplay(str(nodeAddr)+": ignoring invalid profile: "+repr(e), LOG_ERROR)
+        return
+    incrementMetric("dc_profiles_merged_total", 1, addrLabel("node", nodeAddr))
+    if(due):
+        threading.Thread(None, writeProfile, "ProfileWriter", [taskUUID], daemon=True).start()
+
+def writeProfile(taskUUID:uuid.UUID):
+    try:
+        with profileWriteMutex:
+            with profileMutex:
+                profile = taskProfiles.get(taskUUID)
+                if(profile is None):
+                    return
+                profileWriteTimes[taskUUID] = time.time()
+                stats = dict(profile.stats)  #merging replaces entries instead of changing them, so a shallow copy is a snapshot
+            if(not os.path.isdir(PROFILEFOLDER)):
+                os.makedirs(PROFILEFOLDER, exist_ok=True)
+            f = open(os.path.join(PROFILEFOLDER, str(taskUUID)+".pstats"), "wb")
+            marshal.dump(stats, f)  #the format of pstats.Stats.dump_stats
+            f.close()
+            stacks = collapsedStacks(stats)
+            writeCollapsedStacks(os.path.join(PROFILEFOLDER, str(taskUUID)+".collapsed"), {stack: round(seconds * 1e6) for stack, seconds in stacks.items()})
+    except Exception as e:
+        addLineToDisplay(str(taskUUID)+": could not write profile: "+repr(e), LOG_ERROR)
+
+#one "frame;frame;frame count" line per stack, the input of flamegraph.pl and speedscope
+def renderCollapsedStacks(stacks:"dict[str, int]") -> str:
+    return "".join(stack+" "+str(count)+"\n" for stack, count in sorted(stacks.items()) if count > 0)
+
+def writeCollapsedStacks(path:str, stacks:"dict[str, int]"):
+    f = open(path, "w")
+    f.write(renderCollapsedStacks(stacks))
+    f.close()
+
+def profileFrameName(func:typing.Tuple[str, int, str]) -> str:
+    fileName, line, name = func
+    if(fileName == "~"):
+        return name.replace(";", ",")  #builtins have no file
+    return (name+" ("+os.path.basename(fileName)+":"+str(line)+")").replace(";", ",")
+
+#cProfile only records caller/callee pairs, so stacks are rebuilt by walking down from the entry points
+#and giving each call path a share of a function's time in proportion to the time it was called for from there
+def collapsedStacks(stats:dict) -> "dict[str, float]":
+    callees : "dict[tuple, dict[tuple, tuple]]" = collections.defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge
+    stacks : "dict[str, float]" = collections.defaultdict(float)
+    roots = [func for func, (_, _, _, _, callers) in stats.items() if len(callers) == 0]
+    minTime = max(1e-6, MINSTACKFRACTION * sum(stats[func][3] for func in roots))
+    def walk(func, stack:"list[str]", onStack:"set[tuple]", share:float):
+        _, _, selfTime, _, _ = stats[func]
+        stack = stack + [profileFrameName(func)]
+        stacks[";".join(stack)] += selfTime * share
+        if(len(stack) >= MAXSTACKDEPTH):
+            return
+        for callee, edge in callees[func].items():
+            calleeTime = stats[callee][3]
+            edgeTime = edge[3] if type(edge) == tuple else 0  #(calls, primitive calls, self time, cumulative time)
+            #recursion is already counted in the outer call, paths under minTime are dropped since they wouldn't show anyway
+            if(callee in onStack or calleeTime <= 0 or share * edgeTime < minTime):
+                continue
+            walk(callee, stack, onStack | {callee}, share * edgeTime / calleeTime)
+    for func in roots:
+        walk(func, [], {func}, 1)
+    return stacks
+
+#samples the stacks of every server thread, started and stopped at runtime through the metrics server
+#threads are grouped by name without their counter, so all connection threads of a kind add up
+class ThreadSampler:
+    def __init__(self):
+        self.stacks : "dict[str, int]" = collections.defaultdict(int)
+        self.numSamples = 0
+        self.startTime = 0.0
+        self.thread : threading.Thread = None
+        self.stopEvent = threading.Event()
+        self.mutex = threading.Lock()  #for starting and stopping
+        self.stacksMutex = threading.Lock()
+
+    def isRunning(self) -> bool:
+        return self.thread is not None
+
+    #returns False if it was already running
+    def start(self, interval:float) -> bool:
+        with self.mutex:
+            if(self.thread is not None):
+                return False
+            self.stacks = collections.defaultdict(int)
+            self.numSamples = 0
+            self.startTime = time.time()
+            self.stopEvent.clear()
+            self.thread = threading.Thread(None, self.run, "Sampler-Thread", [interval], daemon=True)
+            self.thread.start()
+        addLineToDisplay("sampler: started, one sample every "+str(interval)+"s")
+        return True
+
+    #returns the path of the written stacks, None if it wasn't running
+    def stop(self) -> str:
+        with self.mutex:
+            if(self.thread is None):
+                return None
+            self.stopEvent.set()
+            self.thread.join()
+            self.thread = None
+            if(not os.path.isdir(SAMPLERFOLDER)):
+                os.makedirs(SAMPLERFOLDER, exist_ok=True)
+            path = os.path.join(SAMPLERFOLDER, datetime.datetime.fromtimestamp(self.startTime).strftime("%Y%m%d-%H%M%S")+".collapsed")
+            writeCollapsedStacks(path, self.stacks)
+        addLineToDisplay("sampler: stopped after "+str(self.numSamples)+" samples, wrote "+path)
+        return path
+
+    def snapshot(self) -> "dict[str, int]":
+        with self.stacksMutex:
+            return dict(self.stacks)
+
+    def run(self, interval:float):
+        ownID = threading.get_ident()
+        while not self.stopEvent.wait(interval):
+            threadNames = {thread.ident: re.sub(r"-\d+", "", thread.name) for thread in threading.enumerate()}
+            frames = sys._current_frames()
+            sample = []
+            for threadID, frame in frames.items():
+                if(threadID == ownID):
+                    continue
+                stack = []
+                while frame is not None and len(stack) < MAXSTACKDEPTH:
+                    code = frame.f_code
+                    stack.append(profileFrameName((code.co_filename, code.co_firstlineno, code.co_name)))
+                    frame = frame.f_back
+                stack.append(threadNames.get(threadID, "unknown thread").replace(";", ","))
+                sample.append(";".join(reversed(stack)))
+            frames = frame = None  #frames keep their locals alive
+            with self.stacksMutex:
+                for stack in sample:
+                    self.stacks[stack] += 1
+            self.numSamples += 1
+            incrementMetric("dc_sampler_samples_total")
+
+threadSampler = ThreadSampler()
 
 #code by fatal error in https://stackoverflow.com/a/28950776
 def get_ip():
@@ -118,6 +536,9 @@ def receive(connection:socket.socket) -> typing.Tuple[int, bytes]:
         packetTypeAsBytes = _receiveBytes(connection, 4)
         packetType = int.from_bytes(packetTypeAsBytes, "big")
         data = _receiveBytes(connection, length)
+        if(packetType == TYPE_COMMAND):
+            connectionState.command = COMMANDNAMES.get(int.from_bytes(data, "big"), "unknown")
+        incrementMetric("dc_bytes_received_total", 8 + length, "command=\""+getattr(connectionState, "command", "handshake")+"\"")
         return (packetType, data)
     except SocketIsClosedException as e:
         addLineToDisplay(str(connectionAddr)+": socket closed")
@@ -138,9 +559,86 @@ def send(connection:socket.socket, packetType:int, data:typing.Union[bytes, int]
         packeTypeAsBytes = packetType.to_bytes(4, "big")
         connection.sendall(packeTypeAsBytes)
         connection.sendall(data)
+        incrementMetric("dc_bytes_sent_total", 8 + len(data), "command=\""+getattr(connectionState, "command", "handshake")+"\"")
         return True
     except socket.timeout:
         raise GeneralSocketException()
+    except (BrokenPipeError, ConnectionResetError) as e:
+        #peer went away, the connection handler cleans up the same way as for a failed receive
+        raise GeneralSocketException(e)
+
+#sends the header, then lets the kernel copy the file into the socket
+def sendFile(connection:socket.socket, packetType:int, path:str):
+    try:
+        size = os.path.getsize(path)
+        connection.sendall(size.to_bytes(4, "big") + packetType.to_bytes(4, "big"))
+        f = open(path, "rb")
+        try:
+            connection.sendfile(f)
+        finally:
+            f.close()
+        incrementMetric("dc_bytes_sent_total", 8 + size, "command=\""+getattr(connectionState, "command", "handshake")+"\"")
+    except socket.timeout:
+        raise GeneralSocketException()
+    except (BrokenPipeError, ConnectionResetError) as e:
+        raise GeneralSocketException(e)
+
+#processors are immutable once submitted, so they are stored once per hash and sent from memory
+artifactCache : "collections.OrderedDict[str, bytes]" = collections.OrderedDict()  #least recently sent first
+artifactCacheBytes = 0
+artifactCacheMutex = threading.Lock()
+
+def artifactPath(artifactHash:str) -> str:
+    return os.path.join(ARTIFACTFOLDER, artifactHash)
+
+def cacheArtifact(artifactHash:str, data:bytes):
+    global artifactCacheBytes
+    if(len(data) >= SENDFILEMINBYTES):
+        return
+    with artifactCacheMutex:
+        if(artifactHash in artifactCache):
+            artifactCache.move_to_end(artifactHash)
+            return
+        artifactCache[artifactHash] = data
+        artifactCacheBytes += len(data)
+        while artifactCacheBytes > ARTIFACTCACHEMAXBYTES:
+            _, evicted = artifactCache.popitem(last=False)
+            artifactCacheBytes -= len(evicted)
+
+#returns the hash
+def storeArtifact(data:bytes) -> str:
+    artifactHash = hashlib.sha256(data).hexdigest()
+    path = artifactPath(artifactHash)
+    if(not os.path.isfile(path)):
+        if(not os.path.isdir(ARTIFACTFOLDER)):
+            os.makedirs(ARTIFACTFOLDER, exist_ok=True)
+        tempPath = path+".tmp"+str(threading.get_ident())
+        f = open(tempPath, "wb")
+        f.write(data)
+        f.close()
+        os.replace(tempPath, path)
+    cacheArtifact(artifactHash, data)
+    return artifactHash
+
+def sendArtifact(connection:socket.socket, artifactHash:str):
+    with artifactCacheMutex:
+        data = artifactCache.get(artifactHash)
+        if(data is not None):
+            artifactCache.move_to_end(artifactHash)
+    if(data is None):
+        path = artifactPath(artifactHash)
+        if(os.path.getsize(path) >= SENDFILEMINBYTES):
+            incrementMetric("dc_artifact_sends_total", 1, "source=\"sendfile\"")
+            sendFile(connection, TYPE_DATA, path)
+            return
+        f = open(path, "rb")
+        data = f.read()
+        f.close()
+        cacheArtifact(artifactHash, data)
+        incrementMetric("dc_artifact_sends_total", 1, "source=\"disk\"")
+    else:
+        incrementMetric("dc_artifact_sends_total", 1, "source=\"memory\"")
+    send(connection, TYPE_DATA, data)
 
 def startAccept(server:socket.socket):
     addLineToDisplay(str(server.getsockname())+": listening")
@@ -156,6 +654,16 @@ def startAccept(server:socket.socket):
         connection.settimeout(MAXTIMEOUT)
         threading.Thread(None, handleNewConnection, None, [connection]).start()
 
+def setKeepAlive(connection:socket.socket):
+    connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    #the timings can only be set on some platforms
+    for option, value in (("TCP_KEEPIDLE", KEEPALIVEIDLE), ("TCP_KEEPALIVE", KEEPALIVEIDLE), ("TCP_KEEPINTVL", KEEPALIVEINTERVAL), ("TCP_KEEPCNT", KEEPALIVECOUNT)):
+        if(hasattr(socket, option)):
+            try:
+                connection.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+            except OSError:
+                pass
+
 def closeConnection(connection:socket.socket, message:str = None):
     try:
         if(message == None):
@@ -172,8 +680,11 @@ def closeConnection(connection:socket.socket, message:str = None):
 def handleNewConnection(connection:socket.socket):
     connection.settimeout(MAXTIMEOUT)
     connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    setKeepAlive(connection)
 
     connectionAddr = connection.getpeername()
+    connectionState.connectionID = uuid.uuid4()
+    logEvent(EVENT_CONNECT, extra=str(connectionAddr[0])+":"+str(connectionAddr[1]))
 
     try:
         #wait for verfication bytes to confirm that it's not some random connection
@@ -186,9 +697,11 @@ def handleNewConnection(connection:socket.socket):
         response = int.from_bytes(data, "big")
         if(response == RESPONSE_CLIENT):
             addLineToDisplay(str(connectionAddr)+": registered as client")
+            logEvent(EVENT_REGISTERCLIENT)
             handleClient(connection)
         elif(response == RESPONSE_NODE):
             addLineToDisplay(str(connectionAddr)+": registered as node")
+            logEvent(EVENT_REGISTERNODE)
             handleNode(connection)
         else:
             raise AssertionError("not a node or a client")
@@ -197,8 +710,299 @@ def handleNewConnection(connection:socket.socket):
         closeConnection(connection, "socket error")
     except AssertionError as e:
         closeConnection(connection, e.args)
+    logEvent(EVENT_DISCONNECT)
     addLineToDisplay(str(threading.current_thread().getName())+": thread ended")
 
+#queue handling, shared by the connection handlers and simulator.py
+def registerClient(addr, clientUUID:uuid.UUID):
+    addrToUUID[addr] = clientUUID
+    UUIDToAddr[clientUUID] = addr
+    resultQueues[addr] = queue.Queue()
+    numTasksSubmitted[addr] = 0
+    numTasksDone[addr] = 0
+    processingQueues[addr] = queue.Queue()  #last since this makes the task visible to getTaskAddr
+
+def unregisterClient(addr):
+    with retryMutex:
+        numRetrying.pop(addr, None)
+    with resultQueuesMutex:
+        processingQueue = processingQueues.pop(addr)
+        resultQueue = resultQueues.pop(addr)
+        numTasksSubmitted.pop(addr)
+        numTasksDone.pop(addr)
+    #subtasks still queued or with undelivered results, ones held by nodes are forgotten once they finish or are lost
+    #and ones waiting out a retry backoff once it is over
+    for q in [processingQueue, resultQueue]:
+        while True:
+            try:
+                forgetSubtask(q.get(block=False))
+            except queue.Empty:
+                break
+    clientUUID = addrToUUID.pop(addr)
+    UUIDToAddr.pop(clientUUID)
+    UUIDToAUUID.pop(clientUUID)
+    UUIDToTaskOptions.pop(clientUUID, None)
+    UUIDToProcessorHash.pop(clientUUID, None)
+    UUIDToSharedInputHash.pop(clientUUID, None)
+    with usageMutex:
+        usage = taskUsage.pop(clientUUID, None)
+    writeProfile(clientUUID)
+    with profileMutex:
+        taskProfiles.pop(clientUUID, None)
+        profileWriteTimes.pop(clientUUID, None)
+    if(usage is not None):
+        addLineToDisplay(str(addr)+": task used "+str(round(usage.get("cpuUser", 0) + usage.get("cpuSystem", 0), 2))+"s cpu over "+str(usage["subtasks"])+" subtasks, peak rss "+str(round(usage.get("maxRSS", 0) / 1024**2, 1))+"MiB", LOG_INFO)
+
+#drops everything kept about a subtask whose client disconnected
+def forgetSubtask(subtaskUUID:uuid.UUID):
+    subtaskTraces.pop(subtaskUUID, None)
+    UUIDToInOutData.pop(subtaskUUID, None)
+    UUIDToAddr.pop(subtaskUUID, None)
+    subtaskAttempts.pop(subtaskUUID, None)
+    subtaskLastNode.pop(subtaskUUID, None)
+    failedSubtasks.discard(subtaskUUID)
+
+def hasSpaceForSubtask(addr) -> bool:
+    return processingQueues[addr].qsize() + numRetrying.get(addr, 0) <= MAXSUBTASKS
+
+def submitSubtask(addr, inputData:bytes, submitTime:float) -> uuid.UUID:
+    subtaskUUID = uuid.uuid4()
+    subtaskTraces[subtaskUUID] = {"submit": submitTime, "enqueue": time.time(), "client": str(addr)}
+    UUIDToInOutData[subtaskUUID] = (inputData, None)
+    processingQueues[addr].put(subtaskUUID)
+    numTasksSubmitted[addr] += 1
+    logEvent(EVENT_SUBMIT, subtaskUUID, len(inputData))
+    incrementMetric("dc_subtasks_submitted_total", 1, addrLabel("client", addr))
+    addLineToDisplay(str(addr)+": submitted a subtask", LOG_SUBTASK)
+    return subtaskUUID
+
+#returns None if there are no results waiting
+def takeResult(addr) -> "typing.Tuple[uuid.UUID, bytes]":
+    try:
+        subtaskUUID = resultQueues[addr].get(block=False)
+    except queue.Empty:
+        return None
+    _, outputData = UUIDToInOutData.pop(subtaskUUID)
+    return (subtaskUUID, outputData)
+
+def resultDelivered(addr, subtaskUUID:uuid.UUID, size:int):
+    failedSubtasks.discard(subtaskUUID)
+    addTracePoint(subtaskUUID, "delivered")
+    logEvent(EVENT_DELIVER, subtaskUUID, size)
+    finishTrace(subtaskUUID)
+    incrementMetric("dc_subtasks_delivered_total", 1, addrLabel("client", addr))
+
+#nodes get a new port when they reconnect, so a node that crashed and came back is recognized by its ip
+#several nodes on one machine count as one, they likely fail the same way
+def nodeHost(nodeAddr) -> str:
+    return str(nodeAddr[0])
+
+def registerNode(nodeAddr):
+    nodeHasTask[nodeAddr] = False
+    nodeSubTasks[nodeAddr] = []
+
+def unregisterNode(nodeAddr):
+    nodeHasTask.pop(nodeAddr)
+    nodeTaskAddr.pop(nodeAddr, None)
+    with usageMutex:
+        nodeUsage.pop(nodeAddr, None)
+    l = nodeSubTasks.pop(nodeAddr)
+    incrementMetric("dc_subtasks_requeued_total", len(l))
+    #add them back to processing queue
+    #every subtask the node held counts as an attempt, it may have crashed on any of them
+    for subtaskUUID in l:
+        retrySubtask(subtaskUUID, UUIDToAddr.get(subtaskUUID), "lost with node "+str(nodeAddr), nodeAddr)
+
+#called when an attempt at a subtask ended without a result, it is queued again after a backoff or dead-lettered
+def retrySubtask(subtaskUUID:uuid.UUID, addr, reason:str, nodeAddr = None):
+    if(addr not in processingQueues):
+        forgetSubtask(subtaskUUID)  #client disconnected
+        return
+    attempts = subtaskAttempts.get(subtaskUUID, 0) + 1
+    if(attempts >= MAXATTEMPTS):
+        deadLetterSubtask(subtaskUUID, addr, "failed "+str(attempts)+" times, last: "+reason)
+        return
+    subtaskAttempts[subtaskUUID] = attempts
+    UUIDToAddr[subtaskUUID] = addr
+    logEvent(EVENT_REQUEUE, subtaskUUID)
+    delay = min(RETRYBACKOFF * 2**(attempts - 1), MAXRETRYBACKOFF)
+    if(nodeAddr is not None):
+        subtaskLastNode[subtaskUUID] = (nodeHost(nodeAddr), time.time() + delay + RETRYELSEWHEREWAIT)
+    with retryMutex:
+        heapq.heappush(retryHeap, (time.time() + delay, next(retryCounter), subtaskUUID))
+        numRetrying[addr] = numRetrying.get(addr, 0) + 1
+    addLineToDisplay(str(subtaskUUID)+": "+reason+", queueing it again in "+str(delay)+"s ("+str(attempts)+"/"+str(MAXATTEMPTS)+")", LOG_SUBTASK)
+
+#moves subtasks whose backoff is over back into their processing queue
+def requeueDueSubtasks():
+    now = time.time()
+    with retryMutex:
+        while len(retryHeap) > 0 and retryHeap[0][0] <= now:
+            _, _, subtaskUUID = heapq.heappop(retryHeap)
+            addr = UUIDToAddr.get(subtaskUUID)
+            if(addr in numRetrying):
+                numRetrying[addr] -= 1
+            if(addr in processingQueues):
+                processingQueues[addr].put(subtaskUUID)
+            else:
+                forgetSubtask(subtaskUUID)  #client disconnected
+
+#queues a finished subtask for its client, returns False if the client disconnected
+def addResult(subtaskUUID:uuid.UUID, addr, outputData:bytes) -> bool:
+    with resultQueuesMutex:
+        if(addr not in resultQueues):
+            return False
+        UUIDToInOutData[subtaskUUID] = (None, outputData)
+        resultQueues[addr].put(subtaskUUID)
+        numTasksDone[addr] += 1
+        return True
+
+#the client gets the reason instead of a result
+def deadLetterSubtask(subtaskUUID:uuid.UUID, addr, reason:str):
+    subtaskAttempts.pop(subtaskUUID, None)
+    subtaskLastNode.pop(subtaskUUID, None)
+    UUIDToAddr.pop(subtaskUUID, None)
+    failedSubtasks.add(subtaskUUID)
+    if(not addResult(subtaskUUID, addr, reason.encode())):
+        forgetSubtask(subtaskUUID)  #client disconnected
+        return
+    incrementMetric("dc_subtasks_deadlettered_total", 1, addrLabel("client", addr))
+    addLineToDisplay(str(addr)+": dead-lettered subtask "+str(subtaskUUID)+", "+reason, LOG_INFO)
+
+#returns None if the task has no subtasks left
+def takeSubtask(taskUUID:uuid.UUID, nodeAddr) -> "typing.Tuple[uuid.UUID, bytes]":
+    requeueDueSubtasks()
+    skipped = []
+    try:
+        addr = UUIDToAddr[taskUUID]
+        nodeTaskAddr[nodeAddr] = addr
+        #retries are left for a while to nodes on other machines that work on the task, if there are any
+        host = nodeHost(nodeAddr)
+        otherHosts = set(nodeHost(otherAddr) for otherAddr, otherTaskAddr in list(nodeTaskAddr.items()) if otherTaskAddr == addr and nodeHasTask.get(otherAddr))
+        otherHosts.discard(host)
+        while True:
+            subtaskUUID = processingQueues[addr].get(block=False)
+            inputData, _ = UUIDToInOutData.get(subtaskUUID, (None, None))
+            if(inputData is None):
+                continue  #requeued but then finished anyway by a node that reconnected and resent its result
+            lastHost, elsewhereUntil = subtaskLastNode.get(subtaskUUID, (None, 0))
+            if(len(otherHosts) > 0 and lastHost == host and time.time() < elsewhereUntil):
+                skipped.append(subtaskUUID)
+                continue
+            break
+    except (KeyError, queue.Empty):
+        if(len(skipped) == 0):
+            nodeHasTask[nodeAddr] = False
+        return None
+    finally:
+        for skippedUUID in skipped:
+            if(addr in processingQueues):
+                processingQueues[addr].put(skippedUUID)
+            else:
+                forgetSubtask(skippedUUID)  #client disconnected
+    UUIDToAddr[subtaskUUID] = addr
+    nodeSubTasks[nodeAddr].append(subtaskUUID)  #before sending so it is requeued if sending fails
+    addTracePoint(subtaskUUID, "dispatch")
+    addTracePoint(subtaskUUID, "node", str(nodeAddr))
+    logEvent(EVENT_DISPATCH, subtaskUUID, len(inputData))
+    incrementMetric("dc_subtasks_dispatched_total", 1, addrLabel("node", nodeAddr))
+    addLineToDisplay(str(nodeAddr)+": is starting subtask "+str(subtaskUUID), LOG_SUBTASK)
+    return (subtaskUUID, inputData)
+
+#guided self-scheduling: a node gets its share of what is queued, split between the nodes on the task
+#so batches are big while there is a lot left and shrink towards the end, when nodes should finish together
+def batchSize(taskUUID:uuid.UUID, maxCount:int) -> int:
+    addr = UUIDToAddr.get(taskUUID)
+    if(addr not in processingQueues):
+        return 1
+    numNodes = max(1, len(processingQueueThreads.get(addr, [])))
+    return max(1, min(maxCount, MAXBATCHSIZE, math.ceil(processingQueues[addr].qsize() / numNodes)))
+
+#returns an empty list if the task has no subtasks left
+def takeSubtasks(taskUUID:uuid.UUID, nodeAddr, maxCount:int) -> "list[typing.Tuple[uuid.UUID, bytes]]":
+    subtasks = []
+    for _ in range(batchSize(taskUUID, maxCount)):
+        subtask = takeSubtask(taskUUID, nodeAddr)
+        if(subtask is None):
+            break
+        subtasks.append(subtask)
+    return subtasks
+
+#nodes resend results they aren't sure arrived, so the same subtask can complete more than once
+#and a node that reconnected can finish a subtask that was requeued and given to another node
+def releaseSubtask(subtaskUUID:uuid.UUID, nodeAddr):
+    l = nodeSubTasks.get(nodeAddr)
+    if(l is not None and subtaskUUID in l):
+        l.remove(subtaskUUID)
+        return
+    for l in list(nodeSubTasks.values()):
+        if(subtaskUUID in l):
+            l.remove(subtaskUUID)
+
+def completeSubtask(subtaskUUID:uuid.UUID, nodeAddr, outputData:bytes, outputInfo:dict):
+    addr = UUIDToAddr.pop(subtaskUUID, None)
+    if(addr is None):
+        incrementMetric("dc_subtasks_duplicate_total", 1, addrLabel("node", nodeAddr))
+        addLineToDisplay(str(nodeAddr)+": ignoring result for "+str(subtaskUUID)+", it was already finished", LOG_VERBOSE)
+        releaseSubtask(subtaskUUID, nodeAddr)
+        return
+    if("profile" in outputInfo and addr in addrToUUID):
+        mergeProfile(addrToUUID[addr], nodeAddr, outputInfo["profile"])
+    with usageMutex:
+        if(addr in addrToUUID):
+            addUsage(taskUsage.setdefault(addrToUUID[addr], dict()), outputInfo)
+        addUsage(nodeUsage.setdefault(nodeAddr, dict()), outputInfo)
+    if(outputInfo.get("outcome") == "timeout"):
+        incrementMetric("dc_subtasks_timedout_total", 1, addrLabel("node", nodeAddr))
+        releaseSubtask(subtaskUUID, nodeAddr)
+        retrySubtask(subtaskUUID, addr, "timed out on node "+str(nodeAddr)+": "+outputData.decode(errors="replace").strip(), nodeAddr)
+        return
+    subtaskAttempts.pop(subtaskUUID, None)
+    subtaskLastNode.pop(subtaskUUID, None)
+    addTracePoint(subtaskUUID, "complete")
+    logEvent(EVENT_COMPLETE, subtaskUUID, len(outputData))
+    for point in ["nodeStart", "processEnd", "upload"] + USAGEFIELDS:
+        if(point in outputInfo):
+            addTracePoint(subtaskUUID, point, outputInfo[point])
+    incrementMetric("dc_subtasks_completed_total", 1, addrLabel("node", nodeAddr))
+    if(not addResult(subtaskUUID, addr, outputData)):
+        #client at addr disconnected
+        addLineToDisplay(str(nodeAddr)+": WARNING: "+str(subtaskUUID)+" finished but client disconnected", LOG_ERROR)
+        forgetSubtask(subtaskUUID)
+    addLineToDisplay(str(nodeAddr)+": finished subtask "+str(subtaskUUID), LOG_SUBTASK)
+    releaseSubtask(subtaskUUID, nodeAddr)
+
+def addUsage(usage:"dict[str, float]", outputInfo:dict):
+    usage["subtasks"] = usage.get("subtasks", 0) + 1
+    for field in USAGEFIELDS:
+        if(field not in outputInfo):
+            continue  #older nodes, or not measurable on the node's platform
+        if(field == "maxRSS"):
+            usage[field] = max(usage.get(field, 0), outputInfo[field])
+        else:
+            usage[field] = usage.get(field, 0) + outputInfo[field]
+
+#batch layout: repeated 16 byte subtask uuid, 4 byte output length, output, 4 byte info length, info json
+def parseSubtaskOutputs(data:bytes) -> "list[typing.Tuple[uuid.UUID, bytes, dict]]":
+    results = []
+    view = memoryview(data)
+    i = 0
+    while i < len(view):
+        assert i + 20 <= len(view), "truncated subtask output batch"
+        subtaskUUID = uuid.UUID(bytes=bytes(view[i:i+16]))
+        outputLength = int.from_bytes(view[i+16:i+20], "big")
+        i += 20
+        outputData = bytes(view[i:i+outputLength])
+        i += outputLength
+        assert i + 4 <= len(view), "truncated subtask output batch"
+        infoLength = int.from_bytes(view[i:i+4], "big")
+        i += 4
+        assert i + infoLength <= len(view), "truncated subtask output batch"
+        outputInfo = json.loads(bytes(view[i:i+infoLength]).decode())
+        i += infoLength
+        results.append((subtaskUUID, outputData, outputInfo))
+    return results
+
 clientThreadNameCounter = 0
 def handleClient(connection:socket.socket):
     global clientThreadNameCounter
@@ -210,17 +1014,8 @@ def handleClient(connection:socket.socket):
         #load processor file
         pType, data = receive(connection)
         assert pType == TYPE_DATA, "didn't receive data (processor)"
-        dataAsStr = data.decode()
-        #generate and save into directory
-        if(not os.path.isdir(SERVERFOLDER)):
-            os.mkdir(SERVERFOLDER)
-        clientFolder = os.path.join(SERVERFOLDER, str(connectionAddr))
-        if(not os.path.isdir(clientFolder)):
-            os.mkdir(clientFolder)
         clientUUID = uuid.uuid4()
-        file = open(os.path.join(clientFolder, str(clientUUID)+".py"), "w")
-        file.write(dataAsStr)
-        file.close()
+        UUIDToProcessorHash[clientUUID] = storeArtifact(data)
         addLineToDisplay(str(connectionAddr)+": received processor file")
 
         UUIDToAUUID[clientUUID] = None
@@ -238,6 +1033,16 @@ def handleClient(connection:socket.socket):
                 auuid = uuid.UUID(bytes=data)
                 addLineToDisplay(str(connectionAddr)+": received AUUID")
                 UUIDToAUUID[clientUUID] = auuid
+            elif(response == RESPONSE_SENDTASKOPTIONS):
+                pType, data = receive(connection)
+                assert pType == TYPE_DATA, "didn't receive data (task options)"
+                UUIDToTaskOptions[clientUUID] = json.loads(data.decode())
+                addLineToDisplay(str(connectionAddr)+": received task options")
+            elif(response == RESPONSE_SENDSHAREDINPUT):
+                pType, data = receive(connection)
+                assert pType == TYPE_DATA, "didn't receive data (shared input)"
+                UUIDToSharedInputHash[clientUUID] = storeArtifact(data)
+                addLineToDisplay(str(connectionAddr)+": received shared input ("+str(len(data))+" bytes)")
             else:
                 raise AssertionError("didn't receive RESPONSE_DONE")
     except GeneralSocketException:
@@ -247,15 +1052,9 @@ def handleClient(connection:socket.socket):
         closeConnection(connection, e.args)
         return
 
-    addrToUUID[connectionAddr] = clientUUID
-    UUIDToAddr[clientUUID] = connectionAddr
-    
+    registerClient(connectionAddr, clientUUID)
     clients.append(connection)
     threading.current_thread().setName("Client-"+str(clientThreadNameCounter)); clientThreadNameCounter += 1
-    processingQueues[connectionAddr] = queue.Queue()
-    resultQueues[connectionAddr] = queue.Queue()
-    numTasksSubmitted[connectionAddr] = 0
-    numTasksDone[connectionAddr] = 0
     try:
         while not isServerShuttingDown:
             pType, data = receive(connection)
@@ -263,34 +1062,36 @@ def handleClient(connection:socket.socket):
             command = int.from_bytes(data, "big")
             if(command == COMMAND_PING):
                 send(connection, TYPE_COMMAND, COMMAND_PONG)
+                send(connection, TYPE_DATA, struct.pack(">d", time.time()))  #lets the other side estimate its clock offset
                 continue
             elif(command == COMMAND_EXIT):
                 addLineToDisplay(str(connectionAddr)+": received exit command")
                 break
             elif(command == COMMAND_SUBMITSUBTASK):
-                if(processingQueues[connectionAddr].qsize() > MAXSUBTASKS):
+                if(not hasSpaceForSubtask(connectionAddr)):
                     send(connection, TYPE_RESPONSE, RESPONSE_NOTENOUGHSPACE)
                 else:
                     send(connection, TYPE_RESPONSE, RESPONSE_OK)
                     pType, data = receive(connection)
                     assert pType == TYPE_DATA, "didn't receive subtask data"
-                    subtaskUUID = uuid.uuid4()
-                    processingQueues[connectionAddr].put(subtaskUUID)
+                    pType, submitTime = receive(connection)
+                    assert pType == TYPE_DATA, "didn't receive subtask submit time"
+                    subtaskUUID = submitSubtask(connectionAddr, data, struct.unpack(">d", submitTime)[0])
                     send(connection, TYPE_DATA, subtaskUUID.bytes)
-                    numTasksSubmitted[connectionAddr] += 1
-                    UUIDToInOutData[subtaskUUID] = (data, None)
-                    if(VERBOSE):
-                        addLineToDisplay(str(connectionAddr)+": submitted a subtask")
             elif(command == COMMAND_ISSUBTASKDONE):
-                try:
-                    subtaskUUID = resultQueues[connectionAddr].get(block=False)
-                except queue.Empty:
+                result = takeResult(connectionAddr)
+                if(result is None):
                     send(connection, TYPE_RESPONSE, RESPONSE_NONEWRESULTS)
                     continue
-                _, outputData = UUIDToInOutData.pop(subtaskUUID)
-                send(connection, TYPE_RESPONSE, RESPONSE_OK)
+                subtaskUUID, outputData = result
+                #clients that can't handle RESPONSE_FAILED get the reason as the output
+                if(subtaskUUID in failedSubtasks and UUIDToTaskOptions.get(clientUUID, dict()).get("reportFailed", False)):
+                    send(connection, TYPE_RESPONSE, RESPONSE_FAILED)
+                else:
+                    send(connection, TYPE_RESPONSE, RESPONSE_OK)
                 send(connection, TYPE_DATA, subtaskUUID.bytes)
                 send(connection, TYPE_DATA, outputData)
+                resultDelivered(connectionAddr, subtaskUUID, len(outputData))
             else:
                 addLineToDisplay(str(connectionAddr)+": received unkown command ("+command+")")
     except GeneralSocketException:
@@ -298,19 +1099,19 @@ def handleClient(connection:socket.socket):
     except AssertionError as e:
         closeConnection(connection, e.args)
     clients.remove(connection)
-    processingQueues.pop(connectionAddr)
-    resultQueues.pop(connectionAddr)
-    numTasksSubmitted.pop(connectionAddr)
-    numTasksDone.pop(connectionAddr)
-    k = addrToUUID.pop(connectionAddr)
-    UUIDToAddr.pop(k)
-    UUIDToAUUID.pop(clientUUID)
+    unregisterClient(connectionAddr)
 
 processingQueueThreads : "dict[socket._RetAddress, typing.List[threading.Thread]]" = dict()  #stores the threads that are processing each queue
 #ensures that nodes are distributed evenly to tasks
 #this is beneficial since it costs a lot of time to switch between tasks
+#worker is anything with is_alive(), it defaults to the calling node thread (simulator.py passes its own)
 taskDistributerMutex = threading.Lock()
-def getTaskAddr():
+#excluded are task uuids the node declined, e.g. because their build failed there
+def getTaskAddr(worker = None, excluded:"set[uuid.UUID]" = frozenset()):
+    if(worker is None):
+        worker = threading.current_thread()
+    startTime = time.perf_counter()
+    requeueDueSubtasks()
     taskDistributerMutex.acquire()
 
     #ensure processingQueueThreads matches processingQueues
@@ -325,24 +1126,75 @@ def getTaskAddr():
         processingQueueThreads.pop(k)
 
     #check to make sure thread info is correct
-    curThread = threading.current_thread()
-    for _, l in processingQueueThreads.items():
-        for i in range(len(l)):
-            if(not l[i].is_alive() or l[i] == curThread):
-                l.remove(l[i])
-                i -= 1
-                
+    for k, l in processingQueueThreads.items():
+        processingQueueThreads[k] = [t for t in l if t.is_alive() and t != worker]
+
     #find queue with least threads handling it
     leastThreadsAddr = None
     leastThreadsNum = -1
     for addr in processingQueues.keys():
+        if(addrToUUID.get(addr) in excluded):
+            continue
         if(processingQueues[addr].qsize() > 0 and (leastThreadsAddr == None or len(processingQueueThreads[addr]) < leastThreadsNum)):
             leastThreadsAddr = addr
             leastThreadsNum = len(processingQueueThreads[addr])
-        
+    if(leastThreadsAddr is not None):
+        processingQueueThreads[leastThreadsAddr].append(worker)
+
     taskDistributerMutex.release()
+    incrementMetric("dc_scheduler_seconds_total", time.perf_counter() - startTime)
+    incrementMetric("dc_scheduler_calls_total")
     return leastThreadsAddr  #will return None if there are no tasks to do
 
+#phi accrual failure detector (Hayashibara et al.) on the gaps between a node's commands
+#only the time the server spends waiting for the next command counts, so long transfers aren't mistaken for silence
+#nodes send a ping every HEARTBEATINTERVAL when they have nothing else to say
+class FailureDetector:
+    def __init__(self, connection:socket.socket):
+        self.connection = connection
+        self.gaps : "collections.deque[float]" = collections.deque(maxlen=HEARTBEATWINDOW)
+        self.waitingSince : float = None  #None while a command is being handled
+        self.suspected = False
+
+    def waiting(self):
+        self.waitingSince = time.monotonic()
+
+    def heard(self):
+        waitingSince = self.waitingSince
+        self.waitingSince = None
+        if(waitingSince is not None):
+            self.gaps.append(time.monotonic() - waitingSince)
+
+    #-log10 of the probability that a live node would have been silent this long, the gaps are assumed to be normally distributed
+    def phi(self) -> float:
+        waitingSince = self.waitingSince
+        gaps = list(self.gaps)
+        if(waitingSince is None or len(gaps) < MINHEARTBEATS):
+            return 0.0
+        mean = sum(gaps) / len(gaps)
+        stdDev = max(math.sqrt(sum((gap - mean)**2 for gap in gaps) / len(gaps)), MINHEARTBEATSTDDEV)
+        y = (time.monotonic() - waitingSince - mean - ACCEPTABLEHEARTBEATPAUSE) / stdDev
+        pLater = 0.5 * math.erfc(y / math.sqrt(2))
+        return -math.log10(max(pLater, 1e-300))
+
+#closes the connections of nodes that went silent, their handler then requeues their subtasks
+def runFailureDetector():
+    while not isServerShuttingDown:
+        time.sleep(FAILUREDETECTORINTERVAL)
+        for nodeAddr, detector in list(nodeDetectors.items()):
+            if(detector.suspected):
+                continue
+            phi = detector.phi()
+            if(phi < PHITHRESHOLD):
+                continue
+            detector.suspected = True
+            incrementMetric("dc_nodes_suspected_total")
+            addLineToDisplay(str(nodeAddr)+": no heartbeat (phi "+str(round(phi, 1))+"), reclaiming its subtasks", LOG_INFO)
+            try:
+                detector.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
 nodeThreadNameCounter = 0
 def handleNode(connection:socket.socket):
     global nodeThreadNameCounter
@@ -351,22 +1203,31 @@ def handleNode(connection:socket.socket):
 
     nodes.append(connection)
     threading.current_thread().setName("Node-"+str(nodeThreadNameCounter)); nodeThreadNameCounter += 1
-    nodeHasTask[connectionAddr] = False
-    nodeSubTasks[connectionAddr] = []
+    registerNode(connectionAddr)
+    detector = FailureDetector(connection)
+    nodeDetectors[connectionAddr] = detector
 
     try:
         while not isServerShuttingDown:
+            detector.waiting()
             pType, data = receive(connection)
+            detector.heard()
             assert pType == TYPE_COMMAND, "didn't receive a command"
             command = int.from_bytes(data, "big")
             if(command == COMMAND_PING):
                 send(connection, TYPE_COMMAND, COMMAND_PONG)
+                send(connection, TYPE_DATA, struct.pack(">d", time.time()))  #lets the other side estimate its clock offset
                 continue
             elif(command == COMMAND_EXIT):
                 addLineToDisplay(str(connectionAddr)+": received exit command")
                 break
-            elif(command == COMMAND_GETTASK):
-                addr = getTaskAddr()
+            elif(command == COMMAND_GETTASK or command == COMMAND_GETTASKEXCLUDING):
+                excluded = set()
+                if(command == COMMAND_GETTASKEXCLUDING):
+                    pType, data = receive(connection)
+                    assert pType == TYPE_DATA, "didn't receive data (excluded task uuids)"
+                    excluded = set(uuid.UUID(bytes=data[i:i+16]) for i in range(0, len(data), 16))
+                addr = getTaskAddr(excluded=excluded)
                 if(addr == None):
                     send(connection, TYPE_RESPONSE, RESPONSE_NONEWTASKS)
                 else:
@@ -381,65 +1242,72 @@ def handleNode(connection:socket.socket):
                         send(connection, TYPE_DATA, algoUUID.bytes)
                     else:
                         send(connection, TYPE_RESPONSE, RESPONSE_NOAUUID)
+                    send(connection, TYPE_DATA, json.dumps(UUIDToTaskOptions.get(taskUUID, dict())).encode())
+                    send(connection, TYPE_DATA, UUIDToProcessorHash[taskUUID].encode())
+                    sharedInputHash = UUIDToSharedInputHash.get(taskUUID)
+                    send(connection, TYPE_DATA, (sharedInputHash or "").encode())
 
-                    pType, data = receive(connection)
-                    assert pType == TYPE_RESPONSE, "didn't receive response (has file)"
-                    response = int.from_bytes(data, "big")
-                    if(response == RESPONSE_OK):
-                        if(VERBOSE):
-                            addLineToDisplay(str(connectionAddr)+": is starting task "+str(taskUUID))
-                        nodeHasTask[connectionAddr] = True
-                    elif(response == RESPONSE_DOESNOTHAVEFILE):
-                        #send file
-                        processorFilePath = os.path.join(SERVERFOLDER, str(addr), str(taskUUID)+".py")
-                        f = open(processorFilePath)
-                        processorStr = f.read()
-                        f.close()
-                        send(connection, TYPE_DATA, processorStr.encode())
-                        if(VERBOSE):
-                            addLineToDisplay(str(connectionAddr)+": is starting task "+str(taskUUID)+" after receiving files")
-                        nodeHasTask[connectionAddr] = True
-                    else:
-                        raise AssertionError("received unknown response ("+str(response)+")")
+                    #the processor, then the shared input if there is one
+                    receivedFiles = False
+                    for artifactHash in [UUIDToProcessorHash[taskUUID], sharedInputHash]:
+                        if(artifactHash is None):
+                            continue
+                        pType, data = receive(connection)
+                        assert pType == TYPE_RESPONSE, "didn't receive response (has file)"
+                        response = int.from_bytes(data, "big")
+                        if(response == RESPONSE_DOESNOTHAVEFILE):
+                            #send file
+                            sendArtifact(connection, artifactHash)
+                            receivedFiles = True
+                        elif(response != RESPONSE_OK):
+                            raise AssertionError("received unknown response ("+str(response)+")")
+                    addLineToDisplay(str(connectionAddr)+": is starting task "+str(taskUUID)+(" after receiving files" if receivedFiles else ""), LOG_VERBOSE)
+                    nodeHasTask[connectionAddr] = True
+                    nodeTaskAddr[connectionAddr] = addr
             elif(command == COMMAND_GETSUBTASK):
                 pType, data = receive(connection)
                 assert pType == TYPE_DATA, "didn't receive data (task uuid)"
                 taskUUID = uuid.UUID(bytes=data)
-                success = False
-                try:
-                    addr = UUIDToAddr[taskUUID]
-                    q = processingQueues[addr]
-                    subtaskUUID = q.get(block=False)
-                    inputData, _ = UUIDToInOutData[subtaskUUID]
-                    success = True
-                except (KeyError, queue.Empty) as e:
+                subtask = takeSubtask(taskUUID, connectionAddr)
+                if(subtask is None):
                     send(connection, TYPE_RESPONSE, RESPONSE_NONEWSUBTASKS)
-                    nodeHasTask[connectionAddr] = False
-                if(success):
+                else:
+                    subtaskUUID, inputData = subtask
                     send(connection, TYPE_RESPONSE, RESPONSE_OK)
                     send(connection, TYPE_DATA, subtaskUUID.bytes)
                     send(connection, TYPE_DATA, inputData)
-                    UUIDToAddr[subtaskUUID] = addr
-                    if(VERBOSE):
-                        addLineToDisplay(str(connectionAddr)+": is starting subtask "+str(subtaskUUID))
-                    nodeSubTasks[connectionAddr].append(subtaskUUID)
+            elif(command == COMMAND_GETSUBTASKS):
+                pType, data = receive(connection)
+                assert pType == TYPE_DATA, "didn't receive data (task uuid)"
+                taskUUID = uuid.UUID(bytes=data)
+                pType, data = receive(connection)
+                assert pType == TYPE_DATA, "didn't receive data (max subtasks)"
+                subtasks = takeSubtasks(taskUUID, connectionAddr, int.from_bytes(data, "big"))
+                if(len(subtasks) == 0):
+                    send(connection, TYPE_RESPONSE, RESPONSE_NONEWSUBTASKS)
+                else:
+                    #batch layout: repeated 16 byte subtask uuid, 4 byte input length, input
+                    batch = bytearray()
+                    for subtaskUUID, inputData in subtasks:
+                        batch += subtaskUUID.bytes + len(inputData).to_bytes(4, "big") + inputData
+                    send(connection, TYPE_RESPONSE, RESPONSE_OK)
+                    send(connection, TYPE_DATA, bytes(batch))
             elif(command == COMMAND_SUBMITSUBTASKOUTPUT):
                 pType, data = receive(connection)
                 assert pType == TYPE_DATA, "didn't receive data (task uuid)"
                 subtaskUUID = uuid.UUID(bytes=data)
                 pType, data = receive(connection)
                 assert pType == TYPE_DATA, "didn't receive data (output)"
-                addr = UUIDToAddr.pop(subtaskUUID)
-                if(addr in resultQueues):
-                    resultQueues[addr].put(subtaskUUID)
-                    numTasksDone[addr] += 1
-                    UUIDToInOutData[subtaskUUID] = (None, data)
-                else:
-                    #client at addr disconnected
-                    addLineToDisplay(str(connectionAddr)+": WARNING: "+str(subtaskUUID)+" finished but client disconnected")
-                if(VERBOSE):
-                    addLineToDisplay(str(connectionAddr)+": finished subtask "+str(subtaskUUID))
-                nodeSubTasks[connectionAddr].remove(subtaskUUID)
+                pType, outputInfo = receive(connection)
+                assert pType == TYPE_DATA, "didn't receive data (output info)"
+                completeSubtask(subtaskUUID, connectionAddr, data, json.loads(outputInfo.decode()))
+            elif(command == COMMAND_SUBMITSUBTASKOUTPUTS):
+                pType, data = receive(connection)
+                assert pType == TYPE_DATA, "didn't receive data (subtask outputs)"
+                for subtaskUUID, outputData, outputInfo in parseSubtaskOutputs(data):
+                    completeSubtask(subtaskUUID, connectionAddr, outputData, outputInfo)
+                #the node keeps the results until this arrives and resends them otherwise
+                send(connection, TYPE_RESPONSE, RESPONSE_OK)
             else:
                 raise AssertionError("received unknown command ("+command+")")
     except GeneralSocketException:
@@ -447,42 +1315,63 @@ def handleNode(connection:socket.socket):
     except AssertionError as e:
         closeConnection(connection, e.args)
     nodes.remove(connection)
-    nodeHasTask.pop(connectionAddr)
-    l = nodeSubTasks.pop(connectionAddr)
-    #add them back to processing queue
-    for subtaskUUID in l:
-        processingQueues[UUIDToAddr[subtaskUUID]].put(subtaskUUID)
+    nodeDetectors.pop(connectionAddr, None)
+    unregisterNode(connectionAddr)
 
 MAXMAXDISPLAYLINES = 10
 maxDisplayLines = 10
-displayLines = []
-
-def addLineToDisplay(line):
-    line = str(line)
-    termSize = os.get_terminal_size()
-    while(len(line) > termSize.columns-1):
-        displayLines.append(line[0:termSize.columns-1])
-        line = line[termSize.columns-1:]
-    displayLines.append(line)
-        
-    while(len(displayLines) > maxDisplayLines):
-        displayLines.pop(0)
+displayLines : "collections.deque[str]" = collections.deque(maxlen=MAXMAXDISPLAYLINES)
+#filled by connection threads and drained by the ui thread
+#deque.append and deque.popleft are atomic so no lock is needed
+pendingLogLines : "collections.deque[str]" = collections.deque(maxlen=MAXPENDINGLOGLINES)
+subtaskLogCounter = itertools.count()
+
+def addLineToDisplay(line, level:int = LOG_INFO):
+    if(level > LOGLEVEL):
+        return
+    if(level == LOG_SUBTASK and next(subtaskLogCounter) % SUBTASKLOGSAMPLERATE != 0):
+        return
+    pendingLogLines.append(str(line))
+
+def drainLogLines() -> "list[str]":
+    lines = []
+    while True:
+        try:
+            lines.append(pendingLogLines.popleft())
+        except IndexError:
+            return lines
 
 def startDisplayLoop():
-    print("\n"*os.get_terminal_size().lines)
+    if(not HEADLESS):
+        print("\n"*shutil.get_terminal_size().lines)
     while not isServerShuttingDown:
         updateDisplay()
         time.sleep(0.5)
 
+def printLogLines():
+    for line in drainLogLines():
+        print(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")+" "+line, flush=True)
+
 def updateDisplay():
     global maxDisplayLines
 
-    termSize = os.get_terminal_size()
+    if(HEADLESS):
+        printLogLines()
+        return
+
+    termSize = shutil.get_terminal_size()
+
+    for line in drainLogLines():
+        while(len(line) > termSize.columns-1):
+            displayLines.append(line[0:termSize.columns-1])
+            line = line[termSize.columns-1:]
+        displayLines.append(line)
 
     print(colorama.Cursor.POS(0, 0)+" "*(termSize.columns-1))
+    shownLines = list(displayLines)[-maxDisplayLines:] if maxDisplayLines > 0 else []
     for i in range(maxDisplayLines):
-        if(i < len(displayLines)):
-            print(displayLines[i].ljust(termSize.columns-1))
+        if(i < len(shownLines)):
+            print(shownLines[i].ljust(termSize.columns-1))
         else:
             print(" "*(termSize.columns-1))
     lines : typing.List[str] = []
@@ -539,30 +1428,147 @@ def updateDisplay():
         j -= 1
 
 
+def renderMetrics() -> str:
+    lines : typing.List[str] = []
+    def addMetric(name:str, metricType:str, samples:"typing.Iterable[typing.Tuple[str, float]]"):
+        lines.append("# TYPE "+name+" "+metricType)
+        for labels, value in samples:
+            lines.append(name+("{"+labels+"}" if labels != "" else "")+" "+repr(float(value)))
+
+    with metricsMutex:
+        counters = list(metricCounters.items())
+    names : "dict[str, list[typing.Tuple[str, float]]]" = dict()
+    for (name, labels), value in sorted(counters):
+        names.setdefault(name, []).append((labels, value))
+    for name, samples in names.items():
+        addMetric(name, "counter", samples)
+
+    #gauges are computed on scrape so the hot paths don't have to maintain them
+    addMetric("dc_uptime_seconds", "gauge", [("", time.time()-serverStartTime)])
+    addMetric("dc_threads", "gauge", [("", threading.active_count())])
+    addMetric("dc_nodes", "gauge", [("", len(nodes))])
+    addMetric("dc_clients", "gauge", [("", len(clients))])
+    addMetric("dc_artifact_cache_bytes", "gauge", [("", artifactCacheBytes)])
+    addMetric("dc_processing_queue_depth", "gauge", [(addrLabel("client", addr), q.qsize()) for addr, q in list(processingQueues.items())])
+    addMetric("dc_result_queue_depth", "gauge", [(addrLabel("client", addr), q.qsize()) for addr, q in list(resultQueues.items())])
+    addMetric("dc_inflight_subtasks", "gauge", [(addrLabel("node", addr), len(l)) for addr, l in list(nodeSubTasks.items())])
+    addMetric("dc_node_phi", "gauge", [(addrLabel("node", addr), detector.phi()) for addr, detector in list(nodeDetectors.items())])
+    lines.append("# TYPE dc_subtask_phase_seconds summary")
+    for phase, histogram in phaseHistograms.items():
+        for q in (0.5, 0.9, 0.99, 0.999):
+            lines.append("dc_subtask_phase_seconds{phase=\""+phase+"\",quantile=\""+str(q)+"\"} "+repr(histogram.quantile(q)))
+        lines.append("dc_subtask_phase_seconds_sum{phase=\""+phase+"\"} "+repr(histogram.total))
+        lines.append("dc_subtask_phase_seconds_count{phase=\""+phase+"\"} "+repr(float(histogram.count)))
+    with usageMutex:
+        usages = [("task", addrLabel("task", taskUUID), dict(usage)) for taskUUID, usage in taskUsage.items()]
+        usages += [("node", addrLabel("node", addr), dict(usage)) for addr, usage in nodeUsage.items()]
+    for scope in ("task", "node"):
+        scoped = [(labels, usage) for usageScope, labels, usage in usages if usageScope == scope]
+        addMetric("dc_"+scope+"_processor_subtasks_total", "counter", [(labels, usage["subtasks"]) for labels, usage in scoped])
+        addMetric("dc_"+scope+"_processor_cpu_seconds_total", "counter", [(labels+",mode=\""+mode+"\"", usage.get(field, 0)) for labels, usage in scoped for mode, field in (("user", "cpuUser"), ("system", "cpuSystem"))])
+        addMetric("dc_"+scope+"_processor_wall_seconds_total", "counter", [(labels, usage.get("wall", 0)) for labels, usage in scoped])
+        addMetric("dc_"+scope+"_processor_bytes_total", "counter", [(labels+",direction=\""+direction+"\"", usage.get(field, 0)) for labels, usage in scoped for direction, field in (("in", "bytesIn"), ("out", "bytesOut"))])
+        addMetric("dc_"+scope+"_processor_max_rss_bytes", "gauge", [(labels, usage.get("maxRSS", 0)) for labels, usage in scoped])
+    inOutData = list(UUIDToInOutData.values())
+    addMetric("dc_inout_data_entries", "gauge", [("", len(inOutData))])
+    addMetric("dc_inout_data_bytes", "gauge", [("", sum(len(i or b"") + len(o or b"") for i, o in inOutData))])
+    return "\n".join(lines)+"\n"
+
+#GET /metrics
+#GET /sampler: collapsed stacks sampled so far
+#POST /sampler/start?interval=<seconds>, POST /sampler/stop: stop writes the stacks to SAMPLERFOLDER and returns them
+class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if(self.path == "/metrics"):
+            self.sendText(200, renderMetrics(), "text/plain; version=0.0.4")
+        elif(self.path == "/sampler"):
+            self.sendText(200, renderCollapsedStacks(threadSampler.snapshot()))
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        url = urllib.parse.urlparse(self.path)
+        if(url.path == "/sampler/start"):
+            try:
+                interval = float(urllib.parse.parse_qs(url.query).get("interval", [SAMPLERINTERVAL])[0])
+                assert interval > 0
+            except (ValueError, AssertionError):
+                self.send_error(400, "interval has to be a positive number of seconds")
+                return
+            if(threadSampler.start(interval)):
+                self.sendText(200, "started\n")
+            else:
+                self.sendText(409, "already running\n")
+        elif(url.path == "/sampler/stop"):
+            path = threadSampler.stop()
+            if(path is None):
+                self.sendText(409, "not running\n")
+                return
+            f = open(path, "r")
+            stacks = f.read()
+            f.close()
+            self.sendText(200, stacks)
+        else:
+            self.send_error(404)
+
+    def sendText(self, status:int, text:str, contentType:str = "text/plain"):
+        body = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", contentType)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  #scrapes would otherwise flood error.log
+
+
+
+if(__name__ == "__main__"):
+    #error logging
+    sys.stderr = open('error.log', 'w')
+    colorama.init()
+
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
+    server.bind(("", PORT))
+    server.listen(100)
+    addLineToDisplay("server: setup done")
+
+    metricsServer = http.server.ThreadingHTTPServer((METRICSHOST, METRICSPORT), MetricsRequestHandler)
+    addLineToDisplay("metrics: http://"+METRICSHOST+":"+str(METRICSPORT)+"/metrics")
+    addLineToDisplay("sampler: curl -X POST http://"+METRICSHOST+":"+str(METRICSPORT)+"/sampler/start, then /sampler/stop")
+
+    if(not os.path.isdir(SERVERFOLDER)):
+        os.mkdir(SERVERFOLDER)
+    eventLogEnabled = True
+    logEvent(EVENT_START, extra=str(serverIP))
+
+    acceptThread = threading.Thread(None, startAccept, "Accept-Thread", [server])
+    uiThread = threading.Thread(None, startDisplayLoop, "UI-Thread")
+    metricsThread = threading.Thread(None, metricsServer.serve_forever, "Metrics-Thread", daemon=True)
+    eventLogThread = threading.Thread(None, startEventLogWriter, "EventLog-Thread")
+    failureDetectorThread = threading.Thread(None, runFailureDetector, "FailureDetector-Thread", daemon=True)
+    acceptThread.start()
+    uiThread.start()
+    metricsThread.start()
+    eventLogThread.start()
+    failureDetectorThread.start()
+    try:
+        uiThread.join()
+        print("ui thread exited")
+        addLineToDisplay("ui thread exited")
+        acceptThread.join()
+    except KeyboardInterrupt:
+        print("keyboard interrupt: shutting down")
+        addLineToDisplay("keyboard interrupt: shutting down")
+
+    #server is never meant to close, but in the case that the acceptThread ends for some reason, this is intended to close the connection
+    isServerShuttingDown = True
+    print("server: closing")
+    addLineToDisplay("server closing")
+    server.close()
+    metricsServer.shutdown()
+    eventLogThread.join()
 
-server = socket.socket()
-server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
-server.bind(("", PORT))
-server.listen(100)
-addLineToDisplay("server: setup done")
-
-acceptThread = threading.Thread(None, startAccept, "Accept-Thread", [server])
-uiThread = threading.Thread(None, startDisplayLoop, "UI-Thread")
-acceptThread.start()
-uiThread.start()
-try:
-    uiThread.join()
-    print("ui thread exited")
-    addLineToDisplay("ui thread exited")
-    acceptThread.join()
-except KeyboardInterrupt:
-    print("keyboard interrupt: shutting down")
-    addLineToDisplay("keyboard interrupt: shutting down")
-
-#server is never meant to close, but in the case that the acceptThread ends for some reason, this is intended to close the connection
-isServerShuttingDown = True
-print("server: closing")
-addLineToDisplay("server closing")
-server.close()
-
-updateDisplay()
+    updateDisplay()
@@ -0,0 +1,325 @@
+import argparse
+import heapq
+import itertools
+import math
+import random
+import statistics
+import typing
+import uuid
+
+import server  #the scheduling and queue handling being simulated are the server's own
+import analyzeEventLog
+
+#from node.py
+IDLEPOLLINTERVAL = 0.05
+MAXIDLEPOLLINTERVAL = 2
+UPLOADBATCHSIZE = 32
+
+#discrete event simulator for the server's scheduling
+#nodes and clients are modelled after node.py and client.py, all queue handling goes through server.py
+#usage: python simulator.py --nodes 4 --speeds 1,1,2,0.5 --clients 2 --subtasks 200
+#       python simulator.py --nodes 4 --trace serverFiles/events.bin
+
+
+
+class Simulation:
+    def __init__(self):
+        self.now = 0.0
+        self.events : "list[typing.Tuple[float, int, typing.Callable, tuple]]" = []
+        self.counter = itertools.count()  #keeps events at the same time in the order they were scheduled
+
+    def schedule(self, delay:float, callback:typing.Callable, *args):
+        heapq.heappush(self.events, (self.now + delay, next(self.counter), callback, args))
+
+    def run(self, maxTime:float = math.inf):
+        while len(self.events) > 0:
+            t, _, callback, args = heapq.heappop(self.events)
+            if(t > maxTime):
+                break
+            self.now = t
+            callback(*args)
+
+class SimClient:
+    def __init__(self, sim:Simulation, name:str, subtasks:"list[typing.Tuple[float, float]]", args):
+        self.sim = sim
+        self.addr = ("sim-client", name)
+        self.subtasks = subtasks  #(time it becomes available, cost at speed 1), sorted by time
+        self.nextSubtask = 0
+        self.latency = args.latency
+        self.pollInterval = args.clientpoll
+        self.submitTimes : "dict[uuid.UUID, float]" = dict()
+        self.latencies : "list[float]" = []
+        self.startTime = subtasks[0][0] if len(subtasks) > 0 else 0.0
+        self.finishTime = math.nan
+
+    def start(self):
+        clientUUID = uuid.uuid4()
+        server.UUIDToAUUID[clientUUID] = None
+        server.registerClient(self.addr, clientUUID)
+        self.sim.schedule(self.startTime, self.submit)
+
+    #like client.py: submit until the server is full, then collect results, then wait
+    def submit(self):
+        if(self.nextSubtask < len(self.subtasks) and self.subtasks[self.nextSubtask][0] <= self.sim.now and server.hasSpaceForSubtask(self.addr)):
+            _, cost = self.subtasks[self.nextSubtask]
+            self.nextSubtask += 1
+            subtaskUUID = server.submitSubtask(self.addr, repr(cost).encode(), self.sim.now)
+            self.submitTimes[subtaskUUID] = self.sim.now
+            self.sim.schedule(2 * self.latency, self.submit)
+        else:
+            self.sim.schedule(2 * self.latency, self.collect)
+
+    def collect(self):
+        result = server.takeResult(self.addr)
+        if(result is not None):
+            subtaskUUID, outputData = result
+            server.resultDelivered(self.addr, subtaskUUID, len(outputData))
+            self.latencies.append(self.sim.now - self.submitTimes.pop(subtaskUUID))
+            self.sim.schedule(2 * self.latency, self.collect)
+        elif(self.nextSubtask == len(self.subtasks) and len(self.submitTimes) == 0):
+            self.finishTime = self.sim.now
+            server.unregisterClient(self.addr)
+        else:
+            delay = self.pollInterval
+            if(self.nextSubtask < len(self.subtasks)):
+                delay = max(min(delay, self.subtasks[self.nextSubtask][0] - self.sim.now), 0)
+            self.sim.schedule(delay, self.submit)
+
+class SimNode:
+    def __init__(self, sim:Simulation, name:str, speed:float, args):
+        self.sim = sim
+        self.addr = ("sim-node", name)
+        self.speed = speed
+        self.latency = args.latency
+        self.minIdlePoll = args.idlepoll
+        self.maxIdlePoll = args.maxidlepoll
+        self.idlePoll = args.idlepoll
+        self.processorTransferTime = args.transfer
+        self.cores = args.cores
+        self.prefetch = args.cores if args.prefetch is None else args.prefetch
+        self.alive = True
+        self.taskUUID : uuid.UUID = None
+        self.gotSubtasks = False  #during the current task
+        self.processorFiles : "set[uuid.UUID]" = set()
+        self.local : "list[typing.Tuple[uuid.UUID, float]]" = []  #prefetched subtasks
+        self.running = 0
+        self.uploads : "list[uuid.UUID]" = []
+        self.connectionBusy = False
+        self.readyAt = 0.0  #node.py waits on a timer while the server has no work, or while receiving a processor
+        self.wakeScheduled = False
+        self.busyTime = 0.0
+        self.numCompleted = 0
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def start(self):
+        server.registerNode(self.addr)
+        self.wake()
+
+    #requests on the node's single connection happen one at a time
+    def exchange(self, duration:float, callback:typing.Callable, *args):
+        self.connectionBusy = True
+        def done():
+            self.connectionBusy = False
+            callback(*args)
+            self.wake()
+        self.sim.schedule(duration, done)
+
+    def scheduleWake(self, delay:float):
+        if(not self.wakeScheduled):
+            self.wakeScheduled = True
+            def wake():
+                self.wakeScheduled = False
+                self.wake()
+            self.sim.schedule(delay, wake)
+
+    #like node.py: a slot is held from fetching a subtask until the server acknowledged its result
+    def freeSlots(self) -> int:
+        return self.cores + self.prefetch - (len(self.local) + self.running + len(self.uploads))
+
+    def wake(self):
+        if(self.connectionBusy or not self.alive):
+            return
+        if(len(self.uploads) > 0):
+            batch = self.uploads[:UPLOADBATCHSIZE]
+            self.uploads = self.uploads[UPLOADBATCHSIZE:]
+            self.exchange(2 * self.latency, self.upload, batch)
+        elif(self.freeSlots() > 0):
+            if(self.sim.now < self.readyAt):
+                self.scheduleWake(self.readyAt - self.sim.now)
+            elif(self.taskUUID is None):
+                self.exchange(2 * self.latency, self.getTask)
+            else:
+                self.exchange(2 * self.latency, self.getSubtasks)
+
+    #the server has no work, ask again after a timer that doubles while it stays idle
+    def idle(self):
+        self.readyAt = self.sim.now + self.idlePoll
+        self.idlePoll = min(self.idlePoll * 2, self.maxIdlePoll)
+
+    def getTask(self):
+        addr = server.getTaskAddr(self)
+        if(addr is None):
+            self.idle()
+            return
+        taskUUID = server.addrToUUID[addr]
+        server.nodeHasTask[self.addr] = True
+        if(taskUUID not in self.processorFiles):
+            self.processorFiles.add(taskUUID)
+            self.readyAt = self.sim.now + self.processorTransferTime
+        self.taskUUID = taskUUID
+        self.gotSubtasks = False
+
+    def getSubtasks(self):
+        subtasks = server.takeSubtasks(self.taskUUID, self.addr, self.freeSlots())
+        if(len(subtasks) == 0):
+            self.taskUUID = None
+            if(self.gotSubtasks):
+                self.idlePoll = self.minIdlePoll
+            else:
+                self.idle()  #the task ran out between the two requests
+            return
+        self.gotSubtasks = True
+        for subtaskUUID, inputData in subtasks:
+            self.local.append((subtaskUUID, float(inputData.decode())))
+        self.startExecutors()
+
+    def startExecutors(self):
+        while(self.running < self.cores and len(self.local) > 0):
+            subtaskUUID, cost = self.local.pop(0)
+            self.running += 1
+            self.busyTime += cost / self.speed
+            self.sim.schedule(cost / self.speed, self.finishSubtask, subtaskUUID)
+
+    def finishSubtask(self, subtaskUUID:uuid.UUID):
+        self.running -= 1
+        self.uploads.append(subtaskUUID)
+        self.startExecutors()
+        self.wake()
+
+    #results that finished while the connection was busy are sent together, like node.py's uploader
+    def upload(self, subtaskUUIDs:"list[uuid.UUID]"):
+        for subtaskUUID in subtaskUUIDs:
+            server.completeSubtask(subtaskUUID, self.addr, b"", dict())
+            self.numCompleted += 1
+
+
+
+def syntheticWorkload(args, rng:random.Random) -> "list[list[typing.Tuple[float, float]]]":
+    workload = []
+    for i in range(args.clients):
+        startTime = i * args.stagger
+        costs = []
+        for _ in range(args.subtasks):
+            if(args.costdist == "exp"):
+                costs.append(rng.expovariate(1 / args.cost))
+            elif(args.costdist == "uniform"):
+                costs.append(rng.uniform(0, 2 * args.cost))
+            else:
+                costs.append(args.cost)
+        workload.append([(startTime, c) for c in costs])
+    return workload
+
+#each client connection in the log replays its submit times, costs are the measured dispatch to completion times
+def recordedWorkload(path:str) -> "list[list[typing.Tuple[float, float]]]":
+    events = analyzeEventLog.readEvents(path)
+    if(len(events) == 0):
+        return []
+    firstTime = events[0].time
+    submits : "dict[uuid.UUID, list[typing.Tuple[float, uuid.UUID]]]" = dict()
+    dispatchTime : "dict[uuid.UUID, float]" = dict()
+    cost : "dict[uuid.UUID, float]" = dict()
+    for e in events:
+        if(e.type == analyzeEventLog.EVENT_SUBMIT):
+            submits.setdefault(e.connectionID, []).append((e.time - firstTime, e.subtaskUUID))
+        elif(e.type == analyzeEventLog.EVENT_DISPATCH):
+            dispatchTime[e.subtaskUUID] = e.time
+        elif(e.type == analyzeEventLog.EVENT_COMPLETE and e.subtaskUUID in dispatchTime):
+            cost[e.subtaskUUID] = e.time - dispatchTime[e.subtaskUUID]
+    defaultCost = statistics.median(cost.values()) if len(cost) > 0 else 1.0
+    return [[(t, cost.get(s, defaultCost)) for t, s in l] for l in submits.values()]
+
+def jainsIndex(values:"list[float]") -> float:
+    if(len(values) == 0 or sum(values) == 0):
+        return math.nan
+    return sum(values)**2 / (len(values) * sum(v * v for v in values))
+
+def simulate(args) -> Simulation:
+    rng = random.Random(args.seed)
+    server.MAXSUBTASKS = args.maxsubtasks
+    server.SLOWTRACEMINSAMPLES = math.inf  #traces use the wall clock, not simulated time
+
+    if(args.trace is not None):
+        workload = recordedWorkload(args.trace)
+    else:
+        workload = syntheticWorkload(args, rng)
+    if(args.speeds is not None):
+        speeds = [float(s) for s in args.speeds.split(",")]
+        speeds = [speeds[i % len(speeds)] for i in range(args.nodes)]
+    else:
+        speeds = [1.0] * args.nodes
+
+    sim = Simulation()
+    clients = [SimClient(sim, str(i), l, args) for i, l in enumerate(workload)]
+    nodes = [SimNode(sim, str(i), speeds[i], args) for i in range(args.nodes)]
+    for c in clients:
+        c.start()
+    for n in nodes:
+        sim.schedule(rng.uniform(0, args.idlepoll), n.start)
+    #stop once every client is done, nodes would otherwise keep polling forever
+    def checkDone():
+        if(all(not math.isnan(c.finishTime) for c in clients)):
+            for n in nodes:
+                n.alive = False
+            sim.events.clear()
+        else:
+            sim.schedule(1, checkDone)
+    sim.schedule(1, checkDone)
+    sim.run(args.maxtime)
+
+    finishTimes = [c.finishTime for c in clients]
+    makespan = max(finishTimes) - min(c.startTime for c in clients) if len(clients) > 0 else math.nan
+    print("makespan: {0:.2f}s".format(makespan))
+    print()
+    print("clients:")
+    print("  {0:<8}  {1:>8}  {2:>10}  {3:>10}  {4:>10}  {5:>10}".format("client", "subtasks", "finished", "mean lat", "p99 lat", "throughput"))
+    throughputs = []
+    for c in clients:
+        latencies = sorted(c.latencies)
+        duration = c.finishTime - c.startTime
+        throughput = len(latencies) / duration if duration > 0 else math.nan
+        throughputs.append(throughput)
+        print("  {0:<8}  {1:>8}  {2:>9.2f}s  {3:>9.2f}s  {4:>9.2f}s  {5:>8.2f}/s".format(c.addr[1], len(c.subtasks), c.finishTime, statistics.fmean(latencies) if len(latencies) > 0 else math.nan, analyzeEventLog.quantile(latencies, 0.99), throughput))
+    print("  fairness (jain's index of throughput): {0:.3f}".format(jainsIndex([t for t in throughputs if not math.isnan(t)])))
+    print()
+    print("nodes:")
+    print("  {0:<8}  {1:>6}  {2:>10}  {3:>12}".format("node", "speed", "completed", "utilization"))
+    for n in nodes:
+        utilization = n.busyTime / (makespan * n.cores) if makespan > 0 else math.nan
+        print("  {0:<8}  {1:>6}  {2:>10}  {3:>11.1f}%".format(n.addr[1], n.speed, n.numCompleted, utilization * 100))
+    return sim
+
+
+
+if(__name__ == "__main__"):
+    parser = argparse.ArgumentParser(description="simulate the server's scheduling against a synthetic or recorded workload")
+    parser.add_argument("--nodes", type=int, default=4)
+    parser.add_argument("--speeds", help="comma separated speed of each node, repeated if shorter than --nodes")
+    parser.add_argument("--cores", type=int, default=1, help="subtasks each node runs at once")
+    parser.add_argument("--prefetch", type=int, default=None, help="extra subtasks each node holds beyond its cores (node.py uses --cores)")
+    parser.add_argument("--latency", type=float, default=0.001, help="one way network latency in seconds")
+    parser.add_argument("--transfer", type=float, default=0.05, help="seconds to send a processor file to a node")
+    parser.add_argument("--idlepoll", type=float, default=IDLEPOLLINTERVAL, help="node wait before asking an idle server for work again, doubles while it stays idle")
+    parser.add_argument("--maxidlepoll", type=float, default=MAXIDLEPOLLINTERVAL, help="longest node wait between asking an idle server for work")
+    parser.add_argument("--clientpoll", type=float, default=server.MAXTIMEOUT/2, help="client sleep between polls")
+    parser.add_argument("--maxsubtasks", type=int, default=server.MAXSUBTASKS)
+    parser.add_argument("--clients", type=int, default=2)
+    parser.add_argument("--subtasks", type=int, default=100, help="subtasks per client")
+    parser.add_argument("--cost", type=float, default=1, help="mean seconds per subtask at speed 1")
+    parser.add_argument("--costdist", choices=["fixed", "exp", "uniform"], default="exp")
+    parser.add_argument("--stagger", type=float, default=0, help="seconds between client start times")
+    parser.add_argument("--trace", help="replay the submits in a server event log instead of a synthetic workload")
+    parser.add_argument("--maxtime", type=float, default=math.inf)
+    parser.add_argument("--seed", type=int, default=0)
+    simulate(parser.parse_args())